@@ -5,8 +5,12 @@ if [[ "$OSTYPE" == "darwin"* ]]; then
     # Mac OSX
     echo "Mac OSX"
     clang++ -shared -fPIC --std=c++17 -o libcheckers.so pythonConnector.cpp minimax.cpp board.cpp
+    # Drop local symbols so the library embedded by library_builder.py is smaller
+    strip -x libcheckers.so
 else
     # Linux
     echo "Linux"
     g++ -shared -fPIC --std=c++17 -fpermissive -o libcheckers.so pythonConnector.cpp minimax.cpp board.cpp
+    # Drop symbols that aren't needed for dynamic linking so the library embedded by library_builder.py is smaller
+    strip --strip-unneeded libcheckers.so
 fi
\ No newline at end of file
@@ -1,10 +1,16 @@
-import pathlib
 import zlib
-import pickle
-import pickletools
 import base64
 import sys
 import contextlib
+import stat
+import struct
+import hashlib
+import os
+import tempfile
+try:
+    import zstandard  # Only needed to package with use_zstd=True and to load DATA that was packaged that way
+except ImportError:
+    zstandard = None
 
 save_file = './library.bin'
 
@@ -13,40 +19,65 @@ class Resource:
     """Manager for resources that would normally be held externally."""
 
     WIDTH = 76
-    __CACHE = None
+    ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'  # Every zstd frame starts with these bytes. Anything else is zlib
+    HEADER = struct.Struct('<HI')  # Name and data lengths framing each resource, followed by the name and data
+    __CACHE = None  # Filled on first use rather than at import since a warm start loads the cached copy without decoding DATA
+    __DIGEST = None
+    DIGESTS = {}
     DATA = b''''''
 
     @classmethod
-    def package(cls, *paths):
+    def package(cls, *paths, use_zstd=False):
         """Creates a resource string to be copied into the class."""
-        cls.__generate_data(paths, {})
+        cls.__generate_data(paths, {}, use_zstd)
 
     @classmethod
-    def add(cls, *paths):
+    def add(cls, *paths, use_zstd=False):
         """Include paths in the pre-generated DATA block up above."""
         cls.__preload()
-        cls.__generate_data(paths, cls.__CACHE.copy())
+        cls.__generate_data(paths, cls.__CACHE.copy(), use_zstd)
 
     @classmethod
-    def __generate_data(cls, paths, buffer):
+    def __generate_data(cls, paths, buffer, use_zstd):
         """Load paths into buffer and output DATA code for the class."""
-        for path in map(pathlib.Path, paths):
-            if not path.is_file():
-                raise ValueError('{!r} is not a file'.format(path))
-            key = path.name
+        for path in paths:
+            # One open and fstat both check that path is a file and give the size to read it in one call
+            try:
+                descriptor = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                raise ValueError('{!r} is not a file'.format(path)) from None
+            try:
+                status = os.fstat(descriptor)
+                if not stat.S_ISREG(status.st_mode):
+                    raise ValueError('{!r} is not a file'.format(path))
+                data = os.read(descriptor, status.st_size)
+            finally:
+                os.close(descriptor)
+            key = os.path.basename(path)
             if key in buffer:
                 raise KeyError('{!r} has already been included'.format(key))
-            with path.open('rb') as file:
-                buffer[key] = file.read()
-        pickled = pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL)
-        optimized = pickletools.optimize(pickled)
-        compressed = zlib.compress(optimized, zlib.Z_BEST_COMPRESSION)
+            buffer[key] = data
+        framed = bytearray()
+        for key, value in buffer.items():
+            name = key.encode('utf-8')
+            framed += cls.HEADER.pack(len(name), len(value))
+            framed += name
+            framed += value
+        # zlib is the default since DATA compressed with zstd can only be loaded where zstandard is installed
+        if use_zstd:
+            if zstandard is None:
+                raise ImportError('zstandard is needed to package with use_zstd=True')
+            compressed = zstandard.ZstdCompressor(level=22).compress(framed)
+        else:
+            compressed = zlib.compress(framed, zlib.Z_BEST_COMPRESSION)
         encoded = base64.b85encode(compressed)
-        cls.__print("    DATA = b'''")
-        for offset in range(0, len(encoded), cls.WIDTH):
-            cls.__print("\\\n" + encoded[
-                slice(offset, offset + cls.WIDTH)].decode('ascii'))
-        cls.__print("'''")
+        # The whole block is built first so it is written out in one go rather than opening the file for every line
+        text = encoded.decode('ascii')
+        lines = ("\\\n" + text[offset:offset + cls.WIDTH] for offset in range(0, len(text), cls.WIDTH))
+        # The size and digest of each resource let load check a cached copy without decoding DATA
+        digests = "    DIGESTS = {!r}\n".format({key: cls.__digest(value) for key, value in buffer.items()})
+        requirement = "    # Packaged with use_zstd=True so zstandard has to be installed to load DATA\n" if use_zstd else ""
+        cls.__print(digests + requirement + "    DATA = b'''" + "".join(lines) + "'''")
 
     @staticmethod
     def __print(line):
@@ -61,23 +92,150 @@ class Resource:
     @contextlib.contextmanager
     def load(cls, name, delete=True):
         """Dynamically loads resources and makes them usable while needed."""
+        cached = cls.__cache_path(name)
+        if cls.__is_intact(cached, name):
+            # An earlier run already extracted this exact DATA so nothing needs decoding
+            yield cached
+            return
         cls.__preload()
         if name not in cls.__CACHE:
             raise KeyError('{!r} cannot be found'.format(name))
-        path = pathlib.Path(name)
-        with path.open('wb') as file:
-            file.write(cls.__CACHE[name])
+        # A missing, truncated or altered copy is replaced atomically so a half written file is never loaded
+        if cls.__save(cached, cls.__CACHE[name]):
+            # The cached copy is kept for later runs so it is never deleted
+            yield cached
+            return
+        descriptor = cls.__memfd(name, cls.__CACHE[name])
+        if descriptor is not None:
+            # Without a cache the resource is held in memory rather than written to the working directory
+            try:
+                yield '/proc/self/fd/{}'.format(descriptor)
+            finally:
+                os.close(descriptor)
+            return
+        path = name
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            cls.__write_all(descriptor, cls.__CACHE[name])
+        finally:
+            os.close(descriptor)
         yield path
         if delete:
-            path.unlink()
+            os.unlink(path)
+
+    @classmethod
+    def __cache_path(cls, name):
+        """Names the copy of a resource kept in the user cache for this DATA."""
+        if cls.__DIGEST is None:
+            # DATA never changes at runtime so it is only hashed once
+            cls.__DIGEST = hashlib.blake2b(cls.DATA, digest_size=16).hexdigest()
+        stem, suffix = os.path.splitext(name)
+        return os.path.join(os.path.expanduser('~'), '.cache', 'checkers', '{}-{}{}'.format(stem, cls.__DIGEST, suffix))
+
+    @classmethod
+    def __is_intact(cls, path, name):
+        """Checks that a cached copy matches the resource it was extracted from."""
+        try:
+            descriptor = os.open(path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            status = os.fstat(descriptor)
+            if not stat.S_ISREG(status.st_mode):
+                return False
+            expected = cls.DIGESTS.get(name)
+            if expected is None:
+                # DATA packaged without digests is checked against the decoded copy instead
+                cls.__preload()
+                if name not in cls.__CACHE:
+                    return False
+                expected = cls.__digest(cls.__CACHE[name])
+            size, digest = expected
+            # Comparing sizes first skips reading a copy that was cut short
+            if status.st_size != size:
+                return False
+            return cls.__digest(os.read(descriptor, size)) == expected
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def __digest(data):
+        """Gives the size and blake2b digest a resource is checked against."""
+        return len(data), hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @classmethod
+    def __save(cls, path, data):
+        """Atomically writes a cached copy, reporting whether it could be written."""
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory)
+            try:
+                try:
+                    cls.__write_all(handle, data)
+                finally:
+                    os.close(handle)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def __write_all(descriptor, data):
+        """Writes all of data to a file descriptor without a Python file object in between."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view):]
+
+    @classmethod
+    def __memfd(cls, name, data):
+        """Copies data into an anonymous in-memory file, returning None where that is not supported."""
+        if not hasattr(os, 'memfd_create'):
+            return None
+        try:
+            descriptor = os.memfd_create(name, os.MFD_CLOEXEC)
+        except OSError:
+            return None
+        try:
+            cls.__write_all(descriptor, data)
+        except BaseException:
+            os.close(descriptor)
+            raise
+        return descriptor
 
     @classmethod
     def __preload(cls):
         """Warm up the cache if it does not exist in a ready state yet."""
         if cls.__CACHE is None:
             decoded = base64.b85decode(cls.DATA)
-            decompressed = zlib.decompress(decoded)
-            cls.__CACHE = pickle.loads(decompressed)
+            decompressed = cls.__decompress(decoded)
+            cls.__CACHE = cls.__unpack(memoryview(decompressed))
+
+    @classmethod
+    def __decompress(cls, data):
+        """Decompresses DATA with the codec it was packaged with."""
+        if data.startswith(cls.ZSTD_MAGIC):
+            if zstandard is None:
+                raise ImportError('this resource was packaged with use_zstd=True so zstandard is needed to load it')
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    @classmethod
+    def __unpack(cls, framed):
+        """Splits the framed resources into views of each one's contents."""
+        resources = {}
+        offset = 0
+        while offset < len(framed):
+            name_size, data_size = cls.HEADER.unpack_from(framed, offset)
+            offset += cls.HEADER.size
+            name = bytes(framed[offset:offset + name_size]).decode('utf-8')
+            offset += name_size
+            resources[name] = framed[offset:offset + data_size]
+            offset += data_size
+        return resources
 
     def __init__(self):
         """Creates an error explaining class was used improperly."""
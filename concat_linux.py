@@ -1,9 +1,14 @@
 import base64
+import binascii
+import concurrent.futures
 import contextlib
-import pathlib
-import pickle
-import pickletools
+import hashlib
+import mmap
+import stat
+import struct
 import sys
+import tempfile
+import threading
 import zlib
 from typing import Tuple, Dict, List, Optional, Callable
 from abc import ABC, abstractmethod
@@ -13,6 +18,14 @@ from datetime import datetime
 import ctypes
 import os
 import argparse
+try:
+    import pybase64  # SIMD accelerated base64 used to decode Resource.DATA when it is installed
+except ImportError:
+    pybase64 = None
+try:
+    import zstandard  # Only needed to package Resource.DATA with use_zstd=True and to load DATA that was packaged that way
+except ImportError:
+    zstandard = None
 
 class Board(ABC):
     def __init__(self, width=8, height=8):
@@ -702,2040 +715,1716 @@ class Resource:
     """Manager for resources that would normally be held externally."""
 
     WIDTH = 76
+    CHUNK = 1 << 16  # Characters of DATA decoded at a time. A multiple of 4 so chunks hold whole base64 groups
+    ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'  # Every zstd frame starts with these bytes. Anything else is zlib
+    HEADER = struct.Struct('<HI')  # Name and data lengths framing each resource, followed by the name and data
     __CACHE = None
+    SIZE = 408276
+    CRC = 0x4ff45bc1
     DATA = b'''\
-c-riJ1z1!~)bP?MptRVOAQ-Sqn@Ea)q>V1HEU=QoQYI)WDt2SMU}9sTVqtf8qhfc9f&c8zxv+D+t\
-AObD{rdU5=bgKU*|{@kX3jZtVm4i2rUncD8<t%!S`f;M<nyBV35jhJ<D3r5)?tls^>UMyk&%N+EI\
-C#umJBK#$6}Nt;FUisQ&kYoo~45R-<;J<TvwhY{h#tzS)ydA<3jX31$ZNiq1<dMOO%q|6Ti<<0Xj\
-pL*Y>f9Qu2F>2(r`^#h<g9lI2!oT(8)e{GKd)FCV^_-;^v%WLQK=QAr*kAG%L3^;u*||K4G!M=z=\
-F8B5d`{R_A!46Diee5vm_WBSp{^F}P9q~7O;zNg5l`ad8i%OBn+Z5~pgzf>tBF-~<@Gw$7ch~}kO\
-USidVp0(k#=<hnVn@>0GVYEa4&W)3sZggqA>r!%4Q9UJ8(I1uR2-Fa?R9<G_CS&iK-b8t2@yJ|fm\
-lgi5>c#c<vYc4Q&8%6zJy;4dzARSgWWTfO<B!T}21N#{c1ht_vJ^+k=*y1F&2f~G8OdrilBMk^(_\
-7pR8IAPZy6NdWRhDkL8%rjGmAgk?|C_A3Qj4RH_SBUdx52>0MPEUOWu|OkvMhaXH$}%>L&tdeodt\
-$XX2y>UHegLLm}2Clo@>)yJy_A8o@JhF-4aJdCzg!TNEc(rraN61$&{s^;|Q{y^C#ujRcGn@%gM5\
-QS@JTDjx2d~W#g9ZQhnX~7Hg%;O?8yjD^W43!!pQdDXVHS{ep6E?qTE6>C-qPgN;|U@n<d73>w%_\
-PcBoZI7?q$c5kk{BTLC(s%LQ%Raxa$##7v7SPm>}?XE0E`E<ufC(TkfR;H7z_0&ZyEj{%*^@8<-9\
-jD02Xl4W(7N^S;yU8fBBI7k2S+eP(W#;I?n(DV-Q?8CdiDL$9q@$X=e(Nw<Jyv=;OHn3OR+c3%%P\
-Ns`LR}v>Z6r%rSDw|lsk)+$a>nTF6*5izt@Y*WADxnwdzkewz>!_jgmuS0)l5c)6|c-vPhT>1xw^\
-iae9PW-UGB)L`?V^TJ+3aBF%G>}KFu*xpy60glQU(%V!qy-NJpbF`fgzySq(*XS*Ipw)ySY3a+FP\
-%WsUU8V#yS5QZ{Joe@IqFMc+|go;61%ceJjHMo*S$2J1+qzG0*c%Ti`^OO{OCCXT-8^8Ur?uIajp\
-a;yeyeLqF(7?o=tOJven`s!@$%+3bg_6TG$^yOsLWm(qh)=p<LO45s$%jU^zu!@@;%QQ09&n{?@X\
-`IweJ=4&!ag@4!9c5)l<2uUvh93H@M>di#4)bz}&9AHXP~JeRei!5H;LMDKV53HevM%FTqxJJLN6\
-NeGYx$p?F3V*{mR^|rC}mb1N4;QnOMON4StAuR^t-Y?%6cgq+Q`Tn%Cqvk8ZD8T!(w^OSfOt0;u7\
-*~o1>h%X11(+dOBLp?UWBBDQ@&0X|5zY-X*V{K@YTX)MfV@%}}3{8|lh&Qtp!8Elbr=R#go)d`ES\
-bx;`s_CFA5MlO;bPquoej{k+$#0G;UG`b}9`sri|#I!be7yQ@1bamj1jP}$L1Th~gTrC6Y@$_kTF\
-uftN;iwtzt4{ULKU)^+lma1iXZn~?oXL`E6ntE$p8JUgxtPB>*$*qfwqjuYRz5R33(+{&oXFFyD+\
-v{DGDIRI1r!T9F2(8S@nCQY8JG%v|Wmm`3GHRBVbJSS%6cy0oA8qJ3MImdTqgFR%R^8mgS^8*6%P\
-Y^VV=zP6v2GpxV$Jjx`kFdw(~vw&H<#I?&+6iDEI(hw3j%<L^g<xo!+j9+MbHmH5P|^+xKJk;K_~\
-(q0zQq$MIaC$7>FPmK`eqn2oewo5hOvqWGGXhOhu3e&qJUbieNZ`Q3x^-i~;;u5wAor9zIV%kd0s\
-xf~g3mA($!Ar&$PQOMFI4f;AVO=OI{tU?F_|56WBwc?gywScYJ^NFE?qjbIIebqER&tcUs=5o{94\
-Y6OKenrsotRs`GNa}n+DJD}VplD+V}2f<!=ro{Mu1P2iug3pH$97S*pKA%8v8o?O^=KyyB!9{q!j\
-Nl4_n-cFXL2w&EDSW<<;1PnS2%aN&f#5ZQHwfM#_<*1c!6yWt5qyE~eWMzbA;%^w@mUT%%fn|SDC\
-?lIE&?_9To0A?5vU{3M4*L02Z1j9y&)=_AZUs}A8^J{nxN7Yo?D{Q96>7tZ6*3(fu7k2tN>??N;`\
-?aJD}%w2-+j)40uOWc0u5Tz!`xX0wfn$9tgT2@I>G((MEUl?2EvkMvETsxi2b%5cEgDMG%4@3_-X\
-=eF1uoLJ*B07C}6MK?sBhlAvBPlqsl8MUaMI2;hdJas+}5_&f@gnFvP1=P{_vg6DBiPC(@(1e4+O\
-bSP(`at=JtrHv^EeV&hCA>jW*WiC7~M&(ij`3P1aSc704f&z&))}!YQ2sR?vgkZD8-wM(576e-n6\
-ajv_#NT(I=bi9*H!6z}>_xB-!9l<uLgiruM-d!Da1z031ZNPOg*xX@c^<(91Q!upMsOX$O$4_Q+(\
-l4|;68!}2p%GM1mAsv%BS%B43#etyh89=qMvWk^E(6|0QU)%Ul4qy>WD-#0$I@a<e*eQr4oWV2vi\
-WL0=_;fHDoK>*F?|S2y_tWBG5z7NS2(Z#_(Ar{+mnu%>bT_P-!B8H$~4a5tsw6H7eU6us~obQI8G\
-JRuVXC^lU5f*#Vy0L)ih!j;QR6z!3pbf>_Q7ToAY+a7WM;K{ttZJkhf^g6;@>5cneSgTMQuG7v!z\
-1U(V-LeLLE5Q6>)1|Z-f2u8p|5Qcyc-wj7)1cFEe0>BMKWfX!~iTB6Bb37^sAxJ<VM396a8UB_6<\
-zOg>qH>r-8^h7_2>6_V%8~Fq3YDV~jDgQts2m5+<58K7U^0TK2&N;LfnX+r*$8rEna>;Z5PkvtZ6\
-PZ25G+QpRN`E;5}sF~at%DMm1u7rdfot^H>0u;p0`3-gvuT8yi0T-L9hqGJ_Ls(+Bu4zk0UsN;3R\
-@m2u>q7i{Ju+iwG_uxPsuS#P_aCJl{aiHxb-IP=eq#f;$LG5!{1%_fh!(!9)1`2$hc!JcrLOQ27$\
-UD+I3*yaD`MRDMA45k8lpk~*%Jqw*U9IXGx3K&gbvx(HO{D*LF4p6emdM4*L0TjFoJa^KHU1Hd(e\
-vJom9!*f%K`pw{3AC-m(jNr2|lqOKNgwh<!R<w7vL7&+OtPt2But(s4pdEsa2s%T3CsaBkaFzJJJ\
-9_Slpc?{j1U?7?;O{+9*%Lu81bqP4SK_<D=s5&IC;}b=K7w!r5eNhb1|o=p`q5CvKp6{VJSr35IR\
-%xe2+|M?K`<1-Fa*O9q$9{cFbY8?g3$=ZAOLd?D+`t58RlXF!c7AFWK>Q?Fb%;>1hW7?8<ler<iO\
-{7sGN^r0fIaPixDhAuoS^^sFRP%6$n-$SdCyUf&v5^;O`ru+>FXX1X~bnMX(J)5rSO^_8{1cU_aD\
-7h|0qVj=<-ms639~B!V*t&I0}%Dlf=Mw@F-vzg<D)RRq@%Tt{#N!A<zvEmW2uxQ(C`!94``5j;fj\
-2*G0nPZ7L8@Djl*iTAxh&u<aD2i!*}%TW0Vo<F1VD}rxw;-e``4gordq9ZrjUkK_W&_JMxKnsj7+\
-ED697~UG7XFZxBt`Yj&7(o*RO%XJc7oCtn=AqIUK??*XfHOs9O9W;J%n`Ik&;~(UiFPf}vn2u!0&\
-4`ew0GK}&-Mr$0N)PE_NeR#&z(@|h`<?v8-lJ9ZFs<QHz>U%{?;8m`-$u~2m%rGgunGhWnWr9`k~\
-ML5pWTNAP7Yej$j~yC<HMGViCk4NI)P&kc1!=+DU_Q2r7pnNJo%?U?ku(p&Sck7VZ7x;d3@BCn1=\
-EU^;?XfS-fPxd`UN=l`J0L**g_ixDhEu#DDjKKi^8!D_&-LFHO_UXRL+2sXjz&8RFyuob~J1Umq~\
-6Ux1)+=t*Gf<p+7AUKNP82tUX#Jf+S=hFzz0`43t&m*{i;3D8Iq4Fw%>j-WlC_!)=!Cm-!DJmZ`7\
->l1H+zY_JWcd3lz`aK08+iUetM?gw{(_)fzQVA~l0l^$JS(7537(ZvSr>sSg8B$F5NILLMxX<A8l\
-ZCQ#MrSpZ^thiUOL`QGsUvW?Z|N{3ce+-=YnQFd8Ybifk5+BuWzqa&V_l+YIEd4onr<kPYXwwO~^\
-^U7OiE#dRHW{n|IXz-JO|V%Ysd}_K&bUl&C(jWbdGhriU+&<Gnep^J$`bf3|;?%Z$|Afe&^Lx}bb\
-6ZsfAOLY?OOUyPH}-1gY^#M_KjUtKx#=2$M5;kI9=5!S~rKx;+r<bFMKzZh@NQ8HK;xZuvSt{tAu\
-dGw_5v9%qH#xCBVYWQH9`tGeK>y~!;cBDnn)X~11Cn>mlEbfus^Bz0)+&0hB?j`qgck5&s_?d3nS\
-;U@yDIwKht;4!5gY!2$;pnv<Qpb4S7k4w6yNz2G&q``tYOrCFMb1I~nq_$%JW{sJ-eMXS>oI5i`J\
-jy>(>h))=dQKsozztQ){YSOF81@-hO)D-e)EfIZhC&qa&G>z$a?D6P3P_9$-gVwv+9K9y87Cm%No\
-@05pI;Se8<FAie9t6CZx3Mk)rabv;D=FhabJNaGaFl+i$bR<8L8f4$s&%sArbTgQbN!b6s0Ln!L-\
-xDdx;z1Dn^De5*M@D<|YBlt2Fx%t{%1ZB)B=799ef%{}?N-`&n<#`$i3wb<ribGda<o2OZ1yijPE\
-QZ(^pzgEM?PtMqPAt3IZ)u92~n-BZYaLkFkC9Gu$o0R4@P#CEndDo=ZuB{<o@5X7(`R@?-gHsp%X\
-5Ph<U-s_n*r2h}Bfm1wvoBv}Y7X+@y3hR9*Kg<3qdjt$y&I5ZAEXj|)dr2**>s=s(YKQ(x6kMpVX\
-^JS{pfn?n>>w^bcEI>K@Kf~zI{1TPx-EK;hd8S#Y(>F+9h`WYS}qo6AoRv-sz$__iBHk?URfzJ|W\
-S^PPDq-E~+7WL}up^>|t9Lb(+xj(mUCph3SLOTU}Cmp}IaTzs||c9To>I>B(L&#M{GW`kT{XDlsq\
-n)Q>o)J7vFj%A{vwGS$>{X7gfq4(aORZJFOoJJ)ueY#Yz;|0Z2e*Z#8nxY>^FXM3%6<MnQFd9s&!\
-YU-ZEw?%7ObT*TlcF6ei?u@q=zh*Xw3CK-aS7vqS`Puo+A1Jad>d&dyp!9M1`GR_?$x9#c;=5)je\
-R`?kFu+x(P{%{px2OG^OWOlyo!H7da%NIrXTvtx`zODAJoSp()N^INubU>_y5+E6$7-DBAe(6&Gh\
-3hPk((B*61?YwO3_7&gaSu{y%TqjnVmk!Yry`69nqQ%Fle+yewMc97z?&p^t^4_W0tpGm}>i^fd%\
-&}r$n}+f#GQb?!<Ff`xvPoySldi&~9fpcktSrmhYK);r@uAp6e}!rJc<y_%H8s>Z+&4{>zWKTv5B\
-<TxYlQ=(WCIdd}m;t_z>vz@Tv7l5;1_=k}Bh(Cif=-ze&A*r`rNyU%$KF;uZ%Y9M>!PRBw$E8l(g\
-P3ya|*%mGJ7Yr7%Qr{LuHhFN(<+_@B=j?88H_b1KUi#czyYt<~p&j;TyuH_=VBgIbP9+Y*^9s(Ni\
-*4D?dFiv;fn65Fx^!L9@U46HrvnqRlNWnFQweOgU`)e8oo_J{9~~=?EWiI$)rhNk=X2{>SKPj>Db\
-46N@8$T=-In3=mkii$u&!;g!odmI3e9v&dRg}zc-L;@=!`R4<6G|^({=I!uh9i1Y13>?r#;TwX}t\
-PeFM~!GP4d<#4Q4%V@=dPaf@Pnk^cugs^|RQoJ*EyB5Ep8%kkvxZ&9VKfc~5o)_gt?gusRefT;BW\
-gl@80|GSbdE_^LhcFl^P+WrulM{%SK5A~xPX+1vh{bLpBvW?Nbr??0ZXvagTpiGXn}TaMWG)@4;G\
-`reQg2C|2j4>npLH)Oc?2lZyB^xT6!aUzbLj+a#(TcW03`r2Gur;$<d)lF_z<tN%58u6fU=;^Zq8\
-g<`%YP-RX^l_6iMw@(nVDm)xa%{`lEC-Xt9riD{rM&IwiY}Ww7#v)8d{q+5wtw{W)Xh%=Mhwfb4m\
-Ilft{^PNt9;8n#gRMbCkaR0Ol<g#ty?rH?N-{bzzz#Mv^r_|-n`xZn8WZ^R}`M?a5;Q3k`*QJzxO\
-Rar0h$(vzt5LbZ)oLeH+hIKX1tP8*gr&E^pR7#_G^M9*1pTo+e|JJUHprHp4+*bBgMzY)v{hufsW\
-Kox+y8CMaBS`_%HdmDNJQ1J>h(pAYBGH(S(faDN5ICUd6sT-#;+l>&>GcJI{YKhh4?Q7MoQ=k#;f\
-*)KAAW6M#aXUXiiYvDSUf1qfB!@d1$j*gu))-NacrosWuu@US;`i(AqnQ_N|u<gSs+fHr2Q8p*N<\
-5Qa_O3PngvCoYP+vztaa=Vt9p61q3-j7^2cW83D$NJ!->yEGAaqhJ8hDil8ZDYzmv(3l#c6YMLdA\
-joHHMy0Sd(63&b?bd^-j%+MBAu2b+~&0&zHa2~3C9;q4-o{PXzy;fbfTZr?9uj}ZFP%2tmrWDeDZ\
-Ch<8xIrGgd|n-XG!jCgk>~*M5^O2Zk*-->)IlKKVw^#-Weu`tyRKM#RK8w0I;N$zk6!csA(T>OKK\
-ymS?T@{pNStP4mN+7BcbqvLno5kJY*27QbPj>c+ka3+m2`fBQ0LtKs%>4NmVneEjs8HpBD7Kh~Sx\
-{*6qQFK_Z4rJ}ZGgO2Gp+Qd#wo7*nyjKYY{6K4*$eVDo=D$FK#QSo%Mq0U`r4_(4N-(&sW&Gze8<\
-}48QFDV}ud$&dLwU;ZODm3fcRLNy<sI}hb*6&j4O|Vdj9~#!6x9^SFA%dv8JH8wnHgK6{#>3Me+6\
-HIea!=`&alLG$o=HsihJ%I*hpp7zT&g(LW#_ytQ=9i|9C~5En2bJy&u`gi&7audnW0iA+Yv2hyN>\
-^KqwsX$je^h3M?VfaefpxG+}@m9V>r`Ke%*esJkk9Ur&XW079)-3kEoMm&&zw0(`9>5_S56<yLDf\
-pbW82YiU&m(uT5?2oKe0`Zlm^=;rli$AGKhqPSNe-@-tT{&neMY-(b~DB_^!7SKQzSiqWPMv+lfD\
-qjoa<Qu`B*!Z727qw;!{%N5zLzoNM9-q^lVCuy6XP!2cUuF-I(@6=6ZEq8f8d>Ub}>B*7iPa=HRJ\
-lOF?f6PYn_RqSXyVbnClTU+VF~hZ<@0Z(@yuS~sSI$+Fd)DS=<8xzeg(1A-MX&Ao6YE6uQGDN8n{\
-_hc!8&hw_5@!ABb7u&bJZDgQ~l)fzS)@WiR=0ysdM=L=Rv1OH8;%bx@J`7m!sv09}LfolF8b0>+N\
-%G!HLgfJKPRlJoWOEoj2<BRr$7<m$#&yQi$Ney^~uz?9ew|W0UaY<_eu6`;q##9tls}^s-B>ZZ*D\
-fG)AxC^@mxPG+gH{DwrC{TjNvOM&-+}dNc2zecj|(QpY`e55<kvT@!nVoBVC-#+gf39iA4My1C1!\
-jgOn0PYijz<w)1($JR7|yk*Ryt9SCs8kl8<*3Eqycd>K5#!6TA&p2%rvwocWqxk7MtHKYCGE>f+T\
-{gXbpNN-+vp6qXZEt@hG;~Dfvll(5uRm4VE50D->kX@eK7PW<uQY~r%yM?MIMLGVe7E9kqmTSHGR\
-q?`+*X@)a=LR$<foOs?eBR;^-=72sqMOv?o+KiGYzH<8@t0^h2^>N!Z}^byD#3dG(sO1Z<I}l`?%\
-y;xWy#Hv^@cFZ5Kyx-P`!(&Ktv2LIf(kc6{j^`@p;Iux?{#^jzp7-`!MoY(euy=awtn=(xP=TIU5\
-@vq!90t-bVfzE8gcBP_Z-2+G-dx+7O*aK}A<`C${UxIA9CT7CD!`C1=de~JyuHW+m&FXF(k_C^DO\
-PA@vA*db`4LRQ~)<%#_kOzO8`Qg)I<6SK^mJ;fRg*7e)meLx|%U}t^zOV4HRE!9skV_R--AE?*#-\
-VG1goO&My4jpgV(et1V=l*PALC$RLS+V1|j=8Oc<?Yt5&>p>~p=pcr=j(mQQ#Dw9W!fAw&kgUaj(\
->>h^5OQ_g{H@+&1Icz{HTu7-4v(fVcte9c!lki`|I3|c{)$=<bqt!emlNwa5TBG;_G9ZtwtLT$JF\
-ooeysh@CvE}<?ro<{&lV2R9bj&@VARL+9l3YUWT)p}?X5U{b=btWXT~lZ_HD?QEZa>(TQ~MH**5p\
-VhiBTmAGT6%zwG8F?(&i|9&QH?q#39yeVW1#4LaRAa(Tq%*T;3{bt+GMlPR|~bXCA;zYg8sn%hL)\
-om+J7`8O~7BZWcjhVRsAIco3BZ<n16ESCi|8*aG&bz$FCedIqKweIMt{LO0Vz{&b&X6sFMOugcLd\
-#3X#g*PWV&!1@3v?#FgWcT`V${XIur5+d)Q5@CNu7QdArQQPu_{Fz7U#cNgJK|jMdDr5mPe#poEO\
-^vmPbr_{V_KkjF~vORbyBeT;+{8E$6oV}^KPTo@kEsM`yo3OR_hE}+~&)@CHu6J2U$A2D2%%JaJ_\
-op$^R9#e<<_BCShsvo#Fyd75&zcCP{BEEzlZn@Z{aybvawl74`P(ws%G1r@-e)yMsQJ&5p_oRTTz\
-bdMkLjuCuMuYTFf!?`ByE9^LG%nBwy6K}>TmlMgfAl{ZL9)eAr0cF?II)<a^Fc|#j5Px8#^KD@Vk\
-iw;wopBQ*^iLg)Mt5z1<5AB}oeKzsHkhV)@XEZHdzUJDClsZX`_lH@Z>pXwR`-vff;wFbDPi_ACS\
-Z`gS_X+2MF^%(P2ffu4oGf{>bh7%2*W(={+dsH<IL+>c(etvb-I_gJI&xP%>#%42huaq#4*qYz+&\
-ijccX*wQceS2kQ)+Z?=8CjqOU9V3D2O_;f1b5PnNwWPZ#UL2Z}TN=i3aagMBF|0_Na?yIxF?hEG}\
-x#vy3!}YseqkyL+5vtf0&yYlE$!;I?&H%OxE=N8V|^*zV!Foax>7t{Cuev7v)@OXW@bf<D!G81Xr\
-?2dB-uGSy8ze70rzjccrueeX?#oNNC2Prb5tZficJi?Fkz{o~?W7dN-6U)VxpW!Z}8?k7)&4DYwx\
-t!H>p=E48;?dR^ZI@e=a%9lIrW4b}JZn-Y<+SxJO!eZn4(=ApWXt%hNxmJd?qLNvsu)*(x=C{5)r\
-eTYYecZL)tdDwcT6#E5`J(00B=rx$=kkvl&F$Ken_jl;@ul8F%Ac<(8yu+Cw#aAVWB)$G{~KVlc%\
-9rAL8#}plV*Cm`3;Zdj9DGo(EQ=?0*#AN>zeeAx!`}<cKX5AA3N@wuk5uqJ1Q#4XK`qN;<j}$Wft\
-<51D-_XBRXWrrnFb{j7)qy?za59#f`2+8~2>^aYc&1XC3#0y_;+IIXZWm{VLhf$y<Egx3;-t_*hB\
-7eX`1C#kM;?+*?quq(L9ABk`*`I2XJt*krp!;dK7Vh()I!#dkkhN2Q=~6RWK4AN*9uuFre%aulDx\
->%h{WQR}mpv8MHpJr-fVc>W~wsEe#k_eTBKH>b_H<yX4w`7grco|C!O#A3C2uXgTPF?m<;`88cz2\
-vWVaI5fSQmA_tb(nzf}M~!wzZ(M(`JnhpL8C^BrfBu1=&YI~dyiPCco!#`7mep8=iFtdPPbi3gpw\
-sKJ?IVMj!HM%$<bK(>)nIW^6Vo0S*O?Z~em`sTSKD_x40Pt0ubcb9;nL2%1;xCEjRqO_T>m0&&ES\
-m-&ooq8qu06b>1NLyoeMGp4yXBja<rT=PS(3$+i~-}<mwu)PBhOvg1*1y*}?&~Jypl@A`VPfeBNt\
-~K?|$ZTUl1VyljiCt53bBB<l6(&-VE=`()dwi}f#D_a0sz<N0Rf>ch<ztk`$R-fxG@k_eNtm!FQv\
-R_Je1cj!jJQp>%Osy9AbG~ouUZTWHWy2gXsUhA{Guu$)z?GyIiJu5c)J!g5pc~<mvN#3T=_+_`Z`\
-EGGAx#P3H$JEq84W=!;tm<*cJonR}7Y377solFV>d6xKqHhY3Q-@8xndP!@`vXU}67Q2om#*lfcI\
-vwAp6(-?<!Ka5dfNGVU8~(2@+TSfZj#B_yZP9r_y=909dGKjUDkZ#e~5O)LmuWC>u&g1@HNJ);Le\
-6SxhGz0?3%K&Xv@Mg$wm=JoHv+hz0~mAJb33IXB%0qy2%%s4LY#oL-!tg_*VNTHSE4NRhEC~bF-}\
-8nRj+KId<LlP_M&j@lB2zE#QosxBO{HlZi@ojX%CxIH3K$ONQIRPfuT1>~pG*lbK$#qs#8(%}D!r\
-ajD~5wZZ4EUy3={=k{HbBVj6iWR?t>W;)L1Rhi*h`K;T1{uA3g>!jmz`=iB`jR|~NR{g$Fo=sHJN\
-{o6=(UqG&Fe5Q!0mrzw^J35Edv#9KU2RyN@bZ*J|BGE7edraKc2FtQ_Qta5lk0DNYH-P7W~%4CwW\
-|Hk-pO*=ot`jdT&efT7DLxhn`<Utwn4Lx&iqTG4y`*d?Ru*%^8Lz>wW(t_JI_BUc--Ev*;%VPuHM\
-pW)Wh+QBJ@2kafWoitmrdTIJ(QHwI&mz3P%;1Y0VI7ez4N@+q~gJPSny^)&LF1MMZVfB249aG`Vs\
-}(RslPjc<j$O&@>Ws_eA1=v}bs{AEL3SIrzaa)bU+qee=13Xk(=EO&3Vta(47ef_y^W_qTMV<#N&\
-T4b|LBc7YiZmpnRe?_j>22S3+cK*-5gfG7k`>K<USFfJA8qH^K8e}1FzO~e-r~8qwk9Qqt5p?eHj\
-;MVDVpE@+lqakZhQxPhs1%~LzrFd%2HW*DS}8Z0H|%WF_#Vd}j_coOR#4{7)R>Ng^V^*`{P;C@_V\
-g#ob&O3cpK%(;H{|4(9XPtQ>4r%%qXp}C&lo+j(UcvXdwE2>E%_oeN-+wHm1a{9;>)l!8SrkFEJn\
-P@C&z@B8Nl4mmafeBQ&Q^7a+&eg!<g|KFEHb^^qKJ|l$iT3^4&Ai0f8X{en(g4`d2zJ<KOgQ?$3K\
-E?{#?2jE@|`j92X|!_r{D$4Q~5e;RW;@lyKpTFN|*kwVXAQr4BaB6EF{5a#-3q0IPBa?I@vlF~j~\
-3LOSZ8P`z{=5|80nCnlF($738>tSs>X8buRc<s*2_|a16uu{rAevm>Rdnxm%CS|{mltQ;#Qra0PW\
-xvlx^kG`JF`mrreDh##XY>)~`U(Eb^&k5&;}g0`SywBW>l-OE*Iz27o!wIU-%ScV7fRVj^ZGO6A9\
-iBKv!(R2nUwjR5zO3<c3&y`S|V0m@?W`>btsA#WWu+RvOWufnfaTHl=mh}>3?e}^;f4dzt>#~AGj\
-lBUN%VS|4b?CKUB)R`v!^RPCeF+uh{X-reZ#AWW@N?80=7^zFYSjuD>4~xy`6~&%*d-y7ELjg_|(\
-GD+l9yQh5p2ar=EO6)Iw6#p|jg#)l{1`c!;ti@Ug;SU35K7*25v#cPcJ?2Yjpz&q*Ub{u$QKh^JG\
-e6}@yuPfk>e8KIU^&`h?z6sYCfCJEpiorRH@%F7S-h`qL(5-z8`QBWPsLgt;In(7T;&sLOD7|t0F\
-*k61Gr)5caDPr^<NEa|pJ*A-*^g|0h!Somun)#lami_GaQ*Y(takxCPYu^s?oYPUqb0@<k0j|Zc0\
-R_dDB$t-2E3jL#+yfy?L-G*{NYm=-yHB?55YXPBio<(8RHkx=x=fj<L#YEd^2mH8_aKgz+Y;M@sR\
-^DzAfNaT*mFJcEWgbz;A1V>(8Olp~Y>CFR@Y}-s>KZ@j3T!eNVuDiNbi!eX<=v0jzUv1tM?ig*V0\
-*pTzYCQ|lxR<40a4>GtS7?!SsJ#t)?U)pCsYHzmil`v}Inwa54zYG2>S_-uEQK1EmXdndNV{iGE6\
-ZgX&b&BkQ=mTs_~7vc4(3VwIF$+*5g1f6(8{fvRQ{q*zXd@WJM^-J!`5#yEj!}$46Nxb<nj4y9b_\
-UD8g%zG!2{@*MyzHJn_e!hMLKITi-|I!uLe*o*2ibp-(9^(xMVf=ZD|DOatX^QFQ0eEg4#%IDh(W\
-UedYy94=FXafn@u&yJ2R_4iJ4z4F#O=%|!|nJ|G3xDc{oF?+eWp6%`i+yw@vhXw`02qU-a8QE6>0\
-0u`73U}l*VULR^j?j)$w=*ls?%2<7dHsq{hXri`&_JTaL(a7~KHlweOStzt92WAH%q)`SrVt+wW(\
-iK=h}$4#r1Apbr)If2#=N<r^vx@?yyb-2N9!QXZve;rjDGljFUZ1AOKcxo(Fq!uU_hxczKcCuiJ%\
-o+)HIgSv_IiiSvlC=z*Z4qmu^@JW*Xw?OXf(joazLn(6PL=#*;ISjW$oh2u1#`pwz1%jRykr+Rv6\
-xWXde3L{>pCUC#@B#e6cDVlONRn^FYvcOu?veAT<&Ntc10CEcy+|M9m+{GU_~k#?7ls&bOX+C~Fn\
-&gJj5h*0C#=Bj46BdF)rN}uK8*2UMi{S0(d`*-XK*)ieRh>1r=~VwmM_bM7=QgDi61={x4%J$ocD\
-+s(Ec}?{F)AWQA3hX4(@>K8zqqSEn#0D7GgY=n-n(@w{x`t#<!&O-mAENJquFq$Xo=zWQg%vl-{x\
-!w{zTBo><Qpo8tP9!^r+D*JS3;5!--Y>5=Q!ejBcT)SBFPzA)bRz*nhxl;4H%`i;r`uKpai6Y5FM\
-qh2tsUwRAUbpYSA6|<i6(i^wqLhJwR!MMKDYk5NNlCuXs6HD^{8FMiHwJh$Z0i{nm;`R@|C)-~S`\
-bl|zQhs%si17!%lKXd?7vAsvif}t#FfWTP<NDeluc^FW!=o7QXpHgUfDcIpx@pqp5$0=|9!clT=@\
-@_W9j?Cu@IB*jJ9p}0yejlZ4)lT2T-;AC;Byb+c8Wk=Q2P1s9NbQHGkHSZ$!p>IOM}Vz+5&PalqR\
-Qmqd<TAi1AeJ)oY-`3|;cQyVIEYc`)dc-=fL)z6Ltm1D%}#KkWv_TXQhp0`RSDFdbs&;&xiAL0qR\
-NGoL@u8q+}@<Q=vCEkPbl`b@6FZlEs})AS_|6^ws*2jhDHKCu}1gPlCV2Sm9kBK*K{xPA+2eS-e)\
-)R$bJrmHdjxCSXljHK}YhIW_^=VxPlHsGIJ!S%C@NIJYP!1&=BBwi~CzxU-+jBfz=1?zyGTIBi5x\
-Fc>S{|$bx4dADM{F)L;(!rq(uAlirjyN~X+Y0&#@T<)f-#8ET9Wnk5m3Mf6Sx=610lpoN@qGaA(+\
-t<&1o{u9|K}KBeD?<=J%>7De8FQmg1@!R!1()G<auNtoL>f8lYIEpS~%}pkbH9CRE(ExNXn7naDL\
-}-$ok%OK+gxgj?!;S;Jm44LGEiu(D&Zb*2&BM82=3H53>Nj#sjaPT@dJe0{Ds3NIWh!1o~3zJi`I\
-wd&iS<<o;xgUs+D-&*NN~?F<X1VSK<havs}^!~OIH`$j0G4=e?_X+r8PZaK_)mjN4(>m!`&=R>@I\
-+#TFbTQ_ojdV)Qq<v<cY>@=<~Y)<YM`?fG&G=5^Y1-J7N_@NhNH&bPngU>)-T!VxJYW?^e!R>4{B\
-G=Uz(A$e?db<~_w|rO+l)lkkY==kZh?(*gxt(G<M1USBkMUb5xd!%)E`3P(m5~AVoSWplU$+8%n5\
-Ms-VuAexl3nIgd?N+pgMj}~a$GL~^cGd}z5lWBJeENMO;hN<n+|^O{!p@hJm{rEjYv8BAs)B?{54\
-7cM>BDKTL@Zz3GL^>IcNf$gQ)!Qu^(_dNxtNJtyeM2Ur~O7m_8Hmd!3<u&opK^yP}X;o?e`X@rAF\
-*{qlr^@gX2jDSN`A8Th@28<P7-yE(4kh)?Q=Z2~Y}_5z&mpr6}RnC0O4F}QxWJLJ4~*@f%Bfy5Le\
-Y94_;JwUEe=bD|+pGnXk>Kw6gC2pslDrs+AE=7LLk|OU!IY{Dpfpti=Ga(<pw;7ykD0%dzGo0T+|\
-EJ{ID<_O!kVNV&W0Jw%@`B`hZS<MtOF&a*d344d<8POd_Tf6l7(a>D&dRa)y-R@pe$@U2eRv7z!_\
-@wA8-?+mfd5nTHSrW~r%6i%;#|L20rb6IxcxL(4+XLqzpV#JhtOEu{v6O(yHR-|y3F#33+L7-+WG\
-yt3$A|`<Zm=JkBecvbrlFZ8`}!=2d5dh{s8J+0OyoqIHyp0d&`9w-~A2Af7Zgf)dl@+GNlhd{o#r\
-VgdEHTxsy!OZ*4(eN+~DT?K{}-i>{J($R=RFioQqcT{9npJ=TNV?|YAf9oPi-CxJRoSuo4HJG*f^\
-TkOdFXbXC>BTY}XUxMrRHX-Sw272A>cyhi9K))>?N6zn#p%}mGGr8Wpq{!13+HhVDCFQUC1dKQMO\
-7h#sUBI6Cgw)dlz<yrxisX9{$<R-AjPFnJ6L_yCyqBV9VKl}c1v{!eB`>Z4zp^0ha%(|P^S@2f!S\
-gW2d$l9an>?^zg(PGAQc6BHV3wzw;9Re7L#~GddoaGWJvqNy;as-Nn6y7^nvL-$aE=ZGyheLw`8a\
-P1*gy41dOBXk_=`@YoodqwphHJ;9vxfb_nsG!>*wfFjE_|#&(Xtyp0+^G#?(0o^#6yANIK|k#`uL\
-C62Hn5?~4(ea64TguX-l%`2-=k&I`frrw{zZup;gPw?C^K<AW(Z8P2We+K~32kv*9A`;|!;uUk&j\
-uXxPzGz0XUi=m`^d2$Q*m<1_M<-xzxmu63HWe9eLa1uW)o>|W7!o2vZC=m8Zg(0~9cun#gRK5WGV\
-v3|5{`MTkw`fiC??mEu;uT1F;bO!r@1nqtWK7ea2PcBR;1Rh#TXY8g@D|sn?h2Y3#w<7WR^j^l%t\
-<<|>%%NJ>kh+sLoL$pU<&7;mbCeO84i2^^leJ69cYKw+r?q>gq?Y*DQ;&|A9B9DLI1!0PL9yuO2I\
-#}$CRY=%T_=)+PQle*vZvtcJgGfgVo<g+QHg(gYyfVQz&^lFpXIbCW2k`yeX-Nt6Ac9%%95<{3_f\
-C*Z&eu>VZwbe_a>+*VOvAVSyYBApH^1;CHxhNuHx;c4L-z{iMjRI9TTwY3tm_4)`G?np1vcN7#3%\
-ekA{C@5d|$--O`)c$GkZfX-Wcfj)K(<GWINCfKoOH6;E1*KUHo=R&@>v>(`Q;Jns~TF*n6<)bg0z\
-pks2c1R;VTz?0TJXc1j!#W>8(tk&DIA7EDuOsli`1>UN)k8u5xlQV6JHdbPkx$B(QrLI)G&@Wn=)\
-+E*N&A3leT;W;C-;#F&~1zhiJwuQ*-xE#0^?b*o~d<}40gyRa7n{Ez;_0{BGilA7YZORCV;%4=63\
-+-|HsQneMaL2#y|BW`N<aGZyeC`seUfL2<xN^DSvaK;5?{A+LO<MU%)1T9Pj2>kT3U0{HLyXyw9g\
-#{6>(cJ3t?hr^OG9hx23fUGiMhzZt9tKH0u6*cETQA^o;*fIr8!!u6>;nc{)pwks$7Xj-bw^1>MO\
-iq|Ei-R9O#IDgra{XYQfA=I7RU**ux+_&UCt>?R8`Yf7`>w5rwa)BSdHYMd_=Rg@o{(sF6<BQ>Zw\
-2Nv7&c)AF$bFQ32J|BE%g0mu4)oY5u<sTDUfBWs;IGN`qdgnWaiCxM0RH1_X1%NHdECBTYmz_LHv\
-l~|oYY%7gFcWA@jTQ%?a-dtero~xSnwR&&(2i*4A_@+fo}&={ui)IsDCEqcm&uVrl^zjzXfqb<7s\
-h3ITIkRqXEfpBVqmft;O%9?&I+~iR(}6NXAX6^u+BKTqEfa2K<c`K+<#dKH#_dq})^h`|waUX(um\
-$@wTJsjholNx%C^VU#(RJ|0%5hMu5LNgjw!1+zEc1M&!BsZ921jN$7*uZPqA^4}pEU<{;Sp8k6fb\
-@ess~fW3~=2by-l_|CNWih0XHkF7`Q+n!S7&S^v78#KI<6nS(L>^b@`Nx9?S75omLNIo_N>=I+@l\
-Jk{%klFwH5&RVD$>e&wITHF$(=!!eUvKI}(!uOF#yfT({Ui6`ykJ6;*XKcwFX~R76Ze9DjmIJPMH\
-<lO;a8Fl)2D*I{f*og8jXRU(Be$m{s(*y&IQ(#J_GW4@Evmf+unruC=Ti8{S0!DE>HXR13Megjf$\
-_R3-O9uy~*(oggC3AjmbC%vjmX)a6yV2bq^lI5#_uj`DC+=%>HQ83mCr&_#w5wX06BVL|D@7x1is\
-;vdMU`Sg@b0rRj|p&`w)u$ALOe^~LR6rNuYOPlq@S7#BtV&&tel&|of{*W}3lw5<pJ+5TkQqb&G^\
-$9yE$XDRqqi+~T0rq(UQ&-l^e9FoCq=?nS{6?b8<4&p^E$o(=Ro>>l-+-CL{`&r@o&M=Ry0e=Ye&\
-mz!2)2a155A^D0q&^uBe$uFCWIPEU_);YBCF-u(=i|XItV{NP&nsA0-n95$&_n!fNjv0GIJa7sl6\
-3QcdE~)7Qv2PP$1E56IpO;E-jjYn^`Q{Q@`h}mGYIBIm0WM*rO1(?QuzGKPGFBs#P|(V+#u{DYly\
-$1?ClH2fSo~y^pmPc;pcBI!1=2SNzWHxzdf%=^5;PpndQ!uLhvtGk>|(vy_xy*VOy*Z^qh_BKc(c\
-R25$fD05X1t1#yr0DdahKgb>zqebPSABp>({E$*~2*q=MflXSCh#LS0{&A~tNki;*8IP+=#q<+#B\
--h1Da<dc2C50aHc(#Jp*<1Yn~>t{H`k+$qW+P7Uxz%LAOzf`>RG0>NmT_@Y$4SqvSO;R4U8VvSiP\
-0|kY71qBhTz=J#vhVpa^VMCqnB%yfLR{t0JET7)2jYrzY4(J3K<E9>Nqftfv#_2!lX1dEYjHcPHO\
-cjP$_L*2nbbGNf?niD(~J22U{^d#_Qw$7d7eTXT_ey}UjUy!MdS0CV8?5&NUp0JX<#S$MAB{e8C*\
-Znob3Nqh<i8bPxf>F4&06f%|AE}`ZHaQ)I&JEu|C-qE`D=_b@&qeqz7q!(h<OyvP;N#8+Y($CG;Z\
-qqbrQ}A;jBLaTFP_-dMCau4FiOOc_V&8;To&Z?nmLItlU!RB7?{hxY<s0=qXwPg$^EO|>NBE?zf=\
-_&pzTU+^I=*SIgq_f|H<c$qK~KeQur+`b3sfg9PR{jirU$j2CRT-I>Dcn|(u>OA5B{)k5Q<ajrM9\
-2rmZ@0WnwiKoe(hL9(+iDt((2LI#C9%TJ1Qy@+l>;R@zd<E#4Zg)w4uBI7t{FOVz@ivBaMeVyo{>\
-<lbb|28^Z;<h#i9okfT3%1sIj~DOlH)qol9@kW13QB+*cmAPYy$mMfPPYZPX_WJ#z4Fl6+bx!;&L\
-~2BlA<@fu750^n43;lHA**J!;r7upfe7iSmz>t_S_|8@aA}LcYV0w&c3n4fJ_WJ9poQe4K6BWW1B\
-B6n=XY;+?KPCFA)QKwN95#w0(PZ3lb_;!EAA@%F{@>oNx8X8@lmgS?x<2#gm({jv^N?w8Di_&4g_\
-O2{8M>qGLlqp%KBKa+CmGT2WRz<Gg+KfDX)pu3>QQtL{{W9IWI!yupK4XOVpf5QFgK-)))yqWoVj\
-2p&>!)2+I-%|_tj}?udBrJn<u121N)`Q>HisrW+4|Zwuo8*4n2<Nry-sHIS<>B1XlhjYzjR(Kj7t\
-#(~)DX90P1Ao)fc<Bb1}WFpf<JmpCvx2meG74(-AVh&tEJ3*y9;HvX->-1EpT3Q)Fl0kySHQfHye\
-_k!kNtbNH_r3A5~7qiEV-Ni2ZY1pUM|I0sfKq0i?XEbB|e{tUCzusvgJ_aZpb|AD&@F#tUtS{IYa\
-fepzxo@KcwP^xv2VdX5sgAG<(4LZ%^kKK=3%<6C%>{q%zKc>GJ!|KbO6hHaBc`Pixj`1>Nre)a_U\
-+qyX^_eVQp{3DuvbsX}8x_u(oZ4%^R#p;pv5c~b0&)bvsK)rpSKiHG=e*6inLl4rPGY<66R-k`U{\
->s8II9JM&{TvK&fcxu{bn{#U@qtF9KA!{Ukr~Iy{ts7X_CJ1<Wsd9f%w+aw4F@~tRzB&EP=>sQtF\
-(3E5Ap4bCgA!zsJo<#aQ$vJr2SJ6g7M1mLphXRUOfWh+|HByq|a(NkF=2|;tiHf1HWWLa=c2wC*M\
-Jw31v_42Y=$(6J*?7KRDO>dXs#^`V_N2)BxgXGvmm72fI_ypXTH|_JsJT1s~)HdxZ;}ms{(Q@hw-\
-DfE-jI<!`Ycv)p{WlG%?ozm&!3M>9{y_|r5$cz3X)o~Fgcy#s$rVSh4TX(yb2`$Bw9FN!|^f8#tO\
-?GGCvPW!-P(k}NE>?BU5B>&Wcec@w4`WIG0e5}(Puwzqs9}wSLO7ok)fPARZGIITdL);Ese%;n%m\
-PcWr??uw|y-SdP)P}}?8jfMMQ_Tc<z3?Mx$2$)3!`H#S!2|p~@Goz_PSWRgDaMbpCD-RVkiW}%l7\
-3zfhzHvoPtzO0k8ct|wx13D<uPic9K3Od*$!|Q^1M##kao7`;Qw+|CGA>fQsmA{$oosD>5cgi7jf\
-|+Nw+l?;KzJUo*xs|F~^TNTR=YMKysbufS+q`D^lMOJ_LJpSJFRa4CnXvXUKl0zr*$W`;dI#2IOm\
-Zb0+<Lli{5HoTk^^0=wVP52PK#2J`{CfAayvIcL%GcF(~%eWx7BPuMBoFMdhV!5Q+8x;LZcX@dXJ\
-{52`Zts$;Y8}>Ez8(rmKr@G@$w)0AzS&p=aywv@Aq&=r`KfK>B!^QD$VZZb5K_06uIj#*YaQi1|_\
-C`a{A38LHxN*uq?#V27x`186yM#Q~tOCC_yA|obUIKpMwZnlQf*kaLxRFn{NIky*<j82+esnX2xU\
-2|rUPe;%bRg$_0>mpWX-BRrMX+OU&?W7$ZBB#z1mcIOIN>WiDgGU>7loLUbiN7tf1B=P{Sn|V;L-\
-dAkKz2N9ZTXbZ)essPk<lFM2Yk}A72P^&5-0v*C75XJd(82el=z0+lsJH+tJQ_YhhnMK1=#l-$9)\
-191~LSm4UpT+&1Jn{qZBPt9X#>|Jr<JJz+s3@MDJ2{D8oR^VLYYorU#zyo8LqI1$gxZ%yFd1MT)C\
-A2Wk^@4@%T`1W~H_%IjpM^4f50Vjd{I!eobsSAD<y?SK4!4}|S%S>taIoN=HNQ>9%)t{Nq*N3=VX\
-PSRD$piHN6Qte}835<&FQlFJ0O*;M+K_Y}?Zj+<aON@d{~nO{dYa~E)Q5JGX?j9aZ)X1g3hYi!j^\
-sL-0{J68(PTS&&4Hf_Nc=9)e^x@?L|<xO!+EeB?L4^q0mk2SC;3S%_=BD%kb3Ve$oszelx*kWa5x\
-vg#ds>OYELn&t0uTVp}>DmjQ~2oBlDY*cYyr_;u)y^)Pwx%IW#`wDTV((7eL;zBH8{6DRDm8;OE@\
-~ag3SNJc8ZnG5nxOAL##5$j{ve`MFe_`2dLDR%Vg;_!mJg7?+Ut&#&OescS~&o9_ZUo@@(J-|GtZ\
-c-$XI(m`P^@TDeXJI~?1ktyd%Kg%?KpxbBCP96aA?wvWg4nx5&(3BQ`H3{zPuzp6;-y8Ieg)hnT_\
-+;?AHR6(aE7#S)o=?*g7E6i4X?lq{e%=S-;w))#acYoXa9y2@^N#}i&q56{-trZkYo>tRW-;Y=m<\
-0KudSv@vd*NJZPoASYnlaxOp$&GeKw6%~P_U~k_9Ep%bBO=(g?#*7l>fyH<O1!!lm`&6m|sT51Fr\
-^stcXVE^<m6%@CK~s@v@{Jr^RT9-_|DWdq=cD4$|_8PQpD@^mq>q(4&SACiSQx;h;yIBk3~;_|<W\
-Davin=y4ABJ>o<UVje-TFeb@x-y?yVH^<$#po+xE94s!&==bWP5qh-Do<JUAG<NR-eeSXkw(k?L*\
-*6qMHq`asD@u;IiaQoCfV7+vh<@J8BJ1w|F$`QU4IXfQWUdFa2{Sn6?A9kQF$q$u*Zw#W{Q&a|eR\
-F)5EKPl@D^r!I?12)8UN0H-l0KeNEUz)swJj(g<q#k&1Ao%^2$oGbT-R5dTvj3~N7(e0`xgQ0oU{\
-`!awvz_uHC<<tKNtfaP<}@0^Si;GzxoYX-wNVYrraj$4~KhfR_T!Zs?P>yd2xmhamBKv-An`G)*K\
-Ds9tObMK|b}2DVYB9u#Xmje#Lo3+F=SCG4pL#uruhwIV+LE+cC#`Uj+ZP%T?NaFA%rcm*zj31$y;\
-h6B2K$f$?E9d)MMOEXKIF<~M*o&ZNKo#Z&O3nUm{wvK0C90`h;mOd#(`Fot}qVA{P>Pg0oW#WC>T\
-ee6c+19KpMR!BP+>p}kh)%T=5tv}?2dFhgJ-xT5#dUq!E`HOIV8GMS&`#uSF;{(S@KF|#EM-CN|`\
-Bv9YNs&i&!GF<@^iw#4yci08+f9_d-IrM&^#Z=<*oM51C_;)nvX>%9p2UDX7V?R1QE`L7hp#mt?K\
-usgKdWi${3x7rr@=Xw%I|vwcJ;G;$o!*H$n#xG(=%P+-oi)MN&0-~#w@=|3Yg_or*V*%`i0b&q9C\
-7fs0De>`Z$JJeq8{)v{MLq4w?mgZ0j>p|MUU9dL_+oICU*^ypuYdcXr5<d~7c0r5^{9?W}=yK8E^\
-1I^b6p5Lf)wko4m>&4ze@ucV*oUQal$eIez`dMWp$z1z#|_Y8+PiUYKG&O1%Ok4CctzlAvY<Zx2o\
-*ami8y)x48KN{k!9tDwfxC8lpS>dFgt{2?nl;uhC)mza1aj+Xx=c!>3Z?6mY3!S9a3FK{gKPT;SB\
-f(#PBb$r^{0#EwG%c?0CfNNFUXyl)Qdpnqr6gbF4radh;4$c3>H|spOk+5g6)BMV)qcp|(V^wXH2\
-^zOJ}pjTH~0Y^<48M<X?JEhG8W<=)@YM_RYwNm1J{H70pw;B#KY8kL;CfSS2D|&O~5zk_iBd2J#r\
-t_$h??*De^i}$m}2Vf_#UMx}?4RT03Srb<`fWe-QFAsJOBfV9$56A@iiN{D7a(?tj|=_W+Ee-2)&\
-CaalZw%cA0kTY;T6&4!#uMerks8<Op`odx#oMx;OM5ZnXiON;-{&xCzSJ9i{(0X|?w(ycYv6XY9_\
-{W%Qx>21{~&&#fGuTiuk84tPDh*^$2gZ+Nrm3;3oDe~e1$SHL_l79w4oUN7)$**ij!@m1O#v9KBz\
-I~W>&*9b)peKJJ&jqa@ui-N-E_5l_wQS+sw~>;AaPOt8Ke_KFKwhdo<fZCUdKB!J`Klxz+XwlWM_\
--Y2=qu&^Hv#0$1wsDo2r4cJ&JoL_NPS)o{PLk5q<(lA^q<n>q#w|~6XXrOBjcv_1cJSkHork|Kf_\
-Wxk`9+ZpXuF(TvzLZnD5~kBt^c=1^prH25H~!1n1d7UZlR)6xz?H?b9+(;7edvq~v?SZs-rhSy6E\
-d^RELRb|%|z0{%x1=q-mSdj<HN<<&`fF>E!n-%thY@XsHR=hiaN=MT{Q2=!qdmYyN$e7z;}ePuTx\
-KH(EhZ!8LDmQw+@z~1FTu9IdEAC>i<q~|WcE7qgsYeQW0VJlLP4TSrI57N%v#mUTmy+Vi^lz&Ug_\
-qtN#P9um9>10IGEehhXS=UMWsM-TRr0qK;u+yG=L(1PCzRdhz;~Mil2G<~7=py)QsCbnL5MP~7^V\
-{+uKd2n^9LnF_4(<htq}>ZNRto>u5&+*QCF5c8q5tj9llQIlg7{VaHzZ$5Z_9k2*aL{)4x`!aL%{\
-BRf_C5O2Dk_N-aS$-N5VdGgn6OvHy8_iY4~w69^)M7=Oxd`^Pr)W`^1{`VCM5|e`bDe4eL4oJ?;J\
-kus<BvChrg22XXJ35T{Cwi`$TyPtL3leyCD%zw6sE#}{>idvfBzzP*i#O9A`OtXH)Aqd+bM!@i*G\
-lXD@yw}6&cH3RNjxNbt;3px_c^?O0TrSc-T^<(C%TA=qjej(S@2{`ZQMv?mM!voBI+sIH@=Q8BFQ\
-UW_|WEq*Kd>Zae%7uGQzEXY)SBR5=c&Dk<e$NAbYe?n=H#A}9!=aEDpR<hQhh~s>bFekZ-|j;mO%\
-B{+N%;}(LcHHiTD)H>#HD2Qq}`7pg>PTogX`aEO8TvKK)i}JEk5uNoD(;ECGF$^w^@w(*Z{aEB%8\
-Kwt!=?>|B5{CG=R9u!yGc6Z7BHBrqTRp-jJVSYek+fvf&)cgE&SiuBlB1v)qXWKW{QE4xu^NTi)L\
-x^|xCanEj6qa6a0eMDo2lQsh)~&>tc}f1vd0I*^YLK)Z)o<p9J9Lmo6`SDy@eLOXTxKCZ6)AwCN9\
-q63sa9qa&wU<atMS3umgiUFx_gl}h#qdN<B2`yUOOIyebZuXJn8@UkYxt8XyVS%0|r0HqOz)ws~N\
-x!xL;^?ejkbX}y8OYZTB>h|t;MXfMCi$%aoGWLU)A9}BymrQ#%v&571OAsfq<=FP@=WD!lJ=;Zmz\
-m}4O+~n8n-)jvJ{;nHY4>>eL@>+Qx4^FyArGhvwSFMJsC6?^KQscn>(lY%J-uJR-Z-EiNw;%g_nv\
-J??ynx8=hUU$i{+fbEbo$mpRfKx%L4*@JWX#L2XUA?X!le&L7dX@ak&0P=x007$HK0W>)|craa`^\
-}=I6TY2R|w8J^^+)$XS1~{=HssZ$B-bp%vWYu^RkA)cwp_U{{%MLdIFe7BJuQ=?nIy+&N_2#lCvX\
-@_j4F({!5sK~;(zKM8SnA6t?Bj_HG#<-12bv%J0ud914KNdC44=&;}}d4EwWxbMq^=BJRQ^hTQ8P\
-rb~nZ<~}rUbYJv2i^egOZh^xqs{|9c~zgZbCyB=OJrj*zcuLq^Y03+1U>vC%?>;z2(QDVlgYSo-B\
-jkhhP%(1@1Yfd-MDoK$>&{w&K+p^!Xpfs<>{D0W`E*yIKMxPBJU9@2Y#sEg5;}iV8@81>9?VfFVL\
-0tJ3I4cLY!42k}q|GeDl{Jm$N9pE#%)lr`^M_5cr`6?S9?5;D_x?^GC!6WBmJXWZuVUh<`Z$lGNu\
-<CNkd-=2*z=_e=-9B9Qj`J6>?_#KBIq-?@PKE%YSqY3ZQnB-7%o`lm3<M?dgq<#r?KGr2Ldd<=zs\
-=XRIm8_KZX2ecy3kDKk8?YBx`|J+cYr2jH^%$IzY<Mw5h;9PkL;)J`9c^sSJK5!1rPWTb>jJ9f!_\
-P3FcKSj?AlZQCB9NK-wXFzZ9r^UZTgCGBC2q}LpOPPP4X!SC%vzd~5yDt15fic(#;{d-rlR3VfwS\
-(CY-Xfe?t~o<|e)eOMPfpWfmUlcj4<6Md^|Vt|o<7YEwhingD{1=hz0J)2&2iv=r2lTwCa{AQf*p\
-*a!(#ZIf~GY8@^gr1aA`o^|G5$3aLOaeINR26AEtFjvYpuwuhNSa?~y%}`F`5IQsm%*qoAj?C)-&\
-I_x%pnChY(=5bvi7@qUyX*MPW}B3j(bIv-~FwT8O?M4LPp^oO`&x<7g%5B%~nWV`{-o;hFORCngz\
-?fL-sa$IdjuIE7zSJu20O}>EtVh%0NTvdwPdD?^dcfpQ9{QpbZJtY3<Je9{%XPG-HNV*?cK7q{gB\
-@TWMYZ)!B-bRi2_qmK9j+Y)+ya?iEpV8trcWN`sk$P}1?pfgfR31$T<TFl!{GeMffR5l_o_2zEk1\
-L$(7tVzHuc-Q9ckNBfm+S%i_a^OruuX99B|R?74&o<2)AEIlrQF}OP@nntyq-axMS52<eq#pwPR(\
-oDJ+v|%n1AQ1KiC0+zLI{`S=n&kNCPrX!wCF<Ioc%uKLU0GbvN?8T_N7P6yk)bJc2F#neWNmm;~}\
-mowP^o$%TG`y_DJ)3m}hpEr&ek&evo9T`(4x8xa#1%S{x9BnY`&7S|)tn;XVY;714&h5Up-Z|CT^\
-SbktgXfz-HjrlKJUTO$8To4-)Ef|bG_U#@ZWV3mZAqiYzLWn?^=)rTfjpoNj2qRs6J$a%E4(P?PN\
-$7j2KdR`&jo=G?;)Q~kkZ9+)SfL;`DMToUi*-wgiwO`W2x23|FAG6mb7s3H<2T!JakFerXh@=fhs\
-GwV=)wEGPvS44Z+Zk+aa~0(^!G$hs1+;D&)!>u_qYlKHS3@YH8jyD>Vs$X+p!T>L0?DzkLAUuvA8\
-{AQv|VLTz`IIQjBOC(K6sgae0wZ-0%=Vv}kdprgG!?35ju{sTHPilP!Ndc^v*ASAS0)reY0-%I0v\
-pL`TQ*xRC<13SBso1LxFqf@zJ`e4%i@TPQW@jTP6Mi+U3h%?%3?hSbiW(CYX7rA~2Br+9I(s9q9J\
-=z&J)>Y5zL4Y03id$yA8aYK?)CEG;b;&9Oti%#Tog=z8p+U|3JkYgDhmyi;Y5XKcCW)&igL*EV&F\
-^d49eHdb3A+bEZ_!}ZlWm8!Pzafz8%C-p;goh(Wh$@Qv=!$5I$&0>$HbBL9cp*Z5L|j7JkDIgmuD\
-&ZZUFa*8T<$OR3JuscAtW{|E`}Sz<M9&{>BE-XvWU)tL~d+SbTl_UP7sSKdWc9D>Kj-&I$>l&Tnb\
-vH5ojLx2?=otz_zPDOAew*O5meGyZXn()T|9V)P{Jk_|~u!Y__NuA@LzR#Kc@<YREq;x{+MtogaV\
-}Y<wD5^w&f*8bs9qyI<iWiF_d!<Yf$q;ZP)@V@0cs7g@uGEk)xLB*w=j@<l@xx0=8gFA4a>M?!;o\
-Lu^WnuZSRF(Z0z6)C!6h@Ok_c0ovac8x)9c9T}1s=@H|~ix$rVLU6g!5z)A-_GlmQg-G<UZMa=gJ\
-#K7V7@v!}&3CTg{y(TwDH<y)*>k<)!nkO2MDV$ySEHeeUL8YgjAP05O%TNJ(LhDD(9Vb!@Y2v*!>\
-d-2jVpTow5Gji)`X(%kX)sfMfDT-Xr8NGACuQAMi7h0?eB>=BS-WfbkmlH<})_VJ}fCgtlD@)2MB\
-G%j~-spY*z%9)IV2|>JXO{ThRshZnW@+Uy4RALu|$0vwHxy@->0nKud%cVXcrx$>s)%Y7y;Lu}{{\
-6`3Z5fE+Ga9-{mHUL?`hRJ)#-wRq+)_HH=Pn6%$WPHnuI=E3u-TArO7plb<HmcLLzAY_!rv+&zu<\
-2Wr)S|8>zeK-Da1^&}gTtb+O~NQ@1M{ccgR#alrr(#E;`&^T@+KN_iR9$o@V(WXWdfHrl-X7NDpi\
-4PGVwjUGj>J=&)C@R<@1*byaA~xDjzRR#TYpX---_^29&4%jo+lK1${ZNq-RoQZgNZIqKT7yh8@(\
-YdCX3tz|vuBkwgR0^-JYpp4qNYTAh&IUq{AfN;h_;z4!t)0uA!S?`huCDLeCi%x&1DiE;y)nP>%t\
-EYNs1QYKZc3_O8tp}E92(uBnApXS2Pq1Y;xlMnh{mbkyTP`T!P5B5XOxOiT8*Juk0JG&mqKg6J+^\
-?MrxxcE`Qwwxzq|-YLQV3enBP)euqpF{5F{+_yw6H_#HAyP}?#|P@6JIP@6JIP@6JIPz{+R`0Hen\
-;O~)1f-12*!H;E9H5#dnp1AyV6Xa4WWT`zy{r$m>ZBJl&iVmAp@2fAjs@Hxk%C?#e?0=N3F29egF\
-8`xs{dHMey_eR4Jg)8w|MUo5{`3f?$o}tJsdzzvC6}>95i_%{BD+RyR4{DObN2vSX)N1TI?J||&a\
-!Q#uxxe}w1j_S>{7*5)fSNC2)-MggjhqL1K8Xj>K?!Ag@1a4F8}aya{1%Lu0@e9X}V@xQ6GL)KdM\
-5jwW$?Vc@X~tgmbBF!nynp5Uv)qohrPlHgudSz2?u1#^uk9Mw%8Q`CWqR(%SiZbeF$)#L`8~50*%\
-6>M6DQnm;odmw#@Vxcni))`klrB*4|DB3|upan6Vb<;MMGTUeEdBlw$$^P5y<@jJV4|J9?3c=%np\
-e}E_afY5(0zm*^_o8ul5!}keI<R>Ka6DkEM73gFs6um_pz$w!AthhZnY))cYqL3fM<sm&V%9RMa`\
-eB%pqy+t8fRvRjsxN9l92zB%2#u=v;`be~ij7O5wH_b+>wS(!b4zx~Rjl_)&?S(I6A|KKL^%$kcv\
-+8bftFk%^32uMS{z7=L(=TI9sv&A04H&TT7WClOaP_6n;)rjW63;F%c{?gD`PkQ><cO7hr}Y{M)N\
-}woI`k#{6wY-94m2!KuP8&P8wls4Ob3;UCdO)g^~PhOHsgMY*-*7!yl##dUa%6QgoPWs(>CJ8NvV\
-cRgU-u6+=l|+7)4xc4*Doa|792rtaDEMRAa#a8q9!r?`-WFmVnFeiU=NTF|_#__1NN(2RAs0JY;E\
-V8f*ya$}jIzkntV-0q_A-->W|Q5-NLPH!=FTq{+cns-Z(TG1y=wn~x;zNfccl29PZl%dF7`L&9_F\
-s)zP2);0opAaKTp~AvT;`_g(`TcNms@_c1CPz>^lT-C>eK$D_lw{&cY*DT66*6j%2$&dIA{qk!M_\
-&s6qnfCA=yt!pzHP)jw-%Pjj~n_;RFHfrZBJPz#fPC?S|Lqfp3wIM_M-eN(Mzpk;*$B{f<K_o{%9\
-Z8>WiqIYDeFx{6W<+1XgVicli@%fy$*Gn-WvG*O3lHh1g>RC<mfU6v*#jbGSW`womn&S_0@LqJ}H\
-~Du{`XmN2YCJxPmCbsAz<?OV<@YTdc2tyik_$>LhlUoWjf)yLsek$G6nq4*#zzKWx%e24S_{k%?P\
-J2ZA-lfdU8W{^PV7e8#yAwCHm@<Kz9Qs;vZKah>JzT>3y$VQz1^^=*cWJZ;FfvB^-RJDrliBg8JO\
-{lVec3dvn>M>}~QeC99(Ew+h$3i9>(kuV?En!$-Bf9b8l7!-?=tPh2bJY+>KuiZ`w8bH6@<U=gc!\
-7w4*l=;KB5DDRGMXvRjp@612uR%)6D}?~(bd<@KOioE>-v5AWc5ZAAMYxt>LNn?jQ!*J{X-^M$z?\
-?3(^-?Nv&st`Y#j05=dt~AlNI#+y%ZtTo7y*IP=EM+h78Z&Wj#W=ov67)fhaARA0Nky{GLod&J<*\
-SPXYRPnX(AGquu@;0nm8ux#)jR+}~_5L+`NVRwJ$Od#jme)xXJ@fyuV2NO$CgB#MXi(}u)(nT%sX\
-?K<#d#pX#txJU2A1kp0I5@(A`5FT|U8Jkz_xfK-eE}B6!B^6ePiY{_Qx$Tmj6ifc9_4K=rqRvwmQ\
-&(Fq9<$WpplwBU46hcVUonDOGR`pWOfelQi9_GbBGQTf;EcAZ3m5Iw?|b+2)Y_`<5o^XhVkg=oVr\
-7DDi&?KAneQ!#6~u(3Rvc-4NhJwYwu>RFd|!h)iCdvFc0iK&I)b=_M9iZ-E9II)BK0>ByA}1+I#D\
-o~PuE<&uZB(oF+Zy#dD@a*OH#;@ijYLzN}0~)QbM>Yx{y<qbfKTU2-G1q2guGvD>c5-;t>8l`9&$\
-;A*mkWw3P2(><1FEKP4xqCXjPZ>i|c}l{z)KNC&Oxn%<>@*|xQ$#fXFSzcA6wK5poY>{^rlfc9Yx\
-8f7@8jxuPT;`jgP9b%e`2Z_`fu18!V*C(DI8-o-i@p1waq%aO&L*!&5ZUyL$6lJNMl&<pHaeve!L\
-@Oj@EBN{^D#FRtAQe)$;0B5+e}z(xVP-AEEADHm>AVIA<D;e5klv`6wqmM@{O-P<6^7I5b|T)ZV!\
-^T<Dz{KCL9Cbf-jAAJMCB><j8VymIZUstg<G&31c|7**k5UaUD-x0bO^X+jC8JP70XY-A$H=WUZV\
->Vs(G&hn=YDur4u#1@!+q^vH$y0xM`O6zhqP#(WOmcd|2&#ZfFuOiZ4v8g*_pt*~S#q>c$k*Y-0+\
-lzA*)V-NqFBl^av=e;f0c(qMl>hAsO~59W8~wf@6diT`pM*$<e{KQaE_$EK>2jaF;vZR|hO@!C%>\
-`{&Y${=GbrAF-Ohcho;*Fu%?3#Hn_qHitP<yJ}83GQPTYoN{RDL~&Oh{y#gcTGdD=wvo0LY^1LR8\
-|iDorYbtItB;5{wh4UEz)%x#Nwdgbh6&&k(CshFO=4T4<u4v?NMfQOB37J?gNA1(x>GtL0d-S+_i\
-qSV_MzghRBh%3|K7|C{^6Pbkt)iTu8P`JRZ_4eBn4aaB|B*Zvy)CRJLv?otBRzk!W!}VXLHIJR#V\
-p+uO?<~gUzUI{3C1V?^VERvT}&)%l`+`bN(LrPX(H@|1!NsGIpe*zYbjQka!%5%dDkxt2iQQ1Cl-\
-->BFhQXvF^)$Io;AG9{#{%TMt4E<eHlhs%#?NWY>3a;qV>|G?ncjDxrO#{@IAH#z^<xPP{HtFNB^\
-|FyiUll$|1wpEq$q3k3Z68|I<^;PNC@$XW)B(l7!nCDdGY%nXrF6iouuvN-ObNN}yR+W1o`qixnz\
-K|OjUr7Q860}Ea0WG$;w905b^cB$$r&)3RQ3E2yRq}*IQR(N$59=RiuCO_LG+iM)zBtvzqZ<w^6$\
-x;cc%MM-uSOT*$WE(Y&p;9d8dioK+E&ny+659T$JL?o_vg?!x{1?wP!q`_*5?~29+>4%sA4Dn!6x\
-xrxPsV3euB`WvYnq%L=-M6`bokH3RZg)!n9RP_YYg(eAhx%j-`<2O>A_DM5mf;c8RpXf5pW@<n>k\
-dnlW3j8V)+q@)N}J5~SS$iGN;Aobgeew#C2uhrSgrOsM%!Z_(3&lJSY!k~yQJ_8l!XOYn&%oh{PC\
-<)tz6@2ggkpG$nv60>xUBulT#n_RvZq%}zwz|5FaD=82JKdx?cuWd+tyhtgl$O*0Ba@CF#t~#fyN\
-mc^I(P}B;xOPK_D}Pw=Z!z+SekM^0N3HSCk%@Pygg;nRF%fBhHe6N=KPHhc{5RrreSO6Z(0`p1Cv\
-DYI+-~g#;QoAh3;x;VEvU-!{wKm)f7`nLUmu$)Wq<q=-pN|qN!9!<5ox>4j{AS{oZs(D+uyP;|2K\
-tYO51~f?}@kec3xF(y|3PW`}cwxf4IwPez>m;FJwI2d;VqWa#A8cQFKpAL^MU&+B|=VY&qhYq1y=\
-1v|$`KE>;{c;Ze;jP}gLC@vRkq*_<G{c*8t!1+iiLR9CFy5!B#tF%kZ*)0@56?3_p~K+nHSfBy{|\
-P4F8xnxL8+P4Mq-G{N7s(f%FPz4o_cb&piFy=|-ce(~1s!u@Ag0V5NzrOmB17uWt*Pq{y17k~N5<\
-2NvgDxLmnoi$YDtv_N2e{t0Iud;!^+vGuR{>q-i$(u)=yvf7I_mN^XkNFg9VQdcSOC<HiideqC`t\
-avZ1#10GqZG}fC>&F~v0P*PD}&Lha04$`0K_Z8nJwC=w0&wt=<GJaq<BQGZvLJzVk1v7?!@;uWB-\
-DY!xoK)u+oXcrGy-IynxT+rw9`H+=`$qu27;+;y@|Ujho%X4T&6Al3`PSlbH#}k#Un^1%s0KF!3=\
-zIB~^P{hDXV6~S<s^G~COM87#9O4~`UCW{mNZ(wnPe}csc{w)?Ks1}Q>4fD|-W?_Q=V_{Nfyhbcc\
-Pz@GVgWMKrjIL%;{$iqj$Lg&9&kP~S6gkXH@!z1wckGixvCm3<?t4lQ3Lc01XDxX(=b+Xi4(eLTL\
-G7e+(0|7=D~;DmJCs+0*H(FArT;$2&jZn`_Ks@s?5d_|{SR{Lf5|>1oj?D@RFKY<YweeF7}Z@H!t\
-y2|0VJEOUFKgU3+*3a`G2`}y+(|__Hu$G81T;%HJK7b*)>lPWmh>tlwHN#KenYrj;A=`56+!TIhK\
-%MDgLWncw9mX!c{bd7Nb9NZi(pBhLcNbl8#tA$%r*iMU?jQ0^*-KOaA4APfkU`rvy#?J*z-fYe}m\
-9d`U=>l_Spb6n7w*AgbpN5?>Kjd69fx6gQe5>l%Y|ktE(5Bly`*@BQ$%X4p1if^Zlcm%44Q3pc=}\
-Y6+HX3C2qQWu5Qq1|T|0<TZ<a9>kjK|I?pKAX7iBxZm&WU&;ur%%AeC1=pO|8OTo+ez!(#MZQ2mL\
-@Z*<p-Cc=SC#XLgjdZ|Avx7fg{<!Hf=T`w9f#q!*lPcG!G4}e$)ROZ{ya-k+RwRGR;^ajWz~MvmE\
-nuu<^Nks$^ZYsZzwUQbwW;OZ6s)NDibtGM)cF4zN$Via^O<G3|i%oQ*sN|j_1h!`v~uf^re3w&{$\
-gjQmqmAN1@}=BF8<e92;3{D?;$gD?;#pE23%y{yi(AI>y4<S~b-*P%^J9JMRC5fHJH>+ge|P)ts)\
-Htkd6Z@2J)a`uCy&f780D%GA_swbWGS|4D{aE$aNVtKMr-=cgNx@O1D)<G7Lh=y-ID@)B6OR!z$g\
-Pl7EvhDM-8;E(qM+6|&N#MMrY)Bj`dOaP;*t~VZ(C@vAOMyVCWY80!{Ocn^$w4jUzLNo%YSR2O>C\
-Nh<QND{<qEEdy}=ARaqSggjSHA-8fXpQ0$4NCx(D5z0XqPRpuF^WqSt&#t|_q=!Jn=><+nPgIFv{\
-sYfm$!ZQ-FM!(%X=@}3uM31S$TnTCv!qhSn$TG@IC!j_?~_%e9r(W{OImv;slNB>j~=J6ApbliF?\
-S5iAYX%M$i4^(Vy%HZa*<U#Zk;u@8gO6CWlp{KAqoWnAZn8+pz~s0uMeEJK*L>kF&>GXS$2$&3E^\
-Gs&r};^9Xx>gP)zBM6gN!+1IH7v#%Wv*L1yv>Cc=r#hc=^7Y#B)JEDoazBjf;xt=4iJ>Fw>7Gy_Z\
-RtPhS7gb`I3B!D2tRX%}s!LT~SK+K#^WCMTQEe|z#nQ22*vfbI^o!;q8xIV+x;dkfj(z!!n}r-p?\
-`dmk{^OI;RfE8HM8@D`;b2|5t9KJ?7wGdWhD>8{Xkx@z?Lysh0&X_JW10EZ#ay=vdL%o&Uhlwqa$\
-%eqdnRvFgFG_w-@f;ysN-=jRL5Er>~SpESJ52(9U7?D&WY2D=A^0o%p`oyqB(q(sU~xAi5^8c$9l\
-8qH+py1<5Z<(`i5ubn&pLS%nX<jl2qSZ7%RJ>7Y%vCyp`aaY<>1BC-m$wIicrUnG<^YCnxkozsZQ\
-6YUouy=ZPkt^F*7^d198&d19Q;c>?mesLL&e36N*cO@KTRBtQcvaP%dO@$5NijHiFn7|$M@#(2I<\
-WA>c>*T~bIJ+;4B$5ijP__4B32~?y{m!$?gU=XweEBLxWo=S+>b40z#k|N%Aq?uGSBQp_aTTyMa&\
-ly>igG-pTW%f2}i*BDfvm56M-PIPX?)B7LmeJeZvPi2>>=Mc-PYx!XV_dy^GG~E4uQ5tGqn)qipO\
-~t{P#L}V+xk$bUkaP!4V%I4A$Q>3WxA1GS`lT#nXdntd?jqwEC#o~g;N%L%CCEVVOc*s86Eav%{_\
-PUJ&Ig@kD4OTLk2&9A3P45x5w`J<J7RvAII)PcM<F?^ux}PwngM>y=sQ^_#|1c8XrAxG2$jiBxM}\
-4P4&Hb5y`}+*fc64*i+c1gn!kEq7~7v<+I1-^%2dTk2sqjxM4i%9R8cU^Y$`x?=h^!E?@s9OQvsG\
-`T%|`q_??w1dpgk{Hh4QIFsi~kkk#tdU)4WSiaC4y1E`!!HRc6n8$fDT)lb;LC{wa^yPI5UXOE5&\
-+jqF^cF63m3n^VwjNPdXV6tPd;Yx3^lJ?+E}QLg&!0bUzV&v4u<xqK^m}(knD-8(yQb;s%^_Yr5N\
-=v>MCY7eOAw3a{q<vqI)4xk{Oc0)drF70$0#1vv7XMi1oN=Y9KI~n;hIN(f;_{oOUimO$M@_|=yD\
-16#JvA=^kLF7SXADQ9WMU|;(NSQa69^HNsq}Vg-hm8U60AEzOnYfnzY9rIgi~_)v19G0-AS8z?V1\
-E%}1}@Y(YPX7I;hZJ(8wQ39m7aUwo^t&M@np;fUy%)wNWpZ?ioHf-t+1)h5m5i?HF>o*2vdBK>lP\
-JyD$DKAsp)R3|3po$J2h8{_h|2L8Jb_=Yaxv9T!PC=Vw_ry-KIP`?y@L{G`~cacYO5dH-n<GZkaU\
-e+h~d@sglYlGd3`OEat-hIM<lzyCRk9eFZbq{!)smFF^pI%)r+Ne3v&j+`j2#Km1c>1pzc=nKL;M\
-w!4fu}dsz|()#Aj+Fh_^NWc>wjvNSgO??jjGHdxqHN@q`v8qw~!+SL7q=`z~yDVKxdk($UJJC<9i\
-jcbW0nGB!Y*UKN+n%dI?!1b8*cMOR19~<_~3t|6YXto4arpZ9oqbP0jJzQ{cltndz{X>C5-Uec6J\
-q&&8XU6UEC7^-aw06^5}n9PHA{h;DGfH&flO2P`(nCHnQoxCYqsPo`JdTC=cxq0<|#11-W=8_3ID\
-ys98ozN*!)entGqD&0ZVHKJEDtE8E_;Zpncy47*dm~MKg&8F@5&{!|0@x9wEvJmDOxFO6FVF>HfC\
-FSXJ<nhEZ@_6>p$m8j4<navf$P+wTczPEtJiUw-Q6^47CIts%Qt1(dp_pXYFmC5?^)aIi8L%8716\
-EqFfRz#OZBLOP1v=-9Df&kN9L}&Wr;c?KtGB@}(y6F13y9I#!k{@e;-Hz~KNlosK{L8z7lAeN+dH\
-{CCLuV|n%YB{9up!=N4V)|LwUdhx-p!Y8^dXg(LL1@@opo!Z~4tY>)kD@_gx)({*5YzQ&GczcPH3\
-g5w{!R4N-oxCnop82)fRCyaV>j9`~@DQv^pG*)3@RPc)Coji|?IIK8?3^t8cV-E?Nn$+HIv!hG07\
-M<jJ1uIVMd%EmK@diWv>&&vw(NrzA~o&v5=n)htauyPgpri-QW#2M{R&sftVnA5{`Oa_@P6w$)sy\
-0E`j+{Y<D_VhO2X55!X@Ue@TQ*(O!-i4Ef0C?~Le1so8u)ba7NHdG*uOgY+-K%eV;Mamwy|Yf$IF\
-~iWH8vfizR3hSa4z791c4KfqU&z;n~an}r83T%e?PA{>@)#&98=+&Lg6MAq((i5sfWuc?9O~&F$*\
-_kDK+f8(|+HAxc1WM+KWx!R!l38r>Dx(=UU*2vKGX;wdyOXv3)M8Xxqtt#W^+>#o33+QT?5R#k8O\
-!%K7@Cc%z*Nl@sP;1Ta@AqiA0F+_EUfk5fZ7*8&=psjj{bEd_2Zr;o276)!}MY<Mc8hvBK5=rYEf\
-AOlprd6QTOAD-U%@WjN&9zItf!*mA(KEIgea+<@iDq|GKOym421><gp9M$YFT`3U_<%OO)z|#V9V\
-l*#6JlUbsPI|IqrrN*RW|Xr9<O2}m-P9`iO%4B6YTrWst2^K?zI~qI&@FnElk3KO1g-yxCHey<s-\
-l`-ecw|VP;WI4_(+Yflfk8Zx$LW4)qnH5IeSxeLTwpWl~NbZ|Jbm3^jEW|U$5qz7!9NQU8qrvq08\
-&h_ox28Y&_qR%f=JUW%IxG@|=M(I2~bF=m&RR>(Mq0ADJ$SAu%2%=U)Dt|KgB$Zvs=KqllrCi4ZU\
-UJIC$~it3etzO};azyXU!XN7{TBidj)w#Q)m?RlMK^kF&DD&`luGdOhj)5z`r?yH=lzEAuwjR;42\
-cZijz{<tRu4id-cb`Z&^um4S;#}_JvjnO@<5PGx0B6Cj%-aqkpfWI897g4y!QQDBPH{2T}0>?dbA\
-{h9TeI2PT*IXUctua}9x#=z*pG(JaQI~_qU`;3z-$_-KDBXM}b*87x)FW$6Q!}Q!7T8}*&GXGuRY\
-gz#*N-mQ?tMn)l*MkG^6b8jqI#`T8)r(a^s>T|*bG-LFo($}#OpgDecrrtx-|%@PEDFiUDqX-yZi\
-=RU4^Npp2ud~)uD~>z^mUlW|SWZn@TU&Hv!VstI^Otj9WVTJQ(S)t4dS_;0aa$QEejXS3FPc)v1c\
-`rEgR1cTDy2NvmLCRo4e|dx9RjoaruKPd|1(^zu22NcQXLX}|uxIz@AI?{#!zKK@$>@ib!S4rJYG\
-oUPKMU{4;Yzeo6yy`G=W3)&Bz8k-KaU_IOBG)y*Io+`JXpHDHr>qu?F=p_9XQ<t^Sj8fXTbJ|1~k\
-qKHcdrwV|sR491#<+AmdvfV`A}JleD<w#OgSm8+Kd$gmUp$dNkrG9R30z)j0hd>h6(awLWHirq^t\
-vM^H8zQVZ@YhbuBu}qtEy+luBt}+zWhk5vtRox1~oa7IqH$MD0{BIe#`c?>h`sf8soYeS%Y|wtDz\
-CS`87nn^t!$J%+X9u(`tc<nnBudI#ZfEOC7xVb?&?}mpTxY<m!eUO@f%?xx~!nG$%x<reg5v@aWc\
-_o=~B`%x?d+u(VVqUxoIcoOV-i0X%Q0N-SurG-%r+#k4(4Nl$l$X}wqtYnt1Uni{+vWST*^F9$bh\
-(p+{H<vX;?=EtP@r>-H>MB@gaUvnomji%nVJfhu7?;9Uc@2TI~AO6EFIlUib4mp8Ersg5?=YGlOU\
-}h7g@u4U6!ye7H?8|hFt4}XB%=CM!VbFJuN6^OSn_aNny1z2v$VVaN?X?dXTEE<h{HsB*>@xa#VL\
-xLSQNMf-1r%8_@ZTsF|IDTLC8A%s7kI<5dYAPhh^b>#`Oli?brqVMg>RIttngy}q!6y{_i|ZvCFJ\
-SEPwmQnazI~8`Y{?ihorzWS$8z2=$>Z(BuyL8Z&S7kt8blNA)cxUIGVuv*7M<|!QqA4B%Z6tx7K5\
-qc{sOnyeHE$uhjf4eUi!$;KLGrI`s^y9TvLO@h<d~S<MC--0<jTg2!)I#T>i&t5cP#*K6M|&EIBT\
-Ugj?K$!Uc%ON(jku`XlEF-`?mRW^EX#1prmbZ&|IwX9g2Xo|lJX}L+Twj)&?xTnb4!lWX-=c3t#9\
-Px|vFiw%G^F=xf%RAGPrwU%3ef^?MU2zu_s$8+O%v5CWw9{R`@^jmp9a-%to?#p92FB3qx_S6E+V\
-#_C6_yoRYiF9eqN=d_QhiJ=KXd#?Zu!N{chAZ#oSUnz<I=d9b5tB)x<u`hev6`M*h71PckZ#XA^%\
-U5MDmunz-^on&CAq!cYu!m-owPc6~V-QFM^3dzDN^YV=-{ULBCDY_l@?)kxuN7BZU`Y<5)E>iR08\
-XWizeUBhwk7My4}Dk4$HT9+}RFWMtZRdIzXK-}y@`SB>mhZWT&hUey5iooqbH00)JW{ENV^$YQq1\
-*dOJ@0e)g9_Ct|bo1|$9>NI;i{uxoEcX~dZg_DZm+}hnZ#YQ(Xj8t3Lqf$Fh;T)9?&Nms)q+;uyZ\
-*RcoG}_}RoaW@uiin*HuMYMav(i*MS3btM2681Nk7v33YK@)G1(Z20?SQ2x#y*r}6wPrL&c~BGrq\
-o?F)m_3>(q04ZcKs26(%f@r#oir#tw>x@K^)orq~=xlJ-xjs#bxFodf>D!Fmqo{clid(gBRLFM-&\
-Hw#Sy{cXw=u-n(LmF7i=Zp7SmkTRTR<Wril@K7AE37mXuj@S5%WZWKaqn$IMZg2Dbjfm=!u=c5Ee\
-f>o|ha=Sev3OG6tm#T(vBp55fMu13$?1@8HQ&j!!!DG#;IWYDS9(_J&HPN^WTst@_HF27w^6~Ck`\
-=GUudA@uw9_OProN9E^ms1{POss_5z>-6vn>DEA1OrwoDyi&X8nmS(WF*5hUB6o@2rrPE7N#-tV7\
-BG*0;?a6a^@09O-QZ{S^U<d3ug?Z6ZdHk6Q?<kym|X5H3FgUXT`v*Ry0utF@jO+im*uLvv&U?4s_\
-znoK`?77WzZrFzPLW}aV6!tudA@=5*1VUBbxrN6AD}lGW>9h`WDcgZEzb6yN`gIM^DGm!!mw}oMY\
-U@?y~&3o=eN!)9fWn>GBB^NOQu?VO4k1JoB5bFe&;YEV|w}TrM#NtmnTK&Ud>?3%x3&P0(@NIo3r\
-_;OjZN`V%jvo7)~73GL0g{=y!*9??yuv3vVH6cmg-#VQ=T3%$XDIDNdXr>xqTFEWz{9BHme^GaRk\
-l(^@5)pbJi9#m1!@u;{R@(!W<k<+Xru?~dpyy`%whTgO8md|kcdYY$|jk7i~uQaHWq6IU1+eA<S+\
-8afgsqAuIDfe4Pv`X)rFaF71v}^kkF8}<gs8@Z*F-xX;xBFSXGS>-&4yo!QySQABCF#ead>@aLf3\
-=E#`lMigj36%b?s!W|c&ws$zT5wHX@#n>vpl6Ga|$o#{`43&fy~=i>^q?q8B<g<=sdUQ;@M@T&VZ\
-(w3LhTv6;JCg={Qgm*n;N<UBDmt%9=N))L9&BkEw-aaI25@1eHwjRhj5JH&msdCem1LBEc*$Pfzo\
-{QvBw9neLIWFW)N0!H41q-quwNonP{drH1cwk@s%js=Q22h>iGSPN*e<H(;$@m}ywlec@YG-QSAs\
-Pu}VgVXK_|hI)HC?vQ0MF;td=M-%kDiaNKPXn$(7xY!(=!|ySi-VBfVF0@{(omo^^Qds0EyS%rzi\
-!t<7Wc}4|o+1+UHVR8hbPeE5^ySIH9tP2RIR@wG`<u^u7}o0LsMr7>Um57#@YvlrP(7wP{6EQQ&y\
-ST?Q@V?;rKr9}8hA<Q$Kg`-^z4%P^GXUY)_c?++|(0!Xew-f?%1JjGHPR&6<%ISPgk3r4g4N_=h-\
->=bMkV`S^;k(GE2IO<~XP2M*o^Q>@kM#AI5Z)+A#*_Z=1y@o2f2(GONlG_1n2!-=6b0HOE?Os=K_\
-@ea`#|x@68ag{aFl<S90twNqTq6mzcgT+^lo_Na#1Xyhl0zHq6}jXpK!^!2O4!K#CvBxx$7cprAo\
-e`Pn*%I3Pwi!*x_gfcn99*`AP?a<}d28iVe85j8N=u%V5XzE{veV?%IC%wH<I2TMckFRD9=)qm{O\
-pLkVPEsb%a&d?WccW0{Gi|a<KjJ%(i%0L#Dj$1RbLk{gKz3=VLU8sm80YF>tjbe&DdbE~8PElqX}\
-;@F>Mn~UzbkeY_dQ9}8wsB91^Mbi1ib=Q*e`a5>Jt;Kh2T3#^9y3mykc+Y=vB<I$l(g!e<wNy0vG\
-V>vysQ!Q*TXb3MO6pxi@oEVMi;9t#^+oW7AzcK_=u;^>k3G(nh*ZxfMMS?{H1ZE7n6Y_9rS%cTJn\
-%5*<9@wjFHK)Fm_)yM*jRRm-Q?pIJzC(P^V6>&oZ)I=yCDRhbqq#^ud69WLj9ZdLo$yMgHuYIuk_\
-NntyBds-{hoSj~6G_Vh~rzuCNv6ylsqhpUdbo%<?Rebh!4eQ8s@x1w$PwM^b3o~KIk>TrYrjt3{r\
-PBX^{Wu{hjG&}~_jgBKc+@+7dUU<xJ<a}!=4^-TMGxmYe9wBYEu@-vKAD#%2YcyN-{wfscvgCBCx\
-xY(hn{-duRpeEp0}iMzS}om73rHLWwS*$Ry}iz=7)L;BeEVG@xcJxj`~w!39T9=NIR?`o$l)YcQ%\
-F$%n`(8^ItP<D{Vk$+dQ``bwJy+CxxZD!cDeuq`JK&a|(;-Inzm#=>-Y;xoErhuov^8d^clw_%xd\
-7Rbz2;F8u^ukhGw8^O;inWj<3*Ph~u&DCo3auP1`zb@n*@#E~(}Q)~^hyX=pNsDqst_Ppz6XJqrN\
-c$(Fiew^vzf4dl{gJ#wQl~h-#Sqj{uji3duy8%j#UAt+F(^5jtX7Jk68G2}b^{Qd1rvy-g&0H<mV\
-9Obp_e+|Mlh(^=13D4~%&6(bcGQ{9^}S0+ZPRHr!^6(6aYQhs#u295#xL-Pom=9+bX41>EH%tzod\
-}k(_Zn)dPCC5pHglFoe^#}KX5)lx5d{Qcoe1~XFza!1!5dii_SAi;Pe;}B+arQcP%>`~o9!;T#5C\
-AkbKG-%VI=hFb3jL#(;KG4C#TpKKhpJaLj3Tbcx25x>W7Io{WDX>@$H-@k(XyS5bz!hZ~s0GKSot\
-m^L{(-k?5~I;j8pA14oP_+LReebuTRIk5R$Qz)?XM6x4f~7wd7skl&<E3H(w+tlHmEZ71{#DI#1y\
-$QukIDy3lWQ;2LuU-$_6{;Xb|Fnp)h*x>Kf>dkiZeD4kq_CZA~$OykR9$VY^)%y$=PnB7q3&HPW_\
-5*hCw&xd-hW?03h)lgdKAA$<tV#-sOuz~VdFj?jabC`}GY0mY5r_W53Y{dCcg=DybmoN~IFI?oB0\
-fNET_Xc}HrY2aw}GZ0YS~Ob`+1P~8LqVb8qJZEc0lX-oA^3PPxpWv|9e0z=i%w+ru5fC^g2P3tg*\
-qrQZrzuH$_nAbNXE8&z5yw*LWqGIa4`0cl?<v_Gfxxs8_I<z-l@_U4>;XJs_P|+*AD2tE9l(6x}<\
-{^HV}3(l|vWTw2_V-Ztv#NR8xO2_e^Z^y&*TLHqvTt1-I2()apF^Rbu|XAEYl(2JF0HC4seMHWy1\
-dBx7@JVPa@8*4HP9g%M~iz73zYa{5ym);M{2mKaaI-~$m&YE!aYFdP&7h~U%^%F+Eg+3nxT?4(Cc\
-G1iA0w%cW&mc!VN5K)$Gubb5JOcX;GhI<l@d(jl*o$I|rWdgfWuZ@pzHNEvyHr8PF~UvLu;ysQbZ\
-$m!u*VAZ$YJC!1d4tHQAJs&EAlVXViEX#7HN-aRL-{d&SN&;qL$-SJK79f&-xteX%E!X>7D9}uf8\
-u}`rfgtA821ds|J2&tKS~Y3jaA0{l0nYZSs^o!*g5%dkle|#MXiR(sHZ2+UxD1$HUu~j$FS-@&@j\
-M1vJAWWc$P64Dz`*n6lGD3*8Y(FD<@$9y?!CT-H3J1^VUuqU*JXxk_Wrvl7(SqUvH#SXvP2EEc$y\
-LhmTuygDjOY8-58lmCP#N1rA<Ibt;73G&sPzHZDnO-I#lT_s}kJyS}z#s#LBK}ssH?GA6}81Q#<n\
-n>mi|0(f^ldJ#!hr`F24~Nqyyn}zZJ3WF<ZT+;&Se*YfR~5uu)rhwS5A1JCse66+sR}x<6sgFf?$\
-xF0kA)ZWICaR0CNPgGXv4pkbEvTCL5-ah7rkE4HLqMbEv5qR^?Q6wV&cm@3d<M5j3Md^DOP8O+5%\
-C`&Pf%oFZO#QZpcy(HOtd}g>uN3>Z)epG#7r+I>i;HvSj*o-+6oJvC&gea3%_Su-bm6(5#QqyJq?\
-3rI<n-;4KT2sg;+yOI5+oy?Bm2h!}FVN6ZuJo~D~bFxw;s2ap;#ufnu=^MXu}?M<UOw$qOSzOfVI\
-?PFRu#*C?(?%D-%JUw;;lcFnrtV<WXH}=l__LFDLljw&h_xJGe_`pHvoRIhHemD!hVQ5{i7UXe5I\
-K5<^Zqsme%In=Z=B>;N`pV)Mj5nr6INli3p|1$umgir;i@m)aiAwF$NK~pAiNeo#23bD*mpjwp%b\
-jwAIlbB<ehbw9<7$O897G8N4F{$BX8uO^<<DU0pl%|W#B6#>WLZeBhQdtVGA_g^z_GAk-a`z9`Fl\
-5;p`lO*eB&-i@<lNx&HfvYq3O0_KuXrzL9|q7xF$z$pEitO)4d+AN_B?&G67zSQSGRQL_EZuJJ{~\
-!ojJ{Ak8z1<>;KImEAvU=xh1OU6fn&_<To*(5F;7ul1-5`SJWjJ^dqN1Ta~dG;Sz1k2pTs*4_b$f\
-F){v>#2n|G-i<qn&+zUc*^^G5W;^z<!LT5ML#oaV@X?`h_UO<|ck#UW?nnoTQUeBwf_}8#Zxv@im\
-wJe;_td|h@n4(;9sQ`(w`a<<c~^y5QTO--Gy%WK>sY^t$h}Y<c2QZ72m^c5uO18<G@TQt7tNth7<\
-*FmD+;;Bsyk|NiH^wUSPv5JG0{s;qtSh|?r;;ty#sp0G}Sj^>OV9PevbG6AMNyp=!y(eFcA&(VeE\
-9cCexspe_vNl&u?4Mz3*mTl$jFc`+`H*5yF6ZP(2Tm>7;bNn|rTPT=ewk)UZ!Z1{uKY`#Tr#0oK4\
-7l@4cYMiHqM%EO2`{~Lk&e`)B>48C3(_$Zr-73NT^Cn|gCz-zTTrt$D#4m}#5;fiRWFq%Gv-VV=M\
-ZKpHzROA>xuiw*)tipUJBkYSGdYE9))0kP{2wP7F5;)cnWj~MUNV7_KjLZ6fo;sAgU^$mBveV}tB\
-kvtGudAGHy_%xWP0bjO*Km>Vc@5cAYv#u|>mkv3#l3w@bgG?I_TnnUSH(o%-3e=(ww&)?G|7&0J-\
-;DAWg6BxdV9)Cp1!r|>KfS_)Pfw7-RseZe#aO;7XY)4``VG%t49pP*jrlQ*ju#Ul8nALGc&MHFFF\
-%Zg~OB}x2V4K^`*OX>)zuGxM9Vtug>d{eRb|j_vr7`&hnqRHZ|BeJ12N|%yhdq<{Y{y>A?`Qh@L2\
-D8q9s0@t^Lpp5LUeZi@Hvo*iW6!fEPQ9I^gZ?t+M4nc?8OimyW};I$a(&^6>PoJH|NcbP#qn5p{Q\
-X%<Nbo5LA6+}JNO86xQy%kb|P`*yrWAdNf4^l*XG+tUPN@i=p|Z-c;o&}n7VSEZ^1u5MOMGiStpg\
-mu!4>87B}uIx`T({_BL`~$dW$STK(dxpGWdoDy?8p(`r9Mp2S!gpDyAgCXu4bf{6wvGi3PphN|cH\
-`h4f;5*EKyvW(`9e(59BS_b4m9`p3ZbCe3LX>t^al4JlSJV~Wkt~pk*2!rv5FAyDJzQhHD#&6UQ-\
-tRF@=9inSaT7N?miy=ge_g(|OE?+Ig-})GhQheZI^zV)fTjXI_#12xCShFVypWlAy<ivfstT@5m2\
-2@ic<gZ)$H_ztjSXS!*uphmV84b~=*Gx`#$`REaXDg#P6aY@f!b?<IU^_>zUdg(pw-y|7#+1wN;9\
-%K9T+j#+x|wOjjU9#83I5zJwVF3DXm-I~`F^*ab6-;Z-Tzc3)x@BUyX?veIDN14CNw-s;#<hwIO@\
-o-hx^x5G{pF@metJXqV<RjR=g+n|$2}=ZCUS~LTW~@w1HeXQ>n?+A7nNIH)HovCe8(3U=<1Rbvb7\
-r{A?|#Xne#?e^6xQs&;GePyl5&K6BY*h873>{|VoW8VQ-CVJo%HBeVfy7P_CE2=nA07u;Qd#Q==!\
-fPS)-1ubkh%=5$iX3_@+lr@SADq^_!dNobJm;g1&Ym*gVT%ZDUpcO!iK9DE$nH6(i|pYeE?;t~N1\
-Fy!~7E1katN>LVSB$}aRuC8njITNY_9^A!eFA?bzS3%GINtB88SGR5S;X_Y-k6ByVEKRb0S%udxW\
-MhF(-C>IX4(=?7%87@0DjdJ2@6p=B*Me*3zJ`NL#bXWUq75bc013oy8%k>aS(?lo@-?`9ZWJ`@rW\
-a}wrnm{+%>|v_hlJ0LXzw7p_Ia8DL3@(?o(2P>riF2CMMPw>b#0|E<n3fY+P!svAtnRR=|26Ildo\
-BkCTGM(CxGGcWQk>~2GbL`VY+aNK>}xU4cg`toH^YbUMXJDA;e1p<qe*J$XcBCB6JMND{bo7`UX<\
-Ky4->8ZTeUNTUv6Xg29asM_&b8EL0(*8YJ9)cOX$+^zYs%r>cF1OHtoo3z0FC4_b}0Yj1FjJu1WN\
-vIaRr6k8?bim_To?aiyBV_dQdpYn%>dW^%FhS9*t9q5Y>Iw+2-c&%|T&^xv_ihd#FSpvRVOz43*v\
-4xJL&JsbWNXR^+>Qgp)QA4&D8nXIajRRyq{9l~_j&UGuuTWfkESVLX5b38Lk%Vrgwc;d;W^G+V4@\
-!}%Y$k*i1R7Cn&XPn_mJ2@rptSOUDKf{%JaytK(dU6K+K4XSjBK>4XW}NzU!s(M-j+4_)9tVKB-#\
-Y&5kMqM+M_gRoUU7TJ4Oah+SO3*N_fr4eNBwtS>$iQ?fA=-YUY1JwU{D5|e+S16v3}F~e!Q&y@BY\
-^B_L_sOb@ws6k2;P6EL|T_oV9IQXV7>5eD}|H|9tn)cmI6%&v*ZP_s@6#e1re!|LLE1bqtCdrhXr\
-#{>?k?@&j}R_e6*N_r2mCwEmu={yoIwNr+P!;W|qzKisoloXY+-@$&n|{mJ^9{@?6fe^N={{&8C^\
-?efj{sqGJm+hOqw_gxYnr?SRf_V&!*<Ky;zm$>YN>xRUs%yF2-9<#l@<BqWSQp0=2o%k;8f62&w%\
-+Dd#{&)UvZ}W4h(9^e(zD($|HV!sFZx{LsYdhN}`0F+=If{Pj|K1Vj``=Q~|1;R9F9SURmcJeJp`\
-b4Z{SeSsfIb5Bm7qI7Zw7tYAfLVg^wVMaO`z`w$G-*iiLm@O(6d4B1bq_dJ3-F@eHZBG;&!a^)`v\
-a;^bw;--&g(n^<F-G6zKJ!j|LrzAua{<2Jo8+`o4Sn^zoo?hwW#BejO~I2l^MV-x;81!hSCTeFZE\
-(8+6!hTnXsIz}Q02e+4Tn0{yRWoJ&C82*<M&^jBcN%RsM%?cWZ17HnrZ=#ydj6`)@a`byC6f$cPd\
-{$n`)4WQo$<**6#xu9>s<ALpO13ek^PSD?n?d$}7J?OhYKM^b3(LQ|!$U{JHg8dEy{Uh)@0`!|<J\
-EK6q3idl1^eM3Y6wni~{)2uyY=1oH2gCNWLH`+SClB<waQrhs2RZH{(0>Pim<{@9s3#?$J7M{SSP\
-roLMWDZi^&j+6;A<)9Z5Yo%-v-;c9rVE%&q03^>p$p2U^^>8zXa<)=owi5LB9)@-voL*9M2Ze$HD\
-Pz1N~muekbTdVfme){~ng#1^Sg(5I^+ke}e4{0eye0|Daz1`Uuc}1o|k@FNfn94f;E9ep5g{8uU!\
-i-^cn7dMoJJpx=S<AM~Mc0%m}|57vLsSHkhk27NsEEdl+0*v>-Ge+}DN1bPLO{}Rx@!h8mg6YD?d\
-r-FVv=<_lDgMJ>A&kE4DVLk);8aV!D(0_pSAM{&5-vs(Kn9qQICM>@VeZhV^LH{{yXD8@qVf_c)F\
-X1@Gr(cNiAM{e#&M?p~h3$+0eP4|KpnnMZXwa|2{0H<$VZWK6{}Ssz=uH^^L0<{W=Yigc`48w%Lp\
-{6*^qEl3vqAqo#(&WNi1`obLooh>{t?!H&<}!gSPJ?^(3gRJD&{|+zl!l6^j#SLLEjJSKj<T2zs;\
-Z*!*(`+J`MAE(5qoPTR>lr@gMYsn1_S@Io5yBQ(!y0KtBg>@W=Y}c8vd^e}?rR^dS&GM}WQ*&ig3\
-PU&Z_%^eq_wL9d6y%mn=<*v@#+KgRkG`f7~-pwEHjXMnyR___%60<8a_pMmio^p$X&3qg0l@hk%U\
-3e0~%zZ&a5=-C+mK|coTKj`Oxz8v&IjQ^lN1m&|5^qa6f3wj;Kf6xzv{cZw%BF2BvH)H(A?O^@``\
-tz9ofPNU9$6cVGg$=eOpZ+Oqe+cON!*+&&elToj1nB!>`xo>%82>@{V*U?$E5?7&Z^il#`pek<1^\
-oih^FaSM=Kr9-h4CNsHq8IAe6als`Vru3A?SN!{sa09SbhoUH)8u2^lXg(pf_ND4(JzR{sVd`=qs\
->3VEY&Jhd^%zeK+iP1L(7`{)4_1^evzd#`Z7hA7lLoeFOIAfPOr-e?dP0^Z(;~dJ*VDK+nhc5Bg2\
-m{ssLLjQ^ltjqP9155W8fbPwkLpu6BW$Ai8Fjwc)R12O*r{URv;8KD0bwsR5aZ({!s=$o<rgZ>WI\
-f6y<-`VV>n)_>5i!uSvRd2sy8KtB}Qzo6d-`f|{7;CNPm-T}w667-L-{R{db82>>(2=gD%|A6@q=\
-)17~gYLlmAM|Cgot>cnANFU0J{{}-@o+p?|3SYI>p$oRVfz>KC$aqt`V|=eLB9s;Kj_;r{{ej&=K\
-r8yiS-}!`=Q+OK>sJkf6yPt`VaabZ2y8j4C_DW3o-u({cI?oMWCOC^&j*TvHpYJh5etP9}4@u9rP\
-nG{{g)X^MBAwu>S}2!Px!<Jqz=H(0_*UAI~Gkf6!OJ_P2pP9P@wBZ^iyk&>w>G+y(kX%zsAv^j~2\
-67xbH8`C*`M!}<?;F4lk0560bs{v#;o6wnK>{)2u1=0Bi+f%!k^*JAw#{bG#&pr>R1Kj<f5{tx<#\
-nE!+RJ?#Gh{T0mrL7$K9U(k!O{)7H5_*w?~Etvm+{vIs99Q0Pqe?Wf#^B>TYG5-O*9P2;m`Plyt`\
-cE<bgWiqfS)hN3`48xB%zr?C0pmaDuVequ2|oQ;(1(CN2=jl?mtg$|{pZ;K19~FXf6)Jo?O)I<vH\
-u_RLoxn?{x4WQ8}wJO{)4^^>p$qvVEzyKyO{rgel7O@fIbQ1Kj^bC{)4_7>p$pMgT55>%P{`|eFw\
-IGLBAgRe?YIt{0H>!Vf_dFKCJ(sKMTG#fPNdsf6&Kc{0F@b`+q?HCDwn?bFlpj`e9iAu^wXl|B+8\
-0gZ)3CKZyAc=vQF>C+H`^@}ofCj`=_6uVVcN{b|hqLH|FD|DaFC{0H=zSpPxyVEzMoGxq<3ejK)c\
-L7#{9AN1?6{)2uP#(&Ts!TbmG<=FoZ`WM*$1Nytz{}1{-SpPxaiSZxw)!6?7`lVR^K|dGkKj>#-{\
-RjOQSpPx40rP**ov?f-=yNgtgZ>-Le?VUa%g3Dv{U@0JgZ_P3d>H6&V*3~LLoxpWy%Os`=-uEe1@\
-yx){{ej%+>geCUWVgepkIXjpP>H$`~N|of$<;o+d-cV`ZeII1oY1_{{ek9_Wy(abJ)%j(2v0S5Bm\
-O?|A2ls=0BjjvHu73_h9)Ipr3&8ACD9J|3R<9{0H>&ar_JPkvRSfdNJnzppU@$51{`A+rOYM!tpQ\
-AAIAEB67&;d|0n1p;dq9DJ__?6&^KWJ59p(D{1@~R?EeIPE7pI|55)Qp`cJX{6Z9sm|DfLs`<(&$\
-r<nhPemd5F(BFmamw<jg_Wy%kiSvIz{}}Th&=+I=19}?fKcK&j@gMYbZ2y9OB<4S$--YoX^pCLp3\
-;GU>|Dcb>{2%lyvHs)nVEzyKAguqO56Aom^akwz1pQge|C1pOWBw2N#~A-XpM>!r^dT7kL7$5GKj\
-;r){}1S|WB!l(#r{vwAI1D1^vRh2fW89rAJD&t{Xd{j!~P%8KfwG4^tBlOL4O?UKj>dz{Re#^)_>\
-5y#QX>JTCD$|pM>pS&~L=}5BfFO{{#96tpA{=;(SifkHY>>(0_vCU!ae~{0H=3WB(86Te1HK^cOJ\
-xgZ>Nb|2!GS0WtppJptRlpbx?PAM~x5|AT%KY=1Q9f5-R_`Y4S5pno6pf6(8@`VabCoc{*;+c^FU\
-`Z|pNpijm45BgD9|3NRo_z(Ib%zr>X8uTTg{|EbjK<~o*2lO9e{sa0#%zr@Ng84t_?_mA|`f#WZ&\
-7gPS_!sCG<NP<!55W1KSP!xNi{}yZf6y<$`VaaNtp8YUIRD`k7%#*2FX&(4{5Q~(vHpWT0pmaDPh\
-$Q9`imI<L4OpEClmC&V87!*ABy!K^aJ30<$<1t@gMX-nE!)*IQD;nejDchpdW+rAM_fG|Dcy){0B\
-W7<3H$^V*fwr!?FJ#^gm(!2mM%#|Dcb=`j5wn@gMYBtpA|T!u$vHcx?ZI-i`AgKz|0~Kj_ui{ssM\
-f?EeA%V$A<j;J%Of59r^={vXh9#Q6`P{{#C!K|d1b|A78m?EeA%6P*75`okFiL4OSMf6$-6`46D~\
-6WhO_--i7^pija42lNDt|DY#f{m0|P{!h@GvHu73<FNe;`o3^oF9ZE|SpPwvjrAY&uQ2}y{YtF=p\
-#Kube?eb>?O)J6*#8510oH%ekH`EU^b4^5gI<mKKj{C){vXg^!2VB%Pv3;&U!Z@8?O)KxWBw2Ni<\
-tj_{tV_np#K8Lzd*kP<3H%<Vf+XEJ?#Gky#;*bfxZUYzo55a{Re#q_J4w&kK@0fmty_{`hPI~gT4\
-UsAJ9i*{Rh1Y^B>Sp!2AdFYRvyZe-P_G=vU$V2hgWu{0DtL=Kr8?$NnGCmty`8`W(!EKz|hLKj@E\
-O{0H5Q^FKkq7~8+8Fb<3LAM{#`|DYFO{RjOf%zr??9NWL3Uxc?K&=WBJgMK28e}Vo0)_>4{i}^q3\
-pJV<5`t{iU1^rH}|Deyt`VV?1)_>5i#`q8VDcJuB`gu724fF{({|)q$u>OO7DE9w=z6s|)fZmMlU\
-(k=l{!h@8G5-PmRILA?x8wLPZU^%p&`-wxAJCU${ttQ*_WyuB4dZ_r<T;rCfc`Z0|A78G%zr?C59\
->eZby)vF{~GH*=xZ?kgMJ70|A781)_>5i!~6&IO055&KZ5x`=(Dl@gZ?ATe?Wf&>p$pgvHpWT4(C\
-6EeiXKULC?YZ4|*ex|APKL)_>4bu>A}ASj>Mw|1F%aX3%$H{RcfB^MBC4hw&fur?CFx@{sR!g1#8\
-%|AXF*`48wfWBWH9_KWo&^p~;zgZ?|vM}WQp=Rbp9f%PBs*RlSCz7pd<=qF?R2mK7p|3UX+|3B!P\
-F#iF)9rGX1PXT>4=s(5zKX{z@{3Gc2faN04e~<YO=$~NzgXM<(|DZpJ{hy$x;P@}-$Kw2d&@(Xq0\
-ewHre?Wf#`~N|oiT$6T-;Vu1pl`waAM{kre?afT`Vacwu>S}2G;IH7Kz+vkPtc#n{vXiC;P@Blf5\
-rL_`Vt)f#pSX7gZ>cKf6(8={2%mR;rK7;!!Z8={Rr&;1pQcy|DgX3+rOZvWBvpB^*H|l^l>=<8T3\
-D5{}1S1tpA`VVEzyKOW6JeeFEnHp#Ko_AJFju-IZ7$F#iGl$C&?vJ`dwR=m){}w}5^M#(%62SpPx\
-)0k(fZpM?28=+9yPGY0wru>TYEe_{LwJp<!E=x5{jFX;ck`VacwasC77Q?UMnJ_`GPKp%$r59p8L\
-_!sDJVEqR@9`k?De~ta0SPq!~fPOm8{|9{&)_>4fVg7^VhW($QZ@~BudIiq^2Yof>KcN2;>p$pwW\
-BmtxEyjP)AHn($`WTG=pudFqKj`_`{sp}p^MBA!#{3`jWtjhf{zn}D8Vhk1<3H%fVEY&JX6*k5eF\
-4^g&>zA6f6xmt{)1kG^&j*<WBw0%DaL=$e~<AW^s(6giTlO;2lR8W{)2uR)_>4%#`q8VPq6-j{wr\
-+%g8mG?{{j7C{0DtMtp9lY82>@f#QuNK^DzGby$a($=)>{(7tn9O`VabN*#8OoILv=Q#~00Xf_^p\
-j|A2li_Wy(a0@nXb$p10^gWiJq59qTn{)0XN^B>TEjQKz4Z(;ohJqhPOfW92x{{wmx)_>6Ju>OPo\
-Yn=ZK`g2(SK`+DhFY1{8gFYSGzo4(f`VaaKG5&*oD&{|+$7BCL=r>^d7xeQm{|EigSpPx)66gPbe\
-ks;}JinO#gZ>B1e?b2f^MBA!$NUHM4H*CNd}00%`n4GUL4O$Q|2W78aQ++Ucj5Cdp#Kf?f6yPp@h\
-{MSgX3SI{~z}MgPw%_KcHWN^&j*Pu>ONyjQ#(h?~U~z^b$BP7lB@n@gMZlF#iYLgX3SI*J1q!{Z*\
-|0pyy%#59loz|3N<t>p$p!!TbmGBFuk4KMDJPKtBlQKZ8CS^B>Uf!}t&S;TZoxZ^HZs^gHnRN6=?\
-t{tx<-nE!*m6#IXE4DAlge?VW3^&j-nSpPx)CFVb%dvN><^t-YCgWiJq59m`c{|9|HKK})}3+q4V\
-Ud;bNUxV=<^sg}fgMKj1{{%e?>p$r0u>S}2wb=f}^1=Rp(2v9UZ=nAe>p$oVaQqka-(dU)eJ{*^K\
-)(#fe?i}j@gH;t&i?`ZT#Wyq*I@hy{V<IGpudLsKj=Tf{0H<#9RE5M`Y|y6gZ=}|e?U*f_n(0NJj\
-Q>}e~IxQ^q*q>19}lY{{s3}%>O}u8QZ_0KY{IE(C@+c54sEEKj`DJ{}c3AG5-PmH`xCP`Wx8)5Bk\
-3`{|Eh3%zr>1j`bh(L$Lo7^v#(6gZ?r0|AW2+<3H%tSpPx48RtKM{uYjZfqo&je?k8P=KrAo9iRU\
-K{YtF=pnrh*59ovO#dD`Y`vT)X=oL8s0rW&1{{{Vcoc{p&U$FlN^!+jZgFXlIf6$-7{0H<~u>T+Q\
-*Kqs`^#8;Df6&ju`JbSli}OE0{}1Lrpx=r4Kj`OU{Re#`)_>5`F#dzS7v}$<ufX~b`c8cR1L#L%{\
-Re#s_*x12D9rysKLf|VKwpaa59n@;|DgW?^B>$k=0Bi2G5-hs3+(>~{Yi}fS@4`J)_>4X!~P%8cV\
-YV%^of}NfS!i+AM_8f{)2uw=Kr8yi2eVd{~hxm(1&9D2i=Y1zo4(j{!h?P!TJySF*yGd^c|T0fPN\
-<C|Da!s`9J7RjQ_YD(3gR}4_p_wgT5c;|Db<~`48y-!2AdF-(deI=&LaQ2Yn~be*^tatpA|jgZU5\
-WCt&>t{R!;<0X-k%Kj>%S_}5P$9^&{f==)>-5BlBM{|S0C_WyvMjrAY&H!%MJy$ZXjK>royKcL@$\
-`48yVVEhODLCk+ZUxW1@^i<6MLB9m+Kj<f5{sa1PIR6dwdolmV?PL81eIwR?(5GSlC+O{%|AU^3<\
-G-NahVy?wKO5se=s&~$PtY&K`VacE*#5=i!T1mQbj*K1-wU6A1icmK|A77$_W%48`U5fl2mMIQ|3\
-N<v>p$qn;QSxZ_s0Hz(BH%HFVN4&{2%lgnE!yj4dXxP_h9@7y%X~v(D%Xm5Bg6q{)7G`=0BjPVEq\
-UEpBVo^ufh4xpqF6%2YnvS{{j6eSpIg<-^Tt=&{MJh2lT;M|3Uv7_WyuB8S@{|kHGvN^hG%T2lRU\
-}{|9{p&i?_u75jfcKN0(XK)(z7f5t=m5#vATXJGyV`U6=1LB9y=Kj`DI{|EFb82>>Zi~T>KpNsV$\
-^pi3F2Yo5Vf6!~O{|EHN*!~5*9p^uQ{x6LGpl`<fAM`(A{Re$2)_>5y#{N&x561i-^#9=e2hb14{\
-2%lKasD&ti?IC*dM4&Sp#Kc(Kj^ub|AYQ#jQ^l-$LAkGpN9QEpr4KT59l=*|FM2z{yzbpOU3*j^n\
-I}X3;Go}{}c47*!~6GiTMxcd*kzup#Kotzo0*b`48w5G5-PmGaUZ{{ZM@WIq2tL|0n2gWBvpBy;%\
-Q2{}Agx=y|aHMWDZh?O)Ib<NOEE55fL_(C@?g5Bh7E|A2lcwtqpt9pgXfT^RpCzZv^KK`+Pp4|*f\
-!A>aM)yZ?O)|M$tzBfrdE{Qi*a>iAcV+B+`0vbk)p-J7x(uN^|8FuOC}Qu4>UlipT8h8|^>H_uyq\
-y#3AHyLT@&Jjn27=DiHBV&2>E{mg?6-@zPj_*&+D3}4M`I*GSm$~?qyA@hEQ&t=}<@C4=q3_F+)G\
-<-C3g5lxJ2N@p3Jk;<<U)wy4{4)<H|I7!If9CIzf96BTKXW4aXFintGap9&nMaU+=I@h#=EKQ9^A\
-E^B^AY5qc_jH~K9c-1A4UGVZ5~DbnU5y_%s(Xm%*T*_=3~h}a}xPyK92k|A5Z?7N0Wc%6UaaFkH|\
-msiR7R8B=XOkO#YcqCjZQ*kpHi2P9guy4)V{OO8%MC$Uk#B`De}`|IA~^Kl51f&zwpAna7cT<{y)\
-P=2OW(^J(OtIg9)=|AhQA|CIdy$L8_mpLqiLXFi?$GoL~JnJ1EeW+(Y)K9l@2pGE$ev&ld6B=XNZ\
-nfx>7kbmYW<exd0{4<|T{+Z7q|6kgiNB)`5CI8G*$v^Wn^3Ob-{4?j1f99W&f9CVZKl2Ro&wM`lX\
-Z|_)XTE^^Gyj78GZ&D5<_pO`vy1$HVe>`gpSh6yGtVUd%thp%c^3I+c9VbRV)D;?G5KenP5zlZ<e\
-&MM<e&Kx^3Obn{4;yWKl5Dj&peO(@3Ogs{4-xl{+Z{Kf96v1&s;|SnajyP^8)hEd>Q#?UP%6#FDL\
-)Zzasz4SCD_^E6G1|1^H*biu^PGn*4um^CI%kd^P!J{tfwOUQGU(uOa`;mE@oKx8$GscjTXW3HfK\
-PBLB?4C;!aV<e&Nf$Uk!p`DgwE`Dgwk`Txx3rR1OaTJq0)9r<Uzp8PZ4K>nF)$v^Xr<e&LZ<ezyN\
-`Dea~{4@WV{4?K7{+Vwf|IBsdpZQku&wLyC|F_MzlYizr$UpO6$UpO6$v^X*<e#~o{4?K0{+aJ4|\
-IEwDKl9(nKl9(oKl4AxKl450pSgkjGv7=8neQY2pW3{F{4?KA{+S;j|IGg+|I81Pf96K=&-@ViXM\
-ULcGp{87%#V<N=10jt^JC<n`El~k+(iDFpCJFtPm=#nY;Gq1%&W*h^J?<XyoUTUuO<J?E##kh9r<\
-ToPyU%VkbmZ<$UpPb<e&K&^3S}H{4=+bf97Y&Kl5|s|6`jsk$>jR<e&L@^3VJN`DcES{4=+af999\
-SKl97vpLq-UXMTnJGrvmynO`IS%v;Gnb36HGex3X?zd`;#vUwZ%XMU6XGrvXtncpV=%<qtY<__}D\
-{4V)tevkY!caneR?c|^NU*w;82l;1ypZqg-k$>h7$UpOk<bS8lJIO!uN93RRWAe}Z3HfLKl>9UQo\
-BT6>M*f*UC;!a5$UpNJ<e&LV^3VJq^3VJg`DgAX|IA;Lf9Bof|3jPg2mF+O=0S!xGw)@174zPP?`\
-Ixt_zvcH!`CwJWB6+3eGOmAJj8Gz^L~cUW!~TL1m*(_JD3kNd^B@{;o-~&86Lzu)bK|iaQmP9GY=\
->K%m<Ty=I@bz=0nIob0Ya?K9u}3A4dL}N05K!?~{M#!^uDM56D0B5#*nFB>87PlKe9tMgF_E{ZIa\
-xk0$@jKP3Om$B=*KW63{r68UF7j{GwpPyU%llYizD$UpOs$UpOm<e&K@^3R-1{+UlE|IDY5|M$85\
-PyU%5<exc}{4=MKf97=Z&zwR2na7ZS=CS0TIg|V|k0bxgKPLaor;>l>)5t$_7WrrX3HfLKDf!>Q?\
-SJymJc0Z(pHBXn&mjNI6Ujfbll(KEN&cD7BLB?U<ezyG`DdO?{+V;gKl2pw&zwvCna?Kw%;%8*e{\
-uVt{4<|R{+Xwef97fApLsg@XU-@8%s(Ul%;%AR<{9Ll`F!%v{B!cpd;$4q{ssAGE+GHR7m|Nw7x~\
-}L?SJymTuA<zXOe&BBJ$5Xi~KXY$v<;3`DebE{4>uc|I8lp&-_dB&wL5_XP!g;nZ4wnc`o^9o=5&\
-Wx&2T6nJ*>(%=5`Vb1C^}E+hZU<>a4v0r_XXjQle%B>&8plYi!4k$>hZ$UpOy<e#~M{4-xg{+WMG\
-{@>&FKlx|An*1~WhWs-xCjZRWkbmY%^3VKR^3VJ`^3S}4{4-aPf9Btlf97iP&-{PnpSgzoGyj47G\
-yjqNzsv1^^3QxN`Deb4{4-xq{+Vwe|ID@IpZP}e&-^Fy&%BKMGv7r1ng2}wnQtcl%(sw#<~s7vd@\
-K29zK#5MaQmP9Gv7h}ng2rmng2@uneQb3%=P4-`7ZL$d^h=LUQYg*|3?0q|4#my|3Utl?;-!p4dk\
-EsUh>a;ANhZW+yCUB`F`@x`~dl9{wMioevte#H<EwmhsZzk!{ncNCHZH5g#0r<O8%K2Bmc~glYiz\
-W^3VJP`DcET{J+iZfAY_~iu^OLCjZQ9$UpO1^3U8t{+ZX2f9Cb%pLqlMXMT$OGe1rKnV%v5%p1u+\
-b1V60ewO?*KS%!G;`TrJXWmTynV%>B%rB6C<`>C7a~t_*eu?}uzfAs_w~&A4SI9r}tK^^gHS*8Am\
-HacelYi#d$v^WO<o``>|C4{_H_1QqTjZblZSv3j4*6&9Apgwol7Hs+$Uk!@`Dflv{+a(p{+V}>f9\
-CheKXVuPXa0cvGk-|_w{iQQ{4;+<{+T}}|ID9|f96lgKl8uIKl5kgpZRn0&%BHLGk-z;nZG3e%>N\
-<(%wLgz=5F%O{5AP!-cA1B;P(Gs#y|5Q!<(7+GQ5g;Z^QR94>o)UbG+eenfEb#HS@lPFJ&HLxR7~\
-2!{;*ZZ+HUp0frsS2O2(_Il=I7=7S6mVjgPvqu06pPyU&QlYi!e$v^Y=$UpNT<exc_{4*a){+SOW\
-|I8!EKlAs=Kl9<_pZN#mpZN&#&peX+GapI*nU5m>?cDw+|I9~|f94;Of97MzKl8EVpE-&AGapC(n\
-U5#`%%jOa^9kgi`A6iR`9$*1d=mL*PA31%CzF5XQ^@~TZvT^iW(WCaP9^`$Y2=?do%}OrkbmYe<e\
-zyg`De}~|IFjaKl6{tKl7>NpZPTM&zwd6nSVn5nSV<DU*q;a`DdO${+UlF|IBBQf98qgpV>+Nna?\
-Eu%x95*=4|rMJc;}>PbUA&Ipm*t3i)TwCI8H4lYi!O$p5R{{wM#;=aPTsspOw|8u@3QPX3wm$v^Y\
-Y$UpOW<ezy4`DZ?#{4@WY{4-xb{+WM4{+SENKl6p;pV>wJU*YyY`DZR9|I9PVKXVcJXP!m=ncd`{\
-xtRPjUrhd)XOn+s5BX>QCHZH*g#0tlA^*%?^3Ob%{4>uZ|692IPyU%NCI8Ix$v<-``DZR8|IFp&p\
-LqfKXTFU5GcP3n%$JjY=3kM2<}1iQ^OfYExq|#NUq$|ze@*^h=Jr4NXTF;JGyjJCGcP9p%-4{A=1\
-TI<{9E$R{5$f`yoCHSSCN0_-;;mlYVyzgf8?LJhWs=Cf&4T7k^H~J?SJymd@cEBzK;AeUr+v-Zy^\
-87wd9}qM)J@6C-Tp{jQlg-ME;roO#Yc~CjZR0kbmYn^3QxL`Deb3{I_xYpZqi5LH?QlLjIZmO8%M\
-eB>&9y<e&L2^3QxX`Db2E{+a(q{+a(y{+a(l{+aI~|I7{KpZQ+$&wL;Gf05h&<e&L|^3VJL`Dgwo\
-`DcER{4+O_f98kCKl8)npLr$uXMTkIGe1iHnI9wn%#V|Q<|gvb`~>-Dev<sZ!0mtX&%BEKGp{E9%\
-xlO$^IG!H+(Q1D*O7nb_2i#<1Nmouiu^M_P5zmmA^*%9$v<-|`DcEX{4+mC{-5XeKlx|gO#YdlC;\
-!YZkbmYE$v<-&`DcEK{4>8y{+YLsf96-nKl7{PpZPWN&%BlVGq;m}=GVzT^Bd%UGq?ZAKl7X9pZP\
-8F&-^y|XMTtLGk1`G=6A_I^Lyl<xs&`eZzuoE|04g)JIFut`{bXwi~KWxK>nFOB>$VZ{ZIaxKO+C\
-kACrIPPsl&>r{tgc-{hb9GxE>;Ir(SaMgEz;Apgu?l7Hs^kbmZ{$Uk#8`Dgx`{4?(+|Icyze{bWT\
-d641F%zGJL#k{xS`<VwDzJod5@U_hQ7`~c$U&EI&4>4TGyr1E7nfEt5f%yQ#4(0<5AI+R#csTPxh\
-6gbZHT==D-2Ny3%)`k)^TFhw`FrG_`4IBYoJjte4<-N1hmn8g5#*ow`{bYbaPrUm1M<&&1o>wkN&\
-cCSB>&7uk^fe1|C4{_qsc$>56M6CG31~5Sn|)DME;qNBmd0DlYi#X<e&Kj^3VJu^3QxC`DZ?f{4*\
-z$f98|PKl3T%e<Qd5$v?A${4=MLf95pu&zw&FnKQ^g^BD5aJeK@3XOe&Bapa%*$K;>+RPxV!8u@3\
-=BLB=kA^*%jCI8QG`=9(XPayxyr;~r?Gsr*lMDow<B>&83l7Hs2$Uk#7`DdO){+TC}f94$W&pd_v\
-Gv|_j=CjE^^Eu@IX>R|Mf97+^Kl4=b&peI%GfyY~%=zS>`Df&x`8@K^JcIl*pHKdoe@_0HFChQSz\
-aan21>~RkLh{e-BL7cu`=9(X7m|PGndG0ji2O6pBLB>8^3PmM{+TZ(|ID+=KeLDYGyjtOGhagfnd\
-gvyW-s|?o=g6j=aK&n-2Ny3%$JgX=K18Gxs?1fmyv(wa`Ml-fc!IGM*f)>l7HsQ$v^Y2$UpNH<e&\
-LU^3PmB{+X{L|IEK8|LeK^PyU&&CjZR8A^*&a$v^Wo<e#~c{4@WS{4@WK{4*~h|IAh7pZWLXpSha\
-+Gyfm?XRaat%zq&N%zq^R>$v?-{+X{O|IF8sf9C7SKl2UbpShO&Gv7%5ng2xonU|4&=9|br^PkB-\
-^UdU+`4;leTu1(yZzccCw~_xAZvT^i<~ztg^Iyn6^Iyq7^PS|Mxt{zp-$nkJ?<W7u%gI0U-^f4n-\
-^oAoKgd7xJ>;Lcf&4SyOa7VfBmZl;{ZIax?<fDv50HQ6f0BRZ2gyHkBl%~3i2O4@O#Ycyl7Hq$$U\
-pO=<e&L5^3VJ@`Dbn-|IAO2f95C2{~B)plYiz_<ezyp`Db23{+ZX3f94kQ&%BQOGp{HA%p1r*^Hb\
-!X`Dyac{0#YL-bntLTggB3v*e%oIr6`n+yCUBc{BNEexCd@zd-((UnKv`ZRDT%CGyYwGWloTLjIX\
-wA^*&;l7Hsc$UpN|^3U8({+VAV|IBZY|5e=nC;!ZEl7Hs6$UpPj<e&K+^3U8s{+Zt;|IF`^f96i|\
-&%B-dGyjYHGw&e(%<q$b<}UKj`~mrA{*e4PbNiqCGk-+>nLj4~%%6~d=1<8#^S{YI^JnCr`E&Bmy\
-o>xZe?k74za;<6{~`a(Uy*<2Zt~CkHTh@WP5z(c_WxkxpLvks&CGilUd6n(;rp2f8@_`%-te`|`x\
-w5Od0)eqG7m9a$h@E7bD8%yJc0QD!w%*H4Ij;%V0bw5L52r04>kPJ6WsnM|IEY5Kl8!lpZR;_pZO\
-5-&zwm9nGYrZ%!iSG<`Lwd`TOLb`Ec^j`~&jOd<6Mt9!dV0k0k%hN0I*~ZvT^i=A+3!^AE{C^D*R\
-~`B?JLoJ9Vak0bxg$CH2N(d3``1oF@PBl6FDBKc=NiTpDslYi!u$v^Wc<o|JQ|C4`a2l;1CCI8H6\
-<exd6{4-~ef95gdpLs0#xB27UN$s!g6*u&#iS+&s#kpJk*(o?naE9Py!AXKg3QiQ9AUIxdw>aK^3\
-+@u!Az1ot6Wl7eMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!EV6?g7fA17wi<AB{)NHvfw1aBLyc4P7\
-oX~xcgOc{sngl?hxEAxJ_`Y;1<D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaKVI7@Jb;AF\
-u`f=3EY6r3P9UU2s-;`|Hl65JuUU2vP=R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04\
-QQ*f5x48h5QlLU_xoG3U!aJ=B|E#mwO?h@P~xLt6Y;8wvcf|~?43T_ZwFSt%{t>7BLm4Yh-mkag^\
-b_*^LoG&<6uv2iB;0(dZf|CS~6r3nHL2$g_?w7^+7u+SdLvXv`Ho>ieTLd==ZWP=gxL$Cb;99{of\
--41A2rd`w73>yVAUI!eu3)F&EWsIqlLaRU9w|6caDw1?!QC&3^DnqdaEIV_!EJ(D1-A%p65J@bL2\
-$j`I>EJqYXnyct`J-<*elpAxIl2e;9S8@!C8Vc1Sbnl5<F6HqTmF<@q)YC#Q7K8CAdRyyWlp#t%6\
-$wHwkVO+#tAKaGl^<!8L*_1y=|z7wi@67F-}WUvREqr{FBX8G@4qCkY-YI8ktd;CR8^FN*UoxJz(\
-{;C8`nf?EZ*2yPPGD7Zmzz2G{*wSsE|R|>8WTrSuv*e$p~aK7MN!A`+hf-?js3r-R|QgEW+1i|rw\
-yI&CJUvQV;4#Dk$+XS}?ZV}uhxKVI};CjJzf@=lW2(A=dA-G(ySFl@ff#7_>xq_X7vjk@dP8OUbc\
-%<M&!3l!n1$RF$&cEO;!5xCz1-A)q72G1YNpPd!2Ep}$>jc*dt`S@*xI%EbV6R}e-~z$<f^!8s1!\
-oD)5S%PHN$^O)iGmXZ#|!S>EY82+F2Nmw+Xc4?ZWY`jxJhuM;0D3<g6jm=3a$}cDY!y#xnQqgx8M\
-T7`GRu=I|XM6&Jdg|I7#qG!HI$s1jh^R-XzYy;4Z-(g4+eR32qhKBDhI#qu>U?^@8gJ*9xu?Tq(F\
-haJgWwV7K4`!TEx71v>?23C<9lEI3K<NWqDM69mT#?tV_3f5BaXI|R22ZWG)pxJ7W2;6}j>g6jp>\
-39c1fBe+s<h2V0*Ucqj`1%mSh=L&WT&Jvs<I9YI#;E{q81t$oO7u@}<IRApX1a}B-7u+VeRd9>oC\
-c%w@8wA%2t`l4<xJGcL;0nRzg1v&>f(r!a3(ghn6r3eELvXU-B*7yECkjpw951-LRh)mpU4lCVw+\
-n6)+$y+5aFgIh!3~1z1=k6#6<i~@QgDUfa=~7~ZovhD^9AP$b_&iCoFO<_aFXDWf)fQN2#y!ry-}\
-Qh!Cito1h)%r6Wl7eMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!EV6?g7XFE3U&(45}YA8S#Xlzk%AK\
-iCkT!g-2IF=|AM;&cL;75+$OkHaEst3!Ht3&1lJ3$6I?5}MsTIz3c=-qy@K6>3k2s2&K2wwoFzCz\
-aI)Ye!6OAH3QiClFSz?@asCB&3GNWwF1Sr_tKb&FO@bQ*Hwdm5Tqn3zaE;(f!4-nb1$za%1s4d;7\
-o02DDL6}ThTvquNrFcTP86IVI9_n~Q{wy!?h@P~xLt6Y;8wvcf|~?43T_ZwFSt%{t>7BLm4Yh-mk\
-ag^b_*^LoG&<6uv2iB;0(dZf|CS~6r3nHL2$g_?hWGn3+@u!A-G*|o8VT#ErOc_HwtbLTrapzaIN\
-4P!Igq51eXi;3U&)F5S%YKSFlrXmf#G*$%2yvj})9JI6-i{;O_O}{0r_9+#$GKaGT&(!7YND1UCw\
-95L_>~PH?T@8o`x<D+HGd_6l|jE)bkAI9IS!aF*Z<!O4P?1dkM)C^$iIyx{J2;`|Hl65JuUU2vP=\
-R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04QQ*f5x48h5QlLU_xoG3U!aJ=B|7IFRsc\
-M0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3QiQ9AU\
-Ixd_gZoO1$PPV5Zo@fO>nE=7Qsz|8wEEAt`}S<xK?nD;7Y+2g3ASa1-k_o2+kLrE7&PGOK^tZWWh\
-;-M+#09oFF(}aQ7N<{sngl?hxEAxJ_`Y;1<D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaK\
-VI7@Jb;AFu`f=3EY6r3P9UU2tnasCB&3GNWwF1Sr_tKb&FO@bQ*Hwdm5Tqn3zaE;(f!4-nb1$za%\
-1s4d;7o02DDL6}ThTvquNrFcTP86IVI9_n~Dslb=cM0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO\
-2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3QiQ9AUIxdce6PEg1ZEF2yPeLCb(5_i{K`~je;8l*9\
-)!_Tr0RnaHZf1!R3Ozg581(1m_FR73>t8B{)NHvfw1aBLyc4P7oX~xcf<Q{sngl?hxEAxJ_`Y;1<\
-D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaKVI7@Jb;AFu`f=3EY6r3P9UU2sl;`|Hl65Ju\
-UU2vP=R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04QQ*f5x48h5QlLU_xoG3U!aJ=B|\
-CUO1+cM0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3\
-QiQ9AUIxd_v7OH3+@u!A-G*|o8VT#ErOc_HwtbLTrapzaIN4P!Igq51eXi;3U&)F5S%YKSFlrXmf\
-#G*$%2yvj})9JI6-i{;O@u7`4`+JxI=Ke;5Nanf?EVP32qeJAh=#|o#0x*HG(SzR|qZ_>=o=5Tp&\
-1KaIRpd;4Hxzf|CU&2_7jpQE-Cbc){I|it{hHOK^wacEN3eTLrfWZW7!mxIu8e;5xyzHfPsleW8B\
-Ou8IFx{}{KcEHS$}{;Fl__sZt7{dR8~deovg^}jXNPqqA0X8DZO`o{@hXIJgaUiHCGvsdlfJA2T&\
-?9E@79ildnZ*5@6?rp_pKlb{1|BJFJ^&7s+Pt4C=ob|kZIed0iN7;ed)maBAz4MjFcJJ<-wR`vOb\
-@2s?2NkGw{np=pnfjytC10&KE&J;Cm*@kls#ua;RlX>@s&=9Jb5%{5`tQW5$`bWsR(AE^q|s&}XQ\
-!h%yT*B2cGddMlFxSU&aTP7ExS5*iPD<0tDe>JD;-*P-d<g!*R8JA8_KRJZ`OaSYd3#0zw7tu+M9\
-}hgVxc%SFKmSSFOsfHV2Yj?ObGS`1YqY7A&$CT%k8mwI#c{ymMA|TDm#HvLEkA)7G-9*4X>0Qj6`\
-_*C(1C-taoDtA4%d->SR@Z&Q5rT3r$s6s)leCwuYxqg26ks)OiM-goH_ug6`}Ty_u%>pPRxW_BE7\
-X#J|)`f#gOn}xEgUjF#r?5YjfpKr=u+&O6JQ@(9hRqRp)y;H5UYv@D6)Q_D*ABxLdJ@kg=f;CHF&\
-narjEm-usRMD?@>W@#yt#f`DmtCE|MX#MbXti?nVRqFzwbRZ6Ht*iOc;_H>ko#sYcJ3Us<3+Pfb?\
-z=zMh8+E#djvE@_x#1Z^O)SsbkW%j?=H2fxk~v3yd}eQB}SzyGrl3pwljcFP^u~ms1tzYICmM=$y\
-4xiHj??#p&z8xlJ#3$LIR=<!{R#v}wl>BdUT?CvTfNxK6X?bDcG6TRV=l&y}@<l`rwR>iR@)cJ1i\
-Eb3|oYm9Gv<|C_s$yqJn})<?#UC|foo%h;4_?l#)J*}$3lRd{-XstgC)WvIV*<hRjbd>A!UjBmVa\
->aQx+e069qY3Yc^a3x)?nff%VwKl0k*&wg9YUd`sR`GMYcdIix-0-Q+4Q2c4PXNa4h_@@`fhw*z9\
-vl?c`HN>wA#b2H%`U&#p^MMCjf#BN&;?o9HOAeRN2#V7i>05K%1dX_tf$|9Z_bxbI_OJd$efDRuU\
-V(v-q|{R0_SWESZQ1<6<(*W@J`*4PUm=i=LKtgn|xB$%Fe&POTkH1fX;in_{@Kz&SB?;rdF-Z#M7\
-_Kd~wCDICK4=S`h4#+nIf$b60_X&7Q6PzAUihm+9SZea{@;vh2mpnVL8HxJ2`TEf&WwH|wtNe0r^\
-|Y_pUhui1+JaJN<tRTt@c=bhtEAFA#I`FE=Nvcf8?_dAu%^$(ddwp?9h%hcajsJ}0_{=T(S|7o$=\
-(0b<za{|{pS6V-tt)CmLpPQ_oTdbek=oX~+rp~WzMel*O{`%`C44Xe+_m=v-kGr__U3(XKnWUK*b\
-s6mD#2D=6cWZbzC9s>g$9=n*^=aRCvvak*o2AQHHha499p9dQ{z2dO^wJjI(>DJ-J^r9?PfIt_Qt\
-KD#53-x}4IS%8qy6Y4KT7eVbc@8r>e(^V7m%S^58o)OzN^ds;`s1m|BL6R+bmYUr)}d)dxR>n&c$\
-2Ir9Im}vgfHwbEUd;R|Ldp=Ssb5);ng4EA2fb``8?Tca_C_j3=^U`|!MMEB57iS*xW~>nmfab+JW\
-u2G=_~t)DxsGis8M8{W1yS(D#vU2OV$X7-<x-Y}J>PrGpNF3iQ&Y}J_kVK+~_-uK-c-psoxf!$oc\
-(zlz>clLcZi=VW2V_$6co=$kvx2LXu^?gsCHr~@V|2>^^zi&^+JVi_SU2H4;F1D3^7u!m|i*2Rf#\
-kSJ_V)IKYe$^H<t*|n)E4NxHh5G%XZNA?hY_@*qYCV60t=Lt+dAp@p7f0TQ%;w^`9kzYLR{snTvs\
-OxH%w@5(V2#WXw*=lvw`A8W(@S@LaG#Zm)aaD(b#woJ)g%l$-W*~V!DTN7%kp$A*r1M~xhnthz;I\
-wr(%J2t>TJ+_)dPli8m>`U30-;X+l<_)B%P~uTJlAYn=C6uFI{a;Y)#%E4OL4uh>fg%ROczf;&z-\
--o&UH#0FrP1=kDFbL$7MCa&A?B%~k&yp1V@4`a4=RccuE{5cP|5tE>d&FUb6y-G{I~Z7W!}PUx@i\
-NBbr!Y_qEN+82WsLBV6D2-2wtMq?3-<|6Rh&|{BS#c;ZPBqux-SOSj+S@UXIGxzb3r7-V#zf#aOE\
-IZf@fohq#Cr&Y0sY*xTCa~;9E*d*(ZL*G`>wWX5E#~CZaLT&R)20|w^%~XYGNxi!S+(>eDh9csPu\
-0~{9k=6T`#5H)YEb3eSY5C&$inN@!c`-xof~z_2b*PAZ8jA@`+~rhplPjC<!`OZ-C{SWE_#(tZ?$\
-u)stT$E<6mDsDDJ6H*G!eEZ_WopRG@=tYumI-XJ@tZaaAn(tURb!+Dhlo4#oB<y!8ol@v34Q77)i\
-C*wj-T8~m_;?D_N||JXF~c@ckbeU4~PZ1G=e!gO6nF0$*0YEdn(%Dr<+mGhP<Rk=54BTGZnn?qiq\
-dQ<JZQ~9oT4y!VrAx(IIV#x;oTZMf}?`$xCZB`X&1Kl!AMQWvn+XcZ_dc$0wYo64%t<Hm=*}Z#G)\
-mpWr%JtVxsd}$-nA+o%D&4zqOLo;6y2*Tl`Z-LW6y<pM86&pq4>2#UxN}f>O7I<Ab-%g9vPYP8hM\
-ux&foM1mz2>?&yFSa6C+MTA9+6%7nrg$VCcXZi+!Gs2X}r-n_!)WAv{&07O=UeTO`UpwI8!GMGNy\
-KypA>ute_LTpjUO@e6z9@FL+^()RI<X~P{|8mDDCM`hQ_S`Lvx;zhJLvsjG-L`R{CuArB_-16z9H\
-2yv?m${_}F*pS#}*{BxD>&#%7~(6o*>?QIoAF1ldCFMRh;ePvwz{t9EZX@=>jYRoe~YO{m(@R=UA\
-gG?7dWwu$+bOll=6mKv^qW)B3{<Kb)V4=CW7c`p`*KELC0)Ky2wRJ0JtL5~GT3<Ow{TAo<+u|nuT\
-hY)zE;gsm+UEMsMRc2Pt~P6{ORw6jQl;Z&r8#)MI1?$cSZe<vAe9^ZceB7Eb#P0SyvRDZnrHR(S$\
-^PRv*khCFWqelln<esZXHYQLs(`X!Yu)ZaNWID1dxZY)V|;S%`C9QDxW2G`8;Dn#1E8wyIPmd4do\
--Mt+#!Lx!;7?<gE=>AB?&=ojb(ry-Ih-Oc<tkgt-q^<!_;L_P{#poLOb^M&}B%cAfERo$#hr=1ea\
-HY5$k_u+_ixCpy0I&+8)}dW}wq`7i4`&o^l##pf6N>&g1gd$clc&CnZ~^_s25PR4zA3{oEBM_;{{\
-S!+v+)fE;0^&+hptDmg*9nxW|?2}1+aT^{YpWNFwo02_^B$fZZCa(YI@cLh8w!i3!I6Hq<+4YV(`\
-;4ro)P4Q<A=b}fl*(J@YklY2YGXSlSjE5_Nmd)#{=nCI)3v^GHb-}`3WT56>1wsOfhylM-9C%&JY\
-d2RT-fLB$kP|I3O;<yzi!c?=j|P%<R6NyKR~ay+3Fu2;L!0`)fDVJ$TVum!_{kbbTC0<sqCK&(l5\
-EeSMz6Ywvs46^*8^pbA7+m>IYQavq)OsnPWOEXAI-B@@gxbmAbX2NVaf+9<fFh^Ns#{TCzGw6inL\
-?&{c>-9aZJmROPE$QL`{G`mJ~B59Gvkj{mE1aJzD_i0%i*!Bbnzu*W7imkT!A9d`NZU%W<+P=QI^\
-8BTRxGxU#jRAcPxWY9mgb2G?MovY%Ba|!jtKGJ0J=hane7gi3oY3M2O``k7t?y>^fR$2aH=Pi46-\
-u4%>+Z85s`1%l+J!oWgE2B=5><8`KgfhKMT5W?KSy`4n&bi^&@!Mxm;M0k-PUlu-SG};PLmkFk_1\
-h-h+po&@2)k@wUWbDvO9S#Vb@5l{4tsQvuXj1=9(^Ah?)=pE_tE(G_<N`=@afP~HVpk!voCL)kWY\
-86Ep+D^t%Gmlv2^1aAx_;EN3%|X->e%Hr}kAjp02k=+0`|AHQe2eo2);n-~X&{@0HCaB9$fU4J=a\
-|&?jI@)tlKStuO;SM{mg9Z<D&nCNybjyZ(lyf4umoh{d<-^wY#*eTu5<M(p<O)VZ3{2n&CEk6!oH\
-DOK-k8ahIc(+!IsVHr8i4A%{dKhWZdydk=BeL?6aW;=AV@Tpr?@$H+#5G`ZXm$ekfzfW;I&#s>@g\
-}k{?150t`MP`UkA7OQ+J}osRYR@$z=!oe^tIa|~M{iKINjI8l>(@VEwGvHsp%>Oahn`|i+k#wM;1\
-j8Lr-vH2T=n&+tG>x!)M20IGjw+=wMn7y%uls-eMIw*QpcnZvD);)n5LcKs->ED90G-~QQafAulw\
-3Gb8fG$(T6gnI(Nkso&QxgjwXNR%r1U^NOhAgg7frM^T;5pT3qt7i9<RcG)D9>mB4Czv(=|_HvM6\
-?wexu<X`%GXr|#G6JIOV*^utQgC_b$=5q1Wv>pRE1*z>7WNt+#hFW3O#_sAz<<Lf)0RMl%o^_1%R\
-5>pHf3!z3A-Jx$e+on|gYtcKqt5(skzWA}l7eA7G1ANxH$KS!Xr2|!P?YvBPwAZ*h)y-%^LBSdsU\
-#jC4?;2D-g+j@Am2v0qsy<jp9P8>{dADD%fh9)U*Z<vq;bzB~A-6Rr?6xM~tt*!EQ~$8_Gdpl?qQ\
-I4D0#~~JZ*7WI4Njt;COWA*(Wt<1rq22(Q%^^6JsoB0=_twyGp!TznTqICPZl@n{|+i2Rb8ofwzz\
-qar+L`%I-dM!liFA95lY;?&ptZo)(h?~KZ+Lod=oFH?l{Bi%yO^CQ;e%Nhpet^+MlsK?HS*>Kkpw\
-9LQkX(s-vy0)T@2IW$1mYdE?vE#_P?-%j5My=tbkozGoRT<+<Ec-+*@AMoN7b*;kD3Mw)%Mxgciv\
-t8YEdcW?DC=GDue<O{?Ok%^llzCeE50vAa4W99;}H*>2>@pt?|-PAMbSVsAFdd4$!(vA1a2gk)x>\
-F9gRqrQ90({ztf*VZVwwhnt--!0bJIO8s}H?``NsvUHpsf(=Y>1=)3eb%|(!Mb2mOf}eF-#0ehI4\
-Ew1?qQ36`bM~etasjS+F{P+^y41-v4Va)80RbRi+o|++)wK9E@P|nAM>4sn%WrwcbU{D=q_``UVe\
-9(o1cr|E~7(Vbxn%7*QA@>HqOQpUf((RPWyH;#oUYZe^vBp?!4p~dp^X$Is{LFd&-UlS{ZG&dXia\
-->TA_{s|uTY*(hK1weDe6X5f1GSN0zDwyK-P_jrtIz4dynub#J;Re_{g-AXo1QFk?3PpyIVM%_>*\
-(t%9K)2ruJnYjRmQy<|l`xIYf-&w4?+k$iORx`2Zdne^cCK6ev>5_H6d#9FnTtYkAT|QIEHRIvVu\
-KSa6qu<$R-_GW4@a=3gZMnw!X?CvmU~bl<#Laq??`D09?`YybynayJg8i(5DZ|@%yt-tzySq(}tM\
-21X6Zt-#zdV}4uX~OP-?}iY8@b)Meey4OVc6>VD|@~$zW*49Bl~cFyD{Q$^p9o;M{^&BjjKemUf-\
-`(0X0mdGt_VdM3wt*qJlnx&e|4V>*?ej$6I%3Y(bipuDpqF)%yGMof{uDx9V-?Rz2ZD|HhX7PMx~\
-<jrhuRHx2tr-~0~L|E(GFRbZb}b*)*jrgB?1mrccAKw01UwV4`LnfaBUx_r68MPFI@k<MFdYBW~Y\
->K#=#>YeJ_rM1La4_hs)+Ptsm+|ULuGK<yH=4)ts=4SWVi{|z>%(vf1hxu9)TiSeUt7t&`8gK3E6\
-4QHFIoe-sTx--6v%y;WLCcWuj%Es$cbXt<{YCkI+Ui=V%%)YEyUh`2`_}x&t!9(v4}L}Y{0h5QW%\
-)erRjGT(w;8p}h5AlfU1v6DSFp)XKm|)^gd<h=J5|B9pSs)cY`kg)*y}QJ8~flko_f%4`N?ab^wx\
-LoxWn&cp0-N1?T21-gKmHQ-kQv4>Lzcj?k=vLt6RD26dYc8m)~SSUUBVef89QuU)<rZ+sAchGw<k\
-pwWH3p51S^juJNMBVT75V*|f{-sBvevz6jpe|E=ll4t5dj?6wD;&1t*hHs2WZQKsj&a>Um@>7IHj\
-y|3x85?(M>S7UXp-hOrC``y&ou$IVq(60L_U(>~8wpKabv~g-_+cmU3Q@g+1Z2msXTK|fTrhXZ$t\
-~9P{GKT+QkZJ6^{+Qpgr!@LDT~#@XRvBgeajNNktQ_L6-a>8FVPE_9QbWs7acpd&3*#QTFosyGb*\
-#59jL~0PooLmyqkXH@-fR_FO|D7?6KB>8vM=6eYE5rWvu%c!&v?{V#FOsyb<1VlX)3qbvR%1Pcnm\
-7{`}e~UQ~cVVW&&*82wdsYM`5Lh@7I;wE~xdL@7?NmQZt_jyapc7*T8bT2IydK`775;{r!1g#kJ3\
-g9-rPZUaVF8SN|!p#_PF$;{UVvCD2h7OT#mPKtLn|A_h02qOvGNHd$qn!2uEoOCT&^-}fcMCSfrN\
-Fpi@ESt7fD8WAN5Vno1UP4Kw{MTme9l}{%OY96A-ZSr?lci-E6Z{IsJ!1vDizw>gAGWYg!yQ{0Jt\
-E#K28F=!2t+#Qjn(u3~NkcjG{WAxYkvxt@;@i4M#h4{WF;!>?#b+hEMF49`webI8{UzH(K%kI;8`\
-QP>`VfcH<khoe3t3Eu<^PN@cc2j5zZ<@VcL!Rd!Q0C2KoB=MKqQky@^9n<x7C7WpQ;~Vxv0cO%qG\
-JL0g+F87OMpG{-?rfo<&M@y3gv$tQX+kQ~Fb&+MKBV^~JXf50Y(zPzU)ZlSA{j_JJtTLwSqv`>3*\
-I1PF8I(Qry0hlX*xxc(6SAkO2@#;lxg(Uxx!cniUAqc9N!zYPMw=OZX#CvE<uyQ{y01_Li`QLv>-\
-0gtz=n`R#<6?}-;eSO~nJi<tGlklj<Iu&W&J)*;-&Rc|OZTln`9)0sx5Ikz`3JZ^Bd@O)@<&IGB=\
-*nv{JZib$9FNB4>F_B1uo)gbxR=8U-%bIK=53VW(J$|EE%xq|;L$fP2>@^UekgdfVUx=Lj>+)IpQ\
-lvVf-3lK$u+{G9D+y5fJglRj}oPLlq}-WiM1-yBmfi49M9p=pBsf~4gMF0M~Q$({m5dCr!`*M$?#\
-}8S>m~50mk#-+`fkc=eReBWRL43wdmue2+!8?K=}T>P+*z3Q2~|ns0@~y-%~2|Llt}<z6G$%xp}Z\
-mTcZN*KCcdzZ;7lX`lDd5On4&%SSIi0V0qUL0hWt1wXj^bHxyV_+@OG}!4VlO`|edLM4<}4S#R>N\
-lm|MH@Q7J3(!-jV2W-a4I&nl7y@B=EkJ!nuI|*A@id<)qI^g>o`Z)>3`25H98GeHJ47-omJmRs-A\
-N9=R<72cgMIJJ;SFL1Z9_)hF6u2hwp3=pmWbVYyLeg0h2emThAO8k$rbP6*4EiOnlX3_Yr+}>1&O\
-(AfsJkMb6AZs6d|ekF^0!q0RVx=N_&0%)R~D2(mvjsgVcby;cVZMi93)*0i-7rYr)b)9$@ORgt^#\
-^8shu!eoMOq$ukL`E_tDIJ@M~n|v$m0$yOWCJF=EikD|4@eN1H@qZ4|&Dc{)OwJ2S6qPxMGYODV4\
-XC9zw<37#v$B&5dSN+{GJ1)h?f`9N;Nnp%39EqXIH8jp3PrxjV8ccS4HlJF5{F~jfA(GdN1NBWc^\
-s{;^L2+awAdIcCopiWxCaEB7hMk$79$pZ2q_^4Iiq481Eq8<<Ff4{<yI1w++K^r~gac*S6Fg^~kI\
-*~I%wOUW1S}Bd0d8Q(o;2jdgv{sNTjyTejIDQbXFo!n8JMcKnH=zs=6t9=n;p!bFu31NZ&0GcX7-\
-OYquV26Kw)4=KN!Bmcoq(8lS^>X=-CTfZ_)d6#4_HMv*0vG~_%$A0k*uQHURg-mzAL|$(<N)!Imc\
-)%wN%9~>fPIo7j?^e@NH74hEUAw6*Y@G531#>)$qFdES2!0N+@nZMRifN2<O76jsHs$nj}@ipM<V\
->^!UA!$hXV_$vg<4stdzI+lVdb(B%#eYoX(08R62*N8`11iko)fL3WUN_&wswgS|1>yM^nB_ZO@t\
-3Hs`Wn49Y>aB!&%fKqEGLhXE7yNE`O`D#aDo+)}5IA4``Z=_#I<~=+0Q_LkE4={%Zz^WRZSp}qOd\
-!90ik6xmFoTPpMt^eXH#ISG{oHUa1V3ZJd1+cyxNlu~M<WvN_%Zv9C)|;HJvDOxn5J|AsVjvbMA5\
-VCR8sQR%A1PhP3=nC+!hB0Q12gz;EZ9r?uHbO@jiN;Ca6gH<?qu`dOZ*U#GEkYy0Lpy6sH_gO@(W\
-14s8%lVlDQRl+R<cnFEWpegfQ4r>e9n#D0w^VOpmZIzDQ*-tVUNd7+}itpGWGz0iC;W`gTqNh~ue\
-(<4Z(n!HgbZI!7dwM?^#cofK+Cp(r_>FuvdoPB6c2HYJ$ZYb6A;Vvn9+64nxylIG=UrjrZJ-~=U`\
-15p~Xsk4^w7t9)+3gvWj0h=kPq9>kK+suiF&3j95D*F08LPfQ;RFttsN<|4<2^IYyQqdN=5=$%Vs\
-c7A9LPa$fhfGD4*T|^o?IkJ|9a|(&QOn(CRMg0gJumG!L=5g+MHGV}`T;)hQWbU7d)$bm$^#OT+V\
-`?RQlVoUP!IUa6>|IRUt55<TEnJ^Mgn8p6r~$uF&X2pQOrR<-)BQ(^ylgZSm$MZ5N$}}n^yGN54e\
-ZF1uUV6m&aW&>Q0JK1M5Pf_({ZajKc#0TPZIFEUT*Wi9XMw(dX#+#NaJqh-^=6fZg3ncK3%^*K?i\
-)(a1+Xuk5o?==1*llvR*ef><6b@$NA`=C}A=F2gW@^(pjNKFd}<E2_L%`E*<P^r-SU?5tf(!W!co\
-o-w6@L$;R7;k`c|oG2BD6;X&yEeBve?O@V`TGW>m#i)WO%zG)~03{y~8Z6fI7OOTX=9=`yO_q};r\
-QG|r*a|#L(oazU`ng?G{}x>TNy$)i)cX8)&moTCzfCj#<6E@>`w}?`;8aEyfJEt&FH~pY_qOGz>o\
-aW8pIHvNODP=|Yg9vR1l0!9MuP6ObSZNpsDwx9ucw)GZLl$uudZ8$0Esn^6QQWcE2C5une_F1lw3\
-s~xlx-rz%Ukya=ngk5zd-7-;}cg2gRJ6aJE6qXa)gHpWsvqaJnxF$hHrw_T8J*el=g<v>(4|!fA<\
-k0*<NB$Il3?{udd~t|9jHj9E`Qrq*SH5;=AK`i)n^;O15~WN@h&ItIt`pS-LxIIot$b&XOP+>A^q\
-gPXrT3<j67R?6VkWXc&_er3wwvO?f+)|~=}yZVNl!wn6G!*y|a<FTakk&1=74Pu0z-Laysa(1_Nl\
-b+qNCb!Ai-RMnnb{D@%!|qr=|B|!2yEkdr9jm`y&hD;kl(4%q8)f-P3<Y40^|7x#s$qS%r}M0DS-\
-QabSR;HC$FsiS=@QoGUSiJr?%JrbzRk}FtS=m6TGL954>FOvaiw6Uw8U)AlqQjM1>1;R*d?syj@J\
-n<d%+nFqkQZcfl)FUHz!hLl>4Y@vZ+&GZ`*RhV3fy~@Ql)zD)clkCmcq3*IGq9<?wB|kz!34V;&b\
->aCs$VIh$|@Pv$-l<%JprE0uVVB1gI}LZdjrk`{7GMyqF;E<t9yoSHN(shZ^=1{|^+rHn6~odvuu\
-huVy=ZkUJNw-}FdxU2YvVVh0*(O5@%TA?NNR!91jLTkxvtPuOHItKj5Y94_dEP@t&8x1(YXtVv|R\
-q9_cE0`LCYrR5i-!n^C%I9A-Lkhb5B{OLoA=0$(3Tlc$`WS?OBM4A#?QmChxUMRJ3VkXNVCYc8vK\
-sPhl^IwZZ9*CyyqlD0tif5vxuWQv^5!cD=*q&_i<RH5i@tY1p&JPd;rfs>Axl8c1A63alocLwu3s\
-i1r++(HxluDhLC*Fw07N<Ns`2j5QAQ~0t183KSqAty@Wt!F&t`PoZ%hvbKO<@FwCMtV{<JLw{OmS\
-ehM&8ir}$~lbtC>ZH%g18u9INJQStQG2m?G#UKt*q?)Mp3!h_@MKU<CQb<AfneASsL(VA?L2A#u>\
-l1p(h2a=%)xY*iW6zw@lqL~q@daVwtSHWCQVmXJTzh%%kOOR37+u{teTCg{rWpez#VbhOf=P7)HT\
-^Tfa0$s`SmkAcknaaB7Z9_{kM9Mh%viXjNtsA)|He$NZNiVkIkb%q`GQk`@E#moSx<Z?Ox;XHzbl\
-?Z4$Oc}JE)F~<=)hrZun#lwjQaXdVt-PFm6yS(J<aBe$6xd)hgi8fQr}{P)z7@Zu$o7uxd@dI3OT\
-X(lFbQ%i_!CPJz8y{849+LNMxLPNsm@u1+Ba)SV<lT0#=r649jx_d|vLY>lubti&eDR`HO;9UaO`\
--@-yP<<ZLFZ6FZr8zlE#a@EI|BasFoW)xm?`!q6&PgI3uxwDKxw6>R=X#DV|3i41()B-y}cED;BO\
-Xj8C(6SUgGe5)J(rA4bUD@ChcCn{)#&&{?Vw8|0C3J2Fq(W;S$p;eX<e=PsT;8ZuH{Y9CGxQ`Y?L\
-0fy?!sb8=s*SiCGxS2>Dhsqa5&>efF6<|ZsdZ`xQHxp97Q&>HH<D#3oWP?it9^EnxQGomnlDSSf(\
-)`*l{^UE&S*(SO20OFkvO*f8^RIJ7rNE_FGj2N(>FoRb^mu(?Zt(%RU2pxdDZ$X6d|*f9Gm*?94~\
-`oy@lecrLMm@tG08T>}z||#IaRcAI_>3xWrX6k|;nTd}AF+nNvQ~Rz5STyeThH>^{s(6v6u%X3|&\
-waRX`E=1Tk9<t$52``hYlx+JX(=iqQQaCq7`9T{Qq#e>7u?Z-wyj^euLmBStRSqGAsVc259PH_-7\
-{SdFb4`F$^Jm04NZB|GXv4tV}09ww{4*NQwPc%5}Ds*J0Xfl%FS|l}ttXJYBRZ7yF{_aFDEEH=gk\
-)1fm{u+9+kRC~vhb-CG+#RDNBQ<IvWK2tpGMKspOT;8DzV+c**v?YwuSjHC{r4>?y7aNSykIOvgW\
-JMmb=)R30|=B9GeoMriDc#2;MJyLyRuYvSQM+#!hEkRP|}I{IP>JxiPULBW6NH%RIqVMK;g1+umZ\
-Ls1zj1bUrIpdtOMb}m@nE((L$j&0%tN@9lno7x;|*H)ySJ_q4i2<g1c~JJ02?xsn%io3EF}+z-an\
-6M$x~c8>9c$d87Awk&v_6n_`$>YfrXG{w$pDYNUBNwr`u2Z(n6zUT-ta=jBO^qYKIi#Y$u^oa)O4\
-{*Vi3)%=bz7PTxEyGU0VLIO*UZBXjOS%_z&(U&I<Hy_!=+2-ZlH=38PTW?<8X1;m({H5mQRi6zRa\
-zD>EhTLa^2;|)BLx$Y+vF0O-TV!6IJ10na5S&X40$H0U$oN9Xxp(IoLvHmz0=eGnLWbN!v&=`fHw\
-aF&%rr0mZG(CFn&sx@#}}HHFMTm&$UQyR7;=M?3FPj0DP+h!5(IM9))|xo{}fIlme5IrRy%!tIJK\
-Rr;nZF`$GA4*&x3>T-)ZLM{U)2iMMyc{ZJqXX$*5+pk+O3r@LbV*f`LfUemzUADLAdXI#DVP{Jcg\
-k4lG+JW;^BfN3<u8DpVzcEK_+%3#9UKnxj;c>426ob)Awh6{a_Ioit18Q!9uH#?RqMTFA%qkXhQo\
-TcFmgVv<=dDN*#E1-PWa5r_<cG^Irxn4?DkJd3qyL?2JnABIceWh4X{$e`N&Vu3l176#c*N(ZU=h\
-A%Bse`g2TA(sb{J&IPEm;2_b-@1E&`a5g9dAsSU=H<o1%*(fM-|8}7{oQJ^dAk_5d3nx|AnnJh-#\
-R}{{k=Fvf6GS<x$Y#z=j(&DT2}=e?h!LMB_!$$gK<<`D`gy0W=R>x-j#C3(R04UR{~UJ&1a9>f48\
-!<xh0F)O&5%w$@#e5r|tgddD<+@q4Ymtq_+PvW99w7aDDyv*Y<yhTi$<@>+1jY7qtC9K0@CAXLAj\
-2KoK{@O5?$aAhi8z!c^0{Y3@uj&>ck<CfAPiUwdP`{A>D}*k8wFT;C46spIN9F4S@TvCwo}&nB63\
-hqFN>u*-8omNYK*Hyw%XxzHfADl`b)H_h~G_ou0xuK$W4^0(Pe=1x?sGYt;oY-aeXE}#$eE{gLrx\
-46|WZeJWk{~p1J483whu@8`rD)&=6dZV|Q^ad8;m<eiM)L(I>*vJ$ab^Jkp9}>@t2aT8W;=`#jUM\
-!0s@Ib^I>#wRoe=}3H0#%G+2c_P0i&9BKSIW4ir;-rm)<@91=(eTZl3dPHvK<Mv@;J!(ysN5Y0~#\
-|<KFCjI=_OYtWtmV+B3<x~Hna$-kBL}-5uD)DD0Y2R$0z_AEO26!|9*xXQ<+gdiH~=fJKbnsC$Ix\
-xeK%Cg<!4NSlOi9hacHQL+WDd9u%o*Uq5?*boGn{_m-CVg1>7`dkF4Xv=?uC_WxVlm+Du~#CkckX\
-PBG;H_ofJR5T;aaaq*|e>`d<Ra5c=}0`@7k%0%<jB)Mq5VTL5bzm~tbYs%#*16eA0Il+Q`=bG<5^\
-UQ_2o`ienE;|nWSrh*{RMvqqE<Ijv9K|5-EK~2$i}d|E-4w3h_c!5Qu6UJu-RjgcB7p)lJT>o)9p\
-ujuz3Z@%q7p@Dq!1t6T2a&D3Jz;Q*nI48x}2o{oOXSDY^FhfJEjHYV`usce5|0q2_NI|-;)@_8Ee\
-AO^?r%Afq5IJUc(6}j87csE<+oXNgHIz#}*|YoAkCm1&9eQawz!gc<q+fcd*{3Vunq6aA-!FW%jI\
-<4~A%mvuY^Mn`<3YOkr+|;=p7ZC^41M%;6@|MwDK%SemZCjVGM(pYEj{e@0sH@h2wVtnqgpcw^(A\
-y+}L$dd~zOf7XDTHU3J|ZfyLoj?|9-+M?j&FYJG_#y@uUjqHPEOJw`t;RJObJiWwdADrA%z7MXNX\
-lSBJ(cb4`)AGyLlC`o+<Y20y;xIiY{Ur9^o6Z6u@DLK~BXA@3(+U08yFROPB87Rl6Gs9NkWo)Ie_\
-hJv<LC?83w?xtiz&eIa}<51?Gsu382YR*`1iUqa~}*i2Oi-ztdw5rJPr*YS#?+A(2mE+P?DkVcy}\
-zTv|)f26whK~1KJbgt>|0ICu>b15}Zv8(NI7h1mdfEXg~AhJawdJ#;XvY)H^uD2W0%GA^ys60pe?\
-hD-b`oK%K{~?jb<@+3s3UWOtQ8d~5OzK|FoF_A`&AsUwXXt3rHWm*5Z|Gv+@H@h_4Dh#yT-AYNst\
-I**O>LV)<(d0J5PA0dNy;^Z5GxHU!lnO^hNk!~BLLVVeR;1K_=_kSAVBhmzj_eoPAzIK2*kGqD10\
-P)`jYe8{oo($s850XMW_(4nL67itr*TvF<mL~@34_XF|*2w1_4R6LHA=9+4`v)o(XS^HHBG?`u9!\
-0-Sa&O=`dmp<(@UKKV()6@a3l0BL1OGSnDKGciSlvbAx!3~Du(yqp+G6!#p{2_H-?5KeElwV#fq?\
-lfsSs0~%U#GElPo}j76Byg87V*_mqG&8=-<6KNI1u8#DQiV!9(>k5+{zo*&?nEaT_a3VT+B^GJsz\
-+blNG81@zDECwlvh#g?3OZ<OE0Y+U`?lQ#}`8iqwX28;NS*M|+;M;l^8gK@^#(0-^HHuUPjW5daA\
-#@MiWMA+DHwYwY}x{tUqY*;tS5F6@_HO7W!DQ4L4;1fD*xc?4<4Ij-9h7EbsL~JM<uf>M%JIk@*i\
-QzW}i%-WH!s11{F)Z%rXa<XtVLDjUu1#Rkb6hZ3Or9vhqTO7WxlM(|peM*1Ei9T2yFSX;*V~XX79\
-|=}#*@9wDC3n;JY`f)HKvTGhlWiVj!|;Th#Pui*pQoOhz-tO#@Nuhrx`Y^Pt;*UR4sxHrB4OJhQ{\
-qhY^Xj;iwzqR<k(Oz#q2iD+Jhyx{i?pTyo;-#go;vDmfi-Z+Iavi?w}@467o$zxo*7t+om=n{&2B\
-mkkrPQVq$Y+(iJtpw`1~5bxzVGc1@NFpjK~o1ghBLK{)frv9_Pj6~wPE#xj3-pBg2zu)8XVed`1b\
-*zjy!@PrKuI;8)@(^!%m{%l~uO#Ruwcs|BRZw|<Dcy4dm)M`=E@5H3gKo__K$wEEva{x3X{0MSV&\
-FHP%PL|8x2RTl;p*IIo1d-RjwBdLH2}FQ<;{Te;mIPsaHD)I%a##<M@4&21cZ2&(iY+Xd4ByvkXQ\
-7J_v(*<w$vB!m$xD+hweLVlJl$R##ahl4Th<vw%&~+bS$4Au9h6Ij>9uctY>q~VCm#B<0<cXovMW\
-<bxEsACm;NlKa(y0W`ax4VOh%BX4>1@s5Rhg3U^BhO<N*H5&PE4<9G;OU^_+=5)8a%@uH1a6l$CO\
-I$-mme3quP!_D}7_f}WTScwUO!kUk<g*lEybkJCUV5{)daiKPad|Djiio+FIB(-SCjrpXe%n@a92\
-$KTRM=)O0=(4WnKs<r-}L$BjJS~xqA9#FqvS5IbkcMQTcgK*thZ9~AQAe>8$sj#I;*8=St#g^1ZX\
-?#x^TZ^@-@LtC0sHL5dknwTW36ot&oI`Xgxc#+`B=u&O8K^I-bWaR-wDbB)N4s)Hn4_&R)Nr(wdf\
-&9sHfkmv?WxXTj`o+1hNG>YeA7nzwS2U%b_sK|?~XJa?VT-jqYch2>?1{P@$N)pZsF={!q;rvAcw\
-awli@~=37MlM6?3p^*o!2w6UOvwpCH~xn9~bj+SbK*7U|wtIFE@}&NEcEa_S;3_dd6A5@(E=C%FJ\
-8-ykzMJ=^vA;B<c*37kIZ9WI=DBnO4l_#XcmI3>0>gHz4E*9WH^2@*KHk{B+WcDD}-r;gqKGjPft\
-Y6ho$9j*^f-;R~QDXmwyaB>HSQ%tx26*#%nykfs8=i}g5M(;asCe!43J%u`th{=vGKO%A37cx_7Q\
-hkFMx#vk>xM<F4WtP+`R6wE;dZBqQep5fxIElwc%WE=!>o{}Yzk(KGIlC;BOjQWmW)_po#^vRT{#\
-AdHqCtTbVD6*5>U8`=ykfreA;goSQ5-COF8F5-Cih6XNrD1zFZ_6ns6+X_LywU=iK!W5WDlm#!U!\
-s$5hS=u<6R~3u5anN!my{v&2j!7<UWIZpQjnTA@<KlnFd@)?_P#%=YOJo%6F{4at8vOztWozs*fZ\
-=%gSwXS%$eV5OlKQUH0WNeU;*UTvPtuYpR%f=Ef2w3=U3+(&|oFj<c#JB4&>BYZPJ}L-35=YcI_3\
-rVc>mMI`ZpqHy9H9+|p$q5}g|7Vy7^6t}rW&6#^%HrMw3?(||(c%6{N75&r%#02yzVGH;AwIrrQc\
-8qbr4Tzv7#z0jyuZgV<RLc|d0eAMdWvlb^W2}26X~q7QXf+;BQdgtx5M?zM4@YJG?yw|tjXeK|=G\
-CH`slQn5ZpMz{q(<`|5)RU#$#rp%qK4PQLAJKIVGhz{q$yvpJYvol7CXY`3!il2_(Exd$QR<0C46\
-C0GT{pk3|09;{s4h5<n$2u!t0L;e4%@HfiLvvq~{CcdTRNCvx&+V>U5Iwg~Nz$d~fzqG4btz3MT%\
-Rax?itOyltQLaT(3`NBU>sC?nEhXuaSw4uTm^83p8!rSqNd|^!|DPOpl91>s1iwnXR&OEB)3)c`T\
-`|9>qSL1<XWi`el7UBD%Ybbo-9)~Gk2s{;xFI;J^@&&>aE_XN0k7~dZ>J7Obp72DU8|Dc;I+*f=D\
--WCVgauu~<_QCvb39>4ACV_KmniZCj0(O1{RmI^`2m$D?CvY@gyt;-p0K)sz!Of_6?np#W_q4*n?\
-uVJMl@1+!Yj?BJmFLH8Q)7iRV>_?q+sE<18*izsMs((o=~q_$ULE>v&s{`zF*)8o9<V5!js))JmH\
-=OhCJbFA1O~b*DEBRaH@F_o^Ygrjwckx;rr4O)YXXYr{4dSjPL*I912f({T}mprF(+$gt8PZPk8m\
-->){ExPhAgBXw&Y7dBT8tp=uhB4l?B)Z#`hnJ$iNyn|s_fkmDZJTZr7_iM}HD=!m&TokYStX4F-=\
-hqIT!J;v4*xW|A81?~~^h`>EwO4f6aW3gK9@xa3>_ZXKf<sKF!?)nCISMhaNZv|hsC*4f$as0vXx\
-X1ThLgpTWo2uNSNkf5q<Tg>bM~n6{?(tciA@``&O3FQMZ4(mrIQ?W0?veSRj(gNZqxF5_P*>w*FJ\
-(1qBSzv|@`O3}!1_@GZ3JOfu+Rd*ShDaQ6T%Y=!p*yfeLO<g!@mZ}j$Oxe*EwK^aO&!<#htot?GV\
-zb>tD^Jr>@PrOHW<X?vbCmMh*($)YZ~df9l$<zHoN>bvxOqYyN$bQ`ZQw<+gURQ&-P@A)UI;?tN2\
-EU4L$?KXo+^#rnD{^JBF8l$G;ojt;Rtq4ibCXse5j)%h@J^1zWVlKq}~WFG$z`)K%<!D7d-n;H!h\
-1Iki{;drt*fgd+$PE$~vg(Yl#IC>@a9j(TgyX!%f6aUjpX!=t#mRAqb?J>ui%ALsCS{cqk<wLk~Y\
-kTp`n(WPIO~{+s)!CZ^=ncdj=>iI#Y@-V(kj7f|Xd}d0wQEC$LQ-ttlT?E!M@;6-wMp2bKSID(cK\
->iL)RD**)xnip^xT=)S{5~Jm<z>F7Fd~JX2sradKNIdmrl+I(YxnL!%#Wy%C<Tdsaw3a>I#duxvq\
-BcbjRR^(Q_$5;$ug(6x?|#)=|8v{{ZWTV9S4~uOvQ}m*~>HaR`x1qgUb7Z4OQDwh-tN#HQR@3iAV\
-Em>$DiCoa-)^t=m(mIrQW@ER83%mWara}n<6xm$N<)r0<f)!S;J()V{MTl3TLXlwqyr9sqcXt2Da\
-l>p0_CJHRmTIyigF#bOQ%h9)qu*_(zh2_i|Qdqk0S7G_#ogu(--JJ?7oAf}iT-V};U^&Sqz;bdu1\
-(r3s>0tT1<39n*n3^IiiyqLz^7{v*u<UT33d>n_LV#t@ItnbmL$meuY_5l;6l(9*6`<BKUV)nXJ{\
-{D2?f(-{`_?8xZEFuL)V#4$s8xwoq1HYo1gOQtC{TM7A%ricne474f#JXVn7KG2OG9yAGl79KO|w\
-3KEh&>)obhZu;Bjw9K_NWToT-bTbw+^}dOY6sv+vOk^cMQ#`0Am$cQC!L07DLg=OUx8`k>jRggJ+\
-M?g@PkGujDrnAudALo=H&htV<09Oga9&tY(F$sA5MzkxZNXlZ_V8j}YavJaO+{1SMlfZm+kJp9Gq\
-epe6)fqr$!z5G{OabNwmnVAGq>p@cs4_pXG^8+b{G)mLZdq%V1wjPp~0=GN#Z3UcJfM%%xKklj^;\
-gxt4-$x7aL&Ax;u_w2)h%uKs;8m7NV&sQ2!&jy^wH_PdnfBW7sxKcQlCCzBHog%Xx3McmtM$YMyv\
-(1GrL#EcY)BeEOd~7P@3l>YG@{3n9Ln_OzfhS2=Wm(XDM*_T-l&!<Vd3J5_Dl4Sc8mx~evUYSL@(\
-B)a3>OFf~%OSl@B!~96wGQ#}>?>@Z%FYq1E&nW;b>Er}u3<g;a;m%x2QN7O`<TJc+SN_GU0|u0^|\
--Z{_2v>153l3P(RjtjmJl`uL-=q|G8d)iJTMlKT>4iCJ$)H)+-;1dl9Tq;{-ELzNH|qJ#GG5;wgh\
-#AZ+os=R*=b>J5(<1+e+e50Aeol>MmH3F!Hx6zW_&<2{QM%{O@Zgbd%DGA@M0O(<yA22pl9@Vm?j\
-7JqW{*UpfS8Ty})R9J7V7*->R35dg(M{n|dd@R7CVb9wwhP}T1RnB!D}jfsdqm(N>#G~^ko%vyP9\
-E~r<2S-X{%X(jkXvm=Jf!bkSYB?X@{m4l6dtnn2|W+_rG8KzQdlb(4|yVz@Q{Zd{lCIPcGlOD#kx\
-v2lZX8MaHu@w^H>=V+0gJm#zXGAEf^2ESWyeCjrWDhL$*~k<{`$C%z+kRNiz4=37?<ryWhM`2pnc\
-WbAiJY-7avL)>RESOx$DF$zh(Vej^-a!V^4)dE*u%4)bp$Mf$EZRyj;*3x&h9Xrt#aE9wR1FjH;8\
-ILwe*gu`T1G2$>ZG89Ma#s2@sZ8ll81O)oijdL44<;=Rr^rX4sZK3j|`8F9}s`$`<j4ut03&xjT(\
-}6Ye@lg5FB<s!Bzm_!!PyebAt}Yb<Pdd^>;7NPR13XW9CDMQ={ay7sdD3?cZiFX2Sdr&RcT_gwNh\
-wI<^CdS_dD4)_6rS{Q3q4Qzr*2T5boQ2DJSnCj;Yr00gus(p{r|?3CI$i;;wfl$gFGo#2OBKk+!5\
-^D%kWI}skZtv(OHj5&qRZzDu;;_!bE;Qi|3-xq1mm5JYMx}b3dn*_Yo}lsD&{;>1n^+Bf<GFq$Ch\
-Lot8EZD(9G;YF92pOFqHdv2(OVGJluFVE%XOqF}@G*0B8<kcF6rk!T)Lg%)a4g-Yh|ZWH+&e!MHh\
-4CmKsN$sD)Aw=;V)N_n(RJnf#s4cXNcU$_Zx#><kzj-kKxR?lYudr6NgBXZ)EAf4;P)~6uw+ar2`\
-Vk@=qHZgf!Qt()KzWe3qsG=y$F;p>@Nvb(h~u(Vk&df%dC+mKv4lFVc2U8{wY-HmuDOp%$5o?hd9\
-ZN>$k2n{qGHAj)?u63KFgN8xUTpjafmh7(UTLSwuGKG8W?a4aW%fC*{Q&VI%cJ|zXCya>Od31gIh\
-ith8~E|t7@2i*I_!UkNycZs)9$!s5({;Z&a~0!mD3u3)km}iRt)!tB!D@nhLa%uR68Zi@UiHr#%U\
-WS{Hm>qUniNN*MC8^aSb7Mj)z}Mz6(QNRhsEe_>S9CWOZRL^VwL=;x89d{mXr>xg`aoeAnL`9{*T\
-;Kx@){rIr|>z_al;MmqZMtjTec%;+Cd!`gJ=et(*AQ3z2_`-)c64UoyJ&?`gT|eOy!v=_5`tQNR!\
-RL#v3;5kD2$ADmuo53NB*HK+);@GQKtGwDCkB<h`d2r~9i>SYb<Zs<4-(NLZmppB6Ba0Oq|8MyJ*\
-~(Ro$&{Ayu<mn?q?Z~aIXnPT&}6Ul@z8|#`){{6am;dfr$FN3|qj-u=-X>1yl;<B-}fJ$qF?Oll~\
-&8=2z@*Z!iX4)RvYr=fhGAk`lxc6+gLO@1?)-#EDm80Z|BSSz#WNY0!Fo6+!AUrQsL;9pGuWw7xk\
-FTkew3umP1;L|l%i(rdpPQ0ZOO&EsRrcy4(;w0HS8mG(ZZrKP<qcZ#&PKUPC~ZSUi0FXfkjj`kWn\
-qR?K?hxN3#qeghNceZMXw0FoN(%!#+34}v?-_|gsz1Qyezf5}#Y}ZM98q_>gHHa)@N_)4J3$&M78\
-Zf23OSNv+{&~5kxPK11rc&mi;s}m37gsgcBVwzExPuOOxco+U(0ae9RGdRC5Goa)t{_tJZ+ELy3{\
-kJndw43Ye3yO)9aUeU;^hzMsrb^Z;Zbp|${|v5+kXNA6}w}@+Cdli14dLl<IlkVVJfb0%gv$UTN)\
-VU>XOk^crtQ_2th{P5=2I}{2aJRH2%F$+<j-4Qg!T5aV5x)R4L>;y(V3|Vd;1L&noQ>Dbdny!}~?\
-rZBs|3U7VuC_kJCocKr|NY4^2y3hjPeS5Le3tA<Cr$rVDR-42z-9r!~_ShO2kVo1C1{{DZNb_e_u\
-xGA(d?9YJYepjvCBCnkMMbo7s_fJ-5F*!oQ@f1+hELyY0_mzWc)>1mWw^XFVpROo$2s`Y(6~v8EV\
-*V%W1jd|Lg&om=S*TMLfx9$i+yztCArd<2ODF-B5*y@nhT#2hOX%0-%5AH^7s<`5{qK~USD&vG^l\
-qdNehly-A3J{xu)C2~8QqO!9yLYogNPOHgJ8ZC7|@5oGyF5(h;J2kY;J-UaPnLrU}F49yG3Rb&k8\
-w<E?ud;;zxpyDk)03%bB$3dnFKNixnXsOPXfp9CUwpR;)qa8v>m6==duTR*$XjlhA>1#uBfDOy>L\
-cT?nYr=z#6Zuh2IMKF)@I^{N?Sj4s!WF)xYyMW%$F+gQE5@3z~C5%I1&lptXnk`*Pl_^BA?N%~o1\
-_)q!U*w&q%R%%s3AX01VvWlg9<NUQW=I(^MgNN0cLi@@kEwtw|hdcq=8UHqe_HX}OAGCu&tJl{z7\
-g`tp3ETj*uv33)d$F?vgI!#)7IvRjmccHn0yt0zt`H{YQ9d(Bw~NqGb6zv@SK+$w`W)D-@_nOfD|\
-lTHT^=r8XI{CvEA>k4@*7&IR^m#X{#m<H{r-{hl!HjV2z{mS`Wu(7wCGogN>0`g)@AnvvMz2QP*|\
-7TN@1_dKWA_5x_t6oa0(KjF!}p{5fq|Rg0HVuZYy>)LJ|f<rqYZd3+syVa)OV$R-k8fnyFC;P%jK\
-3B4u9^L?qWGMMPTZm1dY%?r8K$?`RZ1;vv2Maw`kZhi`&CghbH2RNEk2PU3<TD|6TI{ZD|GYrpy*\
-!7}y{dQ=mEe5|-`DfgHBDHm~tWo=;#PpJ6yv>B=VUfJw`ucU&h-^ZXc;YlM^%L2j0D#5QvasAQWr\
-5*HJPxu4j>Ny~f9=8x-<1N5nE}wka*yx|VzeLyQ7$x!b(p^Tv<sevfj@b#$uz1`HV5jtQuj>97;I\
-dcb`=<RBU?G)Wj)aPpn?e?1)N-d3lRol&0bp81VlDw8fD)>mq17;dKzohv%pU=XmzWeXJIe`MTy?\
-7!GW0%;FyV6k-&(kQbV>)8%2!0V4EQq$T*h7!;qv|0A;IOtuNAoTtB&(Om4yHo;l9^2Yj|||j{)%\
-n)tI(lA?xr+b#kK^$)t-WZ*{nON0IeVvfeVJt);ywBiQO(_+Gm@SH9P+&V<Y2>bzeTWOWL@6<5b`\
-KBU#T@4T`)d#j<<x$pOISLf%S!edpt&R^&1R4OB@(-RL_x;lJPV(vQB{Em04KV#LO^|VV_KTJBSR\
-lQuZl1;zUt>k8(xRO8r7Gxy@#o|gXJR8zV4mhi<<dv#uB?tT}TS-%E4UXUXoVuG?9q!&yFiu#4PB\
-!Y_4358URtq~+)0&kWuKrP^Vpkgz2u3Ou3*{Ac$*s3slWwXW>W^^_#1>;G@#FS#E3um=6mvK8bdL\
-z;54ZeldctLXU4}=I8ejV%aKpi>2DeU!+Dz+_CD7SZg@G_!M!)(owAq+`a(fjSqc&}_;>UoQ%fBE\
-T>z0G%*RzxRTm+|q<N9~M7crsGQ!RoZ$5obZI)YsaBX7Wq*V-w3S|Mm&LCl}eiB{gIGoqEZ)sF!)\
-7l$g}naP@iPwMS(5{;zO05!KCT<z>~?r|jv7o8Q*i_WN3?EXIj<@7m@>3<|SR`Pg<C-TXUpi!11-\
-<}<bJMh@^fj|5!P!7M{PDJ2o+1*^F-CTb-Tz`Vm8T7uW$ntVleg9ed6;JkJ=q0i$>39q3IEU}Jso\
-L=t)Nzia<6RZijz_5-XQN)?JuOb2uvj{M$ai`1BhqDpt2Dv&N4)E|cvrd5;ZUx_nrer+(BXqyaEA\
-x@4xd*#EKb1b3BQkb{Va5NE7#$nuSkdPq&*<<p&z-f#EQxqcv|$&C)>iqXx}LL1bs*4`_RK8)I-U\
-$`uF3|d;b{C%RcyJN6pLj_+=gT5`Q@|m+nP}t#rL3v+0{$_9or87|tt|XYY8pze9ZnjIn*GU=Uzb\
-tSS!LE0WV5p8dc4Q-Gu$At@I-4Ku-B?InF0+#UOyh`Xo%3GldExj>G)pA`hf-S`M~0WC#Z-2F6Pj\
-=Qr9g5vHkR<+~T&S-IWb-osNA1DZdyIZ*q`=8O`?&y3i?tY#h1b2IL9Y&H4b3tRt1N6;x6Wk>zoJ\
-%i_pi2PT=HgQvK6qNpJxb838*$yhEyk<p1T7k$VntbtiL6ACkL0sgOS4%iMOJd((-%s4u2P<>mKS\
-~@C#(9W<z!_$Eg`GFzLb#F_g@;4)ucc`LskRX8%kE)lxIR#tpg%5zkgCBs}o--Wc8CpPgdRiI<hi\
-4UxDr~|0_UjOv;e+{$X#}kY8nQ=#bYa&t%9;)o19l(n;kRhFtqA;%6?iPZ0Bj+tT{*g8Rj1eEkx7\
-2K@55J63FcI8Cr@@)oKkSMXIP4%Y#sIh5;U_)PqkqT#;}QGSQdVm+BL<-}C6`xqWFs|d3ww$ejE;\
-q9OK#GvU}4NX0nvCzXwxYaS=ch}!Sw?n=PsCDvvQ@$j&EcH!~iveahyQKl9PNn2AD9N<(U&;41f*\
-wf!$`GIqLGpk7j!nSP8FyQuGaGHT>StmEWG$6~r%{2sW0Wfssf6Y3)ptXweGBQVI%3go_L1S}ADS\
-QLN0?McXi-ghT@0`7i_y4-LlaL&_y~#by8wkq4@%nN@FXmzuRp$^f*oI@2?=u{RPXQ=+5q$O)3j%\
-7-#D#&9L|Hu<8b=8lhg#?k}aeN&s5R47NFHDc@umOxR281f>~5Oibu2>3SFJ+bD)pIa+?q#7@dJH\
-L@hbM^A2U{N1RdUv@4<ym1V$`Dq!YPS$zp}`{_&Jr83FWn)htB2gUbf+OGqK6!|OC_k2S(l`&V8v\
-F$(z>$@FkIF2PpF%1niJCF6Wc;_Gi<QEm;P^cP{OTYM(lDxZP{S(><M(i-7&3pD?0e0qj<XdLk&7\
-=E?+d{UVtA}t&N+Hh*7aj$Lx`2PzCP0;JPZHLnnJ-R-i*OX;B(L&)vwoulfOP`$YWQyi_3cNI+)v\
-c>Jj7-^iREtl`38qwg)aLgxBckvMKHcX*x^9g1^m2P5-4}Y;Jy^(nudgh5?C8tT~Oj5^4BFkN=FY\
-CK<$gZliy%NHt5a|{e{+G#s2`~?kE_pRrnRSoJSGQ-0yHD?2&@<o8o|)YZX9v5m;495sih#qu)<Q\
--yDq|LE2vEPV%B@ThUxkrKg>;IHS|k3a!p6`S!vH%xUk&-65c)`>d_)r<}K<(sE~IR2nE(Vr=<-t\
-6`3jwBK#tgS#wNd%uKQTAYnY@a1oxV9LCG+<rU*8&OW(x7J^8WjZRRO?OHm_W=g>r+ol+a#OT9fT\
-tHL06vD48(-Wd4!~KOd!UWLTSjd_6x%-ji}`4wcjDAnd`CSuMHixVg@A}OUi}0SOtfuZ`GG9Qd4z\
-e<yX;3Zy^ClAyalTOEmZ+}4egDY-nsXa1FizRVW!>gwqHZ<s=Je}(RD++YGvri--n+@<X@bZDH#g\
-Oo&V9d3O)G<++iBK&(Whr3)z6l#bKiR&S&2Wx+%fkM5=uv;O<1g-7dx52QMgWfa2~0#}x8sl(&<P\
-aPId6SOr)JP0F!;j=}M9dfLZ;y#;{11q$}&G3@;qV{ZXqZvn<$^q?T*7*IBE54<lR<l1ZnA+P-!D\
-3=W79wcnJ?K|B`+sP=3_#vHlrxb8)ifEhn{|95RJ87rezMT?DuG^jiL?Yoc`z{AU<0nhLR?z)4;%\
-vT7-vGKNY7fG~!1fDehS<KXSc>gCKjE=`v{j1j?_FZd$6hF6dowGK?LHOTukgcqN<S<g<3Gg;_Lg\
-$kd%G~KPedYQZDZ-MPPy%;$gt+p1{*LD+V>;PovduB+wOHI<&lRQBE$v12h^;eA|ZCV7+}e=i@9X\
-k4U2*kV%LiS!H;gqmF2L$Y1v5f&T=I^ht@qK-j%taTp}#nv*|!G=s=>rBXHT{aC;U2+fT}HJD+0?\
-x>ZP=30kQP_i9{Dz=EiAxjSjGLY;deQY)eV2b_Wozuf-D;<Ps`skI#L$i&r{-0XSz_MH`RjYrbcp\
-0he}$xo}45}@mv=v~d#!n@=49hQ7MR$<Ue<+io&OdE<-!EDa%o~PsxVHbH6kZFKGcJ(~K73m;pxV\
-XTLpagaSySJMQM4X+7YoO0q)9txd|GMbC_8sY^R@5YpbOFiqGl=~kAWQMEklfDzi}y9+GyZ!W?i8\
-;h^IYofm~8(<OjDuZ17B%HOthMFzXst9FX3QO=OOypfw}Opcc)`XeD!46nr6<Wg5UmY0W^n91ddE\
-xouT1_ACNWFyuNTPKyC@ZvjD-B*u%dhI!0sAF$nl>`;p041?-jOM=D=!aN9RT@5;m@%k)M+kNuz1\
-(>4G;Y|!Duvc+l32tIUt5mq=S-@Y91p-K7y+yz02b1RiX1trSGclq|`2s%91*1kM#D*9JIha3qyy\
-gM22n*af?*I7V{Mha4_CKcYDtJb5~5%DoV7GcM8R=*qHj^R}V!~Te2m25%ivp6l&5}o-mutfpV+u\
-sk+t2u<%DZdB{z;17N=oDFirDOp>>|g0;3*cq17WwG{WFu1L7T^{uUVv;^fNb3YEM1(olq|r9D*&\
-Fk`SvXR0t`|Ml?7NRzRS0-A`7sptvxH+vzq)C79m$zgaQm-e4wUVg!)%u5qcR`c<R#ty9y(Z(xF%\
-JyH|*i(f|N32}uCy_ElDp*6~_xQPye)HoiIoN{Sd&eNw4tX`Z4!O+xx}mfxx)+9P1?B`ua5%_g)f\
-degY=Hqh4;6{tSQi}+FS)seQECAJz(TdmT0_z2M%NCwmM`#dCzAlT+oQOETiwKw7X&|h+L8PZQbR\
-E!m_7|K&|zM?M$EM=SSmUq>TMvEQ2qINVX#zMJ9QUSNkje^EFXA}fN<k7)B;?pt6#{P%(OGQ3&VX\
-v}IM-VgeHD(rE9Q~omv$N#N@Ce|h+5hMmC=pT@e*tsYhb6{?QIuo%*o|Lq%>4&rqzAV}YIZUDXJ3\
-?h<W}1UmI&`Z1byB^+jD;AcJu^D=UMGlo6+faf$7^E>6ekNQxg)+<olYOBV?b5=runxhqiaaFUP1\
-N?h9WkNQCRxvZ}QTm0Iwf=MaaF-fLN&xedKrd;tHyadgHROuU&p=?BQ`na*nD6)=nT<YgcB5?DZe\
-@^U15iU0h!k(ZsFRmn>%dXvGpGV}hyzqiBh{pkPc2jH8|77kB~t#4rji+sRiCH97s)ZsDmkLRo`o\
-zqWfMLxvi@pVDu=H9pyRv{A>17sNZ0+XlCV!1mVK5Z>Ij>eG=pSG6F4{+em_q77plO<I_+UID1uk\
-_+x$x(fOe=n_6?mwwW<sJQ;6-ep#&m%&=ZB>-T{@K2#zl6;n<EE&$s@heK6k9(plwj+|T%uLw+kx\
-5V+xM%N^{9ReKm3bH1LXO=L)7d-NR){IiQf@)9KeYI=T8!RvcI=D?Y*i_8~sqaeZRHjUQ`dgo#||\
-fj}4ICW8W`VdDbE_&9_*gU7oe%dkeJd6SUnhXcxiSy+zuMbT$dn?qO($u@$%T&qIwm2W@oq3~m%)\
-jk=&ljh&U?cPkPqZaYAYy)Ax!gMj}n5RxK?J&Q3I<MNbeDK201t^7f?cOFL@TFLVPnIWm8zqJ;{m\
-Vc(8*w;RSV%U8Wm3(?sDLLZ9{O=1+CCmyED3x!&#C%S%{$jrr?ZHOne7jG1ZE0=yMSCv6zU~9H=n\
-~S0II9iQWs<OM3ob^$2(ya0vWk_ky%y^kSJKn2Se-ElZs&FY52))RJm52=#rdbB(g-O1kd#_!>D#\
-!p4=OE((ru*lyXB<xMO@k(l?I%RQRy;LdW@DjacOPzeg=8}CVijs36>Ll){<L6;)qOJPS(pE>83R\
-%eTHjXvX&r`On-m-0nKT>5u}R=H7WpS@}FmyVy98wbz@<IqUK%mBao7MFpu14z5(G60ev%eLqM2W\
-Z1vyCN=K8@L%zDGtRkKOTv5e@pjQy0`kzftE4Co%5ZHLl^t4MBQB>4worQ$~P4t!!YvoEf#awz{^\
-{Fns^a$xiAK9@mhNNQte>sQn|7Dc_|4ZTjOI7~=iNgO8W~Zl}vO1eVr{rjnk?NWEVB7bp$BN7ra{\
-!h2XP}1V&X%+WJz8XK*Q;%F#kNauTRhScWTf+!l94u0M%qgqX%}Ur>ps^<^{VIHORmf%=U8(QI=S\
-9W)tqJ(AY{qR3Xpv{KXaAxD_i-sf&Rk6C;I8OT#at%y&7%1^`+M>==ab=SEC1E7r4v<atZ>KI#y)\
-0W@&06tp>>|Ta@m%(_hq)E;9!`v)?<RZmv>ykMb)|`L$mho}&Nkgk!Dg<;s{?$sq8dL>jaQUpYu+\
-e!%$He6s&6kA$NxrVY3*@Q9DNO@vT9krZ12jOhS4D_7iu6sMQr*aC!#F<e;_D641%aB%PM!0#=;A\
-PD{vJp|zDyL1>c;u@LL#hO2U4Lz``7`VRop=vTz{UzGw$$@{94>9O+&ENW(4lV*wVnsrUc)N3D{w\
--F_R4Z0Ni1=H&)#9&=e!P;7F%ph}+@uYsjFHnJENW)fC+k3ti!v?b3I1sdWziXbRuG_C3xCi?E4e\
-M$=99%0|9T!3<MSO-j$nu?tYRxowt*~4Dh)2eUXl8+ym)>g26m=*o+dSGYUOl5J$^A4o)<^u_1qo\
-76%W&m%8SO8l4Urw=P#HJ?c!&~L(7AqrNft^O5PHe>-0I58%Jks77_M+Quuq373e)3D4d^V_Bp!P\
-<pgE#<H{C5S;c*o(LnH#mK6w?t1$SS4tMK&rMUapIX&+F^Pz~lJ2~9lDK@`)mX0!@#oaQo;t91P#\
-@#kcDDK|31aQ{|xLc;hU7LctF$7!50e5B;d5R*q8w0regjE1=@>z-{QBvG(eU@QKR8ZWVa^4g{4t\
-_!qWT6B>_Gni1@K@rfG`PF%EA6O);4b*n8V~IOlcDXWxErO#T}57SBKfZ5$v^SpHw4D&UJd^TjI|\
-b`w*|kTO$DPxVSv<HWm*eMQ|Sj_S4(Y(t8am3cu!h*>zS>1{~3VxsD>U~h3!}Vifkt;g66Olrapw\
-K0oLQD8@Q$$q)pFrUw#OEF*AoY9TD`a#r#)s)19>GLqWfKi9#h8ppp$x*`R}pkJj2_TI&j}m1kP3\
-l-AmBTI(7iY`SVS?78@%h(7GW55@E$4?p<m!+!iwN*}O2GPj%SxZ=<Tw-xt!8S6VqS;Uns-u3Tz*\
-I!6yL6{ZC9BLq$^G9bvFM>7;a|1A%Q~YSo^P{=MkLC(Lnrq@{jw;@8(DTtPY&6&pF5dM`yvt8UlP\
-HX)9XFa%B%G%oz#^K}d8;b5jQ1-K#DU7Qnh-6}*<Z(GjeLu_Mj&TmX@|5pfm$#$@q&bPG{7uB_!q\
-JK#4-8hYu@s6f~!?1N>3{<04(dHZr_{^tFKmzQ>#rP)zA(xkaBslF>uwD(~S<KZXBxf?qp4uiE5W\
-IT$hu{hM{aAUTy>N!fuDVu$I&)CwPe8MK_83pG_9a?3(CB<hf1Q_l8vV--q9Pg5E?offuuF_{Dy%\
-iW~kvHhQYpHv;Kq%QIgPU&f!rGNrRVre5;0N#tVGeok%l21bX3<jC2ZFg-UpG+WCoyCZdA!Uj+WC\
-eA17z@1>~Jgj~Luj#ROnU2tCzM><<9%4Ge?Bf8T0|Xj14v?LgVBMX>tBLIcw~)s~`uO*k@W`;?$1\
-e%NOb=)r1*0?8;e*XA!RwLq|E6MqdZCDSTY}QR5lizwsd>3f<DSIEHcj)M4RU}uNXM7T7w<t|^es\
-OOCNHcANqmEOpCsi<<rZ55<)OxA(Rh`^XMp1A$!m+VFOi-a5w}>VvIxOH-+qcJ<zBFYoQn25309C\
-I<+Y`?y(rrAC0Id<z+`lan2fv{lToizycJ|QZLg_xr<b~dq^F&?I&Y`LJ4uJv?gIqU(WodwDaxZo\
-_u-;$sHj{i+DwZo;iAT<DB!G5i<Z(N|2|Z78+|#8zC67T8#RioC3lz8EIpnUZ_~1UP<F~%Qlg%bF\
-o5;^P+7^or&ZjcF;uo)N@<JJl5@^1FHHkPLYcH77QRUUFfq=aL`>?c{;jXt(kid&vFfVkTXERDV#\
-LrR5L}~q1jKav58z)EL2@1O(>a8Ifo4loeMzi)DHmaM`=?;Mv7^^zT%MdKPLMdbSFsVoQ_G@>j-M\
-Ez8+vpFWtL`RpIbp4`_mQlV~-4D>=O=3$Nu>~GWN@RrDKn+pd0(K(8k`lqB{1+D(c7H?I1UH>3tI\
-BcS)30uuwNaIL%_Ozx^DhSp}P9OLi)zAUpNV$oIYd8gLGBKgMfZS~DQ)Cl5gLaZ1FR$Nm`wMN2dZ\
-;z{6T?N@(FfOqS9YC@*;^%{9S`%@ZgSHa=#8>NIrK8YA(CtJxJ;=>Cq?tYCXuu8!&x|_l1!2?Rfp\
-cn+EiNyOIGLV*QQ?d$?TU!4i(QoYO<M>NuHe!WLfwX7Xu{)_)6SwECfRB|N=~IfVn)`S6k_9Q{g8\
-kTa;^WI{A}O4iEK_TJ?XW*!6s{%W>gi+rARQRF58CL~^3iUVdxPQWAB1?+DzEM4(sRISS4XlX=Bf\
-gIA5!s~iw2ZI{Hq&*_`vr<g!tDLjUXNsd7TjdWM7C7-?P^k;;r7&LcB+$2I9BBrG@ySN)m|Q7I_m\
-Ou7`FpXLkP=;oSIkp<@3)0z+(@CxOfxw=q7zw)eL0GmjEH(gYuOk#l1rL*lM{{^}ISKL2j8Mr&;C\
-qu<AXHb|rq?;hi0oTSG`0tab_9?NIh%4bEDH!GiRE1w=!9*0vVW?zJyh)56_Qwpa;A>IVB09GdH2\
-hHm{D+#RJkn?(yin!E|y$%y-9lG2Bn{rN;5zsLX+%cE=_Sp*+$#2qjHoqd}-5t3kM1vr85xttIX(\
-d1+wOZ*e%0(giw2;P!HmhvWvCH4y(*;-y*Lv%x<>g$_^N71t=GR2uEKmk8ZI|LV;pM;(b)49>-y%\
-Xx0eB~Q>>pCt-V+IEGM%&_`!B>BoFFa(uB7we^m9poQ-xhDVNfBLSMr}duxFhI`SApUBuHyD4=OG\
-ibFhq9!}nz+*!19|cUOkF!0$XHx0SRiFV{<S2locp&EmnRN+BGeF2*MQISSNL*Eg^dz2^)2m5_ym\
--|f)1{U7Ph-RyfAd4zz&T`Nm*_)_KT!Qpdno8s`0*CjYS=eQn+o4qc>;i^#@9Ip1d42N&2qQ~K;?\
-@DnvSr%SNrj?7nlt;&X=>);yzX=ZKDFbllD82!?9M1RKLvWb5+QOan*mYnRh3yZOFb+p&xG71%{a\
-eQf9@kl^$xBd3;=>^?L9swU)pHn97jQm8c`pJ|18#o2f`Jwsg4!Q55u6Z;KOaRsgRu`ylsdLAHzE\
-|TBSZ0Xy94Fao#^^dyy0$&;x(gG6dxF+qWHj#QWPJ#+bo=3ziFM(?Ebe`VdtDMq#|xeue}UI>ZH&\
-L<eh+4TgV<2<M1S$AzPT5cj{Obb<o?9=;hDR4f@S@0%ig9qKwdSKgbAHA|pJ+x_;>ZBn9!&&nsyi\
-x}wkf_h%XIijbX*?usqmCn=`ruK3XVG^Z4JV)V~1mu8TP(_gKnz=!SOi_0M_>S-!&@!R_tQWQgzs\
-xTR4BBGR%4+xnQYkF&{HYw(sJdT?z*Q>a7(R=?aNk5kZ(9i9f`akc+#vI8|_o?;y?|!(O*b0R4@7\
-Ns(;r6I9qOn2mLrCw{S*DM<czZd+mUrI=G&=_w5^MCZ+6bz>_yK7osG>h@3X~H~3JXzX{(71T2i^\
-hBK>T&lS4)PLmzM|EIFI5D0@(NuOq8#z*E>({GSNE=^j!mE*}0c6z3qpzn>X=YEo6*r+dcpbdQLb\
-`!j1tf$(4Z~yRd3QXn*|<37ffnud<o%c!$Q55KnDr)fKP6%S;f65!+T#+fIE)Vz&9}Eu-u+VQ`~Q\
-D;aX5I%}_s8?COaa--VWQf^fDtuVMz#11JpYMU+RMzt%Ob0c0xf9;?kqh}wK%jgHc(8%av@}`-_y\
-lH@(H}!nmm^amv^QODrmh+|xZyWHY^K#zwMXmvF+9~Hv+j1qm>G|Anc~egfZ#uu4=S@A=NO@Bo4R\
-3mQjf6M#S!K?fzTKtrrm?F-=1nh0YI)PfNIh?A@rD6!a!4X`nXqKrPk71l<)#7|ak?*H?4sdnfDw\
-8It>rz&zlqk;hgIAC0qMNaazQ}b@PUbdMtNc$>*GTNQvZvLiG8z7=&6rcPdX-6Ylot#XhY>7(Z4G\
-xPtU}7XV@2aQ}(b48}~CelQTTN#*E!cs8_Kg-4~(J60rMiQV}OY_kNjahh%<BatXxdeZaPgE3j2u\
-Llv$-JTnwTx#va^+JGyN3p$bTl&cl!odc;=!Q$gzL8BG~j(F?q0S@OJ{PYo1$u&TfA9j(EUEHVFK\
-w+Vd(+UUo2}`tVm$I|e+Nmm{*{qfTzNYU`h3Gc-)8vK#*GZV$RmBUTIySIrSGG-#sDm2Vfw=qjE?\
-+KJvQ<bj#;a1~&x#eQn2L^f9Vjo?-zYnrzZ^r4Mi`%S=`1&F6VPZcK_kA#{B2y4ISCpS5-CB^+%B\
-(U3L069HhE+%-pMdc|3>$s=Q4nri%43xggi8xD7GhIP4ja=tD~_F9NwLJD?+V8Ysq}9C`qtu*Q?i\
-qU9R`YfUOz9^g{4wqP4$B7f`LsduDuvQrPBn8RAvh%2v4mW>0r!1?xVGARy3Tp7#~V?pJog%*M{)\
--FGD+;@uo1ktvISkWXEZi@ulsMTG?TFwg48i&wN1bip?p*t1<pTl678xs*}mQcTN1m}V6*4Gukzs\
-Q$`UoK214r6;kRL&0SmsJk!lH}-bM2C^g``&!7I0^3B#tFV<uGOIM-pyLLSAx?jTEcN)ktb5*KQF\
-DWc_nqHRn9XZ&C<3Q9xh3}!gLY1Ou@#@qX0BlY5jxsJGj={5e6}yG7l(Ob2N~v}cV)wzv|b$M`W?\
-zJEo_(odz{w@LkcOce`#;6BQCBa9Cr}<Ogt{)cY<8JODDJv(aj(|Lc%C(0P8tA-pD|tWnST7%E^#\
-0rTrQiraZicVajVNrfk1vj48jZ7MGywZo2<0k}W~OYH<l-cALu}1aE8_yvZ@co9IkeX!F+$-180@\
-c%*dT(VBq|dneeyRZMyfq5yQ5^ewnXrrCTiF2ox$gvC+>N)wpB?~K)e?VZ@d*q-4IyZk%hw1uG=w\
-;N#Y6z@vdg2Q<=c?${NdG&b4GOf0?=Phgw<5q>KirEx}5bJ}hrvQhtBZ!Nm=*1JA@eEUW)DDiUWz\
-qPA2mkUaSsDM^Y-M<p|LV2kIv#sfq3VX)fU1jWfR%h6CC$hgF5H*3T>6QongNYeKasyxqNX?9tQa\
-Z{*JXr$U4rh?VK2o%X5Ynlm}FyjWmx4)k)>aXn3dwp$5ZLD_-PrOF0T-mqRlRIA_=lE55mGA0+}i\
-O+JY70*gk$M94+Mejf$*lDg}UOHe-80xTNS)y#23xN4*y^Xb(-^BEntyOk4TPsPd+~9MSuTOpd@v\
-<4XJ6<t$52``hYlx+JX(yCOOpI6Unu%(hy5ckh5iDyyAV#70__;(y$coBI-1xF)Lvb^IW1N*vxcA\
-gF3G<GP&J+(@^{P6_8?`YH2yiw<`8{QH+^8~pFqC9^G-=zfQE{rOzZOA=GPJLys<7s8rb-=Af%?1\
-O`6cMDG+m<eE~&%2AHyy92z<Mkw5$oPr|fP9PBSO63}RzfUuU*!qW`ILaiZU8)pF}nE=a^#gNIr7\
-R#>a0>oGvYMNkw-8=?g3*jbYn62d+KrVA{$;I?%HGjfxO>@-#?}adX4m*Sr?FKJwn>rRqFz#cZaU\
-pZeHH}%^>ZUn3t!%P1BQ+G?gsrz9YY5lvTYjgv8^opjElN;;1YZyOJiP5}Durj#4L1leJ&_<;%~R\
-k8Is50h7BI1ryPSFO#pD^fu%j^RMmP6A(GPk~lGnBoToi9~Vu3=fN)A@h-?W7w__nCnmoKq8osVX\
-LN&v#nBCtvZ5QLY>93#CO5jl6mN6`XJK@MH2&->6CVw$Sr|QuQF%a3n7vvH-^ag6!lmE;?U;m@;I\
-L!Kx0X`;{qGzNzQ7V+>r<&U(MT;e-0Zn}WziVHOHj=v-<G4_js~aH-<hAM+8%^o>Aon3wb+p!g$9\
-BC@kToi`6@aN6<4G|BKZ*C6boT#*qRwf4kK+W{)y$^14q?(8vo?+Kv0x>bt$;izFS73=xEZvPUVH\
-J%vz-JZPdMWAVOU?c{!?(RrR!saClbVMv{rda4{;1r+L$-1AH&PfLRS-sq&lp*yEXb*Rq-?Rx56n\
-pY9Bl`&zFJD7}l!JZJ*{3qh!I(=4%^J0~Y*^Q*9#x{yBYN{}#}B64LQAotc>HU4?_D@=KZ$7LRFr\
-(^Q})eM|UM|ClU3BUP{GWXBlAe@-z&W+b7M-|5Rv8+|SkKB$Zb~z6D=z&?3?(uz#?*z&vw+H}#g(\
-*{4iI<jgdHM2v&*DdG5sm7F8snxz!f@a0I;>I>eKSXso8^baX+Ky}>r#(JHS^%R+ldJD$qNW5cM+\
-!%MW!e6W4<r<1!~J7o=7#GVd|y!>_&jcz91ZB-)8gjiAz<GP2HvbzUmafr`fGw+L|mT;zdX51xMr\
-GQLdQ!<Sk|6G|AHLQ|*cTomzz(wDHR(w?bgqwg3mH*$YarL%6T$bHwA}F01N7a3M#r)d3=JBFcWT\
-@7Im&FyLO*!-M#fE!SV+g}Z&*qIUb9N3}@Nd^Q=>by~d^18V;BCVOwOD91R;x2C~y29|c|ovY;TR\
-s0-7pJS+R1%6i_u8?zeLjU!yubxk0R7~)4PDPF#<fHz^n(vjb2A6wn{pDNO^{>3gN?U((LfrYjr{\
-)EeyJ8z<A(pmggW_E7TenRi`HM)Z@^xRSJB|#3TWYTHSoLCGvcS<9#Yjc;)m~24wh-<gUdq<)F}A\
-L=MH0W`MMV|cze%>7siRrdkF%7kZ_$6<ZRFpYjs|EO_{eeS&j<`Ucvls;DF7^grDj!O;iI_U3<+R\
-#MVZ3r=B-pl7uZM<0Ncx6r+N~tHggNGphCFCAUfj!*WsLO)*(E$%BJY(q>aH<DPm<nz5G~tCP+*8\
-YJtjE$4tErFnCuejno^DEx;QOeH%fpF2*=)E3tAk*)WIBYYjffoxom?TEQ+IgU5Qa1(>y1i%X9y>\
-kW^`*yH1CvHQr?c-K#0FP_d{Q1$`RNJ^Hll>w&Zjd#bgjyGUM;81ZyH&3;Sgv>1J7Pl)$#rq>!?2\
-`rY?%|Y7lcPv?ajaGX?JnM08jq8@vr*U=Gf+w36GekAVrjIE@m{cLu{p2r`K;O16>;0mO0TXp@4L\
-?uy{sX>X<d~m4z5#!d7epSCmDj{LEA~97y*03*k=@;;@%ciw<*dokr*aTQMbJ4XJp6GKArL@+?Bl\
-J^?>xQ<dGhU^MX(2b4K!Nv;GDd^jFgp2zK{!uV;me1v@^gTr9ZStKW4Y(}~M@N_tr|60{xF2;o+h\
-ToC<kj(m_)p3~ocVtDV2UV++#79-Oey~?Y<ESYpe?k6W#<*oMWZ>ln|6_5;er3_Bvma@?&;nCMp&\
-cECN!<zuzAjf&O%4;YCOkxn4wLa9Et>=eY^XC<^Yozs%S>;VJ><{dS{l{xP_-oAxqMvV6$s}jFnM\
-O>$uxCbqyFX9M7aT_C_S}tL_s<abr_Ni1JmSp8?w`dx_?Z;*QW`rYEapxLkLc>nNMl+{fy&Z1Y#{\
-DJJW^-7biM~t^7FnRkl))c=*iFEUQes^UQdB~Lcxz+6Ah>@QDJ)QO05W9zM|4qeVH^}gjXb`fNiC\
-Zq-k%=+p$iSQKoKT2SI04ljm0(fXTznXel$*9dm_C*)i$93;Xd4Y@dh61ux*ux&$pyyz6^d@5R)8\
-#nm|q+h>bZ{qaeEJIzIGKh03~iBTJM@s6?E)%$NysV{dK-AeE_Yhc+U8+0kzpbJxugs>_Nw(DYFC\
-HrEEqWBDan&D-k3dExs(%tb#w`6y0wMd!QlnwgbG58(!0_ArfX-e(<OnXf<zBtRBXw%`KvMEP#Cg\
-Nw8shsBCX_{|KDT2?v2>|$gfp8<OZz&PFuvV|z1=YDw->!+9*+mJ;yap_lMlW-g1VNvVn#GcWr6?\
-);wl8HImjxz8OjEStIWIHCKZ5PPSjJF<z#=Rpvz`VmRgEo}!8#Q~hGjhK29t)yY7oNRu%bWU3f)c\
-2;b6_4h1wmak5jpTB8p2ei`P;ylRQ67V%nwJlHu;8a5o-{>N(B#vumr&WZhTS$TnK4rb@7}qfLKm\
-0pyJ{w52{uPp!(>&hYSf=4qBx#$iMvqBQ@<5&={itRMsgj+q|NC$}qp#%zv<N0^mX9Agf@Jt<<js\
--F|8pvanrlm;alq<AyuV2ABFtCZw<IK}&i*wX8JdId3t9ofL#pb@;Luss3jIqD@w-bKv+Sk<JScG\
-G-t+5iFWwgbh<Cf{D5<Q_*vm+5srM1BKGF%hHwChk@f*m~f8Exhd5vmj%!m8MF@_JpUImJSxc9NN\
-W~vy>Gtq%538!?a1GIdAcb5<18CqQSqQh$a<tV|nCh;AIu!t*9~;HS9$UP@j&WU&r2F(HTBsQsM^\
-^uM7l?yTvdU-I!ioz>@naAKpD*S*$#jK~<pXp%LWj=t?N-iqMX-J{@IAQaQ^|fcVWgH5u_4ylvy_\
-AK>~Lcy$U%8NLqBs%E7pS16m@^3?&j&^*!jO7V1WEa;o_6#k+fEAe;I>rS6+92<&}-2Yr(z<7WJm\
-p>EKj$-9!zVFe|Jf|;K4Mau27I8eNN)$jOcdgNG9Irc7%D8o+a8CKtYPL7{RFQVVa^le7uS>oIMh\
-R&B*#u<^YW|Ww>!E(9w-AoiJ&J6OWWS!P)l28HiwqErE!Rr-`Su(-<!mx#Oi1WAU7<%t(>&{tA{|\
-nOXH#;_g8Howr?w?8A(cFN59QeuKJ!2zP0A)P=1LQzuv0hvuDSzd^E*(r2>>ien^K%ke-m?SHZ`|\
-q(|1~PD|mP9pTpw)vWfCRA{gO_2h~s!YB}|J@G7Yc+zDBv7icmI%%o{Kmef1ItH_;@!<E{ns)sSI\
-QTl7IaQ=gmtwQn`sGBlMp_-MW*azCP!B1nu^d!bIY9?n9$EMN}H+D_5(Vw~0IAsdaeTcAqnM+m5b\
-$QhDuNC<GYXP9%+`&Qb*_G|Vf+S$$<c$coZU+<Po%FO)04|7n#8H6&x784-87TNJyg5y>3lDlaAi\
-arKA`b`8`KxjjtwrXxadL~yx%r`FxK%ljuH$`U<sCmWUv?U!%EYb&?FnMm8ZKEberAdehQ3o#{Hu\
-^NJfFV<+Z%ouPEW$fPQ{d;;i$c@QHF|HP237*rM@6NNescB*Ji$azANXMX3u3TcyN}Wd&FmnPCys\
-1Q}*N2Wj4zY?St#)$;Wqfu4%B8DBXXVr8^sy&gPRv!fc3tre-#;PcWK|Jm5(c(ua-J;-(=Cu=CqY\
-W_n<ts5@N_iXY~L)Gz8t;Zmoj$xVVA=4h!m94%<mz>sz4QOm;Dopo2D>(rpMXH{i-$q1cBmvSUjo\
-%UL~UZ-8WLMxj5G)NIBnq_Eo+9*H(?o#gvv}0Jc+U+ANjI`UC6K<k*yL!3~7K-&!wOX3r1+TXb_Z\
-k$SSC>Z^>Q3~=)p~O@)S4)Z^Dm><D3jo$T<)lL&p<_?D2BU1poqwOi`h~E(V-%z!g7CHL35Mi&Cf\
-ZO`YW?VeqlKH6n{o9MMB?fad#u)8hCUVyV46&Ft{8;r=9YccDHq!=*PJgBLJGM-^OghmMrqd;ZDO\
-e){fCwt5n%ZN$~B~1{fid{*_spzB<Z`nxro;cR)WnS%4>h{9R{}08cNSI_y;&vp9It7)jN_ya=CN\
-*;w6^%elZH&9Ga{(pi`^-V`8c`9SAHB5*s#p#L7A(jYn8V!LD0(Nqxz*$gCDAIQLQtgUx|z}!bnl\
-PC`h=F?vA`QQSH*Q18xJ(6Hxu~RgiGVUl`HSXw7rb3o{{z#Ya0^iICdSEtmv0$<9wU}7!8yvw>#G\
-$eZdL}E{4|QBqpQNLJqpyq8iJQVEB|BNZ&p$<aJ?ft6?6xyf?dTLHEAi=J0zK7C8l98bT%f^=YQF\
-_s@~QKa3BGWAxB}wC6*$&XXSwV`!${wX>H0Ww8CQ%`RbnA;n>C5C5D3sM<XF~TVl^qF1~JxR^Ab7\
--xaff1^@r~ab10Ww07;fo*9MsQSvT?MaNv6({OF%FpT*gS<Y>a`d1^hj+*|rF+F>93bOQJulxh7z\
-AYmi4ncR;I$)CY4l?st_!MQhEh5l)J&*Y}lWS+@dsmw>VKysgRAH_<;SYkrF<UF8gfFc&BWL&ST_\
-P{c!9-$ihm~l%%wHkdH--OO+5p;HZp0b+|cK{NY4-oF|rnr!vR%UTlb9mZ+)zxD0eK$vyWZrX;jl\
-@j5)6byBY`KJ`KZbt1kNT~)OZAchwPL3j$Wnqd(FoNA)h;wYZwL)#k>Z=51@eYWiVw^I)GUf#dxX\
-8Rp>@qTmx@7j%#J{mJAkQ4BH<QI4r1G3o0lMvZpGGULI5YiMV5!=OKr<~NVi`QECGO!52YU@|E(k\
-WV!u&nwAQQ>!AuAwvN+W9BrYQ0#b<=ga{FS%NvqCC9U1O@idZCL2J5jRE5%$gTsO%Wc4W%L8=Gcl\
-7$&nWgeMu3868eyxte&mw(A*6h6cVx!yYC&55hEjZ%6cAFXqIxb@tbEZ=AoDX4PLGAeYtI*ok$n6\
-kF%AOs$t#gc63@VO)r4x^#rpmLwp^;UR1fqxbtPWa3oWJ|ZJS>aR)jr2HhsXnvF=ZHk==iEvp)T1\
-dwzvV+#7<GwIZc1m+SXCU=5Lq7w_8!0^lvCcL;18F%roHLO6BhAi0K8g=^1~S(f${EPkQMxmbT_b\
-MV8A!c&$r(s_f_et>MY8S;q!5WizP2+|dsm0K%Eq3tz~BrdR#YPphBQJW0RsZvV^f<llr0~pRVLV\
-mJ*Ep&CSZZ0!ea@`=1D0yOYUP~rh&_97?YAT$rwG4cd{czAl}R*fxFL6;*S(t4b;ksmAVF`8OV(I\
-$M*?Ah~8wRmnR4#JvTuZ>BkfJk!~8Sb#mIjIAEA7P5IPud%0EOT(WqcF?$q5h2JNKDp^f=hO<Y_H\
-{V(e?eq0}glwOux2ZkUUAINgO3@n+c8!vmcta4>_I6YSweCH1g4*wW6hZCoc1TdG+*2;7H5p~>%W\
-5d6&42p(<+M#thPVNK*<WWb)+y5`hY8B`;bEdO9bu$Q8`=^Qdz<1PzHe)$HqG$<5$0BK<^l{y4oW\
-}2+0Ak_5(g~^wJ+i`n8iK8X)2I-91D`lT7+Wt^~@CDszy4*X~Vje_=?$_N5%6Cm6!n7RTj?TOiaw\
-9qQP|HQ8D9bz&hBXGp8|sdDvOHCJX-Z<Lr#(00+vRBlz0m^XCMY#(#Y-!DxREwwE<~O7--c<5WD_\
-cu{CL8kld=M0G!#rn>9xaRMpCDK76>+7o89n>)84=wu`4WW~Ge%k_SwIqX#Vw4Gj<O3qsgpv*Hj7\
-XBsjV-As?5|*RE`F=z42pX@e5U)IfXY^isVTLz#0J-cqiL@sqbjuK!CnN&cJe2_o&W~+RE7ov(Px\
-V+>ZTsOwcBwdi4adK%s8(CxSm;&47Vh=NY4mIEjxp44G>05Z<IDFHL8a0FCQtDZJDvS)+3Kvev+f\
-nC==1hyHNGCNuEsahl+}1B6_u?Rsz0aIQ0!EvgpOpkpkF%+=2qSov}1x`ZY|`^*9Y71=IhEpX#V=\
-l^BIKigfeOnQX0)ej0ns*C$2*)+R$016&-&<AL}rl$4MD3dTvi_X|X7@+j+EdDS8gO7oMRZLs9Ji\
-(FLmI()_*bhWT0p70S<n{Jqrv(~)NYAmYNw{+FFtw&Ft3^hd=SPqhg0K^D7n4U3}m-cvS|EuC4^C\
-){3t@=1(CaWu8DmxdJ$Zo_PL_Tm`Ua;(^L?UVG<12{)u0ZI3@QN;2b@H24tu{jzgd2z_?p+71(_H\
-ld1NwCq=^N#L}CRmtJ4ii%eWF+$ixg1lDKF7n3!AhE)kWS69e_Ap{S$svSvc8kqHL&FLW8`FVIK-\
-bWJ~24h>0-F2QidnFqnv`=*v~0B$;JAx!MU_VgOFIq^(w{Wjz%g)&6YZqf}a=nMS>`*qGhz@nn8i\
-Z9$|kOhX9HBV5ZDhH+Xw-H&+3~d1JWvE{`@B%0xlw%50VbAcV?`oXUBj;J>1}>npD2)RQ*RW^(O>\
-ff)b(RGH=0F!!szgH|0RZY}A_CQ&QGEF1KbTTpNKL@1BkU|(LBcPg3GQF{Aw^X`=8h!X#S0pS?i7\
-L79#6Ai%sXDgX6ah6eh0lrnYwY^j^l0leL7_l=Tz_o0yuu>4few)Pf!iy9hsqF#v^5|7JEO~3nlc\
-2~z=F$~yby<oYRL>S@rO9m-A;F3moNsb}HA9Y(l#tyisEm&J<zt{nl|p<gj;Cu&kNFN2M}q%a?_l\
-wU6eCJHaz2vBKdgpj;@hzcs{1y?PThT@F!Pbv$F-vZE`FtF7%}Jo`}q^K5i?~(w)1kYA|3p`o$pK\
-PuPmUKbF3>?{8dJGgd|?YEYjstYqAc4Mky>8R6EdGS*|{4T)qSSWVxZG>oKz#+c8Q(`UG1f$nix3\
-3^3dX0p1%b^Uu-2dU1l3IBA^5R){dO7*`lET3;a)f}M~QOzj*uil!MBym8c2!awv11`wlj(_mx!q\
-@O_qU};!sn0}jN97qV(=B$u5yUi_boU;cTs=K$Lu?NYgWfqcvmA~=l_3m&0d>b?Vbi=w%y1mTmKd\
-sxD<@*X1X{z%3O8P|UzH<Ia>Ao_icR2gXYbn>UuYCS!(0zr|zogz2QCfWf2^s|w4~zWCau16|iPC\
-sOW5OT$h$-g>BNdH5X~Gm{I%nWCQ~L(D)5s-8sxnd^0*{4W<soQ|g)}8IV9kq@lzXE}{ll3&M%@P\
-pe`&6De|w=DY+1!R_klY}8@s|m9wZxdnLi^d3~SM_W+9o8bwG(H`Xp>e?i6O*0gF+5S0R>WN;8%!\
-0>GZ&DyGWWsgdM-Ax<zP2lamuwf<g>1LgkC%mz`T1+{__Z}S4x+k61p+<bkKRZ~R&Vam3(ew03K(\
-C-PdT};5dQ>{&yI_x%En-DYEzNS*%$o3_21Sgy{%8mCDG(_0bUS8s+4v;p3V$f{;bLe@eSUE{`pd\
-{aDMx8W$B##BLr#+@c)^EFNPSJGV#WwiEHoO}sCkR<#rk<n;Exg=ZTHEuS$>i)1M*9G>N!EBwn>D\
-8cK~8_<2XqgCdL?lTN4;D+lLrts`FnHy+FAYg<Fx($VCMqS+S<LTb=092tLJukL@&!FtCPo$Jh43\
-^PJ7O>3ig4dT<$AN8nT=oV5=)vGxq2$|1Ek*L(HY}Y?U}cp2bl~KKmfkG?wyv1%gH3=MEI?zV~5z\
-#n$|@AeFX040l+o$CHn>P%XZ{HW!+H-<)OLO!9I-+m%Q*Piqmcti0cxaM77H*_($4k~g!fvp2V+H\
-~xzB;ynS9{%*310)m{O%<d{bL(y?k-8QN}71#k{r|99@zZ=g}Ob+`zO@+h0g-r!h#k8jUVc(Ko+G\
-EKMPX$7|7%5(HLq({G0PF0)1~6o_HtW{2k24FXj}yyMyXo^L8Ap>=>S7jaTF@;><bqZv9FT0t%&F\
-{u>;YX6_x<fm<5eUXH{pD>G0d|DJh!zM=rTp&L%p@Jhy+)*qKOGqr}?@a_!}k4qGz{vctFG{;-$a\
-WQ?%>&czflzlD+COnx#ZX`lFr6Mg`oRa-Y}NHJbLgPJ`#NcCC0+?ebT&1is=#b;rG=`V2N0g34BP\
-mBiBo*Yq|v2&U;lwb>0sU4M2XMc0pjc+^hedLd<W3Z}$ueMIi5tkKe#k*R|5B$GRsVfRP<ufsztP\
-G`bxgjj&!wNaM@tk%k;j<7!7pEikQQ)R{2=3RIq4BddsLsckI32NEpD#7F~A!sF1ZGUBZGbrwP!q\
-BctYkckq#j3Q^A!1s!22_<7v><$b*&%55NTw?Bw@^RQ4){fDmS6hHLjni?r=Q|B*twp19rdd%K}G\
-dd^XEe3n{rO~BN?8L6D!W*bGjA@Dyg>ar;zHxWNFk}*jnK4MRG;(;86Lh&+Z)5)qZye!8>4k2PHY\
-qDzD5_Qpt@|EqHF6>o^V>-C0<dq|TD#kl|f|#zX_==G3ERe5}Akz+39e`2>O&G3ryB{)wR8s3F>6\
-gsts0(Y=WI5G0EiiX?17+kUn#w+}g?OMMVl7LMmywF+o%9auUT-&rxGkR2y>?FH6H)bRykPd(NP<\
-d%5XPxvCV-;tW`zXuNoI~BMt;CH(RVcCWFqZ95_#H(=4JJRg;+T1%_1dk?UXT=c38xLf{PHnh^Q7\
-q7!9bw{|m7+8L-~unU)>Fa}yyRS839ERxz2eGQ##vu|s-quCODJe!1)L_PZ-p2J(WN*&?M^^Op(f\
-`p2<hzo?G47jD~!@|b{2~7s4gn`8?qo1IJpKYX&Jprc0o{UZCT+YAAUPYZ~fsdIXLhlwJO!IN>k^\
-N7mdWDtqKlLHJkcM)xN9@3Lb||+k`5Thn&?ouUJ_vVu&=0&^#YUwEk0J8SGBC3~t9_4p*wgVe57s\
-X1;$73?f0X9TaFHrI)#|VaN}+_Z9fz>b??wIK81XnG}d4kaI4ya0o5OQ;zXM7-m9qVVF-emkhH`t\
-bCXf*^U`{Q;vic=lS>mv+WKB+V382p!CpbOLt}SzrBw>KtQ@}E@&len^RgT+vdt3IpwZN_f7F5H1\
-%eFC+403-^}ZzjPrm|AVa9$t9K^~3hk|l!ukbz@d|C$y}EcTyG)_g@0=RYr6}1`K50S7``4C=E7q\
-O&N~Xk9l_%+EjWY3YFuSYaNkS6&i{wudN*<7&B&=*CJxRE$b#NQIRMNe_o+#<wf3IHBtpMjE%|+=\
-!vY4&}CA`kvNm$SYorDFQ(uq1#VA0_aSz2E~vk-icIVH!;vE*UmFQIkm5wxE?2Xm{CdHxiJWQa*^\
-Croq9!@@NCKg{E8Oe3u|uxnpayba;|*V>BT?=F77JOBOchT88R@56oHSiZz@BIKqLBApt9mgo=uD\
-%~e{_@>sE{AR&VUM-TnZc(dXO8X~0WGAn>JP7Jh?9NBcw9271gXrc4y6WsYgsp69s*(K5=y|8feI\
-w7t>b|M4iLk5!E*er9lxP-)LNw|25Q)ZQhtwm=*RfP#^iZEBP>i6cbBq>;OpG3eQ)}W#pHf_nkx9\
-T#C?S1HQ8jKG8Gucg=~K$A{*Un66GuYJPfQoAq<%<9Vi@*|@g;`vc5(tp{PAL#W)G-CodgqNm=O=\
-Z)j3^NZ+62&8C(mgq!xTDEsM9UMRio43*Rtw4g81LyJDA3Hwaf#Gm;wI7?+Z~Q|VWt5EqI%V)^gi\
-fB*jb_us$&{{8pwzkmPz`|scN{*4?lYr?2uvr=bHm^!Xan_&sVMopWFo}8mnW2ZVNPmY~BEj4!bh\
-{+R1Yua_2I(EX;38`aZCr_I;J$Ce%)G?z{$Bd4hFf|sn9+5g`+&qir(MKPxYMG4+rp<(|XO0;$dG\
-fST!zN6fHD+e&^?ZME2aCnK$l{&X1^q5Z|1Gk#ySpntt_SHr?K5Yhuf}#tO&v33Iv!c-wAd-rW{-\
-&-F*O#ynHM{2`iN0ur1d5`r%aEXGa+@nwzAr9x2Z6w*iqw0%p8GcJ`>M;?1af<EYcD(Kg&!@AInH\
-fXG>#UKU1AkMxv_I#>UPWGhy8L)LGgJ(<hIZH)bYkhaR0HQYTEC8arWD>{K+sX*1E7r^Sw(Fs@Ck\
-rK)9E!ied^5LCysX)^-Bc+`lg7=)t`?9pP)N*&#%4Ox-c$s=ZtL!V3?kNWt3?A;HXl=J@o|7&+=l\
-B}#Ow*RA6Emn=JR2EaMB+1B12!mv0Wn|T=m62rCmcbqti;-j{j4Xvc&R{uVWe&^fkj!ybC+u<NBu\
-<C5^Lt!#y>@4=Y2H_#&+qoV-F|;=r`wHty`S&vy584yy|2G>%{A9wQF-}I*Dkuc;F$lj>r4L=9nX\
-JnCi$khC&kOhZw<WARcCx^zVfLP$D7BK_|tgV9ZBQeH~)Wn`mtE-HuL!OKHUAs)m4}%x`MuaMYDc\
-?cfsV7Cx~xl^v^n_b*QG@V$-zBrr%;w{@zpTjOFEPS{^#_ypqmXHO|woTJbFm=Ic*$b;iOtV^U`<\
-iu%(@IY(<+pEEmSW3U8g;zL-8Td@ugJ*zVo!r>UflTaI`X>M#T)U@`gow0U|p4%DAKAv{DX$L-xZ\
-rqC%`15(4v0Chy-WhAe-RF14wqapuXKXKS#yqx(y*LI3T|j$q%*@W1V<hvVe=vu|moi?brqy4@cr\
-l8#*l{K8!Kbh4jJ4r2a~a<Wn)dwloiP{w+1nW_!@>HmSK>7{cg8m3OADAUj4kYpb&O?tm7THrahi\
-4?Iwxw{H|WNz^w&+`XV{3BFJivWrCpfq*0cxFjk6Ya#=O{pe(Y7n^2f6=j0Lx{{P9odyG+yiFX@a\
-0@E2^uD}9}@o|kLd-?0EE>aQ!qlb3eJ%JJnp7%$FPM*FYTv_tM>IpRFbo2zN>VKM%+yfZcnU%rd^\
-!=BZwx9c?RxVt-J`546#bg$@)&BkZ38rxQO#u_kK(;3@>N3CK$v2->4<t9zL@gC+A=lNN0ScQ4)7\
-uMkz{1?u`L+|U1RpAl$Gk=(mA)J8`d;*&*=|8_?y>Of;sq2hQU94%>V>#}Ah~<VuA7;5>!y~NkDo\
-xvib$EJxXKXvxU<W>h4*KQm=)$e&!8Y_^uSaPI=3@w_U<4~s8?I^kuW&nXJ-YBc^x$6f;lYnFJl=\
-uL*otlV6WR(i&GtCU6(?f}K8CZg8JFQtxEAvQ43A^54QHb57}|mPScfIp=Lv?#QMe4J<64}L&3GT\
-S;YPF_t7#u&K2BZ3@K}zsu?Cmn23(6R*o^JihS^Ut{BfGL9P@D<mf*WM8+YO|?6H>NaTqq^By7VF\
-+SvXhn2*|1438slHqOFjxB}PWX7sULZ^MATy<-UT*0DZt0%~mM<yekwSc5&E?u>1~f!KnlU^_mI*\
-=+A)8rWX(9PBxYeu)KGum7kRHeng=!5YkchVfw$wqQ9%u?BNaWO<<z+prXE>*;@(kF_`pH{(*=hE\
-L&M9PljLLlM)*V%&}%EZ)F!z(=qFx8N4st^Zmt<~&EcPtvr}Sb!e=M?7%_mSF={<5q0Iy|@L3Jg+\
-~w!*au(quGC80WQ^l6csmM8NQFz7{vzc_X5M?B;18_u;<CFA1p*I$aan=p%-VN9~&@;dohe-USzr\
-9W0*6BV<9@RXd}bp3ar2eti=v&#6d50##-@I+=H!{$Nu*x9D@rQ+5h7kScN}hJ?6jM8EZl>ZpRP~\
-V1KQ>!t%y^oP}et3g==7>oI~M)J~z_Z(@7L6VZi}(1SD3hjTE1t=Nn`Hq+nn2(%Tm9bi7z;$(am%\
-kVR-#+}%JrLWSza5=W)1DJg(+Zh&O?rSV3JOjP>1=ivZ*of1b=wIl;y%_pE^LrZGI~L=pKhSP0K_\
-9LSv7KSgo3tCZU>o*%i*|F?G3agDjh|r&I-1!|vG5)GCysfS;W3KMIPQ-OkCV1AJZCC%Fdyr%1RH\
-QRevQj;53a=_?=d_UVH@tip88qQ`}9xjgOkyXW!S5Q?Ggvz2AqT~xDng+{6m%-XF^3-h%<01Hexw\
-`hBf#zZorva>7O_kqgaPI9JgOXFScMSevNx@#7CX6T+X@{VG;VV6t`mq7KB+Zcp5h13T(yCa1XX)\
-?inn<KQTNm!&3YjE3ntc437oahzqb48*q=Ff5Pxw#f-utbYm$#h7}mbT0L)Nc)S=}u@d*-yO?_>+\
-a(s^#h)@fF2xEAU@iWDjp+D{;q@H%;A@yWne~oE==w9m<6Nx3TCBxJY{XV<#l73up3Y)^KWDw-I-\
-HEnScV-~jibI`d%&f*1vlU>Y{8yWSbkW5IbSketlz=*i*H~(ZpS7)|BCG%Ct(LZfCJ8EyTD?M;4I\
-W443GJLWx5#rn*M+vV-%y9GnM>r?62@*bmMyTVk`Qw6N5OYjp6Y$jN+BwFx_)lo;%qNF#GRp2iPB\
-%;W@Y#7h*HsjcxcY+NN=`|1I;2J8?4Z#WF1Zj^%}g-_wuLi!Jyxwxib0cEEXOE*9dkI29*jInKcv\
-T#g&?57>g=>h(GAJnbLM_j&A>(247@6kD+ZSNy>8#sD_q&lo|+KUvSy>F-#8?Kl}HM42v@V+{`Z7\
-ySb(aT~6|y?Ehn_P6J2+Rf;~yU>H{(T8Jyq`i1Hw%|N$$KNool=Iv@92amD&cyjxh0CxW8?Xs?VF\
-Y{pM0+owpP&N={LFN59C~mz`tUvs;93mfyBNW3sLjx{@6drA`tVr(Z`LzDhRblwUfPW_umyeCj&+\
-!QA?FkSVL9V^bmMpE#n3PGFWiAa%>I@Bg@Z7PF3g!pzr`Z_8cVUNgZajXu^yYT3Af{R4F5*EFQQ+\
-f14neyZnVXiZ~fos!&w->c^E=JMsN*k7qfrnsx===umpEtId)(T4$FweHsBO&!P7Ehu_%^d&L#9e\
-bmF_{#`>&S%!{v~AKNg9eQdE<81pfTqcLX|`w=X{ZCHx)?Xg%D`mr8g!zSE;+wtQbv6yx#+Yvf2`\
-+!)?g>LlVYv{uW2C#R}SS*Ak7{M8+asBlgI`BPo;jiey-Ur5F&3G#|a{bkSt+*TaU{0@CEZ4*F35\
-)Q2EX6yq0)tqKzhEN{Jc!|OGVa0qF!u_s*RTj9Sc=DHGdxbiTD%Gy@k4CY>){^k#M~?C=La)9j>A\
-%%jTN{6Yq1s^aU-^3828{Wn0pn=tvAEtu~>@5Sb-N~EtX>=w%|7W4)@}?Lt?SK*&KIq3@*i)I4vg\
-@TZR?57XNW5%MoMPhKKfv#cWq=niKQUkCQQiW!Q<;`2Jx`7o*sU*B(y0aWUr3(X@xK2sdCUW*-rY\
-RpPN&hgG;4AI5FijC;|4B-6cy(?=}9k$q#a**G4Tp$FIE5^P34wqX=|meDWz#bO0G11F;o%W!Icm\
-KV;)M*MyN?Z)455B48OySZ*(hDG=Qmg1LKfhB`zH_pYqxE-swjvp|X{*NQD3723_xu)HVPJ98~xD\
-~y)1O4~|1~J#c_J+eTijy$sdQH0somh!(T!~(M2L1Rt263xCJVy25G4m*fpU3e5oj3vASc+bpkAB\
->OLEMR9?8GSM3}N^i*iO-jOVEv5(TfrE<LIFbkEIyKa*XQrF~`e#M<;fm8++$7JT65)1~7<kU>HB\
-cDDJ|X8#ymKn&EK<x^W$PaWnd{a2Uhm6bxe-M$v~k^Vy%H6MsNAo;IA}(T#qbhe2G9VXVU_#?W~a\
-`}+dcJI=;hd>R|^RcyuK$FQB;%yk0h<Aqp)H{)!)AD7`qT#I3B#;>srwPP860sC9b$6_qOX*e6pa\
-TzYbwb+c!Sa)13){fgTdm;O=Li#IyiKX~YtiXehr`_nlMqGrgIBi5M)`5$0K&7Uw!eV?DXW<)Ig(\
-V~D*O=#w#dhKQ*z*>)8!SM_32a|@6V~9JxB(x;7JLTVu?e#m(SNWIBRCa*!g4%p6vN|q+<@m}3zl\
-I!F30S}T&H6pzKVXl>_oO(tis$XO?w-Q@UK{kS`phL=Had-^smwE2XA9L9moCvU%_hZaY`)KfR~*\
-{KfnM+F>*TlPaoUQc#b<*KY`;8I!hQ1^CvMJ{&FVmyPff!&GfMyOL53l)&ovDhvkUBoXh&dlIhGB\
-K7T&LEoJ{#%6#Fw7tl{}_mvzM@rbK9F5=&2Gu`EEKUZ@ctmeE7U3e81-OKvNnK*b3)47j+gCYC^B\
-Uo?^{p^0WlQQy$IUZmW-h|pCns(f^j2B<WyhmBjI0nDLnfT~j_S<;;b?pDJ7&qgExD9)hvp>WuaQ\
-l;Nr`UnFTu(dKYTAqQ=+Aic4YX?=`%jGEsb1RkG{?Ui=}*{mKJ8ntX}`xN9B>ok!E4d+Ec??6#)s\
-$J%=WT@^@Nl0fd#bVInGlT(hgjYdCzN_y^?;7$KOJ~#&59-ix;t6@sh>#yP&3BT19`ulWt{ud6D&\
-ljW`=yaSd+U$nsgj`0@GM*lu2;Ut=+D$5}Ys$9y!>kCxJpUuHQhqaWcrnDYwzpXH1fFU3~;`Yy(Y\
-`PD4XO`3KCZpS9<z|YWeEBy&wIPh-z0T!bV*I)p@!)82o1^X4O!=Ci_%~*ija5C=2GR#{^|Hb>T0\
-XO0n{224}Pep229`tJmw&Urzg??DPn)$(Lm~#jFPjupHbmN43=qI=W>v6iD^^Nl}g7=}ejPp3m$8\
-A`GyKpuRxtIMNUW{w;==*607GXP<VD_CX-v{XTxCBeF9xL!Qti{i<5r4r}tay;+iB0HWJL*}-^2C\
-|w!#WILCx-B_hiEU3N9`{5L+HRJbm0#4V9$pc9!FsSFToHl#RzUjjqS7zJ=o_F>f@hrE#}p;-mn<\
-ka5~!VW`BnHxE4#W`B9ErxC{N*=P{03cpq-VHMkcyV%`eYBaXoioQcyOr{CjjtY4wu2WR`jR@{!&\
-0ou8e{SZ2E3%YO{dRFRRXrSFV;|bc0)!2;dunn8hR>O9H`M4WP@YFS|S6qS1umRWN7Hq~{*rw-C(\
-qC6`e0qxhgxk@LP3u^%7{yu~{S58K$+#Uo*nul>z-spYSd2OA*&cBWR-qs3aThjW&9h7wx1sGG_K\
-zFbPOuUu<2o$EpRooDpJRK*W!Q3$e!rLgh&wRb&-n!wV(;fUuHhIg$A{664H)$6_jBowSc!XZ9p<\
-v%-h!3*Io6>q$o>F_;WixgBI_5IU>^JP(HmL67{OVny~KRtC@f$<e>YCX9ayg0NINi!L2Q4S;~W;\
-h!uE`7Ft3*7fn%_26a5As#!3uh9qz=<xCggkpUt!j>u|vDH0>iSM%$~j3rAoT-h%bG5}WWb+>VXd\
-fxTX%-#x%}HoDM-9-N0h^kD$+!w`Oi5zKs@e)}NX4LWcUy6{=_;AiMVM-#*2C=5NQ-?wFWT#dFmm\
-g^g=Kl~cqnEMB|H!MIuPQf5vhhe-Gqxe1MKBQ@fhu9zCa4f~&VI{tgb+`vN<FRkD-0&*gi?3rI$6\
-?o7EH_+;vv31e;b*uV3*TnGI6hB74=zC;Hevv6&CC~$zz9x%hkjYldViO8VF#At1Ak<D!Un9xo!E\
-%)zDK*T@O|2a#W>(G_On=wUYvy?^x^0a*p6`lHshzb3o~2Tjvv>wSy+Jg;bh!}W!UFKjyqU_4fq^\
-x!7p$Z=4@s70LMctz-c%cZ6C2da0vQwE(UQkhH(c*abuX}`2_nPEJpjEXgB6#6;8o=ybhbN2Djsz\
-*nwFeGv8}C@516W`h8)B$4jvaZ^C+9i%s|zZpU`)z(Jod{FC~9Vur_hoQ3vQhQ|}J9?P%^tI)xDQ\
-9CZfPF#xvK4rP$ENsJ3pV3dB;@_B$^RNVWU>R2andO2HU=TwX#x{)Nwr%uN&bP*W&i0M9I1873!T\
-QA4F@U+-S>Bw7EyZ&D8EY{2OZI;_3S00hY{xpxZqV-o)6ejqSc<*BqMzXfSc}WC5!YiYHsKy@#oT\
-9DUs!}W5r)ShSb;@Yi*?wDo!E+f{>tz;26H(-ycmnH5=(IlR^ZaFSwFZ3J)Acd{f+s>nHa$9F@(2\
-a1jA_Ke6nvF^N)pCgHvz=R$vRdzF|ATS9j9iIN$sL$KZE36a9Z@`^Q(X4%=`u_S?mJ<-F64ZFno%\
-UeL6AFdx6d$@mkNVb-^7FE|Jra5Qeg<=BpOn9X@>5DW1woQi+Lay;%k+KuHHML*_nKKlte@f&pG`\
-QNj=a1QRlb(qU}ZYvhyPAo-tJN58Nti_Gkh<*RTa^?K@Q4HWgKQNy-5ZkZ@dvad<I!?uJupE2*lj\
-V!2;09ccEw};O@eR!8{5dnq{GkJ<;utK)DOiIaV;I}8i1X=V{zZH7F|5FsuonM>d7M}O4aeZD-K;\
-O1hn4tOtlMNf?UO4{{bVefu4Po_Wc1HIpr=2BeF<d)^aq3Lev3bQqV>+1)H`p=AqOq&>C;Z{H}2R\
-I^M`Z|U!p%G^u=$noTLYf^zvEyM<JB^CML@Daq5q94LYhbRvLext#{7y%!vp0$UK`V8@bUQ_tbcc\
-4tV69zi3+j<aX)*y*aouHjsbY?z%rQj>&gqWo2h{k7qmo^<p|lCr@WqJdWob{Fg(1y{R3uyN4gZ_\
-%9<LoSe@vhS%Gm|0ubhb12bleUjR7#vNIis}s|i&3Hbh-l*j9T${+3k++dwU~0$I?slvt?>nS3c2\
-aU)o@hrA`3Ulf`to?>K2tlgPD(6~cJi}^cE*lK9?v<6c4TLA4Mg5MIX@$j7m^=O-Y+>nFOg3rzjc\
-9n{N>~~ksp?vPf6r8<Z~>B-#|WVfqH$mkYBk#-M)4iepqsTY0~^>8N(l+oX<|0e{!!y`=(|Y?eCw\
-QPfwbE8GpL|6rX?cE67JC=W~+gU#5R}a&B}JP5)(#7V@jf7ns%`eX%Stjwp3DQRh5UUz^<BM{;cX\
-1Am>dqmuKPiQ%2(-;y7aoKH&RZt`v96O;2riQG%xu|VC|{p6z-s@HLld<^*s$$8TJg~`t%ADWzBo\
-HYOBQx~e&L5|%zckU;5?<e<4zQ{EHHzwwve4WMc!Tsdn{p8X8<T*X8bLW0?x8$n%^O9?o>f!zS$%\
-FgJ!~4mj`^j?-u+E*5tLD#5ezC>y-u>kM{p7*@<l+6~(f#B(J&jy7e@<+)7~Z{~+$*_iAM58YZ&~\
-C){t~vx!~A83BG-?V9{#dy0LN_hgSH1(nva#Mv%2Rq??6r4%Q=QED``Agzh>$c^nGmu^|o`&y-Pp\
-#UzRkU%q899n8i3;9506?x8<V5{<?~M0{LaB`)hY%egf2~qRwxo^|7aW8X@wF^E+eqjO4r{p6k<y\
-=xsQ<Gxk&JH2$8LhOHOZ8pAqc<C5##n8@>c>7PM$#%fG$xTCubCFFJFrzhtNlFom~HxEm{PuJJU9\
-@_W@c|U!f9I+x%=ggX{J8W6K^tBQ{{xKe>#lELyKY9Cp^6Z0*{Mh9DilpN|`8Y+c&qovE&pC$kG>\
-$R0MRzBi<HYA<h>fcHI;mhhgO2ZvZB1P#p~ST6sI!;j<U-RjpVz(2H<P<9j&s|{OBbd;SJ3ml2N}\
-o7LCN_Ai99b`)6OI>H%<Sl?tV3f{C@I#Q|IB1#5iVU8~aMt`AQXeTVZGH^5nj&pTkc}oU;a~;}{{\
-=3gf%lac(@<ANh5Xmy&1e%l!E2r0J~6s<GW+&uYvZk&`tsKEn9^kNVD0ov~+4<69RWpZ>G0KJwSe\
-Gucnt{&iPkeA8BEt+LhF@92>=)y5bf&rGcMMuxe2EZd;oe|Owvo|ipFMZMm3>dh(cj2)xb`#z;!U\
-RHNK+rgT4js8A4&R1=FQ|g_Z7+)dv?iw%k+ST<+srU56&e&A_`XG{0@05)0dR5f>phW7mrmv?j!y\
-+yaPPI5sEhV37ah_XYk?Z}!Cb|A7u&peq9rF_7*i0Rd#Wc2A<oYzqB#%#{XZmRj;3T)gVj9I3dHj\
-65w~@!E(Xc%2G<=Ms+F}|3i(H?EQ}XyUCa0f98+GbaubbFbFO>bNjSKfR3)K6PeDbFh`y#y!jfWW\
-L^q1@7+Hz-7of+MAwjE-ex5w)=q_5MVFVC(z)#>XvXiKoGPT9V7^!Bz==X>fDCb##h#Qf|b-%EZ>\
-a_&jwxrb_6W~F-HSahhdUsGL2mXi0VRFA)cJjWuhCGTf3{YLUUi|MzL53(5l9`XW<Jhu<mU>4_aM\
-f=H1_mfvhuAG1JVypQlA7?fH<SwiEC!a!oTylP8()=H$X)`L-+uYhdMy_8&+jcG8=Q>)ivxPd#^d\
-FIoZxcy%Zc9w3is>{|roXSF=k?^jx0uf+@@Dd>rtNZK;{F$TRR0c{DL=D2?;v;F(iwB5>=)+Ceql\
-f^%aQzQ)9|yphc6~yevA4XV-|T8`E91*7j!S9D)Q~*Gg8kXCMWIxsMC9qx-W#tv&qjlO=C)T8zcH\
-WEK=Xk&}jUGMe23!ARkZuKx!MS6XPhMPNT&%W|O~6?lZM<VfS*_LmQ7+EPW;5OWRi(7{@s3j7c8H\
-4T*dU`Siu=>!Mxcp2h0E((?#St68k>D+T1gp4u53n|$6>kr@AE^7_T<zEnouM4q3VUy>NUnmn{v-\
-Ip53UtXO4zE6C6Bd?`>7bmwb<yxwpI%^iI?;T|y$$GSCV<Guw^0Q6LXhQcgno8bAK0G<UEb0Cq`S\
-;{~lJm2Y?*EbRSggLcwt;-BBG;EeG5H&djr-ZQ>zAaxryZqE&nopY$jRf_Q>AW$Gtc;5sj3Yj#{W\
-xK8~$-?+BQ@$juMMD)RNDzXhS3UB#SnbkdLnFS`O*ku$MYMi#Fu-)wKI8+AxNEsYM&MF#h>nZTLr\
-3+BQ@%j;1PgpROnWu*!Ph6Qa)Px2Eq?@#}x`QRJTFYb@is+MUsL{?|{_<}Fc=BcI%}#CjZ)sZ)QO\
-dK_ist8cR&M-6q}_o>IRfn5LncdK!Psk8U?^w+KN{!d=Av@^EJls})i|J|Qs68RKUK0a~(i@e7jT\
-yG|~AuFr<`qE9l`wsQ^z2qyFsmJdpZ(ODxe~>(Ir#cUl*DP00KT4i|mwNg+{BPP_>hU}I-?(av`+\
-t(FKI`)Gzp2&g?aI&pimT-~)0KOZ?*H+>8P)22Xqf*^CLfWUU!8RS(_(nNkL3(BhJPk?n|mbb{Fg\
-dgtJTN*Qu44x8!O1)B0n`buSm3^mOMiKT86m|SsN19;G3zlV1;@b+sMmSsPAR%C7-`Sy`AK7!u1C\
-Eg{FL3cRq&v=N0O6?3wxr+sgF!KJ~nkJd^xV)A&of$6rV8TB%;fo5?4vRG+s^mi$V6|90cTq-k7~\
-IRB-NZ>4$}4q)W-SE~C`@nB<kRU2oKUwo3Bn~vXi8CH?6B41+4Z|TnK2OIOC>Z?uUA29q)spmXN+\
-gpS>{YH1j?lw(hS>m&HMigD4{!G(BzH^28oX17pXQev#ke{|vJ$@f~k;U)<a*stGBCoL+e}sIg#q\
-b&{?|F;dLH@bL_+8{-tNADIu*iMn1vTpJAV5BcydXKhJn8sPKCec7eH0-tCqKtD{*uJ}vw=Qbqdp\
-IEkZ-6lwxe|0kc<2Wi}rcQf3|3!k9?0s`vT-cR;k+;A}?B{ZeN6a!76q8w4s`|WR<#o4)Us1>h`(\
-F*ITsDL*8W3J|B6fMf(EeJyu&>|B~BQtJ@bLAGKQDKK;gT$!c}`9OTPa8}}E}-CJ~#KSn+}Iln$>\
-{>dB3&ozyIQeyte+g7WOQvvcHEb<Wf-qq^!k%&dEFLSTtL-l*!=iZp8b9VRr{zLSmu6|8e&;O$Lb\
-jE7*x)X0SADfpXj?JY<^WVMd<3a`bjC<AVv{r^!E%Qe5@_W_Gyp??Ez3OGYhkWC`>SdZcj6Qp>#r\
-;2vTwkWmM;m#3nV#acT&7X#Hr^-8bfj0gOdFVHUafkWZXxeit6rwNWcZ@w{JKQmlZ*DkTJ<t5AfH\
-gHUZ#`D=hv#2X&HG{t$LYOTjcsO&67O7Oo!iKxlBu_Tk$(tru}bFF4GR`ZF@kyOa~O`-!V}y)8Yb\
-Sc-1nUMc)2^dYM*{XFjN2ruF2b9#k*WCh}s7d^`E12i42G!y?z0d5z@pW&Y#!mdkuIbx*64W&Zc;\
-mCM}A3G<qV)XUUQ9(YK7eH0|W=OOj=RhayVht$g?O8)Fa>T}*427L4(^|gtU{I!RyuT4s+<9?(wH\
-pjGHFHPM4A%EZzbsK8QtI11JuE7?_=jV<3JEh2@sn=*<Ctd$gr?Ni%IO5ko<n{IHeQe%wn)VX;MW\
-%UhC$4|U+w0ZOGR`EA)T{4jR+4{KukHtR<gFI@X7Z2gEk6I0Ty-72m;C#Bbw9}~)U@l4m1jZ6@4J\
-r1kY9YPT>p(X-*48}(M<A}>r<Zd)7R0NN!velPG=nNn3i!<V*4j=BM+GJ2fOno^4Z6!+qj*4I{En\
-Iyeet?C%=jOOVjvU6VLx1Pk%2=xfhTbNPPZ5KCE8-e8VjA0rl3OZ}_M)tzP|1Ne=l;@|X4N*gs!u\
-9?#QB$3N=rv}nsN^6mR+OEwp}y&qM#rJix*Jt}RvNZpoF#<T8Gbz3UP>mRjlOC5E#TC}A=e~(*NT\
-fQhu+m`tKPwLHi%z9e3kxcI~^|We7=-)k*Y28|;obRcOXXNARZB~D$-0_cF-2W#Z{CN7$;q~Lu0P\
--Q^_vr1&N@~Yh#<MP&w<c}>)V<SUT6@VCT1=~&d{Ni59=XPHS|v_R`_f`sv&lbFOe_BR7t{LqapS\
-Wi+lfijTA1|t599d3Vj5e>BNo$`N#52qjZfyJokq5PkrYs`ze4iP$5TGzN*aDD`5=b>)U>~7>E2(\
-Ileb!ozlQwdfO?<2fqZ*FeLt#&{JVg98MVvss(W(ToK)<v7`~7^Y>`hTe=DHAUsX=tNbc2A@84&7\
-y6!Lg^%I*X(x2bx+oEHX@qWsO_4Rnj)#h!nCaM2ZZ`l*-Wxbbt=@S;mzY|#><VPmw(-QMC=0s!sK\
-khp(f9sl;S=1?Aqi#bL`SdmF{!~vse~r37HIWxQsUH7!@?lS^`%4FT(UTVUKZ}gvRnM>L@0ir5Z?\
-!)4_fJ+lsa~Ja6OH$O#@FYCS1H%0{@%*H7W1mV&+_Ld)$3D#&!x6jy*~B#U+UwxTAzi~*|JvMhN<\
-N5u2rwka`K&P)$6l{y#6VR?Vo(zQx@AldE-+S+rJF2-2S;xYj{e%{T7lx{FL?jc2j5PQ|k2{Imvk\
-MYJ7d)c7<|%*D;>C>nzTH$;;NMm(@1%`RmljgT3Sn)>*Ib0bCqRdRje=VsiJ>>Nd_IpZ2u6KU9&=\
-ds^Ke>dEsP)Z=d=AJSlP{YzfhV6pv^k87~l{>K=@tNKH+{w~#q{cQi#ncHBo{hw^SFE`#F?z&vP{\
-WG2)ESAL<@^*`5v5WlY26cbv$%WD{4g1;tsq_9b>gTbhl82vBUlW#-H$S7kCaodgMSiWRKX|(P!v\
-^wE>($e5(cdAyUcJ8C$tSH>-;c>2XS`cjdHg4zMt+s4eHSO5f6?DvzFvLrqMZEp_3C>UHRSiNS1-\
-Q}<Yx_*&#t>a%Q~a`IjR=&o5;UP{XFc`r28M#nZPt|FwMi9?s4Rt!ZnbiGgg**f8*k$=bx!F{ix2\
-^ou+p968AsIH<8aW<rj8Oqk{ZL@;#~T{4UWS>!|bgkj~hW)OL6?y2sN*oq_qCu_sc;^I+2bZ|c1H\
-jC#A!idk;YsGkRLkpKLQdb@Lx?|DZ3?68M??=$NA6h88QKcnsw0rCUaTipLA&t0!>e}w$B_3HL%r\
-?TiQ#_u4XYB7En`2vgad&qCG7{8BvnZ@`6<j-4-KSaK9z4|^=g#2mpxu)@7k@)=YG)?=L#WwFCZ(\
-DD%{>i_#$o2O_M=Wyvz0o@?mQUa`{e3p-_Jznlw-|qfe49nC>F=Yq$Q|UZ7VUGLZnR(3J`Z`=YW~\
-T$S_~i1e{sfQ_z?LU>n)!DA`h-No|iWrTa&&Qt-o8l-C`R0JGZ}EuYNXEe;0SZXVt^&@955ZHvKZ\
-x?=|e9jYG&kh~I0taNm0kuO{99W?XMQt3C#X$+wW-VtRhboA~|@`BBeV-2Wc0X@^<lPICKm>E~5n\
--fnW+bJokdf;z6})XTG$+^d*|zP$3u=RGIOYtanL<rNvPzpqKXytE1IKc81GF9-ScFQ}J?i~RBzE\
-Vh60OJ7j;PanDa1?%OtmO3>S(`Y7N@q+q0?QP^u7Q@^0ceB5s?w_>`-~56s@4gpUE^qz!T4o2;%U\
-gf{``n;<dF$`mc>6{5@(z-}{GxhZ!V`_(K~UvU@{KQAJpabY>Dm{q*N6U&`iR9e^mo_qAU`uXUy{\
-`S$$M;6FK-)p&PG|@o6omg-XZD+H>#I+g#49_>gBDSp=pOSS{(n#Ga4<9f8?>3)aUFT^2rwC_mPi\
-lOuwx3^${Syg8Z6&uS+iMnuliUtZh^;gEsO9`gO)$HMKF=-A3CaO&i%iWt}H|pDLexF5{nX%CGG{\
-4=o{|#_*RUpNAT4Jh!WjWz@NoI)$e7FtmF;RFmI3pfeUSO=DBy^MCT0jq2|gY|(#@pi$kgcgZ}sQ\
-~ULVr0XA6!iNLWKd%?R|Dms>fyU>-rgQSc6W0cA>cj@BKhyG(uN{<rS?kmAleZ1BUY7cADD>w#XR\
-K*iI=h#p{@V&gT*I`Ortx;-`zB}V&&74dZcM#yxF)f@@+NEA@m!;vm^!aVC+4-7I&)r9U$4y~zvv\
-~4`=8_&TIBWQGhR|(Pd1THvdFiSkA6wLU38EaTeN?`S!@>;?JFi9VKx8cM_J83xx-@kdh)|8hHoN\
-2^d<GaWjlG6MczUF^G5akzyVy8?A@pyzL@;GjTZO6$ah(cze<KzjX(a|8y4f&f0N_$jVYh)WuBAx\
-{+s@r9Tv+^{|%4c`fvXv=jSHP|JfX;ES8`Cn;-h}QSFoT-vY^dNqs*?|BaAgFR9N1>(4g&ziRqT<\
-da{rn1AvmR`X9@Wi|g(IaXWE|5Ri9SIyrn8D2GiRpe_e#$QkV0C|OJ`0Em%e~^D?F@M|1cUjFp`A\
-)0(KSzJJsKxw~hhMT-|Kw4t^-tbuwf@ORSe!dFkvkgI%V#@zg~ho`2l;%9e1QHNFpcWvQ%qiFaZH\
-{?UfpOh|KtxeTFgKByH@j0zS*Mv+sR+CXnzO!^A_VDa4zRxspnpqmnDvW<i-7s_s}Jd!@1qZ;aTK\
-=R4kwP_g~5T4v=@dBp-)=OuGK3PIIIBJBcCkEsZJf+hQCy%Q}dVe{XSKq_Ob7B%inM`Q>F@^N~-T\
-c>~nX*_7zNJvl)AEYNK7IRoSw_~iK<pY;4AbyiWwVOo|)W^})AN6!b!dv21)@oUokZ@ry^)a`87+\
-c`*{g&uGIzO_D$?DLG_t=g&oZc%@WKIbOyYtg5?<Of*{?<YUdA`g-uV3CK(dsyUAa+^i_a;9@mV6\
-o41lJBwDC%UH_`&8BaGVgR_pQsw%PyV&V^n>IPi{ZoMACpf?&Tmb6{}cIM{rCU$>z?b*FkcJ2oAm\
-kr`NlPs>9d-}iSaZ{H@3U@cur7{NB^CvikH>j%hrE?>h_l{?*EbB^s>eMKk^$bhL4cXemVVfjQV_\
-d$sc=J=3`-ray|-5HEqf(>iL*Ve&H+Xc9fBy^@@5vs>#o^7`}mg9Qkt7eB9bSANuce1zwT)`2EDR\
-^Pz9!QR;olweZ=QDc3cpW_It_b1z_iH+9A~nx^$k;`1N!*EU&v|Bw9jP3reLR9v9HYdrls3*z7ZB\
-d=m#cwuTA&q}m$Gj+b&Wbyq!@;_PRd&%Fn$n!X<eAyx&L*8JK&zzyZS6!V~lGkife{NAne)}ei&;\
-QA9+oV3X*hap}YW`(-)%5c&WIb6-e+>D2i{WRIUt=+R<%RlpQPs!HI`aRJFH61tUXZx{ZlcanOye\
-n2KdMih|B;WgINo)TpFPNW8jhKocBRF9xX3-5)c5*4<ab#N?<2o+llp#ofV^<9`k1WOX{Ju;VC&=\
-dF6tC-QlAU<WCwZ4;Pl_4(x*{CUQOONIhS`!biLPjDs`SeD5ie@E%{n<)pxOKE;4?DP4!vn2J%Mo\
-bkEhtpT{8og<M}3wm+U`TBo<j`CybfgR*03pGk?||J8p_k9=P0eX^wQ_7+j6I$Pb&(*5KW`^jtfl\
-Q&APdPij|`PUZ1@3F}BcSbEEFW{K?hW=i)J5Ehnm-l3?wym<)^tj`ItcJwCxa1N|+sOFR9UBX!Jr\
-B_LF4W)qcCli7;}h?mtYv&}yk@*xGTnP68_9>gF4s-t&F|07m-ftfU8dLPRP%e>CMBlRq5oFm8}f\
-X7SDnhlIZh3E1G!88PD{^IQ{TDZ?E3DD-k#7OI%8Mp^>!Dh);q83-3;Zk=$|3ZMNH@T@mDv*r>D2\
-4=&jCJtv;Tnea5q_YdnpNC-8P>Y>#O?-*;atw31i6(;53L^}T}cB=&22XX)>ARQHj*OVxS&{Ey*x\
-zS|jV(wFg&V)JyKO)O*m_a7I%FXsYD`=;w;Ui9CE^egiC^Z(@Q-k0wneRN9N`_A$6AL_07pfmQ8-\
-e>=CO6t2O1DP^Dy*(qgcE--q>ouN|x{SwWO1ttd<6J)68N1fBj6L1gwqwX2{!?eH-PA|_*1a#9Nj\
-~S}&e(CO$CiN^-S2K}r!Dh7>5S>`F|<ueYKuE*yEyFN#Pd&#b8aO4vk>~c6_d{+|4?66LsOR39}>\
-%IHuY{eFc$kwua|R*dEK=q`pAIG*_P-7%KJa$qb>T-EQ?%kNBd<){*u1Gt{-RK-#(StC+9Mrx2P9\
-?Kh*8x_IW>4{CzXj*-4!(sr&8MlCFQLv%+G(nC(&L@%Pcl@bPyI{x&x4_om#8<5B9U?#X+}Yb<iV\
-M}IG9%=|7|=A&HtWsv*<@^tUP(wC`={CV;Z^mTjrSaTovebV+%z4Lmj+mUw#<5J}D?Ty??-Y@z6z\
-=`h#_UL+Nt%rI;4plF6pX93ZqX4<XA`g)dvKW8FB9CAHNxmrl{Ph@f-$^=GtfQXyQ0arGj7j^BvZ\
-?xSyi!N?j<Is`5V`7pUk&-<9r9kj@oC<Fum5K3p)uwC#uoA@x$1p&?c}5T#FXdk*;i@WapbCNibC\
-?S<jUti$z9~CchQw!rN8?yro3*fAzwhQdZ)?;a-T)sLcYQxZzsRsqW#&k*{74Mu3HPqgXF6BCQc>\
-axm~^f%E|w=UG5Ey-*@@ekXQ9de;yTo|I=(^{@zL5$8Acw|3jVQ4paA$DEU-!)&0~QI*<D>bsuq(\
-PdZG!jNLMPx_7|o&o)H#-zg>^tnZ)nZ%(H?+mLl|Vjoq{xTfZ++uEd0D>r>x^kJrwUresQchJ^UW\
-L{?Tlb(O!f?{K?dS94NzQ!UiA-^wIy$_l#dAfUo@z0}aXFYlReVX}2X`kU~U>xt~s@KbwIr_UG)y\
-Iup<e%rJ@7wX`zxCf$CT~pbTkDegKXrVEtIr3flFvU}z5ghe;Z@7AhTN;j^)?RBe-oNK{!TgV#I)\
-~}3sYzP;p%J5D0$Q2>f=dHnWnvFkvqvZlc)P0O}zh;2M<?Y1AEEWk*nT^<0t<Ux$1o;LGn(E_Jzq\
-i4p;ZZs6`&X{=L@7*X;Xw$bDVcDQg+Wq9bClsJ;!~c0%eobfoJ#WftR_kQYn)Zk71wKl*QQlYf=k\
-=l+y*{HKnqZ!GOQ7WB3_$xF#6>F4uDo?t%T8I!n1-F2<;d*G_R+jB14X@B*4Eg+xOU%lU(Og@KP^\
-?ma)^4t2W*K0NThW;_-yE7Ze8_8AgBilmWPCnC=pWA)TKa)IvKrHs8zU>_5G%xSpCH4R7Smp!LpT\
-or8e?Z<cAZGa-Q7Luy4p5)xRFD@8OuwIq-~S~aJ<xg@o2hf<K=rYD8+qkG_43+F9wb*icb-?y{&J\
-vtUp0pOeT#f1`D+8!+hL{Ts$)V=^5%iYwqv_vMA~-~HBl#XP%Q25Rq5l{P99|(Z=^2AVAAui>`Ye\
--Qg0Uy@~T1VeY#7APj^nIx4}a`yjAWiCf}Q!nDqN!)N!}UcT&3V=gdv~{@3;T`|Q+hY`$K<&#T@x\
-+sI4ERnOtr=5bC#u6pNVKKZD@>ht;%^2^B6y>l}D`7im;<W}!gtfo$tL)~8*Bv1D}k@)p5`QlHkm\
-vcLH)_#(HImbW$CHT=|9P#a+Is;f&LsIW+<R-oUggTjy^xIzi`#<Dk$yM*hh+l6}XD)TLl<8#dPC\
-Eai&ZMK%{bD=$81fENJAO>u|0B;Gl72rGzyC*GGQ_ywY|A>%+>WH{mJ+X~EghoX7tJQGBfrNqo#o\
-x_SVrD+XiWJXpta=v$W`B4YbJLNRiAUTkq;XhQ~s`<?M9Zv(3tWwh<x%s<aeg7ucYsCPNq)9(3tX\
-lGG*i|hpLxR^^N+w-eStn%^S$q4^^KxZ6W`3sJbugBLAaB-g7?t<DoI-J39)<gXC84(U?k|uc@Q_\
-{v-KkL)H7C8uD#J)%)5F<U1|qp+$yQe*c;Lee!hgHi}>W-lS=Nx9Eq3<i8A6AJ?anADgc}hbbo?m\
-2dI+5BbD=bsyM3J}qB;%x)pC%(s|-^11oy^NuPRUcdgf4IZBM_p<`jS(-2BzWSYnH0QqY{W0~X42\
-#8P>*M-0sb1zKiRb?+ICc(GFYkKt`eEw+)I{zdroNxDo%}wFyo3DyVKL>iQ3Gz)v^$5zET4^XQRk\
-y!>UHKJ|BJ;meB>YOXBum%bNF!ezN4A^*x~9nw2>DLSMNV<3s_gf)#vW{<W~((e{LOr{-6Aj;nw@\
-dvIYA4=G6PgYVyMh)brRtUQnQ($1UXRK2$&ZwTry=L-}pa@%vu)^<1cFyNAat-&a*go$DCKX47(b\
-A+i0FXKn3_`Azv<iTi)#ZNt^qt~KOe505F|r?-LpXN&dNLY~bsQoT>FeWCu&zL@fRH&x`5$m5?io\
-jug@eRmDiJ?)s7@xHs$hbrH9=c&}RHOH#w*+(8Af7sOKdlTP(CGU5fdY={|&ps}ud|zFJ{8;j@Qq\
-R}^lxU;v7LF^0G3EQ}^2rO2x48dB{z!|u@69G((UQLJ#m|4p?`%=`tF`0<KUDXtX7W`QeZP&o>O=\
-MPZHqK*A^8iY@vrONzVpd@Y_<MQ%H&1*JLA;*+A{Kfh3fraHF<WS`kFVsKVGE2cP<vYS#R_Aj-<A\
-hC+>eyXGNj<`GzR@dUC7px8*L@v~LPy%4gk*$aj-pY+7FDCC>jB8~sK3{1^Fz<73L-z^x^(JYK!8\
-Yb0NKy!yD=N?uE@`cB#&@-L59pJ(M(Y1;P|?JpwNMyQX=rQ~}Q?br7mZA`zDJpMkla|bKmr&iB+Y\
-DTE{9ZlpbM#PlQ9&IPzI3neq6Vtd&?$32p>F<Y2|9MFK`iFccdHk8emj@}IDQu+PeIt!NXM1E&+I\
-PK_-KuHNk5n(SYVs#Ws^_(VJTOxI+07R6btBc=-!Af}E%KgAn8rx;IxisqJ^6&>{FbEaAM&p(=C6\
-$W<B{t9cr|&m#q=A<|1wg2jkksTqmk-!>s{m#i{;z%Hci_xQoYR;knb9)-sUEg|6-Ask!L&A_fV?\
-I$2is7Yy<i2PW3jsh5R0;dim`lU+Yw_pPoKVyLC%v><rVr5m(~*H}W;)pQPR!c`xbuk2<AHL-lTz\
-a`F@2>x_*_Jr*CEI2QZ$pTBxvzSGj(jvEs9|H(a0bw3J|Pj{-<bClfej49vAlykeLdC67pWO9-ZJ\
-3-w~+~m#^)W<n5`4Do|JCowS|4E&BCm82MwsZR_--*;jy~qjbdEHLF!=kMn<h#gK??f7~RDWk+O!\
--bEy^f1IO`~G5D^u5LY2rOKv#ImTi7CfReO{98FH}><SroH;r|$;pbQGztAzH`}J1M4oXKy?Cr51\
-fW`wot)7JWQ^|L+c?4_}x%zh@=g|D(=qMIVme|08cMvcBf4qfT$;MfKgT&E!{}q+a*i$UPSMUh>O\
-MQtvPGmTB4zC#Bz?#Lxd3ei`{h{rvy!BhAa=q@?qI#uFH=-tYLx?;maP{0sSgqt(aw5c#X4)$<V{\
-e}8mL{r(>=TDOk2xc^TcB3C^(?7CBb7oEEO9`aW#avyo4#q<N@>n!rno%*}-V#;@NMaZ|0R$tp_%\
-h?~DtX@A3@*_@GpLe*H>+i`^-_!Gu4?5Xm{$+U8J?I?rspPN5KL<M8yl;3m>G(&z*?%<N(VH00hQ\
-#Ne<p24j`W*-QPXIs0bX4y+C?L<<lJePrvCWR}+GeLxXFPQZOrN6+?*1I5oct{I9ZjZbyp(wUiM-\
-}y^|LD*$Tys<ejcQSJb1GD843L-qMtfheQe6E*0cvtw*K7FNu6fuoMoDa#6Hwbe$;y@?@-Xkku;q\
-O>bR-%bLw<<C4K*+THV(8{*S!QqF-$zf8b>Gy^b>S0D1f!BWE6F`HqqNyXog+V#;@jl#o9(R^8Uw\
-<SWOj+q#T=1-a^b9BavQ#;Lc#X7VG(sm~4D$n(cp-2Yp_K5C14+sP+C`#tqLD@w>$ytkkCe^BSm_\
-te`)HTiq*r{6Z>-~S}P`UC5J)k2+G>I_ajHXoWe9!04$ZLIn{IcFv7YpnX(-${PsSoJpKCckQ|^)\
-^&NoqNWruVre<?;NZCysDA>Ch~sCdD8uhR`Pjc(;u_q&s&kt*-snuYB=s%^yx9=%f_mYi!;fqEQY\
-VFG1{oQ9<3w4VXX1IX>uDE$-Zzi`5);onaS%q^FQ6|c^mn{u`%U$ulJJQO<&oT+Ml*2egAtE>uRi\
-ee_KpmNv`_t^(^v7Ec!|n`Kqzj=Yaw0{MlkThR7fKKz;8oLSFrWynk_gn)9F4Mt)k#a;T7baFEX(\
-t3D>VRvY^+)xO6=UT4vMpA4_M?hTN)TFpQCyJORzKg93<lK)I@_5LK=J(~6weW|Z$-;~q+eUg0g*\
-FTVV!zTBYZ<DV7?=kN2s@6jpd1Xub^$@@Qk=*J#Y#XR^FY~g@G_Q*j?>{B~X+QlbN}bcksrzJ(pX\
--}(*5fFmP8D@VCfAvh7)L4jzgb=<r+$C+n8fpFmDIUroch|dj{L@P>ixrJ^7-Q|o_`|0Yn=L7?7i\
-f#jZ+_!^X_FD<1F@n<m<`PeLp<D|0CaOG5*SX_4n1P_n&p-%@)(&O#TXawQ2rt>+TEN^!Cx8&P-h\
-gV-xG3gF3%hOk==(n)duwb)PLJe~!E|^>{ls>H3d44NT*V<Y^@R28)mU!*Rwv{dD*91LQ+aQJ>R>\
-$d5cly__TDOFvT2gLc2B-TsmFcVP3W^L04ocVwuuQ1*c(<S$w*$JyjhlHX#QM{nZ!7xE5^;n$M?K\
-z@^H_{8&J&E(@xQ9r-ZMm{@iy>IDR%Q<RT{X2pM<eS6l@4v=k8HZeCk7j5$+rP-r?#{Hwiw@R*I(\
-q6c3pIa+Uhv4#8T~HeO7-mw`yH7X?Rwb*nY{v;+D5&8hL#xDL7Ot{&-c()9$<_||F2;DUDWtA!~V\
-EkdoXi3e_x+vf5Wb|XD#LLzuN3y+O=2h6XW%VUSN+Mpv|>^cz||$#;Pp-{)o-K^8oEP+Y_1mqpqh\
-h+MG-A*Nl&|b{wGnTP8JdK_y3n%y%<CK3Ln^<DVJt9jtwIkez>gf3Q*EgmZ9~z1_yB`P-8jqd&E4\
-yEE*+w`;LX`%`wUF00=vyXLd$f3LRBGX|PM)fx8hZCWLNc{pSAZoBsH4Ex=7&7Woez^>2AD|RiEW\
-q-o1EwkT~5g#aTB6ZKT|B|KM$Y1WyxS-Ca-ESNAKg~KbB(v9Nvc&eE{crwDS+i*>>Fax7#^EOuhc\
-fIRWMur5(Tn1H6RSF&U#EA1jPdVeW_*>|>)TB2*OdJK)5HId`+Ki4`^pS$tt`v``M=EnJ#u(P_Gt\
-U58CTiMv_*+2{2wc4yR6R8d*{<K`Tx~Fd%5lFGxTNgzx-ExgQll$&C*zeJF~RkXWD<w(pG2L{Wh&\
-R%l?#2d%$i~&A&Ip{&$=9U4}ho(_YWC*V?t3Ec-Kd?Zd3!Ww5V!p@&g#+$nfphJ7VThW+Ut+E<zO\
-$9iZ#XWEzd&{k#He~539pV_rHv+Qr$wJ);l8|>QC_9u+(viER?9&f)tQ~PVic}B@7N=odFncC%hG\
-LlRFPRY}m@sdN^Go9b|(Eeqgxx0t9TJ|=%WAHNjPx?|iu{}duEj!M>$KwS1CpPUG{_;@9?OD5R+C\
-OY3#lwF3^o#9FZQ9ovEGO-Cb{jVB&snqM=`poEe(k}2sgM26zS@h2*`MsI?LN%@O<!$ouKmNl+TV\
-^Gxw)_QSl@+4qbAt@m8m_J@qWfVS=x%Mp~h};TV|G~t;w>#pQY{0G8%N?P4-3l?m{zd-$!TkKYJ~\
-IeKXU(GArZrOpX*!X4xCEwAZqdIykj^PP1R2&D*!n=AJ>>9Q!93T4RR&Um2|6p<3GAOLhSTrS?m-\
-3R4qk!%-PWjHhf_#_Ej6vohYv>h)2U_SY=a_NCWZp^qq>IkYY-t2yiPCvDoxHlxn1-P>}X<0zSKz\
-cgcUuRAle2QyN((fE9fvyay<?rOsSWZLn1rv1n-^v?g?ek4AQ|GWE=lx<15&HoR_|43i`K)*2Kfe\
-ia28QOCh=JlMs$^ZAyfB*dV&wu~?_s@U-{P)j)|NQsQ|BL@b@5+i>6fvCLVv8G;@~(5d2fxWM{d-\
--?zZ>P>+1+C{hCf*T)iByPGwdt>t{&JUZh!fAp4d+eNIpRR-F3g|C;1v*G}HKZ*ZHP@tzi%O_n2c\
-1d&$4Y?KIkVP|EbOx|-`ShLq82uB#1m<=+R0M~Yh>%rupUf0t=$=U!Pb2c}G~Qy!Dkq<&2P-PMk$\
-{QLbCM*bi9_y6C{s~ZOPNL%idCE*g?qDS<KKG81*#Gn`w!(v2?b}i`)!yM5eIz^Z07CoX@^of2kA\
-O^*d7#1U9RMawM`l3U0iZ0PDdPJ}26a8X942mH!EJnnrsAb9YMTh7VU7}m`h+fer`o(}46hmTIjE\
-GTDv&r;Dhv*btqFeNcUePD|#ef(TLt<Erh*43q%k)Ku=oDR|Tl9!t(I@)FfEW}*VpxobQBmt5(-$\
-40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MeP8YzUUC0qDyp(9?>iMM86migJMVwixDv@YCUE8qC<3wF3~M\
-|M6c)*{bE22iXky9M#QM79VpWm9imfoiEhy&dPSe;7XxBY42fYeB1T26mrP%Dh)&TZx<!xZ6@8*#\
-42VH7B!<O^7!|dHWcs2*bc!y~EqX++=o9^7Kn#i@F)T*JsHkPj^hJm06kVcQ^oU;3C;G*J7!*TdS\
-d55KQ9D?sFFHi0=n~zcNA!w5(JuzXpcoRvVnmFJT5p-Y=n$QvOLU7K(JT5yzZejMVn_^&5iu%ihs\
-g9rhv*btqFeNcUePD|#ef(TLt<Erh*6OPkAdhAouW&0iyqM{`b57N5QAb!42uylDr$$y^hJm06kV\
-cQ^oU;3C;G*J7!*TdSd55KQR^eq7agKgbct@!BYH)j=obTGPz;G-F(O7q?J$|X=n$QvOLU7K(JT5\
-yzZejMVn_^&5iu%ixiWpxAv#5u=oUSqSM-T~F(3xTkQf#tVpP-)m+6ZR(J8t_x9AbQqEGaT0Wm0s\
-#IP6<qoQ_%OkZ?}PSGX0MUUteeWG6sh(R$VhQ){&6}2N}`l3U0iZ0PDdPJ}26a8X942mH!EJnnrs\
-O8D@MTh7VU7}m`h+fer`o(}46hmTIjEGTD>nqb29imfoiEhy&dPSe;7XxBY42fYeB1T26pG;qLh)\
-&TZx<!xZ6@8*#42VH7B!<O^7!|etGJVk@Iz^Z07CoX@^of2kAO^*d7#1U9RMZB@^hJm06kVcQ^oU\
-;3C;G*J7!*TdSd55KQ5z`J7agKgbct@!BYH)j=obTGPz;G-F(O7qZIDb~bcjyTCAvkA=oNjUUkr#\
-rF(ih?h!_>M!7_c(Av#5u=oUSqSM-T~F(3xTkQf#tVpQaU)0n>K5S^k+bc-I*EBZvg7!ZSENDPY+\
-F)C_D$@E2s=oDR|Tl9!t(I@)FfEW}*VpxobQBfNr(-$40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MQx}|U\
-v!90(IvV?kLVSBqF)S%K`|tT#fTUcwS1Yr=n$QvOLU7K(JT5yzZejMVn_^&5iu%iN6Yj@hv*btqF\
-eNcUePD|#ef(TLt<Erh*41+Ces%kqEmE<ZqXxpMW5&w17c7NiD5A!Mn!G7OkZ?}PSGX0MUUteeWG\
-6sh(R$VhQ){&6}1AHzUUC0qDyp(9?>iMM86migJMVwixDv@YRAa*MTh7VU7}m`h+fer`o(}46hmT\
-IjEGTDJ65JIIz*@F65XOl^ol;wF9yV*7!t!`M2w2saWZ|;Av#5u=oUSqSM-T~F(3xTkQf#tVpP-$\
-W%{B+bc!y~EqX++=o9^7Kn#i@F)T*JsHhz;(-$40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MQwykUv!90(\
-IvV?kLVSBqF)S%K`|tT#fTUcwUIJ?(IGlTm*^HfqF3~ZelZ{h#gG^lBVtt4oHBjUAv#5u=oUSqSM\
--T~F(3xTkQf#tVpP;lkm-vK(J8t_x9AbQqEGaT0Wm0s#IP6<qoOuSrY|}~r|1&hqDS<KKG81*#Gn\
-`w!(v2?irR@XebFI0MVIInJ)&3iiGDF42E~vV79(O*)QV*KqC<3wF3~M|M6c)*{bE22iXky9M#QM\
-7og~v29imfoiEhy&dPSe;7XxBY42fYeB1T1Rv`k-gh)&TZx<!xZ6@8*#42VH7B!<O^7!|dXW%{B+\
-bc!y~EqX++=o9^7Kn#i@F)T*JsHlyR>5C50DY`_r=n=i5PxOlcF(`(_uow}eqBd5hFFHi0=n~zcN\
-A!w5(JuzXpcoRvVnmFJ+BliM=n$QvOLU7K(JT5yzZejMVn_^&5iu%ir^xh0hv*btqFeNcUePD|#e\
-f(TLt<Erh*421mg$QQ(J8t_x9AbQqEGaT0Wm0s#IP6<qoQ`IOkZ?}PSGX0MUUteeWG6sh(R$VhQ)\
-{&6}8i3`l3U0iZ0PDdPJ}26a8X942mH!EJnnrsGTm;7agKgbct@!BYH)j=obTGPz;G-F(O7q%_Y+\
-p9imfoiEhy&dPSe;7XxBY42fYeB1T1Ryi8woh)&TZx<!xZ6@8*#42VH7B!<O^7!|b%GJVk@Iz^Z0\
-7CoX@^of2kAO^*d7#1U9RMaNQ^hJm06kVcQ^oU;3C;G*}#4OWu9Fg%oET8{~$)Ajrzjyt&zx>RJ6\
-UR9UF1YgMc@;N1#*Qc&;XM9?o8$jFVaX`x2xrlV6OJ*;_x~(P7GrG4Ojn+%ZAn|6)&2aDx!l(M+>\
-yE5-u--%xx7dBb3W$s1G=9NGMD%4e$L2Teqi_WNapfh$xk>Xl^>)z(w1jy!HMb057t6y%X@3CyV8\
-{((*3-bxjaXIup&+Qp<2Vlbme_C-!<vV57V~%nyx&z`?)f6`QhEqlbOqpNc$X8mUg68Jvd!?UiWi\
-i=JLL2`+JtwkL@^JdH;RN^geCV{uN6t*Po}$OtYMOOSw0t{3t08rj(x?pGKlRUC-@JivNAz<#WA^\
-Cz>*zTjKTiUCwoi_J27nefb7y&-j$~ydM914#xqzsr)ZeenLw5zomRsN_qbbqx{5_@>4R5`6^js%\
-vY(DFP8GBUpLCfN_mHruU%)9KP%;DWE$lWseiGQe<bDSK5dj|9*}t4NG~7PWR#yT^>3B(RZ_l0$_\
-Lqu@`HYFl;0%fk4yOyDZg9F&$1ik2fUHh-9O^XS;~))@?)g@pdLo~=~Dhq*YcNg+aJ1~tCRk4fGm\
-eUn8*JYDc>mN<E4CjPow-tDgRQ+f06QV$S8kC%3nS(eLHh|8RfUUX_QZq@;9aYZ7Kgs$`>7El&^W\
-qC@+&0KP=lQ@6~LS-zoLCXQyv}$-zeXJyL&GSNo;>dnw-|<xRbf@~_^J^(fQ5@erf@(mxvIPe^@d\
-j#1tz<*#<NN6I&CG0HEO@@0n_<u|@(lo!hQi~AVmkG|ja+@tYlx0D|t^)Hd~m4``tJ}~#gzPYmBk\
-n*82{`aN)lNNJ7x$SVHyzWDDJDo=u<>zme?MTM+FDbA2$S7}-`oSZO^1UCL+c`bYD4!WN%5RkNZ>\
-9V_DL+xh|72gIyyH(s`9LW@yPr|s_Y<T1HyO`QQhr3Mxj*09-zd*-HTT0kQa(+}&zAC41B~*ATDz\
-VjmDBryM)|9s8s+w`<sjv6d}f~R(m_Ufi<F-r<(Y$}pL}MX?pi57>(5dyhyM#5>D#|m%4`2(lwT<\
-IR~(goy1j-N<?UaX$8)=sAHLlvUncW4YN%2E@R#QCY?Sg3zBJb_&rd)8ze&0KEA#wT9i4vs9a3JO\
-Qvb1GM)}{R{G6`kAmv@pyLUa0e$~0w$EgX5<J2dL<5a8SIQ6OGIQ3ad`M1N2a?b>#yz4piAEn%vQ\
-vREi2U5xp7;cn@QpyjN@<>Yg04didn#+evxg(`~l$5(t%1<3`Ea%IX7~dywcbz{-`N{^P{5UE9S;\
-|}PHp)Mf1#wn^jOQMs{3NMgE#<W-<y)lum6Y*MKE^2jtCV-0rhh2q2R&mm^^@_(%Kk^nZ;<jGQvS\
-!3`WGB$l;^HD*Z)b%?^tiHe|@1G2c>+7%x|CLjq=^k+D!Y08>L*^V3c>ALAFSFe<|NA<&`63zb)l\
-{DIYe{D8K4C^Z2W!eExIh@$Z!KRnM8n|2wBqe#Z0W@lQIzDF5_%^Z1{U^0w#A<L^1jD33|`3ti^}\
-QvUo4Hq&uo+KK6x!!uHTV9+Q(qw6?QB>QbC|D<cXILRnK>P4e`j4b~br2L|dMtOzQzhZRy<?{zA|\
-8S#uy4Rg-l=pebJl&yVjPh@!{6d-TRw*xj**x7l#-?9xUrTvV>c1@IE5;e+SHEI29hXO(Vw4}c$t\
-W+7>3%KcV>cV+O;W$M*eGv)#oTX?In^ltN$Pi<KfEO6lV3H;f0lC3X-4^JubJC<(CKo1_?o$$8>R\
-fY*Ujy`)+PO_$=uFC<Bjs^ubcbHD^h;%@6GL;I6;=Dln<8i|0v~Ie=y23rToE(M!7v?lyB?Wzm*u\
-}Uxv*6{7orum-4|<UUY_0p8cj#ewviOC*@P5ysu2xJ4v?Fw~X>1yUx?jG|FeZZJusG%4ffAp6(Ho\
-jq+tu-gSI@Udlg`@{{F!;L@|ww?8c9J>E6S&y@O0r=*|mUMZip#aw>f*+%*GQeG+Zn>W=c-}#=o{\
-%R?=zi%_0Kb&?>`tiRg<tsk0na<}YO-n!iCMj?Ez?Sy>;m8(q|1UjP=2y!5?&tdb`g8THkJg;#en\
-q<ai{n4yvhV$n)$#G{d!OMEDc>dKUEe?36mRFg_hEh?FW>jR(A)9x?0Y|?MaG|cA7fj*eBb*aKTt\
-k|<@0%4mT5Vk=r+oK{*!t6yQIAJV56OfbS*c^`=q&7_XnxpJk}V`ASv&2o>4w+kh%OEDL?*Zqr7X\
-J_e=S_znj~6z;vU$<sVty_f7Oa|B><|Cd%<z$}c_NC=Y&T)IYpy|0(639p>|p52f6_)4UuGE;Y($\
-4>guU*Y^dlD^0%~0#bj}x5jjj?>cY4K(F6h3oSIp|AuU*eJ?QTubF0)50&~iNV)3<qr61QzmW1PK\
-R37Y7b!pDV{`cdGo<|~%h}ac-fmu=eJ(W0`}8sDkC5`yr2NrByJ`QnO3KUn+fD5+nQ4?y`B3&tUE\
-7P4zd77)YR?WS|6#Xzz5h$fUD9tCb!`_H8Rg%}{7&w=PM7lDKN|JV>)NI-Hp-X8Y^M7a^QFA}Z|3\
-Wl-%0roe>YF}u1k#aE6R=W%#-q8rF_nOqkMVSb=fSV{LqWc%l}O&pLCMl)IWcca$8@c{L`-O_flD\
-&U)xOEW1q{6@_w!6^?sg|dylr8?qhr^<u%g(yZUGO<wkjrh34(_c_}YxH?Nm(q`WM{JYT)8NWUFT\
-=_=nX{a?yIzass1v`6aCJ;H9fE;#Z^qkL9>^Y|xA`NQX!+kdZ=uRp|Yx*zzKl=taxzV7&1%D=2J=\
-C|v6&y%i_{o9r1`Mq7r+pjRnhjkslq&#P?&9vVroSlAtpPFsdpU`IB?%tL1V|Sac$4|W4D8Fj3F<\
-%#T?Kh-6ueaTFefPeU5BuD_e2$uvzCDxX$o6ug&D1~FNcqgujq*`l$JuL)^4C(1FO#JF;b@j=x~r\
-tT_pe#q_qF5K`(;M?^J9$hySlb7DK9?H-2S_-HOlL=&C6}0ln>gQW!gV{CgtxAH}{{T=F0KqO!NA\
-^LCPl`X*2B~uDi}Cuae_JS9@YoUOm)2{?c-p?r-Mf)T2_qXqb7vI;4D-)Sn^cbFMeaeOt}rfBpLO\
->+x5qzr4ge{@^^>uWmQWukIS)25HX}bAKKq<)2+?zHjj84f<ITXIpX}lGAnFC-w7P=IM_18s$wR&\
-Hbv{YaAaZFO~H!=aY{}{a<f3*WV`PjvvkI{oosAzx0dwzSAXA-s>2nevOR(w)w_%=RIVU7s`tfYU\
-dmEPnvIT{|8dOtH4<Ax5#)}Z!*e@{$cL_BP)#Z$brUqHg(;%x!EWmH_qJOu9tG(Kh4Ye9V!1|h*5\
-s7lz*~7&g)|4<uG}nQNBa^v$yMhl$7Vm^6xtCJ1dRyYY#W(YeLukZ7E-oX*X@}o1}dDspjqU+*{K\
-3!<DzldDmffQ@{GBl=nzEpP97CDF5O}yXijCi&B1UnR&h3x7a9OdA!}Uy?-R-L+6{9^YAL8eB<Hf\
-@!TopQ%*8p7w6q-lz%<Yd>rvec_3wbd|AqeU1MG^2P`rA+aa$S{bZ{2pD9a>`ltPtWjelZl=A0)H\
-J59*rC-kH-zNR-Z{~jZ+->RG6O(e=X!H5l2|lCzw;^`Ze(z?V(f%0^8slm2I&YWyb$gBSj;`yb+h\
-xD8%X~ik_U-B0f7DVrzdF|3o@=Fi`U&Rab=e(8dFA!y_1hrj^E%ASt=}@)?_FoqzedXaQoi|WbAN\
-tW%9p0}&(>w>&mZ<kd0oo!`m#HvzeUXF6-%XjYs&S`w^F_#Wq&emxl!Iz-aOK^JpEGs%BAM>?aaI\
-6ymW}UpPzb{u^yK!lKWk9**Q(>4>`;zKSJskRLgnbndb5QPRdJnn~(3EQodle`FMBw-9~w#Y<HJ-\
-eNKIM`t!Q?q<mqA`F?W73Zr~ozOft*>-rp7%6}bU?mr8q{M|zHb=;Fu9+K;|uJyQ8$_wTEs%t-KT\
-PerKZ_L*PpGo<+bIsRr?i$(eU2DF7xLeBS%Kqx8uKQ7|q+iK?vg`iF(^CH0Uybqj{;&4F1Te0u>c\
-2@_K-L1K6p&JO*}}Y8vVdaSWD4oD>6oN|xI8A4nPli}otdO9DB=enR75~z6A)1WD<Zf6A|f9yAOZ\
->k0zzd60Ran0W#@mF^X9#C-+k-MByIBNlP}?yx88T}xo7#Eb2Rx0_?MoUimuagHrNH~G_+53p96a\
-4dmL}o)+ykhi(q}`9>8aTe9+?EL+8SJS%Tm9H-Mikth+<MDYs`Y1^f<WI<lw!2>2gnPe<!<`FY@%\
-*dIUV#eknb3-41;0)AZ(?<4zui{qd8B!3>Qe$f4ZC#O$G@#r1T=lHoZusyOj;6ni{2f6@%V>5nyS\
-c{_po)`9g<pNkQARn}K*9G{(53v4o8sO`e;PrAn;74qQ=l?5!mk-3_)_x(!S4Z&iCBT=0o}k$mKL\
--4z&to~T<3)0L-f@w9-hNfXJFy)x?P4yMZo8V}e};LxC*W6{kK@JBi}`gPU55SDbG{9B8SMKHY4Z\
-f|oA<)=f9)mw`j=e9uYZ{4Z@GjY-zVq~yI;!j`**^A$mM_^_dJ%{Hv`@>iofG}z~?@Vzx$q-aeT@\
-S_`WLO_Y3;riGbfF$lG57e%yU{o^1OakOOaEfAxickA9s$PbZB3hu@(bi5XK46yl+?FXzYK{W^Z%\
-1mH7=@biEBa{2!CZ@}m6IUU{i=<mX~?T!6QHvoQ|U=ObUu6!PDdxd;|4*@=!#D0|#z@J!;_wnBVe\
-lOUSi#31974rLrzX$t{AeT-8{0!KSwC{c;;KvL4<YwQ8?_0#{@j}2q`~sFgw*o#O%%9DF!13L4c-\
--<o;PZbjtS@c;yadO8{;jE++R2~yN{-)`#MfC4_$v={TuW<T1Ni?I@$)=?rF=iy`6}3F@56qo{8j\
-up7r=9VQS&Rp@m*jqWHi4A;FVtdod3Q`e@Ej#TV2hsf8EJgFPd|;{QG9FhW&1H>{p!kL-1D!`phc\
-8-)zPE=JSBxG6T<(*=u1uoB8p_!@6ku5zJ?ppPD^&D&Vu0W53glfM2v1mjBNJ{^Omn9@TXX$A7pS\
-ua`>!-|*2?^c^q!G3--^^W!f8ymBqrBd>FOK$EwCe|R{ax9?vok2@Uj6IgfK<NdewI`9Jv`rC1UA\
-NLF%|22T0{yJXow*lTF=;4Q6&++!pVSmW=*URU_f8qF|;QtK#l;h{Y{(BYR3x3A&{|NiV89$R>|5\
-`Y{RGEhKy)AzZa^p?x?>Y$ZPn>|i<L3dNw>2Jz(*Zwl5Byyo1^ndg@q2Cm3y!Y^Jwcm4p9cIESl5\
-~!l?VJg|DB5Tfz57!>%7D9eY7|c;L3mbb(U%SsdoHIJkOhNl*d7~1N_5xv0nNGz^`3^-}gMgKk-G\
-5-=nRIo8;f+vp4bMe+PDu7FRk4@b}aBIiCmoMOa_j`yTvDj=uo@NsaIKG~j22rz1W?^UYx2!G6>Z\
-_<?|56T<5~0r-Wl<MH{y&GPs93mm^|H<q8Pf5q_!K7-}?n}GLxfc?5J-2!^fdhCDr<gdYR_5z;&x\
-BOaeXPtE`e3uXLeg6jd*242degpo8&8MUBd=&7zLf9VM<~Hy%?2Yx|p4;T(GjJQ<FJ@iApYt!89|\
-^8==GORmZU=nb46LW^`hOrFz@MhYeWu?|{j27GcDWtqRRH^kPXhd>k7NDt8o+<P9e$pzehc$|b1Y\
-XwfIq*1zt@GD-w*H$mf`D6{T;}S{rGiCn%^7n`<t<y`>o&cal7(De*L$!I5HgHybJJ5G<)#(Am>A\
-Pov!}__#Zxt_5U~T0J~3+=f~X%dfi*o5YPGBcgppv1O5npMX--nYw_Yg%JuwR@8bArJ7V6#E`I{Q\
-#1d@pWd9_eS2x4)UGHLf_&(rMpTPT3{BHSmzH>MDlV8Hmc?aMZ?~47&Ke`9(@t3hbXYsw7-j4N<*\
-q_1w+=lm;J^upoLGXus6Yyu@`dMwCy$|N+2Y4U38t^YH#ov98`(YmkKZ$1FodNj5XR*KNZon^p8~\
-Y(&1N=F`jyV6X;MaW}>;GFkAm3*X06Z%AG0p(|{19HJ+dRnUznG8E{vhZZN8|N-F5sV<hW!}72K>\
-M$@cX_DcwC61-SiOX!#iOA-noC1uhaYfCZAWkJPi60$R8~)V;SJ9=Hv04{s{P~;Je(Q`Kuq{<M8m\
-8Ievz=Pr>mI9)kTpzkNjhJdeWhX9@n&10IEaXAsY;?>-84#Kph^f%$w7;BQ0x_cGA`pN8w)Iv4M!\
-C;c7v@m&S}D&YBpIDQLUKlB**8wLOTHy)Go2X=fM{5iW}`CI_}vHwg%cIeUTK+l<h{j1jl-aH$B7\
-v&!?KWF3pZUx}C3UU9n|B(AR_j&^Ky&N8gBLIKy9ge59I4|Ifr%gk0;2FUChw%LW<C7qNzJQ<qh^\
-IJyln@X458#(?kL`{<o`&b#hU1^o;tPP^KaBO0C!d!4|33u$!(sfK+dM1x=T`u~I)(SmYXN^_CSG\
-?R0)7|Rm0QF7`Rj9_kG13LEO}n8f1V2XBcI2|{}b^2zJT$=U*Pj!<a?j`0>rh2IPCR+w|C;}H2)L\
-y%meXvIR@~%!&n|Z2zc}Uct3jNMfrMfc?rJbbUZ#yFT;Em^vM$7XYPRa<-Y;ma}?f}d;TTA?`8i2\
-`L;8jS0k?g&*6D|{iguGd_9)WvtI@O_I7x^9Qvx9Cw9cE^5+?b>)baL?>pxM{@5;9Zrl#nf8_#x{\
-frjBhT|W8A3y)oufaY7{$y>v9Q<#N-|zy~&p)vq`~xen-=-Jvi;8$YoV{NDUe~Xe^9h?@2S31m*k\
-8288ys&1yYCm8eF6Bnz^l>hk-2YzofXC7e<9!}e2u@?zM6jk@LurSoTKS){{cPW<Cs@ae2e41It%\
--CF9H086YzTZ*IV*&Xx;$#eHzc_AmA$&<9S=$Am{Zh_%9p}*EtmMV*x*E7wpHr9q@C3SEl*H|ME8\
-Y1GmTiht1!CeL>KN``?it|BZL}Jp9}(I1c_e9DlmtkKO%UIUjGk_rTwh!t>-#z%Pb*qQzfUzR&Sr\
-k6=0f`}gI3p?3g3<tXge+VBDBGyCKDv)6}mf6fr#Z#;$d&vOBP0PGiyuekL`9Dn;zyf4Q9za9L;+\
-Bh6ErAa!UzX$l57xD9K(Zune%*6Uk3h+HP!+PeEfQxb4_GXSh1#wu-o?Q+2>D%D%{#(F*DA<opQ#\
-l^q3E%f%z;9ZN^LHwMpScsZ6F)zV<97>o_xXT}yssw#ze|XZOr74u=I8n6@^RDJ6I7=2<5ztKkMo\
-}Z|Ndk6yM#95*I9Ea#}hEmkJ}8!?QlGA{|WdlXHG@yx@~igpLHajw?EpvNh&wU2j=|4+1Rf;AMjC\
-Op05P_#}JRu_z8~zF8Xh`{TRph%X5687KZ}-=~g`c>j0lIir+V~CC5+uH_lfLZ^iK^UcuKH2E4f!\
-<39!b)(<d`_m^99eBHzNeb)ni_YTt$Un0H@$7c$5#E$_#a97NmI$~RnU%BOUBp<rA<M<u-;(65rx\
-N;EIKQ9D4`#g?E{~hqJwc>TU_Y95?#IPS=G2pMYV?R>c_8gz~8s66~0(`-7cs~CQ@b!n{@0Hqt<A\
-aZ5yW>K@@7e{=lXG_D_>HjdjB4{7@b5f>{juB4<oM0gFkkMUfG-38zc&AO+DShD(>uZV94YMYfd5\
-&T503*Le30XJX*{u6eEnVwbqPSMOzEBl^FNLC|CXI$eWmgIOzq6CbIH}%Zdwh;zbo)&9|Zi33?Bc\
-l%;tFCNBF&70Q`PIer~@DeE0w0cx5Z#?+@bZe`y!_c-{@ii+tMG0N+>8Kabv(<0sF=eunsNO;Wzx\
-Re*1J2HO{Z0{l!NUfJ|<O^#vzOgG?Xej4xB`|r;22ZZ^&3h)guuQa~jJAlufEyVZdaQt||pZ2{u@\
-^Sk$96xPWypK=cqe;pKJ75p_b-n|~Z?&heF9V(iKeooJ>6_amjU(R(_&%^NX#44Advg3aK@PtM_$\
-4#(KBDdg@&VSb7MEECc>Hx7m;3|ZrD@n6nX@<SYfoXhbO7MLQ1G}d1pLFV;qgBk@D&f?b-npMO;S\
-5+4&aZ?66QbPB5&|Dz;{hyyS210$3Ol!&O`Yw;3waU=l{<Ee`y_-+nepj@v{ZL!HIxBvn953bNh3\
-A(Yx5Ld<5`UKfr$b&wYa96~QjP7w~~@ESD}gfaCo_zSTDm<oJDAJZ=vGzF!ji*#ZY~{08u2@2~j@\
-0pBu!^AyfHNIw6sI7qH<Y<)0XU+~}Fda!(51P*DE#`{u$zYRPMO-{Z8_-T9L`M+li$1fNBfiJYkp\
-FemgKmId=cwblpcq{CWS|0JufQ$UDX92%3iRVu!0QwBfe=QC;tZ;m<k8u7%DG2(;Jgjf*9s)gi1D\
-+>q06*<{JfDkUST75)zHw5dN$RhA1MtV+#r%O|T0xIG4D;3B0Q`S|=da26!`eWOt;BrS(*YNG7q<\
-Z(1|Fbh|Goxzd;_k#GQS<>|7KWTEeHH-LY~yG0KZb;JFN#iKO2w#ti!-Q>c)A*9fvnb?cb9Ce|L-\
-N$j|VNPjdV=fgk=j;I}`C<IC-z;`o<#!|~+@KP8{HvyT8h1lG|SO%4Dq`q`R4&GCo8-*t?(E&$*5\
-Q0&j&ai09X`^^LW|6nX1762~#w=V^J--Gdf@o&IydL6I#{pW+e8pJ&RE9T4B`(1!PC-BT?E`aqb#\
-MzGo{Fx4X-{pY63-N1B9`4)8@oxq&&*2=v4;A=A?{~__ZHF#?e22ix8UlQs;1}wM!ag_$`(1Zm2;\
-)$|{K+o^J`e1D&7XfW;9{KdDZo$P728Mm90~fHke52`D2~s5XDa&c2Lk@ZgRuUe0Q@gP9$8yA$cN\
-*EJQ2Wu*@nk+??qfcKl*2&PlCOF@*?=|Ph!1v9pL>TJl}SW@#{PXd;k^J*O4*UU$(*Vpz8sjGYiX\
-yA1~&3@l8BF9|3;h3E1wK*2D4RX5#gATaSF6tm~2M8}X&`<F8u^`^Zb!zPlg}@0G%SiGRlB{*z-r\
-(<J2=T?6?3`{VUKyO-nb-T3&^0T=mQHvs;SU^jieuSuHka9N*RpL`DR8xF*Bc-wxC4-5HyCjkD25\
-I<cD_}UHFPx}JkO@jTUE`#;BGxlq(I2z<t1=r1Z0Pu6ahUfo#fG<7_^GpsuM*e-59Rt^S8t=0|0s\
-O54@%Y~Z`1|i;f6KaK!A^<u<4@4^*w1qOaKVmy1n}3k!sGe!XZiPf^bC&w2iD8>$H||6;5b;1d*J\
-I_a-95oZ2){=R~$!J_c_p8Ud7|^4&bkJV!Lw67eLP+#_RO+fDa3P*WUwv%RV>{Zu2iTN#nu^z=z+\
-Niq`ebfWId2*)~(<<1?r>NqKtb0sh!O@caG?@CW{k^W3*Q9`>&X@pyJ0FP8(C0)9vjo<Hv%FMrNi\
-3DDn!dG!I{+XnD`cN_q_@(pZnt_FM`A%6W+z}Ierzt`J<AF(%n&I6LLj-JAGX%+%L635rM8t`j(5\
-bOfL=L>ZJK0PRx8(#+eBq5LKX~4su!s{rL;`n9nVf@d4i#(i9rNQ47#QWL^;OF0q_oMRw7vm14A^\
-7eGVLt!GfFJe{_Lr_2hJELKEU#8&z_0!uwl6LP{A$5(|0>`w3HrnSCvdz+*w-!w{M^_0@jn3kEx-\
-fM;p=>2IgHP%nBQ^?;CCK@<?2O%cMAUPe*vBp?7ogH=u02x<2C^Esy7GwzL0nD9l#G0>OcGz@O8j\
-fOai`hp5reIc^St8{?KN4etsA5mgPd73cy8v%Z>%P-!cdITHr@%eu-}beryrPh3_iJ{q1`fIet|e\
-ex4rzerq$<&tC)lxkLEz>ovZ|3XcC3c(Wtg_X7OtIR0Mymf*X;j`?p{!2j_kmNO3ko}Gi|d8!P4C\
-*k_v1N;;r|La-6ztMvIsK-}8{{g&H^QQs6s}N`Wk%b>}&ImvLyk4v~jspIJ#du%14)EYi%m;X6l;\
-a->{-0e}%I}+B3G+(GYknATF`u+^6~~`{9{XJ{1^nKp1ivESi#oC2;MCP1Pe7mS*2W)jkq`d>;4{\
-P69xR*)dgcsl&!$dllJd=NI!V4izIBp(d;(trKh-eihhGEuS|M-x4Z!2GupWNTmmxlz5b}La2L0g\
-#yf2plKV8`O|8z3fyS{P*`1yf<vh!C!Z|}o=`0D|`>UjJew>bs&Bk=cX`c)snWqjrnPLYq#&2Swt\
-zhfQXTf;om)<xS_n^--H8A3gZ=vSMhe6ZqI<@db}j^F#U0{`THnt)%5{nZBo{vpKUG&%e`z)wE{k\
-N>Wxf}Ed@^M+mn{I;F&zQ5&Z9G@b{+hYKqcL?UOUjX>Ug8%K#)A;xO<4ySc&iP-6&%TH4lpNr_0?\
-*;^fQ$T}znu<p_+HHS`#0coAg+Cx7XLj1{AP2o9=_Wex!v^HHS*`VV~yMo|Hc~m_x<G8nxwqbMPK\
-9B`Bnw{)z1L@rXifi9Xb=9Q{WGL5%BK|`3TPd-m(zOpNqc^`|J@|j)l$wJ%2mQlUxD#l^by0_Z@(\
-Dg8p!@7LWc0#09eWc}@oW?Gx}k`8nX<8Nv9wfL}2iucHsn23+v}%sHn?nrCzr;CFq5pJ&;*azEAn\
---LDaw%|Vp{OWaBkNrE~Z~Y7No&F8@?+(Iow7t)3lJb{|=gH^Kt#JITHp~Y*;al)sx`et?fS>vy_\
-Iv;1e28njh2!17zW|;`m{+qdl-tV(0RG82(~<u31;D55kL!$GcOjqu$6w5!=hJ}S2gm<rDwaS00z\
-CY09QWViBKW>Sobd#}#X5dZT*UADnd_kbw$^s-V&Iv)iuc(#;8*+y+rL*{EVl=50lXdb{9`qJ18}\
-ka;cnlCxR~HKSPb|>Tj01`_a(62_s0J7EiTpk#+YyRd%({I{^XNz{K1!jo$@?hU*Eb+F1P=1nS35\
-@`yJqSrEy&HJitFA*hg;wei-DLYJTQrmjkcnZ?M0^b9Q_e^rBvzU$es%ApeE^@hHHz6zcf>2JpqR\
-u-!5Hd!PsIg?VDVfCo2VJ^VL-Umg_monidJKdJQ{nEQh!DNk?l4}jP4t*J=<55VzL`tb2z0{mKtc\
-We5_C4fIA_<{cquD{v;;CiR`|3Lm7XIu$!)w6K@`Qrf>>mrr`|EZwA{TcB8d=bY7JFk-SzE%VN^g\
-Gz!at`1#h4{`xfL{o5Ov?j$@M@S>A7Wlp_YXl1Y=h$kMZjl59?(iH?z0yBX`A8s`E9_(ItH(-m5=\
-AnKZ1P(^3k;T*AU=qmSVl@pMZ;X6!*IZ{C+cVUU?7Ta|L;F={54_xe<<^_emV@yZOgW(t0M(1AdC\
-YXXw2a^poR-JOaQk5$e(X_gX#=zyEcp&kXW*ho8v(hsOhcQw-~4Hv>LLh_lbT4*agdJh=^Uv99br\
-*U86c^Xq{pBh*bj3Gh>%!{hMR>*YM0&3_7Z;y##<9r>BupRfLmkIxksV}1TCI6nR#9EZ9d@R==mU\
-VQ}kQ-Zxb=NDi%0Z%~F8?OWWOYaGFM{j^}5b`NLx<T%r4BQC%!{*q|+UF+uI9G1s?|b<Lxc|k4H}\
-UH{3-NI+zA)vNu<n4Tq1DUk06cpfwg=w=e1~`Odu?@dle9i${ARhIFz_q6-|v3_7whFd3i$62#P-\
-6Dw{ZN^!an%rTlhHKeGcBoFNfn7%){gS2H;mL!hVwdf6eiS=VSiECvS!Q;(dIbe!%DMi{o79-ztw\
-&-wXJydtkp%+iyUBcoXlNUkCh+E<w)RCXc^A5BLp>a9ySY|F20}cV*50$@!wc0Q{La#<#eg<I7*g\
-{+t%T#eAzP0bl<L=B3;S_(LuDIY0he@UI3jPvcy`=k0*U=W)OvUV!g=%<sV70lQv%-{kM)>u3!ez\
-ZKMp()7%!zlU+&8qdQc06*|GeEpSxFL@2`gNOV9{LGtSyI}eqeBQoxF66m@{oZ>A@N!?q`sa;zg5\
-9w_ws)Qa{Ke_GzS$msl>3=G0lyfozYy+w{#_hTfZtoIYtj5Cj(>SO92e*Ty!{JUpFHwz@Xxp7{pC\
-KuUkG6PZu5H}?sE**bCQ6I^`E~E_(9KL{7%5X@}y7~=w3Nr@f(0oS%;5*74VND`1#NMGsidE7VC%\
-W0G}Jd>*c+_fS*?I4<B|P#E-s?{pw!^{D=hRLH+DL`M!MU{opry7U%VR2JkDN!Febv0Kee~{5-z|\
-y!{{?$9xv>{lGszsPXjv3h%oc)=#bi{N}lMzy8q!ur7ppXg>q|xovQ~?1Km7>+~}Z!u4Ope4EmPd\
->y@W2JTCB!Gm(U=AH-T_V}EKnxu76jsg5HU3i~5@NaT|_<4Ze0(sn8Kd<Kj7wdU``eBamxDy_Sa{\
-<3;FPztK8{ju@kK-n<0{)jbv7P&uM>xLnLoCN4kIMbJCjnj*^)$c-|AFQ3j(_KPo51f%06wr7U+3\
-(<%fIim$6y``^%jNzzgwu|aTVZa!93LV$D1ApKK2Z3Pt8~dddO@%Z?6P=!%{4l9$zPa&h>Eo4p2W\
-?tB=wC4|txJ@xHJE@HH{KPhAE0z3<?@2Co9Xp%2T$?k70D=LdNG{^AMwbKVEXi+Q8(0sg-UTsKvD\
-66W(Ec$~iixL9X?)>BQ=I=3eS{=~LeKgmB0cKtl8&#ZU`{P1t#akvTaV}<8=?isLyzQwQ84g1%j&\
-+_9>Y{GRdj(tu(KC7RDaTa(iS6UqZXE^@gIYPeV^Kv=X_dJhZ%!T;HT+NRM$L}QcP52(*y9@bNQ(\
-u5M{yR9{w*c_BLEqEt*)v{{^Sw{~r#!FiRlsi%>ZLDv5%#Y?<Na{}aIqfCp8%gF)brW-C5WRviPv\
-KZaIx>h*I$zRAzuaj8KM5$J}<-i+JKKg4Di#T-jr78@EpKH!a8~n@cV^&xgY%t{03*@{D|Z$uzqL\
-aee+v@|KT;9e=+=OleGWEVXwiw4deN64B+c~uz%xez?XtQ{F{Iu`)@f<<{ZGqeiOd{yysBN!`x;)\
-@JwJ|(D)L)fQxn2e!pI>pKtp*U#EA1J+9RcT>QE`esmt-cL@BVo!*egBU%CfC+y=NXgo~7XXb_ag\
-m1{#^#^ar`CWr=a(p+z-n<6zvk%37q<_50-?!^@e*F3HJk$OI{(=AE_|7okABXz$n%%v{TTSx(cf\
-ijV{1U$cT&#=u1mLg4@bd>YG)e1tEZZRWqb`Tz&prfS=Z72Q{G8eU1^eO{T(5Y?x8XV|93RiTt>t\
-TAyYiQS?=}n9Eq@R2(+03y>U{_NnY&=VQ~q6fT;RKa2L!+U^!GS^jlk!O5qz#>{tUtK@vSkx=nBA\
-Fp+4$*7>Auc;N$!d)Tcd5yZ#4Y@9&TI>m1-0Z;9nV;zQVvUdMRnNAh|8xsRHp{f17oIR1P%{#Zf&\
-ybJg@f_T46Olju!ouI$H2>4@j@pt@UQ?s<c#xDRD{e&ND=J*q7{9SGb{KENoKAbX@<2MR*O8*G>!\
-$SR#JEy^OZoqM?^?-}@sN1G<{AGa;whC}DU*Ix=OZ7=O{weTJYW+LHn>9=I=LFzlp2+nCm+>+F2F\
-E|vEabCn-Yl&bH+u_?FBkG+mIFR~1jcUz+?0<4_+Be;-a+YO9N$rhOa2z{Yv06typL_k@hhIj`r$\
-&r*MZ)s#ml||_`XZ<_&)*oxx;v#%-pJ3+7~GX_?Lvb4QB!_)?K_8aIv4uo?ACd`CTUgesDXsE1S2\
-0_dNvr$GQO@-WK!Uz5;mgpVN?>xqRDZX+4DB0WQ`VesSAoCYN454eI8>b++5CSz148A>gwhA4KCh\
-yaafc(4Xjt863Y@STA1z{4(MCHvzuSQ`p{r5b$qJ#q)Oe?KytnE<#@ez{S2B&jSAY<FWp{;||TzI\
-vXbfF7D$`04~-eJ$T1vX`PT|JIdG5TEKs@GuFpm1bo^I?Dvb#Y?js;UNuub&#wbq%%gt-aFG}N9^\
-hg<&(%9|{Mh}lzV`^=&HG~edgoa%Pav<MU$d717yI|E0Q?vs?`bXIJ?pU@^asF2UQP4P&C-4lhX5\
-}2J2-V``8>P@@R^5W|H&@1Ii7tQ=j8<nF4Gg{!|`AI9M+4{yEIFAeGdRG_Fw4QwOQIfv2{0io;;S\
-f7Xp6vd$>OQ3xMBV=J?Mw`|IN{{{_D5j=MKY`xC9%UB0i~1jnEF44!X~0sirRJPv=G1N-bAIF3`?\
-qgfiiz7g<G9D?=OzXP6xb*K5qo&j9s-5ol&S(<M$1o*j7|M~lxo)7p^fq&J$XS1}ANeOVVj`WZBl\
-+Tkp;P^F13w^`@|L{4i-@d+=eEb*e&5z$gsH^Y|z(qatdce08^3*l}F7ha5?8Enqr!ECQHkjFm?<\
-3!rD}amfl<NUM>mclh+;U%#w+iO*o(gz;3D!$r0(>8#?!j&QHB0+>?XrKfl<(ICxY)1f0>Ec1#NX\
-xcPjLM7EwS7?8E~;q%M*bAd=}0NyYql%X}!vI2k_&k&%*r$J^*|U#AUSieeOVx9~HzrqJ;;^=gF-\
-H@#8~+y>rmP&C<B!R{)>)K92KV1GvZwntq7<zQ-QYER9pF0$l9la0}p1{R``X2ep9w7wQ%K7;w=q\
-^jpBM`4I0THyjGz_a8Vf?=8T83vu()wD@m;<G)&l$L(UkPk9&f2~Scu{@h>j`nn!)v7W=+AdG(oA\
-Ab_yB46b$z{NUUGeUAX90q)kgYfn9fPWtB0xggD_^|vt-WY~;B;-@S1^BwHaeZbb0&?<b%s2Q`M1\
-K7pTbt$mdH{d%1H2!d3b+`by%q4Ag*d`{fZr<2pJUpZrE!p-0KWBM_`cKIo2C9V74YK(Kl4R^|9T\
-z1&U1iYwjcJNcXfcC{{p_wnhyE6{REB|`>sw&mMZ1SNIKn;oHCdyrG_%)N~)w*a%wVL$fwFvRCTb\
-R4rL1iiL5$UDU`};Vr12nWFc3~rYfnymi9oaB0oq?XYv^}Q7R=?tEqgYw0cUql*pyj!I4~UH95ub\
-Un)7Wf(|XNt_&CQorQcpl_VEzNfwJ!)Z_Xpi`!K-Q=o^F|Lkd1)nd7l?MSUkB}XcmLOwXEEDn`ZE\
-27qaEhb9Vf9)WDRY&r+SBO;qeq39QJV`FGDjr!-NR$RMaV2;pd8wrX<y2`jRf_h+mSsE2Bgtf{Tr\
-QOQLTZ!@Yn1#X|6{KcCUB*@r$beT@*`?;)heY;Rr7^Xjtpdme24^j_wKmi5|!3bHXz-7LA5VI|9_\
-PH<M<%Uvh;Xzuo@lhSNpou{s4V|<CGwrsFKfK)XvVN)8qCguAj)_mE4}+k}V_?*+e#zDAO;kKX*h\
-`3&pZRK0SSGmCkhbTepirHoRUdeXwXxUqDqNYB#=8Klw{v2Ol?bpZbg(y%jvW>4skBN0bfckuaRD\
-2FAlT+h|9~&%DD!Mb<#BFq-P_^)^w$^h!&6`YK9mDMc@!mQraViSx-69fojabukrP+Se}s8h$>t_\
-zgOhXkQzD1NL=^04~rGSF?pevG!rlHehD<EBtwbL6vSZ^nr*_E>RJ^Q7<Qbj`&+M^`0y>tlV*(H8\
-rl*ah^W4%bErWf}s9M!$kE-kP#uTy>Tum!<q_`2O7x_jgT`_gZ#1Crz~bh3meswix18h&ZZ%_g00\
-3u-ZY-N(IRl%)=MoCWFuKP{$63+S5Q6l#Bp3o^>}<Gq^iTIL{TlLvgH07_12&$+<IUSyzxD0Z*@u\
-#O@!%lxzu1Lkyk4PqL`G*8|UB}r?MiIARFVR+hFA>neFcBQ>8CU4lulBD|^dU_LhAM$&Z14n+H=z\
-$))Pxgb1rgqYL$0+TO(Ojz;;%jTk>}Hj_^!N+7Q4`hmq~^E@rbM>5rE6CO(uRm&rfx2&phxW`>+)\
-u!-_l}<ZGVytGD;U*=|d{14YjL0RHr#5yqMhOrzs8HNUAJh1x;D@WbF3`qr=<K8GlrI$@d!fWLx7\
-1=OwDG0TklPZ;L4NTrJc#7z9iN$Am)&p-r+ke&pr5(#Pfpi;5!B|Vu6;GswxQNzSrE-OF?hmAxn6\
-1_ogsCVujEPlj-sCR{$S%IThQrSj>kyVvb%d6vf7-LKGuPLC{f@Vvl(%jUmPh9H|B%+cnOQo)NB2\
-ngj+OJUXA&H)jq-9k6a^!LPKur&roXRhElJUrBv6MRF8ofb5jzJP?$PLDv3%a$v9$}L^g9`f;r0*\
-`9XCsRj!mqlI*_&namXR$i+(+%wJ4S85vN!Rd{kn9_wrgv~(yTB|v^t*l%I-Taf+MPJRo~--1E<R\
-|<ytuOaqpEB!T0e+{wIBkb2OB~bP70ckC#D!r*<bd(XLdSgV#Dkd_e?sm#DqK}t}ve-T4OodhQKM\
-$NK*|qes3$w8cbMlnwY1p%nLpn8@R8+Ik`H@N_UC3q&E0>I9E15+jxni_ezqa9fl3OU`7MbcZFcl\
-JWsH)fO7)n)^<ufZrQhnM5%F&ESAq&885D~$-Xr50Gp!4fTL34Nzfp|8*s-v}zu!G0&3CJL@C#XJ\
-zE4r3^mPlq<n-fE8zBh)J`<ZO3Z&}XrsBZ8a<zqmshg)Di+Kx%<ShCjKPt_=5Nj73w0<OlTox0%a\
-vrOtTG68V1cIktoleAo~l!!ZCR)<>$uD2yhsaWm4saWn;Wwt)cvS#+xILHyxoN%=&6nE1i;&EEI7\
-gTg+gvX1d=Sw(^Gd0hzK=nO80^>PB0(gc*nCB#sOyw(d><2eq5#5-vurpXfMuR29UNOWCmQJVGSB\
-=6ws0(+mB(pIUlm=N@8?S7Po?3ipA5^k&*@$Xlk8Knxcs(|@pf0w?mU`)ZhcIjs<4L&m^5Eigk2%\
-fK|2{m9<jVS4V|Cft4NJr$FKWE@4R2JaF@4I~*-v9VsKzbBC*f&~cVa(VhD$BVPPK~|Rl5j#sR&o\
-?j`T`v^5a_bz+{?V4<?hZk7|lUx|oLJ!^*5_e;!LNruPROZw98Xp*3#J<HEc2qxUp&Yi^jGX(5cf\
-y0tyXqt<a}R(hP0{#a(?qiA>{mW{P?;fG7+dUI@dOCRfUNt^NPPPdAix4UMHc~(z|&f#4{89(l14\
-ZGJEGA4cPST)RTSF$$jc6xVso8F$n0#-9T>~)5F+V;pV-gmy*n2;XATjXc0(vdQrx;;_)JbQy3WY\
-c&sAieLxl!)SekUaSZeavuy`&933!z*#m_tbUyCi0o<o~zdYxijY6M!!?n^C;DAf!F<({(K`5uS~\
-{qUBitw&O*k~z%0Z8dVgNPPF>hLe+juqPnSv#Q;+Ofrbdqf@Tjg{T1T&3P=^!w!E9<u*D)<bD`+8\
-axN4PJOqI%od?K5vtX4+@Q&?@iDJrjn*Y(++`AfPx$=Ur&I<<?#Gb~-Wu#Z@^{qq+rj<WAWw}%n(\
-X0+JfAkh|!-MKWG8N-S4aCeS~m-f_(5%SWN0{t)YelTfbxiopru3&VOT_n++ri*zLe*-0yPpwoFS\
-vJ8CfslSnb}*TRWMt{FiV_@1lru@STq$MpL)}Tb^pnHHZmg6NnM%1kN$;PGM%$B#Vj@XiJUTjW-j\
-R#D7jzzbtQu+ww*(dbLhWSOQk6s|t8}P6g~3$yi>c%WDf9}92Le(0EOGjY1L{%at;uH|OwsSi{uU\
-K38C3Lx=!6<cnJ*d*t4q{T_I_M^B?bpe^tIF7=;_e?s^@3;Lq(%;GJQBpO7Z}e#6UKsrUuCDNM*@\
-n=w6%&(D5<7hjv{>A>*2;q=r_<Qmd7a_8&*nS0Hy(=pES)?K3jHyn3r{bbj@!bTtasf=x(x(>~_v\
-BiBGvin2Df$wq(gA@8fSt4j)lYAKN)B8Ch33z-b;55a)il}aZ@vK9WvLH1YePw`SFN7ZJE5o;owN\
-v`IXYcq@&%q04rbdce-tFzd{XI5Itwesa+q0C%XbWGb3!UrSTL8n3@Tdb6-^Sw1WTq@)X?SmsFCU\
-(2CeU%9NwR>@vJQx|S0G$AlWML#<seX*0dNdO>{6R1mmog&s12VZ{w$sNu88!laeOj+(=ecaSAPj\
-XoBaUZIOleOCgAr1X4l2R&>T)H;Dvc(Whw_D$;sRGX<PytnZX2hUY3do|8RZRAN^>;PM=Y)R22M0\
-t5R^*Jq+A@mbi^>AbSUZKv0j1t%8ruFH$e?M{yO^K$?1!F>60y5oFhjrBL5eq4D3i{q)67_qOKx!\
-zV(vz#eS#H%VtJ*elWF4g@cYQ7yB7ShM2DWznJC&Zy?$A^(9Zmc$ehMw-Ona%?#zqcn^%E({#r*%\
-DXl)$*GK!3XYudP|(9%35Q%%--mk0D_aPLu(e<aTMLG;g<uFs1Ot88E}B_TSdA3S04ID0iI^r|Go\
-XUL+M((jPLfW<LW!K0q%W;Rs(*nylJBXsnGUBDgsYP=$$U#{^G*MV`ZQM5Oq5SS<EX+KP*nCe`9N\
-BYBO452LoOjZbD@-Cx0h^~VU>?s4j!A|vd8=W9wjOl9e{}Ytxu`GVs%9LW4Eb&YLaMrQD)s}i<qx\
-#gWR7e6IS25HLWzw*0k|e@je1$p(S)kwnDP__1iM(-)*O7m}P!67$kFNFa<kDipxv7BgR3!sm>N8\
-$YB};)XAldbZSB;7$OU&P+ZL;djpB&@|EOEsfi#vqh>>x+IrOGLPn!Qg$kkWv_-y4DUQ2TtGiulp\
-|DF4iIFap=(~3J8aK!2Qlb#ceWdggb0?`jS5k>VKE>%n_UiMJ?ZI@%8YV}OrwnOR5KS<NWDO9>3K\
-pKv=@hY=P7&+r6tSL85jWFGp&BS9@2Uf-G!@@;^+j{NWESM?t+lk#yz`^%bycMic?Fu~p(X5*x1$\
-rANiVvyz~4BC?i9uboW<R=myJ`!hzv`HMs5RYKh1ONTOhb2q^l(+T`r2M$wfNn<LtNI7<ECAeVa-\
-^V%w$iZ16Mb?qka(9?M9OQ7$KPDay~F#b(-6u5PnjMxsiwiK=<Gg5<$cmFiZ;=4y^CDC#-rW#(f)\
-T`)|k?>?3+tVQI@!K!loZ8S^Qpwd7rLzJr~v&N`dNKG7Y0l8ZeiYh20ZB|R7&3Z|+Sucq;H%r1rq\
--C*MlksHQhGo7ski=|(^0(I)h{Gx%6Oe0q#<!xn=mM24HV~h>8d^yV!CXnQ8Gy_xd&8iriMpO-y6\
-LHei-k;{^^f2mBJN~ADS_%4g=lZ}&VtecN{vFLc(RnDIt5it6GJJked=2gSxao~j`Bh3Q}l@AV5V\
-G2(9a%^+34nx!Au(F2Vb|m#Q~+2l5aLx$f*e?H^i~7E--`7%X!*`RM!qPC7^3mQ7W2pHJj^hTtwJ\
-_CtEcUUX<Qpt<F;s6XKdb8FBKpa^1{rP8E<|Yx95xBO)pja}qBfGRe|uHun{y9oA?sL6~l-<lWj-\
-ywD|n8M2FzuU-980hLdoUTre+iBcbZj%|7dbxs@ueQ|quW4fJ222w+ryzbLv(`R6HB~^~cMsvA&^\
-T_9!zo1)HT0$)mli@0#Zth%YV8<;{^Ql$3H>|Zfv9<Z;ZX?uvFlYf$Wt9duay7fe4bsp5MM5buxh\
-9xx8cAkT3Ec~7<JCYfY30kv`SN5?eKSJl(!fY^InlZ@)FNT~OfKi?xiSrSt^j#1GQ~@YWX0@u((H\
-7F`<z08tg{wBx)NTq^ar)ZV4oQ`T5P-9T5A!bwHC9U;+aisikqiaoSlirJ7@?jZ7kkB`rN}ow-d#\
-K+}1SVm|s;|jGr_jMx%%8>g)HSUqbYIRefG{y^|qk7Y0=;4Z4;@FQcNkK(uX%8DKXZeb|PLa72q@\
-vNqC;A!uJLMl<&6x8^t&bZ_oSp&LH()YV_5BbvmLM1BdmN!jshjqzsXM&EPXV6c`4oRv&|G*zk?w\
-IRW?XP%c*7a!VAWs@Svx7IKY=M=Nnrj51r(hsEzqOAE+Tn}bU7B4mt&P#ys5A|KZ@tBLVD_Dn)_-\
-AiVQHf61R|W<SIl}0dH|rcGukM6(>e6T&oS7I|6(x&ZX`_CVp%UXs=BaC=(mlWqckLzgvav_4qGu\
-C$PHQ%QP_4RdD+P_*<H-vfCvpZF1%<iO+sQwjHih)4_)*mEc$yc=<NL${6{rg_502e{wPSbF`anu\
-hi**P=4&y7dslBO@a%yR5KHb54*cbAsZ3USY*GtclsBT&<MgLw3H;%Yy2V3T}+9A!mT15GrL8X{U\
-B~vRi<&;|et6DKwX^be@7gf6#ahGu~-JSZ?uHw@Efa)edtWddL)qQf+g^*{(!d8}CP;_NenQp#pP\
-3Vsy9lNy2Z$l<bdi-s78=rzpot)a~CVjlV<SRjKZL{)r`F9fPE*^5#c1gsqrr=&srTcV7lXWb(X7\
-T0uf~=p}Vi&^lI%7DS*h!Yr8I@Y0jb%XX)K|M%cV(n8a1W4GEv#sF+)=|jVztVONaNdp)%QUj!eI\
-t{b!yjYh`SP=Og%N2=6vmzqjAP-GR38GuER1$sjR4rc(B0ogVb*M>spwBMHtjrgjBLR?+To+K{QY\
-HYk+TG9hvemnLJs+Lw+b+nM|$X%gtxhUcQ$5=n(;fugdHDw$c28M2Se%Ski%$?w7x<FB<mpx?5Mq\
-9<AZKR|A(B7x79hK5NPEP|W-eqRYn9nhbAM!7_%dj8-CI`ctJGE%e7f_2`6V=K#ms5a||!Mj2N@q\
-l`ve)&hTCXE6CneVlDZ|4Ia5l4kcrRB7y0!p}1LZ0q3p-_(LzY(F7ZMOiJAdu6o^h3zL{$%axjoK\
-^b5lmWzC8dSaJYn4GP7}y&l!&yz%BJ*2|`qU&{J(>E|zz;30riHTAgsOBK!cyd>9Re9DNDj}G)qz\
-Zf2_ZO>ed~U8G#cTosJPDFqw;|LPl)8pd_Os6h*f2foWP=QkC+h>#Eg(evjsA%3{(MY{!3?YOq3r\
-_v_4n+uq4J<yO~{&-Q5+XMK@>TG0#CJDtZk8q-x3tS+eQ`3vbeJmQDllkZ9*3v@A=(i-22r3>K(P\
-xQKa8_A^H)T_t$&e>k%=OC5QOv!PZ3&?BOw2A-*=n0X-JY2uoeg)*yUYJ%%vY0$yKRXTy<w6RDzg\
-2AdyXwVGwJPaFcKtbAo9TVA<H)ijpVjDw9b(=Y7@@e%<oJDKM?Q%?B3)*Zfo)iWl!A-v@(azb>fY\
-D<SEKp3r0w<45j@`I}=&%ef(+6m$Y7<o@LTb)lxWs&Wr3O>A?@{Kh&+OW5mAMhT>iCqyo*a#GM=Q\
-Cgwm`hgt5L3&POk8e_n?~<Zy9ImD%C8fzDh{51Qr=GR>)wp{f}v|DjA_%irk0h0w7zSWz%qZ+FOk\
--l~<CjG9y#YX-;Q;kl6n0*L<O(cJq?&L}TZ7%4U|Qc(0C1P$4K2-_@y^p`V+6Lh9<({+cM4Gehh?\
-P>BR|{L$)zu^J=w$fiw8vuVf9D6;pwH6(wR8(?})7)u2UM7c)=a=F-UzENe4N@61+JvQQ$sYR<6T\
-ciQlB~`Q;mzX+8tWKmA$@1#hdY3XoLe)&U2=wY2Uk0mVF0NL*BIiB}g*o_#Q_1Bl3q{SQ^3j~WN3\
-i-HLCvVKNQj1P=#6Uf(TMP{c6Xf$q<gTe!=`qcYe?{8X<sy%jpp33p~PKZV7NOA$1W2a*O+SJPU$\
-vmIK~IE-fsBAYuqMHrnjQ<cm~zqWx|U-L(S1<lsloQyjxzCgP}jZOX2PH)nFf`f$R#=l2($zALN^\
-gj6LaDBMZtkGT+1jZ(6z#N^e)ILE#v%uquT<_6iFk?7jHp#El+xrk2(W(m5vU5RJF8pXwHAMHW&A\
-i?nj9fky3J*8*yUZ;oXHn!=K~$xG>xGb_x~FsRVbk@=OY9ZE&HkAvJUWj!=SqTfd?<e3K1?J)y4I\
-@;T>CusSOq3elEU5Xt!*7%l|sqebSOZu_enZ7}nxa(p>bQ;sV=Ki8NvM;cI{QBOc*#ULqvQ)QMc|\
-DgJh%8<U!T1j8QQb%PB+xWhrlGal<p|UFm1sjXXS5l!zg!j;%9sla)iu0OT{g82ER1WLQ|@&w=C0\
-%gjAn1lcgTXgdV+iP>7+{z8#6f_qHjty`eu_d;plU$L%JjjuSFa)aSb`Fen=h>c8FEcLAlB%bC`>\
-2S4fRZigC0tM@)Vsn^hqto<74syuV%r0nIat6H7$5hD)82yFMCL6sE@})zIMWkNHWtF_ifTvsuXn\
-e}|W{jovhGR@#xvb*#lGfpV%6%@6jIJvgenW|csNZpv&Tbkn$yxn3Ttd+ySOTOCphv#W#E+ohfnD\
-rBk=a#J-2FYGFzvV*u<K^I8$8Sm(wxM=zc*6c-BzS$tEKvgf@g1=>l{QD0VMzVv^Rhf#H8Y0wAu7\
-=2rhNM{|%vIfLbeNg=XMI)4nIPHJU`voE@e5^x{e~U*uv^H@2@+>BrtEtQAXf{1DfGO8FY6*BS{J\
-@!6PAwC$rS0K+L0liLAIBpT#RV-_3|>qZ-7ShRXJ0lUp*G~y>`_h7Ov%>nj_*?2@~x`!C=Vp01qy\
-WWpzXNlsrH8>iWsy;99WQqas^z-gULHk=zOR54?((Rn;n!*a-O&8)HNO4S1|YwMd;<g+My0VN{x-\
-rFf3*bSct|<Lc`sv&OoCtW0@-GRr;1L|=#|vsEt;8Rc}5^<IIje0R0Wl?l#DwqvtKEZM9U$|N%rL\
-mrf_F2_3ZQl_V3Wk|YH%{^1boXg$U+iDQ<x7wlXK$vJA(j;|b>8%1Tz16DP)_!nhFm}olfG5r>2r\
-@y%qr}_;%^e6iz6?wu0!5Fw)<EOu^NQ)^)i^+ERWeniV=8!OjJcPb2PfTX1FGf%iT0}wTRSbfrZW\
-yL*0f=<xk$@5*yqlAjf_id>0ixhepSwTbc)<~tfB8Lh_r|1c4A0w(^`er1DJkAb7(a4T}>v+6+Wc\
-ol^i<-P=*Ay^P|zMHk)b1QF^)Vtm!E2?66ApF9oqpYjmU(i{jYjGA_!jMs3wVb2UaXjPq4!`xo=?\
-g%p)(RtLWh^4(N-)pEs{9T#*$JGxiv!+<yP4clC&l1FeVxlT?b2j`Q;)h2I(V{W;$gGH=9*?qz%u\
-5o(ja$}OIL9S_t2D1zJOZ2CKefo7!m2bm_&Uk`RO&gEddC|kpMyEkn#@45IWnU_hdBP#*V-RUNR2\
-f!NrBb0JW?wp&wDQkCu74pb-MXz?jR<Gsa=|1c@uCt1I*ZMZzatG%Kb)&pd!r^#Hi2EsrcF6(At;\
-jD^b|<9xu&g%x8Y@N8QiIEo3hroaA1vMze^YUt-9EcxpHm@`=rY*K*mpE2-@dTxpJyvQUrvUM~JP\
--K9DT#GJI?aCLT&e+DTDa^R5X~s?@421TQ4s-_7<?kqS_ciXZZ#m|{H8MkT05TJ(m@cC*E-MYvhj\
-8tFz4Ivdh43<c$b*oY$<y<OxL68(&(8?y+Kg<OtUee~Yli;%?!78!Lobn^zeQ9a88a-0@;373kR4\
-114OVxh9|s7BweS4~Z_F0yXgZ%Fo6WA6b$V3?~!!1tEYBqw;0MTwtwbkfpA?L6157M|+~Sw0Gpnj\
-I4$8*Ij!`=Q8OZz&?06G@(t)4hnhD`_&7$!>K`NosVTDxO`ZZww8~vWr+}*+ryTb`h04Zv7a>!HH\
-&H*wz0ETNMDaa(6g+7i|cC-q|!<`;l>J9QIgEC6bn!E*4F?b83Z+jpB~X(BV5#nP^~^gdwNQ|IrC\
-nTgY71RM94nMh^_3z=6A%fn_+rB*o~L4l#*kP)n;qhqj^D^idu}fE22UB{3wNpoNZ{pxCBRP~Y6N\
-B4(*9<my0Wccn7m0unIKa~XP7DfiVi^_7)UFdJP$-X9+U1L>BL>UdR_PO^n}vBrK;DQ%Bcx%1gFk\
-<s^<U1vG90%KBLxJ_e%vGLOC1lQlwWtr|qZe!@smiFAC%}L+PtctoQ8$6x?0^F2kj94wGQkhlsKW\
-HciXR1cvtCYE3zo1&xw+5TUV-~F3BgF<m3Fb2S40DNAQpIX6VLBbhE{Xb8AvIMav#6vTPt$M6D>w\
-z!YGloN!W&5aOM!c^@y>nko6-bQ_=GxZetc&^W8Y4%>bI#Bxs~oMvEoB$EwOfoxlKhAVglEygSxy\
-;E8Uq`7%*a+{Kw^nxu78>N4xf=x?o9nsZ&PF`6Btem9&|DQ7`47F3d+4_tA9_+EQT@^be>MOcSM!\
-No9tHiN0X^SY+yF%zk5oZMbn1Cowfqaz}bgdm_DAmDXru>_)D&@<u(~TDfw^mRgF+rli3$SMU1Po\
-nn1!`;PPtPCj%+HAgv~ZYbw%6S_xHgv^$5%23+cZ&^&;Y2jEFv$1-jRj-1YLgcPnxK}mAE)NwQm4\
-;MwjA4B#nWbrk4$ZpBf|ih8vz0no^aC=Joy`&Yhc;rew@*l~ly$in59N8iHT3jQOLLRyA?ZT3HE`\
-bLQ2^kAi!DGH?UDCd3W~j!{HEA@>hI8o`a4)wO1H@JoD@Zd+^wQUlwwyrl|)GkTZcLSLuL(n%=xI\
-kFd3CZQBtt0s*5zRZkOc;bs-hm|Ie&4s2;VGGF^O3fl1S$`ry2qYWnqh?q=+g5$SGJl<IeM)e{PA\
-vq-u?mdDB^<hy1TjpQh?+`=(MhagiGLyXSlP`JQQzAC8NbR(A}RJd+TQa=V^U0O@KOBJy3VooMbl\
-uZvvA3brFsO3}zatxw5ht^JVd70jn<z-_ns;-**ofwIw9p(j4HZV&Y8ZNV`r0IR$L59u5u9woz+)\
-w3HrPe866;+f>1*lVN-4=t!RMN(vim@$*LC5FZRK>98bq1qQVv^Pigw&+M5c%3xnMqc~ym?%Q2g3\
-}39ckJi;v{QiWd1;HgPC$Mn^--;bF^)EToJE4E@Rr7(TEGEz(yRU)|c2WchXr)hVmCyEkl_{h{lv\
-ds>h^Pp*krqPgP1;r@(vga~S&L*gMT9le%PGU)N+v(wbpp>F9#9q-Hba3i*?<u+RkU)2Np(brqy>\
-tqBEO`qc~;yr47$Q!B^^NV;nK(BQ@dZld-=Z-NQc0g}hjsB*DlL`$j4aY`{7gP?H??2CTJP}NU!$\
-H<7vTSeO2p_EltZ6O({wvg;AWXsXCUCy+1L1?bLx!zC(4Vmnt8Z}_z%z<ipdMKC4lc%6PlBf;`jt\
-ZZp!(AC5tnA->dY_3agn8M_BgyS!%d%9mSQX)kszd?lTjC||$Vf9nW2-u3P8c#@+&%?ruchd1xEG\
-cRIo^z+5e>Orb{m;Ql>#~yOSXu-lSO*mJ6S|n(w7^O%eZp;q&<23XV<i&)S8@+(s9AbHn&j;##qj\
-&zP35txt987W~ZP0Wypc)u`RG??gSjGwb#YO+=)AtMw&w7+zZ&S)%mD+ZgxismCv1=kTrA`p=pJ5\
-DrIQUAKaLXPmkP~UWr&iAN`3vJ-4}5oc9Dq?vXWhcSE6boA6&4_xK4R$E;nG#ahecWqEys*aS0#E\
-s7FUD|Tp(bmu}GVbxV}Qdcd;9h1<tV+7u?((qOcb_CNH-aoxCOI=h`VNIXyRxVlOoB^$WW8SfDf!\
-?tW;{Hl8RU%K5TSC63Jgh%{t|<xSt9}iY#vsDjj>3zzM6~H;cx8W^G!MJt@NsEZ8#)qBMYN^;<Ex\
-FfXaUq}%3sn;#vk*skUh1PeD}dZPED|NZSKM3rOLRey>GhF?S1P)qt753y-r7JGdGx)#b11Onx2$\
-_utXng3?a7@jA=t|>y+6NuySV7RcMkGZ?uZ`irQmX^RpWJV5DhyqL2JxWny)i*T$(mjmfO-n{CJj\
-bZ&K*$<*K-RdnM7Cv*gmhCFyii(SzNy)kiOpq%zY7q=jb_f_&KmV)7DPI3)}lZB})(xeM+x4wvmi\
-2^iEgroIT{4XM33wAW2K(N4P70X9XpfW7>6%#Ejgc`G3489h7b}Q<$;kPi1eqW(HO#KVPxUfx(4I\
-3xVE@xuK>A6z&wIzeqJSbEBNQ#E^3X*t|M5>d7eYkRWHX1%LRVp|Y{o2%4aG0*%sG;SMWydUotrh\
-TVYf&Z>GqU1I3oFY_>kL^B01NddNL9mPsZdM|QRN6K(P-t0xQ$iJT0gM$JF-c{mM$%f$}=0<pfHA\
-36GKuEV}i+ks{|oyP6l;4BIZS?%De!Q=13)z%~V!<FbF)Ef9~|ejj9TM4So~}6Id@H5aDHv+MtY)\
-g_GBUd~2cX81^TFWlcW<mA4jlG=EsJ-c*&Q?zt;5JcC@uSi3qKP{fCA@?;2GS)(C7hzo#~GMPA)L\
-j9JyQriv9@1#sj)Z^NHqjg$vzFOwIrtmK6#XV7y6=W?7-3_iiEl(KsI?fY2V!Q<}-akRjTh@<GRr\
-8n~$we0Lj8;jl%9t7pSmXj4vLyVZ0GdXt>aot2t>v<H@4YtGZOcl~)7WB!?+p@>j;i8$cabB9wqe\
-$|t)CKc=h%)mz_D%Bu3j<Ax|%B1YZ2MWvt1e7*!6XV3N<8w#EeBE<F5Cqb`6v>J{l<d<|0UW_+g!\
-VLQYoI>`=DqPs^d?`)I%FyX+dd+I%K_hcjg7l~e|h*nPgdfo-Y_TM?zZ1&z(S>OhNiQ%a}7TrUX?\
-jaURxwlqN`dEj>P-1H7Is9Mqe7@71eFP`PoxGmD<A|M&lBu0j&S!HZiPK{N&$F69Cr01t0m)f;?N\
-=GW9HopCW*Ia8wnrj_$;(__AqndW)eYxvVqm#WF)1#)bndLU*?Ty9p!HNr1Xdr>b&*Ba>w<lqIy_\
-!zbK?~kc??u{E&(%0}y|t?KYvL++lQf0K(mxcI_8Yb7y(Y$v2ea`}Np_Zjk)kw~k+R8@Z57!%M&m\
-|lv~lCUrEf4=O$IZvooe9xda(i9RbE)WJ(DkvR7~_J>p7Z66%Xt)VqDix9s8z8#{3xX`gw72R4n6\
-Qt^s4MD+MiI%f#z3m#uQh!gN~?(p-VqYaSR%<BUVT%_K=V?2W-$y{VCMYH5jCYdvhQpqh(iHX_-H\
-VttF%Xn>_9#?`)FsYiUm44Nbj+<J68(U>v~pfNe>VPe91BXduTbp~P+nM!30Q%s_28&({mYRQd;)\
-NFM~s516Z^_*Djp_i)PxUQkdmys+NR^2v5rjA|Owr3H<AIQfNs`$7acG0EM#)>{9OSNvR64t1P8i\
-cvDxnMf>?lV!rKR9)_g30bah0orTqvvsDgud$1Q~{bP5Vm0?qPuxuCE8LkGL}?~N!ch>x<|KK`@J\
-U<%RH!8a)A-zyH(C%h-#>=5S#>M+N_G>SZRj2`ZZOO1XE-#)ugWtP|`cIhANh=My44%%-=3Y3twv\
-eIas9H`~tEVb&_(FBC2J*!cqzzEukt#RuP+8rtY`FFk=S~WGd{z;bb<q`_)m6C``>rP!?z(9ri!w\
-xt45EjjczjOzdSS@Tr|EN&=xgzcOc@4PoAfjHgAjkV9A%`RATf%-#3;unkHXMqYm*i<;G5k^&7`=\
-Jg4L`k?99yXoYSTDOB`mt*EITZF=mmZ#)6saa7ss!mKiv$wd~$_Jor^YIvwu=pe7GR|rKQQN*<W=\
-|~{_YRfc$=qMmJu%C$uQ1Y8yHmqj8gIxM3v9M@_^*Va-(9GHG11t8Mo#8L=__O1bGjb%4{JKT6OT\
-(0^foZI>|29R@ZDWf)X4(_SZGOQ!yM-w=-t+RY)3^Oa}#Uj8{M@o`M@r_co><%wQK?YxVaA7L?}p\
-<gQdkvhOEubLcWs8kFXU~j}nEkhS+F>DN|z=gYsfS3Jw`a!AdKCjLc|i2~K{JXFqxAyjblL<+=Cb\
-L`t!hIi;*>=hl_=8)oYDBug~4+lDt5#oSFr=`bQn(UQjTg}r@+J~e7v*|_1X#$XMFh73$#N=Z&KO\
-Uy+_kO>teL|M=>(vzn?coEzO&(s^Z(KWu@HTTUJn)?Rr`xH>`9ow&HQ+Kwh_0%K}!z#!y&H@Injx\
-mGJxe2a)zLTrsW$m_oL}e*KPL!k?c%I`+QmXcr(Q_nf%qnmu0O_26&v8h%%5A4Rcf4g|dqs8Ij=s\
-$}Sy(#0{$7538s5}t!S7+wi)}K58|{li>P;+HmJ&rrDJJ!{8ESz>=~l<wT@c^5?w!#Jt=;0Wq@SQ\
-WRiMb<^b}6I<fuEyq<F;4#35Y>d!Px?6x(2;qSui%#M-r`OXKUINn4f8wn$iYiw{!zt+6%^cT#(4\
-I~~;0By^bNOJu7L)2i~aJ6Zi$Ev14c20>MvYIwsV(cO(A$|&%#p`!L>qsFqGnKJFtNlwfR%F1@eY\
-AAj(>W(jKv&=Hl#_mPIiC3vg($h(?=;?$T8%;iGA#s}4*O4dsRU1kll_*v&DzHj9-F2x(la^Ma(V\
-s4#auGX&tVPT4Srn4X>XYNs>ECJ((Xc5CB9gzBiP2893ZnGMB%llZ8-<$draNdguv%4=ORD=qwbp\
-&ED_5Emj5}>h=hkAg*T5mwqfdGkS6J2Api@-xfr%YWKHhRQO|GLCmk3X+poP7HgrYZ+#N5;hPa25\
-3l;ipCr<-A=x-9)*+cy9?ew_*|n%ba<4HESvsVb-1YoOklPTiq;2<;i=yj8UsSMA@;17g9a@nO^(\
-hfS!dP(P1Wv|sAT8sl^mmaHhRcpgi8$>j@C8_z|_bLXTm)&ZcF*7K|`ZNDmOWMCtSSqX^Ls*0d{G\
-CPb7GBL_WbGZrKMkgrgq-)-a<;MJk83n8MTa&^35c9ocCEW~J<em&*TTgsv(BONk6jX3LI0}onmb\
-)P{Wn7s=-up3`8n?j45eyjPmqZLQ?b}V^3~pG&)46`NTJFS0{eFv6LP)=&xAEij5PXY5>jqpV)_>\
-OqS2muw3tA>DPxR97Ig7UP4*9K;f{JNZ1r^f<i!GwM$kErS-Fi*WZtYd<wFUB;a1NcsWSz&U`ANi\
-><$Cu}71BFV%1UuHMhiI0PqUZ}UT-&n*0lRTYa=T2Dxy#mSVA4e5poS0*(EB!&X%qYvP2;l^@RrX\
-olxplso2|%g=RJ#a%MCW|6B-DA{#R*EU9b(r&b1>6h53vE?2WDn*F84h-mCUub5j6zH3s$VVU8&!\
-vk^?h8E1@;rDh`j~i}O-Lq<t21W*{v~pRU9Sh@HUqId_CFV8M7^dogNMba)EOJo~9S(yb*%ap0pO\
-t8xX(YH3bYG=|3Gebs7olEncN*<i%^BTw64=hn2`_FQS-!VZ*EJ)ndeo?f|NjuLA#1ADvbwRiDq<\
-N)6)_(%0V+5LGjzmL@>pn16)#<QXJoB<9ZE|$x6)Lc3QC|#(%QD{tAaml<n3lbE}3>j1FCwA{5E6\
-sMwmAiq-b?rkb;UVR!B@MNYO49q%es+R;5=_J+%&5T63zR$I<YU&NzAa)+qh9UX4Mk!8V_<Iz4x-\
-gNw9GL0Z*3nj9UFOR(4&HfYD)#cHyv*@9|UCsv~xfi)d-EU<6q-f}Yw^~&*{;<|07xNf}y+^n`P+\
-pd)kJxl4BOnxzA`uR^xs*mDl+%F>D_6xm$5pE2qH=eQmQoY_f(&&9%U1!H*YBs0pLY3oivM^GSWM\
-lZK!N>xQ_T6s8#Lu9%6MC{eoN1<QRg+^NOH8OGi9GFmU3N)MHgMOy4nx?ITPOA*^7zpsm=<E=WNH\
-YTQgOwjH1;Hv@hIy<6EP;PwmK!QZfg5P)dOR8r?MUfHP`yr2@Nuuh6_@fd8;QkN+kyQQ%VYjaZj$\
-+FE1z){`JUDt-WnLbd7IQ>s)@#$ts(at^zZiucK0cPZst0K|2+mH5!j4s}#M7RQth>KI|*yM&g2~\
-b*={;=enDg8j>yn^08CGjIBZjStASQa7m;VrCn##R}0tE<_<D9E1RW81w*O2Nkgi+{Il4Yq%L*Wa\
-b{Z%+>OQtCaiHot4a&{<Qyf7)4ZrQ&GN#F^XPtX=FTlpH}b9!lC?)hKUX)crcnh{9n4IrP*@5s>{\
-vZ(kcwTChf=lo;AY`C2sjy2gAL7<i9t*A%@i$@heqIaf3pi#jiGFoeZP2JG17<^m>QDvLkDS{w6O\
-$pw`~g}QgNF(TkWiBs5RnDjZuIa<9hT=>B!?TdUg@V81APyVXA!v-O<kd6{<1t(d*aJP|LFo5z#@\
-$tvANH)Kxo?m>MB_(oK9<0rQ_}ljyVR#4)asemAvBP%{B{6%|}2nz^s7pzB}`{)~{XML9+ky#SU&\
-j;i0H3C&T|Sc1WNCyW{5OJZq=m|c}P3-(mqgc?-z63Vy`c|nPWoe6U1vcbWXvvP2W>9F#?-F0qST\
-TdFD+iFDc(SjDG+x%=+WWR)(ZMNfx(>-mov0UVOcB+yzHS>go=Rmaz{l^L=d2sgIn<Qi1*wNCv{k\
-{qIwj4X!K@COIF%u(B>^Ng#y^X&2orzr-Qk}|oO3M$jzqlwq7*M(6Ogct2H?6m93+&eWAB_6$zTB\
-xe)~c}S51eUae_+v@Q2){(-eVfA#+U}<E9!9#zU8LLYw~2piL7^N4dR@Oka_4PU5hDVDX9Zu*$Zt\
-Zy6I0XTYe@1h$C=gmmr2~nD}kwBn>Hqt-92?D&SYFj7imxh)pxKO}$Qmq-I#07lk!>QBB{-s!^l+\
-4T&1!G1lxiPQ*3rd8kf+z_|<xB?7Q@qN|aJw$EJQkQQKGBB>Qx^*?j0-k<~bYrYw-U-Jy=YNb19@\
-{-oNyh!+cWEGi7%KWZGE2u6as$vZlO0@Gw(mG$g&2+q>nu%^n8XB(D%U+G}Ouc$Ees;5q3bk|E)t\
-vYGJJnoV=ATPr|6FaEHWs<nn{sh08j0ne%5pg~lqXAPp;Nu`8bW6hp<t%)MN}RYYZIel)>?R&W%l\
-7v6=zJ<7OKk9R^ON+WsX`g26?iO%N6oWLF-;bp16lB&u;4I<(4>ioAKaQyV_0rkt|@bE@Ca28=$y\
-$+xX~&vOtAf)=^4SV>FbxRw1LmQZ0;Bh=Am?Rnq>dr*7W(n%jlBD$2pS*cqt!Y@eh_v~i7j<Zt?0\
-X5$kZrB5}+CIj{3knx+6u}=`8!9JI<NzKF(aJKCS?TX<`we;!-6qIwrYz}LwI<?6~%7!IMSs%IB%\
-Ean2H!n<)P?zN?Y{H7ID3Q@qQkVImnGxJ((3=z*LFv<^bvar`>bGOcH~A8MG@n`Pu@_~{9>OX(37\
-j^$aW88W9M9zNE<H|>jv9+RyHI_l6?@0bd}WC!^J~^t?L@T$I|r9kS0-;c9@{>pt#)lETorVb1gw\
-G~=Dg@Pj$S`~LI+u)2R7=Zm*jGjt^bLiG-5k{u<N!c&eY2`m6;V5)JvPb%$u^}V^f#XRHv%m+|jt\
-95|l$3NYTd=o2b5R85uRG=6vQXX{Gk1Q5Gx|+eRvxY^Jh03PR6MlK>BuBO)rV4XGv6(L3pVj=M1z\
-N;BXMEpL1KmD+txo@T4j1<~f3#T&s{=Ry`?E|YiTdvYH%pXmJ-yOg>Y<x_O7O$|jm4IDdTX--FGG\
-4f^7r5=a84<7+YufkUgMS>MZv$vKp1x&QXTyf^O@6!bzu2pqcd!;%?G{PB~ynS3)zBua(JCGv7nX\
-0yj4Z=h*v?EEg!EzFf(%e6JbsV=%x{Zm))VpCIx4Nru<SO$QII$fn%-nkE;r#I@ad96z|5vNMChX\
-MFzM2T`!d^4(u|aha|MH{Q!C#x4mc$mYymnGVt8Zf`6k`IF&4pBKQ>}~m7;Ed{G7;`XK5yPvW5I~\
-NN<PJgDjhWm7#fbSCmDJVLCjbCx_~*&N(UIe92tO)RG!V}OuGBnG8GvrD@NPBh>M?0nbjL8vL#Hj\
-aA=%`@vS0EMTm}8({Nxcsan}e4(xIxSe*K2aCs6`$FwYxF?qfnwuVTioKNJ_pfY6&Wwu1Z-9)MHR\
-Ah1I_G)c(cd4UjJyqq2hnni`s#WtrSNUu>nkSFg8G1mGm5>>YGL5@YVL)TYsm6o>Cl1|2W6&!`Jv\
-3NKB?f8PfQ6YXC2)EtNt26BToZ`i5#sP#qG7q4@!`ljAE_q#qJ4|h=&~%GJ?w&VLXK7KWNI43`j)\
-6sDlJE8OejVLXHRTdHcnx(E~0(MX|-TS@_O-fC<Pvmr77KCH`P6tv{4MqVkb{8iaY%O?_IC&?V{+\
-e;<f0mv6dz;bsc8R)rjpjNfQd%%Iy1al_*cXSw2;Qu1}i!LUqk*{Cfg*rbVPt$C?1+S+Cg8WyMWL\
-lC-QNNliiDss~2khqYSN(Gc{DE_cd=Y2Oc@m?{-ySvUTYQC+0tbh)o$BU8^DNw@el+|!KQKe^WPJ\
-A?{Yb$e2_f@Wn)unOqIgqST*y(qP7zyctum1YA#F{?nemVjf*T+GP=Fy<6bvgn=#eYjOlAC^|uwo\
-h^oA~s69p_^0Eb2le<ehHa#Y+MKzihbJ}lzJy^lu|8|<2km6sx#~L@vZ5WrfOm$c`c&#_)rrSl|F\
-eqEebZ%9_BjUTYH+9tp5H)qWN2KF0A-&bQjI9%*EX>AY$%3Bq5)vP_6vgY5Q1<!j$H;)b?bem`Kt\
-H=jfCLsyriCFIML{1t%D7Kpwbav6!W)-$p)BP@;!ztm%}rbyK-Q0~;)#(ptmKjY;ix6W7)}*pTnw\
-xCpe=O>do_JaqT%3R)GEG<SULR~??0tfXo+PdkI#PalOekK&nflnn{mPW5><sU++=ralM};x^UVq\
-H$j**wE;>zWm2dnFZ*{JgHXB3A^nqXPWBKssn1i#xSyeOKIy}jl!C-qp-43wA;Pde#fdd(1JhRg|\
-fP|n9AqKSU6=p`!4Xqg2h4#LYWxB5!H=ZBN<E7taoC1*leSp_C4n6*WaU!JwvkOX5$_^C0KCkxDB\
-&Jl7*2xUB|gpj#_VeU+-W`#LYx>QXk2T&w6my$Ra;ZCI1jBCs&V$*2?G9C$+)K%hjj?I(jEK8n0t\
-{K`Gk)Gf_znOEQC;X#v$*Xae<5^UDRRBgbWVge7J4YdxzyvZHMCP-?eky5sCOx*r5o7Uxsx6ADpk\
-+I%`e6y0(nM;?uBPGsS$;E-xnY1MTI{*8sMYjh_}cs4DF^a*Cj`%PSPl4Z7R4iIGGB9zg}3{_Sky\
-c<YYjcmWc-AT#Ok|bdt<&dAI4y{_H5|Ljn<P((Jt&Rp<O6nX}NQP4hRN$^PlP9t&Gf0Hk&<Kr0O0\
-&3Po}0lIE7AIRl{C9%Ir$t~Ul2p-Mf3c0u3;EyknOJTr)@5>L(|bTWx({Q#!zUHRd`U;nisULPEE\
-dbWlpZP<GCshyeP8yb7fq=!zlH=^es>g1X<5{HSTIlfvv0SI(i+GMyI}8^|tq^nCZO->sO?N+a!A\
-3ZNbv*QW{=@GU%llH)W0*n{W&D7v1<N^(N|Wi_BFAr%_{I>|ozMc{%;`%b>ES^(Y1xgKBW?(rR#a\
-E?sO(rYBhAC6?^HaDsIm?6h+I$I^OTs<CTA>R9<ibJXNAw#<$!6GLW}ETV=0orI2*i8iYx^3Hc(a\
-K%tA!m;6W+OSWUC7n;AeXFT6qkF%82n{?L?_f1JFgB$WBxB}_GOy^Ad7-{^c%(Q;-mMQ54=qELs#\
-(<$VJd#wZ*!@jxw+Js(e~T4AQ|g;qV*+qYOW{_IoG;Y!JGQAtCLhsjW5i^$vn)(>Fyk-?5WWNBbP\
-8nXO3vGCyH%0axSSl%wuR(N2rmd8g)tO(PgO11=Nq+rp&KcjtTMF6{0qgVaqKV$rYo*%*C`gW6D6\
-yX$e5JXl+2S&tD_%2xkJyQliaTIjx=~=Q`D)+LbHI#ww!Lrdo1Da@E35rc6v5h2K6;nYv@><h7@F\
-k#C)=4vbI;Q_><wi+0$o;IPn9W^6VUi-I_ta)-YVD*?{VB-%QWrB0=#>JuiyEIc8>kom>Dwlkxth\
-}E1enj#=c0@0W~@HfZ|Ni&s2NDa|nGqu85O>jXnUZ74g)~%!oj#JjI+m;GSt#uPURGdd`l+&DA;h\
-~RmjCpFi`>C)l5!0INmZknBo!LS@#fm$*$}u!)(~7hU@q`JGbyRbUx>+`ni)5o%&B;bRVsaTxEh8\
-Ys$mPlHj#gz=yBJBZ->gZ)N6ci>VhXoB4}J1T2E+%SkP}#Y!)5uEv_eL2syvdTbd%0bHPjLS7l2I\
-x=pJVMbjphn)`5>@;~0s^>x<jx+Zcj2&V<f3V|(_o>I>tbE_+cJ{Br+5#pqN)7pSYr?(8G-RX0+x\
-B!0>JS!Bk&p9M?bSg{Ea&8_?VBBMxB_ru0M3c2gJIZ+A&S~Y^mIi>@(CQ-n{gNsvA_(9t4)li7a=\
-7U9q4`xAspaeC=XL<@1fyq*ekq5<|<(%tVOR&CJbgGanY13Ap%v!iwf47VaVlE~kZ+YoD|GL_L%~\
-xyQHmg<BX1!|KtXEB&yVkspbdtrYt&)oCTypJzSVh&St3?jdqG+_2Y<j)oe5Ur&A|j)@iq+Is_oQ\
-Wm73kEf$h3Gn6|Pe9x1l5iu+PU{88OMQoUBEqFI^*Q@PxQ8NN7|;=>w8uszLsk*Yxu$)!K8>X=V|\
-HYYcW68V2ZrjIgRVthbS}(gItGZl-y=KXMtW^slPsP9UlZ`yGuuEvRKE{-n=MzezP+!3H=>I_p>9\
-T^HlVTw+?qMWq$+eK-YO`OlfVaK2+Deb2?=ShUb4fFKFam=lhxA%w}{-qAYeQIAW^#!bUKF^g0~n\
-Jmje?UeM_5<7J1Yg!A1Wy+MDc{J4@q@l2cAGM^>Er(q9Hr0b$lKw<>BeYeWI~Hni+JhSGZM+Rhe!\
-`X*HbffqvZOuU)6TTMmSYj%v+96aAD!7u)Dw4QF=}kt%CVkNaRcqOF;QowK2c}c2Cr|0Qt3!;o%X\
-5e1|2nBxrC8<7*PsYNGs|rE16cO99OHLu(bj0Ni#zZbm>`QV@ACsf*92gMh(SG$D@);XV6QYvg;e\
-*9A=Nx#V7;xfyNF7t)hQCmh@E_qEplQ3{9Mz>gnn^JX%sVk=W$YeEJ2|>WB1Rz!RAuwr69*pr%so\
-X?dykgio<v2h&N&@h658*`IULrIT4j?N@b(QX`2DU8<;)wraI!N`*VUpf1&t$FMPlRr9Ec8`kWqn\
-U-K&dv-n|i!QurUtM^$O4bJVtbHZxR;mkB)Nan&$&^)2hR9}?GnXQpoCIa6y<Q2EetfFlQ)NT@D>\
-niY+Mgt4up=r^<j1{+q{NL<dsk`d!z7cdm!2b;Ds4LT+T_=!rwYAEs}(yeS$GC^;)Lk}>|NZ}qo7\
-Hvae1=C+}h%l(%sjo+2V9drFM878az8SmDC#z4`$<|ef8_fYV8fQ_BPW;ZVZo0{$-eWp=(VWY|pN\
-C$5tS^+udW+Z^hW=!=p=xk0IrkS+UDp=JjR7yuOKAR>!8doS&M1iDHrYY%OK6{}rv(p^w-G=M<v>\
->^?|9^$Qxp>o1B9CgY8AU|~x$U?Qbdl5FE8F$Km)&_{7?aoM^JY`pB|j=BMr7h9!TbptmIT~6Au7\
-u+<N^nYUqy4M6Ev>UT36OA-#oE#hmCSRS(;<&4x>A#G8UCVO$jXcwGBBKrV0SD#vg*NrdxsnRkk~\
-YJgiYY^vb<w1bTi(k_E8Sts`SaP~cH?MHV3l>?-yCQ+3s|FYb<=vh?sXfLFk3OH>P_PH5kyL$dfh\
-_QWvw#zJ@1e*Y!Nvyw_<T0RFNpqP7}nhPH0&M+OiC~BQ4I+!)&UGSZCo$_Dgy>B4&~)HB~Gmhii{\
-YdfS6_LJxJ1jA~>aT!v(VH=MQh4*GAvp%FNFMsl@9j@!OE?b<o^9d*QXDsS0Tdc)O;SgSdhs6?wF\
-ttxpUW5<^WVA}8)5g1W(D+^Ma%S&RyTci$TOoQE{sq3}ynsG}23(u-j^{g5`oQpJOW6zKYT<<cdw\
-F<^Pg8dX2qFaBpWkSwkb2Uv$F42fp&*vufu22@4&PyUAs?R(tMoci3D`pc(-gB&b5ofGW??KgpTO\
-V#t4IHmds{#gI2bu<SrK3wHJfH9NFDl=TD$3_PHqi{CQpzzO>=i>*@%ns8T~~=1bd@^Swy$T%za7\
-Q<bCwl_g7v5<6!TYduCJ0>VLfpN?2ITz_Gb!3JO;W1PV}#TTd`POJR!JAuC%_Xbw(*C?@ehbug(!\
-MO@3BN{O7RtTfR_9wUA+GDV7SwRH?Gs01b>}vV(_Y2B)z9qT+u_%i!ufxfuUhDe=FIrb=aUOY|Qq\
-`CBQKP0$13w_>(3rG;|MrqEwoh6?aYIhCB!Qc0~M|4Fur3^}?$eY;ayQp0MxlpuT0@L);*FLIk?Q\
-cbN&ri!!*5RG-PtE!1oDY2SgL;IcFJdw+g%afb&`|~Rgl*?0EXgx2Ybxx`IpWVp6o0ET=;lI~5<D\
-YYd<F^q0yG1zvu4epmAL00E!hg>v|8Dr`qk?w+`eyv|sQvMI;{9Xf->nSyZ$A+KJoZHXb2|CA$#D\
-K`_}NGPooYD$+$-_V!(M1Y_iGaF|2gvSM~3IW`^;waGq@#w{$}ClF!}dG!}(J#XhuKppQ1niRLT3\
-VgllW(->;nqKi_VWkDvDbUxmLd(7xYA&FJU6lz#qf$@yQ0G1;v8L{rhv-5kFE>B9MQ;XLi<xt;j<\
-8N$zR3g`c{b1M2dV~YLxmk8(I4(Dk<PjR^a4}|mQoiP>t9J;<qdcOA0kA(BrwoXSsw{aN1>*4(B{\
-Fyf${aibBitYV>DV)Eyb2|F@(BAg<ze70xl%eV9=TYa|%a8kn^Y40ZI{LZe7WVgln*6)1Vb-nLos\
-Z<2Z8k&mRJ_0T^HuWic82q>fb*|_^S5v~{~h>t+WBkY{IziYQ%(B%HJ+z^hYR5StIxj&JpXq5=PH\
-N$H#gz)r_6<!G=u+qbWi*9w-U~OYCb%-!haqw++W-ewr}Fs($1f^fS)%nC?7vje$ImX2LxO@{~(L\
-=jX#?u`&tpsU;7RI-@C(H6Xn;(jALi`XZG#<{QEnaZJ&R8i}PQ6hu>+BCj0j<xBNfM67Iw'''
+eNrsvQVcVM33OLw0CigtNiUIBuzSJpIiIGmjCywLrKQ0JigqKnZjPGBiY6FiYXd3o2J3iyK+szvn\
+ws7lrgKi3/+rPz/PeebuYXbuzJmZc86cmG3AKuogz4oUBPPC+bwIflx8+/iYUc4eLtJSUjIs+CfD\
+6sKSQqX9eIyyB3yahTxVBeFsWUro/81ZzUR1ZVmS/yl+kyZKliouhN+TgzeyGMqt1tJEKf490fvs\
+5aAzZHnjAIsoxb8nHEGmCh5HZnOy3G6I6xUZkt+Thu/lwffympNlsRSLKBXh67IAedB9eqnLIkv6\
+945CPXpJdc9QrL7wn9+DhJDavM+b+p4jph+9vGjAIkrqfT7oe/Ks6v8DcrJ84X2S5iEF+kuVUmLj\
+VIU149qzl3BeimTFVo3wWRM+C/+uZb31bPNeBrt07906veVWt7Z7riQ1F9ZTQBV9hesZgQqC1oor\
+9FykbJ3TmimuLhqd4+i0ytdZtajhfpYD66SJJcu7F0tOypvFCp7qc1514nFp9YBwf+VuyRxzlvxo\
+KV3pCTnZ9lJSo1lNRrM07aX6ivohpZaWUz8tjafM0k5zYUmls3L2yep+l1ZVaHX8yb76MhM26Tk5\
+6cppsUwU9YxWpO3vIW+fo28fK7s7X7/Z7NjRgXqsaXrTDBxUc6w6qgbK6zUwz5WuX2wv78CSUhjt\
+ZGjffLfzEqnStAscQZZj3pSc+qosXV8ZaZY3S1bK3p4lq6po2LpDirdr/yKNNJnp9tI6xUoG9Vh6\
+6a2llY1mXlIMzDlqODZtBmd0oOGadr6s5eoBgxvryGRoFWXqqkrvz5G1ZynoTXcvaqYsrdjGcJqr\
+FMuOZanZnSUvm2Yf7qBe4sLKcJC2nL6EpaGjWq9BoG6g/TQZKfX0QP2iNKkiFyl5Vnismj1LOk24\
+zOzdWNN9DqrL1NMrtk9njbZXkdVtGyKtw0pLY8lLpUhLs2SlWcUyDqjrE2aMZiXUl2U1ba4qr6WY\
+PjZrlVRzX0td2YbHp2XmHGU99rNnFzdj3bNNMZGSYsUqslTTlk1fqarrItu6b32ne9KqPm2KpE+q\
+SqdPQK+VTbXPEKjZN1DnTDson6czL9zeYJyuSwhHWk1eVdqhGVo1UmiG7KXTpFmjPTJZUkVbFPXa\
++x6RllLStZeVZc2Tyhmr7aTWm2WczjoWrqsfLsUylxrbmiVVv5m9d5qsb1Gac5q2vAyrEVvXR94y\
+SumG2zKpNJauKlszo6tej30CqXRdGWlVaZalqqXD+fTitKKV0rmyaqyiZicyDAx1s/JbZRgm9lDN\
+0LdvGqFqW09R0d6wnqKuvptu29FNZItCPJyi8+rrPJbV02jYzTArMCM9LtCgCaKs0wTWWN3cjNGy\
+Tgda/yejzXLalakTIjtGkVXPXieQ3VpXXnXOaDk13e6sz9IeivpWUtL6sqxcjybLpOaxWB6zVqka\
+OjkFvdhhL6OqniUtm5aGlnMHxUOJ8ps9R5sqSE90yu2g1wttHFXpgwazVOflhDuzHBS7pfXIVLaX\
+VlaBDd9ZlaWqy/JjSTnYS2XKTkrvMNpQN/cty08rsq9uc1ZmSl4Gq57CPOmeqg7LnHLbN1a0t9TU\
+ttBlyeerKrNCpFTrsVR1wv2ddf1bnTxQP02XpWyelpPmrOielqarotpWW0pqsy4rncVycOkmZa/Z\
+vkFf35y0tKOssVn26YG2OtelikZb6OhKKyJCK7LSJztxxs9txWrd3f6slIq5+TwVVgN5ObT4x+rb\
+T5PLHGyv0UORVT/naKYuWtKyivPr6c1StK9fT7dIPa2VrrqWygw1tPlNpfbpsrr5GsouFPICP+Ah\
+fRAI93A/BP0RDEAQgGAQAi7UCUQQjICHgE/jcWEIBAgGI4hEEI1gCII4BAkIEqFeEpTJUKYgSIXn\
+YVAORzASwRgEGQjGAX68kFcimAifJyHIQjAFwXQEMxDMFuvTHARzxT6jJcGaD88LECxCsBg+/wdl\
+DoJcBMsRrECwUigPEKxFsA7BBgT5CDZC/c0ItghlNYICGk22CWUrgh3wuZD2911Q7hHKXnjeh2A/\
+PFNi/CCCwwiOwOejCI4jOAGfTyE4i+AcgguAu4TgMjxfRXANwW2xdxcjuIugBD4/RPAEwXMELxG8\
+QvAWwTsEHxB8QlCK4AuCrwjK4HvfqQalyLFJi32WQc+y8FkBynqorI9ABT43QGVDBKoI1BFoINBC\
+oA1/b4zKZgiaI9AFnCGURqg0hufWqDRF0AZBe7E+mKFnNgILwFmi0kbs73bouQOCjgi6At4eld0Q\
+OCBwROCCAMkFlhuCHgjcEXiKtdETPXsj8KXRohd87o/KAAQDEXARBCEIQRAqVl+AniMQRCKIRhCL\
+YAiCBASJUC8JymRUpiBIRTAMcCNROQpBOnweg8oMBGPh8zhUZsLzBCgnoXIKgqnweSaUc1A5D57n\
+08aUjT4vRLAY8P+hMgeel6JyOYI8BGsQrEOwAUG+WBsb0fMmBJsRbEGwVexvBeh5G4LtCAoBv1Ps\
+77vQ8274vBeVRQj2IziA4DDgj6DyKILjCE4gOI3gLIJzCM5DnQuovIjgEoLLCK4iuIngNoK7CO4j\
+KEHwEMEjBI8RPIHvPkPlc3h+gcrXCN4geCvWz/fo+QOCT4D7gsoyBN+oOkKRjEAa9D0ZKOVQqYCg\
+HgIlBMqAb4hKNenK9tXRsyYCLQTaCHQQNJEm56kpfBaK/5Zif9ODZwNUGonhjdFzawSmgGuLynYI\
+zBCYi9Vjw7OFGM4SPVuLfbaD545QdoKyMyq7IrBHgJQgliMCJwQuCFwRdEfQQ6wdd/TsiaAnAi8E\
+3gh84O++qPRH0AtBbwR9EAxAEIBgIIJBCLgIAhHwEIQg4MN3Q1EZhiAcgQBwg1EZgSBa7P0x8ByL\
+yiEI4hAkIEhEkAR/S4ZyKJTDUTlCrI2R6HkUfE5H5Wh4HoPKsQjGwedMVE6A54mozEIwFcF0BDMR\
+zEIwG8FcBNnSzOeNBQi/CP62GJW5CJYiWC52LloNz2tQuQ6e14u1twE9b4LPW1FZAM/boSxE5S54\
+3iM8kCDYh+AAgiNi7RxHzycRnEJwGsEZBGcRnEdwCcFlBFcQXENwXex7N8Web6Hn2wjuIChGcBfB\
+PQQlCB5AvYeofITgMXx+gsqnCF7C51eofI3gDYK3CN4B/j0qPyH4DJ9LUUkd18tR+R2BDBy05KBU\
+QGV9BEoylX1URs8NEKgj0ECgKfY3bZmqc9QIcI2hbILKpvDcXKx+C3jWRaU+AgP4bAilEZStoTSF\
+sg3tne3QZzYCCwRWCGwR2CHogKAzgq5Q3wGVjgicxb7vip67I+iBwBOBFwI/+HsvVPZG0AdBP8D1\
+F/tuIHoOQhCMgIeAjyAUQRgCAYLBCCKgfiSUUVBGQxmLyjh4TkZlCoJUBMMQDEcwAsFIBGkI0hGM\
+QZCBYCyCcQjAnMPKROVEhrmYhHBTAD8VldMRzEAwG8EcwM9F5XwE2fB5ASoXIliEIBfBUgTLECxH\
+sBLq5KFyFYLVCNYiWI8gH8Em+PtmKLeisgDBNgTbEexAUIhgD4J9CPYjOAh1D6PyKIJj8Pk4Kk8i\
+OI3gHILzgL+Ayksykm0SV+Fv11B5HcENBDcR3EJwG/52B5XFCO4iKEHwAMFDBI8RPEHwFMFzBK8Q\
+vEbwRux979DzewQfAfcZylJUfoHnr6j8huC7jOhoypJBgA6i6MiN9heChgjUEKgj0ADjiyaUWmKG\
+t0boWYdmiGuCPjdF0AxBcwQtZIUnZJB5qDRE0AqBEeCMUdkagQkCUwRtEbRD0F6sXTP0bI6Ag8AS\
+gTXtnTbosy0CO8B3gLIjKjvDcxdU2iNwROCCoLtYG27w3ANKD7G/9UTPPkL7DQJ/BL3hb31R2Z/W\
+jwHo80AEXARBCIIRhCIYjCACQRSCaAQxCOIQJCBIRJAC7aRCOQyVwxGkIUhHMBrwGVCOhzKT9v6J\
+8DkLlVMQTEMwE8EcwM9D5XwEC+Hzf1DmonIJgqUIliNYQWs3D31ejWAt4Nehcj08b0TlZgRb4PNW\
+VBYg2I5gB4JdgN8N5X5UHkBwGMERBMcQHEdwAv5+UuzdZ9DzWQTnAXcBlRcRXEJwGXBXUHkdwU0E\
+txEUI7iL4D78vQSVTxmMxS8R7hXgXzP8/Q3g3qLyHTx/otX7ij6XISiXrTAss6RQKQPPcqhUgGdF\
+VNZHoIygIQI1BBoINBFoQZ1GqBw/OXp89vuJK0aWTHRRTzZvdjd8QrKcd7HzhYDZz14ov1skUH/T\
+5/tbpQshHnPaHXtU74Te6bMJo0wmZSfdiNTQY30oFNgsOO774d7sb6WBxtsHhpkfiVedXLx/yGXj\
+o1cn8N6d1foyWXUg2zfTaVZKzuBHu4dcUrwQM3pFboFWy4OvJsio73hqfep9+ppvzpwF88xXSnE7\
+blAL6afvp7EqZ+qA3jllhjuzFfQ2+C+696J7pxfznjxremJ9J4PxSzcp6z+aobp3++n6Jd2+H2sV\
+MH2s99Ypcq5uS3ul9X7Ajr6ww72kZ/HDnL1amXo+xlt2F7IXXolL0Vtvt6Hb0LxNzzg6bYfVM1xQ\
+5moidb9p66I5iW1L9DZNMcs+zF+3IreTW/KOuduMQ6Ld5k28GLB5dGrn6+Xc9VZ9E5ur3tkV5NrN\
+dgFbX3ru9e8+US2NL45byc1bEd5A9abxgv082Q+F+9acMt/QUPNraaOGvUINklfumtxG3mPOt7jk\
+Dr2SlZ50tb38+uiTN2b2U5K9B2xVe/o9qOzorD1Demc6PVpeoDXfufWTqXvMHKLODdWzemvOt5gX\
+sHpSrlz5y7JAVvL4G2M6fDDr5Pdi/umXA+53PTfBe+ubpVaPW8psiNg6wyz9lVzj5MLJrwe0GTlx\
+avqBS34xHyyODNrZcsSnxuNO5S5jrYjbojC/kdxo3fD7Rn32bA/6dj9GY95/R7ifHLrptvAsmvq6\
+b3/7Rk0VnviUup9//TpDfYgX13X29/4+u58f75Wz4sOgRNsApcDrVmjcjsYHFI+/nzK1Y3rnMLMd\
+rx5GNlDd4m6YqJVgaRRg1yrge9mxBor3DQvmnZYrUvBW1Sy28VXJyv4Wd+TKzS6XTbnXByZYP0sv\
+8wqKPHGqzc0OEY3ZozK6jmKP2Laky6T2Vz5IByxOG3rR4orCK+WNqXn1Tm/ttDRgWW/2omGeblYz\
+350NUYp63a9h2AXtaQc9k6e8GJehoqI1lxe9e1h3J0/zvD6aOdYLpNu5h/435WaaZtnKkya7dp7v\
+s96F17fV1akeqikp++LfF65r1dVEZsYRw697099f/pbRKMovJ3FDqcWRl+cXtnwkzzZrOK9Bo5Kn\
+5RfzGygnLX/Ci+2ervDltZrdIGetAi03be/etu+u7PSfc2o779i5Kf0d9dtlHZz6+un0ay7TL5R6\
+v22eeOeO3UEtiwnqQ6xmdM5oe6ZXTmqgUuC+T0qFl83i8u319k/eO25u2hCPQQcXd0Zr1k+vyTLZ\
+OZru48zYJpELdmiOW9l2cYr1s0Zm3OucYunOevpn9biTL1zvZ6B64vr6hsN7nN/ayWNrap57xqWH\
+owJ6bzQbkXo+N/+/3K8pa54b+q484XRN5WFLrb2OY9d7l/VewIveELqwkV7BgWUXTpnO7y3tp94n\
+SLZJxPmQM10M9l7wHKavZLtcT/rUvc4FOhbeB2ybN3Rms81a6y4amsBKeV8Y3uzRDaebKqpds3q8\
+37KwMHL5S1PNrvebBnc6mP7+Qav8A7dfORTbjczNv3ghunUHx+Uv7vp3WxTt1H1V4/euWV8OTcpK\
+Wur+Qsm/xaJxjQu0vkdNfnKiPLz84XNlA676va9t51xz+b6uJH3AgtcTg/eahy5cNmin3ob2SXKH\
+J2XJtdAu7mPZe/B9m81j089tj217cFz3qYs8xuYXp86wNp7xNHe34doLffSaXDbKXacwlPW02XeZ\
+AYtWfJnWZ+LKti+iv/WaPmxQTLCtXGYrHRf7jm8WPNsT2HujisDiSHDCyr5Xr3VaEZOeet7OW+Vl\
+pxFrnq84ytPwVZkdF7b54em+thccS9YNMdnWxvDgyXilA/2cT/lNaN161IH3TmtK0PeGrdKTPrpy\
+qMEimWEjPT+ptjij4xrwhRN24mystPL4YhXVkremmlpNDIqub3GxKD/V4cioR02Dz54f1KTn1jM7\
+9XalTZiSPtbo2yOrZ9pXo1vPZdkZLe10cNEdxR3PV3Xb2knv8IaTaxJZ1gMjZ6Zsfe43akS2ZbBB\
+9w/5IVEe5dseyI/evTAxYczt+Mbf2dqFU1LvpI7w77TITaOLhvftux1P2I1sc03u2S6no6fDWREC\
+3wff84JKyzqc39r1tmOHA647eMa6ucN23np3+2x5i55RFkcO8Dhs2/JUKYukoYl3dugP+ZZd2EBp\
+e+KFBZ0uOGoVtN4zSe6ay5fWJy0sFgsesZ4u/no0Z6HJkhZDB8rZN5s3o/f6bhuv5Zu9tvmgsvCJ\
+ZqCWUr5sKGeA3e4B4UmbW48ZO0dq130z5/H8Q4WT7B4cXHd8/JTxPtmBt+UOqY8PYx/RbXKlbNY9\
+36HWj6ftOLPzVum8tM7PrZ4prHx7zTYnImS3z7zwnRomOurbx3g+cd7aqdnZXhsDj284uXHXhbOK\
+m6bkz7aOKv/KNp3Q19XBKvv56uc3ZFZf7TXvTuadj3151/o3CXdYFneX13bkhtFzJ51cNDNIEHiq\
+o6vN8sk+DnPH2na11i78tKrT5ItJdw1OzlfOSF8dNvRgmM+7oLtf3vpMueofstL0oJpUx6RbvZsG\
+P6nvywuIGBUVZdfqiXQ4h/1A78WQG2v7+Z1bmbnW+7vPWRf1T9taScXmSY8yiT5R75pL7KbBypv7\
+xy2qvyD2/evs7fo7JzQ6e+DoybPn2o3MC/3cYGbHd1KZ3ryp9xQK25sMOaHbZAs7PnV+h8xzcqO6\
+Tp490vpxyrKIEKucJUUzTYY7dp87fBn3Yq+N+7fablydvShhYHH5iOj7rYpuvF79XK5F/+YKTkOD\
+LXW+tv2Q3GCSmVLs8JBGfb1vzQ0SRNzfVXZixOAV6umPz35qH5h1xzW5R/rN0tE6RlE9Gw8ZnjBi\
+tfbWEvnpTrsXbJveckDT4EuDxqX3G3px22ZL/uRGL/QVuliPajXXeeKXWwVnC27lf2059mnA2bOX\
+fWT2Z98Zx5l5+tvOw+Xxrlc4bfrFtBptsHBUvURbXu677G47A7Ken/zYo+cyhTsqz1Y9Krx8Y3pT\
+x/TyDTKbNbeNPLBp5ZhFy7UK756Unb1GcV6xruomixZKUSEtPWKGPpKPNJ6cee/VOpXToVc6nrJP\
+CDFcPCa3T7lMoe3Ga/I7HozvP32KpukpxVDjnWqNd3tP32LSeo/n4+dhelueHWv5LMx73aNdZbrj\
+Npt2fNHzwp2WHR28Gp2IGqnx8qDMlqSD/VC9cq6KzIt2t5teGG+dEMQ7WfjWlj+5Xlg/+Y9tNVmn\
+wx5t8JRlT/KWM1CKlzdVniUz3Ucm97uV8b6Y7p8Su4YefBlwdkxL/dzu68ZklB0vj/+kf26MVOa+\
+O+9fagpOfR3f6W7g0ulXn+2+1aC/0velvNxlHRSCBI8enN7eaZeu8TqruGe3V2kV2o7WtXaLe+ai\
+k1VicafpreNROo1vPs68ouY8f0n+9HDeOq+SdkplIxrMfnj+bbMTiZ337T8SM1Z7XfQRbtL37Ztn\
+L19zdEZ4ytZuYzY/bXYxPujttmPdX55Y1/LptnFLrt/LLW1kkhFcP+d5zOWuDZoqXDs466xF1MYJ\
+rk9iZ2qtCT08xkQxY27pzIb9wl7rz+G8brOz47Hg4FEZL171nrnxTEmf2Pzsb7csDnv5JEx9ozai\
+c6ajs9mp1iYXexRlGXzmt5NaGX7prsqc0zMdk8O/rPbu+MA9op985yvtN4x2nW7hnqE3Y8T4XbZK\
+LPfNly5om99/9Z6lFvy4aLN0XMznZS9Czabop+7zi2m/NHL7/qavd98aoRQkUOqzq6xr9CPP+iN6\
+jJ/Ve7GTbE9j5fH5LZdcWCl3q/PK7usdF23PGrVqrebyr3leAw6NMuvxKCB7+9nOXKWhnff55IVM\
+vub0dPFa1b2PF2p8evslOiRLb8yV3LBDIzoaDAo4u+SCfKeAxXKZ/TuUxw9YNGXApilZiXbNTDKy\
+9xWpNdowYGvPQQXc/N0NXa+8lH6wXDfZhG2+s6O/TvMHt9yksxt8Gjx8onln98NanIdzE/Kz52rO\
+iZ7Atc9pm1DeYeMqzbH7Ghu3unixwadcZb2112bMM3Hf9MHi5Keobp/ujl9sfHLGfNbppk/qKdxP\
+dkga4WnQilfQUXGg1v2o5wvkTy/KcR+wq2yTvdGtVd+eWm032HQ0qmH3j+Ntdz9zEdhx7zpsebF4\
+mPYgU5NFYz5f7My9fy4rLe96X/mZa0Mmvz83fvGI78PKMq23DG/b1MNox/xHn15o7n3cRrHjittb\
+uCuLz7m5HDqUqqeq8GUaPzjgbNvwlWFX357UWtClPP5dhsz24DV+Y3069XxvahV+f37hhZffPWyP\
+FQR0GLlbq/WY/bO/X3XQM1/h12Kk/sG3Bf3X9JP9ctyys7vid4vlg6fqnpurM9U+5Zrn3dmOZ+Te\
+ne66cLJF80L/plNdG8oobnonk3JoXFhRRG+bRkaqV/oOGuQT2+FiiVqCyjHH/K97ljZ/NmbeU8GT\
+TvtK+Bwv43z1y8mm2W8TA02X9r6tPP6GZ4xnO5XOpyIsPw7bLbdWa8jSdmUPlh3QSBpibveqIOLy\
+442q/af+V9jxsdQzq7jlSfeK8t2VdNuGGyW+v7JIY6Tesw/3N2Rvv1DY16fH/lXxX/xfJu4N+FI6\
+NyI3WDkh8Mp7wesNXa0V1lqvano/00Lw5HZf+WSnF4+iWnoYfZr1obxRcopO6MX2Q84MsxwWlcQb\
+3mRlont2z5F9XVt1mtby1ODbyxL6FbxpY7bzyN75nufjDw1rv1x6VvOiletuvEqul9j0YIjlha4L\
+h32cHCQoanZ06vSWb0/01U7wPOWYP65p7tyA9+qC08Xvlk9VXfV2on14x0d3jqba3DJ4WZq5V723\
+U2fumhed9m38dPdS46H/DZp/T3n8Lo/Tsc6W06xKDB7MXpV6Ytk4k1X5EccOLrA0K3WI6f391saV\
+7cpClqnx3oTFPGDvjLhsorVa99zSwo4883CjmMb84X17xphHC0rNMjdZ6wvuWpa2XtbJffS9lktt\
+Hm/Intlz/6pBj5fq22m2VtxyIOBLvcdhXzN6cdp9KFXe0strR6bPhKZKWQ/ehck452380idr946W\
+07oldJW3fVp05/LWNg0LWqmtLl0V2fP02aCRA1a69A4NyDj8n67t/AMWF3qtSC67xz6hHTDnjvMS\
+j92dQ83MNm8822r1oQ5Lu5hqpFvKK5h0CRn6MWBh26vjGrfq3M9V493GiI/GJUdTFS+bL09U/RR4\
+Ie+4wfzunblppSueXuk7rPzlutKh/irtC70mP/XtN/K/QVZLN8iUCYLdd5w20dnLb3wie9za8Mam\
+j0/mq12O2NCsb9Ql36vWMw+3/dz5wEJFj/1ZERGJXkuD/eR3bIgqNZM1H/QsIg/RIV06uaOKe3j8\
+0wl3ZT8sbXIt0rD3vM+rkn3d67ke7ttSs9/x+TNs10iPTdrm7bq93RX9pwpyrlOVtsq33/3pwaIG\
+xY36eRyLXdPJMf9D/hbrbXJn806HLTnzJLbn6XpK+U2bWWTu/OSjPH5j7qvXY/j8PYeWB4zZmLWC\
+NWNg9Ikw26ULp5hGXGZteTDmv/7Z7S6svNZt339hRg8cTDUmF6k0eLN736qpewIvruveSpDisc2u\
++fXMvI3yU0ZrrDtusDdy88YH5alfyqS0VXj/+fp/OW+iI/c2rbRvVvM7Ghbj5Sbn7ms5KT/2kVaf\
+q9ZP9KKGxi9YlVO2ebve0sJmxr0ubzDOn/txztZv1h926WnNM90w/5Pdld3784t4jZsMMey98VXM\
+uqGbF59rrLBOp2v/sy1e2DvmZ/gdTfX5Ym8+a4K054D2ExZ4yNQ3XBtvmnEMfX/bi8WDrHsrj+eF\
+HZop/7LPOr1WFmu3syy8eVlmmdefe06L1+k1kO31Ze7p9hGXG1666TmyPMr93ei1R1ssWnXgiK3P\
+LqllYUbnrz4flSU30Kj+8M2C5eb7w5VvfTZrxvVb3/rz0g1Nh7a/0W9lQYHOY+tn7P37Vm32ecny\
+fPei8Pmy3C3BsSvu7vDeZmd0z+tgr+kpQxrNWHxV2e2eac6XIa/0pqxReXBrzLNlroXf5cKnj5h+\
+O9Np8c5H9i7FnqePL1/VReXMTet9PUe3yFXLn/K86836Fns35U0x6Nssg7N/64ktsY+6Rdrf1mm/\
+ouXm/xDtioY9zjXU3vQ5/1uUSf69TfdyTr1V2zNtdeG2xeeSDMKOOW4y0Xit5rN16O4hjlbSGvWT\
+LrUYcmjZp5699vEtDk5p3HN9ijT/yNcWmX0z7u1tduKm9ZE+R1Njmx03WMSZsGDl86BmkxXqG35+\
+s3hQxwNX9HeEnp25uMjrTD8HE50Wx1fcy52V+vnycvv3KkMv3LwSdbjf3ftGx0KU+kktGzbDeILV\
+m1L99bKZd318J7d70UXL6+5ns2ub4/jSrIb9I9ybKaUWG/Sepi2zcHB6fNAijmFR16XuL/drnaq/\
+Vr887vUZs4GXuz351Mc/9bBCsPWtFTOnNtz+XO+K2ewU9wfrlQeev5fptDctbtqEEs/TrYZvnDHf\
+RLZ0k3o/rYVXxhzZcGjGzTbbZAeUn2hXz2Zurm9i4IT937Iy13Reu63NmMcTn4Tpul/hDOt5Vd5r\
+eMLYbl/WG02OKBhTYKIxK0H9k4W2z9ZNn7IjlkezBqnZLymsnxpmLNOr2bUj8o6LZql9L+hr/PTr\
+dkWH5YUfAo0XrhjuvGb24NGbdI8bNFG4V3CSP2ula4sVLQck2Dac72KiY2w/ftIhjyVWO9RiuWns\
+tnKqDVfleGzi5D7o4PuyLHTlpeg3XbQ8+vTOUWs5d8sQM1nT7SUGvV2PfXu651CrgAtPd0UcGBSd\
+8tKoPG5VQlBsp8YKQRoHO5qebrRTV62NYpMFI843j+118vGEgU3mBGTsTonqPDSvw6mjT99y5858\
+llTP0Mj8BadpbGNOXumh48ubb5oiNVawce+ssaObTNvVtY9b2PvisgSDZIOQaEk29QC+FEudAe9i\
+zmLEC31yTHipQcztbOvOjD8job40lxlvOYIZv/kSM15Dlxl/SoG5/0LfPSMdEOgz4Hd1Z65/rQsz\
+/l0/5v58lPBeu5fM+PBhzHjl/lIsNQZ8jAR6+qYytxMroT9vJczjOAn0bCFhXanKM9c3CmKubxLM\
+jO8iw9zOEAntsyXQYaiEcR13Y24nWIO5/iQJ/cyVsB7Wd2DGX5CA1+zKjB8rgQ6rJczjJwn0sZUw\
+jyoS9vtoCXS7I6GdwRL2+1xEH6Z1G+XO3M53N+Z2xh5jrh/ny1z/qQ8zPq6HhHW1mrm+gSJz/eUS\
+2tkrof89JNBzsYR9tGAgM/5xF2Y8W0I/W0iY31mBzO1o9pewr8Vi1cX/lUtYh8J4QSZ8OwnrMz+Q\
+mb9JSXhvkoT+t5VQf20K83tdJfCBexLmZZOE/s+WsP6DJcy7d4BQ7jRg7fqGHc9sKubTSkqET4nC\
+DjXqu/W/4/oHwZHbgpr3TIxvoS1LtFOwBeO7czC+N5WXcBO3399criJGVrSuOmN8aByuT8W3trqP\
+24l2ka2I4RTFULzF+K+eGM8BvIM2bseOR/ZT9R7GZ1ni9zoD/lgZbue8Dzle0y24vgAcgA5UDM55\
+jLdtg/FGFH2Abh2jyPfmcIRtNmDNmylTEa8rykfpi+uPu4XrmwCeI4f7cyYL129A+URLgc4+ZPvD\
+FHA7/v0wnopLTl2H618EZ70T4HkquL7iQLKdXq0xfmQ4SYfxCzFeSQ6Pty/gdYww3jScbCcyAOOP\
+nsH4loD/dgTmsQPZ/uyvGL+ERn+jGxhv60jiW1gC3WB+GwL+SnuMDx+M8e0Bv+oqbmetA8abAn5H\
+O1x/Ho0Ore5ifLGFHPFe11iMz36A67sDviwC4zkPyXYE+bDONeWIvKlXnhhfdBrXH0qtk1SMH32d\
+pNuTj7j/St4YP5jiVysx3teYHNfeYxjv0hHjs6l9/RDjs1xJ+hRew++d3B73k1Lke8zD9dWbku2b\
+u8B6XoLXpzL43WWm4vq6EHTiCfXTB+P20y6S87VMGdcvvi9DjFfWB+MXPifxpicwvrwj2Z9TMjDv\
+XUj6fzfH+PYR5Pr59hn4mDdZv6w7rv8I1i0Vj3qyI8brD8H4ixT/Pw180hjTzQ3w3BiMz4B1ok3p\
+IZb4vdtfyxB840kvjPd/gfE2lB6egduZVYrb8aZi1Dvi+jlPSPpMt8f1myaS412tjvEzA0m8pz/G\
+y9PWm+M33H4Jjc8kr8H1n6vi8QoofbIRxs+B/UiNi10ft7P1rgyR4zC2EcZrPiT7f6kTxj+FcVHz\
+63Mftz/ASo7oT1E9jI+EQB8q7v9OIcbLNpYj5MWyTbj9MnNSHqVl4voLv5LjvZwNfOYNuW5HLsH4\
+L4q4/SxYJ+dcgJ7JZDtDegj1isZIgMgTeW92Hrh+4GmS/ndA7uzRIvlPYwly5FQzXD8pBLdDnSUn\
+bcX4OFk5gp5m4Rg/rQTXjwJ8s3hMn0IVSPAB/OEOuP7ZcJJvxGri+h0ekPOo4YrrGwIdXCm9SBfj\
+V/DJdVj2H+wLfYy3pvS0RRg/qyXGGwCd41bhdkY0xONqR8V9H8X4EAOM16Ho9gK3M7QHuT67S5BT\
+0xsxy5cVCRh/8zKJHzset79Ji5z3sFnQ/nea/JoJelFjkk8O7YTrG8SR9c1hXx9NwHgqNylmMm7n\
+eiOMb03pvddx/QZmpNyRugx8SR/jNSi9ZSlu56ShLLGeLzfH9Z+GkP1Zqc7Mn8N2AL/SIdet7Q5c\
+/7glue+8Ybwfga9S8yi7B+N1m5L7XfUlbifYnZxHnUBcv+QOxmsBvnkbZj3ntSdux4nW/7lDcX2H\
+t7KE3iVjC3wmmuT/s+Zh/Ftp3E89Sp+0x+0f/ki2vxH0k/KBpPzqMhnjD38j9+8OD7zfBxTidjxg\
+XpZcxfU1QV5Teb/6xzHe3hDjQwEflAJ0U6fNI8zXCh2SzlvTMP72B1x/FeB7x+B27tXHeGXojwzo\
+AyU5uJ9cwOccxu0Ugryg9POR2bidyBayhLyT1cD1lweS87UN5FQwTU7xxoD+9hnjqdyrt0CHWdrk\
+e/emMvPzQNAnv0eS730LdLYFOjsCfsYtjLfkYLwZ4NtYYTpEz8fttFWBuE53Zj5/qC2mgyzIO2r9\
+m4M8mvKVXIc9QF8qoulLbkoY//oexvcCfHwR8AcbWYIPCHNThPjBE3D9VtT6BP3foT+5Po3XYvxJ\
+NVKOGEjg/41tMB0uzsX4LMA/u4brZxqQdPiYj/Ej1Ui8RiJ+7+vnGN8I8Is2AD01yPOXYWfcTt47\
+/F4rwE8D+TUtnKSDXTtcP+OVDHFuWrAd9BPgV1spvnER6ttj/Dsq7/AQs54c7gR8Oxbj+wHeqwWu\
+vwX0H0r/z9bD+J6PSHoOd8T4/KcyBH9rn47xDzXI88gBOL8MtST58Jn1cN43I/nk4ukYL92YlCMj\
+4fzO4ZD1PeuBng96HaXfFsN5U8eM3Nf2oO+9p62T1wMx/gXYH+YAfp0bXj97IND5FPATh9F4XGwI\
+9KXWebodxveNJeXIw6kYv7qc1J8nODPbGRbNwHi/7+Q8tpuA++kN9o1gSh9YDnLTiNRbXLKZ9S49\
+Nh7XZzjXL4R4/5h7uJ32LuT6dAd7SOvBJH7EWVw/oSW5X2zbw3zR+InNNtzOZ+CHHpTdTJlZDr4A\
+eXEDEhKo9eN1DLez3YBcV+NAby+i6e0esN7yYD1Q+kZHkR0enSNmy1bkdoroEAZ6oCzGb6PkGtg3\
+uvUj5Vd6OthzbpPzftMC9GGa/naGBfYTSHZZSPGNZIwPAP5DyXGdONBblMn3/sfC81gKCTTNof8u\
+Wvi9B4PJ+rGglw43IOXsp1jc/su3JP2fzMb1rSFo/TW0nwvnoElwDqLyw8d/wu0kepPvtVzDLH+F\
++Qki+kzC73WE9t1TmeXsqgJmeXp5AcYXvCH3yzMOxgeBPKXsCUtm4fcebUzuI82WuH4TPqkftvPD\
+eOlLcL6Dfu5QYpaDF8fh+j3ukfPebQ+u/w4SUwyoeQT69AK5Rp1rdkN/pkB/qHPE5tW4nQbKpL1x\
+pQT5NUeCvBPmIInmBdYh1c6kPPzeFnCuoeTRu65wfgf9n5JrbxwwflEiqbeMSwJ7yyuS77XTZZYv\
+fs2Z5dE5V4y/W0rah+sZYvwUWjurx+P3LgP6+1D7F/ThZaAPU/vLZQzGdwH+T83X5DO4nWat5Yhz\
+/VI50Pf64PZTYT3kS2P8jl4kHYKjcfvzQF/tQeWFaDPLIy6cWyNo5/eXTrj+fZC/kdQ8LoXx1pcj\
+7GxsC8wfHGbh+oOocwGcU4rgnELp7a0XY3zPdyT/WQ/rVhv0t6mUPgD1R8rLEXIwB+ROEk2/tQZ9\
+KbmcXLcfYL8vuU7aIZuB/SryAal3zX4K9lg3cr/vPwl2YCPcnzjqPGXGLO/u7cXtbLMh96M16Mn2\
+ND3Zdhmu39eIpI8K6HVzY8n5ygf9tnwCOb+7hmP8nq/kevOQIE9facJ5OZiUv66TMF7vG8lvn3YD\
+e+YzUk/zA/t58RuS74UlQT9VMX4gxU/gverwXoqeBZEYfxzsqLaUvLgB/MqMtMutBz3N9y5JB/ej\
+GO/RgTxv8sB+FZSE8csp+diIWZ5ugXO9rhW5Hg7tw/i2tuT8bodz2QpD0v6wZS7GG8E5OgTwah2Z\
+5eOCaWD/1CHpaX8d4y87kHaqLaeADp3JebRvi997UUCun+PLMT5ahTxHjwR6WgM9m1LnIND/Hzch\
+6aCzFeMXc0j8Gne8L0Ztwe10h7zq2cDn4xLIdV4Adj9d4Cf6FXEXuP055RgfSOnJcG690I60/4zu\
+xbzfr03BeO1ymn7FY5an6aDnXA4m5cuzO8DHzEh5Kgv+nf40e3IbfbAzhJL4GbHMclYb5sVbSY6w\
+T8oNw/UnqpPnoPJF4BeTJ/Xw9xcwvlVbmn8nHLcTK0fKCycDZnkXAXYkQ5r+PDQe/AVPyPXZqivw\
+h/e4PnVX0PQQZrmpswbXP2BK0mFDP2a5WX8ExutrkH4HYzgHtabN7+tQ4AOgb1Ny7VAHvN4uj5Al\
+7MzLjXE7W/qR8+UJ+v/NDzKE/lYC/pF9xiSdX7cButHO3SPATq5Ks5MngR2s4Q7SDta+B5xf4JxC\
+ydPBqcxyMB7soheNST1cxRy3Y/pShuBXoQa4flkoqQc2A/91ffBfU+vfigVy0I/0R0SC3+GhOXmO\
+nt2DWd4NkCC/YmCdX6atcy8b4IeQaE75ke1h36X4kPynow+zHHwXhPvjUQz9ATpv7wP62A2M707p\
+mWDHntOY9PvfuA36nhP53pIBYLeB81obaj0PY5aP3nD+uqlM2iENdHD9XTzyXBmmCut8EEn/XS3h\
+fE3bv/bA92IfkvRXDQb95y6pp+0G/8VnPilfSmDf2dLsMP6gDzt8Je0Dxg0x3smV3EdGQLdxTiR+\
+VkNmP3X8KYxnwXqm1lUS2CGXwSUNHwDfFfSKYA9yX8iBvJgE8oKa30Gg/58sJfUZtVcY/9yd5Cfb\
+gL9xQM+n+rn0MqyTbqT8zY6A86ACaU8+D34BqzhyvFujQb48IPFfuuPxvpyG8ZtBnu4CfUCWFj8w\
+Ec6PkffJc83AFrAe+GT73mBXvPWO9Nu+A/4c3QbXp+5kigV+26Gc9KNpKDPLC0PQK94Wk3abO7vh\
+/GVN9v8QrIdgV3J/lUM/c96T97Re7IHps2Qmru8G9MkBfvjWmJSPXf2lGPn/DR+ML4Lz0R6qHTgX\
+v1Qi91HWOdCLwC8fS+070GOnwb5bAnhFO/CDvyXXj+ZcOMeBfuUF+M9zmfWu7hdx+zZtSf7cUA/0\
+zFBSb+kK+kAWxPNQ+7RTR2b7rRnoY4HzcD+7UvEzYF/SBr7tT/lfwC6h+pWU42Fgf5imStL/DsQR\
+TaTFEWVPgriORiS/DYf177Mev5e6j8fjNK4/ozMZN6XUG7eff4OkQwjwN5YfSc+1B4Df6pJyUw7s\
+w8PZpJ08H8bbgaY3bl0H59bvpH61XhH8p7D+mwD+/jBmudN4N/hxmpDn7vdpzPIlrh9et5ljMD4I\
+9um6w2D3a0qu2/gjEDcC9jpKH2jeDeO70uIrFqwEPbYBqW+7S5A7Z/WBb9DwChLk0W2w5+i+JuWO\
+b3fwO3wh+dg0sEuMq0/OV8phZv/vZ/BTqCaR6+32aOg/Tc+Uh329pQtJB5OTGG/fifSPPITzghFN\
+Xl8EOb6kJ3lO3A/+NR6H3BepQJ/H30g6zJwO+vZ3cl+oNQV+Qoszaf8f8D04F1hS+gzI66H3yPVv\
+fRviozikn/cryEG6PO0/AOxsQDcqvqI+xCtu9yTHOxjirIY3JeMcTOJA7sMFKS7UPXgQR5T9muST\
+LTYz+6ONL2H8GuCH1P6asxG3E2ZOs9+CfuvMJuPBosF+sp6mN5pBO+2hHTvqPNUft3OdFt8oOxPi\
+NGBcFP2/KjLLQb35cF6TIfvTvgH4ZweScY/S4Bce95lcnyXgVy0EPjyWWrcQP+NDi3NIArulN+gz\
+VNyF3gaIFzUj98uoWGY5WHyX2V/sY4HrO8I8tgX8EdA/C0H/TKPW8wLQq1uQ+mQs+EkjXpDxJHzg\
+S+HAl6i7Zl9OBL+wNtn/fW9gXXnS4ntBD/G1Ju2Qx+Hcal5C0s0N5pEH80jtd28es1wY4IDrP/hI\
++gFVh0Mcyzuyfc4QmBdlcr1NlCBHhkvg86+7gD02HuM3UXGDsI8sIf6KsrcvGgd2Bi3ST6okgZ+/\
+uwTnr24kPV+B/faiPMmfh1xmljvTCsC/YEGeHz/2ZebPR62xPtB7Lq7/nJKbarj994PI+BkWxD3m\
+JZPn3FEJsJ4bkvaBZnnAr2hxp03B/txZlqSbbRNmPmxoCv6RxyR+BcSZz/Al9ZPu8N6HxiSf7Ad+\
+kMxEkj56yhh/JYBcPyMhjrR1J9K+7VwMfmGI+6XipU+AvrTiJtn+XvAbqquT8qjNULAnq5N2mG+w\
+/pXh8qsOlH3Pm5mv7rnDHMf1HOIqh98j/SnZEFecQ7MnXAA6H3xJ2lvGnYf13JWMEzZYj9tZq06u\
+zzNe8N6vpL4xHvQiH5pexPcFu+J5sj/6EM/zHOLomoC++gr4/Bkan88AO15LeXJd3UoFO8kXkm4j\
+z+H68aZk/69D3LvRQLKfB3fhdsxo/sEJ0J+ZMqQewumL9cnucPGbPazD1+AnPUzzk44CvpRVTMbb\
+uII/K64PuR+dYbyPId6eiqNIh/XGosVxJcG5Y9oEUt+Q3wx8m03u0ymQR6BMi7c/uh/4Eti9KXpK\
+g/1qujkZd/G2KcTveZH7gg9xuYb9Sb63ujHGS4WQ+OGdmeP23UAP3Mwm7Yd9rEE+RpHjsoTzxUfw\
+51LnETfwRzSxJce7BeTIRJp/vxjkTixN7jSGPJEtNDu2IfgfZ/ci61+bBnHCYAcwpuIrQM90uU/6\
+c9VNmOOvXCGOtymsK2rfHfFlPo+z+4E+f4uMF40HupXQ8npCLoBdwp4c14nWzPz5BtgZvMHOQPFn\
+I+inHPST4ntSkAcxDuK1qPjJcRCXu6UHmZ8SC/RcSaPne7CT5Nwl7VEjToD9EPxKlH+kZCPon9/J\
+ddUb8h2GtSfX1V6gz0faufsh5OPsyCLjnZwl8NvjEO908zkZz78I4lq7NCX5yVwb4EsQX+pCjbc/\
+nl+ncRg/C/hMKeTdFIRhfALUL+2E5X7xAoh/o+6thPyR814kfzsO6zDlKymnroL9ZBGcF6j4w/tw\
+DroPeiy1rhJ4zHw+eQTks7wj9f+kL7g/nWj7aIknMz+PcsH4ULgslfJ7agD/saDxk7gVsM5VyHPQ\
+RvDbWtD8thPBLm16m9yPm+G8dtOTHJeuLJw7epP6SYeJ4BcrI+3AhY1xO5Y0/ecU2H/GqJFybT34\
+o8d1Idft8PcQ59mTtJ+8Wc7Mt7tRdpuWpDzdBuc1e3XSz7h3J8Z/tyLpmTCbeR8lDML1x5STcWLb\
+4Dxi+xLXp/LFToF/5KMfKe/qPWDWJ+sPgbyqR7JEHNRz0IdnWZDxQjshvyyNll+W1AD81CUk/Tfn\
+gp6jQO7HbpCPkKFPnk/LXmN8K0+ynx5wHo99TfpffCDOsH0SKR/btAJ/XxjZz94gf9u2JOX+WEeM\
+f0LTr05CflCPL+S6TYQ8rGgd0h5iexD0eVvSHqhzAPQHW3LeTz6DdehG2nMmgP7ZBvRPyl9ZEALn\
+Smmyn0MhDvBgQ5Ju7ksgPtCA1Oez4Twy6yTZ/5GKzP7Hz9LMcX3uGcz+rJFg59zOJ/0RipDXcJ22\
+Tnwhvn3JJFx/F3WXdCGu38OKtH8KgjBeEX4oh/LLq4ZBnNtFkp/0WwvnkXayRLzBihngl2xMjlcB\
++OQHiDOh7Am+4E88f4qMuxsA53pvT5JvWJ5h9ofqQTxtRgyZ72BzBvrTkpzH3hAfteiTDGGvcILz\
+clstMr7l2jKQg0qk/C3yYZabb1cz+9EWlrAY/WimaRh/luYH7wl21LO0uLgP4E8pGEjmK+2G829/\
+iM/pQ/EH4G+cF6T9YTPEaR96StrlvoGdxKGE5J8asC+8zEj/wmqIj3WYB3ZsKu8D4ntLaH7zV5AP\
+VVJKrp9QiNuhy6+7OszyKAT0vXCavncF8o/a0fhP43HMdqrZIK8XfybteCchfvgm2Dd4gH8A/uWd\
+N0n63C3B+AnW5PrcAPJ3RW/Sz+sG8WBbY2l6I/jxjcLI9rPAvzxOhZSDt+4x2wHuQ57XWS3SzvYS\
+/F/2yqRdy0SC3HkNeX9pNL0xD+IiLj8m6bbODPyYL8nzY9wG5vgxRzPIxxxMrvNs8HPtb0PqGwmP\
+wV7dnfRPGcL5/eM5sp9pH3D9gV4kH7gF+do9HEl/31Q4p7+k6XV3wO43/BNpx7ACfYDu33wEcc6Z\
+tLzdC3BO3y1D8hN2MviLX5N0cIT8o54taHma4H80fUvKcUuI69OEfU39Rlc52Knu+ZLtvFFlliMd\
+IS/1oA5pz2k6AO/3q3Bx/HvY7/wHkMdqTY5rUyvc/mmavVEf9IdOLSBunPKPuzPLnW5gl/AsJs81\
+a8CvzW5D+q+XgV94/UjghyAHvSBu5MsdUs/PBzkylrYfXQwhLiuMnJfRFD3tyHmfBPGKyzqQ60oe\
+7NibtEl7bLuzYD+B+GEqTvgaT4J/B+xFQaYknW+D/t+uJ1l/FPgLeDR/wVM4P2pGk/irO5n1zFPg\
+hzJSIP3OJxeDXNMn+dINiL8KDSfttN+Mmfm2POzTDrRz33rY10/Pk37VDxBnO8+I1HulIK8npx15\
+Tn/6BOwqbuT6v7GQWU9Y1AT8mCE0PyDw4TwVkm7nYX2eLCbjLk7FMvNbI7j3QLMjycdMIN576AMy\
+vn2BBD7MhfyRM7R8wCkgv47T8l/qg59FpwEZb7AN+NgKY9p9DlagH9LitfoMZObzDSEu15Hmn010\
+A/3/FKm3hPvB+bqMtNMeAj1zSjuSzmMdmO0Pjjxm/t8L8l7P0vyMutBOEk1PaO7JzP/fgN3JwZ5c\
+J9Mgf8QrkmxnvynwcwGJ3wP6z2rIm+hP7Ws4D3agnQf3PsL4264kP4kGf9DzOFLvvQN537efk+08\
+Hgnn4vcYT+VV7SuCddUM9ycY+M+ZUUDnD2R+U9IusJ9APAPVnwaQfz2PxmfcJfD/lwLIO5Yn238l\
+Ic4nC/y8+yCOMYOaR7A7PYUfNOkH/V8O+bkHID+XijMfBPHbiiwyH/8yyAXDYtL++Q38OPVNyHzz\
+PWDHk25F6nvd4R6Ph4NJOsjNB77UjGznJdw3Mu0i6WeZ4Qt0+0rayf1A3n0wJddhMPgFmtPir6bA\
+fR2WL0j6e4K+sfg1eR6fCn63Jlwyb+WmCtjzaXrCUglxOM2vMMfPe0FcnDktLk4F8gtuqpJx/hFg\
+/1msRsZbvoFzzTSw2yyl/A5TID9Uh2zfYz+cK23Jc3RnE+b7IjTBruVPy7MYDnaVpR6kXGgJ8T/e\
+kI+/h/K/mIBcoN2X8gjiFfNKyXjgtaCPFdLovDGEWQ7egvU8UZr047QaC/HbmqR975gGyEFaPtFp\
+uIeKHu+hBnrUyKGkHjUsFPSoCyR9hgC/OulKrsPWQLcG5mT9RnCvUaCAtA8bgb23/z2yflQk3BOl\
+SMZhjoL4nDO0e7RMt2P8ukZknP9tsM8PuUvaJWbDuh3cjpQX9SAedWwQbp+6B6yPFrO8Pgh2p0X3\
+SDnClyBnJ0Lcy/i2pD/iBOTDDtYm+aEi8I0htHuKSkGPyvQi7SelPYH+NH6ix4a47ghyXHbgd7vn\
+TZN3kEe5UJbUAw8PBr+/AvneILDbXG9M9n8NF+NH3SH3oyAF7IpvyHZS4bym7UjyB0PgA4ovSH1+\
+L9jz174j61tAvMq0u2T9kXCPzRotkl/128QsL87xIa5YmrSbqUHcmr0e3MMAeBvIp541DdNfFvbR\
+EtCvOG9IO0xBE2a+7Qx2Bm04Z8VTeBvmeO/L4L92uk677wXiNvvT/EdzQK8eakTirdUwPoRm71r6\
+jsUYF9fyFtDHkfTXv3oOfjRTct1OlSBfXkH+b7dJ5D0JhpBvFUi7V+pZMrO8OAH+u889SH1gHuTP\
+JtDOxTqQv3/9I2lPGwh5YR7apNw3hviEvl1Jff4ynF+GniHzvk+D3fjQSZIPtID8kSMFZL7VzTMS\
+5FF98F8MIP0UjiAvhoPfdgulb/dnlkd9gO/ZtyPvIwqTII9sJciRZ1Fgj4V8ojtU3CDw4RuNSHtO\
+I+jPWto6Pw7n3BlwzqXy+56AXf18PzL/qATyfNfT9ExnuLfwyU2SPp96MMuv4nxmOdVlAuSllpH6\
+UgTkMw43I89Zn8cxy69LoJd2CSLPQXOAj21/QeqfXqBXr6b5DaevZ453UoXzzi5pko/NB73082Cy\
+nXWwzsdRP0gH/MoM4oq/6ZN+/OZZEA/wjfQTPegN57UyUr5slHBP2of9zH7PUIijOESL57zXDPxo\
+NDvwe4iTTwol9Y0dYNfVKSX9/mMhzupJAEmHe5DflxlK+un6wD1Ome4kX70D7Z8EuzF1nhoB8fba\
+cL/QaWqdQN6W50vSLjca/PW3ssg4wK8gj87S4vpug90v7i1pZyiB9ZlWQvJV7lDmew+egt6lOpi0\
+zzSFc1mhHKlfHYT8HS1aflwjsCPl0eI09oIf0D6GtMMY92SWI+Mh/mGdJslXtaQgPnAj2B9AbkZA\
+PEyDd6RfL2k1s3zZAnyDfq9mKNwj91mFzIvJkyCvwxOY/YMekO/wWZu0t9/owCynjtvi9g9DXgYV\
+V7YK7PkuVmSeVKYP8BPa/W+b4B6ACbR7AKQhLosHcVlU/HAbsNOmWpHzKA9+5FB9sp32c8C+3YT0\
+Zx2Be8C8afH/eRmwT2nnjrhtwAcsSLq1BXuCbBOyP0fhPr3tuuR52RnuNYq0J+Mhtxswy5EXsN8f\
+OpPvHSFBXlwCOaWqQ/LPAIiz1dAi+ZX1WNh3X8h449nAt4/S7jncPgr05DLyXNAG8hq+0uJCl4Nd\
+yxrOfZspOQj3Xkr7kvtuEuSl6kJeqi6lR8F+WahM8rEDkI95/A1Jh/4S7n8TQN5cAOTPjqLiguAc\
+sTKC1OdlwC8f7Ebqh1dB/yk5SfoBfbtA3tAHMm5qnz/YS2nzGwD3Myy3IelwBfSZvu3IdbUxgPke\
+niES5Mt80B9CbpH27S5wnh3iQep7zaH9PNo+LXUHvgR2RUq+5++F/kCcFRW3sPAm8GFHsv1m4H/k\
+gN5ylLJXgN9ZVpWUFyPWMvsNlcAO//IReW4tBX3+EM2P0BDWYck5ks43WzPfV3Yb4hO+0PTGwlBm\
+OeV3B+xdTuQ6aQHxUZkfSXruAbx8A1q+NsRFH7Ug9Vh/uE/4MO3cXZTE7NcrgLhB2fekfK8vQe40\
+gfiQLgYk3SIgHpt1k6SPsi3wQ9q+UwA77el3pPzt5c3M/9VuMN9jcAPihS6Dv4aKV5kE8dV5NL8t\
+D/KDykHPofzdHeBeoHDavUDjJfB/DQHwjRIyHiYP+t/hInnfWh+IX9V9R/KltPbM94k9gvjtEJrd\
+Pgjs3qdo951ugnuwHzwg5XI47CN7mBfqfoPxwJdGniTjMS6Afl78gjwP6ku4T6xZL2Y+z/Zl5ueW\
+sJ7zPtLuTwD7w0lN8v7AAxD3rg5xqtS4uI2Z+eTshuCHKiH3u64Nc3xRF7gnJxbs2zuouBSw/8x5\
+Q7s/CuRCIOwLyj45H+J782l5VbPgvoWbRuS9oKPhXL8f9FsqL3LHAGa+qgF6r30Zua5OwXlHO4LU\
+bx8fYvbbhgfDOpci15UC2GnDS8k85bNwb1IO3HPyjfJTOEOcDMQ7Taf2ey7wW30yL7ixETMfDoa8\
++OwVJD80gbybw21J/vYQ8miy4R5Lyo9wH+L9btPi/VIgLiWzN+1+DAl8+/o+XP9ec9JvtQviVTRp\
+8YFH4Jy46RtpJ/e7y2LUxwbBPSFZtHVraQ12+zfkeacRxFUe5ZDxbMPBjzaD5kfzhPwUawvyfJEF\
+51AexDFScU3t0pnlTiT4eZNocQgtwd7y8R6pv93ZxOx/tIPz0c5Eku/VkyCnWoL+EA76A6VX14N8\
+BD/aPcxKhyBOGPKgKbv6VNATOqiS93F1HwjxUaAXHaL86WAHKAA7QIW9AuKulfRIfSN0J3Mc3Xmw\
+S2jQ4l7aQ15wi88k38iBOM/1NH8NC/S0BJqepgj8xNiY9GsLII7O8hXp9zSRgnxtf9LPZQd+vUJD\
+kt/qwblyjikt3xDOa+csybzFwVHgf6lH+jdzIM9U5jZpj7p9lVnO3paHe7ZpcaSuIyHul3aPh1cY\
+s5x9D/xKHvKAulHrB+KL2rYg9UMDsLs+n0je01sG9sZBA0i6XQC791x9cn/1Aj2nPu1eLMd0ZnmX\
+BPx8bRktDwjwsTS9cQLEYe6i3VPhAHFKJyfg+pehnx1AHwu5Qa6H95DHcbUXmZ/rchD8pLT7BNjl\
+IGd9yfoP+sC9/bR4hjZwj8da8AdR9zNrgF1loREZZxWdz3zPpzfYl3LmkXEXBxowy/ftIE/TaPYH\
+ZQly/DTE3X1uQ/o7Zg5hlu9usczy+jbksSp3IPnbOqDDovvk/UVt4L4vI5qfQprSG2lyP+Uqs75t\
+VAx52U5kHHgjuC+ljGZHXQB88rouaecshfyX8KZkfmviIebfFVoNevhnmh14WgBeh8enknHj2inM\
+eQ33XzLfQysAu3HbIJLPOwGdO9HyhUfpM8vTcQXM/sSXcH5/HEHeI1QO/FC3FclXXcCOEU3Tb4Mh\
+X6A77Xd2FsyGOKsmJF/qAfnmb0EuZ1J+W8i/e0m7h2Ex8EM12v269cEP25/mj4gOxPiP38m8j7EQ\
+/3DxNanPn45nvh/MvoDZ75kGeoU/7fd3PODeicNdaL9zAfNb4E7a09JAz0mixVkNTGaWjz7gz8rp\
+QdJnalNm+RgM+87lPsk3FGG/D2pDnh+32jLbbxXA/rmpIUn/Fa6YL3mtxO1LK8C58grECXcj8zi2\
+wn3gHJqd8DPkGW1XI+1voyF/ip4XJgtxbtm0+4rPgd7iS4t/iwQ//vMgUv6alzD/PtHaFWBnMyb1\
+dm34PQJDsBPGAH5lBnN8O2sXsx+8VSizXHOE+PyspySfnKHBLO94cB48rk7qaWeoPH2aHWwH2ElW\
+0/ThB1uZ/ZsTwP9I/92iLWAHKwA7GEWHpfA7Bc1p/uWXEM/g1Ii8/3MzxOGUh5Nxtm3hPkzLzmQ7\
+cyFepQ8t3iNrOPP9tP0lyMFFx0FP60i2sx7u+x2pSdoBrCDeTxni/Sg5rgZxL4W0uJcNXszyax11\
+/4kmeS4YCHHFdH/0ZB745aXIeAOeLXO+wJmezL/b9Qnu5bjeglzPQyCurGUbmnwB/8U8Wpy5sgS5\
+87wX8++CnYD4/9e0e0h80Xkql6XKMrWXE3c/srz8meVLDPwe1gpaXL2VCvPvcxlAHC89rngJxM2+\
+oMVt7tZkliMN4F7c88D/qTyaIMhnnAL5QXdgAJ3BvzzjFO0eVzjXL54N919R9cHu2peWL9kL9u9t\
+2v1gW+DeS3pclg3ET36l5QsbSri/a7Eu8+95vYA8i7TuZPzGLPidmre0e2ilOjH/ztdAsAMEfCP9\
+qnOy4L6RRmSchgH4AbM1Sf5/DOwGqi7ke7tDvHcJxAlTeQTbBjLfk7k5EeSXKmmP2pcD/QR7KbUv\
+FkEe8XoOec5dqMP8u2AsLjcsKiaaG58QFJfA5bK4bv6e3BB+HD9MEJ/Aj/P3dIyMieb7BwVH8vHf\
+mP/C5aUEcUMF0UGRgqHoY/+efglsNi88KI6bEBckSIh34zlbR/KjwxLCnb3decIKdujF0Ynoeyk/\
+qujADeMneMUmCKKCIh1johME0YlBCYKYaJe4mCi/hDhBdJjoZUHoa45s5yT8ZhsubpbNCQ6KF/DQ\
+2IQV3XhV+yT6Ivqmm58F11n4Ql939IRaseD87L21eI+zQFC7DjpRQxN+oj6417wdK1EV9HX0/2he\
+bCqL2ys6WRAdwvXlxydGCacRLQNeBJcXHsENDRJEChdHSgo3lh8XHyOc2oRUbpL5jyePwx/i7OvO\
+w1SsxVDZHG63yMgYHjdcgFahE0d84JzaTjCt0dovFE6VhVKb3lhwPbmoN0GR3JCghKC6GRRa/d6/\
+1CkO6hQvJhrVS+QluKEROjsn+XP9bGvbnrV4e9ygxBTxNtG3OFy0xCLj+dyE1Fh+XffZL4FjHhoT\
+lxwUF8IVIGYVlBCDvh0kZBZ+CbYhiIEFRfP4om8IOZVVZR38Bn+uM9sqRBAaihghqijqozOiLSYv\
++gbaABXf4QUl8MNi4lJ/3JxNlfrO1HShr5hzub/UKzRg67ig6JCYKG4Qj8ePj6cPW3zLIjoL4rnR\
+iZGR3NgYQTSq6CYkXbC3f+XoEsLjYpLRKg1D88CPi4uJA7Zd81myE05SHB8N2tk3Kqp2bdigNkR7\
+xbuWnWCzhb0Iig3iISbmHFVL/lnRjaRa73w/tGBjU7nCv8aj0SCq+tn8Ch+J5ydwQV5GgRgORhI6\
+WrjKeOG1bNhcOE5BfGxMPF84VFGrcXzRkoBPfCQ0qDdEJ0d5CwkSEumd5EetoFgBn8dPFqD9XbFB\
+geiW4UHx4W5RzrxI0TwgBJcbGRaJu2qL9gE/AYkethW3O6rHjY4J4XNRt/mOFdz/B3UqRWNlJVuu\
+Z0wIF22OMD5X+Go0dOGro2iNccy53nGCKD4aqLAW2hmRAl4qemto9SqycUX3n9a0Fc5agnA7JFWr\
+ZWH9OD6a5xrXx+S1iBJEI3L7uiPOyBH+B9205qH5jI6xDUmME6k2bpF+CVaiRzePSLYzAnPqn7NQ\
+dYhJjK7oAnw3MuGHX4pEL0Nsxde9px+38jX+XH9zhBZiLZBGyeb6C2sR7VazT5ZD+XExtC4hBgnf\
+5SYFRSby490iGetV8xVINYxMchYRT0Q2tjXaK9HCnSEQftmdnyrSd/zgr2y00oXcPZX2B2rVV/26\
+cBugaua0euINiVdBfRXERwdFV1mUbNFWSBBq41x+cAw3nB+J1DY3D4G5cFOjCUCbumKzuKH3xAYJ\
+ENuPCnX2CBYOFBVsoYJToW8RG+0n32XYm3XVIfbvatmpdkN1+m1Ddao6VKREVbYcJFT23KrXINOM\
+/EJjddkzp7rsWSXNoKqoDbco8bqoKSEfok2yHz+Sz0tA28wZ4flDEpEynhCD2GSlfOrpZ8llEh6i\
+PyDW68QPDUqMTMB/DBH9lfoTA1fGzdmIDRSErnAoGNjkxP01I6qcI4vE6Jg4oXEhhBsVFOsWFVrZ\
+N1qfg4jpJsjyC43URU+c/roJcqoTstQhoxb8gkwS/A6ZJPhtMknwCzJJ8DtkkqCuZZKgLmWSoC5l\
+kqAuZZKgBjJJ8NfJJMHfI5ME1WJ5gh/LpBo0Uhc9cfrrJsipTshSd4y66sGNbUtgegsPm1Tvay63\
+atZ+Hcq22gzsf0pWp99HVqf/KVl/XdbW7KV1II9r+sI/PUKnPz1CCbK/aisVL/Az5zK2KGRmltVk\
+16iNCoYtfO7pZy2JZVtLZtnWklm2tQSWza6GlvBvjF2iuKreAhIfQZXRiYk19NmPzf2h7vG7Xvin\
+R+j0Dy8npz9O7DoU6eKma7YF9eFX9aNqtFqXWlG1B/E/IJxTXRPO6X9AuDrQdqrxqrrQcar1mj8z\
+Gqc/MxpJWoz4dwmuS2vn79Fd/uIRSxYxP1gidamn1Olr/sxonP65ZeL0hwhbFy6IID9nr4p4tb/F\
+OSMalAv3l21h1SKO4G8izm9SlUXv7Mb9V48mouF35/4BnvADQv+9/FaMvGyOa1AU3ys4nh+XxI+r\
+FKRUoJN5gvAtogBOob5nwe3NYXPiU+MT+FFcHtIDI5yJsKsfhjmJS9AfBkhZWKP6wgZEoVECsdCo\
+ii9W7YhFdEwyrfXYyF/vcySaW7JLziK9V4wu/lyciBATJcxxEMbLuvXwN+cSkWfOzpaiQFockmbL\
+dfOz4/o5iCLU/JyZZgIoVWV+JM6NOfNAzas/O86M3fizL6SUHxKLiBvJD4pzDOKF8+OZKnAsRBX8\
+xZmfKGmEsTVc2Q92MVMVJ0bys82FAY/RIf6IDH+YLujV4TGJkSHOKQJ6fGQY/9dXOeIbVAwlbWlX\
+hFHaoDVry/Vnc5m6Z8sXxkEKw029rRxiguJCRDko+FHE7epA87LgR4fUQTOWoQLUjq+fFZd2yI1m\
+iv4CmthxewrDfyvC3YVxwIg4fUXUca5UeWrfLUFKRZ8w2SpJKqhKb5vEBIEwU4Yid+XXKv7CtH6t\
+w/gJ/vy4KGEKFRZeYt//Jc3vh5NT/WaqNzmCupmc6neryuQwUJKJK7GFtaoqZNQeETAxsng0BP6P\
+vhT6RzVR0dBtfn19W4l4bh0skR839JuoIP5S2p6yTIwNQbu0QprAPKHvCWyF+VfCl1pGxSTxQwV/\
+QJ/90T6s0xdRO9WGvlP5Q2pkCKzeHu72J84ClUs9Ojmqcq8jHYgKsccIUA6EmSiQ38HmcHsjbZ/q\
+N7UE0EuEDVf+VRAVGylmWId64hafmjTErt63HGvVumN1W69U6ZNEtSS/XlKF6o/DqyLzsIZD8UJa\
+fDVHU/kOyQP6eZ3KdmjswiqOz0PMII7OL37YnF1sIjrkBQchpc4LIX4gG+t8x0nokZUo/+snM1vJ\
+jCrzAlFnvalqFd8Tpgxhm1Bl/2y4XLTVo9CepbpIaaN+jjiPhUw2pFf+8VtCsMBGdOPFJCaIniLj\
+3armqiGOgJgOzmiLQdTkB0W58fwRA7Hi4lxF1AIaZSRTnhvTd/EQkLotIlxMZLyzt4uvX4wf17lq\
++mTNRhQb6yyo7iJC/Iz94/n9QyZZ8WVE5NNZkquz2gscbByxVfPYfrnJCvr+XooQ6k3dGzKoP/w+\
+Q4b777IeId1O2Fy8QJiWzI+N4YVXJdOPMwXZVSlAHy9TFmFPtNurEACN15aL/ufA/c0WM/QOa24N\
+0gqrWs3cq/9NxgxMtkVFuiMvKF40rJ82JMrLZBwTateOHy0yTwpC3frGxwmXoYUoW1yM8KgrSdi8\
+asutoHhP4QyiKamwQlR0kSPMbRfvpEjyV6+nVTqKOk9ZTJ2tuXjMEoeDthXVMbxaiH5FCerIOMO4\
+M0V0qCQOfTcLSSf6gyPapk5ctFOr9u7nqbXV3SOWjHvERrhHRMoE2xqzXkES31MQLYgKSqk40nqT\
+ShKqbBNFVqlagzqJW6Aztl+i6DqCmLh4zKPdK+WaXTz1NyG7FfbUMl4wlE/XXKpWQ6eBqJ/VET9t\
+Sa4lLuRIRUisbqVMZ3MpIVwdXcihWrrQz14E6hCbA2TnopUaW2lxCK1KfmHKd1CKWygt5fsX+4GE\
+7E/JCaoJ5JzTOsCRcKVObS7SQSu6tnfpYLZtKW4x4iD9L0R4s48LOiM716Y/oH1YgkYZSqmjDJqn\
+6P0/eoeI5qJBInWG6xYTz/WK5UdHIQVJtJzABJkQg68hcrAStQJ0R4qyxE5KVnltuD/qEaIVErIV\
+fP0XFeGkGpAKKVxwA0W1v0IpxzCz5qEV9zXVdl79EmIjJdeQ3KiItiKqCf3u3u4VhtOadiLWo2LB\
+su0qt1AfQbSH6N6P2l9E5S7xjFHJiDlMr6yDW7DsBPGouehfaYJd2UYddAi4ZpRkrmkRzU/GIXai\
+pV6rCxJqeK8Cmy6afqUTtb3x4K/Lsf/7Urhplve/ZFQc4aVNIXxY7XxucCIvgp8QXwd7QlC7jSmo\
+040pqN3GFFR/Ywr+uo0p+Cs3puD/NuYvpcH+hgxb9p8ezO/Ma/2HsxL/5TSyHzCff2L8v49N1SQb\
+rc7S29h/puN1n172z6UT/Xt5Ij9iNX/vqH/IYH6b34lT40htDnOkdvWccmR8dd045dDUCeOu3Hx/\
+dli1qJVObCVpLVhJXgtWkteCVXV0YmcvIXGs4/jCgaEm4JJmob8ME8DLr8dflpvEtkTLXzTcoPh4\
+QVi0KBkHDc9GeKd0WBzqpuju3yC07INFX6nezAv+vZkX/MMz/yNVlC1ZFbWqrqRgi0kKtvBLNpII\
+ZiOZYDaSCWZTHUlRjTXi8c/mlDGspu61Xk3M2gabUdv4R9bQ36uA1WblENeX/w/Sc/4e+U8FmrP/\
+Mr1GPHakor92XM+gWByKy6ylcqs5IkkDkjweycOpxmhE/xfFz3P+MiWkustP8PcuP8H/D5cf05B+\
+RQfk1kBs/4HBsxkHb/GPCWZqb3L+sXH/bO/WXD39/9fyrknuT9Vsq2rnQ9mINyT6SSbqq5Kt41VS\
+usSyvKqZ51TtbDALwi7o7I2w1cpHc/pZyla1eyD81a0wfgLXP7aSBBAkaIvWAlpsMamV0XroK8If\
+TrPg+qIGhIqr+AmLotLPjx+WP85cYXP4aLqCeHxRqotbDxxYKhTgTrFe/txfjS7EkZ0Wv56BJAw0\
+rAw7tK6gH7ULxFaOs13l78+hcfQQpe+gJpKErM/bXzQw859QxUb0g02it3AF0fH8uAS3ynZ+RhFh\
+uKjwJwkrKFjjTQjTVjHdP2yBU6WF6hxLIc+b2OhiiU612exiaYP/iouFyOur7DVjtmANHHTC5SeI\
+5sVJugMS/7yaKOOjJm2LfvcPfSs2Ia72P71FTwtKwidqc+aMjrp3tNQuwSeSdLZIDpeXxMyrVq0m\
+Pxf7ojlm6Rxxll6dNzlVFaS1SRfAzJhTJykQBD+uaXSvdVBsrFApq8gJreByNY4Trj6nq01WAsXR\
+6ijiuG5Dhyt/WPFvMfIIfyZRAket9c+RiXapmD9YWDEeaX9WXFYUPyqen/BvxOd6e4saoP86J07a\
+qqO43boNwP358hb8s8tbUJ3l/U+Et/62df3/fGyqhP3xT3gn62wn1fC3RCTtNhvu/8VzVt2X1r9l\
+X/6/FJYpaQ/+vSfeutt51bn1vmb77d8LavzhLqv94b4yvJDxcO/+l6nLifH8eOE9KWGRFGXr8vwh\
+tOWIZoZuI0DThnHcmGhRwIRbDbNAnZN8RbdW/GVzgujiCfPAFUSH8FOcsY5HUIPDxUT4u05vtiKz\
+czy1AN3/Mv39N2w0wW/caIIabjTBv7vRBH/XRvt3VPe635I1PVLV9bat4ftFW7sb959dBYxMwJo2\
+t5ZcXPtfPeX+jF385SeP38AkqnX6q3PWUJ23/ogh/MVR27/KBv5ukwe5+St7DidvHnXyJg8fVSPF\
+ah/zKdLC2BzUl3DqjRWxfH/14c+XCtT6m0YpnEdhOKZoYzlH+VYGo1XjBl6wAIhWhCNbuFFp+9SC\
+0NmtEhJjEbl6+LpHiYw8SbgTVW/G/gUjhzUaD2GlE4VLJXDYsQI+j58siOdzK4KyuAlifRIFSglv\
+3OwhakjouBIPm/qbzEw4joybGC0YksiHiY/6wYkrqvrXPIuvCIbLnH8aNST8zQlh2k5SDVmc4P8F\
+Fif4J1ic4N9icYIasbi6MB/9YRYm+D8WJnHGa8XCBDVgYbXIbZHE6GoX5S8iahVWZ/F/Zghxpshh\
+Zor/Bj2qsE8OxT4r9bmqlCAUPA73z1ryas9BLYUc1LmSg9pI5KD/jmVWEq+VdCivAa+t9sRK/n2Q\
+nweiV+8dNeDZ1U3T+h9y6n/JPiSZP//FVJDMlevsl3MY1V0rwvImJgHEm6xb5l8tC+0fYfl/uXW9\
+Voy+7nKCxBjwzxM1mRJE2bVPEGVXO0GUXc3cP7a5WI6nKOEPzp1MOZaQYCn6q01oTFwywlU0hRaj\
+L3NuifDUhpNLapOOWDfJiLVPRZT08wKinzpL+uWET05FwqcYTX3dq0FVS3Gq/nxJiJOVI8ryFHUg\
+iSCq+w8SXxFVeeF8XgQ3kh/tHIVzkcTeGyX42U/v/fC3ZthWIYJQGBuXum2vG9fPqXoJlmwxxkr/\
+ZZ2qdf0QHcXymoU/D2LJ9f3pzyWQqZ8W3Ko7+5cyQivzp9zrwDUncgbyUxKqrFFroS9QEBaN2HJw\
+opDk1eV8QuFV+1RITo1TIWv6u2Div0bHYfgttrr/XbCfZ1JyaJmUP8+SlPRzrpVVa5R0Wb0fdWX4\
+YpX8f3MJ+f8/+A0lxrROyOmsiwRNTmWCJsmIfvrTVzXnRXZc6pdBqx1ySm7BuvEc2VaN8K5IX/oH\
+Ao0l5S/VGYF/FDouKXLcvdqxkXW2IgS/vCIE/7ciqkfg37MiamIsrKtVU1MDJfPKsuH+Xwgowxq0\
+rvM1WMPpqs06/d32jhqtoH8vKvA3rZvqTE3tVkttdf6fZEjVoc5Pu+q9DnV+ugEJTwc/OIYbzo+M\
+RccoD4G5c/W0DNEkWKNjaBhaBL54P6DdIHxDTN3kOP3sAtn/aVRe1dhJd4kBC1F1RXzBbyO+4P9j\
+70wAo6quNx6UKC4RsEapFcVqFKvRTBYIalpQRgMhGoFUrI1jCBOZykAkCWI1FotpSfOPxSWWVuPS\
+GqWtUbRGcYmGJQSVKKhRVKK4REMxiksVrZH/vfe8d+abMzOZmWTSUrRWk9+Xt3333Xfeuct7b8AK\
+37OHFH50dzJxgsb19wT17QmH/p3E3WTGRCQnO6P3fvLoT3YEt5+Yn+IoZqr388T+N4dVoz6d/80w\
+rw92tmM3mAQefCh2j5sjPc4ea53pLp43393/qdKpUcwj7P0NfnZ+EsEm/WdfpwbMvnY4XNP1EqY/\
+c9IUb4rTXjTIDO2IJvL63tga5XqOwPZ4r9lZkB2FWSHMKF5UiWEmDPONsYb4HKkuVXldhbNmzXeX\
+lka1vTwVS8eKYSvf2dMvmotsPDDo6uaMRjr25TduFnIsvbetpfmPT0ZXDQLfERmDk4WDdemuvk2s\
+XaDPsxgyjcGhiRFjtQt1ywm42QSPZeZbF3PdKuiR7PR6vXvWkwvjzNgzeZsa5JGR//S9L0Udj3uh\
+OtaiYI9jwb6K5ujv0EC9dk6cXjQnTeVnJuFzFs3hq0w1mYtL9CjKudabRf+rd3c9TlVapm94Zq5Z\
+XrjGzB4zQpLqmwtjZTf0oiFvmLcS/Ddbn33KCT27TU7o+VbmhJ6ByQk90W8yoqca+pTPeaLJ5zzR\
+5nOemOVznhjnc56AfC7qcothAuTZfRMgTwQJ0J4TOPqTxnh2nzTGMzBpjGc3TmM836Uxu0//a+Tp\
+zu7aX6xjqvdb/FhZqAQq0qfLUgMeMAjagRV83SBPJcTsOaK+ZEkRbzvSTCqakZmIs62oNtrvjCzK\
+wSXM2jL7mrVFt0+d2Y1zhe5qC1b3eusty+hrb1mk1Sd2CWWUJweTzjGuvj2Zs0Cf1xglndHO1/JP\
+TNVhqIze+219KNQvhc3xhs1gd5M7cN8y3UgvrYiy4UzX/0y+EjZrFoPb38Ipi73l172/sGwAnowO\
++7Dm7jv4HkUuv1tNEeglg9+DHzwOm7fH7vnj1LDPH8fuQ3cR7Cz0w86RtkXkan1qhvT6JFmfGh+9\
+bzHiJkckZRyzTfW/eRHJxKbYNCoi2FPYpoR/1YmiFTGg5bPb5fURzZ2POJvfc8N41Dn8f/PO28fM\
+vdewFrt8/b9ZMv3L0vfgx0L6mptH8Ih6xK+K8Iszeb4ESd1ArId3XYXlC82hq+tRFax4J4R5nDfD\
+1aeXEAR9BUF/Xqfg9Tjn9P4eg0xv4UJXqeeXbusRZXUGXWWz58+7XL/W4JKy2S73/Pnz5ltvNwj7\
+ropMv3dnhHnvQLprmp7eHOLVA+GmJUd0zvm1BLF43l8/dqjzB/HAvy4xv6d0KHuM4lEd6+l8SzAP\
+68zhy0Idrnn0J8gz/LqkrCdzfM8OhS6XYE/M+z9HHyY9g0Xl7djh8n8gvtdLBbejr5b0mHxSuGQO\
+1fWYzOobax+sSXvskfPYPVWdGvggoHmXBHx5M9189NrNFvSTaIG3NN8jaeqU8Brz+MW3+uoMs96Z\
+joiOWV1Lhfo222sgCLMrWW3SXL4IG37tibGcLzIgZ9gTxRnu54nxRHViYt657iu+MS5fa+A/+4Bv\
+6CIeG4sijvJwYnQaImkLDUjhR/SU7EAXeSQH4V/QMb4L6+dlfXLv92J8tjbYvZi/TB/t3Sf8R+nH\
+uXaLx5lSd4PHmXptZ/br1fWijZoT/Xxw64mQqKqBZ+CqgWc3qQae3a8aePpSDTwDVw2ivPmErypn\
+uP6nZomlWu3RqMoskrtHjErqvz3yFnLEIMjzyQ64vKwX6ExzFZlHjXN8ryKWbmlDkUTwUPMno3VH\
+LyGLZC6u2WEpdTLE/KHM8N+L0H9zF86iDehhoqk5XnsKfPgnMx32Mv35vrgvW/D1uXjzcqJ4uaG+\
+ifm9wjA2h4NdWhnRDS74Zqr79YDF5rhEv94Y1x72/JPpVbbWLCxf6PSG60CL8NUG8nIXrypIla9q\
+9atfET+ySndQdY3o1cwqaaZuuNR+vW513DOmmx5qs2n7PTTWy2l873aLLIR59twQ5okwhPXrkvL0\
+O/J4Yhl5PLtp5PH0NfJ49vDIEzxaePoWLTx9jBZRJk5BJgUHZFLpEYShmGTYMG7ncPUzowwZsBwh\
+A1ZasICVEfBtT5EgBTrnjCn6RwEczrAvp451E6uvwS7SqagxC4jR2cKgOTbioJnhPxckZkEzumMX\
+gTXz2zu5OyYhONKa2kuYHhMiTEe46WhDecADujGcmRvDaYzRPdUT8W4jum/5zUDr2y2r710du/+N\
+KoZTUcN/dyfYXRG3G+ENUX6zJyb3wgi6znq9Aw7IHnezm1MERxzZLWkPnmgekxtRr9Nw+nL76W2D\
+fbrpzJqTZw8UhPmwiY5I6kBc00t8lY1nEPXyRRaelxXkkw6hZjwFXKE079meYeUq9E0XS+WJM9qf\
+nrGmRzCnh+uYDDJbKKKFxXVhf6+4n1N+7Oltvs24L4vgYxczp+b0+r0LJw0B8OAD+Ag/emB9u8iR\
+ZhbRX0UytbtP3/bArwWpemedqnEua4prbDpGfZMJdOBcwBMJAicgRdfd6jcZKYNKZZw1/35ecdhp\
+Auo4psI3hcJNKkiNeg5TL5dT2J35vmIWbspSath5pwO+BXHtpdG1F5u+rZhWHk9vlafftcATZS2I\
+dWvVV1Rj+11U0baT/YpzbCyKsx+TowY6B4tpQUeU8w1A8UY7ESonzMcIYK5SRtG88rllUYwfp4Zs\
+rgU0KFNd/R1aCtxaTj9fQSpeiBrZ8FRGL8NTOdFljDlBBqj68iaxED48ffPhiYmP3XyuQIbpDgh8\
+fjHN5TSHYVXGKI6ZxvlVCsbdDDmq2WG6UiIaygs9dYCnBeTEaF6AeLJDp530ZMdMtX+zzShnC8gH\
+IMS7qVXymxr+rdS+hfxXd8BffPs806Fb9Con1435CFr/E0v0B0xURTW/+r6nske91TzgIzW+TgaX\
+9uWyr3JV/83v5uxN1Qm1ZVxVSl04/2PD5tFfzZ4BvZpzYjSM7nehRjGGLq9H358G+rLxfEsuG080\
+l83/2stz9pTB6QjDwgC481qPtmH4yHRRDInxMDn38uf8B4e8+xKYIh1FDJ1MhHj537l2b1BUrwz0\
+rRVmBw5YNDorFGwd0Qbbsb0G22/P6ySjD8uRVjG/0J3BoXuARm7/d1/lFPV94n9pRDjSu0OsPA3E\
+PSFwkDhGt4NIRn39bwK9vlApbIzuZYXQmw0WmXs78IGJx3v4y8H6EIV7HaUNGXvDvUEicNwzJ4KB\
+T9nXkepyzdVB3RqTtZeb7uLxuXQcF3U5eAzWhCLxnVRVidLNZ1JnespMPbLWNDVjumuB/cXUPN88\
+VVX09H/96JLt3mdkTlnsxinP6e8oqtcqtXGmxEovLyyJzXDlAnOYfEK8vhPS7807p1uDoOrUpLnU\
+dV1yhctvwNVVmGrqeWzGXR3aCA+8+o1jRvmRsKn0cn0TIF19Gg3tx7ilo9+DkQ67qkRVAJ5gBRDV\
+JqJ+xfPUPp2qCF/6NtV+x1Qfn7QKFlZ1fTC3J+ixy5nu8vX0Y+dDH5+ziGS/nt7269+rUzRH915H\
+N+bjv4UQTyOG7kDWrcbZKj0K9uSR+nuEH9nr/em8oP3QqbHpUAvWs21Ow2Sz5alyC/r5FPO7jtQm\
+jE7SbzF1WQvNKKWNO6dNdBGZoBWz99T0mhpAd2OMS8ezO5eOJ5LS8btSgvQ3mEtH+eMKH/XFE/kT\
+KVF0mMDllRZweQVZIfKPSEbzbEefO2JSY5P497X7p/eqOiayqnpW7KpqtO/Lj7Q6+7XPYlCTI5mj\
+HlmLsvf667dsf6tufxupMa6rkTWId7saGtGbX0PUS6/bq88czdQ0rRaYqBmkDaczpbmz1MGbX+fO\
+K3OpA1FJrm7Y0SSIOZ5LzVxOc0KUaioGnw6Pbu3pCRX6y+z2XwtLS1XyVWj/yWk3BRfA84aqxIK2\
+SoO2PVJM28OU9HRXmNaL1bCmuR2pqcHbQaYZhPtycIMmzWVnUb5Du3x+TJp/6hoyTTRuAPo1d2LT\
+aOpryyParfS98RH1ngas/eE/3JLT90HmkBNYZGoeIn8ekHwOZjZRGh96Uj/s0WzLvkzHuPr1YsNM\
+v7caBn3neARtfL7ZBcutByoTjnwUUt5e+5GhDcidyL8aBMsuo68X9jOGEfXL91JAkSUD/4li8c9c\
++l4i+pV7gTccq3dZP4KYOkaV/6x5XlehuVn4RtnKCi/RTwrh2n4vl1VXQp5O/NSu7CcH9LWkH6Ox\
+c0gKPJN1R3OK7mn2T9K0Af02Zauw+tfpFeKpmoCjCaxvvR9eGhxeqE3iuYp8a712mYdzK8d7Mj3z\
+Ss3f0iepDAE+LOGnU8+g2mGhSx3vQk+Z1WygwQ2PbiZ4/IZVzLGbvzpVqXq99v3S/G3mFWXuUp+c\
+VjiztJjWHusyphzjVGBVZaMHRzxxC0rnlqhfy4rFiab4u5CWmwRrO1LVgXuKrC1MKtJ7LppdyBG/\
+SA/jFKk6X6SzsLyzPHmq4NXZ1y/a1BV3QaHKFUvLTEX2TjvD9Us/t33ZkdWO4hm20W5gDL2um4dv\
+o10/fVZhWaG1dqapK6oKuy/Tx+TyM8d/5JZf3Hz3rNzCubnqOi6NmzlHxQGmS9U+6bcomoa9tBd4\
+5x47G/L/REkkb4kL3MaZ0bxMrW8H6BjoPUzsXxFMHPAimBjkizTRNRYDNxz02zT93+hAHOnEgThS\
+eCE2jlXzkjhOTVM20/o8Mp0RamQ6I/TIdEbokemMSEamfad3D/XnO39p5aqRPcutQqnLqxrgvpON\
+RxngoHCSfxH4FVnMNhn7o5y4h5/YiQNQZNYmaZqCOs0ej39GFOmdnk9n4aRiOLd2N06x0c0MI9UW\
+9qjUzlM4R6WD803GM6nYuufbG/A5jfY4Cqc5+bMiYufCq4O9xqw01c6Vj3GuPbkSksezXX61xs7n\
+AsqclnbA0hNjH0oyiua4C+fjyR1T6i6b6i7hKmmvAXe7gQhAae65s2Lvjr5WJC6oII7sflLzKvze\
+3l6U4jJzED1wWheYuS9nuHyD5cELbaIjigPB4ohgcTTqa27NdU/KC7aSb4tpLusqimhy08SIPgsT\
+8R5Lyqy5K6rJHDIohY5j5qhMA1t/YcwKHTE7thK7dRxB6fMkHPdloY2Y4g3vJc9uclpXo2fuAvf8\
+wGeD5/aWh1pnMuhU6umuGVanVJBX1Yd8WZffLqyKX1IW8+vVsxD6fft6WNaZo/JzOFQLqVhVA93o\
+dXp4hXRroCqm0UYdXqndc00dL/YYmXthkbtEb1Ptcvokc5c1C5jHP/FoPaX6QH+qbvCzBvho0/XX\
+Z4MVt6rEsala4gxMLveWBPPks66XCGndWiyjeJ4q1Mtz1d3ZY7Y41XeJwiCYNZUyaBEGX1wf+biS\
+ct3XVVh0qYop/BFN/9cJBa4FGX64RX0L6M42uI2G3UfAzaO34+hlGb9EzjHuEndZ/lzPZeXuafaS\
+pXT5hAmkOeHmsKo7aZ75TVeYFP0RFl1vHC6XGAPW898K57tdpYVeFdIm6DjuHOuiJ/D1nF39iRfT\
+zW0PjoT2Zl1/YQ9dj+im0ti9/R4KCsaeYhWO3YXeYEGcPl7XW1ZtzBeZyQOONNekeaWuc0vcc73q\
+OqF5D6qo53hU3A55h9D9yGnWkVgHQndedaBTQ+9Zd8tnuHw9zdPKxlkbmVca1EnRgpl9bSKoAO2N\
+osxUdjmvlPutI1ql780X/2Qv2rV9CZd//lTUp77jmCVTfdv9LF+Z6wRCh1R1kV1SrseS9GNRvo9H\
+yr9axT99UrA/RhAX+na8JSU8VlE83+1/u7RC1dhZntKSOYVXcH96DJtA5u0r9p3Qiowpqhl0vttz\
+yeyyUmdA00yFD4/4iqf1l3QcqAlswXODLuCPfGXNm1PqLI61x9TCMrjVR3uCSqb4qkz0nRuqUlAT\
+aSw3kWAWmKe3eV8pfvO+TPdI2JdvFePgQ3EEb+sqhs4vecZSw/e5yHu3b1VeJifERnwxJ9QSwRuw\
+1i7MNCzqvvCtqu5vxfYnb/WIsFXOfkO9vR13yLKYGCrLwaMJ+l5FnVtOtD81WlxsDs7h9xhOX4bH\
+fBdaH9bOLCosKSzylF3R19vFGPoqsv7qN08RiXobhSUlugbwJvrz5GAvg2h9HINz9P/N570Ma/Vx\
+VGwPH1/Z07vhsbtxT/WY6vD/JKc9P1ZeTekuupai+hpp4CWhH4dL1dOzS+bPKym8RO9Rf3BTT+Sh\
+qbADuWOHusmojV1eeEUpPV1tdrbn9+A7z8nJn5OXY9YKeBuRWdJVNMc5LTf618xhjzF8/zCmo9SO\
+MTh/2yw+2Ux10ZNZVZao387t+vacx6k51lpT3eWl7nPnT9Alc44pRF2uIU+x6ayd4nKmmHOd55o2\
+NbBHNdRGIz9Z9IVLfW70qTm3v18VDlYd9CRJUyHF+7Bz/iO7mVY2121enNmnIJTJGfYeWVHVDl1+\
+bYBYnpBxgd+OLjW1jKb+Zdj3Cet+0tcbhXPBVPP4auYePbhrnokxN9xJyuTZLg4x4W4UqnymTXbp\
+R3z35OLRe7TKx57VXDrJFJBdWqoQnP0Mxrk6GKvy1F0KOdNT9ugCzTTfdSh1l0WS3xU7i/ufJOqN\
+BE/4gnx1IYJeASvsFztD9YmJ1kLwHaT5BTFnXrE3dPQq5ljkcAXvvxMdA4EL+PXZyOPtrbcmNQWT\
+Lv3cmzmqsKMVxda7R5Sx6S6eIBPyqHo7KFVpI92n3IoeiHe4JuUV6yEZ+xMVZ7imTXCJDp5w2w62\
+aeoSGotdQvahquVT7M8spLrotNGTdeVzfZ1es6yqTIsX4/Jmmw6Xc49uVfvVuz3TI9TwEHOSwnb0\
+9rZWqDk7fdpoYB9qb1OOUmMx5UhGx1536PT1w6v47Osa1pHpknnzr5jU99kXZsKOI8PX20wnc7pL\
+pf8B+3FCUhhBSQXv74668Kh3/Izoesd7m/0TzdkO2Yseznf4nvVgW0g173wyL08O9tKr/s2RovGs\
+9NhOCks3Dz31tV9/bNE8b0nhfLdvvCrSN0vKZoturHrmFs0P9RRGZD044oMBuB31p8ISWjVIkHZY\
+QTrdNfDvbAwZmCOIy+a/ZtpW2h6dbfPcrtQ92qY9KSzVFW6yjSPV7S2ZU1hEz5lOmkwvSNDPRdu9\
+h32YD+W7GcPDp9FMrxqLm3PpJ+iCpAV9m8+UOiDzmXJ6K+MxRUGn9Xo9ERyvs9fpJ46MWZ5ia5jd\
+ZX9MRB3sxLDnXTc7I5tnxdOsxgzgTBf/28WeOmhmTVBJdYWapcAt2gha8LoboNTYtZvGOC0l5GwG\
+rz2doZfmV58alnpKADXYzNWCDbacPfN+SbNx0vo4bUBHooAZNX3YjjrTub536ahtOq1meNj5NY4I\
+ptQ4wnTb+AX+sHNL/JeOatuUpYaZrBPBMvZeQ03VSYe33WbO8ujPqhbRbJyQLaKAIKwT4V4bZr1u\
+LngDy96eui/166h6f3tE8AlK5q1hs91Fl5oGm2uOe64vjIQ+fQ7oKHN6w3T45BT74ke6Pk6IH/4T\
+j6x5RwMw0WZgZso4vp3TJPLyzAYC3oPhHdin4ceoqmreb8c9EgO1J3yVXmbgiHFEmzJDqe6FZQMx\
+KpgZOCoIg4J6T/NiPS4Y8pvUKYFfaohV+zuq7YR+IUWE6wd5g0FEpRTsfQqRregLH0Hfn9WnE4bv\
+1Bob/J1afdlunu/d4cE+qIgFGeG3xmNrG796n+HiqTILdCH4fcx+jx287f1FpKE/ohIiUx+IT6ZQ\
+NquSgiITsAJCXro1UpyXM+3MPXvOiEN/YYVOksq7ZrkXOvNCD5zH/GIRH6C2rpE9ejbZf2VuA01B\
+1LKZfvazIPEzXGn7NZojKe2A1vN/4+sovd0DcvzvAbGch6efm9JfD9HrBEmyxgb/Ss0eO70pgjqf\
+0+86f46s87rGK9HMmcrRueNPXbE/0xNDvYLFBFbT+ekqLHPpAem84t7ip14lBeam6N5xnp8SIpHG\
+KSrh0uI+9LZRT0dqJO9KCLm2o09fkAna9wdfjdH9lb7XT5qPxaQ4YzBThV6sHKupKr4usoACyCt2\
+TucZKkHdWJNZ6Ih8s1kcmYFdG0EnvvR9WD7ot/DSIQWIctaEo0/TIhx9GPuOrJ8w8i30+xjoGujD\
+tIs+rhcwwU1/BjnqOQqOgJ7JAZnjEdh3mOmKaopHiB7DPhRbNL2I/SgLfTr0bctD36UKOo4RbpqG\
+NUcjpnMzUoM9VqhHDiN/IVD0I4gqyjpdkX+ZFovA77NIu1Wjcra9dx6z+Ra1HKfa0WbP9azPsZ72\
+QD2d3qm++Or7AqbvHbv6gfYFtGrgd7YG7NGs8J8j0e+bt94mT9kzPMe1Z48h0JPYOrBfVm51V3u9\
+vfR4ePvTkev3SN6e+2ABzfAI2f5wOIN87g2m7PTSQndE0kuLr57HztcUlzXPaIF+Ob/oeu1lrtJY\
+86wEtbWoutgTlhZEOosFrqXQO0o3r44KkxoHm9rkP+HJ0a8JT44YTXiCfDWnvxvzTdNR9VtXidh8\
+z5TSrXGBKWaQkgpsu8PbOfb4uzlNJPOG/5R4xMnVf/7D4ePMh8PpE97BP9ydHkGntn5aZizOf5qr\
+CmKuasRbgwf2t6XUvT78VAUdWIpUZFH36lL1x8JLeJw65EQTmEcVtOHfxzlU2PSgxk6Ki14v6JpX\
+rpwWU4H3+T0+JjHxZR6F5QthxhD1hRSrM0NtgShm56SK1xf7vRE3ZKmHmuVpv0I55Et1VbNwmgu/\
+aJ3iClNZMv2677y99NjoqSg4E4U9WG0/U2jWx+hds3zzUkwh7uEtC5OplZe6S1XBz71kjj2IGHK2\
+R8wT696mm0Qw2yQGB5AaOK/CtHjzgkyQ7UujObbTjwK+sRPj7WNaN8aMqZvu2gVyPD12A5OiK36s\
+Sxe8N/bO/PaTZ82TGIAn93fz8fjAQeickPfrATgLvmFoXa8W5HFDOL1knm7TcHXK69s55q3MC/rK\
+4hiMN6ZGON4Y06GvCN6W51+/i719HYlK7ddIVKoYicLPeAZZPvyXO9Phy51ygzl92iJ+C9T/42qF\
+NBxECQMNB6X7Zv5G9+XPYOmgbiKZxGx6SmRZSJ+GwkzeMi7EKcCxsGDeQwyF+Xs3m6GhUAd84y5I\
+8kUxJ83+G4+h6bZiQErW10G0VGe4JkdfnzaMYNN9Hq9KdYb7MgFeilHtqJdEPMSdO9ju5Z05zWWP\
+cYlp6//JISvzSeG5JarpFDDNPeQ3MaAQIxnrkk2RNFfUJRf0I6dBW5WxGOESbcwIGjdBD1qHjTEx\
+/pTEHOecvo07ic/w7ibZk06eZjt2s8GwIINDqs7t4aND4+zRoZnu4nnz3ZEOEqUGDBIF/Wi93yrO\
+gC71EFvvrX894z84Czr6Ualvz5Rp864Ks6Lu8QtoAv43r2P9IiL3QnXYRWVBIgzsTb96MGjQdE6c\
+XjSHPmHsSdGvKOQaq+6oxSU6Ip9rPUi420QvPY1G99G6w00Q9+7RI6apvhFT/6GB8HPE9/DRTm+I\
+rsgwBRPRQB/GTodrMg2K+fd15fT+tgXd+27mRZkpUb4vOIQdIQyYB9X7MJlOSue7ufcqxUVPf04N\
+++RkkAHM/r9zAR9gDZxR6XDGZhSRWqE8jJjzvxGo/5eG7szg62WBj7KpWGEOxXqiso8OvFa7YxoP\
+D+bQo/EZrogGCqPpU+jr8JzVdjpTT0WO8fP6vb3IKsx3MsK++KGXCQa9jZkFjrD1diCBYw1R9vOY\
+jjSrhMe4rA/oqUPJC5Zz+SI7fe4x8t5R87rK6darKfrd1IzxeA0X+e7XkE21Zn6Msx4SnVfc18dE\
+p9pZZR+uQnxVTPTdnbC2acv57kWT7DjX+xsSVKZhraO3p7zk6Vubrq6RvUEtyDHZvR796HeM8XMB\
+MOu4vx2JfXrEQIy9pQWOvUX7LcnoezMzA/v0ojMRVThMCXKL6k9fX7pLt+49zoAbVsz66rwe2Vfn\
+vmy3/k7tLP+Za1ODnbNzg3fHTLd7Y86lm5IeDDGL6ImCpsHcvxn/6S7r+U366qZ4L+85QVYunKaO\
+xRHrb+UuiPiVGQ6+q/g6tAJei5EOXUPuwlkUP3SXGXSDmarPnWaRdLA5nIHDjQMykyGSfrEM/36x\
+b8drBNK4U0wPFzi9vU0wFo8zR/s2COwHnVZGfVWqSuDqZtU0c0bsR1gnzZhuCsrsyv4kM23HN8q/\
+B/cMWeUYcc+QN2zPhchLI5nxjYNaDlf4LgsVBPWjtCF6LcLWscDhaZUUwW4c3EOQ5rICSA6ePl+I\
+KZpD7Z3AgeZeXyEUdFvBY2K/3uAeZJIovKisKJoh0lSXPVYR4j1lRdG+piw12GvKoj+m8G8p8y85\
+T6lrbvmcOS5rOo/5UDvPFYq6hZ6mz5eZRqz+WurMK9IfYcyI5IV6vk8S9NpQ9ruY+B35QSeeRtD6\
+Te1r65daQDFrzUX98HHQ105Hkln30kiOKlHmlNC/HILt0/j0vYTvTF+yELjw5Km+F5bLpMDndE7Z\
+QKTLMUvvvXZr38zjKb08gjlM0SW5C6Zb85qifgdB5PtxTucXBqT63R/sxD3SHugo83f5tgJOgHx3\
+higergqbPjt86XOIcWzVWkiLfATbt3CIZydhicDL60yHzoyVicnmK+phs+iJJdPp/cLm1xR8A4tL\
+b9xlZ33ODJf53S951G/ZsI/Cmv0X/FM2QVKOkG/kDz+4gr0DUYypBHQKUOW3kx79Kky/nMXeJ74Z\
+c7rDFbz/yhFd/xUma9SRlW76oTNi/SYP3/TICX4zDb1+czOd033ZSNDXbgSbZxmsbazqn8ne6Q6l\
+nyGxYiTdbE0og8XVJsaJt3/rnuC5s1R9pENR2YVeqcS0FHTLIs1lvsKgKiS9EHwBNy58FVFPWKaY\
+HDitsvdoAgNb4WenjoXZqfrFCMFCHOXCwXaaxrEqw2WnplFOXI0iMma4KB772sdhQpHuap+tQp9z\
+asAHx3G5XkJpmgil4TsXeo1sqbGJbL3FTBPoJps9TJVb0v0N5nfdnjVnapKeweWyFppRSjtxTnO6\
+iEwlirjBFhjTciILaiKfldUdFvW/xn1hz+XAQGtazwFXZSpdijM9ZabErZWti3KBfS3m+c45pe1m\
++BC+SBU4K5yPKmg0SQ0dTYItb+KLc6rfTOfAi5Kb7WGitX+rdmbwy20M3yAy7Rd/R5A1yIsrTI0f\
+kHoJXTr+F2LoTh3Ys9mmHXmttzmJ8B4muo/RAa3MNYk+NKcqF+1xjudSE+jNNa5UU/i+Z0p1jdPB\
+zEwutv5K71ArtP8U5NagauJZeIyegTu29NDHlh702NKtN77Q1aFTIrtnw7/iTNb5VopOuPwjqT41\
+k1U1sqoAdrNDmA7buW4FeWtNTwRrqMt2jmdmadmsohNPPLl03sljNF5SpBr5mhyaikg/+8wzXWkn\
+p8SdPWXSGWe6Uk9O599ST86g32fMUEukn+zIjFO/TjhjkstxctrJ4wBQ91vHf/1xfpjqiIuL2ytu\
+77jB6r/x6r/6517qv/uo/+5r/bav+u++RtnLUkkfDMpg8+/guCHWb1rfj5fV/93f+t1ec7C17j6G\
+91HHcYCl6yOKs7ZN6wz67p/v/vnun+/++e6f7/757p/v/vnun//iP/p/+ufdnYPihqnfR6l/8467\
+4gCdwT3Zaf99r7iHrL+nqH8P8XgS4lRGuM7Syg/37Bensr+NvPy+cX+w/qb/N3vnH1QSuH/cFku7\
+YtP9avtD4rZb/OL9l8bHqaxxp7098/f4uL3fIy474YYhcSpzHGaxx2xv77gjLL7M8F5xJ75H+18y\
+ch/zc4i1/x2/3dv8XCr09K2kLxP6rA2Dzc87hL7C2s7WCf66zUuOop/6v3fG+f63FPR/D/bpy0BP\
+gOXvAH0o6MtBPwT0FaCPAH0l6A7Qm0FfNsinrwf9DFh+I+j7wfFvBn0iLL8V9GzQu0CfBPoO0HNA\
+3wn6ebgdq7z1oU8AfcQo0vdV/36zl08fBXo96KNBh2KISwG9Afxmgr7v3j59POjbYPvZoN8Ay+eB\
+/iXsdwbombDfi0FfAcvPBh12G1cC+jAwthD0X8IKi0D/CxznEtA3wPEsBf1V2O8y0Gth+3eAngXb\
+WQ76ZFh+Beg3gr4S9HthO82gnwrHvx70m6EcNoI+F/TNeDyw/a2gJ4PeBfoHsJ0doLeCvhP0E7HC\
+He3TZ4A8BPQm2O8w0D8GvyNAvwW2Mwr0q2G/o0GfAttPAT0R6z/od8D2x4N+MGw/G/SfwnbyQJ8L\
+xz8DdJDjLgb9t/CH2aCPhnpSAroTll+I5QDbXwT661j/QR8FvpaC3o7xHPStsJ07QB+M8Rz0t7D+\
+gz4EtrMS9Eux/oOegfUf9Lth+Y2gx8PxbAZ9HBzPVtDvg+13gT4Ult8B+u9g+Z2gX4UF8UOf/gfY\
+zhDQ98f6D/qVoI8A/UegjwL9Cjie0aC/C+c3BfSjQc8E/QOs/6C3gZ4N+p0Y/0EfCidgBuj7YP0H\
+fSUcz2zQx4PfEtAfgO0sBP1XsJ1FoFdA+S8B/WvMZ/A4sf6Dfhrod4A+H+M/6OdD+awAfSvmM6Cv\
+geNvBv0HWP9BvxX0jaBfi/kM6GfB8lvRF+y3C/SfwXZ2gH421n/Q/RKOY3z6RRj/QS+F7QwD/TLY\
+zgjQ98X4D/pHoI8G/QbMf0B/DPabCfovsP6D3oTxH/SVsHwe6I2Y/4D+DNTDi0GfCeU8G/TfYfwH\
+/feY/4A+BOM/6B9j/Qf9ICiHpaBvAH0Z6Kdh/gP6axj/Qd+J8R/0/bD+gz4S9tsMejFsZz3o0zCf\
+B70atrMZ9FaM/6AvxDwc9C+w/oOeAtvZCfq5eIM/1qd3YPwH/XOs/6APgfg5AvSlcN5Hgf4a5v+g\
+b8b4D3o9HGYm6C/DdsaD/gnWf9BXY/wHfQ4sPwP0/cDXxaAXYP0H/UyM/6CvhONcCLoDjmcR6Fdi\
+/gP6NVj/Qc/G+A/6MVj/QT8X9OWgF2L8B/1hKJ+VoP8R27Og12H8B/1A2O9G0Cdi/Ad9E8Z/3A7m\
+P6C/gPkP6IfBedwJ+tnYYEvy6Z/B9oeAvj9sZxjoB8N2RoC+L7Z/QZ+D8R90L+b/oLdh/Af9Nqz/\
+oL+C7V/QLwQ9D/R/Yf4P+tsY/0Fvx/wfywfbv6AfAb4Wgr435j+gz4Dll4B+M7Z/Qc/G+A96A/bn\
+gH4R5j+gl4K+AusDtn9Bfxj0ZtB3wX7Xgz4L6z/oW0DfDPpgbP+C/gnWf9DXY38O6Mdj+xf0AzD/\
+P86nF4E+BPR8jP+g/xHbv6B/ivEf9Guw/Qv6AZj/gO7B/B90FxzneNA3w/Fkg34g5j+gXwzlPwP0\
+38B2Lgb9Lez/AX0T1n/Q38X6D/oVWP9BT8D6D/rVGP9BPx+Ofxnoh2L7F/T7QV8Oeg4czwrQO+F4\
+VoL+MbZ/QT8E4z/oB2H+A/p1mP+AvhPrP+gOzP9BXwbb2QH6/2F/JujTsf4fD8eD9R/0m7H+g34Q\
+tn9Bfwrbv6BfifEf9Gux/oO+DfMf0Jdh/g/6VVj/QX8Ayi0P9H9g/Af9Caz/oA/C9i/ow7D+g74Q\
+83/Qz4HyWQT66Vj/QT8R6z/o3dj/CfqhsN87QD8C8x/Q2zH/B70E+39AH4ztX9CzMP8H/acY//E8\
+YvwHfQVsfyvowzH/B/027P8E/WEoz52gT8T8Z7RP/zm2f0H/Iyw/DPStWP9Bz8X6D/rBuFvQfwTl\
+nAJ6AdZ/0A/A/Af0LzH/B/16rP+gX4LxH/R07P8H/QTM/0F/CfN/0L+H/T+gv4r5P+jzsf0LejHW\
+f9DfA1/LQL8V8x/Q34fll4PehvkP6A9i/gN6MuY/oJdj/Qc9H/v/Qf8Jxn/Qe3A8C/SvMP8B3Y35\
+D+gvYvwH/Q3s/znBpx8L+hDQB2H+D/oSrP+g/wz7f0BPxPoP+p+w/Qt6Jfb/g34oxn/Q/wnLZ4P+\
+KtZ/0Ldi/Qf9Wcz/QX8P8x/Qr8f+H9AnYfwHfRbGf9B3Yf0H/RrQl4J+OeY/oG/H9i/oN2L/D+j1\
+mP+A/j2s/6Dfj/Uf9OfA13rQb8f4D/p4jP+g12H/D+i/wPoPeg62f0E/DOs/1kOM/z/y6WOw/wf0\
+hzD/Af1K7P8E/SRYfhTo2zD/B/01rP+gP4P5P+j/h/Ef9MmY/4A+E+s/6B7Mf0Bvxv5/0I/D9i/o\
+87D+g34D1n/QD8P4D/qjmP+Avhz7/0H/Evt/QH8P+/9BvxfrP+g7MP6Dvhr7f0C/DOs/6Odh/Qf9\
+LKz/oP8c6z/oN2H+D7oTlu8CfS7Gf9B/jfkP6Ktg+bgTof8E83/Qvw+LDwP9LWz/gn4o5j+gV2L9\
+B70HfKWAfjjmP6APg/vReNDLcPwL9Iux/xP0H2D/P+gzMP6Dfgfos0G/FnyVgP4F5j+gr8b+f9B/\
+BttZAvoRWP9B3x/zH9DvwfwHdDf2/4D+Piy/AvQTMP7jcWL/P+hVmP+AfgGOf4E+Esd/QS/G/B/0\
+ETj/AfQ/Y/sX9EU4/gX6I1j/T4J+Quz/BH0kHM8w0Edh/gP6euz/AX00jv+CXoL9n6BvwfoP+oFY\
+/0H/CfZ/gt6E9R/0+2C/M0D/DPN/0M/A+g/6e7D9EtAvwP5/0Ctx/g/on2D+A/pizH9AT8P8B/R3\
+MP6Dno7tX9CPxPwH9Lsx/oP+MbZ/Qd+O8R/0sZj/g34V1n88Hsz/QR+E9R/04Zj/gN6A/Z+gP4f5\
+fzLEYcz/Qf8E4z/okzD+gz4E4z/oUzH/B/0h7P8B/Q3M/3G/2P8J+mOY/4M+GfMf0Fdg/gP697D/\
+B/Rp2P8D+oeY/4C+FuM/6E9g/Qf9S6z/oC/E+g/6V5j/gF6L9R/0k7D9C/rNGP9Bvxb7f0AfgfUf\
+9FSczwn6Udj/CfqPcfwL9JGY/4D+K+z/AX0L9v+A/iLGf9B/jv2fJ8M4IOY/oCdg+xf0IZj/g74F\
+83/QT4Ltjwb9bxj/QR+F8R/072P+D/oHWP9Bn4vz30B/B8d/QV+H8R/0qRj/QT8K6z/oJRj/QV+E\
++Q/oR4O+BPR/Y/8P6N2Y/4D+Q8x/QF+I+Q/omzH/B/1dzH9AHw71oRn0Thz/Av0SnP8G+gE4/xPr\
+IbZ/8Txi/g/6hVj/QV+C9R/LDec/nALjZdj+Bf1rnP8GejLWf9AnYPwH/SnMf0B/CeM/6I/B8WSC\
+vhfsdzzoQ7H+g34AnK880NMw/oM+CPN/0A/H/k/Qb8f8H/RjMP6DXoPxH/QyjP+gZ2P8B/0y7P8H\
+fTj2/4P+B6z/oB+L8R/0kVj/8Tgx/oNei/Uf9FmY/4Aej+1f0Htw/gPoz2L8B70a27+gX4D9P6Bf\
+gvl/Ctz3Mf8B/fvY/wP6zTj/AfS/Y/8n6Efi/B/Qf4P9P6B/ivMfQH8E4z/oj2P+D/qTOP8B9H9g\
++xf027H/B/QpmP+AnoDxH/QkrP94nNj/CXoz9v+Afhy2f0HfF67rZaD/Fus/6LOx/oP+Neb/oF+F\
+9R/0X+D4L+gLsP0Lugf7f0AvwPoP+vGY/4N+IdZ/0Ksx/wf9X9j/A/qL2P/p8OkbcfwL9I+w/Qv6\
+eMz/QX8J8x/Qn8X8B/Sf4/gX6Jdi/Af9fIz/oL+P/Z+gt4CvPNDXYPsX9Has/6Bvx/5P0PNx/Bf0\
+Usx/QP83xn/QF2D+A/porP+gV2H+A/oJmP+AXo35P+gPYf0H/Wqc/wD6dIz/oM/H/B/0bdj/A/pS\
+zP9Bn4P5D+iPYf0H/VGM/6C7cf4n6Jdg+zcVxmGx/oNei/Ef9AKs/6D/EfMf0K/A9i/oF+PtCPQE\
+jP+gn4jjX6A/iPUf9N9g/g/6F5j/gH4jtn9BvwvrP+izsf6D3oX1H/RrMP6Dfgr2f4J+Ps5/A30C\
+zn8D/SSs/6Afiv0/oG/E+Q+gN2P7F/Qjsf8T9GTMf0A/Des/6B04/ovbwfwH9JOx/wf05Zj/g56E\
+/T+gT8P4nwZ5DuY/oD+D/T+g/xbzH9Dfx/oPeh3Wf9C/wfoP+hqM/6Dfif0/oD+H9R/0GzD/Ab0S\
+6z/oj2L+D/psrP+g/wjzH9DfxPoP+lqs/6CPw/nPoB+F7V/Qc7D+g96I47+gf4D1H/QUbP+CPhbz\
+H9B/A+erGfQdWP9Bj8f8H/TvYfwH/Wms/7g85HtdoC/G+f+g92D+A/ot2P5Nh/1i/Qf9Faz/oP8W\
+9BGgr8D5z6BXYP0H/Q2s/6CvxPgP+skY/0E/E/N/0L3Y/w/6Rsx/QO/A/Af0U0CfDfpPcP4PHic+\
+/wg6PmC5CPTfYf4D+qeY/2C5Yf8/6A9h/yfoKTj+C/qxOP8f9AzMf0DfD/Mf0B/E/n/QZ2L/J+h3\
+YP8P6Jsx/wc9FfMf0Lux/oP+V+z/AT0N278ZUJ+x/xP0Z7D/B/QxOP4F+l+w/oO+BMd/cXms/6A/\
+jPUf9Lcw/wf9lzj+C/owzH9APwL7P0E/FuM/6H/F9i/o6Zj/gH4jzn8AfRzOfwb999j/A7oX6z/o\
+CZj/g/4ytn9Bn4D5P+g/xPwHdHxAdyXWB8x/QD8V83/Q52H8B/0g2P5m0E/B+I/1Aes/6D/A9i/o\
+kzD/B/15zH/GQD8A9n+C/k+M/6BnYPwH/Rwc/wX971j/Qf8bzn8AfQrWf9BHYf8P6MMw/wH9MRz/\
+Av1NrP+gx2P+D/qvsP8TywHzH9DPwPn/oG/E+g/6Ksx/sNyw/xP09Rj/Qa/A+f+gr8b8B/R/YP0H\
+fW+s/6CvxfgP+qNY/0Efg/Ef9Jcx/wc9H9u/oJdj/g/6yZj/g74M8x/Qf4/jX2MhrmL8B/0YbP+C\
+3oz9/6AvwPoP+qPY/w96IcZ/0Iuw/oP+J8z/QS/F+A/67zD+gz4W+z9xv5j/gH4u1n/QT8f6D/ot\
+GP9B/zHWf9B/ie1f0J/F9z+gX4z/oO+H9R+PH+M/6JnY/w96HuY/oFdh/Ad9OD7/AvpNWP9B/xz7\
+P0Efh/kP6PiimS7Qr8H+H9Cvx/5/0F/E+p8J+T/Gf9BbMP8BfRbGf9AnYP4D+qmY/4P+NtZ/0JNw\
+/gPoy/H9P6A3Yf0HvQ7rP+i/wvnPoD+P9R/0Mmz/oo75P+jTsf0L+jqs/6D/EOM/6Kdh/gN6PPb/\
+g34Ttn9BPx/zf9D/hPUf9K9w/g/ol2H9x/OL+T/o12H+A/pnmP+DfgbmP6Cvx/iP5wvzf9Cvx/gP\
++iNY/8dBPoDz30C/G59/Af2vmP+D/jiOf4H+axz/Av3/sP8f9CTs/wH9Uqz/oH+I9R/0Yuz/B31v\
+rP+gl8B5uRj0eoz/oJ+O+T/oHhz/Ar0O6z/or2H9Bz0P+39Ab8H4D/phWP9B/zPmP6AXYf4D+knY\
+/wP6QTj/GfTZmP+Afj/Gf9APx/gPehPmP6Dfic8/gj4T83/Qn8L8H/Sl2P9zKrQ7MP8BfTnWf9BH\
+Y/0H/ReY/4DuwfEv0O/B+g96C+Y/oE/B/B/0Xfj8F+gurP+gezH/B30Nxn/Qv8b4D/rBOP8T9Cys\
+/6Cvw/4f0Ndi+xfLB/v/QT8O57+BfirWf9AX4Pgv6L/G+A/6Xpj/gH45jv+CvgnjP+gOnP8D+nkY\
+/0GvwfgP+mEY/0F/HfN/0H+M+Q/ojTj+dRr0Y2D8B/0HmP+AnojvPwH9BYz/oP8C4z/oP8H8B/Qi\
+fP4F9C2Y/4P+CrZ/QX8S27+g34vxH3QXxn/Qx2P/J+ivYf4D+q+x/xP0N7H/H/R/Yf4P+meY/4A+\
+HOs/6Idg/yfomzD/B/0T7P8HfQnGf9Crsf6DfgvOfwD9bRz/Av0ibP+Cfh3m/6D/DZ//Av0qrP+g\
+f4j5D+iD8cVzp0P7AuM/6BU4/wH0RBz/Bf14nP8A+p+x/wf0/TH+gz4H83/Qn8X8B/Rbsf8f9Ndx\
+/Av0/8P+f9DPxvmfoJ+H8z9B/zfmP6Dfhfk/6Bdg/Qd9A9Z/0NMw/oO+F+b/oK/A+g/6Dnz/A+hH\
+Y/0HfQn4Wgn6KMz/QT8Tx79AX4r5D+hujP+gX4f5D24f8x/QnZj/g/4l9v+D/hTG/yx4ThbrP+in\
+Y/8P6Dux/Qv6RMx/QE/D+g/6h1j/Qb8C83/QL8L+f9D/hvkP6EMx/oPuxvFf0Fux/xP0U7D+g34M\
+zv8EfTvmP6Cfhfk/6Ndj/g+6E+M/bgf0ZaDvA9fFHaDvh/k/6F9h/gP63zH/Af3X2P8J+irM/0Hf\
+gfPfQL8L6z/o92L+A/oJWP9BfxL7f0DPx/gP+tk4/vVjiIc4/gv6/pj/g34P9n+C3oz9P6BnY/0H\
+/U3Mf0Cvwm4q0H+J+Q/oN2H+A/q1GP9BfwjzH9DXYP0HPRXzf9AvxfoP+gmY/4B+HM5/A/0+zP9x\
++1j/Qd+A9R/0adj/CXoH5v+g5+L4L+i34/wf0M/B+A/6T7H/E/SLsP6D/hy2f/F4MP6DPh3zH9D3\
+wucfQW/D+T+gv439Pz+B/kDM/0E/EvN/0I/D+g/6MTj/B/S9sf8f9Pdx/Av0CzD/B30G5j+gb8X4\
+D/q9GP9B78L8B/R9sP6D/mOM/6A/hfkP6ClY/0H/B8Z/0Gtw/jPoJVj/QZ+H839AfxqWvwP0d7D/\
+E/RU7P8BfTDWf9D/iv0/oE/G/Af0IzD/B30Rzv8B/T7M/0EfgfN/QG/D/h/QT8T+H9Dvxv6f8dB+\
+xPgP+pmY/4D+INZ/0C/G+g/6OOz/AX0Kxn/Qx2L/D+jnYf0H/WTM/0FfivEf9Frs/wF9MbZ/Qe/A\
++Q+g/xPjP+ibMP8H/Q9Y/0GfivUf9G+w/xP0gzH/B/3fOP8B9MMx/wf9QJz/DPoibP+Cnon5D+g/\
+xfoPei7m/6D/CeM/6Nvw+UfQp2H/D+jnYP4Deg3Gf6yfmP9PgOdSMf8HfR9s/4J+Jc7/BH0qtn9B\
+d2L+A/re+Pwj6D/E9i/oT2P+A/pEzH9A/xzHv0A/FN9/Dvq52P8J+juY/4B+H9Z/0D/C+g96Hmx/\
+EehvY/sX9ME4/wH0Q7D/H/T7sf6D/jrmP6Dfhe1f0O/A+A96N8Z/0G/B/k/Qy7H+g96Iech3//vu\
+f9/C/3069Mivshd/MCS7Ov7Vo/aOy65sLttr18bsxWuH0CjMroy3lfzJrqR31I+hR5nlzfMWn2x7\
+a9euXUsNDzK8iXkvw6uY9zb8APNgw3cyxxu+nnkfw9cwm07ibZcxDzFcyLyf4fOY9zc8gfkAww7m\
+Aw0fzZxgeDjzQYYHMQ81/PE3Ng8j/8zDyT/zweSf+Xvkn/kQ8s+cSP6ZDyX/zIeRf+YR5J/5++Sf\
++XDyz/wD8s98BPlnHkn+mY8k/8xHkf8em0eRf+ajyT/zD8k/8zHkn/lY8s+cRP6ZjyP/zMeTf+bR\
+5J/5BPLP/CPyz3wi+Wc+ifwzJ5N/5pPJP/Mp5P9rm1PIP7OD/DOnkn/mNPLPnE7+mTPIP/MY8s88\
+lvwzZ5J/5nHkn/lU8s98GvlnPp38M2eRf+Yfk3/mn5D/f9s8nvwzTyD/zGeQf+YzyT/zRPLP7CT/\
+zGeRf+azyT9zNvlnnkT+mSeTf+Yc8s88hfwz55J/5nPIP/O55P8rm/PIP/N55J95Kvlnnkb+maeT\
+f+Z88s/8U/LPfD75Z55B/pkvIP/MPyP/zBeSf+afk3/mAvLPfBH5Z3aR/y9tvpj8MxeSf+aZ5J+5\
+iPwzzyL/zG7yz1xM/pkvIf/Ms8k/s4f8M/+C/DNfSv6Z55B/Zi/5Z55L/pnnkf+dNpeQf+bLyD/z\
+fPLPXEr+mcvIP3M5+WdeQP6ZLyf/zAvJP/MV5J/5l+Sf+Uryz3wV+WeuIP/MV5N/5l+R/y9sXkT+\
+ma8h/8y/Jv/Mi8k/87Xkn7mS/DP/hvwz/5b8My8h/8xV5J/5d+SfuZr8M/8f+WeuIf/M15F/5t+T\
+/89tXkr+ma8n/8w3kH/mG8k/803kn7mW/DPfTP6Z/0D+mZeRf+Y/kn/mP5F/5lvIP/Ot5J+5jvwz\
+30b+mW8n//+y+Q7yz3wn+Wf+M/ln/gv5Z76L/DPXk3/mu8k/8z3kn3k5+Wf+K/ln/hv5Z/47+We+\
+l/wzN5B/5vvIP/P95P8zm1eQf+YHyD/zg+Sf+R/kn/kh8s/cSP6ZHyb/zI+Qf+aV5J/5UfLP/Bj5\
+Z36c/DM/Qf6Zm8g/85Pkn/kp8v+pzc3kn3kV+WdeTf6Z15B/5rXkn7mF/DOvI//MreSfeT35Z36a\
+/DM/Q/6ZnyX/zBvIP3Mb+Wd+jvwzP0/+P7F5I/ln3kT+mV8g/8wvkn/ml8g/czv5Z36Z/DO/Qv6Z\
+N5N/5lfJP/Nr5J/5dfLPvIX8M3eQf+Y3yD/zm+T/Y5u3kn/mt8g/89vkn/kd8s/8Lvln7iT/zO+R\
+f+b3yT9zF/ln3kb+mf9J/pm3k3/mD8g/czf5Z/6Q/DN/RP532LyD/DN/TP6ZPyH/zJ+Sf+bPyD/z\
+v8g/8+fkn/kL8s+8k/wzf0n+mb8i/8z/Jv/MX5N/5h7yz/wN+WfeRf4/sll/wE/5Zx5keBPzXoZX\
+Me9t+AHmwYbvZI43fD3zPoavYd7X8GXMQwwXMu9n+Dzm/Q1PYD7AsIP5QMNHMycYHs58kOFBzEMN\
+f/wht//JP/Nw8s98MPln/h75Zz6E/DMnkn/mQ8k/82Hkn3kE+Wf+PvlnPpz8M/+A/DMfQf6ZR5J/\
+5iPJP/NR5L+b2//kn/lo8s/8Q/LPfAz5Zz6W/DMnkX/m48g/8/Hkn3k0+Wc+gfwz/4j8M59I/plP\
+Iv/MyeSf+WTyz3wK+f+A2//kn9lB/plTyT9zGvlnTif/zBnkn3kM+WceS/6ZM8k/8zjyz3wq+Wc+\
+jfwzn07+mbPIP/OPyT/zT8j/dm7/k3/mCeSf+Qzyz3wm+WeeSP6ZneSf+Szyz3w2+WfOJv/Mk8g/\
+82Tyz5xD/pmnkH/mXPLPfA75Zz6X/P+T2//kn/k88s88lfwzTyP/zNPJP3M++Wf+KflnPp/8M88g\
+/8wXkH/mn5F/5gvJP/PPyT9zAflnvoj8M7vI/zZu/5N/5kLyzzyT/DMXkX/mWeSf2U3+mYvJP/Ml\
+5J95Nvln9pB/5l+Qf+ZLyT/zHPLP7CX/zHPJP/M88t/F7X/yz3wZ+WeeT/6ZS8k/cxn5Zy4n/8wL\
+yD/z5eSfeSH5Z76C/DP/kvwzX0n+ma8i/8wV5J/5avLP/Cvy/z63/8k/8zXkn/nX5J95Mflnvpb8\
+M1eSf+bfkH/m35J/5iXkn7mK/DP/jvwzV5N/5v8j/8w15J/5OvLP/Hvy/x63/8k/8/Xkn/kG8s98\
+I/lnvon8M9eSf+abyT/zH8g/8zLyz/xH8s/8J/LPfAv5Z76V/DPXkX/m28g/8+3kv5Pb/+Sf+U7y\
+z/xn8s/8F/LPfBf5Z64n/8x3k3/me8g/83Lyz/xX8s/8N/LP/Hfyz3wv+WduIP/M95F/5vvJ/7vc\
+/if/zA+Qf+YHyT/zP8g/80Pkn7mR/DM/TP6ZHyH/zCvJP/Oj5J/5MfLP/Dj5Z36C/DM3kX/mJ8k/\
+81Pk/x1u/5N/5lXkn3k1+WdeQ/6Z15J/5hbyz7yO/DO3kn/m9eSf+Wnyz/wM+Wd+lvwzbyD/zG3k\
+n/k58s/8PPl/m9v/5J95E/lnfoH8M79I/plfIv/M7eSf+WXyz/wK+WfeTP6ZXyX/zK+Rf+bXyT/z\
+FvLP3EH+md8g/8xvkv+3uP1P/pnfIv/Mb5N/5nfIP/O75J+5k/wzv0f+md8n/8xd5J95G/ln/if5\
+Z95O/pk/IP/M3eSf+UPyz/wR+d/K7X/yz/wx+Wf+hPwzf0r+mT8j/8z/Iv/Mn5N/5i/IP/NO8s/8\
+Jfln/or8M/+b/DN/Tf6Ze8g/8zfkn3kX+X+T2/97Gf/MgwxvYt7L8CrmvQ0/wDzY8J3M8YavZ97H\
+8DXM+xq+jHmI4ULm/Qyfx7y/4QnMBxh2MB9o+GjmBMPDmQ8yPIh5qOGP3+D2P/lnHk7+mQ8m/8zf\
+I//Mh5B/5kTyz3wo+Wc+jPwzjyD/zN8n/8yHk3/mH5B/5iPIP/NI8s98JPlnPor8d3D7n/wzH03+\
+mX9I/pmPIf/Mx5J/5iTyz3wc+Wc+nvwzjyb/zCeQf+YfkX/mE8k/80nknzmZ/DOfTP6ZTyH/W7j9\
+T/6ZHeSfOZX8M6eRf+Z08s+cQf6Zx5B/5rHknzmT/DOPI//Mp5J/5tPIP/Pp5J85i/wz/5j8M/+E\
+/L/O7X/yzzyB/DOfQf6ZzyT/zBPJP7OT/DOfRf6Zzyb/zNnkn3kS+WeeTP6Zc8g/8xTyz5xL/pnP\
+If/M55L/17j9T/6ZzyP/zFPJP/M08s88nfwz55N/5p+Sf+bzyT/zDPLPfAH5Z/4Z+We+kPwz/5z8\
+MxeQf+aLyD+zi/y/yu1/8s9cSP6ZZ5J/5iLyzzyL/DO7yT9zMflnvoT8M88m/8we8s/8C/LPfCn5\
+Z55D/pm95J95Lvlnnkf+N3P7n/wzX0b+meeTf+ZS8s9cRv6Zy8k/8wLyz3w5+WdeSP6ZryD/zL8k\
+/8xXkn/mq8g/cwX5Z76a/DP/ivy/wu1/8s98Dfln/jX5Z15M/pmvJf/MleSf+Tfkn/m35J95Cfln\
+riL/zL8j/8zV5J/5/8g/cw35Z76O/DP/nvy/zO1/8s98PflnvoH8M99I/plvIv/MteSf+Wbyz/wH\
+8s+8jPwz/5H8M/+J/DPfQv6ZbyX/zHXkn/k28s98O/lv5/Y/+We+k/wz/5n8M/+F/DPfRf6Z68k/\
+893kn/ke8s+8nPwz/5X8M/+N/DP/nfwz30v+mRvIP/N95J/5fvL/Erf/yT/zA+Sf+UHyz/wP8s/8\
+EPlnbiT/zA+Tf+ZHyD/zSvLP/Cj5Z36M/DM/Tv6ZnyD/zE3kn/lJ8s/8FPl/kdv/5J95FflnXk3+\
+mdeQf+a15J+5hfwzryP/zK3kn3k9+Wd+mvwzP0P+mZ8l/8wbyD9zG/lnfo78Mz9P/l/g9j/5Z95E\
+/plfIP/ML5J/5pfIP3M7+Wd+mfwzv0L+mTeTf+ZXyT/za+Sf+XXyz7yF/DN3kH/mN8g/85vkfxO3\
+/8k/81vkn/lt8s/8Dvlnfpf8M3eSf+b3yD/z++SfuYv8M28j/8z/JP/M28k/8wfkn7mb/DN/SP6Z\
+PyL/G7n9T/6ZPyb/zJ+Qf+ZPyT/zZ+Sf+V/kn/lz8s/8Bfln3kn+mb8k/8xfkX/mf5N/5q/JP3MP\
++Wf+hvwz7yL/z3P7f2/jn3mQ4U3Mexlexby34QeYBxu+kzne8PXM+xi+hnlfw5cxDzFcyLyf4fOY\
+9zc8gfkAww7mAw0fzZxgeDjzQYYHMQ81/PFz3P4n/8zDyT/zweSf+Xvkn/kQ8s+cSP6ZDyX/zIeR\
+f+YR5J/5++Sf+XDyz/wD8s98BPlnHkn+mY8k/8xHkf82bv+Tf+ajyT/zD8k/8zHkn/lY8s+cRP6Z\
+jyP/zMeTf+bR5J/5BPLP/CPyz3wi+Wc+ifwzJ5N/5pPJP/Mp5H8Dt//JP7OD/DOnkn/mNPLPnE7+\
+mTPIP/MY8s88lvwzZ5J/5nHkn/lU8s98GvlnPp38M2eRf+Yfk3/mn5D/Z7n9T/6ZJ5B/5jPIP/OZ\
+5J95IvlndpJ/5rPIP/PZ5J85m/wzTyL/zJPJP3MO+WeeQv6Zc8k/8znkn/lc8v8Mt//JP/N55J95\
+Kvlnnkb+maeTf+Z88s/8U/LPfD75Z55B/pkvIP/MPyP/zBeSf+afk3/mAvLPfBH5Z3aR/6e5/U/+\
+mQvJP/NM8s9cRP6ZZ5F/Zjf5Zy4m/8yXkH/m2eSf2UP+mX9B/pkvJf/Mc8g/s5f8M88l/8zzyP96\
+bv+Tf+bLyD/zfPLPXEr+mcvIP3M5+WdeQP6ZLyf/zAvJP/MV5J/5l+Sf+Uryz3wV+WeuIP/MV5N/\
+5l+R/1Zu/5N/5mvIP/OvyT/zYvLPfC35Z64k/8y/If/MvyX/zEvIP3MV+Wf+Hflnrib/zP9H/plr\
+yD/zdeSf+ffkfx23/8k/8/Xkn/kG8s98I/lnvon8M9eSf+abyT/zH8g/8zLyz/xH8s/8J/LPfAv5\
+Z76V/DPXkX/m28g/8+3kv4Xb/+Sf+U7yz/xn8s/8F/LPfBf5Z64n/8x3k3/me8g/83Lyz/xX8s/8\
+N/LP/Hfyz3wv+WduIP/M95F/5vvJ/1pu/5N/5gfIP/OD5J/5H+Sf+SHyz9xI/pkfJv/Mj5B/5pXk\
+n/lR8s/8GPlnfpz8Mz9B/pmbyD/zk+Sf+Snyv4bb/+SfeRX5Z15N/pnXkH/mteSfuYX8M68j/8yt\
+5J95Pflnfpr8Mz9D/pmfJf/MG8g/cxv5Z36O/DM/T/5Xc/uf/DNvIv/ML5B/5hfJP/NL5J+5nfwz\
+v0z+mV8h/8ybyT/zq+Sf+TXyz/w6+WfeQv6ZO8g/8xvkn/lN8r+K2//kn/kt8s/8Nvlnfof8M79L\
+/pk7yT/ze+Sf+X3yz9xF/pm3kX/mf5J/5u3kn/kD8s/cTf6ZPyT/zB+R/2Zu/5N/5o/JP/Mn5J/5\
+U/LP/Bn5Z/4X+Wf+nPwzf0H+mXeSf+YvyT/zV+Sf+d/kn/lr8s/cQ/6ZvyH/zLvI/1Pc/h9s/DMP\
+MryJeS/Dq5j3NvwA82DDdzLHG76eeR/D1zDva/gy5iGGC5n3M3we8/6GJzAfYNjBfKDho5kTDA9n\
+PsjwIOahhj9+ktv/5J95OPlnPpj8M3+P/DMfQv6ZE8k/86Hkn/kw8s88gvwzf5/8Mx9O/pl/QP6Z\
+jyD/zCPJP/OR5J/5KPLfxO1/8s98NPln/iH5Zz6G/DMfS/6Zk8g/83Hkn/l48s88mvwzn0D+mX9E\
+/plPJP/MJ5F/5mTyz3wy+Wc+hfw/we1/8s/sIP/MqeSfOY38M6eTf+YM8s88hvwzjyX/Nn+yK6nj\
+9b3ihh41kd7foTh3iz87BWcJzhCcLDhJ8EjBiYITBMcL7hHH+y/B3YI7BUu/7YLbBLcIbhLcKLhB\
+cL3gOsG1gmsEVwquEFwu2CvYLbhAcL48/4KdgrMEZwhOFpwkeKTgRMEJguMF97wmzr/gbsGdgjsE\
+twtuE9wiuElwo+AGwfWC6wTXCq4RXCm4QnC5YK9gt+ACwfmCcwU7BWcJzhCcLDhJ8EjBiYITBMcL\
+7nlVnH/B3YI7BXcIbhfcJrhFcJPgRsENgusF1wmuFVwjuFJwheBywV7BbsEFgvMF5wp2Cs4SnCE4\
+WXCS4JGCEwUnCI4X3LNZnH/B3YI7BXcIbhfcJrhFcJPgRsENgusF1wmuFVwjuFJwheBywV7BbsEF\
+gvMF5wp2Cs4SnCE4WXCS4JGCEwUnCI4X3POKOP+CuwV3Cu4Q3C64TXCL4CbBjYIbBNcLrhNcK7hG\
+cKXgCsHlgr2C3YILBOcLzhXsFJwlOENwsuAkwSMFJwpOEBwvuOdlcf4FdwvuFNwhuF1wm+AWwU2C\
+GwU3CK4XXCe4VnCN4ErBFYLLBXsFuwUXCM4XnCvYKThLcIbgZMFJgkcKThScIDhecE+7OP+CuwV3\
+Cu4Q3C64TXCL4CbBjYIbBNcLrhNcK7hGcKXgCsHlgr2C3YILBOcLzhXsFJwlOENwsuAkwSMFJwpO\
+EBwvuOclcf4FdwvuFNwhuF1wm+AWwU2CGwU3CK4XXCe4VnCN4ErBFYLLBXsFuwUXCM4XnCvYKThL\
+cIbgZMFJgkcKThScIDhecM+L4vwL7hbcKbhDcLvgNsEtgpsENwpuEFwvuE5wreAawZWCKwSXC/YK\
+dgsuEJwvOFewU3CW4AzByYKTBI8UnCg4QXC84J4XxPkX3C24U3CH4HbBbYJbBDcJbhTcILhecJ3g\
+WsE1gisFVwguF+wV7BZcIDhfcK5gp+AswRmCkwUnCR4pOFFwguB4wT2bxPkX3C24U3CH4HbBbYJb\
+BDcJbhTcILhecJ3gWsE1gisFVwguF+wV7BZcIDhfcK5gp+AswRmCkwUnCR4pOFFwguB4wT0bxfkX\
+3C24U3CH4HbBbYJbBDcJbhTcILhecJ3gWsE1gisFVwguF+wV7BZcIDhfcK5gp+AswRmCkwUnCR4p\
+OFFwguB4wT3Pi/MvuFtwp+AOwe2C2wS3CG4S3Ci4QXC94DrBtYJrBFcKrhBcLtgr2C24QHC+4FzB\
+TsFZgjMEJwtOEjxScKLgBMHxgnueE+dfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4\
+XLBXsFtwgeB8wbmCnYKzBGcIThacJHik4ETBCYLjBfe0ifMvuFtwp+AOwe2C2wS3CG4S3Ci4QXC9\
+4DrBtYJrBFcKrhBcLtgr2C24QHC+4FzBTsFZgjMEJwtOEjxScKLgBMHxgns2iPMvuFtwp+AOwe2C\
+2wS3CG4S3Ci4QXC94DrBtYJrBFcKrhBcLtgr2C24QHC+4FzBTsFZgjMEJwtOEjxScKLgBMHxgnue\
+FedfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThac\
+JHik4ETBCYLjBfc8I86/4G7BnYI7BLcLbhPcIrhJcKPgBsH1gusE1wquEVwpuEJwuWCvYLfgAsH5\
+gnMFOwVnCc4QnCw4SfBIwYmCEwTHC+55Wpx/wd2COwV3CG4X3Ca4RXCT4EbBDYLrBdcJrhVcI7hS\
+cIXgcsFewW7BBYLzBecKdgrOEpwhOFlwkuCRghMFJwiOF9yzXpx/wd2COwV3CG4X3Ca4RXCT4EbB\
+DYLrBdcJrhVcI7hScIXgcsFewW7BBYLzBecKdgrOEpwhOFlwkuCRghMFJwiOF9zTKs6/4G7BnYI7\
+BLcLbhPcIrhJcKPgBsH1gusE1wquEVwpuEJwuWCvYLfgAsH5gnMFOwVnCc4QnCw4SfBIwYmCEwTH\
+C+5ZJ86/4G7BnYI7BLcLbhPcIrhJcKPgBsH1gusE1wquEVwpuEJwuWCvYLfgAsH5gnMFOwVnCc4Q\
+nCw4SfBIwYmCEwTHC+5pEedfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4XLBXsFtw\
+geB8wbmCnYKzBGcIThacJHik4ETBCYLjBfesFedfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXX\
+CK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThacJHik4ETBCYLjBfesEedfcLfgTsEdgtsFtwluEdwk\
+uFFwg+B6wXWCawXXCK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThacJHik4ETBCYLjBfesFudfcLfg\
+TsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThacJHik4ETB\
+CYLjBfesEudfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4XLBXsFtwgeB8wbmCnYKz\
+BGcIThacJHik4ETBCYLjBfc0i/MvuFtwp+AOwe2C2wS3CG4S3Ci4QXC94DrBtYJrBFcKrhBcLtgr\
+2C24QHC+4FzBTsFZgjMEJwtOEjxScKLgBMHxgnueEudfcLfgTsEdgtsFtwluEdwkuFFwg+B6wXWC\
+awXXCK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThacJHik4ETBCYLjBfc8Kc6/4G7BnYI7BLcLbhPc\
+IrhJcKPgBsH1gusE1wquEVwpuEJwuWCvYLfgAsH5gnMFOwVnCc4QnCw4SfBIwYmCEwTHC+5pEudf\
+cLfgTsEdgtsFtwluEdwkuFFwg+B6wXWCawXXCK4UXCG4XLBXsFtwgeB8wbmCnYKzBGcIThacJHik\
+4ETBCYLjBfc8Ic6/4G7BnYI7BLcLbhPcIrhJcKPgBsH1gusE1wquEVwpuEJwuWCvYLfgAsH5gnMF\
+OwVnCc4QnCw4SfBIwYmCEwTHC+55XJx/wd2COwV3CG4X3Ca4RXCT4EbBDYLrBdcJrhVcI7hScIXg\
+csFewW7BBYLzBecKdgrOEpwhOFlwkuCRghMFJwiOF9zzmDj/grsFdwruENwuuE1wi+AmwY2CGwTX\
+C64TXGtzdk3Wl+r37Jr4T/SPcTvLErOr469epn6vbC7bb9fWoUctilP/W2P9VMs/bZbPWK1/nPBN\
+dtWO7FUf/iR71c69swety970TdkhagP51gaG7NpabPZjr6/3vyirUr/hu/zE/OzFWS/ol8NnV3WW\
+HZhdnXWQ0rtefXzXrq5Zu3btWhdfoHhQgVrXb/1tl6s/6l/y1XrTsq/5YIk+sKqKJdlV5Yuyq2oX\
+qj9X1ZSp/06sqixRP2ZlVw9OGm0WcnY5mrNrnLdnV7V2lXy+a1d2Tf7t2dW5S5TWnF31nJZf7dSy\
+847qGr1uda3eUHZNebP+W12H+Zv5Xb9P195U/Ju0jv69qlX9XrUqu9ocSHa1c5G14Tue0ViwyF5w\
+hd5A1ebs6vKuWdlp6eYIy07dnqatZVetsfdTpRbbvq9PNDu86Q1aV/36x3+p8hq8VfE1a3VJXFiw\
+xi6c7MUfjFIF06UOokt536k/vB53bXPZQSS0diWrzWw/xlDrql36cKtWm4Wyq1755L7sqvXZX2zM\
+Xtw1aOnTvm1WVexUBb1DrbRz6MPD1I8dQx+Oy1w99KbmgjVLYc8pasnNWPQ7VdG3OvXHp+PWOT+K\
+y67O36zXzh60Wrn6KLtqndpp1wGbdu1avGOQOsh9sxc7dwza/pJZpjp3pyqjA6mM4rsSVXk/7be3\
+Yea41DFpW8fpV83A36epBUabgqgq35pdpfdb0GWXwZcvWOfLqYpztTlXb3bN2qLExRVb4/T14Nyq\
+l7vzC3368rdmD9q4fYgRVcGok7dVHVyXWfP5rhq1re1H2ufK2sHKl/lcdX+qN7t2dOA5ojKtyleH\
+pf/N3UFeTMU5+2NjR5Qtm5FlbMo1dyvt3mzgLP0qPL1BVYaD7TLU3zvy2+gwPowaKsY33zP1VxVr\
+vjq0l7V0xOO4ki7XTH2a1Vob1aGsl1datXOjXqv4+V271Bkdbvg05/qyffUnAOO2x9sV8kAVVxwP\
+DYrr+vlzppDX05pml19u18Xn3EpFvnPogqzsGuNu82NUU43F0k9N5aWzaNbT778358snHfSVMWRO\
+xerXrdNu72ydPoFztgSsNK6NCq/LV3inbU+nc9zadeEa3yafUrWy62/vUXBSFaDrvm4+85+qc9h1\
+kalVazPx9OsyX1yxM85cP6gWBLvkdmSf6NxZ4F+zZ6u/Lwss+WV6t1veN4e3LHtxc6bmDT4u0Xxg\
+i8Xxy826rV3PrLWVrZYy5HVb0R/u1sqh6iJtdd41/oyh6k6Qf5eqLyuswvqgS9lsfdicseXqKlum\
+/r5C/X259fctXfpPi82GWp0rzAlsda60fjZbP9dbPzdaPzdbP7fSLUjvTZ1f24reA239jTdMGDZ/\
+vuFt9Xs/d3Hbe/Yu8jJJMzHqctjNiTHYzW/X8G5KYDdxT/h2M+uz/u9mx2p7N0uXs2z2dPO7vj39\
+7MP+7+nlzbynrf57euIh356WbqClWhfpD7Kb9Q0d60ej/egkP0rxo3SLxMXq2T7TF5ChWg/fIKu+\
+q9v/4vjoE/+L5ydbLVa/p23lS3uEKrGuxZvNpT3bP7LnqUtzpbp0VwTEaOdKvWrWu2aLK+09JPvY\
+HIF3lcV8jCeyYvvwvGIr9uV5eZulVOsrY6l1sUV2BludXdbPHdYZNUnITe9Ym6zJb7YuNv09M/vP\
+SW+aStOvXTh4F+Zia7ZqzP6wmyff6P9uDm/m3ZTAbm5c6dvNFzv6v5vFT9m7sS82e08nvOXbU/c/\
++78nTzvvaav/ns59wLenY56mpfwutpV+F9tKv4ttpd/FttLvYlvpf7H5pRW/bA+aVliZ2VVbrJRC\
+/X7xVt/vDzVbv3O1nr/eVuyq37zNUqyLI+8jZnPx3AHbvmmLfwaIWSulM+ayWFqwRuaImwPvpJuz\
+a5bppbs+vN9KRWp0SviGuf+/ZhIGHW8OsYvg8peCZXk6FqxXx9Bclf9EYDgwJ+mcDk511mu++kHD\
+OwzXqKyErrzWdiN3KUnnal2WfPETJstK0UtXmxNbkzdIQ9VSDWIjqx/TecqwuO1nVuc/oQ+A5Fv+\
+sWtX8dCrm6ucW9Rfc9V/hueuFKv+llbNXan+OET94twiK0H5izI/Z/chrE/bAtatE/qrB9C+iQpb\
+raq99qWgRVDwuCmCdCqC0VgEo7kI/Db0+KNWMZxhH8kJTweWwBNB1ryG1sx9ImQpzHvBrxR0DcsO\
+dkOgWmbuiVNMVqrSUbgJLHuJi8aOWhutY+j+wPxpszk5NZyy7vOMKYZUvUa1uYypGFZWLT2JikFu\
+6DN1tVXHbT/ZPo5ZqhpUOTdUF2wIsnCrWrhqRLVzg275YLPs6k2m4mdfGNgSNK2VqvwtVbmb7QbV\
+xa/R6a12blFVQZVg/BvLB8U9HeqaqTL1zflQiAp0MG1tq3bp7Kp2PqGKRZ+Vh/RKW+j82aHYPoW3\
+PWkuXlVswwLi2IMbe4tjgx/xjz2fPewfmya+IOIPrs8R7cnN/ktNmK7ryMV2HVEtquVVuXdNqXLe\
+OqUq9yZtZGmIenPIq1Rvqp13Kd/VzmFVxjOkCQ9SLFnvf6uwT+ldDeavzaoiradbhqlIbdRwuzD4\
+Sm+a63PNU/q21XXws7t2Tapaq5ZUuf66KVXvdw1Te5xSpXsXbs2uOlM3mW9SP4fpk6IcDz9zxDb9\
+IebFFXcNKk8JvoOrHzCXWPYIs87QU1YtEA3HodfeEGfXZ7nyBH101SOyK19XbXjVpNffk3tyvSmN\
+N7sGPytvmvZq+6OprGekqdMeCGfqxEHG1K7yk4Lv4K8rjKnxI4ae4lwaaOiDkIZKVvgbKnkRDKU9\
+E8rQuBVgaM7T0tAvVoQxtL3ASp/NvvQqrU9z7nvEO9za5T8v9/255+3AP1f5/vzG2wFN63jT3lZB\
+5OILJ/zcd//UV8Y1H6wwZptmmI6qxjzzozY7aA+f6WE7yHQBVGabBU1XIJVC8XpTJOpPJeZP63QJ\
+Fpqbe0GzSXHNBswl8LfnVFu3crZaTp+o1so56rc4v98WN+nfiob+frE5ddY2W7sW0W26udqsrS69\
+arNKlY6blebg+eJMpMRiqf2HgFRu8N/MAovUwS1V8iLr4Gqe09dn+YGLzZYHbbtslylQPoQeunUs\
+tQ9hmX0ItwYcwg33WRFAHsJS+373V7PAEqt8ltjl86wJET9Q8h1qXTo3lI+ott627eZ+E2KTtzVY\
+fTDq5nTeELP3Kt0dM2GY4hHmPliVv5nO2YPrrHNmlcmbXSvM2nXGq3XCm1aZM70QpP1f5sNW/9Kf\
+6PjGv6CPfOi1OiHmv7R2XWDSSIrPL/rXk9aue7Uybs3Qm5r1mm3GTsb9dw5SHuNHX7OXWWtzi9UV\
+Ff/NIq0Yq5+2+g7psFX2ySS+pB0PkU/uHZtMyZ5Oksp/XxfX//N4/a8z21/0ZJydP6vsenudfUZa\
+KXVvHT/E+jmMUnnrfLV2vaM2tn2CVQy8kWS1kW0PfqM3XesrZ3N0B6tA+EWdrlaLG6jyXdvjs/ju\
+gyYcwYV9/vY8fTGr4MPH/KsWHXre2T5K/qHY+gP0eputXvcgh46/qKZg10GmUUMerlmro4MJGktl\
+/2SQfsn1vpo/e5OVRPmpv/67nev7pVY/oOqeRVJrV47psJwxjM/Ka21wVurWmiLZzAV6xBpVzDf7\
+72nJ6iBRMG19QFchDnVUlV9bla9qRc3CwOjX6tQfyInrGv8X4+AO5WAR3Q+Mg6c3m2GPjXAuF2yy\
+O+zy1b94jRyhApO6M5zmvHbo7+uoxtjXyaB/aOdmkKM6V8UT5xLqiX20yeTPq6vULqwcbOPQU+L3\
+uX1Q3OUFtK2y/MXOW/fquv3PZrcrTOjw9SEue8jI6lZGnSTZD9m5CWV6mbTaej2ysix7nHP9r+K3\
+zaDApxNnnc6tyq56cVGnOoy56reNurdfle0Rdtm+sg4HS5YG5Gfq4q/OHfbYIF/vctK9+j423PmZ\
+7++j8e/x91Jb4LOhp6wf+odmX944IZ/uXJvpzjVaB9/GY+nGNUKcus2OZp0Ev1U3KE7tq3I8XW+L\
+sqtr9Gq4u5s3Wn9Sv/9J394rm01EKkvWG1imNqBPwJSqt7JNWmEGdo5en73fRnWRTWjS0jb9DUv/\
+ePEPEYvv0OmnicX6FFXXjdjl26lzNaURFv7mXr3ua1Oq3tM0dIQepxsWP8IycroZrhsWf6DFE3lD\
+dOX6gtCPzXboZuFTN6/i2zeHIVrGqi9rKY5/n+J4nl0/Xw55c6EGluLKi80Qnz7C6kp9WmpK1J5r\
+RtAR05FWm4WGjl6vapNuNNPWb3zQaiWa7EIvrH8OPcWctgW5tsAnUu9ODzVwuerrUVd9k7+owz7d\
+Z+ieNmqTQuGZn2rr+ojmH6WOSR9itemFMU07w1VLNW8/BAphg7pHblv3jWnm3FFdow9lSnXuiik6\
+/6tuHE3+zJld/MGQ6iZdBOfrq+bRQVa1uPQVE4d0PmiM6GMqgdX4ZqtP52z6w2xr5/NM0kLpl0/d\
+r9l3kmtq6YeVolF8Wm0i7AxWW7vGvNT7qVRJmx1+L1wP4ffIp2DjrV1Pqeq1vXpKdX2JKYaGhVCj\
+i+7Ut5ytU6r+uejdXVWr6Fdf/Njsix9JvgE+a93j7+Tb0oEquHZdrjvaa9xd6mY0oaBgjYwv1XGL\
+dw4qn0KhZLzKuPN3Vh+sI451da+8xy/YwBKj7ev/Hr9ws/2skNuaE3Zbk+/RFcv5mX/Y+qkduDZS\
+4Mo0gStd/7c2xaoGJ9FPE53UnWhUYDhTZ32UqaejuJ6OMvV0FGWFmdaJ+VxFdKoni5v0fweVj6qu\
+1Dtb3DzI0zzseB1PfrRR7av2CCVu22cfnXTrBXeVH0ULfrGRl1N3nOF1Zrk34inGVZtDVtc17c/Y\
+nvas79yf/3cIoSfSBtXRVlfq1b7YPPT+1bzxrWrj9Wbj5fH6IPSicWXfs4yZ8lxuqm9Au24Dpb6L\
+7CvGdyPNvsdcEDP81bef4Lu3+hfz6uVP8QVih8jETRFfIKe2wAXS87i5QOzN3KZS/O3XqZt6Jh3L\
+KN9Oz3yWTrrxfsXguDgqHX2Pecx3j3mG7jHq2hoF19ZhT+i7xTobZ9xt9qZWnVK1nS40dZFVPZOt\
+L7vPu/Y7WBdsiqkG++v7xsabB8Vt1z1s8c/cDHeQVucdph3mXE4/7qUfK+jHQ3G+8r7YF8bN/aQe\
+7zK2Ov9x31moqZ0RcJdJfZLuMlfu5XeXueX5CO4yOvRV16SYe0262W3jbCzh1q7Bd9m3kynmXqT/\
+q6JPc9elz9rzIQ7WIXgK3FO2L9DKaLPVk8xaVF+rWq0qbO5lo3zR17qHVZmB6+Ff23vU26puGt/r\
+Mar1WvVaX79gL6sCSbO6lWycou5qtJ5aA+uNuqFMpAOZkKdXz60ycwEOpz7CYfYpvti+s1h3twXn\
+4q1mYu/3TsqRTCSyTtOl63z3Ti1vv5R2tKt8ppJrxsOdXfcn5Ua/s9G+nc1d79vZaNpyjfXT7Fzt\
+wdysR4mb9SjfzfoU39HEf3TjoLgF+1kFU4a38Xh1yWxz95gcV93HmybyfTx/eTSFX/c8Fb51YVg3\
+crtx+9Sf8cKw1QtW9n5hfP9xDkf24f5mQ8Th6O/NEI7mPgIbV4lkvb5fqwJqmEhnqOEIiCoP/JEK\
++gg6a5t9raeTtx9v3aGxBWlWuuqPfKvW35/v2vCYuVVvNbfqCRf5N7b0d+rUvW/E16a7adjX+uZ3\
+oP5vzZCvA/ucqmvNgjWVW3u4bCr+DEpr1zdmalhl5td+6vLlBhd9beVHOm+tqdFYXat3VN2od6pv\
+l9YSZz9itbBq876mc0MbvNgsVkubr6HtmZvd5y+Z298w334fG+ZrTWxu962togHta7y1r0tN72Hl\
+aH+1ca1RU8wGa+kHLUO+O5spWN5lgrD1F+X/GatrpTKbVmnuMUec7Vvz77eZTZo/+BXlCyvsXpXl\
+87hXpe5h32bUMhfpO2l1ndmcXcEmPwkVLKERjlTd71QF23baLr+z8ZoZYK/LxG3sg9t4+iG/5Sev\
+gdJr7dp+p9/JPH2VbNsPvfYm3f76nTWZ0dRN3ljd3Vw9V7dx1yk4vOpuv8mAvOLa1f66fTg/v9Nf\
+t4/rrmbe0QVqR11rHzFNYl3jRY/DCDM/s2mn2VHjjh59EXyg/1vT1RPsItjRYw86m9N25e2+Meij\
+TM9v5YhvfNK99VR639BhJbxoqq7G6lq9/erGD3qosWEtkfOQXfdTvqGLyWytcrxp49TStmtoe6Z2\
+f7XJ/H2Ytf6VG0z9MlhdaVzVZAy/bpBp7LzxuN+ypzT6Nl1VOYpWGWX9carpfawc4q/eSm3VYd/4\
+9lJDy1BxbGiiC+NeujCGWKt1ttoXxuhvrE606trRvtVqb7GKrCZXJYOJM2sG2Rfvs7WmN6fZNkPL\
+ZzzmK+JJd/m65bLuMpXbbNmu3Cc8DpX7gwfgiCl+bUszAbZuBK702WOw0iMP6EpuF1Rr1/u3+Z3U\
+zCcDr4EH9TWwHK8BOthb/8L1Un9/3ldx7XOix6e3jxdrFf/Ff4qs8Xqen2gXT2vXuL/AWW3tOvW2\
+/2fvS6CjKpaGZwKBgEgGRAxuREVlUYhsssoigwMkEJZAWMK+70uGTcJiEmAcRwOyRHYBNSJKFMSI\
+gMOa4HMJihABISqfThjUPESN2+Tvru6+t/vevndmgO+d83/n5Rxl7u3ldldXVVdVV1VrKIe+f+aA\
+MpLH0Uh8W/eoGLPkKKYKDaH4rGS3CGBNqRb+P6y/ZJsICBQycIO6Vl8f4nCavHqWbCGL6bD8nxHm\
+DhSC+3fDt/DuQGs0eFvZHQjiJgeIZJJI/o1c4LZasOxT9QMsF5XYiNlkOCEg8mnPYpWA3v9UWM2z\
+SIlO91ldmfUC3HtKfwpUmxPVv774duFBsm0Q6iD/ZHJo/tY+ECV6KG8Rfh9VtowAYe48Gk7J49Aw\
+bhfXH8IfxHn82ZiV8y3a8i0CbyH4bRQmguC3QQD4fAQl7KTNn3R39XfQYOClLQq2VCng8ZZ10+wD\
+pYIPEbuv7zuARxhpbhIe1VinIs27R3R41HmLMK1tnwTDo2/eCoJHzV1h4dGMjwUwr9wRCh5deU2G\
+Ry33m+PR2DwdHqUfNsOjB/dyWOHbKeDRvI0yPPrlXa7F3p0SPPrmJQHgTd8PBY82bFL53zEZHvnz\
+lApbUAXfLblGeJRD8CgZ8Kgf4FGiFI+SRTw6sVZFmgRggpnjOTz6c6MwrcH/4vAoEfCoH1ms8bTG\
+SzsZHk0nSzyXLMB4Hpzb93DgHPcGkexxfaQWfbwU4dlaHgjfvxcKLBM3KqByHpXBcvN7SoV+qILv\
+w7cAljk3D5Zpa1TA3efVwfItkdVEfxQMlglvhADL5N0cLO/aIcBycaYWluv2hgLLihsUUDU4IoNl\
+371KhShUwTfrTR6W8kAHEh4xC0Z6WBPzgM04WSeO6KI3sB77ETsZdidhC0uR6wxSB3x/Qz8noRif\
+/7g+w08Qn2H3EZtHPHb5o555fHyM1qXIQ0b2qpWMzINd0JoC1yTeU7p4lMyd2FlIOkvioFbG/OPf\
+AM6UiF6XQb/kdVIOgeIUkNXaWUgQCHVXxHOC4feEr+vCQ/62CqBq5UIF/yZQ8sqCMuiSjkEijDvK\
+4U6MwoeDpKthETA/7hRNey65Hk3AVUBPJrUTZotTLJn51R0w8z6amQ9+jcx81jYyc3dScTxGDDp5\
+Ze6V8GiTSKyNAhgkT0coc2fmde2JHgloKcW1vyR2KzjBc0WYhNQ4XAmFOqTAU7IzH8htWFNLL7NF\
+b8ZG47GO9LQii/NONLxCEj7iLGb4/Tkaot/uSJ9SZHUAwgqhOQFQrwCjCNRJSxjuUGLZKMUQLVlA\
+HgQfteo7ND5qWtTjIf3vV/gRJ+KlOWijpzzOjSwYxschVidyRqhW6ylUK6UxM89URBO8Q4KY1gqS\
+xRFHehLHD+IV5tCGeAceh/kmlAGC4vWyOly9o8Q168ivmasgHmOsFO316/fddh4aM8n6xboTEBNP\
+K+CXsJsLEA3fCe/vAavoxtpWQgG/xsMrklVU2ysLSdt35ddyumQtO+cYraWWqvhFvXu78aJuWQ++\
+TQrVEIp5vaJmUedBtXy1Gl5Xn6USXlQJxU2oqC6qFuFcGLXxf0lCk6RK+JPQFY8ev1cS+ZZZIJkH\
+AVR1YXhoG7EFHbrcwWEtdJwsI1ya+Wi8tk5x0y48yA4yD79HfHmwNwZ7t3Ad8f6C1SRBX90Qc3N9\
+BQ4ulQFQau1EqJ1PaxfRqDFf7SjMM0UPA+erEu+N9CvJvGenfoq5xOMB5vAAWFWjM6uAVG3PU0bx\
+0UvUj5PUL6D1X3yFGBbOgpNGUh6MEuKuANaXI8kplJucioB3efFewnqT0zXW2kISIgnWWgzEAuXj\
+CS9RI1wC8SOlC5kBIg1YmG9JZ2AG340Fe2nfFRzuvlGUiB3uJ1HXnWz+e4kfIlIGKlMZQJnPF5XV\
+gVZ+AakX1colXjK3Ak87mqzuReaRkRAGW0pdehgNJW+HnekRFsYXqQyG1ehKBgNMef7zSB04oHMX\
+Tt/OSQBxPFVwfIkILZjRI0zniITyiIgooJNCrSgUJacTxhe8wQnm182mBDN7rYRgVuzRE0zCWsJS\
+0rw8zXRyoRmcoGRzIEpDNnXWEv6CWaNToZxuLmAzBVX0xNNqmznxsHlvCU5FX79HqKi2looy1kip\
+KGEroaIfRCraQldiaWU9Fa3bTaio5uKQqajyGhkVvb1EpaJjiwQqarnbjIoaubHnpT2HiMGdq4hi\
+MEQ/wAdeqqKOeo8bkVR5QEJS+14WSCp0jAPqAX+5Qm6f/WsLEFdr2DTRSGCMm6J0YywmY/w1ijno\
+5/tsaIz+XN0A67ysD6INSXzTil77Affwt4AlFPHyuAtG3UkRamBdSBQ/iViOcXhAYCvlxYBlVVU+\
+0edZNPocHZ8YvCUMke2JDbC7W8nu/hDres6zIBr56OeVfTYKfd6/n7IKEksQy4Ml3j3Gx/wWv8tl\
+GAawPoUey2fZymdFlTcrn24rnx5VHoedtYtJWGOcwzOmVHDI1nI5vPfHgxOlArEiCrGp5QDMpx1M\
+mlCL+pKiGFXwhHkvRRyg5ANCg8Wa3mLVJsVck764yXLSpJR73xZbgWdJ+ikKQD+3a+rfgus/KRlq\
+jlqf/+45xDH8t2nGf3yrNmBfIicBnMrIApAoffKF6iz83rYcdX2GLfozy0F3KaXDYo1qqI2g2mDa\
+SNC9li5lTgSV8Cj99TSTrg02ZvLVdcsQILHmcSIUFXlllKoik76ej5KryCM3ajMHGMZCUa7X8S3C\
+WfPmm3JW4KCYkxPONmgZzSCA6ROcSgFO90UB2fZh1b57k9qv5guc9uM3TTgtEU/AMRX6+BmB1f8i\
+49k1xJ6eMetJx9S6bFAip65fv/FqGNzcyoYMLjVDx+BY/pOXVQbn1TK4rlEqg5uRKWVw89eHweBS\
+1koZ3JpMOYPLr0wZXFYIHM66U+BwV9+Qc7ih4XC4Li5vPJZ0PlKxULdBjNCzO1bUVc7u1m7SszvW\
+5DY5uxu9Sc7u4jdp2B3r519ydnf3Jg27Y/XXy9ndlY0Sdndmoyw/iaEAzLE+9rVHNazv9nSe9S1L\
+F1gfa4SP4njWNzxdwvrcS8xZ310bVda3+RmB9YVjTGtaifFBJnI3rhTMlJaYzZnSJJKuYBuRC7uE\
+1dzxOuFlLzjDYZSPPSMwSibj5kSKjHIfNU02dQrsbVtOGIzy+BKeUfpShZ4G5oTDKO9aq4inHL4N\
+N1KsCWPM46ILLq+kLGcTDuHJ3AeivFCjYKUSD1LkSPdFaBQnWNJCTslo9SzTJchsl1OTpiVVsxzE\
+gEOWo5TxpbOzgNflUJsR1g3zsPsW41EOdxXfMGyzST8a60hPK7Sk3upIn1JoLZmNFWK/VceA/1jN\
+I7CDRdCib6MBJxhttl+8Sv0rZgVTY3CtV2jte2YJS/n8q2ZIQZe/ZCZtI0Sa9l1BTTFIH4MQcAQB\
+yq0d7qoO11UlUKFPBQIMHWpYVkN+rTIDi6NNSKODd5MSjTU4yzhXFN1T3nwFAV1ZGHux8tt10ffu\
+J3QjgSFcH3ImZAnIeUCPnI2ywkPO9ctE5PRvJys3akYoyNl+BoAox1013t05yghFfVVl+DnLAD8H\
+vng9+NmMjvuN6aHgZyStnTZdwM+ftoWAn92my/Bz9/MUP+25bsTf5kZpsdR1Eqw4Kp7+GmGAp8kr\
+w8PT/T4DS3hwfP1nqzG+jvlMhq86MyVaky3SoHPYUXIpLuZAMjQBF1vbi6I9J0k0M0JVr9Vh9SqY\
+60ks55D0twwaZwkyKntbnEFWC/ams0yO/zds+pHsPIVvsCuDJk+gK1n+MsGCOVNZ97xtaEmGSBkn\
+Xzbf0bB1I7fERkz3OenFVhwykJlDJpijp0U8/0xXaPNPFwfelQ784BTZwAvSxYHHBB04rA32YSae\
+UV//SexPqrDyMji1p9l88fiLHuUQK1dH6luMsPqZFxhW86g0F6ESQiEnFl+yOUFwMXperkerLTRD\
+wRYSiYxTL+nRyquglVcFK8kDQcDKko1heY6Az8u9dT3D0GqxilY7f1HQymvVNEh+RlydnM1kdWIn\
+s+63cLUbPiNGL87fbL46ePBbGFpla9AqW4ZWXgWtgs1/iTjwnzeRgY+bJBv4jCXiwA9tCjZwglZb\
+mG9147+0aFVmpWj160QFrfC52RaEVjkCWuHgeilaNfIwtMoy4o/l3xic6oa0vygTEffRYihoa89b\
+2BxoQbURd2OGXghcZYFWRyJAbNaF/WQxtU7tIGoxS9pCmHTyRrIshRN4dGW1zy4SF7HhRvNlKVaQ\
+QTarkgfB2xktyUjp1yYvEse2f0M4wvlCt5r/xWi1fvomyLnu/86qvbhQtmoDrSGvWp+FImS2kmNT\
+353jZXCst1BctdT1N2fVdo6TfW1vmji2SuvDWbUCl7hqRhIFSIRvrCMpc8pn2spnRpU35SWK3Yd5\
+iSJ4X8NM+so/biBN21xpf7ucZelpf1udTZekleEcHM4GDk/7piMjLL54cLi6/dgIyFFcF71yuCM/\
+60ASMwxbLNgpDuKmH+KV9yEsL5fn29S/zQqpIrYwRB9Ay1naYV8H9IkGh12FjuwUTUYyXIukZpD1\
+SpykSkma09+dCIaFYi0lshMH2V9DTxbSI8nykCX7mrtjlGSkRi2EjGmJUQZTd2CJmMTFtz48C9tZ\
+Sv0ViUyr/74lRZc+VpcXjKVocFt4rI7bpGYAgZJihki1N5GsHBu82lRsV5bKDotiNVqY75UFSjox\
+H2eenDqROm1obNlrlgo2TgkoXDYOVsBWpKArI/VLCeicdSA8GPNFeylaKPRG4EyGq8P30UjXB+21\
+GnlTLbRe6UxwF45sx2OFIdU6TD9BW7AGGE3/xij6d3Rj9N86b/ReLxJyVntTDPNr7ck2yZ+F812N\
+NC/H9m2z8u2rzMvrbab5vDyJcXRBGaFYieyFU33ZwB9yAa2a3zHGopbFYhfpKkNIYMmxDUqdOAvx\
+bDT68sTh5iObONu8vPtG8/J1683L28w3L5+/1Ly86rMhQ+7n+caQ+2wQgZx7fciQmz7WfGRxi8zL\
+c+cEKQ+Cc4lBIGvzBBlf6Dj37jxjyK0eSCDXe13IkHtolvnI9gbBiZaZ5uW/bTAvX7PcvPz4QvPy\
+pS+GDLmn5xpDbnAygdwdL4UMuUeCQK7aOoNy4J/CScQSOonQaqevD6e2MzWc2mvnGNdm/HlwEP47\
+zby832QzuAgp57ut054uGdXsNVJ2DgWeK3pPMBAp2q9nqTUFp5VXJ0rFgZ/XyMWBZQvFbKfc/oj2\
+5FGFqkSQZSoPaYFUPk5zlGoyHdAypq5TEqbC9Iauk2ZJfWoFUcH4ORxJC/l4HjJLW3gL1JpVTDLL\
+JSWK3rMAlzQ4ApEBkKa0iANz9AiAZ7E2jejjafrDcCm8jIQgAxlUu18sMMfRwiD7SekgNd/wpWXq\
+7+wgO+TyILJH0Urzct9c9Vt3L1B/Z403bzc91by8eJh5+RbuW13mq79bTTZvF+M2L88ZEqT9WPVb\
+56epvxen6G/5iCHXnaT4fH2wVuuqgMM9YganhESdYTCOimuljGPKLCnj2LtSzjh6zpf4SoCqrPns\
+cfvvVpY2t2Qxu+mC0TM5H7f7tN3/PE+bhTmU/ieM1PZ/Zqy8/xeur//+2v7vcMv7b3Jd/b/+grb/\
+x0fI+/9sruENKOKGWGk8OBGEtl9NmGp6N82daQa6o8jC5NqR/mtvjJd/TV8T++uYjOvbYTd1XH3H\
+hTquPxaajuvZJHPucDaIBHZ5TsiSxsX+piOxPRcahFaFBqH7ppl+7f40ldP1XxFE/jbbydyJinWm\
+wWGczQxf1QX0gd5FcX7mFrf6xe2Lg+jfIxiRoVeOKPYB0lHlfmpHb/Q2k97AIhwzQe2L+iuuFBuZ\
+IqOOP+jvQ+J58aDxcl58OFXGi2URBB6ImGP9VTXob2aqVqCKUeyg1JtuUSpJ6EoZ1/RUEqLc+gia\
+F922tFuSy3lKtiOhVh4HOZ93VZVsQGPGyQf5ySy95MqkLBOKSaQL3tGGFiH1MRELMIITfBrFro/q\
+GAVAgwVOjPLfz5BjKjPKJ/HxDnOnG+3rBHYArO+Garn8jElwUuRjNQ4NVVI7P/QcdnTXQVTA6JGz\
+Zevvcl6SoYCbxuyRdXw4nUE3qYw3Pk6baUzhJMHw1ymmPODeFIEOwpTKLS7+9JidyV0eroYZXMA+\
+xVaZaJ6aJBfNN8yQZPjX8jd3Tbk8ZSBLJS8nWLDvXPO9Z565cNeTcO/cZcehP2viX4fKOlDGpcfr\
+jaMY5J1l6h16kb5fp5vC9fv+JtzLFa9yr1udekYkUICGp+a9sYP8OaJ3HTZSVKIIjRTig1sralpc\
+wWEtCJuPHU6Xk/Sf066Pj8006G/HtKB87Ex/gY8V9DfhYxz+exJjOGNNGLreL9E2MG/j1Gs4AYXx\
+iQPdZWiDMmmDLPnYouRjk97WpwAxwUUOBX8dr93S+g7W21TMsEkPDs1Is8yetfLBEO1wVg3leXOt\
+Y4opzG1RHJhsAyWmMpo53ETaiNJLFkvT9bfxhDP+0720489ICz7+xOSbNf6uA29s/LMXacdf75ng\
+488acLPGX2najY3/1ZHa8V9bFHz8hf1v1vjHzr6RfbBsiWwfPJyg7oOnlxjtg5N7yvfBVRMNTVQp\
+2vtcbFp++VqyVnaJHEw1VBym56SfxP5701kgBB5CYn0EbsR+OqH/etdndU6kMA934kgAAjLqyeav\
+S9l8HH1Be6GP8G8xBTh+jqLPtH0iqx9DnxUG/153Zu6DAefAI9yGldJLncehASSr7moc2vE4GUoy\
+9B3vjmWVNgzQguJZbGxAe2K8FX1L+WStKUSCs4khGgrIg0B8dQ/tZ56cp470zHgV4pN6B4f4gIz/\
+NMRfGS5AfM1wBeLnFqjz2NU9BIg/210LiuyuMohvTb4hiKfP137msTR1pJFjVYgP7BIc4mPG/Kch\
+/kWSAPGjSQrEqwxV57FxXggQnztPC4r+I2QQT5x8QxC3pmg/02u+OtJtg1SIL1sQHOLf9f5PQ3xE\
+mgDxPmkKxNcOUOdx15AQIP7bYC0oLs2TQfz5QVKIBz9oiVwiHrT8ulh60PLEIP1By6DRGvm8o+HN\
+eCRkmvZ1/0DF4ox3I1oE2+PDo+jXSe4NHGfvY1cI/pVIR5qeVmqh4V9q4P/GPuXlfhuru2g8F1ug\
+Gfa2UVJbrD4stFTZ/zv2kavFyaM0EDC/JRViinO5C5ljkgVI0CKAxD0jBUjkUkjAGv27FwcJ51iN\
+ONCsI3iofkbixPE3W8TVIW5jZSlssXFaBvCLhk475bGA/tn9RG+/sdiSk+6N8tuYjatfe/LG4U7D\
+sGjHYBE/8vqwYftoQ2xoMM4YG9oPNcOGXj14bDjZzRgbVo8IGxuudpdjQ/cRN4YN60YZYkPdscbY\
+0CzFDBsefEKHDfffQbDho/nBsCFvmogNZeO12PB9Zzk2PDH8xmDx6ThDWLxoN4bFHR3NYFEyTAeL\
+2rUJLHqOCwaLyRNFWLSbCzO3qbAY9AR5o4VF02HXRxn7ehtSxqJEY8p4spcZZbwyiqeMyqnGlPH0\
+0LApwzFKThlxQ28MG3ITDbHB2csYG1r3NMOG9Yk6bIiqRbCh9Klg2NC4vYgN1UdpsWFDghwb6qWY\
+3cZZe7Dktl/Vt5Z3cRWUUFHKytLb4FQ7D6DFHdTESUK+CSjXjZd/29RmxB8ulgyS2hhTTGxuTLqi\
+Bvh2TJ6pzkmaxK7JUgHU6s2OQBVbPAhn/jjW9vO5gvj1xVjmL+9To2QWdlcFsW+doAEbnq0LnrBh\
+QYf0f3gaS5LDnw0smKk/GxjPxxjpzQE5Ds/tLZtaLUr6nZgUGugClyBZqOd9DoCGhB9BTqoZvZXb\
+yXL5+yDHKTf05kCKIPL6lzYcTyCBCHBP/F9T2ZIgrK/G7CRFDush8h2Y1elucJ9JsYUFk+H7Wu0s\
+dBFitvqCKBlH0yd5abKl9h0oiafbi6NYy7liyzqDiDmWUCTLblahg3KpML32rY/N0QjxxEN/VgC2\
+SUZ2ZSoJd6O35NKfxVSuz+NMP2hKh8kIEvUhBmMGArKMH2ym15gcwH/Z2ehAkMMz8qSeM9FnWpxI\
+ypWbD5WyUq4u+Vd7eGFoQcf+qb1Y0BOzAc9LkRvSRyQHOw367HEayESikaU1sdSA8z/0CtFzhJF3\
+egJlzjRZwndTyb3l+FvaCN33Bhj6sxlQtdbfc+h1nEcLZyfSA+oX7OrJzO6OQbhmEK47q20IGBWE\
+c6kxFbYU6VqgXaPYkvooje8pY2uxVhXeyzgdtbQTEjI+zjphsguJc4huBbe/1pGk3uwyA/Vlle6J\
+4Y52Xn/paFfOCHO0NYYajrZS75s22kbNpKM91TnM0f7S0XC09ZNv2mi/lo/21S5hjvbdkYajvbOF\
+brTBuYV9pMgt3p1ozC1cfU34mo0b5PAWZjLcyDEhc7SkYg5WDXuRJHbCmH7tE8T7CHN6AUzbuhjP\
+It0bC+cx8cp5hupWTl3E5d7nNk7ijDHzJBfg5BtkBqdnu14fnO5vI4HTJ73DhVOP5KBwGt/jPwOn\
+xPZmcKrZ9/rgtCNBAqdXEsOF0+72QeHUsft/Bk7ZQ83gtK/D9cHp27ESOKX1ChdO7uBwiun2vwIn\
+l5pX7DflfBwcy+h9581kmjyvp1DnETHZ8eVHJE77QmZKTapvECP3PAkMF805rcySWoUKSDRCLzTv\
+xW/qhxon8fhoeU3mbx1n7vtX0EIsZ5eFkqkKYdvMYpLZuLxc0b/qT1I0KLACzH2UV52Of4hXzJc+\
+hHhSNIqDxc8F/8zB5B5JN0lQ4O2FH48RdSjfd+gxcicxNWOM7MH0WRhBBTSCBFdpvKsk3vUtPVcY\
+9hS5Oc7fg9xnkO/zNIM3xP75KNOAC+ndy5Dt/E+0T/mO9VfuQIDzV3rzQfWRJGhZuU0uyzAXBoJO\
+VrzLvlymr1K8j2vK33tNFVPP3FiihMHBCVFa3QnLcVbVRMTMcX6NQoxjCJ7Re+2FGd7UAai8iCRe\
+UBROfMMjUxdPdGCAygL+95DiNreoOXPPy+bavt+dXkwKrxOyuKKfmoCYgF4lbOFev5bElMiOMQ64\
+ARHUxBioquY1sbWBanliPuDO/rZsdX5+jHWvJK3Y3xKtxuNJ6mq0HaKsxuLhqMzfHZZkrpHnH9G8\
+WnQz9Rer3c3YUZzUaN5DwkE6NLkuDlLU8Ho4yNYWN8xBmow05QuWR8z5wmJH2Hzhk04cXyhNEPlC\
+XLKEL0xKJnzhgaEqX8gfIPCFnB4CX3j9UYEvdO8u8IUenfR8YVxPLV9wNlH5Qp1OUr5wGNGN780+\
+Kia+PVDBxN9SbiZfiGkcHl9olRAyX/jnCZUvPPawwBeaNlT4Qn5fGV94O96QL6zpJOULF5ND4gt5\
+cUH4wplHdXzhGkJlX93e6mo8kKysxnjEInxfdA2FL9zjMOULgaeC8YUrzVW+QJjC5e6m+VENeEK9\
+IdfDE57oc8M8oUcHU55w5WFznrCgS9g8YWBzjicM6SPyhOcSRZ6AUcE3oB/hCT8/oPKE3X0FntC8\
+hcATVjcQeMLpugJPONNMzxNuc2h5wohGKk94pZmUJ3yKPuN7qaeKhRuTFCz8duDN5AkVG4bHE+p1\
+C5knlHRWecLX9ws8YdP9Ck94sruMJ9zTwJAnXO0j5QnneoXEE041D8ITjjTQ8YTCOHxfWoK6GtH9\
+1Pu/kvH9X51D4Qmv32Mer3RPMJ5QlqLlCa/eez08Ifep6+EJbdrdME8YUC9UTePRQabc460HzLlH\
+z85hc4+7BnLco3oLkXs80VfkHh0x96iTSLjHjLoq93D2ErjH2LoC9xjwoMA9Yh4RuMdLyXrucSxW\
+yz0eeFjlHuOSpdzDgsRd3+DuKr4O663g6/akm8k9jj8YHvf4vkvI3GNwU5V7NGkocI/cJgr3aNFe\
+xj0+izPkHrVaSbnHrW1C4h6nnwzCPTIf1HGPmmi0vk8c6mqc7KWsRm3ESHxLnjDnHlg/aqCNIMwK\
+FlogGEsW3mNCeIJBuHn3sI9HCHv41yDZseuY7joH7BBOXb21uFPXrR1COnX9q5n01LV5d+mpa9o9\
+8lPXyEEhnLpamupPXdvVF85Ov24nO3XNv09y6hohttzWTnbq6rkvpFPX2b1vyqnrz231p67moVhf\
+d2V+jHafsnI+zdEh1ie0vioZbXWxsTofBk0eOPJFst9Tj8zjH2IfDd8yWOwYdlOjYWJAWcowHE8W\
+J/DjBs1pCoqzsIStD0evxL6j1Rhzdz2ocuJ/mglNf2rG8upBuj3mWFO5E1lbK8M5qHwIV25tL55Z\
+k735rAl5M7s6e3MAvYG4I11AwZNtdAEF0lirHm2EWKt2bchQSIoNfJJqEOWIyZy5Nglb9EcI2Mru\
+H86FOhLZojq4coueOxNby6KmDXOhGMoCKxPMrNjbTc8CZvfSyRkhevdcaRgqx13ZVscidYv3Vl1h\
+8TbX1S6e7hjcMHouJUh87KiWgjtPxTqKN/UfYN0QbPkP9ZXEx/ISXbo3DiFyafQqnLrNocndFgJd\
+gtiUW0thfkAM02OY68RFOo6ed8HQ8sAtDV7DIpx5AEJ1LsL9PHfr7qx60H+velstVPr+LmVrfjoe\
+bc3ftzSIWg0Nlne0EmAZ00SBZVpLHSwbxv8nYDn6NhGWGY21sJxZQwpL9/0qLD+8MwRYrrtTgWWT\
+HgiW61rcECwn2QRYTq6nwLJGNx0sn3f8J2AZU1OEZdEDWlh+/4AUlh3uU2E5q04IsOxZR4Hld2i2\
+vp7N9bCUQu3dugLUWsYrUHPfp4Oar/1/Amrf2kSobe2hhZo3Vgq1KrEq1NrHhAC1mBgFam8ihPDF\
+NJPdlSQw/HcfMxdHZGko7msmMHCmadbnryVlUosznq0HPO7tKCiEZ5ozdRG0zijQQo/Hu372PdqB\
+3kJ/HF89VPcOpvcVYMhh8Fxk9FUfNLuUMOdwzz2hz2FGO2EOM5sKc2hmE+YwOkaZw7wH+TkMri2Z\
+w+nmNzCHEy3NL09j8kBD9uFSiF8C7xTQm5Obh7/42+8KIiHQrw65l/9qK+6r3zYzk0BqPWhq4YEL\
+4Wh+IMWQRmkaes9oFtzWQ/JS4HaHvq2AMwvQLBXgx10VJLwSj+L7aCF+SDgRN/bkdhYx5lIHvMpS\
+SYz8cGb4yvSm1mNDPNNeG1715SNE0tVm0sY3YuM2dsVotZ64gJf5M7J0FiedDUnjh2lkZfq9tomQ\
+RvRYkkOZ3vwXKnPg/C1TOwVpE8Ib1XIlLFw80X6J/tGOESHJzxEnkOjFmhTuRKJMcBVTtfKhpoTj\
+x2nj2IIZFH58Qie0ml7D7KZO//S+jaeQ6tCZ2Ux61yI2LocnMVbJ3gzmzbVo9/KtfFw1nax5QuHo\
+54h1WdBbH39UlrRZpKc6JlZWcl9iLDHr7egmzdqE4JGli9SO1WioEoJCdNBeXuKml4TYDIpBlffP\
+oQ78YmVcRl+RbzRzuFOK1KhGANXwNlqyG9pAE9Wo+y7WbQ7bMCXh2xUAPYzzA8aGyqNatpTxqOLG\
+/zEe9YotGI860kgLrLerhMqjljW6KTxKz3mmxoTPec524duEwEPebyXwkHWPCDxkfXUDHnL/U9fJ\
+Q756/EZ4yF/teR5yq82Ih/S9C8vLzVQe0qeNwkPWPqHnIb/UD8pDCmsF4yFPRBIe8tCj/1d4yM76\
+WrJYV+lm8pC/Hw6Vh3weK+MhGxr+x3jIfbcF4yEXK2qBtfG+UHnItorGPMRYkjnQIixJ5t464fOT\
+ffebtwmBwwxoLnCYotsFDtO6qgGHiXvsOjnMU9VvhMNMeILnMG/cYsRh/o2kSN+VxiqHKW2hcJgW\
+bfQcZkW9oBxmqi0YhxlSi3CYjCpGHIZGhuJovdj/37jNJquWgEB/unFuo6ecWfeYnjRXvC1UvjTf\
+JuNLFR/6j/GlgXHB+NJrOrBGPh4qX5pkvfn617IG4elfFcLVpULgSUeaCDxpT3mA50mvRBrwpL+r\
+XidP+q7BjfCkByvyPOmOykY8KQVpfL7khipPGvKYwpNebqHnSf/UDcqTzt4SjCfFNCQ8qfiBEHhS\
+q//feNLEQEBDPAXNbpAnxepgg+WbO4KdexmeiT7VVn8mOutR6ZlosFTlMJFCmMjvZ/Fc9Dk0u9WQ\
+x6u+be7ntPI+giUftTDGJz3tt3skOB+GlASCp9PSxkHlHLNT7cplaMkneDt2jrZI5u+yGMz/bl0U\
+bHjeGrY/A7IQ0zASzUOq0EJtqlDJHN5tIp/Dj3eFmOH8Wi2p/VM4hCi+g3qO0Y0q9+8AtYWW8W5L\
+XzU33YnnNw/mHxcTYe4V1qp2EAOxbiW+rxXqKe7kVsHhUD9ChEPUbeUyOLxdFigPEnfU2BrquLa3\
+DD6uuBhxXLYq0nG1Lg86rjWWUMfVLir4uJa3EMc19zHpuGpULQ82rgAZetBbVMyYwTpsM9tn2ZIX\
+1xVfJA6x5jp6cmLUltDTRgMDjiGuxtc0OxW4UMes1PZXIMhOHWhCeHDLR8PQA/F5VQ2z7zpMR/XR\
+P8FGVfAoGVXH6uGNKrZGePVLbeH6HDExHZ9v1RFOVFOBVvJVpxZ7cTcX4rQn4VDrgq9LND3RSglD\
+XpaeIN3ZCET10ui12Asp0rfuL4xq2oTQ2J+ohikf/TzSlI+q0nkdkQ+xM0HdJd9Imhb8+IqoHx/2\
+f/0TyAEc27rHaG/5HY90unjPlELmfNeqHiRiRx1f+BBHYvreqweyebzrJ3xi2ACxS/89eDj4fNF1\
+Ab97BSFyvAtW4qOGRBjmxdqHbgfoJ9PzxKCyV//qRrmjNMmi7rmF5UEiWsStFRR/wgIljpS5CKan\
+FVmiM/5gjnc439b9LOMR7jWhiMs11beSwvTKOH89nyIAOycQUZ+XYQs4GVbfKqmASqGchHsnMFmh\
+5mHSXwTV/Ir97Q3GwIva0nLmfFiKQVKCWKLiJ/frvfQ3njjxSiwgCoEtK8xjMg1ar68iSF2mNPzC\
+vwM8DZfWN6dhy10SGjag0oqIy/FUeu13Ayq9q7p5fEwZzy2vh/Yu/6bS3qe1tLR35U6R9vbHamiv\
+7X087aX8EtDRXoNHFNrr+bCe9nbUCI/2zlYNkfYOWUTa+/cvgXBo79sahrT32h3/l2mvge06aU+D\
+moeqBpFlTGnvtnKB9lJLA6a0d6nWzdo/L9cU989B11TKPFQcwZHm4qrmekRs9RB30AEPl9/oDlrv\
+F5WKc6gFQqXi0xVEKv7tbpWKIerVeQ9PxZXv0u+go+orVLz8AT0VX7o1PCquVTlEKm77T0CgYnds\
+WDvoAn/AiIpn/Bn4P0zFFW65OVR8SwOjXF0ymgpPRu4QIcjIW4LIyJafAzeJxr/3ibvv7FKqjh0q\
+rgT5kSqFfKfXpGs3LP2O/1ml3SElWtpteL9Iu23qqLSLU5T43q/D067/AT3tvlZPod2P6+ppt37V\
+8Gg3uUKItNuhsrgDf2gJi3ZjSwxp993f/y/T7oB/AjeFdof9GZDc76q1W+SVk79oulTk/snqLCZH\
+SDieAoqaRWu2+L5yUM1aSof3lop0+NMVhQ5hh723grgxSsz/hJ3AmBOrsCMaMAt1qiJwl6aMu2DK\
+OkRCJ30JJcBSYoOczhC8H24J/bpcuW319yK5ebX/nXLz6vOVgt6N9MGPAT7kY+ePAXY30iqju5HM\
+o6bIfRCx4n0QzJcCA/oweIZ/5hvxrcKOzU3QAk6eCwRMjD9pt8hs4lkhZ9GlK7VX/EjwUSVFSXc5\
+kxZ9rwTCbLEi5GNJ08ycg+4Pz4o16HtDgNMeHX8Fwuqx1X0SOhDOWOKVkMl8374LATUaHbB9+RX6\
+JsHH2dCvXjVDjNHlujHmJZG/yJTQcxurt/fddjsxIt51hxIkbEOyouQWPxXDPEk/awz/KX8b27rT\
+00qtSghEam1dVrF0b5y/lsbcnXB38LBaU2hfuaSF9nzmkCdAO+PfZtD+7Z/rg3YQaPX6+uZC6+I/\
+gRuAFnbqb20vdnZgsIsr1sLu08oy2EVVAAcKwRXC5DzKZwbpdhE6as5rRv4qXBdenwObVb5vVG0F\
+rwuiy8PF68wrN3elXqldfkMr1UpcqdM/a1eq3z8ynnIQyRehrxRef+PSlRb9SlHJyRrCuuy+QNbF\
+DQQK65JbKex1+efszV2XT74LTkECFCZ/HzCCQnRK8PXVym3FjkZIwoDIVJoxZGFdUV5O8HHXCvSs\
+TjM1CgHqhUFEpOxLgojkuqSISCu90gzzyh2NPukdjeJHPKTXX25l4fnwTbCHkAi6l2obhMtJXJBi\
+Ze4avv8J8HLtV/8jWMY+Qo9qIpCPFdct5f6SP+UirrCsLWzhCRW/njYjld8rmx3wlVQw9fsYdCY8\
+aaRqWSC4WCX4FSmuP9q7tIN+6wl/IFw9B+TR4xYibLwF+Mvlky8bG/2z95foGh2jJL5eustIuBwE\
+q84xO8EZFo97AeyUXu5V3R8DXPaKfN+0vwIspNLLkVCxclPIQoxa7pRi0ke+LwBMq0jMJSAEUEK1\
+M7Qa5g9or/Gd+SMg8RKTQmZnOWGLq27VQobepxEmXM7/WwuXj07p4FL5igiXAX8GgcvYSyJcvv86\
+JLh8+LUCl37Vcf6nshDgItz3mmYNjy7/MSCeoBrT9itkHR6pTm4UI5l00eStDlfvKLIeStZbhrS1\
+tDdlBFudC99rV+fK97rVmXBZXJ33y4KsTsG34uo4zoe0OvedV1ZnbzW0Ovf9Hu7q/PxTeKxq1/nr\
+XJ1KZWR1euIhS1eHT0rMXYea3/Fu9Wes+rOedinrh0lntaqXa1ay6Xe6ldzsE1fy59+CrGSgWFzJ\
+hWdDWskBZ5WVvFIVreSAX2UraWqtwfFbn1N3M6vD3TsKxglL0MlG/ZvB8dfNamGHalqzksPVP4pU\
+7GpjAsFIpWKhvKIuufWWa9JN1UP9Mc6B2GLsJH7cXm4ldvOEYu5mnu4Rwfzhln9NT7jMr8vwKFLj\
+az8EbjhY1eDW6VCbaT2yBDp7qjAQhsvoVz+GNhvTT26vImPUpk1W/Bgwc/kXhGPdcrD8enZyn4vg\
+NHBc/+73IiYUeqpFEOS4yvJNR7BLYeQNePFaO4VPKwTNK4j58znRyht1RrTytvoxYObiUOU7M1lz\
+8Em9HU6ikXQaoOb2g6udXc49riThorMCetEZtYrd/0egnD7HMf2PJMdKHu/wRD75ETTKcuTbsyNx\
+Bx57PvCHfwXK4bfbiQg8Lbubq7Sb6w+H608wOoPeFxVZXs6q7z9Lv+LJXgy9RFYlHW9BHefwHTdV\
+O96COs6RdLyrotrxKLXjbNRLvKfFyRMWS6cP+S4vfkS6THCVJrj+iHf9Fu8qFzocynVYU+0wFzp8\
+cAvu8ADf4fNKh8UJOD3h9/Gun4UOb+U6PPQV6dCdtAckPvQj15VYUVkDT4v++WRbeBjtGyWfoO+o\
+fB96WIR6KHlW/34ceu8fo3nZB7/sqHnZHr+sw17iL0fm0r3osJWud2Q2fZPL3qT7FsN5pfLsHQ/3\
+d6jPgDG2LxUMAoyKVcVBe0Vy2sOz/5d/CpC0IyTlYqdhJtirvaRPg7tjfxNx9/Q/AR53KxfIcfez\
+gqC4Gx+hLqClSIu7n+bLcXd2QVDc/cWqdvzaGS3urs7X4u4DBUFwdyvXYf8zWtwdna/F3c/zg+Bu\
+b67DSNJhLmgseYC+uW6CuwSFc+mlEXQJYNtcfIrDB0+LuUcJWnUjrhu4xXgVnaBF41OsKGsxkZUo\
+8pF89mppNiulyErue/pCKc9VynPV8sIv5GRV/7ScrGynJWT115cSsvr+S0OymhQIaMhqIHtDyaqb\
+8kzIqnVAROb3T4pkdeIrhax+sujJqrtfR1ZG5yvQ/eV/BYiNSRly3j/sDRvyq+wNHfIa5ZkMean6\
+DH1WOqk8w5Brf0X8zGX2CWKecFtaH15wv/iMr19Cz4BfPnfHiq0PpwmWTd5CteQKvsrE4TqANIdy\
+nQyfid9SNPz3Icrv8FmsJzOmnJgqdh/DQ2YVYRbFVnooKLz9M58YND2roaknMxZ6OAm3Oub77vpb\
+6HbIVwG1Tr5vypfElqW+6XExwAxntzTA1KmUPAYlmTb+K/m+RtAD6V8ZAtQhSP6v37EJODrjbit0\
+ZqPNVv1MjICspVLwNCpwd4xyZSKVsNy9+m4otW8hnVVHLNrNPjIc/UPzw/wIk+oILaopr4vhtX0x\
+GtdwaOLpCB8h8X0XoBDpQUlbHJ6ExfT1xxdUsONrNCFhLoTqHb5CG2B+fpr2jO0bp5WPw3kweRxO\
+H3eSmuBbsoUU4ZkqGtcCtHolb4LvAfdRulwwi6pH8YhWQ6Grc30O9HFYbhMiBKMz8IWoJQd43qEs\
+/YgzCp12RfShsgyYUgXMXCqrL2FuP30pvFQmeVrzns32oPieTPt1wJAif0X6nm/IpjLmijK2HQhh\
+fbcjDcex5CimocFm57GeFu8cJID8oiIcClVjcukXn1KSd3esf0IbwYgdZrR5zz4swM48j3zLjLt5\
+dD9xW8j2c/UQLkkp5FnhwqOgUBfw79oEqJLtScJ6NPPFqXARjkKc5FW+b9ZvlACwTkBeDf+NoL79\
+KJL7iZqeh9iMJ7HcbT/f4LCr0GW/5LYf/b0IxlcIOxwou4CfV0sC5a4Y3JeCXNOQsFACa4OrC0r8\
+Q/66xEfp6MECqH3Rd/IbbMgG3fmhv9AarPgfYNwdBcO1Cr8Cl/Mo4pn7Ha6EPVJQflMcUHOtAggv\
+AqtKKaKxsHj0++nom6PRI0jbC91JXjRtK5rrqfS0UxZndHpaodVZJd9eGIE57d24OwSUdJ+1tf2U\
+81ZUWu6sjEoD5UqMLd9vNcwxkva77Xtwl8Vq75dQS4uzEQm+/O0TTJm3j9uPZ2Ajyqn71vrrrUxH\
+xbTpTinkPsDA/rQPwE5uijYH8PRiBcDHkHLji7vEAThLcw+0EXjLqA2IYtvHfzEfLfROnPqK76jn\
+puhCtK4QEJHGq58ggom27Ss/kOU4jzAvepf9aKZ3EW2At2AVoKUqQK+hvTHTO/d+csBVgDfMtNvd\
+9mvoXXV30jW6bmhXrQwd+fvw04j8i/MyJUNhufM/+lahJx+BO0xj9zl6tGghGzC5OEx03/nsW0E3\
+JbibSLVPBNydCLjbpbj74AWFDVDcfeCYQv6M8nbSEc79ngCrAAuhSTnWzzE4Pk5P+xiwtwCwt0DB\
+3jyGvR9j7C0A7C3A2IseFIQcA8rm7YH3BYRcm60g5LVfA+WSodyDhC23fac7aTsZRRE/pPPulAKu\
+TRFt8/7/YAx2J+1027dTIsl123OASCR8Zt/lQGj8ZMnXCrqfRpzN1+kbQPdE7UFYGNh+ocwQ27cV\
+S7F95yc8to+2SrH9vUuM+dgLRWxvZuWx3adi+xV+WE/ph+Vj/KdYwd5SDntvF4b1iUiErG0sHdYp\
+t/0UGdZc2mADJkL7fqS5k5Utddu97qQ88nBDhLjg94Ca9VMkxE4XAyxZdjGXLLthUXBC7HoxIPjR\
+LbmyHNY3LRtJ3lmupOfQumfEuzIXlEuEZXs2HUgGHUjUdwQuexxuzwJg+0kZbudzzEG3CokzQSuV\
+4V6NywlYEHUudyctVqhzT0RqJfT/gFOQ4Zfb31ic9oYltZbDHZm4GpObPS/fvrMirvFIetpzVicu\
++WmVUgJ0XRO9q7laeHfcvsOSb8cqDFqp3Lb2nWlDsSqYzdnd85QcIuwijwIyDRDIrp4HuCIdJA0X\
+F7gRlMAuYPd2c4GIsxNxDfQZa7o91+pfF73XviO91IqaxJEuIJl+BrH/A2QpHhaS+xlg8b5GfMZ/\
+r8Od4nVknku9HZPtn4hpKjR84CutiIlWc+7XIJzhJRws6jxEPzswFz727nQsia+eLFvTzLlU8Nt/\
+LYDmkInAkYmrMzR88AOyhprXF64FyC0BeBYguBJ7+JdEx2gMOgYB320/MvmqgL2y/Ejlqw1u+4bo\
+XZl4ZJne6Oex/3N62gbAhw06fFi2OG0ZwYeOL8IK5+TblwM+NEk/gLsgKHFupVKooES5+C7f/hxB\
+h+fa2penTUX/CuiQI0GHdycDfhMg4PU6C0jRSEGK1aTCu3PVehQ7Ij4GyCLseM7qd+PbMbyKYNgf\
+MaySLQh9FqdlWqIzPwa2KEB6+/sBejWH8DrlF2EB2O0ND50iC7CULACI/Sv9bAG87NUiP12AbESq\
+3ALcYsULkA0LkK1bgKWL05aSBfhwBcAzN9+epV+AQWqhsgALxXf59lVkAVa1tWdFe1aT38Ii5CqL\
+UIDhiw/UdItQ/yosQi/DCk99GmBXYeRROvQqfvcKEVIaAAAmIQkg3b7KCtI6XqstylrtwMZXZ0BJ\
+EaOqTyoVLc1T1KdJSH/O8lt1RHsErL2kxZKj2YR2RW8at90G+pqiAtUHeRE/Cr460lazxFajaatV\
+Og8fIToDyWB6fp+HZBEE21wq6ri+o/YmnB/6S04uQ/rph4qxwhVDeSrOV/SlgKVs093yrtrRaLGj\
+V9SOJsVYKNdIKuC2uVHQGOeMgkCIPDq4R3w6BtnY/7B+qchnLuxV1ukIYka+xsyCi6M/NHl2llwZ\
+HgHcNPsfHQMlQuriL2AO+7DEeDCKcuweu/HLjbn/YIz04LZIzS5G/+yLUo/cavvAEuH9h6DPe2h7\
+zs/cjp4A6TyrvWozOv0uMH2bI/0y0nVqQqKZfF+Tc4TsExG95mfm0PZu+OUYVcR94UsFiXD9Wla1\
+VqFSC77zHOLw0XstyzO3oXeLD+D/N47OOIOJN3Mn/QB5PdNZjbwCZtGevOzDXgILqE9ejmQv8Z//\
+NvKys7MqeYlFbzIYV2beP/j3dvi9H/0//QB809nC4Wmx9S2MYJEPeKzE3nCSOjxG/vGclaVz+gmt\
+yId4PL4uiNzcG3fCKmTCYoAMA19g8tRZLHenw6etJcfRONLh09aS+QEO/Pm+VgB7sqQqSPscDfCV\
+XtwrOarv7++llcr9JxWpvKOfswIp/f55ROi3rYqy2D/b9/SXsPlj3BT1VlW7ypFi6+eFEmzdmEu0\
+qnw7MPt8+371sh7Vb+GHfzFpgDy/d4iaXQiJMjEg8TuCjgM4MeD8SYJP9vcWp71X1WmjH0q377eW\
+3IvqobcznU3xsQHSe+z75SrPWkSm+RYrtMuzlnxvgXZ9grYbBu0iWLu3SLuRziZB2j0M7TC24nb+\
+eahR56CNrp7BjQKsURfUqLGzEvxuRULFbQeosbfF728Q8L8FQlLksGcxBmNcnvIsxeWLvpU/qPbO\
+42hDK3k+IDMkdfS31qLY8s8UFPvaR1AMu0+ikk+PKiVHfJj/fcGphFlBAqXy7ZeYzynWX+yXoj3Y\
+qJxv9ymvLa3tvmjPJdjXfaAWXUL6EGe1YbpMErZtwcUIGGFWMVdWsRK212I940p62hWrMwbB7dwO\
+4AF1XYQHfIa0OP90VBoBpR+SUistfRuX9kGl5VC6jZR+t5yUvohLm6PSgLMxKl1GSo/RUicurY3e\
+zyDv36TvUz7BcoLPWnIrSByRacvJerkj3bTGpM9wjUvWEiSS6e9vP6A5rTeCdDGhRgXgTP7z7FLs\
+NMq7bixMUNS8a34EUlIP5pH7zDcg/CGgb8ZuCAgzi63+O1npaFJ6yFcXlVXEE4ArqpgQ9ApCVP+z\
+6WnFFiQdAhuvmZ52ySKKilqts7AwoIneEmKtXAmnmEvvqz7VpZceIb3oIzsWxpBUzP8v5xD+v4zy\
+/38p/H+pyv8/Ufg/wuz0tFNWZzPolBwtMlI98x5s+z71WJHZYg6gEv8M1LDc2ZLWoEeLrO16tW2u\
+2HYJbotHOoKMdN5SMtIGykh7qSPtoox03ef6qF71vHvJlbnkHGsuQifXu6ma06wChCyZWQGyL+dn\
+rlJ+ZSu/NtBfWPhEP92Wq9ENvVejbbe+9LoF/R566Gr0IOwCl1lATkGgUseKrNYsTS2k1SBZZYvS\
+/Xb6izrSZeagZ/Z7J9TNVeruUX7lKb/2i8NT9J+dcKw1vVwZEysZBD6USIP24CsHqcwPGB+bT/af\
+5ZFw1MW0AdcFHvERt4kQiieSYiuAMR0AZ+WKe5Di9DIcW4BQMYYrawJlFa0ADu79Hfi95RcEwV+i\
+hwBcfZcOY0ZcI3O6WPPHr6EHVhUD1/c+VE2Gqr9E2zw58G/yIQZdrvlbX9PBRSBKrEgoEW93rsy/\
+xYqZasUqCBF/S7da/JXRj1fSMUbCMZCbtOGUMXI6hEXNzPpkHchxUaaFPME/baEsOuPPCgJUa+EP\
+2mgltwXbfLK44l/Po2J8vkPKEQxRhVVspck2kEVJpcFF2CtSH5YXzy/EwM70ztOkZk2tnA6oxy/m\
+wvPiqLyeuyO44mG6UXnRuFKyDIf2/AXToV38zHhoeTC0dPhSVMlb4nKdPqdy4+iMzSLCvk8Kfy+y\
+Ar2nA4Xzs8w+Rxe7nKDsfVzZAiiruK8yGgg+0rICAXMVBp/T4W59rxR3Hzunx91/PhRxdyeHuzvF\
+5lfP0lEGtLhbJlY8oVbEuNtmCcXd+5YA7toAd8u0uGtTcDeGYCs54M6MIk9RBHdjAHefsAoATj5L\
+sSRKirutzzIsiQqKu1POmyLIwU8IgiyUIMgezaoe/koclQZ3t32lHVUQ3AV/WuOhPWAytP0Ud6O0\
+uKvIC04k35U8+Sde/IbAWN2r4f+AsdZC9LbgF7SpYLQoDJBaq0xrYWkq/QDsaqkNcfUt0AzvSQtv\
+PbMV7z8D0B7V0IOrsP3KX5HtREXQHLbC1IdQNcB63HQD13SDtOl57ssPoS9m5tCmI4J+tZj/Km66\
+kzZ9KOhXL1Go5AJUsgEqG3RQ8dFae0xrXaG18kxrldJa+01rXSOETVethj0XPxTRhz34oZg+5OEH\
+H33Yjx9K6QO2R+Z2cx1XHNrgtuI+L2N9JymLuLLFu/4d7/oL6SwIs+KYQw0kc/7oLOhF0GZhbgBG\
+c4ofzXl+NJf40VzhR3NNHM1RxRsOej66hY0G+8HFu76Jd/nJaBKF0bTjRlOKhPP0A1hEszpvVaWW\
+8X7lgThQeVYTogU6++uYrJFvMdcI5Ews7ZAWJ1ALhiZekLCOBpjlB/8ilp84Jr98zVt+TnC1CkXp\
+aeUFgGV91O2b02H11WpxarVJpBraIQZSLk82Bq66crrRgdSNQ3XenazpMlHtMobrcjLZMJQNxMtt\
+IF7Y7XAX1pIa5QQP8bvoJpH/s8limV0TvYg8twn73pDK/vvwm0/Qm+gm8GK2Db/Yz1Vxw//HRk/1\
++kYg3Wx55gviy/iTWKZ01sfUS142iVyM2s+pjd7A6JCQHDl7E6bnJodma5lld6QOTNgA6sDE+UQd\
+uBNMnYfVb+A1PfYu0xEazVd0hNhDTEeYfRwgdIBAo8YBshMTrLuTeDWxfeAW8phIH//+Eh4ZNvz4\
+JSGY6QGNo2B0xjp8sJkleD2S/t9UDFAvFPFuS1D6N2Jp/ic1L5dp3JPY2KZp3rNBDhAH6fhS+eI9\
+6Iu+5YfB5IUVIYlvMO+TpFyp3GJroDzU2Cwar3L4DFA8PXltcfYl0lMj4hYLVRYh+OfbT1Gl3AtW\
+kFPRnifBClKkvLa0thdFe74EK0gRmIxOEZORV2My6nWKt4Isp+01le70UleQ9LTzVuftdHgn6fDa\
+fYBAOhoVRShFebToPlzUDRWVK0WbaVElXNQYFQWc9WnRUlrk34eKbqMvZ9GXp/dho0aRteTucpql\
+x9PibVq2D8pOWUtK1DMSBrCeHyor2fe0ijs0hsq2SyltcVpyzpnlpWmASCiTNsTCNwkAJsbZk4hJ\
+XdW/9VVbWuVVPVZd1XwrDptXjBh6BIJrNI+AmG7/AfyLIkiuI346hxAw0GyJqi+JdS/lIoxu/xSM\
+N3b0uozLk/PECRIH9yo2QnhqWTTR8RMjdEOPrqDM0mzscyuoY3+6gn7skWGMfcJB6dg/30fGfnmv\
+dOyxFXRjPxba2BtXVMf+WEX92Lsd5MYuvU/C/C6JsgoW6iYIp1ns9befwzSrYJNsyU7FFGSnvhn5\
+vrdfA85B7sd4jUtrBmT95AFoPk6JWPPYP6OgaIkmQTwJvKz96k8J8G5dT03IlL5eI69nf0pj7So4\
+3H2jlLDIJxFj7GQrmUN8eKHF3a/RBFYpGEZ3Mxg9eECJGBSDwDSReL9DBtJybUpWIXJL6z8k+o09\
+fRx/qcxGrJApkPYMO3YnFWvi9twV8LGSI31KkVVz/+5esiClXLAfu058fDlNJIUzk2Vqra8d9geM\
+wrVEXD19jB+kAyP3QRvdWj7azXJvMDz9gxCPWuW13Vx6Dljt6ki2xFxVwO9DKn5z0YAyiH91IxAf\
++F6IEP+6ohHEoyKvE+Kf7AsR4nv2GkO81VtaiPeI1ED89re0EF9USQLx2yJvAsT10C7mzO7/Ipwb\
+3y5U7B9IYIht8ySQeeM2xgfY9t72feZRgkea4OMucm5MZEjclc9fnQLZ598N1miNrX30+xjQBok0\
+4t1jfIyT9PhI4CDt0GP5LFv5rKjyZuXTbeXTo8rjcMrE7IuQExEJImNK4XQoxJsgFsDKJP2geX1n\
+JYGVG3JeT1IRl/qx12ECrUOXO2BTzskyAjrGgTvmMt8+e6Ei+U3azuZXpLy7I5eEaBCkLqJXEzWt\
+BEikVivdRbkoRJ8W0vjQZpUtOnb523u6AGvhWm/9tLycK3oecZfK/JromwXKAKbtUvwmvBwYoo4T\
+u/ZbRIgpAO8kj/1DCtt7IgFNppMWZP+FeIMTxGXAlXQenH4uCXCqsIslDCrk8kr+swf2rPMgP55g\
+kARpreZBxUVjDpYRa/i+rASbHnz07sowF/idh+S2klbl5XqJ7uDeALtZPBhVKYQD1MXYxD9HgVrq\
++gZWovd8Yb8SspDwux36tv8j3bmbfS8jjxBwuGtlKQ5fqnw9OHzubVMcHvK6BIfnHNfjcLPXZThc\
+NUqDw9Vel+HwLVX0ONz0XSkOJ8vCK8m0ctGX8ui4L50gOPw3weE8ZQDuHMU3IJfD+X57CA4TV1u4\
+sx67DuyisP2hEsbh6Aw3JQm4f+sYweM6KzV5CQpJfDjkJSgWCKh6DkPqAs5HKO9FQGrAzY9XMNCC\
+Q1D7YyaCE0Lx56OoZzD2oYlSx/blRoTidWQofm53oJy6E10fijfcTVG8ZpSK4gOjVBQfuFGK4iN3\
+m4XT6zetM5rd//Yq7JwThlTEDem1l2FInRRagbwT0GoL2aNiHJ6EM2QLU/NOHauiDno7Er38ObpB\
+v/lOwCyAXpQROu4HGcFKZISHWNcvHYCkID76eSWtQ1f0ef/+LMNdEbKT0V2xxfskxRTdFR96n+aU\
+Ak+M/vnl0gxScfqrtRT4sD18cTmERT1NxS1+ex9DimJoUhUmo0xElFLyASGTYk1vTdUmxVyTx3GT\
+5XoVty56758l6edyAPq5XVP/593YmCMZ6j61Pv/dD3cTW4Ew/h27AyHcHlVGNDbofQjpvTrL9DEX\
+by9n2PLu+4Bm5yBDYo0eVhtBtRc/II0EVfSnTYFyoklhIarMX08z4cA7wBmIvy76asnQ8vLy4Brn\
+UbxBABv/gYnylfV658ldJnpngb5rYCw79xKmt/2QdvMmvquFjJFt2wdgQc8J50nYMYAluTLQYxdW\
+bQjtr98hYTO371U28x3v0HgS4qkNrbriFXiZCQIxYtsqatup70jMNl+9ZZR9Jgxu9GklQ25UZ+11\
+caPVlVVuVDtbyo3qvhUGN4rYIeVGbbPl3Kh2ZXNuxMvorx0UZPTsg3IZ/eAXGhk9TN4005g3DZDz\
+pp5vG/OmenLedNfbct5U4W0D3nRezpu+yDXgTTvlvGlbroQ3PZ8bLm/qqeFN51fzvKnnGilvqqPh\
+TQ+vkfCmPqvMedO3u1TeNHZ1yLzp5Ugtb9oYqedNLd4w4E0OSWQuE5Zs+wkvWb7cVCAjTvcFjF00\
+XA0wQs+gtbzH+DfRWvqwars/IJ03Wi4IaBs+MBHQKE/MY318iEDqf5ExsW+WCT31MetJx8Rq7VA0\
+FW2oHCT6dyXl6ZkY7wz74m7KHjZh437mZnKGx9eYsVsJ9Sp2pPsiNFoCdr9NKuJE6N4vM+2QzG9J\
+LoHYvA/YVnEFtoprqMIViGeGgij33ChCG3AFckEnEp5ytQK9cyC1Klh8/Cto1ILAEW99PcDhnIOf\
+PmIquQaI8sMuMrKL+/QaKCzUcVrh4D5hiXbtUnaWWjtVRTSb1RLA1/QdqhDd5n6a3BDgOglzu6p4\
+IVTHBjbtyrbJEXVQAzsQd9/e5cvlSrYKScZ4VYr8WbFCFVPR8a4D5eX6G2WH85dj6NEI43MuneWG\
+bQIa7SVoxNeYv41LMidBo0IiJSia2+V1TEEja9Emj6zFOxmm6d/oXvRcBlBzEUnrlpCHZhPF9iSs\
+aX4OaHU01oHDu1NvRahVaC2ZjxUlCXbtevV6sMv1HhmwNSOYXgj+TLT2F+kCqnV5z4yvUArbnC5D\
+vCpb2SoXwOzpzqxg3WcRBAQ6zPO+Atn9yk6Y2dg5vPuuJES8m4MkMmUREPKpC3LR99K/qJAAH+ZZ\
+/XjxipaCLvhmA3u2K2mLPiQolzKqXIppOQjTrCKmwaHnEdVf2YqzqTG89CSWcyi4bAN19wX+xt7O\
+2ECWxGNfC7lTYJvoeBW20khmleYbdNwgMsTpb5ClHr+Xdc9bLGpuEPG+8xsKs3kNDkXg9Ca35F5i\
+0M5JL7bis9nMNSwgQkdbaMbOp4PP9qX14jBP7CDDPPSubJiT1ovDXL9DGaaFDRNgj/MaYUgh5fUv\
+7a11xMWVhOMOQp+Jx0X8TpCLd+kE1yG6GaRHSBhlDWA9R8cbGYi0zCs8TDkZEqa0XyPDlIfXMEx5\
+TcWU7deMMeW31eISdN1N959FsiUoWC0uQcxucxmE4I1Ngzc5ZngTnekKbf6agXveIQOPlA48WjPw\
+Ye8EG7iKSa9BFIAOk74F18g0m+/FhXhDhrBYikBpAvP3nbEasL0TWxjbM9xhl38nnLYwNON2A8yd\
+4l0JW3A4ryZvIcE7rx7PWKbVtva8hc1h3KowVTGbohBifXD1FOBQdgRxcRS9eKIznmEqj9rBkbUs\
+Gp/w4F9eJSvjf5utDG/yX71WXMdjrypU3XAbUHUxDbCSz6OkGTnDhfuylks/0VQzoJHqJ/K3StT0\
+ppsVQ6XhuozQr0vQXTrspRjI7LsYD5Ns7K4Mq3wpsvRLEbNSnPl4Kl0WPy2D0+UV4lK02WVOJEEW\
+5kFYGEQgM6VfW7BCHNvHb4WjhTy/UZFVTaUAEM1mbA8IlxR9irf/de+o90IG7aHJW0S4K59pK58Z\
+Vd6UlyN6H5HJERhpXGl/u5xl6Wl/W51Nl6SVYVdEZwOHp32F2VaL7+4dkEhltdOK2EiLUvyPO3Jz\
+X+IK12SVoI4fxE2Jw9sGBFVNZlyX85ob6TbZKeFcTD9lPm/Rwe6ef/8SbYP/3bpktsUS3e+Qrj+f\
+y3lJYqp3J13q5EJYc+v7syyWfXDw7G7h6QMzAez0eXeRlFf8Cn68noQLGV/RAJBv8RoLgILHSohl\
+7qs8ITqfEvDYDYAHMUY3/0GOvFIlR14ZSZ1VCmlGnIY58ggmyD1g7IVuLAZ/Tz0uXmTDK8Rde+w/\
+kPeb8PvHNEGvkb4z6wISrUdIW7tqXcD07tBV283Lm78ZpP0S8/LUt2l6MpKmkiXdd+R3jLKqF4aQ\
+ePwVtCqXVxyVxWJX0oRUIvPb31HqxGmy9mu/fPk585GteyVgcveiYCL68GXyVZPehrxj/rWdewIi\
+h1cSJ0aRJCIQ5OOi6e882IU73gX55uJdnvHE5PdAdANw8YxukLA4ukFSVnSDlC3RDcbkRjeY4o1u\
+4CyMbpDGn31l4qNhNQujJzEqD6gJs1dr4fv4N0m49Pu/HZPwEhx2LPnWUoq//52jwRdY4mt9KrUm\
+GqnFhps9V68sGiN4Caq55Nty9NvR4JT6O/PzVNuD8CvdF+WwFjvSo9Ag0D/eaMchX0XHoeKKNEgk\
+H+KbYiEsDVsz48hhpI3FP7H8e+CoGk/jnzweCIpyry4Fl9p3y0gUHU3616m80JVZizS+jbq3DkSo\
+6yYvRxWyqp52EQ7P6ttIMpEYLkZF8TRv+nSA7+UXMKsBLFV+Ux97PDPvWlbzxGrFzfLTnYFyX+u1\
+AaV3kZkHTeB/IQhVbpollnPn5MRsfhU2UxfSp10JEqZTRK4MBOTemqvGP89+hSnv8LjMw+10TP6/\
+moFT6agupjDhN99R5v75G4QT89y58RrlqML4Ppa1qveR2xHFLschHz0wi9I9vm/xnUC55BYB4K8w\
+Zeoq8dJSLi9fvu9Z/GgtolG9UGPcdEgY7ptdh1VKom/maHKz/LA47QdLal3qsahmHnx3OxGBPnkB\
+AeUu4jSiyPREfsz35b5AbTnEE6nGM0y91J7dCPDYF4Sj7NtsXj5xqQqyqbvU31edAvg0uxVMW5PF\
+RLzoSL3gaPw7yhVTn7ylbJwmWdp9qj2Rv1OrcIM2ftnkVggs2xbgADV7QQl2CPc1fY54PNxlVV0I\
+LuQotjpA5E1E2S/2/bqRHQbcq3p4EH+y5forvHC3b1vUbt/zqBYpms8mg7pOq9diQM1/3mTvLRbl\
+GEf51jQ4zsDSLr1zldy9ip9j6HMM9a3A7+rDFXKuTui/3vXV80mMiglezqnIsYN81N9Y873y1eBy\
+r62/fAu7/pX3WGnrb06IO9/31LyAcldsoyzE0tZsUJzLfeu2KSR/EUlVvu4rdceRQXBLzTUeq17s\
+SxY4OqMYqYi+2svJ2hbC/cNL2do9xtZ1tkjid7yoqGL7N8mWM3U0q/pxlnL1Lfqvu438W9PRAG0D\
+HzkO/RmBQQfvqgI3BYDlr9SsKix8FPebIQGMrihTGN28lcroAhspAmB72etUT6LVZm4BFlQItxhE\
+ZxzgOpyTzTqEx1bZFB2dtDG4KkWsDKiXHyvPBGkJXy1Q+eqYqdcBBu8KpZF647EFeOOhbyPI1cUY\
+h20lVo4mG+bQea3B57gT2OtRK9ilY/BYb7YAsxZrcelxZb3h8Rh7fHwtdh+5Gu/6CezF0/kLyj5A\
+GknJErYywLS88e5Y1vEGrAgcKo7o5qlWkZCZRd3iduWoeH8ki32yIN49nJJpchTpLo7VSqDdxVtL\
+43FSdzYK+2IGKgl8omjQRSyNtjHeCzYtNuf1PZ81u7oibrtZ6dW15n33WaKXNeQ3rasyxcF1ajDP\
+M6nsJENwPGg7SRQjYG8Y+4zCU9zbguo2RTkmEsOkKeqWF/2M7Djap1M+hbuSd7wekN6VPNIjcV7w\
+yXzOSF5t1t8gg/5qegLB7l7u9axwsWDHZ5WLBVd79bsuZDpxOU9JL4tGgrajGiHcqpILot/NkQ9y\
+ynP6208M753RK1Cb0GJkeqNXefWXJZNuyP3k5Kq81V79TVUGtgKSwa6UwWncUjb6JDz6Wsr5lztg\
+eBOgG+Q4z1Z5DWWASQxCs9aHWrP1/FBr/rxCdo20HjKrvCmG/YEdsf94rQd/rTlB9PONKpnkLDfT\
+iMkX9swIcPfnafmCw+jcnrvR6/4Z4v7UeYuQR5zZ2P2zmAc/k2JeSmOnhMXcKeERXb0ZaUxrKVBZ\
++oYNxF2IR+psl873QEp+3hcE8nv7BT35GdzraZXe6ylQTyj4sWuiAfUlKkyPXakVwctXVLqqL5Om\
+i/CKpBSwrfSRNO2NeTvWqTLK1C3sIOiMavL8agMwebgZLWWmumOucCk7Jt13YT9+ge3z8LjgBbxZ\
+l6AFind9D+u9mLqvuDpHYftskao/Pulvp7mI7acZyj4xaqMu3jF2u3r/DSr15S6jWwneZg0se2SD\
+LiUbdGHKkRBWpcF2XeyrZF9MURSfgU8zvCxUgXg0Q7o7/uiW7I6tFinzmrJBvzsGv8NeoPzuI02p\
+nZ9pr4nGF2e5E206HFQ25SjORPzsMpXT3DtN820pRfC5NwEAvy8QbqT1LSVCF9bqdbugOhfq2zVx\
+M7soQZnXgKXS6GXOkiDo81GzWFKwFCVl3/aljOOywKSIaYpWPOdlpvhHsN0XyxiKEFiEhWTW06Cl\
+qrEFM1inYsiwjGfdYNLQWA1CuBtW9AdcobuJORys2bNQu8P0cSoXUERxCWbxWipmkuenSUy7VFsy\
+3J0U7sZjUT2n+X52bZWZrPvqGtlGS9VUCTZ2tOlPLYC8cYa21EfpqVUZ2xkeHs88zZLKOIxIRJTm\
+/1gigEqDFYSAwDHTA/rkdsXPmM3x8Aiz0opjzOG3J0UsV/VzQhUUWdOQ0qBEgxRv5hzssD1nlZI8\
+D6d4/xBben1PryDGsCMbmBs0gtcUticAPUe9xMi7iPkfq5rU026aD04bIMDddqA42eTbC5Tc44jo\
+Mr3Oh8hvQCkmYtTfxN1qAlsP3K+Flx17FmQsttJUydie8DTT0sECmEO7+HKWsuKFlIWzaJg2aTTn\
+LV5RQuf4XjT4FxTRpGJuLI88DbysQrwVVaaihr2IAerTMfTr2NsrOsNHTEr8QOKVgYBxtxjmohvT\
+qwtYcl/lw7vnK4uVpzKoCjQ9NIJcHV0JZV0R2lHWp6MsSSpnGQoQvxmnJiM+g7dtfP0DXF8Dr04h\
+KcPX4VnVrPTkCmWTW746ABeaJxpfKZ7ujQV9c57CX9RjJf5Oet3pk41jQzGS+5/rCxgPkODyZ4La\
+Uaz8zPc9Oprn9MWqgagI2CKOB1WJAojkrjXajeN1p0oZt04Uzil/Ws32Bp8q0k5YThwa/HXJd8Ao\
+Aa0/m6BsQc1f0mc91O/0FsKxukeRzZHs13O1eulcdpEBorHlWuk+355Dp5xNpowJCf2mK/TIaJpn\
+HVKkQ8rwbEqOWVC/9eHUtuQlpJIn76E8m8JnHgikSdkExlxpYhR26qbfVXegbH4HqjYBgAVpU4rT\
+6W9ibs2m5tZs+k5rbgXvrv1zWLxfNlE+SAQjHPGgGipCLac+D14llYE7IYv0Ak1mgZk0LceSegd4\
+FbkTcrhS+1T1MMY1Sn/tFc5/ULJVSB4DdVNGKVSzchT7QHs2+GlsmJ7EWEbN5Czi2FRa4sauiTb6\
+M5cap0whug8Rti9zqUq5Lo96/rUCn38tANSbOzjoPbuyPViQBGycvBHh1u1goryTnlYKwAVRjzgq\
+EOC2GiI1AwXfhTenSXbhQU8HpDfxSuTh4Dl/Va6itcjcNk5ukTk3P5QMtyoH0nW8b6y842fmy05j\
+VJnYlaA9QcxawyXLxc9M0cHQdyqKfxVyhufzd2B7ww/D6UkY2amY8jMctfc1ylAxq4lbwazUF6Qn\
+iSHY89rMl8935TzT7LmMBQ/OEnSP+CzRCegCdsp+fLrMZhmifXDdPPn4rs41DZYSpfsvs3Rno9LZ\
+fLJImA3xz9TM5vUJRrORBzypQvqwsVrcNIQBdn6byUwPDBR1p8tB8cOckPpFHSlc6tQ0uUlwwxwt\
+9YajBW0aGLLuPGpZ+Lqz7kp0nRqU9qyqTC8ZodPoUo6EqtNeS9frtItXaEWTnwYpAkWzDI1OGwUI\
+wF3qHYF2DKtWu31khZF2O3PCTdRuV0/XwUKxXqpWS/O74PXW4V6DAvTq8ghD3YneuFpvjoZaE2Vx\
+/mX0GmUSfJTLHdXuGagoFMVwNwgUEXlvMVsqIDpU5FRY7o8raG5yvPk5x1J/ZbbILwwHn+LP6KVI\
+6Jst7m5EXAOPDmNXemEKBpdj6LRTHtPutk4T/Ti3YgRAs/XbmE3YkkXeONxpmMbaMRprlSo7KQm+\
+3doAI0TSvzJL01dHmVGT9OXlDuhHJwvw5I+/6ywS4OmlU4e9amMWB08aI6lamBfhsysbq3tyORcY\
+pBl2i1k6C5PGmwIELR/onEgEbscY9N8DVBokZ1tsd2w6mirCIJuBBOsDGTiOtfUOEJj7iGkS5WHB\
+fNoLPh9cIPF61HC8RxIMLHaKplPGHYWrxh39yVTIks8f6fJd4JsZQQ/Mhi4WLPa9FhOLfYMjWIo4\
+VFZBz2RF+6GOa+qTdBRw9HVxOnFT2KRkJ8v3+adIr0fdM53ddkaqHZ3CZCU+PUygp5pJo3Mymws0\
+eFHtt4BLPnV+MsEXjg9XQHy4Asda6iyXXWgY6VsxXR9HLuOKcapKLORtsyYxFgIBuoUcy9pLrCZl\
+1CDGWmxeQucAFx3Qu/7wnWEO5ZILIMlS6toAEz/rJh4dDnwvhB/9k+azOPuQHE1YPU+tx5Z7Sz9G\
+O+yDn04A34MyrT8IJGyENpP7kSH5M9ilUiFyLjj3ZqvQP03vmdx0mswzWSuV+cgWSO5z7qNYaRhL\
+TIiXnAcUDVDE4pSM65XVHlgm1SNUYx8zbimoVqMv45vQGS2Czo7PU3YT4g5AAvMBwt3dFBfS08os\
+zmoOT/uvulosvu/mqJLMey6ykZhpd/oZ1Jgtl7D0x9CP91G/1XapXlKgVuwUA1lKkCYaobqg2oXm\
+5w2hoSxSfPOzQN6QSfGBOYCaRdFrj7BXNrSuGedSMYiO2RGIcgcwNUkk3KLJQWw7bPMSBNKt2BpN\
+COBEuMjy0HypbVkP6fYLgiUAEPKh9IPkv3UkX+w3Co3WmnUimAmBRBaHep7ERQS8+IywWW5frDhp\
+1RmpI8O9TxGLZMxgPVZkpZhLhusmGcOOTJl4Y9PsDMNk1oXwJGMyo8NJLFcTD9d2PUPJ0MC3aNjD\
+ROdBmIbv7Yje68WcuLbO/prujfPX0qz66wPksjobO7HOlWLrXJap9RKLUMJQO4wLEU2XjpDakgQE\
+OTyE7WH0fp+FTJwq20dkZEj9NWmelJ+kGM2PkqRNsVMhES7LSAvpGEV20Jp03BcGyk5prucMpF5m\
+6GcgeSOlZyDW2YZnIC1Hh3MGUn+k2RnIR/HBzkDmOkM5A9k6SncGsmvETTsDqRcvOQMpT1DPQL5I\
+1p2BFCJxyNd2hmrv6jBX2dgzFhicgcSKagTCkEZoJGBAoHtsalOGsuXjtMoE27DHdGHKBCxQVHgs\
+Ydk8KQVnyX0szDRwWQ1jUpImGaPn8U52pAjEm5kkcPfZSfyRYquBWjmxUteANAOZEf/4PiEI0ZuM\
+9PIEYaTnJggj/XgCP9JNg7VOTvsXBwxzpSmfOm4vt0qcSxbPM2aPgqjw++RQJaspz3D2qPnmW4uh\
+fb5+j5Dt8/Q2tYe667boWSl648GuUTITbwiC2t6OqqDWvYdOUPu9jyKo3d0OCWqVe8oFtSajjH1Z\
+DeW0+U9fv5y26ckQN8Av++vsxTpl+uQwQZk+PExUpiOMlGlDW0Jib1P8w/dtzdSmGd4/wtwKzlyA\
+4chB6ec3u1muRuKgBaH2RXwGs7gnOE0FEo9jQVJZi1Csvp6ZAlzVSIc4bVi3El8xm/OoeH6hEhMA\
+u8rCWZyJiXlUNJhOPCpmPA1YB1t05jTmLw87S9dkwV9+nJ2xHOBA2XMEX3t8/pzg0vivzyUY7e/B\
+9rJmT6mefnOcikcbLwoNRwPzTZqo7mfTVHe9PU4ghTjF5T1Le8KMdnPnFgSdbASdrHiXfbnejzSH\
+nSqfttMLU8l5awGUeebGwr9Efswh0lPCcjQ4329IHkHjdRXilUfwjN5rL8zwpg4glx0nkfaEhG4Z\
+AvOERACbpzJAwfmx7WnFGm7vqR4Lq20/nMguFcev4fiXFdVqCxwLvUrYwr3eOI1+zd0xhvqN5pBj\
+aXz5niKoVBrA5Ck+Yqezvy1bndV21r0iFX3eHq3G1+PV1fhmmrIaD6WishVD9ee0Goqd6pTQkcwW\
+9GtnwdzK24J2TBDMrYW8+fpgG958XRkIzV+feT6D8J1QRg1CSqN5iBGBOefEdWhFGzrLtKLjT+hj\
+HcbzOCnDRc/tiS0tFoV2O49WLkXPYffCMzRkKIr9P7pAtVyav5fdMF9roEL5OZC/l9p/OvIMAERc\
+ONn/shPLVlwomv6oWOOpFkE+yGJ3rmFRlN57yoaypTOL+oTb608+iXEojqY29tKwosFtmM3OXhzD\
+Wo4VW659kl56AOcILCDpvjaKWJ4DfgbuPjZHoyQvDrk99EcFxz5u7zgJNnp63tGd0QQLM8phYiqB\
+jGS+IJdjytHneNgxWEmzE9KpOfZPS6Yoi69oVdZ3MrsGlpx+jJxMDof408UnBgc7XQz3VMrwJHeU\
+U5Ab+zklJ7lYHzY4l5ZoEBLruF6lmNzRSKWo2VKnUvDz4r5IEEVVtIy2XDMosNgj7C/jECAxH8yU\
++eoGby/u5iqAOG8MF9/l0eZCmSgoXZnNUgCEUHmRUzkvFPxXVHd9xdWcetIm2kyunTAQ49+fKrPc\
+GuZ+1XfQqoPErSU92SRqRZhlg35yC+oNnwjlkRvsy+vyTiWTOkpvX27enbIcUeI/MCAcY9uicWZi\
+ogH4/2wl8yXOMoovwLfqtraXKkYyCHMKI3YGBLiWzRVWCgLYb5OYXniRwiO1PaBeHr3qhiVvTXkS\
+FBnIXLqirS5L0YPq2QKtNLmtIiRYEYPzTe6vZsgxkhKyOwWV0TG/fAz0qFKIb8XxdG3pMd+h4kjw\
+X+sdLN6QYkRJR85H8viH1bBMfDt2QXXfhtipu28UZj4S+7h2VMDFr/QMIwYdYD9/ojZipozIdl7u\
+VaSD37fzfUn9lQX0co51xYq/yuiOkMSrmEW6XGpN1kHQKIXlgmoHWivL1QeNy3egnyw3tHQ9ZjZj\
+O0YpSJ9giwQ5vmiAAYYbIcB7Q2X+OTpYL06QEieN09gKEWYW4wojRusrhEKwE5KCqZ3jRtE0w4I3\
+jppK+IdewQBidG4abGyf9DOIACwNKw3Tb5OMAwnB2pwV0ma3ucWNc/ZgQ3X3NjT2IPm0zEISsPI3\
+/rzeHQ6Ab2PGn25Y10m3l1n9p3U7s3xfoSJNVX5fSZ8o3VfOPyndV8b0DmdfeS3lOvaVzx8Nuq9w\
++pfUmyJKqw8gQaNA4mGRP1nuYbEoURpvaEz4Qx8x5fxgpKLxJ02YwkznDJxmat/gdhq5xEhVRupD\
+4LHQqzwErbGQpmQGrHlxknJvVKl/OJPHqPsA4S/Nte5vL3SDLatY5z5wJ2ljVzjIg2SDLvNnZIVh\
+LRrWLCQzsg4o8USfhO3IncJsO2Axiu8qxNJMacZSRQDYE1zFVDk7NZKcL8QJhuSg/i+i1t+rcaDc\
+35nZIGq0oFZQ4m1eoHqbD0Cbm69PsmqK6D9M2bbWj9KnDfo9QbaLCZh3qrUJU4fdZmsTYibb11TK\
+G9m+RI7ghJNGufFegoYIe9rLS9zUAdJmUAyarX8OPe8UKyepDpTkG82ok6aP5LEg9rTHtMj6bVfN\
+KZruu9gGf9iGdwPlBCErzNSTNKGFl5tLa3ueM5mcHcJoH2A2yRqPabPmdCDI6Y/8gO4hUK8kjuGo\
+l0tn8gDCJn9vrl87q/9+nLbfH+xcIFpbuze1jjrUYvXcLo/oZblkdfLYkSe2Z8Rpz1lWwT6QlMt9\
+ZUlDltMDbHXlasYeveW/RQ9piLlUnq0SJ8izOCrJZx9kmsZSfq9AsAj83IGC3fc+TK/Ymn8WpNLW\
+h+EOa/V48rEWqsX31+ZC0++bs6ybSV4OaLsSyeZpLeKVlfebEy46syZ78/BA8mZ2dfbmdvTGX5Fe\
+vCdA0t9NdlFAkDOU2V3lZyg6TqrbRvWnAjtA7BQ9XPt343mKyWGfp6lw2LewqWCqmNaUP+xb0kt7\
+LNnhqUBoFyPFK26oCDURYJ0d2ACGjNZm3Xr2cWYB9XFiWWo3fd4k42jSSl3MYk0LugWJXNDKhAOS\
+DZk5lf2PPaAL4r6/nWm8iiTjJpyvNoZ51oDntvYCXaYofKi3NhaR4MpWNDGB6jRftwN/o0RZ9Oz2\
+Dg+IOEW89Pd6inYdH2+vHFeyV11Gs5ToSH+0M9mogLtT7vP6ukbTHtdp8FzWrhWPql3+ipbAV5yo\
+7riXVJ/BBkNQ2aquknia4JrexgbBND2oNruBqOvPbqTo+hEQj9opXC+kjE7BlLitj8g9lTVaGjMy\
+VTCeZHIHM+z+qP91eGjF6Uy4jRALELw26pKA1VqZ1BHWx/vTJrFsqqwY27wLT4ShG3B5qAolKkEt\
+u1wlmNwlBK1Equ2vbG8GxT1PGNpVaY3PHaFYlXY6REyr1oCq8oIWhM8vOwTNHslUJf4W6kfaAb9o\
+zfJLX3lI4OD/9FPcBjvXU6+jfrUlqKi+av5ciHxTzul+JMPzcWLFWXxO1yJBJdXW/RRSXZgsjXoL\
+Wwv8vUiuCB4cKl/12Z2Dutrv7iB4B2zvoCTHWeWVeUoquXGqBc+Ncx3HIaM7C+uS1FlyHDK8S9CY\
+aMDcnHrUjI8VmAh4S305n0DwIkZ9atM/EdQbNUQ7jLC1vSa6FzEfgmTxQpGELWjbz9bl9iEndKkP\
+wsrC8VyrVgHNrQNLB+M7K6YUsuPErr3A+og6vkDsqcd6gdwS7/oJX4T2O1LT/ffg4WCnAtcF/G73\
+ICy7EH90wp2KeBWueUea/V6be4eL4NGE7KwYonjjgUzYqQ2XMIoFWrMjTHyzUnTGH1zgxdZ6SjiC\
+l5zrK2EVD7dXXDnLOOurT3X0I2kJBU2sgNPE9K0QwyC6FKen3QnIKNTk3AUhnb2/vcEYeIVRWs7O\
+QvEd1UUlf0MWZAIn10AlLaNXyS4Iaq0tK5zkw28n6a0/vCUHB16kVqU6VmnqPPKikXi0VcHhqWZT\
+X6nal5VBweOwaZtQRfKQsxrnFSurRQyRZhGa5+OI1n8qLIPd6ZbB7VjM4UqVOGzdrsPM96+BQSQo\
+toMCTaT0Mhc2DPnh9r4CP1zdV8IPpzeUJpMCcQRyzoUWDqHleMoxXgjDTGguDPOJ5pJh1omVD1Mi\
+2zFDb8qRsOI8Hx9gtt3BQPvdww2UHjpt6a5s/rf30QcISLfNBa2EbXNKK2XbXBkkp9w16b4pfoSm\
+3szvxNwz4Jt5nZRxHjAKZAjVe/XuREGhvTVRWL9AL16hzbpXF49llym0+p1TA7oUJXvKJy0Ief/a\
+UnHFuvNeyZR4qvIk/axRJh4OZnc1PElIIn+R/ElCyQPSk4SVjaQnCXe1Dm5jl0q699cTJd3779VL\
+uhXgfKS5KD1IFtOVoITXuTsJC7qgk7CgUzpRZwosOhwiS+sraBaCDzKn5Jg5ljxM/CW0Lj2C9pPn\
+YG4VMs+fwpAMManthGmOeViYZv+HebyNaaS1Bnbta4q3IXz/Wlvx+93F73fnv5/dUPv943247xvL\
+lzhOhNxUQqRTg9AS/cFfpfvkDt/U+pLfLPjJq0Wy1y1qFUxp/6SH7ORVlwdBPYrd+aiZVjm0ZhDd\
+3EBXnV2HsJVNTTWSfxk97zS5b+TZWN03FTYRllXARUMqgxLNwlCIJt0eItGY7JB6RPk6liqMHurT\
+BIoRFHWO0eKQidHDcGpNHOlTiqsxMgnYCSWkTymqxm0jA7AJM31KmdX/EX574kho+YnpgpXUDwlJ\
+DMN+Mb7EEN5OTgCJP14M0+wBdaiTYEIMM+Lhtzqnq+rNbngog2shldSCb6Vl8ba1qI7qc+Ebhq6B\
+/xB7V+yy6QbhampGUoMb41KSdyr9ShTiQlFHLP/9++/ff//++/ffv//+/ffvv3///bvev5EjZk0Y\
+NWxW6swJU8e1aTMsYdioaVPRk3NUauxU5+TJsVOnpcbOHjF5wmhNu25Tx06YOiF1TOzkadOmx44e\
+kzpmVOqY0bETpsai1iNSx4ybZ7E8+uijVS2zUcG0mdD1zDEjJk+eNmrYhKmzxsxMvZ7vL+5gsXgX\
+WbzzuqDf5ei/RZZ2d3flx/UgHah95kz01dhOqaljpkzHI0udFjtl2uwxsSOmxuI382JnTR8xaoy0\
+3kTnlOmxcyakjtdWVvvtNhUGFTtq/IiZI9DMZ+KZj50weYxFWkLmZ5lp6WMZaelsaazrZ6pzykhU\
+ddrY2DljJowbnzpLW2H65BHzxsxE7dCjc0TqhGlTYyfMip2KBjhtJhrztNiRE8a1ibVUtQxLGDF9\
+GILqmDZtRiAYjxoxFYNwFII9WqxZqaPbtCErEjt5xMxx6JOp41EfU0bMHTZrwvwx9Rv8v/buBjqq\
+6t7//04yg1SjRow2QsARIkSNMGLEgFEHSBE11amNSG3UUSJGjThChAgRR0SNEHHUVKNGHTFiRNQp\
+RqWa2tGmFhVxalPLr6V2alNKNfVOLXpzNZ3zf5+ZbzIPzj7c+193rf/DKmvpi/DZ5+x99tnnMWfO\
+/O+uL/NPdDb/vZHiG+kjKf7vs3cGXhguMzszX//UybPT55P8033pbSnz/Wb+/3T9hmHckj4/cwyP\
+/HEN/2Pyny5nbF/ea97fXT7/1Dnimznj8k7rm6TUTTalmnr+ZUT5+2gVM4pKlCpCJ36vKma04BLz\
+qhXfxGCJ+TRXzAjjgnkxI4rm00kFxyo15qyYUYFVuBAfwibcie142NkxI4RTMIKnoJqslBt7y5Qa\
+qI4ZAxg9P2bkn0i73LQDH0Y3DmIjfvm9mNGGQxfEjG78/PsxYxeW1cSMQdyGRWwTg1iBEy6kPVix\
+MGY4prE85i/msPIS5utUquNS5otRbMOhK2gPPr0oZvTjM9cwv5OUev66mOHC33pjRj0ebX57JV51\
+Y8zYhi8uZ7nQWBEzhmZSX1PM6Jil1H3onKvUX9CNi8zXTeCH2I2XrWS5z6ddmO9W6kF0Y+2qmOHF\
+IfTjgc30P56LYSy9mf7HX6HvUqXGrY4ZAfwK+/EKX8wYfZlSf8VSnGu+rgxPXRMzGvCl25gvLlhL\
++69W6tDb6UdcgkXXKPU2VuIXd8SMWnzpTpYPR7ew3q5V6oS7YkYJRrEK3etiRh0+iy3Yvz5mdGGw\
+NWZsx2PuZjmxZgPjZZlSN9zDcuISP+sNm7GI/cImrMB/YC0edl/MaMYj72f5sARDuAAj+AT2NjF+\
+fsR64ThR1R4zqlcpdR024OcP0W846WH6DbseYX03K7UP2/HMjpixG1txCJ9CB+PyNXThTvRgP/rw\
+wEdpB5ZgCM/BCDahmqKU+S3cDtyMLnwbPTiIPjz4MabH27AX+7Afv0BbqVK2x+lXnI9V+BjWYS+u\
+xS+wE4sCTI8V2I8L0XYc7cASbMcqHPME0+N0XIsXYCcuxV68D/txK9qOV+oDLMHqjUyPDViHrbgW\
+t2An7sBeHMB+zH+S6U9Q6g4swU1YhW9hHe7BtTiqk+lxMvbiPOzHENrY/iNYguoppsepWIe1uBbX\
+YSduQx/b9S4MmNs7hrBoE+sD56BiO2/ABuzHVhz9dMzYguNxB56GA/g05rO9V3SxveJ3cfR0xiWW\
+Yof5pWLYg/W4D1ux8Bnmh+W4Axswiq1YcDL9hU7sxxq0bWb8YQm2YS1uwzW4C5/CQSx+lu2hnPqx\
+EnejByu30A/4CHbhdtyOn5vf1osFz9HuU5SagaXoMb/EE9dhPXZhC+7ELhzE7TjxefPJHfoNR89g\
+/4GluMb8UlTcgvX4DrZgFLtw7AtMj/NwLy7G0aeyfrAMVZDtHE9BL9aiH7swiIMYxoof02/4GBZU\
+cCxEJ5ZvZXpch43YhW04hN044cWY0Yen4z7swyL2v19gBS7vZv+Pr2MzfokdWPJSzOhBL+7GEBaz\
+v1Yv099YgrU4E5vxGgxhB0YwhOo0xv0rbO94MrpwHnpwAfpwMQawD3tx1DbGOx6Jtkq2AyzBNpyP\
+b2E9fogtuAe7sOYnjC+8AwfwAcw/ne0My7DwVfoJv4Ne/D224WfYjef1ML7Qg4MY+inLewbbO1bi\
+9J/RbqxCH3aG2M6w4A3ajduxH8e8Sbs565jwc9qNH2IVOnrZTrHsF4xPrHiL6TGKvTjrl0yP87Yz\
+PWcqi7EE27EKu7AOP8a1uA87ceLbTI/l2I8f4WjzrOgdxieOwfnoxno8cAfbJRbjFpyHO3ArDpj5\
+e/QbZ0LlWIYLsBq7sQE/xFb8Erfgwp2MT7wGo9iOBRy3X0Uv7sA+/Bj34dT3Y0YhZ10rsRz9WIO7\
+sRFLw6wXPAO7cR324Ye4Dwew8Dv036+YHtdiDX6MjXjgB0yPpdiNy7EPu3Cfmf+a6bmKmY7l6MYa\
+fAwbMYxtZt7H9Hgx9mET7sO3sPAstkssx4t/w/S4BhsxgG34GXaj40OmN3Pch69i4XzWO5aj67dM\
+j9dgI7ZhG3ZjN/ZhHw7uYns6m+X9HesVN+F87MV6HMIWnP57tgdcg9txC+7FHTj6HPoPS7HgD9SL\
+HR+x/eLr2IG7scfM/8h2j/NwCB/A4nPZLrASI1iLKsL0WPIn6sXgx4wH/ACjGMWCavI/s7/Ci9GN\
+m9GLfejHGAZxQj/T4xkYxSv+Qr3fpT/3sB1g/l/ZDnAcrsXvYieuwF68C/vxLbSdx8n+31he3IPz\
+cRDrsfIT+gvLPmUcoxd34NM4gGqA7YDzzkIsw+OxGudjAy7GVrwDt+DPcAf+zSzPeecZf2e5v8d+\
+CZ24GWuwDxtx3Wf0NwawB7/ECDr+g/V8AeMdS3EA5+OcKPViA7bixH8wPrAJd+FGHMSLPmd/+32l\
+bkQX3oke3Iw+nPlP2ovn4g5cggP4Lyyq4Tx3H8cFnI4LcSk241rswC7swb0YwVFf0N4LGSfowOIv\
+qRdnoQfr0If3YQA7MYRvYQR3oVqg1CfowCFzemz4T9YzPoZrsWKQduMC3IE+HMB2zL+I84n/op9x\
+M7rxE/Ri6CvGF36EQcz/mvGFEzCKLixYyLjFcvwYa7B5iOXGh7EDe7EHd+NuDP+Ldv+AcYkOnBqj\
+3WgzWG7zZ/RhLQZwCYbQjxHciOpi9s9ctZZgFVbhR9iAQ9iKk3MMYwuegzvwjFzDiGI9FvyQ8YdO\
+fAvd2JFnGF58Ff3Yj0EcYzOMMJZgFGdgQS37ESzHXViDS+2G0Yx+7MBXsQc/wt34wSjDUJewHaED\
+8w8wDBe60YOvog8jGMBDRhtGCKswggtQcf31KjrwbXTh1+jBQ75lGL14M3Zz/dWFffg57sOCAw2j\
+0MPxCcvx+1iDt2MjBrENv8JuHH8Q0+N83If3YeHlXK9hOUawBo/PZ3o8D9twEXbje9hnlsN9GMPC\
+KxjnBzM9zsIarMNGXI5t2IbduBX7MIz78CssXES/HcL0eDzWYCU24sXYhg3YjTtwF36CgzjrUMMo\
+quO4ixW4BhfieQWGsRYbsRP/fhj9iAb242FjDMN2pVJOLEE/zscI1mMMW/Cdw6kXo9iHVx9Bu3EV\
+Fi5W6iEsxy1Yg/lHGkYTHo/t2Izb8GHchb04iP5vU+9VnD5iFU47yjDqcDauRQ924mrsRT/2YxRH\
+1zMuxhpGKS7A+ejDeqweR3/hUuzGT4tpN/4L9+G48bSb6/a1WI4PYA3+ARuxagLtxmtwEHdjM9fx\
+xUcz/nEq9uBqLGhQ6l504gvoxp3oxY/Qj59hEAsdbG84BaM4DwuuU+oH6MQmdON69OIz6MfXMIg7\
+zekxak6Puccw/RKOD+jEOejGGvTiUvTjdgziHgxjDKNYMJHpr2c7RSeuRjfuRC9G0I8zJjE91mAY\
+GzBqlscCL+sdnTiEbjykhOlxDfoxgEF8HcP4IUZxLxbcwHnZsUyPC9CNm9CL29CPZZOZHs/BMNZj\
+FH1YsJT9OTrxM3TjGVOYHt3oxyUYxDswjO0YRQOdy9jfl7LesQ7b8Gnsxp9gH045ju3kRq4TsAQv\
+wiq8EevwflyLW7ETw9iLH2M/quOZfjn7WyzBSqzC87AOG3AtrsZO7MVebD/BMAZwN+avYD9WxnjF\
+P2AN/gc24sEn0m50YDeuxD48b6phDOEqLG5S6m6sxGexFl/HZqyaxrjGIqdh7MV3cPRNbDdYio6T\
+2L5wGbbi7bgFH8Qd+AwOYA/mr2T8YBlGsBq/wAY8fDrT42zcgt/HHViPA3gH5q/iOh3L8Cfox0tP\
+ZrvFZixsVurnWI5/whpU5WyPWIR7VzO+ZrAfvIXtdBb7A3wZW3DUaYbRhZeewTjAAEYxcib7Tx/b\
+z2yOO9gxh+MOOquYDkvmMR1+dRbtu5X5nUv9OIA1OLGa9YDzvks/4lfns/6w6gKWC5//PtOtYf9X\
+w3LhWxcyTvHzKzgu4pGLOC7in+uo9w62nys5DrZwXoYuXITl97L+cSEevZh67mPcYAh/jxEsvYpx\
+dj/bST35wxwPsAeXoXpEqROuZr74GhY9ynrGCvwLLsRHr2G/jSdey/4PK3EbXoS7cFQD+0O8HHc/\
+yXaKQ3jTdbSzU6kfL2E847HX065N7D8xgqd7adfTHP9uYDzh6KW0b7NSP8UeLF7GfPBqdDzL/rSR\
++eF3b2R72cJ6wvn4wHLa8RznqStoB27GoueVsjcxrvHEmxjX+DdsxsqV9Cv+cBXjLqjUJc2MNzzl\
+ZraXH7N+sBvrsA834q6t9M9q5o/P38J28yLjGitxN9biFB/L0c04WsM4fol+WMs4wl9gwcvsf+5g\
+vngJ9uHHdzI/LGmhP19R6nrcjT04hB+i42bGE7pw/F2MA6xEH27EAH6CvXj8OvYr2I6jGe/bsBR3\
+4XwcxHosWs/4xfuwC7fidvwAi8zfirTSH4xrBw7gmbidcVi5geXB87DgNvaf6MQN6MY59zBOcB12\
+4AV+1jcuxQjeh2ot53FYgruwCvdiHU68l/0dXoydeOz9tAPLcQCrMP92+vcBxj2uxhrswEZ8Fdvw\
+d9iNX2EfNj5If2IPOtiORrfTn7gQfdiOAYxhCA9/iPbibFR3sh9CB/agCz9CD45+mOlxOgbwhxjC\
+NRjBbajYTvvRg2MeoTz+FjuxqIP1hpXYjxeg7S72Z1iCnViFvY9y3MK96Mcxj3HcwvtwF27EQdyK\
+RetYj1iBQ7gQz3uccY912LHOvA/O9oV9uBtbArRzPfshdOB2dOEu9Kw3P9BAu3HBE7QbW7AXN2E/\
+9qKtle0AS/BzrMLTN7JecR2uxS7sxO3Yi3ux38yfZLzezfHpKcYT7kY39mxivWIU23DGM7Qb5+Nu\
+9OAQrsPiDez/sRILNrM9YgU2ox87cC/2YOuz1Iu70HYP+8ctbCfYhPNxE9bjl9iKZc+xPeNa3HGP\
+eb+X8YgfYb6f8wssw0Oe57iGFdiAD6MfuzDoN+/nMh6xCffhJixkv70dm/B32I62IPsDnIy7cPqP\
+Wb+4GovYn8/YyvrFCNaiepHlxOlYyn7+LpyPH2GDaTftwCgGceAljnNY+TLbM27Eojb6Ayuw/hXG\
+DT6MTRjGdtyD23Af7sIx22gXtmPxj5R6HyvR9hPahVOxGW/CDlyPPfgY7sZuHMIDX2XcPcB1NrrQ\
+hR5cgj70YQDvwxC+jxHMfY1x+yDbDTpwJbrwWfTgh+hDRw/T43QMPWjet2V63IC2dvr1ddYffoxu\
+LPwZ2xuWoh/PwSBei2G8GaP4KRY+pNQRIfZHOAVr8EfYhO9gO+7DbXj8G/QbLsJBfA2LOA673qTf\
+cAXW4hZsxg9xN5b9nOXi+HwOenA1+rAbA2jrZblwKkbwgl8wLjtY72/RLhzCGnzgl2xP2IVtuAe7\
+8a23aReWvUO7sBKLH2M/i5XoxVoMoQ9nvMt2jMuxF3+DezF3B9vx40rVYineh/NxL9bjmPc47mAV\
+duFzuB1/j3uxYCfTBzgeYimeh/PR9j7rAyeiH6/BIG7DMH6EUdwapj+fYP+DlWj/Fe3GEmzGc7AD\
+r8UebMXd+AYOYd4HLPdGzruwcqN5X5jp8RJsxmXYgZ3Yg2/ibhzAIZzwa6Z/0rxPzPTYgbVo72N6\
+PBk7sB57sBkdnBcN4FqMYScW/4Z+xVrsx+kfMk6f4mcswSVYhR9hPTb9ln7BBzCIIQxjP0Zx1y7G\
+Kedbs37H9o1tWItrf8/6xNcwgIW76W/Ow9ZgA36JrVj4B/Z/OB134CIcwHbM7zLvAzPO8D+wBg/5\
+I+MML8Q2vAO7cTP2YQ/uwz4sfIb1heVYEGF6nIiNWI5t2I7dGMM+HPMnpscKLOT88GIsxyaswe3Y\
+iGs+Zv3gPvRw3lj+Z5YXF2IAr8MQ3oIRDKON88mj+ll+LMNWPAe3YCPuQNdf2E7wJ3sYb5xvvosV\
++AkuRP9f2f7xZWzHftyGY/eyXjnvdGM/3oy2F5S6B0vwjzgfv8B6zPsb2wtOwC6cgdvxDhzAdszn\
+vDWIZfgmVuOfsQFP+IR2YwNG0Y8FnM/+Gp34F3Tj9z+lv3Ax7sNNWMh5bh+W4x6sQfcA5fAKbMOt\
+2I1H/Z1+5fz3UQzgQZ+xnDge+7EVR3Ne/BpW41+wAUf9B/2Lp+EW3IA7cAsO4OuYz/lzbpTlQwdW\
+YwU24DnYih9gGPuxnPPp4/5Be/ExbMQXsQ1/hUWcV/8ZK7D2c9YXLsEm/BO2v5J42qdQnvrJWXmB\
+ymkqyBmXf8Bofw77Ev6t2HwwqP1f8WdP1CEF8w4pOufQg1aM9qkzx846/uSSicPTV5kPCf3+X0ZB\
+yoNF5r/Xmr8K4d99c5P/bs7TfJRrwjExoyb+QNshBXfkzj14VO651JzIE+1xV8dbdMAjv/g/So1L\
+bZf53xtHx4zx/Gy78/7kPObflpeXnzMyn938dyD1HJtaT208judD/FdAfl1aO+pGpi9m/peSH52a\
+L0hMb7bB/FJyM+dQomxjUtrxndvycjck66ljPh9QbnrqfK5O5mvJ+8kvTGtH9Ug7OsmPmhgzTknN\
+G5LtKCefSj7X7I9H7ktrR94pyf4YID97Usw4MnU+3022Iz+XayDyQ1Lz7yTzMvITycem5t9L5tXk\
+Ny/Xz7+BfBn54an5Ocm8lXyxxfRbyGuX69fnDvIrluvbNyDTT07NL0lZ/rzE9Cem5nUpy0/utWhf\
+dV6i/eNS8wtSll/mn208xZef/HLyaan54pTll/qPSM0Tw0SZ34yxg/xK8uVp64+xWJ+cR5Qyr1Dm\
+e2ljbf7IGCmwmQ/8xYxjUvOFyemd5H8jPzQ1n5fM3eS7yOem5iuTuZd8aLl+rPvJp6/Qr+MgeQX5\
+Sal5yvKFyc8mn5SaX5yy/OTVK/TroMBunTv3k7v3k3slX5m2/Dckl598k8X0wf3k4f3k0f3kBaOs\
+c+d+crfkuuXzkqsm/fT+/eTB/eTh/eTR/eQFB1jnTsl1y+cmv9hieu9+cv9+8uB+8vB+8uh+8oLR\
+iVy3fE7stpjevZ/cK7luH+vnL29a5EH+ErbIw/zlI01uHis9/GVtMcds9oO2B9enHys35I0sZ9G3\
+lBrkHMOWlzKfvK9zzQLmvraLcrs55t5pHvsvTZlP7uqRedQyDxfHy4mpbflBcn/dTD6H/NLM/bU7\
+uTwByjRT5l9p62PfSB0h8otLYoY9JzUfiudmHRGzDcfGjC8y6/hrsg7bgVxrTI4Zs1LL3JDMSw40\
+fwcVM1rT2nDbSBuqyNvJz0zNl6ec/5Bvm5x9n26uk3208XXyseY6OXJdssxZrXm32fIONNdK/PjH\
+fJwW+54d+8kH9pPnH5TIj0/NL085/pPP0uTmcvQw/4LjOE/jGGNbeVfKOU58OSbaKGquk0bmM+HE\
+mLEzc52EknW1U2aQ4+SKtD5fMtLn28jdFse5XeQ1K7KfK5j54EGJ4+SE1PzCZF6Ur9RZ5A1p9S8a\
+GVcV5PeT35u5DLcl51Gbn9hX6s5Xmsn7y2LGZalj1zyHPy95zhqgjGOqXCvMHm7H+fHcfOTXSV5D\
+nm/2+YktKfXcnddqu82e1507tSBvbnyG8f0f5Z3TY8azafPbFJ+f+bWtPvLXyHPZT9r+cWdyfudt\
+yLvb1mq/bVRetY05Pp6bXO/dTHPXTLZBc/x+dGf6suxLFDTL7abc4sqYcZxZ7tOMckV5I+VsByt1\
+lfk+Oc5XbYMZ5U5Nzq+McnfOlnID+nI1lHt6bsyoNq8PIhnlTssZKddMuXerpFxf9nJmH5ZzgXC6\
+xXlqDXm1xXluo0Vujgub5OajwLb6lHYsSc5jG2U8FnXsssjNOuolj9cxOnsdxZzkNlrUUWmRx8/H\
+D0nk8Tq67shah495tFjUEbDIzTqcksfrmJ+9jn7KdGReN7GtXiT7VRsX7huX6/clJeRPafZFZhu6\
+D02c019mzmv77SllFoyU2XVo4rw9XqYre5khsz+Hy7RkL+OgLcHhMvXfLGO2t48yn1KmLLW9i5LL\
+s498kPy41NyTzAsPUyq3Sb9vLD8ssV/TXUfWkI9q0s+/kbzAIm8jH2tRfzd5kUX9feQTLOa/j7zU\
+Ii8cwzWYxTlc+X7ymv3kjZJrl5+80mr5yWdZLT+5y2r5yc8hPyE1vyJl+Q9XakGTfpvrHJPIzWto\
+294137iONstsp8xa80sk49tESplbkvU0U09XU/b7OmbeQf5Ti+XsIe8lr07bLucm73+RR83PkKXl\
+Z43kQ+SOm2KGK2O/sFT2C8WF9CP5lWnT145MX0l+x036c4xa8mbyW9KmXz7SR83ku8kXZJ5DzE/Z\
+/1HmkJX6sRAizyf/flod54y0MWIuw0r9/QxF4+es1K9rB/ls8gcy29iSnEcVZbot6qgjf4ncl9bG\
+FSP9sI82HrlKxkrAl3WsdDGPWZSpSJ3H9cl8O/kFq/TXRXvJPav0Y2X0kUq1rtKPlVLyr0+PGTNT\
+z5sak/OfT96xSj+W6sl7yEtS8x8mp28hD63Sj6Uu8pdWZb/vE9/eyNto38Wp7cu4lhqgzMZV+ntH\
++d9mPVq0sYx8G/m5aX00Z6SPqsn7yaek5pem3P8j/5R8TGp+dsr9P/KPVunvrW0h36nJzT6oJH99\
+VeJ+tu261VnvaUcpM7pZ3wcFRRx7mvVtcBYlPleqa0OI+X813Ia/35y1DY3Mo8qiDW3kCyza0E0+\
+z6INVeQzmof7IXsbBinjs2hD0VFK3WfRhgryNRZt2M78lw634e/NWdvQzDx6mvVjuoP8vWbrfU+I\
+MmfenH1Mxa//yaeTe1KvsRLX1e6c4fO/sUotWa2fRwm5Z7X1POZTpuMW/TzqyTfcYj2PVsq849PP\
+Ywu5+f3vVvMIU2bw1uzXrfHxT161Jma8kpY/n7z/PY5jEvk5afns5P0v8lG3cb2Z2oa8vJHrSzf5\
+57fp5+8lX7dWP38/efda/fyD5IHb9XmYvPUOff1R8pI79fUX8L/z7tTP38n/ZrVY3P+TXPe7Li//\
+q27Rb1d+/lfZIseZ4dybcv+P/y1o0e9Dw/xvPvnU1PzKlPufFtObY6xgfGL6ZzK3uUdSzn8ps7NF\
+f7yvIQ9btLGR/E3y01PzxmQb2sgj5K/mpLchb0vyGnwbZZav09exi7x+nf5e1iD50nX67aSIE67X\
+yS9Ky88bySvIv1ynP8deaJ6wrc9+79PMm8hzyS9Jm3/NyPzbyV3r9X28jXzOev1523zJrzD3bzes\
+SKnjB8nzX8r41uv7sJiZL12vH0uVRyem17WxlvziU+TcdPY3+7CZ/G7y1Wn5TSN5x9GJZdCN1R7y\
+d5l+WeY5T8r2FqHM2Bkx4660OtYmf9fOjKLr9L/TdJDvWac/53GRj1mvzz3kZ6zXz99HXm4xfYDc\
+Y5GHyFst5h8hX2MxvWLlPW+RO8h/ZzF/F3nYavnJhyxyH3lpq347CJAvJi9NzS9LOf6TL2nVXx9F\
+yBvIv5s2/6rk8rOBPtyqPw9ykG9pTWxH2bYhF/lnFu3zkH9p0T4f+T6L9gXIJ96tb1+IvPxuffsi\
+5Mvv1rdPTVJq9d369jnIm+/Wt89FvtmifR7yHov2+chjFu0LkI/aYHH9S27boG9fhHz6Bn37zBu/\
+VRv07XOQ37EhcX8x271FF/lj5DNS8+tSlp+8m/z8tPnPSy4/ef8G/XEqQP6ZRR4iH9ygPx+JWORm\
+n3sln2Te8z7/hmSZc0fu9x9qHnXNa8IO/he9J2a0mmXn3pB+bF6dPDbXHMt/9+qPC43kC+7Vr9M2\
+mV7X593kDffq+7yPfM29+j7fR771Xn2fFk5mzN5rcf/PIjf7tPfYRB7v09O8ln0apWz3fdKn07za\
+Pu2izqI2fZ9uJx/bpu/TvTJ9eWp+bTIfzUV7WZu+T0vJ57Tp+3Q++dI2fZ/Wkze36fu0xSI3+7RI\
+8nifTrnesk+rKNv4I+nTcddr+3SIcrse0Pdpcan5GRN9n1aWJqbX9Wkt+cAD+j5tJs99UN+nHeTT\
+H9T3aQ95pUW+m3zeg/o+H7LIzT5vlTze5/+8zrLPt1H2jHbp879ep+1zLyfMGx/S96mfPPCQ/voo\
+SH7PQ/rrqzD5Ew/p+yRK/uxD+nPeAiZ89CH9tYmT/NWHrK9NaijjfiRmLE5br5ck7/+QP/CIvg1t\
+5C3kVRnXYMvl9+fd5julyKOZ12gfp1z/UKapI/s84tc/5B0d+n1s0QlKvUj+g7RlcCevf8gHOvTP\
+Mi4kj3To72c2kX/YoR8H7eR9Fvk28g86LH7/KbnuOnqQ/NMO/TgpKlPq2uPlWdDZ31xHFeQXHy/X\
+f7PT7zeb62gh+UsdGc/5mevorJTtnzJnMo9fpPVxT3L7J+8nD6TlD47kPeR1J+jbuJv8AvLZqXlz\
+yvZPvoz8D2nz70s+/3si470s415AbiD5+w/yyR365xtqyYs7rH+/4aPMeR36Z0oKyBeSv2Rex/72\
+6vT5PJ1y/KPcHou27CXfvZ+25HOhe8ij+rZ0MI+iR6UtP9C3pYb5bHpU35ZG8o5HrdvSTpmdFm0p\
+Nd/jNtyW39dnbUv8/iflFj9mXZdtGvU9pq+rbar52UOp6+Z67XJXM59pj+u3WfOdcic+bnH/n/zo\
+x7P/Ht48HhWTTyS/x2xHXko7zk4865J7c8r2T9nbLeoaJF9hUVcL+crhuh65yrKuKqdSf7Coq478\
+fU1d8d9/UdcHjyd+d2Q7OaWuFSm//2Een1nUsZ08YlHHQvL+4Tp+vThrHfnmRVJAv/7KyGOPZ/yO\
+K2X6avIJTP+btP3FjpH9RQN5n8X8W8k/COj3yVvIdwf096N2kH8S0PfRgEyvuyeXz0nFRxbTl5GH\
+LfJq8jcD+vtVDeTd5F6Vef8+1zN8f9lvntg8kf38xtwWHdMT76d82FyPh16Zvi22pox/yq19Qt/X\
+g+RrnrA4/p3M+iD/dmp+XnJZKk5OzP+f31yWPw8vSy1lajbq29BMfsFG/XjqIF+6UT+eeshLn9TP\
+fzf55Cf142WIvPxJi/uf5Ynpdc+vmu+YNOu3Wp/m+ycbn9Svz+jJifd/xtfnRYu069N8b+WgxbKa\
+77P88kn9+jTfc6k69evTfP+lOX+r9VlGme2d+jZUk7/VqV+fDeR7OvXrs5W84ymL7Z9801MW2z95\
+91MW279Mr93+uVDrekq//ZaRP/yU9fp2U2bPU/r1HTkl8d7V+Pq+5XLt+m5nPtdssjj/Ja/fpO+r\
+XeRLN+mPB4PkyzdZr+9iLg7mPa2vo5Lc/bS+jbXk5z2tHw/N5Eue1o+HDvKSLv38e8gndllc/5KX\
+dVls/+Szuiy2/4rE9LrxUGm+S7VrP9s/Za7pstj+T028Lzc+Hu68TL/9M5/PLPpiO/mARV/sJf+y\
+Sz8eRnOh9FXXfrZ/yrzzjP55rGry8DP6a8IG8t5n9NekreR7ya9OGw+ekfGwhXz6Zn39O8x3iG/W\
+r+8B8nmb9fdj8mcl3i2sPf6Tn0e+KK19FyeffzHfXb5Zf++igfzWzfp7F63k92/W998W8rOPlt9d\
+j/wu6zsjz1HtIF9G/sfM34f9JuX+B2XmUMf1acuweGQeBadxDeSIGfWZ9zcuTnn+mTIXHBMzbk9r\
+hy95/4P8FfLatPyikToayf9Jvi+znZ8kx2M7ZX4+MWaszmyHN2dkPj2UGV8SM57InM+DKfe/KfPG\
+M/rtQlXSb8/onwdwkH/5jH67c5Hve0b/7LCHfPAZ/X0KH/l/PqMfEwHyb222uP9PXrhZ3/4I+Rmb\
+9e1Tp9N1FvN3kFdbzN9Fvtxi/h7ymyzm7yNfazH/APnzFvMPkW/drL/PFCF/mvyatPlfnvz93xlK\
+/cNim3eQ92+2WP/kH1vk5vuhIxa5+d7ojyz6J3CG+T4bfftC5L+zmH+EfJdFrsz3UVvkDvI+i/a5\
+zky0X9c+D3nYavnJd1pMHzC/ccZi+hD565stnv8iD25OPC+fdmxN+Vy0+W7tAYs6zHduf7JZ/2yo\
++S7usc/qpzff0V30bPY+NO817KONE8nfjd9ruOib9xp+knL/m3m9+az+GBgm305+U9rzS97k53/I\
+j3nO4v73bKUOt8id5Pbnsi+r2d9ucttz1v3dSBnXc/r+bCP3auow+6uEfMlz0l8rF1j2V2S2+b4m\
+fX+pOew/n9f3l4P8uhf0/eEiv+wFi+2f/JIX9OPTR+5+wbq/OinTalFHL/m6F/Sfae8n77GY3ma+\
+m/0F/fhsY/reF6S/j7rQsr/N72upC+r723z/+zVBfX+b79r4+Y/1/R0kf+nH+mUJz018D4Iuj5Jv\
+/bHF82+cnHb+2Hp9mO+oj1jUYb67/iPys1Lz1Snjn3zUVn1/28gLtkp/b/u+ZX+HKBvcqu/vCPnL\
+W/X9rb6j1KHdFsc/8pxui+MfufGi/pzdQz7fYv4+8lnd2fvKXB8B8svJr/rmdclFw8vQS5nObn0f\
+9JM/MDZm/CStjcGRNtrmKTVtXMY6T/k8VQn5Ncx/aVp+9ch5aBX5eUz/w9Tz0EQbzx9uYz1lbqdM\
+Wdp6mDSyHlrI7y2OGaG0Ol5J/v6ffGG3/vMF283vI+jWj+u9sgzuzHE9J+X6h5XwXnH25/Xi9z/M\
+lTQ+8fvgtHPyI5LXBm7KGOP1v9PykndOyN7XZh1+8v4J1n1pfofCOK5zZqb1pXOkL83vVijnGmZH\
+Wh0/T37e5CzzubiYcUPmdcNVyf4qmq/UiVyjnJy5rMcml7WSMotf1F+v1ZL/4EWL+5/kF1nkHeQL\
+XtRfT/aQz7PId5PPeFG/XQyRV1q0v/hstguL9lWST7VafvJjrJaf3GExfQf54RbT95Af9qJ+37Kb\
+PM8iHyL/cqv+fmAxFyWDW/XTV5J/stXi/hf5Xov5N8v0uvnHv3vDYv7md3L8bmvG7/Zyv5v8/Jv5\
+nR0W/Wd+h8ch5nf/pObnpyz/uRynLPrP/M4Ps390+yTzu0CKXtTfjzG/I2Tyi/rzwI5zE+NfV38P\
++fwXLZaffLXV8pM3Wy1/Ncdqq+WvTmz/uuWrlel1y9dM3mkx/w7yB8gb06a/Nvn7D/JPLJZvN/le\
+q+Un32O1/N813y1qsfzk4Rct1j951Gr9k8es1j/5VItzhx5yR7e+f3aTN1qcuwyRL7XIi83vgOnW\
+908leb3FMbmWvKXbYvnJH+i2WH7yt6yWn3ybRft3k79s0f4h8uct5l98PudfmedeuZcmj3/kleMS\
+76FLHocLR47DteS/1PRP/POv5EcVy7tdUo/D/0y5/qdMb7f+M4kh8u3dGe/bYh43yjqIkH9qcV6k\
+6Pw/kC/55vnlpcPLUUKZJcX652yqzO+eLNY/C1RHvrhYnoFPXc7ZKc8/UuZuyjjS+vLbOSPv2zHz\
+8fKem9R5fJ1y/9ts5wR9OwfMdk6QZ6Fnp3/e2qwj/3uJ6a3aaX5v0TiLMecmP8piTHnJD7KY3k/+\
+LYs8SH6ARR4mH2WRR8ltFu0ruIBzAot9ppN8n8U+0X1BYp+qu1/mvSCxT9RN7yf/2KL+IHnEYvow\
++Qfk81Lzm1Pe/0Q+aH7/n3ndc+130q8F3kr5/f/3E9dUab+rWZWcT9cFie0uPp+T9PMxv2eq8SX9\
+57LN75+69SWL+3/ky16yuP9HfoPF9BHyupeyP8doLoeX/LGXZDlWVGmXo7RGqXNe1i/HfPKLXta3\
+o5787Jf1y9FCfpbF9F3ks8jvSFuOm0eWw/x+rsDLshw/nZt1OcxtPEq533AtfG5uxnXN6bkj+/XC\
+C1neV2LG1rS6nkn+/of81VcsPv9H/tor+vc6NF5ovms8+zsL4p//I29mX3hRZhvPTrZxG2X++IrF\
+5//If2WRD5L/3CIv4qTyJYu8grzLIl+4wHyvuj5vIm99Rf97i3byW1+x+P0/+S2v6M8tdpHfbbX8\
+Mr2u/qKLWE8W9VeQL7WYfiH5VRbTN11kfhZVf8xsJ/8v8rWZ19/Lk9ffPZQ5hjqeShtHHcnzP/JZ\
+Fse7IfJzJ1jX4Vio1BUWy+Ei97yiv9fnIb/TYnof+e2v6O+nB8jLjtYfk80yvZSpOdr6uL2XMpWv\
+6M8FR7OD/OHR2T9HZdZRSt5CflRqLu+WGH6vcTVlnj/I0L//lryTXPdZrNYfJL6DTfe70i3k3eTZ\
+nquPP49B/hW5uS5svzwjbZ3eJOeDUcpMyDeyPpMSv/9rfp8e+ZLM+2Qpn+0tp0xLvr6dNfvJG/eT\
+t+0n75Zc947KPvKPLabfZ5Gb74xaS17KMfF1871qt52esi7vydtgu9veOuq2A/K6kvviqh8qtZX5\
+ZTs2lkl7HmDsXWS+9+1izfxmJ9892cb8Xn818W7JbO+V7Caf/JpcN81Of392ibRnwWtS35jT09/j\
+Ni9Zz5D5XYmvy/Pxw2Wakuc4reRd5C7zMy2jT89854Jz+LMvZntCP4sZl5vlPq/MLPe94XczNNQy\
+PkOci6Sd48df3RCvz2xP+Zsxo82cT8835rN2eD7dzCfw85ixL20+n45cK/SRN/4iZnyY+V7BXyT3\
+a4O15vsc9WOk6BJ9Hj//Y/o9b8WMHrOPJ1am1/Nsso/N739c+Y6cC6Tsm66VZTG/F9KvyePP/5Nv\
+ekc+g/T+aVnvO8fPfyi38d2Y8aI5Zn92Wua7JwO5Mj+zPVN3xoyzzXLdp2X28cxcaVfRpZzLh2PG\
+1Wl97Bm5tq0gf/hXMWMgbYz+eWRftJB88Qcx44TMY8v4nJF3Nw7QliW/jhnmewxt81La4k7ZLg4/\
+OPn8E/O8JpL9WQhz2SrJl5C/Z/bVpIy++lmyr+ood/23DONfZrmC09LX3UByjBRfxrbEGNDe/yGf\
+YTGGai1ysx0DlybyF839dces9P3tU8l9ciHzeZNy8fdD3TrrG++Hir9vhjJ7KLM9c7/9asr1L2XW\
+WewX8z36PP4+Gpk+/q7Bf83M+rkpN/N4lDK6e/Je8laL3O8x3wtqpL+LluVokHEZJH+APNt7sMw+\
+dZE/T/6uuW4vm5k+Bn6asv1T7nuH6NtRdDnz0uTx7Y3cST429f3Ayc8Fjhp+Z62HchMP0/e5T3Ld\
++VGA3GGRh8gnWMw/YpHHr/8kXxl//roifeyknCu2U857mIzB0yqyvqOs2vyOV8ro3jHWQB4i193v\
+ayVf9ZG8l292lvffm98Ze5ihvd+4gzxKrntf3QD5jDGG9pw9f5FSJ5DrrinKyGeSa5//JHeR695F\
+17DIfPehob1ubCVfTq57p8oWcp9FvoN8nUU+QH6/Rfvz69ink+uuW8vIg+S69yZWk+/ZrV9/DeT/\
+2C33hmZ/s39byZvHZD+Pir//qS6xfL/I3Me9knL/hzInHK4fI1HyanLd/dQCBo/7cP0YcZLPO1zf\
+x26ZPts74MxnGyLm9xSTH23un8xPTmc825B3cHIf1cG8qgv1be0x6yrM3hZzmmryi8nN9w7aesrT\
++2xpyvMvXFBsLdTvC0vIN1rkVeT3Fer3QXWSZ7snGP99NO3sII+/T7OkPOszPF3M451C/XrZvth8\
+F6T+uLGX/HeF2cd2/Plv83uVybszx9amlPFPGd8R+vOBavKlR+j3Hw0yva4fW8m9mtxsY7H5ndDk\
+8XfKqZOzvlMuTJnNR+ivMaPkPUfojycF9Uq9apE7ybeRZ/scTXz8kweP0F8De8k3keveh+Mn/xW5\
+7n0mQfKYRfvC5ENH6Mdi1CKPX/9encg3fvP3IfcNX6d0Mo+VRxpG1NyGbzkp8xw6MnydUsu85hQZ\
+Wd+tEv/9j/kd3OR/zBxzv0o5/lPGdZSR9R0LZluc5DXk88zz+W+flH6+U5G8Rt17deL7wHVjd/Q1\
+bKfj9Ou1lLx2nH6/N598Mbnu8+b15LeM06/XFvIt4wztuzO7yLvJde8j204+QL4wLT9/5Jx/IXlJ\
+sWE8aW47hzvT+/tHKeP/Wvq8OPs5TPz9B+Q7ig3L54hqKDNYrD/PaSQvHZ99PxG//0s+Y7x1Hdso\
+c8V4/bF6F3nTeH1/DZIHyXXPnRc1sL8cr99XVZC/Y5EvJH91vH47bJJcd0wYTd47PrHt2G6bmvXd\
+RD2UyZ1gZP2+KnMeu8mjzOP1zH4Mpjz/ys503QT9duEgb56g36e7ZPps53RmGzzkU/rkvmLqvcm5\
+Kd//RRl3n3wmZeR+zjXJ7/+6znyfnb6NvdeZ93n122Y/eRW57jkc2xLOach173wsIZ9+tP68vor8\
+UvJs75yM//6X/Etyq3cqtlCm2aEfL12SZ/ucSPz6l3zVr637eYAynb/O3s/x3/8S/NNiHvHtnzLF\
+rKuJmfc1ClPef0KZXEf2bS/++R/ymeS6d2PEr7cocw1lVEY9uZ+nnP9RZt4x+nGxm7yCfCitHf9M\
+3v8jL5yYfT8Vv/9HXjUxcb/ZlndCejtSrluqvEqtmajfF9WRt5Pfk1bPHSPtWEs+epKh/QxQJ/lY\
+ct3n1nrJnZP05xz95JMnGdrvtbPdQD9MMrS/gyghH0N+e+b6Svks53zKNE4ytO+TqSdfP0nfRy03\
+mO96M7S/N+8i3zxJf960nfw3k/RjYS/5Ly3y0UvZH08ytO/sKCUPklu9R6OaMh9TRvv5R/IPJ+n3\
+Q63kuybp97VbyPdYLMMOmV77+Wfyd8izvdsofv27TKm/WozDMvKvJumP69Xkx5foz2EayKeXWPz+\
+h3xuiX4MbCE/r0R/zN5B3lRisfzk15TozzuaZXrz+tt29JSs358VoMyaEjn3Ne8kZDn3je+PKXfO\
+ZMOoM+f1dUq53B8mn/9r5Ng5Wd/fHeQdk/XjqYfcP1l/P2U3+X0W+RD5/ZMN7bNRxTcqdftkw/LZ\
+KBdl3p+sX2ce8v9jUYeP/N391NFJmSOm6PcdveTHT9G3oZ+8fIp+/2lbzrqaoj93LyFfNCX7uXX8\
++X/yR6ZY7x/rl5vvm9PvH1vIDy/VL2MXeWmpfhm3k296T//s117ytvfkuzlnf/O6b/QKpT6fYli+\
+r6qMMtcyj21p/fBCcvsnz9sZM/xp+Z3J+3/k/VP0166t5B9PMbTv09tC/qXFetxBnk8f6d6nN7DC\
+fGefof3cTTP5PPL475rOnWT5vrsuyp5xnJF4392Zk7Tvu/M0KbXxeP0y+8gD5A+ntfne5Odfycee\
+oN+nhcjzTzC076uLkB9P/sfM87VfJdtou4njSpmhfV9dCXnZiRb3v8gf2aEfe3Xk63ZkH3vx8x/y\
+23fox1Un+fj39OOql/xui7HfT978nr5+20qlVpC/kDb/TSPbdwn5qJ3Wn0mZv9J8Z5x+X1tPPrZM\
+vx9sIc8v01/zxvfHK833zhnGjWabP3WktLUhef+LMuvK9M83RMk3k1t9vq1wlVJ/KTO0z7qVk39O\
+fnFaf30vef6/KjFetM9/kc850dB+B24bedOJ+n1dN/maE/XHzT7yNnLdZ9L2kf/hRP15VmGzUp9a\
+tL+cXE3VH5dryPdp2m/uO/qpP0Yef5/a+Udr36fWwXxap+r3HT3k66Ya2mePdpNvnZpxz4k6bpH7\
+c0PN5vvhsv8+JH79Q76HPP5M4UsTtM8UdlPuvmmJMWd7ZELWd73U36zU89P0fdZC/sQ0/bJ2kQem\
+6X93s5180zT99reX/GmLfPRq6pimX+el5D8ln5Oa35Ry/UP+R4vlqyf/YJp+P95C3mtRfxf5/5mm\
+v8bbTv7+NP259V7yiEX/jr5FqY+m6be5UvK90/Tb3HzyryzyevJ8p/4eSgt5hVO/zXaR3+rUb7Pb\
+ye9x6vtvL3mnU79+RvuUunl7zPhO2r0RV/L5N/KN5L/OvDfydsr1H2VqqEP3bpUG8pPejhkVmcfi\
+45PHYr/59VfvyGdaRtpxffL+P7nHqR9HYfILnPr1HCV3Ow3tO5kKblXKS657J5OTfPJJ+nHiJnee\
+pD/OecknkuvemRT//k/KLDkpcU5kO3+s9p1IPZSLnKRf1t3kH1m0dYh8L7nunUjFa8x3BhradyKZ\
+ZVyU6ZluGFdkrtOa5Htq6ijz1ckZx0tzWVLuL7RQxlluWL7Tdwtlhsr11xA7yA8/xdC+s3eA/BKL\
+MZ5/G8dVizEev/93W2IMX5S5vGen3P+jTJ1mDMfv/5H3lltf87VT5hCWRffZrm3kV5yiX/e7yD0W\
++SD5pafo95dFa5W6/pTs+5P4+T/TryWfa57///zb6X1xSsr5P/MJzNDvd3zk98+weP6F/L4Z+mN8\
+iPwnM/TLESF/Z4ahf/8PF607Z1jc/ycPkeueG3bdbr6LTt9+D/nLFrmPvNui/gD5Jos8dLv5rjxD\
++06uCPnuGfprG3UH+6NT9evHQX7kqfrzDtcd5nvy9Pf0POQTTrVYfpledw+6gLya/Cfx3wMdkb5v\
+eDbl+Ee5ul8m3tGbnM+W5O8/yf/rl/p3HJhfAfwY9ejecVBKXrQ943cDiW129vA2W02Z2ZQpTfs9\
+ytEjv0dpID+bfUdPWh0vJp9/Im89Vf/syhbyLafqnwfZQR48Vf+MhPkV0U+dqj825bco9eCp1r93\
+dFKmlzJnpy1Dch/qJj/m7Yx3KJjzSKmnkTJuynyZWc/elM9/tOjbGt//kbdbjKtd5A+cqr/XUU8e\
+II+/Y+Sswy3fMVJyF+O8wtC+Q6SK/KGZ+rbWka+fqW/rWvJ15LrPcXSSF8zSb4O95EfO0p8b9pOX\
+zLK4/7eOfdR2/bZTQn7u2/p3VlSRr3t7P+//oMwbb+u3jRbyt9/Jvm3EP/9JfuW71uNqB2XaKHN0\
+5rH5sOTxKEqZ82bqz5ML1rO+Zuqv/Z3kN8zUb0Nu8kUzrbehRsrcM1N/LdNGfvtM/e+rusmXkY9N\
+zVPuX/SRL5mZ/ZgVf96KfPF+2ljUynHXYkxXkK+dqT8uLiRvtpi+qTXRRt31aDv59TMTz5umtnGl\
+7Au3kf+S8ZKbuq5z/2tkPe8iXzHT0H72epD8LsbKrszxtDPl8993s65m6ve3leRN5LrPXteSP2Ix\
+VprJ755pfR4YoMxvLfoxRP7Qu/p7fxHylnfl/Yuzs5z/bEjkZ2T0Q6Msg4P8mpn6Y5JrQ2Lfpdv3\
+eMjbLdrvk+l1170B8j6r5Sd/a2b284f4/V/yL8mt3p9ku0epNxlLR6XtmwpGPk9SQv7au/Ju2NSx\
+8reU6/97Evd4deuhnrxpR/b1EL/+kdzqM2xbKHMvy7I2bVlXJd9/Sv7FfsZTlDJnztKPyQI/1zez\
+rOdRTplmykxLLbM4OY8a8v+kv07N/Pzqccnn0Zooc9Us/bVpO/kNs/T7h23kS2dZPP9Efucs/bPY\
+g+SvztIfk4vupY5ZFvs/8s3k2T4fHt//ke+0mH/Tveb7avX7z3byXov6t5G/TN6Stny3jIyFXWb7\
+GE9nZa6Dmcl1MESZryzqKL5Pqed36sdsJflz5E2Zx9trUq7/KNNFHd9JrSPlO1h85O/NStzTz3Y/\
+P0A+8TT9OW2I/Nun6fs5Qr7mff0yqPuVuvV968/AllDm43DG98hQZoXsA6vIf2zRj3XkT5LflLaM\
+3uTzL+RDFtN3kn9Gvixt+uTzYb3ks0/TP7/ST14Xtt63jG7jHDWs/x7BUvJtYf3nXw0j59Af2KM5\
+6kb773PUXbn2+D8dbH51dPVxK5Q/x/yHR47NGfsDrlR/nmO/LTdnwPy3B3IPDOSqrWb5HJWc10Gv\
+5NifH6XWH5CYj/lf6ew7KfGbHPvjdvVg7h38fXOe/XW7Gshbw9+/ttn/YFc/sc+Nl590od04QF1j\
+f+8AdWvO3Xn8/RGbfc8B6l+2J3L5oX10YrYFl+DXOR/kfXSA+k+pavzyJo4GuW/lfnCwGhz1Hzlv\
+H6z+eJCdHz49OFHgpO9irX3Axqz525M5M35jV5/n2H9qV0au/Sm7as8be7dd+Wzm31vsSxITnUPR\
+BfZPbaqJvzycM+Nzu/rPHPtdduXPs79rNxflZbsK5dmfsKu19nty4hMVzaXs+fav8tQN/OX+nAvb\
+bep+2+T/bhbLkczekUuP7T/7n/yXsWazFDLX9/icI04lDuXY383J+SLnQP753uSqjufXmoMgZ/Yv\
+cnP+mHvg33LV1xn5/6en/2+P9wPr7etzVKf05X//p/T/HjkiJ3+G/fScRfZ6tTJZw//av7NdtuSY\
+o/Npqf5/9OOBbvvmHLMv/oc/xTdoRurOPEUX7slTP821f52nNuTZ/TbVm2d/yqYesCeKltybY/+r\
+TX2SYzds6rVce5tdtebZn7Gr9/J+lMO+4oVRiXKzTsP7cuzrSXLsT49Sf8y1PzZKfZlrv2OUujvP\
+/ll8i/zQrt7Is79hV7/Ps2+xq6ftTyS2y0OmMPVs+/256k8530v8y3T+pcrenasu25eT+i9/5V+e\
+zo3/y2EDuc6/jVL/sC/8fJTaIHubwgq81P6F2UsnD+SoDbLjPOpEnGP/tU1dxV8eyrk173Ob+rvt\
+lHg41qy/0r7Gpj7OoZ/Ua+w2bOq3eXXx9Li2UV+PYr80xn77UerHh9ufPEp9frj9L0epzkL7e0ep\
+P3972raj1GNHrUg0ao79H7nqsZx3cu7JU+vyJiV2i7ty85TamGd/J0/tyUs06FvL7CvN3YVK276P\
+zRl3bid/fSPXvj4v53e5HCmezLN35alX81IGOKVHn2e/UC355pgt/A7/ttj+6xzVnWP/Rw4reJLK\
+unvJL+Ufauw/VI1pTaANx+QcOZt/W5uzIefxvJxf5B34fp76U17a9mWWWWfOKJw7qT0vrzfvsidt\
+6iVboszNI9vymBP4lwvsl+SsOvD2HPVgTsY2Gl+OWfbZ6uLhJvx36o6XS9uPfMXo/J/tR+Lz+L+7\
+L8nYlrTb/H9z/o8cZR7oV+Q8kGN/JEc9l5O+nlM3+X//+feff//5959///n3n3//+feff//5f/Gf\
+6J15ccsjCet22OIG5d+Hz/Ee/EtO2s+bMn7ulp/zR+acmP5g+alrRuLM8Cj5uWX8qLjj5OcicawY\
+kLxYfh6+3/SFfIwvmpv4efh809+ZcJT8XHF8wgPl51l7Eu07KKO+vOHmOhJTymyV68qEhfLzAeK3\
+xe0P5qb9e/hHuWntHJSO+VZGfTF5TE5JeUN+Hm5HVH5+Z10i/y/5+f9v59Vd40dl/Xen9IRLdIse\
+0Sv6RL8YEINiSAyLETE63NM5CQtEh+gUXaJb9Ihe0Sf6xYAYFENiWIyIUVHlSv2iQ3SKLtEtekSv\
+6BP9YkAMiiExLEbEqKjypH7RITpFl+gWPaJX9Il+MSAGxZAYFiNiVFQ2qV90iE7RJbpFj+gVfaJf\
+DIhBMSSGxYgYFZVd6hcdolN0iW7RI3pFn+gXA2JQDIlhMSJGRTVK6hcdolN0iW7RI3pFn+gXA2JQ\
+DIlhMSJGRXWA1C86RKfoEt2iR/SKPtEvBsSgGBLDYkSMimq01C86RKfoEt2iR/SKPtEvBsSgGBLD\
+YkSMiupbUr/oEJ2iS3SLHtEr+kS/GBCDYkgMixExKqoDpX7RITpFl+gWPaJX9Il+MSAGxZAYFiNi\
+VFQHSf2iQ3SKLtEtekSv6BP9YkAMiiExLEbEqKjypX7RITpFl+gWPaJX9Il+MSAGxZAYFiNiVFQH\
+S/2iQ3SKLtEtekSv6BP9YkAMiiExLEbEqKgOkfpFh+gUXaJb9Ihe0Sf6xYAYFENiWIyIUVEdKvWL\
+DtEpukS36BG9ok/0iwExKIbEsBgRoyIHngSiQ3SKLtEtekSv6BP9YkAMiiExLEbEqKgOk/pFh+gU\
+XaJb9Ihe0Sf6xYAYFENiWIyIUVGNkfpFh+gUXaJb9Ihe0Sf6xYAYFENiWIyIUVEdLvWLDtEpukS3\
+6BG9ok/0iwExKIbEsBgRo6IqlPpFh+gUXaJb9Ihe0Sf6xYAYFENiWIyIUVEdIfWLDtEpukS36BG9\
+ok/0iwExKIbEsBgRo6I6UuoXHaJTdIlu0SN6RZ/oFwNiUAyJYTEiRkX1balfdIhO0SW6RY/oFX2i\
+XwyIQTEkhsWIGBVVkdQvOkSn6BLdokf0ij7RLwbEoBgSw2JEjIrqKKlfdIhO0SW6RY/oFX2iXwyI\
+QTEkhsWIGBXVWKlfdIhO0SW6RY/oFX2iXwyIQTEkhsWIGBXVOKlfdIhO0SW6RY/oFX2iXwyIQTEk\
+hsWIGBVVsdQvOkSn6BLdokf0ij7RLwbEoBgSw2JEjIpqvNQvOkSn6BLdokf0ij7RLwbEoBgSw2JE\
+jIpqgtQvOkSn6BLdokf0ij7RLwbEoBgSw2JEjIrqaKlfdIhO0SW6RY/oFX2iXwyIQTEkhsWIGBW5\
+4EzULzpEp+gS3aJH9Io+0S8GxKAYEsNiRIyK6hipX3SITtElukWP6BV9ol8MiEExJIbFiBgV1USp\
+X3SITtElukWP6BV9ol8MiEExJIbFiBgV1SSpX3SITtElukWP6BV9ol8MiEExJIbFiBgVVYnULzpE\
+p+gS3aJH9Io+0S8GxKAYEsNiRIyK6lipX3SITtElukWP6BV9ol8MiEExJIbFiBgV1WSpX3SITtEl\
+ukWP6BV9ol8MiEExJIbFiBgV1RSpX3SITtElukWP6BV9ol8MiEExJIbFiBgVVanULzpEp+gS3aJH\
+9Io+0S8GxKAYEsNiRIyK6jipX3SITtElukWP6BV9ol8MiEExJIbFiBgV1fFSv+gQnaJLdIse0Sv6\
+RL8YEINiSAyLETEqqhOkftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVGVSv+gQnaJLdIse0Sv6RL8Y\
+EINiSAyLETEqqhOlftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVFOlftEhOkWX6BY9olf0iX4xIAbF\
+kBgWI2JUVNOkftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVE6pX3SITtElukWP6BV9ol8MiEExJIbF\
+iBgV1UlSv+gQnaJLdIse0Sv6RL8YEINiSAyLETEqqulSv+gQnaJLdIse0Sv6RL8YEINiSAyLETEq\
+qpOlftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVOVSv+gQnaJLdIse0Sv6RL8YEINiSAyLETEqqlOk\
+ftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVDOkftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVKdK/aJD\
+dIou0S16RK/oE/1iQAyKITEsRsSoqCqkftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVDOlftEhOkWX\
+6BY9olf0iX4xIAbFkBgWI2JUVLOkftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVKdJ/aJDdIou0S16\
+RK/oE/1iQAyKITEsRsSoqCqlftEhOkWX6BY9olf0iX4xIAbFkBgWI2JUVKdL/aJDdIou0S16RK/o\
+E/1iQAyKITEsRsSoqM6Q+kWH6BRdolv0iF7RJ/rFgBgUQ2JYjIhRUZ0p9YsO0Sm6RLfoEb2iT/SL\
+ATEohsSwGBGjonJJ/aJDdIou0S16RK/oE/1iQAyKITEsRsSoqGZL/aJDdIou0S16RK/oE/1iQAyK\
+ITEsRsSoqOZI/aJDdIou0S16RK/oE/1iQAyKITEsRsSoqOZK/aJDdIou0S16RK/oE/1iYG5e2nMc\
+kdmjLJ//MORPTsbfh//bX37W3LmzHKUXXnHjksYbHTOnlk91nnjSjfGfTlo93TnVWT71pOMS/86p\
+9rL6ZY1LGy+/Qk1dcn3jlVOvWnLjVO/S671XLm28KeWfrrjx6oa6E6+uU/Gf6i9fVq+m1t20ZNlN\
+1yVsXJpIll+5dNnV1y9J++EysqVXNlxuFpS/eRsa1dSrl1zN//nr1Kuul78su3KRmtp4ZRM/Liam\
+9PV1lzderqZeWX/Z4qWXX3flZfV1S5M/Uc2iRZdd2bToSm/jZSxDw5WJuV52+dKll9+UmMfw36n8\
+8uuuZvZUlqg/Mecrli1TUxddf911Vy5p/F96fucgefZp+Hmprtx0HRnlR2f8PCFj+u256ZZklLdl\
+/Gy+9+dLw7h+ePrh58GGnT8lfbrM+k+TZcjNeF5s2IUrk8+X5aRMP/wc11x5Zis34/mzYYefNxv+\
+k5NR/7ny7Nfw9MPPew07/cD09udmuFCeJRv+efh5smHDKtn+vCzLf5XMOzfj+bVhh59fy+y/4eW/\
+QbI5Gc/DDTv8/JxNpsmcfpX0SXIvkZfmuP2s/+UZ0ztkumH9c9PLF2R4a8b0Qdl/DVugrKdflzF9\
+SKYLjewfrae/P2N6lzxvOexVL+RknX74z0MZ0w8/Xznswfvpv8dl+pHx47Kn2ZWnLOt/OmP6rrn2\
+NPsmWdf/Usb0vqvsac5vs95//Cxj+u1f29M8fLR1/b8yH8FIGXXDz6O2HDwqbZxm1j/sH8xHKFKm\
+H35eNSDTj97P9H+TdTc8/fDzkF0yfSQnuf2mTje8Hm6X5R9p/9HS/kMTNu2n/s8zph9+/lUVJNx1\
+jPX0X2dMP3y8j5yU0JNRf+bxICcnMa/h6V1zRsl9j+z9l7n/HJWT+Ddnxr8PT3+CZvpU87Ic166V\
+6Q/Nsa7//wLghJGJ'''
 
     @classmethod
-    def package(cls, *paths):
+    def package(cls, *paths, use_zstd=False):
         """Creates a resource string to be copied into the class."""
-        cls.__generate_data(paths, {})
+        cls.__generate_data(paths, {}, use_zstd)
 
     @classmethod
-    def add(cls, *paths):
+    def add(cls, *paths, use_zstd=False):
         """Include paths in the pre-generated DATA block up above."""
         cls.__preload()
-        cls.__generate_data(paths, cls.__CACHE.copy())
+        cls.__generate_data(paths, cls.__CACHE.copy(), use_zstd)
 
     @classmethod
-    def __generate_data(cls, paths, buffer):
+    def __generate_data(cls, paths, buffer, use_zstd):
         """Load paths into buffer and output DATA code for the class."""
-        for path in map(pathlib.Path, paths):
-            if not path.is_file():
-                raise ValueError('{!r} is not a file'.format(path))
-            key = path.name
+        for path in paths:
+            # One open and fstat both check that path is a file and give the size to read it in one call
+            try:
+                descriptor = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                raise ValueError('{!r} is not a file'.format(path)) from None
+            try:
+                status = os.fstat(descriptor)
+                if not stat.S_ISREG(status.st_mode):
+                    raise ValueError('{!r} is not a file'.format(path))
+                data = os.read(descriptor, status.st_size)
+            finally:
+                os.close(descriptor)
+            key = os.path.basename(path)
             if key in buffer:
                 raise KeyError('{!r} has already been included'.format(key))
-            with path.open('rb') as file:
-                buffer[key] = file.read()
-        pickled = pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL)
-        optimized = pickletools.optimize(pickled)
-        compressed = zlib.compress(optimized, zlib.Z_BEST_COMPRESSION)
-        encoded = base64.b85encode(compressed)
-        cls.__print("    DATA = b'''")
-        for offset in range(0, len(encoded), cls.WIDTH):
-            cls.__print("\\\n" + encoded[
-                slice(offset, offset + cls.WIDTH)].decode('ascii'))
-        cls.__print("'''")
+            buffer[key] = data
+        framed = bytearray()
+        for key, value in buffer.items():
+            name = key.encode('utf-8')
+            framed += cls.HEADER.pack(len(name), len(value))
+            framed += name
+            framed += value
+        # zlib is the default since DATA compressed with zstd can only be loaded where zstandard is installed
+        if use_zstd:
+            if zstandard is None:
+                raise ImportError('zstandard is needed to package with use_zstd=True')
+            compressed = zstandard.ZstdCompressor(level=22).compress(framed)
+        else:
+            compressed = zlib.compress(framed, zlib.Z_BEST_COMPRESSION)
+        # Base64 lines of WIDTH = 76 characters hold exactly 57 bytes so every line decodes as whole groups
+        encoded = base64.b64encode(compressed)
+        # The whole block is built first so it is written out in one go rather than opening the file for every line
+        text = encoded.decode('ascii')
+        lines = ("\\\n" + text[offset:offset + cls.WIDTH] for offset in range(0, len(text), cls.WIDTH))
+        header = "    SIZE = {}\n    CRC = {:#010x}\n".format(len(framed), zlib.crc32(framed))
+        requirement = "    # Packaged with use_zstd=True so zstandard has to be installed to load DATA\n" if use_zstd else ""
+        cls.__print(header + requirement + "    DATA = b'''" + "".join(lines) + "'''")
 
     @staticmethod
     def __print(line):
@@ -2753,20 +2442,149 @@ N$H#gz)r_6<!G=u+qbWi*9w-U~OYCb%-!haqw++W-ewr}Fs($1f^fS)%nC?7vje$ImX2LxO@{~(L\
         cls.__preload()
         if name not in cls.__CACHE:
             raise KeyError('{!r} cannot be found'.format(name))
-        path = pathlib.Path(name)
-        with path.open('wb') as file:
-            file.write(cls.__CACHE[name])
+        path = name
+        cls.__write(path, cls.__CACHE[name])
         yield path
         if delete:
-            path.unlink()
+            os.unlink(path)
+
+    @classmethod
+    def __write(cls, path, data):
+        """Writes a resource to disk with a preallocated size and no buffering layer."""
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(descriptor, 0, len(data))
+                except OSError:
+                    pass  # Not every filesystem supports preallocation and the write below works without it
+            cls.__write_all(descriptor, data)
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def __write_all(descriptor, data):
+        """Writes all of data to a file descriptor without a Python file object in between."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view):]
 
     @classmethod
     def __preload(cls):
         """Warm up the cache if it does not exist in a ready state yet."""
         if cls.__CACHE is None:
-            decoded = base64.b85decode(cls.DATA)
-            decompressed = zlib.decompress(decoded)
-            cls.__CACHE = pickle.loads(decompressed)
+            path = cls.__cache_path()
+            try:
+                with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    cls.__verify(mapped)
+                    cls.__CACHE = cls.__unpack(mapped)
+                return
+            except Exception:
+                # A missing, unreadable or corrupt sidecar just means decoding DATA again and rewriting it
+                pass
+            decompressed = cls.__decompress()
+            cls.__verify(decompressed)
+            cls.__CACHE = cls.__unpack(decompressed)
+            cls.__save(path, decompressed)
+
+    @classmethod
+    def __verify(cls, framed):
+        """Checks the framed resources against the CRC they were packaged with."""
+        if zlib.crc32(framed) != cls.CRC:
+            raise ValueError('resources do not match their CRC')
+
+    @classmethod
+    def __unpack(cls, framed):
+        """Splits the framed resources back into a dictionary of names to contents."""
+        resources = {}
+        offset = 0
+        while offset < len(framed):
+            name_size, data_size = cls.HEADER.unpack_from(framed, offset)
+            offset += cls.HEADER.size
+            name = bytes(framed[offset:offset + name_size]).decode('utf-8')
+            offset += name_size
+            resources[name] = bytes(framed[offset:offset + data_size])
+            offset += data_size
+        return resources
+
+    @classmethod
+    def __cache_path(cls):
+        """Names the sidecar file holding the decompressed DATA after the first run."""
+        digest = hashlib.blake2b(cls.DATA, digest_size=16).hexdigest()
+        return os.path.join(os.path.expanduser('~'), '.cache', 'checkers', 'concat_linux-{}.bin'.format(digest))
+
+    @classmethod
+    def __save(cls, path, data):
+        """Atomically writes the sidecar file, ignoring failures since it is only an optimisation."""
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory)
+            try:
+                try:
+                    cls.__write_all(handle, data)
+                finally:
+                    os.close(handle)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            pass
+
+    @classmethod
+    def __decompress(cls):
+        """Decodes and decompresses DATA back into the framed resources."""
+        # Each decoded chunk goes straight into the decompressor so the compressed bytes are never all in memory at once
+        # and the output is written into a buffer of the known SIZE so it is never reallocated
+        decompressed = memoryview(bytearray(cls.SIZE))
+        position = 0
+        decompressor = None
+        # DATA is already a bytes literal so slicing a view of it hands each chunk to the decoder without copying it
+        data = memoryview(cls.DATA)
+        slices = [data[offset:offset + cls.CHUNK] for offset in range(0, len(data), cls.CHUNK)]
+        with cls.__decoder() as decode:
+            for chunk in decode(slices):
+                if decompressor is None:
+                    decompressor = cls.__decompressor(chunk)
+                piece = decompressor.decompress(chunk)
+                decompressed[position:position + len(piece)] = piece
+                position += len(piece)
+        piece = decompressor.flush()
+        decompressed[position:position + len(piece)] = piece
+        position += len(piece)
+        return decompressed[:position]
+
+    @classmethod
+    def __decompressor(cls, head):
+        """Picks the decompressor for the format DATA was compressed with."""
+        if head.startswith(cls.ZSTD_MAGIC):
+            if zstandard is None:
+                raise ImportError('this resource was packaged with use_zstd=True so zstandard is needed to load it')
+            return zstandard.ZstdDecompressor().decompressobj()
+        return zlib.decompressobj()
+
+    @classmethod
+    @contextlib.contextmanager
+    def __decoder(cls):
+        """Provides a map over DATA chunks that decodes them, in parallel when that helps."""
+        if pybase64 is None:
+            # The standard library decoder holds the GIL so extra threads would only add overhead
+            yield lambda slices: map(cls.__decode, slices)
+            return
+        # pybase64 releases the GIL while decoding so later chunks are decoded on other cores while earlier ones decompress
+        with concurrent.futures.ThreadPoolExecutor(min(os.cpu_count() or 1, 8)) as pool:
+            yield lambda slices: pool.map(cls.__decode, slices)
+
+    @staticmethod
+    def __decode(data):
+        """Turns the DATA text back into the compressed bytes."""
+        if pybase64 is not None:
+            return pybase64.b64decode(data, validate=True)
+        if sys.version_info >= (3, 11):
+            # Strict mode validates in the same C loop that decodes rather than matching a regular expression first
+            return binascii.a2b_base64(data, strict_mode=True)
+        return base64.b64decode(data, validate=True)
 
     def __init__(self):
         """Creates an error explaining class was used improperly."""
@@ -2775,7 +2593,19 @@ N$H#gz)r_6<!G=u+qbWi*9w-U~OYCb%-!haqw++W-ewr}Fs($1f^fS)%nC?7vje$ImX2LxO@{~(L\
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
+# The loaded library is kept for the life of the process so it is only extracted and opened once
+_LIB = None
+_LIB_LOCK = threading.Lock()
+
 def with_lib():
+    global _LIB
+    if _LIB is None:
+        with _LIB_LOCK:
+            if _LIB is None:
+                _LIB = _load_lib()
+    return _LIB
+
+def _load_lib():
     with Resource.load("libcheckers.so", delete=True) as lib_file:
         lib = ctypes.CDLL(os.path.join(dir_path, lib_file))
         lib.B_getOptimalContinuationFromString.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
@@ -2799,18 +2629,6 @@ def getBoardOptimalContinuation(board: SparseBoard, maxDepth: int, maxTime: floa
     out_boards = [SparseBoard.read_from_string(board_string) for board_string in out_string]
     return out_boards
 
-if __name__ == "__main__":
-    import time
-    file = "./test_boards/d11_normal_1.txt"
-    start_time = time.time()
-    
-    board = SparseBoard.read_from_file(file)
-    print(board)
-    print(f"Optimal continuation: {getBoardOptimalContinuation(board, 15, 40)}")
-
-    print(f"Time taken: {time.time() - start_time}")
-    
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -1,50 +1,97 @@
 import ctypes
 from board import SparseBoard
 import os
+import threading
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
+# The loaded library is kept for the life of the process so it is only extracted and opened once
+_LIB = None
+_LIB_LOCK = threading.Lock()
+
 def with_lib():
+    # Returns the shared ctypes.CDLL, loading it on the first call
+    global _LIB
+    if _LIB is None:
+        with _LIB_LOCK:
+            if _LIB is None:
+                _LIB = _load_lib()
+    return _LIB
+
+def _load_lib():
     # Returns a ctypes.CDLL containing the library
-    # This file has the shared library embedded in it in base64 format
+    # Setting CHECKERS_LIBRARY to the path of a library (such as one built by c_checkers/build.sh) opens it directly with no decoding
+    # This has to be asked for so that a stray libcheckers.so is never loaded in place of the embedded one
+    library_path = os.environ.get("CHECKERS_LIBRARY")
+    if library_path:
+        return _declare(ctypes.CDLL(library_path))
+    # Otherwise the platform's module has the shared library embedded in it in base85 format
     # Check the OS. We support MacOS and ubuntu
     import platform
     print("Getting library for platform: ", platform.system())
     if platform.system() == "Darwin":
         # We are on MacOS
         from mac_library import Resource
-        with Resource.load("libcheckers.so") as lib_file:
-            lib = ctypes.CDLL(os.path.join(dir_path, lib_file))
-            lib.B_getOptimalContinuationFromString.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
-            lib.B_getOptimalContinuationFromString.restype = ctypes.c_char_p
-            return lib
     elif platform.system() == "Linux":
         # We are on Ubuntu
         from linux_library import Resource
-        with Resource.load("libcheckers.so", delete=True) as lib_file:
-            lib = ctypes.CDLL(os.path.join(dir_path, lib_file))
-            lib.B_getOptimalContinuationFromString.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_int]
-            lib.B_getOptimalContinuationFromString.restype = ctypes.c_char_p
-            return lib
     else:
         raise RuntimeError("Unsupported system: " + platform.system())
+    with Resource.load("libcheckers.so", delete=True) as lib_file:
+        return _declare(ctypes.CDLL(os.path.join(dir_path, lib_file)))
+
+def _declare(lib):
+    # Sets the signatures of the functions used from the library
+    lib.B_getOptimalContinuationFromString.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_char), ctypes.c_size_t, ctypes.c_int, ctypes.c_int]
+    # The function returns the output pointer it was given. Ignoring it stops ctypes copying it into a bytes object,
+    # which would also read past the end of the buffer when the output was truncated without a terminator
+    lib.B_getOptimalContinuationFromString.restype = None
+    return lib
+
+# The deepest strategy that the library looks for when recovering the continuation
+_MAX_STRATEGY_DEPTH = 100
+
+# Output buffers are reused between calls. Each thread has its own so concurrent calls never write into the same one
+_OUT_BUFFERS = threading.local()
+
+def _out_buffer(size):
+    # Returns this thread's output buffer of at least size bytes, emptied so stale output can't be read back,
+    # along with a ctypes view of the same memory for the library to write into
+    buffer = getattr(_OUT_BUFFERS, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _OUT_BUFFERS.buffer = bytearray(size)
+        _OUT_BUFFERS.view = (ctypes.c_char * size).from_buffer(buffer)
+    buffer[0] = 0
+    return buffer, _OUT_BUFFERS.view
 
 def getBoardOptimalContinuation(board: SparseBoard, maxDepth: int, maxTime: float):
-    _lib = with_lib()
-    board_string = str(board)
-    # Create a c string for the output to be written to
-    max_len = 10000
-    out_string = ctypes.create_string_buffer(max_len)
-    _lib.B_getOptimalContinuationFromString(board_string.encode(), out_string, ctypes.sizeof(out_string), maxDepth, int(maxTime*1000))
-    # Decode the output string
-    out_string = out_string.value.decode()
-    # In order to separate the boards, we use a "---\n" separator so in order to recreate the boards we need to split on this
-    out_string = out_string.split("---\n")
-    # Remove the last element, which is just an empty string
-    out_string.pop()
-    # Convert the strings to SparseBoard objects
-    out_boards = [SparseBoard.read_from_string(board_string) for board_string in out_string]
-    return out_boards
+    # The signature was declared once when the library was loaded so the function is bound and called as is
+    _getOptimalContinuation = with_lib().B_getOptimalContinuationFromString
+    board_bytes = bytes(board)
+    # recoverStrategy in c_checkers/minimax.cpp follows the strategy one remaining depth at a time from a depth of at most min(maxDepth, 100) down to 1,
+    # so the output holds the starting board and at most that many more, each followed by a "---\n" separator
+    n_boards = 1 + max(0, min(maxDepth, _MAX_STRATEGY_DEPTH))
+    out_buffer, out_view = _out_buffer(n_boards * (len(board_bytes) + len(b"---\n")) + 1)
+    _getOptimalContinuation(board_bytes, out_view, len(out_buffer), maxDepth, int(maxTime*1000))
+    out_end = out_buffer.find(0)
+    if out_end < 0:
+        # strncpy leaves no terminator when it truncates
+        raise RuntimeError("The continuation returned by the library did not fit in the output buffer")
+    # The boards are read before the buffer can be reused by this thread's next call
+    return _read_boards(out_buffer, out_end)
+
+def _read_boards(output, end):
+    # Returns the boards in the output up to end. Every board is followed by a "---\n" separator
+    # The library only returns once the whole continuation is written so all of the boards are parsed after the call rather than as they are produced.
+    # The output is ASCII so each board is parsed straight from its slice of the buffer without decoding it or splitting it into a list of strings first
+    boards = []
+    start = 0
+    while True:
+        separator = output.find(b"---\n", start, end)
+        if separator < 0:
+            return boards
+        boards.append(SparseBoard.read_from_bytes(output[start:separator]))
+        start = separator + len(b"---\n")
 
 if __name__ == "__main__":
     import time
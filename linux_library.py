@@ -1,10 +1,16 @@
 import base64
 import contextlib
-import pathlib
-import pickle
-import pickletools
+import hashlib
+import os
+import stat
+import struct
 import sys
+import tempfile
 import zlib
+try:
+    import zstandard  # Only needed to package with use_zstd=True and to load DATA that was packaged that way
+except ImportError:
+    zstandard = None
 
 
 class Resource:
@@ -12,2040 +18,1612 @@ class Resource:
     """Manager for resources that would normally be held externally."""
 
     WIDTH = 76
-    __CACHE = None
+    ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'  # Every zstd frame starts with these bytes. Anything else is zlib
+    HEADER = struct.Struct('<HI')  # Name and data lengths framing each resource, followed by the name and data
+    __CACHE = None  # Filled on first use rather than at import since a warm start loads the cached copy without decoding DATA
+    __DIGEST = None
+    DIGESTS = {'libcheckers.so': (408256, '481acfef1743bec0301551d12e4bd89a')}
     DATA = b'''\
-c-riJ1z1!~)bP?MptRVOAQ-Sqn@Ea)q>V1HEU=QoQYI)WDt2SMU}9sTVqtf8qhfc9f&c8zxv+D+t\
-AObD{rdU5=bgKU*|{@kX3jZtVm4i2rUncD8<t%!S`f;M<nyBV35jhJ<D3r5)?tls^>UMyk&%N+EI\
-C#umJBK#$6}Nt;FUisQ&kYoo~45R-<;J<TvwhY{h#tzS)ydA<3jX31$ZNiq1<dMOO%q|6Ti<<0Xj\
-pL*Y>f9Qu2F>2(r`^#h<g9lI2!oT(8)e{GKd)FCV^_-;^v%WLQK=QAr*kAG%L3^;u*||K4G!M=z=\
-F8B5d`{R_A!46Diee5vm_WBSp{^F}P9q~7O;zNg5l`ad8i%OBn+Z5~pgzf>tBF-~<@Gw$7ch~}kO\
-USidVp0(k#=<hnVn@>0GVYEa4&W)3sZggqA>r!%4Q9UJ8(I1uR2-Fa?R9<G_CS&iK-b8t2@yJ|fm\
-lgi5>c#c<vYc4Q&8%6zJy;4dzARSgWWTfO<B!T}21N#{c1ht_vJ^+k=*y1F&2f~G8OdrilBMk^(_\
-7pR8IAPZy6NdWRhDkL8%rjGmAgk?|C_A3Qj4RH_SBUdx52>0MPEUOWu|OkvMhaXH$}%>L&tdeodt\
-$XX2y>UHegLLm}2Clo@>)yJy_A8o@JhF-4aJdCzg!TNEc(rraN61$&{s^;|Q{y^C#ujRcGn@%gM5\
-QS@JTDjx2d~W#g9ZQhnX~7Hg%;O?8yjD^W43!!pQdDXVHS{ep6E?qTE6>C-qPgN;|U@n<d73>w%_\
-PcBoZI7?q$c5kk{BTLC(s%LQ%Raxa$##7v7SPm>}?XE0E`E<ufC(TkfR;H7z_0&ZyEj{%*^@8<-9\
-jD02Xl4W(7N^S;yU8fBBI7k2S+eP(W#;I?n(DV-Q?8CdiDL$9q@$X=e(Nw<Jyv=;OHn3OR+c3%%P\
-Ns`LR}v>Z6r%rSDw|lsk)+$a>nTF6*5izt@Y*WADxnwdzkewz>!_jgmuS0)l5c)6|c-vPhT>1xw^\
-iae9PW-UGB)L`?V^TJ+3aBF%G>}KFu*xpy60glQU(%V!qy-NJpbF`fgzySq(*XS*Ipw)ySY3a+FP\
-%WsUU8V#yS5QZ{Joe@IqFMc+|go;61%ceJjHMo*S$2J1+qzG0*c%Ti`^OO{OCCXT-8^8Ur?uIajp\
-a;yeyeLqF(7?o=tOJven`s!@$%+3bg_6TG$^yOsLWm(qh)=p<LO45s$%jU^zu!@@;%QQ09&n{?@X\
-`IweJ=4&!ag@4!9c5)l<2uUvh93H@M>di#4)bz}&9AHXP~JeRei!5H;LMDKV53HevM%FTqxJJLN6\
-NeGYx$p?F3V*{mR^|rC}mb1N4;QnOMON4StAuR^t-Y?%6cgq+Q`Tn%Cqvk8ZD8T!(w^OSfOt0;u7\
-*~o1>h%X11(+dOBLp?UWBBDQ@&0X|5zY-X*V{K@YTX)MfV@%}}3{8|lh&Qtp!8Elbr=R#go)d`ES\
-bx;`s_CFA5MlO;bPquoej{k+$#0G;UG`b}9`sri|#I!be7yQ@1bamj1jP}$L1Th~gTrC6Y@$_kTF\
-uftN;iwtzt4{ULKU)^+lma1iXZn~?oXL`E6ntE$p8JUgxtPB>*$*qfwqjuYRz5R33(+{&oXFFyD+\
-v{DGDIRI1r!T9F2(8S@nCQY8JG%v|Wmm`3GHRBVbJSS%6cy0oA8qJ3MImdTqgFR%R^8mgS^8*6%P\
-Y^VV=zP6v2GpxV$Jjx`kFdw(~vw&H<#I?&+6iDEI(hw3j%<L^g<xo!+j9+MbHmH5P|^+xKJk;K_~\
-(q0zQq$MIaC$7>FPmK`eqn2oewo5hOvqWGGXhOhu3e&qJUbieNZ`Q3x^-i~;;u5wAor9zIV%kd0s\
-xf~g3mA($!Ar&$PQOMFI4f;AVO=OI{tU?F_|56WBwc?gywScYJ^NFE?qjbIIebqER&tcUs=5o{94\
-Y6OKenrsotRs`GNa}n+DJD}VplD+V}2f<!=ro{Mu1P2iug3pH$97S*pKA%8v8o?O^=KyyB!9{q!j\
-Nl4_n-cFXL2w&EDSW<<;1PnS2%aN&f#5ZQHwfM#_<*1c!6yWt5qyE~eWMzbA;%^w@mUT%%fn|SDC\
-?lIE&?_9To0A?5vU{3M4*L02Z1j9y&)=_AZUs}A8^J{nxN7Yo?D{Q96>7tZ6*3(fu7k2tN>??N;`\
-?aJD}%w2-+j)40uOWc0u5Tz!`xX0wfn$9tgT2@I>G((MEUl?2EvkMvETsxi2b%5cEgDMG%4@3_-X\
-=eF1uoLJ*B07C}6MK?sBhlAvBPlqsl8MUaMI2;hdJas+}5_&f@gnFvP1=P{_vg6DBiPC(@(1e4+O\
-bSP(`at=JtrHv^EeV&hCA>jW*WiC7~M&(ij`3P1aSc704f&z&))}!YQ2sR?vgkZD8-wM(576e-n6\
-ajv_#NT(I=bi9*H!6z}>_xB-!9l<uLgiruM-d!Da1z031ZNPOg*xX@c^<(91Q!upMsOX$O$4_Q+(\
-l4|;68!}2p%GM1mAsv%BS%B43#etyh89=qMvWk^E(6|0QU)%Ul4qy>WD-#0$I@a<e*eQr4oWV2vi\
-WL0=_;fHDoK>*F?|S2y_tWBG5z7NS2(Z#_(Ar{+mnu%>bT_P-!B8H$~4a5tsw6H7eU6us~obQI8G\
-JRuVXC^lU5f*#Vy0L)ih!j;QR6z!3pbf>_Q7ToAY+a7WM;K{ttZJkhf^g6;@>5cneSgTMQuG7v!z\
-1U(V-LeLLE5Q6>)1|Z-f2u8p|5Qcyc-wj7)1cFEe0>BMKWfX!~iTB6Bb37^sAxJ<VM396a8UB_6<\
-zOg>qH>r-8^h7_2>6_V%8~Fq3YDV~jDgQts2m5+<58K7U^0TK2&N;LfnX+r*$8rEna>;Z5PkvtZ6\
-PZ25G+QpRN`E;5}sF~at%DMm1u7rdfot^H>0u;p0`3-gvuT8yi0T-L9hqGJ_Ls(+Bu4zk0UsN;3R\
-@m2u>q7i{Ju+iwG_uxPsuS#P_aCJl{aiHxb-IP=eq#f;$LG5!{1%_fh!(!9)1`2$hc!JcrLOQ27$\
-UD+I3*yaD`MRDMA45k8lpk~*%Jqw*U9IXGx3K&gbvx(HO{D*LF4p6emdM4*L0TjFoJa^KHU1Hd(e\
-vJom9!*f%K`pw{3AC-m(jNr2|lqOKNgwh<!R<w7vL7&+OtPt2But(s4pdEsa2s%T3CsaBkaFzJJJ\
-9_Slpc?{j1U?7?;O{+9*%Lu81bqP4SK_<D=s5&IC;}b=K7w!r5eNhb1|o=p`q5CvKp6{VJSr35IR\
-%xe2+|M?K`<1-Fa*O9q$9{cFbY8?g3$=ZAOLd?D+`t58RlXF!c7AFWK>Q?Fb%;>1hW7?8<ler<iO\
-{7sGN^r0fIaPixDhAuoS^^sFRP%6$n-$SdCyUf&v5^;O`ru+>FXX1X~bnMX(J)5rSO^_8{1cU_aD\
-7h|0qVj=<-ms639~B!V*t&I0}%Dlf=Mw@F-vzg<D)RRq@%Tt{#N!A<zvEmW2uxQ(C`!94``5j;fj\
-2*G0nPZ7L8@Djl*iTAxh&u<aD2i!*}%TW0Vo<F1VD}rxw;-e``4gordq9ZrjUkK_W&_JMxKnsj7+\
-ED697~UG7XFZxBt`Yj&7(o*RO%XJc7oCtn=AqIUK??*XfHOs9O9W;J%n`Ik&;~(UiFPf}vn2u!0&\
-4`ew0GK}&-Mr$0N)PE_NeR#&z(@|h`<?v8-lJ9ZFs<QHz>U%{?;8m`-$u~2m%rGgunGhWnWr9`k~\
-ML5pWTNAP7Yej$j~yC<HMGViCk4NI)P&kc1!=+DU_Q2r7pnNJo%?U?ku(p&Sck7VZ7x;d3@BCn1=\
-EU^;?XfS-fPxd`UN=l`J0L**g_ixDhEu#DDjKKi^8!D_&-LFHO_UXRL+2sXjz&8RFyuob~J1Umq~\
-6Ux1)+=t*Gf<p+7AUKNP82tUX#Jf+S=hFzz0`43t&m*{i;3D8Iq4Fw%>j-WlC_!)=!Cm-!DJmZ`7\
->l1H+zY_JWcd3lz`aK08+iUetM?gw{(_)fzQVA~l0l^$JS(7537(ZvSr>sSg8B$F5NILLMxX<A8l\
-ZCQ#MrSpZ^thiUOL`QGsUvW?Z|N{3ce+-=YnQFd8Ybifk5+BuWzqa&V_l+YIEd4onr<kPYXwwO~^\
-^U7OiE#dRHW{n|IXz-JO|V%Ysd}_K&bUl&C(jWbdGhriU+&<Gnep^J$`bf3|;?%Z$|Afe&^Lx}bb\
-6ZsfAOLY?OOUyPH}-1gY^#M_KjUtKx#=2$M5;kI9=5!S~rKx;+r<bFMKzZh@NQ8HK;xZuvSt{tAu\
-dGw_5v9%qH#xCBVYWQH9`tGeK>y~!;cBDnn)X~11Cn>mlEbfus^Bz0)+&0hB?j`qgck5&s_?d3nS\
-;U@yDIwKht;4!5gY!2$;pnv<Qpb4S7k4w6yNz2G&q``tYOrCFMb1I~nq_$%JW{sJ-eMXS>oI5i`J\
-jy>(>h))=dQKsozztQ){YSOF81@-hO)D-e)EfIZhC&qa&G>z$a?D6P3P_9$-gVwv+9K9y87Cm%No\
-@05pI;Se8<FAie9t6CZx3Mk)rabv;D=FhabJNaGaFl+i$bR<8L8f4$s&%sArbTgQbN!b6s0Ln!L-\
-xDdx;z1Dn^De5*M@D<|YBlt2Fx%t{%1ZB)B=799ef%{}?N-`&n<#`$i3wb<ribGda<o2OZ1yijPE\
-QZ(^pzgEM?PtMqPAt3IZ)u92~n-BZYaLkFkC9Gu$o0R4@P#CEndDo=ZuB{<o@5X7(`R@?-gHsp%X\
-5Ph<U-s_n*r2h}Bfm1wvoBv}Y7X+@y3hR9*Kg<3qdjt$y&I5ZAEXj|)dr2**>s=s(YKQ(x6kMpVX\
-^JS{pfn?n>>w^bcEI>K@Kf~zI{1TPx-EK;hd8S#Y(>F+9h`WYS}qo6AoRv-sz$__iBHk?URfzJ|W\
-S^PPDq-E~+7WL}up^>|t9Lb(+xj(mUCph3SLOTU}Cmp}IaTzs||c9To>I>B(L&#M{GW`kT{XDlsq\
-n)Q>o)J7vFj%A{vwGS$>{X7gfq4(aORZJFOoJJ)ueY#Yz;|0Z2e*Z#8nxY>^FXM3%6<MnQFd9s&!\
-YU-ZEw?%7ObT*TlcF6ei?u@q=zh*Xw3CK-aS7vqS`Puo+A1Jad>d&dyp!9M1`GR_?$x9#c;=5)je\
-R`?kFu+x(P{%{px2OG^OWOlyo!H7da%NIrXTvtx`zODAJoSp()N^INubU>_y5+E6$7-DBAe(6&Gh\
-3hPk((B*61?YwO3_7&gaSu{y%TqjnVmk!Yry`69nqQ%Fle+yewMc97z?&p^t^4_W0tpGm}>i^fd%\
-&}r$n}+f#GQb?!<Ff`xvPoySldi&~9fpcktSrmhYK);r@uAp6e}!rJc<y_%H8s>Z+&4{>zWKTv5B\
-<TxYlQ=(WCIdd}m;t_z>vz@Tv7l5;1_=k}Bh(Cif=-ze&A*r`rNyU%$KF;uZ%Y9M>!PRBw$E8l(g\
-P3ya|*%mGJ7Yr7%Qr{LuHhFN(<+_@B=j?88H_b1KUi#czyYt<~p&j;TyuH_=VBgIbP9+Y*^9s(Ni\
-*4D?dFiv;fn65Fx^!L9@U46HrvnqRlNWnFQweOgU`)e8oo_J{9~~=?EWiI$)rhNk=X2{>SKPj>Db\
-46N@8$T=-In3=mkii$u&!;g!odmI3e9v&dRg}zc-L;@=!`R4<6G|^({=I!uh9i1Y13>?r#;TwX}t\
-PeFM~!GP4d<#4Q4%V@=dPaf@Pnk^cugs^|RQoJ*EyB5Ep8%kkvxZ&9VKfc~5o)_gt?gusRefT;BW\
-gl@80|GSbdE_^LhcFl^P+WrulM{%SK5A~xPX+1vh{bLpBvW?Nbr??0ZXvagTpiGXn}TaMWG)@4;G\
-`reQg2C|2j4>npLH)Oc?2lZyB^xT6!aUzbLj+a#(TcW03`r2Gur;$<d)lF_z<tN%58u6fU=;^Zq8\
-g<`%YP-RX^l_6iMw@(nVDm)xa%{`lEC-Xt9riD{rM&IwiY}Ww7#v)8d{q+5wtw{W)Xh%=Mhwfb4m\
-Ilft{^PNt9;8n#gRMbCkaR0Ol<g#ty?rH?N-{bzzz#Mv^r_|-n`xZn8WZ^R}`M?a5;Q3k`*QJzxO\
-Rar0h$(vzt5LbZ)oLeH+hIKX1tP8*gr&E^pR7#_G^M9*1pTo+e|JJUHprHp4+*bBgMzY)v{hufsW\
-Kox+y8CMaBS`_%HdmDNJQ1J>h(pAYBGH(S(faDN5ICUd6sT-#;+l>&>GcJI{YKhh4?Q7MoQ=k#;f\
-*)KAAW6M#aXUXiiYvDSUf1qfB!@d1$j*gu))-NacrosWuu@US;`i(AqnQ_N|u<gSs+fHr2Q8p*N<\
-5Qa_O3PngvCoYP+vztaa=Vt9p61q3-j7^2cW83D$NJ!->yEGAaqhJ8hDil8ZDYzmv(3l#c6YMLdA\
-joHHMy0Sd(63&b?bd^-j%+MBAu2b+~&0&zHa2~3C9;q4-o{PXzy;fbfTZr?9uj}ZFP%2tmrWDeDZ\
-Ch<8xIrGgd|n-XG!jCgk>~*M5^O2Zk*-->)IlKKVw^#-Weu`tyRKM#RK8w0I;N$zk6!csA(T>OKK\
-ymS?T@{pNStP4mN+7BcbqvLno5kJY*27QbPj>c+ka3+m2`fBQ0LtKs%>4NmVneEjs8HpBD7Kh~Sx\
-{*6qQFK_Z4rJ}ZGgO2Gp+Qd#wo7*nyjKYY{6K4*$eVDo=D$FK#QSo%Mq0U`r4_(4N-(&sW&Gze8<\
-}48QFDV}ud$&dLwU;ZODm3fcRLNy<sI}hb*6&j4O|Vdj9~#!6x9^SFA%dv8JH8wnHgK6{#>3Me+6\
-HIea!=`&alLG$o=HsihJ%I*hpp7zT&g(LW#_ytQ=9i|9C~5En2bJy&u`gi&7audnW0iA+Yv2hyN>\
-^KqwsX$je^h3M?VfaefpxG+}@m9V>r`Ke%*esJkk9Ur&XW079)-3kEoMm&&zw0(`9>5_S56<yLDf\
-pbW82YiU&m(uT5?2oKe0`Zlm^=;rli$AGKhqPSNe-@-tT{&neMY-(b~DB_^!7SKQzSiqWPMv+lfD\
-qjoa<Qu`B*!Z727qw;!{%N5zLzoNM9-q^lVCuy6XP!2cUuF-I(@6=6ZEq8f8d>Ub}>B*7iPa=HRJ\
-lOF?f6PYn_RqSXyVbnClTU+VF~hZ<@0Z(@yuS~sSI$+Fd)DS=<8xzeg(1A-MX&Ao6YE6uQGDN8n{\
-_hc!8&hw_5@!ABb7u&bJZDgQ~l)fzS)@WiR=0ysdM=L=Rv1OH8;%bx@J`7m!sv09}LfolF8b0>+N\
-%G!HLgfJKPRlJoWOEoj2<BRr$7<m$#&yQi$Ney^~uz?9ew|W0UaY<_eu6`;q##9tls}^s-B>ZZ*D\
-fG)AxC^@mxPG+gH{DwrC{TjNvOM&-+}dNc2zecj|(QpY`e55<kvT@!nVoBVC-#+gf39iA4My1C1!\
-jgOn0PYijz<w)1($JR7|yk*Ryt9SCs8kl8<*3Eqycd>K5#!6TA&p2%rvwocWqxk7MtHKYCGE>f+T\
-{gXbpNN-+vp6qXZEt@hG;~Dfvll(5uRm4VE50D->kX@eK7PW<uQY~r%yM?MIMLGVe7E9kqmTSHGR\
-q?`+*X@)a=LR$<foOs?eBR;^-=72sqMOv?o+KiGYzH<8@t0^h2^>N!Z}^byD#3dG(sO1Z<I}l`?%\
-y;xWy#Hv^@cFZ5Kyx-P`!(&Ktv2LIf(kc6{j^`@p;Iux?{#^jzp7-`!MoY(euy=awtn=(xP=TIU5\
-@vq!90t-bVfzE8gcBP_Z-2+G-dx+7O*aK}A<`C${UxIA9CT7CD!`C1=de~JyuHW+m&FXF(k_C^DO\
-PA@vA*db`4LRQ~)<%#_kOzO8`Qg)I<6SK^mJ;fRg*7e)meLx|%U}t^zOV4HRE!9skV_R--AE?*#-\
-VG1goO&My4jpgV(et1V=l*PALC$RLS+V1|j=8Oc<?Yt5&>p>~p=pcr=j(mQQ#Dw9W!fAw&kgUaj(\
->>h^5OQ_g{H@+&1Icz{HTu7-4v(fVcte9c!lki`|I3|c{)$=<bqt!emlNwa5TBG;_G9ZtwtLT$JF\
-ooeysh@CvE}<?ro<{&lV2R9bj&@VARL+9l3YUWT)p}?X5U{b=btWXT~lZ_HD?QEZa>(TQ~MH**5p\
-VhiBTmAGT6%zwG8F?(&i|9&QH?q#39yeVW1#4LaRAa(Tq%*T;3{bt+GMlPR|~bXCA;zYg8sn%hL)\
-om+J7`8O~7BZWcjhVRsAIco3BZ<n16ESCi|8*aG&bz$FCedIqKweIMt{LO0Vz{&b&X6sFMOugcLd\
-#3X#g*PWV&!1@3v?#FgWcT`V${XIur5+d)Q5@CNu7QdArQQPu_{Fz7U#cNgJK|jMdDr5mPe#poEO\
-^vmPbr_{V_KkjF~vORbyBeT;+{8E$6oV}^KPTo@kEsM`yo3OR_hE}+~&)@CHu6J2U$A2D2%%JaJ_\
-op$^R9#e<<_BCShsvo#Fyd75&zcCP{BEEzlZn@Z{aybvawl74`P(ws%G1r@-e)yMsQJ&5p_oRTTz\
-bdMkLjuCuMuYTFf!?`ByE9^LG%nBwy6K}>TmlMgfAl{ZL9)eAr0cF?II)<a^Fc|#j5Px8#^KD@Vk\
-iw;wopBQ*^iLg)Mt5z1<5AB}oeKzsHkhV)@XEZHdzUJDClsZX`_lH@Z>pXwR`-vff;wFbDPi_ACS\
-Z`gS_X+2MF^%(P2ffu4oGf{>bh7%2*W(={+dsH<IL+>c(etvb-I_gJI&xP%>#%42huaq#4*qYz+&\
-ijccX*wQceS2kQ)+Z?=8CjqOU9V3D2O_;f1b5PnNwWPZ#UL2Z}TN=i3aagMBF|0_Na?yIxF?hEG}\
-x#vy3!}YseqkyL+5vtf0&yYlE$!;I?&H%OxE=N8V|^*zV!Foax>7t{Cuev7v)@OXW@bf<D!G81Xr\
-?2dB-uGSy8ze70rzjccrueeX?#oNNC2Prb5tZficJi?Fkz{o~?W7dN-6U)VxpW!Z}8?k7)&4DYwx\
-t!H>p=E48;?dR^ZI@e=a%9lIrW4b}JZn-Y<+SxJO!eZn4(=ApWXt%hNxmJd?qLNvsu)*(x=C{5)r\
-eTYYecZL)tdDwcT6#E5`J(00B=rx$=kkvl&F$Ken_jl;@ul8F%Ac<(8yu+Cw#aAVWB)$G{~KVlc%\
-9rAL8#}plV*Cm`3;Zdj9DGo(EQ=?0*#AN>zeeAx!`}<cKX5AA3N@wuk5uqJ1Q#4XK`qN;<j}$Wft\
-<51D-_XBRXWrrnFb{j7)qy?za59#f`2+8~2>^aYc&1XC3#0y_;+IIXZWm{VLhf$y<Egx3;-t_*hB\
-7eX`1C#kM;?+*?quq(L9ABk`*`I2XJt*krp!;dK7Vh()I!#dkkhN2Q=~6RWK4AN*9uuFre%aulDx\
->%h{WQR}mpv8MHpJr-fVc>W~wsEe#k_eTBKH>b_H<yX4w`7grco|C!O#A3C2uXgTPF?m<;`88cz2\
-vWVaI5fSQmA_tb(nzf}M~!wzZ(M(`JnhpL8C^BrfBu1=&YI~dyiPCco!#`7mep8=iFtdPPbi3gpw\
-sKJ?IVMj!HM%$<bK(>)nIW^6Vo0S*O?Z~em`sTSKD_x40Pt0ubcb9;nL2%1;xCEjRqO_T>m0&&ES\
-m-&ooq8qu06b>1NLyoeMGp4yXBja<rT=PS(3$+i~-}<mwu)PBhOvg1*1y*}?&~Jypl@A`VPfeBNt\
-~K?|$ZTUl1VyljiCt53bBB<l6(&-VE=`()dwi}f#D_a0sz<N0Rf>ch<ztk`$R-fxG@k_eNtm!FQv\
-R_Je1cj!jJQp>%Osy9AbG~ouUZTWHWy2gXsUhA{Guu$)z?GyIiJu5c)J!g5pc~<mvN#3T=_+_`Z`\
-EGGAx#P3H$JEq84W=!;tm<*cJonR}7Y377solFV>d6xKqHhY3Q-@8xndP!@`vXU}67Q2om#*lfcI\
-vwAp6(-?<!Ka5dfNGVU8~(2@+TSfZj#B_yZP9r_y=909dGKjUDkZ#e~5O)LmuWC>u&g1@HNJ);Le\
-6SxhGz0?3%K&Xv@Mg$wm=JoHv+hz0~mAJb33IXB%0qy2%%s4LY#oL-!tg_*VNTHSE4NRhEC~bF-}\
-8nRj+KId<LlP_M&j@lB2zE#QosxBO{HlZi@ojX%CxIH3K$ONQIRPfuT1>~pG*lbK$#qs#8(%}D!r\
-ajD~5wZZ4EUy3={=k{HbBVj6iWR?t>W;)L1Rhi*h`K;T1{uA3g>!jmz`=iB`jR|~NR{g$Fo=sHJN\
-{o6=(UqG&Fe5Q!0mrzw^J35Edv#9KU2RyN@bZ*J|BGE7edraKc2FtQ_Qta5lk0DNYH-P7W~%4CwW\
-|Hk-pO*=ot`jdT&efT7DLxhn`<Utwn4Lx&iqTG4y`*d?Ru*%^8Lz>wW(t_JI_BUc--Ev*;%VPuHM\
-pW)Wh+QBJ@2kafWoitmrdTIJ(QHwI&mz3P%;1Y0VI7ez4N@+q~gJPSny^)&LF1MMZVfB249aG`Vs\
-}(RslPjc<j$O&@>Ws_eA1=v}bs{AEL3SIrzaa)bU+qee=13Xk(=EO&3Vta(47ef_y^W_qTMV<#N&\
-T4b|LBc7YiZmpnRe?_j>22S3+cK*-5gfG7k`>K<USFfJA8qH^K8e}1FzO~e-r~8qwk9Qqt5p?eHj\
-;MVDVpE@+lqakZhQxPhs1%~LzrFd%2HW*DS}8Z0H|%WF_#Vd}j_coOR#4{7)R>Ng^V^*`{P;C@_V\
-g#ob&O3cpK%(;H{|4(9XPtQ>4r%%qXp}C&lo+j(UcvXdwE2>E%_oeN-+wHm1a{9;>)l!8SrkFEJn\
-P@C&z@B8Nl4mmafeBQ&Q^7a+&eg!<g|KFEHb^^qKJ|l$iT3^4&Ai0f8X{en(g4`d2zJ<KOgQ?$3K\
-E?{#?2jE@|`j92X|!_r{D$4Q~5e;RW;@lyKpTFN|*kwVXAQr4BaB6EF{5a#-3q0IPBa?I@vlF~j~\
-3LOSZ8P`z{=5|80nCnlF($738>tSs>X8buRc<s*2_|a16uu{rAevm>Rdnxm%CS|{mltQ;#Qra0PW\
-xvlx^kG`JF`mrreDh##XY>)~`U(Eb^&k5&;}g0`SywBW>l-OE*Iz27o!wIU-%ScV7fRVj^ZGO6A9\
-iBKv!(R2nUwjR5zO3<c3&y`S|V0m@?W`>btsA#WWu+RvOWufnfaTHl=mh}>3?e}^;f4dzt>#~AGj\
-lBUN%VS|4b?CKUB)R`v!^RPCeF+uh{X-reZ#AWW@N?80=7^zFYSjuD>4~xy`6~&%*d-y7ELjg_|(\
-GD+l9yQh5p2ar=EO6)Iw6#p|jg#)l{1`c!;ti@Ug;SU35K7*25v#cPcJ?2Yjpz&q*Ub{u$QKh^JG\
-e6}@yuPfk>e8KIU^&`h?z6sYCfCJEpiorRH@%F7S-h`qL(5-z8`QBWPsLgt;In(7T;&sLOD7|t0F\
-*k61Gr)5caDPr^<NEa|pJ*A-*^g|0h!Somun)#lami_GaQ*Y(takxCPYu^s?oYPUqb0@<k0j|Zc0\
-R_dDB$t-2E3jL#+yfy?L-G*{NYm=-yHB?55YXPBio<(8RHkx=x=fj<L#YEd^2mH8_aKgz+Y;M@sR\
-^DzAfNaT*mFJcEWgbz;A1V>(8Olp~Y>CFR@Y}-s>KZ@j3T!eNVuDiNbi!eX<=v0jzUv1tM?ig*V0\
-*pTzYCQ|lxR<40a4>GtS7?!SsJ#t)?U)pCsYHzmil`v}Inwa54zYG2>S_-uEQK1EmXdndNV{iGE6\
-ZgX&b&BkQ=mTs_~7vc4(3VwIF$+*5g1f6(8{fvRQ{q*zXd@WJM^-J!`5#yEj!}$46Nxb<nj4y9b_\
-UD8g%zG!2{@*MyzHJn_e!hMLKITi-|I!uLe*o*2ibp-(9^(xMVf=ZD|DOatX^QFQ0eEg4#%IDh(W\
-UedYy94=FXafn@u&yJ2R_4iJ4z4F#O=%|!|nJ|G3xDc{oF?+eWp6%`i+yw@vhXw`02qU-a8QE6>0\
-0u`73U}l*VULR^j?j)$w=*ls?%2<7dHsq{hXri`&_JTaL(a7~KHlweOStzt92WAH%q)`SrVt+wW(\
-iK=h}$4#r1Apbr)If2#=N<r^vx@?yyb-2N9!QXZve;rjDGljFUZ1AOKcxo(Fq!uU_hxczKcCuiJ%\
-o+)HIgSv_IiiSvlC=z*Z4qmu^@JW*Xw?OXf(joazLn(6PL=#*;ISjW$oh2u1#`pwz1%jRykr+Rv6\
-xWXde3L{>pCUC#@B#e6cDVlONRn^FYvcOu?veAT<&Ntc10CEcy+|M9m+{GU_~k#?7ls&bOX+C~Fn\
-&gJj5h*0C#=Bj46BdF)rN}uK8*2UMi{S0(d`*-XK*)ieRh>1r=~VwmM_bM7=QgDi61={x4%J$ocD\
-+s(Ec}?{F)AWQA3hX4(@>K8zqqSEn#0D7GgY=n-n(@w{x`t#<!&O-mAENJquFq$Xo=zWQg%vl-{x\
-!w{zTBo><Qpo8tP9!^r+D*JS3;5!--Y>5=Q!ejBcT)SBFPzA)bRz*nhxl;4H%`i;r`uKpai6Y5FM\
-qh2tsUwRAUbpYSA6|<i6(i^wqLhJwR!MMKDYk5NNlCuXs6HD^{8FMiHwJh$Z0i{nm;`R@|C)-~S`\
-bl|zQhs%si17!%lKXd?7vAsvif}t#FfWTP<NDeluc^FW!=o7QXpHgUfDcIpx@pqp5$0=|9!clT=@\
-@_W9j?Cu@IB*jJ9p}0yejlZ4)lT2T-;AC;Byb+c8Wk=Q2P1s9NbQHGkHSZ$!p>IOM}Vz+5&PalqR\
-Qmqd<TAi1AeJ)oY-`3|;cQyVIEYc`)dc-=fL)z6Ltm1D%}#KkWv_TXQhp0`RSDFdbs&;&xiAL0qR\
-NGoL@u8q+}@<Q=vCEkPbl`b@6FZlEs})AS_|6^ws*2jhDHKCu}1gPlCV2Sm9kBK*K{xPA+2eS-e)\
-)R$bJrmHdjxCSXljHK}YhIW_^=VxPlHsGIJ!S%C@NIJYP!1&=BBwi~CzxU-+jBfz=1?zyGTIBi5x\
-Fc>S{|$bx4dADM{F)L;(!rq(uAlirjyN~X+Y0&#@T<)f-#8ET9Wnk5m3Mf6Sx=610lpoN@qGaA(+\
-t<&1o{u9|K}KBeD?<=J%>7De8FQmg1@!R!1()G<auNtoL>f8lYIEpS~%}pkbH9CRE(ExNXn7naDL\
-}-$ok%OK+gxgj?!;S;Jm44LGEiu(D&Zb*2&BM82=3H53>Nj#sjaPT@dJe0{Ds3NIWh!1o~3zJi`I\
-wd&iS<<o;xgUs+D-&*NN~?F<X1VSK<havs}^!~OIH`$j0G4=e?_X+r8PZaK_)mjN4(>m!`&=R>@I\
-+#TFbTQ_ojdV)Qq<v<cY>@=<~Y)<YM`?fG&G=5^Y1-J7N_@NhNH&bPngU>)-T!VxJYW?^e!R>4{B\
-G=Uz(A$e?db<~_w|rO+l)lkkY==kZh?(*gxt(G<M1USBkMUb5xd!%)E`3P(m5~AVoSWplU$+8%n5\
-Ms-VuAexl3nIgd?N+pgMj}~a$GL~^cGd}z5lWBJeENMO;hN<n+|^O{!p@hJm{rEjYv8BAs)B?{54\
-7cM>BDKTL@Zz3GL^>IcNf$gQ)!Qu^(_dNxtNJtyeM2Ur~O7m_8Hmd!3<u&opK^yP}X;o?e`X@rAF\
-*{qlr^@gX2jDSN`A8Th@28<P7-yE(4kh)?Q=Z2~Y}_5z&mpr6}RnC0O4F}QxWJLJ4~*@f%Bfy5Le\
-Y94_;JwUEe=bD|+pGnXk>Kw6gC2pslDrs+AE=7LLk|OU!IY{Dpfpti=Ga(<pw;7ykD0%dzGo0T+|\
-EJ{ID<_O!kVNV&W0Jw%@`B`hZS<MtOF&a*d344d<8POd_Tf6l7(a>D&dRa)y-R@pe$@U2eRv7z!_\
-@wA8-?+mfd5nTHSrW~r%6i%;#|L20rb6IxcxL(4+XLqzpV#JhtOEu{v6O(yHR-|y3F#33+L7-+WG\
-yt3$A|`<Zm=JkBecvbrlFZ8`}!=2d5dh{s8J+0OyoqIHyp0d&`9w-~A2Af7Zgf)dl@+GNlhd{o#r\
-VgdEHTxsy!OZ*4(eN+~DT?K{}-i>{J($R=RFioQqcT{9npJ=TNV?|YAf9oPi-CxJRoSuo4HJG*f^\
-TkOdFXbXC>BTY}XUxMrRHX-Sw272A>cyhi9K))>?N6zn#p%}mGGr8Wpq{!13+HhVDCFQUC1dKQMO\
-7h#sUBI6Cgw)dlz<yrxisX9{$<R-AjPFnJ6L_yCyqBV9VKl}c1v{!eB`>Z4zp^0ha%(|P^S@2f!S\
-gW2d$l9an>?^zg(PGAQc6BHV3wzw;9Re7L#~GddoaGWJvqNy;as-Nn6y7^nvL-$aE=ZGyheLw`8a\
-P1*gy41dOBXk_=`@YoodqwphHJ;9vxfb_nsG!>*wfFjE_|#&(Xtyp0+^G#?(0o^#6yANIK|k#`uL\
-C62Hn5?~4(ea64TguX-l%`2-=k&I`frrw{zZup;gPw?C^K<AW(Z8P2We+K~32kv*9A`;|!;uUk&j\
-uXxPzGz0XUi=m`^d2$Q*m<1_M<-xzxmu63HWe9eLa1uW)o>|W7!o2vZC=m8Zg(0~9cun#gRK5WGV\
-v3|5{`MTkw`fiC??mEu;uT1F;bO!r@1nqtWK7ea2PcBR;1Rh#TXY8g@D|sn?h2Y3#w<7WR^j^l%t\
-<<|>%%NJ>kh+sLoL$pU<&7;mbCeO84i2^^leJ69cYKw+r?q>gq?Y*DQ;&|A9B9DLI1!0PL9yuO2I\
-#}$CRY=%T_=)+PQle*vZvtcJgGfgVo<g+QHg(gYyfVQz&^lFpXIbCW2k`yeX-Nt6Ac9%%95<{3_f\
-C*Z&eu>VZwbe_a>+*VOvAVSyYBApH^1;CHxhNuHx;c4L-z{iMjRI9TTwY3tm_4)`G?np1vcN7#3%\
-ekA{C@5d|$--O`)c$GkZfX-Wcfj)K(<GWINCfKoOH6;E1*KUHo=R&@>v>(`Q;Jns~TF*n6<)bg0z\
-pks2c1R;VTz?0TJXc1j!#W>8(tk&DIA7EDuOsli`1>UN)k8u5xlQV6JHdbPkx$B(QrLI)G&@Wn=)\
-+E*N&A3leT;W;C-;#F&~1zhiJwuQ*-xE#0^?b*o~d<}40gyRa7n{Ez;_0{BGilA7YZORCV;%4=63\
-+-|HsQneMaL2#y|BW`N<aGZyeC`seUfL2<xN^DSvaK;5?{A+LO<MU%)1T9Pj2>kT3U0{HLyXyw9g\
-#{6>(cJ3t?hr^OG9hx23fUGiMhzZt9tKH0u6*cETQA^o;*fIr8!!u6>;nc{)pwks$7Xj-bw^1>MO\
-iq|Ei-R9O#IDgra{XYQfA=I7RU**ux+_&UCt>?R8`Yf7`>w5rwa)BSdHYMd_=Rg@o{(sF6<BQ>Zw\
-2Nv7&c)AF$bFQ32J|BE%g0mu4)oY5u<sTDUfBWs;IGN`qdgnWaiCxM0RH1_X1%NHdECBTYmz_LHv\
-l~|oYY%7gFcWA@jTQ%?a-dtero~xSnwR&&(2i*4A_@+fo}&={ui)IsDCEqcm&uVrl^zjzXfqb<7s\
-h3ITIkRqXEfpBVqmft;O%9?&I+~iR(}6NXAX6^u+BKTqEfa2K<c`K+<#dKH#_dq})^h`|waUX(um\
-$@wTJsjholNx%C^VU#(RJ|0%5hMu5LNgjw!1+zEc1M&!BsZ921jN$7*uZPqA^4}pEU<{;Sp8k6fb\
-@ess~fW3~=2by-l_|CNWih0XHkF7`Q+n!S7&S^v78#KI<6nS(L>^b@`Nx9?S75omLNIo_N>=I+@l\
-Jk{%klFwH5&RVD$>e&wITHF$(=!!eUvKI}(!uOF#yfT({Ui6`ykJ6;*XKcwFX~R76Ze9DjmIJPMH\
-<lO;a8Fl)2D*I{f*og8jXRU(Be$m{s(*y&IQ(#J_GW4@Evmf+unruC=Ti8{S0!DE>HXR13Megjf$\
-_R3-O9uy~*(oggC3AjmbC%vjmX)a6yV2bq^lI5#_uj`DC+=%>HQ83mCr&_#w5wX06BVL|D@7x1is\
-;vdMU`Sg@b0rRj|p&`w)u$ALOe^~LR6rNuYOPlq@S7#BtV&&tel&|of{*W}3lw5<pJ+5TkQqb&G^\
-$9yE$XDRqqi+~T0rq(UQ&-l^e9FoCq=?nS{6?b8<4&p^E$o(=Ro>>l-+-CL{`&r@o&M=Ry0e=Ye&\
-mz!2)2a155A^D0q&^uBe$uFCWIPEU_);YBCF-u(=i|XItV{NP&nsA0-n95$&_n!fNjv0GIJa7sl6\
-3QcdE~)7Qv2PP$1E56IpO;E-jjYn^`Q{Q@`h}mGYIBIm0WM*rO1(?QuzGKPGFBs#P|(V+#u{DYly\
-$1?ClH2fSo~y^pmPc;pcBI!1=2SNzWHxzdf%=^5;PpndQ!uLhvtGk>|(vy_xy*VOy*Z^qh_BKc(c\
-R25$fD05X1t1#yr0DdahKgb>zqebPSABp>({E$*~2*q=MflXSCh#LS0{&A~tNki;*8IP+=#q<+#B\
--h1Da<dc2C50aHc(#Jp*<1Yn~>t{H`k+$qW+P7Uxz%LAOzf`>RG0>NmT_@Y$4SqvSO;R4U8VvSiP\
-0|kY71qBhTz=J#vhVpa^VMCqnB%yfLR{t0JET7)2jYrzY4(J3K<E9>Nqftfv#_2!lX1dEYjHcPHO\
-cjP$_L*2nbbGNf?niD(~J22U{^d#_Qw$7d7eTXT_ey}UjUy!MdS0CV8?5&NUp0JX<#S$MAB{e8C*\
-Znob3Nqh<i8bPxf>F4&06f%|AE}`ZHaQ)I&JEu|C-qE`D=_b@&qeqz7q!(h<OyvP;N#8+Y($CG;Z\
-qqbrQ}A;jBLaTFP_-dMCau4FiOOc_V&8;To&Z?nmLItlU!RB7?{hxY<s0=qXwPg$^EO|>NBE?zf=\
-_&pzTU+^I=*SIgq_f|H<c$qK~KeQur+`b3sfg9PR{jirU$j2CRT-I>Dcn|(u>OA5B{)k5Q<ajrM9\
-2rmZ@0WnwiKoe(hL9(+iDt((2LI#C9%TJ1Qy@+l>;R@zd<E#4Zg)w4uBI7t{FOVz@ivBaMeVyo{>\
-<lbb|28^Z;<h#i9okfT3%1sIj~DOlH)qol9@kW13QB+*cmAPYy$mMfPPYZPX_WJ#z4Fl6+bx!;&L\
-~2BlA<@fu750^n43;lHA**J!;r7upfe7iSmz>t_S_|8@aA}LcYV0w&c3n4fJ_WJ9poQe4K6BWW1B\
-B6n=XY;+?KPCFA)QKwN95#w0(PZ3lb_;!EAA@%F{@>oNx8X8@lmgS?x<2#gm({jv^N?w8Di_&4g_\
-O2{8M>qGLlqp%KBKa+CmGT2WRz<Gg+KfDX)pu3>QQtL{{W9IWI!yupK4XOVpf5QFgK-)))yqWoVj\
-2p&>!)2+I-%|_tj}?udBrJn<u121N)`Q>HisrW+4|Zwuo8*4n2<Nry-sHIS<>B1XlhjYzjR(Kj7t\
-#(~)DX90P1Ao)fc<Bb1}WFpf<JmpCvx2meG74(-AVh&tEJ3*y9;HvX->-1EpT3Q)Fl0kySHQfHye\
-_k!kNtbNH_r3A5~7qiEV-Ni2ZY1pUM|I0sfKq0i?XEbB|e{tUCzusvgJ_aZpb|AD&@F#tUtS{IYa\
-fepzxo@KcwP^xv2VdX5sgAG<(4LZ%^kKK=3%<6C%>{q%zKc>GJ!|KbO6hHaBc`Pixj`1>Nre)a_U\
-+qyX^_eVQp{3DuvbsX}8x_u(oZ4%^R#p;pv5c~b0&)bvsK)rpSKiHG=e*6inLl4rPGY<66R-k`U{\
->s8II9JM&{TvK&fcxu{bn{#U@qtF9KA!{Ukr~Iy{ts7X_CJ1<Wsd9f%w+aw4F@~tRzB&EP=>sQtF\
-(3E5Ap4bCgA!zsJo<#aQ$vJr2SJ6g7M1mLphXRUOfWh+|HByq|a(NkF=2|;tiHf1HWWLa=c2wC*M\
-Jw31v_42Y=$(6J*?7KRDO>dXs#^`V_N2)BxgXGvmm72fI_ypXTH|_JsJT1s~)HdxZ;}ms{(Q@hw-\
-DfE-jI<!`Ycv)p{WlG%?ozm&!3M>9{y_|r5$cz3X)o~Fgcy#s$rVSh4TX(yb2`$Bw9FN!|^f8#tO\
-?GGCvPW!-P(k}NE>?BU5B>&Wcec@w4`WIG0e5}(Puwzqs9}wSLO7ok)fPARZGIITdL);Ese%;n%m\
-PcWr??uw|y-SdP)P}}?8jfMMQ_Tc<z3?Mx$2$)3!`H#S!2|p~@Goz_PSWRgDaMbpCD-RVkiW}%l7\
-3zfhzHvoPtzO0k8ct|wx13D<uPic9K3Od*$!|Q^1M##kao7`;Qw+|CGA>fQsmA{$oosD>5cgi7jf\
-|+Nw+l?;KzJUo*xs|F~^TNTR=YMKysbufS+q`D^lMOJ_LJpSJFRa4CnXvXUKl0zr*$W`;dI#2IOm\
-Zb0+<Lli{5HoTk^^0=wVP52PK#2J`{CfAayvIcL%GcF(~%eWx7BPuMBoFMdhV!5Q+8x;LZcX@dXJ\
-{52`Zts$;Y8}>Ez8(rmKr@G@$w)0AzS&p=aywv@Aq&=r`KfK>B!^QD$VZZb5K_06uIj#*YaQi1|_\
-C`a{A38LHxN*uq?#V27x`186yM#Q~tOCC_yA|obUIKpMwZnlQf*kaLxRFn{NIky*<j82+esnX2xU\
-2|rUPe;%bRg$_0>mpWX-BRrMX+OU&?W7$ZBB#z1mcIOIN>WiDgGU>7loLUbiN7tf1B=P{Sn|V;L-\
-dAkKz2N9ZTXbZ)essPk<lFM2Yk}A72P^&5-0v*C75XJd(82el=z0+lsJH+tJQ_YhhnMK1=#l-$9)\
-191~LSm4UpT+&1Jn{qZBPt9X#>|Jr<JJz+s3@MDJ2{D8oR^VLYYorU#zyo8LqI1$gxZ%yFd1MT)C\
-A2Wk^@4@%T`1W~H_%IjpM^4f50Vjd{I!eobsSAD<y?SK4!4}|S%S>taIoN=HNQ>9%)t{Nq*N3=VX\
-PSRD$piHN6Qte}835<&FQlFJ0O*;M+K_Y}?Zj+<aON@d{~nO{dYa~E)Q5JGX?j9aZ)X1g3hYi!j^\
-sL-0{J68(PTS&&4Hf_Nc=9)e^x@?L|<xO!+EeB?L4^q0mk2SC;3S%_=BD%kb3Ve$oszelx*kWa5x\
-vg#ds>OYELn&t0uTVp}>DmjQ~2oBlDY*cYyr_;u)y^)Pwx%IW#`wDTV((7eL;zBH8{6DRDm8;OE@\
-~ag3SNJc8ZnG5nxOAL##5$j{ve`MFe_`2dLDR%Vg;_!mJg7?+Ut&#&OescS~&o9_ZUo@@(J-|GtZ\
-c-$XI(m`P^@TDeXJI~?1ktyd%Kg%?KpxbBCP96aA?wvWg4nx5&(3BQ`H3{zPuzp6;-y8Ieg)hnT_\
-+;?AHR6(aE7#S)o=?*g7E6i4X?lq{e%=S-;w))#acYoXa9y2@^N#}i&q56{-trZkYo>tRW-;Y=m<\
-0KudSv@vd*NJZPoASYnlaxOp$&GeKw6%~P_U~k_9Ep%bBO=(g?#*7l>fyH<O1!!lm`&6m|sT51Fr\
-^stcXVE^<m6%@CK~s@v@{Jr^RT9-_|DWdq=cD4$|_8PQpD@^mq>q(4&SACiSQx;h;yIBk3~;_|<W\
-Davin=y4ABJ>o<UVje-TFeb@x-y?yVH^<$#po+xE94s!&==bWP5qh-Do<JUAG<NR-eeSXkw(k?L*\
-*6qMHq`asD@u;IiaQoCfV7+vh<@J8BJ1w|F$`QU4IXfQWUdFa2{Sn6?A9kQF$q$u*Zw#W{Q&a|eR\
-F)5EKPl@D^r!I?12)8UN0H-l0KeNEUz)swJj(g<q#k&1Ao%^2$oGbT-R5dTvj3~N7(e0`xgQ0oU{\
-`!awvz_uHC<<tKNtfaP<}@0^Si;GzxoYX-wNVYrraj$4~KhfR_T!Zs?P>yd2xmhamBKv-An`G)*K\
-Ds9tObMK|b}2DVYB9u#Xmje#Lo3+F=SCG4pL#uruhwIV+LE+cC#`Uj+ZP%T?NaFA%rcm*zj31$y;\
-h6B2K$f$?E9d)MMOEXKIF<~M*o&ZNKo#Z&O3nUm{wvK0C90`h;mOd#(`Fot}qVA{P>Pg0oW#WC>T\
-ee6c+19KpMR!BP+>p}kh)%T=5tv}?2dFhgJ-xT5#dUq!E`HOIV8GMS&`#uSF;{(S@KF|#EM-CN|`\
-Bv9YNs&i&!GF<@^iw#4yci08+f9_d-IrM&^#Z=<*oM51C_;)nvX>%9p2UDX7V?R1QE`L7hp#mt?K\
-usgKdWi${3x7rr@=Xw%I|vwcJ;G;$o!*H$n#xG(=%P+-oi)MN&0-~#w@=|3Yg_or*V*%`i0b&q9C\
-7fs0De>`Z$JJeq8{)v{MLq4w?mgZ0j>p|MUU9dL_+oICU*^ypuYdcXr5<d~7c0r5^{9?W}=yK8E^\
-1I^b6p5Lf)wko4m>&4ze@ucV*oUQal$eIez`dMWp$z1z#|_Y8+PiUYKG&O1%Ok4CctzlAvY<Zx2o\
-*ami8y)x48KN{k!9tDwfxC8lpS>dFgt{2?nl;uhC)mza1aj+Xx=c!>3Z?6mY3!S9a3FK{gKPT;SB\
-f(#PBb$r^{0#EwG%c?0CfNNFUXyl)Qdpnqr6gbF4radh;4$c3>H|spOk+5g6)BMV)qcp|(V^wXH2\
-^zOJ}pjTH~0Y^<48M<X?JEhG8W<=)@YM_RYwNm1J{H70pw;B#KY8kL;CfSS2D|&O~5zk_iBd2J#r\
-t_$h??*De^i}$m}2Vf_#UMx}?4RT03Srb<`fWe-QFAsJOBfV9$56A@iiN{D7a(?tj|=_W+Ee-2)&\
-CaalZw%cA0kTY;T6&4!#uMerks8<Op`odx#oMx;OM5ZnXiON;-{&xCzSJ9i{(0X|?w(ycYv6XY9_\
-{W%Qx>21{~&&#fGuTiuk84tPDh*^$2gZ+Nrm3;3oDe~e1$SHL_l79w4oUN7)$**ij!@m1O#v9KBz\
-I~W>&*9b)peKJJ&jqa@ui-N-E_5l_wQS+sw~>;AaPOt8Ke_KFKwhdo<fZCUdKB!J`Klxz+XwlWM_\
--Y2=qu&^Hv#0$1wsDo2r4cJ&JoL_NPS)o{PLk5q<(lA^q<n>q#w|~6XXrOBjcv_1cJSkHork|Kf_\
-Wxk`9+ZpXuF(TvzLZnD5~kBt^c=1^prH25H~!1n1d7UZlR)6xz?H?b9+(;7edvq~v?SZs-rhSy6E\
-d^RELRb|%|z0{%x1=q-mSdj<HN<<&`fF>E!n-%thY@XsHR=hiaN=MT{Q2=!qdmYyN$e7z;}ePuTx\
-KH(EhZ!8LDmQw+@z~1FTu9IdEAC>i<q~|WcE7qgsYeQW0VJlLP4TSrI57N%v#mUTmy+Vi^lz&Ug_\
-qtN#P9um9>10IGEehhXS=UMWsM-TRr0qK;u+yG=L(1PCzRdhz;~Mil2G<~7=py)QsCbnL5MP~7^V\
-{+uKd2n^9LnF_4(<htq}>ZNRto>u5&+*QCF5c8q5tj9llQIlg7{VaHzZ$5Z_9k2*aL{)4x`!aL%{\
-BRf_C5O2Dk_N-aS$-N5VdGgn6OvHy8_iY4~w69^)M7=Oxd`^Pr)W`^1{`VCM5|e`bDe4eL4oJ?;J\
-kus<BvChrg22XXJ35T{Cwi`$TyPtL3leyCD%zw6sE#}{>idvfBzzP*i#O9A`OtXH)Aqd+bM!@i*G\
-lXD@yw}6&cH3RNjxNbt;3px_c^?O0TrSc-T^<(C%TA=qjej(S@2{`ZQMv?mM!voBI+sIH@=Q8BFQ\
-UW_|WEq*Kd>Zae%7uGQzEXY)SBR5=c&Dk<e$NAbYe?n=H#A}9!=aEDpR<hQhh~s>bFekZ-|j;mO%\
-B{+N%;}(LcHHiTD)H>#HD2Qq}`7pg>PTogX`aEO8TvKK)i}JEk5uNoD(;ECGF$^w^@w(*Z{aEB%8\
-Kwt!=?>|B5{CG=R9u!yGc6Z7BHBrqTRp-jJVSYek+fvf&)cgE&SiuBlB1v)qXWKW{QE4xu^NTi)L\
-x^|xCanEj6qa6a0eMDo2lQsh)~&>tc}f1vd0I*^YLK)Z)o<p9J9Lmo6`SDy@eLOXTxKCZ6)AwCN9\
-q63sa9qa&wU<atMS3umgiUFx_gl}h#qdN<B2`yUOOIyebZuXJn8@UkYxt8XyVS%0|r0HqOz)ws~N\
-x!xL;^?ejkbX}y8OYZTB>h|t;MXfMCi$%aoGWLU)A9}BymrQ#%v&571OAsfq<=FP@=WD!lJ=;Zmz\
-m}4O+~n8n-)jvJ{;nHY4>>eL@>+Qx4^FyArGhvwSFMJsC6?^KQscn>(lY%J-uJR-Z-EiNw;%g_nv\
-J??ynx8=hUU$i{+fbEbo$mpRfKx%L4*@JWX#L2XUA?X!le&L7dX@ak&0P=x007$HK0W>)|craa`^\
-}=I6TY2R|w8J^^+)$XS1~{=HssZ$B-bp%vWYu^RkA)cwp_U{{%MLdIFe7BJuQ=?nIy+&N_2#lCvX\
-@_j4F({!5sK~;(zKM8SnA6t?Bj_HG#<-12bv%J0ud914KNdC44=&;}}d4EwWxbMq^=BJRQ^hTQ8P\
-rb~nZ<~}rUbYJv2i^egOZh^xqs{|9c~zgZbCyB=OJrj*zcuLq^Y03+1U>vC%?>;z2(QDVlgYSo-B\
-jkhhP%(1@1Yfd-MDoK$>&{w&K+p^!Xpfs<>{D0W`E*yIKMxPBJU9@2Y#sEg5;}iV8@81>9?VfFVL\
-0tJ3I4cLY!42k}q|GeDl{Jm$N9pE#%)lr`^M_5cr`6?S9?5;D_x?^GC!6WBmJXWZuVUh<`Z$lGNu\
-<CNkd-=2*z=_e=-9B9Qj`J6>?_#KBIq-?@PKE%YSqY3ZQnB-7%o`lm3<M?dgq<#r?KGr2Ldd<=zs\
-=XRIm8_KZX2ecy3kDKk8?YBx`|J+cYr2jH^%$IzY<Mw5h;9PkL;)J`9c^sSJK5!1rPWTb>jJ9f!_\
-P3FcKSj?AlZQCB9NK-wXFzZ9r^UZTgCGBC2q}LpOPPP4X!SC%vzd~5yDt15fic(#;{d-rlR3VfwS\
-(CY-Xfe?t~o<|e)eOMPfpWfmUlcj4<6Md^|Vt|o<7YEwhingD{1=hz0J)2&2iv=r2lTwCa{AQf*p\
-*a!(#ZIf~GY8@^gr1aA`o^|G5$3aLOaeINR26AEtFjvYpuwuhNSa?~y%}`F`5IQsm%*qoAj?C)-&\
-I_x%pnChY(=5bvi7@qUyX*MPW}B3j(bIv-~FwT8O?M4LPp^oO`&x<7g%5B%~nWV`{-o;hFORCngz\
-?fL-sa$IdjuIE7zSJu20O}>EtVh%0NTvdwPdD?^dcfpQ9{QpbZJtY3<Je9{%XPG-HNV*?cK7q{gB\
-@TWMYZ)!B-bRi2_qmK9j+Y)+ya?iEpV8trcWN`sk$P}1?pfgfR31$T<TFl!{GeMffR5l_o_2zEk1\
-L$(7tVzHuc-Q9ckNBfm+S%i_a^OruuX99B|R?74&o<2)AEIlrQF}OP@nntyq-axMS52<eq#pwPR(\
-oDJ+v|%n1AQ1KiC0+zLI{`S=n&kNCPrX!wCF<Ioc%uKLU0GbvN?8T_N7P6yk)bJc2F#neWNmm;~}\
-mowP^o$%TG`y_DJ)3m}hpEr&ek&evo9T`(4x8xa#1%S{x9BnY`&7S|)tn;XVY;714&h5Up-Z|CT^\
-SbktgXfz-HjrlKJUTO$8To4-)Ef|bG_U#@ZWV3mZAqiYzLWn?^=)rTfjpoNj2qRs6J$a%E4(P?PN\
-$7j2KdR`&jo=G?;)Q~kkZ9+)SfL;`DMToUi*-wgiwO`W2x23|FAG6mb7s3H<2T!JakFerXh@=fhs\
-GwV=)wEGPvS44Z+Zk+aa~0(^!G$hs1+;D&)!>u_qYlKHS3@YH8jyD>Vs$X+p!T>L0?DzkLAUuvA8\
-{AQv|VLTz`IIQjBOC(K6sgae0wZ-0%=Vv}kdprgG!?35ju{sTHPilP!Ndc^v*ASAS0)reY0-%I0v\
-pL`TQ*xRC<13SBso1LxFqf@zJ`e4%i@TPQW@jTP6Mi+U3h%?%3?hSbiW(CYX7rA~2Br+9I(s9q9J\
-=z&J)>Y5zL4Y03id$yA8aYK?)CEG;b;&9Oti%#Tog=z8p+U|3JkYgDhmyi;Y5XKcCW)&igL*EV&F\
-^d49eHdb3A+bEZ_!}ZlWm8!Pzafz8%C-p;goh(Wh$@Qv=!$5I$&0>$HbBL9cp*Z5L|j7JkDIgmuD\
-&ZZUFa*8T<$OR3JuscAtW{|E`}Sz<M9&{>BE-XvWU)tL~d+SbTl_UP7sSKdWc9D>Kj-&I$>l&Tnb\
-vH5ojLx2?=otz_zPDOAew*O5meGyZXn()T|9V)P{Jk_|~u!Y__NuA@LzR#Kc@<YREq;x{+MtogaV\
-}Y<wD5^w&f*8bs9qyI<iWiF_d!<Yf$q;ZP)@V@0cs7g@uGEk)xLB*w=j@<l@xx0=8gFA4a>M?!;o\
-Lu^WnuZSRF(Z0z6)C!6h@Ok_c0ovac8x)9c9T}1s=@H|~ix$rVLU6g!5z)A-_GlmQg-G<UZMa=gJ\
-#K7V7@v!}&3CTg{y(TwDH<y)*>k<)!nkO2MDV$ySEHeeUL8YgjAP05O%TNJ(LhDD(9Vb!@Y2v*!>\
-d-2jVpTow5Gji)`X(%kX)sfMfDT-Xr8NGACuQAMi7h0?eB>=BS-WfbkmlH<})_VJ}fCgtlD@)2MB\
-G%j~-spY*z%9)IV2|>JXO{ThRshZnW@+Uy4RALu|$0vwHxy@->0nKud%cVXcrx$>s)%Y7y;Lu}{{\
-6`3Z5fE+Ga9-{mHUL?`hRJ)#-wRq+)_HH=Pn6%$WPHnuI=E3u-TArO7plb<HmcLLzAY_!rv+&zu<\
-2Wr)S|8>zeK-Da1^&}gTtb+O~NQ@1M{ccgR#alrr(#E;`&^T@+KN_iR9$o@V(WXWdfHrl-X7NDpi\
-4PGVwjUGj>J=&)C@R<@1*byaA~xDjzRR#TYpX---_^29&4%jo+lK1${ZNq-RoQZgNZIqKT7yh8@(\
-YdCX3tz|vuBkwgR0^-JYpp4qNYTAh&IUq{AfN;h_;z4!t)0uA!S?`huCDLeCi%x&1DiE;y)nP>%t\
-EYNs1QYKZc3_O8tp}E92(uBnApXS2Pq1Y;xlMnh{mbkyTP`T!P5B5XOxOiT8*Juk0JG&mqKg6J+^\
-?MrxxcE`Qwwxzq|-YLQV3enBP)euqpF{5F{+_yw6H_#HAyP}?#|P@6JIP@6JIP@6JIPz{+R`0Hen\
-;O~)1f-12*!H;E9H5#dnp1AyV6Xa4WWT`zy{r$m>ZBJl&iVmAp@2fAjs@Hxk%C?#e?0=N3F29egF\
-8`xs{dHMey_eR4Jg)8w|MUo5{`3f?$o}tJsdzzvC6}>95i_%{BD+RyR4{DObN2vSX)N1TI?J||&a\
-!Q#uxxe}w1j_S>{7*5)fSNC2)-MggjhqL1K8Xj>K?!Ag@1a4F8}aya{1%Lu0@e9X}V@xQ6GL)KdM\
-5jwW$?Vc@X~tgmbBF!nynp5Uv)qohrPlHgudSz2?u1#^uk9Mw%8Q`CWqR(%SiZbeF$)#L`8~50*%\
-6>M6DQnm;odmw#@Vxcni))`klrB*4|DB3|upan6Vb<;MMGTUeEdBlw$$^P5y<@jJV4|J9?3c=%np\
-e}E_afY5(0zm*^_o8ul5!}keI<R>Ka6DkEM73gFs6um_pz$w!AthhZnY))cYqL3fM<sm&V%9RMa`\
-eB%pqy+t8fRvRjsxN9l92zB%2#u=v;`be~ij7O5wH_b+>wS(!b4zx~Rjl_)&?S(I6A|KKL^%$kcv\
-+8bftFk%^32uMS{z7=L(=TI9sv&A04H&TT7WClOaP_6n;)rjW63;F%c{?gD`PkQ><cO7hr}Y{M)N\
-}woI`k#{6wY-94m2!KuP8&P8wls4Ob3;UCdO)g^~PhOHsgMY*-*7!yl##dUa%6QgoPWs(>CJ8NvV\
-cRgU-u6+=l|+7)4xc4*Doa|792rtaDEMRAa#a8q9!r?`-WFmVnFeiU=NTF|_#__1NN(2RAs0JY;E\
-V8f*ya$}jIzkntV-0q_A-->W|Q5-NLPH!=FTq{+cns-Z(TG1y=wn~x;zNfccl29PZl%dF7`L&9_F\
-s)zP2);0opAaKTp~AvT;`_g(`TcNms@_c1CPz>^lT-C>eK$D_lw{&cY*DT66*6j%2$&dIA{qk!M_\
-&s6qnfCA=yt!pzHP)jw-%Pjj~n_;RFHfrZBJPz#fPC?S|Lqfp3wIM_M-eN(Mzpk;*$B{f<K_o{%9\
-Z8>WiqIYDeFx{6W<+1XgVicli@%fy$*Gn-WvG*O3lHh1g>RC<mfU6v*#jbGSW`womn&S_0@LqJ}H\
-~Du{`XmN2YCJxPmCbsAz<?OV<@YTdc2tyik_$>LhlUoWjf)yLsek$G6nq4*#zzKWx%e24S_{k%?P\
-J2ZA-lfdU8W{^PV7e8#yAwCHm@<Kz9Qs;vZKah>JzT>3y$VQz1^^=*cWJZ;FfvB^-RJDrliBg8JO\
-{lVec3dvn>M>}~QeC99(Ew+h$3i9>(kuV?En!$-Bf9b8l7!-?=tPh2bJY+>KuiZ`w8bH6@<U=gc!\
-7w4*l=;KB5DDRGMXvRjp@612uR%)6D}?~(bd<@KOioE>-v5AWc5ZAAMYxt>LNn?jQ!*J{X-^M$z?\
-?3(^-?Nv&st`Y#j05=dt~AlNI#+y%ZtTo7y*IP=EM+h78Z&Wj#W=ov67)fhaARA0Nky{GLod&J<*\
-SPXYRPnX(AGquu@;0nm8ux#)jR+}~_5L+`NVRwJ$Od#jme)xXJ@fyuV2NO$CgB#MXi(}u)(nT%sX\
-?K<#d#pX#txJU2A1kp0I5@(A`5FT|U8Jkz_xfK-eE}B6!B^6ePiY{_Qx$Tmj6ifc9_4K=rqRvwmQ\
-&(Fq9<$WpplwBU46hcVUonDOGR`pWOfelQi9_GbBGQTf;EcAZ3m5Iw?|b+2)Y_`<5o^XhVkg=oVr\
-7DDi&?KAneQ!#6~u(3Rvc-4NhJwYwu>RFd|!h)iCdvFc0iK&I)b=_M9iZ-E9II)BK0>ByA}1+I#D\
-o~PuE<&uZB(oF+Zy#dD@a*OH#;@ijYLzN}0~)QbM>Yx{y<qbfKTU2-G1q2guGvD>c5-;t>8l`9&$\
-;A*mkWw3P2(><1FEKP4xqCXjPZ>i|c}l{z)KNC&Oxn%<>@*|xQ$#fXFSzcA6wK5poY>{^rlfc9Yx\
-8f7@8jxuPT;`jgP9b%e`2Z_`fu18!V*C(DI8-o-i@p1waq%aO&L*!&5ZUyL$6lJNMl&<pHaeve!L\
-@Oj@EBN{^D#FRtAQe)$;0B5+e}z(xVP-AEEADHm>AVIA<D;e5klv`6wqmM@{O-P<6^7I5b|T)ZV!\
-^T<Dz{KCL9Cbf-jAAJMCB><j8VymIZUstg<G&31c|7**k5UaUD-x0bO^X+jC8JP70XY-A$H=WUZV\
->Vs(G&hn=YDur4u#1@!+q^vH$y0xM`O6zhqP#(WOmcd|2&#ZfFuOiZ4v8g*_pt*~S#q>c$k*Y-0+\
-lzA*)V-NqFBl^av=e;f0c(qMl>hAsO~59W8~wf@6diT`pM*$<e{KQaE_$EK>2jaF;vZR|hO@!C%>\
-`{&Y${=GbrAF-Ohcho;*Fu%?3#Hn_qHitP<yJ}83GQPTYoN{RDL~&Oh{y#gcTGdD=wvo0LY^1LR8\
-|iDorYbtItB;5{wh4UEz)%x#Nwdgbh6&&k(CshFO=4T4<u4v?NMfQOB37J?gNA1(x>GtL0d-S+_i\
-qSV_MzghRBh%3|K7|C{^6Pbkt)iTu8P`JRZ_4eBn4aaB|B*Zvy)CRJLv?otBRzk!W!}VXLHIJR#V\
-p+uO?<~gUzUI{3C1V?^VERvT}&)%l`+`bN(LrPX(H@|1!NsGIpe*zYbjQka!%5%dDkxt2iQQ1Cl-\
-->BFhQXvF^)$Io;AG9{#{%TMt4E<eHlhs%#?NWY>3a;qV>|G?ncjDxrO#{@IAH#z^<xPP{HtFNB^\
-|FyiUll$|1wpEq$q3k3Z68|I<^;PNC@$XW)B(l7!nCDdGY%nXrF6iouuvN-ObNN}yR+W1o`qixnz\
-K|OjUr7Q860}Ea0WG$;w905b^cB$$r&)3RQ3E2yRq}*IQR(N$59=RiuCO_LG+iM)zBtvzqZ<w^6$\
-x;cc%MM-uSOT*$WE(Y&p;9d8dioK+E&ny+659T$JL?o_vg?!x{1?wP!q`_*5?~29+>4%sA4Dn!6x\
-xrxPsV3euB`WvYnq%L=-M6`bokH3RZg)!n9RP_YYg(eAhx%j-`<2O>A_DM5mf;c8RpXf5pW@<n>k\
-dnlW3j8V)+q@)N}J5~SS$iGN;Aobgeew#C2uhrSgrOsM%!Z_(3&lJSY!k~yQJ_8l!XOYn&%oh{PC\
-<)tz6@2ggkpG$nv60>xUBulT#n_RvZq%}zwz|5FaD=82JKdx?cuWd+tyhtgl$O*0Ba@CF#t~#fyN\
-mc^I(P}B;xOPK_D}Pw=Z!z+SekM^0N3HSCk%@Pygg;nRF%fBhHe6N=KPHhc{5RrreSO6Z(0`p1Cv\
-DYI+-~g#;QoAh3;x;VEvU-!{wKm)f7`nLUmu$)Wq<q=-pN|qN!9!<5ox>4j{AS{oZs(D+uyP;|2K\
-tYO51~f?}@kec3xF(y|3PW`}cwxf4IwPez>m;FJwI2d;VqWa#A8cQFKpAL^MU&+B|=VY&qhYq1y=\
-1v|$`KE>;{c;Ze;jP}gLC@vRkq*_<G{c*8t!1+iiLR9CFy5!B#tF%kZ*)0@56?3_p~K+nHSfBy{|\
-P4F8xnxL8+P4Mq-G{N7s(f%FPz4o_cb&piFy=|-ce(~1s!u@Ag0V5NzrOmB17uWt*Pq{y17k~N5<\
-2NvgDxLmnoi$YDtv_N2e{t0Iud;!^+vGuR{>q-i$(u)=yvf7I_mN^XkNFg9VQdcSOC<HiideqC`t\
-avZ1#10GqZG}fC>&F~v0P*PD}&Lha04$`0K_Z8nJwC=w0&wt=<GJaq<BQGZvLJzVk1v7?!@;uWB-\
-DY!xoK)u+oXcrGy-IynxT+rw9`H+=`$qu27;+;y@|Ujho%X4T&6Al3`PSlbH#}k#Un^1%s0KF!3=\
-zIB~^P{hDXV6~S<s^G~COM87#9O4~`UCW{mNZ(wnPe}csc{w)?Ks1}Q>4fD|-W?_Q=V_{Nfyhbcc\
-Pz@GVgWMKrjIL%;{$iqj$Lg&9&kP~S6gkXH@!z1wckGixvCm3<?t4lQ3Lc01XDxX(=b+Xi4(eLTL\
-G7e+(0|7=D~;DmJCs+0*H(FArT;$2&jZn`_Ks@s?5d_|{SR{Lf5|>1oj?D@RFKY<YweeF7}Z@H!t\
-y2|0VJEOUFKgU3+*3a`G2`}y+(|__Hu$G81T;%HJK7b*)>lPWmh>tlwHN#KenYrj;A=`56+!TIhK\
-%MDgLWncw9mX!c{bd7Nb9NZi(pBhLcNbl8#tA$%r*iMU?jQ0^*-KOaA4APfkU`rvy#?J*z-fYe}m\
-9d`U=>l_Spb6n7w*AgbpN5?>Kjd69fx6gQe5>l%Y|ktE(5Bly`*@BQ$%X4p1if^Zlcm%44Q3pc=}\
-Y6+HX3C2qQWu5Qq1|T|0<TZ<a9>kjK|I?pKAX7iBxZm&WU&;ur%%AeC1=pO|8OTo+ez!(#MZQ2mL\
-@Z*<p-Cc=SC#XLgjdZ|Avx7fg{<!Hf=T`w9f#q!*lPcG!G4}e$)ROZ{ya-k+RwRGR;^ajWz~MvmE\
-nuu<^Nks$^ZYsZzwUQbwW;OZ6s)NDibtGM)cF4zN$Via^O<G3|i%oQ*sN|j_1h!`v~uf^re3w&{$\
-gjQmqmAN1@}=BF8<e92;3{D?;$gD?;#pE23%y{yi(AI>y4<S~b-*P%^J9JMRC5fHJH>+ge|P)ts)\
-Htkd6Z@2J)a`uCy&f780D%GA_swbWGS|4D{aE$aNVtKMr-=cgNx@O1D)<G7Lh=y-ID@)B6OR!z$g\
-Pl7EvhDM-8;E(qM+6|&N#MMrY)Bj`dOaP;*t~VZ(C@vAOMyVCWY80!{Ocn^$w4jUzLNo%YSR2O>C\
-Nh<QND{<qEEdy}=ARaqSggjSHA-8fXpQ0$4NCx(D5z0XqPRpuF^WqSt&#t|_q=!Jn=><+nPgIFv{\
-sYfm$!ZQ-FM!(%X=@}3uM31S$TnTCv!qhSn$TG@IC!j_?~_%e9r(W{OImv;slNB>j~=J6ApbliF?\
-S5iAYX%M$i4^(Vy%HZa*<U#Zk;u@8gO6CWlp{KAqoWnAZn8+pz~s0uMeEJK*L>kF&>GXS$2$&3E^\
-Gs&r};^9Xx>gP)zBM6gN!+1IH7v#%Wv*L1yv>Cc=r#hc=^7Y#B)JEDoazBjf;xt=4iJ>Fw>7Gy_Z\
-RtPhS7gb`I3B!D2tRX%}s!LT~SK+K#^WCMTQEe|z#nQ22*vfbI^o!;q8xIV+x;dkfj(z!!n}r-p?\
-`dmk{^OI;RfE8HM8@D`;b2|5t9KJ?7wGdWhD>8{Xkx@z?Lysh0&X_JW10EZ#ay=vdL%o&Uhlwqa$\
-%eqdnRvFgFG_w-@f;ysN-=jRL5Er>~SpESJ52(9U7?D&WY2D=A^0o%p`oyqB(q(sU~xAi5^8c$9l\
-8qH+py1<5Z<(`i5ubn&pLS%nX<jl2qSZ7%RJ>7Y%vCyp`aaY<>1BC-m$wIicrUnG<^YCnxkozsZQ\
-6YUouy=ZPkt^F*7^d198&d19Q;c>?mesLL&e36N*cO@KTRBtQcvaP%dO@$5NijHiFn7|$M@#(2I<\
-WA>c>*T~bIJ+;4B$5ijP__4B32~?y{m!$?gU=XweEBLxWo=S+>b40z#k|N%Aq?uGSBQp_aTTyMa&\
-ly>igG-pTW%f2}i*BDfvm56M-PIPX?)B7LmeJeZvPi2>>=Mc-PYx!XV_dy^GG~E4uQ5tGqn)qipO\
-~t{P#L}V+xk$bUkaP!4V%I4A$Q>3WxA1GS`lT#nXdntd?jqwEC#o~g;N%L%CCEVVOc*s86Eav%{_\
-PUJ&Ig@kD4OTLk2&9A3P45x5w`J<J7RvAII)PcM<F?^ux}PwngM>y=sQ^_#|1c8XrAxG2$jiBxM}\
-4P4&Hb5y`}+*fc64*i+c1gn!kEq7~7v<+I1-^%2dTk2sqjxM4i%9R8cU^Y$`x?=h^!E?@s9OQvsG\
-`T%|`q_??w1dpgk{Hh4QIFsi~kkk#tdU)4WSiaC4y1E`!!HRc6n8$fDT)lb;LC{wa^yPI5UXOE5&\
-+jqF^cF63m3n^VwjNPdXV6tPd;Yx3^lJ?+E}QLg&!0bUzV&v4u<xqK^m}(knD-8(yQb;s%^_Yr5N\
-=v>MCY7eOAw3a{q<vqI)4xk{Oc0)drF70$0#1vv7XMi1oN=Y9KI~n;hIN(f;_{oOUimO$M@_|=yD\
-16#JvA=^kLF7SXADQ9WMU|;(NSQa69^HNsq}Vg-hm8U60AEzOnYfnzY9rIgi~_)v19G0-AS8z?V1\
-E%}1}@Y(YPX7I;hZJ(8wQ39m7aUwo^t&M@np;fUy%)wNWpZ?ioHf-t+1)h5m5i?HF>o*2vdBK>lP\
-JyD$DKAsp)R3|3po$J2h8{_h|2L8Jb_=Yaxv9T!PC=Vw_ry-KIP`?y@L{G`~cacYO5dH-n<GZkaU\
-e+h~d@sglYlGd3`OEat-hIM<lzyCRk9eFZbq{!)smFF^pI%)r+Ne3v&j+`j2#Km1c>1pzc=nKL;M\
-w!4fu}dsz|()#Aj+Fh_^NWc>wjvNSgO??jjGHdxqHN@q`v8qw~!+SL7q=`z~yDVKxdk($UJJC<9i\
-jcbW0nGB!Y*UKN+n%dI?!1b8*cMOR19~<_~3t|6YXto4arpZ9oqbP0jJzQ{cltndz{X>C5-Uec6J\
-q&&8XU6UEC7^-aw06^5}n9PHA{h;DGfH&flO2P`(nCHnQoxCYqsPo`JdTC=cxq0<|#11-W=8_3ID\
-ys98ozN*!)entGqD&0ZVHKJEDtE8E_;Zpncy47*dm~MKg&8F@5&{!|0@x9wEvJmDOxFO6FVF>HfC\
-FSXJ<nhEZ@_6>p$m8j4<navf$P+wTczPEtJiUw-Q6^47CIts%Qt1(dp_pXYFmC5?^)aIi8L%8716\
-EqFfRz#OZBLOP1v=-9Df&kN9L}&Wr;c?KtGB@}(y6F13y9I#!k{@e;-Hz~KNlosK{L8z7lAeN+dH\
-{CCLuV|n%YB{9up!=N4V)|LwUdhx-p!Y8^dXg(LL1@@opo!Z~4tY>)kD@_gx)({*5YzQ&GczcPH3\
-g5w{!R4N-oxCnop82)fRCyaV>j9`~@DQv^pG*)3@RPc)Coji|?IIK8?3^t8cV-E?Nn$+HIv!hG07\
-M<jJ1uIVMd%EmK@diWv>&&vw(NrzA~o&v5=n)htauyPgpri-QW#2M{R&sftVnA5{`Oa_@P6w$)sy\
-0E`j+{Y<D_VhO2X55!X@Ue@TQ*(O!-i4Ef0C?~Le1so8u)ba7NHdG*uOgY+-K%eV;Mamwy|Yf$IF\
-~iWH8vfizR3hSa4z791c4KfqU&z;n~an}r83T%e?PA{>@)#&98=+&Lg6MAq((i5sfWuc?9O~&F$*\
-_kDK+f8(|+HAxc1WM+KWx!R!l38r>Dx(=UU*2vKGX;wdyOXv3)M8Xxqtt#W^+>#o33+QT?5R#k8O\
-!%K7@Cc%z*Nl@sP;1Ta@AqiA0F+_EUfk5fZ7*8&=psjj{bEd_2Zr;o276)!}MY<Mc8hvBK5=rYEf\
-AOlprd6QTOAD-U%@WjN&9zItf!*mA(KEIgea+<@iDq|GKOym421><gp9M$YFT`3U_<%OO)z|#V9V\
-l*#6JlUbsPI|IqrrN*RW|Xr9<O2}m-P9`iO%4B6YTrWst2^K?zI~qI&@FnElk3KO1g-yxCHey<s-\
-l`-ecw|VP;WI4_(+Yflfk8Zx$LW4)qnH5IeSxeLTwpWl~NbZ|Jbm3^jEW|U$5qz7!9NQU8qrvq08\
-&h_ox28Y&_qR%f=JUW%IxG@|=M(I2~bF=m&RR>(Mq0ADJ$SAu%2%=U)Dt|KgB$Zvs=KqllrCi4ZU\
-UJIC$~it3etzO};azyXU!XN7{TBidj)w#Q)m?RlMK^kF&DD&`luGdOhj)5z`r?yH=lzEAuwjR;42\
-cZijz{<tRu4id-cb`Z&^um4S;#}_JvjnO@<5PGx0B6Cj%-aqkpfWI897g4y!QQDBPH{2T}0>?dbA\
-{h9TeI2PT*IXUctua}9x#=z*pG(JaQI~_qU`;3z-$_-KDBXM}b*87x)FW$6Q!}Q!7T8}*&GXGuRY\
-gz#*N-mQ?tMn)l*MkG^6b8jqI#`T8)r(a^s>T|*bG-LFo($}#OpgDecrrtx-|%@PEDFiUDqX-yZi\
-=RU4^Npp2ud~)uD~>z^mUlW|SWZn@TU&Hv!VstI^Otj9WVTJQ(S)t4dS_;0aa$QEejXS3FPc)v1c\
-`rEgR1cTDy2NvmLCRo4e|dx9RjoaruKPd|1(^zu22NcQXLX}|uxIz@AI?{#!zKK@$>@ib!S4rJYG\
-oUPKMU{4;Yzeo6yy`G=W3)&Bz8k-KaU_IOBG)y*Io+`JXpHDHr>qu?F=p_9XQ<t^Sj8fXTbJ|1~k\
-qKHcdrwV|sR491#<+AmdvfV`A}JleD<w#OgSm8+Kd$gmUp$dNkrG9R30z)j0hd>h6(awLWHirq^t\
-vM^H8zQVZ@YhbuBu}qtEy+luBt}+zWhk5vtRox1~oa7IqH$MD0{BIe#`c?>h`sf8soYeS%Y|wtDz\
-CS`87nn^t!$J%+X9u(`tc<nnBudI#ZfEOC7xVb?&?}mpTxY<m!eUO@f%?xx~!nG$%x<reg5v@aWc\
-_o=~B`%x?d+u(VVqUxoIcoOV-i0X%Q0N-SurG-%r+#k4(4Nl$l$X}wqtYnt1Uni{+vWST*^F9$bh\
-(p+{H<vX;?=EtP@r>-H>MB@gaUvnomji%nVJfhu7?;9Uc@2TI~AO6EFIlUib4mp8Ersg5?=YGlOU\
-}h7g@u4U6!ye7H?8|hFt4}XB%=CM!VbFJuN6^OSn_aNny1z2v$VVaN?X?dXTEE<h{HsB*>@xa#VL\
-xLSQNMf-1r%8_@ZTsF|IDTLC8A%s7kI<5dYAPhh^b>#`Oli?brqVMg>RIttngy}q!6y{_i|ZvCFJ\
-SEPwmQnazI~8`Y{?ihorzWS$8z2=$>Z(BuyL8Z&S7kt8blNA)cxUIGVuv*7M<|!QqA4B%Z6tx7K5\
-qc{sOnyeHE$uhjf4eUi!$;KLGrI`s^y9TvLO@h<d~S<MC--0<jTg2!)I#T>i&t5cP#*K6M|&EIBT\
-Ugj?K$!Uc%ON(jku`XlEF-`?mRW^EX#1prmbZ&|IwX9g2Xo|lJX}L+Twj)&?xTnb4!lWX-=c3t#9\
-Px|vFiw%G^F=xf%RAGPrwU%3ef^?MU2zu_s$8+O%v5CWw9{R`@^jmp9a-%to?#p92FB3qx_S6E+V\
-#_C6_yoRYiF9eqN=d_QhiJ=KXd#?Zu!N{chAZ#oSUnz<I=d9b5tB)x<u`hev6`M*h71PckZ#XA^%\
-U5MDmunz-^on&CAq!cYu!m-owPc6~V-QFM^3dzDN^YV=-{ULBCDY_l@?)kxuN7BZU`Y<5)E>iR08\
-XWizeUBhwk7My4}Dk4$HT9+}RFWMtZRdIzXK-}y@`SB>mhZWT&hUey5iooqbH00)JW{ENV^$YQq1\
-*dOJ@0e)g9_Ct|bo1|$9>NI;i{uxoEcX~dZg_DZm+}hnZ#YQ(Xj8t3Lqf$Fh;T)9?&Nms)q+;uyZ\
-*RcoG}_}RoaW@uiin*HuMYMav(i*MS3btM2681Nk7v33YK@)G1(Z20?SQ2x#y*r}6wPrL&c~BGrq\
-o?F)m_3>(q04ZcKs26(%f@r#oir#tw>x@K^)orq~=xlJ-xjs#bxFodf>D!Fmqo{clid(gBRLFM-&\
-Hw#Sy{cXw=u-n(LmF7i=Zp7SmkTRTR<Wril@K7AE37mXuj@S5%WZWKaqn$IMZg2Dbjfm=!u=c5Ee\
-f>o|ha=Sev3OG6tm#T(vBp55fMu13$?1@8HQ&j!!!DG#;IWYDS9(_J&HPN^WTst@_HF27w^6~Ck`\
-=GUudA@uw9_OProN9E^ms1{POss_5z>-6vn>DEA1OrwoDyi&X8nmS(WF*5hUB6o@2rrPE7N#-tV7\
-BG*0;?a6a^@09O-QZ{S^U<d3ug?Z6ZdHk6Q?<kym|X5H3FgUXT`v*Ry0utF@jO+im*uLvv&U?4s_\
-znoK`?77WzZrFzPLW}aV6!tudA@=5*1VUBbxrN6AD}lGW>9h`WDcgZEzb6yN`gIM^DGm!!mw}oMY\
-U@?y~&3o=eN!)9fWn>GBB^NOQu?VO4k1JoB5bFe&;YEV|w}TrM#NtmnTK&Ud>?3%x3&P0(@NIo3r\
-_;OjZN`V%jvo7)~73GL0g{=y!*9??yuv3vVH6cmg-#VQ=T3%$XDIDNdXr>xqTFEWz{9BHme^GaRk\
-l(^@5)pbJi9#m1!@u;{R@(!W<k<+Xru?~dpyy`%whTgO8md|kcdYY$|jk7i~uQaHWq6IU1+eA<S+\
-8afgsqAuIDfe4Pv`X)rFaF71v}^kkF8}<gs8@Z*F-xX;xBFSXGS>-&4yo!QySQABCF#ead>@aLf3\
-=E#`lMigj36%b?s!W|c&ws$zT5wHX@#n>vpl6Ga|$o#{`43&fy~=i>^q?q8B<g<=sdUQ;@M@T&VZ\
-(w3LhTv6;JCg={Qgm*n;N<UBDmt%9=N))L9&BkEw-aaI25@1eHwjRhj5JH&msdCem1LBEc*$Pfzo\
-{QvBw9neLIWFW)N0!H41q-quwNonP{drH1cwk@s%js=Q22h>iGSPN*e<H(;$@m}ywlec@YG-QSAs\
-Pu}VgVXK_|hI)HC?vQ0MF;td=M-%kDiaNKPXn$(7xY!(=!|ySi-VBfVF0@{(omo^^Qds0EyS%rzi\
-!t<7Wc}4|o+1+UHVR8hbPeE5^ySIH9tP2RIR@wG`<u^u7}o0LsMr7>Um57#@YvlrP(7wP{6EQQ&y\
-ST?Q@V?;rKr9}8hA<Q$Kg`-^z4%P^GXUY)_c?++|(0!Xew-f?%1JjGHPR&6<%ISPgk3r4g4N_=h-\
->=bMkV`S^;k(GE2IO<~XP2M*o^Q>@kM#AI5Z)+A#*_Z=1y@o2f2(GONlG_1n2!-=6b0HOE?Os=K_\
-@ea`#|x@68ag{aFl<S90twNqTq6mzcgT+^lo_Na#1Xyhl0zHq6}jXpK!^!2O4!K#CvBxx$7cprAo\
-e`Pn*%I3Pwi!*x_gfcn99*`AP?a<}d28iVe85j8N=u%V5XzE{veV?%IC%wH<I2TMckFRD9=)qm{O\
-pLkVPEsb%a&d?WccW0{Gi|a<KjJ%(i%0L#Dj$1RbLk{gKz3=VLU8sm80YF>tjbe&DdbE~8PElqX}\
-;@F>Mn~UzbkeY_dQ9}8wsB91^Mbi1ib=Q*e`a5>Jt;Kh2T3#^9y3mykc+Y=vB<I$l(g!e<wNy0vG\
-V>vysQ!Q*TXb3MO6pxi@oEVMi;9t#^+oW7AzcK_=u;^>k3G(nh*ZxfMMS?{H1ZE7n6Y_9rS%cTJn\
-%5*<9@wjFHK)Fm_)yM*jRRm-Q?pIJzC(P^V6>&oZ)I=yCDRhbqq#^ud69WLj9ZdLo$yMgHuYIuk_\
-NntyBds-{hoSj~6G_Vh~rzuCNv6ylsqhpUdbo%<?Rebh!4eQ8s@x1w$PwM^b3o~KIk>TrYrjt3{r\
-PBX^{Wu{hjG&}~_jgBKc+@+7dUU<xJ<a}!=4^-TMGxmYe9wBYEu@-vKAD#%2YcyN-{wfscvgCBCx\
-xY(hn{-duRpeEp0}iMzS}om73rHLWwS*$Ry}iz=7)L;BeEVG@xcJxj`~w!39T9=NIR?`o$l)YcQ%\
-F$%n`(8^ItP<D{Vk$+dQ``bwJy+CxxZD!cDeuq`JK&a|(;-Inzm#=>-Y;xoErhuov^8d^clw_%xd\
-7Rbz2;F8u^ukhGw8^O;inWj<3*Ph~u&DCo3auP1`zb@n*@#E~(}Q)~^hyX=pNsDqst_Ppz6XJqrN\
-c$(Fiew^vzf4dl{gJ#wQl~h-#Sqj{uji3duy8%j#UAt+F(^5jtX7Jk68G2}b^{Qd1rvy-g&0H<mV\
-9Obp_e+|Mlh(^=13D4~%&6(bcGQ{9^}S0+ZPRHr!^6(6aYQhs#u295#xL-Pom=9+bX41>EH%tzod\
-}k(_Zn)dPCC5pHglFoe^#}KX5)lx5d{Qcoe1~XFza!1!5dii_SAi;Pe;}B+arQcP%>`~o9!;T#5C\
-AkbKG-%VI=hFb3jL#(;KG4C#TpKKhpJaLj3Tbcx25x>W7Io{WDX>@$H-@k(XyS5bz!hZ~s0GKSot\
-m^L{(-k?5~I;j8pA14oP_+LReebuTRIk5R$Qz)?XM6x4f~7wd7skl&<E3H(w+tlHmEZ71{#DI#1y\
-$QukIDy3lWQ;2LuU-$_6{;Xb|Fnp)h*x>Kf>dkiZeD4kq_CZA~$OykR9$VY^)%y$=PnB7q3&HPW_\
-5*hCw&xd-hW?03h)lgdKAA$<tV#-sOuz~VdFj?jabC`}GY0mY5r_W53Y{dCcg=DybmoN~IFI?oB0\
-fNET_Xc}HrY2aw}GZ0YS~Ob`+1P~8LqVb8qJZEc0lX-oA^3PPxpWv|9e0z=i%w+ru5fC^g2P3tg*\
-qrQZrzuH$_nAbNXE8&z5yw*LWqGIa4`0cl?<v_Gfxxs8_I<z-l@_U4>;XJs_P|+*AD2tE9l(6x}<\
-{^HV}3(l|vWTw2_V-Ztv#NR8xO2_e^Z^y&*TLHqvTt1-I2()apF^Rbu|XAEYl(2JF0HC4seMHWy1\
-dBx7@JVPa@8*4HP9g%M~iz73zYa{5ym);M{2mKaaI-~$m&YE!aYFdP&7h~U%^%F+Eg+3nxT?4(Cc\
-G1iA0w%cW&mc!VN5K)$Gubb5JOcX;GhI<l@d(jl*o$I|rWdgfWuZ@pzHNEvyHr8PF~UvLu;ysQbZ\
-$m!u*VAZ$YJC!1d4tHQAJs&EAlVXViEX#7HN-aRL-{d&SN&;qL$-SJK79f&-xteX%E!X>7D9}uf8\
-u}`rfgtA821ds|J2&tKS~Y3jaA0{l0nYZSs^o!*g5%dkle|#MXiR(sHZ2+UxD1$HUu~j$FS-@&@j\
-M1vJAWWc$P64Dz`*n6lGD3*8Y(FD<@$9y?!CT-H3J1^VUuqU*JXxk_Wrvl7(SqUvH#SXvP2EEc$y\
-LhmTuygDjOY8-58lmCP#N1rA<Ibt;73G&sPzHZDnO-I#lT_s}kJyS}z#s#LBK}ssH?GA6}81Q#<n\
-n>mi|0(f^ldJ#!hr`F24~Nqyyn}zZJ3WF<ZT+;&Se*YfR~5uu)rhwS5A1JCse66+sR}x<6sgFf?$\
-xF0kA)ZWICaR0CNPgGXv4pkbEvTCL5-ah7rkE4HLqMbEv5qR^?Q6wV&cm@3d<M5j3Md^DOP8O+5%\
-C`&Pf%oFZO#QZpcy(HOtd}g>uN3>Z)epG#7r+I>i;HvSj*o-+6oJvC&gea3%_Su-bm6(5#QqyJq?\
-3rI<n-;4KT2sg;+yOI5+oy?Bm2h!}FVN6ZuJo~D~bFxw;s2ap;#ufnu=^MXu}?M<UOw$qOSzOfVI\
-?PFRu#*C?(?%D-%JUw;;lcFnrtV<WXH}=l__LFDLljw&h_xJGe_`pHvoRIhHemD!hVQ5{i7UXe5I\
-K5<^Zqsme%In=Z=B>;N`pV)Mj5nr6INli3p|1$umgir;i@m)aiAwF$NK~pAiNeo#23bD*mpjwp%b\
-jwAIlbB<ehbw9<7$O897G8N4F{$BX8uO^<<DU0pl%|W#B6#>WLZeBhQdtVGA_g^z_GAk-a`z9`Fl\
-5;p`lO*eB&-i@<lNx&HfvYq3O0_KuXrzL9|q7xF$z$pEitO)4d+AN_B?&G67zSQSGRQL_EZuJJ{~\
-!ojJ{Ak8z1<>;KImEAvU=xh1OU6fn&_<To*(5F;7ul1-5`SJWjJ^dqN1Ta~dG;Sz1k2pTs*4_b$f\
-F){v>#2n|G-i<qn&+zUc*^^G5W;^z<!LT5ML#oaV@X?`h_UO<|ck#UW?nnoTQUeBwf_}8#Zxv@im\
-wJe;_td|h@n4(;9sQ`(w`a<<c~^y5QTO--Gy%WK>sY^t$h}Y<c2QZ72m^c5uO18<G@TQt7tNth7<\
-*FmD+;;Bsyk|NiH^wUSPv5JG0{s;qtSh|?r;;ty#sp0G}Sj^>OV9PevbG6AMNyp=!y(eFcA&(VeE\
-9cCexspe_vNl&u?4Mz3*mTl$jFc`+`H*5yF6ZP(2Tm>7;bNn|rTPT=ewk)UZ!Z1{uKY`#Tr#0oK4\
-7l@4cYMiHqM%EO2`{~Lk&e`)B>48C3(_$Zr-73NT^Cn|gCz-zTTrt$D#4m}#5;fiRWFq%Gv-VV=M\
-ZKpHzROA>xuiw*)tipUJBkYSGdYE9))0kP{2wP7F5;)cnWj~MUNV7_KjLZ6fo;sAgU^$mBveV}tB\
-kvtGudAGHy_%xWP0bjO*Km>Vc@5cAYv#u|>mkv3#l3w@bgG?I_TnnUSH(o%-3e=(ww&)?G|7&0J-\
-;DAWg6BxdV9)Cp1!r|>KfS_)Pfw7-RseZe#aO;7XY)4``VG%t49pP*jrlQ*ju#Ul8nALGc&MHFFF\
-%Zg~OB}x2V4K^`*OX>)zuGxM9Vtug>d{eRb|j_vr7`&hnqRHZ|BeJ12N|%yhdq<{Y{y>A?`Qh@L2\
-D8q9s0@t^Lpp5LUeZi@Hvo*iW6!fEPQ9I^gZ?t+M4nc?8OimyW};I$a(&^6>PoJH|NcbP#qn5p{Q\
-X%<Nbo5LA6+}JNO86xQy%kb|P`*yrWAdNf4^l*XG+tUPN@i=p|Z-c;o&}n7VSEZ^1u5MOMGiStpg\
-mu!4>87B}uIx`T({_BL`~$dW$STK(dxpGWdoDy?8p(`r9Mp2S!gpDyAgCXu4bf{6wvGi3PphN|cH\
-`h4f;5*EKyvW(`9e(59BS_b4m9`p3ZbCe3LX>t^al4JlSJV~Wkt~pk*2!rv5FAyDJzQhHD#&6UQ-\
-tRF@=9inSaT7N?miy=ge_g(|OE?+Ig-})GhQheZI^zV)fTjXI_#12xCShFVypWlAy<ivfstT@5m2\
-2@ic<gZ)$H_ztjSXS!*uphmV84b~=*Gx`#$`REaXDg#P6aY@f!b?<IU^_>zUdg(pw-y|7#+1wN;9\
-%K9T+j#+x|wOjjU9#83I5zJwVF3DXm-I~`F^*ab6-;Z-Tzc3)x@BUyX?veIDN14CNw-s;#<hwIO@\
-o-hx^x5G{pF@metJXqV<RjR=g+n|$2}=ZCUS~LTW~@w1HeXQ>n?+A7nNIH)HovCe8(3U=<1Rbvb7\
-r{A?|#Xne#?e^6xQs&;GePyl5&K6BY*h873>{|VoW8VQ-CVJo%HBeVfy7P_CE2=nA07u;Qd#Q==!\
-fPS)-1ubkh%=5$iX3_@+lr@SADq^_!dNobJm;g1&Ym*gVT%ZDUpcO!iK9DE$nH6(i|pYeE?;t~N1\
-Fy!~7E1katN>LVSB$}aRuC8njITNY_9^A!eFA?bzS3%GINtB88SGR5S;X_Y-k6ByVEKRb0S%udxW\
-MhF(-C>IX4(=?7%87@0DjdJ2@6p=B*Me*3zJ`NL#bXWUq75bc013oy8%k>aS(?lo@-?`9ZWJ`@rW\
-a}wrnm{+%>|v_hlJ0LXzw7p_Ia8DL3@(?o(2P>riF2CMMPw>b#0|E<n3fY+P!svAtnRR=|26Ildo\
-BkCTGM(CxGGcWQk>~2GbL`VY+aNK>}xU4cg`toH^YbUMXJDA;e1p<qe*J$XcBCB6JMND{bo7`UX<\
-Ky4->8ZTeUNTUv6Xg29asM_&b8EL0(*8YJ9)cOX$+^zYs%r>cF1OHtoo3z0FC4_b}0Yj1FjJu1WN\
-vIaRr6k8?bim_To?aiyBV_dQdpYn%>dW^%FhS9*t9q5Y>Iw+2-c&%|T&^xv_ihd#FSpvRVOz43*v\
-4xJL&JsbWNXR^+>Qgp)QA4&D8nXIajRRyq{9l~_j&UGuuTWfkESVLX5b38Lk%Vrgwc;d;W^G+V4@\
-!}%Y$k*i1R7Cn&XPn_mJ2@rptSOUDKf{%JaytK(dU6K+K4XSjBK>4XW}NzU!s(M-j+4_)9tVKB-#\
-Y&5kMqM+M_gRoUU7TJ4Oah+SO3*N_fr4eNBwtS>$iQ?fA=-YUY1JwU{D5|e+S16v3}F~e!Q&y@BY\
-^B_L_sOb@ws6k2;P6EL|T_oV9IQXV7>5eD}|H|9tn)cmI6%&v*ZP_s@6#e1re!|LLE1bqtCdrhXr\
-#{>?k?@&j}R_e6*N_r2mCwEmu={yoIwNr+P!;W|qzKisoloXY+-@$&n|{mJ^9{@?6fe^N={{&8C^\
-?efj{sqGJm+hOqw_gxYnr?SRf_V&!*<Ky;zm$>YN>xRUs%yF2-9<#l@<BqWSQp0=2o%k;8f62&w%\
-+Dd#{&)UvZ}W4h(9^e(zD($|HV!sFZx{LsYdhN}`0F+=If{Pj|K1Vj``=Q~|1;R9F9SURmcJeJp`\
-b4Z{SeSsfIb5Bm7qI7Zw7tYAfLVg^wVMaO`z`w$G-*iiLm@O(6d4B1bq_dJ3-F@eHZBG;&!a^)`v\
-a;^bw;--&g(n^<F-G6zKJ!j|LrzAua{<2Jo8+`o4Sn^zoo?hwW#BejO~I2l^MV-x;81!hSCTeFZE\
-(8+6!hTnXsIz}Q02e+4Tn0{yRWoJ&C82*<M&^jBcN%RsM%?cWZ17HnrZ=#ydj6`)@a`byC6f$cPd\
-{$n`)4WQo$<**6#xu9>s<ALpO13ek^PSD?n?d$}7J?OhYKM^b3(LQ|!$U{JHg8dEy{Uh)@0`!|<J\
-EK6q3idl1^eM3Y6wni~{)2uyY=1oH2gCNWLH`+SClB<waQrhs2RZH{(0>Pim<{@9s3#?$J7M{SSP\
-roLMWDZi^&j+6;A<)9Z5Yo%-v-;c9rVE%&q03^>p$p2U^^>8zXa<)=owi5LB9)@-voL*9M2Ze$HD\
-Pz1N~muekbTdVfme){~ng#1^Sg(5I^+ke}e4{0eye0|Daz1`Uuc}1o|k@FNfn94f;E9ep5g{8uU!\
-i-^cn7dMoJJpx=S<AM~Mc0%m}|57vLsSHkhk27NsEEdl+0*v>-Ge+}DN1bPLO{}Rx@!h8mg6YD?d\
-r-FVv=<_lDgMJ>A&kE4DVLk);8aV!D(0_pSAM{&5-vs(Kn9qQICM>@VeZhV^LH{{yXD8@qVf_c)F\
-X1@Gr(cNiAM{e#&M?p~h3$+0eP4|KpnnMZXwa|2{0H<$VZWK6{}Ssz=uH^^L0<{W=Yigc`48w%Lp\
-{6*^qEl3vqAqo#(&WNi1`obLooh>{t?!H&<}!gSPJ?^(3gRJD&{|+zl!l6^j#SLLEjJSKj<T2zs;\
-Z*!*(`+J`MAE(5qoPTR>lr@gMYsn1_S@Io5yBQ(!y0KtBg>@W=Y}c8vd^e}?rR^dS&GM}WQ*&ig3\
-PU&Z_%^eq_wL9d6y%mn=<*v@#+KgRkG`f7~-pwEHjXMnyR___%60<8a_pMmio^p$X&3qg0l@hk%U\
-3e0~%zZ&a5=-C+mK|coTKj`Oxz8v&IjQ^lN1m&|5^qa6f3wj;Kf6xzv{cZw%BF2BvH)H(A?O^@``\
-tz9ofPNU9$6cVGg$=eOpZ+Oqe+cON!*+&&elToj1nB!>`xo>%82>@{V*U?$E5?7&Z^il#`pek<1^\
-oih^FaSM=Kr9-h4CNsHq8IAe6als`Vru3A?SN!{sa09SbhoUH)8u2^lXg(pf_ND4(JzR{sVd`=qs\
->3VEY&Jhd^%zeK+iP1L(7`{)4_1^evzd#`Z7hA7lLoeFOIAfPOr-e?dP0^Z(;~dJ*VDK+nhc5Bg2\
-m{ssLLjQ^ltjqP9155W8fbPwkLpu6BW$Ai8Fjwc)R12O*r{URv;8KD0bwsR5aZ({!s=$o<rgZ>WI\
-f6y<-`VV>n)_>5i!uSvRd2sy8KtB}Qzo6d-`f|{7;CNPm-T}w667-L-{R{db82>>(2=gD%|A6@q=\
-)17~gYLlmAM|Cgot>cnANFU0J{{}-@o+p?|3SYI>p$oRVfz>KC$aqt`V|=eLB9s;Kj_;r{{ej&=K\
-r8yiS-}!`=Q+OK>sJkf6yPt`VaabZ2y8j4C_DW3o-u({cI?oMWCOC^&j*TvHpYJh5etP9}4@u9rP\
-nG{{g)X^MBAwu>S}2!Px!<Jqz=H(0_*UAI~Gkf6!OJ_P2pP9P@wBZ^iyk&>w>G+y(kX%zsAv^j~2\
-67xbH8`C*`M!}<?;F4lk0560bs{v#;o6wnK>{)2u1=0Bi+f%!k^*JAw#{bG#&pr>R1Kj<f5{tx<#\
-nE!+RJ?#Gh{T0mrL7$K9U(k!O{)7H5_*w?~Etvm+{vIs99Q0Pqe?Wf#^B>TYG5-O*9P2;m`Plyt`\
-cE<bgWiqfS)hN3`48xB%zr?C0pmaDuVequ2|oQ;(1(CN2=jl?mtg$|{pZ;K19~FXf6)Jo?O)I<vH\
-u_RLoxn?{x4WQ8}wJO{)4^^>p$qvVEzyKyO{rgel7O@fIbQ1Kj^bC{)4_7>p$pMgT55>%P{`|eFw\
-IGLBAgRe?YIt{0H>!Vf_dFKCJ(sKMTG#fPNdsf6&Kc{0F@b`+q?HCDwn?bFlpj`e9iAu^wXl|B+8\
-0gZ)3CKZyAc=vQF>C+H`^@}ofCj`=_6uVVcN{b|hqLH|FD|DaFC{0H=zSpPxyVEzMoGxq<3ejK)c\
-L7#{9AN1?6{)2uP#(&Ts!TbmG<=FoZ`WM*$1Nytz{}1{-SpPxaiSZxw)!6?7`lVR^K|dGkKj>#-{\
-RjOQSpPx40rP**ov?f-=yNgtgZ>-Le?VUa%g3Dv{U@0JgZ_P3d>H6&V*3~LLoxpWy%Os`=-uEe1@\
-yx){{ej%+>geCUWVgepkIXjpP>H$`~N|of$<;o+d-cV`ZeII1oY1_{{ek9_Wy(abJ)%j(2v0S5Bm\
-O?|A2ls=0BjjvHu73_h9)Ipr3&8ACD9J|3R<9{0H>&ar_JPkvRSfdNJnzppU@$51{`A+rOYM!tpQ\
-AAIAEB67&;d|0n1p;dq9DJ__?6&^KWJ59p(D{1@~R?EeIPE7pI|55)Qp`cJX{6Z9sm|DfLs`<(&$\
-r<nhPemd5F(BFmamw<jg_Wy%kiSvIz{}}Th&=+I=19}?fKcK&j@gMYbZ2y9OB<4S$--YoX^pCLp3\
-;GU>|Dcb>{2%lyvHs)nVEzyKAguqO56Aom^akwz1pQge|C1pOWBw2N#~A-XpM>!r^dT7kL7$5GKj\
-;r){}1S|WB!l(#r{vwAI1D1^vRh2fW89rAJD&t{Xd{j!~P%8KfwG4^tBlOL4O?UKj>dz{Re#^)_>\
-5y#QX>JTCD$|pM>pS&~L=}5BfFO{{#96tpA{=;(SifkHY>>(0_vCU!ae~{0H=3WB(86Te1HK^cOJ\
-xgZ>Nb|2!GS0WtppJptRlpbx?PAM~x5|AT%KY=1Q9f5-R_`Y4S5pno6pf6(8@`VabCoc{*;+c^FU\
-`Z|pNpijm45BgD9|3NRo_z(Ib%zr>X8uTTg{|EbjK<~o*2lO9e{sa0#%zr@Ng84t_?_mA|`f#WZ&\
-7gPS_!sCG<NP<!55W1KSP!xNi{}yZf6y<$`VaaNtp8YUIRD`k7%#*2FX&(4{5Q~(vHpWT0pmaDPh\
-$Q9`imI<L4OpEClmC&V87!*ABy!K^aJ30<$<1t@gMX-nE!)*IQD;nejDchpdW+rAM_fG|Dcy){0B\
-W7<3H$^V*fwr!?FJ#^gm(!2mM%#|Dcb=`j5wn@gMYBtpA|T!u$vHcx?ZI-i`AgKz|0~Kj_ui{ssM\
-f?EeA%V$A<j;J%Of59r^={vXh9#Q6`P{{#C!K|d1b|A78m?EeA%6P*75`okFiL4OSMf6$-6`46D~\
-6WhO_--i7^pija42lNDt|DY#f{m0|P{!h@GvHu73<FNe;`o3^oF9ZE|SpPwvjrAY&uQ2}y{YtF=p\
-#Kube?eb>?O)J6*#8510oH%ekH`EU^b4^5gI<mKKj{C){vXg^!2VB%Pv3;&U!Z@8?O)KxWBw2Ni<\
-tj_{tV_np#K8Lzd*kP<3H%<Vf+XEJ?#Gky#;*bfxZUYzo55a{Re#q_J4w&kK@0fmty_{`hPI~gT4\
-UsAJ9i*{Rh1Y^B>Sp!2AdFYRvyZe-P_G=vU$V2hgWu{0DtL=Kr8?$NnGCmty`8`W(!EKz|hLKj@E\
-O{0H5Q^FKkq7~8+8Fb<3LAM{#`|DYFO{RjOf%zr??9NWL3Uxc?K&=WBJgMK28e}Vo0)_>4{i}^q3\
-pJV<5`t{iU1^rH}|Deyt`VV?1)_>5i#`q8VDcJuB`gu724fF{({|)q$u>OO7DE9w=z6s|)fZmMlU\
-(k=l{!h@8G5-PmRILA?x8wLPZU^%p&`-wxAJCU${ttQ*_WyuB4dZ_r<T;rCfc`Z0|A78G%zr?C59\
->eZby)vF{~GH*=xZ?kgMJ70|A781)_>5i!~6&IO055&KZ5x`=(Dl@gZ?ATe?Wf&>p$pgvHpWT4(C\
-6EeiXKULC?YZ4|*ex|APKL)_>4bu>A}ASj>Mw|1F%aX3%$H{RcfB^MBC4hw&fur?CFx@{sR!g1#8\
-%|AXF*`48wfWBWH9_KWo&^p~;zgZ?|vM}WQp=Rbp9f%PBs*RlSCz7pd<=qF?R2mK7p|3UX+|3B!P\
-F#iF)9rGX1PXT>4=s(5zKX{z@{3Gc2faN04e~<YO=$~NzgXM<(|DZpJ{hy$x;P@}-$Kw2d&@(Xq0\
-ewHre?Wf#`~N|oiT$6T-;Vu1pl`waAM{kre?afT`Vacwu>S}2G;IH7Kz+vkPtc#n{vXiC;P@Blf5\
-rL_`Vt)f#pSX7gZ>cKf6(8={2%mR;rK7;!!Z8={Rr&;1pQcy|DgX3+rOZvWBvpB^*H|l^l>=<8T3\
-D5{}1S1tpA`VVEzyKOW6JeeFEnHp#Ko_AJFju-IZ7$F#iGl$C&?vJ`dwR=m){}w}5^M#(%62SpPx\
-)0k(fZpM?28=+9yPGY0wru>TYEe_{LwJp<!E=x5{jFX;ck`VacwasC77Q?UMnJ_`GPKp%$r59p8L\
-_!sDJVEqR@9`k?De~ta0SPq!~fPOm8{|9{&)_>4fVg7^VhW($QZ@~BudIiq^2Yof>KcN2;>p$pwW\
-BmtxEyjP)AHn($`WTG=pudFqKj`_`{sp}p^MBA!#{3`jWtjhf{zn}D8Vhk1<3H%fVEY&JX6*k5eF\
-4^g&>zA6f6xmt{)1kG^&j*<WBw0%DaL=$e~<AW^s(6giTlO;2lR8W{)2uR)_>4%#`q8VPq6-j{wr\
-+%g8mG?{{j7C{0DtMtp9lY82>@f#QuNK^DzGby$a($=)>{(7tn9O`VabN*#8OoILv=Q#~00Xf_^p\
-j|A2li_Wy(a0@nXb$p10^gWiJq59qTn{)0XN^B>TEjQKz4Z(;ohJqhPOfW92x{{wmx)_>6Ju>OPo\
-Yn=ZK`g2(SK`+DhFY1{8gFYSGzo4(f`VaaKG5&*oD&{|+$7BCL=r>^d7xeQm{|EigSpPx)66gPbe\
-ks;}JinO#gZ>B1e?b2f^MBA!$NUHM4H*CNd}00%`n4GUL4O$Q|2W78aQ++Ucj5Cdp#Kf?f6yPp@h\
-{MSgX3SI{~z}MgPw%_KcHWN^&j*Pu>ONyjQ#(h?~U~z^b$BP7lB@n@gMZlF#iYLgX3SI*J1q!{Z*\
-|0pyy%#59loz|3N<t>p$p!!TbmGBFuk4KMDJPKtBlQKZ8CS^B>Uf!}t&S;TZoxZ^HZs^gHnRN6=?\
-t{tx<-nE!*m6#IXE4DAlge?VW3^&j-nSpPx)CFVb%dvN><^t-YCgWiJq59m`c{|9|HKK})}3+q4V\
-Ud;bNUxV=<^sg}fgMKj1{{%e?>p$r0u>S}2wb=f}^1=Rp(2v9UZ=nAe>p$oVaQqka-(dU)eJ{*^K\
-)(#fe?i}j@gH;t&i?`ZT#Wyq*I@hy{V<IGpudLsKj=Tf{0H<#9RE5M`Y|y6gZ=}|e?U*f_n(0NJj\
-Q>}e~IxQ^q*q>19}lY{{s3}%>O}u8QZ_0KY{IE(C@+c54sEEKj`DJ{}c3AG5-PmH`xCP`Wx8)5Bk\
-3`{|Eh3%zr>1j`bh(L$Lo7^v#(6gZ?r0|AW2+<3H%tSpPx48RtKM{uYjZfqo&je?k8P=KrAo9iRU\
-K{YtF=pnrh*59ovO#dD`Y`vT)X=oL8s0rW&1{{{Vcoc{p&U$FlN^!+jZgFXlIf6$-7{0H<~u>T+Q\
-*Kqs`^#8;Df6&ju`JbSli}OE0{}1Lrpx=r4Kj`OU{Re#`)_>5`F#dzS7v}$<ufX~b`c8cR1L#L%{\
-Re#s_*x12D9rysKLf|VKwpaa59n@;|DgW?^B>$k=0Bi2G5-hs3+(>~{Yi}fS@4`J)_>4X!~P%8cV\
-YV%^of}NfS!i+AM_8f{)2uw=Kr8yi2eVd{~hxm(1&9D2i=Y1zo4(j{!h?P!TJySF*yGd^c|T0fPN\
-<C|Da!s`9J7RjQ_YD(3gR}4_p_wgT5c;|Db<~`48y-!2AdF-(deI=&LaQ2Yn~be*^tatpA|jgZU5\
-WCt&>t{R!;<0X-k%Kj>%S_}5P$9^&{f==)>-5BlBM{|S0C_WyvMjrAY&H!%MJy$ZXjK>royKcL@$\
-`48yVVEhODLCk+ZUxW1@^i<6MLB9m+Kj<f5{sa1PIR6dwdolmV?PL81eIwR?(5GSlC+O{%|AU^3<\
-G-NahVy?wKO5se=s&~$PtY&K`VacE*#5=i!T1mQbj*K1-wU6A1icmK|A77$_W%48`U5fl2mMIQ|3\
-N<v>p$qn;QSxZ_s0Hz(BH%HFVN4&{2%lgnE!yj4dXxP_h9@7y%X~v(D%Xm5Bg6q{)7G`=0BjPVEq\
-UEpBVo^ufh4xpqF6%2YnvS{{j6eSpIg<-^Tt=&{MJh2lT;M|3Uv7_WyuB8S@{|kHGvN^hG%T2lRU\
-}{|9{p&i?_u75jfcKN0(XK)(z7f5t=m5#vATXJGyV`U6=1LB9y=Kj`DI{|EFb82>>Zi~T>KpNsV$\
-^pi3F2Yo5Vf6!~O{|EHN*!~5*9p^uQ{x6LGpl`<fAM`(A{Re$2)_>5y#{N&x561i-^#9=e2hb14{\
-2%lKasD&ti?IC*dM4&Sp#Kc(Kj^ub|AYQ#jQ^l-$LAkGpN9QEpr4KT59l=*|FM2z{yzbpOU3*j^n\
-I}X3;Go}{}c47*!~6GiTMxcd*kzup#Kotzo0*b`48w5G5-PmGaUZ{{ZM@WIq2tL|0n2gWBvpBy;%\
-Q2{}Agx=y|aHMWDZh?O)Ib<NOEE55fL_(C@?g5Bh7E|A2lcwtqpt9pgXfT^RpCzZv^KK`+Pp4|*f\
-!A>aM)yZ?O)|M$tzBfrdE{Qi*a>iAcV+B+`0vbk)p-J7x(uN^|8FuOC}Qu4>UlipT8h8|^>H_uyq\
-y#3AHyLT@&Jjn27=DiHBV&2>E{mg?6-@zPj_*&+D3}4M`I*GSm$~?qyA@hEQ&t=}<@C4=q3_F+)G\
-<-C3g5lxJ2N@p3Jk;<<U)wy4{4)<H|I7!If9CIzf96BTKXW4aXFintGap9&nMaU+=I@h#=EKQ9^A\
-E^B^AY5qc_jH~K9c-1A4UGVZ5~DbnU5y_%s(Xm%*T*_=3~h}a}xPyK92k|A5Z?7N0Wc%6UaaFkH|\
-msiR7R8B=XOkO#YcqCjZQ*kpHi2P9guy4)V{OO8%MC$Uk#B`De}`|IA~^Kl51f&zwpAna7cT<{y)\
-P=2OW(^J(OtIg9)=|AhQA|CIdy$L8_mpLqiLXFi?$GoL~JnJ1EeW+(Y)K9l@2pGE$ev&ld6B=XNZ\
-nfx>7kbmYW<exd0{4<|T{+Z7q|6kgiNB)`5CI8G*$v^Wn^3Ob-{4?j1f99W&f9CVZKl2Ro&wM`lX\
-Z|_)XTE^^Gyj78GZ&D5<_pO`vy1$HVe>`gpSh6yGtVUd%thp%c^3I+c9VbRV)D;?G5KenP5zlZ<e\
-&MM<e&Kx^3Obn{4;yWKl5Dj&peO(@3Ogs{4-xl{+Z{Kf96v1&s;|SnajyP^8)hEd>Q#?UP%6#FDL\
-)Zzasz4SCD_^E6G1|1^H*biu^PGn*4um^CI%kd^P!J{tfwOUQGU(uOa`;mE@oKx8$GscjTXW3HfK\
-PBLB?4C;!aV<e&Nf$Uk!p`DgwE`Dgwk`Txx3rR1OaTJq0)9r<Uzp8PZ4K>nF)$v^Xr<e&LZ<ezyN\
-`Dea~{4@WV{4?K7{+Vwf|IBsdpZQku&wLyC|F_MzlYizr$UpO6$UpO6$v^X*<e#~o{4?K0{+aJ4|\
-IEwDKl9(nKl9(oKl4AxKl450pSgkjGv7=8neQY2pW3{F{4?KA{+S;j|IGg+|I81Pf96K=&-@ViXM\
-ULcGp{87%#V<N=10jt^JC<n`El~k+(iDFpCJFtPm=#nY;Gq1%&W*h^J?<XyoUTUuO<J?E##kh9r<\
-ToPyU%VkbmZ<$UpPb<e&K&^3S}H{4=+bf97Y&Kl5|s|6`jsk$>jR<e&L@^3VJN`DcES{4=+af999\
-SKl97vpLq-UXMTnJGrvmynO`IS%v;Gnb36HGex3X?zd`;#vUwZ%XMU6XGrvXtncpV=%<qtY<__}D\
-{4V)tevkY!caneR?c|^NU*w;82l;1ypZqg-k$>h7$UpOk<bS8lJIO!uN93RRWAe}Z3HfLKl>9UQo\
-BT6>M*f*UC;!a5$UpNJ<e&LV^3VJq^3VJg`DgAX|IA;Lf9Bof|3jPg2mF+O=0S!xGw)@174zPP?`\
-Ixt_zvcH!`CwJWB6+3eGOmAJj8Gz^L~cUW!~TL1m*(_JD3kNd^B@{;o-~&86Lzu)bK|iaQmP9GY=\
->K%m<Ty=I@bz=0nIob0Ya?K9u}3A4dL}N05K!?~{M#!^uDM56D0B5#*nFB>87PlKe9tMgF_E{ZIa\
-xk0$@jKP3Om$B=*KW63{r68UF7j{GwpPyU%llYizD$UpOs$UpOm<e&K@^3R-1{+UlE|IDY5|M$85\
-PyU%5<exc}{4=MKf97=Z&zwR2na7ZS=CS0TIg|V|k0bxgKPLaor;>l>)5t$_7WrrX3HfLKDf!>Q?\
-SJymJc0Z(pHBXn&mjNI6Ujfbll(KEN&cD7BLB?U<ezyG`DdO?{+V;gKl2pw&zwvCna?Kw%;%8*e{\
-uVt{4<|R{+Xwef97fApLsg@XU-@8%s(Ul%;%AR<{9Ll`F!%v{B!cpd;$4q{ssAGE+GHR7m|Nw7x~\
-}L?SJymTuA<zXOe&BBJ$5Xi~KXY$v<;3`DebE{4>uc|I8lp&-_dB&wL5_XP!g;nZ4wnc`o^9o=5&\
-Wx&2T6nJ*>(%=5`Vb1C^}E+hZU<>a4v0r_XXjQle%B>&8plYi!4k$>hZ$UpOy<e#~M{4-xg{+WMG\
-{@>&FKlx|An*1~WhWs-xCjZRWkbmY%^3VKR^3VJ`^3S}4{4-aPf9Btlf97iP&-{PnpSgzoGyj47G\
-yjqNzsv1^^3QxN`Deb4{4-xq{+Vwe|ID@IpZP}e&-^Fy&%BKMGv7r1ng2}wnQtcl%(sw#<~s7vd@\
-K29zK#5MaQmP9Gv7h}ng2rmng2@uneQb3%=P4-`7ZL$d^h=LUQYg*|3?0q|4#my|3Utl?;-!p4dk\
-EsUh>a;ANhZW+yCUB`F`@x`~dl9{wMioevte#H<EwmhsZzk!{ncNCHZH5g#0r<O8%K2Bmc~glYiz\
-W^3VJP`DcET{J+iZfAY_~iu^OLCjZQ9$UpO1^3U8t{+ZX2f9Cb%pLqlMXMT$OGe1rKnV%v5%p1u+\
-b1V60ewO?*KS%!G;`TrJXWmTynV%>B%rB6C<`>C7a~t_*eu?}uzfAs_w~&A4SI9r}tK^^gHS*8Am\
-HacelYi#d$v^WO<o``>|C4{_H_1QqTjZblZSv3j4*6&9Apgwol7Hs+$Uk!@`Dflv{+a(p{+V}>f9\
-CheKXVuPXa0cvGk-|_w{iQQ{4;+<{+T}}|ID9|f96lgKl8uIKl5kgpZRn0&%BHLGk-z;nZG3e%>N\
-<(%wLgz=5F%O{5AP!-cA1B;P(Gs#y|5Q!<(7+GQ5g;Z^QR94>o)UbG+eenfEb#HS@lPFJ&HLxR7~\
-2!{;*ZZ+HUp0frsS2O2(_Il=I7=7S6mVjgPvqu06pPyU&QlYi!e$v^Y=$UpNT<exc_{4*a){+SOW\
-|I8!EKlAs=Kl9<_pZN#mpZN&#&peX+GapI*nU5m>?cDw+|I9~|f94;Of97MzKl8EVpE-&AGapC(n\
-U5#`%%jOa^9kgi`A6iR`9$*1d=mL*PA31%CzF5XQ^@~TZvT^iW(WCaP9^`$Y2=?do%}OrkbmYe<e\
-zyg`De}~|IFjaKl6{tKl7>NpZPTM&zwd6nSVn5nSV<DU*q;a`DdO${+UlF|IBBQf98qgpV>+Nna?\
-Eu%x95*=4|rMJc;}>PbUA&Ipm*t3i)TwCI8H4lYi!O$p5R{{wM#;=aPTsspOw|8u@3QPX3wm$v^Y\
-Y$UpOW<ezy4`DZ?#{4@WY{4-xb{+WM4{+SENKl6p;pV>wJU*YyY`DZR9|I9PVKXVcJXP!m=ncd`{\
-xtRPjUrhd)XOn+s5BX>QCHZH*g#0tlA^*%?^3Ob%{4>uZ|692IPyU%NCI8Ix$v<-``DZR8|IFp&p\
-LqfKXTFU5GcP3n%$JjY=3kM2<}1iQ^OfYExq|#NUq$|ze@*^h=Jr4NXTF;JGyjJCGcP9p%-4{A=1\
-TI<{9E$R{5$f`yoCHSSCN0_-;;mlYVyzgf8?LJhWs=Cf&4T7k^H~J?SJymd@cEBzK;AeUr+v-Zy^\
-87wd9}qM)J@6C-Tp{jQlg-ME;roO#Yc~CjZR0kbmYn^3QxL`Deb3{I_xYpZqi5LH?QlLjIZmO8%M\
-eB>&9y<e&L2^3QxX`Db2E{+a(q{+a(y{+a(l{+aI~|I7{KpZQ+$&wL;Gf05h&<e&L|^3VJL`Dgwo\
-`DcER{4+O_f98kCKl8)npLr$uXMTkIGe1iHnI9wn%#V|Q<|gvb`~>-Dev<sZ!0mtX&%BEKGp{E9%\
-xlO$^IG!H+(Q1D*O7nb_2i#<1Nmouiu^M_P5zmmA^*%9$v<-|`DcEX{4+mC{-5XeKlx|gO#YdlC;\
-!YZkbmYE$v<-&`DcEK{4>8y{+YLsf96-nKl7{PpZPWN&%BlVGq;m}=GVzT^Bd%UGq?ZAKl7X9pZP\
-8F&-^y|XMTtLGk1`G=6A_I^Lyl<xs&`eZzuoE|04g)JIFut`{bXwi~KWxK>nFOB>$VZ{ZIaxKO+C\
-kACrIPPsl&>r{tgc-{hb9GxE>;Ir(SaMgEz;Apgu?l7Hs^kbmZ{$Uk#8`Dgx`{4?(+|Icyze{bWT\
-d641F%zGJL#k{xS`<VwDzJod5@U_hQ7`~c$U&EI&4>4TGyr1E7nfEt5f%yQ#4(0<5AI+R#csTPxh\
-6gbZHT==D-2Ny3%)`k)^TFhw`FrG_`4IBYoJjte4<-N1hmn8g5#*ow`{bYbaPrUm1M<&&1o>wkN&\
-cCSB>&7uk^fe1|C4{_qsc$>56M6CG31~5Sn|)DME;qNBmd0DlYi#X<e&Kj^3VJu^3QxC`DZ?f{4*\
-z$f98|PKl3T%e<Qd5$v?A${4=MLf95pu&zw&FnKQ^g^BD5aJeK@3XOe&Bapa%*$K;>+RPxV!8u@3\
-=BLB=kA^*%jCI8QG`=9(XPayxyr;~r?Gsr*lMDow<B>&83l7Hs2$Uk#7`DdO){+TC}f94$W&pd_v\
-Gv|_j=CjE^^Eu@IX>R|Mf97+^Kl4=b&peI%GfyY~%=zS>`Df&x`8@K^JcIl*pHKdoe@_0HFChQSz\
-aan21>~RkLh{e-BL7cu`=9(X7m|PGndG0ji2O6pBLB>8^3PmM{+TZ(|ID+=KeLDYGyjtOGhagfnd\
-gvyW-s|?o=g6j=aK&n-2Ny3%$JgX=K18Gxs?1fmyv(wa`Ml-fc!IGM*f)>l7HsQ$v^Y2$UpNH<e&\
-LU^3PmB{+X{L|IEK8|LeK^PyU&&CjZR8A^*&a$v^Wo<e#~c{4@WS{4@WK{4*~h|IAh7pZWLXpSha\
-+Gyfm?XRaat%zq&N%zq^R>$v?-{+X{O|IF8sf9C7SKl2UbpShO&Gv7%5ng2xonU|4&=9|br^PkB-\
-^UdU+`4;leTu1(yZzccCw~_xAZvT^i<~ztg^Iyn6^Iyq7^PS|Mxt{zp-$nkJ?<W7u%gI0U-^f4n-\
-^oAoKgd7xJ>;Lcf&4SyOa7VfBmZl;{ZIax?<fDv50HQ6f0BRZ2gyHkBl%~3i2O4@O#Ycyl7Hq$$U\
-pO=<e&L5^3VJ@`Dbn-|IAO2f95C2{~B)plYiz_<ezyp`Db23{+ZX3f94kQ&%BQOGp{HA%p1r*^Hb\
-!X`Dyac{0#YL-bntLTggB3v*e%oIr6`n+yCUBc{BNEexCd@zd-((UnKv`ZRDT%CGyYwGWloTLjIX\
-wA^*&;l7Hsc$UpN|^3U8({+VAV|IBZY|5e=nC;!ZEl7Hs6$UpPj<e&K+^3U8s{+Zt;|IF`^f96i|\
-&%B-dGyjYHGw&e(%<q$b<}UKj`~mrA{*e4PbNiqCGk-+>nLj4~%%6~d=1<8#^S{YI^JnCr`E&Bmy\
-o>xZe?k74za;<6{~`a(Uy*<2Zt~CkHTh@WP5z(c_WxkxpLvks&CGilUd6n(;rp2f8@_`%-te`|`x\
-w5Od0)eqG7m9a$h@E7bD8%yJc0QD!w%*H4Ij;%V0bw5L52r04>kPJ6WsnM|IEY5Kl8!lpZR;_pZO\
-5-&zwm9nGYrZ%!iSG<`Lwd`TOLb`Ec^j`~&jOd<6Mt9!dV0k0k%hN0I*~ZvT^i=A+3!^AE{C^D*R\
-~`B?JLoJ9Vak0bxg$CH2N(d3``1oF@PBl6FDBKc=NiTpDslYi!u$v^Wc<o|JQ|C4`a2l;1CCI8H6\
-<exd6{4-~ef95gdpLs0#xB27UN$s!g6*u&#iS+&s#kpJk*(o?naE9Py!AXKg3QiQ9AUIxdw>aK^3\
-+@u!Az1ot6Wl7eMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!EV6?g7fA17wi<AB{)NHvfw1aBLyc4P7\
-oX~xcgOc{sngl?hxEAxJ_`Y;1<D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaKVI7@Jb;AF\
-u`f=3EY6r3P9UU2s-;`|Hl65JuUU2vP=R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04\
-QQ*f5x48h5QlLU_xoG3U!aJ=B|E#mwO?h@P~xLt6Y;8wvcf|~?43T_ZwFSt%{t>7BLm4Yh-mkag^\
-b_*^LoG&<6uv2iB;0(dZf|CS~6r3nHL2$g_?w7^+7u+SdLvXv`Ho>ieTLd==ZWP=gxL$Cb;99{of\
--41A2rd`w73>yVAUI!eu3)F&EWsIqlLaRU9w|6caDw1?!QC&3^DnqdaEIV_!EJ(D1-A%p65J@bL2\
-$j`I>EJqYXnyct`J-<*elpAxIl2e;9S8@!C8Vc1Sbnl5<F6HqTmF<@q)YC#Q7K8CAdRyyWlp#t%6\
-$wHwkVO+#tAKaGl^<!8L*_1y=|z7wi@67F-}WUvREqr{FBX8G@4qCkY-YI8ktd;CR8^FN*UoxJz(\
-{;C8`nf?EZ*2yPPGD7Zmzz2G{*wSsE|R|>8WTrSuv*e$p~aK7MN!A`+hf-?js3r-R|QgEW+1i|rw\
-yI&CJUvQV;4#Dk$+XS}?ZV}uhxKVI};CjJzf@=lW2(A=dA-G(ySFl@ff#7_>xq_X7vjk@dP8OUbc\
-%<M&!3l!n1$RF$&cEO;!5xCz1-A)q72G1YNpPd!2Ep}$>jc*dt`S@*xI%EbV6R}e-~z$<f^!8s1!\
-oD)5S%PHN$^O)iGmXZ#|!S>EY82+F2Nmw+Xc4?ZWY`jxJhuM;0D3<g6jm=3a$}cDY!y#xnQqgx8M\
-T7`GRu=I|XM6&Jdg|I7#qG!HI$s1jh^R-XzYy;4Z-(g4+eR32qhKBDhI#qu>U?^@8gJ*9xu?Tq(F\
-haJgWwV7K4`!TEx71v>?23C<9lEI3K<NWqDM69mT#?tV_3f5BaXI|R22ZWG)pxJ7W2;6}j>g6jp>\
-39c1fBe+s<h2V0*Ucqj`1%mSh=L&WT&Jvs<I9YI#;E{q81t$oO7u@}<IRApX1a}B-7u+VeRd9>oC\
-c%w@8wA%2t`l4<xJGcL;0nRzg1v&>f(r!a3(ghn6r3eELvXU-B*7yECkjpw951-LRh)mpU4lCVw+\
-n6)+$y+5aFgIh!3~1z1=k6#6<i~@QgDUfa=~7~ZovhD^9AP$b_&iCoFO<_aFXDWf)fQN2#y!ry-}\
-Qh!Cito1h)%r6Wl7eMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!EV6?g7XFE3U&(45}YA8S#Xlzk%AK\
-iCkT!g-2IF=|AM;&cL;75+$OkHaEst3!Ht3&1lJ3$6I?5}MsTIz3c=-qy@K6>3k2s2&K2wwoFzCz\
-aI)Ye!6OAH3QiClFSz?@asCB&3GNWwF1Sr_tKb&FO@bQ*Hwdm5Tqn3zaE;(f!4-nb1$za%1s4d;7\
-o02DDL6}ThTvquNrFcTP86IVI9_n~Q{wy!?h@P~xLt6Y;8wvcf|~?43T_ZwFSt%{t>7BLm4Yh-mk\
-ag^b_*^LoG&<6uv2iB;0(dZf|CS~6r3nHL2$g_?hWGn3+@u!A-G*|o8VT#ErOc_HwtbLTrapzaIN\
-4P!Igq51eXi;3U&)F5S%YKSFlrXmf#G*$%2yvj})9JI6-i{;O_O}{0r_9+#$GKaGT&(!7YND1UCw\
-95L_>~PH?T@8o`x<D+HGd_6l|jE)bkAI9IS!aF*Z<!O4P?1dkM)C^$iIyx{J2;`|Hl65JuUU2vP=\
-R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04QQ*f5x48h5QlLU_xoG3U!aJ=B|7IFRsc\
-M0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3QiQ9AU\
-Ixd_gZoO1$PPV5Zo@fO>nE=7Qsz|8wEEAt`}S<xK?nD;7Y+2g3ASa1-k_o2+kLrE7&PGOK^tZWWh\
-;-M+#09oFF(}aQ7N<{sngl?hxEAxJ_`Y;1<D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaK\
-VI7@Jb;AFu`f=3EY6r3P9UU2tnasCB&3GNWwF1Sr_tKb&FO@bQ*Hwdm5Tqn3zaE;(f!4-nb1$za%\
-1s4d;7o02DDL6}ThTvquNrFcTP86IVI9_n~Dslb=cM0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO\
-2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3QiQ9AUIxdce6PEg1ZEF2yPeLCb(5_i{K`~je;8l*9\
-)!_Tr0RnaHZf1!R3Ozg581(1m_FR73>t8B{)NHvfw1aBLyc4P7oX~xcf<Q{sngl?hxEAxJ_`Y;1<\
-D6f*S=l2(A}gC%9H{jo?bb6@tqJdj-1%7YNQ5oGaKVI7@Jb;AFu`f=3EY6r3P9UU2sl;`|Hl65Ju\
-UU2vP=R>3WTn*=usZV+5AxK41b;2Ob|f-3}<3-$_j3oa0xFF04QQ*f5x48h5QlLU_xoG3U!aJ=B|\
-CUO1+cM0wg+%C9HaI4@J!A*i21vdz;7hET}R&b5rO2HL^%LRJ{y9E~r&KI03*eN(maE9Py!AXKg3\
-QiQ9AUIxd_v7OH3+@u!A-G*|o8VT#ErOc_HwtbLTrapzaIN4P!Igq51eXi;3U&)F5S%YKSFlrXmf\
-#G*$%2yvj})9JI6-i{;O@u7`4`+JxI=Ke;5Nanf?EVP32qeJAh=#|o#0x*HG(SzR|qZ_>=o=5Tp&\
-1KaIRpd;4Hxzf|CU&2_7jpQE-Cbc){I|it{hHOK^wacEN3eTLrfWZW7!mxIu8e;5xyzHfPsleW8B\
-Ou8IFx{}{KcEHS$}{;Fl__sZt7{dR8~deovg^}jXNPqqA0X8DZO`o{@hXIJgaUiHCGvsdlfJA2T&\
-?9E@79ildnZ*5@6?rp_pKlb{1|BJFJ^&7s+Pt4C=ob|kZIed0iN7;ed)maBAz4MjFcJJ<-wR`vOb\
-@2s?2NkGw{np=pnfjytC10&KE&J;Cm*@kls#ua;RlX>@s&=9Jb5%{5`tQW5$`bWsR(AE^q|s&}XQ\
-!h%yT*B2cGddMlFxSU&aTP7ExS5*iPD<0tDe>JD;-*P-d<g!*R8JA8_KRJZ`OaSYd3#0zw7tu+M9\
-}hgVxc%SFKmSSFOsfHV2Yj?ObGS`1YqY7A&$CT%k8mwI#c{ymMA|TDm#HvLEkA)7G-9*4X>0Qj6`\
-_*C(1C-taoDtA4%d->SR@Z&Q5rT3r$s6s)leCwuYxqg26ks)OiM-goH_ug6`}Ty_u%>pPRxW_BE7\
-X#J|)`f#gOn}xEgUjF#r?5YjfpKr=u+&O6JQ@(9hRqRp)y;H5UYv@D6)Q_D*ABxLdJ@kg=f;CHF&\
-narjEm-usRMD?@>W@#yt#f`DmtCE|MX#MbXti?nVRqFzwbRZ6Ht*iOc;_H>ko#sYcJ3Us<3+Pfb?\
-z=zMh8+E#djvE@_x#1Z^O)SsbkW%j?=H2fxk~v3yd}eQB}SzyGrl3pwljcFP^u~ms1tzYICmM=$y\
-4xiHj??#p&z8xlJ#3$LIR=<!{R#v}wl>BdUT?CvTfNxK6X?bDcG6TRV=l&y}@<l`rwR>iR@)cJ1i\
-Eb3|oYm9Gv<|C_s$yqJn})<?#UC|foo%h;4_?l#)J*}$3lRd{-XstgC)WvIV*<hRjbd>A!UjBmVa\
->aQx+e069qY3Yc^a3x)?nff%VwKl0k*&wg9YUd`sR`GMYcdIix-0-Q+4Q2c4PXNa4h_@@`fhw*z9\
-vl?c`HN>wA#b2H%`U&#p^MMCjf#BN&;?o9HOAeRN2#V7i>05K%1dX_tf$|9Z_bxbI_OJd$efDRuU\
-V(v-q|{R0_SWESZQ1<6<(*W@J`*4PUm=i=LKtgn|xB$%Fe&POTkH1fX;in_{@Kz&SB?;rdF-Z#M7\
-_Kd~wCDICK4=S`h4#+nIf$b60_X&7Q6PzAUihm+9SZea{@;vh2mpnVL8HxJ2`TEf&WwH|wtNe0r^\
-|Y_pUhui1+JaJN<tRTt@c=bhtEAFA#I`FE=Nvcf8?_dAu%^$(ddwp?9h%hcajsJ}0_{=T(S|7o$=\
-(0b<za{|{pS6V-tt)CmLpPQ_oTdbek=oX~+rp~WzMel*O{`%`C44Xe+_m=v-kGr__U3(XKnWUK*b\
-s6mD#2D=6cWZbzC9s>g$9=n*^=aRCvvak*o2AQHHha499p9dQ{z2dO^wJjI(>DJ-J^r9?PfIt_Qt\
-KD#53-x}4IS%8qy6Y4KT7eVbc@8r>e(^V7m%S^58o)OzN^ds;`s1m|BL6R+bmYUr)}d)dxR>n&c$\
-2Ir9Im}vgfHwbEUd;R|Ldp=Ssb5);ng4EA2fb``8?Tca_C_j3=^U`|!MMEB57iS*xW~>nmfab+JW\
-u2G=_~t)DxsGis8M8{W1yS(D#vU2OV$X7-<x-Y}J>PrGpNF3iQ&Y}J_kVK+~_-uK-c-psoxf!$oc\
-(zlz>clLcZi=VW2V_$6co=$kvx2LXu^?gsCHr~@V|2>^^zi&^+JVi_SU2H4;F1D3^7u!m|i*2Rf#\
-kSJ_V)IKYe$^H<t*|n)E4NxHh5G%XZNA?hY_@*qYCV60t=Lt+dAp@p7f0TQ%;w^`9kzYLR{snTvs\
-OxH%w@5(V2#WXw*=lvw`A8W(@S@LaG#Zm)aaD(b#woJ)g%l$-W*~V!DTN7%kp$A*r1M~xhnthz;I\
-wr(%J2t>TJ+_)dPli8m>`U30-;X+l<_)B%P~uTJlAYn=C6uFI{a;Y)#%E4OL4uh>fg%ROczf;&z-\
--o&UH#0FrP1=kDFbL$7MCa&A?B%~k&yp1V@4`a4=RccuE{5cP|5tE>d&FUb6y-G{I~Z7W!}PUx@i\
-NBbr!Y_qEN+82WsLBV6D2-2wtMq?3-<|6Rh&|{BS#c;ZPBqux-SOSj+S@UXIGxzb3r7-V#zf#aOE\
-IZf@fohq#Cr&Y0sY*xTCa~;9E*d*(ZL*G`>wWX5E#~CZaLT&R)20|w^%~XYGNxi!S+(>eDh9csPu\
-0~{9k=6T`#5H)YEb3eSY5C&$inN@!c`-xof~z_2b*PAZ8jA@`+~rhplPjC<!`OZ-C{SWE_#(tZ?$\
-u)stT$E<6mDsDDJ6H*G!eEZ_WopRG@=tYumI-XJ@tZaaAn(tURb!+Dhlo4#oB<y!8ol@v34Q77)i\
-C*wj-T8~m_;?D_N||JXF~c@ckbeU4~PZ1G=e!gO6nF0$*0YEdn(%Dr<+mGhP<Rk=54BTGZnn?qiq\
-dQ<JZQ~9oT4y!VrAx(IIV#x;oTZMf}?`$xCZB`X&1Kl!AMQWvn+XcZ_dc$0wYo64%t<Hm=*}Z#G)\
-mpWr%JtVxsd}$-nA+o%D&4zqOLo;6y2*Tl`Z-LW6y<pM86&pq4>2#UxN}f>O7I<Ab-%g9vPYP8hM\
-ux&foM1mz2>?&yFSa6C+MTA9+6%7nrg$VCcXZi+!Gs2X}r-n_!)WAv{&07O=UeTO`UpwI8!GMGNy\
-KypA>ute_LTpjUO@e6z9@FL+^()RI<X~P{|8mDDCM`hQ_S`Lvx;zhJLvsjG-L`R{CuArB_-16z9H\
-2yv?m${_}F*pS#}*{BxD>&#%7~(6o*>?QIoAF1ldCFMRh;ePvwz{t9EZX@=>jYRoe~YO{m(@R=UA\
-gG?7dWwu$+bOll=6mKv^qW)B3{<Kb)V4=CW7c`p`*KELC0)Ky2wRJ0JtL5~GT3<Ow{TAo<+u|nuT\
-hY)zE;gsm+UEMsMRc2Pt~P6{ORw6jQl;Z&r8#)MI1?$cSZe<vAe9^ZceB7Eb#P0SyvRDZnrHR(S$\
-^PRv*khCFWqelln<esZXHYQLs(`X!Yu)ZaNWID1dxZY)V|;S%`C9QDxW2G`8;Dn#1E8wyIPmd4do\
--Mt+#!Lx!;7?<gE=>AB?&=ojb(ry-Ih-Oc<tkgt-q^<!_;L_P{#poLOb^M&}B%cAfERo$#hr=1ea\
-HY5$k_u+_ixCpy0I&+8)}dW}wq`7i4`&o^l##pf6N>&g1gd$clc&CnZ~^_s25PR4zA3{oEBM_;{{\
-S!+v+)fE;0^&+hptDmg*9nxW|?2}1+aT^{YpWNFwo02_^B$fZZCa(YI@cLh8w!i3!I6Hq<+4YV(`\
-;4ro)P4Q<A=b}fl*(J@YklY2YGXSlSjE5_Nmd)#{=nCI)3v^GHb-}`3WT56>1wsOfhylM-9C%&JY\
-d2RT-fLB$kP|I3O;<yzi!c?=j|P%<R6NyKR~ay+3Fu2;L!0`)fDVJ$TVum!_{kbbTC0<sqCK&(l5\
-EeSMz6Ywvs46^*8^pbA7+m>IYQavq)OsnPWOEXAI-B@@gxbmAbX2NVaf+9<fFh^Ns#{TCzGw6inL\
-?&{c>-9aZJmROPE$QL`{G`mJ~B59Gvkj{mE1aJzD_i0%i*!Bbnzu*W7imkT!A9d`NZU%W<+P=QI^\
-8BTRxGxU#jRAcPxWY9mgb2G?MovY%Ba|!jtKGJ0J=hane7gi3oY3M2O``k7t?y>^fR$2aH=Pi46-\
-u4%>+Z85s`1%l+J!oWgE2B=5><8`KgfhKMT5W?KSy`4n&bi^&@!Mxm;M0k-PUlu-SG};PLmkFk_1\
-h-h+po&@2)k@wUWbDvO9S#Vb@5l{4tsQvuXj1=9(^Ah?)=pE_tE(G_<N`=@afP~HVpk!voCL)kWY\
-86Ep+D^t%Gmlv2^1aAx_;EN3%|X->e%Hr}kAjp02k=+0`|AHQe2eo2);n-~X&{@0HCaB9$fU4J=a\
-|&?jI@)tlKStuO;SM{mg9Z<D&nCNybjyZ(lyf4umoh{d<-^wY#*eTu5<M(p<O)VZ3{2n&CEk6!oH\
-DOK-k8ahIc(+!IsVHr8i4A%{dKhWZdydk=BeL?6aW;=AV@Tpr?@$H+#5G`ZXm$ekfzfW;I&#s>@g\
-}k{?150t`MP`UkA7OQ+J}osRYR@$z=!oe^tIa|~M{iKINjI8l>(@VEwGvHsp%>Oahn`|i+k#wM;1\
-j8Lr-vH2T=n&+tG>x!)M20IGjw+=wMn7y%uls-eMIw*QpcnZvD);)n5LcKs->ED90G-~QQafAulw\
-3Gb8fG$(T6gnI(Nkso&QxgjwXNR%r1U^NOhAgg7frM^T;5pT3qt7i9<RcG)D9>mB4Czv(=|_HvM6\
-?wexu<X`%GXr|#G6JIOV*^utQgC_b$=5q1Wv>pRE1*z>7WNt+#hFW3O#_sAz<<Lf)0RMl%o^_1%R\
-5>pHf3!z3A-Jx$e+on|gYtcKqt5(skzWA}l7eA7G1ANxH$KS!Xr2|!P?YvBPwAZ*h)y-%^LBSdsU\
-#jC4?;2D-g+j@Am2v0qsy<jp9P8>{dADD%fh9)U*Z<vq;bzB~A-6Rr?6xM~tt*!EQ~$8_Gdpl?qQ\
-I4D0#~~JZ*7WI4Njt;COWA*(Wt<1rq22(Q%^^6JsoB0=_twyGp!TznTqICPZl@n{|+i2Rb8ofwzz\
-qar+L`%I-dM!liFA95lY;?&ptZo)(h?~KZ+Lod=oFH?l{Bi%yO^CQ;e%Nhpet^+MlsK?HS*>Kkpw\
-9LQkX(s-vy0)T@2IW$1mYdE?vE#_P?-%j5My=tbkozGoRT<+<Ec-+*@AMoN7b*;kD3Mw)%Mxgciv\
-t8YEdcW?DC=GDue<O{?Ok%^llzCeE50vAa4W99;}H*>2>@pt?|-PAMbSVsAFdd4$!(vA1a2gk)x>\
-F9gRqrQ90({ztf*VZVwwhnt--!0bJIO8s}H?``NsvUHpsf(=Y>1=)3eb%|(!Mb2mOf}eF-#0ehI4\
-Ew1?qQ36`bM~etasjS+F{P+^y41-v4Va)80RbRi+o|++)wK9E@P|nAM>4sn%WrwcbU{D=q_``UVe\
-9(o1cr|E~7(Vbxn%7*QA@>HqOQpUf((RPWyH;#oUYZe^vBp?!4p~dp^X$Is{LFd&-UlS{ZG&dXia\
-->TA_{s|uTY*(hK1weDe6X5f1GSN0zDwyK-P_jrtIz4dynub#J;Re_{g-AXo1QFk?3PpyIVM%_>*\
-(t%9K)2ruJnYjRmQy<|l`xIYf-&w4?+k$iORx`2Zdne^cCK6ev>5_H6d#9FnTtYkAT|QIEHRIvVu\
-KSa6qu<$R-_GW4@a=3gZMnw!X?CvmU~bl<#Laq??`D09?`YybynayJg8i(5DZ|@%yt-tzySq(}tM\
-21X6Zt-#zdV}4uX~OP-?}iY8@b)Meey4OVc6>VD|@~$zW*49Bl~cFyD{Q$^p9o;M{^&BjjKemUf-\
-`(0X0mdGt_VdM3wt*qJlnx&e|4V>*?ej$6I%3Y(bipuDpqF)%yGMof{uDx9V-?Rz2ZD|HhX7PMx~\
-<jrhuRHx2tr-~0~L|E(GFRbZb}b*)*jrgB?1mrccAKw01UwV4`LnfaBUx_r68MPFI@k<MFdYBW~Y\
->K#=#>YeJ_rM1La4_hs)+Ptsm+|ULuGK<yH=4)ts=4SWVi{|z>%(vf1hxu9)TiSeUt7t&`8gK3E6\
-4QHFIoe-sTx--6v%y;WLCcWuj%Es$cbXt<{YCkI+Ui=V%%)YEyUh`2`_}x&t!9(v4}L}Y{0h5QW%\
-)erRjGT(w;8p}h5AlfU1v6DSFp)XKm|)^gd<h=J5|B9pSs)cY`kg)*y}QJ8~flko_f%4`N?ab^wx\
-LoxWn&cp0-N1?T21-gKmHQ-kQv4>Lzcj?k=vLt6RD26dYc8m)~SSUUBVef89QuU)<rZ+sAchGw<k\
-pwWH3p51S^juJNMBVT75V*|f{-sBvevz6jpe|E=ll4t5dj?6wD;&1t*hHs2WZQKsj&a>Um@>7IHj\
-y|3x85?(M>S7UXp-hOrC``y&ou$IVq(60L_U(>~8wpKabv~g-_+cmU3Q@g+1Z2msXTK|fTrhXZ$t\
-~9P{GKT+QkZJ6^{+Qpgr!@LDT~#@XRvBgeajNNktQ_L6-a>8FVPE_9QbWs7acpd&3*#QTFosyGb*\
-#59jL~0PooLmyqkXH@-fR_FO|D7?6KB>8vM=6eYE5rWvu%c!&v?{V#FOsyb<1VlX)3qbvR%1Pcnm\
-7{`}e~UQ~cVVW&&*82wdsYM`5Lh@7I;wE~xdL@7?NmQZt_jyapc7*T8bT2IydK`775;{r!1g#kJ3\
-g9-rPZUaVF8SN|!p#_PF$;{UVvCD2h7OT#mPKtLn|A_h02qOvGNHd$qn!2uEoOCT&^-}fcMCSfrN\
-Fpi@ESt7fD8WAN5Vno1UP4Kw{MTme9l}{%OY96A-ZSr?lci-E6Z{IsJ!1vDizw>gAGWYg!yQ{0Jt\
-E#K28F=!2t+#Qjn(u3~NkcjG{WAxYkvxt@;@i4M#h4{WF;!>?#b+hEMF49`webI8{UzH(K%kI;8`\
-QP>`VfcH<khoe3t3Eu<^PN@cc2j5zZ<@VcL!Rd!Q0C2KoB=MKqQky@^9n<x7C7WpQ;~Vxv0cO%qG\
-JL0g+F87OMpG{-?rfo<&M@y3gv$tQX+kQ~Fb&+MKBV^~JXf50Y(zPzU)ZlSA{j_JJtTLwSqv`>3*\
-I1PF8I(Qry0hlX*xxc(6SAkO2@#;lxg(Uxx!cniUAqc9N!zYPMw=OZX#CvE<uyQ{y01_Li`QLv>-\
-0gtz=n`R#<6?}-;eSO~nJi<tGlklj<Iu&W&J)*;-&Rc|OZTln`9)0sx5Ikz`3JZ^Bd@O)@<&IGB=\
-*nv{JZib$9FNB4>F_B1uo)gbxR=8U-%bIK=53VW(J$|EE%xq|;L$fP2>@^UekgdfVUx=Lj>+)IpQ\
-lvVf-3lK$u+{G9D+y5fJglRj}oPLlq}-WiM1-yBmfi49M9p=pBsf~4gMF0M~Q$({m5dCr!`*M$?#\
-}8S>m~50mk#-+`fkc=eReBWRL43wdmue2+!8?K=}T>P+*z3Q2~|ns0@~y-%~2|Llt}<z6G$%xp}Z\
-mTcZN*KCcdzZ;7lX`lDd5On4&%SSIi0V0qUL0hWt1wXj^bHxyV_+@OG}!4VlO`|edLM4<}4S#R>N\
-lm|MH@Q7J3(!-jV2W-a4I&nl7y@B=EkJ!nuI|*A@id<)qI^g>o`Z)>3`25H98GeHJ47-omJmRs-A\
-N9=R<72cgMIJJ;SFL1Z9_)hF6u2hwp3=pmWbVYyLeg0h2emThAO8k$rbP6*4EiOnlX3_Yr+}>1&O\
-(AfsJkMb6AZs6d|ekF^0!q0RVx=N_&0%)R~D2(mvjsgVcby;cVZMi93)*0i-7rYr)b)9$@ORgt^#\
-^8shu!eoMOq$ukL`E_tDIJ@M~n|v$m0$yOWCJF=EikD|4@eN1H@qZ4|&Dc{)OwJ2S6qPxMGYODV4\
-XC9zw<37#v$B&5dSN+{GJ1)h?f`9N;Nnp%39EqXIH8jp3PrxjV8ccS4HlJF5{F~jfA(GdN1NBWc^\
-s{;^L2+awAdIcCopiWxCaEB7hMk$79$pZ2q_^4Iiq481Eq8<<Ff4{<yI1w++K^r~gac*S6Fg^~kI\
-*~I%wOUW1S}Bd0d8Q(o;2jdgv{sNTjyTejIDQbXFo!n8JMcKnH=zs=6t9=n;p!bFu31NZ&0GcX7-\
-OYquV26Kw)4=KN!Bmcoq(8lS^>X=-CTfZ_)d6#4_HMv*0vG~_%$A0k*uQHURg-mzAL|$(<N)!Imc\
-)%wN%9~>fPIo7j?^e@NH74hEUAw6*Y@G531#>)$qFdES2!0N+@nZMRifN2<O76jsHs$nj}@ipM<V\
->^!UA!$hXV_$vg<4stdzI+lVdb(B%#eYoX(08R62*N8`11iko)fL3WUN_&wswgS|1>yM^nB_ZO@t\
-3Hs`Wn49Y>aB!&%fKqEGLhXE7yNE`O`D#aDo+)}5IA4``Z=_#I<~=+0Q_LkE4={%Zz^WRZSp}qOd\
-!90ik6xmFoTPpMt^eXH#ISG{oHUa1V3ZJd1+cyxNlu~M<WvN_%Zv9C)|;HJvDOxn5J|AsVjvbMA5\
-VCR8sQR%A1PhP3=nC+!hB0Q12gz;EZ9r?uHbO@jiN;Ca6gH<?qu`dOZ*U#GEkYy0Lpy6sH_gO@(W\
-14s8%lVlDQRl+R<cnFEWpegfQ4r>e9n#D0w^VOpmZIzDQ*-tVUNd7+}itpGWGz0iC;W`gTqNh~ue\
-(<4Z(n!HgbZI!7dwM?^#cofK+Cp(r_>FuvdoPB6c2HYJ$ZYb6A;Vvn9+64nxylIG=UrjrZJ-~=U`\
-15p~Xsk4^w7t9)+3gvWj0h=kPq9>kK+suiF&3j95D*F08LPfQ;RFttsN<|4<2^IYyQqdN=5=$%Vs\
-c7A9LPa$fhfGD4*T|^o?IkJ|9a|(&QOn(CRMg0gJumG!L=5g+MHGV}`T;)hQWbU7d)$bm$^#OT+V\
-`?RQlVoUP!IUa6>|IRUt55<TEnJ^Mgn8p6r~$uF&X2pQOrR<-)BQ(^ylgZSm$MZ5N$}}n^yGN54e\
-ZF1uUV6m&aW&>Q0JK1M5Pf_({ZajKc#0TPZIFEUT*Wi9XMw(dX#+#NaJqh-^=6fZg3ncK3%^*K?i\
-)(a1+Xuk5o?==1*llvR*ef><6b@$NA`=C}A=F2gW@^(pjNKFd}<E2_L%`E*<P^r-SU?5tf(!W!co\
-o-w6@L$;R7;k`c|oG2BD6;X&yEeBve?O@V`TGW>m#i)WO%zG)~03{y~8Z6fI7OOTX=9=`yO_q};r\
-QG|r*a|#L(oazU`ng?G{}x>TNy$)i)cX8)&moTCzfCj#<6E@>`w}?`;8aEyfJEt&FH~pY_qOGz>o\
-aW8pIHvNODP=|Yg9vR1l0!9MuP6ObSZNpsDwx9ucw)GZLl$uudZ8$0Esn^6QQWcE2C5une_F1lw3\
-s~xlx-rz%Ukya=ngk5zd-7-;}cg2gRJ6aJE6qXa)gHpWsvqaJnxF$hHrw_T8J*el=g<v>(4|!fA<\
-k0*<NB$Il3?{udd~t|9jHj9E`Qrq*SH5;=AK`i)n^;O15~WN@h&ItIt`pS-LxIIot$b&XOP+>A^q\
-gPXrT3<j67R?6VkWXc&_er3wwvO?f+)|~=}yZVNl!wn6G!*y|a<FTakk&1=74Pu0z-Laysa(1_Nl\
-b+qNCb!Ai-RMnnb{D@%!|qr=|B|!2yEkdr9jm`y&hD;kl(4%q8)f-P3<Y40^|7x#s$qS%r}M0DS-\
-QabSR;HC$FsiS=@QoGUSiJr?%JrbzRk}FtS=m6TGL954>FOvaiw6Uw8U)AlqQjM1>1;R*d?syj@J\
-n<d%+nFqkQZcfl)FUHz!hLl>4Y@vZ+&GZ`*RhV3fy~@Ql)zD)clkCmcq3*IGq9<?wB|kz!34V;&b\
->aCs$VIh$|@Pv$-l<%JprE0uVVB1gI}LZdjrk`{7GMyqF;E<t9yoSHN(shZ^=1{|^+rHn6~odvuu\
-huVy=ZkUJNw-}FdxU2YvVVh0*(O5@%TA?NNR!91jLTkxvtPuOHItKj5Y94_dEP@t&8x1(YXtVv|R\
-q9_cE0`LCYrR5i-!n^C%I9A-Lkhb5B{OLoA=0$(3Tlc$`WS?OBM4A#?QmChxUMRJ3VkXNVCYc8vK\
-sPhl^IwZZ9*CyyqlD0tif5vxuWQv^5!cD=*q&_i<RH5i@tY1p&JPd;rfs>Axl8c1A63alocLwu3s\
-i1r++(HxluDhLC*Fw07N<Ns`2j5QAQ~0t183KSqAty@Wt!F&t`PoZ%hvbKO<@FwCMtV{<JLw{OmS\
-ehM&8ir}$~lbtC>ZH%g18u9INJQStQG2m?G#UKt*q?)Mp3!h_@MKU<CQb<AfneASsL(VA?L2A#u>\
-l1p(h2a=%)xY*iW6zw@lqL~q@daVwtSHWCQVmXJTzh%%kOOR37+u{teTCg{rWpez#VbhOf=P7)HT\
-^Tfa0$s`SmkAcknaaB7Z9_{kM9Mh%viXjNtsA)|He$NZNiVkIkb%q`GQk`@E#moSx<Z?Ox;XHzbl\
-?Z4$Oc}JE)F~<=)hrZun#lwjQaXdVt-PFm6yS(J<aBe$6xd)hgi8fQr}{P)z7@Zu$o7uxd@dI3OT\
-X(lFbQ%i_!CPJz8y{849+LNMxLPNsm@u1+Ba)SV<lT0#=r649jx_d|vLY>lubti&eDR`HO;9UaO`\
--@-yP<<ZLFZ6FZr8zlE#a@EI|BasFoW)xm?`!q6&PgI3uxwDKxw6>R=X#DV|3i41()B-y}cED;BO\
-Xj8C(6SUgGe5)J(rA4bUD@ChcCn{)#&&{?Vw8|0C3J2Fq(W;S$p;eX<e=PsT;8ZuH{Y9CGxQ`Y?L\
-0fy?!sb8=s*SiCGxS2>Dhsqa5&>efF6<|ZsdZ`xQHxp97Q&>HH<D#3oWP?it9^EnxQGomnlDSSf(\
-)`*l{^UE&S*(SO20OFkvO*f8^RIJ7rNE_FGj2N(>FoRb^mu(?Zt(%RU2pxdDZ$X6d|*f9Gm*?94~\
-`oy@lecrLMm@tG08T>}z||#IaRcAI_>3xWrX6k|;nTd}AF+nNvQ~Rz5STyeThH>^{s(6v6u%X3|&\
-waRX`E=1Tk9<t$52``hYlx+JX(=iqQQaCq7`9T{Qq#e>7u?Z-wyj^euLmBStRSqGAsVc259PH_-7\
-{SdFb4`F$^Jm04NZB|GXv4tV}09ww{4*NQwPc%5}Ds*J0Xfl%FS|l}ttXJYBRZ7yF{_aFDEEH=gk\
-)1fm{u+9+kRC~vhb-CG+#RDNBQ<IvWK2tpGMKspOT;8DzV+c**v?YwuSjHC{r4>?y7aNSykIOvgW\
-JMmb=)R30|=B9GeoMriDc#2;MJyLyRuYvSQM+#!hEkRP|}I{IP>JxiPULBW6NH%RIqVMK;g1+umZ\
-Ls1zj1bUrIpdtOMb}m@nE((L$j&0%tN@9lno7x;|*H)ySJ_q4i2<g1c~JJ02?xsn%io3EF}+z-an\
-6M$x~c8>9c$d87Awk&v_6n_`$>YfrXG{w$pDYNUBNwr`u2Z(n6zUT-ta=jBO^qYKIi#Y$u^oa)O4\
-{*Vi3)%=bz7PTxEyGU0VLIO*UZBXjOS%_z&(U&I<Hy_!=+2-ZlH=38PTW?<8X1;m({H5mQRi6zRa\
-zD>EhTLa^2;|)BLx$Y+vF0O-TV!6IJ10na5S&X40$H0U$oN9Xxp(IoLvHmz0=eGnLWbN!v&=`fHw\
-aF&%rr0mZG(CFn&sx@#}}HHFMTm&$UQyR7;=M?3FPj0DP+h!5(IM9))|xo{}fIlme5IrRy%!tIJK\
-Rr;nZF`$GA4*&x3>T-)ZLM{U)2iMMyc{ZJqXX$*5+pk+O3r@LbV*f`LfUemzUADLAdXI#DVP{Jcg\
-k4lG+JW;^BfN3<u8DpVzcEK_+%3#9UKnxj;c>426ob)Awh6{a_Ioit18Q!9uH#?RqMTFA%qkXhQo\
-TcFmgVv<=dDN*#E1-PWa5r_<cG^Irxn4?DkJd3qyL?2JnABIceWh4X{$e`N&Vu3l176#c*N(ZU=h\
-A%Bse`g2TA(sb{J&IPEm;2_b-@1E&`a5g9dAsSU=H<o1%*(fM-|8}7{oQJ^dAk_5d3nx|AnnJh-#\
-R}{{k=Fvf6GS<x$Y#z=j(&DT2}=e?h!LMB_!$$gK<<`D`gy0W=R>x-j#C3(R04UR{~UJ&1a9>f48\
-!<xh0F)O&5%w$@#e5r|tgddD<+@q4Ymtq_+PvW99w7aDDyv*Y<yhTi$<@>+1jY7qtC9K0@CAXLAj\
-2KoK{@O5?$aAhi8z!c^0{Y3@uj&>ck<CfAPiUwdP`{A>D}*k8wFT;C46spIN9F4S@TvCwo}&nB63\
-hqFN>u*-8omNYK*Hyw%XxzHfADl`b)H_h~G_ou0xuK$W4^0(Pe=1x?sGYt;oY-aeXE}#$eE{gLrx\
-46|WZeJWk{~p1J483whu@8`rD)&=6dZV|Q^ad8;m<eiM)L(I>*vJ$ab^Jkp9}>@t2aT8W;=`#jUM\
-!0s@Ib^I>#wRoe=}3H0#%G+2c_P0i&9BKSIW4ir;-rm)<@91=(eTZl3dPHvK<Mv@;J!(ysN5Y0~#\
-|<KFCjI=_OYtWtmV+B3<x~Hna$-kBL}-5uD)DD0Y2R$0z_AEO26!|9*xXQ<+gdiH~=fJKbnsC$Ix\
-xeK%Cg<!4NSlOi9hacHQL+WDd9u%o*Uq5?*boGn{_m-CVg1>7`dkF4Xv=?uC_WxVlm+Du~#CkckX\
-PBG;H_ofJR5T;aaaq*|e>`d<Ra5c=}0`@7k%0%<jB)Mq5VTL5bzm~tbYs%#*16eA0Il+Q`=bG<5^\
-UQ_2o`ienE;|nWSrh*{RMvqqE<Ijv9K|5-EK~2$i}d|E-4w3h_c!5Qu6UJu-RjgcB7p)lJT>o)9p\
-ujuz3Z@%q7p@Dq!1t6T2a&D3Jz;Q*nI48x}2o{oOXSDY^FhfJEjHYV`usce5|0q2_NI|-;)@_8Ee\
-AO^?r%Afq5IJUc(6}j87csE<+oXNgHIz#}*|YoAkCm1&9eQawz!gc<q+fcd*{3Vunq6aA-!FW%jI\
-<4~A%mvuY^Mn`<3YOkr+|;=p7ZC^41M%;6@|MwDK%SemZCjVGM(pYEj{e@0sH@h2wVtnqgpcw^(A\
-y+}L$dd~zOf7XDTHU3J|ZfyLoj?|9-+M?j&FYJG_#y@uUjqHPEOJw`t;RJObJiWwdADrA%z7MXNX\
-lSBJ(cb4`)AGyLlC`o+<Y20y;xIiY{Ur9^o6Z6u@DLK~BXA@3(+U08yFROPB87Rl6Gs9NkWo)Ie_\
-hJv<LC?83w?xtiz&eIa}<51?Gsu382YR*`1iUqa~}*i2Oi-ztdw5rJPr*YS#?+A(2mE+P?DkVcy}\
-zTv|)f26whK~1KJbgt>|0ICu>b15}Zv8(NI7h1mdfEXg~AhJawdJ#;XvY)H^uD2W0%GA^ys60pe?\
-hD-b`oK%K{~?jb<@+3s3UWOtQ8d~5OzK|FoF_A`&AsUwXXt3rHWm*5Z|Gv+@H@h_4Dh#yT-AYNst\
-I**O>LV)<(d0J5PA0dNy;^Z5GxHU!lnO^hNk!~BLLVVeR;1K_=_kSAVBhmzj_eoPAzIK2*kGqD10\
-P)`jYe8{oo($s850XMW_(4nL67itr*TvF<mL~@34_XF|*2w1_4R6LHA=9+4`v)o(XS^HHBG?`u9!\
-0-Sa&O=`dmp<(@UKKV()6@a3l0BL1OGSnDKGciSlvbAx!3~Du(yqp+G6!#p{2_H-?5KeElwV#fq?\
-lfsSs0~%U#GElPo}j76Byg87V*_mqG&8=-<6KNI1u8#DQiV!9(>k5+{zo*&?nEaT_a3VT+B^GJsz\
-+blNG81@zDECwlvh#g?3OZ<OE0Y+U`?lQ#}`8iqwX28;NS*M|+;M;l^8gK@^#(0-^HHuUPjW5daA\
-#@MiWMA+DHwYwY}x{tUqY*;tS5F6@_HO7W!DQ4L4;1fD*xc?4<4Ij-9h7EbsL~JM<uf>M%JIk@*i\
-QzW}i%-WH!s11{F)Z%rXa<XtVLDjUu1#Rkb6hZ3Or9vhqTO7WxlM(|peM*1Ei9T2yFSX;*V~XX79\
-|=}#*@9wDC3n;JY`f)HKvTGhlWiVj!|;Th#Pui*pQoOhz-tO#@Nuhrx`Y^Pt;*UR4sxHrB4OJhQ{\
-qhY^Xj;iwzqR<k(Oz#q2iD+Jhyx{i?pTyo;-#go;vDmfi-Z+Iavi?w}@467o$zxo*7t+om=n{&2B\
-mkkrPQVq$Y+(iJtpw`1~5bxzVGc1@NFpjK~o1ghBLK{)frv9_Pj6~wPE#xj3-pBg2zu)8XVed`1b\
-*zjy!@PrKuI;8)@(^!%m{%l~uO#Ruwcs|BRZw|<Dcy4dm)M`=E@5H3gKo__K$wEEva{x3X{0MSV&\
-FHP%PL|8x2RTl;p*IIo1d-RjwBdLH2}FQ<;{Te;mIPsaHD)I%a##<M@4&21cZ2&(iY+Xd4ByvkXQ\
-7J_v(*<w$vB!m$xD+hweLVlJl$R##ahl4Th<vw%&~+bS$4Au9h6Ij>9uctY>q~VCm#B<0<cXovMW\
-<bxEsACm;NlKa(y0W`ax4VOh%BX4>1@s5Rhg3U^BhO<N*H5&PE4<9G;OU^_+=5)8a%@uH1a6l$CO\
-I$-mme3quP!_D}7_f}WTScwUO!kUk<g*lEybkJCUV5{)daiKPad|Djiio+FIB(-SCjrpXe%n@a92\
-$KTRM=)O0=(4WnKs<r-}L$BjJS~xqA9#FqvS5IbkcMQTcgK*thZ9~AQAe>8$sj#I;*8=St#g^1ZX\
-?#x^TZ^@-@LtC0sHL5dknwTW36ot&oI`Xgxc#+`B=u&O8K^I-bWaR-wDbB)N4s)Hn4_&R)Nr(wdf\
-&9sHfkmv?WxXTj`o+1hNG>YeA7nzwS2U%b_sK|?~XJa?VT-jqYch2>?1{P@$N)pZsF={!q;rvAcw\
-awli@~=37MlM6?3p^*o!2w6UOvwpCH~xn9~bj+SbK*7U|wtIFE@}&NEcEa_S;3_dd6A5@(E=C%FJ\
-8-ykzMJ=^vA;B<c*37kIZ9WI=DBnO4l_#XcmI3>0>gHz4E*9WH^2@*KHk{B+WcDD}-r;gqKGjPft\
-Y6ho$9j*^f-;R~QDXmwyaB>HSQ%tx26*#%nykfs8=i}g5M(;asCe!43J%u`th{=vGKO%A37cx_7Q\
-hkFMx#vk>xM<F4WtP+`R6wE;dZBqQep5fxIElwc%WE=!>o{}Yzk(KGIlC;BOjQWmW)_po#^vRT{#\
-AdHqCtTbVD6*5>U8`=ykfreA;goSQ5-COF8F5-Cih6XNrD1zFZ_6ns6+X_LywU=iK!W5WDlm#!U!\
-s$5hS=u<6R~3u5anN!my{v&2j!7<UWIZpQjnTA@<KlnFd@)?_P#%=YOJo%6F{4at8vOztWozs*fZ\
-=%gSwXS%$eV5OlKQUH0WNeU;*UTvPtuYpR%f=Ef2w3=U3+(&|oFj<c#JB4&>BYZPJ}L-35=YcI_3\
-rVc>mMI`ZpqHy9H9+|p$q5}g|7Vy7^6t}rW&6#^%HrMw3?(||(c%6{N75&r%#02yzVGH;AwIrrQc\
-8qbr4Tzv7#z0jyuZgV<RLc|d0eAMdWvlb^W2}26X~q7QXf+;BQdgtx5M?zM4@YJG?yw|tjXeK|=G\
-CH`slQn5ZpMz{q(<`|5)RU#$#rp%qK4PQLAJKIVGhz{q$yvpJYvol7CXY`3!il2_(Exd$QR<0C46\
-C0GT{pk3|09;{s4h5<n$2u!t0L;e4%@HfiLvvq~{CcdTRNCvx&+V>U5Iwg~Nz$d~fzqG4btz3MT%\
-Rax?itOyltQLaT(3`NBU>sC?nEhXuaSw4uTm^83p8!rSqNd|^!|DPOpl91>s1iwnXR&OEB)3)c`T\
-`|9>qSL1<XWi`el7UBD%Ybbo-9)~Gk2s{;xFI;J^@&&>aE_XN0k7~dZ>J7Obp72DU8|Dc;I+*f=D\
--WCVgauu~<_QCvb39>4ACV_KmniZCj0(O1{RmI^`2m$D?CvY@gyt;-p0K)sz!Of_6?np#W_q4*n?\
-uVJMl@1+!Yj?BJmFLH8Q)7iRV>_?q+sE<18*izsMs((o=~q_$ULE>v&s{`zF*)8o9<V5!js))JmH\
-=OhCJbFA1O~b*DEBRaH@F_o^Ygrjwckx;rr4O)YXXYr{4dSjPL*I912f({T}mprF(+$gt8PZPk8m\
-->){ExPhAgBXw&Y7dBT8tp=uhB4l?B)Z#`hnJ$iNyn|s_fkmDZJTZr7_iM}HD=!m&TokYStX4F-=\
-hqIT!J;v4*xW|A81?~~^h`>EwO4f6aW3gK9@xa3>_ZXKf<sKF!?)nCISMhaNZv|hsC*4f$as0vXx\
-X1ThLgpTWo2uNSNkf5q<Tg>bM~n6{?(tciA@``&O3FQMZ4(mrIQ?W0?veSRj(gNZqxF5_P*>w*FJ\
-(1qBSzv|@`O3}!1_@GZ3JOfu+Rd*ShDaQ6T%Y=!p*yfeLO<g!@mZ}j$Oxe*EwK^aO&!<#htot?GV\
-zb>tD^Jr>@PrOHW<X?vbCmMh*($)YZ~df9l$<zHoN>bvxOqYyN$bQ`ZQw<+gURQ&-P@A)UI;?tN2\
-EU4L$?KXo+^#rnD{^JBF8l$G;ojt;Rtq4ibCXse5j)%h@J^1zWVlKq}~WFG$z`)K%<!D7d-n;H!h\
-1Iki{;drt*fgd+$PE$~vg(Yl#IC>@a9j(TgyX!%f6aUjpX!=t#mRAqb?J>ui%ALsCS{cqk<wLk~Y\
-kTp`n(WPIO~{+s)!CZ^=ncdj=>iI#Y@-V(kj7f|Xd}d0wQEC$LQ-ttlT?E!M@;6-wMp2bKSID(cK\
->iL)RD**)xnip^xT=)S{5~Jm<z>F7Fd~JX2sradKNIdmrl+I(YxnL!%#Wy%C<Tdsaw3a>I#duxvq\
-BcbjRR^(Q_$5;$ug(6x?|#)=|8v{{ZWTV9S4~uOvQ}m*~>HaR`x1qgUb7Z4OQDwh-tN#HQR@3iAV\
-Em>$DiCoa-)^t=m(mIrQW@ER83%mWara}n<6xm$N<)r0<f)!S;J()V{MTl3TLXlwqyr9sqcXt2Da\
-l>p0_CJHRmTIyigF#bOQ%h9)qu*_(zh2_i|Qdqk0S7G_#ogu(--JJ?7oAf}iT-V};U^&Sqz;bdu1\
-(r3s>0tT1<39n*n3^IiiyqLz^7{v*u<UT33d>n_LV#t@ItnbmL$meuY_5l;6l(9*6`<BKUV)nXJ{\
-{D2?f(-{`_?8xZEFuL)V#4$s8xwoq1HYo1gOQtC{TM7A%ricne474f#JXVn7KG2OG9yAGl79KO|w\
-3KEh&>)obhZu;Bjw9K_NWToT-bTbw+^}dOY6sv+vOk^cMQ#`0Am$cQC!L07DLg=OUx8`k>jRggJ+\
-M?g@PkGujDrnAudALo=H&htV<09Oga9&tY(F$sA5MzkxZNXlZ_V8j}YavJaO+{1SMlfZm+kJp9Gq\
-epe6)fqr$!z5G{OabNwmnVAGq>p@cs4_pXG^8+b{G)mLZdq%V1wjPp~0=GN#Z3UcJfM%%xKklj^;\
-gxt4-$x7aL&Ax;u_w2)h%uKs;8m7NV&sQ2!&jy^wH_PdnfBW7sxKcQlCCzBHog%Xx3McmtM$YMyv\
-(1GrL#EcY)BeEOd~7P@3l>YG@{3n9Ln_OzfhS2=Wm(XDM*_T-l&!<Vd3J5_Dl4Sc8mx~evUYSL@(\
-B)a3>OFf~%OSl@B!~96wGQ#}>?>@Z%FYq1E&nW;b>Er}u3<g;a;m%x2QN7O`<TJc+SN_GU0|u0^|\
--Z{_2v>153l3P(RjtjmJl`uL-=q|G8d)iJTMlKT>4iCJ$)H)+-;1dl9Tq;{-ELzNH|qJ#GG5;wgh\
-#AZ+os=R*=b>J5(<1+e+e50Aeol>MmH3F!Hx6zW_&<2{QM%{O@Zgbd%DGA@M0O(<yA22pl9@Vm?j\
-7JqW{*UpfS8Ty})R9J7V7*->R35dg(M{n|dd@R7CVb9wwhP}T1RnB!D}jfsdqm(N>#G~^ko%vyP9\
-E~r<2S-X{%X(jkXvm=Jf!bkSYB?X@{m4l6dtnn2|W+_rG8KzQdlb(4|yVz@Q{Zd{lCIPcGlOD#kx\
-v2lZX8MaHu@w^H>=V+0gJm#zXGAEf^2ESWyeCjrWDhL$*~k<{`$C%z+kRNiz4=37?<ryWhM`2pnc\
-WbAiJY-7avL)>RESOx$DF$zh(Vej^-a!V^4)dE*u%4)bp$Mf$EZRyj;*3x&h9Xrt#aE9wR1FjH;8\
-ILwe*gu`T1G2$>ZG89Ma#s2@sZ8ll81O)oijdL44<;=Rr^rX4sZK3j|`8F9}s`$`<j4ut03&xjT(\
-}6Ye@lg5FB<s!Bzm_!!PyebAt}Yb<Pdd^>;7NPR13XW9CDMQ={ay7sdD3?cZiFX2Sdr&RcT_gwNh\
-wI<^CdS_dD4)_6rS{Q3q4Qzr*2T5boQ2DJSnCj;Yr00gus(p{r|?3CI$i;;wfl$gFGo#2OBKk+!5\
-^D%kWI}skZtv(OHj5&qRZzDu;;_!bE;Qi|3-xq1mm5JYMx}b3dn*_Yo}lsD&{;>1n^+Bf<GFq$Ch\
-Lot8EZD(9G;YF92pOFqHdv2(OVGJluFVE%XOqF}@G*0B8<kcF6rk!T)Lg%)a4g-Yh|ZWH+&e!MHh\
-4CmKsN$sD)Aw=;V)N_n(RJnf#s4cXNcU$_Zx#><kzj-kKxR?lYudr6NgBXZ)EAf4;P)~6uw+ar2`\
-Vk@=qHZgf!Qt()KzWe3qsG=y$F;p>@Nvb(h~u(Vk&df%dC+mKv4lFVc2U8{wY-HmuDOp%$5o?hd9\
-ZN>$k2n{qGHAj)?u63KFgN8xUTpjafmh7(UTLSwuGKG8W?a4aW%fC*{Q&VI%cJ|zXCya>Od31gIh\
-ith8~E|t7@2i*I_!UkNycZs)9$!s5({;Z&a~0!mD3u3)km}iRt)!tB!D@nhLa%uR68Zi@UiHr#%U\
-WS{Hm>qUniNN*MC8^aSb7Mj)z}Mz6(QNRhsEe_>S9CWOZRL^VwL=;x89d{mXr>xg`aoeAnL`9{*T\
-;Kx@){rIr|>z_al;MmqZMtjTec%;+Cd!`gJ=et(*AQ3z2_`-)c64UoyJ&?`gT|eOy!v=_5`tQNR!\
-RL#v3;5kD2$ADmuo53NB*HK+);@GQKtGwDCkB<h`d2r~9i>SYb<Zs<4-(NLZmppB6Ba0Oq|8MyJ*\
-~(Ro$&{Ayu<mn?q?Z~aIXnPT&}6Ul@z8|#`){{6am;dfr$FN3|qj-u=-X>1yl;<B-}fJ$qF?Oll~\
-&8=2z@*Z!iX4)RvYr=fhGAk`lxc6+gLO@1?)-#EDm80Z|BSSz#WNY0!Fo6+!AUrQsL;9pGuWw7xk\
-FTkew3umP1;L|l%i(rdpPQ0ZOO&EsRrcy4(;w0HS8mG(ZZrKP<qcZ#&PKUPC~ZSUi0FXfkjj`kWn\
-qR?K?hxN3#qeghNceZMXw0FoN(%!#+34}v?-_|gsz1Qyezf5}#Y}ZM98q_>gHHa)@N_)4J3$&M78\
-Zf23OSNv+{&~5kxPK11rc&mi;s}m37gsgcBVwzExPuOOxco+U(0ae9RGdRC5Goa)t{_tJZ+ELy3{\
-kJndw43Ye3yO)9aUeU;^hzMsrb^Z;Zbp|${|v5+kXNA6}w}@+Cdli14dLl<IlkVVJfb0%gv$UTN)\
-VU>XOk^crtQ_2th{P5=2I}{2aJRH2%F$+<j-4Qg!T5aV5x)R4L>;y(V3|Vd;1L&noQ>Dbdny!}~?\
-rZBs|3U7VuC_kJCocKr|NY4^2y3hjPeS5Le3tA<Cr$rVDR-42z-9r!~_ShO2kVo1C1{{DZNb_e_u\
-xGA(d?9YJYepjvCBCnkMMbo7s_fJ-5F*!oQ@f1+hELyY0_mzWc)>1mWw^XFVpROo$2s`Y(6~v8EV\
-*V%W1jd|Lg&om=S*TMLfx9$i+yztCArd<2ODF-B5*y@nhT#2hOX%0-%5AH^7s<`5{qK~USD&vG^l\
-qdNehly-A3J{xu)C2~8QqO!9yLYogNPOHgJ8ZC7|@5oGyF5(h;J2kY;J-UaPnLrU}F49yG3Rb&k8\
-w<E?ud;;zxpyDk)03%bB$3dnFKNixnXsOPXfp9CUwpR;)qa8v>m6==duTR*$XjlhA>1#uBfDOy>L\
-cT?nYr=z#6Zuh2IMKF)@I^{N?Sj4s!WF)xYyMW%$F+gQE5@3z~C5%I1&lptXnk`*Pl_^BA?N%~o1\
-_)q!U*w&q%R%%s3AX01VvWlg9<NUQW=I(^MgNN0cLi@@kEwtw|hdcq=8UHqe_HX}OAGCu&tJl{z7\
-g`tp3ETj*uv33)d$F?vgI!#)7IvRjmccHn0yt0zt`H{YQ9d(Bw~NqGb6zv@SK+$w`W)D-@_nOfD|\
-lTHT^=r8XI{CvEA>k4@*7&IR^m#X{#m<H{r-{hl!HjV2z{mS`Wu(7wCGogN>0`g)@AnvvMz2QP*|\
-7TN@1_dKWA_5x_t6oa0(KjF!}p{5fq|Rg0HVuZYy>)LJ|f<rqYZd3+syVa)OV$R-k8fnyFC;P%jK\
-3B4u9^L?qWGMMPTZm1dY%?r8K$?`RZ1;vv2Maw`kZhi`&CghbH2RNEk2PU3<TD|6TI{ZD|GYrpy*\
-!7}y{dQ=mEe5|-`DfgHBDHm~tWo=;#PpJ6yv>B=VUfJw`ucU&h-^ZXc;YlM^%L2j0D#5QvasAQWr\
-5*HJPxu4j>Ny~f9=8x-<1N5nE}wka*yx|VzeLyQ7$x!b(p^Tv<sevfj@b#$uz1`HV5jtQuj>97;I\
-dcb`=<RBU?G)Wj)aPpn?e?1)N-d3lRol&0bp81VlDw8fD)>mq17;dKzohv%pU=XmzWeXJIe`MTy?\
-7!GW0%;FyV6k-&(kQbV>)8%2!0V4EQq$T*h7!;qv|0A;IOtuNAoTtB&(Om4yHo;l9^2Yj|||j{)%\
-n)tI(lA?xr+b#kK^$)t-WZ*{nON0IeVvfeVJt);ywBiQO(_+Gm@SH9P+&V<Y2>bzeTWOWL@6<5b`\
-KBU#T@4T`)d#j<<x$pOISLf%S!edpt&R^&1R4OB@(-RL_x;lJPV(vQB{Em04KV#LO^|VV_KTJBSR\
-lQuZl1;zUt>k8(xRO8r7Gxy@#o|gXJR8zV4mhi<<dv#uB?tT}TS-%E4UXUXoVuG?9q!&yFiu#4PB\
-!Y_4358URtq~+)0&kWuKrP^Vpkgz2u3Ou3*{Ac$*s3slWwXW>W^^_#1>;G@#FS#E3um=6mvK8bdL\
-z;54ZeldctLXU4}=I8ejV%aKpi>2DeU!+Dz+_CD7SZg@G_!M!)(owAq+`a(fjSqc&}_;>UoQ%fBE\
-T>z0G%*RzxRTm+|q<N9~M7crsGQ!RoZ$5obZI)YsaBX7Wq*V-w3S|Mm&LCl}eiB{gIGoqEZ)sF!)\
-7l$g}naP@iPwMS(5{;zO05!KCT<z>~?r|jv7o8Q*i_WN3?EXIj<@7m@>3<|SR`Pg<C-TXUpi!11-\
-<}<bJMh@^fj|5!P!7M{PDJ2o+1*^F-CTb-Tz`Vm8T7uW$ntVleg9ed6;JkJ=q0i$>39q3IEU}Jso\
-L=t)Nzia<6RZijz_5-XQN)?JuOb2uvj{M$ai`1BhqDpt2Dv&N4)E|cvrd5;ZUx_nrer+(BXqyaEA\
-x@4xd*#EKb1b3BQkb{Va5NE7#$nuSkdPq&*<<p&z-f#EQxqcv|$&C)>iqXx}LL1bs*4`_RK8)I-U\
-$`uF3|d;b{C%RcyJN6pLj_+=gT5`Q@|m+nP}t#rL3v+0{$_9or87|tt|XYY8pze9ZnjIn*GU=Uzb\
-tSS!LE0WV5p8dc4Q-Gu$At@I-4Ku-B?InF0+#UOyh`Xo%3GldExj>G)pA`hf-S`M~0WC#Z-2F6Pj\
-=Qr9g5vHkR<+~T&S-IWb-osNA1DZdyIZ*q`=8O`?&y3i?tY#h1b2IL9Y&H4b3tRt1N6;x6Wk>zoJ\
-%i_pi2PT=HgQvK6qNpJxb838*$yhEyk<p1T7k$VntbtiL6ACkL0sgOS4%iMOJd((-%s4u2P<>mKS\
-~@C#(9W<z!_$Eg`GFzLb#F_g@;4)ucc`LskRX8%kE)lxIR#tpg%5zkgCBs}o--Wc8CpPgdRiI<hi\
-4UxDr~|0_UjOv;e+{$X#}kY8nQ=#bYa&t%9;)o19l(n;kRhFtqA;%6?iPZ0Bj+tT{*g8Rj1eEkx7\
-2K@55J63FcI8Cr@@)oKkSMXIP4%Y#sIh5;U_)PqkqT#;}QGSQdVm+BL<-}C6`xqWFs|d3ww$ejE;\
-q9OK#GvU}4NX0nvCzXwxYaS=ch}!Sw?n=PsCDvvQ@$j&EcH!~iveahyQKl9PNn2AD9N<(U&;41f*\
-wf!$`GIqLGpk7j!nSP8FyQuGaGHT>StmEWG$6~r%{2sW0Wfssf6Y3)ptXweGBQVI%3go_L1S}ADS\
-QLN0?McXi-ghT@0`7i_y4-LlaL&_y~#by8wkq4@%nN@FXmzuRp$^f*oI@2?=u{RPXQ=+5q$O)3j%\
-7-#D#&9L|Hu<8b=8lhg#?k}aeN&s5R47NFHDc@umOxR281f>~5Oibu2>3SFJ+bD)pIa+?q#7@dJH\
-L@hbM^A2U{N1RdUv@4<ym1V$`Dq!YPS$zp}`{_&Jr83FWn)htB2gUbf+OGqK6!|OC_k2S(l`&V8v\
-F$(z>$@FkIF2PpF%1niJCF6Wc;_Gi<QEm;P^cP{OTYM(lDxZP{S(><M(i-7&3pD?0e0qj<XdLk&7\
-=E?+d{UVtA}t&N+Hh*7aj$Lx`2PzCP0;JPZHLnnJ-R-i*OX;B(L&)vwoulfOP`$YWQyi_3cNI+)v\
-c>Jj7-^iREtl`38qwg)aLgxBckvMKHcX*x^9g1^m2P5-4}Y;Jy^(nudgh5?C8tT~Oj5^4BFkN=FY\
-CK<$gZliy%NHt5a|{e{+G#s2`~?kE_pRrnRSoJSGQ-0yHD?2&@<o8o|)YZX9v5m;495sih#qu)<Q\
--yDq|LE2vEPV%B@ThUxkrKg>;IHS|k3a!p6`S!vH%xUk&-65c)`>d_)r<}K<(sE~IR2nE(Vr=<-t\
-6`3jwBK#tgS#wNd%uKQTAYnY@a1oxV9LCG+<rU*8&OW(x7J^8WjZRRO?OHm_W=g>r+ol+a#OT9fT\
-tHL06vD48(-Wd4!~KOd!UWLTSjd_6x%-ji}`4wcjDAnd`CSuMHixVg@A}OUi}0SOtfuZ`GG9Qd4z\
-e<yX;3Zy^ClAyalTOEmZ+}4egDY-nsXa1FizRVW!>gwqHZ<s=Je}(RD++YGvri--n+@<X@bZDH#g\
-Oo&V9d3O)G<++iBK&(Whr3)z6l#bKiR&S&2Wx+%fkM5=uv;O<1g-7dx52QMgWfa2~0#}x8sl(&<P\
-aPId6SOr)JP0F!;j=}M9dfLZ;y#;{11q$}&G3@;qV{ZXqZvn<$^q?T*7*IBE54<lR<l1ZnA+P-!D\
-3=W79wcnJ?K|B`+sP=3_#vHlrxb8)ifEhn{|95RJ87rezMT?DuG^jiL?Yoc`z{AU<0nhLR?z)4;%\
-vT7-vGKNY7fG~!1fDehS<KXSc>gCKjE=`v{j1j?_FZd$6hF6dowGK?LHOTukgcqN<S<g<3Gg;_Lg\
-$kd%G~KPedYQZDZ-MPPy%;$gt+p1{*LD+V>;PovduB+wOHI<&lRQBE$v12h^;eA|ZCV7+}e=i@9X\
-k4U2*kV%LiS!H;gqmF2L$Y1v5f&T=I^ht@qK-j%taTp}#nv*|!G=s=>rBXHT{aC;U2+fT}HJD+0?\
-x>ZP=30kQP_i9{Dz=EiAxjSjGLY;deQY)eV2b_Wozuf-D;<Ps`skI#L$i&r{-0XSz_MH`RjYrbcp\
-0he}$xo}45}@mv=v~d#!n@=49hQ7MR$<Ue<+io&OdE<-!EDa%o~PsxVHbH6kZFKGcJ(~K73m;pxV\
-XTLpagaSySJMQM4X+7YoO0q)9txd|GMbC_8sY^R@5YpbOFiqGl=~kAWQMEklfDzi}y9+GyZ!W?i8\
-;h^IYofm~8(<OjDuZ17B%HOthMFzXst9FX3QO=OOypfw}Opcc)`XeD!46nr6<Wg5UmY0W^n91ddE\
-xouT1_ACNWFyuNTPKyC@ZvjD-B*u%dhI!0sAF$nl>`;p041?-jOM=D=!aN9RT@5;m@%k)M+kNuz1\
-(>4G;Y|!Duvc+l32tIUt5mq=S-@Y91p-K7y+yz02b1RiX1trSGclq|`2s%91*1kM#D*9JIha3qyy\
-gM22n*af?*I7V{Mha4_CKcYDtJb5~5%DoV7GcM8R=*qHj^R}V!~Te2m25%ivp6l&5}o-mutfpV+u\
-sk+t2u<%DZdB{z;17N=oDFirDOp>>|g0;3*cq17WwG{WFu1L7T^{uUVv;^fNb3YEM1(olq|r9D*&\
-Fk`SvXR0t`|Ml?7NRzRS0-A`7sptvxH+vzq)C79m$zgaQm-e4wUVg!)%u5qcR`c<R#ty9y(Z(xF%\
-JyH|*i(f|N32}uCy_ElDp*6~_xQPye)HoiIoN{Sd&eNw4tX`Z4!O+xx}mfxx)+9P1?B`ua5%_g)f\
-degY=Hqh4;6{tSQi}+FS)seQECAJz(TdmT0_z2M%NCwmM`#dCzAlT+oQOETiwKw7X&|h+L8PZQbR\
-E!m_7|K&|zM?M$EM=SSmUq>TMvEQ2qINVX#zMJ9QUSNkje^EFXA}fN<k7)B;?pt6#{P%(OGQ3&VX\
-v}IM-VgeHD(rE9Q~omv$N#N@Ce|h+5hMmC=pT@e*tsYhb6{?QIuo%*o|Lq%>4&rqzAV}YIZUDXJ3\
-?h<W}1UmI&`Z1byB^+jD;AcJu^D=UMGlo6+faf$7^E>6ekNQxg)+<olYOBV?b5=runxhqiaaFUP1\
-N?h9WkNQCRxvZ}QTm0Iwf=MaaF-fLN&xedKrd;tHyadgHROuU&p=?BQ`na*nD6)=nT<YgcB5?DZe\
-@^U15iU0h!k(ZsFRmn>%dXvGpGV}hyzqiBh{pkPc2jH8|77kB~t#4rji+sRiCH97s)ZsDmkLRo`o\
-zqWfMLxvi@pVDu=H9pyRv{A>17sNZ0+XlCV!1mVK5Z>Ij>eG=pSG6F4{+em_q77plO<I_+UID1uk\
-_+x$x(fOe=n_6?mwwW<sJQ;6-ep#&m%&=ZB>-T{@K2#zl6;n<EE&$s@heK6k9(plwj+|T%uLw+kx\
-5V+xM%N^{9ReKm3bH1LXO=L)7d-NR){IiQf@)9KeYI=T8!RvcI=D?Y*i_8~sqaeZRHjUQ`dgo#||\
-fj}4ICW8W`VdDbE_&9_*gU7oe%dkeJd6SUnhXcxiSy+zuMbT$dn?qO($u@$%T&qIwm2W@oq3~m%)\
-jk=&ljh&U?cPkPqZaYAYy)Ax!gMj}n5RxK?J&Q3I<MNbeDK201t^7f?cOFL@TFLVPnIWm8zqJ;{m\
-Vc(8*w;RSV%U8Wm3(?sDLLZ9{O=1+CCmyED3x!&#C%S%{$jrr?ZHOne7jG1ZE0=yMSCv6zU~9H=n\
-~S0II9iQWs<OM3ob^$2(ya0vWk_ky%y^kSJKn2Se-ElZs&FY52))RJm52=#rdbB(g-O1kd#_!>D#\
-!p4=OE((ru*lyXB<xMO@k(l?I%RQRy;LdW@DjacOPzeg=8}CVijs36>Ll){<L6;)qOJPS(pE>83R\
-%eTHjXvX&r`On-m-0nKT>5u}R=H7WpS@}FmyVy98wbz@<IqUK%mBao7MFpu14z5(G60ev%eLqM2W\
-Z1vyCN=K8@L%zDGtRkKOTv5e@pjQy0`kzftE4Co%5ZHLl^t4MBQB>4worQ$~P4t!!YvoEf#awz{^\
-{Fns^a$xiAK9@mhNNQte>sQn|7Dc_|4ZTjOI7~=iNgO8W~Zl}vO1eVr{rjnk?NWEVB7bp$BN7ra{\
-!h2XP}1V&X%+WJz8XK*Q;%F#kNauTRhScWTf+!l94u0M%qgqX%}Ur>ps^<^{VIHORmf%=U8(QI=S\
-9W)tqJ(AY{qR3Xpv{KXaAxD_i-sf&Rk6C;I8OT#at%y&7%1^`+M>==ab=SEC1E7r4v<atZ>KI#y)\
-0W@&06tp>>|Ta@m%(_hq)E;9!`v)?<RZmv>ykMb)|`L$mho}&Nkgk!Dg<;s{?$sq8dL>jaQUpYu+\
-e!%$He6s&6kA$NxrVY3*@Q9DNO@vT9krZ12jOhS4D_7iu6sMQr*aC!#F<e;_D641%aB%PM!0#=;A\
-PD{vJp|zDyL1>c;u@LL#hO2U4Lz``7`VRop=vTz{UzGw$$@{94>9O+&ENW(4lV*wVnsrUc)N3D{w\
--F_R4Z0Ni1=H&)#9&=e!P;7F%ph}+@uYsjFHnJENW)fC+k3ti!v?b3I1sdWziXbRuG_C3xCi?E4e\
-M$=99%0|9T!3<MSO-j$nu?tYRxowt*~4Dh)2eUXl8+ym)>g26m=*o+dSGYUOl5J$^A4o)<^u_1qo\
-76%W&m%8SO8l4Urw=P#HJ?c!&~L(7AqrNft^O5PHe>-0I58%Jks77_M+Quuq373e)3D4d^V_Bp!P\
-<pgE#<H{C5S;c*o(LnH#mK6w?t1$SS4tMK&rMUapIX&+F^Pz~lJ2~9lDK@`)mX0!@#oaQo;t91P#\
-@#kcDDK|31aQ{|xLc;hU7LctF$7!50e5B;d5R*q8w0regjE1=@>z-{QBvG(eU@QKR8ZWVa^4g{4t\
-_!qWT6B>_Gni1@K@rfG`PF%EA6O);4b*n8V~IOlcDXWxErO#T}57SBKfZ5$v^SpHw4D&UJd^TjI|\
-b`w*|kTO$DPxVSv<HWm*eMQ|Sj_S4(Y(t8am3cu!h*>zS>1{~3VxsD>U~h3!}Vifkt;g66Olrapw\
-K0oLQD8@Q$$q)pFrUw#OEF*AoY9TD`a#r#)s)19>GLqWfKi9#h8ppp$x*`R}pkJj2_TI&j}m1kP3\
-l-AmBTI(7iY`SVS?78@%h(7GW55@E$4?p<m!+!iwN*}O2GPj%SxZ=<Tw-xt!8S6VqS;Uns-u3Tz*\
-I!6yL6{ZC9BLq$^G9bvFM>7;a|1A%Q~YSo^P{=MkLC(Lnrq@{jw;@8(DTtPY&6&pF5dM`yvt8UlP\
-HX)9XFa%B%G%oz#^K}d8;b5jQ1-K#DU7Qnh-6}*<Z(GjeLu_Mj&TmX@|5pfm$#$@q&bPG{7uB_!q\
-JK#4-8hYu@s6f~!?1N>3{<04(dHZr_{^tFKmzQ>#rP)zA(xkaBslF>uwD(~S<KZXBxf?qp4uiE5W\
-IT$hu{hM{aAUTy>N!fuDVu$I&)CwPe8MK_83pG_9a?3(CB<hf1Q_l8vV--q9Pg5E?offuuF_{Dy%\
-iW~kvHhQYpHv;Kq%QIgPU&f!rGNrRVre5;0N#tVGeok%l21bX3<jC2ZFg-UpG+WCoyCZdA!Uj+WC\
-eA17z@1>~Jgj~Luj#ROnU2tCzM><<9%4Ge?Bf8T0|Xj14v?LgVBMX>tBLIcw~)s~`uO*k@W`;?$1\
-e%NOb=)r1*0?8;e*XA!RwLq|E6MqdZCDSTY}QR5lizwsd>3f<DSIEHcj)M4RU}uNXM7T7w<t|^es\
-OOCNHcANqmEOpCsi<<rZ55<)OxA(Rh`^XMp1A$!m+VFOi-a5w}>VvIxOH-+qcJ<zBFYoQn25309C\
-I<+Y`?y(rrAC0Id<z+`lan2fv{lToizycJ|QZLg_xr<b~dq^F&?I&Y`LJ4uJv?gIqU(WodwDaxZo\
-_u-;$sHj{i+DwZo;iAT<DB!G5i<Z(N|2|Z78+|#8zC67T8#RioC3lz8EIpnUZ_~1UP<F~%Qlg%bF\
-o5;^P+7^or&ZjcF;uo)N@<JJl5@^1FHHkPLYcH77QRUUFfq=aL`>?c{;jXt(kid&vFfVkTXERDV#\
-LrR5L}~q1jKav58z)EL2@1O(>a8Ifo4loeMzi)DHmaM`=?;Mv7^^zT%MdKPLMdbSFsVoQ_G@>j-M\
-Ez8+vpFWtL`RpIbp4`_mQlV~-4D>=O=3$Nu>~GWN@RrDKn+pd0(K(8k`lqB{1+D(c7H?I1UH>3tI\
-BcS)30uuwNaIL%_Ozx^DhSp}P9OLi)zAUpNV$oIYd8gLGBKgMfZS~DQ)Cl5gLaZ1FR$Nm`wMN2dZ\
-;z{6T?N@(FfOqS9YC@*;^%{9S`%@ZgSHa=#8>NIrK8YA(CtJxJ;=>Cq?tYCXuu8!&x|_l1!2?Rfp\
-cn+EiNyOIGLV*QQ?d$?TU!4i(QoYO<M>NuHe!WLfwX7Xu{)_)6SwECfRB|N=~IfVn)`S6k_9Q{g8\
-kTa;^WI{A}O4iEK_TJ?XW*!6s{%W>gi+rARQRF58CL~^3iUVdxPQWAB1?+DzEM4(sRISS4XlX=Bf\
-gIA5!s~iw2ZI{Hq&*_`vr<g!tDLjUXNsd7TjdWM7C7-?P^k;;r7&LcB+$2I9BBrG@ySN)m|Q7I_m\
-Ou7`FpXLkP=;oSIkp<@3)0z+(@CxOfxw=q7zw)eL0GmjEH(gYuOk#l1rL*lM{{^}ISKL2j8Mr&;C\
-qu<AXHb|rq?;hi0oTSG`0tab_9?NIh%4bEDH!GiRE1w=!9*0vVW?zJyh)56_Qwpa;A>IVB09GdH2\
-hHm{D+#RJkn?(yin!E|y$%y-9lG2Bn{rN;5zsLX+%cE=_Sp*+$#2qjHoqd}-5t3kM1vr85xttIX(\
-d1+wOZ*e%0(giw2;P!HmhvWvCH4y(*;-y*Lv%x<>g$_^N71t=GR2uEKmk8ZI|LV;pM;(b)49>-y%\
-Xx0eB~Q>>pCt-V+IEGM%&_`!B>BoFFa(uB7we^m9poQ-xhDVNfBLSMr}duxFhI`SApUBuHyD4=OG\
-ibFhq9!}nz+*!19|cUOkF!0$XHx0SRiFV{<S2locp&EmnRN+BGeF2*MQISSNL*Eg^dz2^)2m5_ym\
--|f)1{U7Ph-RyfAd4zz&T`Nm*_)_KT!Qpdno8s`0*CjYS=eQn+o4qc>;i^#@9Ip1d42N&2qQ~K;?\
-@DnvSr%SNrj?7nlt;&X=>);yzX=ZKDFbllD82!?9M1RKLvWb5+QOan*mYnRh3yZOFb+p&xG71%{a\
-eQf9@kl^$xBd3;=>^?L9swU)pHn97jQm8c`pJ|18#o2f`Jwsg4!Q55u6Z;KOaRsgRu`ylsdLAHzE\
-|TBSZ0Xy94Fao#^^dyy0$&;x(gG6dxF+qWHj#QWPJ#+bo=3ziFM(?Ebe`VdtDMq#|xeue}UI>ZH&\
-L<eh+4TgV<2<M1S$AzPT5cj{Obb<o?9=;hDR4f@S@0%ig9qKwdSKgbAHA|pJ+x_;>ZBn9!&&nsyi\
-x}wkf_h%XIijbX*?usqmCn=`ruK3XVG^Z4JV)V~1mu8TP(_gKnz=!SOi_0M_>S-!&@!R_tQWQgzs\
-xTR4BBGR%4+xnQYkF&{HYw(sJdT?z*Q>a7(R=?aNk5kZ(9i9f`akc+#vI8|_o?;y?|!(O*b0R4@7\
-Ns(;r6I9qOn2mLrCw{S*DM<czZd+mUrI=G&=_w5^MCZ+6bz>_yK7osG>h@3X~H~3JXzX{(71T2i^\
-hBK>T&lS4)PLmzM|EIFI5D0@(NuOq8#z*E>({GSNE=^j!mE*}0c6z3qpzn>X=YEo6*r+dcpbdQLb\
-`!j1tf$(4Z~yRd3QXn*|<37ffnud<o%c!$Q55KnDr)fKP6%S;f65!+T#+fIE)Vz&9}Eu-u+VQ`~Q\
-D;aX5I%}_s8?COaa--VWQf^fDtuVMz#11JpYMU+RMzt%Ob0c0xf9;?kqh}wK%jgHc(8%av@}`-_y\
-lH@(H}!nmm^amv^QODrmh+|xZyWHY^K#zwMXmvF+9~Hv+j1qm>G|Anc~egfZ#uu4=S@A=NO@Bo4R\
-3mQjf6M#S!K?fzTKtrrm?F-=1nh0YI)PfNIh?A@rD6!a!4X`nXqKrPk71l<)#7|ak?*H?4sdnfDw\
-8It>rz&zlqk;hgIAC0qMNaazQ}b@PUbdMtNc$>*GTNQvZvLiG8z7=&6rcPdX-6Ylot#XhY>7(Z4G\
-xPtU}7XV@2aQ}(b48}~CelQTTN#*E!cs8_Kg-4~(J60rMiQV}OY_kNjahh%<BatXxdeZaPgE3j2u\
-Llv$-JTnwTx#va^+JGyN3p$bTl&cl!odc;=!Q$gzL8BG~j(F?q0S@OJ{PYo1$u&TfA9j(EUEHVFK\
-w+Vd(+UUo2}`tVm$I|e+Nmm{*{qfTzNYU`h3Gc-)8vK#*GZV$RmBUTIySIrSGG-#sDm2Vfw=qjE?\
-+KJvQ<bj#;a1~&x#eQn2L^f9Vjo?-zYnrzZ^r4Mi`%S=`1&F6VPZcK_kA#{B2y4ISCpS5-CB^+%B\
-(U3L069HhE+%-pMdc|3>$s=Q4nri%43xggi8xD7GhIP4ja=tD~_F9NwLJD?+V8Ysq}9C`qtu*Q?i\
-qU9R`YfUOz9^g{4wqP4$B7f`LsduDuvQrPBn8RAvh%2v4mW>0r!1?xVGARy3Tp7#~V?pJog%*M{)\
--FGD+;@uo1ktvISkWXEZi@ulsMTG?TFwg48i&wN1bip?p*t1<pTl678xs*}mQcTN1m}V6*4Gukzs\
-Q$`UoK214r6;kRL&0SmsJk!lH}-bM2C^g``&!7I0^3B#tFV<uGOIM-pyLLSAx?jTEcN)ktb5*KQF\
-DWc_nqHRn9XZ&C<3Q9xh3}!gLY1Ou@#@qX0BlY5jxsJGj={5e6}yG7l(Ob2N~v}cV)wzv|b$M`W?\
-zJEo_(odz{w@LkcOce`#;6BQCBa9Cr}<Ogt{)cY<8JODDJv(aj(|Lc%C(0P8tA-pD|tWnST7%E^#\
-0rTrQiraZicVajVNrfk1vj48jZ7MGywZo2<0k}W~OYH<l-cALu}1aE8_yvZ@co9IkeX!F+$-180@\
-c%*dT(VBq|dneeyRZMyfq5yQ5^ewnXrrCTiF2ox$gvC+>N)wpB?~K)e?VZ@d*q-4IyZk%hw1uG=w\
-;N#Y6z@vdg2Q<=c?${NdG&b4GOf0?=Phgw<5q>KirEx}5bJ}hrvQhtBZ!Nm=*1JA@eEUW)DDiUWz\
-qPA2mkUaSsDM^Y-M<p|LV2kIv#sfq3VX)fU1jWfR%h6CC$hgF5H*3T>6QongNYeKasyxqNX?9tQa\
-Z{*JXr$U4rh?VK2o%X5Ynlm}FyjWmx4)k)>aXn3dwp$5ZLD_-PrOF0T-mqRlRIA_=lE55mGA0+}i\
-O+JY70*gk$M94+Mejf$*lDg}UOHe-80xTNS)y#23xN4*y^Xb(-^BEntyOk4TPsPd+~9MSuTOpd@v\
-<4XJ6<t$52``hYlx+JX(yCOOpI6Unu%(hy5ckh5iDyyAV#70__;(y$coBI-1xF)Lvb^IW1N*vxcA\
-gF3G<GP&J+(@^{P6_8?`YH2yiw<`8{QH+^8~pFqC9^G-=zfQE{rOzZOA=GPJLys<7s8rb-=Af%?1\
-O`6cMDG+m<eE~&%2AHyy92z<Mkw5$oPr|fP9PBSO63}RzfUuU*!qW`ILaiZU8)pF}nE=a^#gNIr7\
-R#>a0>oGvYMNkw-8=?g3*jbYn62d+KrVA{$;I?%HGjfxO>@-#?}adX4m*Sr?FKJwn>rRqFz#cZaU\
-pZeHH}%^>ZUn3t!%P1BQ+G?gsrz9YY5lvTYjgv8^opjElN;;1YZyOJiP5}Durj#4L1leJ&_<;%~R\
-k8Is50h7BI1ryPSFO#pD^fu%j^RMmP6A(GPk~lGnBoToi9~Vu3=fN)A@h-?W7w__nCnmoKq8osVX\
-LN&v#nBCtvZ5QLY>93#CO5jl6mN6`XJK@MH2&->6CVw$Sr|QuQF%a3n7vvH-^ag6!lmE;?U;m@;I\
-L!Kx0X`;{qGzNzQ7V+>r<&U(MT;e-0Zn}WziVHOHj=v-<G4_js~aH-<hAM+8%^o>Aon3wb+p!g$9\
-BC@kToi`6@aN6<4G|BKZ*C6boT#*qRwf4kK+W{)y$^14q?(8vo?+Kv0x>bt$;izFS73=xEZvPUVH\
-J%vz-JZPdMWAVOU?c{!?(RrR!saClbVMv{rda4{;1r+L$-1AH&PfLRS-sq&lp*yEXb*Rq-?Rx56n\
-pY9Bl`&zFJD7}l!JZJ*{3qh!I(=4%^J0~Y*^Q*9#x{yBYN{}#}B64LQAotc>HU4?_D@=KZ$7LRFr\
-(^Q})eM|UM|ClU3BUP{GWXBlAe@-z&W+b7M-|5Rv8+|SkKB$Zb~z6D=z&?3?(uz#?*z&vw+H}#g(\
-*{4iI<jgdHM2v&*DdG5sm7F8snxz!f@a0I;>I>eKSXso8^baX+Ky}>r#(JHS^%R+ldJD$qNW5cM+\
-!%MW!e6W4<r<1!~J7o=7#GVd|y!>_&jcz91ZB-)8gjiAz<GP2HvbzUmafr`fGw+L|mT;zdX51xMr\
-GQLdQ!<Sk|6G|AHLQ|*cTomzz(wDHR(w?bgqwg3mH*$YarL%6T$bHwA}F01N7a3M#r)d3=JBFcWT\
-@7Im&FyLO*!-M#fE!SV+g}Z&*qIUb9N3}@Nd^Q=>by~d^18V;BCVOwOD91R;x2C~y29|c|ovY;TR\
-s0-7pJS+R1%6i_u8?zeLjU!yubxk0R7~)4PDPF#<fHz^n(vjb2A6wn{pDNO^{>3gN?U((LfrYjr{\
-)EeyJ8z<A(pmggW_E7TenRi`HM)Z@^xRSJB|#3TWYTHSoLCGvcS<9#Yjc;)m~24wh-<gUdq<)F}A\
-L=MH0W`MMV|cze%>7siRrdkF%7kZ_$6<ZRFpYjs|EO_{eeS&j<`Ucvls;DF7^grDj!O;iI_U3<+R\
-#MVZ3r=B-pl7uZM<0Ncx6r+N~tHggNGphCFCAUfj!*WsLO)*(E$%BJY(q>aH<DPm<nz5G~tCP+*8\
-YJtjE$4tErFnCuejno^DEx;QOeH%fpF2*=)E3tAk*)WIBYYjffoxom?TEQ+IgU5Qa1(>y1i%X9y>\
-kW^`*yH1CvHQr?c-K#0FP_d{Q1$`RNJ^Hll>w&Zjd#bgjyGUM;81ZyH&3;Sgv>1J7Pl)$#rq>!?2\
-`rY?%|Y7lcPv?ajaGX?JnM08jq8@vr*U=Gf+w36GekAVrjIE@m{cLu{p2r`K;O16>;0mO0TXp@4L\
-?uy{sX>X<d~m4z5#!d7epSCmDj{LEA~97y*03*k=@;;@%ciw<*dokr*aTQMbJ4XJp6GKArL@+?Bl\
-J^?>xQ<dGhU^MX(2b4K!Nv;GDd^jFgp2zK{!uV;me1v@^gTr9ZStKW4Y(}~M@N_tr|60{xF2;o+h\
-ToC<kj(m_)p3~ocVtDV2UV++#79-Oey~?Y<ESYpe?k6W#<*oMWZ>ln|6_5;er3_Bvma@?&;nCMp&\
-cECN!<zuzAjf&O%4;YCOkxn4wLa9Et>=eY^XC<^Yozs%S>;VJ><{dS{l{xP_-oAxqMvV6$s}jFnM\
-O>$uxCbqyFX9M7aT_C_S}tL_s<abr_Ni1JmSp8?w`dx_?Z;*QW`rYEapxLkLc>nNMl+{fy&Z1Y#{\
-DJJW^-7biM~t^7FnRkl))c=*iFEUQes^UQdB~Lcxz+6Ah>@QDJ)QO05W9zM|4qeVH^}gjXb`fNiC\
-Zq-k%=+p$iSQKoKT2SI04ljm0(fXTznXel$*9dm_C*)i$93;Xd4Y@dh61ux*ux&$pyyz6^d@5R)8\
-#nm|q+h>bZ{qaeEJIzIGKh03~iBTJM@s6?E)%$NysV{dK-AeE_Yhc+U8+0kzpbJxugs>_Nw(DYFC\
-HrEEqWBDan&D-k3dExs(%tb#w`6y0wMd!QlnwgbG58(!0_ArfX-e(<OnXf<zBtRBXw%`KvMEP#Cg\
-Nw8shsBCX_{|KDT2?v2>|$gfp8<OZz&PFuvV|z1=YDw->!+9*+mJ;yap_lMlW-g1VNvVn#GcWr6?\
-);wl8HImjxz8OjEStIWIHCKZ5PPSjJF<z#=Rpvz`VmRgEo}!8#Q~hGjhK29t)yY7oNRu%bWU3f)c\
-2;b6_4h1wmak5jpTB8p2ei`P;ylRQ67V%nwJlHu;8a5o-{>N(B#vumr&WZhTS$TnK4rb@7}qfLKm\
-0pyJ{w52{uPp!(>&hYSf=4qBx#$iMvqBQ@<5&={itRMsgj+q|NC$}qp#%zv<N0^mX9Agf@Jt<<js\
--F|8pvanrlm;alq<AyuV2ABFtCZw<IK}&i*wX8JdId3t9ofL#pb@;Luss3jIqD@w-bKv+Sk<JScG\
-G-t+5iFWwgbh<Cf{D5<Q_*vm+5srM1BKGF%hHwChk@f*m~f8Exhd5vmj%!m8MF@_JpUImJSxc9NN\
-W~vy>Gtq%538!?a1GIdAcb5<18CqQSqQh$a<tV|nCh;AIu!t*9~;HS9$UP@j&WU&r2F(HTBsQsM^\
-^uM7l?yTvdU-I!ioz>@naAKpD*S*$#jK~<pXp%LWj=t?N-iqMX-J{@IAQaQ^|fcVWgH5u_4ylvy_\
-AK>~Lcy$U%8NLqBs%E7pS16m@^3?&j&^*!jO7V1WEa;o_6#k+fEAe;I>rS6+92<&}-2Yr(z<7WJm\
-p>EKj$-9!zVFe|Jf|;K4Mau27I8eNN)$jOcdgNG9Irc7%D8o+a8CKtYPL7{RFQVVa^le7uS>oIMh\
-R&B*#u<^YW|Ww>!E(9w-AoiJ&J6OWWS!P)l28HiwqErE!Rr-`Su(-<!mx#Oi1WAU7<%t(>&{tA{|\
-nOXH#;_g8Howr?w?8A(cFN59QeuKJ!2zP0A)P=1LQzuv0hvuDSzd^E*(r2>>ien^K%ke-m?SHZ`|\
-q(|1~PD|mP9pTpw)vWfCRA{gO_2h~s!YB}|J@G7Yc+zDBv7icmI%%o{Kmef1ItH_;@!<E{ns)sSI\
-QTl7IaQ=gmtwQn`sGBlMp_-MW*azCP!B1nu^d!bIY9?n9$EMN}H+D_5(Vw~0IAsdaeTcAqnM+m5b\
-$QhDuNC<GYXP9%+`&Qb*_G|Vf+S$$<c$coZU+<Po%FO)04|7n#8H6&x784-87TNJyg5y>3lDlaAi\
-arKA`b`8`KxjjtwrXxadL~yx%r`FxK%ljuH$`U<sCmWUv?U!%EYb&?FnMm8ZKEberAdehQ3o#{Hu\
-^NJfFV<+Z%ouPEW$fPQ{d;;i$c@QHF|HP237*rM@6NNescB*Ji$azANXMX3u3TcyN}Wd&FmnPCys\
-1Q}*N2Wj4zY?St#)$;Wqfu4%B8DBXXVr8^sy&gPRv!fc3tre-#;PcWK|Jm5(c(ua-J;-(=Cu=CqY\
-W_n<ts5@N_iXY~L)Gz8t;Zmoj$xVVA=4h!m94%<mz>sz4QOm;Dopo2D>(rpMXH{i-$q1cBmvSUjo\
-%UL~UZ-8WLMxj5G)NIBnq_Eo+9*H(?o#gvv}0Jc+U+ANjI`UC6K<k*yL!3~7K-&!wOX3r1+TXb_Z\
-k$SSC>Z^>Q3~=)p~O@)S4)Z^Dm><D3jo$T<)lL&p<_?D2BU1poqwOi`h~E(V-%z!g7CHL35Mi&Cf\
-ZO`YW?VeqlKH6n{o9MMB?fad#u)8hCUVyV46&Ft{8;r=9YccDHq!=*PJgBLJGM-^OghmMrqd;ZDO\
-e){fCwt5n%ZN$~B~1{fid{*_spzB<Z`nxro;cR)WnS%4>h{9R{}08cNSI_y;&vp9It7)jN_ya=CN\
-*;w6^%elZH&9Ga{(pi`^-V`8c`9SAHB5*s#p#L7A(jYn8V!LD0(Nqxz*$gCDAIQLQtgUx|z}!bnl\
-PC`h=F?vA`QQSH*Q18xJ(6Hxu~RgiGVUl`HSXw7rb3o{{z#Ya0^iICdSEtmv0$<9wU}7!8yvw>#G\
-$eZdL}E{4|QBqpQNLJqpyq8iJQVEB|BNZ&p$<aJ?ft6?6xyf?dTLHEAi=J0zK7C8l98bT%f^=YQF\
-_s@~QKa3BGWAxB}wC6*$&XXSwV`!${wX>H0Ww8CQ%`RbnA;n>C5C5D3sM<XF~TVl^qF1~JxR^Ab7\
--xaff1^@r~ab10Ww07;fo*9MsQSvT?MaNv6({OF%FpT*gS<Y>a`d1^hj+*|rF+F>93bOQJulxh7z\
-AYmi4ncR;I$)CY4l?st_!MQhEh5l)J&*Y}lWS+@dsmw>VKysgRAH_<;SYkrF<UF8gfFc&BWL&ST_\
-P{c!9-$ihm~l%%wHkdH--OO+5p;HZp0b+|cK{NY4-oF|rnr!vR%UTlb9mZ+)zxD0eK$vyWZrX;jl\
-@j5)6byBY`KJ`KZbt1kNT~)OZAchwPL3j$Wnqd(FoNA)h;wYZwL)#k>Z=51@eYWiVw^I)GUf#dxX\
-8Rp>@qTmx@7j%#J{mJAkQ4BH<QI4r1G3o0lMvZpGGULI5YiMV5!=OKr<~NVi`QECGO!52YU@|E(k\
-WV!u&nwAQQ>!AuAwvN+W9BrYQ0#b<=ga{FS%NvqCC9U1O@idZCL2J5jRE5%$gTsO%Wc4W%L8=Gcl\
-7$&nWgeMu3868eyxte&mw(A*6h6cVx!yYC&55hEjZ%6cAFXqIxb@tbEZ=AoDX4PLGAeYtI*ok$n6\
-kF%AOs$t#gc63@VO)r4x^#rpmLwp^;UR1fqxbtPWa3oWJ|ZJS>aR)jr2HhsXnvF=ZHk==iEvp)T1\
-dwzvV+#7<GwIZc1m+SXCU=5Lq7w_8!0^lvCcL;18F%roHLO6BhAi0K8g=^1~S(f${EPkQMxmbT_b\
-MV8A!c&$r(s_f_et>MY8S;q!5WizP2+|dsm0K%Eq3tz~BrdR#YPphBQJW0RsZvV^f<llr0~pRVLV\
-mJ*Ep&CSZZ0!ea@`=1D0yOYUP~rh&_97?YAT$rwG4cd{czAl}R*fxFL6;*S(t4b;ksmAVF`8OV(I\
-$M*?Ah~8wRmnR4#JvTuZ>BkfJk!~8Sb#mIjIAEA7P5IPud%0EOT(WqcF?$q5h2JNKDp^f=hO<Y_H\
-{V(e?eq0}glwOux2ZkUUAINgO3@n+c8!vmcta4>_I6YSweCH1g4*wW6hZCoc1TdG+*2;7H5p~>%W\
-5d6&42p(<+M#thPVNK*<WWb)+y5`hY8B`;bEdO9bu$Q8`=^Qdz<1PzHe)$HqG$<5$0BK<^l{y4oW\
-}2+0Ak_5(g~^wJ+i`n8iK8X)2I-91D`lT7+Wt^~@CDszy4*X~Vje_=?$_N5%6Cm6!n7RTj?TOiaw\
-9qQP|HQ8D9bz&hBXGp8|sdDvOHCJX-Z<Lr#(00+vRBlz0m^XCMY#(#Y-!DxREwwE<~O7--c<5WD_\
-cu{CL8kld=M0G!#rn>9xaRMpCDK76>+7o89n>)84=wu`4WW~Ge%k_SwIqX#Vw4Gj<O3qsgpv*Hj7\
-XBsjV-As?5|*RE`F=z42pX@e5U)IfXY^isVTLz#0J-cqiL@sqbjuK!CnN&cJe2_o&W~+RE7ov(Px\
-V+>ZTsOwcBwdi4adK%s8(CxSm;&47Vh=NY4mIEjxp44G>05Z<IDFHL8a0FCQtDZJDvS)+3Kvev+f\
-nC==1hyHNGCNuEsahl+}1B6_u?Rsz0aIQ0!EvgpOpkpkF%+=2qSov}1x`ZY|`^*9Y71=IhEpX#V=\
-l^BIKigfeOnQX0)ej0ns*C$2*)+R$016&-&<AL}rl$4MD3dTvi_X|X7@+j+EdDS8gO7oMRZLs9Ji\
-(FLmI()_*bhWT0p70S<n{Jqrv(~)NYAmYNw{+FFtw&Ft3^hd=SPqhg0K^D7n4U3}m-cvS|EuC4^C\
-){3t@=1(CaWu8DmxdJ$Zo_PL_Tm`Ua;(^L?UVG<12{)u0ZI3@QN;2b@H24tu{jzgd2z_?p+71(_H\
-ld1NwCq=^N#L}CRmtJ4ii%eWF+$ixg1lDKF7n3!AhE)kWS69e_Ap{S$svSvc8kqHL&FLW8`FVIK-\
-bWJ~24h>0-F2QidnFqnv`=*v~0B$;JAx!MU_VgOFIq^(w{Wjz%g)&6YZqf}a=nMS>`*qGhz@nn8i\
-Z9$|kOhX9HBV5ZDhH+Xw-H&+3~d1JWvE{`@B%0xlw%50VbAcV?`oXUBj;J>1}>npD2)RQ*RW^(O>\
-ff)b(RGH=0F!!szgH|0RZY}A_CQ&QGEF1KbTTpNKL@1BkU|(LBcPg3GQF{Aw^X`=8h!X#S0pS?i7\
-L79#6Ai%sXDgX6ah6eh0lrnYwY^j^l0leL7_l=Tz_o0yuu>4few)Pf!iy9hsqF#v^5|7JEO~3nlc\
-2~z=F$~yby<oYRL>S@rO9m-A;F3moNsb}HA9Y(l#tyisEm&J<zt{nl|p<gj;Cu&kNFN2M}q%a?_l\
-wU6eCJHaz2vBKdgpj;@hzcs{1y?PThT@F!Pbv$F-vZE`FtF7%}Jo`}q^K5i?~(w)1kYA|3p`o$pK\
-PuPmUKbF3>?{8dJGgd|?YEYjstYqAc4Mky>8R6EdGS*|{4T)qSSWVxZG>oKz#+c8Q(`UG1f$nix3\
-3^3dX0p1%b^Uu-2dU1l3IBA^5R){dO7*`lET3;a)f}M~QOzj*uil!MBym8c2!awv11`wlj(_mx!q\
-@O_qU};!sn0}jN97qV(=B$u5yUi_boU;cTs=K$Lu?NYgWfqcvmA~=l_3m&0d>b?Vbi=w%y1mTmKd\
-sxD<@*X1X{z%3O8P|UzH<Ia>Ao_icR2gXYbn>UuYCS!(0zr|zogz2QCfWf2^s|w4~zWCau16|iPC\
-sOW5OT$h$-g>BNdH5X~Gm{I%nWCQ~L(D)5s-8sxnd^0*{4W<soQ|g)}8IV9kq@lzXE}{ll3&M%@P\
-pe`&6De|w=DY+1!R_klY}8@s|m9wZxdnLi^d3~SM_W+9o8bwG(H`Xp>e?i6O*0gF+5S0R>WN;8%!\
-0>GZ&DyGWWsgdM-Ax<zP2lamuwf<g>1LgkC%mz`T1+{__Z}S4x+k61p+<bkKRZ~R&Vam3(ew03K(\
-C-PdT};5dQ>{&yI_x%En-DYEzNS*%$o3_21Sgy{%8mCDG(_0bUS8s+4v;p3V$f{;bLe@eSUE{`pd\
-{aDMx8W$B##BLr#+@c)^EFNPSJGV#WwiEHoO}sCkR<#rk<n;Exg=ZTHEuS$>i)1M*9G>N!EBwn>D\
-8cK~8_<2XqgCdL?lTN4;D+lLrts`FnHy+FAYg<Fx($VCMqS+S<LTb=092tLJukL@&!FtCPo$Jh43\
-^PJ7O>3ig4dT<$AN8nT=oV5=)vGxq2$|1Ek*L(HY}Y?U}cp2bl~KKmfkG?wyv1%gH3=MEI?zV~5z\
-#n$|@AeFX040l+o$CHn>P%XZ{HW!+H-<)OLO!9I-+m%Q*Piqmcti0cxaM77H*_($4k~g!fvp2V+H\
-~xzB;ynS9{%*310)m{O%<d{bL(y?k-8QN}71#k{r|99@zZ=g}Ob+`zO@+h0g-r!h#k8jUVc(Ko+G\
-EKMPX$7|7%5(HLq({G0PF0)1~6o_HtW{2k24FXj}yyMyXo^L8Ap>=>S7jaTF@;><bqZv9FT0t%&F\
-{u>;YX6_x<fm<5eUXH{pD>G0d|DJh!zM=rTp&L%p@Jhy+)*qKOGqr}?@a_!}k4qGz{vctFG{;-$a\
-WQ?%>&czflzlD+COnx#ZX`lFr6Mg`oRa-Y}NHJbLgPJ`#NcCC0+?ebT&1is=#b;rG=`V2N0g34BP\
-mBiBo*Yq|v2&U;lwb>0sU4M2XMc0pjc+^hedLd<W3Z}$ueMIi5tkKe#k*R|5B$GRsVfRP<ufsztP\
-G`bxgjj&!wNaM@tk%k;j<7!7pEikQQ)R{2=3RIq4BddsLsckI32NEpD#7F~A!sF1ZGUBZGbrwP!q\
-BctYkckq#j3Q^A!1s!22_<7v><$b*&%55NTw?Bw@^RQ4){fDmS6hHLjni?r=Q|B*twp19rdd%K}G\
-dd^XEe3n{rO~BN?8L6D!W*bGjA@Dyg>ar;zHxWNFk}*jnK4MRG;(;86Lh&+Z)5)qZye!8>4k2PHY\
-qDzD5_Qpt@|EqHF6>o^V>-C0<dq|TD#kl|f|#zX_==G3ERe5}Akz+39e`2>O&G3ryB{)wR8s3F>6\
-gsts0(Y=WI5G0EiiX?17+kUn#w+}g?OMMVl7LMmywF+o%9auUT-&rxGkR2y>?FH6H)bRykPd(NP<\
-d%5XPxvCV-;tW`zXuNoI~BMt;CH(RVcCWFqZ95_#H(=4JJRg;+T1%_1dk?UXT=c38xLf{PHnh^Q7\
-q7!9bw{|m7+8L-~unU)>Fa}yyRS839ERxz2eGQ##vu|s-quCODJe!1)L_PZ-p2J(WN*&?M^^Op(f\
-`p2<hzo?G47jD~!@|b{2~7s4gn`8?qo1IJpKYX&Jprc0o{UZCT+YAAUPYZ~fsdIXLhlwJO!IN>k^\
-N7mdWDtqKlLHJkcM)xN9@3Lb||+k`5Thn&?ouUJ_vVu&=0&^#YUwEk0J8SGBC3~t9_4p*wgVe57s\
-X1;$73?f0X9TaFHrI)#|VaN}+_Z9fz>b??wIK81XnG}d4kaI4ya0o5OQ;zXM7-m9qVVF-emkhH`t\
-bCXf*^U`{Q;vic=lS>mv+WKB+V382p!CpbOLt}SzrBw>KtQ@}E@&len^RgT+vdt3IpwZN_f7F5H1\
-%eFC+403-^}ZzjPrm|AVa9$t9K^~3hk|l!ukbz@d|C$y}EcTyG)_g@0=RYr6}1`K50S7``4C=E7q\
-O&N~Xk9l_%+EjWY3YFuSYaNkS6&i{wudN*<7&B&=*CJxRE$b#NQIRMNe_o+#<wf3IHBtpMjE%|+=\
-!vY4&}CA`kvNm$SYorDFQ(uq1#VA0_aSz2E~vk-icIVH!;vE*UmFQIkm5wxE?2Xm{CdHxiJWQa*^\
-Croq9!@@NCKg{E8Oe3u|uxnpayba;|*V>BT?=F77JOBOchT88R@56oHSiZz@BIKqLBApt9mgo=uD\
-%~e{_@>sE{AR&VUM-TnZc(dXO8X~0WGAn>JP7Jh?9NBcw9271gXrc4y6WsYgsp69s*(K5=y|8feI\
-w7t>b|M4iLk5!E*er9lxP-)LNw|25Q)ZQhtwm=*RfP#^iZEBP>i6cbBq>;OpG3eQ)}W#pHf_nkx9\
-T#C?S1HQ8jKG8Gucg=~K$A{*Un66GuYJPfQoAq<%<9Vi@*|@g;`vc5(tp{PAL#W)G-CodgqNm=O=\
-Z)j3^NZ+62&8C(mgq!xTDEsM9UMRio43*Rtw4g81LyJDA3Hwaf#Gm;wI7?+Z~Q|VWt5EqI%V)^gi\
-fB*jb_us$&{{8pwzkmPz`|scN{*4?lYr?2uvr=bHm^!Xan_&sVMopWFo}8mnW2ZVNPmY~BEj4!bh\
-{+R1Yua_2I(EX;38`aZCr_I;J$Ce%)G?z{$Bd4hFf|sn9+5g`+&qir(MKPxYMG4+rp<(|XO0;$dG\
-fST!zN6fHD+e&^?ZME2aCnK$l{&X1^q5Z|1Gk#ySpntt_SHr?K5Yhuf}#tO&v33Iv!c-wAd-rW{-\
-&-F*O#ynHM{2`iN0ur1d5`r%aEXGa+@nwzAr9x2Z6w*iqw0%p8GcJ`>M;?1af<EYcD(Kg&!@AInH\
-fXG>#UKU1AkMxv_I#>UPWGhy8L)LGgJ(<hIZH)bYkhaR0HQYTEC8arWD>{K+sX*1E7r^Sw(Fs@Ck\
-rK)9E!ied^5LCysX)^-Bc+`lg7=)t`?9pP)N*&#%4Ox-c$s=ZtL!V3?kNWt3?A;HXl=J@o|7&+=l\
-B}#Ow*RA6Emn=JR2EaMB+1B12!mv0Wn|T=m62rCmcbqti;-j{j4Xvc&R{uVWe&^fkj!ybC+u<NBu\
-<C5^Lt!#y>@4=Y2H_#&+qoV-F|;=r`wHty`S&vy584yy|2G>%{A9wQF-}I*Dkuc;F$lj>r4L=9nX\
-JnCi$khC&kOhZw<WARcCx^zVfLP$D7BK_|tgV9ZBQeH~)Wn`mtE-HuL!OKHUAs)m4}%x`MuaMYDc\
-?cfsV7Cx~xl^v^n_b*QG@V$-zBrr%;w{@zpTjOFEPS{^#_ypqmXHO|woTJbFm=Ic*$b;iOtV^U`<\
-iu%(@IY(<+pEEmSW3U8g;zL-8Td@ugJ*zVo!r>UflTaI`X>M#T)U@`gow0U|p4%DAKAv{DX$L-xZ\
-rqC%`15(4v0Chy-WhAe-RF14wqapuXKXKS#yqx(y*LI3T|j$q%*@W1V<hvVe=vu|moi?brqy4@cr\
-l8#*l{K8!Kbh4jJ4r2a~a<Wn)dwloiP{w+1nW_!@>HmSK>7{cg8m3OADAUj4kYpb&O?tm7THrahi\
-4?Iwxw{H|WNz^w&+`XV{3BFJivWrCpfq*0cxFjk6Ya#=O{pe(Y7n^2f6=j0Lx{{P9odyG+yiFX@a\
-0@E2^uD}9}@o|kLd-?0EE>aQ!qlb3eJ%JJnp7%$FPM*FYTv_tM>IpRFbo2zN>VKM%+yfZcnU%rd^\
-!=BZwx9c?RxVt-J`546#bg$@)&BkZ38rxQO#u_kK(;3@>N3CK$v2->4<t9zL@gC+A=lNN0ScQ4)7\
-uMkz{1?u`L+|U1RpAl$Gk=(mA)J8`d;*&*=|8_?y>Of;sq2hQU94%>V>#}Ah~<VuA7;5>!y~NkDo\
-xvib$EJxXKXvxU<W>h4*KQm=)$e&!8Y_^uSaPI=3@w_U<4~s8?I^kuW&nXJ-YBc^x$6f;lYnFJl=\
-uL*otlV6WR(i&GtCU6(?f}K8CZg8JFQtxEAvQ43A^54QHb57}|mPScfIp=Lv?#QMe4J<64}L&3GT\
-S;YPF_t7#u&K2BZ3@K}zsu?Cmn23(6R*o^JihS^Ut{BfGL9P@D<mf*WM8+YO|?6H>NaTqq^By7VF\
-+SvXhn2*|1438slHqOFjxB}PWX7sULZ^MATy<-UT*0DZt0%~mM<yekwSc5&E?u>1~f!KnlU^_mI*\
-=+A)8rWX(9PBxYeu)KGum7kRHeng=!5YkchVfw$wqQ9%u?BNaWO<<z+prXE>*;@(kF_`pH{(*=hE\
-L&M9PljLLlM)*V%&}%EZ)F!z(=qFx8N4st^Zmt<~&EcPtvr}Sb!e=M?7%_mSF={<5q0Iy|@L3Jg+\
-~w!*au(quGC80WQ^l6csmM8NQFz7{vzc_X5M?B;18_u;<CFA1p*I$aan=p%-VN9~&@;dohe-USzr\
-9W0*6BV<9@RXd}bp3ar2eti=v&#6d50##-@I+=H!{$Nu*x9D@rQ+5h7kScN}hJ?6jM8EZl>ZpRP~\
-V1KQ>!t%y^oP}et3g==7>oI~M)J~z_Z(@7L6VZi}(1SD3hjTE1t=Nn`Hq+nn2(%Tm9bi7z;$(am%\
-kVR-#+}%JrLWSza5=W)1DJg(+Zh&O?rSV3JOjP>1=ivZ*of1b=wIl;y%_pE^LrZGI~L=pKhSP0K_\
-9LSv7KSgo3tCZU>o*%i*|F?G3agDjh|r&I-1!|vG5)GCysfS;W3KMIPQ-OkCV1AJZCC%Fdyr%1RH\
-QRevQj;53a=_?=d_UVH@tip88qQ`}9xjgOkyXW!S5Q?Ggvz2AqT~xDng+{6m%-XF^3-h%<01Hexw\
-`hBf#zZorva>7O_kqgaPI9JgOXFScMSevNx@#7CX6T+X@{VG;VV6t`mq7KB+Zcp5h13T(yCa1XX)\
-?inn<KQTNm!&3YjE3ntc437oahzqb48*q=Ff5Pxw#f-utbYm$#h7}mbT0L)Nc)S=}u@d*-yO?_>+\
-a(s^#h)@fF2xEAU@iWDjp+D{;q@H%;A@yWne~oE==w9m<6Nx3TCBxJY{XV<#l73up3Y)^KWDw-I-\
-HEnScV-~jibI`d%&f*1vlU>Y{8yWSbkW5IbSketlz=*i*H~(ZpS7)|BCG%Ct(LZfCJ8EyTD?M;4I\
-W443GJLWx5#rn*M+vV-%y9GnM>r?62@*bmMyTVk`Qw6N5OYjp6Y$jN+BwFx_)lo;%qNF#GRp2iPB\
-%;W@Y#7h*HsjcxcY+NN=`|1I;2J8?4Z#WF1Zj^%}g-_wuLi!Jyxwxib0cEEXOE*9dkI29*jInKcv\
-T#g&?57>g=>h(GAJnbLM_j&A>(247@6kD+ZSNy>8#sD_q&lo|+KUvSy>F-#8?Kl}HM42v@V+{`Z7\
-ySb(aT~6|y?Ehn_P6J2+Rf;~yU>H{(T8Jyq`i1Hw%|N$$KNool=Iv@92amD&cyjxh0CxW8?Xs?VF\
-Y{pM0+owpP&N={LFN59C~mz`tUvs;93mfyBNW3sLjx{@6drA`tVr(Z`LzDhRblwUfPW_umyeCj&+\
-!QA?FkSVL9V^bmMpE#n3PGFWiAa%>I@Bg@Z7PF3g!pzr`Z_8cVUNgZajXu^yYT3Af{R4F5*EFQQ+\
-f14neyZnVXiZ~fos!&w->c^E=JMsN*k7qfrnsx===umpEtId)(T4$FweHsBO&!P7Ehu_%^d&L#9e\
-bmF_{#`>&S%!{v~AKNg9eQdE<81pfTqcLX|`w=X{ZCHx)?Xg%D`mr8g!zSE;+wtQbv6yx#+Yvf2`\
-+!)?g>LlVYv{uW2C#R}SS*Ak7{M8+asBlgI`BPo;jiey-Ur5F&3G#|a{bkSt+*TaU{0@CEZ4*F35\
-)Q2EX6yq0)tqKzhEN{Jc!|OGVa0qF!u_s*RTj9Sc=DHGdxbiTD%Gy@k4CY>){^k#M~?C=La)9j>A\
-%%jTN{6Yq1s^aU-^3828{Wn0pn=tvAEtu~>@5Sb-N~EtX>=w%|7W4)@}?Lt?SK*&KIq3@*i)I4vg\
-@TZR?57XNW5%MoMPhKKfv#cWq=niKQUkCQQiW!Q<;`2Jx`7o*sU*B(y0aWUr3(X@xK2sdCUW*-rY\
-RpPN&hgG;4AI5FijC;|4B-6cy(?=}9k$q#a**G4Tp$FIE5^P34wqX=|meDWz#bO0G11F;o%W!Icm\
-KV;)M*MyN?Z)455B48OySZ*(hDG=Qmg1LKfhB`zH_pYqxE-swjvp|X{*NQD3723_xu)HVPJ98~xD\
-~y)1O4~|1~J#c_J+eTijy$sdQH0somh!(T!~(M2L1Rt263xCJVy25G4m*fpU3e5oj3vASc+bpkAB\
->OLEMR9?8GSM3}N^i*iO-jOVEv5(TfrE<LIFbkEIyKa*XQrF~`e#M<;fm8++$7JT65)1~7<kU>HB\
-cDDJ|X8#ymKn&EK<x^W$PaWnd{a2Uhm6bxe-M$v~k^Vy%H6MsNAo;IA}(T#qbhe2G9VXVU_#?W~a\
-`}+dcJI=;hd>R|^RcyuK$FQB;%yk0h<Aqp)H{)!)AD7`qT#I3B#;>srwPP860sC9b$6_qOX*e6pa\
-TzYbwb+c!Sa)13){fgTdm;O=Li#IyiKX~YtiXehr`_nlMqGrgIBi5M)`5$0K&7Uw!eV?DXW<)Ig(\
-V~D*O=#w#dhKQ*z*>)8!SM_32a|@6V~9JxB(x;7JLTVu?e#m(SNWIBRCa*!g4%p6vN|q+<@m}3zl\
-I!F30S}T&H6pzKVXl>_oO(tis$XO?w-Q@UK{kS`phL=Had-^smwE2XA9L9moCvU%_hZaY`)KfR~*\
-{KfnM+F>*TlPaoUQc#b<*KY`;8I!hQ1^CvMJ{&FVmyPff!&GfMyOL53l)&ovDhvkUBoXh&dlIhGB\
-K7T&LEoJ{#%6#Fw7tl{}_mvzM@rbK9F5=&2Gu`EEKUZ@ctmeE7U3e81-OKvNnK*b3)47j+gCYC^B\
-Uo?^{p^0WlQQy$IUZmW-h|pCns(f^j2B<WyhmBjI0nDLnfT~j_S<;;b?pDJ7&qgExD9)hvp>WuaQ\
-l;Nr`UnFTu(dKYTAqQ=+Aic4YX?=`%jGEsb1RkG{?Ui=}*{mKJ8ntX}`xN9B>ok!E4d+Ec??6#)s\
-$J%=WT@^@Nl0fd#bVInGlT(hgjYdCzN_y^?;7$KOJ~#&59-ix;t6@sh>#yP&3BT19`ulWt{ud6D&\
-ljW`=yaSd+U$nsgj`0@GM*lu2;Ut=+D$5}Ys$9y!>kCxJpUuHQhqaWcrnDYwzpXH1fFU3~;`Yy(Y\
-`PD4XO`3KCZpS9<z|YWeEBy&wIPh-z0T!bV*I)p@!)82o1^X4O!=Ci_%~*ija5C=2GR#{^|Hb>T0\
-XO0n{224}Pep229`tJmw&Urzg??DPn)$(Lm~#jFPjupHbmN43=qI=W>v6iD^^Nl}g7=}ejPp3m$8\
-A`GyKpuRxtIMNUW{w;==*607GXP<VD_CX-v{XTxCBeF9xL!Qti{i<5r4r}tay;+iB0HWJL*}-^2C\
-|w!#WILCx-B_hiEU3N9`{5L+HRJbm0#4V9$pc9!FsSFToHl#RzUjjqS7zJ=o_F>f@hrE#}p;-mn<\
-ka5~!VW`BnHxE4#W`B9ErxC{N*=P{03cpq-VHMkcyV%`eYBaXoioQcyOr{CjjtY4wu2WR`jR@{!&\
-0ou8e{SZ2E3%YO{dRFRRXrSFV;|bc0)!2;dunn8hR>O9H`M4WP@YFS|S6qS1umRWN7Hq~{*rw-C(\
-qC6`e0qxhgxk@LP3u^%7{yu~{S58K$+#Uo*nul>z-spYSd2OA*&cBWR-qs3aThjW&9h7wx1sGG_K\
-zFbPOuUu<2o$EpRooDpJRK*W!Q3$e!rLgh&wRb&-n!wV(;fUuHhIg$A{664H)$6_jBowSc!XZ9p<\
-v%-h!3*Io6>q$o>F_;WixgBI_5IU>^JP(HmL67{OVny~KRtC@f$<e>YCX9ayg0NINi!L2Q4S;~W;\
-h!uE`7Ft3*7fn%_26a5As#!3uh9qz=<xCggkpUt!j>u|vDH0>iSM%$~j3rAoT-h%bG5}WWb+>VXd\
-fxTX%-#x%}HoDM-9-N0h^kD$+!w`Oi5zKs@e)}NX4LWcUy6{=_;AiMVM-#*2C=5NQ-?wFWT#dFmm\
-g^g=Kl~cqnEMB|H!MIuPQf5vhhe-Gqxe1MKBQ@fhu9zCa4f~&VI{tgb+`vN<FRkD-0&*gi?3rI$6\
-?o7EH_+;vv31e;b*uV3*TnGI6hB74=zC;Hevv6&CC~$zz9x%hkjYldViO8VF#At1Ak<D!Un9xo!E\
-%)zDK*T@O|2a#W>(G_On=wUYvy?^x^0a*p6`lHshzb3o~2Tjvv>wSy+Jg;bh!}W!UFKjyqU_4fq^\
-x!7p$Z=4@s70LMctz-c%cZ6C2da0vQwE(UQkhH(c*abuX}`2_nPEJpjEXgB6#6;8o=ybhbN2Djsz\
-*nwFeGv8}C@516W`h8)B$4jvaZ^C+9i%s|zZpU`)z(Jod{FC~9Vur_hoQ3vQhQ|}J9?P%^tI)xDQ\
-9CZfPF#xvK4rP$ENsJ3pV3dB;@_B$^RNVWU>R2andO2HU=TwX#x{)Nwr%uN&bP*W&i0M9I1873!T\
-QA4F@U+-S>Bw7EyZ&D8EY{2OZI;_3S00hY{xpxZqV-o)6ejqSc<*BqMzXfSc}WC5!YiYHsKy@#oT\
-9DUs!}W5r)ShSb;@Yi*?wDo!E+f{>tz;26H(-ycmnH5=(IlR^ZaFSwFZ3J)Acd{f+s>nHa$9F@(2\
-a1jA_Ke6nvF^N)pCgHvz=R$vRdzF|ATS9j9iIN$sL$KZE36a9Z@`^Q(X4%=`u_S?mJ<-F64ZFno%\
-UeL6AFdx6d$@mkNVb-^7FE|Jra5Qeg<=BpOn9X@>5DW1woQi+Lay;%k+KuHHML*_nKKlte@f&pG`\
-QNj=a1QRlb(qU}ZYvhyPAo-tJN58Nti_Gkh<*RTa^?K@Q4HWgKQNy-5ZkZ@dvad<I!?uJupE2*lj\
-V!2;09ccEw};O@eR!8{5dnq{GkJ<;utK)DOiIaV;I}8i1X=V{zZH7F|5FsuonM>d7M}O4aeZD-K;\
-O1hn4tOtlMNf?UO4{{bVefu4Po_Wc1HIpr=2BeF<d)^aq3Lev3bQqV>+1)H`p=AqOq&>C;Z{H}2R\
-I^M`Z|U!p%G^u=$noTLYf^zvEyM<JB^CML@Daq5q94LYhbRvLext#{7y%!vp0$UK`V8@bUQ_tbcc\
-4tV69zi3+j<aX)*y*aouHjsbY?z%rQj>&gqWo2h{k7qmo^<p|lCr@WqJdWob{Fg(1y{R3uyN4gZ_\
-%9<LoSe@vhS%Gm|0ubhb12bleUjR7#vNIis}s|i&3Hbh-l*j9T${+3k++dwU~0$I?slvt?>nS3c2\
-aU)o@hrA`3Ulf`to?>K2tlgPD(6~cJi}^cE*lK9?v<6c4TLA4Mg5MIX@$j7m^=O-Y+>nFOg3rzjc\
-9n{N>~~ksp?vPf6r8<Z~>B-#|WVfqH$mkYBk#-M)4iepqsTY0~^>8N(l+oX<|0e{!!y`=(|Y?eCw\
-QPfwbE8GpL|6rX?cE67JC=W~+gU#5R}a&B}JP5)(#7V@jf7ns%`eX%Stjwp3DQRh5UUz^<BM{;cX\
-1Am>dqmuKPiQ%2(-;y7aoKH&RZt`v96O;2riQG%xu|VC|{p6z-s@HLld<^*s$$8TJg~`t%ADWzBo\
-HYOBQx~e&L5|%zckU;5?<e<4zQ{EHHzwwve4WMc!Tsdn{p8X8<T*X8bLW0?x8$n%^O9?o>f!zS$%\
-FgJ!~4mj`^j?-u+E*5tLD#5ezC>y-u>kM{p7*@<l+6~(f#B(J&jy7e@<+)7~Z{~+$*_iAM58YZ&~\
-C){t~vx!~A83BG-?V9{#dy0LN_hgSH1(nva#Mv%2Rq??6r4%Q=QED``Agzh>$c^nGmu^|o`&y-Pp\
-#UzRkU%q899n8i3;9506?x8<V5{<?~M0{LaB`)hY%egf2~qRwxo^|7aW8X@wF^E+eqjO4r{p6k<y\
-=xsQ<Gxk&JH2$8LhOHOZ8pAqc<C5##n8@>c>7PM$#%fG$xTCubCFFJFrzhtNlFom~HxEm{PuJJU9\
-@_W@c|U!f9I+x%=ggX{J8W6K^tBQ{{xKe>#lELyKY9Cp^6Z0*{Mh9DilpN|`8Y+c&qovE&pC$kG>\
-$R0MRzBi<HYA<h>fcHI;mhhgO2ZvZB1P#p~ST6sI!;j<U-RjpVz(2H<P<9j&s|{OBbd;SJ3ml2N}\
-o7LCN_Ai99b`)6OI>H%<Sl?tV3f{C@I#Q|IB1#5iVU8~aMt`AQXeTVZGH^5nj&pTkc}oU;a~;}{{\
-=3gf%lac(@<ANh5Xmy&1e%l!E2r0J~6s<GW+&uYvZk&`tsKEn9^kNVD0ov~+4<69RWpZ>G0KJwSe\
-Gucnt{&iPkeA8BEt+LhF@92>=)y5bf&rGcMMuxe2EZd;oe|Owvo|ipFMZMm3>dh(cj2)xb`#z;!U\
-RHNK+rgT4js8A4&R1=FQ|g_Z7+)dv?iw%k+ST<+srU56&e&A_`XG{0@05)0dR5f>phW7mrmv?j!y\
-+yaPPI5sEhV37ah_XYk?Z}!Cb|A7u&peq9rF_7*i0Rd#Wc2A<oYzqB#%#{XZmRj;3T)gVj9I3dHj\
-65w~@!E(Xc%2G<=Ms+F}|3i(H?EQ}XyUCa0f98+GbaubbFbFO>bNjSKfR3)K6PeDbFh`y#y!jfWW\
-L^q1@7+Hz-7of+MAwjE-ex5w)=q_5MVFVC(z)#>XvXiKoGPT9V7^!Bz==X>fDCb##h#Qf|b-%EZ>\
-a_&jwxrb_6W~F-HSahhdUsGL2mXi0VRFA)cJjWuhCGTf3{YLUUi|MzL53(5l9`XW<Jhu<mU>4_aM\
-f=H1_mfvhuAG1JVypQlA7?fH<SwiEC!a!oTylP8()=H$X)`L-+uYhdMy_8&+jcG8=Q>)ivxPd#^d\
-FIoZxcy%Zc9w3is>{|roXSF=k?^jx0uf+@@Dd>rtNZK;{F$TRR0c{DL=D2?;v;F(iwB5>=)+Ceql\
-f^%aQzQ)9|yphc6~yevA4XV-|T8`E91*7j!S9D)Q~*Gg8kXCMWIxsMC9qx-W#tv&qjlO=C)T8zcH\
-WEK=Xk&}jUGMe23!ARkZuKx!MS6XPhMPNT&%W|O~6?lZM<VfS*_LmQ7+EPW;5OWRi(7{@s3j7c8H\
-4T*dU`Siu=>!Mxcp2h0E((?#St68k>D+T1gp4u53n|$6>kr@AE^7_T<zEnouM4q3VUy>NUnmn{v-\
-Ip53UtXO4zE6C6Bd?`>7bmwb<yxwpI%^iI?;T|y$$GSCV<Guw^0Q6LXhQcgno8bAK0G<UEb0Cq`S\
-;{~lJm2Y?*EbRSggLcwt;-BBG;EeG5H&djr-ZQ>zAaxryZqE&nopY$jRf_Q>AW$Gtc;5sj3Yj#{W\
-xK8~$-?+BQ@$juMMD)RNDzXhS3UB#SnbkdLnFS`O*ku$MYMi#Fu-)wKI8+AxNEsYM&MF#h>nZTLr\
-3+BQ@%j;1PgpROnWu*!Ph6Qa)Px2Eq?@#}x`QRJTFYb@is+MUsL{?|{_<}Fc=BcI%}#CjZ)sZ)QO\
-dK_ist8cR&M-6q}_o>IRfn5LncdK!Psk8U?^w+KN{!d=Av@^EJls})i|J|Qs68RKUK0a~(i@e7jT\
-yG|~AuFr<`qE9l`wsQ^z2qyFsmJdpZ(ODxe~>(Ir#cUl*DP00KT4i|mwNg+{BPP_>hU}I-?(av`+\
-t(FKI`)Gzp2&g?aI&pimT-~)0KOZ?*H+>8P)22Xqf*^CLfWUU!8RS(_(nNkL3(BhJPk?n|mbb{Fg\
-dgtJTN*Qu44x8!O1)B0n`buSm3^mOMiKT86m|SsN19;G3zlV1;@b+sMmSsPAR%C7-`Sy`AK7!u1C\
-Eg{FL3cRq&v=N0O6?3wxr+sgF!KJ~nkJd^xV)A&of$6rV8TB%;fo5?4vRG+s^mi$V6|90cTq-k7~\
-IRB-NZ>4$}4q)W-SE~C`@nB<kRU2oKUwo3Bn~vXi8CH?6B41+4Z|TnK2OIOC>Z?uUA29q)spmXN+\
-gpS>{YH1j?lw(hS>m&HMigD4{!G(BzH^28oX17pXQev#ke{|vJ$@f~k;U)<a*stGBCoL+e}sIg#q\
-b&{?|F;dLH@bL_+8{-tNADIu*iMn1vTpJAV5BcydXKhJn8sPKCec7eH0-tCqKtD{*uJ}vw=Qbqdp\
-IEkZ-6lwxe|0kc<2Wi}rcQf3|3!k9?0s`vT-cR;k+;A}?B{ZeN6a!76q8w4s`|WR<#o4)Us1>h`(\
-F*ITsDL*8W3J|B6fMf(EeJyu&>|B~BQtJ@bLAGKQDKK;gT$!c}`9OTPa8}}E}-CJ~#KSn+}Iln$>\
-{>dB3&ozyIQeyte+g7WOQvvcHEb<Wf-qq^!k%&dEFLSTtL-l*!=iZp8b9VRr{zLSmu6|8e&;O$Lb\
-jE7*x)X0SADfpXj?JY<^WVMd<3a`bjC<AVv{r^!E%Qe5@_W_Gyp??Ez3OGYhkWC`>SdZcj6Qp>#r\
-;2vTwkWmM;m#3nV#acT&7X#Hr^-8bfj0gOdFVHUafkWZXxeit6rwNWcZ@w{JKQmlZ*DkTJ<t5AfH\
-gHUZ#`D=hv#2X&HG{t$LYOTjcsO&67O7Oo!iKxlBu_Tk$(tru}bFF4GR`ZF@kyOa~O`-!V}y)8Yb\
-Sc-1nUMc)2^dYM*{XFjN2ruF2b9#k*WCh}s7d^`E12i42G!y?z0d5z@pW&Y#!mdkuIbx*64W&Zc;\
-mCM}A3G<qV)XUUQ9(YK7eH0|W=OOj=RhayVht$g?O8)Fa>T}*427L4(^|gtU{I!RyuT4s+<9?(wH\
-pjGHFHPM4A%EZzbsK8QtI11JuE7?_=jV<3JEh2@sn=*<Ctd$gr?Ni%IO5ko<n{IHeQe%wn)VX;MW\
-%UhC$4|U+w0ZOGR`EA)T{4jR+4{KukHtR<gFI@X7Z2gEk6I0Ty-72m;C#Bbw9}~)U@l4m1jZ6@4J\
-r1kY9YPT>p(X-*48}(M<A}>r<Zd)7R0NN!velPG=nNn3i!<V*4j=BM+GJ2fOno^4Z6!+qj*4I{En\
-Iyeet?C%=jOOVjvU6VLx1Pk%2=xfhTbNPPZ5KCE8-e8VjA0rl3OZ}_M)tzP|1Ne=l;@|X4N*gs!u\
-9?#QB$3N=rv}nsN^6mR+OEwp}y&qM#rJix*Jt}RvNZpoF#<T8Gbz3UP>mRjlOC5E#TC}A=e~(*NT\
-fQhu+m`tKPwLHi%z9e3kxcI~^|We7=-)k*Y28|;obRcOXXNARZB~D$-0_cF-2W#Z{CN7$;q~Lu0P\
--Q^_vr1&N@~Yh#<MP&w<c}>)V<SUT6@VCT1=~&d{Ni59=XPHS|v_R`_f`sv&lbFOe_BR7t{LqapS\
-Wi+lfijTA1|t599d3Vj5e>BNo$`N#52qjZfyJokq5PkrYs`ze4iP$5TGzN*aDD`5=b>)U>~7>E2(\
-Ileb!ozlQwdfO?<2fqZ*FeLt#&{JVg98MVvss(W(ToK)<v7`~7^Y>`hTe=DHAUsX=tNbc2A@84&7\
-y6!Lg^%I*X(x2bx+oEHX@qWsO_4Rnj)#h!nCaM2ZZ`l*-Wxbbt=@S;mzY|#><VPmw(-QMC=0s!sK\
-khp(f9sl;S=1?Aqi#bL`SdmF{!~vse~r37HIWxQsUH7!@?lS^`%4FT(UTVUKZ}gvRnM>L@0ir5Z?\
-!)4_fJ+lsa~Ja6OH$O#@FYCS1H%0{@%*H7W1mV&+_Ld)$3D#&!x6jy*~B#U+UwxTAzi~*|JvMhN<\
-N5u2rwka`K&P)$6l{y#6VR?Vo(zQx@AldE-+S+rJF2-2S;xYj{e%{T7lx{FL?jc2j5PQ|k2{Imvk\
-MYJ7d)c7<|%*D;>C>nzTH$;;NMm(@1%`RmljgT3Sn)>*Ib0bCqRdRje=VsiJ>>Nd_IpZ2u6KU9&=\
-ds^Ke>dEsP)Z=d=AJSlP{YzfhV6pv^k87~l{>K=@tNKH+{w~#q{cQi#ncHBo{hw^SFE`#F?z&vP{\
-WG2)ESAL<@^*`5v5WlY26cbv$%WD{4g1;tsq_9b>gTbhl82vBUlW#-H$S7kCaodgMSiWRKX|(P!v\
-^wE>($e5(cdAyUcJ8C$tSH>-;c>2XS`cjdHg4zMt+s4eHSO5f6?DvzFvLrqMZEp_3C>UHRSiNS1-\
-Q}<Yx_*&#t>a%Q~a`IjR=&o5;UP{XFc`r28M#nZPt|FwMi9?s4Rt!ZnbiGgg**f8*k$=bx!F{ix2\
-^ou+p968AsIH<8aW<rj8Oqk{ZL@;#~T{4UWS>!|bgkj~hW)OL6?y2sN*oq_qCu_sc;^I+2bZ|c1H\
-jC#A!idk;YsGkRLkpKLQdb@Lx?|DZ3?68M??=$NA6h88QKcnsw0rCUaTipLA&t0!>e}w$B_3HL%r\
-?TiQ#_u4XYB7En`2vgad&qCG7{8BvnZ@`6<j-4-KSaK9z4|^=g#2mpxu)@7k@)=YG)?=L#WwFCZ(\
-DD%{>i_#$o2O_M=Wyvz0o@?mQUa`{e3p-_Jznlw-|qfe49nC>F=Yq$Q|UZ7VUGLZnR(3J`Z`=YW~\
-T$S_~i1e{sfQ_z?LU>n)!DA`h-No|iWrTa&&Qt-o8l-C`R0JGZ}EuYNXEe;0SZXVt^&@955ZHvKZ\
-x?=|e9jYG&kh~I0taNm0kuO{99W?XMQt3C#X$+wW-VtRhboA~|@`BBeV-2Wc0X@^<lPICKm>E~5n\
--fnW+bJokdf;z6})XTG$+^d*|zP$3u=RGIOYtanL<rNvPzpqKXytE1IKc81GF9-ScFQ}J?i~RBzE\
-Vh60OJ7j;PanDa1?%OtmO3>S(`Y7N@q+q0?QP^u7Q@^0ceB5s?w_>`-~56s@4gpUE^qz!T4o2;%U\
-gf{``n;<dF$`mc>6{5@(z-}{GxhZ!V`_(K~UvU@{KQAJpabY>Dm{q*N6U&`iR9e^mo_qAU`uXUy{\
-`S$$M;6FK-)p&PG|@o6omg-XZD+H>#I+g#49_>gBDSp=pOSS{(n#Ga4<9f8?>3)aUFT^2rwC_mPi\
-lOuwx3^${Syg8Z6&uS+iMnuliUtZh^;gEsO9`gO)$HMKF=-A3CaO&i%iWt}H|pDLexF5{nX%CGG{\
-4=o{|#_*RUpNAT4Jh!WjWz@NoI)$e7FtmF;RFmI3pfeUSO=DBy^MCT0jq2|gY|(#@pi$kgcgZ}sQ\
-~ULVr0XA6!iNLWKd%?R|Dms>fyU>-rgQSc6W0cA>cj@BKhyG(uN{<rS?kmAleZ1BUY7cADD>w#XR\
-K*iI=h#p{@V&gT*I`Ortx;-`zB}V&&74dZcM#yxF)f@@+NEA@m!;vm^!aVC+4-7I&)r9U$4y~zvv\
-~4`=8_&TIBWQGhR|(Pd1THvdFiSkA6wLU38EaTeN?`S!@>;?JFi9VKx8cM_J83xx-@kdh)|8hHoN\
-2^d<GaWjlG6MczUF^G5akzyVy8?A@pyzL@;GjTZO6$ah(cze<KzjX(a|8y4f&f0N_$jVYh)WuBAx\
-{+s@r9Tv+^{|%4c`fvXv=jSHP|JfX;ES8`Cn;-h}QSFoT-vY^dNqs*?|BaAgFR9N1>(4g&ziRqT<\
-da{rn1AvmR`X9@Wi|g(IaXWE|5Ri9SIyrn8D2GiRpe_e#$QkV0C|OJ`0Em%e~^D?F@M|1cUjFp`A\
-)0(KSzJJsKxw~hhMT-|Kw4t^-tbuwf@ORSe!dFkvkgI%V#@zg~ho`2l;%9e1QHNFpcWvQ%qiFaZH\
-{?UfpOh|KtxeTFgKByH@j0zS*Mv+sR+CXnzO!^A_VDa4zRxspnpqmnDvW<i-7s_s}Jd!@1qZ;aTK\
-=R4kwP_g~5T4v=@dBp-)=OuGK3PIIIBJBcCkEsZJf+hQCy%Q}dVe{XSKq_Ob7B%inM`Q>F@^N~-T\
-c>~nX*_7zNJvl)AEYNK7IRoSw_~iK<pY;4AbyiWwVOo|)W^})AN6!b!dv21)@oUokZ@ry^)a`87+\
-c`*{g&uGIzO_D$?DLG_t=g&oZc%@WKIbOyYtg5?<Of*{?<YUdA`g-uV3CK(dsyUAa+^i_a;9@mV6\
-o41lJBwDC%UH_`&8BaGVgR_pQsw%PyV&V^n>IPi{ZoMACpf?&Tmb6{}cIM{rCU$>z?b*FkcJ2oAm\
-kr`NlPs>9d-}iSaZ{H@3U@cur7{NB^CvikH>j%hrE?>h_l{?*EbB^s>eMKk^$bhL4cXemVVfjQV_\
-d$sc=J=3`-ray|-5HEqf(>iL*Ve&H+Xc9fBy^@@5vs>#o^7`}mg9Qkt7eB9bSANuce1zwT)`2EDR\
-^Pz9!QR;olweZ=QDc3cpW_It_b1z_iH+9A~nx^$k;`1N!*EU&v|Bw9jP3reLR9v9HYdrls3*z7ZB\
-d=m#cwuTA&q}m$Gj+b&Wbyq!@;_PRd&%Fn$n!X<eAyx&L*8JK&zzyZS6!V~lGkife{NAne)}ei&;\
-QA9+oV3X*hap}YW`(-)%5c&WIb6-e+>D2i{WRIUt=+R<%RlpQPs!HI`aRJFH61tUXZx{ZlcanOye\
-n2KdMih|B;WgINo)TpFPNW8jhKocBRF9xX3-5)c5*4<ab#N?<2o+llp#ofV^<9`k1WOX{Ju;VC&=\
-dF6tC-QlAU<WCwZ4;Pl_4(x*{CUQOONIhS`!biLPjDs`SeD5ie@E%{n<)pxOKE;4?DP4!vn2J%Mo\
-bkEhtpT{8og<M}3wm+U`TBo<j`CybfgR*03pGk?||J8p_k9=P0eX^wQ_7+j6I$Pb&(*5KW`^jtfl\
-Q&APdPij|`PUZ1@3F}BcSbEEFW{K?hW=i)J5Ehnm-l3?wym<)^tj`ItcJwCxa1N|+sOFR9UBX!Jr\
-B_LF4W)qcCli7;}h?mtYv&}yk@*xGTnP68_9>gF4s-t&F|07m-ftfU8dLPRP%e>CMBlRq5oFm8}f\
-X7SDnhlIZh3E1G!88PD{^IQ{TDZ?E3DD-k#7OI%8Mp^>!Dh);q83-3;Zk=$|3ZMNH@T@mDv*r>D2\
-4=&jCJtv;Tnea5q_YdnpNC-8P>Y>#O?-*;atw31i6(;53L^}T}cB=&22XX)>ARQHj*OVxS&{Ey*x\
-zS|jV(wFg&V)JyKO)O*m_a7I%FXsYD`=;w;Ui9CE^egiC^Z(@Q-k0wneRN9N`_A$6AL_07pfmQ8-\
-e>=CO6t2O1DP^Dy*(qgcE--q>ouN|x{SwWO1ttd<6J)68N1fBj6L1gwqwX2{!?eH-PA|_*1a#9Nj\
-~S}&e(CO$CiN^-S2K}r!Dh7>5S>`F|<ueYKuE*yEyFN#Pd&#b8aO4vk>~c6_d{+|4?66LsOR39}>\
-%IHuY{eFc$kwua|R*dEK=q`pAIG*_P-7%KJa$qb>T-EQ?%kNBd<){*u1Gt{-RK-#(StC+9Mrx2P9\
-?Kh*8x_IW>4{CzXj*-4!(sr&8MlCFQLv%+G(nC(&L@%Pcl@bPyI{x&x4_om#8<5B9U?#X+}Yb<iV\
-M}IG9%=|7|=A&HtWsv*<@^tUP(wC`={CV;Z^mTjrSaTovebV+%z4Lmj+mUw#<5J}D?Ty??-Y@z6z\
-=`h#_UL+Nt%rI;4plF6pX93ZqX4<XA`g)dvKW8FB9CAHNxmrl{Ph@f-$^=GtfQXyQ0arGj7j^BvZ\
-?xSyi!N?j<Is`5V`7pUk&-<9r9kj@oC<Fum5K3p)uwC#uoA@x$1p&?c}5T#FXdk*;i@WapbCNibC\
-?S<jUti$z9~CchQw!rN8?yro3*fAzwhQdZ)?;a-T)sLcYQxZzsRsqW#&k*{74Mu3HPqgXF6BCQc>\
-axm~^f%E|w=UG5Ey-*@@ekXQ9de;yTo|I=(^{@zL5$8Acw|3jVQ4paA$DEU-!)&0~QI*<D>bsuq(\
-PdZG!jNLMPx_7|o&o)H#-zg>^tnZ)nZ%(H?+mLl|Vjoq{xTfZ++uEd0D>r>x^kJrwUresQchJ^UW\
-L{?Tlb(O!f?{K?dS94NzQ!UiA-^wIy$_l#dAfUo@z0}aXFYlReVX}2X`kU~U>xt~s@KbwIr_UG)y\
-Iup<e%rJ@7wX`zxCf$CT~pbTkDegKXrVEtIr3flFvU}z5ghe;Z@7AhTN;j^)?RBe-oNK{!TgV#I)\
-~}3sYzP;p%J5D0$Q2>f=dHnWnvFkvqvZlc)P0O}zh;2M<?Y1AEEWk*nT^<0t<Ux$1o;LGn(E_Jzq\
-i4p;ZZs6`&X{=L@7*X;Xw$bDVcDQg+Wq9bClsJ;!~c0%eobfoJ#WftR_kQYn)Zk71wKl*QQlYf=k\
-=l+y*{HKnqZ!GOQ7WB3_$xF#6>F4uDo?t%T8I!n1-F2<;d*G_R+jB14X@B*4Eg+xOU%lU(Og@KP^\
-?ma)^4t2W*K0NThW;_-yE7Ze8_8AgBilmWPCnC=pWA)TKa)IvKrHs8zU>_5G%xSpCH4R7Smp!LpT\
-or8e?Z<cAZGa-Q7Luy4p5)xRFD@8OuwIq-~S~aJ<xg@o2hf<K=rYD8+qkG_43+F9wb*icb-?y{&J\
-vtUp0pOeT#f1`D+8!+hL{Ts$)V=^5%iYwqv_vMA~-~HBl#XP%Q25Rq5l{P99|(Z=^2AVAAui>`Ye\
--Qg0Uy@~T1VeY#7APj^nIx4}a`yjAWiCf}Q!nDqN!)N!}UcT&3V=gdv~{@3;T`|Q+hY`$K<&#T@x\
-+sI4ERnOtr=5bC#u6pNVKKZD@>ht;%^2^B6y>l}D`7im;<W}!gtfo$tL)~8*Bv1D}k@)p5`QlHkm\
-vcLH)_#(HImbW$CHT=|9P#a+Is;f&LsIW+<R-oUggTjy^xIzi`#<Dk$yM*hh+l6}XD)TLl<8#dPC\
-Eai&ZMK%{bD=$81fENJAO>u|0B;Gl72rGzyC*GGQ_ywY|A>%+>WH{mJ+X~EghoX7tJQGBfrNqo#o\
-x_SVrD+XiWJXpta=v$W`B4YbJLNRiAUTkq;XhQ~s`<?M9Zv(3tWwh<x%s<aeg7ucYsCPNq)9(3tX\
-lGG*i|hpLxR^^N+w-eStn%^S$q4^^KxZ6W`3sJbugBLAaB-g7?t<DoI-J39)<gXC84(U?k|uc@Q_\
-{v-KkL)H7C8uD#J)%)5F<U1|qp+$yQe*c;Lee!hgHi}>W-lS=Nx9Eq3<i8A6AJ?anADgc}hbbo?m\
-2dI+5BbD=bsyM3J}qB;%x)pC%(s|-^11oy^NuPRUcdgf4IZBM_p<`jS(-2BzWSYnH0QqY{W0~X42\
-#8P>*M-0sb1zKiRb?+ICc(GFYkKt`eEw+)I{zdroNxDo%}wFyo3DyVKL>iQ3Gz)v^$5zET4^XQRk\
-y!>UHKJ|BJ;meB>YOXBum%bNF!ezN4A^*x~9nw2>DLSMNV<3s_gf)#vW{<W~((e{LOr{-6Aj;nw@\
-dvIYA4=G6PgYVyMh)brRtUQnQ($1UXRK2$&ZwTry=L-}pa@%vu)^<1cFyNAat-&a*go$DCKX47(b\
-A+i0FXKn3_`Azv<iTi)#ZNt^qt~KOe505F|r?-LpXN&dNLY~bsQoT>FeWCu&zL@fRH&x`5$m5?io\
-jug@eRmDiJ?)s7@xHs$hbrH9=c&}RHOH#w*+(8Af7sOKdlTP(CGU5fdY={|&ps}ud|zFJ{8;j@Qq\
-R}^lxU;v7LF^0G3EQ}^2rO2x48dB{z!|u@69G((UQLJ#m|4p?`%=`tF`0<KUDXtX7W`QeZP&o>O=\
-MPZHqK*A^8iY@vrONzVpd@Y_<MQ%H&1*JLA;*+A{Kfh3fraHF<WS`kFVsKVGE2cP<vYS#R_Aj-<A\
-hC+>eyXGNj<`GzR@dUC7px8*L@v~LPy%4gk*$aj-pY+7FDCC>jB8~sK3{1^Fz<73L-z^x^(JYK!8\
-Yb0NKy!yD=N?uE@`cB#&@-L59pJ(M(Y1;P|?JpwNMyQX=rQ~}Q?br7mZA`zDJpMkla|bKmr&iB+Y\
-DTE{9ZlpbM#PlQ9&IPzI3neq6Vtd&?$32p>F<Y2|9MFK`iFccdHk8emj@}IDQu+PeIt!NXM1E&+I\
-PK_-KuHNk5n(SYVs#Ws^_(VJTOxI+07R6btBc=-!Af}E%KgAn8rx;IxisqJ^6&>{FbEaAM&p(=C6\
-$W<B{t9cr|&m#q=A<|1wg2jkksTqmk-!>s{m#i{;z%Hci_xQoYR;knb9)-sUEg|6-Ask!L&A_fV?\
-I$2is7Yy<i2PW3jsh5R0;dim`lU+Yw_pPoKVyLC%v><rVr5m(~*H}W;)pQPR!c`xbuk2<AHL-lTz\
-a`F@2>x_*_Jr*CEI2QZ$pTBxvzSGj(jvEs9|H(a0bw3J|Pj{-<bClfej49vAlykeLdC67pWO9-ZJ\
-3-w~+~m#^)W<n5`4Do|JCowS|4E&BCm82MwsZR_--*;jy~qjbdEHLF!=kMn<h#gK??f7~RDWk+O!\
--bEy^f1IO`~G5D^u5LY2rOKv#ImTi7CfReO{98FH}><SroH;r|$;pbQGztAzH`}J1M4oXKy?Cr51\
-fW`wot)7JWQ^|L+c?4_}x%zh@=g|D(=qMIVme|08cMvcBf4qfT$;MfKgT&E!{}q+a*i$UPSMUh>O\
-MQtvPGmTB4zC#Bz?#Lxd3ei`{h{rvy!BhAa=q@?qI#uFH=-tYLx?;maP{0sSgqt(aw5c#X4)$<V{\
-e}8mL{r(>=TDOk2xc^TcB3C^(?7CBb7oEEO9`aW#avyo4#q<N@>n!rno%*}-V#;@NMaZ|0R$tp_%\
-h?~DtX@A3@*_@GpLe*H>+i`^-_!Gu4?5Xm{$+U8J?I?rspPN5KL<M8yl;3m>G(&z*?%<N(VH00hQ\
-#Ne<p24j`W*-QPXIs0bX4y+C?L<<lJePrvCWR}+GeLxXFPQZOrN6+?*1I5oct{I9ZjZbyp(wUiM-\
-}y^|LD*$Tys<ejcQSJb1GD843L-qMtfheQe6E*0cvtw*K7FNu6fuoMoDa#6Hwbe$;y@?@-Xkku;q\
-O>bR-%bLw<<C4K*+THV(8{*S!QqF-$zf8b>Gy^b>S0D1f!BWE6F`HqqNyXog+V#;@jl#o9(R^8Uw\
-<SWOj+q#T=1-a^b9BavQ#;Lc#X7VG(sm~4D$n(cp-2Yp_K5C14+sP+C`#tqLD@w>$ytkkCe^BSm_\
-te`)HTiq*r{6Z>-~S}P`UC5J)k2+G>I_ajHXoWe9!04$ZLIn{IcFv7YpnX(-${PsSoJpKCckQ|^)\
-^&NoqNWruVre<?;NZCysDA>Ch~sCdD8uhR`Pjc(;u_q&s&kt*-snuYB=s%^yx9=%f_mYi!;fqEQY\
-VFG1{oQ9<3w4VXX1IX>uDE$-Zzi`5);onaS%q^FQ6|c^mn{u`%U$ulJJQO<&oT+Ml*2egAtE>uRi\
-ee_KpmNv`_t^(^v7Ec!|n`Kqzj=Yaw0{MlkThR7fKKz;8oLSFrWynk_gn)9F4Mt)k#a;T7baFEX(\
-t3D>VRvY^+)xO6=UT4vMpA4_M?hTN)TFpQCyJORzKg93<lK)I@_5LK=J(~6weW|Z$-;~q+eUg0g*\
-FTVV!zTBYZ<DV7?=kN2s@6jpd1Xub^$@@Qk=*J#Y#XR^FY~g@G_Q*j?>{B~X+QlbN}bcksrzJ(pX\
--}(*5fFmP8D@VCfAvh7)L4jzgb=<r+$C+n8fpFmDIUroch|dj{L@P>ixrJ^7-Q|o_`|0Yn=L7?7i\
-f#jZ+_!^X_FD<1F@n<m<`PeLp<D|0CaOG5*SX_4n1P_n&p-%@)(&O#TXawQ2rt>+TEN^!Cx8&P-h\
-gV-xG3gF3%hOk==(n)duwb)PLJe~!E|^>{ls>H3d44NT*V<Y^@R28)mU!*Rwv{dD*91LQ+aQJ>R>\
-$d5cly__TDOFvT2gLc2B-TsmFcVP3W^L04ocVwuuQ1*c(<S$w*$JyjhlHX#QM{nZ!7xE5^;n$M?K\
-z@^H_{8&J&E(@xQ9r-ZMm{@iy>IDR%Q<RT{X2pM<eS6l@4v=k8HZeCk7j5$+rP-r?#{Hwiw@R*I(\
-q6c3pIa+Uhv4#8T~HeO7-mw`yH7X?Rwb*nY{v;+D5&8hL#xDL7Ot{&-c()9$<_||F2;DUDWtA!~V\
-EkdoXi3e_x+vf5Wb|XD#LLzuN3y+O=2h6XW%VUSN+Mpv|>^cz||$#;Pp-{)o-K^8oEP+Y_1mqpqh\
-h+MG-A*Nl&|b{wGnTP8JdK_y3n%y%<CK3Ln^<DVJt9jtwIkez>gf3Q*EgmZ9~z1_yB`P-8jqd&E4\
-yEE*+w`;LX`%`wUF00=vyXLd$f3LRBGX|PM)fx8hZCWLNc{pSAZoBsH4Ex=7&7Woez^>2AD|RiEW\
-q-o1EwkT~5g#aTB6ZKT|B|KM$Y1WyxS-Ca-ESNAKg~KbB(v9Nvc&eE{crwDS+i*>>Fax7#^EOuhc\
-fIRWMur5(Tn1H6RSF&U#EA1jPdVeW_*>|>)TB2*OdJK)5HId`+Ki4`^pS$tt`v``M=EnJ#u(P_Gt\
-U58CTiMv_*+2{2wc4yR6R8d*{<K`Tx~Fd%5lFGxTNgzx-ExgQll$&C*zeJF~RkXWD<w(pG2L{Wh&\
-R%l?#2d%$i~&A&Ip{&$=9U4}ho(_YWC*V?t3Ec-Kd?Zd3!Ww5V!p@&g#+$nfphJ7VThW+Ut+E<zO\
-$9iZ#XWEzd&{k#He~539pV_rHv+Qr$wJ);l8|>QC_9u+(viER?9&f)tQ~PVic}B@7N=odFncC%hG\
-LlRFPRY}m@sdN^Go9b|(Eeqgxx0t9TJ|=%WAHNjPx?|iu{}duEj!M>$KwS1CpPUG{_;@9?OD5R+C\
-OY3#lwF3^o#9FZQ9ovEGO-Cb{jVB&snqM=`poEe(k}2sgM26zS@h2*`MsI?LN%@O<!$ouKmNl+TV\
-^Gxw)_QSl@+4qbAt@m8m_J@qWfVS=x%Mp~h};TV|G~t;w>#pQY{0G8%N?P4-3l?m{zd-$!TkKYJ~\
-IeKXU(GArZrOpX*!X4xCEwAZqdIykj^PP1R2&D*!n=AJ>>9Q!93T4RR&Um2|6p<3GAOLhSTrS?m-\
-3R4qk!%-PWjHhf_#_Ej6vohYv>h)2U_SY=a_NCWZp^qq>IkYY-t2yiPCvDoxHlxn1-P>}X<0zSKz\
-cgcUuRAle2QyN((fE9fvyay<?rOsSWZLn1rv1n-^v?g?ek4AQ|GWE=lx<15&HoR_|43i`K)*2Kfe\
-ia28QOCh=JlMs$^ZAyfB*dV&wu~?_s@U-{P)j)|NQsQ|BL@b@5+i>6fvCLVv8G;@~(5d2fxWM{d-\
--?zZ>P>+1+C{hCf*T)iByPGwdt>t{&JUZh!fAp4d+eNIpRR-F3g|C;1v*G}HKZ*ZHP@tzi%O_n2c\
-1d&$4Y?KIkVP|EbOx|-`ShLq82uB#1m<=+R0M~Yh>%rupUf0t=$=U!Pb2c}G~Qy!Dkq<&2P-PMk$\
-{QLbCM*bi9_y6C{s~ZOPNL%idCE*g?qDS<KKG81*#Gn`w!(v2?b}i`)!yM5eIz^Z07CoX@^of2kA\
-O^*d7#1U9RMawM`l3U0iZ0PDdPJ}26a8X942mH!EJnnrsAb9YMTh7VU7}m`h+fer`o(}46hmTIjE\
-GTDv&r;Dhv*btqFeNcUePD|#ef(TLt<Erh*43q%k)Ku=oDR|Tl9!t(I@)FfEW}*VpxobQBmt5(-$\
-40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MeP8YzUUC0qDyp(9?>iMM86migJMVwixDv@YCUE8qC<3wF3~M\
-|M6c)*{bE22iXky9M#QM79VpWm9imfoiEhy&dPSe;7XxBY42fYeB1T26mrP%Dh)&TZx<!xZ6@8*#\
-42VH7B!<O^7!|dHWcs2*bc!y~EqX++=o9^7Kn#i@F)T*JsHkPj^hJm06kVcQ^oU;3C;G*J7!*TdS\
-d55KQ9D?sFFHi0=n~zcNA!w5(JuzXpcoRvVnmFJT5p-Y=n$QvOLU7K(JT5yzZejMVn_^&5iu%ihs\
-g9rhv*btqFeNcUePD|#ef(TLt<Erh*6OPkAdhAouW&0iyqM{`b57N5QAb!42uylDr$$y^hJm06kV\
-cQ^oU;3C;G*J7!*TdSd55KQR^eq7agKgbct@!BYH)j=obTGPz;G-F(O7q?J$|X=n$QvOLU7K(JT5\
-yzZejMVn_^&5iu%ixiWpxAv#5u=oUSqSM-T~F(3xTkQf#tVpP-)m+6ZR(J8t_x9AbQqEGaT0Wm0s\
-#IP6<qoQ_%OkZ?}PSGX0MUUteeWG6sh(R$VhQ){&6}2N}`l3U0iZ0PDdPJ}26a8X942mH!EJnnrs\
-O8D@MTh7VU7}m`h+fer`o(}46hmTIjEGTD>nqb29imfoiEhy&dPSe;7XxBY42fYeB1T26pG;qLh)\
-&TZx<!xZ6@8*#42VH7B!<O^7!|etGJVk@Iz^Z07CoX@^of2kAO^*d7#1U9RMZB@^hJm06kVcQ^oU\
-;3C;G*J7!*TdSd55KQ5z`J7agKgbct@!BYH)j=obTGPz;G-F(O7qZIDb~bcjyTCAvkA=oNjUUkr#\
-rF(ih?h!_>M!7_c(Av#5u=oUSqSM-T~F(3xTkQf#tVpQaU)0n>K5S^k+bc-I*EBZvg7!ZSENDPY+\
-F)C_D$@E2s=oDR|Tl9!t(I@)FfEW}*VpxobQBfNr(-$40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MQx}|U\
-v!90(IvV?kLVSBqF)S%K`|tT#fTUcwS1Yr=n$QvOLU7K(JT5yzZejMVn_^&5iu%iN6Yj@hv*btqF\
-eNcUePD|#ef(TLt<Erh*41+Ces%kqEmE<ZqXxpMW5&w17c7NiD5A!Mn!G7OkZ?}PSGX0MUUteeWG\
-6sh(R$VhQ){&6}1AHzUUC0qDyp(9?>iMM86migJMVwixDv@YRAa*MTh7VU7}m`h+fer`o(}46hmT\
-IjEGTDJ65JIIz*@F65XOl^ol;wF9yV*7!t!`M2w2saWZ|;Av#5u=oUSqSM-T~F(3xTkQf#tVpP-$\
-W%{B+bc!y~EqX++=o9^7Kn#i@F)T*JsHhz;(-$40Q*?=L(Ia|ApXe6@Vo(f;VKE{`MQwykUv!90(\
-IvV?kLVSBqF)S%K`|tT#fTUcwUIJ?(IGlTm*^HfqF3~ZelZ{h#gG^lBVtt4oHBjUAv#5u=oUSqSM\
--T~F(3xTkQf#tVpP;lkm-vK(J8t_x9AbQqEGaT0Wm0s#IP6<qoOuSrY|}~r|1&hqDS<KKG81*#Gn\
-`w!(v2?irR@XebFI0MVIInJ)&3iiGDF42E~vV79(O*)QV*KqC<3wF3~M|M6c)*{bE22iXky9M#QM\
-7og~v29imfoiEhy&dPSe;7XxBY42fYeB1T1Rv`k-gh)&TZx<!xZ6@8*#42VH7B!<O^7!|dXW%{B+\
-bc!y~EqX++=o9^7Kn#i@F)T*JsHlyR>5C50DY`_r=n=i5PxOlcF(`(_uow}eqBd5hFFHi0=n~zcN\
-A!w5(JuzXpcoRvVnmFJ+BliM=n$QvOLU7K(JT5yzZejMVn_^&5iu%ir^xh0hv*btqFeNcUePD|#e\
-f(TLt<Erh*421mg$QQ(J8t_x9AbQqEGaT0Wm0s#IP6<qoQ`IOkZ?}PSGX0MUUteeWG6sh(R$VhQ)\
-{&6}8i3`l3U0iZ0PDdPJ}26a8X942mH!EJnnrsGTm;7agKgbct@!BYH)j=obTGPz;G-F(O7q%_Y+\
-p9imfoiEhy&dPSe;7XxBY42fYeB1T1Ryi8woh)&TZx<!xZ6@8*#42VH7B!<O^7!|b%GJVk@Iz^Z0\
-7CoX@^of2kAO^*d7#1U9RMaNQ^hJm06kVcQ^oU;3C;G*}#4OWu9Fg%oET8{~$)Ajrzjyt&zx>RJ6\
-UR9UF1YgMc@;N1#*Qc&;XM9?o8$jFVaX`x2xrlV6OJ*;_x~(P7GrG4Ojn+%ZAn|6)&2aDx!l(M+>\
-yE5-u--%xx7dBb3W$s1G=9NGMD%4e$L2Teqi_WNapfh$xk>Xl^>)z(w1jy!HMb057t6y%X@3CyV8\
-{((*3-bxjaXIup&+Qp<2Vlbme_C-!<vV57V~%nyx&z`?)f6`QhEqlbOqpNc$X8mUg68Jvd!?UiWi\
-i=JLL2`+JtwkL@^JdH;RN^geCV{uN6t*Po}$OtYMOOSw0t{3t08rj(x?pGKlRUC-@JivNAz<#WA^\
-Cz>*zTjKTiUCwoi_J27nefb7y&-j$~ydM914#xqzsr)ZeenLw5zomRsN_qbbqx{5_@>4R5`6^js%\
-vY(DFP8GBUpLCfN_mHruU%)9KP%;DWE$lWseiGQe<bDSK5dj|9*}t4NG~7PWR#yT^>3B(RZ_l0$_\
-Lqu@`HYFl;0%fk4yOyDZg9F&$1ik2fUHh-9O^XS;~))@?)g@pdLo~=~Dhq*YcNg+aJ1~tCRk4fGm\
-eUn8*JYDc>mN<E4CjPow-tDgRQ+f06QV$S8kC%3nS(eLHh|8RfUUX_QZq@;9aYZ7Kgs$`>7El&^W\
-qC@+&0KP=lQ@6~LS-zoLCXQyv}$-zeXJyL&GSNo;>dnw-|<xRbf@~_^J^(fQ5@erf@(mxvIPe^@d\
-j#1tz<*#<NN6I&CG0HEO@@0n_<u|@(lo!hQi~AVmkG|ja+@tYlx0D|t^)Hd~m4``tJ}~#gzPYmBk\
-n*82{`aN)lNNJ7x$SVHyzWDDJDo=u<>zme?MTM+FDbA2$S7}-`oSZO^1UCL+c`bYD4!WN%5RkNZ>\
-9V_DL+xh|72gIyyH(s`9LW@yPr|s_Y<T1HyO`QQhr3Mxj*09-zd*-HTT0kQa(+}&zAC41B~*ATDz\
-VjmDBryM)|9s8s+w`<sjv6d}f~R(m_Ufi<F-r<(Y$}pL}MX?pi57>(5dyhyM#5>D#|m%4`2(lwT<\
-IR~(goy1j-N<?UaX$8)=sAHLlvUncW4YN%2E@R#QCY?Sg3zBJb_&rd)8ze&0KEA#wT9i4vs9a3JO\
-Qvb1GM)}{R{G6`kAmv@pyLUa0e$~0w$EgX5<J2dL<5a8SIQ6OGIQ3ad`M1N2a?b>#yz4piAEn%vQ\
-vREi2U5xp7;cn@QpyjN@<>Yg04didn#+evxg(`~l$5(t%1<3`Ea%IX7~dywcbz{-`N{^P{5UE9S;\
-|}PHp)Mf1#wn^jOQMs{3NMgE#<W-<y)lum6Y*MKE^2jtCV-0rhh2q2R&mm^^@_(%Kk^nZ;<jGQvS\
-!3`WGB$l;^HD*Z)b%?^tiHe|@1G2c>+7%x|CLjq=^k+D!Y08>L*^V3c>ALAFSFe<|NA<&`63zb)l\
-{DIYe{D8K4C^Z2W!eExIh@$Z!KRnM8n|2wBqe#Z0W@lQIzDF5_%^Z1{U^0w#A<L^1jD33|`3ti^}\
-QvUo4Hq&uo+KK6x!!uHTV9+Q(qw6?QB>QbC|D<cXILRnK>P4e`j4b~br2L|dMtOzQzhZRy<?{zA|\
-8S#uy4Rg-l=pebJl&yVjPh@!{6d-TRw*xj**x7l#-?9xUrTvV>c1@IE5;e+SHEI29hXO(Vw4}c$t\
-W+7>3%KcV>cV+O;W$M*eGv)#oTX?In^ltN$Pi<KfEO6lV3H;f0lC3X-4^JubJC<(CKo1_?o$$8>R\
-fY*Ujy`)+PO_$=uFC<Bjs^ubcbHD^h;%@6GL;I6;=Dln<8i|0v~Ie=y23rToE(M!7v?lyB?Wzm*u\
-}Uxv*6{7orum-4|<UUY_0p8cj#ewviOC*@P5ysu2xJ4v?Fw~X>1yUx?jG|FeZZJusG%4ffAp6(Ho\
-jq+tu-gSI@Udlg`@{{F!;L@|ww?8c9J>E6S&y@O0r=*|mUMZip#aw>f*+%*GQeG+Zn>W=c-}#=o{\
-%R?=zi%_0Kb&?>`tiRg<tsk0na<}YO-n!iCMj?Ez?Sy>;m8(q|1UjP=2y!5?&tdb`g8THkJg;#en\
-q<ai{n4yvhV$n)$#G{d!OMEDc>dKUEe?36mRFg_hEh?FW>jR(A)9x?0Y|?MaG|cA7fj*eBb*aKTt\
-k|<@0%4mT5Vk=r+oK{*!t6yQIAJV56OfbS*c^`=q&7_XnxpJk}V`ASv&2o>4w+kh%OEDL?*Zqr7X\
-J_e=S_znj~6z;vU$<sVty_f7Oa|B><|Cd%<z$}c_NC=Y&T)IYpy|0(639p>|p52f6_)4UuGE;Y($\
-4>guU*Y^dlD^0%~0#bj}x5jjj?>cY4K(F6h3oSIp|AuU*eJ?QTubF0)50&~iNV)3<qr61QzmW1PK\
-R37Y7b!pDV{`cdGo<|~%h}ac-fmu=eJ(W0`}8sDkC5`yr2NrByJ`QnO3KUn+fD5+nQ4?y`B3&tUE\
-7P4zd77)YR?WS|6#Xzz5h$fUD9tCb!`_H8Rg%}{7&w=PM7lDKN|JV>)NI-Hp-X8Y^M7a^QFA}Z|3\
-Wl-%0roe>YF}u1k#aE6R=W%#-q8rF_nOqkMVSb=fSV{LqWc%l}O&pLCMl)IWcca$8@c{L`-O_flD\
-&U)xOEW1q{6@_w!6^?sg|dylr8?qhr^<u%g(yZUGO<wkjrh34(_c_}YxH?Nm(q`WM{JYT)8NWUFT\
-=_=nX{a?yIzass1v`6aCJ;H9fE;#Z^qkL9>^Y|xA`NQX!+kdZ=uRp|Yx*zzKl=taxzV7&1%D=2J=\
-C|v6&y%i_{o9r1`Mq7r+pjRnhjkslq&#P?&9vVroSlAtpPFsdpU`IB?%tL1V|Sac$4|W4D8Fj3F<\
-%#T?Kh-6ueaTFefPeU5BuD_e2$uvzCDxX$o6ug&D1~FNcqgujq*`l$JuL)^4C(1FO#JF;b@j=x~r\
-tT_pe#q_qF5K`(;M?^J9$hySlb7DK9?H-2S_-HOlL=&C6}0ln>gQW!gV{CgtxAH}{{T=F0KqO!NA\
-^LCPl`X*2B~uDi}Cuae_JS9@YoUOm)2{?c-p?r-Mf)T2_qXqb7vI;4D-)Sn^cbFMeaeOt}rfBpLO\
->+x5qzr4ge{@^^>uWmQWukIS)25HX}bAKKq<)2+?zHjj84f<ITXIpX}lGAnFC-w7P=IM_18s$wR&\
-Hbv{YaAaZFO~H!=aY{}{a<f3*WV`PjvvkI{oosAzx0dwzSAXA-s>2nevOR(w)w_%=RIVU7s`tfYU\
-dmEPnvIT{|8dOtH4<Ax5#)}Z!*e@{$cL_BP)#Z$brUqHg(;%x!EWmH_qJOu9tG(Kh4Ye9V!1|h*5\
-s7lz*~7&g)|4<uG}nQNBa^v$yMhl$7Vm^6xtCJ1dRyYY#W(YeLukZ7E-oX*X@}o1}dDspjqU+*{K\
-3!<DzldDmffQ@{GBl=nzEpP97CDF5O}yXijCi&B1UnR&h3x7a9OdA!}Uy?-R-L+6{9^YAL8eB<Hf\
-@!TopQ%*8p7w6q-lz%<Yd>rvec_3wbd|AqeU1MG^2P`rA+aa$S{bZ{2pD9a>`ltPtWjelZl=A0)H\
-J59*rC-kH-zNR-Z{~jZ+->RG6O(e=X!H5l2|lCzw;^`Ze(z?V(f%0^8slm2I&YWyb$gBSj;`yb+h\
-xD8%X~ik_U-B0f7DVrzdF|3o@=Fi`U&Rab=e(8dFA!y_1hrj^E%ASt=}@)?_FoqzedXaQoi|WbAN\
-tW%9p0}&(>w>&mZ<kd0oo!`m#HvzeUXF6-%XjYs&S`w^F_#Wq&emxl!Iz-aOK^JpEGs%BAM>?aaI\
-6ymW}UpPzb{u^yK!lKWk9**Q(>4>`;zKSJskRLgnbndb5QPRdJnn~(3EQodle`FMBw-9~w#Y<HJ-\
-eNKIM`t!Q?q<mqA`F?W73Zr~ozOft*>-rp7%6}bU?mr8q{M|zHb=;Fu9+K;|uJyQ8$_wTEs%t-KT\
-PerKZ_L*PpGo<+bIsRr?i$(eU2DF7xLeBS%Kqx8uKQ7|q+iK?vg`iF(^CH0Uybqj{;&4F1Te0u>c\
-2@_K-L1K6p&JO*}}Y8vVdaSWD4oD>6oN|xI8A4nPli}otdO9DB=enR75~z6A)1WD<Zf6A|f9yAOZ\
->k0zzd60Ran0W#@mF^X9#C-+k-MByIBNlP}?yx88T}xo7#Eb2Rx0_?MoUimuagHrNH~G_+53p96a\
-4dmL}o)+ykhi(q}`9>8aTe9+?EL+8SJS%Tm9H-Mikth+<MDYs`Y1^f<WI<lw!2>2gnPe<!<`FY@%\
-*dIUV#eknb3-41;0)AZ(?<4zui{qd8B!3>Qe$f4ZC#O$G@#r1T=lHoZusyOj;6ni{2f6@%V>5nyS\
-c{_po)`9g<pNkQARn}K*9G{(53v4o8sO`e;PrAn;74qQ=l?5!mk-3_)_x(!S4Z&iCBT=0o}k$mKL\
--4z&to~T<3)0L-f@w9-hNfXJFy)x?P4yMZo8V}e};LxC*W6{kK@JBi}`gPU55SDbG{9B8SMKHY4Z\
-f|oA<)=f9)mw`j=e9uYZ{4Z@GjY-zVq~yI;!j`**^A$mM_^_dJ%{Hv`@>iofG}z~?@Vzx$q-aeT@\
-S_`WLO_Y3;riGbfF$lG57e%yU{o^1OakOOaEfAxickA9s$PbZB3hu@(bi5XK46yl+?FXzYK{W^Z%\
-1mH7=@biEBa{2!CZ@}m6IUU{i=<mX~?T!6QHvoQ|U=ObUu6!PDdxd;|4*@=!#D0|#z@J!;_wnBVe\
-lOUSi#31974rLrzX$t{AeT-8{0!KSwC{c;;KvL4<YwQ8?_0#{@j}2q`~sFgw*o#O%%9DF!13L4c-\
--<o;PZbjtS@c;yadO8{;jE++R2~yN{-)`#MfC4_$v={TuW<T1Ni?I@$)=?rF=iy`6}3F@56qo{8j\
-up7r=9VQS&Rp@m*jqWHi4A;FVtdod3Q`e@Ej#TV2hsf8EJgFPd|;{QG9FhW&1H>{p!kL-1D!`phc\
-8-)zPE=JSBxG6T<(*=u1uoB8p_!@6ku5zJ?ppPD^&D&Vu0W53glfM2v1mjBNJ{^Omn9@TXX$A7pS\
-ua`>!-|*2?^c^q!G3--^^W!f8ymBqrBd>FOK$EwCe|R{ax9?vok2@Uj6IgfK<NdewI`9Jv`rC1UA\
-NLF%|22T0{yJXow*lTF=;4Q6&++!pVSmW=*URU_f8qF|;QtK#l;h{Y{(BYR3x3A&{|NiV89$R>|5\
-`Y{RGEhKy)AzZa^p?x?>Y$ZPn>|i<L3dNw>2Jz(*Zwl5Byyo1^ndg@q2Cm3y!Y^Jwcm4p9cIESl5\
-~!l?VJg|DB5Tfz57!>%7D9eY7|c;L3mbb(U%SsdoHIJkOhNl*d7~1N_5xv0nNGz^`3^-}gMgKk-G\
-5-=nRIo8;f+vp4bMe+PDu7FRk4@b}aBIiCmoMOa_j`yTvDj=uo@NsaIKG~j22rz1W?^UYx2!G6>Z\
-_<?|56T<5~0r-Wl<MH{y&GPs93mm^|H<q8Pf5q_!K7-}?n}GLxfc?5J-2!^fdhCDr<gdYR_5z;&x\
-BOaeXPtE`e3uXLeg6jd*242degpo8&8MUBd=&7zLf9VM<~Hy%?2Yx|p4;T(GjJQ<FJ@iApYt!89|\
-^8==GORmZU=nb46LW^`hOrFz@MhYeWu?|{j27GcDWtqRRH^kPXhd>k7NDt8o+<P9e$pzehc$|b1Y\
-XwfIq*1zt@GD-w*H$mf`D6{T;}S{rGiCn%^7n`<t<y`>o&cal7(De*L$!I5HgHybJJ5G<)#(Am>A\
-Pov!}__#Zxt_5U~T0J~3+=f~X%dfi*o5YPGBcgppv1O5npMX--nYw_Yg%JuwR@8bArJ7V6#E`I{Q\
-#1d@pWd9_eS2x4)UGHLf_&(rMpTPT3{BHSmzH>MDlV8Hmc?aMZ?~47&Ke`9(@t3hbXYsw7-j4N<*\
-q_1w+=lm;J^upoLGXus6Yyu@`dMwCy$|N+2Y4U38t^YH#ov98`(YmkKZ$1FodNj5XR*KNZon^p8~\
-Y(&1N=F`jyV6X;MaW}>;GFkAm3*X06Z%AG0p(|{19HJ+dRnUznG8E{vhZZN8|N-F5sV<hW!}72K>\
-M$@cX_DcwC61-SiOX!#iOA-noC1uhaYfCZAWkJPi60$R8~)V;SJ9=Hv04{s{P~;Je(Q`Kuq{<M8m\
-8Ievz=Pr>mI9)kTpzkNjhJdeWhX9@n&10IEaXAsY;?>-84#Kph^f%$w7;BQ0x_cGA`pN8w)Iv4M!\
-C;c7v@m&S}D&YBpIDQLUKlB**8wLOTHy)Go2X=fM{5iW}`CI_}vHwg%cIeUTK+l<h{j1jl-aH$B7\
-v&!?KWF3pZUx}C3UU9n|B(AR_j&^Ky&N8gBLIKy9ge59I4|Ifr%gk0;2FUChw%LW<C7qNzJQ<qh^\
-IJyln@X458#(?kL`{<o`&b#hU1^o;tPP^KaBO0C!d!4|33u$!(sfK+dM1x=T`u~I)(SmYXN^_CSG\
-?R0)7|Rm0QF7`Rj9_kG13LEO}n8f1V2XBcI2|{}b^2zJT$=U*Pj!<a?j`0>rh2IPCR+w|C;}H2)L\
-y%meXvIR@~%!&n|Z2zc}Uct3jNMfrMfc?rJbbUZ#yFT;Em^vM$7XYPRa<-Y;ma}?f}d;TTA?`8i2\
-`L;8jS0k?g&*6D|{iguGd_9)WvtI@O_I7x^9Qvx9Cw9cE^5+?b>)baL?>pxM{@5;9Zrl#nf8_#x{\
-frjBhT|W8A3y)oufaY7{$y>v9Q<#N-|zy~&p)vq`~xen-=-Jvi;8$YoV{NDUe~Xe^9h?@2S31m*k\
-8288ys&1yYCm8eF6Bnz^l>hk-2YzofXC7e<9!}e2u@?zM6jk@LurSoTKS){{cPW<Cs@ae2e41It%\
--CF9H086YzTZ*IV*&Xx;$#eHzc_AmA$&<9S=$Am{Zh_%9p}*EtmMV*x*E7wpHr9q@C3SEl*H|ME8\
-Y1GmTiht1!CeL>KN``?it|BZL}Jp9}(I1c_e9DlmtkKO%UIUjGk_rTwh!t>-#z%Pb*qQzfUzR&Sr\
-k6=0f`}gI3p?3g3<tXge+VBDBGyCKDv)6}mf6fr#Z#;$d&vOBP0PGiyuekL`9Dn;zyf4Q9za9L;+\
-Bh6ErAa!UzX$l57xD9K(Zune%*6Uk3h+HP!+PeEfQxb4_GXSh1#wu-o?Q+2>D%D%{#(F*DA<opQ#\
-l^q3E%f%z;9ZN^LHwMpScsZ6F)zV<97>o_xXT}yssw#ze|XZOr74u=I8n6@^RDJ6I7=2<5ztKkMo\
-}Z|Ndk6yM#95*I9Ea#}hEmkJ}8!?QlGA{|WdlXHG@yx@~igpLHajw?EpvNh&wU2j=|4+1Rf;AMjC\
-Op05P_#}JRu_z8~zF8Xh`{TRph%X5687KZ}-=~g`c>j0lIir+V~CC5+uH_lfLZ^iK^UcuKH2E4f!\
-<39!b)(<d`_m^99eBHzNeb)ni_YTt$Un0H@$7c$5#E$_#a97NmI$~RnU%BOUBp<rA<M<u-;(65rx\
-N;EIKQ9D4`#g?E{~hqJwc>TU_Y95?#IPS=G2pMYV?R>c_8gz~8s66~0(`-7cs~CQ@b!n{@0Hqt<A\
-aZ5yW>K@@7e{=lXG_D_>HjdjB4{7@b5f>{juB4<oM0gFkkMUfG-38zc&AO+DShD(>uZV94YMYfd5\
-&T503*Le30XJX*{u6eEnVwbqPSMOzEBl^FNLC|CXI$eWmgIOzq6CbIH}%Zdwh;zbo)&9|Zi33?Bc\
-l%;tFCNBF&70Q`PIer~@DeE0w0cx5Z#?+@bZe`y!_c-{@ii+tMG0N+>8Kabv(<0sF=eunsNO;Wzx\
-Re*1J2HO{Z0{l!NUfJ|<O^#vzOgG?Xej4xB`|r;22ZZ^&3h)guuQa~jJAlufEyVZdaQt||pZ2{u@\
-^Sk$96xPWypK=cqe;pKJ75p_b-n|~Z?&heF9V(iKeooJ>6_amjU(R(_&%^NX#44Advg3aK@PtM_$\
-4#(KBDdg@&VSb7MEECc>Hx7m;3|ZrD@n6nX@<SYfoXhbO7MLQ1G}d1pLFV;qgBk@D&f?b-npMO;S\
-5+4&aZ?66QbPB5&|Dz;{hyyS210$3Ol!&O`Yw;3waU=l{<Ee`y_-+nepj@v{ZL!HIxBvn953bNh3\
-A(Yx5Ld<5`UKfr$b&wYa96~QjP7w~~@ESD}gfaCo_zSTDm<oJDAJZ=vGzF!ji*#ZY~{08u2@2~j@\
-0pBu!^AyfHNIw6sI7qH<Y<)0XU+~}Fda!(51P*DE#`{u$zYRPMO-{Z8_-T9L`M+li$1fNBfiJYkp\
-FemgKmId=cwblpcq{CWS|0JufQ$UDX92%3iRVu!0QwBfe=QC;tZ;m<k8u7%DG2(;Jgjf*9s)gi1D\
-+>q06*<{JfDkUST75)zHw5dN$RhA1MtV+#r%O|T0xIG4D;3B0Q`S|=da26!`eWOt;BrS(*YNG7q<\
-Z(1|Fbh|Goxzd;_k#GQS<>|7KWTEeHH-LY~yG0KZb;JFN#iKO2w#ti!-Q>c)A*9fvnb?cb9Ce|L-\
-N$j|VNPjdV=fgk=j;I}`C<IC-z;`o<#!|~+@KP8{HvyT8h1lG|SO%4Dq`q`R4&GCo8-*t?(E&$*5\
-Q0&j&ai09X`^^LW|6nX1762~#w=V^J--Gdf@o&IydL6I#{pW+e8pJ&RE9T4B`(1!PC-BT?E`aqb#\
-MzGo{Fx4X-{pY63-N1B9`4)8@oxq&&*2=v4;A=A?{~__ZHF#?e22ix8UlQs;1}wM!ag_$`(1Zm2;\
-)$|{K+o^J`e1D&7XfW;9{KdDZo$P728Mm90~fHke52`D2~s5XDa&c2Lk@ZgRuUe0Q@gP9$8yA$cN\
-*EJQ2Wu*@nk+??qfcKl*2&PlCOF@*?=|Ph!1v9pL>TJl}SW@#{PXd;k^J*O4*UU$(*Vpz8sjGYiX\
-yA1~&3@l8BF9|3;h3E1wK*2D4RX5#gATaSF6tm~2M8}X&`<F8u^`^Zb!zPlg}@0G%SiGRlB{*z-r\
-(<J2=T?6?3`{VUKyO-nb-T3&^0T=mQHvs;SU^jieuSuHka9N*RpL`DR8xF*Bc-wxC4-5HyCjkD25\
-I<cD_}UHFPx}JkO@jTUE`#;BGxlq(I2z<t1=r1Z0Pu6ahUfo#fG<7_^GpsuM*e-59Rt^S8t=0|0s\
-O54@%Y~Z`1|i;f6KaK!A^<u<4@4^*w1qOaKVmy1n}3k!sGe!XZiPf^bC&w2iD8>$H||6;5b;1d*J\
-I_a-95oZ2){=R~$!J_c_p8Ud7|^4&bkJV!Lw67eLP+#_RO+fDa3P*WUwv%RV>{Zu2iTN#nu^z=z+\
-Niq`ebfWId2*)~(<<1?r>NqKtb0sh!O@caG?@CW{k^W3*Q9`>&X@pyJ0FP8(C0)9vjo<Hv%FMrNi\
-3DDn!dG!I{+XnD`cN_q_@(pZnt_FM`A%6W+z}Ierzt`J<AF(%n&I6LLj-JAGX%+%L635rM8t`j(5\
-bOfL=L>ZJK0PRx8(#+eBq5LKX~4su!s{rL;`n9nVf@d4i#(i9rNQ47#QWL^;OF0q_oMRw7vm14A^\
-7eGVLt!GfFJe{_Lr_2hJELKEU#8&z_0!uwl6LP{A$5(|0>`w3HrnSCvdz+*w-!w{M^_0@jn3kEx-\
-fM;p=>2IgHP%nBQ^?;CCK@<?2O%cMAUPe*vBp?7ogH=u02x<2C^Esy7GwzL0nD9l#G0>OcGz@O8j\
-fOai`hp5reIc^St8{?KN4etsA5mgPd73cy8v%Z>%P-!cdITHr@%eu-}beryrPh3_iJ{q1`fIet|e\
-ex4rzerq$<&tC)lxkLEz>ovZ|3XcC3c(Wtg_X7OtIR0Mymf*X;j`?p{!2j_kmNO3ko}Gi|d8!P4C\
-*k_v1N;;r|La-6ztMvIsK-}8{{g&H^QQs6s}N`Wk%b>}&ImvLyk4v~jspIJ#du%14)EYi%m;X6l;\
-a->{-0e}%I}+B3G+(GYknATF`u+^6~~`{9{XJ{1^nKp1ivESi#oC2;MCP1Pe7mS*2W)jkq`d>;4{\
-P69xR*)dgcsl&!$dllJd=NI!V4izIBp(d;(trKh-eihhGEuS|M-x4Z!2GupWNTmmxlz5b}La2L0g\
-#yf2plKV8`O|8z3fyS{P*`1yf<vh!C!Z|}o=`0D|`>UjJew>bs&Bk=cX`c)snWqjrnPLYq#&2Swt\
-zhfQXTf;om)<xS_n^--H8A3gZ=vSMhe6ZqI<@db}j^F#U0{`THnt)%5{nZBo{vpKUG&%e`z)wE{k\
-N>Wxf}Ed@^M+mn{I;F&zQ5&Z9G@b{+hYKqcL?UOUjX>Ug8%K#)A;xO<4ySc&iP-6&%TH4lpNr_0?\
-*;^fQ$T}znu<p_+HHS`#0coAg+Cx7XLj1{AP2o9=_Wex!v^HHS*`VV~yMo|Hc~m_x<G8nxwqbMPK\
-9B`Bnw{)z1L@rXifi9Xb=9Q{WGL5%BK|`3TPd-m(zOpNqc^`|J@|j)l$wJ%2mQlUxD#l^by0_Z@(\
-Dg8p!@7LWc0#09eWc}@oW?Gx}k`8nX<8Nv9wfL}2iucHsn23+v}%sHn?nrCzr;CFq5pJ&;*azEAn\
---LDaw%|Vp{OWaBkNrE~Z~Y7No&F8@?+(Iow7t)3lJb{|=gH^Kt#JITHp~Y*;al)sx`et?fS>vy_\
-Iv;1e28njh2!17zW|;`m{+qdl-tV(0RG82(~<u31;D55kL!$GcOjqu$6w5!=hJ}S2gm<rDwaS00z\
-CY09QWViBKW>Sobd#}#X5dZT*UADnd_kbw$^s-V&Iv)iuc(#;8*+y+rL*{EVl=50lXdb{9`qJ18}\
-ka;cnlCxR~HKSPb|>Tj01`_a(62_s0J7EiTpk#+YyRd%({I{^XNz{K1!jo$@?hU*Eb+F1P=1nS35\
-@`yJqSrEy&HJitFA*hg;wei-DLYJTQrmjkcnZ?M0^b9Q_e^rBvzU$es%ApeE^@hHHz6zcf>2JpqR\
-u-!5Hd!PsIg?VDVfCo2VJ^VL-Umg_monidJKdJQ{nEQh!DNk?l4}jP4t*J=<55VzL`tb2z0{mKtc\
-We5_C4fIA_<{cquD{v;;CiR`|3Lm7XIu$!)w6K@`Qrf>>mrr`|EZwA{TcB8d=bY7JFk-SzE%VN^g\
-Gz!at`1#h4{`xfL{o5Ov?j$@M@S>A7Wlp_YXl1Y=h$kMZjl59?(iH?z0yBX`A8s`E9_(ItH(-m5=\
-AnKZ1P(^3k;T*AU=qmSVl@pMZ;X6!*IZ{C+cVUU?7Ta|L;F={54_xe<<^_emV@yZOgW(t0M(1AdC\
-YXXw2a^poR-JOaQk5$e(X_gX#=zyEcp&kXW*ho8v(hsOhcQw-~4Hv>LLh_lbT4*agdJh=^Uv99br\
-*U86c^Xq{pBh*bj3Gh>%!{hMR>*YM0&3_7Z;y##<9r>BupRfLmkIxksV}1TCI6nR#9EZ9d@R==mU\
-VQ}kQ-Zxb=NDi%0Z%~F8?OWWOYaGFM{j^}5b`NLx<T%r4BQC%!{*q|+UF+uI9G1s?|b<Lxc|k4H}\
-UH{3-NI+zA)vNu<n4Tq1DUk06cpfwg=w=e1~`Odu?@dle9i${ARhIFz_q6-|v3_7whFd3i$62#P-\
-6Dw{ZN^!an%rTlhHKeGcBoFNfn7%){gS2H;mL!hVwdf6eiS=VSiECvS!Q;(dIbe!%DMi{o79-ztw\
-&-wXJydtkp%+iyUBcoXlNUkCh+E<w)RCXc^A5BLp>a9ySY|F20}cV*50$@!wc0Q{La#<#eg<I7*g\
-{+t%T#eAzP0bl<L=B3;S_(LuDIY0he@UI3jPvcy`=k0*U=W)OvUV!g=%<sV70lQv%-{kM)>u3!ez\
-ZKMp()7%!zlU+&8qdQc06*|GeEpSxFL@2`gNOV9{LGtSyI}eqeBQoxF66m@{oZ>A@N!?q`sa;zg5\
-9w_ws)Qa{Ke_GzS$msl>3=G0lyfozYy+w{#_hTfZtoIYtj5Cj(>SO92e*Ty!{JUpFHwz@Xxp7{pC\
-KuUkG6PZu5H}?sE**bCQ6I^`E~E_(9KL{7%5X@}y7~=w3Nr@f(0oS%;5*74VND`1#NMGsidE7VC%\
-W0G}Jd>*c+_fS*?I4<B|P#E-s?{pw!^{D=hRLH+DL`M!MU{opry7U%VR2JkDN!Febv0Kee~{5-z|\
-y!{{?$9xv>{lGszsPXjv3h%oc)=#bi{N}lMzy8q!ur7ppXg>q|xovQ~?1Km7>+~}Z!u4Ope4EmPd\
->y@W2JTCB!Gm(U=AH-T_V}EKnxu76jsg5HU3i~5@NaT|_<4Ze0(sn8Kd<Kj7wdU``eBamxDy_Sa{\
-<3;FPztK8{ju@kK-n<0{)jbv7P&uM>xLnLoCN4kIMbJCjnj*^)$c-|AFQ3j(_KPo51f%06wr7U+3\
-(<%fIim$6y``^%jNzzgwu|aTVZa!93LV$D1ApKK2Z3Pt8~dddO@%Z?6P=!%{4l9$zPa&h>Eo4p2W\
-?tB=wC4|txJ@xHJE@HH{KPhAE0z3<?@2Co9Xp%2T$?k70D=LdNG{^AMwbKVEXi+Q8(0sg-UTsKvD\
-66W(Ec$~iixL9X?)>BQ=I=3eS{=~LeKgmB0cKtl8&#ZU`{P1t#akvTaV}<8=?isLyzQwQ84g1%j&\
-+_9>Y{GRdj(tu(KC7RDaTa(iS6UqZXE^@gIYPeV^Kv=X_dJhZ%!T;HT+NRM$L}QcP52(*y9@bNQ(\
-u5M{yR9{w*c_BLEqEt*)v{{^Sw{~r#!FiRlsi%>ZLDv5%#Y?<Na{}aIqfCp8%gF)brW-C5WRviPv\
-KZaIx>h*I$zRAzuaj8KM5$J}<-i+JKKg4Di#T-jr78@EpKH!a8~n@cV^&xgY%t{03*@{D|Z$uzqL\
-aee+v@|KT;9e=+=OleGWEVXwiw4deN64B+c~uz%xez?XtQ{F{Iu`)@f<<{ZGqeiOd{yysBN!`x;)\
-@JwJ|(D)L)fQxn2e!pI>pKtp*U#EA1J+9RcT>QE`esmt-cL@BVo!*egBU%CfC+y=NXgo~7XXb_ag\
-m1{#^#^ar`CWr=a(p+z-n<6zvk%37q<_50-?!^@e*F3HJk$OI{(=AE_|7okABXz$n%%v{TTSx(cf\
-ijV{1U$cT&#=u1mLg4@bd>YG)e1tEZZRWqb`Tz&prfS=Z72Q{G8eU1^eO{T(5Y?x8XV|93RiTt>t\
-TAyYiQS?=}n9Eq@R2(+03y>U{_NnY&=VQ~q6fT;RKa2L!+U^!GS^jlk!O5qz#>{tUtK@vSkx=nBA\
-Fp+4$*7>Auc;N$!d)Tcd5yZ#4Y@9&TI>m1-0Z;9nV;zQVvUdMRnNAh|8xsRHp{f17oIR1P%{#Zf&\
-ybJg@f_T46Olju!ouI$H2>4@j@pt@UQ?s<c#xDRD{e&ND=J*q7{9SGb{KENoKAbX@<2MR*O8*G>!\
-$SR#JEy^OZoqM?^?-}@sN1G<{AGa;whC}DU*Ix=OZ7=O{weTJYW+LHn>9=I=LFzlp2+nCm+>+F2F\
-E|vEabCn-Yl&bH+u_?FBkG+mIFR~1jcUz+?0<4_+Be;-a+YO9N$rhOa2z{Yv06typL_k@hhIj`r$\
-&r*MZ)s#ml||_`XZ<_&)*oxx;v#%-pJ3+7~GX_?Lvb4QB!_)?K_8aIv4uo?ACd`CTUgesDXsE1S2\
-0_dNvr$GQO@-WK!Uz5;mgpVN?>xqRDZX+4DB0WQ`VesSAoCYN454eI8>b++5CSz148A>gwhA4KCh\
-yaafc(4Xjt863Y@STA1z{4(MCHvzuSQ`p{r5b$qJ#q)Oe?KytnE<#@ez{S2B&jSAY<FWp{;||TzI\
-vXbfF7D$`04~-eJ$T1vX`PT|JIdG5TEKs@GuFpm1bo^I?Dvb#Y?js;UNuub&#wbq%%gt-aFG}N9^\
-hg<&(%9|{Mh}lzV`^=&HG~edgoa%Pav<MU$d717yI|E0Q?vs?`bXIJ?pU@^asF2UQP4P&C-4lhX5\
-}2J2-V``8>P@@R^5W|H&@1Ii7tQ=j8<nF4Gg{!|`AI9M+4{yEIFAeGdRG_Fw4QwOQIfv2{0io;;S\
-f7Xp6vd$>OQ3xMBV=J?Mw`|IN{{{_D5j=MKY`xC9%UB0i~1jnEF44!X~0sirRJPv=G1N-bAIF3`?\
-qgfiiz7g<G9D?=OzXP6xb*K5qo&j9s-5ol&S(<M$1o*j7|M~lxo)7p^fq&J$XS1}ANeOVVj`WZBl\
-+Tkp;P^F13w^`@|L{4i-@d+=eEb*e&5z$gsH^Y|z(qatdce08^3*l}F7ha5?8Enqr!ECQHkjFm?<\
-3!rD}amfl<NUM>mclh+;U%#w+iO*o(gz;3D!$r0(>8#?!j&QHB0+>?XrKfl<(ICxY)1f0>Ec1#NX\
-xcPjLM7EwS7?8E~;q%M*bAd=}0NyYql%X}!vI2k_&k&%*r$J^*|U#AUSieeOVx9~HzrqJ;;^=gF-\
-H@#8~+y>rmP&C<B!R{)>)K92KV1GvZwntq7<zQ-QYER9pF0$l9la0}p1{R``X2ep9w7wQ%K7;w=q\
-^jpBM`4I0THyjGz_a8Vf?=8T83vu()wD@m;<G)&l$L(UkPk9&f2~Scu{@h>j`nn!)v7W=+AdG(oA\
-Ab_yB46b$z{NUUGeUAX90q)kgYfn9fPWtB0xggD_^|vt-WY~;B;-@S1^BwHaeZbb0&?<b%s2Q`M1\
-K7pTbt$mdH{d%1H2!d3b+`by%q4Ag*d`{fZr<2pJUpZrE!p-0KWBM_`cKIo2C9V74YK(Kl4R^|9T\
-z1&U1iYwjcJNcXfcC{{p_wnhyE6{REB|`>sw&mMZ1SNIKn;oHCdyrG_%)N~)w*a%wVL$fwFvRCTb\
-R4rL1iiL5$UDU`};Vr12nWFc3~rYfnymi9oaB0oq?XYv^}Q7R=?tEqgYw0cUql*pyj!I4~UH95ub\
-Un)7Wf(|XNt_&CQorQcpl_VEzNfwJ!)Z_Xpi`!K-Q=o^F|Lkd1)nd7l?MSUkB}XcmLOwXEEDn`ZE\
-27qaEhb9Vf9)WDRY&r+SBO;qeq39QJV`FGDjr!-NR$RMaV2;pd8wrX<y2`jRf_h+mSsE2Bgtf{Tr\
-QOQLTZ!@Yn1#X|6{KcCUB*@r$beT@*`?;)heY;Rr7^Xjtpdme24^j_wKmi5|!3bHXz-7LA5VI|9_\
-PH<M<%Uvh;Xzuo@lhSNpou{s4V|<CGwrsFKfK)XvVN)8qCguAj)_mE4}+k}V_?*+e#zDAO;kKX*h\
-`3&pZRK0SSGmCkhbTepirHoRUdeXwXxUqDqNYB#=8Klw{v2Ol?bpZbg(y%jvW>4skBN0bfckuaRD\
-2FAlT+h|9~&%DD!Mb<#BFq-P_^)^w$^h!&6`YK9mDMc@!mQraViSx-69fojabukrP+Se}s8h$>t_\
-zgOhXkQzD1NL=^04~rGSF?pevG!rlHehD<EBtwbL6vSZ^nr*_E>RJ^Q7<Qbj`&+M^`0y>tlV*(H8\
-rl*ah^W4%bErWf}s9M!$kE-kP#uTy>Tum!<q_`2O7x_jgT`_gZ#1Crz~bh3meswix18h&ZZ%_g00\
-3u-ZY-N(IRl%)=MoCWFuKP{$63+S5Q6l#Bp3o^>}<Gq^iTIL{TlLvgH07_12&$+<IUSyzxD0Z*@u\
-#O@!%lxzu1Lkyk4PqL`G*8|UB}r?MiIARFVR+hFA>neFcBQ>8CU4lulBD|^dU_LhAM$&Z14n+H=z\
-$))Pxgb1rgqYL$0+TO(Ojz;;%jTk>}Hj_^!N+7Q4`hmq~^E@rbM>5rE6CO(uRm&rfx2&phxW`>+)\
-u!-_l}<ZGVytGD;U*=|d{14YjL0RHr#5yqMhOrzs8HNUAJh1x;D@WbF3`qr=<K8GlrI$@d!fWLx7\
-1=OwDG0TklPZ;L4NTrJc#7z9iN$Am)&p-r+ke&pr5(#Pfpi;5!B|Vu6;GswxQNzSrE-OF?hmAxn6\
-1_ogsCVujEPlj-sCR{$S%IThQrSj>kyVvb%d6vf7-LKGuPLC{f@Vvl(%jUmPh9H|B%+cnOQo)NB2\
-ngj+OJUXA&H)jq-9k6a^!LPKur&roXRhElJUrBv6MRF8ofb5jzJP?$PLDv3%a$v9$}L^g9`f;r0*\
-`9XCsRj!mqlI*_&namXR$i+(+%wJ4S85vN!Rd{kn9_wrgv~(yTB|v^t*l%I-Taf+MPJRo~--1E<R\
-|<ytuOaqpEB!T0e+{wIBkb2OB~bP70ckC#D!r*<bd(XLdSgV#Dkd_e?sm#DqK}t}ve-T4OodhQKM\
-$NK*|qes3$w8cbMlnwY1p%nLpn8@R8+Ik`H@N_UC3q&E0>I9E15+jxni_ezqa9fl3OU`7MbcZFcl\
-JWsH)fO7)n)^<ufZrQhnM5%F&ESAq&885D~$-Xr50Gp!4fTL34Nzfp|8*s-v}zu!G0&3CJL@C#XJ\
-zE4r3^mPlq<n-fE8zBh)J`<ZO3Z&}XrsBZ8a<zqmshg)Di+Kx%<ShCjKPt_=5Nj73w0<OlTox0%a\
-vrOtTG68V1cIktoleAo~l!!ZCR)<>$uD2yhsaWm4saWn;Wwt)cvS#+xILHyxoN%=&6nE1i;&EEI7\
-gTg+gvX1d=Sw(^Gd0hzK=nO80^>PB0(gc*nCB#sOyw(d><2eq5#5-vurpXfMuR29UNOWCmQJVGSB\
-=6ws0(+mB(pIUlm=N@8?S7Po?3ipA5^k&*@$Xlk8Knxcs(|@pf0w?mU`)ZhcIjs<4L&m^5Eigk2%\
-fK|2{m9<jVS4V|Cft4NJr$FKWE@4R2JaF@4I~*-v9VsKzbBC*f&~cVa(VhD$BVPPK~|Rl5j#sR&o\
-?j`T`v^5a_bz+{?V4<?hZk7|lUx|oLJ!^*5_e;!LNruPROZw98Xp*3#J<HEc2qxUp&Yi^jGX(5cf\
-y0tyXqt<a}R(hP0{#a(?qiA>{mW{P?;fG7+dUI@dOCRfUNt^NPPPdAix4UMHc~(z|&f#4{89(l14\
-ZGJEGA4cPST)RTSF$$jc6xVso8F$n0#-9T>~)5F+V;pV-gmy*n2;XATjXc0(vdQrx;;_)JbQy3WY\
-c&sAieLxl!)SekUaSZeavuy`&933!z*#m_tbUyCi0o<o~zdYxijY6M!!?n^C;DAf!F<({(K`5uS~\
-{qUBitw&O*k~z%0Z8dVgNPPF>hLe+juqPnSv#Q;+Ofrbdqf@Tjg{T1T&3P=^!w!E9<u*D)<bD`+8\
-axN4PJOqI%od?K5vtX4+@Q&?@iDJrjn*Y(++`AfPx$=Ur&I<<?#Gb~-Wu#Z@^{qq+rj<WAWw}%n(\
-X0+JfAkh|!-MKWG8N-S4aCeS~m-f_(5%SWN0{t)YelTfbxiopru3&VOT_n++ri*zLe*-0yPpwoFS\
-vJ8CfslSnb}*TRWMt{FiV_@1lru@STq$MpL)}Tb^pnHHZmg6NnM%1kN$;PGM%$B#Vj@XiJUTjW-j\
-R#D7jzzbtQu+ww*(dbLhWSOQk6s|t8}P6g~3$yi>c%WDf9}92Le(0EOGjY1L{%at;uH|OwsSi{uU\
-K38C3Lx=!6<cnJ*d*t4q{T_I_M^B?bpe^tIF7=;_e?s^@3;Lq(%;GJQBpO7Z}e#6UKsrUuCDNM*@\
-n=w6%&(D5<7hjv{>A>*2;q=r_<Qmd7a_8&*nS0Hy(=pES)?K3jHyn3r{bbj@!bTtasf=x(x(>~_v\
-BiBGvin2Df$wq(gA@8fSt4j)lYAKN)B8Ch33z-b;55a)il}aZ@vK9WvLH1YePw`SFN7ZJE5o;owN\
-v`IXYcq@&%q04rbdce-tFzd{XI5Itwesa+q0C%XbWGb3!UrSTL8n3@Tdb6-^Sw1WTq@)X?SmsFCU\
-(2CeU%9NwR>@vJQx|S0G$AlWML#<seX*0dNdO>{6R1mmog&s12VZ{w$sNu88!laeOj+(=ecaSAPj\
-XoBaUZIOleOCgAr1X4l2R&>T)H;Dvc(Whw_D$;sRGX<PytnZX2hUY3do|8RZRAN^>;PM=Y)R22M0\
-t5R^*Jq+A@mbi^>AbSUZKv0j1t%8ruFH$e?M{yO^K$?1!F>60y5oFhjrBL5eq4D3i{q)67_qOKx!\
-zV(vz#eS#H%VtJ*elWF4g@cYQ7yB7ShM2DWznJC&Zy?$A^(9Zmc$ehMw-Ona%?#zqcn^%E({#r*%\
-DXl)$*GK!3XYudP|(9%35Q%%--mk0D_aPLu(e<aTMLG;g<uFs1Ot88E}B_TSdA3S04ID0iI^r|Go\
-XUL+M((jPLfW<LW!K0q%W;Rs(*nylJBXsnGUBDgsYP=$$U#{^G*MV`ZQM5Oq5SS<EX+KP*nCe`9N\
-BYBO452LoOjZbD@-Cx0h^~VU>?s4j!A|vd8=W9wjOl9e{}Ytxu`GVs%9LW4Eb&YLaMrQD)s}i<qx\
-#gWR7e6IS25HLWzw*0k|e@je1$p(S)kwnDP__1iM(-)*O7m}P!67$kFNFa<kDipxv7BgR3!sm>N8\
-$YB};)XAldbZSB;7$OU&P+ZL;djpB&@|EOEsfi#vqh>>x+IrOGLPn!Qg$kkWv_-y4DUQ2TtGiulp\
-|DF4iIFap=(~3J8aK!2Qlb#ceWdggb0?`jS5k>VKE>%n_UiMJ?ZI@%8YV}OrwnOR5KS<NWDO9>3K\
-pKv=@hY=P7&+r6tSL85jWFGp&BS9@2Uf-G!@@;^+j{NWESM?t+lk#yz`^%bycMic?Fu~p(X5*x1$\
-rANiVvyz~4BC?i9uboW<R=myJ`!hzv`HMs5RYKh1ONTOhb2q^l(+T`r2M$wfNn<LtNI7<ECAeVa-\
-^V%w$iZ16Mb?qka(9?M9OQ7$KPDay~F#b(-6u5PnjMxsiwiK=<Gg5<$cmFiZ;=4y^CDC#-rW#(f)\
-T`)|k?>?3+tVQI@!K!loZ8S^Qpwd7rLzJr~v&N`dNKG7Y0l8ZeiYh20ZB|R7&3Z|+Sucq;H%r1rq\
--C*MlksHQhGo7ski=|(^0(I)h{Gx%6Oe0q#<!xn=mM24HV~h>8d^yV!CXnQ8Gy_xd&8iriMpO-y6\
-LHei-k;{^^f2mBJN~ADS_%4g=lZ}&VtecN{vFLc(RnDIt5it6GJJked=2gSxao~j`Bh3Q}l@AV5V\
-G2(9a%^+34nx!Au(F2Vb|m#Q~+2l5aLx$f*e?H^i~7E--`7%X!*`RM!qPC7^3mQ7W2pHJj^hTtwJ\
-_CtEcUUX<Qpt<F;s6XKdb8FBKpa^1{rP8E<|Yx95xBO)pja}qBfGRe|uHun{y9oA?sL6~l-<lWj-\
-ywD|n8M2FzuU-980hLdoUTre+iBcbZj%|7dbxs@ueQ|quW4fJ222w+ryzbLv(`R6HB~^~cMsvA&^\
-T_9!zo1)HT0$)mli@0#Zth%YV8<;{^Ql$3H>|Zfv9<Z;ZX?uvFlYf$Wt9duay7fe4bsp5MM5buxh\
-9xx8cAkT3Ec~7<JCYfY30kv`SN5?eKSJl(!fY^InlZ@)FNT~OfKi?xiSrSt^j#1GQ~@YWX0@u((H\
-7F`<z08tg{wBx)NTq^ar)ZV4oQ`T5P-9T5A!bwHC9U;+aisikqiaoSlirJ7@?jZ7kkB`rN}ow-d#\
-K+}1SVm|s;|jGr_jMx%%8>g)HSUqbYIRefG{y^|qk7Y0=;4Z4;@FQcNkK(uX%8DKXZeb|PLa72q@\
-vNqC;A!uJLMl<&6x8^t&bZ_oSp&LH()YV_5BbvmLM1BdmN!jshjqzsXM&EPXV6c`4oRv&|G*zk?w\
-IRW?XP%c*7a!VAWs@Svx7IKY=M=Nnrj51r(hsEzqOAE+Tn}bU7B4mt&P#ys5A|KZ@tBLVD_Dn)_-\
-AiVQHf61R|W<SIl}0dH|rcGukM6(>e6T&oS7I|6(x&ZX`_CVp%UXs=BaC=(mlWqckLzgvav_4qGu\
-C$PHQ%QP_4RdD+P_*<H-vfCvpZF1%<iO+sQwjHih)4_)*mEc$yc=<NL${6{rg_502e{wPSbF`anu\
-hi**P=4&y7dslBO@a%yR5KHb54*cbAsZ3USY*GtclsBT&<MgLw3H;%Yy2V3T}+9A!mT15GrL8X{U\
-B~vRi<&;|et6DKwX^be@7gf6#ahGu~-JSZ?uHw@Efa)edtWddL)qQf+g^*{(!d8}CP;_NenQp#pP\
-3Vsy9lNy2Z$l<bdi-s78=rzpot)a~CVjlV<SRjKZL{)r`F9fPE*^5#c1gsqrr=&srTcV7lXWb(X7\
-T0uf~=p}Vi&^lI%7DS*h!Yr8I@Y0jb%XX)K|M%cV(n8a1W4GEv#sF+)=|jVztVONaNdp)%QUj!eI\
-t{b!yjYh`SP=Og%N2=6vmzqjAP-GR38GuER1$sjR4rc(B0ogVb*M>spwBMHtjrgjBLR?+To+K{QY\
-HYk+TG9hvemnLJs+Lw+b+nM|$X%gtxhUcQ$5=n(;fugdHDw$c28M2Se%Ski%$?w7x<FB<mpx?5Mq\
-9<AZKR|A(B7x79hK5NPEP|W-eqRYn9nhbAM!7_%dj8-CI`ctJGE%e7f_2`6V=K#ms5a||!Mj2N@q\
-l`ve)&hTCXE6CneVlDZ|4Ia5l4kcrRB7y0!p}1LZ0q3p-_(LzY(F7ZMOiJAdu6o^h3zL{$%axjoK\
-^b5lmWzC8dSaJYn4GP7}y&l!&yz%BJ*2|`qU&{J(>E|zz;30riHTAgsOBK!cyd>9Re9DNDj}G)qz\
-Zf2_ZO>ed~U8G#cTosJPDFqw;|LPl)8pd_Os6h*f2foWP=QkC+h>#Eg(evjsA%3{(MY{!3?YOq3r\
-_v_4n+uq4J<yO~{&-Q5+XMK@>TG0#CJDtZk8q-x3tS+eQ`3vbeJmQDllkZ9*3v@A=(i-22r3>K(P\
-xQKa8_A^H)T_t$&e>k%=OC5QOv!PZ3&?BOw2A-*=n0X-JY2uoeg)*yUYJ%%vY0$yKRXTy<w6RDzg\
-2AdyXwVGwJPaFcKtbAo9TVA<H)ijpVjDw9b(=Y7@@e%<oJDKM?Q%?B3)*Zfo)iWl!A-v@(azb>fY\
-D<SEKp3r0w<45j@`I}=&%ef(+6m$Y7<o@LTb)lxWs&Wr3O>A?@{Kh&+OW5mAMhT>iCqyo*a#GM=Q\
-Cgwm`hgt5L3&POk8e_n?~<Zy9ImD%C8fzDh{51Qr=GR>)wp{f}v|DjA_%irk0h0w7zSWz%qZ+FOk\
--l~<CjG9y#YX-;Q;kl6n0*L<O(cJq?&L}TZ7%4U|Qc(0C1P$4K2-_@y^p`V+6Lh9<({+cM4Gehh?\
-P>BR|{L$)zu^J=w$fiw8vuVf9D6;pwH6(wR8(?})7)u2UM7c)=a=F-UzENe4N@61+JvQQ$sYR<6T\
-ciQlB~`Q;mzX+8tWKmA$@1#hdY3XoLe)&U2=wY2Uk0mVF0NL*BIiB}g*o_#Q_1Bl3q{SQ^3j~WN3\
-i-HLCvVKNQj1P=#6Uf(TMP{c6Xf$q<gTe!=`qcYe?{8X<sy%jpp33p~PKZV7NOA$1W2a*O+SJPU$\
-vmIK~IE-fsBAYuqMHrnjQ<cm~zqWx|U-L(S1<lsloQyjxzCgP}jZOX2PH)nFf`f$R#=l2($zALN^\
-gj6LaDBMZtkGT+1jZ(6z#N^e)ILE#v%uquT<_6iFk?7jHp#El+xrk2(W(m5vU5RJF8pXwHAMHW&A\
-i?nj9fky3J*8*yUZ;oXHn!=K~$xG>xGb_x~FsRVbk@=OY9ZE&HkAvJUWj!=SqTfd?<e3K1?J)y4I\
-@;T>CusSOq3elEU5Xt!*7%l|sqebSOZu_enZ7}nxa(p>bQ;sV=Ki8NvM;cI{QBOc*#ULqvQ)QMc|\
-DgJh%8<U!T1j8QQb%PB+xWhrlGal<p|UFm1sjXXS5l!zg!j;%9sla)iu0OT{g82ER1WLQ|@&w=C0\
-%gjAn1lcgTXgdV+iP>7+{z8#6f_qHjty`eu_d;plU$L%JjjuSFa)aSb`Fen=h>c8FEcLAlB%bC`>\
-2S4fRZigC0tM@)Vsn^hqto<74syuV%r0nIat6H7$5hD)82yFMCL6sE@})zIMWkNHWtF_ifTvsuXn\
-e}|W{jovhGR@#xvb*#lGfpV%6%@6jIJvgenW|csNZpv&Tbkn$yxn3Ttd+ySOTOCphv#W#E+ohfnD\
-rBk=a#J-2FYGFzvV*u<K^I8$8Sm(wxM=zc*6c-BzS$tEKvgf@g1=>l{QD0VMzVv^Rhf#H8Y0wAu7\
-=2rhNM{|%vIfLbeNg=XMI)4nIPHJU`voE@e5^x{e~U*uv^H@2@+>BrtEtQAXf{1DfGO8FY6*BS{J\
-@!6PAwC$rS0K+L0liLAIBpT#RV-_3|>qZ-7ShRXJ0lUp*G~y>`_h7Ov%>nj_*?2@~x`!C=Vp01qy\
-WWpzXNlsrH8>iWsy;99WQqas^z-gULHk=zOR54?((Rn;n!*a-O&8)HNO4S1|YwMd;<g+My0VN{x-\
-rFf3*bSct|<Lc`sv&OoCtW0@-GRr;1L|=#|vsEt;8Rc}5^<IIje0R0Wl?l#DwqvtKEZM9U$|N%rL\
-mrf_F2_3ZQl_V3Wk|YH%{^1boXg$U+iDQ<x7wlXK$vJA(j;|b>8%1Tz16DP)_!nhFm}olfG5r>2r\
-@y%qr}_;%^e6iz6?wu0!5Fw)<EOu^NQ)^)i^+ERWeniV=8!OjJcPb2PfTX1FGf%iT0}wTRSbfrZW\
-yL*0f=<xk$@5*yqlAjf_id>0ixhepSwTbc)<~tfB8Lh_r|1c4A0w(^`er1DJkAb7(a4T}>v+6+Wc\
-ol^i<-P=*Ay^P|zMHk)b1QF^)Vtm!E2?66ApF9oqpYjmU(i{jYjGA_!jMs3wVb2UaXjPq4!`xo=?\
-g%p)(RtLWh^4(N-)pEs{9T#*$JGxiv!+<yP4clC&l1FeVxlT?b2j`Q;)h2I(V{W;$gGH=9*?qz%u\
-5o(ja$}OIL9S_t2D1zJOZ2CKefo7!m2bm_&Uk`RO&gEddC|kpMyEkn#@45IWnU_hdBP#*V-RUNR2\
-f!NrBb0JW?wp&wDQkCu74pb-MXz?jR<Gsa=|1c@uCt1I*ZMZzatG%Kb)&pd!r^#Hi2EsrcF6(At;\
-jD^b|<9xu&g%x8Y@N8QiIEo3hroaA1vMze^YUt-9EcxpHm@`=rY*K*mpE2-@dTxpJyvQUrvUM~JP\
--K9DT#GJI?aCLT&e+DTDa^R5X~s?@421TQ4s-_7<?kqS_ciXZZ#m|{H8MkT05TJ(m@cC*E-MYvhj\
-8tFz4Ivdh43<c$b*oY$<y<OxL68(&(8?y+Kg<OtUee~Yli;%?!78!Lobn^zeQ9a88a-0@;373kR4\
-114OVxh9|s7BweS4~Z_F0yXgZ%Fo6WA6b$V3?~!!1tEYBqw;0MTwtwbkfpA?L6157M|+~Sw0Gpnj\
-I4$8*Ij!`=Q8OZz&?06G@(t)4hnhD`_&7$!>K`NosVTDxO`ZZww8~vWr+}*+ryTb`h04Zv7a>!HH\
-&H*wz0ETNMDaa(6g+7i|cC-q|!<`;l>J9QIgEC6bn!E*4F?b83Z+jpB~X(BV5#nP^~^gdwNQ|IrC\
-nTgY71RM94nMh^_3z=6A%fn_+rB*o~L4l#*kP)n;qhqj^D^idu}fE22UB{3wNpoNZ{pxCBRP~Y6N\
-B4(*9<my0Wccn7m0unIKa~XP7DfiVi^_7)UFdJP$-X9+U1L>BL>UdR_PO^n}vBrK;DQ%Bcx%1gFk\
-<s^<U1vG90%KBLxJ_e%vGLOC1lQlwWtr|qZe!@smiFAC%}L+PtctoQ8$6x?0^F2kj94wGQkhlsKW\
-HciXR1cvtCYE3zo1&xw+5TUV-~F3BgF<m3Fb2S40DNAQpIX6VLBbhE{Xb8AvIMav#6vTPt$M6D>w\
-z!YGloN!W&5aOM!c^@y>nko6-bQ_=GxZetc&^W8Y4%>bI#Bxs~oMvEoB$EwOfoxlKhAVglEygSxy\
-;E8Uq`7%*a+{Kw^nxu78>N4xf=x?o9nsZ&PF`6Btem9&|DQ7`47F3d+4_tA9_+EQT@^be>MOcSM!\
-No9tHiN0X^SY+yF%zk5oZMbn1Cowfqaz}bgdm_DAmDXru>_)D&@<u(~TDfw^mRgF+rli3$SMU1Po\
-nn1!`;PPtPCj%+HAgv~ZYbw%6S_xHgv^$5%23+cZ&^&;Y2jEFv$1-jRj-1YLgcPnxK}mAE)NwQm4\
-;MwjA4B#nWbrk4$ZpBf|ih8vz0no^aC=Joy`&Yhc;rew@*l~ly$in59N8iHT3jQOLLRyA?ZT3HE`\
-bLQ2^kAi!DGH?UDCd3W~j!{HEA@>hI8o`a4)wO1H@JoD@Zd+^wQUlwwyrl|)GkTZcLSLuL(n%=xI\
-kFd3CZQBtt0s*5zRZkOc;bs-hm|Ie&4s2;VGGF^O3fl1S$`ry2qYWnqh?q=+g5$SGJl<IeM)e{PA\
-vq-u?mdDB^<hy1TjpQh?+`=(MhagiGLyXSlP`JQQzAC8NbR(A}RJd+TQa=V^U0O@KOBJy3VooMbl\
-uZvvA3brFsO3}zatxw5ht^JVd70jn<z-_ns;-**ofwIw9p(j4HZV&Y8ZNV`r0IR$L59u5u9woz+)\
-w3HrPe866;+f>1*lVN-4=t!RMN(vim@$*LC5FZRK>98bq1qQVv^Pigw&+M5c%3xnMqc~ym?%Q2g3\
-}39ckJi;v{QiWd1;HgPC$Mn^--;bF^)EToJE4E@Rr7(TEGEz(yRU)|c2WchXr)hVmCyEkl_{h{lv\
-ds>h^Pp*krqPgP1;r@(vga~S&L*gMT9le%PGU)N+v(wbpp>F9#9q-Hba3i*?<u+RkU)2Np(brqy>\
-tqBEO`qc~;yr47$Q!B^^NV;nK(BQ@dZld-=Z-NQc0g}hjsB*DlL`$j4aY`{7gP?H??2CTJP}NU!$\
-H<7vTSeO2p_EltZ6O({wvg;AWXsXCUCy+1L1?bLx!zC(4Vmnt8Z}_z%z<ipdMKC4lc%6PlBf;`jt\
-ZZp!(AC5tnA->dY_3agn8M_BgyS!%d%9mSQX)kszd?lTjC||$Vf9nW2-u3P8c#@+&%?ruchd1xEG\
-cRIo^z+5e>Orb{m;Ql>#~yOSXu-lSO*mJ6S|n(w7^O%eZp;q&<23XV<i&)S8@+(s9AbHn&j;##qj\
-&zP35txt987W~ZP0Wypc)u`RG??gSjGwb#YO+=)AtMw&w7+zZ&S)%mD+ZgxismCv1=kTrA`p=pJ5\
-DrIQUAKaLXPmkP~UWr&iAN`3vJ-4}5oc9Dq?vXWhcSE6boA6&4_xK4R$E;nG#ahecWqEys*aS0#E\
-s7FUD|Tp(bmu}GVbxV}Qdcd;9h1<tV+7u?((qOcb_CNH-aoxCOI=h`VNIXyRxVlOoB^$WW8SfDf!\
-?tW;{Hl8RU%K5TSC63Jgh%{t|<xSt9}iY#vsDjj>3zzM6~H;cx8W^G!MJt@NsEZ8#)qBMYN^;<Ex\
-FfXaUq}%3sn;#vk*skUh1PeD}dZPED|NZSKM3rOLRey>GhF?S1P)qt753y-r7JGdGx)#b11Onx2$\
-_utXng3?a7@jA=t|>y+6NuySV7RcMkGZ?uZ`irQmX^RpWJV5DhyqL2JxWny)i*T$(mjmfO-n{CJj\
-bZ&K*$<*K-RdnM7Cv*gmhCFyii(SzNy)kiOpq%zY7q=jb_f_&KmV)7DPI3)}lZB})(xeM+x4wvmi\
-2^iEgroIT{4XM33wAW2K(N4P70X9XpfW7>6%#Ejgc`G3489h7b}Q<$;kPi1eqW(HO#KVPxUfx(4I\
-3xVE@xuK>A6z&wIzeqJSbEBNQ#E^3X*t|M5>d7eYkRWHX1%LRVp|Y{o2%4aG0*%sG;SMWydUotrh\
-TVYf&Z>GqU1I3oFY_>kL^B01NddNL9mPsZdM|QRN6K(P-t0xQ$iJT0gM$JF-c{mM$%f$}=0<pfHA\
-36GKuEV}i+ks{|oyP6l;4BIZS?%De!Q=13)z%~V!<FbF)Ef9~|ejj9TM4So~}6Id@H5aDHv+MtY)\
-g_GBUd~2cX81^TFWlcW<mA4jlG=EsJ-c*&Q?zt;5JcC@uSi3qKP{fCA@?;2GS)(C7hzo#~GMPA)L\
-j9JyQriv9@1#sj)Z^NHqjg$vzFOwIrtmK6#XV7y6=W?7-3_iiEl(KsI?fY2V!Q<}-akRjTh@<GRr\
-8n~$we0Lj8;jl%9t7pSmXj4vLyVZ0GdXt>aot2t>v<H@4YtGZOcl~)7WB!?+p@>j;i8$cabB9wqe\
-$|t)CKc=h%)mz_D%Bu3j<Ax|%B1YZ2MWvt1e7*!6XV3N<8w#EeBE<F5Cqb`6v>J{l<d<|0UW_+g!\
-VLQYoI>`=DqPs^d?`)I%FyX+dd+I%K_hcjg7l~e|h*nPgdfo-Y_TM?zZ1&z(S>OhNiQ%a}7TrUX?\
-jaURxwlqN`dEj>P-1H7Is9Mqe7@71eFP`PoxGmD<A|M&lBu0j&S!HZiPK{N&$F69Cr01t0m)f;?N\
-=GW9HopCW*Ia8wnrj_$;(__AqndW)eYxvVqm#WF)1#)bndLU*?Ty9p!HNr1Xdr>b&*Ba>w<lqIy_\
-!zbK?~kc??u{E&(%0}y|t?KYvL++lQf0K(mxcI_8Yb7y(Y$v2ea`}Np_Zjk)kw~k+R8@Z57!%M&m\
-|lv~lCUrEf4=O$IZvooe9xda(i9RbE)WJ(DkvR7~_J>p7Z66%Xt)VqDix9s8z8#{3xX`gw72R4n6\
-Qt^s4MD+MiI%f#z3m#uQh!gN~?(p-VqYaSR%<BUVT%_K=V?2W-$y{VCMYH5jCYdvhQpqh(iHX_-H\
-VttF%Xn>_9#?`)FsYiUm44Nbj+<J68(U>v~pfNe>VPe91BXduTbp~P+nM!30Q%s_28&({mYRQd;)\
-NFM~s516Z^_*Djp_i)PxUQkdmys+NR^2v5rjA|Owr3H<AIQfNs`$7acG0EM#)>{9OSNvR64t1P8i\
-cvDxnMf>?lV!rKR9)_g30bah0orTqvvsDgud$1Q~{bP5Vm0?qPuxuCE8LkGL}?~N!ch>x<|KK`@J\
-U<%RH!8a)A-zyH(C%h-#>=5S#>M+N_G>SZRj2`ZZOO1XE-#)ugWtP|`cIhANh=My44%%-=3Y3twv\
-eIas9H`~tEVb&_(FBC2J*!cqzzEukt#RuP+8rtY`FFk=S~WGd{z;bb<q`_)m6C``>rP!?z(9ri!w\
-xt45EjjczjOzdSS@Tr|EN&=xgzcOc@4PoAfjHgAjkV9A%`RATf%-#3;unkHXMqYm*i<;G5k^&7`=\
-Jg4L`k?99yXoYSTDOB`mt*EITZF=mmZ#)6saa7ss!mKiv$wd~$_Jor^YIvwu=pe7GR|rKQQN*<W=\
-|~{_YRfc$=qMmJu%C$uQ1Y8yHmqj8gIxM3v9M@_^*Va-(9GHG11t8Mo#8L=__O1bGjb%4{JKT6OT\
-(0^foZI>|29R@ZDWf)X4(_SZGOQ!yM-w=-t+RY)3^Oa}#Uj8{M@o`M@r_co><%wQK?YxVaA7L?}p\
-<gQdkvhOEubLcWs8kFXU~j}nEkhS+F>DN|z=gYsfS3Jw`a!AdKCjLc|i2~K{JXFqxAyjblL<+=Cb\
-L`t!hIi;*>=hl_=8)oYDBug~4+lDt5#oSFr=`bQn(UQjTg}r@+J~e7v*|_1X#$XMFh73$#N=Z&KO\
-Uy+_kO>teL|M=>(vzn?coEzO&(s^Z(KWu@HTTUJn)?Rr`xH>`9ow&HQ+Kwh_0%K}!z#!y&H@Injx\
-mGJxe2a)zLTrsW$m_oL}e*KPL!k?c%I`+QmXcr(Q_nf%qnmu0O_26&v8h%%5A4Rcf4g|dqs8Ij=s\
-$}Sy(#0{$7538s5}t!S7+wi)}K58|{li>P;+HmJ&rrDJJ!{8ESz>=~l<wT@c^5?w!#Jt=;0Wq@SQ\
-WRiMb<^b}6I<fuEyq<F;4#35Y>d!Px?6x(2;qSui%#M-r`OXKUINn4f8wn$iYiw{!zt+6%^cT#(4\
-I~~;0By^bNOJu7L)2i~aJ6Zi$Ev14c20>MvYIwsV(cO(A$|&%#p`!L>qsFqGnKJFtNlwfR%F1@eY\
-AAj(>W(jKv&=Hl#_mPIiC3vg($h(?=;?$T8%;iGA#s}4*O4dsRU1kll_*v&DzHj9-F2x(la^Ma(V\
-s4#auGX&tVPT4Srn4X>XYNs>ECJ((Xc5CB9gzBiP2893ZnGMB%llZ8-<$draNdguv%4=ORD=qwbp\
-&ED_5Emj5}>h=hkAg*T5mwqfdGkS6J2Api@-xfr%YWKHhRQO|GLCmk3X+poP7HgrYZ+#N5;hPa25\
-3l;ipCr<-A=x-9)*+cy9?ew_*|n%ba<4HESvsVb-1YoOklPTiq;2<;i=yj8UsSMA@;17g9a@nO^(\
-hfS!dP(P1Wv|sAT8sl^mmaHhRcpgi8$>j@C8_z|_bLXTm)&ZcF*7K|`ZNDmOWMCtSSqX^Ls*0d{G\
-CPb7GBL_WbGZrKMkgrgq-)-a<;MJk83n8MTa&^35c9ocCEW~J<em&*TTgsv(BONk6jX3LI0}onmb\
-)P{Wn7s=-up3`8n?j45eyjPmqZLQ?b}V^3~pG&)46`NTJFS0{eFv6LP)=&xAEij5PXY5>jqpV)_>\
-OqS2muw3tA>DPxR97Ig7UP4*9K;f{JNZ1r^f<i!GwM$kErS-Fi*WZtYd<wFUB;a1NcsWSz&U`ANi\
-><$Cu}71BFV%1UuHMhiI0PqUZ}UT-&n*0lRTYa=T2Dxy#mSVA4e5poS0*(EB!&X%qYvP2;l^@RrX\
-olxplso2|%g=RJ#a%MCW|6B-DA{#R*EU9b(r&b1>6h53vE?2WDn*F84h-mCUub5j6zH3s$VVU8&!\
-vk^?h8E1@;rDh`j~i}O-Lq<t21W*{v~pRU9Sh@HUqId_CFV8M7^dogNMba)EOJo~9S(yb*%ap0pO\
-t8xX(YH3bYG=|3Gebs7olEncN*<i%^BTw64=hn2`_FQS-!VZ*EJ)ndeo?f|NjuLA#1ADvbwRiDq<\
-N)6)_(%0V+5LGjzmL@>pn16)#<QXJoB<9ZE|$x6)Lc3QC|#(%QD{tAaml<n3lbE}3>j1FCwA{5E6\
-sMwmAiq-b?rkb;UVR!B@MNYO49q%es+R;5=_J+%&5T63zR$I<YU&NzAa)+qh9UX4Mk!8V_<Iz4x-\
-gNw9GL0Z*3nj9UFOR(4&HfYD)#cHyv*@9|UCsv~xfi)d-EU<6q-f}Yw^~&*{;<|07xNf}y+^n`P+\
-pd)kJxl4BOnxzA`uR^xs*mDl+%F>D_6xm$5pE2qH=eQmQoY_f(&&9%U1!H*YBs0pLY3oivM^GSWM\
-lZK!N>xQ_T6s8#Lu9%6MC{eoN1<QRg+^NOH8OGi9GFmU3N)MHgMOy4nx?ITPOA*^7zpsm=<E=WNH\
-YTQgOwjH1;Hv@hIy<6EP;PwmK!QZfg5P)dOR8r?MUfHP`yr2@Nuuh6_@fd8;QkN+kyQQ%VYjaZj$\
-+FE1z){`JUDt-WnLbd7IQ>s)@#$ts(at^zZiucK0cPZst0K|2+mH5!j4s}#M7RQth>KI|*yM&g2~\
-b*={;=enDg8j>yn^08CGjIBZjStASQa7m;VrCn##R}0tE<_<D9E1RW81w*O2Nkgi+{Il4Yq%L*Wa\
-b{Z%+>OQtCaiHot4a&{<Qyf7)4ZrQ&GN#F^XPtX=FTlpH}b9!lC?)hKUX)crcnh{9n4IrP*@5s>{\
-vZ(kcwTChf=lo;AY`C2sjy2gAL7<i9t*A%@i$@heqIaf3pi#jiGFoeZP2JG17<^m>QDvLkDS{w6O\
-$pw`~g}QgNF(TkWiBs5RnDjZuIa<9hT=>B!?TdUg@V81APyVXA!v-O<kd6{<1t(d*aJP|LFo5z#@\
-$tvANH)Kxo?m>MB_(oK9<0rQ_}ljyVR#4)asemAvBP%{B{6%|}2nz^s7pzB}`{)~{XML9+ky#SU&\
-j;i0H3C&T|Sc1WNCyW{5OJZq=m|c}P3-(mqgc?-z63Vy`c|nPWoe6U1vcbWXvvP2W>9F#?-F0qST\
-TdFD+iFDc(SjDG+x%=+WWR)(ZMNfx(>-mov0UVOcB+yzHS>go=Rmaz{l^L=d2sgIn<Qi1*wNCv{k\
-{qIwj4X!K@COIF%u(B>^Ng#y^X&2orzr-Qk}|oO3M$jzqlwq7*M(6Ogct2H?6m93+&eWAB_6$zTB\
-xe)~c}S51eUae_+v@Q2){(-eVfA#+U}<E9!9#zU8LLYw~2piL7^N4dR@Oka_4PU5hDVDX9Zu*$Zt\
-Zy6I0XTYe@1h$C=gmmr2~nD}kwBn>Hqt-92?D&SYFj7imxh)pxKO}$Qmq-I#07lk!>QBB{-s!^l+\
-4T&1!G1lxiPQ*3rd8kf+z_|<xB?7Q@qN|aJw$EJQkQQKGBB>Qx^*?j0-k<~bYrYw-U-Jy=YNb19@\
-{-oNyh!+cWEGi7%KWZGE2u6as$vZlO0@Gw(mG$g&2+q>nu%^n8XB(D%U+G}Ouc$Ees;5q3bk|E)t\
-vYGJJnoV=ATPr|6FaEHWs<nn{sh08j0ne%5pg~lqXAPp;Nu`8bW6hp<t%)MN}RYYZIel)>?R&W%l\
-7v6=zJ<7OKk9R^ON+WsX`g26?iO%N6oWLF-;bp16lB&u;4I<(4>ioAKaQyV_0rkt|@bE@Ca28=$y\
-$+xX~&vOtAf)=^4SV>FbxRw1LmQZ0;Bh=Am?Rnq>dr*7W(n%jlBD$2pS*cqt!Y@eh_v~i7j<Zt?0\
-X5$kZrB5}+CIj{3knx+6u}=`8!9JI<NzKF(aJKCS?TX<`we;!-6qIwrYz}LwI<?6~%7!IMSs%IB%\
-Ean2H!n<)P?zN?Y{H7ID3Q@qQkVImnGxJ((3=z*LFv<^bvar`>bGOcH~A8MG@n`Pu@_~{9>OX(37\
-j^$aW88W9M9zNE<H|>jv9+RyHI_l6?@0bd}WC!^J~^t?L@T$I|r9kS0-;c9@{>pt#)lETorVb1gw\
-G~=Dg@Pj$S`~LI+u)2R7=Zm*jGjt^bLiG-5k{u<N!c&eY2`m6;V5)JvPb%$u^}V^f#XRHv%m+|jt\
-95|l$3NYTd=o2b5R85uRG=6vQXX{Gk1Q5Gx|+eRvxY^Jh03PR6MlK>BuBO)rV4XGv6(L3pVj=M1z\
-N;BXMEpL1KmD+txo@T4j1<~f3#T&s{=Ry`?E|YiTdvYH%pXmJ-yOg>Y<x_O7O$|jm4IDdTX--FGG\
-4f^7r5=a84<7+YufkUgMS>MZv$vKp1x&QXTyf^O@6!bzu2pqcd!;%?G{PB~ynS3)zBua(JCGv7nX\
-0yj4Z=h*v?EEg!EzFf(%e6JbsV=%x{Zm))VpCIx4Nru<SO$QII$fn%-nkE;r#I@ad96z|5vNMChX\
-MFzM2T`!d^4(u|aha|MH{Q!C#x4mc$mYymnGVt8Zf`6k`IF&4pBKQ>}~m7;Ed{G7;`XK5yPvW5I~\
-NN<PJgDjhWm7#fbSCmDJVLCjbCx_~*&N(UIe92tO)RG!V}OuGBnG8GvrD@NPBh>M?0nbjL8vL#Hj\
-aA=%`@vS0EMTm}8({Nxcsan}e4(xIxSe*K2aCs6`$FwYxF?qfnwuVTioKNJ_pfY6&Wwu1Z-9)MHR\
-Ah1I_G)c(cd4UjJyqq2hnni`s#WtrSNUu>nkSFg8G1mGm5>>YGL5@YVL)TYsm6o>Cl1|2W6&!`Jv\
-3NKB?f8PfQ6YXC2)EtNt26BToZ`i5#sP#qG7q4@!`ljAE_q#qJ4|h=&~%GJ?w&VLXK7KWNI43`j)\
-6sDlJE8OejVLXHRTdHcnx(E~0(MX|-TS@_O-fC<Pvmr77KCH`P6tv{4MqVkb{8iaY%O?_IC&?V{+\
-e;<f0mv6dz;bsc8R)rjpjNfQd%%Iy1al_*cXSw2;Qu1}i!LUqk*{Cfg*rbVPt$C?1+S+Cg8WyMWL\
-lC-QNNliiDss~2khqYSN(Gc{DE_cd=Y2Oc@m?{-ySvUTYQC+0tbh)o$BU8^DNw@el+|!KQKe^WPJ\
-A?{Yb$e2_f@Wn)unOqIgqST*y(qP7zyctum1YA#F{?nemVjf*T+GP=Fy<6bvgn=#eYjOlAC^|uwo\
-h^oA~s69p_^0Eb2le<ehHa#Y+MKzihbJ}lzJy^lu|8|<2km6sx#~L@vZ5WrfOm$c`c&#_)rrSl|F\
-eqEebZ%9_BjUTYH+9tp5H)qWN2KF0A-&bQjI9%*EX>AY$%3Bq5)vP_6vgY5Q1<!j$H;)b?bem`Kt\
-H=jfCLsyriCFIML{1t%D7Kpwbav6!W)-$p)BP@;!ztm%}rbyK-Q0~;)#(ptmKjY;ix6W7)}*pTnw\
-xCpe=O>do_JaqT%3R)GEG<SULR~??0tfXo+PdkI#PalOekK&nflnn{mPW5><sU++=ralM};x^UVq\
-H$j**wE;>zWm2dnFZ*{JgHXB3A^nqXPWBKssn1i#xSyeOKIy}jl!C-qp-43wA;Pde#fdd(1JhRg|\
-fP|n9AqKSU6=p`!4Xqg2h4#LYWxB5!H=ZBN<E7taoC1*leSp_C4n6*WaU!JwvkOX5$_^C0KCkxDB\
-&Jl7*2xUB|gpj#_VeU+-W`#LYx>QXk2T&w6my$Ra;ZCI1jBCs&V$*2?G9C$+)K%hjj?I(jEK8n0t\
-{K`Gk)Gf_znOEQC;X#v$*Xae<5^UDRRBgbWVge7J4YdxzyvZHMCP-?eky5sCOx*r5o7Uxsx6ADpk\
-+I%`e6y0(nM;?uBPGsS$;E-xnY1MTI{*8sMYjh_}cs4DF^a*Cj`%PSPl4Z7R4iIGGB9zg}3{_Sky\
-c<YYjcmWc-AT#Ok|bdt<&dAI4y{_H5|Ljn<P((Jt&Rp<O6nX}NQP4hRN$^PlP9t&Gf0Hk&<Kr0O0\
-&3Po}0lIE7AIRl{C9%Ir$t~Ul2p-Mf3c0u3;EyknOJTr)@5>L(|bTWx({Q#!zUHRd`U;nisULPEE\
-dbWlpZP<GCshyeP8yb7fq=!zlH=^es>g1X<5{HSTIlfvv0SI(i+GMyI}8^|tq^nCZO->sO?N+a!A\
-3ZNbv*QW{=@GU%llH)W0*n{W&D7v1<N^(N|Wi_BFAr%_{I>|ozMc{%;`%b>ES^(Y1xgKBW?(rR#a\
-E?sO(rYBhAC6?^HaDsIm?6h+I$I^OTs<CTA>R9<ibJXNAw#<$!6GLW}ETV=0orI2*i8iYx^3Hc(a\
-K%tA!m;6W+OSWUC7n;AeXFT6qkF%82n{?L?_f1JFgB$WBxB}_GOy^Ad7-{^c%(Q;-mMQ54=qELs#\
-(<$VJd#wZ*!@jxw+Js(e~T4AQ|g;qV*+qYOW{_IoG;Y!JGQAtCLhsjW5i^$vn)(>Fyk-?5WWNBbP\
-8nXO3vGCyH%0axSSl%wuR(N2rmd8g)tO(PgO11=Nq+rp&KcjtTMF6{0qgVaqKV$rYo*%*C`gW6D6\
-yX$e5JXl+2S&tD_%2xkJyQliaTIjx=~=Q`D)+LbHI#ww!Lrdo1Da@E35rc6v5h2K6;nYv@><h7@F\
-k#C)=4vbI;Q_><wi+0$o;IPn9W^6VUi-I_ta)-YVD*?{VB-%QWrB0=#>JuiyEIc8>kom>Dwlkxth\
-}E1enj#=c0@0W~@HfZ|Ni&s2NDa|nGqu85O>jXnUZ74g)~%!oj#JjI+m;GSt#uPURGdd`l+&DA;h\
-~RmjCpFi`>C)l5!0INmZknBo!LS@#fm$*$}u!)(~7hU@q`JGbyRbUx>+`ni)5o%&B;bRVsaTxEh8\
-Ys$mPlHj#gz=yBJBZ->gZ)N6ci>VhXoB4}J1T2E+%SkP}#Y!)5uEv_eL2syvdTbd%0bHPjLS7l2I\
-x=pJVMbjphn)`5>@;~0s^>x<jx+Zcj2&V<f3V|(_o>I>tbE_+cJ{Br+5#pqN)7pSYr?(8G-RX0+x\
-B!0>JS!Bk&p9M?bSg{Ea&8_?VBBMxB_ru0M3c2gJIZ+A&S~Y^mIi>@(CQ-n{gNsvA_(9t4)li7a=\
-7U9q4`xAspaeC=XL<@1fyq*ekq5<|<(%tVOR&CJbgGanY13Ap%v!iwf47VaVlE~kZ+YoD|GL_L%~\
-xyQHmg<BX1!|KtXEB&yVkspbdtrYt&)oCTypJzSVh&St3?jdqG+_2Y<j)oe5Ur&A|j)@iq+Is_oQ\
-Wm73kEf$h3Gn6|Pe9x1l5iu+PU{88OMQoUBEqFI^*Q@PxQ8NN7|;=>w8uszLsk*Yxu$)!K8>X=V|\
-HYYcW68V2ZrjIgRVthbS}(gItGZl-y=KXMtW^slPsP9UlZ`yGuuEvRKE{-n=MzezP+!3H=>I_p>9\
-T^HlVTw+?qMWq$+eK-YO`OlfVaK2+Deb2?=ShUb4fFKFam=lhxA%w}{-qAYeQIAW^#!bUKF^g0~n\
-Jmje?UeM_5<7J1Yg!A1Wy+MDc{J4@q@l2cAGM^>Er(q9Hr0b$lKw<>BeYeWI~Hni+JhSGZM+Rhe!\
-`X*HbffqvZOuU)6TTMmSYj%v+96aAD!7u)Dw4QF=}kt%CVkNaRcqOF;QowK2c}c2Cr|0Qt3!;o%X\
-5e1|2nBxrC8<7*PsYNGs|rE16cO99OHLu(bj0Ni#zZbm>`QV@ACsf*92gMh(SG$D@);XV6QYvg;e\
-*9A=Nx#V7;xfyNF7t)hQCmh@E_qEplQ3{9Mz>gnn^JX%sVk=W$YeEJ2|>WB1Rz!RAuwr69*pr%so\
-X?dykgio<v2h&N&@h658*`IULrIT4j?N@b(QX`2DU8<;)wraI!N`*VUpf1&t$FMPlRr9Ec8`kWqn\
-U-K&dv-n|i!QurUtM^$O4bJVtbHZxR;mkB)Nan&$&^)2hR9}?GnXQpoCIa6y<Q2EetfFlQ)NT@D>\
-niY+Mgt4up=r^<j1{+q{NL<dsk`d!z7cdm!2b;Ds4LT+T_=!rwYAEs}(yeS$GC^;)Lk}>|NZ}qo7\
-Hvae1=C+}h%l(%sjo+2V9drFM878az8SmDC#z4`$<|ef8_fYV8fQ_BPW;ZVZo0{$-eWp=(VWY|pN\
-C$5tS^+udW+Z^hW=!=p=xk0IrkS+UDp=JjR7yuOKAR>!8doS&M1iDHrYY%OK6{}rv(p^w-G=M<v>\
->^?|9^$Qxp>o1B9CgY8AU|~x$U?Qbdl5FE8F$Km)&_{7?aoM^JY`pB|j=BMr7h9!TbptmIT~6Au7\
-u+<N^nYUqy4M6Ev>UT36OA-#oE#hmCSRS(;<&4x>A#G8UCVO$jXcwGBBKrV0SD#vg*NrdxsnRkk~\
-YJgiYY^vb<w1bTi(k_E8Sts`SaP~cH?MHV3l>?-yCQ+3s|FYb<=vh?sXfLFk3OH>P_PH5kyL$dfh\
-_QWvw#zJ@1e*Y!Nvyw_<T0RFNpqP7}nhPH0&M+OiC~BQ4I+!)&UGSZCo$_Dgy>B4&~)HB~Gmhii{\
-YdfS6_LJxJ1jA~>aT!v(VH=MQh4*GAvp%FNFMsl@9j@!OE?b<o^9d*QXDsS0Tdc)O;SgSdhs6?wF\
-ttxpUW5<^WVA}8)5g1W(D+^Ma%S&RyTci$TOoQE{sq3}ynsG}23(u-j^{g5`oQpJOW6zKYT<<cdw\
-F<^Pg8dX2qFaBpWkSwkb2Uv$F42fp&*vufu22@4&PyUAs?R(tMoci3D`pc(-gB&b5ofGW??KgpTO\
-V#t4IHmds{#gI2bu<SrK3wHJfH9NFDl=TD$3_PHqi{CQpzzO>=i>*@%ns8T~~=1bd@^Swy$T%za7\
-Q<bCwl_g7v5<6!TYduCJ0>VLfpN?2ITz_Gb!3JO;W1PV}#TTd`POJR!JAuC%_Xbw(*C?@ehbug(!\
-MO@3BN{O7RtTfR_9wUA+GDV7SwRH?Gs01b>}vV(_Y2B)z9qT+u_%i!ufxfuUhDe=FIrb=aUOY|Qq\
-`CBQKP0$13w_>(3rG;|MrqEwoh6?aYIhCB!Qc0~M|4Fur3^}?$eY;ayQp0MxlpuT0@L);*FLIk?Q\
-cbN&ri!!*5RG-PtE!1oDY2SgL;IcFJdw+g%afb&`|~Rgl*?0EXgx2Ybxx`IpWVp6o0ET=;lI~5<D\
-YYd<F^q0yG1zvu4epmAL00E!hg>v|8Dr`qk?w+`eyv|sQvMI;{9Xf->nSyZ$A+KJoZHXb2|CA$#D\
-K`_}NGPooYD$+$-_V!(M1Y_iGaF|2gvSM~3IW`^;waGq@#w{$}ClF!}dG!}(J#XhuKppQ1niRLT3\
-VgllW(->;nqKi_VWkDvDbUxmLd(7xYA&FJU6lz#qf$@yQ0G1;v8L{rhv-5kFE>B9MQ;XLi<xt;j<\
-8N$zR3g`c{b1M2dV~YLxmk8(I4(Dk<PjR^a4}|mQoiP>t9J;<qdcOA0kA(BrwoXSsw{aN1>*4(B{\
-Fyf${aibBitYV>DV)Eyb2|F@(BAg<ze70xl%eV9=TYa|%a8kn^Y40ZI{LZe7WVgln*6)1Vb-nLos\
-Z<2Z8k&mRJ_0T^HuWic82q>fb*|_^S5v~{~h>t+WBkY{IziYQ%(B%HJ+z^hYR5StIxj&JpXq5=PH\
-N$H#gz)r_6<!G=u+qbWi*9w-U~OYCb%-!haqw++W-ewr}Fs($1f^fS)%nC?7vje$ImX2LxO@{~(L\
-=jX#?u`&tpsU;7RI-@C(H6Xn;(jALi`XZG#<{QEnaZJ&R8i}PQ6hu>+BCj0j<xBNfM67Iw'''
+c-ri}1zc3k_c**X3Mef$B?t!W(k7B3AZeouEDNlpG$tr2Dt2Q$U}9sTVqtf8qhfc9BEGXb=fckAt\
+^%Up|EoVg&w1wVVRr7!nVECWoS1FED(WE5iWCI%!uh-ieq4O}_?S`79xl>SQZg*~C&TK(l0v2Zc#\
+N_Ke42$kRR!T}SxV^t%~{Pvb!AzS|0#ZxCQ6nnE`;BcgEz7m%B|MYL@E9~(fjP>pfhB7;{b~&#lI\
+&UL8b~GM`m-f+-`{L6&aG>lZNl*!T0i-lV!0KizpT0>#_iO(0zKT%OXqq_l`n6dP#N9P^`Z2pWlO\
+oklMV@oBEz3rXRh$Xuu*$>U}=wd-AO6{{wQeeBphP<{<_8OO;Y$<5Yz;<Jz;Aa9)aJ#a4~*Sra}B\
+|E^`d^=$KA2D^0c-8#MHR=2i$t|T=V)>A+geTC~8feM1wiYxS7q->qjnklX>8lB_lw9406wW#5Km\
+ILdgi6zUs7fVjco5c#A>T_Oo;&Ey9fN+21Zpj>Tmi%ZbUFiuq+4fRWqghQxvo!6c`ilA?rIwacKP\
+`=?%+gMCVM(R4a`wsUewS8NXm$L_zWOo~Ht9Jz>B?!bOceEuR;2CkA#b0fZyzhWJ72%q?AXzPdaP\
+-B(+nI`bF4b52FmL-Fwd2)Uu-Y$z>-oJ?PO@*e7ExwsnWCy96^?2-jtmBsw`b!8EKX`OIFI>o+Yc\
+QXxO?#innY3B8@be>Gsk(#YzVCSbFKLrIn3lUQ!IqIchjIZ3bs_py8T!zO3cy0fQUs$Yf|0W$LO*\
+@6VC7XDR4ScQ0zDEUnnaaGI+W%Z_EK*_|aXn`R&GpkCs_%5adjoW6vmp`%)_L7;A+{WKXV_4Gjfq\
+BN-@7b$sGc&wT|OFB)s%<SD*(|r!A%hb~=wohk`wpWqWZ5tx3!%9nI$xEe3OS5F9S;aCAsOuAEjA\
+kX&mt{3=t}3skm_9aZl~i+IOI_K9$ERiH9A!QBvu77KW8Je&F_DsD#VWE?)0RzNsjBND+q!Rkr+d\
+<>K5dGmPpV3%Pe8AgO|{PusM$AA=S({&pQke~+}>cEu1g3<T1{S6+MyX*HBxAX?4{GBS))BNSyDw\
+?6!qHs9+8$((zTbBWzCby8LRE2)|+LV&N>#Zs~;}KGM5_Lnk7}gnZ0+KtZz}8bDFli466}a*GJwm\
+O6i8%GO09{t}0tIqpMzzeFCX;T^VUrX_lp`rNjC3;<Tcb(z&u~tfFQoG7JoLv+`SI7$){m&Cs`R8\
+lh@iPf^j{u%4o>zMF2_(M@EFLOh(J^Xlt7metc}*v&92Fe5!K(4YyTtkVS6Sl!%=(XvhlTK^}b&2\
+rk6sS_eQMv+y|UMG;<T323m&S*I`-R`W<(jJQXR#MXXvaDQ>Cd;Jeu~;6nR;d~~IR(AgVK1Yqo+T\
+}tmWGyd2gO5)@|!(Jn<_|8bjt0Z*9&bNRq2BUvsCBhggdhw6uYJM$W*qMR#t%x-&vKVs>||YNjca\
+{Wy(%U?=ad>H}@^ePb;#oZgW;<N?r!5p29roo~jPZoO0VYR<yU&)V9!N$>*yovqGd)>#<aI!u_3f\
+{ac+pP(MwVrEH#-ljf}Go|dMoqS{tlN@}w%E1ku1aOoyxui3sqU*DXxw4<!CS@!9HwmR3Pibh-L=\
+t?UhLMyV;Cp&S*&uztO-QE7Il#03eJQY?0c{#NB$LiZplgk`zuhB!1RX^uwrY>62vWoNT>CIBKuU\
+}8MNIk8UuDX`W3^la*O{Mnfvby;i$}SZ00zcp(eGmxua6bh75ez^OfM5^;F4PG`5R8C_fKTIbVF&\
+~W1|x_>5RG66f;a>T2oj-Q5|qhMrXWa#=V4F|M=%n>7z7yz#sPl3kXIs@2%je*$U-m$!E^*O5X=_\
+q(;NhI#Xh4Y!I}@x3lJ<quoyo72W1X|Tm;JztU$0*C=U><MX(OR1_b#CHbVW)2(}1iHG%>fO|}VT\
+D}o*HxsdkvT~O{3%3gThhhRTEQ)2ueg2M=oz~`d~jw3h$pHCq;i{KoB3xK<X;4(a4MQ{zlZLxP3B\
+e;v81U^4R@C3ng1TPW1Lhu&BI|LsPd_qu);0uDU2+H7l->C+r$gxR_eU?GbvhY~}%6h1*k3a=JH$\
+Y`W1gZ$s5ojRLLZA(QZ;Z-j2%00%1)L$2MyND~=hmn+MbHL8d$B&4p=UM%3&2^T(njp>cIdeSf{q\
+Bf0^S~#-4Hk+a75sO0LcZG8-gAP+!1(+wb2tjdn53r(V`c8?vKg<1OpLp5d<L!K@cidUx1z?5JVz\
+~Mi7f&2!aFziBK;I%4AfgAV@_p3~(b+ISN5Kd>(_!3<P80^Egyy!t(?uC!ul*f~oL%CX{nfIS-!a\
+)5esIJ}*SD81Vn0G6$ZQqH;NcJOpbHtV6H?LB3cU8`1M71e+0TL9kWqZw2Ui8-nc!3IV@U?C-nK^\
+KSUO7nMZ__9Hle;4t8ipz<h!;|NY5IE~;ef^!JYL!Aq#yolfug3Ac5BDjg*HiEkd?jtBc@DRZx1d\
+kCsf$u&;<#Tv`fy&ni-XM4@*3b9o`2&Jafct{VG6dhKIzo|*KpONt87SpYseqs!0wn~>fNzLOHR;\
+Os)zPyi0xbmE2y_rMktXM<DSQ@+|CVBZ(}QONR2qrljnQ*!1g3y%i^_Hg%n+E1)nmi6g&58fJzI-\
+?wu9%6P<Dc{Gb+0xut$KDAeJKnCj>4CToH6f&_k>pcl7LupeF(^1l|aI;P1Yu^heMOL2m?o5DY*N\
+fM6hkK?t}A0uk^KgdpI<cSBJbh9De)0C0m*8G#^L?ENwD9E-{!2;vYVAV@@z1b<70awwF;Q8_}aj\
+gjbi6nsuc<!E>wgUYc8#=+-IR8D~BiKxs%Fcrac1TzuLLNFV_Tm;$D%;${-2)_vawiuPU2$mvPE_\
+N<j4bN*(xelJ!i?z1_J#T`~TTxj6&)cCaMCC4c-XlDaAlQfC0D>c8?HotXClQ=Na2mlG1ZNSPM{o\
+(jWdv6cTtjeO?0YxGo^PS&+X(I;C`ND>!94^e2p&Mahp2pn;4yrDg36}|Uc%>BsC<p!4T84_-U0q\
+SDnB9k44+F;NgdbAQTZK#3>>uNpj1F*eFRD}m3>r3&kYc$BhWygDfTyQnW}Tt2yl&|Y=X+B@Z4Oi\
+ehYZkMWsFh1NdwRr4f{^p)`fE4eg!n&}TLR3j|gOY!TQY=zyRzg04{C0hNvjoW;KHik`b8=z+i!f\
+foWl_<Ju@_D0YLK|jFt7yE7?dJaMmjDUxLk02C57y<!;!3ZLtek7DpP)0);i^@27PDW)4f>Z><5D\
+Z5!0>MZGX$aC0j6slrU@U@h2*8}f%0%TvhPjx8a8m$36_wKw%s?<3!5qNPMdf@1+3<M*Di<PHgdi\
+8eQUuEoEJv^s>g1tv6@t|W)*@JsARoad`1@ukx1zED!8Qcj5$r%vh+q$beF*j=I0$tQqw*+%WAOP\
+nDo-Lfjo=)D^MJpA%1bhmZ4y`EZ`V+H9l;F*Hxb-Ia2x)12bIML?jk5b@BqO>1dkCsLGTp8a|Evt\
+yhiXw?0xUh^Lqpz0rwfoQdE9{=dY;zhTyx5=xEB4L4XdT=*W%s7lMWe)DWm6&;a9$CX`xYhPOuOS\
+%+qbYl1#EMbHdEa|A79g(qZ?d8jl*&<cSO;EYk(8i5G{Qv_`hv_sHdtX(toY>t3~z!HHq?VUF0vn\
+>KUz;}SMBPu(?a~D+FBXC6Ef}p!t8*cF214<9Ezx71VK0^Bq0)GU(;ctCW*`L;r0qFBU1Y86`2!a\
+uWA{dMy0znjlXaq3`;t(VtNJNkV?W96E43)zXq#;O0FdFa~P>zQ(llK0J@Hq>WQxHr;FcZNXz|TY\
+Fd;|;O^M6q0qH+m>r3jWISV3zy4}D&ZU@hR+p>jPuZ$#y01Y6+qR#X-s*p6Taf?a^$4ds4R9zbvy\
+!4U+<5FAHv0{(td?A>S3^H~Jv0e1nF7ZF@Sa2aq{P<b7}O$4_Q6eGBc;6D7l1eH%2jKwbz?iJu)G\
+yMGx;NGJ09Xx-c)%%J*mmw&ZtuQRJq);gX&vK|#fM-Qi)<>X>pdkV^1R4l55okf3MyMP=IeL8d`-\
+v+?mP~X}Pd0CMH+({}oOiMFg@D=5UMRm?Bv60T=lffw3n3nJ+8ujT?}Xmzvk9Y2CS@nxh}6(yeJB\
+*zEI97_;oj_TrGduV2Zos+iC3Lmyno1L<D*w6@ZO!(`Z8H{Alo<7X;w<k;77ZMTvEIcGkQgCfmX|\
+duO`T-?|5o`>V5i}Z_b<r^UPODaXW5M3+botr?Dz$>VV!kWrjPm74$avFS_@ld#4xko;+)MVtprr\
+@k=);>pz;Ix_A5O`X$}IA8QpbeXRG^DRQoEOM9jDe!z~tu*1EiXYs?Fy;_-iKE_*i7qS;#iA&L2Z\
+?~b_(7a90I67^I)iYdB=4v8!ziI2DIf-pc^fpZ~%RbCsw<5QbTk?*%+l)h^-R4ca7_fPCYUk_a-1\
+Sy{6Pv5v*%jp4&2|A>UwZEK?><p2jW3Q{$<134-az%H@q+z4*$;*L)|@im&`|ShX`_a{LJg8v?wZ\
+_2-eb<Uxa1DKl9irxwY~iM=#w{Q_EVC*2W(Y)`aP)Z=&U_MdS^O4T3(<v-?{aZse8;EqRtJ~vwCa\
+Jx0n~OdQz@j`OC6ER`U28V>)~=>*V)h{^^$k?sq*m!F%hQrB;ty%4~?(I>Rjem0aWG!pW}(v>7>Z\
+YWjgoelZ^`jttt_a>S>`<4)x+W37nWqA<Ua+-TkK`$m2CY!CW&KSpETe@D2V9J=YY@GP48x^I8`M\
+okr-_>{VzfBiZ`eTWy=b@uoEKD(bE@0GLS!=Oal0Hwg|R%qOg#s?ISzn?O-V|wQ>vmLJ<MmA90;%\
+=Czm0)QUVAm?(d)cuDiuVl*=AD)+Qt(#QEVl7g$;$o~cjU^=E|*QY*9Rt8KT9w33W_{&s?E&~5sl\
+fSGP;gpkJz@P%cS;KK1c^FP8)jB;)=p6<&CL%^-gc?v@~E@Z}y^Lo^Dn%-<=InihA9zVb}%jX$L)\
+%r@R=Kp`xNSmlwTzSa&B+^SnNqIo1oL+qsASH|1uUX4%S<CcAc?@3Y>8*SFQxsUE5+Df{Bz7p`m7\
+)kJ2-5yP*0)8AkImeDB6FDG$Bsl}0(=NGnoB+oW$IIlsYlBeYt^BX89Eq}s`?Vhgi<+YmKAZM)tE\
+jMlN-nQ?q?DU^=YCG@Pxhee}_1k3~ocj9d^lL8DFO+(}ZJv1Nj@>~miwWvOtY&o1XnUqtPHLc1;J\
+!~vg_q6Z^6mBZPu@FjZrTu!K?fIiMr+njugNmmIhyX{%-AN83wCIZTiJGTiuJQbX58zXV(HF$`e*\
+gHlP_HFXP|oG`uc{$dz|0e$zyA3o_ofnhob^|Z!{Z`dOkP*zud1WYn~hWt~}v%P32)rt-X$8*L#=\
+sUcigq5W29DUcrH77fzYZ?=9`8-X}=5NyPb(GhGb!Uho{IuVlMiPx{oo&ILLa-Un=(H*{vR&06a&\
+8k)dLd0!ab?9mOUn<}bZvwFPWvam36`AbvHuJ@Y;cRHB<{z0q!1Gir}6x)r=&A)gdx^)M~<uC5~c\
+Uu(g)O}Us_pVuA4o%8RTI&8n$-l*-ag7VKzDG@da-uxE{NZzD1FrhLuWjdCbNRlmBz?ew*As*Hnu\
+ji2HfX2bhW1HvhbLvpwa_l^W7&J~eVff=)6Z>>ZF_KB_o<6K#^x8N&agI~@ice0;o1v*^qO2Y%3Y\
+^0l=ZaPcbNf;R(zS(XX47XFQUKonm%k$Ot7t7W-A>R`;KoGJlhl4d!vfL;z)49%Dz{xby^XVo_gN\
+STjgb^5o?~WILg!TRhb<Zw)x@dzP1+}OV$lB+1AGJ;K_KU1O1#&`AuludenjUPHRfg_lB*~lRmm~\
+sKFwcVIw_1skS(y;~MaV6L#WkthDm@Vinbrx2Bp}O$>^zZ*j3GKh@#Ls7FnM&z>LDr03Q%JN0&@O\
+_-8C*67<Kt7qC*qg&5q*%>YEba2rf#U0OAb=%rW@9>6`YZ6)310!dqY<=!GYDBhWutE0^`5{pr<=\
+Y;}kKVm7F=5Q@_{QJa+J#e6@1&0K@3hEGql<?3?YkXM*o|y+P43w)r=zFCSrG!?2jBC8O3ON&-`e\
+%IV}}E-J9x&rxx;qedUyM5d5fM=7Do>7IBeVUR4I$3p^0~P=nwgpUD!Zrd*X!!oh~?P6|~+nN$#4\
+<m)0jOEEWqMv7RpedNgOD$&waB2g=zun>VBP`feMq<(s{>`Jl4!iDsadQod{`XMo-A0pUrTTaOt#\
+M{3u7Gw1RALxq#<9vobEeEgL0KG}h{<qoNj4`UzEZE~e-);-^$){m#{IJ5Is>AbYg&#j&*tbBXTH\
+YXxvx6i!rof;-O>f6V7K5^dKsoB|H8v~DTIJt4xg|mvArsU7Ijw=7kHl5Jd)xj$J`ReC4WL978HS\
+bR5osWHa*ZMaJcUTs8m)CaWhS75;om@0CNDz3cqpQvG$vzHq$J%za)-L?Cs?+3)Np}rS&R5PzUmZ\
+5|V3^Olpu1n*`b@d%AF|T)pqf<2q+7k420y9q%L|AY6%}RI>WOqXhy6hB#gH3o`}v()nYq^cyU$q\
+{^-tScNyX+#k1~lqQSX{d?54rWoBPKts=pxi{p;-Q`a35yI(y*g$+PF$jm!)E++b$McT$<&ys7sT\
+3fr3uIicHR3p+k_euvC+a-+IVo;}j~amuoY5UZReMKeu?J9eKtd>Qv*uZ{b++HPE(y(nQ|arubo`\
+>l#@yk7lWu0{Xm3Qj|VEp@)O{gB*Xl9^KM@Q_A*y>HD85=7kJRd!;;;1%lWkI#N;ADDH=HMvLn&C\
+=02Mo~Q*4;h{?Vzu_x68Y&)yBBPm-f}?G;7fzXrS}_paoc7~{^Uk4^cA{Tk7_m7dE%E_1!oIx<$r\
+BC_G!S`vzL8j_GjN2$C-Kh+s?z~@vc`mZTiKu8f~y}RJ}x7Uhcc>ZaV|Ao}c{KqvtY(J1WmsJu19\
+>V|r7^^zscdn>DwMJg{lym_^IA3h$njoxMhJUa_v~CW{tIQ6VioVun7Fk2Ic~dGFOamD8bDI-asm\
+2r*ndCbv(yOrh<@Yw|lDjPE~vil*r)#Zcp&YK?b$Pv2tFdXMMh=V5wVo*irXEX;e|qg`dX<2IXie\
+9`m5ot7OPyc(T|8maN}pv;z}gZ)swa;}QZi*~o0UKnqk5X3uK_|}#`xn5X5`HyWiS*ODuZSa(3Px\
+6*CP>Po~Rh}g?-A5+(yOr_2nC_nvyM`Wo8E|$?Oa0vL>&9f19WRgnq<?OVROY@r?_X*PPJJEU>2B\
+cC=~tiazSW?=()Xpj++`gUf&`BqoZjAPm#*<TtGH*kS7{a6j@Gqyi+kpxlT~7Ir|GTZQ96xpKF++\
+N<~)B%{`7F(I<Jy;N@XJ&%zk+OZL<@Jo%iiO5;InNUGx!d()aC~XD?rKbVhi})^1}qKW%m~KIrYX\
+W8Gh#Sl9CDwsA|Y-^(p+WRekFKj(SO<*p5yDqK4_>#Rl8#tE)ZVrOct2|YZ<L@{G->CA@x!d~mo;\
+k<6Mv*WSg;87VbUiF^2@k~jd*!=8ow=52O`6Ntzqc);*rlYgjsn#YJdlY3EeCD^4S{Z)nuF9O#Ga\
+Zw|zpVD|_`p4)pM2*l?Kg~eoo?Ztp*Lg1_+7S2EceZqE@+$IfAyZF7W}wqvvgd{=VdQK&8Fz5?(>\
+Ujzch0D{-&>Y-x{G5Bv9(JtE_AEBhUIHdW@gdd$E&jPh;ir`7M`RSSfd_^UCh)9T#oS8ntSz=JKz\
+3UIPw|GVAduAbb1S&RnITo%i|Vg-pKY^mOrB)xD1wYJ7V8B|0QaZ_Jh4utOs{8Vm|JyX1m=r+~$B\
+nf*JI#}8OEWx%E>S&4SdOfs_f6{$7aFkoxXK?U6W-3?u@yp(>hTsPT-ZN9UkzfSW9x7?(&8+;l(e\
+4=@0_rqG8hjSD1v*&8giJri<&uN=b-eKb^&9VC$8@IZ6vB9TYWxci6X3R5j-}J%a<fo`^pYD!dY<\
+zOYeAelvPwFY$Pj*Ne;c3u{SI|*$pw|7U=L_UdFUoNru&Zp7z0s{z-=11+H`sJEs$ut!<8608a}n\
+5a?>cOGv3QvFAXAe?V?JN(%)NguD=qJOU-_A9LngmJH-7Pm@59P6t+xzs+tkBo$NWd1UTE%p+(xn\
+EirZVbD~r#$xg0u_s;8>(Wg0&?;B4FQm0?%kp43{<r9A#!hRpWhHGX4#I`w>SY88Hee&L0e-#u)P\
+6$Eq`xm&CCnEkWAUv<zkU*Xqcr2fIT1^w6bll^ksva`G5cZ=nNr|O=Yt25O;<(lW+*^X!A-kt8ca\
+I!`7LjR^yT^q_MZh9w^a%fywQABT>Mn<Yv`VJc86WifpiCTinF~|I`dzLnTHfG*a!IMt=O86Wv<9\
+zkY$)?$F69Y|`_P(t={)T6aXFHY7ry?vr4%;oaR%^)8c4ZHi9neS`Vs7`UAmZ}ljjH{p{#V%XvD7\
+oGxaCRrit^o+blZj-CBDD1NMoelvk&(-WN*Jv*w?4W{#Ef`{9h*S4fs+zHzGG!IU(@Md%^1sU9A<\
+?TCZw)Khr|+<aS^AWTzL8qFQ<weVX;5yiszBPUyw<L(UAd92S+t8{TAPqI-7Fk$qiTb(+@l)Zp98\
+68aUqX=AqY$lm#$=i?6zYrkB2R`a5j>u$VCu9w*KV2I^~t_z2KoE#)5YIbz$^p<Z=^wm!AJmr`_u\
+4(SvfcNTx)5Y(WPgPy@cA|ZF$47ULrrO*xcv+gcSG~7WXYQI8o%U_~boWx@q5ln<e@}V*E|1f(&X\
+&`xN(>&%UX^-c**KF``4PtsF0eE!b%^Qx{no~n?aD%ysqx-~#XMl|jJRx~wOaSw(!!2B^Khe>#{A\
+)Zd&ZbY3rfv0H(Bco?pl_%Ue?Kd^u3l#Z60sPp4oH%szHyJ>f33yR@`zR;7h&7VP7+PaoT+-Ro>F\
+eYe%Nfgr-Va58j2zIOlEr(kE;8j+WE9C3KayeOh$q^42yD3tFkIE?pJb^Yq!Ekpot`^bQTkIQ*Zk\
+?fe547kaHoF1yD*p&c;ij`I?a-JL_t%r<X4+iLZp4okb3YNT7rE0}Z%8Tv6`VcV<Y8n^1)&sF2y#\
+)yx`B}Y>gFPkq<RQ(iqA@8`s{O+B(X{9TkUg<lm{N=jRq5dlE3%w>k_3bzEzd=?@H^`I;g57tVHq\
+qJ3Z+s$q+}iNQrjJkNt6h%R(5!FNCEu&oGY_}@-1)#lMUVYi5fO=AON0I7cWj6%HIp?T^eiF|(IH\
+(rxuc4Ec>L1|cV#~;ZE`Kru=l*rtCD@)>$x88+fuXN@%b}s*GP{|+UD)Lz1<c4rwVeeQ<b*Lx8ME\
+g!J-Dmjrw^Ui(S*nG5<sU7VB+tXY)>nEjjZfw&&@3O8HHjS!C|~<fA-(WA3ZhWBB|%hn5G7*_gG0\
+HDh4(i7?xx3#XVyTxM-~Fy_Dh+3hZ@yw+{se_=)s985JP7pXLOvwPpFse1x1uIt`Pkm9k;uKD%My\
+p8fxMr*7)Zm>6U^Tr3|sb9*Zv{iWj`TBo3Z=xgjHm$U8R`WX=7USh6=k9AcDL?j+R-dcZPxPXO#x\
+GcvQ?_}#-qONm#=S0YFwUR*an9Cn)*p81Y0Wd;F#nU?mEHUEi+GKj3^DAz@m0*ap_><<Ypk$Nr)&\
+SSEne6==4bdFP4)R=Z$4{+wC8~K6Bc;L)HhrkZ<=uoeSh1F#e=MSE05=e9hxcsvd=obRu*fwvn;%\
+MS!S8npL<S=*XcEo?e%5u>Glzq8(zBUIkG&;{oUxbM_Vjfb>N7t&n~HDVMgb#J|C4OH_)j5@Xdnd\
+=KI5yZ+$jv#`Rm@`t#BaO^3F>(QjozfzD&=XYBp^R&Dlq$?|;nqVV~$+%3VeEAH;_-ezZX&+A~X=\
+_x}R%~*U@+3lWb&X*yt^roy)d2nmYvt_P@-{r!mkC=Wt(`oU}NA@noo~Ms5U)4qB%uVZkJx905Rm\
+-39yz9;S7JE14O)==(EQ7Ou>xnI~kGe(L-_~irqUGlQ5bcVFJ<c`M-t;;DTa-!uy-oLWPQ6vzGi`\
+O@w#Da?48o2%ZZgq$t>&|J=<XqoR?-^vlP<Lwa%kD7p1t<*Ee=j;+;e@3H2=ug7MXoB?(J=M;->Y\
+HK1Wkyn;kb;#F?;Q<@2CslNIV4etxrfP{#vT^ml}wow>Nk>r6if6P*^vSKP~;mHPSea{KoxLoeLC\
+5_P!W-TOwzLX`SREgLq&c!JfNQvLO^nRk7BC%1diMa%2%XR~XY<M`67hW#Vln<=Fh8}y#0EwgZNd\
+VJ6#j$u*PrS32HYn`gUR=+&%^%=8)m%Bar)W<*dutKo)trat;Hr)PP?~2*%6!!<~l?R@`m+7=OEp\
+FO`63^4EhHsoP-$b@_lX^d`g;&NL*>Gsa%{JR)2b7;^SI=f{u5V)Cg#F*LGS_royRFTb#}l7~>AG\
+Lx4C{GS-fMWm*lu6e8%>TV7*k-PF)Km+lZCd=)=i(XBbG<A2C3OEDXgCwW-QaI*|j6`j*DigeJ|*\
+1{PgQ~MTg~u9|DaRt{CpTX7=FGn{<yGG*P%$aFRc3rE7~7Ee9mnHk|KbqGN17e$pY2C00AsV!3JT\
+wsNWsSLJwY;^aQ);QO*HbmgV!H(j(m`t;6GYdLqz5HnfR?Ii}iU5|Zxy5~@<fD2D|MI0Cuo$}JCJ\
+Z@D&P;95h3PBnNJDQ$uv{P5Djbf7pBhELE?RE0;gn>=w1Z3<^iRwHwufwUMPv3Iq&U}_s&(O&H1*\
+d6jV@_V_q2tS&Z<-=CR<LpJtg)k;OxxA9k6YOL;<5yTWP^}sNjCKWz7$KH0q<hYV#Eu5a!h!sLCo\
+!J>&}cnBcZ-Dml<z4f*HU05;I;yml=Obfw})e-#sH85a=`DcXem3f2|8M{#`%j{(O}1Ub~mf`0!!\
+Oc;)_5EHwsvj0Af6rZTq^E1^GcCCuYE3G{3sVO^=pGuJl?Vy<rz%#80M!`#jg3GK5b&|#>AaUFMK\
+ZYNlSx&9;x{mhlH9@ckY#$S+t*X+uSA1i?lt0m0iCkgbil`xMg688IO33R(7p`F1J_WN8!AEtF1<\
+<8vBcQ@vC#vWs?ALq+l|EUi%KCXv^b+wwgzJVfh{pAwc*(;&{JtWX`v4nlJU?4O8aTjJhTS7luNS\
+NPQfz0h__Ls1)#bVXP|CLKvhr)P4CVV>y>oY%)nZHR%cyE$~{<oD-e{Bl$dtD{)fqN3>Ws`*d&z7\
++MgC)$ncYsjtG+^!eh8@prD(2HlN`y~|!VWd+yY;{0`Uk<0+k%?+OpI@#Eladhum$70b1=R)m6vc\
+6x8L7ft|CTOw5~d1d}ti5PsO*kx{uq5c9E@!;S|MCyv6vho*2&oyn{Aw$Bsw#Q}rIkXIbL+Is^V#\
+8E)si4>?}bEx5h_9Doi~49<Csw{3&*MihO3ZXKh@_vUbfZ8l)dn<-NfuPe$&>5J=+yM^nU0G=a<`\
+*S7>*Ka`iL`#9rK4kmD6mUEK{V<-2OHN&f>t6(Cy%XShD!9JlK(d`)tucONI7x@`3o%|v4v)7l;B\
+|~J-ZY$SCo%xzkDkH!mVp0u1m>{=+5YUW7{7!@f1?{1Z|g|nTUY|!V163{{z`j{4<C&2?E$~)DsE\
+@31IC*Ien&f8e;$nvt?pucv4tG*Ue{QR&whaGy92%~0^>Ok$#w+!u+BB*h`gy+o)}+r8rL66t&>!\
+YAAOyq+mnyD|4QB%KbYcID>2^Jm>k#MV;Jw!5#zI|ef<#Qvs_8~6kfyco!lPxlTze+%)|B7o09FD\
+yTE#0g4d@q_}yiu;`+J}bm9s1(+A`B(=L+pwM-e;FTO8Bj91nN;}<?B@unv*zPuyZpHnh0?_Egxe\
+>cbY_7UXz`Suz3m^WF!tUIp%2-YnXk9x8r#_JEk_=^<(KMj1+7}L!S@Z1=T&wzEJP3a+)_`Ta-%M\
+g6yNiU4|e}VBflpdae+nH60+wrDi)H~w(IZsIXOt;7Nn<kRuU9FDsGXqJyr$5Ha)7G2gH{5;+jn5\
+>n!S$c3;_(V7eX<e8&w>3&jf-6$x3l%G43Xn7wh_i_J|z2psT0OOg>g~y>vJEsKfp?k=uc5SjE{s\
+sA1dzuP9et2HkKpg#j;Jf{W5b>9;IdC`U}63<Gq{>eC7?gZbvS`_%DjM{VZ4~=UjlE$z(f2dI<H3\
+#z=t36M1iT9=LwsX_EeTK<@0(BKc2a33B9AGh9C@1h+$-B`0mg_&8ZPf}UpK7(cB9*N*~xvv^FOL\
+KR5x0sP?(xc=F2l5fOn;`$vPkn^bFit8H!9b75BNEhQ*@X2*p_8;sEeT=uJ^t447KdU9i8vvc-R^\
+fI=G{oa-N5y>~#rO~djMt&)_5!yvv<JC9yGxK$(;G3%mlX*ZfAcblA3Gkmze$Un_pn*e{&$-EnhA\
+PQW0Fq}?S$(a#F6#QVP79jz<4S*DP}Tm=XxWIZ%ygF*Kz#@W~AJax(s|tALBJBy=5tG=cJ)5v7Rq\
+C$Mv6vko{Sy&di^~b^yQ9A=j<#4qX4ZCAsgsVZ0xKuTt|Uy9eWSo09uo^(Ag6*qxk5oj_c_<POGb\
+0ls+~W<BS%CvL}y*8jOfaearkvV`6xV+(vHn&khp=3)F>Y1~geN}sgH?H~R~w!abdlk$P2{OU3p;\
+}3r$_wNo5yx#{D;&wb>UY1<N^)*3WQ+dDo$1&dC5aUAuACv-gQ>V=%%-0GXlFnPxF#h%jTz?hdd&\
+l5*?$yV5W$2F#=mRA=xSw3W=N!iE6oR~<^z)I~xShxrvV^>o)xh<a2a@x(4dhfXO-}K~fd2Lw<Eh\
+-Mw?Kzk+T?rprZV&MK+q?@N0RS-3v{*xIy(Y>#x0Du<Y2rR;M-VXIz-RM?X*>axK4LwK7Xh!rh_c\
+VJ8J!#gFKq@m0X8CKwm1N=}T@(82|bn#`gkzd=c;m8(D%62y;_}_`wr!{Z`ca1pVKkKe;}Q*JAuh\
+HByckNZ|jCZ7>}!&c*mFz(2c&>t`B}boiK$@gvnpyhb8^@9XCn-w5!FHUK>}$n%$BXWUNSJN#ZNz\
+)u7DH7%T^gIzmZKjW1Qac)|$9rP36S6eB*aS`g<WBfZR@9+?_o*eE3d^;B7`vKmo1+KpZ^dCz9&(\
+_2Eo{va+4tK=({HHPme`}wP@eeh~^T+`>zYMh``S6+baNai~`Q+m17%$zJlp`bI{LbN!^*!r>o)3\
+B*rQa6Ac~i%X+}HM?@4ct3lh*?={sq_{<^X=38(u$qAkg^~@Dqp8cwB4<^rhB$x*f*%jV0yC!>Jg\
+*x}4OXCpa_P85YgJc)#!DJhq#F`{@n#jbKV2SPpX2h}2tLvYGWRJvJWKXE@g{gn0j$d$^tUF68=j\
+2YX2C!6bgfSzJG%CAnX0+rxa(_=(Ln+|Fm<haQyOOqp2@z5sb~0}>Lb_2YF6x3k@VTvy{jZ!e<h?\
+H;h+@?bqs`bI~Q9Uh${X3JLOc8cf_26~_@#&4tK8rV0w^&{n1dOFy1Zj<wV(*pEin*Mf%1@;q2c3\
+DXAjbw}u0RBVCah*8OTa?N7{>Q@eSPBU=&7uD;TKK&OgUR}_pqCCeAm!|*Sls^0w<P_a%*OStA!z\
++Iw4V#-ph<8JqVmJXf5Pn~dXw+9T*EAXh4~30`b@&_b%gfaQ<>%Lssd(tdU*lH7rY_&%QFtf2Z21\
+L><LR|;rAYGOztDimbiWsKB*tJ^TT-QOK`q}e(q3WmV+0^;rc!9k@Mbd53c_X5>pJQc?A0O0=Y(=\
+Yj#6_ra*tFbHwJ=xSa;dq`h&a1o<^bg1i&vAc^J$)*;o-q&)oI7I3bi<k7pXaDE5<pOR~D958-SB\
+B{5GO9Fe#E0XWE(`A+~e$AQX(K%O)zgtS$hwB+){1jR{tH<N_E(7}eQ2Q73;bou?Q~S$h490f>{!\
+h)<<TJRPX07FjbNx~|(D(Y__ETX!<V$1xj$R}kf}?T!^FUwiLFI*LGs`0`oLeJk=l7RRxc+^Rzme\
+2DE`{;dmm}<KYzxdE9A@GAgQ#->oKuS6oI>gCtruf_&vzvMSr6-08}zrSls*9UN6O0)axe$vP7+P\
+OwFZ4Dxtv_LA7H;PxlY<4n}Pi*@&T!L&3+2@ST}ON?>`B4U?be0IO;rQ#w_pd?ZxeEvmy7RHR#Fq\
+G(FjN8Lr>gh@_7S=yh{r$@$6${kD7pIlsGxWBi`4<a+avAWvUu!g)EEl)tW%FkbH)$#0)_1AFE(Q\
+cv>(`+4yjlJA8jK|fV7ejvq9;JxbbUW%Rtkr;m*?5MVsyto1U%8azjtp`2L_by2X_oEo^(SbZ~^1\
+yx-l!WoiDf!rlS)OizbG@z=xgHMf!}zwg<os@jbJ+?*(*CezF2)<dIXVRJY8{#7<AP~m|I{JrX@4\
+E#FFTNSsx7C04xPz)v~P>wdr?5HpX19hK3au5M~?)0S_3_sQs*Gh{~tFY>7cU};}>&C{2F(>FGg*\
+_?R1B{>e;~O;}XbqUI2DKUEnAB6>%51{W;|rA4uuRaBjWOj<o-b?!~;{uT8;t?Q)ua#bcJI>7eIa\
+4kqQxvpc}Y%t(1E3;vz{G<$LzeXuixlK2_1%yL#6=EYk{j<8S44a4;(s*~rS@<remlPC4?_ZKj}R\
+a=^WCmgpED@V!;Cj(}A7Xfx8Lz@0PG#>l~PssJzsw?n^_qaZFSJ3njX1S@e2G>7eO44CNKW4dEe+\
+0(sYmj~iV>k!3rp@o`P~ZcgZ&PyZPzSu;E{~8U?99uJaXVZ3k@MvV`v1)jGKBtC0{)SG#w49zw*k\
+7*&fO!xPOeI`lP7^4tl<vQ4%WU0oL}IaLdny?smyXP9_*qQjY&OR#T>U|`cj7ASD^;Depx7~2Q~x\
+$b$#$(Q|sS~1#-}j^hZR3-{GM-d5)glgIV4UkRZQeV4Yv4t#dCM;D?ZCPWh4TVc(_rko>2k53?M6\
+7lixcQ4IY7I&bd-`q&MO?@sBNV8@=*nDqPKxDEQA6Zzhf0bsX*^I98fJr84+kKS<px~WXsAq{kJ{\
+arlrTp6Yc>wFMN|6MKNd`;WG_Q3aIACmM}4F>(^E~%&O2LHupJ}F;HVBgu&>@fbI4?BD%?E}UQG2\
+Y3Q+($-0w{cD+epW+fKXv>mjAy}mrq)#w*ddp}B@G_{-xc(VU=MO%$br0=1oDEK-$9`NpDZQy8MR\
+j!|J<GAC)<F(aX`<f`nmKntdnk}{LPMl^PmE0Pd*QR0joH2yj!C|zC0lDU%KP*zMO{fn?auL0)0T\
+17C$f%&X1Az$#c!X7O)=pWc%J=SG@I(^xM7z{v6!~*Qf4eiUoe#p`7%iX(%(x3q#N=-WHQ~n>)MV\
+{AEq{{}8N)U{`W~l|w&s-jnyVUhIMCvt%Z&?*{bA0e<+_n3RuQ{iPWB{|z6EFM{*Y9;zKU7r#^@_\
+fgh4(2Kw?A4}~!&|{~;zFPu#MLY0=za`g?=3F?(fqvx$_|J2h^{(z0ar-uHN&ehW5A@7XQg7)B`a\
+l-M^HBS=Q%7d|tr_TJf%9-byHfEpU|-S(zU@!>U%)P*`jwR9VPJolrb^QP4#W{nq{R_sPlC9PMkK\
+!thxPBX9>15mkH_OQu0NwQ88@ZW8@Hc-gQP<U@HdtpNzb(hfZytpa#IfM!^7F6ojf1L+kvJxZe0i\
+G*6*Z#wO$eYr?CE;0RH|kX1UXNH~4Xykmv6AY0UB^t{+~vnPV_M2=?i^!(jJoO0L`ZBM>(N_Bu)*\
+Xx<IuyVBw-7OVt4wgIVcyGxKeXZ3+^(C`Wp<k4-g=jgsB<&JN6@H>1V`PekDON^^e&R5D|X8-SJ@\
+KdNJk?ZaDXy`vp&y<IKy`>9D2a}T+Z{LaZk359)f)Pz#Uj#Y6q$hb!+z<XW9*5i)sX(8{-$**loD\
+TZ-cXD5-H3fb`i!*8eAMiam7g$pI49M%D_sI2ceH-GVIHaHVE672*JncUK>})_cD!!sV#4B$1B*!\
+}#;;e=@CF2}S;y~`h1t~7nJ$MjDl>M6IlPxwg`=gC7Vf-54ht&R>vk|uwW=^x;f`04FCgZ`P!G5x\
+yrZ<{FJMEzzJL){uAGdRz7T+j46XG;rTonDkDl*GKz4>rnlOg-lz5)1W2a<7*(%=^!_nBOuCE!;r\
+1U@{LTDK5C<3o#cNCLa1H|R4|+=bo-h!-^@_sghQW;s}Vm)T$JV}a{C!aTMG{1MPU3qk)(qt^2R(\
+5qXJ`eZElNh4m6@g#iUOX0wmsJmugP6WTOHrfAuZ(v<{(&BqT5An4o?U2Xe+-hDz(#;L#kq7fg?R\
+Re;vs@V9fa^c_NcsU)heI68JF<Pw5SSNba=lHIAV-Ev;PbD$fIT)I<2O-pgRqY*A^wW8w=Wt8b_O\
+ldPpTw=pTD~V=dW%gJzs(S_M$w=pNCv#mOIl5z`tNYo*zH<W#-REt+77PdoHg3oRXVrxc&Eo$oLr\
++#69LEljqz~39z0UlJ<dSdBCq|ai>ke{@huXq?>IMW<G3a3jUGDBz^_Nna}Vg^^@-K-iO8{pX>*I\
+kjzAqK6=U+e<griKO-TIv~?%azU^ELeqo6FrQ)SefWEZiCfWX8@EfYDlk%v|P_QSflXjSIu>O_d@\
+~aM%eb1YjukN|S9LMz>;wp#VBmF7a5LcW-vnN~tIv;#V+FQn*hxOc*j1x9kkK0+RPOi^0Uhv+pq`\
+om8^dcXcUc~nWyW)AWKl%{Q^Bm&nnt;Cg3i$jP8lTSqJ6=n9a$Vg@1v|+Xl5Qi<;rj8WWdE;2+`G\
+|0vY!Wc;dabu{=o^*pP4eG9>VF1^~vsV@tZxY!`I*^JxueHjsm`vRZPa)xPm_`t`E5%ongF>A>N*\
+fqezGK#-hb>CBeC4+5}SHklze^n@#T1DUe5?OpCWax*zxw*u5!wN`w7sx;Ytl@wO?%?|G5?f)8=I\
+hW$ytx4JRLONEg5;hmY|_T4}a+{`BJhkdL;K1Pw_vV`-+NATxT=MgvXM>Me|$GZjO$V8fdzZm3BE\
+KTk-hCGoiG&{B-_#bEYBI{q9264h*2Qa4MD?rb5xlj6Y)lHb=uUsLHw<)YEYTq64Wj>Fy`++`xi;\
+NeI2fCHe@_IrpfL+3#9M_4~%>4NV*crUR&Oq^JBj~3b^poOyQjiBR4&t?__{nh)m%F70nV%91^jt\
+}!=X<b|<lH6gQ6o-({Sf?0lz*gTBj}&s$#vBm@*Re?C)d?ppwCCzx%(mH<Lt;H<DHx(@Y~}M?{xD\
+y8PC56;##{jCHcu*8{kV2U+O}Qw?Cd=r*RlR3;0Ya<lPj6VSEDAFYScoe(?f`f1~cLg#3~7UL=1z\
+4(l-GD=DY0g8gI>oEND0!~1X!x(|9RwXPC)%zQq11mv^4BlZ8JFStLQX!~f1Co?~fa>4jexGa_Od\
+ujmxv7qsjxD~L@RmgMDM)2EO(EPR&!7gojo7|6^;k<U!lN^_>ESx)flln=AiQpG2BkjP2jd44cH2\
+vok*nh^Tk#cQ4_@l>lA=mBj_YmjVleC|_S<cM2yHR$VmZUu02In<<b<)qccPGYww<778Fq?TFB@D\
+v#$CQ(CV%y+6V*3);r}D*4fq&$qA1UwZJz&-+>komvsz<U!9Mp5rhi6%k@j^QxzbuWGUzXGW{M02\
+R{Ws@=o})nS$8M01kfBeWPs?6od@E0~pB``?k9|%0Uwk0WuzeCKAKSD7e_t5c&)y(^+qNX-{#Zwh\
+e?rr*PC|ZAk1yo9O@utGXdTiXVtWwud0WyRsB-}H2U~L9Pd<Zn=tkOeCV>9g2J}zLUs(_W=Spd^p\
+F<%I@L)rdZthDUKG1;F=d<BFGV3JS|B;H!{>RVK%yE708O;8ykznWC&L{m5ijdcEowiPVA-;XdBw\
+T+Nb(eG@uHVCow0{bMFkTUUD2MXPtA;_G+eMO}^jiz(k#@2~yupeY;FoMnj#mNr<Ohf|q3j91;7>\
+e%ij2D(0OxvdPm*s~o?-Tf>OnkhMhuznU~>lg(~_LW-Vh(P=#va#uW*9%a$7AjzUA67kb_F3{4Mf\
+fmYZ)^GyBmNmarK8Xr^fxf0pJ4?+JF)v$VLl58zKJ7)a(T?S}Jje~8cNL-7aTZ=4sT{b4i2X&-t@\
++U351oy4Jp<ewU_FTBi1|H5jBk9C*_c5Eu|1LAv2XnylokPlT-O0J(!h})sdue&<T@+buKy>Oboc\
+Lnl~+R^w=<8jP(s@Wi~7k?)0cqbu#_$Jslcz}NZ{^gxFN&4I^!T1T*<oetI@^?jV($DJ#@nBnHX?\
+i30@r}aB_OrmhJWhp_gSYN6+X3!Fp4V9|($4l0{9pFUq+QEIg4}rxd4Fj%y)h5sA}&8B>9)=c{Fp\
+Dv^JClw=J+v3GswprOs?~6@N?~NL+Tp|kHKEuo%Bx`!ukE<IkKN=A8`GFUL+s51^L=N97%uQR5+)\
+<r0I2c!0tEv6KTh=0)2q)-+Tmd&Y85l-3xF|-z`J(6LvEAi(iv;aD@D$o-Js3n&5vleM`!5ONi^!\
+gndo@Mprr5sqXob?YvQCmLnY@FZG}fY0qgo0Ppv!aB=*5*zf!YkjH9Gj%!mZ-2Q2ry-^?ZhfXaZZ\
+k+OuyEDt3ZeW-2EGEx2YrwC~ZbSO7mw{h+{Yc=4AP2o5Zsf}yQqRu^IWm^EA6*O~E-Q?jm(dhG?Z\
+|nb1o4W?I*{v19_-kgv`KqxyR%?Ff%su6PWT#6f`13>MM0({oo|Ew->xTFe-!u&cr<^(Q#e0rMw9\
+rfJDK&&Q{aa(QXu`#Cl`ZU(<k}T4T!%A4JYli-;A00wmj_94zzRMdf3-b&y#-D4-jWN&xq7}r68{\
+-ryY4tfBFRMDsJTZzp;>6Pgv9h{Fos$KOpeoJQb2|=V5)GEGFYFPQ^0wTO+vlK(iys$4nsJd*}l)\
+zI}lNKFo#uku$V>z$qZVj??mA>Vuy}rvVvnunqXw3S-)R4pyKa(&DxH3}oi>4IwVqk>;OGbOZhW6\
+sfm_`@#9TjI`4p0zGp|JCe?09hmJ8jyz`m-wX0y&(i#iy3kG%O;2d<$;|)XfZfT#o?Iu>Ab-Rwl5\
+A(cDe!XviQfbI&uYk<=uhoyI1hH9od@?m!uZ>+BtMA;f6((dQt!P3dEd96lkGen3FqSX7*FL@?JI\
+(H)eQG182HbbQ9$PpWPVf9F0h|KJOkCA29SR}kH%-*CGh{30?0d-C)<A|A<icY{Ji@hjxmFpN3c6\
+Rg&#EO2mN0T`MC!mKbML#9|ZB+iYzi8|1!u0!(!6@`3?Ly^-aip^F3h4lWs-od)?t4kB5UvI>^lj\
+zSN9t=Ox@XGVLPiXPMy(bo)x$$^AgyeJ~~0VKDdwn$zO1roeq2mM=*9dxE~P_%(SRp9+4rCR{Ra<\
+)#YQ^J#j*QVDT5&95-W&wD{!oH;EnP6hG{ZmN=T{t;mRS*%9JTfTvF%`~vvET#MoQy@Q7hiu<tKb\
+$LV$#ZmP6XyFOG{LUrPs_6y4tABL9;94o3GqMPkdMEI^1qmXT%g^T@(AJ;^GeBh;I*KS71HRuF@#\
+wT-h%Z!QJVDQv>FTX+nS_(@0bS2L0Uf1X}E`q9`B(Bdeq3Fq#iXa6!fSIBz=YezdGqkuEW+qw+7~\
+9{YG%FQJ{dd4;z8KxBoq|epDpf6QxMTVUB|MoHMk0v`n{S{JKVDod0dG&kwmv+9hVgx*gn(lo$0N\
+9(8OGZlAgbtdAD6ygmqar$zTjIl`A9XD343%lNjWKjH-B!w%La`Jp24jUlvqib_F`%Jd@bC#5}s{\
+xp7~$A-A>2y$F@;CH*{O_O(!N4Zdz)B_I>2EV@o`Q9L~+gxu<_J0i*<44^g_oE;M?22#5c2eQIrt\
+L`b2SeZkiZ4igelOVb*S;g`TR^<Zw7X>ek#LXA8ZDAv_1nZOFV68Hu2`D1o2fzEn!O&}!vJ_2$fu\
+q)4bxv1_R$j1uQ+c=J4`_nX1?tVb_Q)YXT?)^8|HZL%izCux=y?A1>!dQ)BHzsK(8KZMB=U0Fg}E\
+4?^^nf#TXaY@)pp?k@VNUdJcXxQ*zx-l^|bULH=*IN#s2VhLCR+NV`|+Su(S{I062<&pk+eU>@Yp\
+CeY5sI*`AA{Ud2l8whz}9@?bbH-`9xzFkRu{xY0jhMpnwzE6YQ_|Qp`543>%ks}3UzSYe$668^R@\
+Lvod{S=NMFNTBPb_=C%_h*(zeSq)Tw<GT(3X>p@Y$eE%XHj5}g?yqrRNNr&;Tw%edrl+h&sy3#KM\
+v>I8F0>}^822EUHyDNGXJOq@_g6R^h{^CxA4hLl0Kh$Fw3vvd}cY-Wdh`-mXZ2W1mrUgHzUtkpT{\
+xFuS=kpb_pWSL34nQZGS=PpI)F>ucrA8r>|#@cT$D(&Ms+^kIe_Y^z&e{oprFz$5B5>2mHzm;)=i\
+NlYac>Sr8BKjr0>e=ndz!GE%;5lyFblhyBcc&rpb?I7Ex*yw?o;Xf!+Udx(=y3MKW89bnhhDJA{>\
+V<FD!NdQTQdywCk8A|%;`oKL-neHTCy#wu^1iLYHo*Du1_S$g2&}nL&K;D+;OVTbk8vOOQvdB2Vu\
+ON@k(&GAVgWWIgEoo;cf%TbILh@DaQ099No`T+`I+(Q2G=+0np&Y4S9fbTHEn0qDBd{ao(c(1rf*\
+;U6hP1;N_hgnM<01ZGohHdwwWJ_Ea3k0sKyF4rJWPXkq+c&-HM4x#0(^shuVyIRBllT_%!|pBAg{\
+v{nEitukniwWo3yvz=)f$ej@#n)4?|uC6<4+j?D;NMWS&%}5AYM({coG#9)Jn7djO;%E{g|oSycR\
+R8?e)+T9NZ84}RoOeX^bQbHKjcg!E?}fqTHbY4QJg8L&@j=Z?5-zy~Zyy0ry+f@~AAKS$v{z3sZ>\
+dD$86HHx$+;~}>jFw2n_u-_j#lkXiNL0((}Ii;#Y^3MQ>v(?Zd`IYrp*mqyZc;nf?w~x~9Iov)9^\
+yD(~T+jyc8otuvLYISG%Novon<+U6_g+f-lKXBF<fZCDUaBsoN5Otss7&&)1CWn-{0&Km{u1tg6F\
+}Zv0OZe(qT+(!9I-Nj)aPZuFCXki>W5cB|0y|1`T>2rK;F;?GHz<0KiErY^BVy7Gc30u>2L+~nZE\
+7Fb+s{o`5vAj66DK#&>uo>k@oE_aGo9FLF#+Wq5VACJ}q?zz65qfO1|gsh5kUC6&1Iz@FwtKN3#8\
+9;D6+R-g1<(SAgGHR+W?&Bi1te4VAzS|MC%eZY>3U{t(TN&=A&P$vKkFH(N8`S9TlX6TZ;&#==l$\
+Ipuc;>|IXeI%xs%QJEh}dhP+dd;?m(HpE3AwIKCaf4EQhFzwu3l*H`UD}cB`+4rP;uP;IFG=cb#E\
+(RpsA|M`{b(5rzvMumK+P+f&JMHOrr2OsW&CLJRZZO|ta0B9nE`z^@idUHg@zr@Wzby~)gUUhAq5\
+Rz);9j6`+Py&ICGdX@0q~6yG9D%m`rqLqdEZ(eh+oxxNAjh#_RRN*J%ae{5SraS2<+acX!o6Nf_t\
+zZJRs$AIP4>Pm>24PgYm$ZMxG?&F)o09Ui^YQ59&*}PpnxlW<JmMW#;FWu%7ci((X?H`@>01^8Ua\
+B5cjSQajMj~xQ&_l<m`svhbkfWyRHp$d{Gy;Cnpx{+dHVZ6tMryc|*HD3gki{><h|1IUnMC^J#fi\
+v*5mkn?~flprhejzaR8lDlc-!0A{|b0eY`}8M&@b!FfkJg4AyxA7b{~h6lqsmm=4d0@!K8OUXRtv\
+v6-x4%~C{jq+1CL!1o6J58tddoJ)>eKIe&u@N&L4u-t=>=h(GG=aRE!);0a_7L)Dvf&;}%8zg#;{\
+9&Z;{8$}E+w-!?S2dieEa%7T>oBk(r>j3;#D+h@qtI+oVe*5X(#u)%VN~W2EjccS+sR)X$^M!H{^\
+Mz5yVv<<&g1g!@-X>gXTx`g!~k13-WxC1?Ny6#4%EFP3_W|<xV8{d6Q^y2ra?h^6?(2zunoy?0>X\
+_^U=;klJC`%Ag5Y_{tyoO1Ep8jgM0)(+C9ulhagTE@}McZ`c%*pI;fKOadjUE@ll``9isf{U<W7w\
+J3xiK0^+Wf^hkXpbSHBh-FdJ}Xwc$b+CyG&i_awA$bmS|^)!DC3-q)Enx3Wz{KVLp^lJ+sj?VHG>\
+Gw2|f_!a%($8fFe!W6NlHcmVxpIyvE#DB%Yv(M<yv4y$;D4z{`ZseR&s63%X^*;nm08Z-mWO+`X>\
+p{kBO&gWc8`Zw7_*#x5By3V@_@Qg>j&bC+O{C|Lj$n8KA%Y5(_04i#z6x}x?KRf_gsB)fAs=Ar#|\
+goEXQ<ad6xwId~F#m4+!wFG`(>G#9{8D-BaNJaY`pA;QE)LpB+FS3%NnAhxd@jakUqjpX+iE{G_z\
+|1lZ*uXMM@~5Bk8p{j_+7HgJ!}TJQ%^_cLpNU1gyW8D|xp&wS6PH`teQ=8<t12O2QT_w680(`fbw\
+WeIZpG{oI~ZbSMzW)5MN?{2Zo^7=O9u_|{U`P(|6!=n4-{Y7oyzAq!1pF*0_8)<Ss<tnqjZBz_-*\
+-m5}cq6zkrHp1rT>yOYx-MzwEQS1+@TO#bYvLj1-xXR7diZCW9e7#*UWdo0l5ykODa?5d_g^yKLn\
+{EgaoZr0&pQE~JJIrmN9i-m({TmN{=}DXet#T6-Xl~F{7|<Q$yZ&#juB1MZ-XIUpgZk%b{5QrIIA\
+WkU+Mw*=5IkRXHtG!$iI6@yN6*h@Iy7){krwR58I#SkBAP$_>bSoypORE|8Vg&sn4H|XTBfIzJS^\
+9nFe}=KkfH-JmB7m!(C{<a{=>P;7;1p(m>BiqQzMaOlFpkKH$&F=|R$GYEx$U7!3Q)<vz(b6k)#)\
+YD1nMx7sq>Zxz7)xv3#Z{}ry7FL|xR?Mo}bx$+9c33ns&IJUxl;2fHr@H6BYZC4}hZ=)f9ik=rH3\
+vq7QwEK$Bf!^Xvi+_s*KmPL|QvRBkF#kT$+7)1DGbZ(RZTLL`L$DLZ0Dff#b9_5%7qcI{RVcGubA\
+<T(tfwTOoT0%i?|5(?Jg!daX=kWBeVQF?2iQqg)AZp7Tbccv6TtsS|J|Z3U<WGzI~YZWrSLli&1w\
+GSmk`h3)QG(Qb2G%@l!udXwr$})Ov}z>J98mkr4KFMBWpPG{j~ih$iYR&K~L*QwzD4Y`yHuC+5xN\
+}-cK3g{U|xE25~Qiw78cIUd-}q9d-YSCV4Ix2yw-9fAnM?_~oU@cmtj-bH2ctp3J}7^$G6fxZZ+X\
+&qE-ttYsUTd;$N(JX)N&vIM#FychHDf}Mc)|JSs8NPN+GDwn0oGPRczcR#Yc{F&uT4E!F}3R+yfl\
+?wCka~VJ!FFme!3B=95pv7(O)?}6=4d7nf^T7Y9JenZLXPg50L3dyPox#66;}q>4S2))%o(=b3QT\
+4&@+Lx9u*$ejXZQA`{Tj1VHdR&$b#7};u<qI21xW8+$F7xksy?{K6wC-g5#w_@qnzyujXr($a|IX\
+Jyumc2qBmJs#vf#dvMr53Z0r&y4HA((|4D1G~F64W=L%eqh#0gV*1ltBO-;=pH5#*ODX^+~M1N{V\
+hDYY*aK_2mX4tdU9sKflbU@R^-EGj0N8=nvqm%!z+xNiQQ+z@^oKTHsxz>o9ybc~FN=KBW)NAmIC\
+nE%4%r37(91<^r~f}!YR|DJvcY&I`ED2|&D7bHlCcjGx*NAjb?62hIm-Fd<acId^?iRgPNKdR`!4\
+dW+x#U==%f+8Jbq7wwsi9rd1m}r-{m?*!5I6-un=w(6ZYmRK^B>ZL@E^e012@Z-E@X*+V72SAM`y\
+~1z`lg$o1=m^lLSJ|Egj%uS{OrB8c#pF{P`eH~Q9~1cqCU9Syd5i174&uV|7c!pDvR4II$01M!u9\
+3HCq@aU5iJ8=1eX^c!3_-(L<$#2N(wiY9~U1ZoZ5s`Zj$+rCy&D);_U0r!&I!rP}v-Ax5&sC9yeT\
+oR-qF|eBhkgPB5*}+AkDNm4#B9-dJ!wxu`cmk=&4=grK?^6k7e>ztkxX>J%>~8r4hWCAgsxIy)!%\
+bNy^<+n%*}d)%PJ6!A9Ew>Vt1#3JMQ+=SFveqHz3FM(qo8WWcs6c@r3AZ8Vm5QDxQBxDwT3AQ1Kf\
+dxhL_@ZwJIh9pq9sCA=t~1*zL=YN^7$K@C>Z3EFEhaDe2HF4>-{A!%@WW!_Qh(f>O_lo2)O4Y*m~\
+*+m)GIV#>$srkkeDcL5Rb=?kEah?e9Iy_3*x!aiII`q*cd@Hs^}&pU9h)*<>(T^<6@H0Dh)&Pz>k\
+ZIi37G>^I5VJPEs5n4cgf^DynvE*q}B<d&Rq!onW(ty$Fg8;vpvH992vHS<#K8TJL;6v|wXXxx&B\
+3qtPI$`q}&nABpEDa6w*1ffx=(5;|JA%6Q?mY}i~lPC<NZOgvvWR8gyOe9@ACPkbaas5e9>M|leg\
+5)$d1<VUTbSOK5MPZps4U9mxd=$7F@@!@V!&b&y`JRk&@8yOafyK0N}0Y3qW9<~*?JF3TxjtSv&Q\
+MdVy72N*^bt*+;WhGm#XG{neZH_QLSNLi)bm6O`XpM2qx!!StC_Wmfuol`Gkpf;SdTVI)Dzb4!_n\
++3Z70z0Ma62Sbt7T#RI6j)^8rR3<wTKc#BXaw?BhJVX{s-N(=ArqFj<F3%j1#FgZjpWoR-#8Yk4U\
+yN0(0u0vru)2NsO-O0(>_z;fG&}L@z^Z#n-*3AGh)~{#<`^gcf2gkVeVo`U`6j?N+l-mP7e*F|;l\
+r1_|HgCIv+%^5fki8S7Q^6-YIVOmY?xPeeAhHQFoD!kr-ye%YO$D$;lS;IC}7(uLeTmG%c})mQzx\
+a2ud%=Cpd^4T)DleHFw<2Sry|lx)#fNDyk{Tz+s2H=G}d)HXK{fw^!~qX|Hpx?;1qq4&fF2@u<l3\
+U&4f77i2@Y@vcvp>Giz?I+)5*qe3LA@=WT*{OCzb^2{Xb*eg4q(oJ=93)is+^W|g(~SH=V|Cdxr@\
+HJ}CC#9!s13I$@w%ufAs?bmvL8Q^&r3kt%o*YNLlTiPo)ClBWTkxS>1WAh5+0&IAlB=|4-HC;Ou&\
+B(5&f0=69ZSq&Dn?z6ojsDC>Yq}#QilRs+=Q>#ORnfp>ZLE8x<7m78P3AH(H;Ai0LNC@(YdBMNgd\
+mx(RZs6SCAHqZa&vOcMMKnI!maGD+|YGD+||WRjq+Ws;ySWs;ySWs;ySWs;x<GD+~)$t1zwBa;Nx\
+VtIle%cL4KQWrgO`s*ghsZPjJcZ|B~!HsQ8V0sG=n^f;>F1KpdejUoT+6?S}N>-=eM^>l*DOrDA*\
+4FH$bs&#x`ocdwLZ?4HLJ6|JYAY2l@H6K!wkTv~mepj}sErDSEqw0jXDx|kTT5oy){<GawFH*Uu7\
+;NIZ;V}{xT@X)5+6a8(TRyQ^x2Qi{h{vhyI%OGN9gnqFDIuzPV71q>EfnqwgvU!SM{T6v|5*1QMC\
+v0KOme_T@%jfe?Yi8&~~cvs=Cl|s`Z*bGa9EqGa5-+jQDp6u1jm@@6lcU;t@+0F+W%$b*ZP+>1+P\
+XXq^7JW#aUQ2wN8}h#)^_uZnoJzr{Ht8k7t7mu+FyB97p1BF=A8l|}FD#{E~1CZgeY=l%hn@B>2s\
+z5G^;yljqZP!!)QIG!Ju#E+{Kq*S1jd4ljQq5w{zzGuPh&0%xmQ{xl(QCuF<10$S?u&W=2If+Zq9\
+|lNSSfl#F21KDz0<qAjiZ52}h(&ZvGOhL4$Y1YsB$`{YOU@#_SBx(HT%3py6D7=X5XQ^8_3$_65|\
+L-l&X%G;S{#yQ%XRa!<N7&>BGmkxnPvhgRb_r8&W$<qK+UT^JI;*V__Hshlphj{h#ScdigOI&h4b\
+T?DsU`B75v4SpD1aBu{B)T4|XwA6(>gWv(1G8kI^Cihzx(2F6h<aF^Q2O&M5+Vd}J8^*H<~>8&nJ\
+>ZE078QQDw2Ys>X#bD6ql%NNE$3d2pktsG*4;zC3@DELvt?dm}DvfxLD)Il?rp#s#7ub&l{cF2up\
+iv9wc*l~Lb!+$Hn-Gy<$h&X*k)N!s<d1~J+K}toRFxe_eDyT|to5TcxFjIyicjebA{=&3=t;6^U{\
+`|NoVG0!%USi+>CC%@LlT-a>sy8`;x|y8ncdN?eFi?_-E3t*Osw!mE9uY7xvUoHE{*S&C`bRZU(a\
+>#veSKSrcy1jmksmkoo2VfEQre!fOpFadyR<@@z&xSv32cS=SHhQCM#UuYLj`|8pZ(E3tkV}!JJp\
+81Q~5(`WC*O@9`5!h&H|N7Jvuq6a<3yDhzhaC2v81$nJAFo!RBy#BW<7RH?;)NON0$q{#6ha8!2X\
+3hkD``pPDqpuHLsCYt_1Abz84g>61jYB)?u#h3b#Pt0METhC}f}T6{G}Q~3_b1NwQL%64e%!YYo>\
+L(CwK&M$u0oLy`pI^+chA*Id>A$}km>wL#a=#iBu|LZ3+Tgi+n^8!(4y{T#y-xH<`VVh88|7^Hiw\
+AG`~o~61-X`_CQIFE%)Hl$bn@moT$z(#cA#Uv((o+9Jjs^+R8j)0gB&S;B4)Z_<6x$*oF1F_=bTt\
+(CZ8f7F?o*UD5@eq)@Eh1b@WW2Mti?3gdAJ@5R`ee;U6dUU-sO};{{EYqM`TavCS@C5=<kMM_tFz\
+h*9Bdr1RrA<>xycIp{$7d@>P_7nGN?cNK0}84@3I~t-A>qCyg-<i%#V%Xg;yohk23|?RVhFpFH;s\
+_Pqf>s5CDzWmW%%9!2Qh@GxQE?ZVl23t6I(6tN%^L3{18~MY<y|C|)$IpEe}Q%VZoAYS)e*Eiz9E\
+Lf!ht#|f9Ag(zEGjPR%{N!Yw<%dMbzPvH!rDXFkRRCJLe%xxF%q)75tucuWyiaJkOOr5Q{c+3)qg\
+SHjbF}zxcenkoD$T-8eGevZ$Bo2Ky3rQ#XgCp9ePF%E8tM=~askPPJBbJPN#74MBM9Ku)8na$O65\
+mr0Er<$AsW{SllS&e*Y!gLRsak_NiCdsEwqK&?I)a$Ec+8{SE9IJ9JoPsryA}4-GF~v0PuE<kRzs\
+(OsGrplKW#~_B`)MhMM$h}rA%jYDIr`PUC5zYy3o&F1nLl*17zo-l^R=VaR{wSeqqXYP>Ne9E#><\
+c`+<b)Pss_Y3FMs9I>3=|rA}=w(m^Y_ws+}ZwrweHG2$ToFGP5=j|(~@JJ+T^pnX_^Mj1+}qYRp-\
+=>0!>hlu8)K_YdA>lPEw^@`<3M<E4Cw4A^MnGl1oA#$)1wE}cUin7E`N>+JoxIgL<q7@Rd6@2{{7\
+2%{BkP0bWa05lPzd|X;Ftg^N756pOc3%AwVk0Hjkld(<wj!zt{qElG6^7HAb|TiJV!^WQDz{J{L9\
+~bH-jCW}MCC5=j8VymIZUstgIlod1o5c3=wE4qUD-w*bO^X+lw_`H5zSA=A$FprUaJcdYIv^#n=Y\
+Dur4zNi@!+q^vH$y0xM`O6zhqP#;iXL>d|2&#Zg3(mf}apy2YW(LyNxNR(~T*p-NqDDe`5;%x{WF\
+LD>tU#|2F0?rNRD&3|sb}9?b8|YyF3_6945ivL7&?e`5T<k4@Di8?DaL+t`1m<8_~2_Rpmg{d;*L\
+KVmh1@2G#sV1Aq5iBsc9Z4Ps!cJ-WcWPEkqIOWjP3FEHZe1CRWwWyU&Y$a(eSV>+BR+86(RdsY?X\
+D=aftmF8?fuSbgl4ha53=_c1ug71Oo5Z$6%U?9yp!j$}ShOe^2My0gc&Bt&9O|a%?%yD^?1M#Lso\
+u;B{=JzO{KGT<BUO|wSrxUauB2d#NeZ^`OE!`SW+RzkHj)WuQyocBjWy!&&*qddtfua@UQNu}2Af\
+ga_(#^z->ZPtX5|pqm;VpabN(LrPX(H@|1!NsJa(j_zjj>DpjaG=%dDkxt2rV`1Cl%*$-}9}Xhi=\
+P#m{s8G9{$C%TMt4E<eHl50@X)kbXr6<kmoJ|AE1?83%9ij|paKZ*u;zasO=Z)?7XP|JU-aN$yY8\
+Y^!SLL)nNoB>G7v>Z_8i<5g0+#In4qndemPY%mMLF6iuyu+_>(bNX4zR<(N|{MD^6egfA&wvq%8B\
+xsA)0$OY_sg==s=qth>PP5?pq6UPDtN00vqSDWgAC^DPTw!zgXu5)Ud{L^4TMryqDiq*Ov0nb%Uy\
+Uxrk)0O5o`EC`G^`9ew635ZwF|^nj<a3m@6Vxe^bn=*peB-ptk2tDG%)j@P{l^{gH58ha0Suv{I~\
+?S%65K65n;Hf@Fxi?C|Ki72-8+E-9K!BQ>BIK97`e3o7m`LiB7fI>|$wy|B8!+$m^@@HDk754IFg\
+B<tK>d#YwsY692rKDC46hZHs>Q4}B{(A+Gj6y+uz8O2Q{<bLNbWx_7kHF2N^~bhbzimzTuMt5&Th\
+KNtI=IcDh`ah6`4H#t=mq_s&Gz|5FaCn*pFKdxzXuXRvttWYVd$O*0Bay5<<u0E%$O;!TM(dsDTx\
+Nbv-D}Pw=Z!z)+e<o1^N3HeGk%@Mxm_JxpF&=4uR$NvTKPsM|@NdNDdV7l+p#M52PTH!YxZS!9!2\
+S917W}izTTq?l{ZE9q{<d}f|9ot!g#GbPcqi*@C)Mz`L?rDt8}9$bb5`A#*1u(6{=XEKDQOS>y(i\
+wf+j-Tw^}c5N?cWP({NXOE{o%ecypZv5@BWvm%Zc&)c;P)MVUZMN>+<{|wB?9qhHfK3(}r=}m}pV\
+Jgj)@>K%J9(MYmS`Wpje);tBJ>6-0;dQ=GAmM^J;q#YFhKPH(m%vvWMP0NwvG{rxv=G{JA&Xo4DU\
+G{L{S(FA|jM*DYE_qyMbH9b<*^|r0y`$b#38~2}G1&mC<nl`tVTwMEKJ>~w4UHs)IkKe!~s&)FSb\
+JkFuxBiGB{KZk*zsd&wZj%SO`73)4CvP5g@+J=-RU^e}AM+{F!q^<tmvHKh6|sDO_2JK#3e@_WMk\
+$;}VK}B}V>w6pRtBS0;|5-^0EkwEBU`vpY5UZI(AljL5@Qj$dic6WiHtl+xD!=x#{LB(hcy}xVWk\
+s=OC@mFu>wAipDc*yb1Q<fxCvr?5(P>LZ`|x5YDnm~5)YgDo6Jl&j*OcaEf|u>hl!8+!HFxX`qw;\
+*uLy?AoPQcMB>c?@VcJeo4OyJv{{<E&_$OGL;NN0#f*P^7x-cL8VHPI%KNco&#%smG1T|n`wa9Ie\
+#OP`l<u4*?6;@~Qe`W}ArpRGtivI>Zs<2NE#Xc+bxvG>P6g&?1&sy?o&p|DP9MrjzgW5>sp#P3#R\
+uZq3bSSR@udVjPO8$M2p9i8>?;SPZ+0{+c`X6%Yf5|>1nLq!<RFKS->+F|v7}Z@X!ty320mPfETj\
+pOa3+*3a`G2`}y;h9A?s9^}81T;%HJK7b*|kp)Wmh{vlwHl-KeoA8j;AQ$56+!TIhK%MDf+8TXiQ\
+u(!c{bd7Nak7Zi(>JhLcNbla5$7$%wU2MU?dO0-~QfOZw%6PfkU`rx;Cr-K#-WOL40Hd`XCtl_Sd\
+X6m=kpAgcQh5?>KjdEtCs1UHf&?Hq-3k;L8`CHUD-@BQ$%X4qCCf>0P6m%44Q8`saNdI^?nF~&;&\
+Wu2;Z{SY0+@|uM|4`Rvn{prsokg1;*+^ReKmoh>t^QYYFz%?gw2J%x9s;p6Kp)XJn7LC|)aH5dp)\
+#ZFb;Z^%oNKTDYA#3`(VB)_<$6@#_wz~gau%BmAa%h>9KhKhs^mDG2Rcn-VS-l^1W%y#1{C{%^`T\
+sxo4JF33PRQx3iv&$hWr8Njh<^IhS2gEFc3kS0L8~2dN^Zfr@f_J!jqt8WU-}0EjV0wT)fs_*6gn\
+;`a@@Vzv5|GQA_Tv@A_V`pBC1E=-?JiWVl1qyRZ~*~CG*O%;r?F;D8m}GuJbim!|AHcI{n@DjvB3\
+?e=jQVH?5oMOik@pOKo-jpJYhYq0Udc>b(wie!2k(PX|9Zh8xb0j77&N4}rOJ^|TDpBv_+kXc$@q\
+zIZ>N-5`8JOx@%-{p<qS|7lcS)!0dQi2(~ybwzx^ZzI0o|6}h=0Hdm|Hy)HIE)lRssTIX)6syrp7\
+6@uuP(}kG8i7=-jbjKCnaV&U31T%Ci)l&okHsaHR^!qdrL9r4MsbOTB?Ofys8Lj+xI{xSic1x(k^\
+jB-ym#iCGc%c)WYSW!R+HbCw|)2Bciy?ndvCxB-?N7lesp&-ae~J6_XPFr35Wij#NA}ZL?kCWqxX\
+LD=udV8x1X4w;wWaS_w&U5H-}ZDKAr!~Fs~1GwqrM#1Ri`Sc8{AQJ<c9$o#`%~H{ad=snV%Y%p>g\
+m4Ssfh62T_@XJ4lV%)WLwT+{UurayDi6mN>tUNp!I?T9Aw`rg<Y<$8|5_IR(^S&$utSs~0QUQ~%;\
+CJgh9v4;2@sV-G{U4^q|&3BiUMzy^>6-&p8VJqL+(=VEfY&<aN>gJ3_I`-u^ZWeMZy|=BU`HxRVR\
+}BK+5gCJ%g@bkJuD(sIU7*ji7&48)p@|V=wF`C23Aot=k7edt7jxYz=#lL7dcAwrlMCa_*fV*X8s\
+w3Y|Ma~tMIDcOp*q&0V2@+LzKZ7P@6bTKc21mLG$&2vXC~ou7R}+SOf{K{OY|tpxz?LS|EqU*Jx*\
+0xrf+y=u328V#>^fwLXzs63u9$B^r9hen70!AH(Q^5$_YKYO-|_fR_27BfyoIy(Qh)MryBZ{&v~N\
+B=RDEobDo&xbDkLIbDn^FF6wfNVFKjYeG?#01PRcd6FB;l#&~w0G{!S9X^dw#PGdaZr7^ot|7+yw\
+&hFY@tYfP8Tl`pAs01p~r^`|U9xw>nffan+AWtR4>^Y*oWJwWkJJL)lnvt1^v#qE$+V6}k%E2Yf+\
+A{l^wMDm2o!O0Zh3;w#R`+`AEz9U@Z&{?(Cw2*ClqUz1&M~gOJ(;sWpVt^Aozc$M@=r|FVW^DW`)\
+z$F)Gvk2@rKP{cauAC-!k1uFRh5O;Y`>6OuiB}YZims-@+-2z2(=vzp!ioo{SFru;%VN_#Q<rzgt\
+Za=p}>SgC9H&o43dA`Qy~E&mYI`Lw6DEEcC<9k+wzTYJF;k^!g-OpBf*%Z!zK~M<it&vrYBCc@fF\
+Prr0zpBG^;dri6dhiJ}!TpyjjM<@FKGosT%1-*dxw)H(cr^UmAH%)QsJ7Q1}?zgaT<%hLDY$3ps=\
+n@8}7dc?1a@QX8fz643#K&*#%U4`Wf&7rI7Q5CFsCxm&NH^bGZmk<Pf1wnsar{MKC=k)#_gG_JXL\
+RYEhmu~A3WpxH!WwYncyIjB4;F7Z0F8BQT^X6M`HwgQ#icG(EXM}n0K)P$1p57ed)dS(CB}a75`L\
+zVGc-~(>cBu0Q@xZ?>F~6sDD0__JQ61~)d`mD7>&)THLLIJo^e4zO{JNy9Cv$wy4uvk4U{B2ZKSv\
+)XJ%dH%?bzY+e;~fsO9i*1ua@+fd{Ve%4%PLT%<3C!AFN4x?2+@>Jyo3=_#mKpmjrxyGu?dj+RYa\
+9lW2jrG~Xj>>Xh&r^Z3QL`sxg`-kFYwj#*txh59zzYaj@-D_L#QT)qe!e(i~|oG&sUXV??P8Sdwa\
+@kDiEV&1v#E50!<Uu)n$`+#rgA|4xyB98KKVssiJX$uWV;Yak8>_8WJBnRPN&@sLX>*r;Ca_{$Ie\
+6}{&y_mmDAMM>I{731>xps@knNoLy$C-L<XZGvW^`ecM6a9Q}>xq!4s)1+Vs)1)WsRo|iuNrvzQV\
+l!<R}G@P`Gl`3XSn{SW{IU*?a`>pERwrNj7sXiJ@OWE#30D?$qu-@tQY7^a}}9KjdOgjB9?AxLy<\
+)AQ1d6Fbw@8Di)1dY*<mSlGQ|9$%<$if(0_9m&Y}(IVWO!yUV93B_$M<R_A>qXzPK-2@b$TP^Kzn\
+ixuL#^`Mtt0Hiv^<S{cy|F8F4u`}Kgu=D0+^-Wb;&_WYCSRkqeFEMMsKhU-9!@YM$Lau=^ENR_W@\
+^{ZbIKe9@9P<4&y)yyhsrf#^@e!XsW+%u+|9%{2``#m()%V~V?c8e^8dG_28=7}(b_3M)I^gHr+V\
+i|cnyJ_U{^fmH$_VCCPJX(1A7A-t|j22NQPC+IG2V_#|5rm<bWY{on=Wz8iqYN3a93cZ%TCjkX5%\
+6tKkst*+=Zq=(M*$qpurH^MbrY+v!7kFNs4)wO(b>YFIX2>;nc+VdBxXS~x?>lCHS^m$xjQByIMS\
+NhOPC%LB1}iP>1acFzyrE5oS7TLX^hc5)f4e<Bf4+-%|PqhEvxTc9lQUHDuz>0!+&=t*j*8~8{rL\
+6ezPYg_reIe&U(EA4#*yNvzt={M;zHLX%C)g9+MkUuhVe)a{K9RgMGT`%$k#D4-|y?u!)XH>Ofr6\
+OMI1$XAt%BMHZfy737l+p=LY<T%k1Y*`8tLD)dbkOXZ0(+Mk}WrbjTRhwGROGFvF3g~fGYf3LWoQ\
+-18}ZNAO8FN@$~7c-~k^!mLECk+Ac-~;#wKYCz&yU3Ad7SUftGPS!;-}b<-1*v*xovLvzYl>@ZI!\
+1ky33T9Gz!M1qCm==F-Rd_PDT7L7oHhS`UUArI0_r%X!Z(G&O)5x@dJa=Bms8lC`MzQnZpu<>*m<\
+V|z6EjZrO~w)o4&1>Rvu4pm8ajez!POHh;?h#S5#yBT~yJwll_WwY%GeiACsd7ItPnsK}VGH4M6c\
+mI}s`;%*O~|u2M$Pyz;qaQH&p_hHS0{G$>PD{T*5g+*(dQUqLEfh#J}OR7NkuQ#sLPj5$FDsQU6I\
+u@F8yee>aoiI3fUu0V$A4hVdHG0o*PhhbI5D2|!N`Be(W-3&RZ*<rd;A{xpIJ#~Pm1?0qNUVwPAL\
+#LheWXDXkf3wXfXA8&&AjG?=Rq~q}{;kx$h5T1{z+Zg(Jkz0D^eQLUjrj;#{}W5}2TW8&HNX14r?\
+N-A)jZ%MHNH*;m-gkduX0uY&F|*yP1OmtWn5KCT{!<^!{*Un&7J|hnsZ__jP7@#MlpsiuSegX2Ku\
+t`d`m7HPc)a!|JuuQ_LRZt2*bhvxbs?%wqf|lbWse6@h~~}^5^^qhrIg|m?9lT44q7bc=_MCc5hH\
+ruMG696=nwxSTs5-6l@*Q2HUZ{2HS7X>m;KO%aK+wztEk*p?iQvZvS^*<rMXO;(uvGIMTaAtUL|G\
+Jt1(AI7YXFNJf4AZvwr(P$_JT?q!A0n++D3dpq!fiN|~R%fb2(g?k;P4H<jGy+I;y+%qSFflt}jk\
+?L~I)j{1FleL$d?&9&ebQ~9TId}}#gd*{sR8@)6&1X_)ddf^aveq;;W4ddB{l(Ng-#k@S^z?uI=#\
+uT;XJk%U?8Yh2>F+42*DAGfro>7wFD!}8aODDXn0!LKz7x{#%{!-CgP`ivq`A~}U2=uXZ@|@6m}=\
+^IY{p$3+6WK4`i)~o`H`@x^m2U@AYFYL4eiIcrK8`2kq*16L{$KuU<DA>CZc}D^VB|_st8~DHr0N\
+|R3D$T3Kmv%eK5Bt=&{S0?(+5YW9LI3pR<T$zn<Rq>))$WG)MPdM>po<zl9J_BZlrk)~&|bDm@DJ\
+<dOP&gdf@K{pq}*{m`kg=}-&Svu#epWV7X|atr$T6!W`|)FzBh(r+<!Sqsf5rHwnMO>_~NpcS+C)\
+byGfKzCz|OUJW2myRcr(($`eg7i0-OGo+R3Lo{w6ZsP<QFNHV<&_q2c?DS^@{dSH^K3_-J7Q8}ll\
+b?w`=|G+IwrEJdRFYJYP9dmkF+}bwa;QulOvg<9$AaB_xkI%Y=5h6e;cVWuB(wXh<Cdh8qu3yL)1\
+&J+pEtU&D1ol7MQ3Rqz$JtrMa`z!JA*_&MR}N15rt?ZrITzh&i51&0J1%LX>JM2A>X(Ztdv_75dB\
+U_FoH2OI7k!X#dG+Hw72K^M<O#g0@P7wmniz+ryOfbXS<xi`B5ExgDvg!P`Nm8HD?CaDyhzWoJ>o\
+L%V!_Oqze{8Zu2ZZUFi<cVg3M>TAm*+O71x@e%c&2CV(zKirbj_d({66If(w9wL7pkbDkiHc=WMd\
+Qv~^(QM1UOvkwT^<u+Jzqc9&edl-tZG67j1<S1mDie-;6jI(^`;nmy$eqZ)8U)KOqpuhCGlmiM%l\
+A@1ktGBFiDL23T>4%j`jvZuHyo>XSwDi9I!2ZMta)Bnp}AT3M%l^=FVRm5;o5#LmsM9no=*JKuIw\
+iV^tGfPqp@>H3Oti_M{|nqY4%Ujv;qA#Wvj6I*Xb4FshWVJ39N6uA6^<9UZ_ptxr%&iy>^+0b1TP\
+tGClK3&EL`|sSE)=Ea9h9&!F02p-Ua_LQk31Y@opnk8UP-{DxJ`v75g-RjGQt_WjcQZRQna?oywe\
+Ryeb?nARTaGNv5kRA5zQqX$PkaSKZ4mZ)FLip7bh_`8snn*?h+Qq_TbimWY6D$;u{nq9~dzeo?`6\
+sbC2q_eQRvpjjK;MLjJFWS@<cR``b6-&!ZMfOfR!}Uu)w|&`>)sEsBw$W~2485+Khi{`@KYdnVS)\
+sLdrl~8c3cD}U$K>)e$A9FOU)+56tlYx6x#~JDjhi_~#Q~;E)jsLBD4K@7v=?~i9y=TI|3pb7Z;1\
+=s#+lK)Os#JR=osidOzd9~OdRkcm>A@XG|@E{12-J>+cf>(=s+Cl#DO?ccp)~9Rr8WKPEAub)A~F\
+zoe^qeIwSPRbVlfr>5NE5rhTV(5B29ee`)2akv+?;LaEEE8sNT@jYk>apm36Z5%?8Z%r+VOqnx;h\
+pV)~5P-NC7X_|sM%^r_`Mil9to=<1tq+&R?b~jG3(aj7a)fV=s)Xq~lN2P=FO~x~+*t+N28}K=e_\
+BaZsIr+09V&}rEgT2PAG}X?Pk8!R&xe}7cvt53*#?I#g%AA&Vz|s?AA4)Qc=C}*z<H;RU>Mon=F5\
+xO^uK{<vfe1ip?zyvK?~cA!Brd2Rj_iI?^D6w_-d>dAGIJ0;a9S6bxi4q9e1qk|3vHq!iUYyoh+u\
+Iv>T7Pzbx+C*wvum)X)fz3ifD4v#E3o%6Y(BP%B;C7s>vKOD20w==BP{qTYq893LP;!wi3H_96{;\
+xBpml;p^cd04euq-ZgN^zqi5~{_x!+TgXi{^hgxSc=v3<It{GORRFGHIhkRL=-!80*Us4wH>(#Rm\
+`hEL)Sk{@N@^d&;3#nLD1KsF#dU%C&YoIEo(MBC!soir;9WVA6nR{W8yF_nO?Q;4gbC)#>n8!cyX\
+g#I+K!2)k@UsT^Xw&uAXM+{Ds>HFWTH*{$F87uM^W?Lxmk4RyS}db@o+{MKbJgA1W41WecZtFvm^\
+GC$Xb}cqTp#(kl5*YGRakVXiYfdNP5;*k1+E1dez-+_3+T=^xQ&M0N5IXax8vw#8NWo%G42v~S^i\
+wlW##T^_L8M^`Gg6iIpOB8syk_(`At`t6#WqvU2hyNmly-q^WO^RyIrM)UKP?N=s4~i>!K&{^_*S\
+(i5Jt&Z4Zuw_GVpwVGmu8=%&)xz5N~v3dWvd6^`A7-e5tTK3>;bR&C4|naKl=G}okgrLJ>J+;hF^\
+I-z+Fs;K99RNM}EhtU1VY1WZg2SRsVb)Zv2?^$=tXSjSl&C|-pSsR&G8q`VAf|-47BB%iEjiSs{b\
+~&$<`>i8drSHub|70)PwS5VffBsa|r@rHuB~yLd{VZRZ>jXlFRCSSEQm)66^kY%Jk4MVCTE#zoQm\
+{Wp5EuG(yd@<(R#80P?SH$pLe<z=p3;&zg;#KYdJLOD=Itx?ozRMmDXJNCzT0!j?6Oj4K+{Zx50C\
+hYr}dX~9H<Fw!E=Ky;E#M|&6`u|ERMCu)WR~j)kk}RN~ZX#O!S=_s!~uBX)HI9U>2CCw|QSFe)GO\
+e_ej{6Zx!R<LvaLe>neuMFL}mN!}qz!d$(^@UM45RMtm_R)DpoPu+}cjG%V`A@U5!uZ^iZ}Z}o_<\
+RnC4xy}ccG$g-FiD$Bv63Hn||om)<{KQ&rhY!1%h_ZUuJhR1vtS|8TVEGjH1Eb^3H(bwC>82T!*{\
+^~bR5s7*mg(W4r2Jj~O^W<PJgJ^vmgLCx%&F8%gYxQwdY!4q_+0(n>vAc0k^_c4L|0Jh9KUQ8%=`\
+OmKqWT(X;3c6ShfCGdvrFdBD=EB0?@@nnQ%~ffsjvgNV~4uQsEu7-ctt5aU2S%@=l9?{&&kQ3lb2\
+)G3V0ilS<+QB$2l!G`q#{1k1>4zFs7r_jxjiY+bllWOm)$dSyh&(-_Gs&_MFG5Io4WJ-Q}h3bLUU\
+cC3B7`L|v{SPqFE&o#Jw)m~)-ynl?4CM>W(&BR^U6g-d;I^r<<wzh4y&Rvq*tNmC)k`>=EVBfFVa\
+HrH)loY|)!l*t+P9$8V<4qbk2fLNZ8ae?2CE;Y4`rv7Ev_X+EM($^b>bHP;e_-f`JJ-BP0i7_|aN\
+y_BeE)Fr_ZWO9~rcHL~M|}6>;?aAw%EzA7Tsp}VkX>4;5S;xC#<@BetMb%c3OUnL_UHo5G~ab7b(\
+ckw-xWKH`=2E0jRa5lf_!x$f?feD>=!#j^@)krLhv1=`2{g&Ua>cH^eX09<ZuP=zY`q;feZNc*~s\
+JVt+ysM1(PoQ+?zS7u%i{l*1JcPvFR?JAQSSadOIjpX(QdI+=?EEcep0y73(1x`x6ysxTZ~Ti4LA\
+{+YYvA>Jl1@T|)Mus^wGc&n%?6=(N$3b>(w?onEu7s!WR)<ML*k4wrL}ZdLo$yFJq*)bJ2<lEQZM\
+_O@22IXivYXkZ^|Z&Qv^V=?7OM#o-v==Al&tN85e8rG5Nl6mv5nAG>#7iPkaBg5C*Oeb@?OQrt-`\
+*A{27(qz|@9&Pf@ThnEjOcpDdz<|e&DjpwiyqE*_@4D(TSztUd@?Uj4))Tk{>_o1@vQXNP6|sm4?\
+Xp@Uw>@TJa0+ie7A4BD$+Mg%4Umhta|1a%@6eyMr1uW;)4OW9rdTe5?VD#kak!>I^8w!?`#Yim?M\
+bG=D%jzR@xq&ZS&l&)IHj!Jt-{J6>hSPBh~FKnNwIq&zVk|OfN{#&qdq4hkck2<+~Zf!>7?quNsS\
++bLl7Of}{m~o6nRwAoH1WdMo2GMM0<adOZ;wud~<bCytC+o?>g5-DQ7FL>=tJu;*PjJ0qKC#nY_D\
+4B$)`|J%i$I%sB1P)T)#nx()k+6Y?kx*MR>*tMI+I4vdQYzD7AouQZJSDzY|dP)E_*v!>}4Yr&;^\
+L|OQankxYZ9qq&fEhJ?*p52WxxRPlsBJo}W_Z~7HI4|T)HuR)+xP|kuyafNmyT-Nl%<B5tP{a9_F\
+h9x)k%l9-Db}6=+CMa(QKTMEuw%RtP|m08)m(3E_egW-k!QI_3Nm5e|tpm2}<UzVYA&umzoBfYmR\
+%aFN}mfeGcd-b9%#c_~aD(;zznZPKY1=6OXKUM*}d?W?*K@IKG|JB=Yji1_IuL;T_ng;m4?|YTj?\
+hJrV=8Cw!G&X5ff%M4K{0sqTek12HO?88|8kgMxZb^I|<N81kFcDS=;Vh*kSLs_le+Aw`7i2YG`*\
+M5Pq$eF~AS=nEe~-=Ec|6Nc~98XNqbT7B7Wp6}h^!9J*n1sUPD#$#(6zj~kH;;AwVbRqbC%zlp@y\
+zTu(q@h2e5+YL{h)<?aHmj0?A``FzLSDKxQk<7F?aV!U&WJ;QVTDeT%DZN{7drDo51hyRVi6ypwy\
+u#qdN$dAWo`paLDaIDe)h8<@iSa$`!$*)DeZvP^MB*(D81bSa{TWBv7CpepPSNO57FxcNwUTU|4P\
+jsJH07_I-k?;I)9F=^SZ_>(af33(YfPKU9msY6GOd%#ROK<`ROVwbLj!;yyD*Cr(Pum=BDW0ah{(\
+NB9X=^D&f-NKJ>OxPe*Db?@9={wxds9kO|uN2VafR{guAgPnwU#q&Q<RQ-xlv9IL4+zAmzW0>~?N\
+PUjgaLETuBS?Gv-vsoOOfn6IxC%*K3SU%{t@X{d#h;r71qfgT!9DNx3j;x<B@-6iH80Z@4!?cS&t\
+`{)DO@9VC>NyIIfS$<#nd1@IcbMslYKljQ9>YEqTQt3h{U{54I`nPJL*JzeI*t);nuaw;Bc^jRQi\
+DBKs7DSXe<4uxBZw->I$e=}nHGz{@3Tm|RikpYy>}k7`4+Vtr`pkG&-JX&v7YuoJ)PdEzWD0<0;c\
+aByZV9l1+;45ceV!X(X8;FBhl}hx85dC*)u%HwP%kZ(399YuwPbgbys`6z4Ul^`_qx@_ekEJ`(Od\
+h@Ce!da5#f}?hU5w^wL6iMAA!(ub#)w*A$mE&uD>uIlt(7?PadgSo5p|wY8|a*b|l(L^_KFuBFgB\
+N;j{L3X>WKo7&_*;mOgj2~Um~O?ZNQHK)HD^G(xH^;=ho*nH2F(yeiUDQ1w83T(T>+d205yE#oH^\
+M?PFc*M!ofBwVa<IIP{=@Z_;Kir)jL8rEUT4pTHf10ZbVy<e$TZ0Gox24p*KKxV#9axG~WKs9(Qu\
+W8eOL&|*<U|vgM-{Z;-^V#r*z};rPKt|OFX)<AuACNAf%o}6J|;2oWgdm)3t`3(^@S9xGed2GC}!\
+uRiq{wWy%9HLsfU{7X}>}_<V$r`vv8UVzi6G}3R77!{kreGz4X}VsVF!Tg*{kpKT~Md$LL+NeDhL\
+FA@1QV3zMmpm%2+;!Oy*9jy;GNa<)gz6YJiln?x|%BnAhN8aS`Qw0QG^OpxtMqdB(Ij{?526XWe;\
+S~tdwshjTF1#&z+b_0{5D}Jm?7rZz2&iwY1XU&rsfG78N^YQq=LFk;2_v-;T3%+4!U9T48aYH!0W\
+S(x*aCOS-+d1Z~%nSO;;uwrKrbam47}KGz2;P?GU%!jJeI1EP?bk?Dsu+pF&v*t|KKz$E)8WgVa)\
+UX2+9G}n)c@mZg)|&Q2?GrWrTb?7M)&2<VCkT4BALW&dP-zjNS}tnOx`js#3{hBuwdRp42Ai7H=C\
+iMPzQYDE=cl4F(=Lb8;_yswqig^*4II_RA;y*M_->dj9}A!9<NGuhWj!BUW!resFy@M#GO0X?&Y0\
+1&1H{qiD~Qq$ssHAN#VIAs_7Ik%{}BdF`y758S9cwku+D-B^UG~r$Jklu^8bJZOjN7H$e|thmA2Y\
+{*=TV=bXNcJBiQm?k3rjPM&5vcC*2-AcI4y&h6o&L*wkxp_%UDdGp<o4icpX3=#$XXuaPm&VVlU5\
+L@r9e?8+rI14)ZQK@gwlxg#>3bUf_@e61I{x`2<{URdwLUq_hWkDhg>`lLVFlf+pPMlsehdyEKNz\
+tz;<Ql8)sKq5ZBA;tLNVwZXFFlP$_tCn;O%V6)(Icj*z7bRZp@Hyo#P{&gPH%{=$S?&H(Lf)@PKR\
+qU4T|~qb>;N_wguh$ZstXqDN(*JID{P`444Pi`!JbKO6R+|_bSCjPk&Ag`{ZPh0nGlta{(V<4V+Q\
+waK>g7ky@cVjF|Jk5vc!{hVIPZ>t%tDvZ+{M4#j$+vX2hDR=Z;w4-e+hqwyK8hz1Iy=~L+I@SN3l\
+I#W+Yj`8#Qy}igP%y%-vzWAY+2?o85nFWrp^>!eEV+~RE^O%k_tAxk6tPkj^L&*!4bNM1WeeN;x-\
+cj?q%IVgtDf->ijPZC47y0hjkWIB_evGpo5}jAv*T+Ps+F4~Eu0niOO!VEIu(oN-`R+xN>^Rr^8x\
+mBeVXdRLr@Z9pTbr(~k-b4J$T8Wy9{uQdjPY{;FzdL#9f^H<#6XO_r3H??Mf)wu=zB9W1N-!%GZ9\
+rdObK#}>Q7%^x=Xk2J<fm|R?Pb9ydK$C=e}&W{!Z;I|Cwu3gPpT;gLlVFw|isGrJIr-3^9x7iGrr\
+V+`k$B=`QQ}P5SDlcrWicK~^rDrjErC>u=>Qi1?Km4!*1SI<x{_i;)gpL+-*^6hCyA8FYi0s?VKf\
+k#w**oPooQ12U5#l76ua|9-J=$7=-AxKm6I7dXAWO)wUZGe`S22<!))Rz`hQs!HJMX4N!vM(jseC\
+(W2{3d-!t{v<PP$2ZEq2lotF<rs0#kT-14g~&@InemN-S`JtEE(;X|^`o>QdM(1%vB2SJl@!5l9N\
+a^Y=CT4v4xT<=h$)&w?VZ4Z=3ZYR6m(m`V`9JF;2va>D7>hwD4HSCRF^$g5#l{%MbW;dEH&6`%A!\
+A}@NX&eFF8-CYi{|RIWB8DkNHqL&lQTgg`TF*mzhSa{#xqHE7Bif%!uTLdcIE*^x9DNyO{VL`9UY\
+1M$r0A?Q83oT0k*t%|-q2anRRJN0M3h(nyXfQRbA;zZ`<?)A;nggzrpWvJklN<f*<Fmdm8T=X6fl\
+K%~ntOYgmQYv0V{DZM;`IZV+dxeKOS^O~Z52SMcfaZcwK2BiAkAMC_E(jMq2^LP2S0#1N@cZMh)t\
+_qtzJACPLh;eMyT1bn01lzZ8h-W8ZiNMS2Ooz^lm5IsbE9zmh=!qrM>HWgy*A#pMi%W0ZWoLcP44\
+3)cFL~5&*|3kon*A62Q#L_Tj*xHU4?nnqy#rB<sRVQiQ02Fi9{nmzznsP1C%zeTy2BN`|H=_v{}m\
+={)RC2L`k^yo{U#6J^vDT*GY!3db2FXOec4FR*KP!xXBn(*tm>c1-sujdpCPegB;9OHD1*h-CdP@\
+kf9sy$xwBM#q(f2Jg<h$|v=ns9BF$yK!k{W7y%2l>H!ge?QBPQ=m>f8*viE2L16$!|r;df$srtnT\
+!9pD6!ohZ$#<42HWv8Z5PF#&5GG@3a9{bwIVM3AaYM-q_pL1%!2gh-_UP5V_2&LgW7kZ6ssj-P{y\
+~Ruu=q8&zOqE;G{SD@K-JUgPYLcG8<+2u<QA#^;PIJ15OeKoA!4??Pav}?ABA=Dj9TxS!#(iPW<-\
+kB|TF(JjWhz~YGd*Rd#I2RBi*kW|E#~>oIi>Ap_z=EG6*w!Lk1A+1NevxMf-P_2i*u^qOy|IhlAG\
+;eqP2gkc4qL)Z4BQaGVK?CN02qhiz`fxACP(pT{`|3V(3mC*t6ND9eJ&{If?KdCc2N&0j<n6i9R%\
+^Di`f>j^|Pn=*=~*R8#oAXG(RA)4|M4F1G$k?@%kW{}klbplae-c#NKbJGS)D$Ce)S*wU>xzR=a7\
+QzE-(!@uH8*7;V7PPqIdsXjH6RW-7z0CuxOm=4>yZUuR3O-}@CsLOVaXJ%>HtfCW7Jh^n<$zwELQ\
+luLBnjD&nNI(0`GhJyXr^KB-WzrdEx>8S0=igFK&Y<6C%uq|DpX|ttQ@>6)W0K2pa@xt`08sZ^$A\
+A5CewgZri;LSUZtu9k>c8>ozxwB1>c9J_|L$x3wy*l{zDC*0Qb`{S%3$;F;J6{yZ(84vm(~B>-}>\
+ENbFj7UK8E*E$8mtA>m!P@woU5{`tG0a{`u~o@BaDjpYQ(p?w{}e`R<?p;y?O-`sdx9gW`s%-$$u\
+`^NzdX0G+`-*=hfMuegV-zo)2w5Ak>s;#5Ys&eF;c_v{y^vcHYI{JwF2u>Pk1H+$zFR1&y<+!jl_\
+V$=O<`$OWkTm0hvm&V7btZ}EkJ@fbYxV_&aE<53dA#o~m9A>e{Y;W(lBP_nm@Lq8zzDN6CGIAgDb\
+BMM79lzb%{9G#Z^sS^X6Z)(TgU!!7gucSs&ejS3y3I?DqM!P|cgFetw-oe$5BBNHKu>_>?*M%$=*\
+vMr1oRc4j{too=nl}EL0>k=r>_V73|M|6==;I(Zw7rLEWZ`>Y|y(vp9K02&~rfF3Ho`s9jm<cp-%\
+vP#3<7DRsVjomroxBdOhf)L5E_9O98zB{APl_@7_LrJm}kC``Mu10L$lr{w3^p2I!fv--|(C0n5(\
+@9d;X60{Sp8wh;7R!U~H({|g-F63{om@hk=XRoL$`&}(7)cYvM++gT3!WLSO$=r@AC67+jvJI$b<\
+3dg@5^qZj^HiAAE^v!rYu>Gx|CxhMv`UkL`9iX>@z7zBlvBDkg(`SG@1oS4@?=a9m2EQXfzXi543\
+iPXCzoS8)0^3gkJrV0a=y$;O$Af+_Y(E?HpTc(XK%Wc8KLd1-<1PmMxA2GAppS-nQUbaYmS2eF0N\
+Y;#`s-N#K_3OamV(}n@f`H6u$?<VAB^!F^tZ77gFXbdvl8@6vHpXef%PBsyJ7i_pvS}UYzBQC9M4\
+wJ?}P1kfj$(L-vRpXVELV(UxfwnL!bT!*v=5p_s9AV`jw!M0R2axj{^M)IG)j<zYFI#1@xmq&jkG\
+gtpA|5fu0Teof!W?9||X62I%`>{Re#|9M5df$AjMz&>w*9ECl^mu$@JqS3vnM0sU*tXYe?&{)2uR\
+=y!lVALBph=R^6d0DUXwGoY`5<8KE22U!0>zZLY2pkIsm4CrUU@>|gt?6(W_pTTx^fPOaCf6)CBj\
+$?fKMHv4<FNN(41N}1C&Ir)=#rO~UN1%@e{RYf`Kz|JOn+f_au>OPIgz+Erm9Tss=#7~Ffc^~B!;\
+3+m3FSN+^xt9p2mSY$|A0OO<3H#hWBmvHASj2Wpl<+u8R(~B{sa1J82>@viSZxw{jmOnJ`(oZ40<\
+taXFcfCFrNp#8n&|;^j3`jpfAKc9P}@+{)3(Z+t~^Fxp;#=)~9!1{0IGWtpA`7f%rKB^rdj#M}ht\
+t=Kr8?#`q6<Jsf5x=r6-|#)JL|)_>4fWBdnw4lF+d^!>os#h@2p{RjO_jQ^mogyUQYx&w}95$IQ9\
+{sa0oSpPxK#`q8VF<AdWKNs}npci8N2mN6vpOv8h5!<t%*J1nz{Xp37M$ji>{0Ds##(&%n=0Bjnf\
+cX#ThrxN=3HsUCU`z7ppTYKrfWAL$XBg-Q!*)i1zAv_aL7#*1A9OF~|Dd;F{0IFutpA|Dg6&_>F9\
+bag^nYRg5Bl2}|3PoZ{2$8)+rOY60lpT3zBlGSpwEEimw<jVwtqp-#`q6<1NP^Dei7zBpqGNa0_y\
+{|e?fm3^k&d^!G70+J`3wV=vzSF4EkVf|APJr)_>5~V}B0l$7A~!^aC*eKhCEYfj$KEe2o8~{}J2\
+2pnr<-AM|Um{R{d5nE!z8!TcX|7aZq!&^N>JWP^Sn=0Bic4COxq^xwdCE(ZNA?Ee9M6V`vw-^Kb5\
+`W0CJK~KQ?5Bk*@|3N<=j(-{GhhqB|^!q_y4tfq8&kE2x;doYp{xP<HK|ciJKj;Tx{sa1TnE!yj6\
+YD?d4$S{SUk2OR0s8-8e<tYDvHl+q$Ak4B^qaB%gMJXUe?fl=+rOY+iSZxwYq9==z76vq(3fHU5B\
+gPD|3QBM$}JD{e_;Fv{Ryo9pbx_KFX+Rt{)4^{^MBCKf$~`d`srBzK|c}eKj_`q{|Wk`u-`jCKLY\
+a~(AzQp2fYOQe?T9M?O)KdF#iYrrx^e7JYxI@eFbcPE9k>9{|Egx?EeJ)VJOd?pijj7XS7fMIkta\
+6|066v4D_v7|3S~i`VacSxLeSF1m&CpdI8pd&=0`;2lOv7{|EhgtpA{2g7F{pbnO2J{RGVaL4OJJ\
+f6%{&{Xd|;iuph2^RfL4dNJ02(BA`J%Rs*s^B>UPhvk=p-iG-P=nrE419~#%KcJUm{RcfC`~N}z3\
+C4fWdvH7p^sg}g0o{%H59lvq{0IFF?Eg8zrymRY5YPu<{tx;RtpA|@4EujTPsI8U`k%1<3wkB?|A\
+T%g#(&WN3Cm}L{wmgg(6?g!2mM*h|3QBb^B>T!$NnGCCt>^teHO-l(05_|2mKn*mx6vd=0Bis$M!\
+GiH)8(}==GTYfc`zK|DfNG^&j--z}I@vZ^!r#`gn~0px0sl59q(Z`VV>zwtqoC4C_DELyZ4F^66u\
++{|EGkF#iGlO6>mx{Ulg^6zJP9{|EgwtpA`tgZV$`|A+A(^vRh2fIbuJKj<FJe?V`>{(sPq!}c%e\
+^RWJdegoEj&=14-5Bj5+|A4+6`~N}z68nEZe-HcrLBAL4Kj=F!{)4_6`+q>c4C_DW=VAQ^{Vc5ip\
+#L1}Kj=4M{tvnnmhS?6F2;Y*e~tMM=&NA)xD%oO1oMB;zYmKK1N|**|AKxf=0BiUV*Llb2YjV~em\
+Leopbvxl(Rk3yaQqAOi?RO`^dDgVKj<?s{)2u8=(9n;7JQX}{srbgps&XMf6#vh+gSqo5m^60-yi\
+cI(C@+g2Xr^~|A78JEWZNu6EObcabo{J=vA2ifPMjve}O&{$A3XD#{3`j5jg(=^gm<!7xYCq{ssC\
+YSpQFgenRa31brkN&oIzOVg3X9dhGuJeKd~$f?k6CpP+BS`VabnSpPx)3HE=2-h}lZ^!s4HGeG|g\
+^MBCK!1@pRd$9cy&@aILf6yy&{txJ%VEzO8V$6R)Ps98N^mj1+gPxA<U(k=l{0H>AG5&-8F}8m}-\
+;VJg^s$)#gMJm(e>@({|3M#w^&j-%nE!y@fc>AKKZp5$GQ?rb|3Uu*<3H$=F#dx+1mi#GQ!)Ps{U\
+PlC0sRfk|8c+A{|WkInE!)58S@{|S781F`uDK^2lQ#!{{#AmnE!yj7UMtYPhkBA{Y$L>pfAMw5Bg\
+V_|A1bL^&j+;u>A}A%^3edzZUy{Kp%niAM{k5&k6cb*#8Ook8%79^pTkVfc`7&{{ejq_WywXBF2B\
+ve~$g1C&M@(=0Bh(VEY&JA(;Pzz6JAt&`*Nxj|Tm382>>Zh4CNs?_>TC`UhD5L7$8B-#~u{$A3Xz\
+hw&fusTlu3KMLzV=p`8cL0^RV59mjOz6A7tWB(86-I)J?{zJ@vKwpUY59pgQ{|EhD%zr>14)viK^\
+iCZA0{s%4{|5R2IR6vtA+~?<JYxP2`h{5kL0^LPAIlBrKb!*NW!U}&{cD{626{5qf6ymj{0IFh%z\
+r?C3FANLkHPU|g1#5*cRc7rvHpX80GzKp(9<yfgFXoJf6x!d{!h?v$NV4kV=(@MUW4%;^fHY9pl4\
+(J2mLba{|9|I_Wy(a2dw{~AB*uH^pRNq@i;O5gI<gEAM{z6|9~Ek?O)J)aQ*}6&tm)sy&BuUpkIL\
+fKcHWN`F{%B_c8wg{rlMe1NzN4{{i&BWB(`UN8<b+(0_ydKcIh#^B+Ke1mi#Gk7NE1`ja^S0rY=h\
+`xo@vvHu73DVYC&o`CTm^dzkRc%0b(33@a3|A2lRwtqq27q07Np#K)@Kj^cu{)7HC=Kr8yh4mlwU\
+*PyJ=nJs@3%UpUe?Tw5`Vac?nE!)*A=ZD;t1<rv{a@Js1Nw{D|LO4Q8*%&#^pCLp3;KA>|3QBV^B\
+>Tk#ry~KpX2x!=$B&r2mO4E|DeB*{hy$>fUi8z*I@e>^meTOpl`?iPtfym{1^06%zr@tH^zU^7hw\
+Ja`e>~GpjTo31NsS=|A1bN`9J6nVf_dFYMlQ7`gDx{pwGwrAM|b5{{#9`%>O~3gZU5Wk74}>{ZWk\
+npu2JYC+L@8`!^NFVX^*$UW@S`^a8B^p#Kr`AJDJB_Alrc<LwCa1dRWnpNQjMpg)N9AN1c~{tx;W\
+nE!x&Bes7*zYFU>=(Dl@gWiSpAM|T5{)2uB_J4wYKF)sweFDyZ1N|hd|DYd={Xd{@#Q6`PH)H!3^\
+dqtV6ZB-ve?UJC>p$onIR1;<!TbmGld=B?^yQfUgPw%_KcG*;_@4%O4(30gKZE^0p#K*0AJE^&`V\
+V>?)_>5y!TJyS8jSy----P{pg)K8AM_hA{{g)c>p$p^V*U^MY^?vF{|NIR(BH)R5BgfH|Dcb<`Ol\
+yqh3#L^bFlt{-iYJBpnrh%AM_M#|AIai^B>TE1Lvz5^c`6LL667$AN22G{0IGMtpB(?<a=G9FUI-\
+*p!Z<@1Ntr4{!NGdV*LmG6|DcD{}%KSps&FB&!AUe{RjOGtpA{|#P|>T$r%4ZKNItR(7o9I5Bf&T\
+e?afR{0H<?K%WizPjLPZ9w$Ek2s%Dsxd`;%Vg3X9r<ng>xnci5=nrB4C+I0S{tNoCIR78?49tH(-\
+w*R2&>zJ9f6!-Q|0n2oVE+&3n=$_fJr(mG(7UnzgZ@|S{{cM>+rJr5pRxZF^k=aD2lO#G{ssD9u>\
+OO-1jm1Id944SKaBMs^tUko2mO~g{tNmr%zr>X0{cHfKNjOZ=zqobFX-u*|A2lY&VK-X9L|3R{rA\
+}a1G*RMKj;aV|AYQAwtqpNfcZb@Kg9e8bbLT}CDsSbe?UJK^MBCiVf+XEAlUw9&`-hmkM#lTKj=T\
+e_Als@F#iYrdCY&tKtBNXe}eu`jQ^l#VEhOD931}z{qI=+LH`@he*k?7)_>4PVgC>4!!Z8={V^Q>\
+0{u;_|DeZX{tx=Eu>TXw0rMZw&%pWrpl`(b5Be(1f3V!J{}c4}82>@9!1@26ug3fb^nYOe2Yqj>|\
+DdnM_z(J{SpPvEgYh5qmofhbJs;b@pqFF*5BkZN|AW2^^B>TEkK<osA+BQl2mKgq|AO9({r{jZ!1\
+@pRquBosdLhPt(2KDCgZ?MX|3NRs_z(K;F#dx+7W+SOznK4kelFI3&`-zu5Be<_|3UvT)_>4{iS1\
+v|pT+k-pkIvtpznwEACDj7Kj@j*{||Z|=0BiUVf+VuI6nUZ`b}8>LH`{4KS3Xd`48y$qM0txufhH\
+w(67h-f6!mV`kx8;KgNI1TQL6teHO-l&?jL21Ny0$|AYQE)_>5GaQ*}6%klj`pf_Rt2fYsKKj^>0\
+`Oly~kM$q)GHm~%j`=_6)3N;v`Z}!tp#Ko#Kj^1n{sVeE_Wy%^6SjXrKOggd(Eo(>AM~$q{txJvV\
+g1MRi}^q3*J1tx`e&H`gMJ3)KcKJ2_>boc^MBB<$M_HWBUt~(K|X-<-$1_`pML@UubBUX{y2_*f&\
+Ob8{{sF0u>T+QB<%kI{Zg#|pnr(<AM|4E{|9|<tpA{wz<IeC^m>f{pr4NUKj<DD{{p=Z>p$qPVf_\
+a^5Bq;WZ^8Hv`e9iALH{%6KcE+3{sa0+*#86iK{)>z^x2sIfPO#5f6x!d_z!v$=0Bj{iO)ZRJ`?k\
+Q(4WHmAM~Zz|8pv|J23wNeL2>D&_`qa2mKeA|A6kn@h{Nt!TJw+3+6wdPr>{j^j-M;7w9gm|Dby@\
+{|9{y#(&Vi#`q8V!8rdD^en9Zps&OJAJErg`xnax`~N{d4(Gptek#^~&==tNFX+F<_z(JCnE!x&I\
+gbB=z6s+$=nkC!1NwOw|3R<8_z(JF82>?k9rJ(Ce~kGL=#4o3bsF?zVEhOD2blkWo`~;10sRGx|D\
+gW@<3H#>!TbmGB7FV@^eveGgZ>J(e?fl|+rOaSi}4?H7sh|k$7BB|=&xb^1NyJA{}c2#vHu_Re_{\
+R)`e&H`fIb}SKj?>G|0n31F#iYr6YT#7eF?^Y(5tcjgMJIne*pb$9RC9SB5ePHejVojp#Ke@{{sC\
+gtpA{Yi1`obgYm_4r$hS!<3H#XIR63kL>&JG{dk=J0Q#S?{|EH_G5&)-2lIc>pT+zK^joq2AN1F8\
+{0sE|!~TEJ&&K(mpr42HKSBRD=0Bj{h50||7hwGdeFN5i(9<yfgT5E$|DdnH`VaaJeE$RJM`Qg5e\
+F^wl3Hm6^|3N<!$G<>diun)dZjAq+Ux)b*ZXfd>(4Cn7gZ?G<|AYP%#{VpMP8RDw=%-`<59m9w{R\
+{d;%zr>n!}<^UhgknXzXJ1r&@aONf6)Ji`48wrG5&+@#_?a!Te1HW^i#0@gMJLo{{($I=0BjHh50\
+||*JJ(<x)b9+ZU^*bpzj0M#T}sUhxtF~Ut#_O`rk4C0sYt5{|Wjk%>O~(f%D%$zYFU>==Wm&1NsS\
+A|3QBe`+q>s$M_HW**O07V~B@1{tNp4nE!)*5B7h8-i-Y}pl4(K2mMXVe?YIoZYt1!iTMxcH(~w*\
+`n4GUL4OGIAJEre{Rcf2^MBAU#rhBW37G$YejLt!1N}bC|8e_R|3Tk?^&j+U*#8N72j>5v=i>M;=\
+(pqiAJEUi_z(I|vHuhFi?IHK{v5V{@pv%)gFYSeAJF&0=O00D!}&j;zm5GrKY{*0%>O|@67zr1kH\
+h*8`Y|~F2lTzM{~z@Car_JP3o!o&eFo+~pl`+a5Bj|r|3UA<{0H=Xu>OPoV~qcxKZW@Z=qXtLLH`\
+HFf6!}i{xj$$SpPwvhx30xe;Ss*1N3*W{}c37?Ee9MFxG$2|BC%Tpijp92lOK_{|9{$&i?`ZKFt3\
+?AA$3KKySnTAJ9+4{vXiq#{Qr2(0;`D5Biyy|A77=)_>41#`+KXIPCuceG0~Z(8pr`59sG%{RjPI\
+%>O}Oit!)xTI~M;eKEFwLGQr%51{`O<3H$|F#iYr4_N;}pNjP#^lz~L6ZC^I{|EiwIR63k!!iE{{\
+Xm@m4EiE$|AL;0`48wn#rh9=F6RHB{|Vzi=-cr5N6@EX{}1TrVEzMo4aR@0pP2tofag*%{|9{^Z2\
+y9OCC>i@eJZwpL3d*Q1Nz?h{3GZ;#P%=fPh<WA`b5lsK>r-azd%0}-+vDJx!C^+`a78afPNp=f6z\
+a|`VV>@Y=05xZ)5ux^uaj)0rW$#{~z@GvHpYpI_5v1--Yd8(C@(b4|+Gof6#Bi{!h@$vHpYJh<V6\
+&|NHKL-@^ZWI`qh|vKN0aB)dBP)uZ-~%dTuL+iTax?8R$`&?wBVjJK8i$*!b#)Q_P@ndQy%7N2Z;\
+YuBz_OAQY)yoq@)!>gG0Hv9ndV8eGZ#~Z$$c^|{qFq=-|ZI>|*F<i*JpW*YE_cuI&`2fQX<^v5M&\
+75F(IP*b<2Qd#d{P8z74<rA~!^uDM!Q`L$d*q+_5c1EQNdB1*CI8Hak$>h9<e&Nb<e&L)^3VJO^3\
+Qw(`DY$U{+W*?|I9~`{~nu1k$>i+$v^WC$v^Wk<e&Li^3R+^{+W*>|IEjef9BETpZNsx&-^3u&wL\
+{JXFiGiGbfXO=99@k^C{&2YnxNZKeL1UGpCY&<}~upoKF6kGsr*l81m0Nmi#kkl7HrL<e&Le^3Qx\
+4`DZ?z{4-~ff94;Pf99W%|9{&&p8PXUApgu~kbmYg$v^W%^3Uuf|IBBRf9A8vKXW$uXP!j<nJ1Hf\
+<{a|RJcax-=aPTsbI3pQx#a&VoAby&^LgZ-c`Es5o<{zer;~r?eDcryQ}WMzKKW;!LH?O9ApguiB\
+mc}7l7Hr(lYiy{^3Qw``Db>K|1WL6nEW#rl7Hrz<e#~S{4>uY|IBXk&s<FYnJ*##%(KZqvxodM|A\
+PE8UrPR&=a7G9FZpMlOa7VXk^h}Gmymzv%g8_TeDcp+O8%M4$Uk#A`Db20{+TZ)|I7=?Kl2sjpZS\
+;MpZQAi&wLg6XRaXs%vY0t=3kNjFKk{!{+X{K|IEK8|ICZYKl8QZpShC!GyjJCGyj(SGcO_k%vI!\
+{`FG@>xtjbl{~!5ht|9--*O7nb-;@8(ZC*<LnXf1R%r}sK<{QaB^G)QRxt9Dh-%S3Q|3Lnkmyv(w\
+KazjuKaqdtTgX52t>mA%j{Gy<M*f*^C;$Jl`3~~Wd?)#5{xkV!{tNkMzKi@b*OPzdyU9QEJ>;KxI\
+r(S)EBR;s8~JDcJNak6m;5s~kbma;$UpP_<o`39SCD_^2gpD3gXEw2ALO6;A@a}MNdB20CjZQjkb\
+mZt<e&Lb^3VJj`DcEd{4+m6{+XM|Kl791pZO{B|EbN*<ezyJ`Db2D{+ZX1f9AF1pSgwnGp{56%&p\
+{~c|G}OewzF<KSTbRpC$jy8^}L%8~JB`j{Gw}PyRo#c_aB}-bDVHUm*X?FOq-em&iYJJNajRnfx=\
+qLjIXIlYiz{$v^XJ<e&L<^3S}5{4;luf95yHKl7X9|6`lCl7Hs6$UpPj<e&K+^3VJ(`DgAV|IF`^\
+f9CheKXVuPXWmBsng2=tnYWXF<`2j}b2s^C{*e4Le?<Ow*t~=MGk;9}nLi=_%%75f=FiAK^S{VH^\
+XKHB`3v&Typ#Mhe@XtCzasz4|0e&;Uz3049`eup4f$u@MgBjsS%1J!`DY$vcoXwphF3A~ZTJD^!G\
+`Z-jyHTg^FD^JVcys9Wz0hi7c%c>_&nzQ4NqV`z_5e)K*L8fCm0^ie30Qm%tH--{2{mh$v^XO^3Q\
+xQ`Dgwf`DZ?a{4*z#f96BUKl5SapLqoNXZ}9<XFi<#Gyj16Gao_znMaa;<|D~J^HJo#o7?~7pZRF\
+=&-_F3&wLE|XFitvGbfRM=Htje^YP@Lc{KTFK7sr*|A_oEpGf|hPa^-!$>g8;Wb)5^3i<zl+yCUB\
+*+Kr9Q^`Mb8u@2VC;!YD<ezyA`DY$W{+Tn$Kl3>9&wMKRXFiSmGoMcWnX|}0^N-0t^H0eCc5eTZf\
+946~pZN^(&wM8NXP!v@nVsaH`7H9!d^Y)K&L;oNlgK~wWb)6PL;jhkkbmY}^3Qw@`DZ?t{Qr~N|K\
+y+fJo3*xmHabLBmd0P$v<;G`Dgwq`DZ?#{4>uW|I8PVf99W&f94CxKl9JYKXU>3XTFI1GrP$DHg5\
+luf968+&pea-GZ&G6=2_&Q*-ieLi^)IpCFGxZHu-1vkbmZ1kbmY&$v^WP^3Uug|IBmAKl42D-^J~\
+J^3Qx3`DdO_{+Ub3KXV!RXD%oI%nQgr^X259c_H~{zJmNS|C0POUrGL%uOk1<7381!YVyzgEAsz7\
+xBtmM^EKq3`Pby1c`^BCzLxwmSCW6`-;jUi-;#gkCFGyEiu^PGj{GxMlYi#_Bmc}b<e&LE^3VKx^\
+8X&U|H(h|_2i%V2J+8*Bl%~(iTpFyl7Hr#$v^WS$UpNk^3VK7^3VJy^3Qw=`DebB{4>{)f9BiBKl\
+AP6zmwbl<e&LY^3VKd^3VJi^3Qx1`Dd;t|IBxjf98A0Kl5_(&-_>N&-^#?&-{1t&wMZWXKo<>%=e\
+Lh=KIP2yWIXK|I81Nf940tKl4AxKl4N6pSh9zGe1oJnI9ql%qz)1^P}XS`7!d({5bh%euDfnH<5q\
+lC&@qaQ{?|0ZvT^i=2hgMc{TZGUPJzw*OGtc7V^)$j{GyXl7Hs)<e&Lz^3VJX`DcEX{4;ML|IBUV\
+pZPiR&-^_3f1BI?<ezyH`DcEC{4>8u{+VAQ|IF>=pZR6-&-@DcXWmTynO`OU%&(Du=GVzT^A_^Y+\
+(G`C-yr|YZ<7DFxcyK5ncpJ+%x{x_=6A?H^Sk7qxs&`ezeoO=-zWdfUF4s68~JDcC;4aIPX3ucAp\
+gwW<e&LN^3VJc`QOUzfAY`#G5Kfyg#0sqO8%KYBmd0*BLB>vlYizf$UpN=^3VJw`Dgx${4@WX{4;\
++|{+WBoKl3-_pLrMgf0Nt)dl~=CgA8wC-plYR=DiI+z&zOSoy_ruuV>!J@HNc)8orEqh~Yx!{S2S\
+SyuaZI%m)~DFdu06XyydN!<i2<JcxOy;g8?o_CNV&9!~z54<`T2-y{Fbhme2fMDovkDEVhTjQlf?\
+ApgwYC;!ZclYizPkbmYQ$UpN)^3QxE`DZ?g{C9BspZqf)P5zmGNdB3RA^*(Bl7HqT^3Qx6`DZ?!{\
+4<Xx|I8<lf94;Nf94a(Kl4fCpE;TQGoMWUnNK1ATe$sC{+S)*pE;HMGpCV%=5+GUoI(DX$B=*KvE\
+-jQll(J}Bmc~&l7HsY$UpPx<exc<{4@WU{4@WA{J+lafAY^ff&4R{LH?P~B>&74$v?A`{4<|L{+Z\
+7v|IFFspLr7bXP!*{nRCcL^Az&WoJ;<h&msTJ=aT=|xcyK5na?Bt%u~rf^EC3$Je~YA=aYZtpOSy\
+(^T|K+4D!!>0r_YC8Tn_vko+_MocuEvkbmZj$Un1-{J+ZWfAY^<NdB2;l7HqR^3Obr{4=}BKXWnp\
+XTF5|GtVaf%pUU3{0s8Wd@1>7o<shbz2u*HF8ODkNB%c+`=9(XUq=3!=aYZtQu5DSM*f-0$v^V~^\
+3QxZ`Db28{+X{J|IEK6|IAmCf99*mKXV27XTF;JGyjVGzryW*^3Qw?`Dgw$`Db2C{+X{O|IC%-pZ\
+PcBpZT}spLq%SXRadu%)cZ5%+=(d`Txj2a}D`tzK;Ae|DOE6%<X^j&wM@kXTE{_Gv7%5nQtQh%(d\
+j7`DXIZ{0H*Syo~%a|B?JN|B3uF-$MSGZzccCb>yG<HuBGWJNa+t_CNV&zLWej|C#(V|AqWB-$nk\
+J>&ZX!-Q=J79`et;ocuHYmHadRjr=qJo%}Q3Oa7S~$UpOa<e&L|^8XUI|H(h|1LU9iLGsW15Ax6a\
+5cy|rB>&70lYiz%$UpN+^3VJz`DcEN{4+mJ{+XX3|IAI~pZQ7h&-@hmf05h&<ezyJ`Db2D{+ZX1f\
+9AF1pSgwnGp{56%&p{~c|G}OewzF<KSTbRpC$jy8^}L%8~JB`j{Gw}PyS!v_CNV&-bDVHUm*X?FO\
+q-em&iYJJNajRnfx=qLjIXIlYiz{$v^XJ<e&L<^3S}5{4;luf95yHKl7X9e-pR=$v^X3<e&L%^3V\
+JZ`DcEY{4;lwf9ChdKlA(KpSg?tGjAjR%>N|+%-hL7^9SUgxtshme@OnBKO+Adx&2T6nLj4~%%6~\
+d=1<8#^JnCr`CsIp`E&Bm`~~@E-bwzMza;<6Uy*<2f0KXaugO1i5BX>QhWs<{BLB~G`+slapLvks\
+P0V{4Ud6n(;Rl!p8@`h{-thIz`xw54d0)eqF%L0Z$h@E7^O*NHJc0QD!w%*H4Ij;%V0bw5L52r04\
+>kPpbKL$X|IEY5Kl8!lpZR;_pZO5-&zwm9nGYrZ%!iSG<`Lwd`TOLb`Ec^j`~&jOd<6Mt9!dV0k0\
+k%hN0I+FZvT^i=A+3!^AE{C^D*R~`B?JLoJ9Vak0bxg$CH2N(d3``1oF@PBl6FDBKc=NiTpDslYi\
+!u$v^Wc<bMOV|H(hIgZwk6l7Hqj^3R-3{+Tn#Kl2#!&pej=GiQ>2=5geo`Bd`Hd>Z*@KArqCXOVy\
+AACrIPpOF7&x&2T6nJ18c<}=7Y^O@wIc_R5|c9MVQv&cX5+2o%&oBT6RBLB>j$v<-r`DdO&{+V;h\
+Kl3@{pZQ$!{|vYP$v^XX<ezye`DdO+{+Xwff98Dh&-_#J&wM`lXP!a+nJ*y!%s(Ul%omb>=AV;)<\
+^uB1d=dF)c9H+5x&2T6nG4B3^Gx#3TtxnvXOVwqH~D8SCjZQrkbmac<e%9?{+WM4{+TZ&|IBm9Ke\
+LzoGtVXe%=5_qdT#%df9A``Kl6O@&s<9WnajvOb2<5EUO@htFDL)Z3&}t87381!m*k)MO7hQq75Q\
+hbApgu)lYi!4k^fe1|C4{_Ysf$IugO32V)D;?E%|4zB>&96A^*(3CI8Gz$Uk!x`Dgwe`Dd;s|IGh\
+K{+VmYKl63upZWLXe;v2~$v^Y;<e&Kl^3QxD`Dea~{4>{*f99LXKl2~RKl3v3&-_R7&-^Fy&wLB{\
+XTFvEGuM%S=G(|W^X=rnh1>t+pZQMm&-`cd&-@qi&wLm8XRasz%y*N2=6lFL^K$af{8#eN{5SH?{\
+CD!td@uQDZXo~6_mO|*`^o=WZvT^i<_E|>^MmA{`5)w;`62Sp+(`bJA143IkC1=nmE@oKQS#6H82\
+M*@ocuFCLH?PW$UpOw<e&K|^1p`L|Ky)}75QggP5znJkbma2<e#~P{4=j3|IDrApLsp`XMUReGe1\
+NAnV%*9%p1r*a~t_*evbSzKTrNwbNiqCGjAgQ%rB6C<`>C7^GoEPxt;tozfAs_Um^d@o5?@(tK^^\
+gHS*8=I{9bbLjIXM$UpNN<e&LX^1q7P|Ky+fE%ML&Hu-0Mhx{|YOa7TV$v^XZ<e&L{^3U8w{+YLt\
+f98LZf9CDvpZNpw&)iM^nLi}|%pZ~eW^VtJf98+LKl3N#pZQbr&-@wrXZ{!YXa1c0Gk-z;nRk+Z<\
+}b-V^H=1b`QPN9`D^me+(Z7Ezajt3yU71j-2NYI{4)<Syoq@)!>gG0Hv9ndV8eGZ#~Z$$c^|{qFz\
+;*lGUg$M3z_#bd>-@uh9@u|VA#QYpy8vL6ATY$KFIJO=Ani^ev;e&<ezys`DZ?u{4;-#{4*ay{+S\
+cWKl7pFpZPHI&pd+sGk>4_GapX=nSVh3nU5g<%p=J^^O5AA`6%+=#O;6b&wMobXZ|7iXFi7fGapO\
+-nUlyr^Ks;#`FQfrJevG7pFsYZe?<P7PbB}$Cy{^VWb)5^GWlmdh5SFk?SJym>>&TlspOwIjr=pG\
+lYiz6^3Obm{4<Xw|2BWJE2-o4z2b%*HId%mp*VMoKRX3y3C<9lEI3K<NWqDM69mT#?h(iPFTve{I\
+|WO>?Sk6`w+L<$+$gv~aJ}F<!L@>G1Xl{K5L_<UE7&c#Kybc1|AL)@vjk@dP8OUbc%<M&!3l!n1^\
+2ur&cEPp!JUFT1h)%r6Wk)WNpPd!2Ep}$>jc*dt`S@*xI%EbV6R}e-~z$<f^!8s1!oD)5S%PHN$^\
+O)iGmXZ#|!RxRh)mp-GVy>cL;75+$Ok1aFgIh!3~1z1=k6#6<i~@QgDUfa=~7~ZovhD^9AP$b_&i\
+CoFO<_aFXDWf)fQN2#y!rvss*f!QFy81$PK;7u+VeMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!EV6?\
+g7XFE3U&(45}YA8S#Xlzk%AKiCkT!g-1CY!|AM;(cM9$h+%C9HaEst3!Ht3&1lJ3$6I?5}MsTIz3\
+c=-qy@K6>3k2s2&K2wwoFzCzaI)Ye!6OAH3QiClFSzGrasCB&3+@!$A-G*|o8T6~O@bQ*Hwdm5Tq\
+n3zaE;(f!4-nb1$za%1s4d;7o02DDL6}ThTvquNrFcTP86IVI9_m1yEy-Xy9IX&?hxEAxJ_`2;3m\
+P1f*S<a3$7DfE4W5*rQiy|<$}F}-GU1Q=L^mi>=c|OI74u<;3UB#1t$tl5F9VK=OuCe1$PVX6x<=\
+WU2vP=7Qsz|8wEEAt`}S<xK?nD;7Y+2g3ASa1-k_o2+kLrE7&PGOK^tZWWh;-M+#09oFF(}aL<e4\
+{0r_D+$p$2aJ%3(!7YND1UCw95L_>~PH?T@8o`x<D+HGd_6l|jE)bkAI9IS!aF*Z<!O4P?1dkM)C\
+^$iIyx^V}#Q7K8Ex1!~hv0U>ZGu|_HwkVO+#tAKaGl^<!8L*_1y=|z7wi@67F-}WUvREqr{FBX8G\
+@4qCkY-YI8ktd;CR73o5cAS+%33MaEIV_!EJ(D1UCt86x<-VUT~e@TER7fD+N~wE*I<->=s-gIA3\
+tCV5i_L!5M;+1t$p}DL7GZg5Y?;JsZXO7u+qlQ*ejicEN3eTLd==ZWP=gxL$Cb;99{of-41A2rd`\
+w73>yVAUI!eu3)F&EWsIqlLaRU9w|6caDw1?!9CB5^DnqtaHrr7!R><E1h)uo65J@bL2$j`I>EJq\
+YXnyct`J-<*elpAxIl2e;9S8@!C8Vc1Sbnl5<F6HqTmF<@q&Av6X#!Wx8P2}9fI2hw+U_$+$6YBa\
+D(7_!F7Ub1=k3!6kH*=T(DQLTX2Eke8IVbor1FjX9!LfoFsUp;6%X*g5w4Ew2AXCxLa_i;10p<g4\
++bQ2yPPGD7Zmzz2G{*wSsE|R|>8WTrSuv*e$p~aK7MN!A`+hf-?js3r-R|QgEW+1i|rwdp3ykFSu\
+K9r{E63?Sk6`w+L<$+$gv~aJ}F<!L@>G1Xl{K5L_<UE7&c#Kybd`T)|GkS%NbJCksvzJW_C?-~_?\
+(f_t77=U;HQ;7-9Eg4+eR32qVGB)Cy<gW!6>b%JXJ*9fi@Tp_qzuvf5KaDm`_!MTE+g0lo?2u>E9\
+BzUCYM8OGy;|2FTBhJ6zZo!>`I|R22ZWG)hxJhuM;0D3<g6jm=3a$}cDY!y#xnQqgx8MT7`GRu=I\
+|XM6&Jdg|I7#qG!HI$s1jh^Rd0L!*!QFy81$PK;7u+VeMR1egM!^k&>jl>dt`%G(xKeP1;BvuU!E\
+V6?g7XFE3U&(45}YA8S#Xlzk%AKiCkT!g+_PSsf5F{?I|X+LZWr7pxJ7W2;6}j>g6jp>39c1fBe+\
+s<h2V0*Ucqj`1%mSh=L&WT&Jvs<I9YI#;E{q81t$oO7u?e-&cEPp!JUFT1h)%r6Wk)WNpPd!2Ep}\
+$>jc*dt`S@*xI%EbV6R}e-~z$<f^!8s1!oD)5S%PHN$^O)iGmXZ#|!RRC(gg%Zo!>`I|R22ZWG)h\
+xJhuM;0D3<g6jm=3a$}cDY!y#xnQqgx8MT7`GRu=I|XM6&Jdg|I7#qG!HI$s1jh^RX%XjNaJS%2!\
+5xCz1-A)q5!@uWQE-Fcdck#qYX#Q`t`uA$xLmMTuv>6};C#Wkf}Mi11ZN0N7Mvt_q~Jus34-GV_p\
+BA?UvRhJPQe|5+Xc4?ZV}uhxKVI};CjJzf@=lW2(A=dA-G(ySFl@ff#7_>xq_X7vjk@dP8OUbc%<\
+M&!3l!n1^28G=U;HQ;7-9Eg4+eR32qVGB)Cy<gW!6>b%JXJ*9fi@Tp_qzuvf5KaDm`_!MTE+g0lo\
+?2u>E9BzUCYM8OGy;|2Gu7Uy4Zx8P2}9fI2hw+U_$+$6YBaD(7_!F7Ub1=k3!6kH*=T(DQLTX2Ek\
+e8IVbor1FjX9!LfoFsUp;6%X*g5w4EtP<y6aJS%2!5xCz1-A)q5!@uWQE-Fcdck#qYX#Q`t`uA$x\
+LmMTuv>6};C#Wkf}Mi11ZN0N7Mvt_q~Jus34-GV_cV+1FSuK9r{E63?Sk6`w+L<$+$gv~aJ}F<!L\
+@>G1Xl{K5L_<UE7&c#Kybd`T)|GkS%NbJCksvzJW_C?-~_?(f_t74=U;HQ;7-9Eg4+eR32qVGB)C\
+y<gW!6>b%JXJ*9fi@Tp_qzuvf5KaDm`_!MTE+g0lo?2u>E9BzUCYM8OGy;|2FTDbBy(Zo!>`I|R2\
+2ZWG)hxJhuM;0D3<g6jm=3a$}cDY!y#xnQqgx8MT7`GRu=I|XM6&Jdg|I7#qG!HI$s1jh^RX%gpO\
+aJS%2!5xCz1-A)q5!@uWQE-Fcdck#qYX#Q`t`uA$xLmMTuv>6};C#Wkf}Mi11ZN0N7Mvt_q~Jus3\
+4-GV_dFrazu<1coq{_Aw+n6)+#<M1aHHS`!S#ac1lJ0#5nL&_LU6fYuVA;}0>Sx$a|JsEX9>;_oG\
+ds=@JPXlf)fPC3+{PboPWXHf;$Cw2yPeLCb&g#li)_d4T9?h*9oo_TqC$raE0J<!Ct{`!3Bcz1?L\
+KO3eFOoAvjrZlHieo69p#-ju+hXm^lA}y9IX&?hxEAxJ_`2;3mP1f*S<a3$7DfYjbu@)|cw{?3(y\
+b^p9~n%M!Dz<F8((ey?mU+i%y_p+_x>Q~z6I{Zz|8ZI;hit$&>GO?K6e>{TEBBzx7)y|V|c%ii=&\
+*&%8J`PK%8?Alsv_G7QF_rEBsQorH5{KWk1#aS=tm&0dQb(S5NU7dB1(z{-LeAlk7S-W=aS{GlSc\
+u;{_*Khr8m#aVOU-H#@)3UGmV2M7ks){AqRppDat7;djKUdY1ssB!_sw`1IW@T3oP8w|%a&|eIvu\
+m8UXIHg$m3+QyS9VSQ?b+42OO)1}UG<!nU+vVg^N#8oy>4}_-cWW;d9(goU5ELb`CY$H*WOh8o3x\
+Jpy{c9HUbQN_+8juBwR4fR;X9tuSg^=maE0DL)#mK#@~&CgY3b$&%TC>%rmbaHt+Dr0r54-1uTL~\
+Pyy*>ESN;0Of2r~syjAfvYjsInSg^(}ob1IPj8X;Dr4FJ?dEco&ydHOLbJ;;8w00${&1^r$Q0uB)\
+`f#gOn}xEgUisv{?5g$IUu?`?+%;(F)4pw1RqRv+y+f_EbLhjv)Q=rQACAjhJ@lsLf;CHF&narj%\
+~<q1RnfOP^~a~<);T|l%dXDftk=#Sv|73PD7$K%+G*DTn|AG5ykn3$$bGXHJ9iA){*qayI(MfkqX\
+Vgo;=2-6c|Yy9w_)bE)G=vW$LUwiz~85-1xA~Ks4Cx@U8VP1&}EmwmoHf7%c+WUwK-RBcFo$N#Kj\
+d`<Mj35+^Uzm^9z0Y^0#IW+PHm)5mmvclebkJT$fq%`K}tZt?ftJ=gQi_%9r_Eb$_ZiyLNQoIifP\
+H%2$V_|IOV&UQER~`(tBAlr5W)Wo*hdcPs7QY~U>YDm=YGRfdD@GSuHY^4sVzK8zYF#y8(H^;Z>Z\
+zB;s*wRFVexRNf{OnsWwS{v1&te00>wR59htN8g{yVMySZum6k`m%lXCjjHN$J-V1KowUU4-Jaz`\
+uTIFkk`|iW|v=X*Tv`DN=3eN=z^^58sl#BV^mX(#nMkr<)yP|*3<95H|NVI9rTqkWKPBE*R9iT?`\
+)kufpfM5tTe8T3a`soc&BYor*queb>SM{CZAHZvg>c}QE*ZfpzFSFKJ%ZdbJ%r}sa0z;@$~C5UtF\
+;>&RjpJ76iNGc4VLE+*#mXvuCTnFAFUBWqP+;-ZzK0EPHWtrsfSkF425oi^cKF&AP2!&#bkTt(G$\
+6bz9LN?$*ko>LP7*-ZlP=q3TYMf0wE+E3Cr$pi9|oeb}6_<?1S1rvAP{{e8Lh_bpxePm9flTAeG*\
+32b$)w0<^QKi6A7H(Eb8TR*qbElBT8onPCE-UDs@jW<jfHh;e1ZS{LUcX8W$_Ac@=Ni#9(a@fs@G\
+1$#-*YIviU^j73_;xevv;Oa9$7*{wOP8~3_H^^RzCHcy!~XB-<;}dOt^Rv@;vwIjmTsV>S{LaLvY\
+Yh{9qUJ<{pch=O7Wv~i^Rq1**?=3kfB-+-yo~LtK0wL_~;Y=i{~d>Emps$ZRJaQgetMF#hcBgJ=;\
+IB=c!9`rMh%i1jK0PO1)~<yJm|k?L8#>*c^d(mBoCFC$eJu@VsIx_T_nbo269iD`Tm3u|;+UTb*6\
+j&mGnoHA%=#?^v6x$#1qUHvK&_`_D;lno85JT{w6b=3;BMYRvwyn<wAs|85R%=G~OQZf;!Z+szj{\
+`oEjSPuaV%FE)EmC%om`Q};jnzb8*S?`f<5p3Z&1x2I#CrltHYwv~Pt+e*KSZKdDEw$krnTj_tX`\
+K1-VY!8}NSee;XTdb5q{eJOQ-|r7KTfcL)p1<B!?5f|q%~Gt3Bkv<-bMf2(+rDXwe+GzIE2T5$vR\
+GQMM&^i{1Mj4pvul>=rMo`7-%3SlbV~S!x&Oar5(XV_4zY{i@|S{Tc{&!XSI5v?mH$LwI4~#aoDN\
+QP)@#1{LBl%?*Ql(7uDsTEBX=oD=W1P+eDM<|%SzEpSDO=ClQ&31)lv;&BdZ_NdCIW3?Ppf!KcNq\
+R<Xir+Ygh5mtDCEwThw23)qjTPt`w{OmR8MOss1=b{o>prD?#~-GCybcA*@f^0@ke)`l|=fzKIH3\
+t*X8DrJzMn@VF_0bSi?;SOlZF2>dqm_@h=aoM9iy2~P)>z!O2%yoT1yeIjHj%zMGF6m$*C4t7JJT\
+4wHvQ%qK>(owhxEPIKI#*SJWtz+o^!2D^mIXN|)vhMSYDTY+NMzy(&sTfvPEj@{fL2l?Xb+uK;Z9\
+myQj#;W2R5>?P7i<W!aI0FlYDBejgKqg?v+U|krs8K`7}ydtt(B_$EmgUj?FQAwuhHqPc5YEsL6u\
+<q8_Ng9Jss+rsWSD=`A~=obTDmgt9I$^s&+o1ibbE5hxAHY==|BC*gl1~J!vjpRcylo;@E>5dy8X\
+(AMuYppFQj!n<l;>;t#IR5$(y%{!2}muItFfb{$bIs^wL=cTK5s-a4f!_a<#*X^47r$g5Ous-1T!\
+-__1xRmL-<2@g^%S?_<Vuuth-4d$=Ssv@nYTZXAfZPakPF!)Mun(K4TQ~I{mb?~#hc1@~UtCm!`{\
+<<ku?{^JTdz@0Gdlzoat~ygUnQu}*hv}1|91lNp#5VmQ=EW6v4JuCwzJseDFqc^N2(!-6Q&uey4a\
+cF^-VkTkXSwnOeRS0$vMXO#ZFtqB*WZ(Sa=j^yH@gNuD{q?iYWt(9tY@UD(;f(C>cm0D)UNWAg74\
+t3D~ze}BZi*hTpDQTgOG+wR`?q#c@YeyJrl~%xD{Y%&ePJ+FII#xw7tMepUuAXDy>g*?t8>L+}h<\
+oFZcbq=k35hSNZ<@#@hi+>v+@NRzc+A3n%>CcmLE^#x)<TFlL)(n2xH(JoBSAJ7^D|>0vv_bOBUm\
+n*~i*AeBP#dQ&9oPbKD0>vRbgnwxt;vq^Ey2FxY!x93z_w{o^xPM@gO$~o${IKST(H|gJshW>uBI\
+d#@HTe}v~ZMwPItgSA+YO_j}j+>R{;Q8WAq{L#W{fB^5Zt&mC0*lnaEmiU&>)>jh)7NMDfs4(S2W\
+`7-mnl#_gdVzeEVU0|nSBVi1{}f-_gN7@9>P-le)m_iz!Ix`me}R<tO*f6Q1TsWT{<_EkEpiZw(a\
+JA6JnFMHCTNx>gIIb5VQ9x-5oPwnBo!UK3J8%na<gR>#TETmC2i3E6mz;#;bM0n^u`Ky%41RU*^M\
+B|I(l6_{P7Wk9_F0Iw9u2w02!!(nyNWFZ$P$)~<WCGH%V#o0|2SZN^T<{dW#h9^*$}vzJ+GbBom#\
+75~j5tr)AHw)zg~uvPZSB)+5_50Ovq9h*$ao=%d=e_t2Z|MPhLuQS_U^kkf!KdbC|d!2noS}ApJ9\
+Y4hSIgC<y>wL9#y`wg^eS%dCypd$Jk!=rtqc>gaD`#_b2dhB%MV+oziyNr&UEAZc`0j%y9KnTs{`\
+Ne5F{|Li$NZ}n9eUo`K1%+f*!lzXdYi3Y_aKLkzo@2Q*FmOHLmsYKtD}Pn8cSvWWRQNz^}d=vdy|\
+z!`KiDDyPfO%rB*+n>YhbXYgdlxu$(cB&&q3Ua8~Npnj+cE1$x99Rm?a0?`g^EAW<-FeLz<s4s}$\
+OUt5*0YDLY$!06ZN)E~%+>l*(T<KPbEU=iI9jDx2)n_-WQa4r{YvODbZ)xUU+9H9b}x-*>SymsjC\
+>!`-q*U6xNXy;~-qdHf`6Xz1@iG8%m<j<?C)Gn+XY~#>V;`h0IP~7DOw5_uI#m-yz>bm{UX16O$=\
+<xL+E_=wx>Q+XbB-szyxd~-@nY7w^J+iVadz^Fquj04OpundSXPwTi%C35GQKveLx$3u#y0>4I?G\
+bj_zOoJnOO^)YXX@gw&K>sHAYbot(!KgVHr)A{@9(4W@A3CiTi~;yr>r0Phh|^iI3b_zT$}06HCh\
+MX#$)NmHA0-a&5mZB1iw``C{FFGay(sci?XY0^lG@fn>Sj2QosL6-`*>mO++e7)*D!+HlR<yl&ZI\
+~O<G|Fc8*@3z28Q4kxgjQ(l-4KOaFNB4-t#+(CMd%#rhOg*Nxca+o^Lkr4bhX=3c$-Yg4M;(=>F1\
+9;X`?Kf*F{x*4t;7Js0{6L~{)<@$oqkIi=IX5mveuj1P`hap<VsxNCPj(?xxc%EH9Uk-V5p$3-X%\
+8ShqpFYCsN_|>tO4OcfM$i${kye|9hK^pZYLjj>)7Ec%&}t=`>_RWBe-1sxoVEqIw!kM+?@kXjaJ\
+lO1QCEGFzo^4L-Dl{YHfobX;hCRm>-vc1AEk~-A7ZuXg)vP#!&OT)Z$AVIVS~CyZd><_Y3AHfU84\
+_WN_FmvDLVhFZX8Yi%$Z&M!I0`ET?FUrtLD)`R<*eF6%&VaK4^^SV=95w_-3n5=WP1JY-{K9OwvN\
+>mrvcV*>{p_YUziSqEUQWZ6fRpR$IHqywv-tR7sm1elJ`P;rGa=VB@V_PpRs)y?RP@eTgZChJ{e0\
+i|*97oUK!;{<-MgT~({-S6}?t?28{sz5zaK-Q(}%+tPt5xOQExJKAg9UFv2up`c)mj4#!3i+2txp\
+F*Kzyvn%qcUB*)BaU@-ue`@E*uWB_?d$&@zi_kttdQH96LwpZ@6i>@`I&#%`l%hbHd5fqG=VE!|F\
+<^9ss<;~PZOQgooG~GI8$eRl&PnqxSozO^>h?vg_+ig`CLVGswaz^^nVAHkE*WJJ6qg5$kRORcpX\
+oEv{CJ=_6Q|z+h-r0bn69ol^;b5ezB34Q+J%<b!NFY;wi>en?qLDHSN#Xp7yNo+@Jq<2%#s^2G!A\
+4SL)Ti*gW+9)x7boYUA~0<K^-CAoQYfW#6-mnetq2s&7EMZUd#hi|i}LcO%Wd$6OFI{MEOg;Jdf_\
+7xU`nPw@p}hseZD5nmvuw!j6_^SHS{?9JS!QvB`LshfHx9m^=+PS1RnPP*}a#o)L&Djj`~dCYf@d\
+4}#W>e?Cw*VbWA=)1)_8)w{Y_NG>yQnj5fG<A_xJ(I03yU)A!J6IQNim3+s>-)yWn+L^h*F9|U&)\
+f`mkXGj%rXA*7PCxFYA1mm`Lvg<HzStMW&Hbbv?=rSJ|8d`0sHvS1aF<DalI}8B?&Wuvx#jr??lL\
+;`RoA4Ldri98ZR2b#;nuFfciFd-Ddt|J|Er=;bJwNM+Vdd})**Nb+*7tM(8_4D)sxIxR9~xFttxE\
+pWutu2*Sd#QnStx!U)y`s+p2CF-|I1|^;-2>U%y~4s{%>0x|M94qV8(6o>~Lzjk=*sqyw3dr&rId\
+GIIeAr#`}A_9?#DzOz_&w*}|ot!85H_fE=@OeC^S)1~Wt_f9Quzm#^gt9+)CYsSN!UH2#DM!&Psz\
+Maio@7vjE+H#Hc)9hUB!Q8AziJSE(-_80I-_gW>bmO471^ZbAQ--(kcy-BabN84WSKY^(Ch~nee|\
+a>8U-vu}zI9<(H*&ji`_!ND!m!l~R`z~jeE)F{NA}_VW<$i`=<m%Cj^;iB8&`>By}n<o0&18@XQ<\
+%_h$;{KkqY_<I%}JKt*4W>A8*~Eu?1;Xy6TU7tJdG2@7nN~xm9m9x9SNO`8T%ock0x=Z^YN8yJ^_\
+h`sR0_{%_5YuLJv>s%y=HHI-X?xNIu^3`%R)H)d*BW#-p@>hk3V7kzEzM>=n<snJ+nt9Ml0sCTMw\
+m(~(zKVr48YV*FPb3+@v*eq5{o3EkmnVa3`FPYolFyDS38|G_GY;O0ht)c<#YrM6uOHJ=#<!FDka\
+jj8P%m!=e2Q5RsJDVw3-erQY^%v#;8LMlhGMiRu?lDK4?OXHjx0y|vKll~p3oGnimF4reSEcS@-)\
+7V@7wJ1`b)DIqUBM<l2^B1%5sp;d?^FfbcG@n#v+<f4V6V%>ZR~^Fc={o~<tML!(rfM7ey88bJbj\
+gH+Yi0=Cf)w}oi&-!)J@)4-Q8S0SGRH3DLB09ZokQZyyDu`{<?iQKflvow~y<tX5P^SYDZmbA2Cg\
+0UE@WM!w54!vuUT<QR9vteGz=1|69}56YL_`(PIxfo6~mX?Y=SSqfF0l<%n;5(!KRmdf(7tCA?^=\
+uEy$Gz5VLO4|=GvVJ(sKkX`pvzM+fBY^`#<Y2(z=wrgm6rgnd|$^3nowf>bGO#L!gU1?m^WDLJ<k\
+ZJ6^@wnfzr!@LDT~#@XRvBgeajNNktQ_L6-b!uNVc+=nQbWs7acpR!3*%n8FosyGb++0U#^`UXPP\
+FRU(Z1DcZ?TH3CRZhci8E^k*%$A#wWc?x*)~JVXFTRB;z@V;y5+L&GL_qG*{<9tJPwung9qS<DSm\
+BBGXb`41g`YiW3bXA59ms67gTH4`?vX>)XXOXuYm{kHLx770Xo=Q|HAcBe}CRraqV-W$EUZC7i$&\
+&#ea&d@p_)0Xctdw*SNpHS#9k)^|t?K?@OSgDwc+40)c=?21E>QL`7v$h-|XTB7*}Y5SBn#!oKfI\
+hE2j^5?~xh1F}SR0W~5@6vT*t!<yi835pN_Au69v7}PvOjoak!uI|3K``*5HW`OUV^MB{%9A)n9<\
+#tzBRaaG4Rck1RzJKO`GLpy9NPJuOs2H>4D5eSxq4=z1w+LWOsTTe}tiNQN2nZB1aD%#5UmxOdn!\
+I|JY$1#3u>7A9<_;8s`**{)@a{lsG<aLt9SGtk2Z&^nNdApn;I>+@>{ImvEEkp7h}mQ~At3T;&tj\
+E;-v3ls&9g{}PWM?|ne_tPdrE%_RGSmkzrOf(;X$%(5b7ZRWO8W!);<s=dMIxZejin~i~wQoJQ_~\
+P<Ipf}7uO%cAH;e5*_f5{E!y%e0&gMsZ4@Sg;I}~l_<RH<?4-?~ba(Z4&|u)DEef_&Dd6#zb<^wv\
+rGgI;yRYv%fJYc<ZW12VSf?V*yGL|*)Om|At!<wK!=rEB3W7(?U18zTjE@B{uiOy|9$k4&hDR;;o\
+8!^gJRKgTA2!3I2lsMV;oB+T(Y%c^Jo@EbuEpM+5<L3mB>~_~-wy?kHf&P)-!T~;`SX+tTTlhxEx\
+AT`ltb_+8Stnd;8CI!kCH_^I<Zzongn2ind3P;`g5Z&t-=4|@F)@Rs2^FZ@wCQEI~g8LCrdn+EWm\
+gkoZI(s;2ie`k?e7Oq!xX=6ye!g9thvR7YZyBH!7fV9+kmz^Lt8#eyD=)!?ysIIX4fMX=_x#-RIT\
+8@-30oM1K?vmI-f!0L$dv94znJA;5BRrWTg#_J#t>iW?MAH8>)JW#7F@g(y_PH|tFvmhwOc5*{%N\
+MtWEi^MK7bStpL@qBpP}`w=@Cb|+yAOOfjgQU`p0Lq8{>7@z;RKEqECpJDeAn@2o$`J<kBe0+@7r\
+N~1@_NtYP%!6IfngZ7(-c!1Gl+2yjSx7od;-FT>{NvvM&XkB=mqEYeby5z2;uMh8+F3{t2z6J)bA\
+sXbgs<zuL;ki3planp1^*^c^2&lT=#q{>B8)rA;ZBUghl8Z6VG%Gt?i5XXF1a2}z*Rs`Cbbi0i&H\
+F_`PCgT^FErH4}OizeAYHHb9Yj4JVp#Ud1daE@Mx1rtc?N~Bu_^ub7$st?TH=<Xeq_Dza(}mIKgv\
+8n1s|gTnU9bq`*_MGatxpSW`<cvqf*lM&q%L^t2+2^G-CpLJ~gWEN1xqIU1th?ns|fWOV?-3ZXdx\
+P_F=^2-HbS817JF*(k*jEm=Sw1Ru5PJ2XCOTGZnq{qI-!5hvoMIcTG&JkE_Q7{<pTRwr^ss8;JKR\
+4b)1GtX2+6TCx$nAQrC#Suq(62}kX73R=}cn2Pb`6iSBg5veEI$XV@#5L>4ubHbL9%HN&?e**T-F\
+6-tGs*hJx)Tr+Pb=V;u$v1I4c`gx?*Xgm#@bdw0l&t>E0R@I+bau6+jr&Ha=K(KJLed!rIxDrMZJ\
+5w@uF^7557$b)ewq#y`pAO=Rvi6wHjVmpQRFBR0+jRsHiTg7U5hNwef#RLX)IQ_><5Tj~>5Q68V-\
+{AejdNRCQr^XdAHw9lG4XVJ&o=EF)Z+`DnbhPI1#NJjf0*55Grzd9XJId$({M@&1C<Btc)@5OZ^V\
+1r9Ei0Z?k~M5vulYZuX|F<<Q{%riv~1Lvy}?~U{;$-HN$eu}xo;{oRI09aL{Gpm49ZO>Ci@zG1vk\
+CW6dp!HvTg%}pjf|Ev49*h#=t^n4TBgrY0o1BV(cX{z%!g`a_HP+ff5+VuKS`5Sj<>Lu2Q6pRe@g\
+t=RnE@gVSeS1~XJ7{3jRkvY-xVD0zEPBj9quPl*PU$sdx;++QU)qh89<rO7nRk4R(=7g7uCuoUNW\
+}=Pdl2d?nUO2kq`!3N?m#w4JB`fo#_!4#uup!hSlgw1_Mla{_{v3IG}SEPT$T+0C7B3aD0gfEtt_\
+GOy`J%@`#8ipp!zaC=?~96UG<3!3pNq&87r1d#!|ER_xIeOu|~iQqsIU&2)018JwVGb0A7XHg(n#\
+{(@PfQ=y!0E?_eSRrJKuYMVLnuz7C@PDNk8N2sW_mWndgNU11cE1{wvL@L@sS7K>pJr%9nO{l2m;\
+*hDR@){Wxy}d-GqGO8$Dr&jgjEWk$vFD{dhls(QtB7JSL_fd>UaF#wdXF2CRCz!`Qu|&ONGf!U1L\
+^^Pxk7HA{c8&lS8Lcb(MVv7o1%1MEGA?8HHtat=lg7EjQ(8R0PDQ0526i8eA9|v`vLdxw}2%S@$$\
+F}M%_sfYG7SR6hDbrj&XQEU@PUtfMr!xKGEk{H2NGJpBTI)43X`L4Y0dg$?pCT>w3<!AR77T=aqd\
+n3Vq(cpRx)POAyP0CEh*8$NUz*%Vih_us($z%V*ijXGN7aE1zyFpB_~nhn=;HNmyf?!!xE-aLCqj\
+IlTABgA=6!u_6kwspSC7ryWe1P>cGKq8L^1gn2JT9H8U_LW9Mc-eT1z#axrVxXE(Tq?CK#7F&U5N\
+%|=YKtH!@>feIvKPee%j#{7p?m5IU{I_Ywe|)PpU|%990i4Rn0+1+u@`dUw{NA=4b$x~{`ZLQxcP\
+XXAVvTC3jiB0K+DOp7mM&#Z1eNe8{q;1Ht_?P3^3`?A5FoMUaUv8Id1aKUB9p$JkCLm%BR6U@2N=\
+deQLfkVEy7vz=9_X>;Gme36V5hh8O<Po=@Xnv0Z#Wt0onFp)xLX^+OOsdoc7~4O*kzPPrxx1`uG`\
+v)&C;n*)_zTo-yl5$JDxPP$H+UU%&Bc7~I^-h72w>L&xA){*#wg2Iti>xUNwugPV~lWpMM?hr!@d\
+)=C-NnoK!^%dbosTviAi&bm|Ja97`ubGV`5aJVimZ#<TCK2otzw?T~1vpZJQRnG3#Zql<m*5o!hy\
+Bobp&hFwjY1kd>=U;MmclRa@yJPj&%h}zPjS_ZuW}_@WiJ<_@u|D>-M>VYP_H>^0ElU?zA8Uk<;&\
+|3KJYB;2+)K<^-(4G3*0=c?f%S!BOlw++@j)hXH?9=Sl$MyynbIVZu3#IH3%i8X-0?c$WiL3xVU&\
++OBQQ!P<K{$)jB+0}O*VB3>}^|47>x4x5}r}|QiYxd=7hs2?^>&fryRZwH&Uz#W6a~C3ofsuEN2r\
+A;mO<wqP$R}V5JfdQshYYMQ9W!SkgjH$!PT~(<R7kms69bB~`N=#DGJVqm=Qbv$KHL<xrau)(!Kp\
+`xfI-4tEvbFl@6)KN{;uPb;*f-s(u7QfMuijTK_QRmXt;Sj{7_gGJDyZ=(Sx7;Uy+yh{BmW(8AYa\
+IIHp?R#bkOZoh(W=KJozhowDBSf0^T|rGTNFRd`a0CI$tsU;F4%byBP@zu+0t_8$SXM)Rtuh0Pqf\
+JPogLjh>jWsySI9C+iQ{H?90bN-bd$ID{b<y|kCv+o$AzUAFCS(c7c|ebxjk3Z+&h^Vg<n(VRD>r\
+IJD9G7<27oBXT{Yg_Im!q{eN|=nIm-Y)2flbc_}Pq(`;F<L;AbSQoi<&-&!4u1fS=u_%kXpe^Atb\
+rxo*VY=0<6;)O8Z9I4Yk08exE^$t%Od)BQdJOL%a6{b#E&zK;1!hOas^C0dg$(x7wLQF19R=0Gwu\
+0T)}_i=sUzNi;J;Rj<`y^(vU_Ni64(^tTKeX9+SYdt01ARtxr~vrLZvH*ETm>^y~Uuq%TmPoOJV{\
+xZRWIa68pylrSnhDaGFUpC*-uyrH1#70c_IqAh#95RrZLnfG`r$s#fOjl_0PZtN?l@9#i6xqNF(#\
+3(t1RXf64fbIso>5=_N$gLmu<|lEwWry9@%W1#<q#`ZN9tRQu=<%77*_MBG#8-~LLny>U$Qwta4~\
+vbu1BjaG(*7_5{ZmcFX_?BtDu!v1uMw|LBPtAjbV9?fX~albv?t-YO#t|JAYBo%4^j$NPb3Kot({\
+Nbz&#8?zeEY8$KgOFV5d=zB+jDTNqkpYtSlNhE`q$t%A*ei8%0|H<5vln<N|fj3wg04{ZuIaDrA_\
+m~VCCzqDvoW~FHL>qG^u@VVI*gjP8MTH)Y&DOxr1Fto}t;*aIu7@X>cw7)155%<wzC}?ZXTi6_EL\
+A4QgV}@P`TxEe)M<PIM)`k6KF||(ZAZjs7+CrFg@<y^Og%fymWwp;P5*M-IM)PGUR**q9tC9!7+Z\
+ip%Na@!mFA~SLe?vIJ`9imv|HWvve)=ZJx$ghYs=c^SwrT^dA+K7Wg(76Ol4Dcfo#SP2thZ2Hwbb\
+=DXVrF&lYMP(nmD#f>%&>K0++aIMiK=`gm0`PDRata+RA4}l{e)jirt5Ki6VGk!%X_hKW-pR+gxd\
+XyPRd|X@6UtO_!vV;T#;!1`bdArXwRPzIbrBy8YM)$WdGuy>hrCKkGmeGYnfS*eMR;rXS*!_aQ7V\
+m*?Bmzs(A%BDOF@A3)1l+F@S@^oa(CU4@S96ir4lT#KY;ko8KOq)JJe)8Cy4hJ|7+C9)F-*<V9X7\
+Sbch@{lF_n!96^WTZwdgp6s4Q3g|YV2PN-#kW2@3)@*r{S}E!tN*?wMVCHSmluqsXmDG2td85HW&\
+nYbVunbyH<7Fy8@$?7Y*&`b4vS(nTA1&Z1xh+GA7`GNI*~eUXl&VQmI^jb2`F4P4pzWcq@XJ!^-B\
+rpoOK{P81qGYDOxD>M&L|_tHbxvNY@ALwHkR-Ewo<gOmG*DY{z4TA=NreKS5it1{h8M#whxCbYt}\
+2I&bt|FA{QAds7VaYwgK4$)APuU5zv^$M$Wr^6jh4%j<2X`Mf-dadbf$p;(FRg;Ramz#nn}t(xC4\
+#-f(RVi)NuLr7rBu?<R{I1BM?H2U(y;pQWoINQ9u`$qHfb?eQ`+srpFpTE?+yy~+dL+<DK#*q7L5\
+P_U~eaMiTKGu9>af{5$bLRvp4}x=vK_F}M1Q}oGIQQ;6W5}%@NFdjHUC5AoXqNfN_6EU;mYL?|zi\
+lutU$fl2{P;ri@})0^47sQ08bfYyGJ)J3FNF-bM}k1E+B$=B;Ge=t#1cA*&}yfz52v;>HJsXO=NQ\
+*!{CRK?{yWXQyx(LqxCkldyRFlnE*aJAHBxpC1)eK<PcRTE+OKD+H3g@YS0_rvfuGmN#eroD#cZe\
+C{)qPEQH82RkYy?lX@OKePIHuMG9Az|rmj;Gro!}wu9Id-eQE_!!T32GNelUS9x_W?cnj2;RZKF=\
+B_)d9vjCSgI0BIYkfyYV19S8UfM>Bbjp*ZP`onN3yo`h(0~u7iUo0@k(ZV46N$DUp-|(en>hJ6zJ\
+LK{pvPaQM^K#!@^;>r@P=9BQH*YsR)x5lTn0fgY?ps~vtG`=KHg6Z>HZRW^5~TfD^;_qsslOMe=x\
+_OmA=jOx_<Vh^R_m&O!#!dKr-VeEVK9!0Yo&~1$}B14*t=5BIC{>P_)37PtoiJ5`|nnkHn(IkyXk\
+__GdUl(`?THvJWrd2Ih6h<jMVmjW~{vb7p|}W{@VWUaLfB|a$Wtu{(`pu$4AKf|7@<|4JhJ<SZO>\
+s5rnp1O_*wWH_e@C2D+oj!sObK{%dcHmw!!P6Z`9!jO*KBH+5Wn$AvnsKNgyf>)9l8?r=7U1a^5&\
+$dbmz{-z_bJr^2;R)q$k`=*(G?fx{C)Ae5wME*A0$=r#Gb*8~#oXreh)dlo{-bHbK<`%d5#qEoO=\
+-(q4k)c<PDE0x;QRRMWM{o2tlit8095X@fi~1|B6dRc$qmDo5??d8w@u2Z?UVJ!J#*1YU1RjW(WB\
+pY%=x=7KR-lSe?4Z<}Zc!>p=t>#a^i&d}-1-Qb7u~kBTawFpO12}RRvrgApLbQ2Y(Qhi$p`t#EWP\
+B)q%0GPNu&$j(S{Zw^)V3(FoF|&8pW=U>KFw;g9T2E^54&pV=6PsC-LzPbEg~a>jZWHtnY?ux%`Y\
+ta8l%BH4Y6`QaeBN9CmcqK~%u#k+Ws%?{Z#}p@5sl?2&bRIGsT^sf;&1PMc{=;UvNE*D0nv;NBF0\
+4#JemEiV4_n4QU89<GKNT);lXR+(s?nj{y^H_VV^_}B6`cTKrGWgtr>FDF>A?_Be}XP&um*OPGX+\
+-1k1KWpM&hsruo#-+#WjiVUkon`7BdXc_gr<=m{`~D`}%N4J3uUnmZMkG*xhNtGev4i|MqIVrOQd\
+FV{jTGX8TPtc>T)|;22%C=`PM4GPpVO|7kIgjbZ^yKteC$krfsYmRH{oL({(BN*IAcv1y529*HZX\
+7F)N42ah4G04-DPNlGHHV>`Pic5W0T(2rvNd*MGggj9k1Qe`VQ9HRLrnR4-U;pv&^2g^1%@8a8?c\
+Fd2_8}iYd%(Q5=|T10|+1nmOD=+KAFi7E9ChxABBC{?om*<IhM7KK{hyn>GHf18;2nvlnT{U+<aV\
+<Ifs!v&LU(+Kr9>)sfoqUt1J>{Du8**7(QHzL9;fY>8|iJe;8JgQu4m?Sqqh%J;!l6AevNDcbv7Y\
++8Q#TC!Gli5yHdR2-(~q@Tq8d(&AU1Rg?SeFSdAembH5de>)lPNXmocj8C@0y65!=C4cHd>nm2d!\
+di;Z!rZpevYEgw0$D0A48uN2LE1nX6}Ol=fES}hLzGwoyVa8B&+Uf9NO_X8A>wr9q*21l{O5}g5p\
+_hY(RTrycK;*`DCprM1r%4AsPzEgFt+B5AA23oTrZT%y<>zlX?e-_<)T6G{j#SE<k+Ea0TM$7O3;\
+s)jb4=KigdkitMg3h;L24A&95X*M8=)G<BqrV^xR`>=GQ}W5)caA^t^@0P&+q3dE}nRp+sBUI-AM\
+J5LLW{v%`%Pn>*15VxjiKhtZzI?`=}RERHI5FFy)_5M#od_<Z6@jht^#Mcf`=W*AN5Fq~BU@a&v&\
+67d=`9V^M2R~?uTp}K{{JL0r(DK9}{Xxs1(Hi-@qv6eXBxIWQb^k!c;*57AS_IqU!=vceN$w3CXY\
+XTI2>z8wN1C2iYN6p@YT*CIKIP?p8>_o$JQrJ_8TPhOQd_J(EVNYF|2y`PtHsHqG!QVqB^6?dbGZ\
+wdW0D0(&?11uJtGB3<Wfk$8vVN$2MOm`jX2P(BY3EOM&iWrH(SKjA#P)3DQvNES_bfohE6->v4H;\
+B{X}oSvDlK6?v3)>n2oDnd-BHNPQ$Qh$6ygZ^7^o0`)EUKXfVzg8`=*w!-ifxcx*V?%@`Y2j|dwZ\
+u6CDWL-!Fkh7IdR8Dc}-vBucYEX52P9(+QF4fo$cu;HWm!LT83nurZ$<F(lEeP=l~JTd&nVDafVL\
+s-0MH-^O>9nD}-GE4`H+O-KRdX5VQi^&s3ShSl9Gq<U*81w{rqlHD&Vb@0)`+6Hv#-c=H%6PJu8D\
++dOil>aqsm7G?^w6*=!!b%u8F52z3>$J24Y9%5%NQG4_cX(X^@%!ch^j@fq4cR>*wDDWhz-?8X|Z\
+8Lf*c#_rI_8uS$nYLwqMn^mUnR#lu%L1%F^55R67r##U0edNkYB}DA$dbf7{e%#2+q}43gRyQ%r1\
+bOuC{5_;yU5sm@87#IDIw0o3ZvjzAS#JP2q0IM(*_xq|rh#aQMq?^B~>7Is$!v2UHA0UMsJ3!boH\
+L5K8zcp6KR!=DW-n5jP-7|+KT>CFK-4$ti^n_4YO`kj~*8t4L-AX%vAeGY(zgdagpsu{hN+sShI`\
+yj_DH}vK}iXig(mo^+vAb|*QPyAm~*^(fvug2^oMGosB@*SAf>27eJNwI|mli~YX?JRT=Vz&B%C>\
+cl7CwXbIrS=^tiKp9(qgcziV#_*%h&h%}B+G7Ap@VX%FunGzkIm5t@x()aRsgn1Ms{T?33sEn<kF\
+wTRIbnCOh0H!hsg*M^&tjh1_H8-A8e-Am>j@=+1cnoki#?bq@FX;XIh*{%9WcBm9kQ<F8Nn`cwuN\
+k$Ns6kSkM!*0nba38`4K42RjY=>~R{%M52+UHL=uy^FQ<o(Q|~6cX|S4&NNxVcT>r|<@j6L2;KJv\
+82YmrP_@?IbLe%PM+;{s(gW%j?CQzP?v6pYW)QABt8EAv6@+uCF%`BH=~|#&qu7%AD2?waV{5Ti7\
+2eA@9ksL*5;8u{I$^R4iF1f<1-HM}k)+=2G6VHxmF|h*j&@#u>1bEZ2y?VGh8m8xQtz8K+D6T!qd\
+nC*%+dbR(Qvf&lW*E+zm|{o)h=O<_T7<&qrJ0*ZnVL<g?*&RE#94I%q?7fP57FP8|3g7W-{E!F(G\
+rbq+$+M4SSI!cEXr`?GwcN2y=P?OxwB`&m!F$3+FNM%6W$BR!&{S<=*EuPU4I)^CTDG<QrrLr)Rr\
+fADr%QBZ1Q=y~Bl5kK~|m8sFnT1E<9HW^k(6_xj+pBS8YER}#a8)9&^`;ncDFe+Ew3L(Sl{ufz4h\
+>D#dqIHmOp7f$ZraEj^nzXB(hnpf;M<$N3*%jkXQ&19N9ucuJw5i!~E<wqn=`$A?)O{#AYBlkQB3\
+>VEgt;~{Ig$hVCLN7G$#c%3|8Yl7iXn9TMZyjgu`&ZCHEN7R6lBo(|+stB;*|@x1(ZA|XQZy*A0?\
+d7sSDlW3h*!*)K7@EuG>U`8&jtU?!Q>uEH%U<7?S&tY5p^ivcjz&4Cowf+jO@YmSr|bDG=c<IX}q\
+f>-t{d#R~YsbxjD|?gWPA3@AEW+H^lz=DARxo>D|ka?fg%)Px+4ZSMET7^H+NFLG_U&Xj!>UF3T_\
+%27*pjyvx2^rms@Gk88@`drcKn&)is|gu%fHQCi&z%W+oKM8wQ-evLwmV+fwnd+mi8-qZo8yoe-T\
+P!vvl!y{7{Pjp~_$^!oPkm5GCs5x`b%jVj?-<@7e3a=BgxT2q$fS7<@C2Zkdzm~+5$c`}%xB(H=#\
+2Bcm<~6akfogeTKH$#&wrq8NevEamB(2!r60OGLN$P5}9iptp;^C;w-yN1@u94>-(Y#u8GxZm%-O\
+bohoYZLEL&8BiG`TJgQq=HzILOu(H_Snrj5Os7mPgF_!eU3*eBqN$9A79+5cxt}vV<>8N+x{afuS\
+m2$R8l^g`6G&UwHjdfiHCLF7SmOo%DQRTu&`ua5ho-LY+=hzHk`PjqlAqDki=?P{G9CQf?++h-n-\
+iUucyOGGF-T36(EA_OQSgnl@DULVjNvUwAv-kT0z1B;^YilSASQd2vDb!kI^PeBl~GWnbOi>S{cY\
+tgOa(#3FoObPa_s+~Y9i3xTJC@r5hRRlY!&!sYI!`B4pcLcJl^!xNt9bHhBLM+Z}$aOGihp0J=x*\
+gRoibB-qr=_B%l=MqJpfKkCWpdaB0KR=-Igx!4wp3uC7z!O$C5O~7rx&lu)(@f73ZgXgP!iYvHPk\
+5!7lqY<OKI40-r;3FelN2occHqtA2^AZL#}n#x3z;XBbXIx7*Y^uNVblEzPk6Gsj3?aFz>p_g?IY\
+z0=X!<26HYY`!V``((D8)AIDB7Pg1Q>f{nY!vlJWgtokQUXuis-HuXIl^o=}#e<q5Cedp$fM_o?g\
+Q32oZlFi#jzFH}wA(Ltu%<E;nGxkt~=VRMhW26Eh^dJB<zJkeL=9vw0FsFO&z$Beov_i*+SxX0MK\
+0{0m3pujz19uc_5OUZifaV%ELJsx;i<sRdbrQE}U#9iOu?kc_x>#gAH_N1H1J&r#Z9{2dZOUT?~a\
+8s3gG-)VskK85-_h`{x#yviZGvpq%T1mObt!+Z$9;crS!aXt{)NzlRXtcgh9O`PE?4_(mZNx}?OP\
+(<29#}tWpp78R3Km)*7)uu3V?ua>LAZJMu#ZOwd-&HN*|F=G?m7qT5KdjawYXE)tsO!-b^WWE^wh\
+O^cj>8X+CB19*T_L3oVr??>Q7zU)fdiAziuZxb<Mv|a_Sl(w%pcEcIxW6FQik~*}ZSdsq4>e^{1}\
+pp;%vcWqyoypR#g3&Cwy&C$zpQ8Etj3u{s|HO&&P%MY7*hkIdsAVjm6PGFa>wc2lEaVnA8SFdR=7\
+C-CD2&1njXv#^A%4@a-WzN6I`b9X(ca^ioQ2~B@$#`5Yxx;^GtQ@ImaTPwpksC)=lZf!4~S(Cl_t\
+O<EDyE=Pw0KI{@BV9njlWlYX1=3in9&LnJt9EV3P)Ldme3EJq<%r3gxi$$~^hXHT%I+V|g*p=1qB\
+^*8i=I0ZTg#%R4RfIw$^t7B%&gekP0s>m_tME3A$s>*X&5TUUD;O0B6W-RR$XE7HrLfIp6(djFnT\
+T}NPO(5mV!G^#X5>N^&eo}5N!Dm^_9fO@)BLTHx40kY4j?by3L`<-4+5}g4mQ>OJROM4AWzn>%>J\
+mj-GeH(DJ}74PL_{oOu93buPmFJa_Bvta{LYuX<Z8RQmodWov#q9&OFvw={@a4Gorev=U$$(?o$~\
+T1y=)8^-@9U^)6W5tbQ^wXmF7Lkdgx{VFU!yfXw?uDer#Ws@EVmg`#F5G*Iz1Xxb4r@*pCHytdWc\
+l;+{8B<e)Wzhp#SbqP26qX(CQ(-x)P6)8<Sx158cWAc0p3U{JltS&@x&qW%#w$>B-=~9`ul;`lYT\
+w#KsBP_`g_<{33biV+D%9G?gaEae7zJu?B82e8G?U$xBryDUA2Sz6WN9ewYbG#orfJsauO($ti!+\
+|B2R!cWC@6$ynlp6~w9Y8dLXXG0e)c`uf!;!Y9A7<D_YS7_6=29=@LXi{RUb6FlrZOT&pn~fVMaS\
+)4l|nyb7*E0<}f-&nZvvX`8f=(Et$jV<~J~h6D`dzPh;{xL-yfPh+hKl6wsTKn}@&n+wTe@A<(Z5\
+xtITHEAFe`HZzkzYCULb;eiX`Xnr8YkVa`5de3MU+}1<#Qs8!nzO8^W3(zbT;KyARB)k%j;`?YJe\
+n>bGH}>Rq7BS{h2fWHsNsRn(X86kVrq*LaJkwqqUiIZ8MAFq}(#AJp<2H81XtkcWfS36*vUC<Foe\
+fFjhiPPG`n|S^kVf=al0%u^{1+;7;QTF9I|XSI!W-3cB`jP#(SC{k(T))z$<Gldkm$vl6z)W#OmG\
+!bweq2+gyY9)<Jf{36n=a{C$ySg!|bL`|Mb3%r;zH<nb}Nw*CIA9hbJ*s$=(d+&9!Lv@~wPaHJz+\
+^LgDD=h;>=eTOWT^mb6)<r#dE9R&rlrEHUft=qAnDgy4~-i`0(QXs8l`LUhnxUgD;ggxCy<L6!H<\
+p$`0FWn4yIk#96}xKoPMs73(Q@HSeq8`?k<)u{U})@=^kFeTyJ6#zYq^8?0)%A;Dgl<}zI#{V%M^\
+@=SRk2=yw3#_-Rgvz6qHM%K0O3!(w#)Qv#&UWG3gup}IZzb@Mb&m)<WPNo59&-Ov*U3Y^di+Ls$Y\
+1Sw9&)SAh==sO3(L#RR36f&jlx6LKB4C!ztj)PLkepJ;~`H(5+3r<qyJZU$j<s&vRGH?X7Z4~9}b\
+m=d>$*~AsZV0$9Twnw*})N7b|Lkweh}CdC0bk#yrGWk~z>KEJ^0xI^pw^efOKU34y~5XfAM=qT2-\
+y)4HkwhlzXaIyuZ!)o+BuOn8FlFmK#q#9{u8q)6YD#wv#?ZJ}_O7H#w#W<|ZA9A>I57>5~Bi*T5X\
+Dn=ZJMuy^Oz1aWXxXmW3mViKix^Zr!r<_^$n4UCOye(9|G~XuUOBEmbkMX5}al!b~YdWw-J{~Gxn\
+q<BC`q#1s;ptx$!qufh;7LcC2s~*|d4T6huS6Q~q`#|PCr|pW!Hw{w2P^VC>5j@qJShcfe7@v{Do\
++~nn8K4@ZlUK%|I`i2lg{1}j3>o3Bs{73fe?67tN-74(!@YOLp%k|ZjdL%>R^NAn>&J?dl{aIKGj\
+x#COYd;>6vJ-ROK*{LYT<!XYpM0IW)V~kjJaOZSLo^@;-tkAGI*XCq3=Adn7m?hLi+?r_<8LLFF8\
+?Q|-!SXvrsdJ9dt?NapXd7|j1}T@-A1-Ws+)1F{g)FcQr}s?b7hs!+)s-fbeE!;g1`nBn|dEvfxe\
+ID{y^gL;n9jVkx=0JVjd@or0BH8<Uf=Qj`L9~Tp0?iJRmb`S%xZY93273wMO<W|AqP(MP1L)2~MG\
+B~_l7AOxAchuM#>bSPI3_h;77;#*-D$;SaE)P1cHI`7v)h;UdxR$pN$2Ipc>9}fCEe|%X02zAFTU\
+5-L!8&X++h^I57uOYEBo49WI(l+q)RxfGMgs$mA+E;PG&>czP{*v)_E#XtP911McyP-{!_Wiqc~u\
+Rw?>bCJ_0d1UMpf`A8CA#X;f*S`MtJp0ZQ=SHF)<yVZ`Bb_R8xUg@>Qo6dvP}x;<P8>Q0s!POEf*\
+vN(n<=mYyKp*$71S(&)9=3n|jK?k|jL+Jw;9pQwf@AN@Sil#i;?c^#1tu`@y4CErMz7X0{%s2?Bp\
+fBh540UX=9$7pZ)9glRnc+ZqV=6u(x9wcH%9bfnmM`HTks|T`qyz3`?V%Pw&OaDE1IQV?gbpgM71\
+tD_03s&NzhC~?V#oC8%2k0l$^TeRCSO4lpxuZ16qVBnc<v}7^#H|$+f5HMKj+D6wrl%EIqBH(rj(\
+0fU*8MEw5$-jih|4wAx01s2$~b>LpCSM|ClFDemthMy8CKsasenqMoP>KPFj=AIVbWg&)%=S6?G4\
+7ji`vq1=6qO+K~jQPqT(m_>%H_ho;dMJEFcPjEi24pG7Va<uOdiYrZoJ*zXLoCm)19@Var_-8aAN\
+PiipecRC?`q11i0%x_Nv|8P6@RhxRW2rqbT0wY0Q%<xY|I_Qz^yukC$2?WOz@(9vFlM-<xY`LLe$\
+cGL)u_Rdxfk@gN*MB4lJFM)7q@7o%NwD;N_|Ced6f$chJPlK9=ss@o|Olj}7a)I_zO9Q5~cd6FR+\
+CMMX6!*_T*Hp?pR2;#P=Hja6dPHpX5O>f450~HQ4qERQm5Oty1wy6b(-lN2{_Sp+iXrONc@Iy;mG\
+9E;prh(5RJ{BFJr!TNH9RV=RXIc|Zu?I_pkjAySUczff53=}XZ#uXKTO3HZn-&Bd`knPTwOAn3Qt\
+Dv5FyCOTY|{QmY)MRiN?S8iM#LYQmT#}Dy{_ikt&6Jr`M!wH!S^*|5>HoAthScZFs*(yKU;Iw2M=\
+e_};I>)2{ykJ?*|$Podq9>*{H@e%0`3H@QNHwA-PwxC4J^35#}POAKlE-QWK&)9!$O0yl+rhy59l\
+-0!NjTjZ6Kzi7Ht<o?O(EG9=tIGzHEnni22_`Y&b&00!__m+xu_|p}I4q=DAw}QAaO3eR+oxqqAt\
+FR*)Fbj36B5;?cjJsgUIz&PzeF-JNQeuOg&JesGZVCOmT)A!a_aeD@wf~)R^Xl`Jg5Hhv!H)qx<Y\
+VWL0d_aiDx<rR%%i5reGswYeGtr-0t5Omc!q!G8}Y5ej?GQb0#2R_1Wb%SX}8F1;#nbQ(WNW3SNu\
+ruQ6)u5cR7<5eXj(<Y_THbV@cD@oP+KU&x$qZdqaTJ9vy!L!s@ZreG)nl&RF7=kjZ@Cz6$|08Xd5\
+G`4##m!N=LquU<7njM3$~G3F(azsQu(a~rF-_uY0oF(Te|hY}=gL$ade7C#lkJV`%m4F4&A8{4|m\
+(@L#M2t;aaT~@JlZ=AoD#@wB7ckr-UQ)pkgq=oi;=8z{qJLBJG(Ejb8>w|U>X!ZK~=0fY@KY<&77\
+Ix}yZ7+6qV6clT*23=7$}-qRRR9MH!4<;fJj!PV>2?u1YR+p${wiD-UY`S-RlaXjZ3V9jqRYd@>&\
+z=RccosbU4BC=)k<8c(?4rhs^32{o^lY$7oo2dUVr1#l@|R<QOU^~!n*9fK-R?#1PbetTPf^y`RD\
+A-U6)V33r;}-6efQkFoHsKO7Qj7%5BAtMo7Yd$W)p!WMN%VUQY0F*9!EkPBS$M0qTW8M5OFXf{5h\
+0q=-l>z0wTx${me9=^c&YM?9q0Uv6dL`S4A!hmZ)mmuee?%Sl|2VrA|czW)jEa_v|DBUr{hLXT=9\
+kdGDDE#>}_Kjk8>u&ga?;RzMLo;D+u-z%FP@Rd|B_4^ofCOm1RYFQw-SS9!sDXu@-yR?IT>j{4#T\
+s;Tm(c=~(Y`g{d%jJ_V8yo$z_m}7z9it?^Ub@RjxEutl&M`Z|85WOw0qm4s?p56%16=lseBZRc0x\
+YD`%aKsAa#P4cj9TuLV$w&xF91xdNX#W51W-b?Gqf7!4`{FPo%tgm@e-3lW@kBJi>q$cLWbU_5hh\
+&D|62=}k51{}Qu&GqmjQnUfy>xSB3!=zIwZJ!__YF;e${dQr?L>>BHZ_yW(|)n|1lt*pc>QmD`Xu\
+WsZMSbBbjv3<gE@@?<le!O4eJ3w6(N1WdvKD3*T#3=gRlG)tPWvT%GsJf~-!#x8mwJ&WE%*_nlW(\
+XKyvMI`{n^?&|#fQ+TXu*ZJ#Qol0e7b$a3<OIL?aO3Yn{n&0tm^=GX5vz~S->xW5awW^nER<h}Lx\
+|Q7Q6Ib%*--4`UpjceVg=a%r$pL4TmAq0Ft>l1TWh-fFt-<kIpHp`;tHa$p3dRXb(8)&qo5Atd&1\
+zwXYFe|B!__~ERP1VF0>Mb7VxhdEF1huVYtl{CL;W$%f!Jc~B!1jpZY6f}gktVyp6(IB{Na{=O;5\
+PYugmZ#QsZks1a3H3)!^3YP@8EzvIIJNsxT0S%jj1>hBh11Pj0UwW7MWiR{R(+bNLs9W8HGF{Cak\
+BpNrr$a9scH_aY_~da6Yb<haW6O-HaxVdM>X@mf2DPb&n?D~S2?Inl}+bw;%Ew)!z(=HgK0J2P2x\
+@JYQLPNI=?8ldL(gR7lg&ONRq;i9twdeIrRirxQ5pqxI(G5wDu$4VaW@I*fO5j4tj<lD0&aR(lIK\
+JbTs1<K*K+ldG~ExVhmw43V>hwD!;I)mO96<J=+s_#Ebzv9VW4825FB^_@;9p~^JH&r{{f;!HTbi\
+Avg+VLp0<80JRyr;#<6BbLS5BV-Henh%VaFr&w{)l(|7Vjz-IvmP%SX1pV7dm`!3-0g$-{JF0hs6\
+mvJ>mE9uAhYtZ{<2X^cCsQowNreKJ+8kl~_?(15b<o`D9yo80{M+pP=ukd>?vPgnB4>R{wq+dhZ{\
+jdD#cQ?5KI!9>1)^Ug9rD=F+|Bu$8WNWHx=1%ig5>7Q=a^^6VWC_jjnzfHAf&6$}E5idDrydqr~E\
+!?XXFe+rPaBP8Wwr(q`8tG%R8gS%sY6LI(SKLH+hD;LOd_p^eaxEmj#E}*4Ii@TrZ%W-#hK~UWN#\
+j1Av+8HhGuFluu?gIruaCa-$VgEB)+#Q{-#of>IgWzs&uER*uVJ>Jad4RsTZi2f6g>&hp5p)S)+g\
+yB#!v{}`xkm|FbtA4DxW#xCouEbIQ>-X!F_D!h@{xS@YH2nrrN~O|d-_5t&sEBE)$+nG<YZO<w4A\
+JLrzK?d*OwBq`u<BpvYHeKXvk_Hdqc^poAOM^s&zm_=J!vEWOd>zg{*$E=*g<PUq@C(=PS_t<$nc\
+;jY%1D-aqUO8}h5{4IT0t<(Uk5srn3kRywIX!;ou#Mf}WV_6cI1a9dg*UU0wojIUop&wyV(cgKpY\
+52p#1P2NJa<O;sZ#Nj%CG>3AX44;YLQZ)ScA<FOYS*#~Brkt26b|1q-W))!;#a4PKD7^hMpBOYft\
+D&hUGZuO{3AZ}t`|kQ%=yu3g0kuxPZ_1a%mZiSwaWTLQXSX!K)Txv_1|^v`{ww*uM$iN4Ul{__Ax\
+QqO-?0feI^%9DbY`Q?R{czjfUKob@H8rLcZ_mnB9*Y*z4~q_wQnJvRYxq^%|0?5{X_G^{0Nik2ra\
+59uZ!WeeK8u>aA@M`2p=KweHWk*=|M?b9G-;5^!3LVRIuY~G$COwgz6o>LK|Ryewy}-?Hi|+kHdK\
+|c^pn3caoamTe5`|;h8EL*8;S9C2xZ70rye5Tri8ONAZYOL!qm4eGc?-SZ)&{1fw(Xg{UP5c;2Bb\
+{fILPopwd^p|T8^QU%OhDyuJHZa;k~yi_K6TJxUG_MrHlO#5}fkRpFY`krsdrZVP=GPWHEVSTqF4\
+ac$MD5jyoX6Lb<7VjJ+fc&B&912xqa_JYJQj&Lftbalq!H6AZw0X}yEWpk@k9^CFyLog!aa+jtbM\
++7|Nh#!6;liV!P#5s;+61VQ?McFVH1ox&a1o9|oa9x$Z`N;=0I*I#UJd_^puYVmlKY98o`=|sC$Z\
+dZKi}Z6tI%b?<hCFEy$Hrv2s<1oyMUipO9JJt7~GeFT+@)SPy%a%s|!l}L;kwNN9pLn0;qk_ck&x\
+-$Ohf{p})`?toR>b+#LnOwF<uim-8s%nfo2CggsJFep4J!bFBghF9NGdDWb8kc=Y?}=$oU_BS_l|\
+-AP_FZ7Z7Vsr0l{7H4#NTA|fhCEs2cfjRBnxH|-tbf2}g{gm@oR9fz=j7kILN{lVvZ#B#@lJ>jpd\
+vKS<YVVg&ON+A+3BLU86HJ-6kK2!DU?a+@`_}sFtxQM7wCPSM<UYW_{<IIkPHu`e2k`V_1;EFUa^\
+s7;!~r-<a}Tr;c+02_h+^Bve=#2|^iG`mitniBrszVnt`HEB#;czof{C{6D?gCsIFB$ddYAoZrgs\
+r-fVW^3prtB6uc5s$(>wQma==x9H_Wu#-S%tfU3GWTHM(wSSFH>k`TOwGi2RH5G9^P{x${5zR-q>\
+!fjdlN_c?mBXdxRgxj0O8-}&rYK{qA1n@F`!1l*knxZ9<;```tI4N%;D;Fv=GjPiEU5zhUd0IL8C\
+p-DN`&oMYYPEY$7u(trPw?M((Jchj=W9%&e>@C39iyjn&90SVc?Sc0Ngj}1gAmp`Q1LcyT+=GNIw\
+|%EOX*(H35kI8!?vw(qO%ZML{{LVMb|>w0+qY99$#vUvfJh{KX5ZyNX#8Z!*9y9yMx4#p=^H@zMD\
+0OX7}$QH%n;kR6-%*w=O;Y2kG4v&{k=<!`Pd6ZY;R`evE8R)`xSmzPw9u{WBjLB!QN61dv6zp^@&\
+J?tZghE)+x9B6dBfB+F%1FLi>KCxs#PGb=$q}q&)I)Lxi~C_kf!9QzXPr7XvI=b}^SMyJ1mqLhO1\
+mAo$TOxw0JAH!T}U-dV1s=g_)m#Je&VluLwVdo~?N1|3M$cLXkb9B$77VEaiKZs&8%LAMHtGeIkr\
+;a-i)30M$yE_Wv_R;Y7NL~14U|A14F;g{RrSe*8TCAF5r9htZqlbby+-@daVuJK5E+H+PXF8OJdQ\
+UY{c6TPdsT6lNdzQdAl$0`h3sob{qooPd{DwxgL-Sd<jBJ3iM0x}H{$gZ9TxFQ`S4Hp-<5tP6#VE\
+1-&frzscaSiktYq~wx>R%VV*S;gY)QXzKkuD&aeg?7s17s;47LxlJVDY|2e8zvT!=2)FWS&dC9h2\
+>!h-oS`eBdjsh>2En?$;ok;Uyd_>O4e0J1`eM_U?2niLah4Thq+BRPft>Er8~biNKMGt1~ow@B^}\
+jn%5Vu1;{M{corbI5_|ZUM8{|hItBsXZ9g*ks(`(+{7B`i4Q~5}=v|q3WSQRR=du5DdfEoShYdP>\
+ShhHA8Nr8+FTx7v<lC16J~T-`fV&_lac-qjsGvl-_%7f696^WY+S-?=O-26-=#V2phj%9feiI<z^\
+*Rek(MUmx)uh6^bJcnjJ0d;?$Rg}`&gysL+cCU~VAvlqtdcDVeHN!>TB0*Q2DT_bdi(nUdNqgeI^\
+`E(0od&g51k?lu#_wSi2W=5YyrIN)gnJ#fNVsn+ydNU#S4%P3y`f_fTfGmmXZbda0S3KH{YJ6Uw}\
+bsp|SuA#drDkRb&BHwY6tOdsdU*!Xo4<i%@{!ix1Rvi%|b6EJ82C3Qv6+U{_(}Q9AT0e)kFyQW^j\
+NCLswR-M-2S(mGzNEy`N$z{Xc+KuHm!s!u8vEzMKZr%6bE&hlGzM0*6Ry`;sGquGRZMQ<9n-3I!a\
+q5{<ic@aMfzB<xYv&2@TX{%K_4<8{q1Ib`|exHYA5d_;@D(bktqxL48ANos9E<^h1hl;Vn6+?L{&\
+R6uMfTe8H-SV#5(P*)wSJaLs#aJlUNGjmAxlzy<=Zu0th&(#DM|?U4+1UTEeyPZ3F6>p-=?G#*zQ\
+)Xgi=#g@d3Kgu86E-LH2WVN10_Q0;xAwh`>@1#Fp6^Q9=q|&jk*6|jP&5PNX;%r|LluWkKAhez!K\
+s8hoH}UXnW4j+>V|A={&2wYBM_hE--zYBmFYcb!tMQnS5W9bA;>@5xwST=Fs+T_~jT?#C_pQ1&MI\
+|T2{4Ip;8OJ^Bm&v(R(e+Gq<64ix1%cH;&FYgNZkDC;b3<J=0l@yaHy?p1kbCUIGiKPhO5>FY%xM\
+HuAEwvnqLsMQ<_~S7zQn`1f}By&wHQ{Q!K^*}~yzvGpyCV37}ati;}Mk~%y_{_&iZrE~fTt;mOXJ\
+iac7+}s;?!YX9KVt@<-UtsdoSuA&_!>6q!$I&>_;nUWV`2i06`My>Fd$Ob|Nc$WO@ReTND><s~@9\
+(9R%Kax5sl20~vjQpo{&_^`x2=k@*gxC%^p~*tW84(=R#m&okz(uTg%WJtm`k*(d^<4veEWX&vL4\
+lM;fH@QX@ESxcZix@2#GQ=An`kbjsrL`;QUE~Pxki~r@dFzX`>%Xx9_)>+>7d=w=<nh@v#BYd+ht\
+=D$iO(ruh~tw9B)Wd~bnveS)?d2JIqPySGTYk<KPT+C2>IFt*}${&}cT=b(+Qp23X*tWg)#sIjvW\
+{BA`;#cc<uvA4zVZxHam1wvBfuxBv_V_cr{EXC!EzLh_y_RiyILo0bcATuO&^taZc*z(U56#LpoP\
+z<|IqLNRKDkVpJnE!pjsf1ZU0;Tfpmzd8f)?e(GqCMECoNxCjuPv?ZzG%-S*w=la7F|O65NEYvx=\
+a$bZNbF|7-3d1S5~nSw%1}k<4Stk6{|A_!R_1*-~n}Aga>?vv^f8CR2l)LACgilEqxo8_CclPP`Z\
+tjez%;IzKBbkqtbx0F)Cd~N{`V}CoZjx-p?TK-=yzTKEZN=&suUTNF0%A%gK7VBi*#dq|b1TOV$!\
+3lIibnKcG3SH-dCAp+*JZO#buiQtUL!yKXE@P}IC@egsld59X2k%r_wXA)s%@ZU_i7i>>}US?Op}\
+ddOE7l~u$OfGet)5cCQ{RR6Q-X~h;K9ReG#nVxpZB8rMyt+TK&po!iRVy#>Wr<hCct3K7GmmVR#=\
+p#E8#*kFZ|1akd{=ba!|9>g`f2qp<KT-HU!tC_4Q&wj)=#(5SGEzPB9&GzQ^;nVFVh*4Z{|wZy+}\
+V=Wpht_W?RvFsuGn@7Zi`1cf{b+DQZmv8%1C>uBkiJ$blvCrs9yEFd&!l#<Q!`*LMPX|shZQQ0)#\
+A?Spl*y=Vz``eq}4aHqc*K_(VV5maEYXy;q}cx4!hc1^pg+=xX#J>;jirKu$rRQpbv{)+|jeq}3o\
+<WsB1NcKVAt(q-nLXZCw1)Xi1u?ooc_DZloM!&CI1op7u*y<8a+D;Wenlt_d2;425I%nukJn@{$i\
+<&kjI#k2v}1s?Gcw}}vnCz4_-fH55aXXT1}kmB?*99w`;F@`H^0%aAg01oc`9r(TF7X-myqK5!ne\
+U}bnMqDFvx>)naub~H46$97zK2%MHs=q|rJUQ@h@*xIYuK8PE)4@d`N~}mI5pQ>{%)iBonQFx<2o\
+Zlvw_5y_(T`WsF-F2MkejsOlreHTghkEF`eYr*aZ#p)Ji$M0p)5M%&k6!mYvB*tXeGA=+kCRP;$P\
+3BVtl?s$`K4vg;i{&$u^KhNu|L>*eg;WmKV=2#K6w<&eNo3O|6^`sK+nn!t>&&yq>!wxZ+{DQF+n\
+0QnCz(_WT9Yp<VpUcxZVrv~>7VRLNW7a-BY>a^vWX%_73SPYQo8vI4!Q1BLUm%sxjKyPTlxeO%cB\
+D66=yG8zaz(y{^pa}@@k)8TG?uM~G5JEzCpe?Am(cPEFtJH_T#&(cu_w76R)Ry?6r#JJmL3B}#}m\
+H_VB0C&r@xNB2zH-=y<IpEHWB2Q5ScVhr|pRfu5PCiSqBua|At<N$ni3*ClQ_h<r$iYttf-ICE$R\
+5qA9{x%kl?HdWeWe{$5ZncSTH~QTU^2A*6nCSvxU0wuP9)!zJozVH{D#0--K*jMfU(v>^tRv^w5e\
+dUC=8HVt4wQQX)65y>}shEarG_G4DU$`Z#}aW?>__39@Wr;tFZmbUy<!ZMbI3!!qkUQHNbk@bOYC\
+PgS6>+?#mCMFJ|V@rXzxWwV3}ZZn~2;eJJQxFHxxE0#vdADjRfA@zGj)Olw`Cwen1BmC{=KO>12v\
+giTkihCLTQ6w!x0_@S6S<lzS&eb|p5O6dc(N9J~O9akLM;I`sEFJpZtDT}zW#k>9;@A?brEC{pWm\
+_rRDbN=Wo=ta<GVQv6MbBZ6$d44pP_|aV9M{`Xa%~8c04thSig^dRL!Nt42iFf(QXcC3dwBtroii\
+Gp@16V|}I&W2_mhpb&fjCfkRuiHHI{WLGtdVaq*9hcHEbWjMCr}H9CSH)Rjs}?J2md0LpExGJe9c\
+>aPH?pfMd@kf1%PFJ)a{$oVfEE&acZ?mq#D{G22w6hHU_S`a=Ouh)Qv-R-kq%JGEwa^hU;=N*)Wt\
+1#LI0UUfAt$7uJ#*<pdA$yXYp7|Fg+rnOzgTh&;Cm``(bs{`>HoPtcp_Ch%gm4ZqmWRdK`r$3{=}\
+`bHq#Y<cDj;>-AxSf+H=$J9$+Hi=w}+Rv$t-oWUPkQ_OC6Q<`Thh}S;Wp|_wOxOVGz{L4P9k>%ro\
+rl$L;59w=F4GYj%~y1U*h5T5n0*`|bbvsk#sRVu6Rf+Fcr~$o;1=?jNFV?H5*`^g{P-mynCStHqh\
+NH#I()F1C3roO{@+v#P%jkmZc9-5H)3i2Cp9mZY21_8*rsXTvq26J2kH1y`Qkn3i@xQD!Q_P%A&G\
+A=?~|llsoY{~pgh#rEE=zJ_zX}yJ$Y?$_9fC&BjOedRTd%m=i5(FrQ8cvkW<l~C&3C*q`bDYwiiW\
+vz62{s5txil5tETuV>0S>inoF+r|mVB?(|Yuko2_kR_E<>cqi%b+I@gPIvN#4C`Ea+=ssN34HcCu\
+MVo0+C0x`P6$PC2Y0*+z<ll#iZlf<}(U+(9VWUQowdC${nx)6n;%!>C56VtiOG?x;5(coIA1W)^_\
+q2*TG=|EyODSz}T5`^r<)vwWNGOvw#KJcT04B!SlZZ)O)xY&sTUzB+Jyu=Sd@Bx{SBw~X1cGZckA\
+RqN{{j4qB1o<yemaK`Fwks?sxOIkFXbYPZvPaFH+J;8jLVbr#0e4y_bN6*cxqWR(eV=_bVHA>pv=\
+;2>~kxqV}H7We(aH9jD5mE>DWKtN5+16uXOCO6?9`i7TVYwS5(LTSVjHVyB*}lF1=5}{4R;I3Kr@\
+n2&Y->^|znHG^=2fY{^c=6lABq8Tr1qUjxoT?#FnIOKS#X{p0~?K2C{P^VmP5plFFEK|Be(to`aw\
+3Gi-RPff^_zFs4*XMaj#?J79jeWR4H$R`nF>|`sMLwtCl#oe#b1Xd{+Mt3t9J$OKg7!-rRG?93}L\
+k7}vZAw-la!cz!B>Ig#eH?$O%tow`DUkLIJ9Z}(YvT6Y74Wf=BYjGdRdfIDUa}yiT(BRzPJDbhO(\
+caglVxhHuO0RWjKZ}<Ts?h^AEW~#_dy%oT0Yv%a&Is^{euvXTIIFfTzU>z?dnLj#9URt??WnnbJ2\
+h@h<|k>5Fhwnh!Fp}q7lTSBCiwTpX>_};(PWQL%h{nT8Q_E)Ij|9x3mynR7nEy+ahlQ#P!fF=FIN\
+@BAgrFE>!FvNMML<^CXaY<2J?z*!JG`edbYuN1EW{E^=;6WJuhV&tIJa+2`L4)@Y5bef0Yn&<2S#\
+;@x9>jFa^ENZ=st&|~>5TluW0@@D1JZROLW%Hwd##O#ZZ6A=j_V@lz4D8!o}7Qo6R{h)b$XC;A^8\
+**MxQW2N>vDaY&twWbPU{lV?G6Firfjj0h-#&YxBKb|)&gNI7yt^ZpglG_?E}~ZxHLV0lq*g24MY\
+$+MpBB>i&}Nk_I(GTnd%6H?;aYF~w7i@vdLD6?%KVz>n+3`MrtMPvCcGRNqK*^0_FF`VDFE*zkNr\
+am+j}AbO{S9;WdDVDgA>GMz?F0!oPI6|aH_D2B@8O$@=E@*2llM<AU~d9kOXP1=0U|pV-A)PYxus\
+b1e+dw^zO<q7x<lr<hGJl<>h*b?%>`4yIDLKRVjo6)Wz7uKSzOD>iPy&qW64ZzY?;L@Vg!Qw*MpD\
+xto12BaaYpxNBu84qvK#Jve;sZBrZ`^11|v=N#ALaI@ECI9xSKgTvKcm*Ma&RrEOA^j#?qC(FVs$\
++U9Om-6ViFP$Jb{5QejJY@jx9K|;vm&5sfdk78_S6jHV9=i_gqOkp;62{@^3^yeSxPR*y!Q(nBHF\
+*gNNqjiuB`6jMsCo`V>H^M3DDOo;YQW8pS1{0mLs0u;CV~?}@#mwcXE64miBiY*<wk_!bz~@hZg-\
+%Zx)WU=iZ|R%QM_i9isA#KR1_b$QHtUtcbkRN>o=`4n%)2QD(svShE&82>9v<(NSzc~fxHvYY75z\
+;VjP}?Gh_=>^G+SBq7HgH621I6x<SABPQWaHUX&3!?gtscN@RqGSl2HdfTSQk`gtX-Ls#^9|Nbn)\
+T@kXA(Ot2{`y|B_-4!2tpXQVTPmKQg<<bmNar&#Z6!@?`d~rF1MLkW$Eq;3+LyBT(QWYknOhlAY@\
+&O@}Voh&N)h5MUlgDwB<$4vjE_&~uCF$pK0Q$LIQ~&4P*q9?3>OQqT|J@IF6I+2W{vEpmA>1BSMl\
+?3)eF*8jI?MDi7jG|T*z)fCfM(|)Lt>2{RvSUJ7e6441Xc8>O@VTvNns(X%wJD4;lMk<8Hm3w`fA\
+D0^78WF8s|~GK>!>7fr;{!^?K*YT_$>Gfxc^CEIaoSrnmi&cJn5_tA&h_ZQBQ6LC*>2N!T%fCAl)\
+tV;5F!2<@-mAz?GO?^QPQ9q-V165^>1t-9hBc$o<TF=E>)YTK#rNX#~0y=9brCJb)$X(dB$RA=pV\
+aii6hRc=%}Tgr{<z7+;Hir69LMs2g@+^BYCb8f`T=&v0VWc2KVavA;L7aAEoOx`rpm^TfO^QN9}8\
+}p`ma^7^;+j8Di;cWxnbY9MzzQ{G;O*`ehX<M#@H$9&lE^q3o;Z5gP^Sr6&8Yyq8qv1^tuaWSkKC\
+8@m)3>`+-ZXY~$h_(0NG)&L7^&w?E#5HTO%6$9E)$k)`w1^uzT8wGBTn}Pj9oNb4KPB_ptZcm_&3\
+p7`mk!dKOmhqS}q7^8$K`*&?ryLV|{#xK<a;yF|lu!2|e{O>q*DNYVA-o6>X>-B>HzH<>{Fi?+p9\
+mZpt1uVdH-0W^#td*O;+e3H2&=r28T?S^{>zO)BC<=-w|g?U2lGNiKodybst`aRs)DYpB8%h-Zd^\
+DEHhbLK|=eazQ5&o^rJUy>lS7Dp-8{D`?b$z!7hKJ;33dgP%TPD!B%T^207NvWxrl8YnE(aa!TvK\
+4FP=?NWA@T02!mG@I2Dz}NI0su11gewy46;5rF&yQ+90RL2H3?aH>v5p_@lI}mr@-sQ{XO126~#&\
+}hV{8_O=6;sjit^?)e`Wt13^Os}j(Fo&nE}i9uZ2}tYC1}Lgn7@rnGABW!LLwz7n%m`dOhF@S(I$\
+_q#XA|M>EGyH^jro|a}i1FmXL>L6UFu<tZ9A@XmvE!fy28~Z$+q8Xf2tK6(tFF?Rxcku*>xx8L%}\
+Ym|h6}OtkhF=>n>CdC!cmPzu|eE<?O3TiGfX!0hSHtYF<|5d;J}%=5ki+5O5+nAzAly!);sM7*1W\
+Br;_Y5b~)Da?$tFzo?J^ALd#8c=3vsf-d-G1ADeBX^TE2D3>y-T#9Kq2-B=0roo}-5!GMWinFOPy\
+!0fNb11lM19kTW{>I+U*g%%VV_yroQ(&9uconwNNM@Dh8+6<tGQ{a`kfk2KmvzruENX5L@xJpL3b\
+T0)4n^SfCb#5XV$jY>FSg>d*~~R8AVNo5XvWT`gU|M*_2Mv3>>$HD^sa1}lh%vFT)#sZriBd?V2|\
+?}VMrn6^)KzMb;QM$gyRlEpNYps{7#UIcj*MzA-Wl)M@SfD4PZS-#~T@lw9G3!OgR}6rnFxp!<2{\
+DFid$(#gy&Wj4|c6)#4I#-A(tOMY1I*SS>C=%x-fTgy4-$gEu*5coUuJ3T^(HfqUK|1CNvrJX$mG\
+VebSRxQa=yK@@-vlfDJl$TXYp#f5l7hOk(QKxqQ=_nomCu)Pyo7~3=4VV8d=oVGAD<8}kgo#I^yT\
+W~n9CT}6ZJFgzkSf<ss_PmA7Vce=PRWX~Q5Mq6B^%USxb_8*86uo$&GoE28kJ`bJwJaK+@ZeuwB`\
+f29o2?9Q@?X7HT*qUtDpcKY8&GvI4X~2Wqof%*!-e~@mP<d;R5PHF>L>EIO4RhGn-xQ);kt~_uS?\
+KfI_#ww$n3iq50h-{t_-VuDYEoS5wlX9`FJW_7C$Y6)8!T7QncA+P9#AV=0R8(L?APzUt6$39NWi\
+lg`<T$zfqA@O{D-3&1P&52$vLninsrD@2K}e2JNBATST}kpJ^+f8CBktmm_)~k;xGlX<TW4yPRd|\
+X@6UtO_!vVVOK<F1Ba)5h1ph%@9rItNM*Itir7etQv8oQa&uqe3fE+nppGBJO^L(X1_V`2W?Yx^n\
+j7gh*(u>%Oh08lZ_&Z-o`3%mZG->ax@5M+65a2Ru0Nm4c}ZfbcPCxy<U&|;>-)1TmVI#W>~7)d12\
+X~a^m%uYlvn%;e!QN93mIS00FZC-8Vi7e$4ZE0?yEc@I-e5o*bRUOF-AB4L5{pqB}ZNvNu5;+X-1\
+reIr0c5$UR`}g>Ebce@{IwUSz{7#9e#rKalsE@cYL!L9da%GwT8ptw%^(yJ}s)^zP7A+s(_HzZs<\
+c67%xZw`qDZlBSX+-FM`7jIyd1hLCvt6|^dsR~(haVpr0HR3h`+-%;wsX|ncfzkK;Q^O3E4C17&*\
+qF^HW@MZE<lir5BWB#?BdjcYdR}v>ikt8Az<m000?>yLrJKhEP=HgwR@x<i!Ky(9e@r-VeusFIwQ\
+dV?>lr7N>#^gpfnBt9Y;4F-8kj9^VW#Xe@H4CFBF)9zJ3A0yg;rsYENx1a;za5kC5*&6c`PNd3zy\
+F=1!53KKYkexUCK{>5hMPTCuPhoPcnPYx<lA!e+tJ{Z`aARURNI5_E8Q36uogSgqtGDGKi+7^Azw\
+wuq2h`(NF*QPn_?j>4O=tg$YG?7#Xqt9d*G-VPvf6F9tetZuPz0b+IP!H6dg_a*QvbFm0624zKy!\
+K4n(NyCND=7vZ|hT5f0Dl+ek8z7%oOd@icGxbb#;W7ci><ELDC}AA3AA?^;&##A?OO^3$Dxa$oDU\
+0i}15nFmeae<27}Zki>QbLZs5Y<?9sQy0>wT?rDVQ$(%|1mxbDtHwXieuXLT@VLyw?Q~53znXzl>\
+8LKIFyS}fQRe>n8-x?{+_~`@<*35=K9;qr_mSHX#V*GoA3ZRO(mlR!@tr`q<Q4(ouP|lmD)G`%E-\
+zoc?^*n4EuvAqP-EP5NEq&$U58alqHpGCa<lxfIPC{ZYF+BFsAe8~cRLY*K6wEF<u2khqR8|_e$4\
+mfzCdj`#1pB;GfchIp4|xW*cXJO?AvT!K5?lEvZ=e&-&dUi_%yo}Ok0!1M7-!oz2Ip4JIWPPpS-1\
+PoF-Y?eX2c?zf-GlgEoHI<W>kQ+ZNyeHG4q`b_n-1eU5lM++|f=2rlF(wmLxMO+?u*_Win%9R}R1\
+dUz0jvgP_Kyl}T~Thwmf^Qaann$ISKx=yRtVnEG*-em7B7UdX6`PMWz&cM<xy>pe^y^5b>=yMG9t\
+-$Z<!xeI_PUyeh_0{u9jEV_f&Z)?;gM8HASo6K|)!=fkt-pK=yZ)8;SZV8TPKZ0-_td<Aa#w7lEX\
+2~*Y*3ubee1R<B!3Y}Rle>kb;prGa7)cK9;;sLOBOgfqZp}(zS_&l+7`n7!%NxPJ;v5`wn*Z4yr`\
+&R`!~s!Gj%kp`f-+W^)33ZyN&!?)6oEJ10OjK{TYEl2k)u^HwA#@uhgt6EPNFAn;`*=t|(I&-Mp2\
+`=mHxl0$_XD>r_vo)n;x17E}ng7({0r;5wX>%{qj~R@oFCowPByDn+aesFxor&je`+UoBAi>X@n5\
+0S501rIC8$u?2YJp>HF|)x{WxZ6#KYCL89^d9A_cxD(jxQ7hP`WAIpSwg9shYjNpuWxe6?7<+ttE\
+p{Kd8t?iE?8Vdh3(7t~8cE3#wlcu9yz%Z>*6{|c2plSo=;o<bk&u~1-QsrTsCa)Qi+!>n-aVX>X>\
+t_lE{@eopxwn=OXG1;cQy+9Vg@P+e4=R3MJ$cBG2RO{EjH)%J)bqZx*~47S?Sfa=6&~BqL($~H?6\
+BO#ldxIFwZlo>?A{QJZL*f6eD1782gOEQ{3Bv>NZ6=CKAJ>De9IN{fz85+NV=Kg}ah>ydIF=l|0f\
+TabEDre9lN-ZPwo)gZ^rI0>SQH?)9v2v0%q%m5T*ed-c06WIAy<Pf0I}MuN7Z8X?@Ok_)2W&5;js\
+%5(bLPYmy!(JN4!&|+kIqgQ$LmnD;K$o=Hxs=U=+{Y_N{wgQsDu9U%P+)_6BBs}_B%K4W&V0aUt8\
+{|08R(TC&fJqEOv(|@Nv-SK?YyP}Kc8#<iGON5PhW&vZvHy6j2Y;<OLG<&DDw*UgH`9p87xv5uaQ\
+EkF`GUjf+@8D9>;4(y{?vJkkVl-^*!{DZ2S1ZyUP@!9gvHz`;SpWE8EH&wDNtGZh7H7Bh)3#dm(K\
+S<N`BrK1oC_P1wHv0-0NwT-s>q)Pbm1YYoY=5B`QphU8xnp%U4vosxOnKi|~r16tJ!Iku>d%c{|p\
+rGRo8~>>%ijYV!PQ12B2G87*a|x?`?zDLW?JcVRz%f$j6~xZnl6S(l&%ig$ev>%Ew|uedr#Vf$>6\
+sy{yIZ>PD4?WY;aJ~3*eF5WSAyL$f(D)r?qqgx5yW(_QRWP>gx8+2jHkq}m;!FFBjt7KnHQ52tnP\
+cytMRDpOjL%KWu=$7n`trjWsnzBK^I|jeQUZDK$BTcEDpJ}g&#usO~6Ky&iR5s-(&P4p|GL_TZJ5\
+BR#DMj$PHvs^@FA#2|^(`er7uM=^yP!H3>f1GOGrK53nb&}&(&%N*k|5~wQL|W5uoNX_-}a@9<Fd\
+e{h-r#eJm+Pm_(!na7t0um5LkqTWY*K5rK+(7Ggzl$$gqrO-C)wtSPeqB8&>oOT%o&(IUKCnvrxO\
+k^l>T|P(*PFX7O4oW|HTpNld#`TQc086z;}jQ9Y;mes*n@nXLQj8reom)l>;KcC_hFEr7gnhPKp4\
+>8Vv2+Zi4n&pgeN$~cTjM3m<LSR#N*gB65;z%kPU`s8-S&zQ~e@CdWgiet>-w<kp`SM_s36%<+1k\
+kX(;gA{M(9PF??XO)sX52twl5L<eEPp=@xup=9o8#IE~6t*V-Jx9I7$h(O7AFG<w({7p%P8%S=-F\
+Bcj+2q>`l-%Qp=rX;|hsbY0DJEjn-^AT&0$UH<uZ5Q#dlqCYw$fC|*q-n-)6&5Lm_xhxa+b2<g_M\
+P}XqYx>H0Lc|Q9|eVUNra@6w#z&ZY+;H4ZN&EycJcZqK3VQ0qWB+^y}E$D>}nROiKJf;+27bakm)\
+eq8rnz3s`br<-@z@D~pw<GN=kPJv4$`9bE}!T@l(*)~BN^Nh)U<3J|{;rzRslgSTyb{R3QI1FudY\
+DZ|&{S=Frc<O*ezTfRB~7n&y;Un!pMjRk#kp2A<$V<rAhdfn-hjblSGlKY?Q3m6ZO;PPjJ+EJ|h%\
+=bMyn&<Szs)48o*dmSxRfz(K<gPW^jpKEvN*T9K6wWDsTFv$bpDNN$SWX-o{B_B9z$gK&KbxRzLC\
+s&%XFb&K^cKRgx<`@Ck?hxVwR-7Xc98+1vE^FnKHr{0r<_fuj0p+-rYrQwXqsmoQlvx5@N7zsSx~\
+?A;ncR|C8Uxk@1Z=K!e<@`q)FKX#$0J)6n5&S-&J>@Y<>r-HUWSIX;X^R>2G3g&8FtoZ2C@XZUyh\
+I{c~8nUp7%bNCYDs@t_(iLM^904_+mefjc3K^a4$0ftfTd$C7#ncon%5a=23aRP`{%HA;W&70!Q9\
+vQ<bP19ekIDO9s^6#GDXHu!05n4ZK~M$P0b;@DJL;>NCtHu^J{8mCMlx(^YyFLS9%xh{`-{<Q+1e\
+=Pvin>#q@J-f0!Sdav4oV*d?*6m=Typx_*3cv+Xk2oq2;I<kfH3J3Tg*T^3cHu!!2c$RgO61|-Ie\
+%5IqP57}HcoDlIX6F)47Vx=(sjIVti0oA=F3iFRGHY7pglp%TEivF#m`L9!O(XqihmVyhUfElV0*\
+(4!|6#F*{PWFGaR+|HOf#itBG5|tkf5zCy620^V-ap&v)fK)9ks71rN>=bdUHf(Fy1RcFKNyy3A%\
+7qJ41PJo)&p&NU5|5~ceuvvg;p(%F2nNSF=r&(zH3^$A9^kq11fLi(_=THG{*0d{_y$xIIn6m_S|\
+LGi<!korX(DO~E*G`UG|!yGO3hNA^-8W^(fJZf3^y0h*|be$TM_N=N*FBzfJ=u(b^s?%Oe*Xy*4S\
+7=3(p9U!cMY9ZzP8$UXz+LJcfp!e5R=a&<g^_kUbHYv3ZdXs&!9uZKs#Z($yWsWK;a-CR^y=~mL*\
+0qqxLR+HhFTM4asFlW8f6lEl*=8}?ir{k6vc2i2ow={Z!udcAUag!R9NnhD`;+Vy!koDQh#N($S(\
+{BpW@HxrAX+TE$(haTmz2|V^?}%3I>;B=(JNF)9$uT6a6^1Vgx|5_1l<D*pfxwINWKN#@aC&Yn3W\
+HDG9#a+5jU&(!VlG(^p5CQIquL<qqgaCkyc8kH70I65#2jQ-{53V-^Qb8Y8J%m>1!*D;ukOayb_m\
+q#1ULSvm`o#+w2JEg$HdNCa-j81&x*R2n2_TWoi1I+`lNAe(^%>jN1$j<xj;5SaUjX%gjO!F<{aJ\
+|A2l@p{y7yhjoYEOv^fQ^p;ItHvGu$yCUa&mZaXUErG;K@ZG^E*32Iy%rOTeS;%dia1nOLC<7G`=\
+O3&>XUR7aP)O?I&o9jq+}<{_xYztuSeZ8o!xdusvVueWF<a5OrWQlNuzTzn+r5}QSG;YOFngeGQk\
+&)4_82ZxB|yo>MWOCXc*~RF<l==F5`-Es!A;6ZL=mZ76Jjfg&fP;OROek)F8%MY+gd=02dw5yZ-Q\
+<VGiYz3n0l->e>JkKkFtQ9S(digdhEr=Ce5akQ_}|Jx{I2mU~M-Mmy|-pH2YZgEFl@2qbKTHk132\
+A^9`drBWesE;#pQtI$79@0r|mn#?m<E0y`k7D(=M?xR>~7)wlumz)O_4N%15l#J_@)gD+T)gx46A\
+2V(#s8*vd<D1YKErQOD&r^02;toIp^8v!$-4qwn)5<K)Y7S5Puew?+zVGI!lFWN9vXPi+clsIBm@\
+SvE^vBST_ffyqcBx)cpjPY@16fLtCK{o-pxTAz=MABuEK+>)vq0XEN%4U>fSN_oYmcy3Hngr8=Tb\
+3<j@c22atAOqNhI8&$w6#8Z1WNX(yiDUO$gvbxXAL*e5q|&59#&`f+YYD@}cyD<iB+!U+gyujn<l\
+VBA5w*L>7m7p2S52y!ec;S#DpfIBC@xsUyR^PZ5h`%wRoMWTlu(hU+F7!;Vaucw^J-48vsBh43U}\
+GNZ#uELRf`*LFQa$<V;JXxPI<=Ruf;@9l`*>&2Y7w$A>V?v3-;(yaRH1LU$g8#}Sim165$mZ|j;i\
+%`N)JB$kvO_z?4+L8nWIXr~zVf22Vg-o0(+ec(%Nc}Zwo|K=Y7|oB8q)o9?ArUUiNDJv0MRw4dbl\
+evP%1&vn=M1D?X6R=ic_XD~AlBK2XCN&{hjRu}f27$N$Vc(P&OqimLpcN4I!bp2vTMXmI|Hc~FF6\
+A#Pf*W5zDU-cffOQf$k%p;YVYbWSJ~Jz78sm?#ENPJ!jML2Bw#?Gdu(b`hO*`3w8{kAu*Y;^$^<M\
+>RCp|5**qx)XUTmm%rtOW4P#Q0CK;pW@lJN62*jJ2ByjiHN&JywtAScMu~OH7Gy|Ct|M)&32+^C2\
+^zsB@q~|6GBmH;+KhjNuwN6g^7Y7V;r752}ZZEe=oJ$tZGiHy1sPOybP$jD=&v5pr`Q}@Tp?$u7k\
+C5&2^ftAJy6d*+St)ws!LCs<6K@ED+TM<;pw_*IPEh;3k0Pku-3|$Am3ztswI-vCeOV3VwE0h8zn\
+r$|$q+ZdFZ=84#X4pB<S;>*K0HiRrX!4$X+v8=VsBIY!}o2?)TSBUKf>G!&Rl@u$U*7nH@jJ`M&h\
+6aq4q_52D7*)I86l-k7GenS&LAtzMh!^T-8X2IBi(B5??W!^Qd@!p%N1SyUM~@oQa8fR5X}QJSt{\
+94Oj<TbmlbXFAqCQ*JQz8ew>}L9N<9Na|B;|eEyu^()h2>B^d4R!S=FdPpO`MbDWAt8!rkCM+5Us\
+nyBt)(^Pl8Jx(BnIK|~XOMAkMc5~+z1f6UIove75eYxI`G>4rkpSIHrQ^|R20hD>>#=^fue#{}#Q\
+^ImIINxtb9zo-E72=gg@QmJTFU;_!4j`8uCz1Aqgl-uE^MphIo2N2B!TGW6X~i0D@2MUOt8G7=$S\
+xJfui^NY71e4B91Fcl*uuTuIE{YI-7$vxjpmSJX?*#fBB)dvz~m`DVyCmeEnA({cGkTj6@A_wt;W\
+~m)z$cBnz9-XrJ}MGL-psh8j79jl+cmP7W8Xp!Q9H*f_6+0%&mpI`TAfR-h5pd2+d!gc|L>iolr&\
+%LQ11~h!KG~=frhrMH@QHw4&or=wltm^EfHPMbGVtEiD#>b~}$&E=A8__rfzYWGIULKe|A*T$;a^\
+-7sHkphEdMkiVDOe>(CE07P6k+5fT=%T`<{n*OL*<Ea)wKFDHsu3=G>-h0Z1vZXVN`h?r-Pd<rpD\
+2}E!_R_GT!EKn$&R!hDT8<T4u6>eTdI0ALEFkH=Hi}rD1AYeXJ~l_ABrguRJ@iKf$3AZFI0-g-df\
+w5U(F6-K%3)$EfsACnAeUpx(dT&BF<42n6Vj<U_D@TuD2uOXRn~Vhy9Sn=evF(<4u|;D#U};_J6#\
+O-RLbxqca&3*8~ZsWC%IT3HaM4-Xb=+XxL&20+|fv-sM%7dQt<QQzDN*7RkVz@Tr()J*dy#O;}9S\
+*AIy~b>IQEw?&d0hIByIW-{sNfLYXKiU75{N0EAF^kyAM@6#Q3IcYVdxoO;qG+DxvUFc9P4pDMH5\
+8s>i0chIVX#H}Sg*(7R3m}P^0atrDWp9tlV8|=&L@=hg_I!bR}Zr+`;98uywFd!Ub+oEx1Vxj@~|\
+7<1mCC)O6FTl6zwziilMluL<3L|y~1h|&X6;=uY*l&}VUU-qhBegxCULL*bh9z%Jc@h*E$XvRjtu\
+9N^gX-A=tu(o<A|zN5gY!-9uV%<Gk`l5z1(ne;zkCezs8Wb;#qo4)=`r7-;z;mc>m4lKkYYqhN6t\
+s`_=nZ7Onf_bL3Q7T*r~g36lOjW`?z*gz{Rih3?l{|U_XDNHe#lX$aY@tRiuO8xAT2T{gnmua*lP\
+yioeR}j*!Hwm_@o=YE9Nb&?trFf@%j^E6ddfjmvkSpDZ`DbUkJ^V>?DENS|Pf1UbHFfB}XZA;5b>\
+W&SxjST9bH5+{w**a{J57UK#dM(ZntLa-B(f~lS3M$t6Gf;WzuO8AFf!2n`(ZW?TCpY$_`04xnF4\
+byLvi~|Y5+ME^AX1BS;jdS*3Lv{ByH1;6*w9G;hu<|$lyxtuSfNx{QpKe&!Nw=3-{ik(1vwUBnB2\
+86(UrC=R-B->(Dcx7b^bTiVc`fBS_La{c4Z5#z`j^z3B1)?dAVH%*;$e|LS?*!6C{Y@3XiWG+A2H\
+?pV5Fk)Cry~bOy>-oW@_Kyb{e_FNL5DaL*TK{t2_j)v5=-@2CR8;l5%fUsed?=$Ef=N;V;d#?r$%\
+2gDtCA=RR;JX=7J7$b)2qF7sz(g<&lk)+{75vJNQmM4yE1$eqG$J76)2?<&O7OlihaMF7|nT*Xv5\
+J2jG=FT@Fk<e>g9qSoK5aiHAanb{y}w4hc{;%#1_dYcbGo13psvTBOxKTO%S){oMs4f;Jnwu=dvc\
+dE4sQ-|GVYZGE7+t*ae8`-`@j^KooM!E4`f`$lt+RIDa)B)0FPz;)_e-1tG6e}mG4wU2@&8U;6kL\
+0l+_O!>e$og$p%_*AhyVwSQ*oJol<pd!s%+!-Kp@o;5OKW?cGnt$n!e}30Hpv=~X|v{ZAjs*D{DA\
+HuP_HD8;i#8OXYv5TCVy|PUpuS+ew?=7AM9KpT3fp}wT?Q}V)fiEkLYE&WOee`kteoi#A(l2R>3}\
+yl*@f(Nkf*?18jBWYQ`SD<-bJ_X^6R0o~;rm$g?;q$!8yAn#NLouRyQ}{M><p-S<9Buh^P@7NpYF\
+hv5!u^?35J7OKVf*XBag@0+u%n@L^{XuA^0=4mbBm6i9K6D~TlCVTVnK=NjGb@t|V^u}M2Uc4tj(\
+%(&XQ9zJ0l-XV7XDB*Os@q2Orvf`b>=Zp*`*-7cipgQ0r>St*x3H;Ts+iW4KkQr5OM5KY;i*7q7b\
+C?hZm0+~5n!Di*Z_u%)@I#$_Hkwb^>JcZYBzn}B;#n(N?puiO$)jOiCoaigaeWdnK_mHk3FCZ;=a\
+F~X}pRg<0hQ1HimiDfakXM0$rvke5kiJ7Lnk}Rx~kz>NH=s1An7LS@i7o4iAVpMZEO)dWv=(A8)T\
+5SF%@KMzfUYNPo05*{FcKQ||Nnx<=C;*J<!v)~*$gs$KqymcUn>sP4FzRG+~HLr~eOu9A3~;F{jX\
+2EjBvs5ZNSsO!&er0Dt)5Rcj^TrZ@IPQjG8t&hk(l{H!#Gcr{$o@8<dGwlAT|8;n1#pz7AjSveEy\
+f*5RfYn-=)DhOl`_m?|Y^tmn+q?@;grOU7d8i5{DnTu~TqT&?B?PTRs_n0AZwAFZPZ-)&X^qbvp;\
+(o6Iz&vX)_|(=f)<3&FFORy9?4WC{ub&-+5x|4&GJiMc}U>k|MXMb20PbNucLmoC8(&rYW`e^d{f\
+Tpek8;5abm?;d`{OQK_%7J{S;DNm@JKY3tJ2Py-2PI9vmuP_1T?+y4vsVAb1CC@1P{dS>=^^N-DW\
+=ss+!Da~;PaqdN=hlGIsp95TF1(3ohz+?;yUjE@zV2zX0<IiEoAB1U~`(?1c^8#P2bjIg!6Cb}0f\
+AA)4@LXm_mXxq=$<@O;bbg2)*%EIwnt5yNctpiI3<2x&+6td&QuD!teh&sMN?5W3kf!q@B`Uziz_\
+B&G3{rBMEV5b7t1^jOJAS}BOe{{l~ig*>Sc}JT4UYmP|i{R0O?5r4~c;kUg*r^SdFp33Qvm;D=vr\
+=@%A6($Y)_O`ff|s1@D`6E6w^v*_%Q)++Pj&PoX$b{Qtbo(R^sNxXAi5N%r`-w2DAeTK1tFcizrD\
+d2c!g0~&dx&d9o0o8e?t~z0w>o%B`u>@$u0<Ltt~5@<il?#>8(G!B?kvyq*kRmR%z-y@}iM=v{k|\
+3sb*7OsoIy7LBZp&X`4_*@{qF{=M^ifMGTQ<5t`@Yh}M59EQ8(Ymci{<%;8FvIBean!_4=ufk7lF\
+wu1sqr1UZuHVpaU_Pzo?T-{f~52rVjCX)hj1ai)W77n51c*-$e2*XThE)4UD=8|F7iIopiBHJ-TZ\
+_1Id;yfQ8V7A@CK>OXp4U`@_ZRxIT{<rth2M9>F%>}K5ZF5R1W!qdCB&Xap>Aop`gr?ri@5J0Q;G\
+21!lyM#~3S<b?d-d)_L7}}hQCPn~FJ7U|x>pyEWtS<m`khk)x)ddQ$|o%ddH>o{amBjxUdfbrs`4\
+cLtWhQ&4rX^XJV{6*f06u2LdgTtlZ2Ixq$de?wGM7$mrA<#*Ape(`|s6Dx)tDjq`4?PNEXwTpoG`\
+CI|&QApp&qmQ#w&+3M@JtB1`KlXcmGGGN<I2IhH(3{3Wz5J%aX==U{FXGS8pFkPI=Y?SyHLd03cc\
+|A%?JjcKH{26pXhink$r|5{t|``yLwcjv#K-BA1e<9)dA8_SnCPK4Z4LZnlJ&=UQ@U#0ux4&T)Jl\
+HV-&$*V=O*DY!lOlkk5hwS84mj^*Tirx9BnN~TpW)R)nKv$hzhp?4RO*N8#89nbbxo_mzSlu@jHW\
+8Lpz(qqUgA&ccP>3eo9wO10?2vjy`8t*=j2`OK1d0(9b&k>EkcrX5aB58)=~IfUF)|6*2_>XYDXP\
+Y8BLlDrGkr>#)&CKGd*VoF`HAU*mDCRjNesh&F}}nQ-cC*ci9cQp)9e9tsFPqq3^U^4w>qb*>dkI\
+=D1&PumDGZ7rDgH9wWyBjbKx6?u7Up$dspnT=?39yYDQ9n8{<-vcPjl#6yicrM=byS`|sa>|Ni^;\
+-@pI<{rB&`fB*fv-oKF}W=$A1Y*y;b2~)?lX)`Qg*r;h!(UWsjYV1_!<jJv9r=`Zu9x-{sXid9rQ\
+^!u2Iw5sT?Br?FrpJyRlR9Qp>X^~76Q;(Z)+18KjGJe%Jo@OPRV}ko!L*ss^~^CNCQqI=YS@ISv&\
+PI!y`Jwc?qIQa7g@aXx}e|X=)Xmlc6WE>$Mql`sD0*4^wro-si|Y8OvfWjofbP~+Uzm0Bc{gUH}h\
+g=O&>98jI`cF=alKOb0(yY*H%{h?KTw#6+3GDh?yhM%xB`6kDV}ij73^P=4Y8{>0=pb>1=7N>u0K\
+S%1Bgo+Su4RV<wCnpE^rhVfy3|^Ty0X?a-rhMCycTQ)4I0ik*rEIBg~x^R(EJ6UMcPwN$kXOBgYI\
+7=r4UHf=^A7>^n;6@zdTf<0QSS*fGjv>_`JJ9)&+ap;q&<53?|M$8>HYr_07^&9-Z_U;Bcs_NeV|\
+4uT4RHH_WHbTG=B1DZaV#I(^2S^b$)v1k0ZPZaBMvXW^ga{EwM2!$})KsHJ9Wi1=)G0=#n%dE(78\
+P-7Q_HWVc4|{fHT6y{dUG|M^M9Y2Z!!<gKHU3Xcdh@!Dr@PB@Y(0=efHVsF=x*F@2)TNPjoi_y^-\
+P@=_4ur@3VIXUKlPjJ2PMZ)XB5c=ac-?ed%o}^ZjQ2|8)I^Vce2FKXVL^{BaHcWAdLaXKY{IYu?{\
+oKL6A?;+r|+@=oiUq|{9|rJ8#FWkmV=XcaSxN|Y)>Cw{LgX0+fE^Qsl!#9)c}G*`?B<AQlHBZ}tJ\
+Nd?C$HRi0CQGr#s5Ff%O+==aY*x4~7gi|nrr=XgwlpA}?lp3gx83PzSKW5~gNW0v$10O~=4q_vI`\
+MsFYhC>&`jBfn=`!Qn|mes_JLEMH#Y!ic6ffFvIJy@|YW;mv?JmxRvu<{b->r|@aQs#?MY{Q`|Xb\
+(QUC}#BIGuJS`lazY?x|rd@-+E(4Jsxd-dnI0VW6aowFD_@f&{z>OhGtS<Q_Sd?rPO`soU7Dd(2a\
+}C*G=Gu*o~L1WVz3$U6}7y>Opj4?W&mJ#Ub?Lfz9+ko{M2Dy_x>UU!m_(rN*s}83FtX`|%22%ou%\
+{Qh&u#oNK<W3{PDXGaB%v+n6sdSWEk_R_f5(=|^0GMb{|xHdf*ncf^cZeCbY>4@bAK-mX>Zgu7x!\
+2}ZFB-RojT9X^XK*uOqzbYZYHW^Bh}?q)f$W&`78nNm00!*b#hKkE&fv55V`Cal1JU@abYU(9I6B\
+kyPVumnT603-MW_BJtoe#Cm=I8oIeGpbi9bsaX~=MT|uIO$>f4Z9v;eK#w$58Ls~j+n6<TX6`VLI\
+>mWHFV)l^k6^w@W4lD2bN$6&%p>bp_-zU`7PWI+>9=K8$CFPK0Np_rpMc`7yGauzd&25QnttGSDc\
+Sk_!!n<FRsNeuoH^{Opg`Vj|<Uu9PPjoY{x1b^90l5bX<!UU?(ocUc3+caVy%6SLy>S!Rn1nj}2I\
+dt+*DqU?=XtUL3%F%zu*UPf+R(EWu4!g>PXU?!mP<s*~w)GWOy;?8gw=*#09}g6b)z$EjF{wYV17\
+VJB`wAKUdV44B(HhOlT8>jUSYVmoiZ2JFXH9Q}06*n;D62cCul_%!CTy;pRxz2bLq^mN80mSTtbr\
+DE8F^|%jPvG5t@hvm2f8!(EkSa34^g--0p8nkU@{9y^UVJ&XMHMk3(!a*#4mhGXO`mqvsqX#Ru&=\
+2?scHws1j-Q*~){6zt(e6`}nt`S0F~7tU*I_+&VGHiWE*!+|IPrP&$sPI)N6%pYfu*>{{8Cihg7x\
+?gwqO*yaO?|AkMnRZF2>QPvVO1(Rgmo*PeCu%q9403h=Ul$iXYQ&_!t&ca4bY8mTzTxT!)R=g>5*\
+5-8kXJn9+x)<38-eBKE&uU<EGkX8(_`V>5n<9a!>G%;-Tc?#2)nv%gj^)8ANvwKx--@fr+a2SzZ2\
+>NLjvD{Sw0GP-acdT;^ya4`n34|{RcHpV+1iMC3%11!NdoR4o|J${HSxCgti<|m9VyaNaD0n9(0?\
+F`GX@KyQ=zk^=<J+|Rz*p27)Fuu@(gBbcL%X<dfJ67WKpV4ltLLYX9*v_!v4cd*{u^-30NxM1gnD\
+BGjjUQqaI(peovFsO&Ppo*0=`o7EIO~^8kMp)OJ!dM5u>{+(3cIilKgPAV4?A(<+f0w;*pDCKX!E\
+S-9mXe)!TIRMdOUCk+a(s`7MzDWa4Qa&`Fr#mXF}yzh6}J7yRiX3#8&(gx8TB^j8D7<qu7oG9JgO\
+ZFYdrT{22G))c0dXA!l7Hu^jzagS)X2OT(-eJOjIN9rodexDN-g@H_P1ub3X!Vhw(bjd<V(Opm45\
+jmxnQyKtYG|C;H!ikXh(=*Aj+3>z_wZD!ub^msA$VH57dx3KUmwo5F>i+{uPxCR?BfNl60cBA7%r\
+Z;okhp%GceAYXbqwBX!kJn%$wqYA~V>k9;9}ezfdpeut{T=HSH{pEj#d;jV7M%Wjwg+5;+i?r-#T\
+_{M9QqGSvEUEXiya@a{o?D`fxEHC%>T%CkMnQ{AHd>s*)FgWBUp<n!t_}3C+fxE$BYO30HYYif@<\
+<Vv%kWN(T$tYi+$+F7zS}dKhxtG7{x38LcQOmKliX5VE$j(4saZ<#qVM#uE1Wr3;Xdcw4KMv{@++\
+$+=KIR5bLq>6Z#9wK4l!E7kA*(IDl$^?SS*nLM+4Mu^Q)N11`o^yaTu3&u|C+%`DG(=NW%zxxdGL\
+37xnZYp@R+aouP1HwLf=zr+YS{)6>=0plG@aRBGzoGA5T1GeJCe=t6<33uT}9K?%0XMg*BrEWwQ-\
+iaREj6R(CPuh#;;tpJb1Nbj2s^L6$AIAlpjtg-qHsf0Cz%J~;y%@n!U(ntQ87Jt#;xDNeXQ2n{(1\
+-V706Q^+Z(#&?p<1BSC+NT-b9!v}Pu4R&hHJ56kapt&+<`tEz;?{Pi1Ug6qMvayy73eAV(2Tz7k-\
+36%>SD4g%dD}E-YBcxW#h(7;CV3h~>tIu>*Ut2Y2Ic4F8LE|A29c4xAdJ-DopdZu4jKVJ!x535L*\
+*5!{ICV)oBmwU%HNR^dn3fJ4}dlXDDX3!Z~J@Qhr;h+;h!{E+d7PJ9d9*pX)#UVIh(*pERRV>65}\
+mS7ZTU_mYW5iG}DSc6OLhS7|E?7&yC2S38y_`xW{P?xYBp#$>|Fbo&E(Sxs|4<i`BLq;1$2&*uH3\
+s7<W^(s2>ZFJ$+=)pt2Wf;A9Gj?<R)rEcdIqt)P0}Z3l!|@5r@%vbVw__s)u?@e%ZXACQ)8l;Hhx\
+cLO<y@~}IYzJskI!d%JP+G&5q9Hy*k_i*eHg>SD;VboGd<428mz-cT#jwnhTXUo`!J0A@GC4_M86\
+%v^mshhU?n!<#n^@o*o`}I7k+|+IO|ZuD5~SQixs#A7vgyZhOrhKu@nD(82yL__Tyn=48wM%Qcf&\
+EKhDPp)?*A?@SVe{7o*sRS06#UaTOLWR_Y-v$1PZc`9~T?6CRK4*o@ooVcdniIEemlQ}0!rK4KM4\
+JIXNXa5k<*4|d{e>_tEJV-!c%GcLv&Mky}9`RK!XtR6>y;Zp3zPm5_c{tNfvxbd``>-M!+jt^iB{\
+s9}YY69)XYj6;EV>8$B#YZ##aVqxUYAk3_>Rxo>3+Tq3=*5rFkDp->3mt54I0d6P4-2kS>Idk=CU\
+oO^^x`w<$Ja23JI(1aYEF;2$1wd8jt}U>Iq1e3^x{(V<8}<<9t>j)qgXJJ>91!yMJKLCH||6)M$n\
+HlCNVwMU>F-PYL>?WFY6thID~FIq=e~l4f-*FL3|y<_#sAdFBaUudD*c{j|<R^o6w8f(2r%4nI6x\
+<FxF!feOR!R{W&`EGj!t_Q<xsz=*J}(#5*vI?HEM^oy*wYm$Kfm4%_f)?8cv9A5J-r?c_$T6R-p?\
+!YaHG>+pVDi(9c1!`O=-V?V0nnSMF@TP(p!titoK4jXVSuEtL6#a?Vb!7v7JH|DQkKUT(g#Xn#T{\
+s%VV!6(vgbYM5G#6CQ4s$mS_DlBeN>TayWXR#Jv$7ZaW#<<2Jr(x{HcX0GgY&Tenj+5BFa2dAZ?Y\
+IRW#2xqy4qy-FuVnmS8Ah-gzrY4Od^*$PY}|t1#~oOY19%7Kui`o#%kU@Y$4gIUyTxWKY*y;$SdM\
+?f8dT+Mk646zS2Mn5uphjI?Q|CV1AG}<aMWpr(S?_u!8pJGMlo_G`%fR+&uor6*fEFW4mzut4ol`\
+S9e#Bd?YouvolE^VfHgR=n)QJ5zDqyiSLd_-u<8Pq3!nc!)2(6uSHp7QTNg4;@$)M<F5;1kI4<I!\
+>!|k*wx26G4z_S!hAv!$<@d7waUmYPn0oGG++YZQj}a`rig9*7+etn7!yFH=2bZCGM5z<5X1@3u7\
+Cp*(#tQrkF2qN#VZV(hUd#RuD{&iMgu8H51N%d~9Cts-c8WuI({;47Q>h;>VLaop*VC>|>_0Jrr+\
+aDF(;WY9U_9aIrL=FeQa{BWEMCTZ@M?5C%l@>H`QdkOWP91ddcyhmz;fF09OtPkXa{b_qUV*eH!-\
+g9#G4q`_&03E%9Zph{%{rJE~wNc&5SoZ<z}{*AG3b28|$zSH{!0X^v`PMkI&!2cJm_R8Y^)(*5VW\
+&%hAm^TEjSgiGEniIKp3G!OQG_?qI%n3HIT~cQQXLX`w$~QR;f!jXgMoAEM)C#uK`5{9TL#tVADf\
+!~lMRy?FdO_AA(qqZ#kpuoQRUd>q7jELzX_#rv=ex8ipE0E^7uinP)njB5uD;F-9caag&5<-zl?;\
+5PQ3=)?`^#yR&ePH-J|;01oxH!j5p-iK-}=W$qqyRZuPVjWJrm;D`HjGcJw{j>wiaR93@|91NK0m\
+eP9#v1IvMtl|9@ORjaUtu3MK1hFJ4?5V6Mz_<SxDb8Vjsc8e2oHaV_Tp?*cd{Qs2lk)~KSB?Vewg\
+WTItK8E7{WCe!ELD6PW#b=V;-SA{uVp2sDt%}mDrCLpzSX9XIO%rScScha@@kb=*KaSaoocDa2Ia\
+GLEMT(>sXIifkU_u&wHG4k9F9w&b$xK_Jw`88(RXjb3OYZbl`S$;V$&7H$TuoyK%u2v>RKn7dK%)\
+_M)wo?Ep*gbF9MCH?m%F9j?VL?8NQZi+i!(%%5bu-p%ppDaI4-MmP3sV!dJ%+i=D+v>WH+ZuH;~u\
+EXLD?EkS63pTSoVg)v%A3Ja__F(I?)Qh{&b`Sf<Eo>*)g!6F|*5jAhie=BSJ>y#3agTYwm+^=nVZ\
+NX93oOG!p69rR71)3eqaV94=r`}@G9IxB_u(ciWWT)~oA7toj<z8C1DuSzaQcr~zqlHU*q_hX%KF\
+6!)}nfm<;3Y&%6|SXoR1%2gK0PIz$gZB;3bZ8Sot#BGj7D9Hu?iAu>KXs4L*!b7{+$ogWGT)?!qz\
+KXcx9)@sE^xA1l%J6WWDSu^Df|4qT5t_!#cSZXCh`UuE1qz;!md(1jjcf<E+N0Pn*PzK;>ieT{MZ\
+AlnT(a3#9%S@htC=tD;j)8ljuJ!syyWqRCzws!jUb=Dt#jBYIa8QU9{q94z}AYO}MycwhTDHcAY)\
+Da=}M>qv*@JHB$?_fLb!)<u{8}u74!a;lui#QIu-lX4f1=ivgY{n09H<taJ<>L5!4tj7k`mh@VXz\
+OLUa4JUdf?qH$J6P{;(Jmaq8hqfFY){yQZMX-!@vXOM7nZ$4yRZ_AA7ej@mFUG<451Hayvufs%dr\
+=KgL^S|2ix)EO4VX1-iPyXFV^Fj_c-og6?WlsxE+6wd$C|A(+4;nVkw@7^U?M`>jNjEAFsh6Zo@E\
+sgi+iYrazxx|AUoi{}t`V5^TnEumi8f9&E+k_y!JP-UlrAM$Wsia-(@)nCbBnY{q5Sft}ccZ{lto\
+z#*LQYo>qFyid&Z*nzcZ?_+vA89T5Zd$1WDoEHt?T8v>Q7XOBR#aisg=^rvqpW<gM!6jIQA7MQ<{\
+g!^g2QY{s3}Zh=an~-!Dd$_We#iEWZCHzIf6w~F*D!#EyXkMv!`5H}eu=GE_y_iXI30K3A{@YW%<\
+nSq12fL>Kd=T5`6J^DFT^&y1G{lE_F)h1!#*s0hV_NzSP)@)oQREBj&0bE-5A3@9P=lp#|kXu{P1\
+Ed$0n@7?bwKGK4$&kKJ;+jSpH|07Z+jxufq`Df)Na(jq}N)`dNM~!&W>8w_qdgK-XW`PVgst7;l_\
+!zKa$32`)tcU)lcgWo*ZO+=gTKvR*mwbYnl>jJ6k)x(7?}k2oK{z<SL48`}#`z%HDD+wl$@z;?{%\
+yfuhr_$F54pRoZ?_=I+214hx01)R_R8lCtTbmR9wrN3}7?!!%3$a!ubmg63*LH7XV@Ct0ht=Nr6{\
+hfa0{P$4|;6b0UoH!o)u@y&iUi=zX<6p1=NBsx=i>Kih+<-f93l8Axn9uohZj|Li2UcSRHsCqfiX\
+UJY`>~w!>Er%Ed+{-B#22v*e}zSySN|C+u=aD-7cRjj{1djnl6cyuP@ek9S$ToVX)4GWmw&)$e-8\
+T+{;k-2FsS`s@n=ueAqDdeDLUuSgI0|8sWZpUI{xI6iNn)ZnGXs5{$EBx%7aDbzt@_-3gO><bCds\
+W&eMF9Yr-)xqbB}9+aU#a<jy^KRPMRdoX8XHaaYG%bigCO_&-XGOKq3=-y28AjPd+zyYv3!Jm%k)\
+mzSS2GN0Z2cOdl~n_5q8JdWo>{8vDJU0OTpMy4-j{+E&;otiI5OmDWq{8Dl==TM?-V^Z4jo!jzqH\
+zez+V?G~HZhGo`u1@A_$@|GKOlwE=NIN>okD3@WPD#xhlI<ubpGrR0?2kw8OKV5oDarmAAU}Ij%s\
+4W2KHp8YBR`jGAo4>}^Y0|{GV&A2$EN1rOXk(&H!s)Ezkz%i`QfSgImx`0e6hv!TgYpd>(}QF@++\
+3>+czN7PfpD*Nm>59#Plbo=5;B{Pwus7Uv*xh{o_*e3sRO}=AUgm#h0J_a`I`Z`Qnu2m->%L%@e~\
+!ncs}DgZxVJ<!S4Wu~?s+N0c(JQ09ASV{QJ(7%8xs5B$Z9V^Z^l$?2Wse<MFMHJ_Kv-Q>H-=ceW>\
+lew3CXt{o@`^l%T(68elc?J1Nsd>usg~`t*pOl(koU;7n)hqPtpuldOJNJ{j_mg`iUzxW2Hzb#ze\
+3QlW!Tsdn{p8X8<OQRwbLW0?x8%Cz^OCD3{q+9*<iY*q;r-;%{p1A)Sm#d3b<5`_zu01W?|yRse)\
+8ac^6-B0=zj8o(TQBQd`|4PnBKjg+$*_mAM58YZ(8I*{t~vx!~EqVO>Q15J^W>DF~@B7gSH3Pryn\
+af<c%z6(YKTu<Q&76molHcuXD`;=DxOza=SU^-f15DFHM<G?&^_w)G`kj$IFSSZTUfRf89(zhy2p\
+a{k1!}JORoyQ|4c3>to+Y9U=0IOJasSCp906=Vl!dvkk|_j4v|l_-nEb+ksqbOpY0|Qp?<s%u5b5\
+e+LyaTGQHa+ejO#$lJ-!OwE_4od1w-o1A^0ZmyGkwDEQFvF18Ca$T~_S*>}u+42rF*Gl~O$9$X?`\
+<@;9$p`k6=O2{Fk5A1nPdWaR&(h@Pa`Z6&g5x+(;}~OGc~{CgPJB5g+9+zSlSbw<;l!A+GjpAUl6\
+AFHW{~6LinKmoGScVU$lVslxn1NnE3%&}nEBvAiR0vi)cnF^UX-uYS>z3A^)DJ3R~6*<li!=U47V\
+lcQJbIGSL)7Jn#udiV#Z~uW7j-~KQDRC8la40s$46~9&X3^@!Wjm*GXPOo^ST~i7hGh+@05IyUm{\
+0ojbK4Z*F{s@%<m=ozr8+vuX3&6rZ2@wXHt#*T{3(Pul)*XL5e$ZOFUZ)@r|PR9>}>IX<47T<_gX\
+bJt9^L38|mbZ7dq>`N3h%k8Gz;>wtDoLTPEjB-VJBjs!dD|MCmJ~_@;ZG#!*PEF3QjB<C*mU097a\
+y68DdTz|9Hm?sN8RbsP87bFHxp%9iTwnHbW*?SwfpEITd1?)LwZ(aEqeX6x3!CKTqrkTMly)ph&S\
+M*8JQj8AvdGOk>LriYF*<u4#hm0eTGUZ#k;l)+4@u<lI=b%2T8EE$v{=*;u*l6ioRY`un4i6le#&\
+%YUN^C=UL^Zf8yD^ym+SW>CFD<O_C;nJx(`j9(_d!JYy0gfWfqK-*>z~*yggo~D|?wCvp<K+v}7;\
+ipe@1SGWFjqW45=CGM`eWEVaFhlFPG?e31OO)ZCNI3lCE&w@JTmEI%x<U(;Pj){u{C($Bw<yuc!F\
+BOhx~e>ZuNMg4u`6D;PxkG#|(FC4=)n8i6<`F`@6{p5|3YnPwA(rWq1XIU*jxyx$#$<HA_AvM1uW\
+%&<RYC)5Jo9i5t$jxhL+uk+bxQ;f<Y^Tgx^GhV-+eAv4TaxuOQ%_e@_WL?!-a-CTi{<Pg?<KEJ+b\
+-uO?|+d;&Cigf<!6oLL*$N|VumYYzpzyH3&n->Bl(qS)7OqnUrBz)P5N_;TJmP{ThgXqKGH|c<h#\
+iiWS&FJPuc%b=8%>8u@EB9C;xt09p{X+F=8&mO8xx|MdRnJ)URs?`E2qBGTYdaoJSR9x-IIcBY%n\
+9m)6D=BmJ<CHXgZ3#!A4Kb*ywTk6DzdNS(*^$$UHc1*`PeMSICTtMp@K^pQ%nuF{W{Qu41)j~O#l\
+&zl;P^Pf-Nu}VLd>dAY^OH%V6CZ}&953SOVr7rT9R%O5M6W`v*+i2g#sqM?SmKvbU##Q=zNBQ4oJ\
+zBJ}jC>pUxoLegXQYp+$@|Htq~@2V-2Ws0lzdETes;?JKk|=O>F=#=A>XOV%|56ke|=Trezxtp)m\
+iUpM=3M9S>Fc*MI3vY^=)t#B|cZGYeR_ne>L2Ozu%m-4UNpB%AyTz<O?j?&`mziq77B#Gn$9{A$u\
+DJDdV$fL(x%6-DlB;3i34;ZP?EImkzh#@6B1;(9Aq~n)PG4gZ#Z_>wQm%GH2eLeN4r#|H-G5ds45\
+l64%x4oZ<7ou}Upjt)E8;xo5TYJmyoT;}-oq>d80UVm*&m%Dm&#&tnU@`Tg%!^9WOB@Yd|tt?}_s\
+UbQA>yponbpS=G)j$;z}IcfRq<oz%5QMYlunc9ZDypiimH~Htc>F4hyU$<62e?NKmTK)Wk<bm7ud\
+6>NQ4t@Pm@{&9C^%wBJ^X}Bo-^u@GwOHK$lU(<^E-(M9ZqaX7e*Rb4BFCBG+?#U$kN+)b(eFdU{B\
+J(_)YSaSl>46+)0<<gV0>cwXEL|BM^eszDYLUhf4r|D4_mack^D{a(^K=tWE<MZBjm5<q_-h&OY$\
+0g8)cTS)7P<!yndbjUe+M_(slanq=*x)*U2wR%g-ChE6BfGr$5JDXr8dG&wlUI%$vw_$uCKpf6d7\
+J+sR$)^?kgJe9n6PdE0!+uQ2y-H>^mh;|Iy}U&{E_>-(^nnJ-<hA4`=-C#Ki6v6lSeQ{>!q_BZ>m\
+nfz|@)oJ-nBYDTsiDl4@)gJP9nSNR3IZw*=7NN}888PFov^v%%f7i~8qU-d(({zyUS*JheagmQ%u\
+g^W?XRO!H-$!0<F@1pCW08l*TP@}vAzx!Ly<+7(Z;?C5e`hg&7kSuf`N@YYavynVtA0BOkS``LP0\
+cS$IsTI`Y1LmJMaUb-zneDys^s#sfj-=-KM!({Z)r_zN7=R^7x`xv?ema-Y0*9(`96#G1;{7ft#4\
+n5y!>u``y%Aa@7A|ZO;T$0-TL-9$eZuhx6ehs*`j?O@*a!!`N(4y?F*2P+F)`0OK#hsZ(oFb`UZX\
+b%p1Q|8}#jSkl(Q(aepz}y+s%KW8^bZ^XpQUpS+v={IvPcOD;co{|5bWDnS03MIIs_+@L=niCE-j\
+pL->rWZv^W|Au6lb4Tv?A8H<T&1=FA{ujL`X0)1R=iZQhY+ju_HrE`>fA{K-3ytIp?$xi;Hkn@6=\
+iTHD_v-t+k9^I&`aa)BzV%*xpB7GL%-(Bp|IZ>f`?UAiL>}+c)4Y~_8l`OaebT4XyxKnPqRyf=eV\
+=Y8AKRwy)4ei%d1`)bG9S%Fds&;lPfN+?wCVeFKKar%eV^8oH@E5gw8bJf`?N^%c%M$W-m*`tDBJ\
+iW>C<u7Yx{JFa=RYT_i1sd`56;^pH`M8rq}gpE&0F$`aW$Y&wWteryb<eAJq404|%0UzMFjBgZe%\
+nvdGOoZ<RdW=l{IUvd_0s_KbGv^S@rF?Q<_D%o`ul_o<&e@R0ucC`f+KL;CBhF!>V?>H8!~{_I2g\
+bKU|beDopxwTYAb)rYLFO=>9Pek5irPFt^+B=7%_Kk$gY4Q=Et<W(8hV9VwA=iTNzrO2b1*JvN7T\
+>ns}sU!P5;@3aq9Uc08Y|#lyy-5Cpv}JH7uYbq~I`q#nE+mh1=<jDXk$>2s9|!H^eHQsP@((&Je*\
+Y=C?mBvq{L>EoI4LSq>e}PwS<u<vTt^k;7auRzf3wr?H=FBdA^A%k8PEBd>*%bM?VmDdGLK)R^>I\
+&f`zP-w52WP}j^sV$btmZCxSRX}^4Y0*bISHlzKr}2Y4h((KL2|n<Gn27UO;Xj`TGy@$sPLV8*0g\
+mJFI`d;iJrX9r|ZV3dk3dzhqv={`Tth`8=I+{G;3+i?-|~-@Tu<<a42W$fNqUbTE&iN2M)4(6^<A\
+`D}Vr-<C%5jz_KA(oUJ37Hugt-{UsimfzQBZA<+AC*>ADW?h$U8udM<ud8jU`PoCM>*jjxa#u5-X\
+^-o-S@WH8Cq8a*|DXKm$Fu()-aH-^lTReS$81MlN;}R@JnNEsbISHl+1oAZ8YEv~QCAE3%Hg^mxy\
+rJxDyLF^u&Aq!{C!Pb@!x+@*9VU$es^R$Ii;=@DZl?=9-mp%v7J0(QO82^{^2@)y*O(f`Q}AZK)?\
+RV$YYOZ{EjPS`fBnCO#hp-{l$)v{Y3+LpT+!J$v+6__sLtxcL((Mqjr#g643Y2fK0EuCzsDj#YYy\
+?myw4p@@n!o1N!?_4dmVAUX^+OKG!pRf7x%I*gTQ_{KniC9n%x<r+nC4kB45FzAd(<jDO0leL~;Y\
+gXC+TusHsm%=#ezc4~fJa#<=)PR#$G-&~eI4=+nCWokC++t5sY!AAXf>L6dbQ9qt~$V;Ep&wn@h<\
+R|sxWr)1|NsIfR<%#Ka&##*Am^ACRTA$|oCmWyCug~boiT8iT*XKoxwCmG+Z{?uHvYPL+{PIct`Z\
+V8jsXF!R(|rG>Ie)A5Sw@-do%%LZlfTueU!M)+dph;&vz5H#DU0o&eA81F+dp~tQx@C5Ot0Pkxlr\
+qRO27S<kw5&D_4;;GX3tal^&L4S@!r+=`o86I?fPzKKG$rrIR7QD-=y!WUF1tQ>5m74<jXf%ukT_\
+m4(2_rucMOO{j|P~wdChLtsf7~<V&8`kB1KOk}m!Hd&nntSzP~;mvvce|Kzi}EVloO#PquHP-(tP\
+wQE1yKV`1zve^DlO}sBRJ|6D8OuzjzpU*7%VmtYOMPKYC|FTOz9!7Ja^i|h>wtvdJ^Njv^tZMS`G\
+x}@72J+r#^w*@V<a^1lP8$!Nk@2vFeEMd6{X5Keh;P=f?*a08oAvi&@@FO9Ev!BMlb=VvD6M@LC!\
+c>Y-(9|0fA6A!{MOC-dl#+b_ixts-xl(-kCxwEkNhs{J0s6g?I2%9{>RMUhy5ny{s(2|P{;LY%dm\
+K49tEdy4djR!^_llKE>3y=nKBm~6Ekj4Ylkm+|AYJ$^4hfgqLDfp$^S{dFSDJWB*$YrWqv*}W~|O\
+^hc{<rK0TBfUlKE($ehoEDfhoA^Tsp!?Lt-3Z_ntT2XK&o`HX(MbCK_RM*r-vhkWoE{e21_`F}p6\
+9}@xcZ*8`?|4&}HS>OH$`5Bw_?Ng`Ibr$n?kXKvG-$lOMV*VcTn=Iz<BVTJV{{Z>(7V{60Z{4iF&\
+lDkln*5ry`Cp#={off%{lj9LcaZmQwpjn<A6w++`=KKix%uAck1YBpaEAFl8-4pi<iE3+e}sIOMX\
+t>EQCs8=@;;09xz0?qU)MeldDv?C$#+^zA27dh#$x&q`Rki4p8p~bZcaQepLT3b`CPR5ZtVe!I?Q\
+)&f3jKsY^eDz?y=A6r#IixUG!}BJ~Zz&?4ykn$={9NYq;o}_ZohZa{rroz4@&E7#JqsPJUC`^Gn|\
+3=YPnLdCubg_iUvOx5%C3_UE!MtJ&Xfa@%v({oP0z*K_**Y$Nw->M;AOgnY?!(qAhVSoT+Bw)ws$\
+eSfJr>_4B^_m_kGx)=2Q;Ud561&i&U{E`>+<I_j(e!;rGIw{j?QAaQNx)=1HY40cRv6$XwzMK68{\
+rGHS`ra3$zmK}mvcJvmYpDzB``di~`!zv*f1B^x`1z0Z{T(EK>BstI3C~S@4}va_l5hR7#q)2RoO\
+b@$dVQGhsE=6GVZOWmBl5FS^VKQipM2C-eSh1?3${vsZ~MMwe}^a=+^X;I2>Huf_5H2Bqtv0@7RN\
+vGoNkNbAGz_O{+!)IKHp;gKJr=J+55^|9|7{q$*=n6b;(7;%g{@i&Tf4l^pig@HfH=Jt&PEvHrnP\
+XHEmqRI#2mLRSEeu%ztTGe)Y(CXchT+O#j2w^Uy>a&mV4MJ!NjEOj+7`m^88;TFCD$jv1k}I$lZs\
+{-1ndxBl}5+s*GI=+=+xy|N7M%yB&@<@$$}@LqBD=k?<EKg^XhKJokDv~%(!lGg@q${6GIzti%Pc\
+TULO*Jd4l^8N|deQAD&!Z@yTW~TL}bEGfL?^Y=18fHgY9Y0Tg-sCLvxwx2dL*{kERmuJ;ny=J}T%\
+(+vxva+~m$i~Ii(k}Vuho+O;6;o3pX3)=<Q?P-UesSt_K?rB$aj;^cu~Jy43Sq_w7>XlwhN2)Rgz\
+D&T7L3ltd^hLVKIFN`QaAR_mCg<qJH19n>^1VA0q#9tNwmqF&8C+TlLddl7F(*;{F%;UW@rR%k;Y\
+W$G>~SV*ciLa{O*<#_#rWznlF0oB5p`7X4>_hsPo2cmJg3=cg?Hxg4h~`p^8%53_%C`y}(bK#E?}\
+-;XiBBV_W6`t!h!a}(oVSAP%r{1+{jpM15|@{>1PEq^t~YOCe1PHg|W<*SwHb<5XG-f1!a4)O=c8\
+`Gx0Hu?Jx@=q+5Z#Vf~tK}!(W3~L>HQz02vHaxW7cJI5dDLqClgF&qKlxOPbB7*sN4LIzc9S<+oV\
+yH>FSW>v&F_He*7r{(dA-Fkxt6@8+hY02ALzDNe)6}hmY;l^Mf-P?ziiR|A@b)f=3jh1=U<uUUb&\
+YhkALKq;}Y+oOCE;{M~=g_<iFJPPyF+*<VO|DyIoR`!~aaV{-;cDxBfGUA@c3r8SmR-9yiK5h>(A\
+3abBe8{6CN{`R4iMrNhfnLYXDS`sZw_%<rBo);|kWN4~gNo`FwY&e<u?KT_sy$~e;c^4mEh@7po+\
+@$#OV)OmcJa{t?G=LCH_2h4U(kY}N1r+?nstRw$>iRrD{X?}0fIEyjoCO^tzOnJ!<vY6ga{w<3<N\
+Pd7t9wr}Ukw?jG7VRszfO7(ieWsIqpT$1WeL-TMs=Ht2y&$nq)J^Xv|Jb7bAbG@M`Y`zi<nvPVn^\
+WHZL_TPK|DSo?bM1H1uLa&p`ThU*6W3H}zpGi5oKM#UiR~^vpOf_SF~4W3@g@D|vd!<Gy7eWC`+w\
+xiUb49VM}C9F^bzv9m$E;{XfB7B{IQp0IaX9@m!q^ssdHY|FUNfHi(b~Zqn`Zim-WlhLVlLT^j+k\
+$$nQv7j+;l8!~A}(z{|26Kb@O(Im~T5O1a-~Eqrcn#&yl<xg-1a!V6j6S7OH2w7Q;2{{Dyj)mJP&\
+|407XEBg03G+t=FYdrfq3*w*uBX4G3cu{5>&rY^+8)g3ZipA&u$bV&#50d}fA}`{k@+FJBg1pNjU\
+%0@0uev^OB5!>~|9gve@>^fA`29cmEwAX$Eq0OLZMFO|y{`VEi&#$<^;eKDwU~Y(`BfIvH(g|Y7F\
+B=DY$yLO^0k@Q-^-KN-#wH$hB}@~8%G_<^FQ)g7RS3G@^dFx*Wp;G)D;%X;Uf3EqQBSYA-~gNdLQ\
+}iujucm2gu8g)*qA2GQE_kIokTTy_YhTujtPON3(<c;nCSYM`hMgO5Q?#RBA5omKc7oaW!S0KgiI\
+(|CYRyT=!Y5)*mFkgH89l(k<lO<k_C9k3Ww={uQ~oE^NO%BW<1DB<F)s%1p>NvObd%zyE7~pC0*=\
+%==_1pY1KDOiRALoi+Q(8~2m9?I-V+T=$O3KJt$(rr&3go9~QTOJ2$`@pbdPYPX%9vM%q*+hDuf-\
+a6{G1M<3(`{Jq}Dz%mQWji*ONqZh(>|JEO_w8cM{AMTLJ=w<mUVk<5Zpm!#mFy;;{F+=h%}#%Rc8\
+RoS!D~|AnA6kW<2El@&ye|DiLcA^@xx`BlIJ+B<Xz-0^D`}@PtSbkf^+z@FJ^l}KZ_Zco8>;Q%q;\
+i4;de7M)G|IpoQtHL<Huj!5U<Z{Px+fMqs^R8&o}0?c6dJB%qQ^kn6WQyKA(<UEA){!{vu|4nE77\
+8UnKWygSF=S9Q9+Q=n{P%KmTL;J#WQ~9<z@pR;JhUY_gBd?|)qRj+_gm?3=EYWih`O(yz(m&;OHe\
+dPhEk^!{mC?>ooOe<-){-I(#BIc9%$TIRba1GzFkvprLH#*DMga^0t8_VLVIX;;yuoXdw}#?@(k>\
+>0VXtssB+S21HCZH)eTWM8z9eDMb{<Als(%lMp;cQ+2umL<QA8RmNoZSzvv;!fEv4nH{g{1fxMCX\
+)SG2y@vg$(NA7XZF>kjK2C=vajkWcm1~v<6maEg45F1-9U1T6ko=+#2C=t{~@1YF@|a_a<d%+mnQ\
+NT&HZ)9tn~fuQ^|dDA@g~Ya`E>=-8$<V?}v)NZ-z2^D6>6tzx`^;^)F@CS?m|{J^DQUJ{p-m{;t7\
+)&CL3_DL3<Ylrp+|@?P>*i`?%q-wSG_zl)aTXpnIkB!7TB+k3FgK6Q~lPyVjCZZDgeJ_df8vi(!;\
+dxz-TQFJ-;(&X{&joe8-Hue3$$<GCj8h&T3hjJ4S)AzYga^3k+fZSn`hsY;b%s*n0$FKh+Um1V?x\
+*~n-q?{|ZQ_g#sjKR|?vc99N+Wd}J%IMxP)<7O2*WK@HC13TCyq9lwmiOPA-x+(Dp}pU@gFH&Edt\
+coE`HV4!_MAO`ky0m+>#ixv$Y+vkpZ_Fxk?Y<?*RaTZ_o1P^ZfqrAPOf{W$`*2;MZSZ4okc!Ce!o\
+Tg^Xu5Blk2Wq%gBS|y7wkllkeHBUw;kc|JW_}hGu`We_P3$$7DZ`iogG<F0p*S$lS-hl5+otGAA6\
+aA0tunYI5EE)B*;N`*8gjagxtFT;IoTnLgV);LK+mBIfrLlOJvFpUh8AXFS`GcW`na)xo@~3-xX7\
+G3zSK-WGG3YVwQ8&G!!4ddk!LY-!5#FI-S;E!6J|OUO4`<W=PN73%jvb&_YhCm8>IH0|slkH1f|q\
+&(|0JYCG=okIP3*}m9(7o`5Uv6uXJh1th;{P}P5dzHz%Gso7Zl<`j)-x2!rfok%lN9gw-4Kls1A6\
+v=2n%rz-vH6|Q<nedPsgtw5Q!Y%I%}403F{9)?N9d0y1@%h3YLPq1w~=T298G-ulLwE`Ujuu|H<9\
+b!hvO&z6}j$xCPDI;Mf<|!Lr3VxV$>p!U;kd6$TxoT_aXNUU#E03kCjInM%3JfZ#gOR96B<5ol?u\
+Z<`fxO->nk={g3$_+~j}E9CN=)IsQ||b(E3y9Sde#oa8m+^UU-4Z=aNYzEhFBM%{aL;`_jLV|Vm5\
+Y^US&>$Q};cAS2{H=lelx$g7k_2jpV)34VS@-5>G?YlF($h*mP?<3nzK0v-OEkA$coPQyCNwHx(X\
+>L1*JJb97M=9g~TKc>=`#DVf{RiYbiVe%>h-xS^Sgb$KX(TTlpM5_OzyC`<W4v`8+bDCzc>S?@7k\
+SfoeSZy-2g!BMofkE*zZ|dMS5=U|W05Z;e|5ZmJ8Y6%cT5;f-a9_A?bvRcn)Tg8J(S6vU}XKiDsv\
+vY$)n8U^~`<@rab@3&UD=b{dVCXZ=Rsvr@LhOZ0B@l8$9Gw`sBW1>b=RiDc}D^8F!z2CS~M)&Na#\
+J|GLh6pPjyqz1NxddG*_7KY10o?l~OW63%JJb?<yEA)kJ<{=B}5{8I94@0^VP{+Ikqa;tYLwos<o\
+p&u_@l4tvzNc{SjeATb5`+0yeoxjfB&+*^?68zI*9`Ws;GR3T`iJA8`3RB*HLYZ7g_H8fz`5*F`<\
+hplb#ILs~a}8xwMm@Qor=0&$X5KOSaj~1cf_x~g9sf+;|06G)n0-GLzyC*GH8F9&*_L-gdOK3CTd\
+KTDt(mCb7uAusli!n8&mAM}SW7;7lA-+!P$&6Va^2_FddZ!W^yeJ?<dY{E+V8cq-9SG~GPJ*gC?O\
+w1etYKnO8G43e9AOVGPLiLsV84QN#92;H<<5wGqk@q?;_tkNq^q7o%}bG^kZQ!`7bT<(M#DMPcpR\
+c>?kD<l3Tq;qna`wQ%3vwNAeFR>Gwme<hv&6_qAKd_gE~$4w+v2`DgNX$g{oMD1QCBOsT(GjKebW\
+uO{h_>(%7Pm*~%78px-YSp5End~S(;3~V7kuS9>$-a+0}VzK<>*OchbJDO#B^ZMI%^pvdMpB13Yn\
+i4tpHSZ*3Irok4k12P~WW%U4=k;|;x!fNnpZ{y**g09>-yP%~ll9}Nhul9|e?Mh6`F$4o5c&O+4e\
+hg0#WyN-`((rN*(euf-k+>rXCCtZV^N2X{N4T3(Mg#jrs($_z2wJF(YK+WynKp&|7ly!x|*UtcP}\
+AdG$s4Fb^Q5%@<*mv?;q=zo9~;`?;l&p4=>d(V;6a8seT!^lW%%Y|LoUZ^0xQnyE$in^SW>J3Z*`\
+uVpzVfs*Ez%GLLO({qRC^`zO!a88iH8`JKu8f8_mB^w+Mf<R4ElwC~f~LjI-2dfY*tPao;tr#G;|\
+d}p7b{oGA6`8@LY@0!k?Wcj|kF3O&9oRN6n-I<fL@4NFfDYfx<{WAN=1LO~<wfWxU=U>Uko}k~Sg\
+~;<yFtqQhi;y2r{>RMowO=LMXuFByN|~X3UtI}#*@+hSzsMiip&xs7<m+~1AA9lhAM)FG=*Lwj`S\
+|zr<EoeZZi}(sPu~2VzJA+ErB;x?kT(BKBinZg`KX=NpGld&(tKx}eqUQpKDJE1A8aAdFVkQ1#`n\
+i7&G*h3#*Jp1KXs(EwIO-`i!$rV^v^d$$v2Z*eZH-5l~R8xGqlgTm6Lx?esNlVeJ^?bzbY|aw9kK\
+$&pFZ1eg|$FdDDsdeO)*CniKWM%|7xra@}Xr_L2YLME!YIVY5=7TC~5MTus#<mutxPY1(h@JNl_V\
+Mjn5k+WALo->25Wd|IdK_Z>at>!upoXODK1Z=ITP&xty2k^6H)&F1^zvj09Le*HtfhdlmF;Y$;=&\
+lGl3?!IY>F=u;ZLe_V^)ZeVs^V9Tw)<XWoH2t!6kq4&fe|NK;eA6`j_P3Y(X^VXHYU-G#U+1OdKP\
+8`&n%|Ui{X_moi{+~)|6rPaKi)##Yf*m}`Tv=wzsB26{{A%mx%FQ1h(-U7zD22zrs=o2Qu4ji^xN\
+Eg@~<rNdh&dy{vJvTd4*HI&32LB>eO$u+sW^7>icgmd8bpqen$J0x_Nud_)glr5m)m0H}Z|-zs|f\
+j@^;GgA7yH&L-%f#2J(~Mju{o1$KvCY$6~+v^;hr6XIe(uaeeasKe@-LA4g&G3!M7(93^)<4edLb\
+3T{=(ORjq-laqY%N&0c(CU>5sKhAl{Cz9*lnH2y2Ps%JgDRE9@JAbV9ok%^Di=3oi*4^YES+sSCd\
+@s4~ok+!N%y$MF+IJ$EWn7f$nQj<YWUkYi<a=uBDD&0H8OKX=SyJvVv{1%bZdkt4cMD~P%JtU}JI\
+D_|#n8U9cYyp7i!q*m8^=|PF&@AFcUxi%UzEALXQ$l%qfDJ<49D;Pk@uEcU-Pw7<`9-e_t~y(<X4\
+=cU-!GnJr?;O`K71m_m@R$mAd|v?E91W`9IUIC7)}a|Ns2k>3wlZ%K1O@3Cz&%cYNgc&#-v@h5Wu\
+5`eS^E{3kQ?%Ml@eXNIAF{|^_fJ7-wj|0fTT>z*5S-EO{%PTzhH`O6l$kG$KW{s8$Vi#&9@`K~-e\
+`%bP1`R*C|Ya4Y3`=e9!>&HQU<f;1e4%Z##d-C-6^gQGfPPJHmnO=7fx`4cz{3r3>109jRZ+JH4_\
+(!?AUnbtso1D*<<nKSp|Ld3fcN~~s0sI*C=-zQqN?x=*<97pzZFctXHd{@Z*_0_w`#s9hBfm#!AU\
+~UZM^9QEFD9RVB5yra|Ln>Z@-3(8p9k4N9z0e5jD-0W(NCSKKQ`sJDD~i}*1vajQl^(OXQwSgav$\
+m@Kj!U>cPN<iNU5ihGH%LznOV=?l+S;(=-V3K|B<&_jH_Mb51gvM*HKR%AdkOe<gCLj-!W2h7vsF\
+b(7r>Yiu|FO`nJ}Qub-)J>ss=4<hsvsbdnd$(r<&k<VViZpBwg*m&~%b|F@2P)OP*0Q$l|3+xmA_\
+RFSWHdq400pv)U@>$i;-^0(i~zHP)m|4Dx3yVm1s2W8qQb9Cmh`LN{iC`y_0X6nzA3)Zu~X6mo~o\
+#Z#n)Ney>@<lVPx1mPL+%r>uEz?GR`%L}stGdaTk&jKyQ|@2%kuRB<{g@Sh-imzje%e^n%5m3XOj\
+nSvovA-AE+lWZn7*ks(MH|%Xgm4!GZW97rnYgV><hP%|B~^No4T%Z|7&DD?;>9@)6jnQdXW4s#>%\
+eD@w7AL^WS%~u4d}@x0U2g<hsvZ*OEVCF;<$%@1ALW9vGm^Z!P*UME=mb`g?y7@|Jhy{fo1+od0Y\
+{<Y#2`L!&H%gZ!GA`eTx7Lt@{h+xK|L+b!Dflj(KWy#ew*tK}zuYi9QIhxq+p@-NA)-k)T<N2xa%\
+OGl;cn+irgPf|ku+Pm^@*wnG|x0LJudlL6}b?c#?ylF@F^$@@Qk=*JtY+EREFUztvZCO_(-+xN}#\
+eT+9lrm?|(vQgkKi4<2tmjcqnP$pNOD(fFIgc9h|D?Z8&HVi8amnY=nkaMCEd8}<JNXT>^!tZx<V\
+$B+JpV*~=PdoR*n{M+&e9)~i|(b4Sr+?0^3CMgJ|7<6|B>&sn19o~=KE^(`_FdrUW@v-k-tpdlD2\
+%ejEsd{X8RaVXJxK~naOo9M47KF>L|WXspog<$806}bL35#$J=XCuKy_0MIGNsts~_-SbXH~%}U(\
+U&vrjQKtAy_{W)!j{M)DL`#D0s=6(G#sQZ<=^?mElz?M+v<8a3J$WUg5>;tRFe{9i@b>vTy-;}nD\
+-sJNy<U<zIcancbzASC}<nv*@<g-uHKflsXUKh6Bw~TJ%95t-}9>G%bZDIZAUkxMY&>z^NIqF9H?\
+{m~$x%T)!9c+GeboFs7lt0J(hewXh8T$jSRDYghzb!Xs!2Gudat{pTs;y@E9F?5cL9gW4pC6^xAC\
+Q=j`CsYmJ1Oy-9Q)&T^<eHD{C#tt{dKz<$XmnTzqZ-`U{^n}&yAO#bfMiiKwV>h?*Mgc&fR(Z{Sl\
+je&jIRRwkLA=p?!2>wgs2q*Et{LeRP2OPpNAB@+OW3xo_ouaIhL2^&dHJAFTd(kewesJvdR|r0-&\
+_eZa=7`P-8@Gk#-NpXb<rYF9?C{VBU@&l`KUUHNS0-&^cU5)++6(FOKTZK{dCJe)J*bG!P_9Q$2%\
+<<GOfYd06=WxERH*`Khhwf1{*;u96krR@3kukzFl{N?_f3)^k#e%s{#ZWhat%-)epkL^GEpZu4xX\
+0sGB*Z26GBTgj_<=EfN$@wDZK>qpO<f@M6*P4SMXZA00bN-ln;NNo9*BSZ$r>FmKkM{%X?dx+?r}\
+X82|EKi-9yuZ>e}?_^oJIC}wK7@5|JuK^UAE+yqw{I0{(to2fo}We9J4R}hd;$PXh!PJJVh7o$x}\
+bgwSS$bHssm;Hr1PFf6AsFuqTR^+?!+nt4)29V>fK-wOo6fUA5-fpRud=@_v-VzT$;ZiE^_}!~1g\
+V>q&C#PmfZ6%(Xu@N`0AYzhjiTJJ0@Ee2e_huHMMAzhPIu&$Dl_tEcTxB(}>#rZDwv`~A7<PdVR9\
+{L6IyrOMu&t1jD@llm`z<zJr8jsMGG1G&z>jZ*)xFZ_Iz+8}$I!V0|9{)O2~ClBPP4YK1r>O`Dl|\
+FunB#a|xExi#-|oBF%$lz2GStiRH}#-={bp`X-i>^5xbw|RB(^tiTBUyowHG{%1WQR>Hs+n+p2eS\
+Wz8FGs1)Li>A1sXu>v+P0(AV@It>G-{6hAGzwWoOg2W$y4j{CM9-@yK?iC+L&j5Cr|CkOEl<P%j_\
+%7-GxfqzK_ircWx(teIwVtJ}>8Yxg05;%(HjpsaNw-1~{chpJ%^NE&1k{E&LAuw%Gpb9Mzp;|3?l\
+hc#_Jxd&w{5A8PDBRE=p(pbf|5966hRTbr{X=kdIpU*sM5exCYMUfT9$mRV=cD4aW~Juj~}@3JRt\
+>LpvE%*`X)@|Y9&mkaEd<g7aI_8j$KPR2GGUyfP!+3MoqCj58mj+aZ@k9@`G{GaVd;`8{wyD!Pum\
+bBaae{=qi9AzHpSL8g9V}B$^J(rWdo>MpZfB*USpMU@P_n&|N`S+iH|M~ZyfB*S^@t^3Od2!1l3F\
+~&);s)j4htKgI{7X*S&zmxS?v|hPN9LTE{$Tm3YewSC@F@AYW&EhP<K*WeajY1SyjXr7zTfnPe2g\
+!eoA`P7eAC~VaFqO9aeTr9<>y&@674%EqrSZ1<~kBn%50VE%7lgT^8w<w#qAH~ru}>PN4aV39F&g\
+vRz`g>c}z}8c|(34ZbwvperH`G|1bIZ|8M8jUE@b({dcGIgiCab9?>iMM86migJMVwixDw8+|xM;\
+3q*(L6kVcQ^oU;3C;G*J7!*TdSd55KQRPbgqC<3wF3~M|M6c)*{bE22iXky9M#QM7@}z#zAv#5u=\
+oUSqSM-T~F(3xTkQf#tVpLQ%sb6%6PSGX0MUUteeWG6sh(R$VhQ){&6_s7;7agKgbct@!BYH)j=o\
+bTGPz;G-F(O7qHA?Ci9imfoiEhy&dPSe;7XxBY42fYeB1T1ZfYdKKM5pKy-J(bIiayaV2E?Ek62o\
+FdjEZWs)Gs<jr|1&hqDS<KKG81*#Gn`w!(v2?it1ZZzvvL1qDyp(9?>iMM86migJMVwixDv@ssp8\
+d(IGlTm*^HfqF3~ZelZ{h#gG^lBVtrk2TA>+Lv)HR(JgvJujmu~Vn7UvAu%jQ#Hgt9rGC*NIz^Z0\
+7CoX@^of2kAO^*d7#1U9R8$8`{h~v3iZ0PDdPJ}26a8X942mH!EJnnrs1A|(MTh7VU7}m`h+fer`\
+o(}46hmTIjEGTD9V+#U4$&#PM7QV>y`oR_ivckxhQzQK5u+jpo&=&pbc!y~EqX++=o9^7Kn#i@F)\
+T*JsHhH;`bCH66kVcQ^oU;3C;G*J7!*TdSd55KQH_!MMTh7VU7}m`h+fer`o(}46hmTIjEGTD9WM\
+2Y4$&#PM7QV>y`oR_ivckxhQzQK5u>6il=?-7=oDR|Tl9!t(I@)FfEW}*VpxobQBfTs^@|SCDY`_\
+r=n=i5PxOlcF(`(_uow}eqB>IQ7agKgbct@!BYH)j=obTGPz;G-F(O7q^=+wNbcjyTCAvkA=oNjU\
+Ukr#rF(ih?h!_=Bk<>3bM5pKy-J(bIiayaV2E?Ek62oFdjEd?gsb6%6PSGX0MUUteeWG6sh(R$Vh\
+Q){&71da&Uv!90(IvV?kLVSBqF)S%K`|tT#fTUc)i|kNbcjyTCAvkA=oNjUUkr#rF(ih?h!_=BvD\
+7a*M5pKy-J(bIiayaV2E?Ek62oFdjEZW!)Gs<jr|1&hqDS<KKG81*#Gn`w!(v2?ifV$?FFHi0=n~\
+zcNA!w5(JuzXpcoRvVnmFJ>S(E7bcjyTCAvkA=oNjUUkr#rF(ih?h!_>Q;7rsnIz*@F65XOl^ol;\
+wF9yV*7!t!`M2w2+7^z=$h)&TZx<!xZ6@8*#42VH7B!<O^7!}n-sb6%6PSGX0MUUteeWG6sh(R$V\
+hQ){&71boEUv!90(IvV?kLVSBqF)S%K`|tT#fTUcRf*IuIz*@F65XOl^ol;wF9yV*7!t!`M2w2+S\
+gBuhh)&TZx<!xZ6@8*#42VH7B!<O^7!}oIsb6%6PSGX0MUUteeWG6sh(R$VhQ){&71b1}Uv!90(I\
+vV?kLVSBqF)S%K`|tT#fTUcRjJf3Iz*@F65XOl^ol;wF9yV*7!t!`M2w2+IH_NBh)&TZx<!xZ6@8\
+*#42VH7B!<O^7!}p=QoraBouW&0iyqM{`b57N5QAb!42uylDykEte$gR1MVIInJ)&3iiGDF42E~v\
+V79(O*RAo}X=n$QvOLU7K(JT5yzZejMVn_^&5iu&N6QzF9Av#5u=oUSqSM-T~F(3xTkQf#tVpLR9\
+rGC*NIz^Z07CoX@^of2kAO^*d7#1U9R8-TXe$gR1MVIInJ)&3iiGDF42E~vV79(O*R8Fa1bcjyTC\
+AvkA=oNjUUkr#rF(ih?h!_>sNm9S)5S^k+bc-I*EBZvg7!ZSENDPY+F)FI*QoraBouW&0iyqM{`b\
+57N5QAb!42uylDyoyEe$gR1MVIInJ)&3iiGDF42E~vV79(O*ROM2?=n$QvOLU7K(JT5yzZejMVn_\
+^&5iu&NQ>1>;Av#5u=oUSqSM-T~F(3xTkQf#tVpLQ!q<+yMIz^Z07CoX@^of2kAO^*d7#1U9R8*%\
+*{h~v3iZ0PDdPJ}26a8X942mH!EJnnrs4Ap>(IGlTm*^HfqF3~ZelZ{h#gG^lBVtrkGo^mfAv#5u\
+=oUSqSM-T~F(3xTkQf#tVpLSKq<+yMIz^Z07CoX@^of2kAO^*d7#1U9R8*%){h~v3iZ0PDdPJ}26\
+a8X942mH!EJnnrs4As?(IGlTm*^HfqF3~ZelZ{h#gG^lBVtrkr%U~!Lv)HR(JgvJujmu~Vn7UvAu\
+%jQ#HgswkorZ3=oDR|Tl9!t(I@)FfEW}*VpxobQBj>K^@|SCDY`_r=n=i5PxOlcF(`(_uow}eqH;\
+<7qC<3wF3~M|M6c)*{bE22iXky9M#QM7W=s8|Lv)HR(JgvJujmu~Vn7UvAu%jQ#Hgs|Nd2Nibc!y\
+~EqX++=o9^7Kn#i@F)T*JsHo;j{h~v3iZ0PDdPJ}26a8XfZeH4R9Ff_hET8`{<WEk<--rL(Uw+oy\
+xw9Ol7hZAWlExbyGpCkMb)I<Ajq#sOT0Px4)mc9Eq~j9*&Z+jY`eltv8!x{?O<i(*<CRmdT5{u5@\
+6zkNS1xV5DdnH8xbf<Sx)ZOiQ}LhbFJD%#rq<oGWZ6yEC2U-pNS0r@blKI{FG>61GP0#tHe7BNl)\
+rf!8r9URmt4*N`RmlHu9v?oyK<45+IVFXKQ1Pw^!0U@H(su$URi(H;-!~gcjaaEbxV^!QO%-7mtE\
+Pk=t^(nWh_I(m5I4tcKOn!m*13_$MD~&{POFrX7*H;s6R31E0!%&Qx{!--E~(kY5ZS$e&-;0_G$Q\
+esjl2~9U0|EXZ$=NWBTp6>6T=aw`KfnzW3)#!?=EU`r+rnhMhkpeY(v0Pm^WH&3ImH*o7;T&zI$-\
+Oh5b_*IapKD>vi$vtfsyHyi$wlTrV<^6b~}^uy144Lkk7^!DdwxKN%Y8~%Ctd9q={D%t+LEX#kD%\
+sV&Z`L$t(pI^)Dzv1P-L9#g+&%+Hn{QR6vrpcUsmGnt+FOiq#xc#jE<r&jEWV&JfbJNQgWO!@F^g\
+-Ew4O^hBr(c&beMqJYjqD$-r@udAdY3$JIqX$0<Yb+G_|HQb(+@viIqbpv>A%Ni`jPSDvZvXVr!4\
+D#I%E2-x%M>sCRx}2QpWVYtL$mcZ?oQi{48Vo?O)r|Jbbiu{l79F!AKc(!_T9(96Ty*oMzTP>>tc\
+WC{m^$eqJ>o(~sWI^na6eH$46D^N?LKeIzHj{iaSgydG|s<sWJP(bE1y6E^Lq{?9X}AAbH-6(rns\
+jP>+iXG}kQypNoe(34Sr=J6mWCo!+#>0NV1$$gLP{g=7_9F>#!H)qDb4^MxBX8Kg~vK-g0mFW-7v\
+9ACB0^o#^i2'''
 
     @classmethod
-    def package(cls, *paths):
+    def package(cls, *paths, use_zstd=False):
         """Creates a resource string to be copied into the class."""
-        cls.__generate_data(paths, {})
+        cls.__generate_data(paths, {}, use_zstd)
 
     @classmethod
-    def add(cls, *paths):
+    def add(cls, *paths, use_zstd=False):
         """Include paths in the pre-generated DATA block up above."""
         cls.__preload()
-        cls.__generate_data(paths, cls.__CACHE.copy())
+        cls.__generate_data(paths, cls.__CACHE.copy(), use_zstd)
 
     @classmethod
-    def __generate_data(cls, paths, buffer):
+    def __generate_data(cls, paths, buffer, use_zstd):
         """Load paths into buffer and output DATA code for the class."""
-        for path in map(pathlib.Path, paths):
-            if not path.is_file():
-                raise ValueError('{!r} is not a file'.format(path))
-            key = path.name
+        for path in paths:
+            # One open and fstat both check that path is a file and give the size to read it in one call
+            try:
+                descriptor = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                raise ValueError('{!r} is not a file'.format(path)) from None
+            try:
+                status = os.fstat(descriptor)
+                if not stat.S_ISREG(status.st_mode):
+                    raise ValueError('{!r} is not a file'.format(path))
+                data = os.read(descriptor, status.st_size)
+            finally:
+                os.close(descriptor)
+            key = os.path.basename(path)
             if key in buffer:
                 raise KeyError('{!r} has already been included'.format(key))
-            with path.open('rb') as file:
-                buffer[key] = file.read()
-        pickled = pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL)
-        optimized = pickletools.optimize(pickled)
-        compressed = zlib.compress(optimized, zlib.Z_BEST_COMPRESSION)
+            buffer[key] = data
+        framed = bytearray()
+        for key, value in buffer.items():
+            name = key.encode('utf-8')
+            framed += cls.HEADER.pack(len(name), len(value))
+            framed += name
+            framed += value
+        # zlib is the default since DATA compressed with zstd can only be loaded where zstandard is installed
+        if use_zstd:
+            if zstandard is None:
+                raise ImportError('zstandard is needed to package with use_zstd=True')
+            compressed = zstandard.ZstdCompressor(level=22).compress(framed)
+        else:
+            compressed = zlib.compress(framed, zlib.Z_BEST_COMPRESSION)
         encoded = base64.b85encode(compressed)
-        cls.__print("    DATA = b'''")
-        for offset in range(0, len(encoded), cls.WIDTH):
-            cls.__print("\\\n" + encoded[
-                slice(offset, offset + cls.WIDTH)].decode('ascii'))
-        cls.__print("'''")
+        # The whole block is built first so it is written out in one go rather than opening the file for every line
+        text = encoded.decode('ascii')
+        lines = ("\\\n" + text[offset:offset + cls.WIDTH] for offset in range(0, len(text), cls.WIDTH))
+        # The size and digest of each resource let load check a cached copy without decoding DATA
+        digests = "    DIGESTS = {!r}\n".format({key: cls.__digest(value) for key, value in buffer.items()})
+        requirement = "    # Packaged with use_zstd=True so zstandard has to be installed to load DATA\n" if use_zstd else ""
+        cls.__print(digests + requirement + "    DATA = b'''" + "".join(lines) + "'''")
 
     @staticmethod
     def __print(line):
@@ -2060,23 +1638,150 @@ N$H#gz)r_6<!G=u+qbWi*9w-U~OYCb%-!haqw++W-ewr}Fs($1f^fS)%nC?7vje$ImX2LxO@{~(L\
     @contextlib.contextmanager
     def load(cls, name, delete=True):
         """Dynamically loads resources and makes them usable while needed."""
+        cached = cls.__cache_path(name)
+        if cls.__is_intact(cached, name):
+            # An earlier run already extracted this exact DATA so nothing needs decoding
+            yield cached
+            return
         cls.__preload()
         if name not in cls.__CACHE:
             raise KeyError('{!r} cannot be found'.format(name))
-        path = pathlib.Path(name)
-        with path.open('wb') as file:
-            file.write(cls.__CACHE[name])
+        # A missing, truncated or altered copy is replaced atomically so a half written file is never loaded
+        if cls.__save(cached, cls.__CACHE[name]):
+            # The cached copy is kept for later runs so it is never deleted
+            yield cached
+            return
+        descriptor = cls.__memfd(name, cls.__CACHE[name])
+        if descriptor is not None:
+            # Without a cache the resource is held in memory rather than written to the working directory
+            try:
+                yield '/proc/self/fd/{}'.format(descriptor)
+            finally:
+                os.close(descriptor)
+            return
+        path = name
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            cls.__write_all(descriptor, cls.__CACHE[name])
+        finally:
+            os.close(descriptor)
         yield path
         if delete:
-            path.unlink()
+            os.unlink(path)
+
+    @classmethod
+    def __cache_path(cls, name):
+        """Names the copy of a resource kept in the user cache for this DATA."""
+        if cls.__DIGEST is None:
+            # DATA never changes at runtime so it is only hashed once
+            cls.__DIGEST = hashlib.blake2b(cls.DATA, digest_size=16).hexdigest()
+        stem, suffix = os.path.splitext(name)
+        return os.path.join(os.path.expanduser('~'), '.cache', 'checkers', '{}-{}{}'.format(stem, cls.__DIGEST, suffix))
+
+    @classmethod
+    def __is_intact(cls, path, name):
+        """Checks that a cached copy matches the resource it was extracted from."""
+        try:
+            descriptor = os.open(path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            status = os.fstat(descriptor)
+            if not stat.S_ISREG(status.st_mode):
+                return False
+            expected = cls.DIGESTS.get(name)
+            if expected is None:
+                # DATA packaged without digests is checked against the decoded copy instead
+                cls.__preload()
+                if name not in cls.__CACHE:
+                    return False
+                expected = cls.__digest(cls.__CACHE[name])
+            size, digest = expected
+            # Comparing sizes first skips reading a copy that was cut short
+            if status.st_size != size:
+                return False
+            return cls.__digest(os.read(descriptor, size)) == expected
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def __digest(data):
+        """Gives the size and blake2b digest a resource is checked against."""
+        return len(data), hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @classmethod
+    def __save(cls, path, data):
+        """Atomically writes a cached copy, reporting whether it could be written."""
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory)
+            try:
+                try:
+                    cls.__write_all(handle, data)
+                finally:
+                    os.close(handle)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def __write_all(descriptor, data):
+        """Writes all of data to a file descriptor without a Python file object in between."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view):]
+
+    @classmethod
+    def __memfd(cls, name, data):
+        """Copies data into an anonymous in-memory file, returning None where that is not supported."""
+        if not hasattr(os, 'memfd_create'):
+            return None
+        try:
+            descriptor = os.memfd_create(name, os.MFD_CLOEXEC)
+        except OSError:
+            return None
+        try:
+            cls.__write_all(descriptor, data)
+        except BaseException:
+            os.close(descriptor)
+            raise
+        return descriptor
 
     @classmethod
     def __preload(cls):
         """Warm up the cache if it does not exist in a ready state yet."""
         if cls.__CACHE is None:
             decoded = base64.b85decode(cls.DATA)
-            decompressed = zlib.decompress(decoded)
-            cls.__CACHE = pickle.loads(decompressed)
+            decompressed = cls.__decompress(decoded)
+            cls.__CACHE = cls.__unpack(memoryview(decompressed))
+
+    @classmethod
+    def __decompress(cls, data):
+        """Decompresses DATA with the codec it was packaged with."""
+        if data.startswith(cls.ZSTD_MAGIC):
+            if zstandard is None:
+                raise ImportError('this resource was packaged with use_zstd=True so zstandard is needed to load it')
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    @classmethod
+    def __unpack(cls, framed):
+        """Splits the framed resources into views of each one's contents."""
+        resources = {}
+        offset = 0
+        while offset < len(framed):
+            name_size, data_size = cls.HEADER.unpack_from(framed, offset)
+            offset += cls.HEADER.size
+            name = bytes(framed[offset:offset + name_size]).decode('utf-8')
+            offset += name_size
+            resources[name] = framed[offset:offset + data_size]
+            offset += data_size
+        return resources
 
     def __init__(self):
         """Creates an error explaining class was used improperly."""
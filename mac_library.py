@@ -1,10 +1,16 @@
 import base64
 import contextlib
-import pathlib
-import pickle
-import pickletools
+import hashlib
+import os
+import stat
+import struct
 import sys
+import tempfile
 import zlib
+try:
+    import zstandard  # Only needed to package with use_zstd=True and to load DATA that was packaged that way
+except ImportError:
+    zstandard = None
 
 
 class Resource:
@@ -12,1510 +18,1069 @@ class Resource:
     """Manager for resources that would normally be held externally."""
 
     WIDTH = 76
-    __CACHE = None
+    ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'  # Every zstd frame starts with these bytes. Anything else is zlib
+    HEADER = struct.Struct('<HI')  # Name and data lengths framing each resource, followed by the name and data
+    __CACHE = None  # Filled on first use rather than at import since a warm start loads the cached copy without decoding DATA
+    __DIGEST = None
+    DIGESTS = {'libcheckers.so': (271648, 'e0bf36244a68e6bca55baf95fb196b52')}
     DATA = b'''\
-c-riJ34B!5)%blg37JWV0RjXF*@#F26-0yt0hwe}HdjCvfdoW~h>8fU3sQq=KT+I9QBbUAahcHC>\
-Zi7umJ~2<pne*xTdOq*pfiL$Aa5Wc|8wp#@6MYyOA<i*H}m_=Z|2>1*K^Ny&pG$rqUfi(682g7@H\
-w|Ex?%oJ3+69gaL2O2%a-JCcqE2=a(v&(&V(qKqZ52F_XW{}{H}<V>kZ#56Cs6#Q!kq_l>~mam<*\
-qz`L`2KE-YNW;I8FbHhq1!4`jbti%q^~znY^+k^ER#xNP~aZdewyzV%PB($~aj&vJbhUSDTl`Gxc\
-67cRJK{({?=7cQT7gT6lZbFB17aoV$q1pgEk&R@3tjzzaE4AQ?hovifzivP3tm;&ota@(@yLC2fB\
-k(F>s&*qT*`_*lCF1qc;!bP|Ja*08GM|gdf9@=xL@gknAr}bQ#H#M)&e)UyTruyNBO@}Z1+04HPh\
-AwO#mMr({r*VC&qqX|vaU#Aw7qnk;kInx5(ml)lV*R*r-tu|+eg)QNlb*xDYdo#ziV0Uuy6n;k0`\
-@lEkD@5Q=M7h~XGQ80e&Ug4;M+@=?oaB3Tm&_C;q}d!K*%uuJmWz#xnKapH>_iIrI{pJ2swC36v-\
-NECW!9W@Hz*@ux}~S0sM{&F}})?QRGS`Fg=;K^Pi{g*_q@Vw*G-t*WK8C@$%yrLRz|S3@|Dsp8lt\
-!S1vLS<oF>zNVga8x+t8_?H-M#hx}^U9YbL7_?<s!(BPqiZ@e4+()_t{elj2+|CGCzEnjf!;Cx<$\
-e$M0Vu6_-A0&vL|&y{RmQuuTFZ(_)b1k&;8_;h?aJ{_NqPsgX@)A8x}bbLBK9iNU*$EV}d@#*+<d\
-^$cIpN>z*r{mM{>G*VfIzAnrj!(y@<J0l!_;h?aKL6i-TI{Bp<`tHTX0yprQk<rin$y&>;#9TVo?\
-7{$IkmF1xKORFCXU(!;>{vtZEb?hTWT+;EHf8WI(L$q_d1ic3L)Jw&xQ?Tt<zkny5oqq1m0ys{yH\
-<+SQ}^amK7JMMbELkG*1l6^C*<5jj?%~SB$TKzBsm+3%_uim5sGY#OoeFTv+e#AWsaGlhd*6eH(b\
-&NjC5LXUW=@Y64?1RWuh9I+i-@2lgM@s)Ih9LquEo6_A&<)l!UQl!|6Mj1ltT`^Av2c|~3YykmLH\
-3gj_YG*=TJjA*@3f9W_<Q#Ogz#1lSt92fj<hW^w+UG;qYV{x2u*tWd_>SOg9^tV2S_u0()Tpz>xZ\
-4Te>{?CQ)cRkFbvsmkA9EZs{d~Rd-bAk_6Qh)8FMzjV0wKV7}_Rp6ljSFFf<HmB)5yBtqi}sCK8j\
-n%?2IXU+Y?OWujmqlaFXj}-zJ-tx6t|%7y=cE_pXhTcf2Qvv7*AiwZ<%cyX;JPz?2dV%4^c=rzrG\
-oi!9Eb88^1w5gi|;DSPk+;1dq0sGk2<KTGF$kc|{W7S~S2i6<}GQ)(#=wrBL2I#O5WXP-hzP-YTB\
-+6i00)@h%t7b?`iZcvpz$RVGL6AmY7WJZG344-rQ1yMVSziu<aiiAs%S{OZYWrQ{B0b#i41;Jb+w\
-?RbIbLmp8IX%FChCA0bRKwa)+o7ZVhQJv;FYSsdvgKCA2>2k~m?~!hQ&vEq+@LMw9RD*bN3Gy?Te\
-=(l5gwb>v{#KhPkF;T)1fB=R_%f%fH}N+U@+1;(KITc}d0^a?_zs@m!{1_n1Ms*@F;5cD1F+bR@8\
-J0>-p900i7V}&@cjzD-@vyPzPpI4dByaKrX|yWW;@Zj@gV;h1oZ&#tT3ml&gzuP_py!vHt$B-C!6\
-;X{7tiYZ|8O2Cg5i-Q1hPwz8Zu^pYCEnqe1e{O^iJ6AA3ZeS51mM@9*Lb^2$6C_+woH<BOj{UN^!\
-nlQ@u9;+*~w((3Gtr<G)qnor^p4-3_{@bv!Y81Qt1vVvD5p52<l<tdb3k`g&D?bOF$++o_9m8P{d\
-CoS@}wzi?I-Wgh3$r+Kib#HR(+xoJf*4EekB5y0VZ{&Ek>14~gz`W7GBfA5S>;d_s9i_-4&G-dA3\
-4CrqOUpX<AkHU&S7nN4<deWR2a4x9#y5wGXXKN>H*>`^@JSo|r@RiHoxq1FkDJeUTs*u(et<mgM*\
-I)IcffCnnen)2_)mEp@5?OA1J8@_x18~~7|fHv^FaS@#dq+$0)Nen$5}B?BF_VTz7OBQ^CS2>pYg\
-aj%#+0Pz&ITE4xV4&eGJayt^*!76<`~!@wfq;#}xx#x2IG-igf^QTZ+HH+os|#@ckTK_izrQlHxh\
-4b-lmtSPFO}>n*4QKh9wlie3ec59a(6abT46KcD}1o7s35;GCHme8!3Y0MBgkAK)L?!f?sjB5+D;\
-AM<!nCx*Uy5{L`yyhf_?LaEN~Qk_3?{5*1!!2rj3841qkRRwt=D|=M@hdNIvq4f@T4C}{nCA3~D=\
-o9<@RTS`4;KLM7F$_+hnt*2Kvo%Nw=pW}np1CHbpW*Y@@NBW*{6m|ByeZ)Q*i=Td!=GVr7x@)ZH2\
-KRYl-<PpLrY7NXy>~q?5D=dn^$bEz_R^9$iVwr3}_wNsKY$)-UIKjex$)*dZ!rwp8yXrFU4ob>w*\
-3$K+n-s7et*gIG?IBvp&^9d+T9MW+7y9fSy^6aPI`|Dpb}X4=RIoo^Q<tyyC^{xZDGrC@m*7PN1j\
-ZL`(BP`+#epLlN&-kq)$9R}OL#Xc~3nxr(McTmETtS)xf-3(zsvm%pCswN)k6X`2!#{S~OVp7azj\
-T?%+v70_}O%ykv!AF-b5PgO8}nvUh@JXRNOYF=?Uz(WZOk3Q!L_!-Ly#Dh96ACNC@T!(l=Xjzo=4\
-`d2CZ%q4wSG<+U)&*Dxmb=@iTrti;H1t#Pt;xjv`{n_Dv-<;V5vBlZ<dqlpXR-=;^G<+wKZP93ug\
-!AodVx4jWU_fE0T?(zrr^8|fc&rbf^nx4NArryVBAVz`y2;+>sFYHbFX7KSPFHad_tOk3wa0PWjV\
-u1><^}IraXn=MIFGw4SfH3NGsy=k7cZ1+g#Z&|JJX8Kb0bHB{f^u1>!*EJk~DAx+>t;RRG5-k^il\
-AbnFZV()2hG`PlYN)r}2!*a*UDP97Vi+a#P9V@rcHzp;JG$M!9Z4a#7>kE}!5v$>qrX_aDZFU;|c\
-&E-k6xjZpi{#EPfI~UNa%bmu`@v&9<k1aTUzc8?M_#LCe@3euD;rEpT{qei&z_#P}(sTXs`<`=y<\
-9E@(K>U7g5Lx?)5q=xkJj$w5D|aRn7q)xLR5k`@bwMS}smr4N8TjOYRDU}M))7_FY*zg0C@)T}EU\
-~9<qT?~Mam<*?<e^v>R1^a*gSIN5e!wSJiM?PG@-mcz%}+BtfVl>FacKp#(<+$Vc!596&JO{z+#!\
-K5n+N4*^ahyO^gJO@w%zh{c$>mq5#&kL=c$eYJ-93A!QBA2q8u+mzg|K;801VTtjWt@U0-hR3v2n\
-ln_h-By%Y2^cN&g=j@mp0#ss=tDd@5##eLKY`|QdJb8=-x^{mPYdvYbp@V5xdQvopbWMa8KDyDB1\
-^qh%uO#!*qTYVnoY80bq(z9sC&~?mCP+B}&y<#%g)u1j<GS-)*!rZDA=3elH-{M}NyU*TKV(z^O>\
-&HIb|1{FWm!k<O8dFmI)o2n`H0D0k!?E3Drk{Eyf$V&YxVk`F_o6Kn#sKnhsS-n`iuSPH+97~5yk\
-49OSeI8Ry?_U%XQaLwt>qPY=08pOju-iqPX_{h`>M&zws7QWHXa=3F|03vjkB9PPQW2g4#i>BGYW\
-oToSw0S^`}_t&v-0f{2m==ZSnhboR^AmCisu@3&@+VjdN(gIFqz`FMOKXIDF%L$zYt>Vw^G3I04V\
-PPiD06H))(zPcuG;<NWGcX`HAx58&e*#K$>=k8{4(pL6Iq-{IqYmyXja#%cB+=X11QOve=8<`t7+\
-opLSk#wd#WwUcb#{c8htNtu^V8s0iyKJ+PnUjFz+k@51Xi~M={{TH>Jmroku&zE8{1NhRXf-j{F5\
-9CYZp}f_QFQHwr7x0SS(1%VA_b6P;vvqSRuJd5t+!Q~R8WrvDz$=`^$tuqMB{+9>ZlkrM%%7!B7d\
-U{=z~i0fWEIOE;p?(2SQj|WeJVFs_oiR!tEiq?X>lk^AL_(#u>|V*H{x0jtJ^&mX$I=ssnj4(s4!\
-m-JgGPEq?y2zdQ+Z6*N(%a{KG)Ug!T3wihI2%e_AJWDOj79W}1LMC8>MS9#=?Qv|ORh^#RvCx^iC\
-#@<6A(Pvx5eC+%Vl%+ikmZoJBIk&Xj&6(@}ALs;|p)<ZC!S8zN7r2Y*+9&3W}^yK47;^Rr8<C#s@\
-)>3}psT+%7Jjpnoo^(9(#dwmD-{N?BsQFlKEFaHUo9iZSW50{n!|2Xba{=OX60biA(v>Y^YKIk#A\
-<^)g1HUl8?_r)qKEJ@<>gL<L-(AD!Hxca~Y;Ip+F!VBerc$#B?W$<2odvkM)8s(=ZjqI*SKxUIx4\
-Yjknej*gqk_q7y-4dvK8b4^#oAEE@xrE%$H|sFZwBCc#;5%pk3Hq@BgljI8SmtIxA<(UN=*^=ZMx\
-RCr?79u(6=ejw{nx?xA1H;^S;6JGlcU#-8%R4YuGw>#Z%fk7xUvf_g!q`YRC_BPH`mBA4hJ3GUsC\
-cQ8w=Y$cr@KUPoNLMLj!NJ#Sz=<B0dqP!IOCG*hYhJ0A<;hz0ThJQgGUa9mr8xV8}TW8G+n-zL>B\
-##}@F3p0UF&H%b+Hfv1(P{679dbRY);Op<-jEu|%C~Py9C?-3OU(9qdD`E3!QrJ8qZ#;Jtw-G|Um\
-@h{7eWdjCQLKNFuE|GSV!+qs{M?78K!0*CVYtKWO~Lgmx&BWrLDu|6Z2%0?g0;c@JJcqk1oxH6c2\
-##A!%2kEswWXf-0ul>{CX|UZ+I9{o02m2i*WWNiu*Wk(6{VW1u9XjYx0z$$+K)+zr*pRki_`4+^@\
-M-*my(8(*)w8whDrLBTd~M6<US{!>I*2oB~>(DrgjC;oZ>3XzBSmn*k1m@nIjdMQ*bm5{5Q}E-)+\
-4Ul+LVLL*%uu#M|MXGl&WYj4TZ>-eGJdu3i^^*2AEuNPw#Vxe9W^)Z&B?Fz~v?90r!K1)$=LK$vP\
-sr>ho%>Rxt3e2|ES1kdag*+X7gfqGC4(-@zmxc9)ind^<dA8~Xxm*Ww_?#2WKI*j30ohkjiTv#fp\
-B^wr{lDWa>zMs&PGuQ9Poe%aC=0T*HgU_C67vhAK|k7LA?qh+J?6YafpsS8wR<^U$o0<SX?=LQ#R\
-{?-#!>Mk$LpP-U%@)46vkswcpA4$sA6ryZE!smwvItRXNCEBtiRz_UcU*xA5k7&sFu<>m<V%V3h4\
-`rj|udJeH7#G3+o)yc3)T@i-9jJz^4rBLx2aa4=o2b(=~gEz3(PEXP~R&xHDkxo2D>7>AwLc=?Zx\
-Z$1K+Ppf_&X40uEJJdk}QIFINTp?XBoj;{n96PeCYVqQPmVnttZZ}o`u4t298iZe-|Z_b8qPr#k&\
-pdU|%_3JdXhRZHrKZ|>8vK-`nu=m(R`wKcrZK2KkAH<ni?EepvK7jt@I*{S}F%}_)>j02;jOr(#2\
-Ms71Lv7xmE4X1@;Re}UI}Z8=xTApVEh)ZkQ>p#BP36!(!1rzksE?Oa(R$Fn_5gvet*X>MdlTa1J`\
-=-_x<t@FARS>_JAlE!J%z!b1oXH|O_ClIM`c76j!(qrlz{%{tnN{XaJ>TZUQKQ8&==?rw&Uh_SON\
-XY+RbdkS-XiVTId@v#t~3%3*so`DTVnhGtU4R&!D=#(>znfbwCO9`(+sGF3=lygMN_-bL!#ritlh\
-8hjZfwJ)OcE)_3UJ#&`nsx8eUaMALg~VU1IlsW_g%dF8$ZOxqyfoxtIp$>>VI{#<?)<I8=XlyopC\
-Z-%jWPzOpzSUx{m;GV*958tB?uoU=+-gjSOo~GX5@b^toeu{STvBWWr(j4<U`O}Uu9Vd4J90r<Yv\
-KqcX$2~h~a<h)p_bq<)2FCvc=mtF9gMN-^kjn~_e^ztR4idlZS$)1bF2gMfTZ_j+zU-B;8&H;Oc>\
-`^5&iS0zqg@wuk3{6NHt%>l!%4a(O<?1)Ls~u6jhGELhRP_}=4PyWePfG2_mcFePi?K&)h>t$qN@\
-dkZw&ClWZ;E;0Uj|9y8f+3UYJr@Vo%vrYEA(<@2gUps^K(MgZ56)k7mGJ+WS@tJ5vVNbDh<5=z7p\
-v|J%uymDXgU^h+(NPTh2wqS<N;^EPXFFIM;(lH%{2N=j!yPa7t)_>z0jugrOH1=NAKkM{CdsAu5H\
-*yIW*lieJfoX+b*y6C5{_OcXm5tFmC)r-8aZXCzgjpJb5*oo06w&z4U9PoyRsSlg|e+vHtk7j){)\
-!=&iIY^t!*HW1F5<DYamzbX(jdblqUJmqzGS)}eX*Ta~u4J(>=RP6%5TSg$!swc<!+XP8syF3%36\
-SpP{VoN#yoi0z;e0m-eHW>l1P}N@$RChhv&DKj3FS)<^+r0L9)RZnS9AADCTF_C_^yL`uLGVqRV^\
-=`s-EPs2J=}##$<quv4Y%5hhLm;(m4ZQo4BcE8S%E<3Evf*A1(oWTw?QHf@|`{>_7UTYZnTBXa;_\
-0c3cH%>0JdsG&`nqxYZ8f{BS<NYZm-YN4Y**t($K1mcjg$Lw{00KSF;VEsH+AS3u^xVyoJNJeH6g\
-nhwvPw^SwJe<+J{kMav~1J{%$(2Yv$a{$NZP+2yH*&bM(nXIh7-P&?nRl;#53lwQC>Y<<b-VL(Wj\
-celh@H+|D+P12fq3o`!L6(3lozBZ5Oc91#xopIIrPWiY96MjgOI)v)<GdzrsvQDw8C5if)(dbhd4\
-ts4MKn7C+6}0@1e)!m)j!mz{{E5F4|1WD7|3Jb2O6#d>;QhDWN%mMZ<?~nQuM&&)zzAwx=-k-91c\
-Q9^~q|$he^=>uY{~d7%$^6zLV)B?iKKB$G%S4L}3g%%5J;Od(z8cjJODLy%yy728>G>#s0r|lF|*\
-=g+Ml!D~>-vnol-E+M6diE+%nY97bp?iC#88as`vk!yJ-qhVmGfi8PFTlj%~(=DxxPQC+a9dBtpy\
-&9gv$#4y=hJX2lqSn!x*l+phety}v_v6HwKvdkk6^aX{AzeHJ+a*0taY@mE}7c<#j4{~v55?`Nld\
-3YaR;|aSh%EWsht=`OKB(!zUrNLz+`drc9`uFJ2_Gvu~{;GpP(~^Hwh&o&BU21ThQVTq^E}8mAy}\
-<VmT3*ekx&hjH>pxLkJ3mxhwdI{?+*8YAEN1cEDU$96@0uXpjWIwwp*|jqx&FtNb!dOC-3ep-B+p\
-g<VV-MA6UHHdJeKT>9?&5?s7C`2tJ{e>9+ZbV=5jtz2mHSl=G|l}ntX?d;ekAe*JyKn^aQnQ(*G}\
->U^vWdXMneWXHP)dT%p55+AHu(?RbFSAQON-6o=`09w!9t)WP%pk85;|a|N>aAleUK<2o+tmYZ?R\
-If3|IGl}8*osUcS4(<LK`u=Y&vuZzsGA}T=z6$kREaK~V`Y_$|FLclSb<b2+hI-QY7@iYw+8JoCt\
-eC{``Rd2DF~7*;V?Rdt0qoB`*0K)$GcrD)PC1wJpaLih_~Sr4Y+CZRlloVno+m`S71Z@N0V}Al%Q\
-61{GvEi0BHe1SFtm*Y`CjWh76V{W6za>M>2sj%47Sb=h?z;k_#Vr~3cz`?s*_{uc(Qg+9P^{m*f+\
-qfScQ14HHhPujV7pP+jtI_B$f~Ji##NQ(f#Ddv^<!GYXhgfpwguDy|89H^Y@52vMe*xuQ0D{6I%t\
-m?EZ^cJzaeM0u~$BUH9Bs_zz<IW9WuG#_UyW9iYY9;Mh=4vB~{}@qhG~u-VR0FM8CNH_EY?C!*L`\
-@V_bA-)?x*V_|q_MrhtCY=sEF6OU@P0EC$yPPrEgJ6!nKPD+Qf^Sw_;@i;gb_oI&m@@GFjR~=J>c\
-;W$kp>`S0?<#N|1Gt2?E3|nd|9k&Yrf>f56lO~jcJg;1-JOX%F-5Hfy$pH7+@rwX0Cos(u_q@7=?\
-8GPj{8Q?7ef8Ig@o#AxSn>SP62gfaT$zr$?W%}8-CsQnMT4mU(1-C>9|YKF_fXY66i;hk5he|{=W\
-(T3qKpsT%FnEm<DM@7S8V=ZSir=@3@?I!#exD8KPc{XH^`uy}6l=MMT@vQwQ&UEuP_jF~SD&u0mL\
-h4di=IPGo#<<YN-wgZ427^lP84o(wQ&dj*z2J(u`sfu-l@o-fcnXX~D0bkEq&nU4w{q&TL*|GrFz\
-QuTar;Y5Zv@sDZ#M|lq1_vMdt3OyO%VHfqnTofbRVGjQVH~{$N&j%rIu9WvKF2^wc{~Z-^ud~!ik\
-A&Yd<r!ySZ<fm7n4CObR`yF<q5Xs7G=ItAagq4}I1kX-eR2Jp0`!y$ZN|`eXi7tAR7a>peoW~H=;\
-hcWOg~tDt)?GPAMYbfKcMte&SI1wKLYfV$mypT=m%(MA;J~tw2to=L0gXpc{Q#V&@Z>aR;9P+F5t\
-R4&`>vLb!w&Xab2#%4eZAb=*Kuc&Om=|f_ce<bV{Eft1-={@_EB&plOUH#x;aBiX8IXNnApIxXsJ\
-_%lQAd_<sneN5I9p`HJHXNE7k0nD&5|)8innFULuE3G=sg0<(=Td{m+%DE9*B+YLZR6qj|h_vQqK\
-C)e{bp#QsMSl}4G5c~$l_6ry<=+%|YD+&N_=TsmLGrfA2`qINF+k@DY6rD|}6}WLb$BkK&{c+<~1\
-KhA0;6|<Y)ZxZB1KdD*9B+Udb<mf59d5Xe`Qyf$Xg^3`vBTN0R+I7LdsV}aCN&U0_Ne~&(V~XNkC\
-7ZdzI((UKaxV=$1ga3?06(Neq1Ht$BRdT<3|d`5A+Wt!Myi^HBcwIpMcIg+E1X~GK|&RN$C3G@Wb\
-d2v3ZwVLv7$*u{Z3%!z@+|<4{n4MIN@Mk;_!HX+isCF!wijgUHlOx);?;<4|<tJvg3?_vuH3jvI&\
-@?k`{H1LdgheA5vcW9woz!5J{->97v#<l7I6{wcc04f?(HVQoLGNXI&+AK|>+JX`(en%2Rng2QO-\
-wf-=A*#JiQ1~BT~1{l4<VRU7LFiL9$jP42oqjMw}tyvQoS0MDp7^2z5S-hsPZrGXaab`B*OyWS_q\
-E+ZDI-Bs`MzmKH?P!f}EIP>EUkYnphQ{2*F?%}IiHk|dcxcQge1(IEhy^TA(VvJgz%kTA-2?d^$b\
-Rr!&wTtezRyA|Yf5?i7W)1^ruJ4`BS^7Zd|xo?$k?7c%-&nQ-Z9l^uW&136C#FXgnOjjd`|}Q!v6\
-?ctuL0>*ykzxYC4f1z8a(0KE5B@Le}oEB)xq2gPXP-w%lvkfOtmZjsfO4M@xKgj{ruJ??uF0`0&L\
-Z4zG$_es~pRKYTI5Wj^yE)pDQHZzNdNarkNbSwj1Y(LY_!;b*u9Cdj;_Z2A@5m&3+-hv);PWlMwm\
-6|o09eB4E6zSkS;v<f_k;q@dL)DsN;5zylJ7RE!3Xi@CP9}9Ux(c+$y2DEsF>7(ZvppS1+M;X6*h\
-g&Hzqz&gu1KNlbzk{?{ds1q%^9RrB+l(fW#SNWuJ}=vX^|&>k#pS+^_H?xW0&dZCK38Z{mvLI`br\
-EBl=7XbT7e3vzVgP>ur;-?U)<y}@_Tk_hL~;Lzo7=|1!BY52u)LzMcysr3)<-{oYyzpG`_IzTQ{8\
-v+_o4cUXMV)7e(ps6+}eJIu$f`ZDd_j!feN!3X2;{N%{y^bfofeeP(@qU<qt7Ff&5*8=jjgxk)vE\
-TQ@a$@E!)I!e6|xUN#X2w^z0CBzw1W)?RT9Y3ccRPJh-2#Hwhj)CZEZXtvi$B2Hlw)H-$QrqvPz4\
-(|7iVLAmeHM;sNt|DQuXgbmupBeA_2o(a>MygFGXcyI<0dzy(OTi&BRk2rAOaZ56B)fW=S`F{Ji;\
-T^O|x(rUOO(a$IAj2+__Ik@QPu?$5fpILb_R96effuUZA8c6{Y#bw7G3H|=vRG&%`SS}Uvhyg6%H\
-}JPolk^imMY=<=&K)X=h!B|HpUOOT083ycBfgti6`2b5efV}mlVEl6nSo1q-Q0C;irwV-lPcKDRM\
-q`O3zv{niD(=VHl~|Y)`8!%ON!}e(PMVoeR&voOG7vM4Vk!$<Ju$b6Vzu>4@R>Rh_nTu7b>mIIpV\
-<32mpB``4PhJx}3S(jtg;h!`Fb;0Ufq1&;iVpHVV|<4Cj-j<jYz+t?=~yp27Lc#AqN?wfBj-bN_%\
-nNOOnfm*X4r<-hN<8~tCw}>lLXO{eBh_|R;_afo<-e8~3B@vuY!ufYZ=lwyM^Q8I1xLOfUlP%5$<\
-Lh#h!sa)k^YbE@U%@*C-|R`k>(>h-&<$@1qkqdb6}nbBwDL2PQnaI!!5qA~KRDmVwz{&Ie82UOZ%\
-k(PUc?(<T5qFyme!1xJaWjrF8G=(0Cq8APQv>k6T-kw_E(lX5FXBJA2|E;^#7lA>aP1wjZXb-J9O\
-%9?a-;STA@?tpJJW*?R`IuPCdSvoil?xxzCx>sn0_F`Gzw9|Iy8wZgfdA(~aCsr${&I&~?wauKPi\
-gHlN#@*nBQ;`e}9DYb6|;!g1{C)7hsEz4T|Hm!?FZm-cI;UOKm#`S;~MoU_+h7ig>A<b*c<o9&f<\
-Yv|Ce+NxVEZun_*t3$^-bSo?ycLw0U`?x0eemKtLp5u6jZuN83t(Hpjxs1<e%JH98w>mEMsfqVV^\
->*l19lF)&)2*y00(GmudQPowb?u4&Zry6Wr$e`Dt8UfZ^V8^7&#E1|6}A7nPe1%0RW-TyxXR?-#c\
-GFc^>fv&`bhKHm(S;W$9`Jfs$A;ROT15|$2xSY4&CbX=~n-%2I^LGe>k<e)p7L<=~lt^VuMaKOu|\
-nE=5)e+to-sHjqcG1JmUiAY!HpJPF2NSg5%8$r$x*&+pEv=)h4i*XS(+&!RG6OI9q|npF{t$edmo\
-9sCd3zKcGF@S3K_x+Wo$zB}tBf_I__XH}^(DBV4x(2j9U#<{5p@q2?L;eSU;^DAT~02x#E6`lutU\
->qpRyq9TA_*?q0Q12BL-Ju4`EZa)@CpLZb+oJn7ME9h$VZ&>+d>d%X=GCSz%tf#9_esk*R>d23Qb\
-XB(d?4_$4SF-X)ygx6xx^lNMU9Ie(tFwl#4z6rJU0I`xb|@>Y8<4hA3~1}aU1u+C-E}Y51yB6EXz\
-SOzI%L+_PFp=s0c|O}@1Zhl+|fX~I=V9mT}9ZAY#&qZHL|}3-ra|Ijc37Pe#F&Hd@YUVGW?#fv=8\
-9dbd=c=F<sEa+mPOb=P4vI+al(zg0y2tw7h8w+l#z~*R_q)tFN9U;(Z6xlC(NLf#+?6ooW0LFZWN\
-WoH+jy^WnLk7@LlH{sqtf<mJAkcey}bpp93WTGrv&5qPFPo=b*lWtdhxNA>VJv!I`4{B8`3LJn0#\
-@pCK9td6H4|3~zG_5x~iz%)k_p2dLi@fyr<9!!dMXZ`2W*`3G-Fi$nn&R_H0?Wi!mg7vO|deb;8R\
-&u)w!xioPw3`uEjQkJK{_WB@tm6KoIL0S#Y|`%ALw<SB3V<trH%EGh^Y$rW_h`0AXOC7;o@i}&Te\
-|B4$MvYRrxC}4<wY4wG}}LX5YMoN{Nw$`q}gJI8;nV|^Yl96Z_jp1ww|u|E{@?4wke+xl6ZvOHJf\
-}y&|L5{14LWRjk>m=4YiTY3yvWiU;D99XD119zGYDuK1q4}Jix&=@Jdnk@kr#zDs~@vo7#Y~Pe#B\
-)W1B+Tk3>xTqa25kK1jTEjlPW7hmCWNdz!PO$sxeYhb-cZz6Aetl-G&6dw0tCIgk`z@D2|CAJ0>?\
-TDL!o=ZRxJw{%vbTiUm4c;<F=Xj$`17}sqi%v~4qeJFU2A;_m^0G~Q@-3ZTheyWk#lJ5pRCyuB8n\
-)*G%*oh;QiR4IlJKve!YjCE^of82*caLD7wXkWQaa|{jju3xO>vROnk22|Rl8&%}%jfst_XPtT0p\
-<QPNBwmKyz^=8(Lf#HAH1&j4RnOJbvnYw@ccfP_1k&59R@nW$2uJW@8{UT%Y82C2)JI*>j+Cu1nL\
-MSl5Ab1(-G!F{_Q#)q2L755&lK|b%bw-rXzfGlKF~!x&fEBc=nZEH<)-LylybRu5G%(uoM2e!Ros\
-;-QX7|{B?sro?+c!a9wEK;IAQcgV#dn2LH=-gTJ*xH+b$ypl-14NaVV~Q%54#4Q5BE8{E+j-Qbo8\
-b%Wd6p&Q&B0Wbafcx1Z4f>63aD`fFJsAo|tWij3nG5d%ni&w+*j3Z1I-*Q}&#fy%gI$4}@`1Hx*j\
-FV@doIhLS?s<CHv_Zyxe`o7t?9Mww%UHC>8OhkB9|L7<w;#_g8H+KndKrr}(;69z=jrQZ?5yMAWo\
-%<p<T7^L@$fSCq3_xzV=p-FFJtH3sma*v<3Fv8z3#ivGIsdU;4*gb(cm)nf}>2v<{ph)#`ZZHC}V\
-pZja<ei9_^5^MsUINlYb5}_Fp;~`vsS=i@chQ{iXNR$=FK|o<2D^zNtgT25aNWruNHN^;fNvv6w%\
-UjNK4K#y({rV;?`uWb6`epp3oQ+d3Ir;0=_qGri$uY@ZX6%h=1j;brXW-?mN04)*%X*k!-cWb6R%\
-Pb*{Z{Wi3WeIta7{bL9j`zJ1A|I!K>yWT*?KG_Nx>*$cNhH&|(`ty*nGmiSp*r`XEj9sW|GWJIG)\
-XCVz`%j-7Tynfa#s+I+c>rtz&yhyiNck%8N0ebViMWb5c5eU2{N4(bU8}8(?@$>4&(BFb6=fyf?e\
-vhiA0&bCst;mV8Okd;UlY$(ymvQ&xIQp(eg<iOfbtb6tKglLSQ~&hx#kLf4DZX~J+{5lD`YY|9~k\
-p-S>S>;T)YjJli%BkW!G{UiDmLk8jqjo<>!4vp7W1t=Y1>aF9w(lk<N9czT8YwGaAx5^ZP60v26!\
-A;JeoX>K@C_rdE7+VHuyTUCQsl5%K?ce)+Np_GZXuvZKr!9AUf$-Lt^Y-@S-vckN*OMrMTPrORjT\
-+rssg-*JHZ687;k>w?9kU_XMLD=*Hl#=Bj_y)NQ>=uq^AG#N>($5YGO=yNeTBVXPR1Mlfs;Cy`Un\
-85S%gPjr9iG;rMSAQpR09<_fbaYMAk{%V!D|*5_@_W(EDJtHJUT*HIzF3@0@3F6)LcF&C|1UMqp?\
-AqrdZ71sC#&03Jkz_6x_McjTxaq1>P;5G6J`NFxn5nT%K3Xk{WI0y@jGFhc-L+5Ox4+m$63LDc2{\
-F>RXkIk@Pft@@UG04Rpbe?G@h_Q;|ciwdF(5+eV2;#JyZ4ZgbkbzYyh6{0{{Pl&9z$GR|9>VgfY&\
-O5SM4FgN1#65~qC_{{?vWFQ@%#PS<k3Ka=R)34NsZix<yUFTwqZV=;bgwra!wc#moEEEV@H){O!>\
-8*B6KwA;M91gtVmHNBQWKKOs~m<B_-e-Cs_qGUc_`xvePu5YrCUp`Nt*O02txZh}vt*Z7hTa}5}s\
-xmD7=-nrO^xeODy*fUI-=mEGf&MHjtsC&ZQ>aUQ68pA<!3NuN4+9)pVsi~t$YhT>b|c`@6M#!=D(\
-t2j&mcnYI{qS9|E?xgZrtm1wXI5lzK~uSsgGj)gAmt8K3`gHs=@n-7h{^ZM+n;-!gyER9ei&fqz&\
-PCCh$tZXTT@z&a|GY)84bP1mIQz_1(<NA-;KzaTzp=-!I&W#|BJcYk|_nmUUlZKlyvgyOZ(UdK10\
-tX(7}{?`Og>X0r9mEs(Zd8n<T_OQ-dx5!&vD_&&|Q983b$^_&8qu?>)wGa&sh$M{|`kYjkK=mdr7\
-1bdD#e11o~hxXn)rrq&O`1&IO$23dR;c4B#D{~aK?(y*bPuP#qm^Mo*OY;KnK-~1vE8ue>v?K0w%\
-;Iy4<>~#lK=YR=Y>rBS2IzfPz<chdeoVaYiqw=XRBFa4^1bxaDw>vD2Qnd=-@!CZ-LzD9cMj)?9u\
-t>CASY^~ggnvsT~Hkf`Z*Tw$FUKIHCn%a%nbSCV9jN6;5^}dbH2McLBA;n9{3{gK-7cIZA6^wtKx\
-lz?g7Ll?$dKF>zj)-odL9yrqKJoT&NS3LRyJkp?4seAYZ1!?q5Xxq#p2RD1XNLx7~nOH7Hl1kNq0\
-y-PT^AONlsA<h{fB`nd#nPY%lE0qjlyyo+`h$E$&S4zTV^@h)*phyOT7Ss7%ch*N!wpEK=yA5FZk\
-@%5>EUm%XpxomdsYK7!j#C@J=Y@fMj2)*0Zg|><q-sU^LJ%5v6t!bukt_2#te5rQ#TBP#QKP@m$S\
-KLEPV{)U(p;FG*kdI+JZD$^@i)(ig^YZ}_GO1AgVJTbZ`*bpZW3OX4&+MLy3VNr7wP734bj(sn-@\
-26D?<nW#7b9d&fqEIhz<2K%p3%bXLAC6j?q(m4P9Rm~Khk}mKAt#%>Q^J5x0u<ycjI*w1*;>DR6T\
-)p#A$Wp@;d&!)c+1|-yIwP->!U}iExs~@wRTP|FcxPi;c}|`1?9g=exvge9x*UhTRF8Z6$~B{;g~\
--t0^wV_+qp6P#GP=<ubpU%MU-q{TW-%O%1iq!G1(?=fOor`GVL;a?H{lB%HrqXlAq%iH!t#8n)Ng\
-a};hjhd&EJ))6N~p!Xxqk0+K`_gFGgZqGf|HWK;QJEZMrH&h$mK_jg<IX#yF-IW91-6ifAPvmy47\
--kbZh<D8(jsaghe3IR1gfj04%9t1(F9f;SMZs}PYbv9&jFs@P!SPT#NesKkgXz<xp+e9KA+M3;nG\
-U2WYE$&A_)JlXcAOVMto!gVb3;r;J6>7JVuNwrH&{BOqK=S*8CT?c>)|*53Y+(jOF6&i=YZgy)41\
-L(;WUi6xoe64-K_FGM4LS=>-6U+Q#&WrcL86kiu+1(0@kj9v`$FN6OrD_79HkX0ym7&vNRvhW_B=\
-q2(<a{T*C0o9b<5=MF{%1VrlrbpUohTSbNH}<GV`<?XhF=eio3U>11TEJ?l<@6^_U6ynr}nZ;0dj\
-=<B&1r8CjyQMTpo{W8cNf%cr45rJ*s9LY8y&Xq{z=iFer?+y!d>+j7u)puBgKhJ*47($B1w2DVby\
-lGoAu0aaakD4_b7xJc$o0&ZWZ9~k)An_v!7m!{{?RejsWa|MqmyMIoMbVx4bK93XzX6oRvkvOx*x\
-n?H=Lw828lEo^q^uYh;vmjzEb*6j2z#=N3?UXg|3A#R39Yc52HtJg9-F5L%37hU$={y>x^{0^%TI\
-J`dLH_VJVevqQ13yX9Nt$N#qQYM;Z75Gk;7bqp8Idq)A8PPgca!cQBdb4P$#Yp5k8{cMcr7vo6TY\
-`S%E5iNjC`FWhUxc1!_Kz7Zmw$eT8<`M!aJ@ldVs^2U^w*!8>eWZG!$gYHNTsiWAlZ?sJ50J4c;+\
-1Z^~h>czrtLGO6)OUt<V`s6%($Ni4D4sqgrrcf5|E5=_@H|x(F^@BLA{_(v2en;542+LQPXVY;BJ\
-zUf^NsJNl;Qhx)A0P0TeAcfyRMz8rMcO;$>kIE&F0a$g*GG7_GWHSZb~4PB>n33<hC07#6uQD3bu\
-+-sVq<ax%OH;Z?EupmgpJw+u)T)OInz1QY%Vvq?Z|Cm+x6(r%d~k#S_Sk!OJV)5Y1H6NX$9?W1Gt\
-~l%<gK(eDBkIXy<0{WF1?c*D}e5)VyK>;JnF@w;^A%fKFZJv+XcB(wYCy1{}uw*a+y?*Ki%iY5_f\
-5A&V^;+n#mvbwW7(RhFB*BRG#mmTA=2ew^JGh`i<Z$GP6d=ip%)vlagS&PesKSDTq{lpI<~^|7~`\
-b$+W>@Fqf<p3tvPX}evw{0r|HJJWXz2H3d=gtv456!$;`J!>e0zx%tE;QsEfT7vt#m!D+*?r5J4B\
-8aTh*$*rkwvitQy*EKS-w4}8o?Eq_@e+A2?;HD>Po495pC1c(3+0P2ZrA=mzx%4sgP&!l*R4F%Pr\
-&$t@KZ=<F!^-LHu+-PsgE1!-{JH~-&%v~Hgz$Pmy!L{-;49#&5`S_vflSav;H30Q?Va8xc_v(5o7\
--;%IIMJ(<=@K`cLzYw9kKf$&t|h(-B9Q|MdLBt@oee7>)d=D9?re6lvyc@t@9Zga7nDYWUa|JsoH\
-0{HLF(LdHezKRv&_{?m5&JZIh7;qyeF=ZHq;^So2%^IXyx+UI%wp+KMK)s5}*d0x>N+UI#`Bl8iB\
-I@EffXOBkB=lTA=K%b{w@_BA;h0jw#y^s4m&G?`DJfl$u4C3=VxS07oKR6t@&-07J;eDPKBcJCW=\
-JT9}@%DqbUt|jPrv&;shcRDgS+IT;lBzf1U2UOelb?cP9>#s0^U>GYQ^mOd+8oK(nZx+Z-xq7X&M\
-y!9`#Rq{sPlE2d#cXr9@N)asPlEcbvU%Ib2Q9v`C*-}GmZNSVV!dx`m==3lCNO~LE6)YgZMf#nXh\
-vlzR&b8muTec1lb43viAPNT%LpMse`q&h5I_6ILz?)!GoHwvq-d^9K_d|!21s}^GB4o3A`VPtRE+\
-cfv*$zZ42@Dbq+ereVuW}zRoDUuM_yrqudTHe4U*_`8v(h)Kxd@e4UaF#J!jKEdS5kcAw?Pd&B!I\
-_mbc~%Y($<XL*wN`z)X5KFbgH`ui+9dHLEK*Rft^r^j`8EXHRU_$-eR&1cy)gwOJR1E1x}Hu@~rN\
-<K?R5T9jloS)O+cieV!px^P^L*f07l{bg>J7OHO?03B9P;kHF!-xF+j)Q0{_sHk>oM3Y&{Emwb1@\
-}9yIOOkl?8EDD+#KBR*eK$C!uTCm-W<a3XrQO8GDYU+yVDf8pYI-1pr7worq=oSu)VhW`Q9*{c|T\
-uaJN$eFr^wIu<1x+8rykS%e8-O&`}zJr!u$F5k@oxfV4ZRh?Mg{rZdc-dzF&CTV^@-VWM`32X?jh\
-EPwA)jDP44o`IK^w`TLY|kDWfB($}A!exK3`pqF2H17V+LAuhkVPLuzq<Uq^1+joWb|2V_=e{MM7\
-@Bdi?&o}OBpZ{muf$;vHtM|05`^$mw{-5dt%s=zDeZl=duO4W-|K|_9{<3|o^Zz`4AhiEy^?_64|\
-CxV4^Z)eN6X^fxvM130GvXBZe`Xwr%>Q%Mfp+?TPO)F+&J&tn2G6~bWd!;OPlaDb$j@=d{QWYskD\
-VgF%zvTJ<FBX5=P}I_=<~S36W-@B*%RpVxb%~@`#fsAn$5UXK99D}X)A1ku?Lw=@O(K=+MKM~4~D\
-i0Ubi>UCYX7!eKx`LgQ0DLy$&*4%80$Kw+VU<Xg0z1o<N(Rit(;(unFQhp~5D3owN^v91U(0{QWP\
-PP4Kw`k=q0}9%!FU@Y<u1+XR1oAh=BsWt(ghyy|G6O>odrW1HZDUurhNKOFG432to&ZWDY|XA^wz\
-Kxms_Jk0N%2ZGxKuQRX-UXN`Y2yGKwd?3&!m><L@csZm`JK%2<%;7e{Umjq1{M!c2COGv#<Tk<nN\
-}x?}pkizj9IV^_(6T?YO>mfjO>m^b)?30Rm><R_c<%z^{SO~Y`yYN~u>T>L9r2HDW=H%}RA^t1tU\
-vsELF@MkUa0u{xiS=keS)p9T`qTrw_Q#OvESlq-F}NXy8RaA+;(|~+uwHiWus=hyg=G-f$?5Ow##\
-YKev8{f*e)M1uwCBYM%(2xlI`;8AhydrHwN2paq8`vPb~<vXWqX*yghT+g3$KN#zud8X4?MX_ROL\
-C{q32@8ksHfFF*R*Gtb!{+@6`f-`}43J+EWVg5dVd&5e=SGu0bgXU{wop*{15R@gK57}zs+x6+>Z\
-gQ*qwhH?LOe{*E9Bt~|mRC91!5B2k!B|opV$VC+E_DIfMN1i<3MgtyYFzx|(#u^D8|1Hi6wkpg{7\
-pw3+E=p_z#!KXhJucW+tIb8vAckMSlf_gAlVU2u#c<uW;MAOPf2!@q^V(rIo_mVy#y1_-?8aNA{U\
-Ns;HntnT8iC!|+{*nSU5wYgpW?dr!A7=@!@D#H=$E+m{e5HG*S@tsnE!XnN41B~M*H#mA9mP}e`@\
->ji-(x~_@r)6g7eVnvma0R@bue{(Y9oj_9O^6rCEsg=eQr?b6Cq{*0s+by{^IE9=!#glj_=Mk3QK\
-D-X6VbcgwnlhVb@iwSn1-d%A<$qw5>mZjY|z^`HEqb@u3Y8$#Qos~S#?J$ikEW{)1XJJ24Tzx(vq\
-qaSIA%pP6baCX_FpKsRe(Holm?a>c4pE7$imCNOa{O!?|hdS)hXPZ5G^{zmB^lx^Bw@3eWSD-z*W\
-Sgd&1dUH^qrJNSkv7_^f5!3n=bda{JburUXEq-HXoGP){@}gA<MD6$J}@3XVQ>55@jLGg9giQim&\
-M~x_`db=_&7$Rc>GTqw0Qh`cLm1d4>pL$9~EId{w3{*$KTM3czl#86X&+xMmb6si$AapXPGTJg=d\
--RZ5N=cY^VR@TW7~OTo{=h1MQjTwZo1v&!pKgtX9B1%!76emS=H*ts|b>I^x@A>$qUvPqg>oH0~q\
-#Vh{5fPSEWmNN5P{GaSD=&}VpHPy2j^d-sI)8SdJ{d@b3#TkkV`YmeqLykTdc&#-$N_YoY}r}+$X\
-C7)sAzTiH?6@|=ac+;N9eTKi@(>|Z!rTZiI8RqW^?lYXa$KPj|w?EKln7ZHCXLxy`<}<u=kH63G&\
-0WELhD&um!|V2h_8ERz-?GlWC%Dfr*T82u2GU0C3GFk?*%Rn9>>tEum<{Ru_W1h@`*5G(g&dFX+@\
-<*p)AvN~Gqf1^4C90N47=)lh97!D`wV*;_zVkm`v`i4@fj{DF!mWvlYE9hnj`la{<@y|42MLueec\
-1n`tbg{Lm~Da9M$bTFbDD9&8+wL-~F)H*niis*Vup8B<(%uc^3Kaj?X!B{=1h70{wT3J>mU#LkmL\
-t@67xB{dX2maQ|H&kH7yeW*_sty?4Ohe|O9s+<#~F`1|jE+{@~?wII0v?vuTd`R{(5(>nj%x(NMu\
-kF>&n_qc)oZcQuwcaOAVKf<>E()|cK8Z^IBa*O6y`l6xj`w`5_DcO(kINGlo_j3Ey?t7^H%CfH=_\
-N$_^b3ekccRTz^Kea!pO9S&KU4PQwpVYnK^!bzCdgt`}lknWWI0JtY*+rI+DEPG?%zl1;rCvX@tl\
-RZX`}|7(`rhBKWQIDw`lfw;rMw@)`<34Qu4UceAHw^UM*YD2K1FrG{Yw3RXuDr2lh=P!UF-ZxmLE\
-d<mB<gL#;^46?=`>D>hA*mO2yxu9>3D3-$&+Gdhh$Q%dd2?w9g?&zt7>sDf25)xg6i%?^o*A(BW4\
-)+x$w~{uAg|+WepJex-N+6X;ipt#121hjsh@`}{_O+vzt-JuQACV_Y}HbE9>dnZ<w!8#vwvmKM$K\
-ORIxATM!?{5=Uo0eMjr}-EW@;JvS6zjA4ASv(R(-*+9r2kJm80u9uNs)ka+u^QY<ON{1)HFBBbtP\
-blR4v|@f^c==(5_4wOd5ay^$Ugf*@u24m}G|_iQALD1&$j{JLzWfY&z_%ZXdjc7+x>$Pe1f9)B>$\
-iFLK_B-5Od4QL_9WWqeR&?9@BaAsHTL+pHBs@_HT@`lOLhsJ?(5|3c+8fK6)+Cug;|n6@_Ih+O9U\
->!f1E?A>qGws>egyAI1V#kpTEpRn_eA^5%Fv%)UgZ7hrH(v`Vt?(c~sVR&~U88cZDy<3UZmmZ+kY\
-ZT{O=?A3udWMu9#hM|eMzIAb5_-4@9mdeHaFBhZzEo@9yEeAkFGo&*M~Ez;eG-?uP5ips?datQ4N\
-zi;9E9NLWKxPf;cdg9pn0d1x-o?NmOcwGqnE*LB^Pb9uk9J>O#mkH+h_8mfAYp_Z+Xuqv<DBv7$=\
-bpj(8vWgLoaMxUy2Q<#=QvuJE`mOZi5$L2<G<C>-K|1)KzX_j%fMgay-&CH#`QM(FJMjQ!n}8ia=\
-=4wm=VOjY{vCu4B&<0ue(8i7qw_Q3i78{Ka}DJU=8=AWGg{g|I&w=eq9bcs}|t?7QdI2+74jt(4|\
-GJUkX*^pA@e-?-?eab&vLgOg>gv+pd|(-$8mU9rrlEE0Z>EjN=#p<A(QNiF#lSc<zkAGnXRY8ycA\
-m&T6d;*4ZO0y7}%;`__8<1NP}WBYCDfPu9<#hrdAomMHB%y|V-4i^T$T7lt><`rQ{T==;+2++ez_\
-C5o>PqlvMfLyq6UGSgv9iR|83Pa@+@4+?ud)OR1(8*b-&0I2T{@=XL<%eHQR7W0?${B9~w)6_VAC\
-#~?~)<QpUUP|Ya8eGFNKf4^;5=72QbGuX0#c|zG5B2W^_-r)Nr$XrQwfqeE2T|XRVZL2cG@COs(8\
-E;<s}G+Qc*gsvJp4Hwp3&#NkmuQPlE?qRyMIgcS}4^)=RA(h*_+!np1y?VS+9h@*8<yEr-WY{;u!\
-IKOT1T5*okqzFO=+Yb@SOhx(USJkApgc48x6^jrsZL>Hc?K=<llO8^JvtS&`f$3vkZV<!fHC8E}|\
-52GR7b&Y)*Rb3X!}5&c{Ay|wm?=u>DXAmrc^!D8sp&%0CDg(Y1QeQGVJ?<KK&chfna7wc!_F?iPr\
-`mnS3Jo;>o;_PvW4<Wr_Y@Fab$d71RF-t={86<2kgw18Jc(YKv`drdFpO!rmJebGMl8+?cv^LzyS\
-=ywno6DORZ?Nio60xVlClO-ZW@H;1+`{;kY#S@#XMkM(y}xa2*7u=pW8rM#;cV*I|G1O7^Ls<^ZT\
-Ze`Tq9Uujeuinh!MOIb=;yI6P36IOML7a8oR>Adgy#bx_g}4jPRWa#`@881N&7FIOdDHpficXLu1\
-j{oQ(EA2OMakklJNOi2QLz@-{GTfUaYKrk~^Zggybp_4Q4BU5a`d^yPW^8U4`mGtm6g@-x71brZY\
-uPrq&zc`9`4*5yq&FOodva~d+nPq((Ex&g|1XanVRZ+`ZtevR8*tWgput@zfqNs?@-=W&$?-xr$L\
-x<S9jP56hgtWl!a{mtRliS!PzNY|qwWLK14b{Y7)gnbpqfw+Ni$+oigYNa*Z$0r$0VjrzmsyiGaR\
-^lDdr0D=_IXw2mx=x12hgE^_5IioDb@Pa($nHl+yuv%`4bOiLB3ChnIhw{M>+Y#)i|sUAY^i}i4*\
-jXP<|`>DHRfsDW&;1w&Qd#$`(egmJS~&?rPP0?I2uug;@qV%o{Vw1*{cdvqFC2>35|VZW$iYXwI{\
-|PSz|4$$kIBWU&<HHvWDJK!_)9TEtkw<Nc{38__syV5(C@+j?jBrS^Gn5u3d>N27=N~8sN|XfL{t\
-p97AEq+rzm4{6rs@8`5o2Y`prqOEFfJui1M0;uBL;XLaAo7~M0%@%8ICOwDuD!fB{?_}ABi!+h2>\
-*<Pjjn8bX%0QGp$2PxHm)if>c2kT!um8|VjrP*kCeDFxWcwiX^4C3QnYV4cqWWLw8#5^I-TFQN5A\
-_fWJgl)c#FdV>qdcya(kIykaGyfdk0YbcHNNX9O`Bp_;xMrs7XOK_(M2s)Ai~3kSq~lq>^gXdOY$\
-3vz%WQ_&w~2oKL2~HUXqE?K>dG3w$wm7D^0W<H?-1+RmnFM$J>>nZPKWml@V70=ZDPy`;Ht~Y=Ul\
-dB^n|&}#<3>z`-vf~>vi;QUe`^8T!d*UlAn?4lA+*WW^kAt1`ZYp7tsH87pGDGwV{SvXlsd?8hrg\
-BcuiL&IIp36)M|5uvOS@0c;Qs011b)iD--^UyZoqqCaP$1mcr#tUy_*R;Ixa+ke>jp2GgsUf0rBz\
-h<n%b=opxr7%Dqm<CGA3T6|<S6``Y}e6$QjU25zXVdHmnab)#lw~Xu)fsT*;UJUsbgxDW}_JOQ;r\
-Y|7wX2o-zq&UL<j3SQu9OAI@{)qlvJGJdGZf*7V6o06#8&DUzk3Yu-^Y!qU;$Zh2omQVs1nU+G7w\
-E_E?JeuX{w3^F9G5@h-pa0$Jc^{B2_&*OP8>_O)94>)t9??e8|k?dl1z-1;Sl7`%xQmboqe3rb`R\
-aWB@h?%!-e~OK=<_R1Csd&Aw}H`*C@-<a&car^O;@9J(=N_tgF-Y@Uri6Q`mSYPb-1^N2XBQ0OxD\
-k+Cr8im~YP%%_jc)$;P(ft%N+D@j;%~H95=~T4`h?<$q~gMpB-Y!gv<xtK+Rf_@*TtU<7?u6zjnK\
-Q(Eswn1T06z+B$v)%*y#Ud@kigU+rzDTp88*5jy)2lpc^IL_7p2(xPtW+8kAv%UU4gOYdseFpz?T\
-(f1MzP|q5K%apV^2j~|vsd#OoUij4^bFxM_{|i}XYd&vV{o6rhhmILfNyk+ZMWZBBeCB{U{60B%A\
-Ov^j&odXS(h&9V(2RtHe$L)Ry2D*+TpRxINce|*pGZKi|4ZNnDa}dJZZcRjCY{FN(Aw%A!3F8ag5\
-oIL=1&{KC{WUB(S;P%k4{I{?Y#GizC&^u*|;&kIgw%vBG~prr~lGKcm|s+1O8|O)lIXRGcG($L*g\
-Z9^2@i)Cq?oyBjJJ*-ZJH68g?2%=hBwq1W~L_=}4T{Z;<FPsCqbC&ym^jIPziS4@|lt!8%rCEcS3\
-_;a}&YXNJs-J5~7c$_4r(R{!UM(biS&?dK^<J>-=^}WCY8-Pb_g!O|Qmyx~loDKIY@oVf#+?psw#\
-AX=BMR&wz1c}Ws|98Y@j60pN8S~l}oAG7k>5t98`Bi|<Fh0YwJup7wFO}_x&o~QgflW*PQ6c)?QX\
-N<0DK<GgP;YvF#ha0#c>AR&-VXo<S-llsTr}0wGxEH#{qwxI?>-jZXUA`U*4jhyT6*NMbvW{|9^}\
-vm7BaPg&FAA259K<b?Jg7U{zE0&?1+-~#W^Ns?@dq1^JZb4fC~emU9##wqf0^8PXAre7|SY{`>u*\
-N3);hd4`tPmz7o={s1qpOZn)=5_#)At0r?cDYk-O2&{0K8x577L9;|QSeLrZ+1Z|n2?NN}o!6+a6\
-_S?$xXF`56<d1^<Z$kd>Lgk0w%nXH=I~U4DLAhus*8=5gcsUBIyUC%>vM+}B-2{1mX(nsm<9V?@>\
-rq1CZaoCQhkyq`z4)KjQ<`unE=sG%3TZT!0O!R+yq!Ieb`;i{Fjo(+jN6c{bY4U2^WfPBERPsRET\
-m0@JQ+&t8q-l$PNZc*TGSyM9m_|!*AM&rt>Wq)q}^Dl-HEi_SlTWf=TY=G*(m(~t!Q-#9{|pG)^6\
-g>f;?GugyG0;w)dsfY_3UP#Btzj$a9pXmlZ?$Jf6Odc-P>*<enr);O-u%cRbWFp^m|CLLH&JN#T1\
-#XuI&<0&_{*26+40=J;1?j;cwY$=h&29;l1rE#yPItuKyoq+iSNwt{$X#y&)AeGqMA*D=00kK6Dj\
-DH1L4w(87K*96|yGsHLk`r=NG^gN#aAm|m)#ui1Q0m!F7{l7$e8n*Xsp34$Vx@G}<<?(eg81q+rp\
-F^;IW+>YJh`|0rzee(Y-7WVw+L1n#r!QiA<bh^$j9}g%weMdy)RE2Wm}vy}C`Wn*hx-J;c||+(eI\
-J)2@_6R+@x<$3);kQ$-j?dh0zSFvBzvZPt+VmILSK6GzK+!Jv%c8uNbkzivq87PbLkD{4bQ9B_rU\
-~tuF=hn4^O3Wm08)i0_JG9=o|FG%KOk;?wiSxuJCj#@opj-Ukx@#w9int71|yMa}kTQ0&`IZYu4J\
-#qA}Sp7oJH#W4<;NM{P1|1JBDSXXo<g1e>Epe2$WI@OjMuJ~)o--K^YJBGEJC&pN947UgkN>T&%j\
-D_>-mcruO;($gvIp#O<5F6h5!5RA)*-zdZRxX?afG_O#{{RaIOc`T6jK@=J8Ckvn)%7QC7ugzxXp\
-u~FaBO|TwE*-`p<i(|s$0pjm&o=TVK6k^V@nwM=N&tMt_gPBd-0lJ0ejwr#;C1v#ZNF0k<hcp*Eb\
-5;};e#^Y0z7^Zw7nSNro=TM&&PM$_4165VRtjEUxKt1C*+52OkYW5u<uy!cg-zHpsP4gziL|YHjP\
-*6LO`*AFUTQs7ko<y9-K!=Fh2yY-*#OUTwi8-GS_J#Kdvt_2-+lyCf6qt*DZfxb`GqsKGEhXv8Qc\
-HSNJ^$@J_L%r<T|YH{p3K?k|}wF_Kt^D!SKx%NVzv?UAdE0i3e1^Sp4)_Lj829%CvH_hg!V72ad)\
-0@gv(EiBzXcA-;E(~>06`+7n9onUQ;zTXtJ%$%Z@7xz^++xu4H`4{MuqVf*bwk76gM`Ig!4iNh6s\
-H`=cAbmYg@2$Ru=jC)_v`ovJMS0BkG|!jhtG6EbQ0*{IGmBw-Ei|T#mUr4`S30XxE3cz<%~A0@qB\
-r0@J(EP&zdGPswS#y)v(U~}!0Tr`h^7M%S`Fn1$9Z;E$sF~0NE^@Vl-teGjiFA*x3n=Zen8WKA1s\
-0TY;qe={&!NpMg3_~A6Dwe<!jTQr)X`W{e-83u0B~F7l+kNLB>V%R2Nh>ub2U}GaYcE6UT`tz=;I\
-Fi7tQ>Q4Wl`DFwVJ1H32)ym%4tg6+pGfV4S)C$rVtaK3bX4!{*(pZ({eKd%2e`S*Dgq+vgiF9y!B\
-4*tG5_J@B0!XnClj{6(c%gYDCxWEv`-jgls(tR*ya7fVAE6dyxNN-+o4Z!$nfN>OuF`mJd2r%vrF\
-pf5a@k?eMoB=K`nrEx)5!Thom3XEU?!h&t%Q=R0xgGkx#VTL|u!i!rkmjtO#riJlH3y-mAanTU$-\
-p_>Zd7k8=kWQHfphq#VSigUhpP?d@OfRm@*FZ+nFaGW73OgY%wsgSk>D9a@gP&oe(^IXD=b^tK5^\
-<3f^QkLfj$BSWLnute%>Mc$Gy~=-=D?srN?Uf-hI5+jC1@PpUV`D_v+^UTBzF=qs_%2g~^fHBrZR\
-OF?eJA1=j84d*Cq!24J!lV-NH)1LG*1@?LqAH}o7KYXkbs=9;wr)+WI`;68_hqA~7a?0hUNZv~yu\
-Gl1*oR0cEs9Oc=$EcRVH8}dX9<^8oFr|=GJqdp0k`TB+XvpGCprSV=@f;=~K8x_)9H=sA5x#}oCI\
-VZ<kSj{YUQnp(-V<o%AssRCZ3%~P}8dGztIc;IRIOYmyN7yh*%o|4InAx6wK7ZAi{tTbLK5AXF<`\
-Wh;f2^6=oAhltc^<4wp<|z;nxIX_M*totnLLrpY|xj1U(;4r)(mA?+|L~KHwI-N4ptU^%^3=<BMR\
-zx5$bpe>Uhtfjuqk@1=?mWRj#kBcn0nFzwiur1!Y#R%FX6pl}<=!bDPBHdb(Oc_v2d|Y@J1148nX\
-m;{$f!PXjo;PeDAN!T3Nm@Ru~6ZYSRVfp+E!eh6jf5(8R+vW!-ytJq&bD`?NJz<P~nh3CVv40k!L\
-#7MM)=YY3?R%WuZrd>Qn&5u?t2+}8~c?RQa082{-Sz4-ya{;GQxH3C_k`Jcn^OooA9A9jb1_MzR=\
-j1t{H~l=*JdFjpOy8XXd~<RI(4j-t(a$A#_y8gAz!&n7NcXM@z5S(0!R_d7ewG~4@qn#>PsjazJ7\
->_|`P#(SJD(PNXG{=#X9JIWjl|wLw3YVGjcv4d9&LrabM{$o?|l0d+B<7blfAR(EU<SLo&kI3<w5\
-M71Dm+L;4HIu_BjLgPNj|Z&TmhIhS{mKcYYPb-nq%34`<rm`T7~Kcdl=vy>q$I9Gyk>&KrW*J1;l\
-rcO>>sdj$5*i#zO{f%Z<xFOU9Yb_SgmyJ1mmI1fwf#5w5+Z0|IQ#``d#-|&9;>#Ps>4s@?7`Q6~x\
-nQaqvwJKrT)bzi!+@3+|Oqc64``6i9)M@5*PWP{q>6C?Br<7yVPLCb)&+W8hz7WQax$1cP?3fQ2*\
-fDQ8eroNQw;9+mryLJ$$DDM$eRj-i4eXdBj-TCj%ySLwnAYR%w_~1TV8?9qw%?Aa8rZ<T_5M8UnA\
-;5On1AxN-;Vi)fgN+bxBYg^-y7I5@AtOfj`@JW9Nyyn|HF=Xjn0ngrRN<+X2;xrg56bfrtO%SA?%\
-pjg7oPpv168AeA?}pwFY*~chwF%=IO9w{!VAd9Bf1@LF|~Bh?hTs9dkwqJLbvb#(nzP*fFK}0l@9\
-oEVt%+EqQD|fP6;&1w=Z>CW7-S<QRU`p$Fo*4hr#RN3;8nCax+_t&0Zw_7m69cxdaIv`F^|0Pm9b\
-2=tThpaOoj@N!*@FrJT%<6FeWr^VZoh|m1|=5lr}O4?<_`|4%vKXDLOxV>)YZwh}thS+CUI*!zoO\
-(Hd4971`e?JHb&nSUI5(&e~Ut8HgTw&fgCd7ngQzQ;w6^Y|_{L_BY}eTK38p6M1zE?MHq()$(7PJ\
-n5+CdKn@vhE(J`tkv-;T>3wR1V2|HvQ!g;K1XSSM$B>KBQE&_G*B`I^wE-lDOPgGaUxcL&1Gn^ll\
-Qo$EFmXlZf|G@tlV|jd&k~<!g3cwgYVrP8d&#`S+u<yV_h8=G02$bxu5kXB^aThj|-k!~AQ-`2eI\
-8>PX;qICvdgUa>m*R#IMwb>u)Dz^m$WY~H)%IusL)!KQW8iGDEI#_H%(i8>vvV+hnS2<jMO^DdO@\
-n8)tMp>+%$$oqjh>^fdYuS(>Rv<~2pb(w6x`825x&pMmSst}jwN%)N>E`;AIs4ru7rehY*hx_Ga*\
-dx!I%k4kY5tow@XZ(2<-8(iG`175_l_K`4^XHzr=LFre?~a%len$*X&zJ5&7%ToKu(MypeKjMcbM\
-5jFpK(9lWjt-H&AaGQ<Nb`d-{SG^#^=Hr<$a+?=(BG*pYzIP=pG2@@87$$?tG=B%OX2F<%?dC_y1\
-^8__KRU?P--5d*(Z@&0biEv1fgZ_F6?ktFZRb(<$!3km>YA@hsEns(}&HDcV8|>9l5G#B}<oT!&1\
-j8G|CG)0J`^GMz3R6fvFNBGuuUME3wOTE+j-j9&472EY#CH&x~h5*;tn)sq3RMfhGP^8s29q{H`W\
-eLBDZ;V?m;4&%bH*(2Z+S6+7J_(U!rFY<}u;y=*ch2lT(i6Jf8Ue+AMXW$c;U#jtmLVNi0DGu0MC\
-x1P0-1e<#=Q3hFpQKA?74mx~@hroaFO~OgM!qj6CEQ*}$-j+wlf=(S!@2aFWP4e0zP}g$0Vj5f|4\
-5g<bkH@$f55jN?UC`H$Lx{uv(H-C-fe&VOSd+q_5*e%myGj&<mWbFAF1rea|B@>iO=ilUZ-Tx-Da\
-z0#k16so$Ne|6271CZE==Z0<#fpr}?#e0$&pQ2%+3x={u(5<MU=b&yU)XV6C=Osd*pY^D~U_8OQe\
-t@xQYQ*96!G=wdFXJ*l$9KE2XCUvW&kRP0xTXV4QT^Jh1%%iulwO5PKFsfIk|#4$nS$poGQ`RX98\
-O3-Z_o2NQ>w@t`N_`e$G4f6dD{z94G(s@)I_v0_LQ)Cz8RcaJix4cW(S)=cWbAj-#O?&UkA>te&{\
-@hph+(Y+#j_x@|_l$j;XV>=Q7l{AR$64Y(^mB&z4}HB3{tJI2p8Hv{kkmYq&wbxrVUA&r{!aJG`S\
-T%6f6KQ&bf#LE?@#~YJdef<c1DEQH`kmIdf%KVXX)o(?m(DwcpotOQe=9-vkmYpDbg>p^G$qrN<o\
-?80a!-blaF_W575?Kc;8T6f8CyZgZmS4-{)WYv$2HSH!bo<*}NMg$*<FS>f-U-K7;ejg6zfJ7au&\
-f9{HS;->+OJ-4XnFH?sDJYz+pU?9h8t<^HYe7Q8*$4y<SByz?`1x5pdIx6xV>=4WL$c9sYJzo#36\
-9sb8QefKR=Sz%pMpUv)b6f#bpzd;*~_ln}&c+U;bt9>#;;;VRej5voC%RhIL>lP>jx`sH{mY=(ae\
-f%tsjZd73Nzb|NrrjA+%XJ2epN%9fw+la)iry=S;|G1oM2em$&eP60K^qU`U+Qm@3GUOYufV&s{L\
-ktTbVGU;?TE26-a%mu`WMJ$*9aabNzdw{XJV#NxpL$ryPL_!Yay)}(n_h`nnKUI!!vy6Mss;k&dv\
-}TsXMz8&$hdW%PcF%1Wyj=d82Hux;Kc!GX(UWXy#M(jOAy?41@PM?9OTWjP@1WlL75tl26ZkL|w@\
-x+C&~cj`Q#@FeZS@I^?|-C{OLFmDNx#n!{T@69jG6z48LrP%>?7|An}FJG6}dCX=ka7uHc<{v!Oj\
-E<%SA=Qd)$8qbHZm9uk@aqZA_KGUP>_}zo|6Y^UAmO+kPFA&H3zu;#U6ysfMsr3B0P0;>qXrH9RJ\
-Ow!?*N~PCc{ldC6O>ULWss+w+J&GUfTg%E74d0VKC=a3y^l(G<m7jH;hdF%eE2kvo?GgIwS~)BU0\
-7KGYcH7FI6R95?}xRRcpSqZh6}3{-~FbOu}qTCjpMj(3~Me}pSZ4s_AkPBG4u{A7p^0+p*-SEhKM\
-U*bq*DGd1aBJZdj*$N0sO&J)^o9`e)|-OVjl?6Z#AF-K4Po5~XNIF7#nF+Vg&QF8T+&z*`PxjL-K\
-1E$^@)zCwP0mrJx$w~RO*&SPg6As(Zjrg_EX0DCrHxUN`c3yqUIZTj;BG@7S(@C_q1Wp<diYCKaN\
-XrMZ!lKOpOn2x-JpQ~H}xZ$DrmqPm%E$-VvnX;46JAh|MaXoq-b_GB4k-`t!oF?WOXxt4nTv0uz(\
-z4Q;j67^_5I#7H`lSKJ)ddX3L#RDfn*-nnc>ZLTNoDb0IM?uu>qngDo5eg2!)GbaFoqA9ry)q&eW\
-m^*Kgt$&02j0Kc#)^zyUoqonMUHQ@<#Mq1%XSa0Dq01XKOqt)I3)XGT=Qy?rB0gTx4T<5tc>0?7=\
-i6Ij!M}A#HP6ac>?wcL`<1IvyK~@h5uP{@TXpd=#UVjWCxJVC>l|W0UFpaa{1x_$UJ!A0^Sa;NAR\
-u&Z*E3yRf<D1flU!1~fiOqj7vM)9j=?PP6^{2hi-4Jmdk|_)>A765!)TGaJ`HI<D9_#21RIe9XS_\
-BECX<RBrKl9=B<7OUCWGC!vl3Ivz7fE7wA0@Em`cWuBuh9*g=s&SNa#fhjc2Comko18q?WoaPfXn\
-zsntPPBPTVcmdtE6!>Oj@v86U1^-=XY%<MaV?S1{4Kl=9P>t?`)q(`X`)h7QJq{_!C{SQXw$-W?7\
-Z(DkfF%0Y6r0~ecdGSt4sx9>HS5BzF#Hx9oicxaCaQc**J|~xe4PV`tp}>UWI*@alt*7%`5G<zym\
-wfIacCZ3G~k6K)z*{_!j1|N65GMIO-aS<HSi0AE0qO0}1a~$9Ik<?d&dGJL7pr?>4uGZ%qU~!ugg\
-R;~zR#G@H!~|A1D?fuFp{`3dSJWr%~tn%w!nv3|A!fLTgqDZt!G<0SgBGg!@i)w1H*z?WvLpCkTL\
-KYbwmIg67k^|a@t_%o*x$B=DBy%}^JaaJ;<TdZU#>e84_VV?xBW_o6<b6Ik(bJ?t13y%$P0#C54L\
-LX-zbv2El>Qjk#lsgeefd44MkBa#emTx@I7bDX1{L=+L+B~dJZc8EWLm}Xu{rXCZ6H%hC*Q=hwBA\
-4avMJn23X}k`F(=6(b2AzWXi_xySGZWS+D2o&+wg=;eME*3MA8=x48mu*v**!!w)(raL<B^5jcLn\
-|WH|WvMVb{|;?iHWke~v0-pWhwYN$lQ^IB};bo=qn1bp$yy`UJCk)sNNAS#Dl&MFrqb*t-hx-WbH\
-41LrfjY$eR*Xp+uC>OELn^J2ajo}MVB_ZTeB<d@gO82{L-qIpGckiDH8XgjC4IgG7ID>x393O<^H\
-XK?{u`RD_1=8crxT-=M0WAkn<Psv3bfB6K%Sqjq}Mx%d*G~}&#zibJNcNgC2AkF{k1U`4joAKQse\
-tz;GZc{TS({lCrPQEkN3N%#R2k78>KfZefhfjf!sl$X!1sVey=?Q&?eBCRcoR3z<Nwfm#K3b8^FZ\
-a>P8+~$}Z(JWpD`rkB)xAU0ikZ_yb#H%Kk<xv%Qq2B4i)X?ZXHq)Z!|9|p2Vrx)T2cH=CDIDUxlu\
-YX&!VvkPV-Fo_EK4F$qaQE(us7YI_M;{|L7~hy2^ZIlX%%AwY+#b@U-dbJ14a`94E}Rwtkq&;wzw\
-^U-I~HoGV<H;yoU<{Jv#(8tP6x)fGrv<#TdHJhdOc1$<&Lpgk*}mhh)5;#6@DKb-1=I8}|d*&eVK\
-H`QE?ZRPN><xu^Duggs}Q}JCA??;lb({`ujuEckV{9Pi)DSLO2<x~A|>K2Y0^UyZ}?|gWZCgBaF`\
-|w7(f7pjN!@B1>hfS67=2OHQ_d?=Dym7xzTtV>WQ^Xt0H=gH<5$SpU>0(}h&RP4_HkappCQk=;((\
-uN;5alK3v4zCT`0G>^V;zAez3%D2UuOY-oer=<81Zw+@%-`eW^OZrdVJ-s=H(_qxvQbvB%60|lXm\
-wkrNKBBljNR)>nqS##v(6;vUXl}9Krn|>*Ux&>_6qpFrJSEe!;vUep#E?IdHyvghmnXUHW(&38yG\
-5-<X53V>zNviN5=GXI3;VnE~sJPF&BNt=5bV?q7c8g2?@|CyesS`m1y<B0W#PI<=CX>4-Q6W5934\
-8>zXapm#k%;{|QLvmcpXBULS=zKax9#LZnS`P8qF@}m4i-y+_hj<H<mpIomyv%U`WOe%LXl^R?V)\
-WaCQ<NlP(;J4n)^eLn%asM2?D+PI55AyZ1G5&WVpse(tlT_fJ1ysIT^y?nfgFu&l6=ZY_@BhXYad\
-w`je_{OcqS40Z*2=c>!NUS=<=MmhZRPteh|E_0_64o8mH#DJe#yQ>?*zkp+_B$y4m7~3teCA~a4u\
-`b8JK`0{}Oi<CGoR=L8qBKg53jCm&k3&@Q&^=T^YLp<1}%-It%jDn#5fcb66}Bv{ediKRH4>Cl|}\
-b-W$6iU5Q<zL<4Lf@6r(*R`7n>2o~#vbtv=5p{GY^F&v0<_gsKD$YO|On~sd@bi4_CUkQ#EW38yJ\
-fx2%B_5YzREMm0F7LuChhqJY~58wG3+zEB;fOj??e~opB`!~KGF7C`wYQBK~c+cJY@LMEes-YhZ!\
-})nRFz*yM5_#++)j5@#ox_=Z5A*o;ELoT?iN2^0;C-!6M^tLQgy**gF?_@NE8!XY$9%9`#t_2dFY\
-&%FEb}$+D$MsM-dAzY0)wBl)`;+2-#^9#`jY(iEEmVsAl<J<xgo`KpuNL3hTXwoQi>+mnN1sSKgM\
-Vd`2*@&$k%J<n;iK5S)})J#gPGdS{CyADd1flr0vCblFXOSWN*TEl8m;T!{(x8K2Mup<U(4&x-l=\
-4)ubVx$GO(Qdwh42-2*k!eV+o~ts^Zivb2cDjknB#btk56Q<knW`RpN+L9V&71g{yu?WiDc+z$}f\
-3E(61MLYse!*+&`MxUw45fA#}EV@q&>Ybo06?T^Kyxy+j-GkaY3)*02@w+|nomG36#oy`U?A`N0Z\
-<zx9UkJa`;dd6uT5dNg!Yx``^3YcEc*a-#9q*22Hh*zWIrZthljp7Gd_Nuf_Wfw_KmDIr7q0u<ll\
-ZzBc>KW8n!gFxg7p3eMY0>s=du^(=Na@5FXYcK=f8z#gw6j7fAl1_RzbM^Fp9x#Gd)|NK$Y=LjwA\
-W|XlCOFy!6|jRy)q-J$y0Rcr-pq>zJ31@xjyvVo?+-H);CJe0BzUBI7IcJ{q*=@%5RIt)#S*;}Fo\
-=9`5Two{2by@vzp<k#Acznn0iOa(cvfm=E)dJcP%r{&kd=2h;GL8K=FV(xjwZXd1zIfbgYdnb|!!\
-m{+EURVWiV5AEXfmjiFJr&M;=J$Kf{$5in2^`p3NN5^w<Y$yw!mir0gA39q2#pkHcTx=W{Bm6VsY\
-<B&9LwUdho*%*P?iTh8Qwm8uI4b--lV9dU<_pHWxp86cBM|qn=5QWMENddk&-gLkwGx596y|p1D0\
-<h-TVg)-bGUA}&>_R?f|O2Y<a?)g;(dlW`Dm2US>z})EfvjX7PE#t`pZ#_UImYi`BCS)g!$WCoLa\
-e=+Ok0xggJf!^+GfI{~Xm3`>JA%hHLUapbxW)w*G#T^H%4wzPZk2-{e}d$<nRj?joogah&b-O08T\
-PV6z694!Y|r(9b(io?&_5!-`4RbqXrcUPtYPP!HM&5x0;Z#XuRVBT^eNZv)z!F6x<}tLHPQCx_QF\
-N~`B6;PiNddM*|9JgBQj*s-ymVOl*qFGe^Nb<@`~RMcbD)gx@#SkEA>o|=p4xB}`)74?AZ+Df!~#\
-CwddA*P}ob4M{9lJfo8=Q$=z=l@e&nwpQk(NFWI+PpW8!ZXGt9>M2h2Be>(lQsVPyGRYj1LE48@s\
-aTrfPZ`)RH!~SQnwD`I<6{o!%X7%V~&WQ3+}6-cj!RbJtH(9Ir5oHVzpQZ^xI%8#QGcq-%SW#(aX\
-_6_)4(*GsDE)ZHx{bKTq!mh$ardeGAfBg!)&u=20Hvi$j32o9$_p!bgX;bYbh>9_zb{OM6fK0POu\
-n3%8fY(0e;8(H7}}H97haJZZ#*xHg{BE;(fFq~)cu9`X*knA`eM2T0=kxW%2)0Ka+Y1N!JZ$Dbiz\
-8rKIbR)akMJkRkm<mn;uM3bQbdA>Q%@%xLJO_bLYm}l2{j<pwSHc|2IB<I<Co@0%a2jRi?@}yPbS\
-p=95Xy7%}dw$351_)EepVBH{(cR$~3V*uh=+9jDzn@#IA2$O%As<AzF8)!n9dTGMhctvY^66TrtK\
-t~iL%F>Ko?nM&j15Ga(#Jk~Bd2?)yED)Cij;4=0e_HThWTkM-!W!y`4(+#P^XhH-4XeivpTKP%Ig\
-s6)Gh+)c&Fax>NLJDy09|X-QSF6K}R-=eMM<%Ilx)0w?`8#z6N7Ub0xb2-Zv*=WkHvH4Ru*M$4Aa\
-{bb~n-^O%VHQ=wlu7vp`|bS{_9lg>z}<8iCKkFuChx;`sa96jK<w>JMn1Ij2SM`yXrJd?u$&vE+x\
-+%>?lf27u*1I?^Ii5DB(Ys>io(rQ+;cCW*Ogx%|4cuszCY>g+glf$!&>aMTJ>#+2t#GCOgtW%Z(U\
-tB`GW4|V@v7f`Y2EHGIUar`x(rxLf<i+#^^3}WorOVt@(raESvE7iGzKv9wqHR?+>AmmWyQFIDR;\
-Z&2_{1(UB;7@-(%*u#*CFjy_*TI8CB{Skf-qVJ@VS!X^%92H|KRDR^G!8m0<LdOHHQJ$i-w5xw5j\
-I!j~dS2+LQ0~gY??P#M=n(Jj=MgxES<ltId`5HRg?t%Yt!c)v&ci7L3&`>Vdh>Q?z>Oc^$D)P<AU\
-XyOqa6VLJ<n_v;^d|B0=Ne3en4Y=ht2jMNYC+^dCvo9~mVPeq<6p66YbXEV=(@93El@7t=Btc+CR\
-g7@^7RBe^V0eRzK91{UQ(0;qvihlWr`eZ#qTz}>H;$R#b@jNeu@9SFye1qkCHY<;Kv+``-fsYiq=\
-pD;r*fXAiLuJ4+{113FhT&C7oCMQZ#QVJ5ms!lGI1utrR2XbFn$0zP3JIPe<a!eF?!mk;pLK<x!v\
-YK^LEgm}PoTubO}LfK|6fniyJru11pV;&$1|j!&t)<M=XZ}dGY0$kI-k4OrMZ|wyuX(FH%05;B!$\
-6j&!35F;>tMc&&--fTsK4hhCka}qMz8uD<J>F(8t9qJ15hAE+DQ6L-EdObIpX|%&+=Th(0e3*5?Y\
-|=L&7TE8vZ5Nt}Zc;G<Q1Ja!4U_sF<?HSj%ooL4j4MqgR161zC-bB?D#$5|iqHi4FhXgEG}m4xHj\
-5{|n?9aX%JDha-mh&MF|uE!%D!+N~-F;dkd2(Cx*JU(21jN|%S9M^$Abdtw4DFD}pQe2-yTun!Hx\
-Sr>S>q9B7X9FH)1Fp~ExZa;VXJtsZo&mVt-vHOg67SBVQeVb$T*{Dey&7=cPLOt7UmcZj-Oh16L&\
-Ehj4A+~QgWwI+wKGS<n|(6gyvpbBRcS7Ai1+Vu|8lhc`EdPC3D<`b*PkJO!<{-@&(PueaKQE6=wk\
-s~Phq(JNr*oGC0L(d;(dNehwB*}*E1Nd`=8yxd@QdCdC-G+SK?Vn`2TB$OIG0Dv7aMMW8*TEejtk\
-gZ~Bue@_C5&8KlYryk6)aD35A~k!HGo0PEh$@pKF1@A8{eVwsm}s<Bn&0gh&XT+85c4a+FJOzkjR\
-Gs-!V0(F0^t9uA(PT={JDouVWSdXaxV}tsKNc9il_4hXD`ykRBFZvF0B5c10N%aom_4Y96_W-Hhw\
-{-Oy^>+ZP7w5Hh0IN5>E6DlR89Y(G4*ZzWio)k2Js#e_8sfbb-dBWp9}Vwc3h`cn_x){E&NoO+dN\
-ce_0r)FQReBHjjfUTN__e|>=q>5-N|pN!zHbiC0{AQF=Wp1&^?!x&R7X3WJH%-^)8@5h*s3Z(FSU\
-6{m901EJp16cEBqdUUn~3`g<sH>0CH8H7oe_ksOtr&s~qo%i*`JCh}%t;;W=VV&k$>Hq$dmLml!t\
-^EuKMlbaR_Fz5Cl9<@lShdj_imbW-#a`04<CQ`}2lmkf36G&?GI9dy2rk*bzPZU=AVc5oQ?LX1!2\
-cJO*}CpEmsKD^BCZmp_KBULmF@|RNkJKzh-1WN|u1$zhWJuC8O@-%?OQ@CG06Ve9Qs!Z@M!_qGm<\
-v{H*CI_%ztWVtb3w`{G?-i>3f9!n;d{ou-|GjS}WJ1EeB+3>RB`hismY}FXh-IrHprQgpNCJswYZ\
-5lsC}>gmSwi_MRjPp42Bj@OYc2GLib`9wv;|5PThxH437`^0ohTvy@43soJ1;YnVX?J#-X|~T&U^\
-RW<=pMud(Zja$4L*FZ^_qd=jwNk<2UJHP<ScJDkpK?yDQ;z>A4R*V|YgKB>4Sp_WS$2-`{4xKmWW\
-3ehcNCw{7*yuHp3iR?4HL_ID`{Xg9fx?cx_?)U)KwuKl&{jQOs+eD}1=KR;Qn<^#LB@9JG~cxd2x\
-tn@AIyP4<giuD=H7v5LrYSNsc*)U`M-QWk6g@rnpq|!k+Y4oiA80lxYE50U*vZ*7AGX3%xVOxlG^\
-q}^bH6ktPFJf*HxQ>pns*fq#NQC!+b|cJ#+WmNXUE&b7Qk`Y{BIat~OLEsp*GXPY4S#N!K3|*8yI\
-^r~OM_wbu6eE7R?IuM&g7BV8gvJ5pFQcoaxnG^XkS3jJEbmDH?db(sm@Joq{sAG*R)J!6LSyh&&z\
-6lUDJ-{Wi$M1G<{pBHJVYz`%yFeYcz+|8V>1^Y{2uiKW4i(yw+ti%5F2+IMX=&-q*HHggl#+)xI8\
-Ue<#Lre7AjY;2t{36SS_VZ3GVJdfX~q*3+FAR@|xjlRl1hS#2+HFUmPX+XTef`X&A__Fh<Vn+hY*\
-upMaRZ~uiAnaW>+9bRL9hc2wRku_f9p*z;}cl5%F?>qdN>&!o+wI1zvLQ2I|hF^0{WMvR67Q$ii>\
-w6%KbpKj?pv}PzgPXPyt_W7wLt%)JjUVdUW2yF9XHAyWPo?^~Db>~mJuph*ygZp|+hfh7{k|zF70\
-*+g`0h`s+O{RK^{g)kH+`NXr87aDldaG3_3NiH&k=o&b+ESGXg#%wbIs)$_m1__2+o|1HSMWb@bh\
-*fS=%-3w#l}^kAu@95C@0$dtMu?Y`9(0?)3MAL-cX#99r66q;fU)g(xle)DiaPH_Ue<d@(*ORJcL\
-v3?fsXl<M%FRJqp_>^$^<F(5g)YxVrVbIb$uR<e}d3hlKDTSuj@(oV+PkMfr&u{~(M(nskmlHSRs\
-8Y2k(-QK}!KQc?^?>^%UXG;5G^EcW}KYboH+VcA<jMr5deqEw=fqSHPu;6>7v?n$-wQ;-G{93AIJ\
-ePe&Gu01juMJdJuVfWJG|uBTdHM3=4UYztSxf|HLhEz3k<VGFQm=>Pz6Y7D@B0rXb#Q8gZMxUDU)\
-P;@Sr6mfOq46NH-V{#F_-GXM=a3Zl+ME@o6954v%8HlHgWx)5_Wc8AKBXwo*&t8Q+mf(vTgict^H\
-D()-57TG*&UuvhBSKEQ-hGeWNqiE&H7M&ju-ZBuqae)?B&3&Ipt%PV?O1+bpTO_WwehJ6z2J@t*R\
-m5a$k`#+m04oyQ&SJa%Pgn_#q!mP!Zje1-ee#gG4V`e_Vy7I!zsP76!Qzuy<jf@52q;kn$Q+7R({\
-KE9>1^MsCBtkea$)972Z{{Br4eMhQaCZBda7Tnf))}Ziqi9c=PjAnfvaw3n+Und@BPs->w$ll~au\
-FeWa+oLq~;Mzu3+O(yZzhfn)y#F`aVY2xfJZj6Oe#gg1%Te&?2<gGJQ|E`n5A`kg#kE*EDlUGh8}\
-09u$h)y`6k^<?I^UT!ttT=hLS7DV_^ZF;W$=fIy{Gy+Ua1UsRx;r)tchj2TNrlmTJOWH>PEHF;|Y\
-fGMEhL2O-or`Vpr>Zpz7Xg{B+b~#(XQnoyQ%?`Ol0UTM>@W+8%!c>5M8{{0(Xx5wc}jPm;wXmd59\
-I|LtCk1znuw;s~4c5k@F|S{e)b7-OH9|4tCP2+OaUkX|=3Rp}zQ)Ep#U$h}*Jq}n>83kNpF<v5`7\
-Nw)PGr`CUdi`vUeWm3;HMul^!`fc~iXL;_m@l7t-X8a($Om)}5CS)pAUlB%a^`j1%DolU!?x3czb\
-@mMU=FWwW^c-^113%DCVx+wf-W-CTuxG-feYA++Jo~saOgEJa;UCtx<h;YVFB?g};%4WFuMx@s15\
-QH*cwe+7CEuxh5q592u4kOp{@FZNfJ?cI-dSktS*SCINfwNkGL$E-`BEtlI`+3i@U|lhZu?;Nhhp\
-tPVU!9AInCp?-PBK#Y)ZP&!T3kEZ)ES562rolHR<KIVNK6<HP1D_hdTSZFm?o#-fE>MOY&q*D_Nh\
-m8FqMt9U$sYD}hZ^OT3tZzE{g<%~fA{Or6_7;ZWX8em}RWvD{(y2cha4`Dv=Y3G4{s7s~%W)R$(g\
-u}$C#ia*r%`1a2RcDU}7{XBKa_NwPu^sG&gIKq~Vl4B#$`D(=?(+wrQJutB8wtV}*@O8+Ko7kJ}U\
-e}N9jx+S|Is_R*t_;IVXWNeiYnQ$mtK`;mi_6;dJR_!F&H>`o9D}Rh%|p#Glz!m9WnOR&`)P9?6w\
-jpGL+-Xr%Ekv(+wL}?X?d2)_&gRt9Yee%S7{t{if@)$E7I~#E(_dyI1`Ltil>z$o+L*+UBkr_B#$\
-K5d#0ri_wa?st7G*VR`_<;O72NDX-7xp-<JKGWt|}3y(iAvXgd9Whd<&C*%(BkCmzEhw=WFpH^}^\
-${C3y)kRv7Diy!YRQ|gH}bYfc$dRfIq=DU04nip$*ao4JL>_uAl8XU0hWw(D*=GXeiX&Q?UeM#LT\
-p>fQHpGKaKv!*d`L-n`4d4$;JLB745H;wnJ)0oejPNP43V@)wO#G2wWk3>GEoavfU3u8^GmFn;B|\
-60x=2|MombGWW#;%0`!vOlL|MyPQ;mF*_o>~+J~?pPKat99JJfd9eP^e*^Xj<??o@5{IR%XlB@*a\
-SbZDz4T|%+JmAosQp*=P)nb7;ADqdZz1|!Rp8&V_tE8gR}=<{gtdEF~RD{>6GUgrYTsxo&VK0S8p\
-+=eUUNt;u+W5(^yNOeUg|6#~a-bv~}V@B0TC_sji5*lYtRK^_J#7Nx|kzLDJMKlC@Fv)!m%_LhU=\
-@n+qNLY#N)f4-2%twz!_7HBpwQxfY`P&5jYQ4R?t^4(t)(nt*>^Tzl8wEMC4R{iMbku+y+}WpJ70\
-UoC5%6S**qonxv|X9>IfNB!mZJL-dAcZb-E=qJ`<^?6xd-x!yy=apiuN@77!e<AjVTgh|Es`a{wN\
-`u~;5%_zwp6<tTp5Z&tipsWpk4P)&-yq%(#hljOdzcxbyzY!}PoYl)_3PqD)?$KuN9n%k4A!eIkD\
-y(AqxCVuu)aVa9m(2hvy0Ar?bP39Ywi$jcJkMa+w6Nkw)fv7X;-nTtrYv3uIpmY4fSs9S8^Pt`b_\
-1X@s%8()~LR7y!jh(U2gtHJ2-aS_>HzO#CT8kK$nT|8}GqUo2gO$%ssd+;=KCcwp&i@UA=b9-1hk\
-ev__mP?1kmt4m}&Feh*i_N2=dr)o;>WyiU5scuenJQEi*tJB|I<YJtBi_uY#6nKE{8S;e_;xV?!s\
-AlfhHu`fr`&f)L1Nc>^$`^O0V{V76!e^q+8k@(%iLSx+$uKYTMHz>{@M4j48`(|-Uwm@A;?MLNhp\
-I=Dlu~l_rTgGtdhwN<$2S#9X7#L3`e$^O_aSgu>M*mFuK3h(qj?x}OI;(JTjbk#yr?Ice&!$sKUP\
-XFnUpW99h;$RX*=H<L9Q{=|d;Mn;NIf2nThO(?JPU|${yyx>R`$g2o=T_C^q<&YhI5|c1^NF+Ut4\
-!j=bg?}Si|i+(m4#hxUHkqn$oQB!|1&mziY*qV`6Df_hlgLS5}a{VDet4y|i9)SszRBlO8&&cqTT\
-8&9u|bx~H)1-1B4zzk1K~+q5S3UH^{s?tj^YY^~+$V{~RM+GvBuSuytQUNz5-!Sih_5I3Y7x4$7<\
-a~dOP|A_p*s`R;NK0)<rd%awvp*=I&Yo}*~+f47B=hG#v2*1y?lbzmq4Vw`Uwg0B(8s>cQWploPx\
-PQ;2z5umfN<-BsiSt5v{%f%LW03O*C|pX{Vuc6G!2_Z9Lb7Fy+>_kH?Re=q;k{hUgO5>v=5ii8$W\
-ppBX!~iF#w7?o{}FnwJoI^ny1i=M68h#t<IKd{-6n=sczLfd0y(Q?1b*5_um-Q^l>f@Mrt4%IiAf\
-@D2wKD~jbv>9Cie<fI&BX^*gN?3fD*&&d<d)?q~+o;^8)R!r<jXLjPq*MPArtmAf*?2pw;P}AxUR\
-PT(0_(I4<ii=>pKZbUYs&c)rn=IJd-zYN~EF^f|*h#o4T{hSNcamHG$a>O<QztPgRgF@MtSDAF~r\
-xyD-G_!Ou7OR``b(qaYZ>Iz;#_PS1=XQ1S(Ar1C#(MMrSVZ7%PRpUu+pK;Q|W<Mc*e~-O54fX86_\
-tIai8gJW$kv-N%jYR=jDmO-ABGEa&V@L<(uDHkL{C<Y-elF+dH7dTooK326HGc+eVg=z6Zg`6At`\
-X;yck#6fm99(Ji<eS;zeL%yC3Ww5AD3s(dD!qL=qwh(4D{;$yPI6MC{7VJaCL12ezuY;F*cC=x4`\
-gAID>>Scu?4n6ORakdz!D(BW2^4KkFp%zwwOHMR=TqwX%fkH4Qq0Ue3)a>`YGB`S7cB_)QtQTFKC\
-rp9zfZwuHl?zrRSeF_H`X=OsfH_uKd&t?w(WQ~k|9zqZ#xX`CaS>l|*#@Py~qiEM9$jni%E8cP=O\
-YkL@h|A9PON_Mt!R%CvOAFpW4RXnS|V=U^p)wn*Jy6r*Ed-2yvw9Sq6vP{I8HZf8rZ>QvIn%C+&r\
-PqTVMm{I0H6?ma=^{Q+A4O$4-oO|k8##Ke&v7`Am|l0AIy;W~0KEpK^}p%+%hVpXNDtn<fx1X(`o\
-z!&zxkB8?kr`p3#9E)qxAF^XQ+@3h!LN$21arGuZrXE>f9dDP7;;fyT$^5-}a_XI`w_<H|&&s7Kc\
-uY-yV|APgQkUV-p3Og%fN|>}#hTU3h)TaaLsKB&zcdw^UupDiV}jE1t#R*=2H%)1MFKc_XO(U@Y5\
-G6<fZ=?n4`|If}kgtyd$@wFWlh9$FhrP<*E{>Vx;-@k2Y9UH(t>runhd9o0N^Q5{v7q#HyT#~pc{\
-*|u%8PBIhUU7^EPetIZ7KAMXYPVP*Fxk}%>sn3~cC1mD$e_z{*y~t0BJsf`@H&)1F!=Jc<%ei)26\
-~^yFg%QtQJSOZ4?J&|*7_)mjuzeRPoJ8<g%T?MoQs?7UM_w=J9cY^ush;;@-uUcqZM)%-_}R5|Hc\
-%gK<5da$X<1H(MIUOM1r{Jf1=y?h>S~V9S_Tlfc=7)59`bOzZ!w?KSliBcPCQtrZMj=XIo+e&gas\
-KF_r_xiU-wA0F<+}TbY;TLgZz7E>g=mK<+=7kURg-vu3>L7#%~jA>SZ<__eC4+$?9kg>eqF4{Uu$\
-{8fMo^D$kD;Myp$5L+#PF?NvQdKQPw3Ch(!9jv}qkynx?7uajr_+Wjc2&1<VM%k1?fJ-3~u$F82T\
-kB?JxQUCf-4B_2(^^rar+4NIi-|nl1N8eKCt`WYk9D}-uvlpsc>NY#wmr3WaA)foS+|W~w<pSGS*\
-rZMKeSA{c%~N{uTaNA1eF8h!WrxkxxeYtw?eNE{@C#_}F2bFLd`%PiTI-j8WLV>M9^q%#N!j=AQ1\
-wivYr0tLrT051P3<%fRa#Wq()9Te=J^Jk`bN24m#b}-5N6d^(uSDQ`ZmhNlP-1B=^Gkf_SVTdr0v\
-3Jjyt14VDa1Xh|>Eq<D$3^()xnJ{1syx(obU>rGM2)o8Qs~9qpyJoG<9JFUa4+C*?V^aZKBp8M1{\
-@uImiUkpS7k(Wg*b@u06*=f^>lZ6`sw`=Ab!{Uzr3wKMfx#v`!PZ}W72{jqApcE724%P)M6@i5Gu\
-=}&xtIxN-3zUc~|Eq91MMDO>~{1NYHp0?Vj_bno`>2<TnY<jirM=NHZ!>DaP(v|JUgP*B0b!+eX8\
-|USFp7@ONeP;VhjGbH&Y@Xw3v+W<G?-p(yM9=5Q4yPZ|aN2e_VfKiq4b=3~{b%rbqVC`0$i80S{7\
-USmKD@a&dr{+$QGKSf8s)g5&T6Fb$<W0OX6s{O&IYat8FrQmv)F$gBKqmflWN{ad4El|@01Iq>@}\
-C!nCw^3xNod2inCE)lWWIw)f{;-(`!}^`^!Y?GazHZ{~cQA34P{|dy$=+J;qdbl30H_onoC0>D=U\
-#vOMvN<~p|BeU~(v19nHdET%e${)XgS8VAJr%!!0y%i5MPIhP~3_F$qo<5Bz;=goAJXE@Wk;xB1W\
-uBTdm2XD?N-t<&sB*v>nI_;gL4W8e|73oUp&W4xQDPDGxa`Z#yJ~#TtZpJwh<mW!qR<@J0LAXolZ\
-Uo{BbV;lHY<l212Au-Wn!!9lp2^cm>LfV(I+|Av>lOT*iJm;jx?Bi-sUbY@9BQgZ1Gr3cB>f)Mmq\
-EN~eF3vS8XrM_MEn}VJk6`GWW&uhoa!snhf^K!vNPAkoN>B3cJanJ5NIn)z7CYNe#63?1EKizQiS\
-@-ub#ucy6bV(SJ&Jj`s&o<XVX_VtOzD6o8=U+ZgwT<bECc|v*Dq}L~U>D<TZs8&jRhI6PRuPXY%^\
-9r6Km~&t^R^0(^;<#@f5qAMC1hr0KcVqiPiPH=*--);e+WjEP8iVD3Ns0rI4_l_PnLa0yf5nqK2Q\
-llAj|$38-ndVFDIy!RSH%Xs@5Ld$rsHb@ySh6TZm4YfChusz+=hwsofR;_H^L9up(vFgYdHhz%Sk\
-2;`m;MKhBdH?#Evil=_sgJ&BENgaL8eC7RO@w`yUK45_seWaXGEwNYgv>_vdV%MB>vcxK$3!`=rZ\
-X9)>ajjiu7L~L0`g3Dt(woGzpd8iVkJu58k(2AT#B*XC2ixI9ai%;_<fz*e#QE!@aOf3_3T!1J^Q\
-N~C2yb%Mlt*R1(~MlKGLBaujb&DrPI^K=yjq*HD8Ri*DysIz^@N#<eW;|t?RRXT$qzC>nZK-#JNC\
-_hl*94t<<x-drB-8aW10n@9=xB|GC8Mcna?q_O#_dIfezE)!RtlAWWIP(1bnt0i~n+f?9*sHh{m4\
-z&4Y{8PVocd~fP7ke9z{TP?ib<*?P-WXR4xKTGVBxLT>-{J^KOA26{`wlf?1<l<TyuR~*>T&VB}N\
-!R50?qP7K)Oh!2!#>1YW3LBStM>T)TB*ZEy!@ksm*+jy*oMJx=SqEzUS~i!AE-UWYd*E-BE$oMje\
-@lN_?XmB)4c6bE7l<ECMbT8>`9n8-Tb!2X8#a~ukN2$ApEDg%XM*~=hjZ!Zri#N=Y1;qUV2Q<eZ;\
-yQ{Eb6D*C+0c$H@Ov%*Irsxl6n{Usmr^RVmCZIv47%U#b0{01N?RjZ^ho0dkYx$B(tw4E?y@O^i+\
-Y+h8`>LFbRIrsW~x_l89ddvK+9L~C_%hOWt4A^%8Q@b`PD{wdbR=xb`+zqm)!d+QyJHNB2<E^OI1\
-^@z}xJ*a+e<Gm`4r?N-Yd7*QR@BZ?s(#=%(D0|J{$ipAZ--${_Kpoy@Jg4!ev|7$NK1O<vBHu?)K\
-MyC$Id6^fXX<oTeoA~a_HaVX|E5>latftq$T8VQs6Y6F!tlAKp|PH9hX)(?2fDAJvkRm?3#;AWw%\
-0*O4yin0_dB%b>h5ma6|ObjQQQBOl35xIy+7S%{OiQ3zq;p3d!1O6e~euF_)MMmu-JGXvYs0Hc6X\
-nkJWGAMv2~IUp=2A<r!?(GsGWqe9T7Mss%>iAkD&6Wp~KfFSp23wr`{{oSZWGyq(AK`8t3Cly~^o\
-68tX50U>Q~V*Ur)AU1pn~?knzY>)h)4S*hytQ+O}dVNfUYx;yaHVgqp`1M$>s`GD3q+{vNw)P{X5\
-Wf+a6rfnXnoXGBRQ3$)o{3WQPVPs}4k4x+>IY)0w-ge@xvE<-*YagpI@T9_9`?LwXwTHNU_9E3=U\
-kKc_la10CT(4Kk9y4s&<9#W6Y~`|EzNs*LsPCupp)}MG9!n>=rbe>JHl<HX-yYzBGF^Zyg7<H88;\
-1=O-<79}r*@~pQ`-~*Pi?jXPwn<lcxvCUo#l&1ZM_<eYw)L|vVFE|!iFx`Jbc5^5IAZ7Mq5fsV}r\
-}qTc-9F^R9v6;Zpsp;fHWRK39G1xky`3eaIlXvZV+o&w<_6;$wSE)7Wi?j|SrBI<ea_e;9mD`&rl\
-U*lj<E&^G9v2>mT;<S(?W@h~&6+v4r@X^qXc-1z+<mwR18*9!c&$9PBb#r;g3=c=9we~EH0;1eYe\
-e2lt&6z%&6`iE!a{L+u<*5|I4kKe~3e{jej=)=4sAK`UKT1Lo|=AqVZK4Z_VdFJ5pZvw-^Tw~oG1\
-Pd*l&i*OuS@HX$a?V2hW#Ad%p}l?d%-31}o!DAk4m)J;Na8;o94-Fs#nBqv#CV{`)+)tM(+=dN{S\
-A+9v+T7ueFi4+bVrTUyCuIP9cv1GwS6Mqy>P1GQU6?IpwK_Bt8U^PGR^C!&k?ScDT4&yYn{g4NDs\
-%leai^;Ms9(huWOsuCv&bp#~N$!aV)sbP$ca<QcS;K<M)T?8(ONq)6{{k!t*u`9cb{h$+huwhHn>\
-2Z#YETzrI%5Vw|&f_aBVO*2=_W8z?c^-mE@7Ot$ae|IK5vQGd!Y<`6F1nxl>9=>6{xjhUnERyzi>\
-(RRoj+HSSvlwr4uv=p8Sv`Z~BemmujEaM%?8=XyggVu1Aym8a1KwDNXeut7jOnX+R{Bh+e$NER8G\
-xvDlnR}ryU#X9dVL{FoJ(E7Asr`%)dlWl_ZfaMbajvD$zjnvv`j<J6r#{Nl0kj#LazxhK<>T({NB\
-X_3$1Z$!GxhU~cYCvpOZ^B6kE6cJ_`E*Snb$a9lqa!Ht>$@ixO_(K3g1-Fw-&yoG4d(e6M(-NPCu\
-Ylru6HA->2YrJ(VH+P7dW4)KwwBapRly_~vPR(*g6ptGUt(JCD^K_3J9Cbi&UR__>@*T`#E*=oM=\
-qWH*X2wwB!D`?alV|K!p-V$*$N^;#n8;}NmOHeJlmZxdr<{89=_=m;u5I^Cp;P2(q>L%WXj^l<BE\
-E<8Jgcq#24a(SM8+aU4P81d<`xKf<MO!=DbJBTodzvERHe!aGKGGElz#C!nlgwoIk{*qfty?wo|O\
-?_S;<e&DPsP2r6x7WN$_7LkkYQ8RXKgD`UdL5N7jr+6)vCY*uObRPgmBV{lZxr7i#Cux*C|C1GS|\
-gx6&Q_#*GE89%A}?nAF^=?nq;&p*#kJi$f6Rz;kHo1P=FHod+BP9b-pHPCrmFKk(lIsS%Tn>h8+m\
-w_h0eo%^*!wmbP#7GOB@O+muC%}Vjb3>9AS}t#Y!XJI$SeNJ=7kgnSWjOD-4{zQ27`3j>tRNLDDz\
-(%lr=umj67J|8_>2pKzpE)Ooe{vewXr);hChI`$fQ+aPpn<Bn8uQ|EZPD94!&UeWV%N4z2&{2t?$\
-XQ2uCfcSuLp62?Da8L7UFB>k-%Na=LJj#CJr`*7d_NEWdRXn>`?*makMQ7M~g-%NVKgAgy?WCUD<\
-EL!BRFNmuH$No$<~JUrc`~ir_u=tJ`m~VyO%HLq-_q$VKc)7K9pT66vwn=U&sBaal`X>UrvmNETQ\
-hX_j1CK9Yz*#v+^cYh!gC>6;H6HDWk4rpxzKxzm3ogUTJJHIZTXXB@41+M{JN1YLpL&B=|;vHx{*\
-JB@_h26)|s|6(&LXnzw8(fV`Hsseh(rq@5hS0g)Q2SdL4NB`vx&z8|JsKR%eF1+#qyJhv~G?`NzZ\
-5+9mlxTYr@JQ0)khY<8H&2q3u$&uKkjjPh%S*V7T_I`~UBzm1prAvzxYT?ZrV-#OEv!upYs4xQ#-\
-g-C~eo^$xMaC2=zkGtZ06~z0L*gFbLLm{5cbO)y4VY#*<+p&Xpvl{Gqwa(vtLHx_M;Pu_mV6Rc?^\
-vrYk53qZ}^T55n#&$v^cfF7HcL;g?Al}X=wY~Sz?hYXjTLhLG(xU8Wsn1F!em4v3-zPT+`*J^~uJ\
-Etgd~bs{x)1+e5dXBMPrT{m;0-;$ESP`An^r-1bBV*h^Q<kD(UySy><~73LeD-^+GS{2i1r*vP9a\
-$?8Sx0)4eIw59tO!zdha&fuzw=kJNov0vge4g^;^iEMeGH%l6q#<J!!0wd#KfkHVz2o`Eq@x1>Rr\
-D<vvHHX=}2`u$M%>(~U8Q{0dosWdAHy@yaP#wthV1`dHaF;9XB6o(s6GucPA<GNQ`!cCnUY?#DLP\
-<6h^Iwu=5eZ6(v2vV3lwA<NgcXe7%A>KS)STc_|=DrH&J%6PoKrO20GwpaD%*;8^3=?tSn`BC$O3\
-JOce`eL66VV{zHj`_`E=Ql1b&(DyuKfYa$Zx09gc5bL|U1~0XFvMH{VLXj6+BP%}BU|gWi8#CX%<\
-$Gh=B9MtPBxFcd=g>4G^C<F(Oke;N0n{c%s6ddsp=^FUP?TSwd?4UEJz(Cy)0cv7j^O1(UtzS`{}\
-+%)Lxu^Pu~RC^u`)>)YZ6-Cdu^*e;;nv(c6u9#F;j!s=Xt>p6=`iYxP*1XviDLzs@(=Dwuq2spT6\
-ZKW07ub)&QNx=CB;&%9|87sS?Q(y~b}+>p80YTWxsHfdr`9jDh0;7;z&D(I}WE)nRAQ5gL-CPYul\
-E34D%co!PF{Zej|Yk7ogC3Ftd+Fm4aB*{3o)TF97RA21CcHBbo5GF!`_8%VvBOy}!gEP<pcCK5BH\
-EZy4;o$(?)yC_V5$fw|dGhU~&})j)E==lbeEELEqbJ`Fj*;<Auj3{tUNE-p@?>6qIofYsN}PPxuU\
-hM0oc{XqTD6a)=K@xJ`rpX5Iqp1XeRc0XS=44j{T*%by}M$K*uU?BzFMy52s=fZBi+ktJ(g`tD9(\
-oQuYF7tbEbEaq}}@w<Jmvevk&!moHzRJ@5;|Rew#b8UljAQrED#$9Yq*6E^XJSo+JLtY483rX)o!\
-2et^{uvs8V*Oq@@+v~p3Wz;9n+wHI5YqcWYa50+M6=?Ei})n2GDbm;8%^^`uBBMjt&(!S1hi|<+S\
-{(SK5{6Ih8S>>Wze0kSAu_x|tzdc^_=Qod!UGc^7no;QI#ahiY-)ekYGm3O=&%^iU2|Nd}Ciy+8T\
-hn}W?tS(5#2(;MZ4*j%<DL(0Ut!yW^4;iH1=hj_#3%47AT!l;BmIh-#c!c^g7B!FeX22r5awEU`J\
-{W1hFql4gEUqnjbo5T(mD3r>3Lkli7+=TQsJ~y;k?2s-cgtt6wb()@<~MqN9ZWicf@nZ8r7FjpMI\
-0f7ms^G=HX_kb4KB;Wfgy-a1v?WhCHhDi|-*9V~&k{A%53Q;+)FvNbmK;GZ9Z5($~pHe5yqHXiZx\
-10Ddj_%}7$VRo$dM&{~(ZdxI+pev^EyEQNh>FZzIfDh{Mm<gquU?G_)M>n+kqcomdJvN!InbYuDv\
-wrt$e{yL6JWE=-ZSrs+o(GOkA>b@X3Ej7KaY8djS<Kw)--=<K90&IF~8-63l+MCfXZt^ut(t5_X_\
-*jy?r{k<oR9~nbZ*WQ8NgZQ^f&6@)XzTxwO)%BFV~IBADaoGocTC!FvgkVW3GT-7wzl=7ak)FI9q\
-Y339;S1N)o0k^FGc;Ty;0+1xD-~Zl4qDGS32*_^UOaJZCtCJiL(5Whc{@wVZ6qwXv1n3S$2G4{jx\
-X7-$s0Nb`3ojGS3WOP4DzAeSXkoGR1}R+Cp(XpC~b^hWIfsSnY!`x-S!B?(ph+*l>TiF=LmCXLs1\
-ol<mEIKA*vV`tX`N(uaGx$Hk+q$hhaH5AQR#>ts;|iI^vM!q^(OWKZ1jr;q1-@6X5kO#AFOjmuPC\
-HHqn44nMPO&l~NYIeyspkK=v&)E%dFSET!m`xB*ZqHIUqd;%vB;dl^EF2YGcIDxvqroKaPy$w2lz\
-}d!S_;Maa{Xz{><+;eK=K`WU-zWLO5kGw^+pysmeeyo?+v|ZnxpmJSUlRZJ@yarv^s99D2z!Uo8Y\
-=pWtVDIDEXw{BSNSAwV!*kwOVxUw>bq?Ff*SDcb?~hQeCq?g5zp?m$|qf$DCJpwmNb2<aY`tSRQC\
-raI`l(cqdkx282hY%Jv+kWdRpPQ5dYR0xGN-IIP?9OvcanH%P)u<e8>YI9t0mYfDhCk>$a+GJ9N9\
-aw^{k51E|AYMP2P8^eL%tK7jgu9z7G|u`H*1gnp%{$08gtH-PMWpdZ`PGEt3d;+^^i{a1<O8y&ao\
-YZVqjyu?B}fU-Dn3ET2@N6An6MvrN7Jdj~d_hTX(yug@uqk(bb&#R+OT|@H&v`^I@mx_95@MAyXM\
-qj%{^I~5|n+N`IFiwx4aQdZhaq?ql$Hsgx%Zsqf4qOuWT_8_7NuG3)JlWh)j%|m#1@c3T9q89<`l\
-&K^w)dX0%xPSH7X5D@9=}wz^QB7>W(~qapC<7O$e+MVid(w4qa1G-+D`o)<Ip!Z#xWB14?*<pwGK\
-|7U);YZZqAFx<3_%7yypLqmR7PaJ}lZ*^EZT?fifqI5K+!Aj(bDQ8QV$R5WgR#`!C`oKRSN(PROF\
-c>?Ba8S{I1M8Cri7I;>R2sK<YnYo78q>eK5D3Nwm+qy7E9LD_4>s<V@krb9^E2dG!qb(A<bYlWS+\
-SL~+*t{JJdW9o;|*H$vQKCks;5;T4a-gz!~{W02WI0AQbPx+*AJpQ&m-NicjGeI#@nvm(A3^Bj?N\
-uXYa(1VF&Ubj5N-0>j?X1|)(3Hy2BKR(FZ(WpOS-tpqtHyYWy$u(YjFL?v^k=Q`qppHHh6hnc_wR\
-2kI42m6qI<XdQZ5`V6`)FH-P**=_C+GduiK@R(48WLLO0piciM8nC-|V0;s1oIR2aPA@cN+wziv6\
-3$mU}VQ?C2n6RcgD{>U$wW!k<3R-q>?mdQi;`33sTO!jN9;z$EylZGBr9x@<zfN9yedlzF2%bcR^\
-y<~~NVP<X2605|fnYNx(c4CbF5F#qfbUc^*Tf4`QnRxl<#g|TM+B9iZ?`>H0hx=U*a=VrQ3pA}p+\
-nbtfz`9>Wk+?(@#FPEO5M)QDNkH*Hi1!Z=#@8?=CSNK0q$kuI+Xd5cbxoCdUOktjhIe>hwe+wMFC\
-)t)A8ix(f@{cw=O7b?XImI#L{c*Nsrhh&6CSNw*Q`}2FrZwoBY>d6f)q2_EXeUo9_mk;cmS~$wq_\
-I8e?v1B<bd#@zwv!pJaPyG=kBz<JSNwBkJKcXXaB65?Q+=77OMai^<SS`Bo94Tg+@s{&;yRkAV6J\
-=+bKUnb7d@nT)zjL2d3*SSd(UB;hXI&}KVmOpu3=*_E@dy)k<QZ6^cSms6atHp=8~}rixF-=7Gpm\
--Z|Onh)lbP%lY?L}j<R;wi1}`!Z)2!*dD)9^(fWzk#u)2{aH~=k7GsvRyK+%S-$~NX9;W(ugi$?A\
-+6TqAS9S$>_H2!;U%EcE`<QS<&hz>4yImbI*X^)*4fu8arwxzZs=lLoHvh1!XVtf$&D;XoOksLWm\
-ingmebn&i)szPH-j73$ut+XgO7>XY6fYEZQFlBWe$>u)%`Ix2q40Y$5${dJm!5&&E%;Q`d0mew4)\
-l>N@caU8UqCjw=$8xdjBq2KJ0k1xoBBQCyGrxCla1*|w!8lHw^HdxKYPok65F^&VUtrjYCplVTkL\
-OzU-W;Ue`2&#)Z-zC$<ANfp~$kO@1-5{`DtH$BKHkwo?G>lCHk0?N2I;l8uUHu=J4H5ioSb>*k`D\
-};|9!guSZ`Qqp(bF@VVPL^z4;9<<Ypy7zZxpjj_y|>O&LSMW#<^_V*VaRy<ZR&*vXg891<jTrPwY\
-zo8!TpwuI>ac*cI=PC4`>s@l+;lzg$4@}_Q^fvHrN;{`fe?WLQ&lArfXICj4vNe$3sya!$o6VmP2\
-3NYkr96nT{)75W@-Ef0L!U_9&Etrts<(}?ug^rGetU@jY=!B*VNA&M!XEtnR;r&t9nH{oR0#X+Pg\
-I$Av+;2BnJYU!k^1od_c5&QwNIpdUBKEu@>f|pEfD8MtpU|sf_8Ev+j1Mei&b&vexh|4$8P|CrES\
-<H>2-ItMcp{Z>)^rUgL{Kw0|(#pB>SpEYToVFmx`70_1_yb&e{y$TXJt$$Ukp4DBKv6@9nfMX!x~\
-*fH;k~ekX9^XZT)hQ2m>V>m_BoN&C)?!Z-Hv#d_Q*!oxLe7{QZu-!sm$bDY)q$n6fhIzy*I+hS`h\
-^q2@S*bh4N$O+db&MBvpUAWkbXyOd1)6iMg`p-?(6({zKQyy#?C=dFvZ_Y?2JV*N*X8mqT_SL$sy\
-8I8sM*fYdlfSyb?mHuux6L`*G7~q&X%iP@Jyh2>8dtt-W7n4rr~@^kPIdM5tyN)?zQt2=pYoFWhD\
-Xbl?Dn#<^RE)NylnR}#b46FsBR<s%@oqTjbyFQfpu2&A&uKJd^eu5(?Drj0C_{;sG+SciPLhj+*^\
-L<u<e)n7NHALZMSb4$9KfqcrALY*T03F+{%`dsXeW$Avt-5Ehop@ax%StjIc+j-_V#PT278vvT;1\
-*WJ3?4(q-%MEUi)c9r$LXW$V$8{!p$fke|yxFzmh+?sOMJ2Z8zv(y{&oVI}B2W+QKJ7_zj$+&V^M\
-YKZbM=DBN?J*>TMDfQ0<rd&_i_IB6EzOqW;P-q)xQT|U!`@#G+($@3kqZDt`^G~zAE)J>#PV1eX4\
-fQTd>f8F)h}D@qiFR5){!n6@QvDb}b1#hNQ*<3kl)9BPAA9K|J(ue2)BAT4XIk#%S20^xRKFv?Uy\
-z=s*c+JUqqQlLhhI9>@aTOtQf4H(H(N($ny-~gL+W8Fcd>VOWQ}FxyHmKieysBu0=wE$-&|;Xqth\
-d?WTyKb{>Zk`H^b8PScmm#wG6A>VTtcY^0n3<P3I;i&oqhWjra3EvN4zZ^+@3-$Tgd35(6B+$<BP\
-iM}9o)TKa}~zwD49o1<Ret$)8J#~Er{B(F`Nc|<!Yf0A5rv#<vovjJruTK}Ji!2&Ss;_@P}4;7d*\
-6gKKEVL08Y`r(I^JV^6}3Iq4%#}1pV0t16a>?39}f#vwHLymCb(LBIx8}QbxL&$7FY#a1AHOm-7X\
-&w4~6K@f7j^_<~FB*6LX{4KU%|tmU9CaZFq1<oOGBEOalRA^~pjs18HRPKEBn$Oac}1PNsEvAu=k\
-dX8-wg~*eSQ_yi#@G^V=|sgTg72#iC>uLDDR<7*y!oHcf~n8?~n46c8=^8o4Z2TEk<BNxVJ%K*g5\
-q+&WZhQQ#Np6u#D!k3Xf&<pc+&DN6qWb7RzXLb!1pZPW!1im&1N4jGnOn%xtYEtgtg9J<E^2Emdm\
-(H!7QKS|hSzWE~;QiZ$xJI5PmhU*-;7G1TMVDL+3yrQ{RZt2FwS=Zr8!9aHP~FB@m7ysG>h=S`ol\
-NpZNWrtt&yIjG$ocm{9pZ;WT~!v64h1{ci_Zu|Fg%i#S}zjJUVRMYnQ{JHe&4;=rda2kWzoa_4eF\
-SR)jG9REdq4yJQyDE)?Lgy+p(B534Jb$XE8ox9iBlUmOPtqKspBl^j`1=~4+~^}Ep3DrNvrqK6)j\
-QImFmPu2Y5Z6w+gLcvs8HikuMlS{g<6xlF2Zv*y%GA$VW+>wH~ydYJT+eRL5U9h)}%9-zYh6l2t1\
-dw#eHRw?NMsXiq=6eE0PsvMbdsL3yZdaae%Oa`|l5rS<w{!YNK_OAZ_QhdMCa_a697-T4!0=89%M\
-DO4Ph;mtiAJc`)saA2a;Y+-VZwDg?1JUT*qB`~1H%v@@O;W^FATULB=d<JFlsbn$pTu09^^Q{vHS\
-EW7WAz_O!oEad5A%OH5MA?nC2A@;Ga53!GZZMc2xF!(gX9QZV;4t$y!r)-QnXE~-g@M$KS<!Ip3b\
-Uj0S8jrKwoLG%#h@o;>eFXZ;j`dF=^N|dP^pgB_9@Cg&ff!jYoU-v@54db>tX>9|+d*}H0hM7J79\
-1n%!nwg^0}dIr`x)RbT*D%hfv%5qd=7&R>kfzYpw^N#t{df@>MZfHPn?Xe%D{P;rOx=GG{)h5awe\
--~kp15{Y0G(f4g3=a7R%quzIl8H;tlE2(plvx`y1msJRc+tdQ6N&mf2n3G~Q20tgaAPeG}dekJT3\
-&0;})dvc`Cl=Nh~1nz!w8Z7J-!((9(ZEywGaCgvgEI0jpY?}wd|_#D6cT`-)E;20|ICe9c>T|AVN\
-UmJKRnGz3$8*StYg%27I4<*h~zW*+4jgv($ZO}YxcrAW+%_2*j7o2<nuj}5O*Y)Va>vo{srJTq8>\
-x4p9>OQir`2{1<Z#6$6Wa}1hJQml1*LgaOtTXNNc6j{ud7H)^uo~ItwX|fPl-y-xT?&N>e)dJY?A\
-~`rtR2O7C*NOwx#wQ+uMMwDL41VGzwR|WzYEXfX#C}MZD}s4?fOX`fIp6~x+zS=&$<0P4tIC-2bB\
-IEh|5A;F2tP*zej@k1MTsO^xqTyUGVRQ|BdkfUO4}tJ-c)9T`zp+#&<FJ?n`{PTYV>ZwUE^&n6iv\
-Yy9K{9Tx{hZlwS%j?sF#i9#>14+33R&F1bZGYg^UEyA4}&JQHglR4z5FE};g`K9};;vb*9R@52+8\
-itzAU`_cJmj%VZGr#oaW>vQ>?e%2Gu+=!d<vfYw;xa=LirG1Ean;Y?t6Y(||@rr!nxrMNZ|9|6lS\
-bChI@=o~xvJd>E9AL7Jd?3$fSnG1_PR>(x;BEN%Ts~j72+uRs^VeD3QnCf;Xk&Ab{^%HlG4_Du-`\
-E2Z^Mk81*hIV^$aPN<H~8(3Th+g{F8A)_n^YWI;0IxedJBJ4Zx1ettw_F3)!PlM?p8`ejGYD@N1p\
-?MxE<rU(H2x(2V4kitcvR=%%A^*i<(s=k5tbeWObw~wT&BX0RA|_pTVWQUdlTog`Hyx_-p2`S&%&\
-MQ+rFH(%GHcHqnjKi*yZF=~`%}H>M(apn9Ii>c~F0O5q1M<3D1=9~d^m=%d28DHz|~70KNd-^ZfP\
-b6X$nW7QX%`O)|#EgU>+(*)06HNr|kKe_dk{4LUYAYG*uX*o}&b+}zW4=!?5B)3t|`#_E+ow*?8c\
-8oPn1L2=cbd-(1o*MaD7Z-?u;!oQLI&DZpoJzxaX4<R@vE~~m*L=4!yI&1eMk37!I}UO8MOiebwt\
-})a;Ib;JdX`__2W3HaM;?D1yrQa;jDz(5o-*)Nf|ZfRSV?s7r!okCC?9=3kl($+jP?xwDWBW&ubG\
-d{&bt1&{Jz{}^vRSzJWm$9L;BkxUr2vVKjh0_ziA9t`64~FVC9N1ZV!@fKlTTn?NE3v{;>ex(O8h\
-7`r1Bnzq)zNJ#2W~2SP@#(Bs7j_|f<nWCx^iTZS0<OTjqQim+SoK7}_f+ruu;GkvK(p<c%r_$^1^\
-Cl`M5E*L5J)7&L7T=Ee2Z65?;xV+&U&r}{hs8^VdLE?(n<A)<p`;2cW?E*`wz9A8^N(ISuCyQRKb\
-mF=!z`cgip-<s)T{4=7p4%N%nBmEgAMg2N!=of;lZ=**-*^1c)<+O}0llSuamaHSjCFtpAL-6*yS\
-#do)Z?y-m3u7myl=1XOXDm=fy=<vK8$LUpZZ8|fo$QO`!nX=M6=x|ixMH%B_aN10k*SGE$Zxhc~s\
-}k(l&9r2!HJ&zI%=9u@Mvp=`G8BWsIdR3(r@n=jZu06DCJ9*;d8(F8w|Edqnw5^oM&8{Y+J=Y7@6\
-%?qOiYRF0aqx$?EHo39sPO&9z1zgD;fm5%fsK)+PgPla=f+>@5!%RWXtM<26109$5;I3wl>h3P_J\
-n(+>E<l%s$U$XNc+q-y<_C7xVgGOR9-EX8@hu_Ue!(GmN`Qr@iGwe7?-%~wDox9o0m*Q1!h<r(`n\
-i-qx@0g0VaU<$PGgT+Zp1Kw4L~GOucYwXaQ>Yi~Q7<IM)C`}%gFre7pJt6C&5i1cKh1$<aS`d;H4\
-98L;jvIUso!f{#t#1b%Q%q#iNp(cU>RQ!EL`<{V;;{4%3~gY2P65=$`Nh=t{9%z-!Tz9z7{-I_Nk\
--DW}qE-+#WoR3CiQAT@F5jFY8^?e5;7puXWl?I`G1_H)y+@9<*KVA-$nE%@gn%-&f&T<!iUdwCiw\
-PA=*=jGTeHqaT&f5EZoy9!=IgMT!zmFP4DTI;qp_B%kT+DxK2!;HF#Hl#}t&~WRzo!T1OyV<`x(;\
-T#a#kUI~HggE4E}DW&(NFjh?L5*inio7=cL{=U~mWxQIIWf!~eb(B5ffTqXVWl`{@97n1W)%cOB?\
-3#Pa^7P~X^iHpv^`+ExbB-Bg+ZPT8Xr^VSw<;0kK>8%D$}g`@mHPbjeH>)In%+wO7GtcGziB+{@4\
-yPG{956#V4S)<M4B|u{OKYL8pY3Fh&9LWW4v~$bsTDMZPDJ)=3Z-z5ux?G^xlHGE>YRs#0?tI1a4\
-5*wAWPIqHrnC8xW6Pqgdm5d<5lLVhE`6dySs|M3vw9zM6UyUr5&ZFYANh3w2Ga)EGrBS+6KgE0ge\
-rx`_V5(+DG|Yue+^Z$PbA<hQO&!WSa_`{};BgM7Oz)VD4=gNutW+?j+g)CK+5bl)F>gmH(~PZMz_\
-`ONUvEt)FQ{f~N$FO;<TWmnSXN<5cko2bhAM&E`-N^dPe+t(A%Z<PJODD+RgRePUI^?a)A2VO(}(\
-oH=d#p)hLJTrBFh;P?@5u~l)TiI4_6u1kztvm|98z|ghZAJN`Z)M%J@re9w1?fGLwvt&Nh*@N|m6\
-8x?s&q}2{Tg^_Vi!@Kh_7-_J<-q8K<uKfe(WNX2l`tolhuu|i@GZ8q8SRiXfpcENgL1(8{ro%$Gs\
-gl{4rC<jrI+NZPF;VdjshLWU<|qN*`b#;aVz;GokCL`p`8`vE8(HMt)P|nRG*SpQUXf$BFY~Ay>a\
-9&*326i?Rmq>HDh`*1UPfr@sv1r2I{oNBZ1s8GkpQ$KM}y^S!I)it=njQ!gm+Y`;)@AibNgU-X~z\
-0se<N&(WNh+_XJ#UUL0*$Gjvl*t{fiJ%7qu-EO(oO<{hq+uVN-5q^kpW-0wjVJqzj$KLabOkd*qP\
-<(7c=YNE;*RuSJ#^?QgRcD{~=iI~VQW*T~B<J~wKQZ)3A2H5P{ITP#gJR?S#5s-5PYj-qHU<w{vH\
-(nq;5-br$99_Kf1<%I|JsHK%0JBh_k3UAS#YJkz_Z|<_`<ROtuRT5x4Ay4m*_kjPP|9ko#_iaA1(\
-=DeWJ=T+!=AseekP&!Ew^h<orOtPJ?lNV4oo82Wp*#J<S5o5Y#$LWMkgc-da+#ruR3eejfTv3G}P\
-WJq1_Qc}7YdNb^j*5zNs4i$L$j)Gea5o4%YdZy90Q683G~xO-8)d3}Af9~y_>eeRth&MT#S_Knmg\
-y%k~G*!oKs8TyI`A!|M!6Mhf=fW}tESlc_u-n8IHp5%w!H?zoXlA1|9vThly?oGFJvx=tAyBPKN@\
-O#iY-JWED6TF4<xV|69IQKV$;N@fNetA*X%~a>s%#perT0ehUj6A<~HTaO;(#F6f8`YQ97_4#Cb$\
-L-)ZDCR;SL?XHB+ufNGE6tfFr&I`t{gReGvN^ZKesBMPU%}7fID5y|1g$9=I%BKGQj2$%5Is?^VJ\
-yEWCwX7M(6;-9~1tZ=~#<*Z>zrD`R*_im`__2F5?!Dn$K1v%q#T#B1U0iBCR<{Th(9L@T$LV8@~3\
-lchj=n_8vlejk}9?U%8bo3F)frm3<_+pK<idulQ}tDg9kV`e_}1BV-ARdk2$t*XDbDW}wN77m!}e\
-RoXuv6Fi^91H#9pu!Ei{2tI!5Vk>XU#~hg@?`^a`S=ud4%xSZvo^7IAw)tM%)};~nxux%=^%c6ll\
-Ba9nzh{i7-&<H0*3MjqH0>eC-+3{%J;Y9zZ4aR^8-@p9G=w;x^B!iOz4*W2yIy0b--Ok^wl~}TGV\
-*fLCDTu51d?uebLEF{M%VU(pR8_apBa8u`Og=(+h=lqaJ`@nVRV9sSJdZ`?p8_*lusMEpTLcNU&w\
-fUsK2}N%{8xe+e|p-r1Lfg{^L*=$F^W3pALT+>01+kKkXRX(FfAJn)n_tzF*0PAGnMSufB5I@S4l\
-E4Hr1#5ny2a5c#@G$t>#J&)T522#F%zIysjX<C@UPB7HQBuUk^O6Lxv?zA4?=7LR&PZ4YC>AoCr4\
-6K=e^Cxp&WuyfFr&Cqb6kI&igaQS@wZxTZw64_Dfk8b^&(jRp<Z42?g@Y^=Rv)^_2>vj0k95%9NX\
-=@?IoeqxYs2^2VribOx*_^wCdGU&~)@e7>e}RG76C}Lu7^}PQ7+LpED}0&{bVI&r%<qOaL2a;$Y=\
-f*b^;_Zd8YAYH!RKwF+)%GK$n}6*t79E)Em&WM^1t_Q_L`8;H&wEBjQX9Ye(QcC)I6@KzSAk2+#N\
-<wNbox@G{5!!*;-5LhVzQ_Eh{YJJPLZ|E}xWpO3LdV@HVBwe||xor$UbtA^6CpoZP6tGSk;0G8-|\
-iA1BIspe*Yq<w~@T0R1}jq31`S&o9oeM|t&Nq0fpST{0RI^m%wGEmWOf6k&QU!~B03s~E9I%~MtS\
-{$vG7-|6VryZmQZ_~nVKP8oI2IGfpwW9qHJbrjG3yr&T747;SQ)a%^V%dW{{6*WQ^kJT-D%diVlw\
-p>a3<TK25R|L+n8{^FjSq}2b);Fb%`Y$!^OFOwv{@1sp-La6{3>$S?%N_hr+b``=(7C}+>{B-C%C\
-6m`@Sh|On0&5(3mbLFNgkJN+bhmu#=9@yR(s&$%n){j<ms7)UGJxFEBjwcLnp&ly_0Hpkh!Z(x!h\
-%Av{$_y#8w@7_|cnc-VZ-3{%-SC+p3p*V%VxDN}a_W?;5u1Mjm&Vw(1D`ytkaT>W1xj5F0=n+p?S\
-3JG=I;4Ub-++T>cyWyHE2o`14KVv8sn?b_EZ<4kn2%eU<HAA$eRB_(?~!XH^?InL{LDQuQ_iCKQx\
-Um6~b31SOKeRUGI<=H0dG5lQp7dhT*z2NFBSzjAk$$3PAvP07Lxuh?gV935^U7nYRc6b){vuBC}c\
-g0_9o1yf-NWEc?F%NIf&az)J?0y>cAz{uUU;90_d);`p`}i)Z+qS;*R}MSh+qpcGJe-cR#sH!3o>\
-j6jt>aOB9~DeTH_W=_j<+;!Qs}t@#dV!(ds-K`PXxNa%qrj0+mh*{IsQOntrPTE_lZ~4VQzTrs)^\
-}!{VjzJ?Wo_$x_uxG*(|tS<Y+u!hkOhVBi|DCrKulI=?OIs2>z<Iwd&JdV`&2S1z{cY%vEbzYTew\
-qCOlKs(dwZ1Dvk5M=B@DSGkRS$WAC{=KeRRS(%M4URyXNxX1JRh?v{qTt>NxyxX(A-T@7~+!+oLQ\
-?rXR&Hr#^@_fW%qso}oDa9?G(uQuG{4EN23dxqhjWw>V>?pqCaq2Vqu-17|g?S}hq!+oFOe!y@)W\
-VjzT+$#+CBZm7i!~KNeUT3&}X1Jd*+`ly3&l&C)4EOI0_e+NRRm1%U!~KTg{)^$>W4PZm-2X7#?;\
-7rdhWkUqeb{h+Vz`eR?k^1YSBCqP;kHH^b=z<^H{2}^cU!~V(Quz{xVswe9)|lu!`;_#Uu?Js8Sb\
-Hm`%=Swh2g%+a9?e>#~JQx4EH3%eS_h?*>KM=+_Mb#Y{Px4;Vv}XC5C&R;lAB)-)*?>Gu#gt?uQK\
-b!-ji>;eNz$KW4a}Fx=}5_s<OXGlu(@hWk0g{et2Co#B4TaR0?{?=jqO8t#7>?spCMLBsu_;XZ7*\
-KQY|L4fhv@`zynJ%5Ym(8FkxmH#giZ4R>3^-O+HLZ@9Y}?jDBwLc`tHa9?b=2N~|6hWk>(eTCt^%\
-5Yz8xbHUH_ZjX74EIBZ`(eYq!f-!gxF0jzPZ;iXhWi=A{hZ-`!Epc1aKB`@UzP5L2Huv9U~Gg3B2\
-T`1BWK0aNL>NX<FiMvcCkuM>-6-yd9G)_#fmps;{D?-cuZ2~a?UwZ{`<f$!|gu7*+zZ{?&U7`eiv\
-KmBDc@&-X6nFx|jI<_ee`vZLx{&jTXz^=7MvR+r6t9yi{8Fu|76e`D@Fz;+w7fr1iXuZFcYF{^#X\
-LO1ZT!7RlTfw_QIUNC#Su@ho<+i39MS4_Hle$<`Z@63esI#nxE8cDmRh7rBqRR{PU)J}YLdIN=y)\
-tGOFNZ{`D*TdbPjsooEO9K+H*D_v|1!d)-`0dC_72xPV8L4cK3dt`Q-m2lL>c3R*ReRCcg%-CQLG\
-B5()<S*w){Ymcg#~J+nN&ovq`TnSSpRm|s3pVnm-l1&VNeOAHXyotY(F+29dq#x)-OKs@Kl}TbsY\
-$E-b@g1lPw}Kj{(T$X?1a^Mr%OLk&z5n|F79|%?(%H^SNo&3w34K6_j0}?hOLjm%vL^c!<JJ!=3}\
-0>*gn3>UoR6_GGoc^bk-|f<#&X8ii7`w{2Ad{V)PYlSUF}b<uRSN#jw>Xy3q0cw}mg-Z%Tmwn3?X\
-yA?p{F#}vk<xbI|BM~mOB*)qIb#*?>GU!11X;F%T>=0s0<K$tV#MjIQ*FYN5uYw?uz)**}Uw9u)p\
-bh)>?*eVyo+vRc}a`C;c_Cm9b+4)D;O&#K1^x)Ppv%Mrt3`lPZV=0}p+357sNdE*+Zdjg}ZL)#)T\
-E^Yzop*6JZL(T46z#Lz=$(C5!bulf?4pr`{4L?`&2F}nyLY(Ra?8EX&GuUEYBzk`>2tGkxAJ!hTM\
-Wlyp1&MHaL*b9VYS{Qy8ms|{kPubV%sfG6?Ok>ES;wGgqeY9ZoS^9M=cq;?g2E~3@*3)&!}H_V?0\
-jV>3D|0Ds8!LoAC?wda60w88=P-ZpAQ(pShSXv)Cb?EuSTc@DnhOjp)x<?nxI0+e7ZD5si1}vCfQ\
-jPQaj^LKS?uI{{o;?Jm=4@5z?6Lm9R6?CrpIwo5qFfh}*JaH0d-lsI8=5<8h#$#tEOa={J@!5?!?\
-(cd?pGG;x+JtAnGr#d0V@mw}BSp5ys2Ze1Ta!gGB*NrI`@Xixg@nf7<b2?noa-&Xc#D5pxWG(Qw8\
-WGND&qkw8w2=8O=WOCc{j4=3xoHW{N567{N+?*L;^?Cq^Do&Q(Ejng*(RH(PhG>=Dx*9GINB`g%~\
-a0<HZxRz623j2exKPZ;QMc&k83=R2jn?eo&tDy5x;;=D9ugU%6U0Q%Q(RY?|^J+x$$7H%e~so_qi\
-tM!fw>>2^reSvjCnqpN8HEGOS%DW*_Ki17izk=N0Ca<s|196%{9E=al7SmE~k7=M^TGmX&0d<;+>\
-g*hLpz)SPAJ=NDyVmKBwZm~zFXm#SYmDW!S0=XlGK3;QJZF6^D0vmh%cC%ZJcAag-p!Q6u6(z(UO\
-MI{s<`C}O+B}FBdCXXyD%PA<Pr)5RS1x536k~0gF>B++6(&Egl;Qnr%TTq-lKd&q|gy*q^^D^`Ev\
-XirNGfOg&hZ4%e?7aLO7W55rmsdE4m9R-{7Q2dF><p%GZow@0ESjA>KPPWaZds|*LveoQ!kiM8fn\
-Reo%kqi}lk-ZG3z4>>5+t`Mc~;(>OOsi1Hn*^-Bs-@hC)-<)Sq#RNU7CDb&cfuvqO#=KMRN<YS-@\
-32Z_Kb)6}<{mu93K3F{pNr{L7kO`Q3CceL8id>Hql|i_C9KzvnPKSxeF7vpC%8>NlDivt)kUthI1\
-XL7lTOhn&)yp2^F?IAe|ZJ*J0!@es|N#-yM8Klvs7rsvg=4W7Rk4}OY<p2}Ej(2YY-e?hCRz&Hh(\
-FbZQBsOS6W?m*j5Vr&h)N8hs<H1`&y7IepSeE$UAXCjTD1F{&)22IJq5DhwEHogO0KL=As&}pTN?\
-F2o6M!Fw#$vno6f|jE%Jqfz$ZpIRxwAh$(@Bnnjy^Qq-P5L3`#-IsH7@GjP{z2powAWHhxj@U7Gj\
-=CvZUwp`Q1)YpKcM9+8QTcD>nDhxzJDC?gBJf3@q=bRf%qw&HHaT{>srK*5h8g#;s;H78u5eP`E$\
-fizbg?xX!Qp02Xw?H#>zn5&w)>%YkrG(L36h-wuzp<%-D9&o!c1ON8!GK_(0qL73HzkVwHbKJfKV\
-7LOi6z@HXNBWd{%sX#0<lPtYAl5D)17TI3J3`ZL4>dZG^b15NoF`2$^y+Oik4vxl>z^t?GHvh=()\
-X9?@T|3uC@gO2XZ*<jH89-K`8UC@iOX`uW2a+VJ|<s#1R1Z_Qtvt^+BKv$E$RCMy7DT6uN3c4hXv\
-t6LOuHdW+wE9ZUj)CTmM6G=a;g3Q*pohjH9?<pU5D)0K@rVa>+62S{y6PIvmV<7b%-I^yvMHQx0$\
-p=2XWKw0+|OAx=<^S9)_Oh4^<mCNgU<XBXH!5u7`w7TC#>LX0cgr2NH^$!pCUZaP3sUIXwuI)+YY\
-*S1JVn+i)QLiTWt07oF#*@S2-I4n*B%4W`d5`!C5irnAg$$gC6@6(g`}{uLu`39YX0QP|x3yPSA;\
-Of*+u*|B3KHEBAvRpegSno}Z!o4<Y@a#UCI((7hjVHUPBxFlXtY<)3ht3%bbyuR$leEVc|ZKNh?I\
--Pj!OKu5O(4?%Z=?xOG8qHTh1ZjUsAF6)52{2YEdA}ydB&qLgxd%J@tpsRZz?Vz3v!~vQ%4rK;<V\
-gk}Y-%YXDa?s-I5ijVSH-q<}WwR`{o!)05EP9@evZe2H@Ga<}*{JiCXh(OW?t*S#gf<FVeLr{xy5\
-s@y7IgprAS}>w$fAouCsfeEui)2@QAa>YDoJ3cT<+GgU)za){Vm3kEJ$yRZv(9cJqhY_F`nQi`JM\
-66ZszXQ45C0Bb9>^^mg1R}kbpMUf;CHNfzGl8<7J@5?U}nQ5p5_5$wg<|x+~);T^U=|gSppVfVeJ\
-XeAR_$YrPp?-<!G9FG4?a5#!51i!WwwANtv8gCI^1Vtfba)Ksz{Wo-RW=3bSC^rbQP=1ZA-|7Cc7\
-Ipz$PGpqP=7P|oM=Pzfj{h(8?V0;1k+l`>xL3dq=e55niV08KuM>3v^(ctJ+%+(%!@#;~`wH@@%(\
-TuOeU{F1pxjJVsJ|Y9c4ru4A89Q_}<37+6-(%bZnX~^G#?wKMj$zi4vFMM-F>Cuc#5<nx{PBnvbQ\
-@^W1ZGWzbW}Y7`~+S3ea0)%@6Wsj>AMDb0^JOnb}i!*u0?+i`aEdzM8*e0G|s;cX}S(PoW!h&7$-\
-JOVtg0q>dB06n#|Z<&}z{1Da_gr*>T_X%u2ce@!x>>L8soxtW`HcB%O+IFuqK<iSg{4Ac}&n2kmt\
-;<7qcz+yUJQ>Ym1Ue++Du)0kBanlPR5WQ;?rr!y;U26*jdR+*PE&rI+IbFt@VGV28B{!GS?VVtU*\
-g?MLyFQ5$LRe2WT1#O>=IsoBeW)9;^Fn+mbGix-)uiV*;-wEo&@0A$Gmgh2S7sSo%Jn$zE`MwqTz\
-7_nr4g9$c-{m9Te8~Ku(?Iuw9s?~dV0>`_`sqT(4;3PwB4({A!uU|c_&(6p#mpM<1MuYsNFQi=3F\
-><ZV+%mnfF1>9rOZk%#dD0KC*WR*anwDR@uaz^yPz9EcY*pqN6%w?>OAlkbR)*u3G<nCbUwzD1&k\
-MC>T?X#4Ouj0A>$K4SA%X^2ws7DZU>)khb(ai_<jfY4m#mZ#%E%jUJSYs)CZby7qceZg*J5;{KLK\
-A9{k4Gz2IK76^z~cL63nJ--jl>2<cpebb@XJ^<c2-ycqceodUW5bQ$O-(CwgU_k*AJ<6F>GpgZqJ\
-et*cUT*v?`A4DC64B!JzcnIzEA=DL6$OC)=WP+8Tm7vE!-OG^2WoRp)n?SdNR)d}d9q>QQ@;!|H<\
-wpo>Il_YcFs%ao0X+ulS%GnV1^5E$15JQjG3Cc-o1n`;*MPQPiFyM$V*=<*Qs`cZzTpvO4R{n`tw\
-LC<7~2NA7j()`(DopU90hIv7~VgI_n@0WcY+=Rbwfs3@Hlt@I^hYlg(sM6737pda8Gy=_4P@l=Sk\
-)s0U4!uJ&P>^UB8}L?SF=H{2A(FCCUSGO4_r`TKz2Knr9hry^*o1jm(ww3-m+3Kt22g`ov!{KH!%\
-K19UNHuU~<;ze2tG74i+arvE1Nr=a<u<)AyBN4<I;Y5EOwmH!5D{s#R5=zh>+pvzxiR%ggR3w{f}\
-fbQRn=bO>q{}27pR>&_~QAS&tI|Y*N)K{3b15$bNAJK>Wk-75!h`tH#eSbuHb|5`F&@Mptfi8HRS\
-zBL6I^IA!AV1Cg3-b3D)FaT1pu0d1fiC_l<l$ZLw+sG2*Mn}}1wKK>YX2s)7Qcmh1UYNkKM?*uz>\
-j}0*XVzuegBj3<)G8vLAdWQ*T#34<$f1+^<C5#(Cwh^_wf5Yl+%06ItjYC3Sm{DErad_Jqg+xGTX\
-63D8CO--#$Qn1Dy$42HO5ZwDk{B?>_|JKLXz&*X36uoz>`nkDy#3-&G!At^r3;M~*Un^eA%|L)P0\
-{i$3Txv}4G7o4!O^zGSYGUovZo4|ULoL9q_?2r}Rl&|FZ@S7?7<f%jj5_n_^+Mqdfpa0+NH=$Hod\
-Ne!q&pesQ)gYE=H7iA$xHU*Pln%J(lINxk>Org0o!o~SS7vvex6QGOToUd|2u8iTH&dngNG~@hEP\
-){u9ons*v#d0eJ^5+x}!t!vd67HRFSAlxsxV1hGVS}!QY`U#ECg`Bk;yEvlhm0A|T~(mT37n@VaF\
-*1PTMJr325ZIn;#Qnhf^KcaW4FV-vJK~zZ4iH3%=+7MHljV}Guw0PP<zOL9k_L(184g>a_;NMt*R\
-u>PbP7zbtlM;oj9Kcx()OYXzR|Lr$8Rw(V4qWfbQ&qw07Yvtt-Oo%2`S`&PQ~EJP2CWjaxh5J_>j\
-LWF9*>nOmEaIh)v>TSsy4f;`>1C+7ota@M{V!tKSam5{AdE<hL;KsE<G0lKO;_iXOX(HJ;SN&&w?\
-H-nDo!>#RoAT##i+})R3V@MwFi~NBe0(JM}F*{RvvqO->eS>*S+NCI$%Xm!jmAu)KD>+{c`TN9`J\
-Z9?{-fZs}<Z&#IVb_9h6XACXZ#EHfb=vjF|Mf`c4M^t=oIMY^19ZTR+`Z%`&i3ET-J7O^PhQYW@F\
-$yFW!Xp*=&BrU?VJribGS7#kF(9UajU!l@sx0P^?b;%3%IppA>zA}yR+{Bugbx<`?z&%F`nJe`8L\
-S$CqUajfV@8h9zMj~yB^`Z8uEJQM^WaFLcV^KTYG<k{5{6`=*Lmt9!I`F*=q1}HR=NB641S%Csrd\
-pKjl`hC&1q)P~J}<T~DHZK8bX%;k?%x<PUTQC|iqo*Mgs*<!ezV;AZQ&Yw&u`X$dqRw0u2}T>|%^\
-_2B)}D7T;C-On)B0o?_90@U+!?n%KsqU`5L2Wb0Bq^lC~ZQ!mc8&F3ux7f9TTT`Dw+MhvMp5fL$x\
-T~H;Ix*i!`UUd+3%mne1-cb<7wD>Aa=!7G;M1>A$A1O?peI1rY(g9SUzFQ(XbaC_9`|d`lYb4~{~\
-B!;bjkDJ59Tj}e}lA=_0|ihQ!k+WK&OK413e0w{#(wc{1#;ex)(HI3+IEkVE(cN<pbLOcgV-@Fi!\
-)W3CjMDTWkIg`PvFTZbcmh-3+=P)cqpr{EM7tzlin>x*5M0Y~xlk=1+@X<*rqrTVF-KKu>^rUgNC\
-)YbamPY|sUut3fw`?ggy|ZM~ga+qNTJe*k~}fWG37=ua>YO9!0-x)-z>G+_tI8uPLNuOok?eEm9i\
-Z38`o-=vJ)`3>;l4W$3i;KQHMxBL}lg8ACu-Qf3b?n>E%y7w0H{ua{s7I!7@L%Q~%KH#4C5Ab6@=\
-iB#l*UA0dn(_|%uy+vFyQn*u!%YFr1#SNxc=aB50GbWD1avj%h$__iD)e6mkmdu(`$6vVypOcM&#\
-h^PxV07YzoQ?ZFZzJHdVR=w+K1dV6Li6ci1#DJi}~P!YSig!^shC@KjwvF4s)yX5pES9L3~HKReh\
-AxJdv-&T(R?~;KirtOFu<<*P>n5;vMKp(4^zw<8gcgnthym7Q;R5GxW2cq0c<QUC*BY{TzMw=g8L\
-=sQX_aouHmCQAS^)KLbtjAq*el_90z$oUf?^@4iBP_zLZiS<RL(%nO<28pAD?5N9>(6^Hp{bBpI=\
-p1K`$ALxL1i;s@C*bdPBph*c<O#jyS-NEA39V|~S=BURyTCNF+n2#n|{LUoI7tgbJ>+><sJ>TMGp\
-sUWe+?~5&uG-CtodUX}n`NbS$2-ht7x%EN9hlEf>}m1ro|t2Tt^qv>+N&4lqkS!&(iiXhTGmmxSw\
-G7<)DLm>w|HkvDtCgO08PHga^+uSv3(a=JmF%@r7yO46==c$%gP^s`RxEaABg-6M1DYbfgS?&rQ-\
-Qu{2q+_fUX*5@ycPAXU8z)3vPFsWi3fV{KGA4=WzHR4*!>0*2GJZ575q+A&ny}o-_h;;t`g05_IO\
-}7B9ctiWzgY)okX~m^**Zidl)d`G{+*n4Q;I%?@3MZzdyulQBmJT>?5`ie+uY1bN!^_)YWn8!W#0\
-2F$Ccf=)#kH(Az#TM+&&h-;c<t(k^-`*e#hm~OF+(=C^0hQ<2Nu=q^S(O!!$_JTK{RiN&f79TJZ^\
-Lo%jplO*FpOOh)gRTK}&$4*>EQ?jmvRnyS7Mq%dI*?^qv`%mW?)KRhYdstJpN%>II%bZ=r_BL>K;\
-5|rFVC`8=b_B<P$supto>~kx0i5RmvcoeMO})z6^&7}nWC|ZdK8UQw7H`3iY6%9LeZ9rwo<gUqHP\
-pyt7tn#+bh~Z(T<8HDw?F|d5WH|XeUKGE80cTu8MY3G+EK^iuO>nr=q<Sy+F|m745BPilTiK?W<@\
-%Mf)pyk)jtXdWoU~6dkDOAVpIZ9jxdOMTaUnOwlw&hbwxiqL(Q;Lea|=y+Y9|6-`%kq@q_TI!e*e\
-ie@N!wW8lsbc~{76&<JOcts~D`h7*OQS@3xCn|cKqLUPztmqU)uUGU2MQ>Des-ib3db6UpC^}8i>\
-59%!)T`)BMKcwhrD&F-*^1^UI$O~>ismYsr|7MU-lk~2q6LZ;Dq5syv7$dvv_#QTMavYOtLQvM=P\
-SBE(S?fMuIL?#-l^zair%g0J&Kkqdat7QDY{6}#fsjq=mU!WP|+odKB(wJiY`@jnWF!r=);QsNYU\
-krRw%kc(H|?iQqljX=p%|gs^}_3f1>DPiaxIBYDIsl=o5-QspuL-*DAVB(Wew$ujtc?{!G!ID_W`\
-O21TDy^jSqWD*6jWf2ruN6x}2{;BpqdqF3~aUePOhMX%@;y`oq2ieAwxdPT436}_TY^om~5D|$t*\
-=oP)9SM-Wr(JOjIujm!MqF3~aUePOhMX%@;y`oq2ieAwxdPT436}_TY^om~5D|$t*=oP)97b9$4d\
-2xqZ-%Y)bUePOhMX%@;y`oq2ieAwxdPT436}_TY^om~5D|$t*=oP)9SM-Wr(JOjIujm!MqF3~aUe\
-POhMX%@;y`oq2ieAwxdPT436}_TY^om~5D|$t*=oP)9SM-Wr(JOjIujm!MqSv{(l5x{H?Co8Q{Vx\
-l&>vt=f<oHJXPH)E8Hp~BvzO(SNz6b6baIeI@4bS&ktp0Wv<5S(Nejo0X7*>BD?l)o>FKfo?U&TE\
-lmeudXo$g_LJ?<*p?c*4~8ux-YR{tDsPjgm34fk`nPv9OJ&*~q*y$AP)Ef8;ORzJ8MtDn^Y?nG99\
-D2dfSb3Wd8#_w*deoPNm-?<m7KYjt?>dorE=)>wa_ha>=FGjcnSpB$ERzGD3t3Ngr@6wR|OIiKu5\
-v=}-D_DKim8|~Gk*t2gDEQA{^)1IB4P#k-@pxAM$pp}AkoJkJK5Y`Kx2|XP)i<#E?5V8&;7yEY-@\
-@u2!(BX$@oCc;{{r{28I1SxGX4_o8)h<o4EKGRj3>+j#eD+zj4Z}?;2x9B_;a|Ea~NNNyY+0wm*7\
-4=8|j|I>SyG#`m#J$f6c9|KH)a-6?bkv@>+mA;Qk7Cej)gQ`_>}lANTFWtls?tR=*DSRVA$cm$+M\
-(GQOu2`2sC3V|)|tlVvEcxvZYeWA#77Jz_riu@HW5M;N%Paes9Ot8ac6%HnRu@4SccPjFvYj&$KZ\
-iu>VvS-lVUr2AO?M%-zOP!DjYFJ|?t79;PtC*IHM@5b$Zfbqk)6Mo3*yW$>)d)^Nje+GB^C5+#Vy\
-BhbT2a!hH@8WL$5aUB1Lf&xSj=K`~3wU-AcgLlSkH9?x_d~cValg8hS)br;yNp?BxJTojf_paZdC\
-M5{dao~>pI4aeos?5Lw;%_<Z@y;yz=5S@C7ES8a~6)zS(x*Kj7j4sd)1qvcu`ndTvVD@mRD5he4U\
-nGl$A*@0-jDTOZ9pO4jkn5=4O`Wddo6r<>!pOX0mtSF!f|!X8zn9Z`s1)oU#58@-i~uWe`4^TUb<\
-*ol}yN?JdYG79Zr4jGa8lJ2}-0AA{)u{S^Mwa(*y3Gv8ZQB%e%}H84YlGte21@Th{BoaUW8)a&;=\
-JTqUUq6pEXB9x55v%w*M92AyFc2-egX_+^#ET=^Hok&^I?+S~ubLi`d^YA@*F~z})S(&AISzfR?u\
-W-)TEb(PlZf1!W?9D4H9h>D$2p(h%%PJ};&Me8vC@7dXKC2)gz|?@;8Emv!G_Vni)Dt5b@?D&nS2\
-A`yUglBKGX`arWlREx%;*LU@OtOvWZ?@hGLi#M6ciK{jujlFcV)RHMf1J+IfZk|a=kevB}F9}^UU\
-vMiUO)xMpiymnStIQ{u))fFrNK6595c}eMTjap#mKm5a>|ylAkktE;uneGb;!Dx@PhK@1VTwi~w(\
-vV`GPx&dtioDJ?B3anv;`j*PT|%mv=kyxVgEIi^4M7m%Z&G^(>rgfnr-RYjR4*^Vy<Meyb9z;9-U\
-{vs`}s8rOCp>uM|;9tF+TsClEe$gB-U(}3IgECN?^_xLvr5QcY{$x<m+%j*`Y%glUoE-DT(7ZzQA\
-9>l{%#u0i!3xWam!fGnign<?oF91e3d=-)laZGf)@xaj?KLZ$&q44hABj-IcpZekF)LhHsX0Zn!{\
-%UUW@%~OoWhJrS(C<x3uvh1rNQ3F`{97LIWSfKxPg2$-7^n9H$C%U@8sd$$-{#8%!8?}4n&R$ist\
-2bHA^O6?G-sfspZTmL4=}{&MYh&J4=T0o#h0Qo}Htf=7{kpLySm6jS)$-#$W^0U^P&ESGhx9i<(d\
-}H>*stLc}_0ya>8DFDEN!ex4Y~w5PI+ad<bRY;G}fKMtL~=p3(^Jl;EYoEQoyqJabE7Uul`%qT7s\
-eREK@DlXWikewsr5dHaR@7T$cy)wjtYo~Ze7hgMNfcLvv5P_o9z#%Fl;e@EcP9f?$$d(~l`8k;-f\
-xZ5BDStytawwLJg70bu)4bj@&tfC_c3@h-lmEt1_dkv&|EBTxKaEfS1tal)T9KUj;PaoB)1m)8ee\
-~H3NZ-muxPgPcYP|6l%*`*$8+&F;aTyu&rg$fR-}~KR3i6EZQucl_@PacEmA{=C9O@h{Xaq2pDF>\
--#%BF{a)Ch)vQ5XWQRYL%E|KAlZo|SNtdZxn3w~`m<PyiWs8Uje9wQthd3n2didngf2{8P_n;{UB\
-=!Wm0i-_G2Kk>?Dz#J(FW82a6kv5*~_*Z)@+X&MccWtmyI-<4+iotp_{PNqHBjME<z3TB7TMFHaX\
-=b^xngMtXsPXS<7HhD<!)DH^2csBZ6FP?on@_AM==b$s~Q@#~>KL;{qfe3o+X-JrZB9Jhzf`ob9*\
--Mz;3MNa5vLJGKa?shxli!LgpRxS-tw{Zu3rpXM<e$wrT9Ef&GV<j87mqx7(UIqyA9?cr`$nF;|L\
-Bn??>~Fw$@^B1JcT(6%DlxTc?CI*UX>MjGqbZxa!O0bPPA1{Gcra`$;vM+Ni8kQCZ8FBUbFItW#?\
-q&g8^fwcy;4P%IB9L!BoTL6f8_sK^0WbKGq@5SkFX#7yW-;VP08=Uwiso1XhrB_CaM97v~gaH&WC\
-*%dpNt9+jkUE)q7pcrKdOtjw(2GR{7*Q3GiSV2Jmu19B=0r^-NP=jG?jnmapqC>eu`z+z&`t*8Ad\
-`q84&oHK}X)R`nSMDFsyqnylw5FZUK%_%G^Sx78KW1n@}-;W*?G}5B5AEg%0Eeos{5q&mfc0Ov=8\
-N?Tu$us>t1b>UpJ%92`GiC>T6lm`ePD}1AEI{P&laZ0P0BjoW4VQq3^dtTyNjZnMFCwzEaFG?v4m\
-bLTih$;`I{0B>gU>so;PXNSpGHE6e^~YA6%^->Z8X>hhzmk0fnbDTC4XVY<iTeUTnLfC5%SO`LpI\
-Xo_;yg!-_CY?GSK{lgtLOVCHNcUEh_P5<&`azJfBc7bTB5AcwL&CH@nPR0G<|{#)qj&qRh`J#Pl<\
-x;B>xCGrk=_(h>r2jOtAVG2D!P7=@8K=xoABO{FmK`1Hac>A9q+j3(o=7J4(w5LRYs8N|SXyweB-\
-37Mahd7F`%LEia!Wx3wcoSf`Zk)(oi7hHk3A`dT3XYsT$m6eZl&kKlVu-A*RP#6<sW>NhuMU&4d%\
-*qKdGLW&E*Extx@nUkFk%87faXi|r8NuMJA`G?W1Bi?HXBM~-%8)EEU&_kxo4qNsv8>#ZqQatqgG\
-$SCGP4(YA^&9EmReXeKVT44CUlPRG%}01L6F2t=cBcgg;-WzN!HwaWCB9b?3@yrez3H(I6tpUJ*4\
-j@Ip;Bv#bs}KJNmfs;(g#)aoRR}6y`j=ZWYkaoPJPg<~k6X912-<&AK@ksHE$mBa(HD5OZXygQeB\
-$WO{N6X;$scn>}`FX~`gblvnD_DlW$7vx`dRXO?8!@z9iShzKrYUdCWyKR0=t7k|MR5XNrt4C=uk\
-)Pupn>p>7R$EJ%X*hhFj&t8oTTEByR7Oeaxj-P!_xSK{>tOaM2kaLrcVYKoQVLH@QG+5M`nUP0cS\
-~74b`O`VdqqU#eqW){&y8lDkGKQDrprTOkn-L=UM(T%=nQLBQPQ=#4X6Ksc=v;?;Cp9)xhLD6Pr-\
--g5Kwk2j+G2#pfPosGnLP^?J+tutvv)s$ZH|cp$I~_2I)<W0F%-SiBS_n{>nLh#X5DJ*t-<b;v}@\
-A!wX}&Q?K;Ml6-Aw47>Z&jhB?D948yQv=Z0b^h8=T?VHkeT`##^aO`5hzo22dh+`Z+Kynmked7pp\
-p^E~exn|7{>Xi{3M?AmkLK1r}+LzC<o3HTkIe_ii(MKR(isjd{e&FeB7v-gK}L>XbR`WBHr>?X*`\
-)<N&kx8bR7G`{bRWFuW&IWvfrmA+OEEtbajy_b+8sqg)DkE6cNq%(>#`d(KFye`S#=??C8d4gzw%\
-G}`dl(oa17kmSz)FLyGZ?~4i-LH)6?4EI_^_p|lLl$}_h|;D)sT5aUJ3C7rfwAQIKLy|UY1c>KJ3\
-j69{JZvz#d|YkB7Vzy?Orek+{hWsMyK@WNT&?sNFC*p@5g<nBvua?zo!I@-&1;uUz<agl<L3L_Zf\
-&4=2WVU1FQCR<-7|1)%{CrX>EzMV{p=5TWWWyxz78|Z2KIg(ki|yE%$z8R}1m3ACy(u18hn0?qvt\
-&)Ye*E_A0ltQUt^^-&$i-KXrRbO6Q8ZjJejb62;;B$((9Yd+Njy6cOMGdqt^hzV>f*@K~p&Xc2wd\
-zbn;mbTL-lPO-Xni%vIkqE*y^Geoc|N*t4%l^&(CS}Ri~S2;ygs5wD5()u@DUF>X!IM_)gl_!Z^x\
-^*{BpDVtS|9$K9D!Z-Yo4cm#b&HqA=yb7ZBDW~oizYmF7tKILDJv^TO*^rq!aifR+g?>;7gsY=R^\
-&>J{Uo_X$IAYzu8x_YTNk6(HC-E{6Nh<L9A-pk_)k?T^R;9$pblpB4HGZKC~mR0O0ijIL=1SZKaJ\
-4q)~yp^9+j%Ir|CY^r>FH5`2#-YeWS)#_(rOKoIW&aLdVGt_;8Pnny!0ftX|jlpn7R~IK6=#Mbt*\
-(Kp*NS1i0{FjJUf->2=FrP?Oo(C)B?UH>iJGUXIbl>ee{L$=N;TN}EL;$n(2#Hi|IWtuCih=@C_2\
-s@3;S+N^$*Wvi~zq9U(Weeq0&hP-@7s#z>X??2p~>7E`{?yPp$%p!M-nsxQ)SluQOfKf)bZq2Avt\
-)(}qq_o`b7GJ&*m#%$KNE1bT^iG_q+GP{!_>7dGcA9pyAxvsfQKslVh|8$5mx}+c@?TxIDNcPYj7\
-8Rh4%t}oe)oA?tZutQM9roO@u%%v5mk*BsZq76MoaF`k51FwKW2QjM^Q_(j?I?tlx0`j=<0ozH+|\
-~v-f5DqdFNc+?PFtgtIrlOovI$Tdqb(Cl+fKhCSA92j5t_@SX(=PpVckujfaSdx5l`|6}I=bt1{g\
-!qGYT;M?DFT__NU^{%ku_>^9OD`Tm`1bT{rCt6MflJ!7-(p`Fsqx(CGvt#hJq^kqBO=&l#>z2bCn\
-zDt~15NdQck5!v;4~oy1&DH7jeg(%@aa_f#cAutuU{4uB-F3(6b?e_ACH7F(kr~ZB=0;<n>}c$kA\
-9Wv$757M|+Lbxw9=Eysy{FOt=2PwWR&-zNqSv*4D#9|_sQYAWs_w4%G|^_UsinkZ#bF<Ku(rmhi?\
-mtj?SOKN7Vb~+8D&nf+Pst0XC9|kSGd&1XOBHr#_ruBX1`pitJ}SM#;eg?w7XgYo~%vt@d-iW?s{\
-GO1L_q}kA8~U6zaCi4|h{*>%iaL8n4%Fzf0X-aqB+YO|(SB?RkanDe-a3GVgA?ZM8C9-D9_p|0lL\
-uw{(;!50<>D{$2jK`nP?B`gi>%?UU!#3zVw+dKYcjL@nWV&(y8keY~!H_s-Hm(Jk6zl5Y7Pxw?&e\
-=yi*3R<~?u)&f~65~Er$zOcJUBQxzT@t>PS6s)*fU8nv-bsd}Hb~#Ga((v=$y=731?ozR*)`g?RT\
-222|*Ijv~x~}#byleLm#mYVEkuDu2^JCK<B0oMWK3R8Z$6Bk@wbqNznip!}xq1{C=gmFTjPtqpW{\
-cRTUcY3SUi~J(OZwXP=<x-8ckij!ufJ5UW<1^Zd&s<&<#CdwYIL9M+3oFpUwCujr+evjb@k%Z^vm\
-kw#NW*~?WESnzw;OReZ6NC-n!SemtMcEVYFxfr|N##Q|?sv+}_^IuX`j>uWz{5KRtB5{H|{AUf!P\
-f<lcJyx=Zxh&M(?Kz^n6?CWhl(dH0AgZvRG2K6N*#>392zF(MfT{~o;MiT!%*-6#75`Ifsc_UYrL\
-c3<x!QvO3~%5V5uFaEY)r=HB##Us^*oA2A?e%QzNopH_k>h*0`tJx)0_sc&1uZep~eA{xxPFkkCb\
-6;K!*S0UOfctdcOx-tPjn!fey}s$1k!l9KQr(x&8{oF=+vP=Xi}s7vx6D#^=zE29YxWgcPj^YCUz\
-*i@G9l1-sqTqvy}tg}5#m^(zwD)Tzwo>aW#c$e*1bGJYx2Fn-|%~L$if2$`ns!24(ynCdBuU9vly\
->Au<Mk-8xPd$*R0gi<sItZb?3*5ziXdR|GV`S|Ds{&zC%g((YWFEmJQt{hv@aqU-d7W{B}@yvdKa\
-bhE>mrFpNyqU3l>D%O;zXI}-W-k~<Um*5s~<{HJ759-Xfy>CNAaPz&OE^}p+`la<%42M)=0hVJ{6\
-3f&5$2=g1GJ4)^FyuReNKlSw9kE;$9wZtu=hK)6e0>9-?gZ&1L&r`zl_KEfs(SW^3t%TcO9<8<Um\
-mE6$UgmK5;RAgW!qtao=x#Y&<P+WZhl?Ddd&SW4K<s}Fdi~19V?-3KX;%NPx--t(g&{K6^@k7Wf&\
-I@9*XuXjuI_fzw`yu8W40eYkVnR!79rlYRNZOad+JU*9=(3v(2?~&7VB*JQEhQ8eqH^$WPQN$w$F\
-!|zA}X8!Ju!C(CZr?k<F6t48!e-n`?~&dwiwI*il;FX6!7jTZ~;x>-$BSxA<nY8PeRS{@wf^wai|\
-9tNP#V567zAIYZ#N3f+%K428!#bg!n1tlHMUM7<_0Jc)X(2*ajTGEu*rHrx{R7a0Rf)L&<GB<deB\
-IurFT8C?_g!c5VseoIZlZ7-;Q>o=*1dgVJ>qW*6zMPl#WA-cLhc70k#_q^EW$_?s$WZ0k4c{($a&\
-*E$wFK&Q8S8L<O3uAh}#R%i9?_bA9d!BjQgjoI7bF@ZgeO3gfmajRwLigIyqEfqklrC1^=2nZwFi\
-a_b`RH)W9DnbaSpDkx>NW0`M7z%m|LB;YCwf1eEppQ5aoR|P|4d5V=3@$U8`TvS?&NdK?sLB1%nm\
-TC`^sbW`t7&HX${0{_Dj=Ucfvp>xGtI4(bIOtq^M8uYR&61l}2~nG>1D+_iestG1aRbXnwQOzdo+\
-}Z1c6p_c)9E)#JO)?AE<=yk6g0r#8fzzEg8`>o)cB_)Z$%aJ=sX@a<xohM(iK-m4#uOViz(<1-8T\
-vJ<@1o3A`UGzTsmBm0bdnhAbKP9IaUb>HNOaGkI2Mo#wLlEW<R3&sAoT&M=V?E>|0!<Sm%d!2f%y\
-C5erQ?0L>DB3$0sC{*fSH-A})`zqcAHXc-n<oY_@A#5Q;<oRlQGIr->XuFneipHALvDm-+^(1$pw\
-CtJ;1rSmmT~dA&b56tcZZnJeE($83cgRxU(H|XwccE<XW#c+AD`T9&hW3315U%$U3#L}$Ia^g)?T\
-IFK81IJaQ%s4o#%V6xVUSYw2P}-J$cAZ=zTp;?ci7Abj`(TzkBO_eRiRCOhkP@FVv~4tEY;h>oVD\
-kwJ9&)MAgrxR_MMJtF8D<z5CsK6}L|vlQh4a+I7n2mDBY4jqB8Px^(jBUYObiO`;0f{OX9{&PoJe\
-#k5f8nqDi8(71Mlc2<uEo?7~3eueHOvD)g_)U(?7_=v7&m0{IAm)~{5=x1Wh70;;c?Il;nc-svjP\
-xkyWKRPo!ubHmbuX{|L;j^f2toYlk{jC#!#Xs$qbup&oS=q@22?+*6LP~<gl#-I1ketvKYf%3w$j\
-&jy{~4NNP3vQFQd(lh8j^BN8)J+)S#>cRWB89;S6xhUa&rABO^tDeTBFfqOq^nvWhyrrvJ9r=wh;\
-x{jiZdS5>pJt;=9DAoefC_TZ*A!<fak%Nd-AABTc!6t+6TFVwa9sI>MA4mz}a8$&{E~U@S;XPO+H\
-srz9>A$WO`7PH|01w3w1Cwv_x7OGl7XM0lHG42JA%Lr(UrgdA}~IoXy35%dI;_$twmU=jZpPB7Y%\
-Q)VS3n39uoij#~fhGcbf-;K3xeYf=4PHYj44W=~5B#V<vF{vR;5dWo~Rd65X23|A4v_5u2j4L<Uk\
-dlxh{-11G6qBePQ;P)cf8t}YwrQ>3dL3(Zt`w$q7R8#3Q%r_LlL%o#Qj*EoIL4$mwvR|iNLU<e$W\
-Kg3$u(pfreu4Pi;``{38s8Qa@MSb>>_bGImNlz1qsQCDG6;O%MF&I<b-h+?QD&%#+V{;7A8|pc5(\
-to@b15UjM)3)*sl9c=(@*zb$8m{I(L<vP(Q|GG)xh}l3SXxQ%or~u}5tW#mR|2dmv0cJ4q_)5*~v\
-HkI9tM5Tk|3sP4RD*8u}%3AD?OJsQNCmV_)dL9L9bO;WG5cICwZ3<)AJr8LDPY!b&3Av5IWBrS`{\
-T@_;}PBbKoJTLYYw<;#vkdjg)4wsUc+z?}1789RPACr<}SRgK$(Ui0~cHCmUDbbc}NX*VoG31L_7\
-spDl$h>C}L5r)8F=UyVVm8I(C*&-RNpOf%ZptzwC7U*M3s9~Iy(ww!?uiD+g2nnxBi6>Y#4Z}0D0\
-V46+Y-~|quk=$<lJPjr-Fp?R=vnRBD-X77-_PZYLg9H^jTTi7Ezk0m&0Z#Xo*=d!f2?AG1bQ!R>c\
-}~*2dP2T&u5b*-7kogjlaVX7z~dRieNtG9()f1v!gGnhH#brljUrL&J!s5h+XeNi>NRxkhhVV3?A\
-akd%{XOPP|GpVS&NE3ql2Ato`YR*Plz)J5E-q%4ckBG9D9V3DoZl%FIE6YuF}*TooelTu9DMJQH_\
-n%wMiE#{IFdMmqvDY|5#6(Ea?1h67T1TH1TkkS&HWk^Ww^1qbjF(yN?NQ=42<WDsK#*|z&C1)GdR\
-T8te>l2$|lT8JQTJ~EMV-cAv*=3Nq%a+s}(>_APxJab=DL$!mir7C1Guf1oWY{_)!H`wn5K~+qBh\
-r(|{fVyR<hq!I6)~1IF<GW0!-g13_R^RoF}2wiHR%=^lC)@DE6yn~IiZ-S)M9c`j3GZiMVwuch~Y\
-$|`h^y)xgvR`h{UvRY@%UtjA6})O)<?Q){Uqim6&U@i4tU%8rvfEWG{|e6}x=I@{vh(;z}0HvW?3\
-U*EL&>Ok=XheR?fxi#YI*eZ8f}l9)xYF4Okd<jyRVA~JoxI9ZX6Qe-|#)&i^sbgj%tSqa(2;-d{Q\
-jWM>hG4V+$YHl)#>?A^*l5DWZvR`Bd@<D#re6S_Pl$4)1Ws0e|d`d#%l=U%*3zCy_ZMh=(B%7A%>\
-tn`=V#AY|BH|)GIVCG4OT>sQPZJGUDJhn5YDSg$R3xz^+mhH-G4YNBHABwIF=p8erX*8-vN2hgSf\
-JDGD%vpFhs)m*F2yc<A6|^N;Vt-rzewjBq{q&bZo*c)9Djz_;G9C~c3gzV9U;9K8}WO179L@dcHo\
-ooYJ5B1ihsuAj+C~XES-y2<8qvNiu3|J2RGwO@M5F%CwMhJ;Z))azl0N0rB9s2@$oY3!e{=K{o%~\
-NNpHv3;OsQ%uW>mpI8C|*FT)$~_#)|qbm^yY4$e7Ux(+`jd_YW{u5rBdn|z;=C4Jf%(peLv|BcIW\
-x|Q(YD{*4B^yp&gDOkY`_(kkFPWsRi=_UALybA9*TYA$8qz9ZZk?l*RE%+{+c%t;%I2Z3_WB>S0y\
-ajK><EBXOW|uC&lW-kA6Sv_OY|E2=6)(YK%cONvNnhB6-MAQkhnL{<=8*sJsB-CTxB)N7m!7Ohuf\
-uzsN&FQ^KZ$d3$z1Y3z6Gzqt#~8e#UUN{7wHOIj_<@v@OyYI-m`-IfRDw?PbEF#jkw;sK7I_R%#u\
-F1Qo0cziC5r!Tz(qmBThVB`ad`e@8XpCr2$WJlD~_k|ACj{|KiO!%|-l_N|$5T9O-}IrFgfqNKZH\
-$Z^pY;Nhg;}x8ZzT=_Y>hCcGJ+<RN`4<X>#U_f``={Co}N7k15~yvJi|DR0iCJjAo`a=ZX9n9up*\
-n6pX0xC9&KN<V{Z@m9PVA8?LzD_({z4(S&bNH4-|=Mum8vh$?lE7;%PrHk<AxE`NdC%qo$oi9DMQ\
-u+@U5TAH4UW#AFTksE9@1#6iNc`awaU-6Mm*J}x%JivoNw38=JgT1Uu?4r{o3QRI=})l*?|dQo1)\
-qUe;bpiT>n|cdRY{+YbMQ;phL69P>x*5u315Ym<Iiv_KDL4Qb4y>3jkxd<t|#8*QqmiK5GQ-2vo5\
-2&$E~;#&ub)q;e^X+pWv0)R84vP5AqYvy@KuW%XlN6zKHx;BYi72V%wFR5B?lCVAoabAID!!{LCX\
-i;#qhLcHrd2q%ZseZpDXR!~SZy{x}h*UrTv}pT)I!%5~%i+=SQTcDxxMvxNF;zVvN41y8)5@&#|g\
-EjaH6(ktGK<Im=NZ{+&pB5cFI;6=EkiSXlJ@dn&{6ZOYA<lmdQUid3qk85w?`r~c59k(<S-wSB(-\
-OB#)bGQiS-$wfcKaE%8PjJ$?<cHhIpLiyA;Rd_}zl7J|pYdk=_obAF=TTqX!SV2wI2XT&XW>KcB!\
-2LFcsaiAF4EWENgpkwFZ?WCif7+Vd5>f6A%E3L-;Af=iT9G9aNIJ^7r%<folkjsANdovVi&&ge#$\
-d^&;#U8d>4+pfb_DQ_`#pyCHRsD2@n1sZpY4ll3o@{e~+{9g%6Rw@y;tq-`I**;fL@B{43VgOWPk\
-Nf8vpkP+#D?@M1jnQSv9g7jMV;E6Lv%QeNR~e9~i-SNJQu9$))7<uN|)39i>gq&MurC$8dp;~#Jn\
-zUWEzkN0?r{o@;P;>D!*r%BKFD!c$6w3_(FOYsV9c!u<f_js24)Ij-wTkz`VxITF98m`YJ(izVaf\
-B08ii=Tdh{DLojk^3!t)>`uKrL@OiVtYLDW$H(KA6|zSze0VBk6TB1dl}_1w&7*};{F`FUM0S9=4\
-*tfk?`YuY+KL$6W;CLq(A&DUX2~E(;mZ{aN_0E2mc{|<5zGIK4k;>9Vfj({={2wJ3i-4^5;Kj54=\
-Ts!Mn9m{^6VO5`4znlpi?x9ooxRkRNaXe&SuO7cSpOdd6el<9g#ZybWLdKKoz9{m%#NAGc!<zPOF\
-_jF0+|_5=P1Z^4&*M16cE{RbbDUh&7c96!B@_`8bs_$OQ+e88t%AN)REf^Yha{DLi;$uC!v-~LN|\
-h`+%L@avzmJ+AtK`VYr%q5N7b{Ux^G%fF<4#z*{*^oT#h+wrYm5#QI)o^B^Rcq4AX^S-A1#);pM{\
-_rz++_ki4zNP-duVD{9b}RWC--cJ>L%t)w<BxIDb<%fyPyWP*{XqW2|HUitJ=-Y%@R2`~|M4d{c?\
-t3J6XiFa{WI-XoV=aug<r&m>pA~lxZe2iU%6g*18%@)|Hl6D{<;{MpYT06{s!8+G14adHJ*b1F+$\
-pbKNnW--<IH|vC?bs8G5<?vKz@ycs*_zDZLHHj*=eNME#GAcmtk=^F~WI;#cu<JSk3k4SoV|#>r!\
-(x8s>O{wC>#I1As8U3m0P91mZJ*WeF#lJU`wZ`@gW+|BeKkCp4|Z=wGWr{G(5kuJbLVGmxgt8@c?\
-1uw@ryGd`t&*Qje>7(O`Z~RZ3gZJBA+Jf_NIX)XN!gt`c_*WcvE8*RP<6-@tGCro@&#?!uPmt>u-\
-NyaLAEfK>nR`jM;Q!)v`0Bl-+wiDF!gD+Ei?i{ReWZ)=huDM9-B)@E-f2J5H!i}f@q>6X){T=+TF\
-U;g4Ij9_bS=JVe;FT3@%#g%*W;59l<Tj&L;7315x<*6`nr?;`GZJbxE*KXzaC6@@MgROUwnx4D!f\
--R`5Cw1t@!Xi65n^xUyR4$r*JNg{gd<pT!UBPT@U4W_<OtwKa|4y_i%mxEN!@#`=!IkzxZ>!7(ae\
-E*ALG#aQ*O3M^Ikif8*q3(l;C_osSJik)H4uxB*Wxl78@qxDAg;CA{~MzHkFRB#r!zcTXq2@25P*\
-<M93_%2V8oEjT%Y^oJk9jW{Ed<Kek@4gMeAj2Db2zP$U-BK<!=d4WxM`UJ{%+=}b)`A3uAaoRClZ\
-~O>u!(Za9_>FAhXF2yf$4a;Ulm4&csP7)){^xkkAHRf`<Lh(CZ}^lG$Zsnsk8mPhK9TYj&!0qjig\
-(T>{o|MMQhczP@)fVf+ws1Wr4t?|J>hKp+KHrhJbMc9iQmPm@ELi;C;kZQAK`v$D(8p4#o4%K8tE\
-VF^C?g9GQ0#IaT56fzlqo5;_0*(@R%8-r$@=Z*o2QOAU)xkf1&+?kC{n$AD5n1$no(W7U_2UK2CT\
--`kj-xp7^;_xSqJ~RIVp>&*FOG^1o7F;pD#&-*~svNUy8t|HlS=QW5csU%|DjyyK_R&A9ap;tyY8\
-l^**f<yA59iQmS#PkP5YIX|2;oAbk4a5KKXl=1=p#YTR^``bys_*oqP6yYo5dg5c}&>p}$l}p#-5\
-AYIvu|j&rSDs0F!mhc5_ZiZwgX2F-|8NE6BmNH8;?F9%p7;eP*AvfoaXs<uv$&qmas8?&kMVCf7q\
-_`duXv`1_7>i$n)t=%;f;7s4f%Bq_1Qe)4=2}Bzu-r4J^tH#$_M-_UWe~HoAbjn&f$2^b3ckxaPt\
-E48=ieG=@<WkJ$UtbTu*HKJM}X@w2u15dpx`yFFK#{`bFAb7tmh7<v3w2_ZPSbPh3cR<6rSAyjQ*\
-S20R|ey~KP1Y{b`K3tod4;Is>+oA7OT75)Xc<5?GxUtgv?y_oXrRoZX34Ik9N`QvI_zn<}3yaexa\
-3H!sdvE_BjH(ZCC@j84j-h>akl=9|3e2-1|sLRM-_&&T8@88Jz;LGsX4fHo+3vRuf>xXar2kG+-(\
-*G5tPh5lR@fWxS@4krRy-E3i9rz+#_ojC|OnL=gg>`RnKZgzY&sTE4hp)vAxaKO(AMbKC?Hha>Hn\
-x%;7t?;hOK~&a?HcxnTkuwV{Iy)4x9QKoi}A$kD9`cRIN=@2*CpIf;QMhc)?H6}#|FFtKZ-ZvsW(\
-u5zsLO_&U&Bxk8Svj8@WHiFXMy{xZi1Fd;9{<#~<NxyvI%CN1TS+@sl{Ajr4Uh=?mYF^Krs0lz;d\
-tya?~zOnUi{{s`QNzr~wz&8?Jw_#qts5%meq#k<_b^}zqc%kZhUOK-uK;FOP<e}ePzu1krJP1Hv?\
-`4h(Lu?5e(gX@o1<MnvKotzK8A18lG`wLIOWA36p!}IVW{25-3C$>;N;hS*6XY_yFO?mi*wD}&&x\
-BpRo<E_|yFZWwtale3z@rld0e)v(m7XR@+_J^;++3ob--p}>I84qxM@KZScYx;MWQ$FDf@gm%cmt\
-ymS<Tw1sf0F;dq5Q&A@LwLHyu_d4He9%Z^TAJH)3>CrhuI(gA8x>lA0d6?ud!h(<GqiPKk<PpDL?\
-Q%cq2acG1Au$^oQZ?IQ4PL-)*D^ybK$jV0(N$-h`7^QUCu){e;KiKRn6(0zL;@@Q=72pZ65;hd;-\
-4KhZvWn)Ac&;dXrJYSQ!1)ZaJ-fBFpP_Z#)uvs^!XFOJv6$ok+p(j$HgZ;g>Qtsy_h@;zRI7d%gT\
-#mO&FU+JY^z(si0i=<b)1#iVkYdN2h(lvMmegU`QeO{tG9VLA)HsI`+X@BCJS12#=;p-@WMoYKiD\
-R}z7XfNQ;@H%|PtE3nF6&@ES{q1WUAK$;8{D9~DoA|^@uhae;BmE#Y;hg`lKl}@Bz$-UU{@{z=AU\
-=1J9{nce2Ywc};B(*Ndf;_9ZfEJET8Urmz`1z8x7j~_9T)E^ecn5impI{F(kEVuvv-p|btBv3&De\
-vldyn!QAN)S)AFs#j@!vk+dg1LjAzu29Hu5XZ_>lavyY!3Lh)?^7^T8uNragvp@CJMyj@yI$wTbh\
-^pW_Aih)-zm;2ZHq{1dKAkgorf{DOD=jQGV(IOPxI*UjWlJmSB!hj1!x$LHeay`-PRYw+05DG%^s\
-Ja%vC1HK^r;Hz;F-sMZeyPx#QIAI*e!z=bDz5S2v50qYk>+y`QNDuf++>S47C%-01@AftQOZYlmj\
-}Q2U{ErjA<$4|@{Uct0o3;{PIPN>@Cwv`FI#^o&J^3A9h8_6AABb<9xsCD=e}WSZA^v}){e<`XiS\
-xnDcnvQ6nf+n?cKQR8rPtzGeEct@7u=4w;ah*DJ^4rJFK{u=`;GA6^KldYlWv3zAN~(snIc^sBfS\
-a7jF8Uyv-HJyF*e4sJ$@9g!$o@OcKjaJA4d2_N~hqMQPSD?dhEbiqop_Er*Qe<(o^C%Kl}-9#RrU\
-$9&4aH#5p)_Cut9U46ndH;C6i4&e91-NH51J_#<q=<Hkxa!zbd^xCL*=V|I})I8u5tw&9C#6aECR\
-#iMtX-ipmQ?kMSbI2%79td5^;#ozJ0!zev-H|a*)fLGvWaVy?}x8Nh=r46alXJHF|7}w%&aU)LMo\
-#Wwi@n-xaj!%=`c@OC&cotrR7vfg@5Kc_zdgE+7X-}>Pz7W^qw{e1r_EZAt0hi;k8MLpk5pPbA@t\
-=z`{vf}v!&l&S_}_n!>$l;3_mUo)NqcB7!i$&k{UZD&-!I39?=8PC8ZSN9>n!QJ_9njZ_gFW9_D3\
-Su7Z>9Kd@HWS&*Mh?9d5%1?nC;;Hk^1g?Ky0~AMGQ<Yr+TbOMb;pY&eGc4bQ^g<2rowe$p-YVyw@\
-Weg`Mw!^e@Hu>~*3*W*_FDQ?Gy?N9nSmiinw;k^zZzK^5)!prdOcop7sfQ*mzIO#ybcRbezFThLj\
-D!dhM#<P<se{x6<xDju`%W=s;)F=2>oN$8lOLz+Y8W&8WeSEMCzXRWXFxSUS{=_SA!Xe}jJOvvkO\
-J9O5cr~uW@8KnQzhvnRxCF<aD1A51!p~zH-uaKj2fhYx!3X|{@?{F~i3_mqP_7Rihg+}(ufnx>J$\
-@M{=Sd%wBAt)tV-Mbhm*Bttne>G(#_Mql-h{W~tf`dOhe;RV>3At#h*PFXKaMT<E!>E|$E$Jv;p{\
-(O`X-!n675Iah>tZ$H{%7k4L^wMr_&xeg80D4Vf_s0OK}c<)4M)SIg<FpwYUw>I*Rh6K)Ma*;**S\
-|C%hCl;J5KAoRmuW{uk-fQ>pJ~Qa|Dp{5>wf>1m_~T#Os=9e6GN0=MI|bn<thv>T`36}SM$nuu>a\
-885@vVUvaa0$hy$kU@Cy6uc5&fj8p!aXUUJQ#$En(i67edDw$r@P2;=#~V-iffwQ}I4+C!sg?F3U\
-Qj}M!)>#rcbY){wn>-af->n>@HU0}(W6NpXR<!dbxYrajUMSy$MAiPv>mt1<9-~w=1Uv0NuTFP-+\
-<L|N3DFp`oGiuIF|6>b8!p42Cu^(<M=x6&yVAJ<67K^zrf8n{dme}d=5@NUphXA@(BM8Z(AsR3r?\
-=5y?p}ljq`9LUW8ZT$MGhdJdyO&Abl0K;MLf63GLxYtl!A}EuMwra>>v57&GyQufs`~OTUW?@cxr\
-YpZE;C0$+_c;w?DoAGAMDq`trk-h}VQ#aED@r%<0=$^9L6;B7eZD(T8R>XWObKfo)mq5PUk`vd<A\
-uWX`!V;b>woAg9nkLTfSw^Kgj{H63y<dYxqWZZNI^&8%JC-v`1q_?|C-#F`D%2T`;r%WfmU^m``S\
-K@?aY>#uWaR%2Pm(3u)ACP_kFUH^FP56)k;(NJtE;iy)Y{Lt2@;_;hW6uiq_ZPzV4EgmhGJLb}X?\
-)*^FT~67l{j~e^hUfDA2O5l_dM-=T#lP?9o~Q!<G4c7H(r3Z;=2pEKYD@mhFy4n3-vdiira7{-i9\
-y7xi6Alunlj<*=s2uPbR$hIK2KPt_R+XFFIL<FYaa13*Xn_kG=cD*{85Sd<{;1h5lolg~y&sd5^8\
-Q9<Rj9@dmunyZtQ6n|1Ve;c|QxUW{MHtFZpBq*r__Ui2^06JCXH#clW<9QUg9uXr3j@^73Uo{pE|\
-D!dXufH&graXUWrG_F6MiY>26yYNbU6;50)eIL%pYw;4??%f_ASw#Hc({bFtxu3)a`~l9v`<_mE#\
-DBrH_)fe8Z@{bZs53Y|J`8WeHk|c3^(ijK@8WvAr&XrsC3u#V@)Y0A_m=<Ae~;_%QN_}0u&bEx;X\
-Coz4Q!8d@R237U$Gl+#n<AvH|Sr)Q}8C-g8w|5`+01|x;N<$#s>U4F2H-2l0WdRcs>3CXT3%Ltc~\
-_K{slMTQ|z1{uEJaKJvgqF_H!BG!<XV5+=?6VL31cy@tHX8ZQ9#-9R3Kqu(6!{ha2!Z{2|_oPg2M\
-~?=W704R|Xqz<ZrZddG8dBYp<2#D~u%{owC#{JYXmJGdXgb1S&s_$RF2Ncmq${Na<Gv@h^axCP(o\
-qP)kRvna3Mqdil__IN#Bgp1sy7ksFP{$u<wPI;gH%WBGJ`~_Z$udX3~<Ja)m59m*xNBM;x#I^W<T\
-K0$U!Ygs+eD06%zi?t3<^9>zr}$Cq!h4=W`p0E>1%3ms#S0gZ9zW!M;au`Fz7rSW!t<!_@D+Fsei\
-7?GVm$rtw5RZ9oQp57qy2=(pHKS1pW^NK+6%b;A9Fnya{ciGcoCjcPkiHFaVx&+LiUdjxrp}FCh4\
-1TF+S{K%4_@#UV`%*sE_dlcs<_IAj{|N_>oJbQ$CTdyOjL(DeZ^LxZlGc;Ua8qq`iaxjThsT%Lxy\
-@1GnR}f6%`EjQGPT_^2yL&$t;E<2SJf@3x5Y7Ei<*@a;HZGxfuj91j=bB76m2`(Ns_t0@2Ql&eX<\
-pVMEsnDm9e!Vdh@HN+2IaxL{aKI=Nt&lbkhmvDT%%k>-|kG+BN{Y&b1Y{19fNO^}}!#3<_qI|%=;\
-wF6KP2@LhxS9CGYw>3M*IOu${>S||PQppe#1B3N&%#ICN`C!{{Dy6K8(xGDyN&dO54@fH*iL%JP5\
-9=ev`_KWJ18%{mi`&1;LGo%{=&!IMSS5Oa3fyWLVV%J@fuuwH{~}z;vVAX8~V3#E-t&5_`yHm1-N\
-(_^&h?gZ@}xYI&QDsf8EFSI2$)(H(raEV*OUiZ*0Uz+)w)&*Wq&9iW~6(4{$te!z=MdycIvcociS\
-l%G(F2UvSPpDUW}oe85xiUJucJ!AIiSpD8c#QtZI(cpi@1PJYEp@E$AJ|8JCM*rXdF%S${9zxgon\
-i_0G2eDOQDAV&JEM=9U%r?>%+SV{PC8s3Ia$BRZt{|7I}-#<qAqnG~s<K$<&^AnUOBc-pzv+(Fu)\
-JJ#$UWaW@5`Uwlf5jGj;ZvkXyw}sD5A4F*@s~JhwDgqK#5aBtJMbOPkpFP*v(&%%L!1yNecp4VH~\
-cNG$7O5SA0GWY`@?tQ#4*x`yg+@0AHntbk1vv*@JhTI7p^5g<4^E5@AofJ-tHv*HqORnFH=6?cW~\
-Cu(sN#+zQZ5mMfl8hq%Zs_UW1SN7v=LV(%0fz+=iFp*jKrK$A{u|yGobh<-18=kBj1^-@^_(^)>2\
-K?8GhjZM+`GtS5croA9jN3E#g-f4C4Q?Lm033BQ3i<Ji}^zf6$+H_pO&{~`SN8Qh33-yqv#EAi?#\
-`2G*lac@$8;V0gte{XM&{}$(qtMJ%F(mO83N41jva1&mG*Wq@Y_%`*yKBNa+jEmkOy!cT(cHa@qf\
-26#|b8rEE7}w&F8@V3Xg3I@lz8^Q@U+@Z?@gC_5H{f>sG1iZh-uHddGj`wx`~q&mdw)QF#k27S{4\
-cx}@7_jxaewK*;v9T8uERg!7M%Yf=YyAg$ovxgE#HqjK>D$d<oC;P{KwL*c<#qsj|0hH*o7^dNFV\
-ra+=_q3Td?sH@=KDm9WTI7;AXu0r=&N0GH%7!<97TVPC7{X#Ls9i;Y&XwKj07fz7`*`nd9S&@do@\
-cE;?BHxc_qf@jTpwAI5F?JFL!g(8BjQ<paJ9$0t)h;T*i%7u5IIj2GiYc-vvp`)}d;9WMPhyb^ze\
-H{sMTz4PCs7vix;O1EOeQC!de5r0PNf4n%I{Eb`jF<(*tnD`zy;~((~oZe1*2%nEP;-%P>A-x$l<\
-I}!ofB1I18GnJZGNtRj;eHa|gR^p^U%{(RpnSs#6UpD-lK=2Ryk-*l1M6}}@O~fa7rgUU%71Leb+\
-`qu@UH(I*AExqI5X{q?<xQCq_^YMIO7MxhwsDf_|MxYU#1cNcolvFug3@cNO<tII4Pg{`zO)|-t%\
-Y5KU|BmPNMwWPI||W;MI6L-hfZ}h4hav#qrZ=5C2O1;>&Rzei<*uzu~pm^c(F>{2^Ay`Ly>3>0)L\
-1h}YuWnY1rsVwvwi{f(F4kt3v6<04#ivh*$3g}=s@Q>4eoO4s6f!rJ@A@r!)F7ANba6HcYR#o2f<\
-F2HZ=<^F8=k0YfQ;p&mGydRqK4=2y!df_Q}+9<hw5x#De{C)v$#VLQKJ{T?6FTfVB|0aF)XpWCR!\
-CUdcangyWasPy~@x$1LKf(*}VPmA5@!5C<ej0DZBX^P>S491cbMWOm$?#k7dhhzDODF9tJqwrPdV\
-C*VhPUDkICreH@eJxST#nzv3vlW#(kt=lIMK@e63)Tj;aNC)SN4Y&;(}u7ukc1(y&L;0p*@1*X49\
-UH=lHlBXW?6MG5#c8#-|4-?=HXJhUeg<Qpyu-!N1_exL^<RBYp;F+enXl5}){ZyZ~3>)%bC|8IMS\
-i9&0E6;w<dJjkp!B#o2!#y_8AcjHlq|um|h+l5W5g@G5*Z-h^Mljycl1?k(MfC*bwihTHK!z2Cbi\
-KNF?5<4Qc`EZV1d4L0v1-RhRU0cTfBe}nb&q)*zH{7@_XAhs-^J+vR`?Og8Pum>-|i}5444Y%QKc\
-&~Bn?>y=GxB)N6tMHF_+~1}Dv_JV7H{f;nUEGGp9Ki8$4$i3~f8+S`ssC{bwjL<G6u*kM;9s%v0_\
-o{V#0P#5x8luMzi<REVBmOoI(FbCcoBXSZ@y4^i+BBtC~prYKCv6eUrc)loA4&Q8K)jXd^gY@#I^\
-WZ+=Rcw>v4WE@r|3Y@e=86coshCkDMPq2d}_QcrAVmZ^ggi#7n6k|3rGnPF#RDVh=v#P~r<u#?AO\
-#ybj-h^_P(zumOLLEjT+xx&@z&*Lb(b+wd1SzES$XKNDVDjF;eZ@pAkG-hyKeBYj;?e+e$YcDw-J\
-i`U}U@J4*d;atyuP~Ko0o`dUgo<Y_xb&F_U8Mr=IO23cu@t#LepW@T;I(#dRyNdb?7vt0;i7$K(Z\
-ow~L-PP0|M^PT&XRr$&X=HnB!DAOozlF2#X{qE#`~hynKjGE*4{7Z08n(wq{3I^M@#(}bwy2I(-(\
-N}pB-Y);{Q-{0m*FIQGdAJ}aWP(l8}M7W8Gnvf;$Lt(jyG}qn@K-77mvp_JPp@lD{jVayb528*Wn\
-xSM*INYf}g|N@mqN8E#yBu4*!M?c+U*!Y<wur$H(9zJOev$DPDl*;YNHJZo;?VW%wby3crZg;dk*\
-y{1x7UV>3B_yf+@(EPXg0hmXewT!^#r9Gs8O!NvFr?7_F=2K*>)!mr@v_yfEKe~Vl3=<%E%-Vf_<\
-r9T#r!;`Q9pNg~bT%3>pj*IZs*n{uFjra-NgkQtU@W*%+{sC{mJ7;k|_&~fJr{l4=(I1A#;nT1QJ\
-8?c<h>P%b*n#iG3-Hsp5&s7_;m`0g{4-vKcbg!+9v_0+@Oa#gr(xag<bQ0!Zk&%V#znXZJMe>e0e\
-%55!tdf{+>V#ykw;6f#(U$<_|G_gDfK<h#WS!4&&D=fjcaiOZp1g@W_&+hj-SD6@CMw5Kf}5^sDE\
-%0-sKqSDL4riV-t4aDYy<7;YHYmn{ho}j+fxoco|-gSK~Ik0k`ALSa&D=BRC$%XLEiy85?mH&cXS\
-(92etS?7@w=0XO3&yc{pbtMMAV9=GB)yal&o-LahCU5xMGc$|Wha5gsL0-S?wxB%DUa@>gPa5G+n\
-SKwy67O%h?@fzHYH(>p7(wlH1-ii%a-@^SFPQVtNjLWeFFTggu2z&5ST#r}c#dsZFirZ9=6zSw1`\
-WudyZueR()719iVLIL~Ae}Ii_gCR@(|8}A_xlpwhlcaZcwbnIbQ{0#b|p6Qduv<qT7JJx?Uqv=ca\
-rqEIK?jg3SPtSBTkK#-h}7k1)0*9d%wpI;x>N2upN(`Bt1?qoqddS9?m(I@ZeSK?_ONb_aEWnqoq\
-fVlrG};8xO;^8Pd1lW&Hl*Be)eGK1zB8zlS*yFX4RuikGoJ7hccvC2R4lhnUYZTDtu@=I`R|Jg+k\
-gr(DbY9GuVdJuNu#F5ZU{$Mw94`8wEjgY?<Bfag!H$IE%1=LsCo^G5%|af_Hgj92h{)pxj_=Ua9f\
-LwxZ(%7M6v=UX!HN}ks`5yxNXeP0CUhZWq+^JVjK1IKT`TiD-qn(K6lywBx9T)_L6*0a9uS)O;~d\
-js=ne!-i$pB%HZbS=-%)Zzx-FVl?I@jj@3;RVcB`Wn~qJlEv0d{2M(LcEOe_E&HN&;O6yMY^5mLB\
-?Yb&-c#8ZS+qx;uiW>9>uG1D{f-@AMrB!PY&8uI)&e-JrV1l=6!3s5x>0O-5D>P%lmG&?M`@k-_L\
-G)5<jcu`d{I-ybou6f^;kIOL^!I(#^ad`Nh4YSMfgnulAO%=lx$7>?2+NnEc+cuXNl9($jv#Kks+\
-S9mn-$zUE)|=lmHDI{E<8ODyA!2THq`U)z`@oi&yFn}a$30{X)bk<Q+e`C@p(Ul^ZBmfl4AX!#@Q\
-i}9yre<Hlhr#$yi=`GAxo1P+_!2H#5f986$$n)19COwwlv(O#R`maga4bn+3NUOgqti{LO(t90Ad\
-f|PmZ{T*`e|hauoFDHmKhG#_<M$-aPUZUYzQPaEq>Fh!<Ll|9C*F6y$V7a8spI~Y<MF<{_)Na%`P\
-*}_hw<UBaU;KHTQy#KE9L($cnQx(o|#2{;rDo7!mIhc-INK$AIF=Ar*OP~<F)k1?s7EwnfXRJxR&\
-wd`FIxN(+}gOqv@aYexFVI>KO9>v7|q|nEgGETiIViHtB=!ZMc~6?;CIf<K?g5a^44FIF|F}_jar\
-BV#e>@$IEzrGxa#>aeH~&L&P6G_jvLz?>G4rFXMT<{c<R8nIAS2PvLpIcX6(FKG_MR2j;6CG*NmD\
-{nJgjmGb^$yoK`KG)Z~|^I;WS&ijk6#YMb-^EvPL{GP*@T;hk{yZ9?!&3yFBaS^|-@)%yxEd2>y!\
-tWiYm?;m7q;FImr@r4XR?cU@N%&!`!_NxG=$LG(<|pYGuMe5*>ry{o>gN_eKkMgr{k+xByPxQ5gP\
--U7d5xdrr}+AGKi}==@BMsyp0Dfu{Is99`T2;czMk#p+x+~NpLd<+>l6Kak)NOS^ACPD<oo(qKcD\
-R9bNqazpI`R#r+yxBlCRVJoag7i`MFecUFY@o^A&!++i&~#{k-RNUr+J#xqe>k=jZ(Vwx7T9^Oza\
-F;oIHMDSkf6&*mAv`?LDF%Fhe^e7&Dr{QR(=Uzy>X|KIa-yPv=J^RIp$UEu58{Jc)wUz{Npt5{0J\
-GFvSF5=-f5^|!7>eIpjTSjxmQM=Y<2rCcnESk4s7T(PVd%fCmfbGmi93b9m*#VHn-Sk4kll~~+j@\
-rb2bEHz@8Cze{V%ooeqVmU`F3&e7+Sk4p6-$%=Pq4ULZfmjxbrCux-isd4)Tr8Fbv0NgSOT}`TSQ\
-^E0xmf-omMg@vNGw;1<*L!@ycCg^#Bz;Tt`*C5Vp$@V>&0?|Sl$rJjbdpM%bQ|(YqUBCU8FCuyd#\
-!(#j;T>?}_Dov3wwwHnDstmXE~p@o4p(tLl6gkq5={nOHW9<-cONNh~*u<rc9ti{)0a+$NUW#j;c\
-^cZlUqvD`IU-tXNlmV3l<uUM9e<vy|8FO~<yvRo`%#PX$B{wbD+#Iiyx4~yjyu{<i4m122JERT!j\
-39+ma%m2jkl~~%v^5kgsy?>(Y6w7L{JR_E8#q!)}bsoNGgNWq?v3xC-Z^ZJVSk{W=Td~B%$$QXPv\
-FODzQY@pyGFmKgVi_Zroy0O$EW5^0_lae9vFs5S-t_jmSpFlH4ga6^qL%hP7t4cU`C^dM;a0JHCz\
-kKU@`G5miRDMJ{3Mp2#j;&2zlh~mvHUh#y>SaZ?e0wa-KB>#to3W_tP`zs?4B7ek5W<MnB=VVD3#\
-SE9>rNXxyo5l=&4dF=jg1~zon*CD3xNBTC3Y*cNJtzbe2@v6s4@JAT{m8k_!8b*=~DPjlD`+H&gN\
-0tHe%f>?g^MI@S-g_Jq#kpQ=>m+bidI%BL54(yi9i)U??pZlzQlQw>L6>GVSJS!sDmmDN*KqIleS\
-rDn7EY(j~{;VdojIIGkT%w|QAJ67Cchm~T>&T|RJj?>Zt$JoI3U6^5I_kkiLyl0S}*4H%;$5F;t_\
-+I@07r*loh2wzJeGiaoblW}VN}ENgu$$R`W@&kqv(lMr6z6WYx|~X-CvSRTsx>uDr0Wvfd~2!L?_\
-9I`QI@T`N{f}e+UbQxYleord`GHTEJp7?X8BLx!<Rd&9X4~V;xX3*S|PR6VK1qgR8m@QcL!c0U0X\
-w3k`j-7&iugZn5tbi@pZ>aM7KBtB}<DWaSEmiXN|oqU?gQ!*-OQjRsP!tS~pW98;iY4T-OrEDJ70\
--doL@erK&4el~lT2PPd{4!e@(sS1e7Qug_MNlGzS>z%x%vcZ&pI@9h|60X7?7?NJ<xr?(T$ve$_H\
-i0J6pQ-GBwr4B-(5(f<w6_e5iBP?kF!;%{~h`HXiWsIg8%Q^}hbB~$d7%2A}yJdf${fbO~s$H2=?\
-s0d-NsYZ!UAN3{+cK@(HCdIe+ovk-snr!Ok&qOd*)IqAt#^|6sPFY$_Np>xRfW3KVAfN2+S__*Rp\
-K(L1@&abVGnD}rHc$(SY29bce|ZcZnICUWRy9@hVxFUc6b!+OlJDU?F6@XOTWVurdhQTy5}?MUaI\
-&c6ty}$xl%c++TKIpOywo+a-VH7l}eG~JiecabTQNJ^7(AMO>w&%CG&kh^p+1@KkO_Kx*l2N#+lO\
-!t-hZqK5L|PTO-YPjgIUBz1d`1YO0$ed76E`{jARYOiRu5bS?Azzb3>UC%KFLbzA_SmA&c5YE@&=\
->QPJEJhj#x&nN16+pV7YE_+_b9u%z-P7@ndS30X~_A0y0T2bQCHn3}#yfED=*3hnuOaVe!_Oq%>9\
-9EB0ev&^s)hzdu>c1atMRrq|Wi8CKcC6erWu>br%T%UR+B%M*?n?`Hsk74UvC4+1ShqlHNbp^y(`\
-Hw<E~rsc=FDjp-?&Kk2~3x>?mVN^ZfC?NU4o~s?J7~K@}{X(u~vwtm3YiE#R+vioZO?&#Wt5Z)GL\
-%4XuWQizL%9dLf*?dYP|HX&BabLeRdkCIPke<YCM^<v>OTKY;R8Y+qfg<{1RNZYv0FysJ#8QObcS\
-mGT&{=0&GEI@r$U`RQp+0QRiwI#+%W5TGiw1T(z{fHPghJ@*{1py{wuhGIwcj`%1Sv%X&S7%o4X-\
-nNw+=SvqrCZ#&9#Xg4P20^hZQDoA`%duqBDvheS-XfcJSXfas}Cs+%|2QFGnY9dJ$XQWnER&SIPP\
-PS@iB(9o$PL(*IR?3u!Cf01ZmmM}HM9^(^KDBEFs97sgGrJV2R#A-D1C_KUO4=PYcGRu4lu%V&>X\
-A{Q9d+h3ZPzZvUTUAGxb0n5@|dTJ?=n2qE^+o#MKP+CO4AFcS@WjK2Dcg|#%itIV|977LNQ>p5(}\
-MI!Dg4o&<fIAYhGcYRqnB3hQ*renqe_ochn2v+ZIU8;6!?B1(^I>0Xtx{WN3HQzNP+-bbgstcI_6\
-RVn;o}EUUHur`WB<n40D3-evOps&$85oD5R^JKW;wcTf`#w@cFh%4fKpY3A>zj2=jZG$ebGQcYIs\
-8*7Ey$C=l^z9h4`#$qiz$-3i2ia2LcT*}f<?!2O3P356^f|>r+g<1o2>9|Xy<F4;2AU%jGV3Mc;W\
->5vF#s7{Hivwz$r1!URG9=?7j17>fAv8dOO?@*5-T)Z}g8)I@_@@u##(zjgLcd#DL-TC3nx~&*Iy\
-*)bWbRmPEO9#Oef{tHl4hw@rKhB{d`HQqJKUW>NufHbX%4+ks3`0GEGoqDJI<lP?+hw}2*0`maaU\
-HD5jgZ|fjiG~!`*o{G|qECZO*j*mMKHx+{4hutk8Cy7eWg&Er=H8MA5?h%fMThLn4x8i?Sm4_GH>\
-X+LJ@#l>6O&91@}Le`9G#1b-m)Xod1Ssd<#&am}Orf6Wv5nn(Hl)jZ0uu6dN<UGpeIy5{jXttB>F\
-mEG;mE9jiiX*TCtN*(U1bhpQ*u4(pNwbU`*W-oP!v&^$ty*XS2Z(fxMm70v@eO51r3ON09;785yJ\
-F4F_-`=Kz3}E6f)8EZXt*8+vSbGaVP=kO`2}&5JJZlHb>g`|^WxXZwo(@n^*17xfz3yJ=*Y1^`cA\
-ur@w2owDRVrMLyl#ojC%b4_Pvrg*m&-9<ecmMW-Sv<q{PvvL=bpQS%WvDXzPBy&+a$H?CTa;(QC%\
-hepJsJdSxXhqd>QBY6`3Z{Y7$?&%at;ZwL-*cMF<<FQ*1iym7<Mht_Wq@tS;Lc)zU)jpkP{QD7%=\
-@_3-1>eWa%iWFP72>OREBq3uJhBC4DowZ%DmzO}?7_EqBch+?op31KH9AoJ`cbGw8l%{ou<lv~|)\
-yUncysUm#4tI+-let%isQw-^(N*yBHH9m(iS*@;Wk2Yhzq*P76Zjt5fm8JH;&o-FVhncLY>GCNEr\
-zrXDB^9C?5iLlwS>*nLX(G>dJ%GtxX>;^%UtRVR+@lg{;<my)Ph>==dPYiBX|+QfaCUWBnY~ILOP\
-sCS<xo6)sBSmYzlsg+Se-*Ie#Or;?R(#1JmiNp)P2@?@0)yzfY5i9)%89^<OXp;v{KWX(<%tMw^R\
-?N9o<74P0j)EPVbQ6u~(|CI;&EaH_Kg>CN@&s)>4;CY+mN9npaX~>pYIy8p)`UPqmp%+VdNQQ?26\
-vfg+%n2Uhx#4$?$AFa=Hr0iJK^`|<?ZNPJ(@c{l9Sg70m!K-aHeT3J|PH%sl}uNX)`!V`}1YRfyw\
-aPZJgphK6G1b=XMRcfZXp7)Ft_1>dQOaI=ry=9dMn|VT&T_hB>U^Mp-{4Sv%KgaHID3$i0pAYL=5\
-GsBJ;RNf<?hl@c_KP^AMJsB2nld6+J4&i6MVl_K%jBHi=WdHEYq9#4SUv0}$hmhx@6fl2rfxL8?~\
-P=0R$V!WGp|tkS~;{>8sGO`LW-om_t!m+`aYA+D9Y%2T_xbU4tHMgm3FB`CPd!{+{7;WlL4IFGr+\
-W7bAZk|+fh<F_oR|a^?`7=&N^4Dz<-Kco6gUzCs)o>Ds9%8c6W7!-S?s1{yf(?zSLRaDyb4xKt)F\
-rl^v!TMQN{<VOsyDC}%1voRxXnZGrlor@YEJ&nlk_wA!nxoK=2LSE|Qx*e6trZOckZ?H)CXjMg;8\
-X70LLmg0142T&gj7n^j{DygXs=NxfD+O8+1b$RqKHLdGWJ07W4zfkK-XPH$b);adBU#QQBtIzIRO\
-RDCGh^zE;`O@1fQE9LBSY1`>`$K&DM*0)6q5@Yc6_0<ze_%VSC>{8&#O<7@_PRaDIlz5|;T#!B2u\
-HvsxT;07Znnr#=7H}_KK7qs9q^9)lN^Obnc}dEMqCef7$&EPVl`6E40+RxQis!R@5eDG^(UY`oSn\
-BV5O||Zx5$cB^VKL8ZT;CHZ{P9$1mBIEy>65)ZWn#iMNpe%lsT&1<^4FG?@9J|^B&^Y8UFZjxXoo\
-<?|(~0q1yGfBBNBhRVp=i6y?4zqw#t7OnRkrp6`u<tQP!Er=u1~7joOhZB2=7wz#_~5p|u~z*R(z\
-FKR-q&I!DsNfx&OzhlIqYZjV7@^ZR^i@FIOC)r&-kzeSU;E``J@z}NXEP0e%mOTF&s`JyX)l<i(-\
-RdUo8;kdvnFwiFuNTc6a3g0h8=cahBb_pkBXwLD-;eveCafMXeoqM)zo+yRzcz<VD(b)0wuV??PN\
-jNFY}LN5oL9lWx_@actu3*33<=w7OYJVTaqInNwtbFLX%*j<mU}<4tEsr_2W3_E09%s2z3jl8+FG\
-m2UgdUHmZ-0)vDO&XPu(6-zgbJm=Ze;q;_&@sPPO)`D|@XX0$gFQD0R)({w-g|Bd(N)KJDL?+BXB\
-PA@g!8%^fxOfEuJ3+6I1Yvwj6C%_mUoYP{M5P~lPsk?c0BcKgupccNsdLuoGcReov=sM~1sJ<Cd}\
-9UiT{X7!ZJF&Ca7+V?XoR{tUDNQERV)R5$lr;nk>4YjSb`x_?pT06QDwEimDhtRc8Hm%#qS?vyc#\
-emN+Uoo2VXB*Y4YwjtuL59Qk0QpL)9A61;$37cR@~dP;YrWE0DNaYJQAClUlxg=&fl{dN4O9PO#$\
-+q;l=uW7-*1R@TB*D_PPY#HXlfUrxKER>nzL7h;{+yXy<HAx=ew&06u>MQKy`oN45ixhpzhaQ?yT\
-zR^dpp|Gs=`Ix5xKbk<Vcn+WGpXY!m10-H|9<&8fzY51pcc>oZK4KY=vpEc2$qnSNuB;T#_BcHa`\
-lvEe@U9kt>7zQPgNc@2I?5B&N`WB1oj8hu|s+56ik10O^iDIegj9n%X<R`FGOruaZzLk{tXy>>kV\
-i&f?rt-nhS3r!VO=5$ej=2=p$78w_^(o^SQO)t!{=Bdw6Pqdo5JxxI9JHzPc8pf^x5p4)XPU|WNF\
-es2}l3o4kn+~;({=!VF!`qMVbmprE>}mR?v7^7=T<LLFrKPJab#ZUyww5`ZA|&3DQr%~_p@B$c){\
-;W=4ACNq)b4X5SQZ2k^nvU?cZd`<+G$Q25|fy62es4-A|fIi08U?&dE&-a+(|mb*51yC?q$s!`@l\
-;|tt6POmTlb%M{P(${bsx<^|HL<7af79w43E%M+8Ra)x7N;n-`^Rq{<F$PHvww%?5IWbhX>OCR(w\
-k1RZMwDYk-(wSgR=Tdalkngp7b9L~@OvHz%*rvbvEy(c(ADX{lp>5jCSJBUTBH}y^!#4vPA-$Be2\
-@^38ny+xP7u^GNMW05R``jZ5LIGGHsx7DvG%`0FFsxZF^Zk8TrxAk(MF4x9;yYD+|&U;9ky?;Y41\
-(Vg$A$1Cu&ue%C9>eAGc`a~g7hQYjNXUt7hVKYy5E~6{o6RR-c(2%CrE8a8Kgytm!#CYT`;v68bi\
-#OVU(3C{_p8CUw+|S`{@vTxM)}^JbIDIl_nwWo&v47`oFGn6jsA3N;49N@cBR^hEY7%NuU+O-is&\
-Y6YTT!Zi(>3{he1#)lrY`q1WXayK|4dzEg7i+)xJ?*w3Ms9LeK0ottt4lkx}ZbuJi<cGkxzfxJ}(\
-&P#@fOe$Qm&o5XsaJ|1i7>-U|^>B&~3d?DTmR^I`pAg7~uugQbkFu=W(Z_s;e1B|!!QlEF(gI|@N\
-pDv<7oye=^XSL4uoz&6eZd|T@oSk1S8r-!C_V?S=i<atl(eg7CcV$UsnePcJl|7$ua5Dh3X;cA5C\
-*(tq{<A6145|@S6M8TLO^OO`%Wg9U!!T4Xcja;fJ<GIv1Zo{JT4^;y6hZ~l{GJQzS14WiU8cMR|1\
-%o_%A?2(5Tpe<NYFbloo%mj1`K9KN8KkU*yq*uymHWo6PLVpSk(Q&pHbQ{IU|v=dOsD1*2d^IAmr\
-a3@J*j|fle1;=+<Tw*+!l0?d>g|7RhXonyKy1tyGrUt#+5w?=@o)8=UL@Ge9AxAD<RazcW?9Yo}H\
-*saEeL3Ya|8)#({l^+ymznwqC}VQY_>g_=G~O6+I#xHp*?(rxxibz(^$NqKy@Gw1IsX8Lo>;yWgs\
-9;gTi(=Cf%2_SCpdkbujgTrQR&%NGcb(}@#7jk3u;%IZ5<WG2I^qzNn3_{PjHvHB5OuuGK2&3p}L\
-wyvTb8&bEbCj+#5WOFxRx1HGM7JtX{n*r52?k2=>0J`MBh<X9&VKSHTHhX9`&l7$^7h_gYtkkn*Y\
-u<HP)j-M*X0zp)<gf>n}GuM|5c;fZv9=w%mAxK|LSH?tHz$Y9)qkJQ-i1!L+;m28@m0vVTfLzNDL\
-6kKGEB`4ezSaPGVruyMx?1538Hz3MHsELD2PFM!<S5OReW7`d8^;?Y8Y+vD0%acAIInI@G!GWo6!\
-X>8VYOjE<gbZ|3P-O-smSbbaQl@857JvrAp#xN3K4UYU8e&-?i3GY#TUp>;yi^<}9sS}W7kUjT}F\
-7pC{A-)^@O1Al&DU_0v8`}qG4Lj3=O5JUe#h=E;=j4oHX`!8JgbElbIFLC!@!4B&)8)?J!71Wbbh\
-i%CH;=Jn{c~7tg{d(g*C+Vue6zOwzb?IC+i7IYS=ev|;TId?I3EoFcw8!Pd4r+pUTrynY>>7|vYe\
->PU==FN`o(}rB&f2_@UZ2Vg;;GWI-cn2N!Sm0^9l`AkURg-N8&WCFzcn<pvO!v~>91h$Gi>1r)`6\
-zdg29jP5YM9Xx#=*5z1K&rCx-H<br=KH<*92ml4`U-4&D>w!C%~PUKj5(;=w<BJ~+YjYnBXFDAIz\
-eHzOAb1FttD8osp9!q=I@lwPw^YA9K$qHDfZy5;I1U!D-oc<KLJ7{VBe{=Cj1+Ic6kP2Ye`k6v%I\
-!(Gjo*{NJ_0I&AwPbhrTV6UMF%ZdBnNQPyfes8ZDK#cS!KZGIMMf*-G#1gsJ21;bY7-H!dnNS3An\
-Id_^nHJg&XJ@@x7QTA3tZThl7E-+#nP>?$VMHPjL%L5XcPIxgLnIWt$DCU^#P5)Odf$g`Ff-luQm\
-5Y&A%k=ir2bfi?|VX`dbb{6;9^MMRtFkr$?Q0)cf=xsK}j`s`Ei4pg%hpn)vFl%bfo?WkE83Wu?I\
-0M-A7p?b0nW@Q6Mt6&l79fd*J2pd)L)!e13o?U;Swq#jVY=(%#@HQoLvmSS#)Ge4l?)e{jL(?D{*\
-8<t3Fihg}=`%A4x<22c^W8gZmtmv0|fA3N!3tIl}@P8Yw~U=umgBR1*wVp4S<q3s~R7SZnN2v{Bu\
-V%I{TQYOk#5}+mxqLU_2z{C26yR_l@lZ^cviB)#|kyvGzjKnH~ITEW3?U7hzSd7FfLwO`t88#!a$\
-__CSs|@3jSY;@V#45p##14`BJ7stbn<_(M*i;$ZVN+#@51T3j7&eX8eTFh5hA@@E9l}(iJA|nWp&\
-?9VNDN^r(I3K8A~1xhgl`B_iN+A768RxaWf%-$DnnujQyIh|OeG>im|-1GREENEqB8iyiONtOPE>\
-};aH29ih7*<HJe;Tu)^MUSjD{1Hp);JQ4AJ34We5!?Dp4CwRDv5$jP`BpU=E2XLuW`#>3v9S@P1;\
-cKLcUG{$_e_ZEJPF$kaLLq=m=#4Af8h9C(tuQD0g-KJd_!so#TU!|yC3+EfcRI{MT8m>A_jxRB4K\
-Yhbg&I8fI;AU%Xwq<|h%Ul3_4;zN32IT630`<~j+82pPuE{N;^VKlOF^ac^5Qz#Wq8vKFA=v=oD&\
-oqpKk)fSmuLG93Q5~=hE#N+bnv;g=pk}BSV+ap?hI}f6HaHr3NTWW0+K<Q_a)Ye>h~^<V5F6@w4B\
-lXEh#?(}0o_RCy}`dniR!>`zw5!M4<3ga(kKluhZL+Z4nl`^+yM_%59DxR9n2nJu{3mV^`kK~9<8\
-$p*C2ZE;Z5x`yn#Dg!!g_*y<U_k49rLCWWqFrAC?r-y#u~Wnu)?-e>A$MhWiObZPGwA&Lv6{3!-o\
-;gFE>k<Qo8Og2E*0Q0`(HvXdAF(7iMm6CFYhuHR&cT&tQ=Duze89^?rVA%{1jlPW?Cjo-wJiP4^T\
-5pv`W;^d5ecV7+81dfoSHke5sk^Kqk{!Q)Z^{2Im`Gk&Pa&D1rU<dKr=|g<-MsQ~ku_+r}58uljZ\
-GiMOBqnO~KlsC8dPbyDcZ4TpL@ZNAaVkax3zi`<0V9IfXb`7e1aVeFX|hES!5t=3EP{&op**o7xD\
-yz>=@dbRFZz=xf{nPLH+3S|C>@#;CV~q6AWoAACVYc3IU;O1X|P)U(VYkpS{)Vr=?_7LFItlx`VL\
-Gur#b|2w1H1>2>Br4oz~EwVq~b@1V?2GLqyLZY!erP31w<;p^V^kg$Va0L}QXdL{A}HQxp211_pg\
-XLc}^`hG(#&H~Ao9XArF^2a!5~L7r$3Tw^+_(+fgrunyfx1)+AR49Zl3-~u_6CJ+P{;=!Ia5L_rD\
-J6Rx@Fbw(>f#4!)Fee6t)=e`=(*c5u#vmpE4Cn`?bBFB@O6LySAC%4=<X@}{l%|GH?5RQ3qNICm5\
-tb+ucUaY~(h_%w^?E;k+F-oRF0#FIzF)4aQF|F@ifAb4Ht3}7Y_5HNmmRu$JCJ#T{Aqe|OCuTqY1\
-RmzkYA%ioPkJi6@!`72T%(Q;I|M1)hH&HQ>paWJ0d%*KmO9OZ>Na%ET4hi2_-h0dZx~@yfFSKhe(\
-<;3n%n)AfH-BTifJ6)D&R<YB<#Ns(tDcfBEAbCDoOpya=>&QC@`U*BkvBR~f!d=IH&VXQY3<BzM^\
-UdP(lE{q>UEL4M0~|Eqmv2d?&&C{_DPuhqU1zG`2IQnjxPZndurcD1hzPPMN@z1mm$QSB=sRQpP(\
-)xHw8YF`=DYG3J3wI8+jI_CZ^-s_nAyLhi-?l5@QNWYsW!|rNCs3{ZDC5UiyC&Y)H0yK%#c+9YNG\
->aw-uvrvrfP9-yChHK09KYt3hzXHlDu#M?jzSZxpKsxbMl&tsOYGB>J0U_%xlkWL)EaOT`)=+9ow\
-?*5Gy7^12D!h`nvEd^Qk36Od`FRA^K*PunxEl&B|wy)O3mGYpGwW$fuBmv9kR2#```2&9x)%O24~\
-;V9qDFfFoWn(Xk7LhjHomzL!LPjt%hVjvt%@ykD)xp5S2z_a2GK;O~s(5rv%+V>^*}7+bryDFCjJ\
-t`wq~+n}B^s;ovm<1~^$W-=sdlo2Na_8>VR^=>r`<O1Fw)L!_X9bzr)cXOIIwfNb$Te>|gbigkF-\
-i76=*fzOTPFV>fZ;aB$Z3N)*$*elgIRUcED<*rK0vQ8?um(D$*s;Xpufh^r7IV)@IRc>(`qFx_!2\
-HBb`RXBC%p6mE3kx9h?Bl@F<0}Enms#;RoL^wrE58HWQqFJTo<Px`AnNvyIcBWr87(VCIeP(f&f;\
-RM@b}b9)M{t8E6DJPS_)JaLf>l;sS*rGC4BKR$QBhKBbvR3G*0PdP@p+F)B-9_4Eeq-gcz56wlBw\
-R_+0P396jD(jt2cXczte_d4WQJTyEZlR)u4#`EwwGERB8t^S5)`}KOA9YAAS)toTeTV%caihO3#j\
-0acZGfn_qLP#38lxP*Um1n=SVhxY!BjPh6IDeafoua>s1#Gf4e8bl(R)!5Wd@tq-os4)W>ANCqL)\
-&Y1{>Bh)8&$|6@w2Dm6aMo3w&V=2)McgR;VBEblJA*V(1XU@yQ_iOCaBL3^*easJ^HeBv8r$zn8v\
-&(vTbaM!&E#E9TZAkred|BU*K~Ia`FJhPV^qgd0kya7j?oDM!?%q^>7u}o6@2GoI8T#Fu%HVcyDm\
-z&Brn2L8Zz_Y?y{YUN-J8k|-My&{X7{GDBX(~pQS9DS!qdGuEsUo<klssWhv>aj{=fG!xaZ`e-Fv\
-AFf!<4H@Ov+nA<}!P44K|brN6zGQ4T@G`yrJf+7GD=r+!FfQ2HU29iSgl8H|2NWryvDREAVPq|*E\
-Q+CuJ749f$p>1s2o^ZA1GZqFB_2lae`wj0r8D9j4nCd&xA^Kq(m$A7X{>!_S;-2r~wIIlo+I65=)\
-hj)BLqr)=_r!mk@(c$-$eGfN^lYa;0Q2#nxga7^dw4Q&zKA0b82%@&g{T*DTfp_5!zf&G)cW+qIX\
-fQt=@&9Sm6p2pckZQUpbTmhy<_%|ObV$J+K!^1(e5cL;JGXbB_RS!7gope?=Rp*;Cx)-HJk;Rz9k\
-@vY>QIkbt1BE`?@<eE*gEN>72<Gq=SQuP6NZlesD(9LLj=(ZaP$WgqR}}N)d7cayrO8@j?`fj^?{\
-3!>+)y~Zbab%4B-Kg(3@C;JxCIAh{H0F(*M^p?GVE!!{hB#ksmaP>`yTcm!XnK#X?jDNFo*Z0S}7\
-|lQ+PHaWG_foN+&gKqC9A)Dh}b9wupU;KLom<U|KN$Pw9J#r|EV!mtl$^j$MWV;Cb+^<!8EFZvGT\
-K!z-a%ez<yI#4m(TO5NuJQ3utJV$p>BB($`d?+Hat)H+AKtwi(;Tv{{XgI?<*bv#qMmUBTA{)Z64\
-J<@7n1e8!5V3BP=nf+E`*pX|hJRN^^al)rt6ifuOc1Ha9?F9QK{jv(eMlg<a0aSCCa^cP@Kr==?`\
-Ugf@I}Xm{dt?rq*Sx_*A%;4*zmu=tkhwiInC$pDk87f(hehP67R8y!!SgZh^QVCf%Y?;!}Ils>30\
-8Y?LD4|NS~|K_1N-S7N%SMGf_W(<$7A6pSjNL=}r670{-H*&(C9q<$9+DeZ3=`L(|N@zjs<`7ttT\
-C-TVH+sr{^o?RpsH3bp#OSGXJ{rFJXLA+;l|q-u^kuVSheL20Qj#a?Qkr?~CBOSZbyWA&)J%kWgY\
-#0iS^DzyFQS@WjK(!C?$1{uR5G%_Y<o5f|ZSaV%7EJmyEt8B}hRr5-!Y}OLD)$h0+0Z}(oPs=Y$1\
-=_ZU4Nbl|Jq(G%<u}?rp0MQg8oOq*2++*H9Rq4ljO-Z*xZiFUrq_LC1iP=kc9b4yN9h$MwQ6Ejuc\
-<m}o^JJjJ+b1JQRi~bvsb0bk~rT~YF8X(J+{_Ey#{2n&caRm>7eS;0PR3V?p?jzEJXhB>D})BqkH\
-_m$9^Lp2EX4-3#mBiv%sD$8ae7u63v{gHI>zL?N{K0?-$iO>$fbQpHr_0^wU(m$4&oQz3Rbc58j0\
-oF|AfWV%q{a`9{t5HoHqS$n2FKxp#H1<E_@taCvWdt?n|VvcxVQU!SFx(P>7}%yK$y)+!M?wE(jE\
-mpYNSbQ3xX=RDs=S@4ylyvLkgcp|l={E@Qp>W`FltL~zFiF%$cF_2j6Ozstt&RFWmtlIaGC*o6lR\
-3Yw+e17LCUrjZh@+#*%tHWM7$5U>#S5-Ny%mvd*eJUhz7>6>u)a9~vhTZ4pU_kNV4P{3Rr>1ocje\
-6hJ5gxy<()@#}w)zOF(<KW+Yo&c&-qZ@QZEA@_9h^}!h}x7WsL6F%tif#^X!Qt|PHBT)I;BOqbn=\
-_85}9}n&!|#CR4NDcC*lfEum-Gz2Psf#y#=aE3%(yMk6v2PSpizmJ$ImodgzYMaL%qq3rkO}{>Uc\
-Hp5x$zP~sr6;q2&06%i&fc(?c($nL|@oR}b+6XuSa?wUX?iOzkCtR}WfwVJ1T`wjX$h*}S5D`#3Y\
-7_GiT`2lx6HNQecS|10Q+5IRpeGfxZUt7njRN9nMyE|{{EVs*&YL#6KldaP72c!cBD{Tk`tLv?QM\
-L+JPMH?+oJqd2>wT;tdK-BCYs;fM;4)Q$(Ezs<3rf;K2?WdBPi<`Z&|7-6%;GC$o{{caYfPzX#Ko\
-CJGn@I<hvKwSK3#`jhq>b5ZvJ9I>l3nVf3W{_Er3jWMf+&cH(gf*<^dd@;CJF*7MWjFeb7v;Wlsl\
-7|$xIUX|CIMWGMPE|+<VVG_uO;7=Ujp`PMHvSt(fq095k_<z`fe)09ITc7!4lBpkUaSfk?A?6)l=\
-iKW4T=;}?lwdO_9coy;?Zvf~>$ZL|xWHrk;)rvxSY&N)AjvWJ9idAn-}^8zr^|Av#sIdI|YCEZOp\
-1POPX9{dSy78K*O*LXu82~Y#lparrmBayJ1cy~Ci{f)De4@qR}WTFpo@Qcf77hh6Y%+Q45UQI;Ut\
-I4qOl?mDj*)e9p;6iq;;KvB$V@6;Dw>iOHgto;E1R&EE3;qr7%ZTvH5n~8*`&{X8GmkJKEtYWelu\
-Zc&G8y1s5+mCQH#kWXkg^DIGc804bSOZ#CPS}=tVa`RYZAsIFy^%}GKnORNsd_w#1rA3r0``x=Fx\
->V?<@havuIMnZ+meI2NAfZo|gt0NoTUHMr<2X6n%ol2YrGi1bu?3g+9TO5`DtMs#FjOCJ97>DGws\
-Sk^@A7sS6^()B}-VF@Z?1{{xYT0g+gh6Le*u0a#*@30Q)W30M*!6R>1LCSZv`CSVCbCSb}V6R`ge\
-kqKB7WCE64$OJ4okO^3vkO`O=WP(+Jen35fDlS<h;Y;=b3fE%^3)f@G7_P^XC|r*vE?kc#L%1HhP\
-r~(>y5V|EFkFwR7_P_E4A*1H8Lr2YD_ox-ZI<YeHzqFRt$xTAQz@j4B}GUZOL#~dOIS!7;|*zB6T\
-0+N3NvGBhncbD3NvGBg_*I0hMBSC4l`qFhncYigqbnfVP^3$MNEO1BE}O_d@%2*5OVnA6ePI($pA\
-v9E>`(Yf1SL{QSPAgWP}=(iXcd;mF$CTLor^2pow}Bf`%hB8kAuWX;3kimm(~&m|!wVV@Zcb_!7*\
-7g-*DjS}`!xN-XgfDN`?De=#Z;5>l5%Wx_`4@~B*BNnJi!;iq_MBmrE835A^JW83+q6_zK1W^JJs\
-38$(DL=l9v8$119K4TJb9AdjmVm(YEupW{qvJ(T83WP|!9)NzzH>(+il*ktmsWitP_E1+Z(4(0~*\
-`bkk35aG&oDQfr7MQKzyd}XSn}#v~CuG#qtX$Mn-RV{|GAd~XRF0lXRT>f3l{w_PGRGQWl{Oynh{\
-8%$S;&2%vXD5dEcK$fYFv+KQ7pKs`p%P$8zo&*m5&OmE`I`y%ZVII69c6ptE#Zaj6j>>8-bRwocP\
-BwHL+1@seNHYvfC*V$(F<d+`iJHg!4~6s!TZIEs{eraE-`{ikk$Z;?fz2Aw+GG6r%1BC2}s7btH*\
-crzgY1Tys*(-_f(<p{_nT>GGzic}?7=RLGxKcN0u7;6S!^Oav%F^0q{GX{3n*F2vb=9*XlT9_E+r\
-{BbAuj7H9zX`%CGnp#i^xo2So;S}mBA9WxXvdmniVHt58xTG7mB#fFM$<ARICSpXB#*IWkNla)W!\
-c9n0hno<-aFenC7^%CHfYsbiu$%(SWQNpN(4ykMMufkXSj&Ki!BBAneW<vBKIY;EW(6xS@C;1ixQ\
->2w0ivyqp+<w~z#|KDrIU!ck{ICBt6l3s)V(L53Pf9RRUky&JEal2YD_6Ok9<btgLu@P2=Q2k2kP\
-=hZWRg|DuUhxNq`8UzDtEc2#%u!@I!PuY{-MU@+R7tNt|Xv!kS63+7@COX1X69sO9!Rz+@R}L2ZO\
-=ba~;uO@)c|WN{rYm}gY}69w*6fiZ<3ohopqAdpi9?o_BAB1X>&K_rz1@QB%O;)nGUX_qSlmr+4r\
-?qgh^n4!OK(0nRPt+E)t=%cMRa!=I4R|T&pqVI7*>4`M8lULb1K!`k%7v{zlho{c|pc?v49SKt!b\
-0=b=<Bzn9%2Z<Ubz&Ds@}lZQ^*{|QUG#<%gP;@QOGVtA$YzrVEhoru(qiP8E{&MraV+nMO2{~RD{\
-6q^RM?vm4TY1Y(h>rI6Sr^3fxX2e%%mRJO`6Zcos4r9S74i@qoR^<HWk!{N+34z7Np|PHMIvRNya\
-E?e8Na_@)aLQniy5U1){~#aUL(Qmnc0gAL7L{`y`;dSRX13?BcMM?3gaja3lwui(_xcjN}qVQN)V\
-h5`)oTptcM}4noaj>Dzhn)dstYB9)~`@&6+~qRbP~UjoM^?MtvtxxF63H_B-Qw$lo=q)AWnfI%?<\
-&#Kc_=nCRuhT*44TfRlK3s0~s5*vspur!aLg3(BFl~F9x{ak4tjyMXPujmFRNi1~yA*X?_lRP#)M\
-S?wl;O<VZ2VV_X5r!WlFefq1Jk7Je79o`3-Q6ns6ENjAkH;It*97HVmn+yZTGwi5t>XvcAeLX~Ee\
-sI<X~R4Yza`6B1a5^P{zxRQ%d-V-l36m@Z9bbF3l8SqeHrwkl(LD;5&(*^pljksjNO)W3T6~_c=A\
-x3j);?s03B%u3-)@0S-j%=pts|ji(jI5A-qa7DR~Z>4?u@z;aibg9w%TefJbtB0!BS#rJ}YVm>S%\
-eL{ND>GZLh{gQ>l>i0B-jPdW5i=p%N!kXIQa2VQr_uoXykXbCFZ*yM?`CPc4&lHrig)$4IklbD`C\
-{$4~N(I7F!a2KM7_@o*dz>DQ8#4Va!o4o)HxV!`LfeccJ!XlQz70aquV9|@~PHJd`a{!3mW(N>@0\
-v4l3-SSonEee9Kl?-sJIc>pk5r|<cBr<Q(u1J^PQ5GmGh7m(JBL*28`p6(?NQ_~F5<{0{SRJ@f`y\
-Ig41uBv;>pBz-_*}Som0Re<=O9ES8*boQ+-_FFg_Q5ZlOcWM1!jA&pC4b1E{7*S*bjC1{a)rKmZ^\
-1P9#H6=xCC2^vJS7}#hd0Y)rI_}vTY9d9;fpZx*dMZj=C^6V8vwt7kb0GBmRnSNMEG*Sw(L)R^@j\
-aL>s>8oINnaC!E2NCbkGyYz0OjoA+!-TzDx1Ur7@!hUp}GA@T^71PVNxw)Am9_{W77<>VU=@$l^^\
-LYFNlb(GIUF9;I|FB*6-N9xE(ve2TkFE$V$#1X{&$kZ9=CK#}Jh)jWj7*Mf;><%B;anSri8@~Sp9\
-S&Z}4%y5(xCM{`a(P&h<V;;)pv@QNkIbuZctA1;IG6XZ*#dq<g9T7R3c?&=AXx;s+4O{iDd5+bLh\
-slD0W6;&K-S~eQ>jSdNVXnj-ODUyqtww3$R5W)h6sq+vhm@>JUAy<9-x5#9CjB6SOZU4vJy;LgZz\
-ybk*_Hj$3?3Q0`L>QBobl{dP>kEJet7uneVr`NGZg{KAj2>$Q}VXUIVc!Sb<BBrDt=AG&$Y20tdk\
-lXR`1g2l}Z*xQJ2!Nwiuq?;+v$!Uh>`hv8O(7iZpKbEn&hzT5lR!aK5^RLP#8f3UqMm*Xe&+4As(\
-pND!2gTBHb&-a8|(oD61&wFI7b5O$Hk1x?I0*zoIR3JbwVBP>>BU+e#bT}D!v*55s1Q}R;BnFz1^\
-ciYQ?{wMn159BvlV9Vn@HC@yVlEd;KqYW#aN01JgSp>DZPOHR1Oq_XTKdB~G7!rP_G6VrCy9m`;~\
-}jN;1lVwWLfPlMua8&HRj2Of65eRY6jf)n5obmr0{+!z$wDw6ry4PC0WGv;1ubzfbEtHGD3ay67G\
-;xgcC$6CqgHenAo8OM8rfeM4q7Rv4lqKvVtOZZa9SPk++k+c&1vHHF)4K4YFmZpd*u8c@#|~MVHr\
-;uOwMBNjA{W>*rxtB^j6EI8;oCVMh*5gxSuD7TbAZ#da$0tC774A|f}zsC$mypNF@{Dwhye#E>7O\
-Q^d8m!((Cgy)fWFoi@9JK#J?_gr#K<IdBM*%>YK<#Y|5QzX+ijW|F;YD&TMrrJ{3O?lHK`DVl7jx\
-okgkwpF~RIom46*Q|%Q7@~W1!(%1WuZxQ^D=tCHmEv)eL_Hibi(W{AM|5VHrgC5p#1UK}gaZ#P1{\
-zDUH%TussU-?RfpQJAMEgN1a-q+4<YOMD`cG616Q579n~_9RqVPr8^F)`UVF9V2p-6L}&~68Nq@O\
-hj8X=5_@K;hnCTj2?4r*dR$v@KR3!qJeKNJTziO?YJT&-aIM_P-rh)D7w36qirK8ethf<KAEfeZ)\
-=eMZ<Q6fMfZQ%K@R6c8o)n&Y|@HK^<^M&Kw21xL~H!%=8o(hw<{=x?(?DVpe@6yafr0hdDWy-=`F\
-qz+{HA2kAgMOw?i1&N4!6=A)KpRDoc!Sw8&MmK&eciRS0mIIchL0+=C9i4Ln4u28Oj<x}sLMLS@0\
-znfq$^^Rr0W9=H8mIO+I5#1`0PO=3^^EW4<R*`6@*KM>;K!Q+^6vAw2HRb@wAfwv{+Lc;nW>0L)D\
-CpAf-cxymIwzdoG=;hVKJy&#77H@_-IjPjKoMzh*r*w^e1P8Jt-7PU2G(IsOn>;$|ejX0`uUX5@9\
-^h2C7v`K0&Dn7H!M});X{@<TR2CTLjd}i2h#m!;lWXEHwzl5*i3Pd?CItrxU`OhQI&f=@83ABd|<\
-p5-Oj$=%T6wZ2_58h`dPQRcIDPO0oRbVB#FrmBh(&5EIu5RiWfYMk3xZCOs$Sa`1;vbY7psLxmMt\
-u0%3O%JLjC+)!aJ6{{=J<4?eq9laygSX{Vz;sXVI!Gxp20-{TBH;z22qC7ojREc;N%L64l+Qje4Q\
-pFi=K*bGGYV4iE_l+SAzgG!iVO{L3Wq4)MO~kvn`oW@=c;@6`hANO~P%KpL4rVGlnIAf-g4IEd0j\
-xR9=ECrvqAn~D#D9yqyS6T@bs@k;THJ;vel6ks&$hw=6Oa)g-)6!d)Z-0y@>a1mh!0V{)@W6*nWG\
-+lH_{l#=c%P!*#yKxc{eA%e_{0UOF1a)I0S5w0BZO7a1x=Sz2UaHq|;AD1}wljG~rz!cnp0ITBG1\
-Qb681Q!sjONoLf&uN7%~Tqb76=Eta00NQ($R_Xo3a1zkj#^}y63Y#(T7MD%n(#78m>j!<|Uyq(D<\
-O&&(a!BLb|#!%GAu<9A(2XV1B0C$fh&_zTBG1&c?)x71YXkR8!I(h*|2T!kj7A%(8U@2k80MVn83\
-o}O}1CwQC9{t0xI2G11y_2C89Wpqq>P1Q*&9a0nUac~PK+XLF=QhBpN);|(ALqGMy}LRmhAS&pZ^\
-gMg&EWt%t|K(kzvnR=qeO-@EKD=c-a$VVhc*n2Io}cNN>oGX68be@!H8otxqTRUwvQ;G1^zuFO2C\
-R^J&?6pV($+EwtF(AniU;qlC?7Y(CJwOUqI4RP+}X(VwnuM6`&)nfFj_&AZ!353UiGz!kN@L+$ro\
-*(8xXiXBzQ=aAEj1D^|7BaXlEtRR~aPMj@wZ5HmEAdS4PwCj$J9$%$YfQ_vJR7-EB%IVPgKJ+6Qy\
-t9>?AbW-}v;wJzvyM(^DFWDz3c?WsOkw6w9s9|RpFyahCMx5P}7a0?9EGBX|z?B|_pll+zSBP<><\
-$UgA$7R(#!+8rm!N@*gje5q^MREW$wYJ=VQ?!qOeKZw#J0#4RdMx0vd7KKkO&~rt+4e4z3~qVG;}\
-oFFWnWjp1{&}%kwqkV$}rE1MD8z$;`@s=TELV$7-AI<<w?#dN<lpcKtRQyw!qBCpeC4|fM^ONBx#\
-u-M~KR5B~}E!N^)~VE+!CMj_#ggAr#<r!fFXhPRC3ShQ7nl*?cc?^sxx;(v+>u1XW>5)MSDVY;x3\
-Maz?4b#H?Y*%Pb!=h<w<jGnTvsr>wjMw#17RLlMOVqGETPtn6-KI1+>jQ5Yo1cYMGw0p%i?<r-rd\
-1t+tB0um~qfS?j5C4PkyXs;3FgxxH(AA>O|B^4mOilvl-Q{f^C%zi<$-ZOcY1}p9fdQUYSArqpbL\
-Fk_{ENRwH2%9dx*8_(*u9N)uW|Qy12M5<?T#*GxXR3X#kMe%wFQsR=@isKXr@+aB27zT&1j@OK`x\
-^GTyqQ*VqQ!C`soangj_!=EOvC|w_0-Z6dtl*5_d?zl2kCV(GS<W^B9ZW2394Dv1X^XzVARnQDiO\
-sj?Uo5HzKrA#;qT@<P<T=XPT1<i|DhL!FrwL6IT|!3uF^EIb_?NjO9mH+)LmK*;@QasIwNS7Q=(k\
-~1tvSC@)1TOlQRk!;lm<3X%J*5-z!YqF{4kJz^_l~WBN-)Zl)}PetBtcp#5x~JpAZN7#<m1#b1O|\
-;HZ9KB79%zxEltUW|5weRRn2S8Ue@`vf(*J$(akT93bcavdZu0tnvpwVOpM`+kD_&K3a(0s#M*H*\
-a&fMS!CN-Ry#CZO2N7SF_APA#|cmtKnZFBWd^Kj)fuqHaot#xs?va!U21?C=B5`Lu!gD)AWDd#o;\
-J&ngTFkY2Kp3pmX(?aQI-N0m9or&^#~>?Yn4e*))GaO4DbYHEd;V~Kleo7mYB9^tT!@oAuWJmT&i\
-;m?FB%vu|P0l0dud6Y0JK?TFeHnG{2lXY{awU7Mka9V}iI%adH57!eWgzI0d9hG_x%BnCwTGbxLA\
-3DW#H)Nl4D6gNT*YtmIkjUD~0s-(`|C<1eu{w36k@_d&VKcU54H9!`Yat1EbGrs$bbV^A5zenp*>\
-6U#2ken~Vph^UQJ{XvO+3ylk(h%`PU3I$Ux`0u7KR!sH<Oe%~|40kyx&yB2Wp%S#l;$u5Q?GeFqz\
-FK>Xg(6PAAA>(L7H*ibD#(qZ1HnGQDoPvSi}fo-Qq($9aM>pIXeUwMN4s2Hb&e%!VEH_0m^{JVQe\
-q)|@jLw@(oVmT{oASB{>{MdIi;D}aTp}2A|#h34VNXJ+urXBM_Jnaz$A46beiWrIl@B%ddbW#6#S\
-Lg10HeFb~`lDZUq={@qTbAz+zNUD;cZ75(^QOih@~nCy$&#ak~lTi5s|9w?$S}#kNtaD#pWQ5zCd\
-KYPtwSB3$D!L{eZQZsBsM>eaD%U;?;l4@>|zElC_ZFe~Z)9aX?OF;tK|5G98aR895SZ2^h9dkmT;\
-jHacnZyi|QMI^e`#6s61p-C)o45pC|h-uP7p^5P02Z4N!Qx{og3f?1JMBT}-NMhIr6>u_&!aAv8k\
-uacBW<KbY3cD(S#A++hAhiNG3DDWxJ6i?X1N;Fwr!tcnz8jaV(39uz3pK_pAEd;bvy4Ck(@2lMvt\
-3$N2w&BIo(u!Q>jv)QEyxU}$v2p)Jx%RI+14%=7P9dE?V*-n(^=>tGFu*)iGz0Q{+})bumBtb9+Y\
-WfcIN?DO?r?X?DE?3z};U#b`tr6*RlJ5%Gkv%?(^<&%Wyo9yRU?sniCo~mYnY&-{7zW-&-QaE2)R\
-engn5N>Ead7xUop-O3-K}^I#=|Y)Q%m6D&TEJl&AjiwD3iMX2Z-Svs%?QYje;xfh7dRFTrTA+L`$\
-0uWKQg**pG&IG<8EA1obgJT>K4kGgQ8q{6r3St)SSb}TgiY#oPj<WN>t~+=ikE#x33}`yBHbOpng\
-p9$7EHO=uJPg()+nLYsa;6g(B3rm+8_9bF0yeh;9}0Vs-{DNpVH9qJ^eS|T8ndWqa-x?s8ZZW=tC\
-4jQO(LX$^?t)CS?^aojx~v316Fysfuvq<>^jx=uYSMJ)~B=zVDW|RCDu^@G3!J3La1-a$__<F`H(\
-1#;beS4ZqnJ|m$HE!n@&}2rcgno(<{4+4rSMV4Fx`}LXl4+ZygQ6;4C9x3SpDV&?lKAS7($D5TOq\
-;wfK;xXS!1?3}(nO&e~w14>y0nGH`f;={<5#OPKf26)_<T$I9w(7}=lA+g|~|zY%tc62+=UVOBLM\
-6qEzJ3r501G{kBI=QYw1vf3&04oD^y4G)zRIvJvJD$}nTkBkwb94ia6a{ul<px7Me#D?Pf(`WNLE\
-beS})g&b~IYsM1Ii~RprNfV}WjFsJm}i3|ZdOwZU54v)AN$Ht1@9*U^>lf9Wn`^ba$+#BsxW4~WZ\
-NL#g3p<NGJcpOi2J+)9e#wm=0Rt7U@j;7RkA#&4fBxlM%8Sz#w|rCq%v5DBO+PRF(?@B2g0;y@0(\
-+8@+TFgXAytrcqI@Mn%d7{FKFxc+XiQmXtY$~ZixWiGVRXy@U;?MtZ2g1EliAD3wPX72;lX&6Ep^\
-qdhV&AdhV%wCDPRx3s%i_TJ1rqimKf;gk8iQ=rr*);3JA9+&-mBG$`}Rc14vp5?y&e0MHQ>b+~;l\
-o83YAR5M^sRmon}G+*en1M{88ofB%<BGVD7oy^sG<XzN+^~|rF<Hv{5k8c#58+H=I3p=$#MWDHff\
-iic)9PPq9$5Ns|Lo}M3_yLcU!vjcTN~h#GKp9#5lu5P%s2aga4)GT<Ezp1y^Vl5ZJ`N6~#EmHVUT\
-+@i2Q{qm<1Wg%M^MEnHHT}=a}p$Q)zKvlwb0TefEq|i20h?Q3N65IGb%ARGOZFN_WpEyx+&Yk#Ak\
-cR?-$g<h=T$_l170baaJIiI^ar6&lb;WY>}hRa0gya$bZ)v*DKMg3&d5QXM@Z3+M%M0Eyh(=1el{\
-aRAVsu1zfIXNhK2HvOurR0(vWavs!#an14*#NxY{m4*b%pF#^TF89ybOfm;gNkfi_w)KUaD5)!+F\
-qy_e3mSM5CNX2ge<N$r+C9ugiT9U5vQbk%4bdE%lfeWfwQWi7hslG%KC3}phn2R40QCdLxIJ<;kM\
-sg(3sxSoNU4kO+{^CoZVTM#=A|xUchq9MUc^LQ&H&?Qpl)Eo9V4-6pZjEd7d6<*3Ysf<bHzsAY<r\
-Ptc+-~ZMIhGNs1MK3z6OkbhS0`MRh{)UL1TIYzkq@l_Fb;5eG5AdEO>-d3M&2b2(x~wt!_pLBxxM\
-kDRZJrZ6rjOx^W=HmsExRs8;yL;tm#MGjY(Yq4(|C0%`?;4jtfU*Lde;G@&vrfT&AS314PyDpk2s\
-~H%Hv*$eh_s11YZQPA4Z2WwQnRMhYEEUSUI7(}d_o&VvMOf(%H3*cJW-Rp`_;n7$MUcRaCCP{Av(\
-OHd@T$T%bmZvy&I=%M$4Dy~R-h+=M^3q&<3w38(*$L<RFah^b~z0c<wY<C&+9CjDpCJ{NaSeV5Uq\
-+Qj>zNyh5>83^_Lvq7Xi|b^3!w|n}=v4#){rs4xK<wIqU9R|mB&1TkF;l#|DftLn777NVi0zkI86\
-;lqBJ6e_p#0mA+=kDmEVd!H0TCTmVd%+FTg0D0sA;xtM9Aa;yU&M{pfpCLEdnYN(ux`b7KkVrjL?\
-Ky9@US3XAb)-EMaX4o^u=*Y=cC?&@s2lh{d7Oh{F9e5;o*Cl;w7m+jS8o$g;$bqb5Dg6Z7paQY2n\
-lbAo4IZku#hUYbYlJqb|Kv0QZkCn&SZI*c{WdSIB2NxdY9k;FW{!XU3P7$@f0xorv(_xXgc6c@dK\
-K(r;;&+i?Gx*VSTU_aF1_j~=4L-0@;qQ}?us9OnL1uYRPn;PFO>ykHKkoy<5Ks}Cul4G3k@rwj7^\
-`QW!9#v%8S>tFGsbSc`POB0+TyiFv1kDO@yhQILJW{P-AJy(+Y`jYK7z^y0usk)%i%YAaEiQZ%gI\
-Io{w~#O&gEq|L@LRI1MZmZw{>0Q2<i2CcG)%ZUvDvZUV1+ca()9S0o`OPSRZwbV&H{cEOAQ?_a{M\
-+=z(!PaBVbp|dWsVK9Xv}>tuvRFe&)*RqC>;($}SmbHr&e+>j1IfcZ!WW!Wnnj+afJ;i;qc0b|?I\
-B8VcP~@Gd<MyemF-U!FtShC}a=mgtZMrJ-9{QD_cSLPqMD0djQaFb04m++0EC0f_q%68$5-d_1W+\
-ZY=L8PwHH3R7EAukpmrD+8oH56H1y>^z<O6ig46=63n{5TA{kY(P)urp*mF*8lucu0p=-|tHD?mu\
-5oRJ_g#_m5j6TFy>vH}>u~9DoLQQhm7?iFB-lJf{g71=S&O=35f#1)#gc{@Ubk4b<;j7NN@oh!1#\
-Vjb8AsvFI{qUqaKz(4(pXp-E26$aSYH`XG~o3I)3bYa(zo;CdlY{931&NRd()zAfTr+}u@nKr#)R\
-ewhP)`97nLasZ)D6MB{D{)0&@G&$qITxr1|jegcc^|BU2X`$hgh}8eSxd2nA5^s*ea@<j|ewoF7x\
-TnQye6NQ)9SBQro^Bqv8Jb$0rbv%{Vsikwb9IUb7om?*M|0#P6ne(~1{`lwb3`6MHl47!*HoOyss\
-klH{lqyf%*gc#wQ1|lR}P}xE>xbQ^c)#1PkL&Qv>cjz%{Ekw+Kbio81Q@Cve);5B&V%8KQoHhW_L\
-EAbQ1x(DBS`>~(hfQj9Y6ijiwspZ@LExr8y}SIzJ_4&V5n)<`;3fuUNAX#~Jo)K%Lc`ko*}~R=ox\
-R=I#lqrQky$zI;9F8>)@2Uz=pbx5^daDZ#>r}lsKny4Pzb>2gOtk2HqY}?O%g_PdX^O@>(1e1*W;\
-%OP*r=N7ncM#2+3wyx#eHnZc>6YkfrKQ$WmqS-Cuxj{QT*5htH3!^KaxWMBuH+QgKVZdo?5<Zpj)\
-UR2NfGuL83wL8xGnicLUIg)m10>maCmP-?Ewl8-6uFetld^XC(Av<#|Xln-;*9RsldZMmR9Ku}Nk\
-96-i0!4>`}15M8e$24_eEh8m!IhRaC=emP5h7jPw7C^%-(>4e?OGN%Nm~dlM8ayBB(8Lt<(Vz(`3\
-KD4>TKkDl4g|H14yJYJsX=<^L`wGTL1{)Kq~&!HDy?>Mfu_f8h3s5DHJ-SPVUbH5-^7W9(t%px@F\
-e4SB`=9(x-H3c`><MqdYZW^AD^xau(4Y*LV7l8V`;t|vN0n{`~@6bEn*wVApEXT8q4Okmd$LAl3U\
-UhjCt}fyCaaE(Iem^-M{$nFQMe$34I-fJtT?PqbnnEX9Ar-?YR^SOW_E(&}m&FI>D|59I*n(&s`3\
-ilW2n00<r2jr7%>}HHfgTVJJ(5!At@Z(pFG!XXi>j;X(Hfd{F^?fwuMJ5#d&gg=x9MKSG2*ip(zI\
-V1vssu|_Nw4m;H10pX4e@GlYfun-Y2Le|lcFHajHNmjh3Et}A*p=Dww7ZtHefHqT#StNnX@~#^o&\
-RTAUtSSjsJSPrzc9ANXO(NT72Tsg^LLx83>t~tx8YmQk>3J9am_#>(G`!d2pyDm*8RYLpkt##X17\
-(D)WG|IS&hSC@72?B`YqJ-i0hf0m>aztYtG0;A6cqI#OkNT`C_+jMyd!GAcrhJ1Y1jh#95CYV_`w\
-dSQ__IbLJc@+G6qE~5(UVDUX+TGGT6!DczVLy07G)5Z3i)pFb^n1-fSV9*@DjteO5GRXi-5YM7j*\
-efXAaxf)EHVwh`xvPzn=+r4LFXz>PwJm{Y*#!h&dSAwXNx2xP-3;EU1iX8C|5k_bziRnB@71T;$;\
-3^wpij%uMnc(ox2uNIZxyQsKbTI*84x>8n)RpI3#Yam3TA|>wsR%JFtt1`Qy<h6%z*Pd`sc$RQ_n\
-ujoLWq4wk(oX}qFd-XKy9USoOC-W$?#UV>gnx`AO*=fVh>7mw8(twBKrf}LPj<8=OC2<Hf~9!qsz\
-*G8KFUB#+Nj0!Lo8fA3SY4GE^?EOa_4!b&Okp{02`k0$q&T9W;V#~@DW&p{6ZUUE(9G8p%sXmg7o\
-BUBg)21l7YZ1`ZtP(1a+{Gpblk~CJ{MsLP<6vt*z*#5+t!CE;Ye`l7D2_W3+q(<{>gm+9^^WlR<{\
-Wq;};XCmDK<1((E6Ww=~3tXrup@tAfJsldUO8dL?6qD!Sn8`%h?lTsAqkvFP-r{Op?(cfl)H#M=%\
-olK)GTcj&P+`>#1Mioo@Sh}^TOqO*tE|p5H7I7euoB>UvA}8&cu?koO#7RI}ED``yiIND2P(9*Z2\
-6WJ{MgaaxA9Ia`bsZ}Is|f2=4m?<6#x1h01jM3C=(B(Y16WB7W1lM`E6hkm2(zpkI4oEv1r}^#z=\
-HYsCqTj)yUP+`0E)v>&H56B+vEa*MbAfnaz5Bo!o>v3pvXg1A1hHdU14N!Orj|g94xwxT)6n#^7`\
-BCpwhAv^W;Sle=&_BL}4rvL!H9JwK0k1l0g|pYd|Pj8C1O7go+r5T1N<U9a*Eb!OF#R43N_WH<q4\
-djeM3xsLr$;H)eO`1)V-r2Q;>Y{7VY;HwzDC@YsN+vvb72*jhz#W|E=gqwf~fxq>!01Zs^ef2U(b\
-Bv|7?=$ROXL(d%!k;ggV`eDLCLLY6CN4B6ynh*It07%6$ZnZi(E3mt^@J*GNK*kbLrGg!2mod^S*\
-cl@g>~x^aH&a}>73>(}1mBqvDLXS`YcrGhZOj{hgSWY6JoN#-R2()p|3^e9TOUS;<L}~UmvlR^WF\
-YjMn9D)D0Hvq%`Wzl=eXtPcI6(;XzQ2?%ngWhs0LU5RGZX#+VP~>NASyW>u*;+O-x>>6Ur&6%;49\
-28yE|5qeCr2ddH5*XnZW`v(`^Xgd#iu2y(pJeCQx42XokON-u-#_@Um(NaR#4<`P@Rcj}<PG$2$C\
-?i}1vNwHuln{QO0P;3UqGCME3N3@9+xqU)l{BM&+ZvbtSfPd-W^;FTb&C&rN^OANO=cA93A)j&UB\
-gDS|Yf#j8>%Vn06L11Sk3)p#b#_d!_ICBFJ%NlG!MDu&unbBAz6pcmD*q27ssH|N|FgE7QBRv{Z#\
-MT}qP#anDeCsvSTo`bmPW)6t;FI-s0@h^@U86^Abq3I!%fZ+#!Y{(Kb@Z*tX~SGRtkQprN#eCsDF\
-?<HV(lkhS^J6E8&>8Kd>fAiqM<OktoAtjZ)C+dUAFvy#C=DH+bygCmBOU~jJYF^XGXvj2m8s|)bs\
-&gVbEjAvf5or<QKZ_F;n5jY1sXADUrd*;FOIaBXuUrD<?&$kZ3{$Jx19HU!aiN&`!7jS!c2P_)<z\
-8(4vK&Ae9wH5_bc|Ca&f*fo7FhlLLIGH3o2PO<+wU0Y<W*c*HU2^$>eo5fS^1Y;U5=^%Hrr2v43Y\
->s`rlM_3R7#sdLB(Tcyn3fd2T8Vra(r%%#SqD1bgPDZSQGCx>IT$x${@23UmLgr4ykZ;;Tik54~Q\
-woNv=0t7^xLv_Y@Cc=&B6?bZEf)NnT6oGL!@-e16^&EZIR&~iBVa>sA-*o1Wc4`qY$RY*SQVZUzy\
-YTsd?I+DSBKXi^f?0e#aQj|pAgzl@N<k+Tq?AlldY<352M!cvdSprrQ<8)Wffn^3-9<#si_oNiQM\
-B;L_E<LxsS}8M>;*{k)BJ-h;Sa6w46s~?uTX#_mP3iR|<sv6a?~23wfr4JcG1hfV5$Nyl3RnLsGb\
-7i6AMEXIy%Smdi6@Kp@Xd+-EReOxz*WYEmH2xV&f)1oDh46k0u(7p;LSDOwYxT@&{`9b|rWDUkOd\
-W2!?S@97}#>2#21kZ&R5r!#TKMX!OZ49J-3b=>jOLza-<%#|TS3YQlH0(-`7!=UBPkpUuC1{0)R6\
-PKP5G9N|_cTA014dfYjT#P!%dyw^JG(y@nbDx<YvTK6KhDir`PtWDWWQ06}$blI$F6I;yMAJdOg^\
-ZsWfqbhsK-45en;N)tX*NRMgX>rg?4cg^5catSs*hoxLnM>SBljK1f<w6d)xuOAL|btexkk+9r!z\
-rTGxw1Jvi7)QY=TIq$jwh9Zllvch7mR=1_(U^gdRkgG!S7zAe%Fi!c{5=WHBNT<%k$ya}U{c%{s_\
-t1$zeBtPGHi&IH*cA&OdSHbLYGfjon~2eG;!%1j3_6m&+292+4Ujux_kX^oK0N(Yf;n0!ONg^ZN}\
-(l-O5gFJ(5LXc%^fNbmrgBG%Z!Ja|dh45^IXb>Z0%@`r$XVe)PPD3-KK7~cZ8}xr}9WTGWSg}Wk;\
-{REkdh`VTtOWinzgUTq#fp`{|1DN5AOBwu>i0p#N)NAFw?wh>#l-wmVtx2OU0ANYpTl0@@CTX&yu\
-}RDe|o-K|3Aj*PE{=VYxVxyzdSL1N<q=BnmyY&uXp(Tm2Vc0_<UIp@76z@>r4K$Z(l))&OJ)q8@7\
-Ddkg-SBPUtYc$%2N>ez{!jWa}NTbkV%q>g3sy4Q^ljy2`bu(hgM0sQFLR{$sLh-l@NS{uBN-H+p~\
-jbic-hD<<wemFXNg>-%l?F*7<{9Q8-ahPU!-&zk=FvO~H`3y$3Saon}7AKdui@!azZZka}1n4A9e\
-p2?aiyIwi4<N05=j>y0L=6^REhu*#Y*I$3GEHQuhxj#Q|(<{)@=UegdyVD!KRNUN4`{mj9_ctuNq\
-V1K}*5unq>pt4vxLB%w(4En5e!O*j;WHOM+%>#wUa#I$eyuv9|E(_@>?*v{V#0#!4=?I5;iJ@6b@\
-sPf^UlNds_%bhU6t~`bvk3qNAh=n-0H?v*K;EV4?cO;e)V|s@~sW-C!bl+t6tgO%Z`39wEw+77e8\
-j2xNYj!#oflo2Xy)3HS_K}gZzEZmn^wu<u7F#eExdJlV_Kf`XRRtk~*dQZ^d8SUBA|&lYVYgxp3R\
-Vrx)Anyr&&kGyM*>FlBP>Qsb{rt5n(5R(s90x8*~98oo1X=&;tGzHs@c;Ia>1d3Sm4uSM_m8eFza\
-_gRCw<^Ddb)Gs?mdn(Vkx_`;sC$-he=?}fze8Z}@PaQh&^^vCj)Y_l5xbSklbY$hmMmrv>I)C?k%\
-aZBmm;70}u5aGH>(%e2H9liHaq83Y>)snT;PHJkM%U~%^68rOQ=aTseffKxD<7QkWry->3J*N_@w\
-}r?H7xn;$?t#4{V3(B+k=k0HS@=nufAEKNA2QmMlUZnYV7MT-D%iy`E!-J&RJIbi4B*>-D}n9l~q\
-4`^!{1p>P_ExXyw(N_l_-U_{6!NGxj`V&GYT~TRVJq8Et`g`}t2FnUp!ZT(u6HE~b55{mN|5$xRI\
-d{zI3SZ2RvNZM*%B-K8r0Fz5A?&;2Jy^HKM&v!-pX_`{TMO`5BjYg3=SHNtUhZR%#E#cu;`4Yrh9\
-<11Ho%%nvZ{yDaJ&8(DC2QIyaWgV=RdTjn=bYso)g?-bv)GN8aNs|s}t<NsLQRnGV6Ypvav-|w_#\
-wR5vEZn~Fn?+MQR~h`q<dKsaXMc0?+4ORjj>V4L8}n!H*N<G!MweE~zJPtUu}STW{DtUuZ_isXs>\
-%jq<@%)xUjDb)qg9UfT087+(G|-({(`0@=1jdiYxcs_v44Kj_~`Y8wl&w@nAm(z>klhd%Kqh1)2p\
-pVZOU6VW&F>mWpwF(eJ}oCI<??GN84()cKUeq1;>@!WhT2{@BVYw5^Z`kEB4L!maop(QTOPhPrT4\
-{e6v?Nzvn)pS$fNxd3k-olvTq=j@`Yb>Gkse9JG&_ooDL1Z1Mj-*7o!^%ij6-$-HmR7I&2y*0yxE\
-y;AKd@0YusH#K|a$L+6WKYwV!rc37@n|S@Y_to1!-?Ck;<0;?XaNzfGzyG<dj@8x1x$@4$pZeXcI\
-%8GIyp0tCuYK5R^83BBrXT#d*AL~6JvsB+b3K|``_J4^+BkB^bN%}~I)6s@y&wHG>ht|I4bQiD?C\
-U)(HdL)YB(3@2SGCU{z4rE%J>ws}cdOo{Umx!D-Il^HT0ds|Y0UJI278VAWuD&HZQZn=+qIh5wfp\
-|Bei~^uFW21LH1~x^zB_HYzW?kF>&*(EZrofpV_wILo+T~bU;XBsH|l)TZtZIu3t9{@mAJli%Dud\
-4Pxl#md^ytUcGt$sHn*F9WM1%F^wbAeE<atV@2`K}{Nl#pb{Ch<IZ}S!tc~AvtJG-kIp6Pf(Clkl\
-w(0(yx1r*itK}xnoibyl=d(lq>$FjObjSI+Gdh^ZmmM>r&*TrT6#I7j3ws~`Y}rE(zxnp26~j~S-\
-5pW#=qDp<^m+F5+hh8Fc{ZzBhwC*w4F@i{v}0ep7b+J!b1d`3%FEO1nNKXa*`xQ-bFFr@Y*zN2F?\
-~NA`>+1Hc3bZZ8g=HQcYgX}f8TXQ$A?vPKl<FdKc_UhS*v~e@ozKUHWyzv^_BVEZ<-g?U3|7d{jO\
-u0l|Onc`#*~c3O5~J^Hep>bL-|Td*zw3=U2O;>EBp?ue$Y8?Y4ER{%-9#^v3r!Ds?Yj@%s_kZ&h8\
-q=F`VIPrLnPEw$VKeS7U&GpFQNzVy+*-xN77de7ecq*2E^9k<Qgd+F|l_I;P-KmOd{(%Z%#KeW9|\
-)2=@~)HT0yTm6dMtHWA9QESMAy)Acbc;@e_lP+JJtsRGDEv!;ul%^r_W7}8Wu-BVc@1%M7+b2$3L\
-_4RC-LU7?X?wFX$NrJ!Yx7RpjkP&-_q^>tc;(*Sqpw~2YihZvc_m*N-2HX;tF@ZmT9Z4>ac9Igqt\
-@K)I^eV09~xfjx?$jZ#v6m*sOIa|QL|z4^mk9#7WA((Z{LARhN~MVT*_H7a#hdC`x|WSx-YQzeQ%\
-joXZ*8Ht=ZprX*ug>6HLuN>HO)nOT~WMJ9x?EPS@|%9$NC?`6ab}8(;EfH`~9(PMz5Mzu#;>FJG8\
-;@~@{}dbi+*e|EN7GG_JB?^cg<n|dBvSLeNV0wYfju9CU<{S6}zT)lkz;U$fi_voJfc+(aeZKK8p\
->y&L)W6_;{^Q-*3=g<qyTiP1d>fUHy`r2N;wO`D*IjmrQ#XXCPH=0v+YQ?Fur+Tt_HGA@@y35<F{\
-{7+*%a7}x^nLT)>y5vkxPRQvs-^EOtiEis-n?nT_OaT@YezI3pK7RTpVQ+_f3st!TbwW7($lSL!I\
-$edUM)4T+PU##w=8b+(7Z>R>^=YT+nb)-{bAj1`;QdAI<mx>jPAvLnSj=t;~1WQW6g!Z%Tp>o`+K\
-QYCzdSf-So<pvEMbCU9Cs^p`Y#<y}EqkskfJ2C_lZ@fGx+1K6|Uy%dgL`II#7O$6S@o6H08+AN&b\
-9JZj3Wnv2&Cy3w%KzWfezA6waA$}P?2pQ{|Z_F|7><3@FG&Rg44vuSCUz0V(WRXEVN{l&Lh?f(9R\
-HD%tle66MQ_wT0qYNvfVym`vh7S$ae<h-@M$uIUl8}<Loc%t``nhUCrnzw4qwQmY1&MVtt)0*Ylj\
-(yWdnabbxkD8Lv^Vaz#?=M>2pz_N#denLO;->R^R;?Mb_28*p|7_jcdvb+NU;f$ejg=RF8{S~rl>\
-+09!#l@V-W`8pSGuXyxYCCMdoDD{{c+uR#}w<xdDCv@G%Gh`!Loq^w?ERi&YhQvAF$rNtpB6k)i;\
-jJAHKHbxz*Sq_sp{eM@N{;ciT_}Ip^$dol$F3iN2jT9JlYuDm=G;^nU&NM$6ZYzL9ojL)x<^i#1H\
-WIHgO&vw8bU9W8Bm)86?7??We_*Oh(Q(r3w@2|w2vR(8d_jw5tw{)aMpbv*d;r<Z)yeyh3fz<|ZR\
-9$UQi22H*8%;}+h?YFdVU;Ods$Hq=u*{|b7!`P`GESfdzqXv)9?Xq3}UFW8`C)%zVy!-CA-XCWdp\
-stEfUmK8GIIK;u>H4mQTZaa?{+YD#!1q(Xf2rx-FM{T)u8Quj%M}~YcnkK`)}6H$eo*q&hR+>rk@\
-i^`PuuE$J#yujXY0D`c{!)+SN-<Ap_Arnnm5RqJigrE3VmO@V{WqI)E^fQT==%+sJcIvLLYkn?Ee\
--YJ3VyLf>rA`jPBDrV{fNfCHCYzSu}N8#a<1{HTmEE58rRlZ+h10{~lR&)7SBZV~-AdxyJf+hc;i\
-tp6s9Ae0PH@m!4XCcB=lPa;5vv-Lg9CWNFV=Y40s=_-MDSUm3Q}T7~>w{e#+P+E;n^(a*ChKGdzc\
-=iIJS|J}Xk@9D-xeeA0mZ>rYwiH-i!W7==t(sJc@b9Bo#EY99!=(pheOVt`Sc_{bJrSb*o-_Eauc\
-K>gaY0vDOQ@QLG!|a;tGFm#%Oloe)>$vvQ1rvU)z3}sGW0#g4G3dag;IQk@9Y6H>*5P$>I`3?l`%\
-BqZ^}Ty-+u3#R%<TFLXMS>L<_>iJcWpb`Rz210@X|k;zgg_~h<V-`R~;#rO>@syu^e9Za*1KhZ>4\
-|Sr%%s4Prdo~Q@$3TFP~Y|&DL<*lg^FBtIV$7>(UV2OQ%PDJ$6>vSsOZ+`JhDW7rV@yHepMZhEC&\
-<zH3iB)N-%$PVbQi4`d&z>@5Dq+<G(TwIAE7#=9RL|L~!Xzit?o@$~K;GxL7h-Lx>>srS7+GGMg+\
-lljc#oU5fzcE2+J*S+nJRIOTf(gG9Getz2qjmIC}xusZL*NI@?mM4ZE_GUb?zx2loi?`l#`DU-oB\
-}eo>_Wj|vgZ{3M99mxV#q^i&PWXFrpQkVB-9`W2D*JEo9(UW?9+^>Q=<KBnhirH~xIg%+>z&^E->\
-R$_cEIpTg$dOQdVDqFtsmbiyWtXYt<jQhNbYktX18$lKl8%H)-CpQp5kc#`uIDkzpOiPc;xLy9rO\
-(jzxsZSFEjpgyXA_5BmVfb!(+`owJMK$ZNr_;dzOB7Wz&zZuRUg&UGe>KU3`rve1Y3blh!wz+NQ_\
-V%`;q+b{%T<K`GoEYSN}}@jaJUUs^C@WX)B3$DUh!R&&+)NzI+R-YlW{Yv|mz`e%OGbD{E*Lpz5q\
-{ClOQ&74<yRBbf<^7agLcn?#-;adfF4lKNEx?W;isS4M({E@a~&o{;HT-{V>_`B2pb97<-@>Nai8\
-Wvten!Yuv?tm8$jmo{e>yJnNdZPH{Mn^7R+H8HZPwz8xr_cZAn*lX?ZT`%8Vb0+#t(<fFoUZ!s`P\
-Wvj_-Jq&&!T>w5vN+CL;F~R4G;a#U*@A#4Zi#H4d>fa=jW`SHf#M?gD!sfMA@2~uX>v-EW6~c=_O\
-nB_b#8>_lKoI!QmWx-mVSnYpg<6&Ma~a8F4AN*<8Hw_|rSS9y;L2-kY`Wp8UMBcf9ZKUYloLYh5r\
-iHS=`AdfkS@^-?Yb3vU$LYu(oUi*+AOsIP0e+dj3?fnV0ny*8!$=nB0o#q&!U`c%8(pF43_`?8yx\
-Jp5tHQUz-sp0hbvcGX{&37YRRx&(%=yM!+7osr=T4!pgu#_==9%A9)P<TjlJ>GQ|GPv0AHb!V-w)\
-?yz&a%O9TVT;bbKX+dHmfe<?I6bU$v$P8hzJ9iMqg%h%ZfDy!@Qdp9)q7SC?>WBe<NDwJu^&0Ru0\
-q*nr|;N4wA8xRzt{H6tIztkA1Rn$W=QAy>!-~4`=)E-q=q$~>~L+$ivIcYzFe!lR{Z*%N6Now^pA\
-db&+rYO{jl@O)VmX^6=s}UyrWF1Jx7NY-p)Ax;?s}SYiz4_e*KwFPR)OI4ZnPRZq~WHK(qe`W*=2\
-1'''
+c-riJ34B!5)%blg37JWV0RjXF*@#F26-0yt0hur=n=2rTkOV}Eh>8fU3sQq=KT+I9QBbUAahcHC>\
+Zi7umJ~2<pne*xTdOq*pfiL$Aa5Wc|8wp#@6MYyOA<i*H}m_=Z|2>1*K^Ny&pG$rb4YssD00i98|\
+L4%VE*C-cPtycY{@6b_nquah(h4g3BFz7dqFfIzbnFjg!G1QmWhzU!fBVyoJImaTTF(}(fr$qCl?\
+kjUvSrQEt|f++Xu4Wti>kZvtP|oq)2`&EL^tyS2rvRTHpGoSm|qGv}d_K3$L%Uul&OK^9vW;HGje\
+F%L|v!yFp){`#Dznqd4u^M1p?`3+FFee#fHQ76$3xn@(2xe#QS;d`yA$ExB#k@}T3*-N;I~q-S%;\
+{{8B<I~Uz{W8tFPe!0Y;z9YOoOAqZi)OZn3*3)_}&6}22XutZZsnh)M!=}R*{%q!71Va}#4@;K&_\
+0zb%)zMmg@;DLSo(tM9xyNSze(9d&ezAVsIB)qpeZK<hvq{h4;5C8PbH&7~CSP{xL;-u77>(lhoW\
+5I2Rit|2k!IlAOPB6X<%C>BND;#Kf+c1$b0Q(b_%oScCKn7~_=a_?t~3)j{Eq&}OnO~I2%`Hny1t\
+k4@Aweov%GI6S1N(&$-JHaJax~`B<Ha853IWG#_o%kAHNXC=o<r!N{Ofc>FAY<%mX=oh!4{31-vc\
+_=X1M9W9cEkT6V_}7(9OG4;nOh=-?aghQBm_uAH9?2*^M6?q$mt+&Xw1FG4@(iFR=wEQDn9XM_`e\
+Quy=SzENb0g>-y6J{_NqPsgX@)A8x}bbLBK9iNU*$EV}d@#*+<d^$cIpN>z*r{mM{>G*VfIzAnrj\
+!(y@<J0l!_;h?aJ{_Nq&;Pfd7Q3mYd4;8-*=%x@6sM`B<}|geI8`mTr&hjbPOU60E>vr)iK8}wc(\
+VvuTbp3>mf8y{%ghCp&Yh&@z0PE<LP&Savta{S>ogat?l|Htfp^)Ezs^iH*2dYqWyJ+*(Q_;>%@f\
+1&JPKuMV{G2$6%#6;FODtd!Y|xrWn*m;@wx{P7uNeb$P)wQ<a8{1-v-`xlFhsRS+cgJn!s3070tz\
+jj-?L!f&GWJ>Yxwj5Yg7S3dl>_YAMDtN=36B#t8ZF{bI=1ydtjx-myGp1@f3HnyZNqMzmh2zjQpQ\
+DVt1c;t3x+jthP_Lx1X^u6jQHu{h2+Y};M|^|5*l`dc5v`)p=?u8-mUHiz$b|L4N@yB_AzS*-Olj\
+>F^}KDROaIl%`jslRqoBie%hS{n2f`{zrO#)UA#abvmY2;q<QMf=7qjmM~cgYvOZHcCH-MrC#I7j\
+ueZ-$KX;id)e4UbNq|PxLvJKhyUSjHfT;x6HAPv?zBUcE`NXhbW|*U*8PMU>^w4jo%<2!l|2ntOo\
+faf=64+nLE`qE$La&ydnv3EgE2%3a~6tYljf;QYh~pV)K$xs56atZxzpZila7@c$bUkI(QyHyeq`\
+>DwCsj5b@qGo-@pjhX|whT|iqU#eLP%M5V?uVf7TZQgVm0I=Qk0@ZCg;cD%szA&)49v<Gm$lG%KD\
+pe}c^&FeI$s7`afnzaDvpjx40x*YStd!*anb6ouc{Fcl&)gWG6g8U5TUyNrhVKiNazttwnBW;)`f\
+#-oSzRc<BP5jM-Jc-0R4)Y}PJTUG`d<W0(;cqd(0eIY{m?w$n0a$Fuckuib?_=7h#Fh3>_<jZ7Z{\
+S-C-(AGjykbU0(~{{xvz_SNc#!`Lf_i{=R+v*&XLU;D`&h>Sn|CAalg;}G{-)WyxAVGh6Yw(^sN<\
+diz8Zu^pYCEnqe1e{O^iJ6AA3ZeS51mM@9*Lb^2$6C_+woH<BOj{UN^!nlQ@u9;+*~w((3Gtr<G)\
+qnor^p4-3_{@bv!Y81Qt1vVvD5p52<l<tdb3k`g&D?bOF$++o_9ou;*wpB8yrTiei9?+mT2<c!GM\
+x;MG?ZGG8KYwPQNk++rGH*!4Nbh2e#VBTopk==nu_JI7+j#A{2X8Z!51U@&QrDdIa5a*M?t1`ti@\
+=4&E1I2S4<C{apGxAB`o4Mi{_@oW~Q(gzpPT<3o$IWLvE*{<?KR_OLBmRfqJK(p(%y?Wh{HHvQ_h\
+mNbf#*f|Th4e~4CYDTd7yu{;yZX=fxl+P<E)q`k>`Ov--qwu`4Rk`&v;xM=1JmtU>pv72hT6?J_h\
+G;*8z{42C$9Rc-#Qa<BEZ=+fynZ#X5kuEyZ8pZPV}<_<jzrdpL(tNpZevUGJ|umIB_$dJF2nk8@a\
+sqE|uVgE{|192h12AIJZ@&1}32aL&vOKI6rIfM>S&5Acs`VYp;%5jdr_k9j<(6GLA;3B-kUUL)0c\
+p;Tvgsm>ocejYi=V1VPij0ETNs)D?bl|3r{L!Bp-(0YeEhV|pP5?U`6^ojldDhhZi@L>w47zU?LO\
++d5r*&3t-^pEo(&s-DJ&+z$cc(zz@{-I4m-W2eDY#O84;m<I*i~I^Hn(}27%5LKQp`|5BwDVmQ_E\
+Y2K%_}xnVA*~lWZ-=*2DA=s)L|ZY?}2w%Khj_@y;F?;Pk@J*m*O+z^+5j=pyz0+3!=^#oKMx6S)b\
+~lz4fprvk)>RK+mj3xOakf6)NkH2bIA(&$ng+Uh(2}T<!r*l$MhkC(zSyqNRDDeZV!)p@?^^NC(=\
+lD+f6VG>y9PTt(BJE&sH+EYYN^1?U*-8@Hb7wN)k6X`2!#{S~OVp7azjT?%+v70_}O%ykv!AF-b5\
+PgO8}nvUh@JXRNOYF=?Uz(WZOk3Q!L_!-Ly#Dh96ACNC@T!(l=Xjzo=4`d2CZ%q4wSG<+U)&*Dxm\
+b=@iTrti;H1t#Pt;xjv`{n_Dv-<;V5vBlZ<dqlpXR-=;^G<+wKZP6|SDWS7^#XC6$Yk?S0x)obOu\
+=~_0Qq0<1>;U9j^-7Y!MK&c_Bjst)~zrX=U&HfuoUV-`Ghq87V-|n%W{U3*dI*aOnC~!i#mXV8~F\
+b7kXFR!AIn(3wz;xl{;gjFe=0@ZN@}*Q3&erSd8}QKbydKxs{oEwBL7?K=-3$!r0H=W^0DokrW+g\
+Zun~mQoIEy2w@ElJ#+C+Yeq;NVkL_C+8<fF%A6bXAXLC8L(<;T-UdZ>2&E-k6xjZpi{#EPfI~UNa\
+%bmu`@v&9<k1aTUzc8?M_#LCe@3euD;rEpT{qei&z_#P}(sTXs`<`=y<9E@(K>U7g5Lx?)5q=xkJ\
+j$w5D|aRn7q)xLG&TljbwMS}smr4N8TjOYRDU}M))7_FY*zg0C@)T}EU~9<qT?~Mam<{?<e^v>R1\
+^a*gSIN5e!wSJiM?PG@-mcz%}+BtfVl>FacKp#(<+$Vc!596&JO{z+#!K5n+N4*_6C^Q^gJO@w%z\
+h{c$>mq5#&kL=c$eYJ-93A!QBA2q8u+mzg|K;801VTtjWt@U0-hR3v2nln_h-By%Y2^cN&gAUu~W\
+WV**{S6m;2=;y!AHeNJVCIk~c;dUj=nJ-HHP_*;bKsQ{RIGO=7A71K8hdd@_-rhr`Qtv-)(HHy(Q\
+=~=X6=sIR6C@r3&UNMF1YEYLa8S6_@VQ$q5b1(S9Z*ecs-REp7G56kt^<$sze;VoG%h7}sjVUSqY\
+BY%|8gn1&;n;36(@#B<L3TbyTwS28d(jpOV*vTMREZ(eM0;3o?GV5jUN6oCtjnvEUcdv>Gg4oT*7\
+Axx^Pi@C$BTT*rvrh$ebp3ZTR8GG8xM~27}l4-#@S6CC*Y7LhvKm683n&EPS04v`ctg+X9AWlevg\
+i`w)lNI&P&BO6a2^d1>_y4jdN(gIFqz`FMOKXIDF%L$zYt>Vw^G3I04VPPhqt1H))(zPcuG;<NWG\
+cX`HAx58&e*#K$>=k8{4(pL6Iq-{IqYmyXja#%cB+=X11QOve=8<`q+5opLSk#wd#WwUce${c8ht\
+Ntu^V9^N`$KJ+PnUjFz+k@51Xi~M={{TH>Jmrowy&zE8{1NhRXf-j{F59CV|puE+PFQHwr7x0SS(\
+1%VA_b6P;vvqSRuJd5t+!Q~R8WrvDz$=`^$tuqMB{+9>ZlkrM%%82!5IBI(z~i0fWEIOE;p?(2SQ\
+j|WeJVFs_oiR!tEiq;X>lk^AL_(#u>|V*H{x0jtJ^&mX$I=ssnj4(s4!m-JgGPEq*=g|dQ+Z6*N(\
+%a{KG)Ug!T3wihI2%e_AJWDOj79W}1LMC8>MS9#=?Qv|ORh^#RvCx^iC#@<6A(Pvx5eC+%Vl%+ik\
+mZoJBIk&Xj&6(@}ALs;|p)<ZC!S8zN7r2Y*+9&3W}^yK47;^Rr8<C#O()>3}psT+%7Jjpnoo^(9(\
+#dwmD-{N?BsN=BQSU#SyHrGwu#(o#ChtZv><^sg&Bwl|Kq$^v-)D9~eL!#j~2Yz9G-@`nKe13ty)\
+y=ngzq^LdZz9?~*xbItVCZG`Or>TM+Evk3I~#Cyr^$i#-6AVrufX#bZg;<73geLiMg>#YdXd(Td=\
+l3-inXDR<AqHjkCQEV-VDI?j8FSH9(&5)N00~aGv3MbZt>Yxm6{^#+YGI5PhsDRp>I>6Z{;S(Z{g\
+Wy=6!?bX9(wgx^?d7*RXZ&il?-7F6PH|?z`B=)sP?NoZ?8LKaSi6WzNO?qio&*kQZsdy^gqgi+Xm\
+ldfvc##uM+Kp&smOX{J*1cRm)x5ewu2cq~Tx;kdRGacv>w$GXuDzfG!NjJbyT7iIyUoC$Q#Y}T0m\
+p@38I^=j#p!Pnov85x-kP}pWHQA~CmznJM_R>J1dq_BBJ-gxdPZX<+xF<*@E`$*~OqgekUU6YTv#\
+DK5M`MD2Gf&S!P!f=P#n}X|Ca{ZrLf~@(C+5i}&1#5%*cc@K73GOSC?W*oLhLZ@RRZk*}xZe}%`1\
+M+x-|#S^HYH{37vbzl6!&r7pl{i$3RI$4*W@WhQ)b(^euv{rA&K#8xnFawu<?eFrwPPGZ50IhMw+\
+@iDzpp@hEof4I0dvmP0%RH!n>i5(bDsCHUk_A<HJ5^i`-^CBn)i`U0`;ezb<g!g+{tSU>nzi&XAl\
+$*4~n**YQKc_sYD;>TiBRUoXZg#6rC$>SHWL+ZB{U*q51ceU_r$gfiToQu*&Eng1PQ6qs$RuUY~;\
+3wb*F2xoEM9on(cE(_}o6>Y&z^BmO;a=8xV@Hr=#ebi~s2iaFpiTv#fpB|8}{@?MIb<BR1Us(pvQ\
+>i}<%7QGdP24i3#Qef&(2q7*$oeT+k2&v9V4aD2?Ou)-a=r6-S|6Tnv4X6Iaa26X@p>odSFjE$h4\
+EMvp2qDGs#x1_8(dF?tz*#7Sz&%2>u<P~*KdOFN0f&bs-<)eCczw-Li)nuV*-6)AI13l!aB#a-51\
+u!V&Dr4@F~Ok5a5C9L(9R<bj@C3@4Jc48R+Ub?hKgwrm4(N`fq?qx<cN<F^e@m=#85;1Kv<Q4`g2\
+n&LjFos2)+Y<0}EjM5c3;nAeZCSkYJ9TRkGZL*1;2;!G0gn{(jX6L4n+=*Kf){W@K(;j+uu&*C1N\
+EC+cX>^(No{(??YTWItC2XSUL`~QQa51>D}4rKU#j75myIsl{{qxuQxK?91$P@6aC3T{|exIs48j\
+)%Sh?kFI8ONy`CRBFF&Q#tex@V(ms>f<F<v>vptJwV`Vt17k6*@QT`&&2SfE)nz(NJrS#4qz~FPh\
+~JD0X^<glcWd5Q5jK%;}h{YC7}N~t9w);T(5w<S5uoi^ac8Z?YKD}RzSb9b~D>>)^6g87WxK^aRi\
+jxf;b9!N@0G>%rgPTGpVlcG|y6T9Z&-Oei_EP3-rd_pkHLdoO(FD;yYZ&;oP`EPp9yP^&R@QF`fY\
+ZZTNo;(e&P0SmV@XDvl>`Ub$}p(>4frCvbRYGP=^QKbK#{_;Q~oB^?aPn_(;-)Pa%_md}qCxTkR3\
+!}sU|ECoKI_uZG6r>i$O{C!iDpQ4?7EOAVyG{^i-{<LFE$H|=lhk<69tcEYpanDYg+^pmDeT!ecf\
+$={9x&cr3pr0ce<g&u#pVeHngT!xpR-dnq%W#Xr*5a{{FMDO|29)Jm-as3ib3W(wXxByEBN6$m%{\
+#%)aFVV`6WF-ykXBE1BWA;mp)yLgxf$zT-`FD1y(B&AQ(NnGwF_c`=xRaX8w0#B8F*n|fJcmju79\
+hM7p7E}*i$x@np1$z`>K?tYB){RpuH3HqnR+5_P&+E&XmFRTxWGYT@PC8e>=sp(wa<^eyJtZshci\
+SG+T{f-exWD#R^|TQvA)Yq;v-Kv|$R1FS!T(%A5yRKplwtXfKb2dIqkHO|F14+0C)Z>AXIqi+&1g\
+FH0d8F*!R&y~qpe#_@dJI3CuGofv&$drq{&0dIJi`movmr|>`UXx2AV4X&r3gS5GPErn?>!86izi\
+TUZ#NY_r}<v?#JV|{d;X7m2$N){V)?h}#^5z5CajIP-_yf>_+dQ+a40O?-d?^1xvi`e%Z&UbUrca\
+geD@PHqL`~lfDN355VP`>m~Z=~bt0eB8@HFvLMa;7_s?>eaWI^c=Z)biqK>PaqZFrO7<Oa{mpE6A\
+O6_{I4qoihNoiJMxM5pT<#@Lj?A;S#{dB{uIRxF%oB{-Y1NcA?;hX5fcr$5oJ)-c|5JvttH_TkR0\
+e59b5CX2b6cl<RZUx*0Za8O&cf^d|-MBlPFdvgp%$1!T@EwyHhIV+qNj>F^ACOH~s7hq5^LD8CRl\
+a7}3f-KfN#4>+DrW!V^Jdth~Dva<SiYs+m_3CEc%P^7u2hkoLFH^^Eyu8HTv?_^wS+p1oMvb(MZS\
+pu?j1}}>+MHp`7vJvx@R!^mJ?0g|FalKxS^P0G+b_l>_RM8k(FTlCv4N`L#(d-ClH=yzoXts}5|4\
+^g)`$tkg$c0j3Adi6`Xt)Zn1NeoKy<MrlY3e3R(F0RfS8ICeKB1>_I0zlpC#wM;CPVwb60#a$yo|\
+&6PNtK%SHQ0w`#N<Kg)!(TyX`jbNiT;n;v&fPT9D%#FfL&f`~TueN;g~=0@+-yIQ{@>KG_UuZ=U4\
+1n8a~$7@@HwdfEKQ6-+h{b4aoo%41w6(lGW-rb{84`wAOGb-||Q6>~r~&j$Gs!(?;uEOo_W!DEh5\
+M*m;5ZtW|@PU2d~GLJaW7ZfV~5@k)wB}TEZf%4H^%w&5#$i<yWe0|R4;eC9KC+xN;6YqhvdNY@i(\
+AGVd2A7fOb47pa-=jm@r}Z%Ss}2TDOa4(I>TI!hsljzhE%4B~Wa=OF0^dJqd37As4bawG|B2$-`J\
+v*fE$>9*o?0GbF^l(3m2@|F*97Tqi~-sS_3>ED^*^?(L;G{>P8j1Sd9L~o^IS`sFb)aiv1DKLfDY\
+k7JsNme-A>f;pghzum-B%-;QzHS?<P~xlsiNW59C3-Mw{!SC#YSM{(tcV!(nDS1H1)1djitt3LPH\
+OUV&$7#{>KZnE>>mI84{`I3Z}K4xaCST%&88E0Dzp(SG<E*Ktv|+>B$+3B>oB$qe7`d|bkJX!p<1\
+_kVMlRr?u~d4a+8RjB7;5ns>Khv}Ywp?mJHd#1WF)RV@?@SK3t&Om!*#bk!hS3j<e`9&Td`!T`~V\
+1MqhmUZZ#k?{d_%DJ2e6+l_Q9|z)L(~`HH)V~7tJR#z(psv3OSV4VVj`9DW0Y7*Y=~jz{p=~S}=e\
+5pbF#r}tp}q{7o)2wjuyuAo%uEu-_gFSo0M3(Dog7;ykhOc_m>-SCz5#B<D#UB8K^(ViG(kPvCUC\
+eUv3!_c<RKZ1?x#Ga<-s&u8#wI+l_sU{g*6kHzemK8Wto|Ng?VM0*ec*<_g~EF>EiPju-Lfny64W\
+qe-PszLpSU(X0KxF04>%A$A)@}P3|X*|D(r*%{E`X=uu<dD92)+h+<>G|E6evyWvfbh2fnUp?RmU\
+6(amjJgV6O5N3Kf<z6i8aN%P+DILxk=Y2Yg$HBq4AAKy4Kl|~y>X;hD6A$1EwaajRSApvoz$LU@q\
+0Jll-}{d;ee-{(GFy_clfMJ$?o8x~DQYd~Wyl-m9tHjeutRu@Jvli@KY+V++&6;05bD=0Bve<!^|\
+Tvx3aBHC%V3;KX1^!h@aw+MG!n-7TE?7A$6bPsp$yfPKtGytoa*EB|4sN`_}PHw>dYp`bVw_*aDE\
+4Ai;r`D$K|{m*4gjP6!l^}tKy*T&CPTyBHEswI(YYM@eKcq5jK!_6~ba{Am4j(661R#ACveVw2v{\
+MU;A|RWPmx_E3gFWxx_~cEImi}e1YycTlXBJd&YjwdQ|Wr#W5ZJ_hmYis^^0XCo#N<e@yc~%5&hp\
+Z`??y(31fkc2O_PMKQu1=I~#D1At%td=T>HN_p?%at!nT-%%0wI$NFmNccTdp793uW~mI0$;snoW\
+xuo)+CMm6^OqbRADJJ3^8lUQ7uUZjKu@XAW(<vorZkjBb%aXf$CQ46UXDG&^n>NsYWe~7@jk-z14\
+=*TEJpe9BS1fioPLUdet?D+B3yw^>-c^VwDow9SL1pC{c;;@ReF2w0<NnA4Rv!?r&bCd*X26gz<%\
+t2evH@S4D{zFn3p_Ar}PQ38q;hlpErC4n#NdSTtir+$RW?2#3l5H+q}%bjQ@X&|A%mT1YE3}uQ=|\
+2G!ZY0X%BcgJr3gfa-4*hFn?PoGTZpVM<qIfaxZ|s-2ik%aal)uZ%$-*ay>5t`oBwt1&-kh!Eaz}\
+zku<AUR~L|q5$wVzXEZX>D9B<mmWsh9>k`k=xj=@z>V8EZp@zIj~lld;D*%zH)_474mZXd;0Ds;1\
+OwctgT9Q@;fCv&KW@B<_Jaf#JDd$`H5os?S2g@-QUmd0kLr&fEox}|7|HSDyGQ)-BPj%a{DR}hjz\
+@yy$5j%3ym%xyexy+RK>t7z%zH0b19hVN3Fy3|{RHYQ!&tqYgsv|RKaBnmn|H}I)CTSqd&3Sq%wo\
+kb4h8jB<Y8+XxlBcy7PMambAN+3h)m6-dr`eK4n;TKgA>?zpMFH>xPiFg{_=%BP>$-(Hyxodwk~E\
+9oC#x|0qd|%zWuQ1pQ3x*px;{`*7n1SbgW~>5zgDqbJTyXX&sCzIE>a_>kp%s4PZ3R07kvr0Haqp\
+jIN9jMro~p(Op4cbdCh0HEROn3WVMmLo~ZMi`O*P4Lh?v&des9NgU`~v<jU?XA|Dri1v!29j)<=M\
+F-jYOJU8+(3rb8W>2R&aWM%Q4~_YRuW%3%v490C`V$cbIEH$tdm!Hf*$;l}nU9~w_gRQ#O(~DxLf\
+_xV)ZU6~1Sxil?+Zp98QXJ**?X(kJEj@!6>ddrLd39)aF4W`@5w-3_#a`b^~LfU`#fb|O(zn>S7Q\
+|0$M<7f$l4v2q?ZqWaMPB<mU}H55YK4bF~A(>Xo(N*5x_|Dy@+@VAHLYb;Z>2#53hpkhc8CB%x6B\
+NTJCfDjRdPY4nJ)_OK4v)`lstT{0#TN1ete~O~0c1a@bh!5PhJuY-w=6BKBa1kGts1_j+TUR)GgG\
+yq+Y3dV;|}0$QBV!g#0=EsFj4V<Ar{THJHefELd%ee^s7^zkj~C=*uia4RK-wBbByKpT<bcaSz~P\
+fBfe{@_`Co6#h)xS><d=Ve>49=GPRxZKy#o{sikz%822=L&7=GER%VE@Dj6eQ=cQ!l#>74B#)|R1\
+(9^+9)B~J{+8bDDMAobK6)rSPEYWmRA%OZ|<JK`snA6O(0ct|5<u^s{2m<K2$&P%#S$M&z;DhTie\
+eNHZzPl1^wPTP+>O1?0EdOc_*zZP_2sws%Y!F{2|6CkiRSNJmaAta+J$vYL|k#Wt$j|&vv3EDV+U\
+|o*lyNcio7;{jT#vq1XGE2lrF;Cc$IJ<TE+4b!T$ipgWV}rch^cbe#Qh`p*6^DEA%uh@-;y|8vNP\
+utD2+B(_(>GhtejS0~E^56&QBPcw03%X_rv5eM!&Zb>Gt`a<G3-*5jmyn{ALm%*vEiKMC?WY|U0U\
+T<0E$@@hrFpdS*Ub((F@Iv+bgDvZVjbmgh#(a!K77J}8e}17vb{>UM*>Or_=M!O>rAqid`szp9Ik\
+pL~jq!u6*3LSF-D%cu;)!-<L;^q0C57)BMV^}$=~+o(_-Ui8Hz`7Qiky#~(zBL~<^<0|7)EL~+tV\
+t`a!5^#-#S-o=fX2EC!M7^5ocFb@-rIxoR;}uI%2qeRj2Kot040s&g<$zLfh%({<S7=&r>*-v<PA\
+yB8Eo<ID+d@fg``;XOs-#I1+7yBdwXwHulK~Z(~m*-lC3+`{vt>w-L&G=96Y?pw{fi=_cFRxSa_3\
+E#eB*nI(T2;w|dey-4`IH`u3hNd)JUaQ+?9d4EvmJZb(gu2#g;WQ()G_`2Mru=$PX{JaR}SMW~3H\
++z!s`t`yHbi-T1=-;wUg|3wjt^CZS6z%9_Fb8k$56<_ot*$I4-)}wS8<Uy67x4y|*4t>Fr8T1^j~\
+sHZ3%(``fL)B3lkk4XgfOs^{govTgopFm2hKh{{r_j3y6gT^qf>v|4xPGNJ9O%-R_N5@PO(n?_P(\
+D+r=HNv&Y3};+~-W`)Mugoe8U-l|LA5-H@c*m=|=9RQ=}Vp=(=ZI*ZrVLo6qe{Y(AGa{j|F7wGxg\
+^<v4cr>FiU7Ui!1pOH(4yOZ&A^FP+=W{QGhr&e?0M3$#^lazY#b&GyQ_HFW4!ZPl$7H~ciZ)uH1Z\
+x)qj<I|K0FeO!}!KOARr&vCp%xB9v2R!gP%T*l`!<@islTOF7B)WrLwdOLKh4&CbX=~mVgfx6XSJ\
+*QT;y7t6>w{A7x)1h0nRk!Ny`Dt{kXVnhfirW9(ryu^0s+!z;TxD|aVzooJ`nl>>eWdy9%jfgGV?\
+V8KRW9}ECElmfV;#Cxhi-NHbgTbW19hvpKb%_K>bQD_bgN){u|cOACgG<7b2{-pR(|=9M)zn0o^g\
+S5Hi*Vqr>f#E!3k!D(<0`X?bT=bY7<z@Gu?ZXVDt4soUK6P&!K<WzVk*4R6O6VAJ87{E1vfT?S9|\
+Vk|f7Kd%riHn|mXn5w2T?gYV!V^NhadQ1guaK0iV{lxbj01T=73ebf=w^&{v;Q4zqe?7r6D0T@7^\
+o)wfnw;v0n&$|!@&ZMus6?C=wH>~_J_2)%bnH_X>*3;D|zd3bub>zoDx+>d!_R`gjD_Qv?-k%p;U\
+Afzsu2y!?)mcMV2UoVAuB_2TJCv2y4M<xl2DJ6zuCtf6?z)%jf+v1nwDs#<9Wv`|r>&l+fVPy~_f\
+VNN{%9aw9o-p(t|DwlwvQ?I8rfe1@9smq#<O5CKjP{pzLv&w8GcV#+6VA!I?8N`m@a7IZAfpz^Ar\
+-9Z4vWULE5n+THZ8;?M2?g>)OWY)mKjv@xFs;Nm?DB!1Ff3&NTjrm;0wwPMm*<`S4s%j7`Tp|AOa\
+#@^W9&yIdeI(8eoGE$i^?2s~3C&n3gOGE6JZS3SJWEa+z$zZ=7%kV6$w{M<@2tK(_N{}H{Py@1*r\
+FwN0~XE9)WyaqFz2a}@RS^v3ob|>-y%u`LY^VfWLJ1UH?V7)7#-ZT!2mE7*aa78;m?PkOkBmV=mf\
+4ejetGNFtj`4{bo3#7(kYC=j0^rKu<xB5y-aaMl9?cf%?9mF!6RizzOLtx1xE_`EG~#%$yeMOdX8\
+VT^;u+SEe}dnbG+WGYgE7f=o?b`%?b&Y0*3%W=#W5VhHsv!y5|6OEW|NNynhSnrfM~0^QP&o<p*F\
+I4!7+s6Yd<#X>?9%1w=4?7Cn=Ag2RPUUUMb2x9*G=T#qJ|-QyWnB$q0C8Y*T3ak%)<Zl;bec2Z^_\
+?(U%eXuyM|DPjhxOIRtq5kVTx)m*Ag{@;Xs>?@k#%2a@6o-oe5D<9Ui!>-J~yJaNqDmd;9aOZ#>W\
+&)kj<Eo*)W<GPK6x$8o{4+YOL1o`v~;8SO=8{xUmPc<@I^4*~4#PRfBQ@>{zJ8^_EksJwc=R4DT4\
+bF7Ab0Wa!?h)*>7B=lOuIq%+5#sM@osNL{Q6~LO(h)Xr`TQRIzF?pupxl4vsK1VYcRsB>8mJ@ugV\
+*)GfsXLDPDl6{p5N!PemgI>!$3#)Sf?Z4{Tw@Zxz8mX0oMz99bw6dKpmk(lC6t$I>LO&zg?#z6r5\
+l>!oP^Wj_?i9bcByiGGCETH{kLX&%V;@29r*N*A3>^wM{n|cEVpbSbevq8~oygzi#lyGprj7t_!U\
+j{56Db@LCAn;D5Pp@V8dz2G1P{)D6}hiCi~$>PY0e!JG(ngFD)x8{871Zg6`$bc35C;H6(5k4!gM\
+5K1>_g)E*2^(<<oEXF$`<{Z&v@oIRUd4$R0TaIh8c+v4wCyP@KpFUZfaq{ew^Jk0PJx>ptHptlT?\
+`)ln-Fatd8H@HfBN?0YW1x)f_T$+lV=)F+FJqBrS|eleJbk^4oqasKjBRX+T*i(+9$v;i^j+Iz>;\
+=dDW$e5=H5r?I{HK+%*L@dS#tuIkT*eMQ8eGO+aFof|+@q1p*gi)CWo(b5k;~Y`qa8BV2rhVj^3O\
+rW{!1rgzu+=<kyn$kzx19u8GGr$(<cWfG<C?>U~OF4)P5PO{;G8{7W0Rau^WQO*ryC+?Bi#dj9ua\
+ll(9E^TPI@+yn!-ymN&eN?Q<e>8GD&Gyo`PQ+qTKr!CrqEyX;q*j2+<pX=Uua--ed4Z-kJse+(gG\
+|HNhNUs@q!*Bi*#CtD$79UU^(5H9~ze;zV+=23qcJMAcwu?tmA#@?u&IvKlo|LK#1OOAKQ*kEle4\
+}eYJInpQ_DPINth%)RZ5myn%&h7u0-&=vQYqgc}9V!Fh`8kQFqO8QbogNbRgCsCs^+60PLwP0VYv\
+S38_wFVT*9Ruf&mip&P`(0X6}+<&YXk5m*IdDm;e9#0$F^5`g-mAW17kie3tZ5Ki?`u&@_Re6>{>\
+1(u}q#x<METc{Jd|-bN*57yl(~l#Q>8b(z&kGmzzmyMnhU>et(5Lw(TGXeD_*F-DCOL)QayeEaS7\
+aOZh!GBK{xGFJBhH-VFInc9eO8BaGLedlvZlyB87dt{sfu$c*s3botDETe!aRI}UJP!ajaxU9gxG\
+>_@P3<;5A+c(;qV*F~HU9g5zNCL@XUcxrhYeJ)04<jebE;5|JHoR7~P6L@}purtCsk<fSk>hDAjf\
+QwI`j;?81(xakzMNgPVelNN?Ma6s3%gue&7mJhWJ@&OziT4)Z|E1=9dY3Gv2YQcpvbs&hGrjw$o0\
+s*;brxT*-eeIxVK(rS>(zCtoWD2JKTG``zZ1rZcik4xQk|W6oE7|McQy7_#WUpzFK9dg@5+2xMV>\
+HQ;|Uuyo`CP4$G$?_cd1C<vs52X*ueR~2H*)V@c%E^T&u->HPFY&7~?z{ae0<HSlIU`bJ~aTUx0W\
+2a@w!vbS?M$Gl|}v&_{Z|c<~(d65O9S7URd}s5bnM_m~#XR&n2A-6){5u{Q5cyUn{xz$(*J(`y;z\
+ga0RwX)vVw_dv%aO6K#mkKr2N`X&qc<@5A;4XNsk`;FGvs%jszRhfvbD#Ox`-hJ{%-~FrCs}o}QJ\
+<9kW=+Cm!x&iMyg}T%yv2RNlY_L7|Fu<WDHrGIfO!1gwHv%p_0l2iL!fvYZ3?lTd<1d2s?`l%z#=\
+TBg+o}}k3+a`S`Y6^v2yuPn^QGmc8oZx)F{X)ogs{yajCa-D!S@D2+7OOs0<RQ&27J=)OzWvS?L8\
+|?0B$8v-_5)n;+y9fmqD}n{lcAiY`|2u7AS3OS@$LOlfS3DI~mWdH_^ME7D9dWekL4aCR@MU0%_Z\
+&aeHR7bXtEJq3wQ%@6-It!6Z;!&nfU3+W=WP6Vm^3jPDf#Ifi$NPE?pqu;&=V=Xb<=Xz$Hq+8xh?\
+uRjuSOtUo|p4JV#GDl(S9uMFDg#8$eX|uJmG%xTD#7!T)0zMZ)JK{daEIzkbp5AW@G=G`G=BN~Cf\
+ZlfnyytG}$He=tNKM&7rDnV$-%CHeqG`!>AQPhb9Zb{JO-prm=Ww3rF>yHra-t?m$P<m<1=W$DpJ\
+VZU92;?1qxJj8%#c40)?6kB&J*4@=evs&^qX?vfiD6NL_O%-M#Q<kD&A-49za~;K0W8MzPU)#89+\
+N}3cc^kg*s6wq?OnedIypT@?|RQ{zcSJ>H&X-@@Kq%+YNYCgK`!6*sqb^ZS57hl!zlm-aDMHpG$!\
+E<e*$0!0rUVyJ&ZDyc)>o0PDUK?-Iv!_>Xgxl|e>|IMuiKIn%!P(Zu^2U!ThN1>*Re%jV>+R!ELT\
++~=9b_L+Nz(7SD2Xsd|fZNB5%^EVmRnq~^;TA<;}muh#fMJg}-(*omk#XZC{CO4WKD&>3)`54C2c\
+INTAxONvYKOYbwlM2-zma=uePbUL7_Bw|1%<j3Upm$nW8@3Tm$1H{PtxMVcj&h!UF+%1PsFwi@eD\
+|K=87<r%RLkz^Zuar$1X5N0Bi#q;<B1cgel_xWi<!-PH(p0kusY&M)e~4poK{CJuj9{4{qOMh-N6\
+Cy?aJ4g2q$?QZ|lbTKTEZ{*x0;=zpn#zzDvx;_pEwi*qxx+R&ogM-^%8)n&M)NFE(ormC-R=F7vy\
+&{P08EpRwiK)KKdj>_;Sb9$aLUFNlpK$1L4J!ujikW=1=a*hrA4VS8;oN8xsJ__GjX9dU95dOy<q\
+1Y(JGk0m4J_S|D_Bawf-L)w0JL$%=@G}3yL({mZnT{-aGUE+@ML~iGbVK%{oc-IW#81TizC)u4wD\
+D#e>jET|lLXewX6dbp-rZPIqSP2gs91pdV#ISojm_AJ!Dg><%@)}v5=|GyIHbu{h&lII-$9WONx(\
+^RCH^fx5<CUc>HW=4^gQYVn>IgZQam6@qJ^YTl!sh+sQqJ%BIUsoFG_H3`I1M9i?por1H>-RP(Pm\
+G}I{i7y)XoX@UBK6>;=YocfVFENtrODnM5On!MTa?;zzt)xEFFhuGdmbQ1ls&}E@61)jxjjbA_RS\
+0u{8YJ&t{NEtUYDg@!h3__Sms_KMTmwbTTs7o^>a{3diGjUO*hPH^lLM^!411(wS)UDBE)Pei>ws\
+Kzq*2h`=^*j$|7U=SrmVb8ax*cZY?!_4nqS>N_mLpJ%^i3?W5hTE(Lz-n6Y5*B}MzN6ngz3whJW&\
+CH&GwjpL?kob{=3rMe}cD!#*vh@I*%f?IRqUg^2x$R4x-vG+uSqJrTY;O|9^905h4bPVdQdW!$aS\
+-P<miWs%ggx0sh7b#${~zYugjU#21MjwLkImBrWvx)w<nK=bUAs4|<tMo{JrDgw9-`@QsP~{x4(}\
+_CVt4HBaHom8$YCx)&;2**>3DBC!U}Z!D5&!is1w(Q2p>`JqHe6-&1SKetUwjMq#K0oG81*J0(Bg\
+Z7Zmw$eT8<`M!aJ@ldVs^2U^w*!8>eWZG!$gYHNTsiWAlZ?sJ50o3GA2f;O5$^<rVSpm)6YrDfcF\
+eR3YY<9<h6hdA**Qz(n~72~g{oAoDO{UA=Oe*&++-x0Ph!txd7Idoh?4;OV!7Gs1wc>gid#|Jznp\
+Y<!B%6fdSNPCBTec^q}<#oFG`Uvk<#y$ewPJy{{-6U+qQ0F&|LRZLFHv`NpHYPW)4C2_|4ltcT*r\
+-ha+iTdIGo3Td=5lk}j@%ZuU61~}Oq*AvRY3o<6xRQmMh)JSR?zM?fcrVk?5=jq_dd;sc5e1g*0J\
+SzEt70W%_}AX&YKK*8}c;^=+tFC+YXZ>o%#Q4z+t?PjevfA4cB3;7SO{Lve=Tb?O8WpCxp{qWx3f\
+qg7a8pnMQr>$Ju>>$XkAYoa=3T4j!g4TjB5Tj8q?cwVC-w$)S~0AA7r5=eKGFZz81W3H|z%w%c{f\
+zwn;1GkwQkfSr3lcsut`aSue$vxY+WyT5A*?(hDpCAhzP`AO#Qj`rCgg2+0Z{lJo88~K6IdlR(tj\
+j&DRxmEiaFOm21zOkSA)H$E``LU3<P`(J`cI^-JyRZ5@_*rIp-O5A#1dKljKZSG#lTWv7lP|WN`n\
+Zw)9Zrw*tu?rAQx_9?8QD+$y*U5f9J%f)>wRA|>+g|075kBc`%ecPG4`LLj1J~Mz2b17|1|GN`~0\
+Vu90~0|9dU&DPtQNxdjBbo(a3*_@?7{&k!H>o|LNQ|_)q_%hL3I0({YB*fBKm!WL)I_)AQTwKW&H\
+4bM~zrK2P*{j%Z{)&pUNK&n1naeV*4J3iNqi-Pk^#=M{~ieV&&#G9S^XL#_9D_Gr|6p6~Aq^m*DP\
+pXb(A_&gQV`?$~3jQ_dMGa7ZkAU@B7i<!^!gTs;gJij;`-sfpC@_7zoKF{eGZ$F6pMW#}JN}#WE8\
+1r?O1?yKKsd^LM)fQ?t`KdVOVcgd_AAOxYRgC+u&5?YaIgHQzeX-{2{PM8Buk*cwI$x)`r|PWkL4\
+BQtI$!5oheP{1N5lM<AJ+Lg)3~n?);Z^)KTG&5`5I;rq&<B&h_5q~`8wC(`%M3GiAKIokbQtGYwt\
+hI<vGZnI#^3vxUchx!wiofJgE6Pi$vSWL42JFy#F9Ge?)nk!26NN`f-97_&R~#wh(_`=b*#f*BNK\
+*>x|O-I)U#z%I(m?*V!qQuhTqTU3Ih0*D2XR+<TeN^8d_j_gQ|tH@wesFA46mJV^X~mM4k7&+>Wh\
+v;1(czt6Ihm#@8X9qVOwdR&LcVtkf?&+-`2e3o59_$==?@L8^Gqt9}!<g;`H@mco9`8f@K$89$U`\
+W?SL6yEPxd2?vLBgQeye#d(b1@}8Xe8}JLIEcn_k9>a52{w1a@3`ntaKGb<L;ilpKD-Xc&B6VSjU\
+wJBjNftP%_01b271aWQ)GU=J57=M`R*|V`uTokYMq}C+iR<z?+w$L_wyCD!_QZ6iu`;(9@G4M>M_\
+mFcl?;KpYIPOyq|9$X}_Nj)+q<ku9W2Eb|voT`-QhXb|uM2b{6@RX4G`}lzwWT(nZIZPbue^zfUR\
+m*y-~ref{a__bIIadij+%5cX*n;_|EOH2Hr@4z#SheOGAzk28$_=Y|9R{+~7QeB-Y6`G2+@2=D*7\
+dQZ!`zZ?kf|EWH}{4;;s7u^5z>VdZVfBwMhFWc8T|IgzGLi>MKA2>DspZNzg|4)xSf&QN^djkDGB\
+Tj+;XXb&({6AM6Xs7?@6#HfFJfZnz@Z1|&MxdYYRQP3t{2YJG-!C)g*eUYM{1^H>{(72x9@9O6K9\
+4Ir;e8%cJb^xsOFwD5&!fhx*^FD|^Jwdww!$VDdyv@#&zIw*&B?0$U}&4*b$bJCf|&=~XA?|67}_\
+S->makGjM&?Ho1o`_W)ocR3A72S81LE!n;@PODr|z+N&6tk(cm`0-~W=?1fM$)xlM56f%e%1uRR*\
+MP4L$Tg4+a9w#hcZtBwZR1P2{8wh1oyrDhZS!vTMr;MRuVHo-@AHo*rEgtiIB!~EWPAh=ENIs=>F\
+_1MON&^E!v2Lf$^<AT@(FNgH$2mEb<Iou}r%L5FLf7_th1g9N{+$Pvx3A70gRE%wcgLV5KTK0#w2\
+@W%`3650QdP~>@$Az&8-n+nf|HH@9{)b-~?0*PmNBpCk*%AK~724M$>kq$P(E5FX7b^aKt_;OspI\
+|F&m&@JZZI_cn?6<gDx8EXPx8I_i+b-{L``a$RY}9O*7fAapFy70^b~#<zZ*hAF+vNiWw#)n5XuE\
+tyvRytM#CEyo#$fv`PQ5+zsRe=d%=`C;w`UGp5Za#E*ywN1Oxqvao;h^CzdiF<BeO;R<wt*e<~jR\
+=+cVSm``a_W=XK;S2yV~Z+!&cXQ@ycu_RK>O+B1J>g*|hRfjx6~EA5#-m|Agf824ZIH%AsrVq`~3\
+H3zr#P(QC(^7C4YTtu;MkL28S<jDhWG~iJN;~s!#tdZdH-{P!btHSJbu?pYgqQo{}yhNVZ<AQy)+\
+FbMuV)z9-Sxj{>DW)P^4A*T7PR$wjr`m2juN`*dxu?i(eA8jgZoF06A9BlKW4rOI5!j8*t=u2d#d\
+zKODXx1TY-H;=yi0?Ceu-<}-#4~>?OXeU`G2>3RD1Yrv>(6!VTb+rr?wxzc!=4LPwMt0I1imZ`|-\
+pNPrv;bZA(^ZPlA9`nuU0Oj{6ZlhqX**UHk0O>l*y+(Ocj-sjhwY=#vfM?a`}tx2$Vu2yc&88<@S\
+gr#rYky1t?9_UKw(|H&U(XODijA+$ZZs^Qewqt`cR_UQ4u1MSh{cAp-5^dk+C*`tda&MtfO^Uaz)\
+dPB3nJ^G>MQ)Z8*a=HAFzdgG0P=`JGY_mtN-W6z%{>`rN_UPa43baR;Y}0g;pz*0~v{&~((nfpr&\
+p00cyp!#V$M1Ra%*Nv%Z7`0<AG|ksJpN7J2gc(k>}_8>e&@ZR<ME^RvUvQ7-?u&<AIE4EkN-)77L\
+R}LuE2Qw!3Od8qauvQzoZ@U_#0XgkB>5C(%jbDC`ajH@dviyEVD(Y@GLXE?E-X_?eu?q>+BeZ3nQ\
+~*pgr@vcGxlInKV0w)e5+WdC-o*@+=Opb;NU9M||6C9T&{|iS{0x#(e}|>|s8`iMo9R2@Rorh7)!\
+N`V0^3X`jz<@1D>;!(DrruO)kT>wSiA?a_ROH|z}b8Fp{uK7s@LG@oIv<TGsC7u;vKqLBFvZ`u>N\
+&+ylK+UGO8bbsVN!*P3p`wXY;@%I_#?GN-BrtUZP8D3tf`3&#e<L@(kb60Sm;ZmK?@VY&reTHAwx\
+2&`83GOq@HSigZfwU2OLi-GJ_5}J2`v>tEW<z?vJ^nt!KHO(`A;;r8cWFMu^gWUL3@rve!}uUR!>\
+&4?;fJ2kKEs{{KEp!YK7w9he1=O3jD3dFC7<Ds=E!}9zpiIK!y!>^-+M5-KD__#P>8(;M|FD-%t8\
+Ejv+Di*cR%bk_TM$^HTK^%NqY}^o<;t<<N0UKfA>;Bp#N^MC%pe|XhCTIoq3<X|IXqG?!W8f@%P`\
+w>|?&S_YU~`?~b{H`|qqCfB)T&ds!W~76kX-eX=()|J{%It@Gcli_m}fNGtqzj~n>!*0j=p_eeYT\
+BW(LG-H))NLGvpmw`hK)FB;muAHl4glKlveqy4IJFSlRqzK7bcEc@DFzbZOA_ah8@x5J<GQ~Q&;G\
+%$bC^(X!PN!=SxpFioXcTT@Q3D50|Gw>&oU1SM~f?o^5?C0lK>h(j*x?SJ2&#&~a@BRHsW~lS4Z`\
+$Wq%KIU_U+L}dTGkEzA-rE{)DO(>Q&bn+uhjpCw)>SbdHpxlwa%|(`60AliTrSC{7V1+Uh^xh{w~\
+n3RQ%oP@hg4$ePn*6_r5>7{7M%~`y6ug`y5W3GQSd)%kd5Vex-g59e$;=&9AiWKY@Ow&HoASS9<q\
+9fqtdf>bCE5Shw%L&u=uioqnU#)8aQW#&ttHH(IBeSqzx4f#ZE(Y0>Pyv^uD>1@U1ladh_6ceH-r\
+{q||lb3^gP7{(Vn3q6;g4TSvhcn#C*dKu|eZPZ0Ef0}--ba*2CLeUZUghI|wE9N(bmmg+WkH5_YV\
+UD`wRla-g3RRR#lYDpdF@AQ9{0wc4lb=Bk`1T`lPaxw}7fbJ*ptIR%{WkAD=;L01NdwHuo<tkHFV\
+DmC-5(#n#vUKHCMw>#rXR&`$u6POeVx1=kJ+-Z0>**7FiY}BUeD)!iNFQ;k8?<Medzx{-CAuX$6@\
+B{^Ou=u)2o9qBA)GpI(9+%koUYnU*aP;kILE(8jh9tuJGkpK`xW{ZO?|ai{=^V<EN0vDA1?m2=8Y\
+SXY3=r+akF`5Bh$21iF&YlPuAi?;3H&lfYoLMY{X&`xd50QMs5w4xydk_br^CLz}T2H}LL5PaIo6\
+pv_dqlS{S&uM45y1%oB#iNrUGV^=`;GQk|*zC*}s4OXcJ?YDIf1)Kx!+%s5TqraPuvz$0km$;ep9\
+7hY&MbIZPiNhCZ{I@!~yH&^zC{Nd68Td=Q_vzN&xZXzp1+3{@nD<Um4tU57GlSTd&A6V70lZNBbv\
+Nkmq83d@LH_jWhf@3itl^%NY$Yh`U;0qfugigF)dJk#;`fqL+X1W{y0nP(OQDMVlj1e!J;UU)?$L\
+gb$;S$7+cmTJJ4mmk;~o!qWzxotaU26+-0=P@Q4g#E&z%`~=2GN)LnD*HS*?}9I(vjgH{bnf-&${\
+fz&@R4B+qo`$@<yz@E7Rc5~cm8cXoh$u~>la!tf?pzx$#EeP5cM8%&qAMDg`uG%@yb$niT^W(JHY\
+k=+~XNo2g~L1C|l`tIX;!|i+z0QKELzDYo9+1BmPV*YZT-%aIdni|LNq!oVLTIdJPOX+-4gKJpkX\
+P0AJg2-8EZg)z$IIbJ&q5ho!pN&TPR0uu3mY*U2AnLm@%(rWbW^-l+dbmnq_2IJu&v+k|hd-yoGy\
+2>Y@;p0E^7tQk_iu?_3#B^foX4>_dvm+S)0gl(>y_~LT3{RNl<;dq93!4@iT4T$J2B4pg_1q4Za%\
+w5H-Y&3aZqQFVYqR#F+U$Y!~f0;{arPEBe<s{E0TL;0nVAae9bF10}d0%Aez3_8T5>3?nl5gqJN9\
+Nx7MB!eG2UagdBV#SPUKdd3OrCu%t_(Ppt*@y(D(;ZaU}lV*QLf2JbpSA9fa>N1x46oINh_A*45q\
+jT3wa`4LSkW@(5ggM{scu(=EtZx)JIpG#Wj)3Qf`2lLoj@{#15-iA9lOPjQHb9ocv4OX2`BKCCnB\
+top)jBI0rTNuBRZDS?;43Nve_qUDB{ywyAESya|oJ}43A9qrBes2iAE#LW#YXl3d5pYZmF@iUuj$\
+5>2k`mWoiH}`FV^`Q%51p?_caL+M5xz6QSU;L!V803i$8q8==uG19&{#A!C!_t(0SB5Wq;}a6B7d\
+BbybX*SpzBzm>E}2;p-%vDeSH&Om!h5qeR*DfMnAOt3^f0={0#70-Nf$v)2~}ao(kQ%b$JucizH9\
+^oQ90?)2(f(Zh*2L+CVwoo1guuU*mQcYm@{^E55aDk|bN|d0ZvJ_k||5ZqToB6aHZ=Ym_K<e{;BX\
+BE17F()DNv*%hUiT?YOxVPC~@AZ{RBvaPJWT4_!9@kvIL*hj0C>JEp9m3Rj<X*$4K4v+n?u9M;MV\
+O1bJ1doek-8`Zxvis2yukem~!}Fhm$W@GCj;686x_heHVml2NTWa8sLw_o+`AW)3jd?n^nZSRvv(\
+%2~ewgtXPs?O}DfQnejz*NBICp7`Cu3Z0_NoGvDAqMzLSr9US-Z_;?TIl+)>z9bvb4_Um-5B4tf6\
+<*@HG5S%O$fI62E*2{%z5;#K88yBlMnD*8UKiYgZzRfuOXL1~@bT;Fm%Y$50sZ_HZr$KhekKhICs\
+L8?V0ZQjAsQYqs9L_{0>|S>3lXM)!<xeEm8OQ**vrI34v4|N44xn9rUr+p9DmlbDYepdK&!Af@`R\
+ny$tDVEt>Sk+of_G#f3C4<6|k4=m$=L44dxjeT>S%=h}1m?z{}OSw->#2_J@u+7&Ih69*SPxv19@\
+j1q4=AXkmK#122X)OaZ->Rq!*UWVN4DxB8i1CGXQ6H;^bUe$Kz9*K3EkyWonavRUHp$OFNDkc^&G\
+KMOU0LHdxoBTNp0<JO9b!HEvSe4ThrGYl>F}Nb{<bB#O^i7KTy<IboXfV1o-kM0IM!r-KQW|ry^h\
+|^>$-`Mi!d!k@-tFhG87!l3=VU`z`-Kn0{Xx1;xy{NHq>wnZ7ng=g0DXWuj#4;=QWg%T5YaSwkOm\
+LFPz47K*eEmWx{`PmmjsyL={cRQn<Y7OA@mjoObaU@)MxdV0snv?~+3SaqoH_9RqU{LuIFHyb?lB\
+i;v8vB6M_=kCvgROO5>^Z2XQcj;wy{mXUoT(DAX~iy_~F5c?z0K9Cj9^aaG-taz@I6i3*fQN&T7L\
+mXD#AJM;Sr?oxCt*!o^;t#cT1L{Ke@#olJz8)S^9PFN>)9SN{VBJFD0{s}iy=9%)zl42?<MKz`Ti\
+I2TN0Ib1fkYO^iDT(@8vO%pwNHw5BRzLQl8Lc09D>}LIsNagvyW5S?xCBv1mc2zxNyG@=$^iPKr$\
+a8q^O(W8f95pF3ziSKC=tCr!d@-b#=NPUiMvX3L6jQX(f>V$W&?@;CxM6TgY+*^X-|c*~EW8#n?8\
+ym5|3XKFIUBri3{|D~*h#{4Z_GNXoNP7|$Yob-XnQ-?XFyjG)hoVjZ}DYU}+7Gx0tNn9KXTnjaz8\
+tN9Ub(AkwI2k|4^dK`7};C_S!$JrVHVRj9|EQHTsj@RF3Q1Y(7&)|QKYqkv3*Vn%r=reFa9@%GL_\
+G&(Z^L0Lho*{e&znQA}3_hb{4DK`dP>eAN@QseK?e=?XB=-9V?CFO?+0(<=agM7k>(V7%41LAIMo\
+ibpie~ReJ3N*duREg|`!UYT;<+q5=KK;VPa3ZS;~nU)5<&cGh*+V29Aow)5kujg&usE732g57a{H\
+2)f3&~);z)HeEc0){V{=YbtnlBDX}Da)&*-*DHuh6#lMA;873T=yar@_p$2Phrb>gAO?uLp)HdFq\
+lgub&0^S$_a=ykn5{^DXof0aM)6Y&?<$?+Eeqic2X6*Ht~tC`(@N%!ah{#-7{TEN<D_hz6i9w&)u\
+G#~JT(Ylxnw8`z~IJXaIeJ}992H+7JVf`S-Wn`~BXT$wU{2IFww<byvu^Gm3(H*fFL1Ht^{~fUz<\
+4<R7#=N%0W_($B`eQS2eifiIjL)!a4~)<FOJzIaGtL5AVAGO+REWN}RL9kLicJm=)SKR4@n&Qw-h\
+L^H_XB`IR&T`@7fto_j682_|2!}5yN`wU+40+-wf0cFmL7R*9gcjg2RZbCg-mN;^ZEFsL%9xUyUW\
+D8|4@lGJEEk0agK@Ed(%_$yjfT$;KD#?m#q5F=u*(N(|=bq#<B|LzN_NRg7$FVLs>PXuY`0f>I90\
+n8}9iMzDV?EKt2WP8en2LbX3vOt?<p52kTpS-w)a{L0e{MdlcktFv<tN{kF3FnULQM`J*8Jn~?vz\
+Q2F6EGee=}&V_POP%awEwLrNVUXH@*ZgQxz?2F-jH$mQCn#tPtcwVf}dX!MOTMxnSA>ct!FaD?Xl\
+qMXCi_+?`LK=-Fz<KcyZ)Xpr9fh?f%+<py<2Ga~o!8L%Jb3m2%Ol1S3u%)ePlgh^#&ndG6KR={7I\
+nx*$MO;G^}{}YtGK!cX*X7CcM@$kmbOdBc@+IkHVXfLD_UK`2Y~aPwVQaeAWv2uVK}mz?R_aVn`_\
+b+aUA#>@*HL9WyO#_kEd@V-Zi){xhKgHxVs1Hod9)AtYh$-SVt&tQuy8w+Ah4ez+BR{0p7m0IsTQ\
+JqiWJ;@ittL2kN4D3;7Ul>x*L?>DO|+tsvf;u@BK&A4D73b&N00<2Jm>ibM;%tvWN*HIcXV4DpS>\
+zPOVkJ&&h92zmvyu|<(+0P-nN|1Z&=hV6Zu=dwhTu2}$Id3>D=#{3oE=Mb!)8H%<)BCx;EuaUf8c\
+gy{acBBvG>5JGNd7#-GBbYZx?fcgab!788W*Naf%8{PI;XV;?UeV5c-^b;MJf8V{Jn=f1^$r8Gx2\
+3wWfKP5Z$)0In>ukKQ(3jr4uOl`5tS>e@(!28XY|w4+TzZ3f!}IF(eK0|uYjktt!&7NoWmYz>fH~\
+SN`UZWl@;>yI`(|>aD?Hswyqk!|SA)$F?K9MEg|-L6T*M-+z+BY9nzc5wXiPTDg=aF*n6C}RQJc)\
+#!1FT7*}42V!RBZYpQ9uld|oqv4~`>yH!HW5Nc0T(vyN)MMR^>RdR#xs$`_d>o{Zyz^mGb4=zk)N\
+3;ORF1mp7IH_C86F0@Y=%`4P#zd^r69t)&>5JiUj$pR>cvfxV2YqQxoD6yXV$Ve-^ONVg?d2uP^v\
+57YCvyHro&)slod|4oe5&&QEeU=h9w|hXhABgw_cpZIG+war>d2WI{i~8qL_@K<U0FPe;Z7)W+DR\
+B+R^YPtwy*%S%*xd~4mmqD$3HhNL(^pa%>^s)`U2{tk=qe7>ubP&;P2-ii5Kt`O3v!6u1>X{a2j>\
+wI%nyO<w_R5S*O!@|%ynAGkL!yJf;NewDfNlOb<1CvodfHuPqev8>}i|Q6@Cu_yi;uHsU`NpO?V!\
+Q`%7j^j3m~fite@FGRAFZd*o_k0H-YMJTF|cy(R6h$CwJlJ(*@-h4&b{fOXJx3rqKpUFcNPv?K}i\
+zFyFNCs^B|?>9v)GpDHK#eLPy_P&*P{ssD^sJw%<ZHf8W(bxu_1B5<1Dr?OqNMFy>d#kVEc{!aJE\
+z|O5Q6BR>&GRMs>a7PpR6C5*%wiZ{3ymqG<(>99mCowa%Ij!d`6`}A^ai}AXOigpR|kBnb`Y;;Hr\
+lxgc>RnA(RAQJtD!vMIM2>1$yc9;v<bXUx!oMy80vI<OB(~@2Q(e{!4jy?Cbt3Qe<$@@)So8xVWo\
+atzBc`Niq<CDPk1`$>Qm%#aai3HWLz{)bwOqGikUz=GXN(#ah!+(oJati=mIzq<-nMmQoxHcz>9L\
+gix&Ye*nZpsNXrL2nWNr@^QG%^0IvA@>^~R%asAiHzt5u}4f~0FF>sD`@b}HJKl~FA7E%6l+~25P\
+UOo`U1%@#8o@`l{?t?LdLxQeeS>~2Ndh?2F0LE7XjH5V=@eHm+fN^(#akL?fUoz|93~+hTJV#xRu\
+&z$7#51LE53Vs?<{Q%GcIf*StAGi>8p_u~nzMQ~>$|Ae9E6^N%;B3S1LttNQN694!{<*1&f%Me{c\
+YVGt~Qv%=XLeUbI53AHq7HRn8&FwkI~#lf@ciHgG@2|#m}Iuuxw@f#HmjRzGct``Un(|X=Nw*d57\
+>H_fl(qe-^`+9;@wp_wimc&hc}6E>kq#tDF04p>A7@HWz~wCP!+MxcnH#;EnMYShth!fyWpafXP~\
+nJ<!VxjH7VMd*xBy&~t>W4d^qQYts5#n*{TK`y3LA#<+*E^RckJ6?8(+0Ir`?8O-!^lxOF%*mv!0\
+$P+P?_t%1)!aJ~y`XpfH>lg0N=J0%##(P}}^4!dAR7h{#fZl-Ss-yhmoE&dqHM7`B*>2&CmFyO)1\
+_anG{LWKqOwFz4w1xHJm@A+iVZ$gfZy1eZW_$Yi{8eN6GkpH~sCCVnPgvmmv1Vp((zoU0d9W^pjy\
++#BL7R+^06b1Ic_NqDpf3Zzrmd{38OpM_pM3Q<24x=(Ru+EE849f<3hH<f>Uat2c+a4Y72+HP+Ga\
+0RuCJ_kChhmX@C<kbWmd1s&E{T}PDp2So5bgOhFU@Q<69eSokd&>!h8nf19sp~130};MLeI$_&_!\
+Amo%PkC*J>ocIFCx2xaFI16qNyj8<l-*k3^_XwR>}dW~p>=fkoLcR8)ZNVJ0IfVY8GX0fxTT|7q3\
+k5(=S(kG{RCgW=WOG^e>TB?Y10cTLSGCO{f52onzmgnpoUu=>F15p;|<T;=>{XEk=jRm<(-<=A4b\
+4mr!p+nZu&n0;H03q+d7xIxv_pS-O{iVsl?dWcPmK@UYfUST}$NhafXVBjH+N9SzpB8&(Ob~l#1C\
+M)+#NIiymG;h!ZM1hDZH2va&RK5neESsIJ8Mppy|d^nuy+=o0ek1=LF}Cao4CE;EVFm^IRo}irH%\
+H^Z%>4V*{QU5eig*txyhgpXWHKR`Wdiyu5Y8gbGgwRokjM}8-mz7FE{9SB=$~w1oqC0JM5i-_D;z\
+!kN#wK2AvkWVNq;24@>LBIq3;(?=*?V`!J#3@P7E~tPl7ObgwG;-Qd@mZ4-30Dq-8y^uM&+o<ZtN\
+m+Lh9*V$XtY36m#@UN5Ul!aWUlw;IRj~(;R?X+XQ5XO$V>UjI?m=74(F>g73YVDY}8Q3wW9uIBDo\
+P4}}cFb!H?3g2tpWSxMa}Dg6*5mEBW1eGR$87Yr-;Svo*ucK^{yglM+YIcOfAY59j`@ax9do_6{d\
+UaX8`v@L_qN}T`GCP3-s1iL!;X24&W`D&=N(37$J~E{-Boj@?U<P%?3mkv^yw$DW0qcg+U=ON26o\
+JM)ebx6>9Aw|PG`p)Y(y(T?3kH|mp_3Wb7lxT=E>v6efrthF{Stc!0p#8w~q5#^4NX=`HcJvh;)u\
+k1m{)AG5n}Q55#jF6ynW}X7?XWT2-K07Y+37C$6LM(AG6+k?s)y-X-r5=qKMn1^jH`<+>PQJRcj!\
+w}_2Ti?=5cpZWRC<?LLPw9AP1)yvp_;vlYYd)?086#je+vCpn_JgF(0OlrP3gz`$;SGevn|2Xud%\
+W<z(+s=+`%Q>d<K8enJkBc7X@m*|)c;0aP3}g8{(=C!*vc!|6_bZy60Ml?yis##8-91qC<pWy7JF\
+pt59Fq5J`pY4}fyXVcj`OnnkW$s!s{sz{h^zid;&NZjbQnAj1@~pqyGigKn^JgABHl;Ea~|?E;(Z\
+X7ui1Io4zxKqVLT<~-;d7jYI9YXQ!A0zIq?jh@ld}V=54$U^RE@>1CUavBZ1f9;B|0$#p>u=NqHg\
+Gkpp!Aud2_ndGC_zP)sxio7Pb$`oUxytD{dP>U6Y@AyCI4sAGuDyHKuU9=jWd)-iM-?+5Cz>v$c#\
+Dv?LhI)FdcWwQO|)1^8*>ufHoLR_9F;WwJN5PqwmzKl7Uj@djP?w6Ngk34TKxBtvQTuw%u@#k4|@\
+7P%2&vz16irA~ppL^<_6LinMJ7Qw^9Wgw8oOBPuSn)rBo&6&2s~IVsYnO-kjQjB}<7s1U-bI%h?`\
+OpQ7LRu~J{Qg??+ZObpMA^uoL4SG_dq~@|K6o_=PM;$7TMV;U-XK+|3{O;pWRz(Ppib(Gv9e__QF\
+bxJ?mq%*D4ZPg|&~KPH_*0Os6l3XPHh{4UCvh(H3Gzr!@m3rqf5|I%GP{7!)y`u9WML>2&F!i0Sk\
+esSeL%x(A5SD*lgV^osv80Cot!X)<q+=y;K?o(zC3!uL9v572rb9llrV(*Xtuhl%=h7#EJs9s!@Y\
+^0G6>Cvy3CkxvX4|AFo<6#s!w3~AB!vgRN@1E0A3QjJd(+QXkualqa>`Rj?}wr@o{ml5mvBwaeIk\
+l!<jXBobHsl0D9@_jie;r2pG{%ypYBz{gB&ZXxh+slgc{k`}PII&awN4oT-gRUw51HS!ekBt93W{\
+-@Yeb&PEZu{$By0s~_AFwmIWSsvaKeq|{NM%2sBM9qAd|prYIwgbdHb*Tho~@SbWan9w@co2ui?h\
+TMn2lgN&9B`P_>$O12<84t-!UB@pEu)qe$<WxYqgz9&HMPCpJ9a0IKEGa|D9F1Ccrj87jrr7NtGq\
+`8I|t&ievhvV!t9hgPu5rKf7^V2Jg{V@}B5RHRLHLj)@{qCh#1{R|jcTf^Os3Jk`OwZ9-1M|J68e\
+knex+7s~vW&ZFYEAAg~pBD)x`Qlr4S<z2$g8huBc3xs!V+Iv?H5$6!`=f1k<9=hjqbk8xmXYAWNy\
+S5*{K>UY3&KCcnpEJdO=<9XxU-%pG+|QDQq~?)v-1prT<{0Ma?{u%6KOe&Mw|x6UXQ_qb{OMnu=h\
+2wK&WI5E=9)7?@0%0lEdBh;9SBnn?*m3(icAl9wgH|cMfyc{zKQQnDJWAs0Lw^w^6{?l0ou9??;E\
+P?uiKMvaDO81`}|9PHkOe4rbYfJn|EU*`E@!^T|A!KXK<cbkiEG3;)BQ5BcF5f`<3gYJAxnYM%Mn\
+2t--*P9eQu7+`m=bg11N8f%OcXcYa3h_IQK&Hd;%<{H*N8&ho(j_jF^h!~fW(@4iJUE39kkv)O%)\
+LdMDSH)x~rUQwJI@44Z5wNFM!d=<}*5$CXC`R7h@-2!Dm*AVC0@^kmFkDukS@rg4r={eWkv^!&Jx\
+z1qmvyr6bcH!qz(R<}^{GczHNYN9;dD=NAXybwWOZ{y!!F_u56?m7H|5+V^Zb;9f9Wi#sJ1C4n{{\
+p$}8o}cv=~-R$Ow2SYSB{)ycQg5TEu=L=S}E0AQ|MWDc!uxXXf6-R*%?A3b!S)N*>)FknPml;;K>\
+0!Z<Nhd_XcrzhJfA^&3vk!vHa|qVemeO-8oI4(Y}IvGNAoS#?dn$QCD(_Hj#&q=REuij0xbf4tZ|\
+{%2Ru4Wi^zG=J1x!1VNj1ue`uDluR4je<AMP4lU!q$s}v<g>}@IzX*S>i_oFOxsBMb#`9rp<?I|}\
+Tst(K&-AD|e)r)0guFIx%OJ<D7l`BiU+^;vit(<sRC@m0CTM>Sv`^Auo`Rf{Ye>t6yc_%63CbvrG\
+RRX-?LyEFz*5|oiukl_9J2*sy^l(G<m7jH;hdF%eE2kvo?GgIwS~)BU07KGYcH7FI6R95?}xRRcp\
+SqZh6}3{-~FajuuPKBjpMj(3~Me}pSZ4s_AkPBG4u{A7p^0+p*-SEhKMU*bq*DGd1aBJZdj*$N0s\
+O&J)^o9`e)|-OVjl?6Z#AF-K4Po5~XNIF7#nF+Vg&QF8T+&z*`PxOc>_{THawpe1-e~FPCViZW(b\
+roX5^CLOe!4P4kM&0rqUZa9y#?78)ma+VtlMXf#jn;2TD2%Iq+2)p({l&_H!cCH4EnFdcabKUcW|\
+aKl6KFNO9kTHLpTGG!;BcL2|n;(GKv><WJ7BZVKdIbF;%(6}3DxS~40(z4Q;j67^_5I#7H`lSKJ)\
+ddX3L#RDfn*-nnc>ZLTNoDb0IM?uu>qngDo5eg2!)GbaFoqA9ry)q&eWm^*Kgt$&02j0Kc#)^zyU\
+oqonMUHQ@<#Mq1%XSa0Dq01XKOqt)I3)XGT=Qy?rB0gTx4T<5tc>0?7=i6Ij!M}A#HP6ac>?wcL`\
+<1IvyK~@h5uP{@TXpd=#UVjWCxJVeHu}W0UFpaa{1x_$UJ!A0^Sa;NARu&S}sOyRf<D1flU!1~fi\
+Oqj7vM)9mCtPP6^{2hi-)Jmdk|_)>A765!)TGaJ`HI<D9_#21RIe9XS_BECX<RBrKl9=B<7OUCWG\
+C!vl3Ivz7fE7wA0aK69HGUuy{$D%%u^B4<wU<yt12@HqtKwDG-r};#U<}CuZ6K&p7SU2F^inCjS<\
+Mv8%R~o1JS$zIQTuUT0e+#bz$Gj2fJ{#a!nyA!NR3}$fa9Cp++O)78JMX&(WGM2h+CgkgUpGnoDp\
+NsNdVdk3?^nrvhxP^v+#L^dHeTabZo>G8zWgPeS7D!JTyT$N^Gf?I@W2jrj+OXU0=@G%kZ;)~zJ+\
+=05%MiQj=DzTIB}B02WTA6K*BrL@tvbdJG%?l&UoI@yUp$4Ta$o~aK2^7_=nCF&1N&hKcJOz;3qF\
+~eu8>Q8RB5ECU^dCte>p_V3tx@3NUxlIElXO3|4brwXAp!@TEEG=ZOE*PajBs&f?@sJ?%Lu{^VEU\
+7_zOXH-oMt&Ps-Ki<JyTT^iFV?2`c2OwWvUE=$gJE}NZe;jtl3;0cyh=;Q38uBI_meJb&eawp;l@\
+E=9^Q8Ayw@=f6RVnlkLf4bmDn}_wuZ7Jk^C<MH-UtdXaB1-i2deu`{<g(noNJV=rjn|=Ynoa%Dpi\
+@wPG1^skX2LoJWsxGq_F&wQ$e+gZ15WHrgSAF7yN8Iznn6E&JhG7cuApE420hw2?0R~~z2fux=c_\
+{Y`Q4$N#P02g6L*^8*<|8gN039KPcXYz{aEds<>nPvQ~>^jy{i!KjX~Twa6XgER>EwKCh07s-h;I\
+@FXoHk>4{Q$kHO+hetA8N@sGVKnpgA&+1ts1wsVS`!`Pa%g5z+h;G;Qs78l@^k3Ilr-bl&K#k~kQ\
+Ht**0lw8E|mrpR9r7+E5H2P;qL*9z_%a*`+cj285()_PZ;B$w(8Q%@!=O+*1HZ^lHEmx24<U3=nK\
+tt7ifDW$r<GWXI_!J14I!wq^pfRA4p3rB=*S!MD`DkUlL@SW)qZR4=av!a{(I?mW#`S@;V&=3`-8\
+(d`m^n>U_x7h1Dcwga#q7VccovLt7NwItoK9+U5H{DV6~)g~BCTMY8>JKTY#OWJG|z%>FO|iX%v6\
+UVok(Y@gHA&GkG>MDtISt6iI+`M%Zq0KPn)5>b5e`Lal%|{>xWq^z5@FBC65osxx#fR-s4fr?^|}\
+Kq3+aEU4gV!o}Vk?sr~pZ;1i1h?OFM>gg;#or;2;{;Zz^QscN*%_JFmxspe{ID~FFQhw2}EU2dwG\
+hVPPiKazx<wmU6%CB94K?-Dsq*}H=*pXP^Cw{YB;hrSVb=fj&c32z|Xhd0vw!#=zj);-rbY?_QWp\
+CaD47ZNYxjr)D#3W7JEBHm!W2|QnnNYC?67xMyi&f2fGxjgSPc{;F@hBxkoC@(pWEhJvXU#F=U>j\
+*UIb<Y6)Ive=w41g8Fh@V4_=Z{Y?bDI&=<12SHFE<&=T@B?X+q{FDw7X|14aTvUB==NYUxB_d7I`\
+U@wezy$3GNSBC&wOQ|0!RF@q8@s3+4^+%i6@wf%DxXG>Uld(#PXSI7MOkMn1-l<%m8d`tIAERnfF\
+$Cag0$aXoX6S~EJhfBBUQBKOapFv=_IuhO}Q^gR9Q)Jl4$BjOm00lyV*q~?}_-t`2H7qt1#eq?@)\
+RJD-$E>ctxH+Qk*Q@=vWi}DkFi+F!J#&V&5a=q@%`Z~}vsoc#}YH&?Z4`cX_`%^B1-+D9Cr;w(^{\
+d4%P6y$9^$k)%t_}__uveJJ}Qh|RKQ2A=nuX|7r0$uu5kkK)`{~KGx*?F4&h4IUaMjM}7E8EHk4-\
+2%FXAkqYmG8SCGF$oE7qre+{+D3+CHoS+6AbTh$A05E&;YBlVz!3CxvUjuU;>W(OWakI#LxZ(oo3\
+1ib`MNlBDW>OJG#eoW$Xrw)5P`aY{*k<5_eJLvsfl*s}$OPa)fqHE|!bEH+Dn161zr;2G~H}r6V}\
+3;QjOwEY=C@Q09?CPmj=II1uOVxd3sH#SqCh9U0f@coX=(5*#naT2WmCb>9@~|3h6^#Auf-BsI?u\
+XKQgEzVkJ>6YAIj?`%B&8tV}EZ+tym+?k=&d;$OQp1b$qw@AcPLq8gZ^Ye0G-YIS*^4LeJb1F4Eh\
+co*g=JD-WvM^l|eNi94`&yrlsMLH3&u<N4_=fdY!ZY@d`Czw<A%w+W;(cFO=4;?pnD0-#ui~Bs20\
+v-75#hPMe~bzACHd`HE{>}~x?hcQLyG4>dxvcdyMx1|6iul!n>OBljL{tO2h_EYuh-5uIq?0nNbl\
+u}BLniZEadl7z`Hs~+l%icnJ=Ho-h}TY8ErX-%|*+6o;JV8g|vWmV_qh!Ny9iE=UNBv@!d&w57bE\
+aeF}WHj<mSQ(jp!=-ZC53otU;wS-Q&PvxiIpx#r3eyk-Emqk_C~KR{e3fRD@<@d!K(+ZjF@eWoTy\
+Jm`zF={_;2ccQXX*jXm<db^5u4{Gl$XoH!}@AklVR_$FDf2WVLch3jCWh(T4A^gsO-`OB*x!tG;w\
+`gt2LtD+`8DI5xygQoN{KYxt)Ti@Kp0}Fw{dDNt_oK!C^nYSqxbAaL=IdtQ@dHO|{w7=t()%A2$!\
+;{C%U+nDXV5>qkUztm{}!GRHvcR9(UaL)1>yF?C<eF9^lX6wRmL|tj^yv7nT;Rt(r<rS?RcB_@Wp\
+83(fA~-W8OH752iK{i=t4uNz-SIV`rczGQL9Zqd|KfU!MutN=iF94gsz0;l3W^nTTT;4{QA#`L<=\
+F3G^v1r$>B;`7po8LwL;UUq@+qFb(gSaoP(iO-jmzrV)$>2wz&3ncahfd1ZQ7g)))z&@MiIIq)`n\
+N@aK5b7x(AOa)J0KZ^TybUYWwhO*#kxt}opp`(RgJYRk0V&k|N;hzy_v+M60$^#zo{0Me;x3FiJQ\
+b^*#QQ_~I{4yspUohs)jSF)hfw+e?hx1rsSrbWq#*gu?l?eQ$Ft;N|(Yt2e67#8_!*#=j4jEn-q;\
+xuSoOebi-e;JTk471tMUFDlQqgQ?F>A=9zZ}KrRq*JTA9cP<n7_@%sg;|lEgN(}nByl<FEq3N&ru\
+z*uPWAPxF-Jt`Y^j_>+d%?Z*?x~o9kTmO|B)IEZr*ZE`qud$Jt)5)XJp+HfxaSpu4^T{k#L^8I}h\
+=teAvdr=Sw;b<|!6^`MOqaSQoT43wcdBDE3oHlV#3qMnJmdOm}Ca(F$Xw0e#LPERnX=TcG6gSvWz\
+9UJQzrq#3aVuV9cH+?-rMLkwsJ;Iia^$gPLskxYrE1;fKQ4h$jtwgIwyvO(&Vk+7(cNEhhDc_%So\
+@0u1{y)W~Y2(m0`sui7Ht&t2@QiVZNAUTW3F+tPWR3s+E>eT>fVehid}Kle;2&QH6{?So)UAWKj;\
+jjYFq1g`m?Prng8ORd9Xe2U&j`&&j(p~lSS=O;{Wcg2u|CJZcN4-_^m23%z7p*I%rJ3x8>2(V&(r\
+$>qKU(A--5Ijq5hSvd6b9v;t-(hW_wzt@X?_yUD&#}$NKK#(%w@)0DHgD!tLcT^xn=&v_*PgO^!Y\
+UPa1I{u1%n{OAc8(X?dxvhrB~B=C*#+0h0JWZgHnHz;7P<fId3U@n^`F#`OV<)gaG5&vU#Cd3uOE\
+(PU^qo^Q@`{QhEQ6Xo>;=Gk?gW9`M7O;mh4$$9pk=U5}<L3pseJZY7976Il18h8!$p5Jl10m78=r\
+?kpfbayz0!k?}=`ZL%4@8=fl$IU=b$OjRwi+_}CM;zA6Ar0Y;e7Y9usyK%BP;M`Q=hxvGV*}Bq^s\
+&$0$mt&H?#%POBIVm|z#n9oVSXCRcZ}IvzC{}w)afKlcSJtstWK-6@;XF1wTnPH-l?~_I*sp(F02\
+f8_cx<i(2>nzUs0M`4saIh?a@Swuff>TT*>Z$_sxk|S<q!)LtU26@saZ!-C&NzJSO7)ROnaE#du#\
+foy(>3q%#ugc-(65qbw$ruFpypM-O=Jt<C??fHI27(OE7t&*ZScbDX|EcMWjtAF1`{Kr`!4;>8B{\
++H!t?w3-#I-RtlmVfQ*1o|9i3TjR;><nSz`y6bE5IxKxD@n(Dr>y)Ly7ncz4*sqCe?C0>Uf$ztlm\
+n*iabX$5Vc`-eKd^N8?=`uH!^qQASY&WE)ZzENvXj_#{dhdJpE~y&373!!0KCz1oNq3Q|^tT}Gbx\
+3;^z7_C&iSdxXAdHp)e6Hkpy@cWQKX`iSd{YgXi0fNZ&0)axq9I~EZK^r`qlUA$_T+p0AiZ`m@ix\
+Lc&oZtrE(U$tYI9|Mjd^3^vS6H9HEeB>1!HxKdSLGJ6s?|mUPo*cl-<h9ZsoC1*v>-Y{rX4Ve`2d\
+5Uu6_1+u%1hBlQD3_i7>F=KG}TQ;{c%=Xsaq+066cJ9?(X`?e}2D<hS-;642%Ra@n8K;AeQ$0WcH\
+wBIhaqF?@@K3R_t*I#+QI2gx9JkLwv`}$S^-(dNk&B`O*tUQ}{;3GvYddKn@_KauXP#Lfc{{vo)V\
+R%&%C&6?!@jfs2Wj6CE4ut%Z6b74(W^>J+LV{-qxt@f)doVA|XI&xaumHo!kasc06DV<U6K`en|J\
+RfB?%6{gK|g%{@eHZwbD0dm`Q0PVjKMy>&gbrRX)dM`@2}<lP1X80Sz$2S^Jn6kv@(wRGqdIq*Ug\
+Z>;m<ag=qL8^3dsL3^l|aZ&dIc&3y5ptP`q>6Tr+Vv^Q%4-qR&f%^|^xgxk6j-3V7pM66c@<_-GX\
+$k6ps;Ju+@z4SY`?=hY0i(N`9$#4gVIoZ~6ban{GYO`zo=8jcTLCE<9sgyU{eM-{K5N`miX;!O>L\
+>+y)kupX~{j8ydqg6mN{j}O-$<GB77$93Qjo#b&%4#4%H6xZ{KtLdl?*Yo^veJI8CY{0{8!1a8N>\
+;2htR)&P@8G!5k4RC!d@$Nh-^<^x_r3?wzs{z;T1Zl_h)lmu8?Ht!LBwQcEaJ{KH2;M+lJ99L=*(\
+c-8t9%Y$mF6Occ>gZ<FGuU257+OMaD6Co{TcE%+^NI$3>~fy2VC!sJ{G|B6o%`cgy{2Mg7x_&-sh\
+KexSqjrJ%i!8|JfbP$MTwx2R(>)C7y+Z|G#FqWCi{m`#HiiHZDWy2eJt8ra!47pNDv#L8>gk>xB-\
+2@~CzgX{P%Ju<orKPq#q+F26}7mU*eB8e3H!;AjTOwG1xTu#CdX)DE*XqnsltQ1{2Wx`&YF1fEZ+\
+(&VRt^@#dEHmHAyRR0iOe{X}n4<gO+qVFIl!uETRRPP{OZx4fh50L78OINQ^e+RI7ab9Z&uzJ(Gf\
+}DSy!4u`{z>gWND10u`<Kg|QA>LczeMN}((eVDI5bqUu-``f{e1p`aH^cuFfWM+trT2i}X!wnXUn\
+~5A-jW`#RJq^a`{wX0fWLx%{)Ww4|5q4Kb+qHTL!72FZC+c3t*Qd_Qk#cV*?NP{vk!i|!tWvYwZi\
+XF_yt`FAXnvi0qQD;x?X^~%JH7KXvc$xxZPwKo+HNe46z1Bda{6iiE$&*;u&;DH@9iiyT9#Gj=u@\
+JXRtazCq+MjuMW^R#l7Tp$xz2mv!jC7LFfAzscLEDcJM}S2ZwPl#P~FB2d@`*Qp0=f!^`aM)~ebx\
+Qbp4se<`)U1HPb4uw)=!uy@ejvm$>cPXkyyh5Pk0A#H%I$^`E+Ed5eZ4%8lFasd0q`owL&(8sU%U\
+ZL6z7>BI5ZV|R~{=DG-vG+EBQ59F;_{`l+vLWF+njl{bL|GtefG9zO1_2Ek6(uTaAPFRxXn+&~qM\
+}AYi^5|G<x#2>17ZzIEw$7_i;6;Rw6q0E6)kGOs0pAFMBONm_jl%F@9btbSrFUz{r~rBIJ5W8=b5\
+iFGw1v!;5X@EP<)=n)z@?0zZc<j>9r5NV|YjD#QXeh^!fX<&)-I$Ki|3sey7VdZ<qSl9K-4N?Nml\
+fo$pc^&~J(v+riHsbDX&gdZlRH8S`5o`R!SUZ+)^vtp|4W+0no9z=i(zu~Jw%cQfzV75g(-FMO=-\
+)uc5;^e|)p-QWk+g@rblr1C*HY4q;+VbafVR(?+ub<;!?b^7gL!nP3m=t1o<8$@0*U%}eKe;*xj)\
+gM;2k%;dT?M9sYwfm{ero;=_GIf{jD_E<6FYaF9?vuPRwDo(#^!?g&-vx_}T@(zXw`yze%~*GC&g\
+bFT8uS5gUpN+k<zSo@(7AwKcS>ER-r}sVTHTx2LXYXIUg-tOCgy&$pV!p-x}htr%O?5uXa=@ddo-\
+hr@1rL9_Gk{MJsi>_S&R3pe$IBT-P&^_>TV<1IMY1+(f77aguI)SHNF*NhZA!-!fi|QKSL*Zg7y`\
+)jle$Ljyq<`cDntX%6V!$84$29tL+6IKs}GqHUY7=eu*!R-RD%^q2fq1YzJES+j~xBf$|q`$Jf$d\
+-8q#vv6g#0^cQ3LJ9JLv)dBv@edb@$UXS*h?Ww%X@N4dgEDM6gLO3iweGkNu>D#OKw>h{mt!*3O%\
+3y6h6ov@d_@TW$In>_kY?vbTQ>lHfA8PA@?i(d>UY;Im+hgU^d0&pFas#D_aDN@DZCk?I&-ym4?f\
+V=lpYiIRY<-WfPd}Bp4(fZXgZ1qe`>Ac*YcB7&57;ja<IdR_)1Hb2zi&63y<O98n`|3=I5_S7ad7\
+CoXKR|W;dV&7(?6$$7~|AEv~<2m^=h6AQC{wEBJ9l{neRsYVt%+w;RdNYh)jJ_YQwvR%Cn|m_o4g\
+E0d9A%`aAvaG56D3nWFSo=&V)PIx2mYt}@+0RK7%s?Lq660ZM0)^iD3)7(p2CcBiTH$SJaX4;ptk\
+Q{EStztL|7>HDzJmp@i<yrtss=@NDIKO?<|1wSLDGqDLnTlRa+uSHtMbJ%w@Q~RL)+DvWrQdap><\
+34Vam#;n5{DfbfMTK!Ew7zE><(xcJ>h+M^_XxA~ecxwN2d6>UrssM0>b4Un+hMGeiF&2}CNT9d=T\
+ckvjQQJ}(tX%ub9pfE?rx)wO<cccgq>ZUm+Wl_&yQ@lDZg2k>>Gbpd%u*Y)$<7xja81bY<ur%7Nu\
+kJzQvvEmVHnCS3{IM(#kj^_FTEZ&hVEjPV(O2J1nWY_P-(S9j@p8cuyr(h<k@m;?DE1?&EIlK6Yh\
+i8*lWD4oU~_EQR~j(}(|b@_7t)7k6*QP6|uPcitDnf@52q;=SCV`VjH-PK2eq^MsCBjMN30XN;{{\
+fB)tHeMf3vCZBdZ8Qj)-@{rc;5`Wpo9nJba<U}5xzwW%1Gbv--AbXQ@xVkGGeUI|gmunkYY18I0f\
+5%8ndEamJL$~=GJnF)we#hs?%OUXSAnCz$RriO(4~;Dk#<pKHDmHGB6aDXmD7$fP6k^_^Hs6D_tt\
+WCpn7m94@OS*4*T5ep&Yq6n^Llk_cO?`4LRAdg+1{{&*LojL)i&yt9#1fgCpzcSeOk)$61!TT1J(\
+Ce^JhRiX3V>^wfnfkx&N85!%JJ^v$n@yOFE;<7JsdpM}%xy-j8H4iKX%NegAv_b3xC*dI^Y|^bs<\
+YJ}u1!1B|&(tbenGF2a(_vNM}T4pq7c4z&h}6LRmS3x?V{qjwE%iOaE1m6L4iHBPPX{uXtXH<U>|\
+(<l|sMe4UbF8{!LuZ=LpWSjAm)@7=D2e%<psrHIE8tb13kf~Z3Pd*&dHnz^LAwS-|@ZsJ=PI}<`x\
+=M_+kHMQd_-XY{c=V6<VccgQdy4s{dLjJ728UdC1fI)=Gp;z<Y2s^`GC=A{$N(RUzNF+kRW8Ert=\
+H|0v&O%f_X=<+m(e#1eSHer%mI=G<D?Abify+@%7X#t+aY*+CJS!+V2+1k??GXd3JN*R<+R;2PLg\
+a&y3oP+N49Td@8*eOt=2W^<#%RnuXQ!gHNP(m9P3)KBcS}&D?M3~CmTA-_O!*Y!z1hf(SAA#Y@$Z\
+uMGnSZEuXbhW94CWZwJLgWi$Ex((;yahdCaEYH#GHt@b9cBZyz9{|C`tqFGCuz@?OasPG8;Hv>Cd\
+kI6osI%I#<>nwWLIY=6<){T;5!_oQb$imYNCB8j8xb41t_u$sskPkPpKij!_5Zf7R=;56aWDdEs6\
+<!AR{cx~$Da=?Ux1L^H*0$FfQOD&PAXcq0xcc2L)EYzS2mV*q1*dVGHrGLMOv*jv?!u&OykGV0-l\
+=WNvsB03SQu>#>5^QfanLEf$!f1i%R9x)|LoyZFn%eWjsfW;1*FrfwRD1%k>q+;Zsu?ozw1bSjNZ\
+d)z29||XHsq2(NX<(VgF@WCrG%D#9bS0=l@^uN4y~$gK+f3qgeR%g+cuWSs#<%J{li#q{Msi;e8c\
+IJ<;awY}5WcR(Y=Z?E$&x#X6nWtF|k9h4#JD{Pw-<{%^|sTK_m*WAR}uX?i>~j@j^&DDx54Hs)=p\
+@wPt?6WcsU*b%&KykDKiQr>nReeoN6iZLPf6rX=Q{5j=R_mtWjdrBSEc>mD%at%q?ac7;zeI*k&v\
+o$RH(>iB_n%9T2our$+dKlXo!-8YAUily3f3Q8hv%i<~?T^FzicSA9-iJFk!B31zt5X~6b2EP@<M\
++(dSeD+5wYeTW)qTxiZDhW&u6U?f+Jmq7PPUP#U~S}N>hl!y6s+Ce`Q4A#Zn36)g)#QZDYx5`*h`\
+>ulBh7}8$Awm3B-X!d^EOFTM=s~10#moEv<c$f~}W=<S99vy-|$Sy#xJ)I(I^ta{|uUG&bV^=5Kp\
+#alJ-sqb^T!FGP=<XNIvi+%pV0uy2@q0={)|<Gug1c*U;FV;XC~&cpU)!DW{Jw5)kr<ib|$9ETch\
+maxlzmLkK~91nus9pWrvkl2gW_hsdIvmCOWSBt$Wi3LI9g*YGXDDNq&*ZU?a5Bh9I;P26Xx(~~Fl\
+6PN6s@sZPBCn)>gLFR?Yg+s4AwNWY%?tBPVL%w|>%4IGVuFODe4l#?`&A>t=odd~dkizKZ!kuOvv\
+(SO?y2vc`uc3cJ)+N!|Gs6P{pjcR`FlA1Dn|8{GH=^$U7We0-HrWD&coE6souwYC+DXsHFjQQ{zh\
+6O%-`q-hmRP)(HAZ-zLP!B#UlQeXK>VK8k9ft46diRuRgf#Rv`AS-aBSa`~CvjBX$dWVR^Pg?*^;\
+i!`1JR>i1ann{*eilWs8|)3?`E-zN8V<NUQ=;P1+Fw;6*>89TVF5_oR7t&Kh)`Y+b8uZ7dk;csg=\
+{;>A_OPK!t8m7O0C_UV8{O)3*v2F=hezn3I6!#CJP3@+0vsfitpsfrYMD=CgUr6_{)%Iqavbgj^_\
+O^rrBd|FPj3*PnDobNr!*8=OK9j!BrW0tRbjFa$Dji(om`w6&>}&F~{)CcOksmr&_QM7u-NfGZ9g\
+CDkii&5q?@j`#$D?rzdZoy_fC%UB(}8SRKm6{ebP7%Xi77IkZi*M=|NVis?w~F^-KkK;?K09m49V\
+QqQR+l_R`_A`-HG3gV$LzKv?qGUAnw<flD(jNcc8tr-g8+KL+O(qI;(s>CWy^+pq+I;VcWUu=@5S\
+Pnd$#cdt(1z4@Y|UFSa3DYq|O`-C2u1+N^O_jB~p;%)4Xoehc%*4e8D8Fl1{^a|E3qk^eW8J{PSg\
+s9kM4F865Y%#6<3=^f!V)Azvp>5`VVe$KR=o!os58<7t6|F+f|=6dlpbG?DI|IDPm0QFzWL+vPu^\
+Fn3*N3iu{koyQIUdq=3g$K*Q1EKdqvSpM!libDabm=|ey`0B`&ryHlaveLwQo1$h`{|a(B?!L$5q\
+hpX^nHf9ziQnQ3iGLPXX4#X6GN+Yd2f0ca#n{h{3L|22d~$Z|H;0l+hk{nNg{0s+Q%*mXKw#7&kB\
+|W+8%_kckt-}CAO~fA+T<cm-AX#7ifR|#9B;ZoY$*<VxeA!D80~q9Z&8KNxC~?gc?g?xop3r3qap\
+8@qV=b{YIN&of0Fet+v@b;1t&sKV*NkH64T)sejN~d+2hC?IHFg)=#=0g}di9+t};7$`dI6k}MdD\
+yjXs^x`J1by{^;u87TScf@b@-7^5(!Fy3!v?NubVPdeseQ&)=LSFl%d(a!c=k@-sPRkmFi*<-EKS\
+QL<@ilZbZ65aEgMLH<=#y%z2_mjL2ak)NkQ0Wci?D_^ryXVm-mJ%-E+Gp6#260b$PjAOi`8uDyau\
+K!n^OZeYQlDNAa(VZhiw$2%cd-y=V4fbod&_-`GLNu<Yw9fUvz1(lxq;-rxrSfD86=Fs{lb2nctj\
+Z7x!!7*l#O5es=LJh#yiRv;c*hy%0jO9H0Ta`xi+V`3piot!>`ieH)ZI0B|}$#B`~(T5DtqDf3E6\
+dBp3MZONK1&v++S*KUP?$I?TVnxA#J6o+F*>B5ug=gy+_sY;T2)(;b-_OBU&Cdl-TLfihZ3cD8X=\
+WO<1nuWQUzygPo+ShR7gWqUSt+k@Qq;%k%Wo9m9tIuUo;L`j*vtCFv2U8~!a-Vb^V<-A_)DbaVz7\
+x9V4D5}$|42%)7k)!we9*2F2nN4@7yW?mK(0fo?|C_>Jtj@Sae(>#Wv_;C(7luCgEho%<XDO4NEp\
+3ll<fp&5LxpTWjP#5>FiPXMDvf`sdwWDbNmO?48Vdk^6HJ|S8vEdH*a`bC4xJaDJtW<qs@k%~Ci1\
+%rC)l3Y_knhFt?Nr(X@z%BqPqWZQ|+a!GG58G;$0NpT`bQyedS=Tw}aXb#;{GbF%_HaF|_5LqZlj\
+Iel^P6Xkat$qP@X*#doTs0r(CcKU%}=`d`_f*2hwJRP)e5ZB${Bt`&70d+;r0+qTg@Nj}0|qT^P6\
+`YJm<T8k4-Zoa}?r7-X4dnP&xnfbVHtnJ8N;m5=oj&F<`E99}^D=*=4t=&b%@#j!+#IaWn3%f!)j\
+&v2r)cyh3zVj7MB6zIjDs3C7%kf4)S<mk8Z<`mcp7#RY^6qbKyWx`f*^P8J&;V}ZRSErRSx*PV7;\
+4-F<|jk>*{de^GUsP40|;EaIA45^y0|^InD1$>?P|Oy9<0{3+#RKy?ow{Tf{cxQ`$>hbd$8VEuhk\
+p6GOewHd}n9s?yGt7UV9<0+(q-QVQ-S<vxznJGF#63qL21tO|%E~yC%E+k}hZiv)d)r=VuC|)hV%\
+|c4^!8+J0ysm}|BQd}yhoNc%G{<M(q-@-AO{9A%9qT{LEyy}zW_wv+YT)lZJ`v1%>q+aHP|y!&2W\
+(nlkkej4k$e%JiOyXxLG!uOSPP)~99LVX9_XD50K=pHtt^N^Ms`pLOmU>ggYv|R7!$CTYX<rlx@+\
+&<AOu!9|T++5w;P!ngzKUT#*jn?iW-dvO`SCng&PyUf{U8TziKRb@evA0IGGnuc6Vy~CJ*HE6iY9\
+6Y*sJx}?`y<Tz4LFUBa=)%v+bki@+V7+dG3E6=)Qc-q>ZVf|nqPJ|$u^|z!f1^<saat0+wzFg`!d\
+s_wD;5gg2Mb2a~twca~tJ<`7xW{(gq#<rN3M+=({h--($z*J+iS(+nE`%g;B4o4a^Zg*&<*}p}yk\
+6Sh3oNgC_e<ymAjf8z%cptnnN3^;*Uyu+#5w^?B>bdc$_Vt#!+<y#e!KD`%#^@cQep)EnofOTD(-\
+A;u7W-b?F8e4};R3a>u52+yY1$-=Yg)wUlUnSBqVw*AOdwjYmtrS8;iy!W4+SL|B(6_xwc&X*WFw\
+lvr}$JKeu`=syI+CGS0&ygL@Amrhs?QmK-BceXgkgUhg;Oj&^zQ>Y%y}<dE*i8d?J8}1-#vh~hOm\
+{WPc|+aRNb{4SiyO?=$HbiV-xD(IEEQ(4?><C~(*?)Wx{u1fRrYVs*;4kJ&1_8eOK9FV_7=t6s9W\
+XU@ocq5UcmI8Re=3vB8?f4vEct6t@DI2^XJKA=Vs3__1z`bpU$V)XG1>Md!;N-{GzpvZFk=@oz{S\
+T&@aoV4Pv|@IhW=EaX)h+Vc4=R<xH;SNUq(VDDHR^zr}qsz2zOww6FLgoyql6`|se*S;U)uYL3Kw\
+HDBkwyR^ac*|;KKo<3}NMU&!XcPU3dYMygrZ0v2^BSC&1G;L+OOB;lHmF|W=zCh3P>aQmH-(%3-|\
+E?LV6Xcyd-K9=K;8;iNs$t2&@0sYwgY3(N(3iS^``<%N?I@MYJcl#xQF|G}+twE_$D^yl7>|fwS<\
+Kb0{!%vF+{3BAG;=t$fjoBVx|owrR>v;RxCa7#W#RY!vexfeEB8PsKD`>IzVaKVajfojM2*!A_lU\
+82=#d{XRyQvVCM%ou<hO5jDd}^gy}Q})P;;WTw+-Yq#S_Q;?Wg0JZU1NT`m04D&g*~3eqb2*5*>`\
+acdb9zOX*0{d#y*+BJLkU=k*8c#K}7*!r_5={_rN`No^}f@*3e1dSct&<2{xA^Z&*<LYsPgt;l#E\
+HHVh*_B4l<@!n{bGF}u5f*Tv^Yz%R``eY8T(Kc2cZQVh!cZ9j>;5RmYkk*gdr*Poax@?1Q|4iBak\
+-pSt-?Wr9&s-E-PpWg6W0&3&Y8S44Wt%cl=)Hu37WR7n_k8PpM#0BKxvr)=87AntK2h$03)uqlOk\
+ty1&tkl-*Y{#2O5GY-m%TO%bGt*@#z!Ae>o)j(i`#z1{;BYn=N0?e9p!%ZcMVG3Kpl)?_WcVoPZP\
+bQLwS{2gICX*n4YEgi4xU%F~;7*6nOx@K539^Ds8u}@A`3IO}e<Bw7V1c0zn=sQ)zZo@9yg-u~@{\
+th<d!k@7cch60_qOe7~!oEeFau%>S<57WxLQ)Y;2z*pu&5I=U~bJy>l6_=hlTGija?eNLtKj*bIm\
+`KPwk!uK5kwp!~A+4;F2h<y^<DD|5k{!)$uCiclTW@De6*GThqXzY`76dobznr!IP3J#T;@BU`kh\
+vYTb`@!|9KVID^b=ZiPe+l4aw?|vrF!=0TX{^!v42b6wb*6aDm-bqOcp$J*ke8nymilR$w|yJM9%\
+NIt;s?o|gqhRZXIpHJ5B~V-zI6rSf2NPz7Z-YNUA67Dtt-*(OUd_HhvnKw?AyWLl^Ev+#J>F``G1\
+Dlm}<0kiBtE>>T{}Eg}FudLjB`Ab^harAz<urs&UItZqn!YG4`IJ5BIx`xk-l&W`iAc{pe_09wL6\
+PogZKiuJn#*uP)ZmHCZL(A88BzabGn)#n>2qZO!}V^=<oX{fxtH@1vX!TlV#R!?a}&s-N5PtV-jl\
+>{4xB=o};5-@jD4nF=3exA_}oc+>oysAL4R;Vs5{ntx{1%QeU6$nPPP`ykrqfke6HZBYJ9ozChni\
+I2t^PKfp2#Cls!q5NEMSoRSb58hN5KG!t2)RR5qk(T3u9&70C0;$i!8rM4QeGrmEs*l>^4xPC=``\
+C7ctBh~d_kW{gmS#imPxl$$KCv3F?*G=_Cl>V|CHFqQQujS9FusRur-r`WeMhOxQr~WDljK7v*@p\
+BfO}i25C!uUd1Wt+Sn;Q2csQhW@@C^u-zNyct&q_6xn!+1Np)*C}emtpHInhgV{Y3#-M%BK(bM$$\
+K+2<#E%lg<lx4L~+tM>d1zKeYrw8@e_0eEUL{y38UcxtwMKzkfccW6AdVV_GGMq{aIn@6fAvU{8#\
+!tSwjA=+pwGP9P)C3crwqqik*2jZ<UcW}J5&($1wOyRA4*#_R)qujoGk=m^{1n%0g7I_S=*DGa@N\
+w)0qv6MYFbJ;H6Q5Zfn_EY^(9vTRbrMuiyBUxmN(x;`c`?$YM=O>Hc`+MBRVZ*|A*~#Lm%~N=4>q\
+FqFO%1?PyE_z~+K+5!`N|<%uSVk<{PmFRpIzIqp$oPSUwbG7PTGIbmXh+=?6CEgslP>iXkd6a)c9\
+)nAzYBJ)mVEv@)lGdGKjA1EW}e1fZf*qb9+wH*lh<6`QzsXVz(9iH29kKt6r^RxBVnc+o1cy^f$k\
+SztFPAW6Z#Ai?jEqH8$H4<M$(6o^=UbEAZof;~U8r4>5J0t9mE=CCamaFO)p+IokRm^zVZhAD)-%\
+OCP4&fO|VU^&p4*!6AQO49gScXkCY-Lzp~i7i#b3EA~>=^ZSqd7#JSr9_!8^SZJAa_fL7h%0C~HY\
+Zl@!1J4K#?Y%>%zR&vK#MbJ0AVBsGC;gMb(c=I2;%KF{F(2r;wN~-dv;%o{Z}SsdEPL-w-+@Uyt!\
+a>Yx8!$Zz@EZDZJ&s5FP~_B!nYO~EcDNt>f5-7O!NBL(}b&K${>FDS|@Qf(l=n=zC##iBe%lO_l<\
+4qlLhWS#~6F?u`IaGP&oZOTui@U^Y^D18#<`5)6{{k#rw_yI?&*0n|tG@4c{)5-f)P%e?z0R#W-#\
+K?*Cy-wvHwy+hB>w_D=oDVX|HQ(2tMFM&l{RoI|*5Rfk%x(Ni7@jhUnER?iG(qa7e~XuH*!Ck(q)\
+<YoE^f4kIj<9DFEF~#^s@<tC+-k?1kC2!n(!rzuP55GgnAErHPp!{*^iGcl&P<QTe|2y|WVZPEB9\
+mRs&EqW?rN?Yd{A<igjgl=jtuW_%X*SB}a<^Gqsj;Arobp~iO%Q-09?UE}W7)1KLoyOkv!bTeB8S\
+nj0IhXno6dy->m+9qsNoQW;d{LRiKDAos-NxlR>Q@L;NntI7r8)8$Iun4uNr8Sqtpe%S0l&|{?;5\
+H@_#Ge0FQ}tZhH)ay8iaWkVa~w%?{cp6!n(1>Lq1(al~4G|fu9jv>Uv3iz&x=BLUyB=V;jjW!msM\
+s_*aM45u4~8tM?Mo9uJB=wuxeWeutPF;}%g|LPt>f(fKA_Y??pm9@^EUr-wiN&VhGzNSE^dDVO)z\
+cL|bSgOQ$|i>t*w%v7$4-u;M!_<NO#!>8BQRhEnTnph8@pHLn;!=Jl@)Z5ql+BD`3K>6w1iQ3M{I\
+D5~VWDl{wqt@#}_fzbbWHwR#(!5W55L+BA<D|F>R6Ts8^+pkPKfcrcM}=BH(jEbwadsr#lVJ*D5M\
+?pbj|#}oXG-TUSX$f6`^StlcS)SOVS#1)R@){7DI3`n=BqaEB^^^Ey(ucaIHL?7ve0GNtHRUyz!~\
+C>WQjvT_40y&Q>^3qYd~CNU$M+6w~p7$Q(tukX_jBt{Za#`FI4%3y(7v_c90b2AzA)m!OCBv%HP$\
+<^U8oci#D&$URD{p&{}8K%*Sq{Y-@#XZS28XZt5IQ6!n-Nz$<!R5s<Ek2fwqN@-8$X9}pi9&$C?L\
+5$<YNpT~xa`*H@;J&$sn_$4<mqw_L{7b~8fr_X_CoT5AI@`O%{A3wz%9$lrL+fyfOy;M;qH8wvg#\
+^$%5q;)dw+YjJz2M4s5=S`1td)(6btvI31jRWG3)pz|Ed7rKPRx4YCyHEJrmv>?q>=|7a##k2qO7\
+XWGf1&VPNEUdtdrKKG5VKt9J;q4AM~~KfjA5JpYT0KlrXQbfq{GmSj8nRiF@|pBb5EZ|e$+nGrWS\
+hqVd$3~=B?ORE1Tc_D9gt&;%s4)wxeDRp8mO6tk;J5?5owCA+I$H9n)btFLeL$Ftv9{e$dySAU@O\
+w#78zeOk)I)+=TbEpOB^en(_4uNOLv(Wtw5*q<)A_M~6GZi2IL$`A~8F%*cn%^KU}r!@keC^}TR&\
+Z$Zzy;(isR`;0g{^3TI`yvuj`=ixEAw<7y-0PiL@+v{pwz6XQ&mwh46dt<Y`N2&8OC&0g--4ovXp\
+Y^r06C%0mWAwi|l=YK1yPVYbK1RQ*Lm4&+EH&gs+0oLNHI(=r?LWScZx;6DK1^NVU-kL^25<Bjen\
+k-fw5LzJ=^nrvdVg^+|B5#qgYf430RMq^ZJ~}f`JHEnu+bBG_65=|L(4*R=0I`^$#QO_BWyQl+*f\
+!QBtPl1+f2j$iEQsE?8ju!5oPPQkUfhy3+O2I%<B8mTqDm=>l1Ap5GwNseWwM!U&`e<N405dGT*S\
+5M7cAKIfwiTS%75!DXjAK6S8i7c*w_N<k*03{fu<Z=C;0$PD{v$s?6KOUXFPl+ft8vwL{t}`p&eK\
+OmE8a#j%Dg-`Ku|Ebp&p+&g`>!dt19b<rr($@4BkxqPy{YCkWWkZZ`mI4YGNwLYk%xP+`P&Y2MR2\
+|4DNVHO02acFsdl9c@sb`8QF2oiR7sIU&T7C;<gEr2+lMI2q4TgFkS_1Z+5J-udpt08k!zV9ZRM_\
+zF~VZJmEMSG&PKwukHwr%;b+P+e?QTV-xco<{1(WhCEHcEO~x{c27>1(6Qe0%p3y^pK2IQ^Z%_}T\
+Qv7;V(ivW+Im{R-b0Znn|8jdaAFHbYf^M|oX+*iTmJxj4~~H&A|EZn9M{`PxCtH%58PcK*8-cj@(\
+(w$NYYrAu58Tc1hGCdv4N%*9sVZx6{PZLFzd_1*#8?mn!N?po^^hRztpk)kmn`cYX~litTW$I$JU\
+a+}=CBU~$?bD;M2!bu}Zrm?AEs7gbP#R1rkn<yQ^M2Oe^<APu$go}T03Oc}n`<7zQ8oa#gfS>Ma%\
+YDl*^>wv8`Cd}!Jw<63CUrHw{kZvwV;={{$oR4MapM&)7~3+!%_~Nr|2BDI<+nlgTL0qY_m@|xb0\
+obMu#RW`lWdz~y9Ksa=gwm@I<Gx`PZxxDR#u7g`<@u9<$jK^Q=~Q01FX?y*|vn@ZW!O*N3K{ieUK\
+#W-VYk@{;l49s>5;KBHX`}pAURCcVxdP)@6&>D%LoPFl-#!u2H>5`XlJ<{$gn_>3hGAH4d{>d%sx\
+RPq?Uhes}+{ud~MUEYeY#NZ1F9>Msq5qkuJ@qcC*n?)Ej5KSw|uC<o<zwc}Rr3*!4(;M-aLe!#Qp\
+`L}vYu35P&_Md+^((t!;j*MOU&5?#t80W=aO|EwZ!ZwT|UE6L5-%a2-h&{<GsBPtX>E8SLE5sS#B\
+5e~&cH^#3?p|u!gYumiR|VF>TBIlNDj+j8^d|j^Tf}dncY^q+pM9w@h7ji}XT|joAP>dJqYHVgM;\
+^0~N76ZV&2v2^(nOqV=c{<Ss(4;!l^-a~42oxDRK@i(5RcGNrf|e_$Qt$M)0lp<EEkV`TbAJ#sdG\
+m0tYVdarFar)-G(x%{EP6Ai?PN=xsbl&W^qqtALRE2;+aS%7WwP$B|cRnf3znpcmTf^{EkUdwpG2\
+QKF}(MwR5c_34W8j9W8}@@c_nvK`IU8Q<Skk<?U84-Rmv#NO%>LN3u8WuXJMu5w>jXq7<FR`7(`t\
+qpZq?t1u2-%bLC+Ic;cWQ|&O6O{d3srLRw+4f)yhHa7oW&b7CoU)=1CPSSeDw|ZHUeWnxGo~XT0J\
+6`LMypuY{hy&&MI?>kuA)8=ocZU;g%u|v*kKc3s+G8`W!<gV~DQ|0AKbn{Ou*R_t8}DHvmsov<E&\
+d|3ug04+K88bKr7C%biF&2`-dxZBJJH6q+MX!uA7yx(_8YF!SQVXF<9y3bPwZdzC;8h*kM6Fa_d@\
+2G<ZbAmxoN;pdXA^GP+yxUtqqA1qv`@51_o<<BubBEV$L02e?J@Ui#KZQBJu7X`<=4Am+$Xn@Si!\
+n;hxOlu0FAG=qobqJ2Qt5nB8l<sDnhTle=SXja|4a_Q<nGO0M|Zkpa119ie%d>Z>6!bJKz67w>wz\
+>+?qrc;7!Va6r=$+IL01-+m}j>L$v5)Y~g?0uhf3@f0H-590CH{WbL+g6nP2{R4r0T*fcgQ8X?zF\
+jb%P^YmIk)aS<}KLn&tVPzjS{9;VrLw=JV-c{W6(vgL6?;WWw_e#G?caN}l8112AyqJ=x?vzE{zw\
+W5GJ}=SlUfD%zKTnNawtYbZ`1Tg~)&RZ@0N;pb4_Fn~Uz;f9S$&r@h1EDElt*g&gA)VvL$=bHM?1\
+`Ymfx8jVRAjIa9oIgs}0;0k}m?w{iL$NYVgS~NE>`80UsU#AJ&2oG#=}|s%<-Tzjz?J;`)7P!@Wd\
+X?J4vrX>8ty_TG)&iTPO8)BQrfQnX_ck60T(_T4v#ZR(Jy<~8w6g~9kWGa!skTaL8~iy%&7A?-t5\
+>^q-r`u<GGPYR>wG&vv0I4Alrkqus8&b!ILxbc-WpiNyv>jU&p)gKp$c4+WpFVe<XyGiq6&zUw4e\
+DPqO&Y*Y(Wo`=O$M!Q@^1-Yx!Y<o)zJEA>o^+Qy=`MM)@k}|l9q8@P4>5OOTyGep>O8Q&_mg!_^Y\
+RNAe+TfmMXH}KT7)<o5Ff@giC;ke1YT0?q6KHl`G%qI9KYvEjLj`^jD-C|5Pf^CgEQdQ5ABM*?Uf\
+_3BR@FO@F(P@qa2G5h<?@XZ6Rl%&Iuz#)blG>zAe^_T_tXa&yUjm7ip3ooxb`eWYJ)D5~x$H3q<n\
+_?LP_~R;pvP<G;y0Px%||>8)mk8AZR*|Nh*p>@{N4-O0#P9rE@G+SPSuN*tV3!p=KSoTvEj8L7Qv\
+8iz5~Rx`Ojuk~c&HGT@dxz2v;Njhsd2zNVI#r0S6xH|^)5&PuN2gOKfL#BT^#QNqJ{(2cg4<?*--\
+I5S%$43J&`_;Nm*v||9aY5FOM*9)#j#tLM-NN2Y?(x!h$s4#2#`yCFZS?t|7z$kOozos?Q0xG-iB\
+;%ptI@ANM&GJKTm7V~T=&-}s_{P24`XT($$Hc$R$+{P=M05Gl_>W+Xg)E+treIm_HUY79>82vbB2\
+^vsqfaS@Ir=!KYgFQaptsWzgim-?ohPCkX{vlN$_La`nET8*@S+N)Z6!~^A>IB6tU3FbByRvc&eu\
+XH}c8)Kz*wytUu4d`twZiBC3+c`&ERsf;s6K%r$G~lYBqXTRWaLUDQB0Hxs@3uHf47wCCB~JL&-8\
+-kjxqZPr=ov<@hCX>6QZQD?V!pVNA|!hbg*TX#OFZK$y3qV-9%!aNge0Qp}37C3rOvrRP`hYjya4\
+>dnQ@;2=`#WIxrDYhx!x1W2nw-Dbc?S-Gy9`wyN#@<tEzw9aWlc$yY>C8<FwM`}Rm_WLFS5Z5<+1\
+p;*$y}vy^HBcJjkDs{eQRbr-~TjlYG_?kf3aLkUQKfHr8J-Adaot-D7m({j@BtyEAPiz_hYO@>ol\
++WSvyB0z#rVZ4%j^O!#w;Mdj)F^8;fxfd!>nVmKJ5cQv0(ISd6rmj8RyOaQm<r2g!9yU#hP`N|qW\
+Q1dDN$wX;F2cN4wqLgg!uz49*YpXAvXW4#e??NEiqIK|poJ^xJaG1AW-rp9>0Q9n%D2gM~Qy8^s>\
+p+UAU-JZIBPB<dnygvMH$C+5`p0TkC{JP=G<|l4f;i#S6c|f+a`diUwZUv22m|o+hzUhOXH9v7V<\
+w1S-;gBOPk_#4*JyvhU3x!?O2k(X-vdi6YtD0vh{(elPdo%H+pMSWyU#d2*+cBkqF|s}0pRMf+$R\
+-!#@-)07+=!PB%69yY{*Lr6(>(8PWBQTpt}p)`RsJ!~-uk7)Hf~VZ<dl!bFYxYGJFM`F@$c&|jDC\
+uCe8B;-^VfDLvTiB7v|~Oi{kt#ZxdE+nYoD>i7<25Pv{$Rb*t7aJzVm4@c25%L49D-e5$oI=Fjht\
+>ER!3(&aMG^_DY^|Y20PZ0~hg@Smtewq48bA(<d~?`*RK`9xIvW>(8kU0<eG_4#X3;_BiB0sYhhv\
++|W7BGZ;VDIOMs*(N85Fn83T~Z{Xd`>XA<40pZ<jAf7|cu2nc>Rgm9myGy*Ajb9K3SEj(F+>g3`Q\
+~f4+m)cp~7gBfg2-2zTZ)5E1J5gxdzQA|4!bI;dCS-bH5B_mSHO`=oj?s2hi2J=SRGs&>@o@B=D>\
+Yw8eR$vZDAu&~3u#~HxA%|oRnN-x$GK5^Kn>@kpWMVY-GOj1D$U|Av<~A{Yr$V>8+LwX)4g5LHcs\
+<Ccrf|kfuPvH!OuL&zN${GyM6jnF;c$%SF^@ho8*00o(&86=e=fy8)NdltJVc=eeb|8O(U&83Y_>\
+!-dCE{_@>f&RoQORxpRy7jkA2QA2*8da19$q@MQHB#(j1HcQrnKcYs};p;Mu4u{9QYRG1j-`vdgI\
+3D+hzP);YiaB&vV#vM{8p|h;@pWA9Hf!HsB@?ZyldC-S_b4oJdX*%C9+jm>Cuhw<d^}jDB{4l0Y{\
+)%RM><m}lHrH&6P27|~o46qRp}M`%yz*^lyS=PM8)y)1s+V_Qql%OCEuN9*l;<CBexgFjZm%gj|5\
+{<o%XThS{3RWX`p$CP^pNgtID35oSZ6anrFnaj_ofqe9w<+9A#VsAHT2bmv06@+XUiWPu>I25B6L\
+CO?fy;kcukCr*P`co{aeV%9c?+8`qSzLl9MOda&nw4C)4*Q344Ub4UJi%<>WXe8^=LTHuNB>9kw3\
+Nq6VekfiNR2TaSM9r*dC`{EYa-u=`fH(>)Cx1R5_$$NCGz6|c{jjk3LM$kGCH>oCo!A?m|e=dM!r\
+u=c*C)IS%Pa{XlA+u0z;%36g(p>3Q+{XZk^2TMCkThG@HQMzrfKh6HSAgB&F?RUD?9(Pz$-`2NBt\
+nTDVwDbD;rxM$g+D9s_y)d8W=r)olbt`E-_UdPPE!D%T&+jD8v^>kNWwx%U{ziVkAw5rVHjwM3y(\
+yB1U#)9?;=u+fGm_n#ts|4`?WpoF^Z?bnIJ-MoW!d=d6mPK)>wJ>HuC`Q|bBr)LKN3r3qW7`SY#V\
+(uF5QlGTwm79xVj#Y_<kf`YyHtoZesG}N<43Tzw<L2bII3^6n=u-v&oeh;P_2;=5s&u;bAvY7~=i\
+nIzu)`yS`8V-YVxA>RTkQWz#yMtCT-UuDC_m17@v7orl){=dEA?7<O?bVc3TX%o&OsZI>{dZdc>*\
+qe>p6^+KhAd-L-Eo2_XE28}pJEMNl5@v#6oA`p+}VP@Nacj^>EW(#85py#Q{#vDrf&>x$4i&%4PF\
+zmf(-ubtYZ_+gr^`LOng&c%>ze&r$DCf=UPRjjiPkg8$-|Qn<sGlk;+SIw7)i=D43ugOnU|{O|tE\
+gS<>KGi8@pRfM4*P-lg^2<6ePJ6mdb;ghavJaZqw=JmCcDLUju3W>Vb~DvZk8B!fqEaO#eTOf8@N\
+`mjBe}LI+oERYEJndwXXZ2SVk-A!^1KPw4aJ~1lUitq9^RTGh6EkE9}g0@A9Ltv(z5IP0A*l_K2(\
+~*+vMnqDp-icLw11Ydk<#4DI-j%FlBrlzc*GmB!fek`ae!V`~5YHRDc|H<X_vyzTonDGi6!Hh!SK\
+2enTCp22&2TjCkKytj2cgLCf;Zu|FIhv4JWpwn<CRNMCY{H4qr_8s}La2kWzoa^@aAGJ9TvL2v4p\
+^p=7yDE)?LiZ{()7f02ynm{nn!hw2BaMGFPSP4;kebVU`1=~4+!!Mzp3Ed~;F#!gs&Ax2Vc^UR()\
+h7V_OaG5qe9I`$sz7k3biM9U6}W5=7s66h@Jc%-&Oy%*Qs%83`z{ZZ%sOd_3H)y4uR+LLvdeOcxR\
+Lvv!YWF%nG-{tVr4`Wns}bFb@zmaLV4+F)P}_Uv06E5~S~JJsyZJ5!}vrt=3sqcE-<YtP-^@+hN!\
+UQyEM<<0lQjw063la20~s880#Yp@07A6zz=Xw6eF>8eSdcTjSN4ICOD%f93Hw^iPRLr?Kp=4uNGy\
+@mMI+u?|7-Vnei%TSJ^<-w@&)``Xsdv0K5X85V#~Gc*97X3_~8<1VlsJpuSM<IQ?B@M(ITB0h~Pu\
+-*c(8cz{J<>KRE=r0HCe+rq8WH{uP<gac_V~Y7>WW9XC#)sYKu(7d{4J^0)>iz<%!_F)?M%FpAgU\
+bdSGHRbwz+bqAg(m~u5bpfk3O1~>HLM4<m#lH!sO;2ciI)RnWqP#+&ckGN#~0->7T?_ktdT+XfBT\
+p%=jlE0F9NVw{#E|t<2w*<NSBuGD);PdiSMu>NFMZ@7>+En^LX2MKOwQYLSXe}zt=ieUrY$Bz6Z)\
+%;z^!v?6zy(v+K2ku<Ocf%6(7H*HLY(Lw<A&wh-Zmosjq(fBa)GoQ~iaD$X|U7(Q7%lw;o;cqj!D\
+4}}|j<PwDs+8Q28Y(V|~x3D#i&3JXK=2`RBxSb92EpcD4`)uCSrw?!H+mkodpx=4Aao;|nkd^w3Y\
+-)G*NQ_(U4hq@2{o7B*p23@3XN+tz?el6}KKs1&SMIY~*ynYy<e22{IkL$^ae|)%kuH1S!;Dp<_)\
+hmj6(d{^fPbBNlLzS$Hvj6acz-Y6$I|@Eo4U|iQrq>DJOF<jarIW1h+lL2eJuX^U_7Aw_eEM3(sC\
+f}q40Y!m_N|IuS@^^;NJoNPWWF3{~xvHAGBW|F2W@voD<=q5bj%q+o{3{UfsnS<4svc<=ukcNe;H\
+`P34#3i~X7jzQ;BaW;Vuf#7k}w&#I1%aZbb59Ph;52h~dhYl?5cyRW4@wfNq+rv~u&MIt`D*M4+4\
++Tq=m@Y4q}m-V#_r{DF%J15envTU=Y9xnTUZ%PP}ZaX90D@D5PM7pA!cyA#t;{QLn9haV`sJ=a)K\
+=y$j&psyG$S3lChE)#7PIrlF1Mk7l*Yf@9`FLNT-oM3~7LhH$nKm{D>5pb1j<NeB|Hkf<m>*o-!6\
+wrEMDBZvw83v*+N%AnayWOoZ&qn+f*-^s+AaK1yWKxOrqX?#YPV}y)9sXpC_4{2jRE`oaXYT!Mqf\
+~A?Q<Zmu_~=!Fkkui&yTKjk5um;VNIkfwS^mf0RA}QpTwoTp67#+!p_kH{+i{B4pQbl>TD@gKKpR\
+nCc0&Qk+0z@Uw4`LjjD7HR_{w#6WIsXD*S-J^bZ>8`^Swq2B<i04#sz9rMr*f`&hJjZtJ6cuEt`s\
+JQ}~GeE`oox52YFjJP})CpVvvzeQg6WvaX)FWppLhuiIQ|9nTKyR&*f0CF_x%mt~p!>nZ<2>)bUK\
+;8J-sZp-gvHln+zPx>+^M*XcsyuWv^JZ0wJ>OWl=ewEN<7%in5_v}4u}FI$>Y^R>71YH(hgDhIuV\
+Tai)CJicxqNBx%G&NS4buO6#=utzR!16RB{6_M)j{|}<rwgZ4EH)S`ZN4{zP9CGvm6@(+xpise1*\
+dplc{`o?-sm6{=1@F$bZ8il*`w?X%1KAB0aTW^@=#|4w7#l_6Oe8D7+TmT!3&i7mQJ3?EraR-LBz\
+&HazwdA){C7`62^;G(HB|0cqTp3yku4Fb{Pk>=u0Y@RoIZz~Op+Ahjp7>nH=i<skeN!%xZCBL#oj\
+IV6Tl3DUmf6Mqbsw*%)hRfbQFD@?~AX~pUJBcM!sj4+gUfu(f3IT5l-CCPNhX1q}yi0d*Je^rbwe\
+QF)oWlX!!YrFjlGu#dN@&3OwKS6Rf$!MAQea~NPeFUKw&|m5ohrE};*av9#lJ4A=5%r^_9(QewJY\
+$jfedl?<HSR(bxC~sK!>B&_rI+*;$QC~Ee8xPRh~9Z@Mk3_8B%~khXFL1M{2t!dM)lYzZ4)Po_*c\
+#6JF6T|W>6ZWw=B<<F_$_lykD-~ck^x}Opa*TS4DV-4p06bSN;-x@$SbsQ#(}ki94|NFfe1PN9As\
+;-r8&94I-|I;=KNM3b&v-Ab<NXF4YcF@!TrUq-Feaj1liK#w_u}mYF2(h*_yHT_{d7-C+S`*cUJ^\
+*=3OZUA#wsztazcMq)BOWaL}N-`mK;y@BQOrRhIr*lCi!r+SYzcZ*pr#jD~F<&s!6lQtf|X9D`hO\
+=uI*s!fnRbw{*`PG}QOKYNE~&@R@XT}X_nNnU{mfqW7^O;tdiTeKBlp8f0MT++9T_Rllnu~0r~+-\
+q6K0sQyXu|NM4i5E`)IzBsCyefQ49#0C&WA29sBl*xVAYMOQF}y#1&p7b-TJTuer;Z|<fv(_j0(c\
+x1l*i9H0{9HRta0RemlLnIcHc-k@WQq?Xuq5ov|sKby`fmm6Yv`0Yw@mn>#Z{HI$lSJ{uH7PH=k%\
+(hi?aq_ay7^S0`H5;fA33J-Iqua-wA&t_+Ab5Ywj$-;UptgL)i~dW=&02&Bv09&?7HC9cowA#i;#\
+XRSV=^u83viiur9^P;<*jjQ7udmU8AD^y+fw8!3nx+fga%ow{arhO~tk=jHxe+*T2&HZJ4`tX1HX\
+Esg#R_eM1&KYFe*BTB`zGdgPHWBqe`Xn7IM$`|L`ur3=7BXK$e<gp5IabQwG@qpeU<FlwuW(o}Pm\
+KtXC(Scoz6gUx@$=VW&+%%^*ABIhL;bA_`WyP()|MC%TF*<LEtvZf)$L5&pwu>SgL<WJReg)%r82\
+KYI(m<y%JEbNm04m4sQTMV?|-4{?<{Y_aT8xiw)t<52g4WYm0qneiX5_CQJPi(;S2Q?<AtjQMo_Q\
+xrvk%(TCdBnjsn6LBK`Y`-ur@tT^uT`gYMwsA`WK(;S2S|_%+e{W{^1U(fVm3%_OfG-|G1jM84lY\
+uJMJEHooRa+E|VEvThSqUEkzgJ74Lo#cTU|;`vQ-92kZ1slV#)<EfobkmJBsj4!>_`%$dvF{G2P$\
+3ui&{Y{X*g0Ql$+$3-pbYFP_e%DgG!TO5wM`2~#weg62eFgbFmA+DN+#j>Z>?<=v<f+;*L5^$SrH\
+NfcWg@=HGxbCtPyMlrdik)6Odja4R3|H1U>EgL*hP~RcF}l@o7b;JKWu?tv;=?K@CSd))N!M8Lt&\
+dVitSuWx&Twy&T6F(Fqm*H6~>v+^;BbM)iZ1-ot=?ikGzxaLOo__TgWTLeX@|Nx5|4si1(td!Fvj\
+SnZlYk@A&l9L9CR&3G+zbn=RAt?RELaqu$;R)ml;BZD{HR`QPmq>I|fR8}^I7dp^MbQ1>~S>yn$d\
+`L9cE*cPxZNes3w3182j%GR_~?sZd~-|RHc-$TS7BA&@gzf#yr2gGBad4;DhaYHCRwxRQ%VVt!r`\
+KIN4f8RCP_x%N);q{yz{O+W{`xAd*=#f5d+@JXKfV&RLjQbOBYjJ;K@N#rEc-VpYVNwL=VX!l{ld\
+S)v&364aHiuFFt(<?~>Gi)0ZkE^oF1VH71e|{>OcLU4u~+IP2Hp)PzN7Evd;RZ+OF~><sJd+Jj<~\
+>c@XNiyaneua{y?8jgK>Z0fFSn=YMq5$(f)S`YMmvrF>mW^Eh)O~^UVoghrUw+<LVOEw9A@YBc%?\
+cc_&^5GxYz$(7Q2pi)im=AScXQMwqsQecN>91E}AUfnGWfjm7T)4@?sGl~OqehHI1Fk+5xS{iSma\
+eZ~EdHJ^%V{S1De##Y5#+ds(JwBSdH<cB>rv+!+_qNN^L?=h_D9jA1&%C_&j81=8#&!Ba_U2cIBy\
+ovMJfuBbOo^J-h%g5aP+WcM{sm)d0CUrTqetvG0yuWq@_>kGb#=s;S)z{P<tZ~(KeNkO)Vp1np>$\
+txv@8Xp*OmE0Aqk3+v9yM_z;Sl|=Q`JxR%uNr&ovGG;m`fpZ_Z|WnU}J`|Tc-PbHHJ0WK^~0~I)L\
+!UgulRitireV)Yu;Q?En*)Pn#4j<0h9{&(<T(OZ568N?~FmuSLjP?LXM?+J9^rzUr$F(+i#U8A5`\
+_-Nm=>oJyC3bX9iCF_PTR2aL<F`)tc8|Gh;1X&-+bWC=>UhDp0?^Siz?(B#F-$S>9^2^*q<my>uv\
+__!2z&^rae$1fdh*&U@=BQy8z7W<R4dZ&vu?G&kJo9L8%KAGFPGy*?&)<@|Bg|4sUX%+nUixTa76\
+YI&kn){HZJp}pd7G>K*Y<Jl95DK$lxF1GCi2FJ3XZGETzXjj*9y|RetoBv?+0NHcmSYZ?f4U=(bi\
+>;zKZG;7Y7qQP>7D+S;b*z;esQ~hx=VxW1+8sGCy01OV;<>ldD^3XI?M9}ZjAdv#v4H6-KFnTZSB\
+30aLh^PEerl*(H6(HXC$8ve+~Jo^247FnA<T1(z=@X?l-?*%7*W|m<_MLbj$FDi?<9HIO1VoVEh#\
+2x>w08>fX=BptcB!BHbprmKO7x(8(fwG|aD?Jbeheyxl-gAGXP*-c#Sh95BTEMqyf;ukH__GZgF|\
+bY(L%T<GI-HoUcRzV%OuArOx2sP#uT|5NFYI@`8|_$~Z)3G?oE9se2~e{O({><_fH5cAF%0q@a1Y\
+A?-fl}A71-X*Mym;PX#b~FEH8<;&o;_HLCx=+o>rhi+l=Xqaml$+-K-slt52Ybps$a>JY)p}W@#Q\
+HM$x=qv@+VxtwA8>npOh8`?HkP6OANZ%eCnWSum8>15ewV1<dfW)Lj%#b|43tgoYei2;@H;j%zxD\
+aqDog5y^UBOkOD*F*3VP?PxW4#=l-FJ0t*6p=e?gP0QqL11_{gQ4++w^k^VdE+8!@dPC+d2ztm`)\
+AO7sms{W^@HXN959FYd2Lef4Fb?}{K@GMW?geR!Vss?E<2Gd~w&{XdLVX6#byRF%KKT0!!6GWzun\
+-yIe{dE&AYM%y#)W;WB9aC>ka#UFm(Q;2(p9nx0nEpF>&H%wub4MG=>HO+t5unSVQTuFQ6JFIn=`\
+meED;>`<L4)V(8cchK_iyHT(tK295$Gg(*SjcULjXLe+rv2OYOJ@{xZ}7@J%0^w;wYwDllf(g&@A\
+YqCqYgRA<*;pg#a+z!_U(J>3|!n9!VZ!=op0Fne)*oV|D`;1H*D3rt9}QWyWW(`9X3XL?R!CN)lr\
+6@y`$Fs@U!$^Hea=^`php3TlGY#vsm+?VXJPGvBtDjN8H`s4YXA^Y{!Gx0NU7=y~Wwtwf|^-;%wC\
+?S79w9_U-WgiyDb7qHMGq-?EH5(aA2~viE-k{y&$L?Bxi5WU&=+U$;YHv&2cv@{9l8{6tg`TR<AC\
+lejI<w%Ly1=kmYH`CjV<*H4k{wYj5QN5m^TByFEd`oi&s>}$5=IVI?aKfr$WRB_-g`MYg1l=*k5H\
+|#Rj;qBND9G48cpB7_CD|eBvx`ORoeHGhzWCyivTi^M+06X8ixxACSH63S-0Yc$kP_i-Y<57Db6-\
+-CBm3_;acQtNO=(Pi-b)D*aS{Hag7`njBs@T=vlKG=G{$OLT6ZCMOahEk=ZFu;yahXjimcoV(Xy0\
+z#Kaht)7Thj!G~Ta9Ifl0)-xBtvsUJ@H2{jK0{;IvT`jg#bX#@8KaUFKeR(o1%-#l<nIA68V`k?q\
+KEz4i^ZtMFqdS7+S?$djJXeX4VlZCjg-qIayxZ4@-4u-pn;Xc!FpJljv8ScJ@`y9hP&~Tq;xQ7_-\
+3k~;0hWir3eVO6D+;CrMxNkAslMMG{!#&k--)^|48}6Bgdye70+i>4!xF0m!4;$`B4fkV)d#T}m+\
+;Bf>xK|qP)rR|5hWmNL{i5N1$#B1Hxc_LlUp3rs816R>_uGd1?}mGq;eN+(zi+rdG~D|Q_os&YfZ\
+_haa33+;-x%)i4EG7cZH+YAw&8APxH}l`E{6L|!+n<F?q#_98t!up_dvsap5Y#1xGyx^7a8tL4EJ\
+S*`*Op5rQyEDa9?k@Z#3Mu816}id$Qr4YPfGV+|v#BOv63LaNljX?=##F8t#V;_oIgUF~hyoa6fL\
+ipETSn4fkrp{VT)$yy1S)aKB`@UpCx-G~BNm?!O!EU55J|!~MSD{?KsmH{72Z?gNJV3&VZHaDQXC\
+zcbt?47YWe(Y6hDJHy?<aCb4>XBzIa40kWX-PdrRW4H$z?(+=y5W{_;;l9XlUt+i~Gu)RO?)wb)g\
+NFNI!~Lk?e#~$$HQbLI?k5fRO2fU{a6fOjUozY;8}2_E?pF=>8`9m}%)77*#xh(Gc}kt@I4jE~bp\
+^bSD;&MT!Kyj!)6?&E#jd>;D_d`g?@zVoQAs^2IOk0H9{|4$f6k+vt>blYFL5~cI@mG?xxG&3wkU\
+SYxzOjoZ+iR+i;Z)xvsmF42b}Aj&K=S4Qf=YKnwVncuM69ZFq`=?YlDMrbnfQ9_Z7%Wg|#OJ+1wM\
+mO}`&Z7g}by7C6|rRD9>DD`+j*X&rK6xi&jkm6g2R!Rj33KIB;8%g<S?jIpx#!<?<)PDH(tr!KKr\
+J)ft(r$UZlnXY9HmW6odrXs>EJRXs(uw00++DbrSw^;Fq9BjJ<PEnX{ERC@=7YdMpFr`a4a(|3_e\
+Q5^&e$4khQGP$9zQ-@H*xYrzt#7CsXHtB+sv7y*J$kPHZ&yaEzmo&M|GynRYC_TqUt2vL-#xC(@W\
+XfJ(MPQw+a3CidbgOncJP3A6%N<7|Fl2qOUp?5b}r#HQEW{VR<`neXSRg;G0)myu|0gbuU*D7H)C\
+#RCQHs#<;`&B1n}RVKN+rt##qsrRbbUp5!GW$6kDN^3!UEo-{Kej*W>3uD&M&vWc#A}$YCtUIgd>\
+kEq-@mi}7(WcW<MyI9=z#mFpMhI9G*VocT_pj}7MM^l<IAxMz)3XYuV82GwN_=Qamh?m&Dy9L_oi\
+-|a{cnr+N3KZb4^5O-q)w+@^AC4QV=em#tNdK9wJnJ1C|Y*%rsJTd!ZGf!U3ofw^Wa3>wIS~L~yv\
+78v4y;l4&2V3BvnS}f;<j##www*g`oNS5Z+~Z`sEoZ$GKIVCytiq}MozE7)v4EE@K@{9og($2}>&\
+5WDg@*r5I~;7A<*KFOzsk~i%8bwV&vU0WMmy@jFm$KVY?D@D`QFjE?!<hYzCGX_Cad%%x^KqK-R-\
+L9Y<q03{N0gZ5ud++FSb}6FO=_+MEvoX$1+kFD?aAHWLxK)5Y~LxjrCxxM?5BV4>j;5&UkQXg|l4\
+ey&qfL6?N3rwfhXVy=#2k8Ei>H{LwSm`o!!7N$gl+HP>xI$^|tRqCf1&(c#<WWUZmJGlI5xY7=4}\
+FJ|L{wcj9PP^*1J&WV}-xjE%*-ecTyewg!mPM1qsPPB=2_}9VLTXTKAM#MAPwa#c0?Pa+uI2$)kz\
+w5+EZd%AoF|Hh?8VWY11dLHF`R8`}^?!sn`((S!300geH|irbpwFV+OmNL*`Ju*>*8AhhkD1AS;e\
+UiNuH`)LSLR@4^5fyT{A{|Rv^Z%q=M@}1<0wz7foy3x@nW~bxx&f!II?wRw;1<?3?0ZbKc2VC#pn\
+bX)~*wC3=HT4W2a9onO;&}<Sv~tqs(1cR9-Ztyr|G!GTl9^d}cv;(QS7zcJ8_7wqpgQr8A}!l+T!\
+%k#osK7pY%Go>?V#7v+_^rw?%VpWfeHG<Ql-QQ<82w1T-M(`HX|&zfCUHe)75NdDNEnKNh1yvRMW\
+yu4^y8NDr^;hr{QPLaD{x|`nI<(^emFeSLZ+h<QJbKhA~UL3;n*y(c$N=pjeQ;G{_7N86>sSHy~N\
+{d*~FDPBf^xN1>c0HTSE@S5fMl*f(w8`)}W2*bkqLSN+%V!08C@U?vt7s-0gI}`?%1dTUcbCj^Pe\
+<Nn%tUr)xF?s~c9EO4W3#8vm|0jfv#2m{T0t2YSALQEj-tEV(`S^sr_Pu?y^#4m^>ea@y`ku3SaO\
+ZT-|Gg|?va15`i;*`e~X?SI@0vNVbXjvjOq6@#wS}ThI|%_zfAQTU5#0?JWke0ICIeEEUY1OI?+4\
+%SeR$5tUqIUI1n$<&1p{h#sA8X^qbz-LpIoO9$x$s9epTcoj})Jfc6VodkN+#(D+f9!$4hEW4HrN\
+xSp{p`i`+@BWUrh$Sr8iM1)_7?*+&sXzCQk3PC+Zn4&?mry?Ban%l5+1kIhr*mlsP=%jl=7tUeq5\
+NHL)(qo|O?_(_fX^Ul5fCr#84=|Pjn)FkwjX~oVGL{Xx<`I+)G<gx0T%hGk7@G%LT#2Cwl>Hpy4`\
+{_Q#@2!E_yy9Z@J}Iq(6V15ebB;{NT1TFLi(VaS0R1O5biZdA2jJ%qz^jpIiyd&tC2ov{aWw`G-E\
+wu<)F@&z$ehEKOkMu;!TXLr}wWhwheUq7RL5ayl*2t(1d@WK2}+*`d>%~bm6;5hm;uJLpq>rAJPF\
+$_zdL)tvQHvK=(GHe4zDTAsx`8O(-9z=X;b7bOBn+ZqObs&JNN0c38;L`%aw2uLl1UIqLyBx(8=z\
+prw5|%LbjB%vmnz-hrHzg65pd**wrrLpWOux(9Rx`5THs9@LY@*=Ep%>74BV-Ej$LwV?Hva&{QBc\
+qCfwGl+i_(gCd-i*!KOT#0l*w_JsEKy$N^4(Rf0I9md`ZaimIpyfH7tp}}ofU_;2*$;7654zzI&N\
+{6@y*|d-Xwdwhah3z>!rWB|n!S{>xuBlMk#Eq{Um`xx^{WvdXwq|>Z3ErC7WoC;K`ZrVEw*9<XKq\
+mT24`8Ig@55JA2g$evog@Ew=n#J9{wxx37Yc{#0#1Up>#c{>tDzx=(u;l5718kM*N`Fd%+J-&xc6\
+oSE&Cw<R7%`6Ql>a`!mi`LF*52mI+$%1!u*e>n-pabezLti$P0czzfiI?eGnBbO-PdbUWw{3f~2N\
+6Lez&@(8;443y<L_&F1K0bSP(X@l<W1D=4c=!?9Ay2c<4(DW-&XP`&3kp~KwW3eTmWj7#Q(0R9j_\
+n_sIEw+umPeEMtz7Taw;foL!v~DWed^P&feQ3L&+vcN>g4RC-o`EiW7`z4D`#*>av;wl|0?_PAy7\
+(3R`Z?MNC`l#p?1aPFNsepV@lT4yII;!ljqxp@^`OT<y$;6Xog}|AKHABg$<Yu6VwuwwhrSfYtoV\
+5JvGy$5(;kCmd&bK_%MzHgJP~~;3E9P9+o>1ho?eVC@5`KP&PH12Fuwd8^tJwsuj$X6ndf4hIhXO\
+ppk?PVrx)XF?huI6Lm00CoiLOvNEusmA#*NINB+{8bK^zKx%XncAAvQ)2xgUyU@>#y-Y|kW_JU5h\
+gz>o;Z`Xlt1Kn{c%8|(&X&Cg!jbywSv%#Uum?HsW@rqH*u?=+IXvUXeGN>QT96iP`o-qc(4rq_d8\
+LPXTaWCl6D;Re{=1j?AJQMU#7PA(P#dv%rv$kD{bgyE(^eUtax&<^Tn^_Ye9o1)ppP<XGX1p5Xe*\
+QJc-!&)`=tj`=YZ=eJ7UMbS22l4n#?v4gmtKcFT?Zas&#ZBnC)Quj_zut&;~8H+p0VAa^`MzK%-R\
+dtanB9RO1cs0--z@<C)~uW<u^ejoq%{SzhvLcc;U?uMM2kqCf~w%`Yo7uK(~WBa~V&;#8#clta{M\
++iHy5353QKUtn^9Xbsn?I^B8mGgD+T%ZOCWVQP8~wj3354RXrK$P6l5<8Rn~sDM%MIp%85V!b5%$\
+;|no=Ij1sfH0H13sf^D9_2Tz3%wtQ6nY9DrW?>2VQ-X5ej&k1){@eln+<|bVNVgO+KWHxKUeLp!W\
+z!g6Fb(7MbjItZBb^z{s+xiMVFu%SKv$G8E8{2N%TJI$(9D@=?=u;j3t9zw2$aoYR^}|c$2@uz?q\
+!%qowFHFnvJ##x(;*)s26nf9L6Wi0dGOqVV=#tlUaxE#C$TB@iHuZ4ud)&i+b*2d>rTs(DiqLSD>\
+!D!Kb?+OWXs#-vhpbX3t|hAM^AA&~>0*(D-|qm3=Sz)V=Tz_uTvO8*}&E2hdkAckcx~3|jUey7YY\
+Hb3XD3x&_pQ$*RW!loK=ubS~&((Dk6(K+_)rKOaI^(B+`pA3}M5%B*6@0Lvah8-)zu1&x0c{q#|^\
+6;Q|nJR35>GSF(!!=TQ^DC1)E70~sd+d%6<kAbHC53{_FVSM=+;#z{ZAV1_*f<K^#L0wBRuP+5(K\
+)s;xkSlV2j=l-H7_<sBVHw&D<cw_4d{XFMhOyysW~DxXxRxWX<&13s-3^-a3-mq6B8NZ|p2YVj@f\
+~y{=yuS<piamrbDsh)K(kk(FRWya<&abA;Ld&;?e%Ho=V|85fQ(YMhQ*YFu35vZgkPZ^e}(o~jrx\
+F`lKuj-R=fbY<^{$(tz)cq9dji88spHf(GGu&G4VylQ(r_JpbJ2ge*@nB2JPxMC^zJql=T=-K}$g\
+^Kx;OjU2Q;~e$N~gzek$C$G8Bx7xXabl9!p)1M<(@KY%ZwdpF|!M)dbTVI0~F`DHWeXftzqAn8tc\
+omn-I%H4m#81fh9DE$k@Cb;+f1^KB#ernJ!K=**oeT!L}-$Fj#Mm``v<^LV!`#ahZ=sM6Hpmm@N{\
+sDP-2mI}TKhQOx8+U+Dkg*cpVb+3o(T*Tz<-U*j-v>Y5XO7YTM*sdd<4ZtuKR~=6Fvq$NnC1KsZS\
+_O67tn2>&X4f>Bh=GJ%sK|TpcZk}qA!E)20aGa2{PN^I@I4MXm6jOy@BR~mV+jIioX6S+Wn{C`)A\
+-g<hs&&<g*^*??Kcn<h$yF%#nHsZR8N+hYm4k8DzcPjTnQzLO+JQxBgq?<y+=B_ARq=yl8`7Oo~l\
+tN00$?K#M_L-=Y6~2i|`N-h(E5kFgT6VGd|9XjU`Eq-L}s&}E<-LAQfqh_VnR%fTX;7Pf0F&No^d\
+OK5IoI5;2YfII_w6m)@;^W{#+l~LT)BO3BbH0Sd`T``>Zh=E)b!z~Zw&m0%xa&fB~?(J~bg1Tb4w\
+I&vEgRX#Vx}_Z!=%BfAoR`Hx#*E{RT2Oa9=b7=GC3WD|+zybzI&!|CBWKm1n>+HDZE!E^%z1TZq~\
+8Ur{w|zlBygUez^%Fj$be^X>*yJr?KzWk@0r}HP2&7m61O^ahuqkm^IXs^pmm^~dT{Q6JY3U*JC1\
+^G?}@zj<Se}x;_Jnkr#I&ry&(^RmiOjX4cv#|PI2>?G&i?4x;Y!yhg*m6w*&HYkA9q|_Twxe8Sy4\
+_YZ+u~&)JCMY{=%IM?shO=dO+YIXVO9NgnVUbR%fS0B&s?0GV+B=gxuL$|8AuAj$_?2kIQeqqYy_\
+(RGl+y=gou{UX%M#XPF)QXakVQqEUE{yusskJ_BYqjzVajAMBeyB2&K2fsNydK~2H^cztA8<5W%k\
+<S}B+W=YvntBs=F1(quy|-}Z`ibCE9%uphQ^>9ILgWc_c@ej^Plcb`xRqbR*~UA#RWS|e%;e7cJ0\
+Zi)<<`QxklsA*EW97QssP^}<ksN@c=r(JTOh|D1x<JuWq%Yre3UzPJkEJN<n<m;pw6FweEkHscK-\
+t9dy@0fPocd%g>r$i72xLzv<1+Gpu0hju0Vc%$*ts-;O|P*_e$jJX|&I$k?$(bldDiZ&>B#-3hAx\
+_KS3*2p-sTe)^JDK8qR48v=p>r4Ubs}cikHB{#n%9ukh_xSnGi906hxodXBq1SVxpUhkSr0R3l&2\
+NN+87<g7&-!P;WST5e5v9(jKrd3l~&d*H5p0r|vwBk9*D_pk8{bUEl|&>f)5U*vq<i{R65(8hlQ|\
+DZ=ftJb3r{ucH268geRSjYX2bNBDS``@9@f-c+u{$Tx*_Iu=&thZi9n|c}b2RZ?C59lG#%s+6R^9\
+R%w=x)&XO`NA~!un+s>IXF8k0{3<u}%Zc2W5ZaR@I+SuFc@%X0%bzji7r$ov)zHzruOpE9lRl8}W\
+PY7H+w*ep>JbcPt0p{07PedKA>Pm9vzss9(@R(7B*1K-Yur2CWC}w2fO^wjp0{f<JF!toRGY6Rg8\
+BL32QNgVuw_*PyPkE=zq2<s;?mx42^qXdQl&GIo!*!H2hz|G$9`f5X`F57Y_PYiT>d@15M?*@d?E\
+F3SEc^7t-yxc4Amd(a;6H|~A#V=w31_HxIuz1+(A0Att(i0ebN9jxJUK#M^WJ_4^k0uMk7K^KCq0\
+L`dHo3F+AwGVmThqCYI4%f%X`^VhMt>e~atp5&ug0bim?nwTW^Yl--BOi3`r%3lRq>J_7+<LU>dW\
+^3PC_mPPSqHe);~=-n4kEon+^RpsX`RTIVXfHXOYq`LjHO?qz8lf68}SWv8EDcG@bL)3fEFI%t_5\
+)CeuZ)ND~y>(xnsjo(62Fee~of|gSP(-@(Jqt7IpM3#xu|)FXHebZ7=fG#CcT{c=sLJ!*}S1%!*#\
+fur6elBa2%sKGup(j>Y=2oyAMBPTdB&2Q)R#;-lj%Rs*^hG%4PSO6i2(XIQ-c49iuFHR|CrEk|}D\
+)}u)lpO=L7VmFI-It%OEvn*Z?y8JB5*`qhss=ck49MGEHmX+QI->{xt(ATnRu$~>)&*Fvsu*L+f0\
+zC$roQ(D8K#O|@;`>0$Is`WxWLb5CkXDMtdtgzy9rP%u`&`RWdalLxoNMv;^RSja&*HV9@u`+onu\
+_&pD&7x9c?P3ApgTb8K)plpJ`KOqP#)0b!z^As%yQKXL%HB~rd!s+bfiDrvbGP0|Kad|k!6j$2;~\
+6naWV3kVezC4tcf!$>lkSM2#Z&Yu%faqx1#ee$J+S{D{2|m<{8&mQQNPxqU)|hnDHpzc&yPu7lLN\
+zSk^i$kaKUqZ(6tCXz`6VVqHA}bOPeI*|O%|iui9uTDg{0m5X)zM2pXzXt8w@Er)B8#Zo3&JRfv)\
+p2ZjBfj6MFpw4`Yr{-f_4_XJBUSRQ@0`MBN3e-8-;+c~zRy)~p#80u<gehnPQ!I=2368>@P-wAEQ\
+&Ik@Xak^Gw^=;*Ht+}3S&aBfENevx>Z}BHa=XP6?y$JMh1;ouD{3j~P}Hetl%mm!#whAiG*;1eip\
+D7#uV{NkJ1E*w(N2nXR<w(vT@_7G^bAGMR5Vf1Bt^R^dX}Qy744yDPepqv+FMb#qJ0$Yt7tz(lNC\
+K%(Q_2-uc$}S0g4V(bdaJcik_?Jd5WH|XsV)v6&<4JP({-ey+F|m6&<E%x}w7sy-3lE70pm|grb)\
+yda0tBijGwDGDSxzI$F^&ie9eh6^dplI#$su6}?K)Y(=kD^cqF4Rdk%9*C~3vqT?0KQS=5yZ&dUq\
+MJFhFv!b^sdaI(jicVB?lA?Kv<||sD=wwBwC|am!k)l%-y-m?#MN1UDUC}!fEmd@yqSF<fp=g<+K\
+T&k1qO%k&S9G?ba}>Q((YcD=rRd#?-lOO|MekMgK1J_Wv_jDb6n#+9`HC)3^dUtbR`jQeE>!dpMI\
+Tjkk)n$g{U1diQ}kzwE>W~n(WQ$1T+wBU{;#5sEBb_@%N6~FqE9ONl%gvX{iUKS6@6OKDn(Z*x?0\
+g^6kVg}vx@#o(dQJcR&=eR&nx<ZqU#j>wW2R7`Wr>p%K^B8MV`nLc_L5bi9C@f@<g7<6L}&}<cU0\
+yC-Ov|$P;-YPvnU_ktgy*p2!n<B2VOrJdr2zM4reKc_L5bi9C@f@<g7<6L}&}<cU0yC-Ov|$P;-Y\
+PvnU_ktgy*p2))pTUS0jz^(t<`W|^APvnU_ktgy*p2!n<B2VOrJdr2zM4reKc_L5bi9C@f@<g7<6\
+L}&}<cU0yC-Ov|$P;-YPvnU_ktgy*p2!n<B2VOrJdr2zM4reKc_L5bi9C@f@<g7<6L}&}<cU0yC-\
+Ov|AO0N9+0N6FCuAg#OGrpbN$@1(q<K8a3CRhyjud*vWn`wv|5B<PX*+nPr<%v7xJRe$<*AwJ6?`\
+vOj?rZmJUKaeLA3a_*p)IjH8m|YDJx|{T5(!RdP-Vytu-!Vadhg0Bu`2{z9p@QOL3<ZdQuif)mho\
+@ahcUoX`@q)Iy_#-8f%S}mf_0q%yXwDWsFN5mz3<uNz2Yknuj0Rp6m=ySyoa`nmeb^lkLgzW!Z!L\
+uHY#t85t>=850sRQJ~C>oCIV&Aq}6BQWA3TKYk~q7AAWpBqXFICuionQ#~ok6x=_s2<soxFC0SrC\
+jw+u@njUvlSVmAfQw2M-pkR!eI}&saO~z~qmxrS2_F2PoVJ7~QJR7Y;y=8G@3fi#e?DKfr_<zTi6\
+bpFD=j4{4LMA3yVFt^$EG<`4_gTd3CkQQ*-0MH=#-3<tc>#H+~mUigtY9G<n##%8M!D<X8!1maS6\
+#uo`l+{;*^}+<b)nMqO_@Hi+L_ek(QR3k({7X(D5&bMeNHQX1obzjM)^Oh|P{FIblI;T53ubvL!>\
+NWq8s&g@{qake{677lX=^UnK5aBR?s~Pg<I1As2Z{rO16z2hCJYuqb^orod-TLOM05jeM?~>RQx1\
+5=covWAd!v33W&dIZGLx>0ZZ2Z{{iaNh!(b^N7o}nP;SUJh@2Dla#!W7p~)-5*BbzX39KNS!$ZQ-\
+qB;3GcBnwIVCA0!;_K?t|P649NG7BkTur=o|2xng4glvgv>QOp%kq=Ej`7ZoVL3~hDIazY3`cNNh\
+ziCmO1OJ8b`HbNlX%=#JfY>cr`kIbn@tA#569Uc#jj^2i+xOcT`$o+T7%nL(cT{j2w(6R2_vW<Er\
+@vD>bEpr!8=#Y<8q();KDnYMgVc+aX>H{tojkR>o!wIJqgwsVU<!mqewFOG`>~S2<D^S}QEinr=y\
+HXp!5TY4cLDk`mmRNrj%Qq-^&dJ|SrZU&xc(a|M^F=-{2lvyKY}rV$5o3-i;m-EuI|#m%VTDWlz<\
+G*JopG}MgFC>EScPH1iH3TNn&gI16(js~!SBXb^4il^F<o|2Gk{O4KE(^B%$7Dp$m{z(}~^^B&Lo\
+RLCak}{4tlU6vA)5ax<?ze>JpmQacrO4h@=&s_2EpQx-G~46XO0y8ZYM9As3GS4mRzga8@j{-zfT\
+KO3_a~JlCs*)<4LoNXPfv5F?B+QcYxr_LHzS9dZf=TOu(bwdN=i=1SF9AAT*6bbvppzXE;yW&N*@\
+GUN27Up(3rNzC#5XoDch_%US(~!7DOkFE-b_dGJ&{_)|0W!wb`-WS|8=EKuzXODD07rdd(narY58\
+JIYrk756V^d)uYF9zQj?McFd7%cOefteKrb<Zsd{uC|P8fGFl@$QhGv0K3?tSi+N!U@8tGSZ%RXV\
+LXJJjDLHcNM`uv|AlvK*hj^MhJ1HwGEx$M`At`GIPnwsUJi2f+non}t8s`Gu1H(pnk_Wu#l<Z0Oq\
+=O@JJWWbT_jq!8P)C*h6iv)sxZJUscPdSw4mlw+HN7w;&7GE=oSMuS&tvTz5Ca&Cx-9RuqVj9Y%1\
+fpdl#ZG)y}V@l?1J)=8PhMHIb+)R@|h*mZ(~t;x3CJw<kEsEcU)aC{puNWie|B=uDJuBq<hshGm8\
+p+U!J?h$(F6*j5&r(E18aH=jP2SFDe^%!DTZFW)_x|Or1Jz@Q^DCrWIW~c~;TPIYl#B-i0OQMKh7\
+=oT95`2%qObuUq(Vww*iKipM!aGH)Om%g+BzCDXHurr%axe9idsp?P_O2M?KCFsoz=(x-BaopQ~1\
+yqi*7Ff*@wW<g2$tg%zZjKRC%1*N4krWBOVm`N|jj43H$Z}O5^h;2H8*^KzXv3_Sc+4k+obM#<VG\
+=zQT96F>e=KtU{e;qw+nm<zmdHTEP;l9HD;N&(%U&CIGce2{wQq_bg-VaM<`~`VPXrFU<kcvNzjC\
+(HH$=1I~&8+56^zXta>EG(NIdiaWGf=pq@-fp3b4sQajZtY`IHh>zjOjB5ry@^9d1W(7rk9VsX8h\
+p1!9&mi3JUMan}Rg%7(=hp3un(1tQb4@n(?W57l<EYvr7k$!C$I=#>j`g7F|4Jc4^_5xh3Ue=CCa\
+>4pxT@M5oST+oA_gDJ?3PIjUevanUS%{FiH}cmXC9lo#E07hb*ZN}F9)h+n>UswE&FCF!Er$Vl2W\
+^xml@>?79&GmECcJu}cdt8-llmgf}BM1v|Qy|JKlc9HMf0hfavD+O!nrs1F3d%>#34->04&k@c2&\
+oM*Ti?PFImzR{5l-p6RX_sC!2N5A5{jP+qZ8wTl#f@gq#5>rQyTR$fl<drc>9fja%qpSG`lXG!S{\
+pl*?TtlZ)8Jc_-_Lta!Q|2+aN^zAS*YQn)}orqp2o<y;2tVOIsVyOhJU=bBibLkl3#2$hdmYNVC!\
+z95|3fOYd2&J`z>DVx$QrY`ntF|>=)qohKVTe@);rvbJ)uGA^7*Vc)#ur#+(5I$CoZui%UCS#eUO\
+O=8!!x!pU~L7mXOE`a0v7ki9WASa(cq(I44I@w1A`Zz?Let+;%aufNSHnnFIN285U@Mv1h%5_Yh?\
+lkNEwd5KA7pTrMl&vhCy6KtYU;_{Nxq92~Eqn(DLZH}KkWlGVkSu<wN8iPT;(*;v!z}uZy&n_)5x\
+pMZjvN6{OWO(>29Uvgm@k8>&=;PljSw-iT9d8bMxHFA_H%u@2$?PJ(94zkaWQTu4H9)Dudr4u7DE\
+D=w**f^QRh^vd*mD%VWET6ZV_DJ6sWWCyW3S?M^*SAGi%=UoQH(8Ke}Pcj*F<AHSpIkVcl{sf-@_\
+Z|-yL=0&7Y})2D8TYX~hMzifM%Fd?DN3c^Es~*&ZEA*pe=z*!nJ`+1@TrwqzxRTv#PCIUS9W2F5o\
+#qm5i&R0d}qSg_&e<Y&P?@>5tctE{wuM#BT0^%yjVJ&Kt2{Gax&1Fq@gi(fD*BJRD4duvJ9iWPyV\
+43z?|I(~+bNHj|laMUUaDyY?}xVLpzt+m){wTgRIty<-;)>7-LV(Z?~|GVEEA^9ah2+<1a#|M0Wc\
+lU0+d-v{sckh>28e%Q_8^_%?1IG;yiD1y2%Ai)(<D4d!BI9vUWf+fp;mPsIhFCjstW)r8St47WS*\
+7T}Iae7EoLdl*1w8ruc^mjRL`zj_h;*cMn22R@x3Z_sSRWY$t*gT4pPJ0a0}nl}OvakGPEChYJi1\
+oJ(AL>WZfB3e>(%)vAqlF+-;m@8KW{E}!t*i1;3j5tSRn@CxzLL~!ObjXbR#v=AOll5J2eU+QJhL\
+08!ZJZk5P&>Yyv4OtPySu#9+IP$Sxpn>99Dlg3+nTlh7!Ei0~0``LGcwn+R_v!jmyXHXajhcucs<\
+<f>>x9+($fY>8T>)iK0;gt%es^iIQ6>S!rW9TtzrRCq`vgYH#vGbw^mU32OoFslcBVpJ#`TO*do2\
+8G~BlvSZZu}%~Y)j*lm`TVEJrNICepeI!bQ?#!}_TWc9)a3J%zv0S*NTR@9C}2=R4Ks<z3H-SRpM\
+N}s&oZA_!%+O32rFyiHn7d=p<Fx}v>wX%@;(-ygvD5XU#67-F*Md&CS8OZNaW3$`tng&H*KzIXd#\
+X`nf0u3vTL>IM9hgO<VL(*OJ*8H#))vR7D)d0Sn`wa@!{v)xwtY9Q%hpQZ5RXdCM)dN(0fu#r_Om\
+GLCb3M`I)oua1kJVEg=MwmSdx%T@bo<x)VDnSJxK8z>`Q&W^FgAS_au(ukDHMLyUBY!RIfUT@nw#\
+8JL$?tCbH{iNYn}Arh2TTfv&EqA&no)hWSW+Xpi=?IE<kHVi$K;>nR&bj`;b52fL;Fov+`GjgRy5\
+rlU5^7%=x93U^y09f}j*?C5EX4tU~m6Q&S1)*k#jTmf)C^F(uMjcQD(Nfx;Qg-Z!*wN%^G@2NYDy\
+gMG=1vD0x>Of*-BAbD<hxu44^uX)*f@!fa9~G6cnCX&HFBv$I$W-m8b#8Hf+5U97pDOQ6%4}2c76\
+AV5GE*?m?}7T*En|8V>CK;C|WEHRb4rSkCu`=*x?(<1VuzJgrl-YBonCV5$VdHL>E&<Bk-Uc@=`J\
+G#wsSo#e+3KK^UgHc*aWEDNTuHyFi~A&_WkJfB!aCE?427$H$d`pNDtgzcY?;RfE7S8<43#U#;wJ\
+AFb@pMEEcfUY518J8nF5rLLK-5_s#(?dx}_$SIBZ{AK^zHcVbOu+K0_gfi^h2W2QJKoc4ky<u{*u\
+|dfHX`CbE4;vc``SZr0kH%q<zIopPE8-;lcfwpUc`bK&C+!UMxVaLgxk8zLD{au)j1rsjLADtlB2\
+j!K6VZ)9E1E)N=ta^gq|{1QXUuE{v&2%EVN1A!!e86elPeFni;YYUAvHPj?_)PB`ZxgkxCiZH+`k\
+OE)x1z*o?UZvw>cQF6Y(T`_h@O>#-G>Bj=~;X0AaVbA;Qgt{mWK1%n2rD=d4y9XlW}LC+Kl27$N9\
+bYjFfNv_uU0yEUJ`Ewv0Z(f(!l=g!rR*;^PexaPNFMaD*x7u{;b=b!x=v%UHNOEVpqcUxh#XDid)\
+P~xX6G1G+KG1F+NPAtKzwgasVL;o*`ll2T+T&bt=&v~aT>f6Bl^zFZ`3nhrc>@q)S!{<-^ftV$aT\
+H8Scm8{SO6+i%mRtTU!2;isY0yxK&2%yq>@e>-0-y&CowqD_yqpjDv8f)uKpz~6fU^8UdRQ&Vi8L\
+YF@m*c<hZY_bgbMjWxO32ipq?H^Mt+YZxV+JsFM|fCP&+MQ_&)Ue}g<_m=gQ1#fn^5l;+DE7lLm9\
+5_Btm^uSk#32wnyQF`kseDsGoS`2({kBSf~>{!KyxwML6>y{+V<Y3-z`OtWf`5f~v&4w?j}u6IcR\
+@qoZSC<r@@+4gk+>XYo2RXE_WLXQV`-jRiwJ8gIXd1kfHisU!-oXsJX2OoJks?3RVP8CGz__&~co\
+Ev}ji&)oxaf9eGb;9Gb$o;rb-_Y$KJn;~=yQzRb&W5I_(ue_{UA=oj;OrH|`ho7@XW|FrZH+We7-\
+VEB`PKi#ogGue{Qm6z!Q;St&UK%Gi#!6WZTQ3G3Z6~*hi`<0E@9j(Q(?{YyHWN`+{eXarH5$c8yg\
+!bvw9iG}I8i+rwAB|z(k(~!O$0}}!qCn3VdxT$kmzKRCx?xYLFasBoQDDi&FH}Azg*$S8i=#&2+`\
+b5?ow5>!t%D22=Asd0ynb3r3SH;ij^Svpi@L5+ye9b4Lfbq1H1-HbqcvkYV{VFF>^VGxepU=zPAR\
+A1Gz?G3Bv7^5#+-#3UQnYrj;NxH$<TgLJva0VoJgrXwYuj7`aTxD51ZU=-wx8RNpA1Dp3C-r4k+P\
+=xy}O6_0ZW2n&%Y(TR>eMnUL8M?OCz0UKhA9^p})@f3Fts4z(4CL~GDc64*Y*wdZhmyjm;g(JIr_\
+2d&F`o<5dOSKN~uq)+gN+*c|BE~Dxj80$<OejP4j7bD0Y9u4pLEd686$Lo@DnBUDaH)7`PO034%y\
+79bhS5r;(OMC@?+4`?huPrll_<+k$^JtVfPdBmT=>lK_-FDRw(u~S#>K*aA)}6EBy!zIG8{scPyr\
+Dd?+5E6O`MM1kP}Pr)|VE>h*Tw!+9oVvAutS-Xr@2dJLB<Q-PD;pY_xvQRve~d?QoECHO^5UD~VG\
+8^QbtPOd3o0LTR)bg<MA;Vm%U0H2D&L4};~-87(2Kw!w-dB><LvM@r?pv5HpuTfLhqKxYH<*h96U\
+PC}>?-Z?>Ooh|ISqVKwb{B59}7oTm^fN-A(^ftCgKyqMEvy*JL6f0?)WNS2QjDTDwX|g2FUT~A9k\
+*e^t&d6m!eYCOI=8|g}iADp-W$M`B&_Fr);Ca&{p1fBRxwAXHu)2i*U>A1=D|jOwU(5dGv%9(M&c\
+10~f9ebaIX=gx1Eb_sXG_%&LzBAzk0qGj;hA{(6e6=rX}$5zh7u)pu@5^htkjg~8|d8qi`dRZ>76\
+}^jT;nZo`+a$eJ<KqfhUfa-8OP;e974U&yJlvgrN{3pI9l#As*wRT*`?~2jLBV+@|{{;eGdvjrne\
+&g0Mv5CPSBltlYsgq(~12)is6eVqN7-oHz;;=ti&-J%DIwH}LBB=1jVLBH=Jg+zFN&p&223{-xtM\
+j?pF$Iv8vO7Qqy9^Mr$SwSoeqg%qe(kYWzxF!itlTdSW!%xeYZ{5e#KjzF~ZlekuwesVCbl?Q|Nh\
+02Z44Tzbx2ix28X7IA@2CMY5B$7;~_~po*P+MkhwfW2)lIPToW_RcFk8j5(e7;I>hM&vWp9%1j{;\
+LlZ22>UL={scl9Xvk$U6XUpp2dEk;L{xp&u}^ifcl0&y?|1I(&2fA1JaKwfp~rRNS^`Jyd=`YoTN\
+Wm67h7UkbW<aZ)v1I4&>*Ecq@T2fvT24yv{%)${_s~AV(*p?+>&E=pm42S)`u`bQ<V-Imovn(z{n\
+d`lxE~cMYV!S`+El*M{)AfL)NjYeS^3+ZgHZH-WsGA^qbPNWZNW(g(H$zOG0g?1uD_9!P)J6T-Zq\
+{Oyo_kuTDJ@(I#sc0~Hoosd2>0OE^~zI<0GLlDwyLXiHSQ25;)${vRF-r-2^&=cuz_CosTK1hG1F\
+XBb_L;3|kn*NB_e*oe=2AVn$@ftITw+pD(AjG>1G+vB&&Qb6i=poQR3E~|F>KcuBTY&0I5pO0?MH\
+%8H1KpQFxd$Wtz!;?0$&tSM5Tth=3hfFMqky`?qA?ZdIgmmH?Ey4I4fO{ar9pcBFr;4r<R6Rln}8\
+~65%07X>IJ_ObcnYZ=%o(&D-P*VJkqZQ@*NKCF%sgA0v<p&fu4Vk^iE$uUyMP#(PI(sAE2fQP%fY\
+>plRcf{wYxSc%<I|<edm|0OXg1^z)LS?m%G^kbVphe<I@D0&<>&^dA8Q1I155y!Aj;lM!zW&`qH5\
+6euImWgw@?i03&O>IO6lXf4nW@azgu^(lzw3p5aDGSFI}y;G3GKR}hIA_s4vK%ht<8BqLGgczo$Y\
+B;RmnQ*B#PALWaS@#fur6Ud`B-djOY_Qo$2KH(8@tpVk*n&x0*z#uIOQKe4#IaziDA{FzF~hfTBE\
+l#;p(_|l?DCA=;DVM=D%GkWwgqvRE+$qzoFQ+=8EI^+8gK9zr6(m4SUx#n9xsoR6lRev9HuafV~?\
+{HMoc|%6ou3$4q8GcmPmDY7IS5U@@SDsGz;g(@;-lIA+b#dGA!`1@`Q$kl=&RlFiPPqS8G}Mz~|l\
+|J`Ih~2?PrDU}$_+G6L8|Zgz;!SZD$TIZ1?gt)rGPAPIw|#sQvkRXjcb$B1JGg9cOSi~`xA!Rc0k\
+fOB#ruc)SHO7e)wJz$c1RC?GX_XzY5O70OnO-`ZY5zpv&icu`9^su0499<9;{Ox~nZ3+9FX(*<xQ\
+}hmJ6w{6<?7^&J+AM~*V8yh4Ij{DLX$6hnR~ER6MeX$6+n9BWT$}ty^KVgWr}tncE^1w3`{Yy9YU\
+=s^=;*>sNblq(9Db*1&x5?hrcrV`k6b(|_+Ou*E*`CDpOfIlqAiNv(e+}{?1epjUo0BIW=rectWB\
+Y=H57{`@GM?77F4G&mr9C78+hZXl3s=>E)^<XQfjz%RnXcf--XLBf`Z>QDVp`P&;6JpS@)uLji*R\
+9a^Y?s70D{wY(KserMKN!dMAosn0Ztwe@|u}`FlL`$Un?HZ+_;Hzkf52yhzVH@}fQS$lvLiM<pGh\
+V>GeYeJMA{_`0**?>Oh4)tkKgY@Dkt$9F;h%T;on$Z&ev9?X=I!m|=<G*VTx*+I=h^0Gr6sik0#g\
+869TU}!~&B|}ApXBHs9TL2zRp&4-x3)8DdGPyz;6(`H(KB~JKnix0AkOC(KJ*w79ZOAjgmV)L|yX\
+-5`mJ@kur7B(QNZiCQ*rN)ZK2T^eQ+1w++%$1IQ@OAznTJdfr;V{8KhsLunmm{GRolOP6k3tYB$4\
+TT55e1U1Cd7o-nM^;+>7!CoJHiGnbICkBl2Kx4{s7i>@B&RG{4-Qx4(%3v$NVgMLwLv^72WMUs?+\
+uD{_(u^LAMv;COtnKB2j12<y}4>OsPK7RH_?OkGOY#>3PNh1EQSd3c|&o=HAlDu`<eyRoAlF0AHf\
+;(^2JRN0O?j1s&V=NLH|xJ%S9)fzu2gqxNeE*=tgy(AGCuDzN1x;Jrc@1{}@H<<+K6*|s*YTb>w!\
+g%;7XkJ$M12Jc5z1t6tLyE$%Di&@#%p2ehc||eL$ig+p{JY0eA~T;N)+Mv(cf`JKMha07yZR@wsv\
+PgE+mf8pzjZfNIawR7+QJMC69!1QI64XhU95^`>naD6l8KeF_p(hy(2&rb?2K3pqnm%mt6d}iSVp\
+HY1=e|M$(Kz*ow?-4(4u>n{1PdReZAxxS)O0yg0+%Y{#**`8zvuq7M;c9lSXOmI3~Zia?5e4_^Y+\
+nEth@3041Zr<d(HU8)Tbn8WR?8$4d=l8KLvhkq^P>q-^aXgJ@wQgSfZgbDkPsfj2xgyZ_FHL}o9B\
++-dvD^4wk!Sxlt1CQ&b2a_Uu>oD6!&^l`qDM59}5-(D8mw^wfM8?7Lk692~j3?RZ_6*dkSHdr-WN\
+q?CKGLjKu#_)1dIzl4V;8B+y5+xlhS1}MKiOGH>#Y)`xfh<;PAthDs+0Xz6j~Kydq_JAHN{qjl!^\
+FGdr&^s@G89%BLm8P^t}uNvI1Yag3UZJ`ft6CFL^G28&3+09OEfee`&)%Wp1L4ZfrpT$CGm~KI1^\
+kooZ#{l*9{@~ySg-7Oz@d{1c%B9Zbrj1`w*<5;jR*bohUv$fM8$B-?1CPtv@2Txs>2<f(hR5MQ{@\
+y!B;8nOz~(>f=416PVoZDFY^<EUpFAwIe_3+4GH#bPw;~}1p9R$c%>u3J1M`q^$AX*;g=}CLG1|s\
+AI-17H^ECo2p-`<uwz+*H@Fepl7?qcytxd)X>AGiaUysgt?yl0o(+`Wvmk;`Z6MyTUeWyfd{6M7w\
+7hrc5?qFs_vI{tXVCEGa|qr}ap+8fKc($oa}B|tP<e4(Ot66R(<~sk8ZBSg7J@&c@i(ua`IjQN;&\
+g&5(f)J%ir}3kY5h|OUQGKlX*0pm6ld%qcoyZqD2?FM)&y@$CU`P!kBSor9#6wVDIP_`myIKMEN$\
+;(nty59A6b;28=F1>)vQi%H;Thb5}ZZrhxQVzpy90@i2pI)<^<oIM(_exf=BEp@twU0POe6<JH^N\
+O1dAyi{fyw@?gS@HBRHcp4gZYr??v&3S_ChlIN6)TZ%pysV+2pEORz4Owr694GgC<VbuI+2okZ~0\
+4GB)CxCG_5h^F69!#5<8@T5irH*Zbkw`wTC{M`hv>O|Xj6~WtReFN(feodOu@>V8zEswTOI*H$}I\
+>CqQk#O(I1ZOlM_@izFFZ+?i-{(*8&gBGm@*y~hdY8k+#yDm>)mJqLc61=&b*j+zFH7)h+TS;C5g\
+gc**1rd-|0~*_VI>H@FCtiTjl@6Oj$rR#65h21t$!H7u_XxhtwQj>fdrrZl;CDH3BF3@<8}a*uW%\
+AxrxY#kKP23-D#2MV3Et6$;HrNUT)PMDkF})!&$|%pypZav4mAErg8f<%T>l`!ulTe*))Bn57L}J\
+%R6kdv{ds|4VRu@;%`|;yf}@uZ9O6s+_cp=ZS`s|yFPcBikH3ZB$Fx1X?@;|r>wEVh!H4{4_z+Ux\
+(H*J$dyw`@X-n`_e>#7COz=ah|J%^<%Q{%Z{q07_iw_CECZzTCCD`ASwja&!I32%TX?~|@_~CH`P\
+skqcl?Z-aiT0;I)gR>u?&C-Bp7M13wWIP=frk4M%%?cH1Hqf>5S&W+g;0JOl-~<yDjzg_1dTta6T\
+wGmc(NzeFSL9yok;z@rtRSzM8_v>@6^5|ei;EBA1g`xb+rkuTb+bYrR7bh_&)8QWnLt{j>g|`nCe\
+SMs&6Zh_+M6}?R$iTSEuC*EKkP^?Vr1432y2^@cu-CXVd=9p!)t2#aUF}_owAgdq8k7?a!Daq`vh\
+i?th)&88m*(8iLPL?7WiTziE4=-yr;cq2=knn1nB<IBglhSyaEy>q^HD)t|@v6TAc48_*^dQ3;YC\
+#q}vZN-?7N%Lc4}OoOw`bLCiUaJ3o3GsPV`n&Q)rrucCqQ(WK46w5fc1P4E?ZHk+fH^qG#n&S1G{\
+B)f7-kk6*jZN`04^zC4Q=SHOOz}`oeO=0$;%S`pyEyrMUd9wx<b<CpX^Llfn&Ly8^qo04qP{7v#_\
+6wU4!(^{aTurkTR7oeIk-QkeX4WHGup)zf6Ph$F{gi?vhA5*z~478#VStt{vgxzpK<VX4sOE1O*!\
+rHxT`6?!s*||4NP$)C)^L2mTwxTy!)I@@hVRE6lYU@XF2V6gM(Lb;#c9cZ$l1t2s6bM>X?rIBOHB\
+@T-FqqMV#>Zrg(?5DR$t*$7UB^`hc25c!`CVIV<ou#d8N<{{Z2o6<(g<DHN+oJoVz`Tu0iz*i>AN\
+Z8to>0^y|{m_<m0#{(YYR8H{}6pZIMpipc(0D-xIdQiW@p90}!Zv^f~pq|)%2I`IV3{YPzPk0W)a\
+t?%-umka$8E6o;&4HqTBy^pEm#}zQJQ(XuAUV(wtTXVs07!}D7f6lu7G5g@4Z~|*pbbD9@%#+*Ew\
+-}|@p+8L-}gXi*p>qN0SKG2+wj^A=qKFfcpU}wGuAiQW(3k=T?iBh6pz;pcrK^w<xyA<;jszy1<)\
+A04gyL58i&_RK#ACP$My)eG4S#RXcF#kY$M@y7M4{!U*kCh%Q+rvKwn{<h2<QNO`ronGx53&uPyN\
+W3N#03F3>!n`Pilb!saD5ArAp9qU*rJcs{~&7+&XKTMh`DjTiB}4D>tDWuQOsx)%tWgjcZ*285^I\
+8+MjAJcVPkc-;rtduy_Xmx&XB(*I*Q#OB>mpkvsE$95Xf2_U=-!b_W9u`Pu6$FR-@`mF%6n@Q#ON\
+-i>7KWF>Su)&w-E~5F4b@mo$o-dNf+gh)jk9FgRrXQdexUp}SBIsKXkx9awFMiwMT~~fb5lEh%hA\
+)v@D66YBMjfY!7LAbS5<$RLCO|BSk!nr7;o9so`GdQ|_tCdj@$z3$#P6`Yb9X<fssim7F4fp@oY>\
+^tG-1Y;z8LvDFmd7#Lh9(PQ%8_@$MM!V;I`TK`Mcw<y<qO<Nj3uPu|1MZ_X?s?;|qV>$%Y#ern9S\
+%m<o}`3O^Fdrd59DO?erP6_6TpPZ<>OR6?On{#$vS!nFJWLfdaWSnEDN7jOKWh7{y;k~0_A{j}Zf\
+ajm6rH-9+oDk#L|oZJr#<aShpykpPnAc5J_D1}%uw3}GfO&u@QBCvF$bHGq&0QzUHM;$C4FoCkM$\
+KT}f(r#eDgI1s#M=lRDZ6F-mOKBR%LKK0J#({2;Y7ER|GV{3koQU9_cE~<|U^r%B^HJ-!dqUjK2i\
+SADTVVGu%)C1nE-l||e9PA;Y`g+t)m4lSr@TKLh&DYC{l;&D*nIQpgZKUqo}r6@gS&U!zr%ar8ma\
+hy!Q}n%l3&bxv=(*WHSem^w?f^qv%_sl3!Zb#&%@inB}iTusNTqR;`}aJbGFk2c$d#y6B!okIE_#\
+Uk$S+=TPaoqs8u?-DvoXRLM`P)ATs%UdC~kMjRK#XlJu6VLfIXR!WDxscFU!TonzHXvR!PCT!fa2\
+Z{I8gK5{LvRzXVpGS1;^4{mhpFF?q_f^5urr|KT3i3X82ydkFYiM@0fbbvd)n<BH6+*^uOA|6TEa\
+&5fP?W&dPdQ0VlV{}@Pxps2psweCK!z8^MbZSKQ2D?^d5{5gxC+j!QEJiMO+2~seLy6@D`{bw<7l\
+{0s{AAtYzPlD0K$@4TklE<b#&D}Br`ZG=X)LUkmBDdJjfm63mg3?4&OGDEwU|{eyz`n*Jj^QJcpf\
+q}$i(n&_#-rI8N>5%A>e90BU<2X_6_b_?xR_{1!#V6%dGzl=Pzh?SsG*>u~G>XCYC$OEX6f{J7gT\
+${!Y~j`UTzGK9F0OOQMDgns36Pnw1~!wU2MP+`qnD7<XNE^$BPFcbE(7(d@&Qk>2w!BiZo-TJO;(\
+cteWW_lRux+DY;GD$(2iG}HU&!?}2TFu~My37BEwAraXjX1kmw!3M!Meri|;a-Rrto_zRjWpVs&r\
+KL~!d~j*{&U;sSORiQ!-gs_8v5xE6^$j=xEUYuCcgST_(e}*trrqkkS*O7EanM;vr(Xr~b(WVGH9\
+ELS^O!rzvUV#OpXY-q#PjX=BmNIv`xVHUS^=E2+0XI5ot;V-(to>6o}*2K(nQ%(ITKilXQoc`h-{\
+EG(>OM}tS(kt5_bG1b4UTcTjXxVzE>a<6cJJQ?-mugLm<V!OFn#^{6G0R`G?P>y)Pf=EV_-H<0C&\
+8r=x~TcI38`PaM=jCYDHb*zj{@I6m-m^Ns)Cd^_u{yHbA}?)%^37th|NpWxzX>=o|wobI-Mp0mhV\
+VE<7&y{l(<@lhEYU)2>8=L?3d$M?1g3O6L&iu9L#|EsSW%ZgRq3+yf47Dx4O&yT(>ZvG8NUuA|fp\
+Q2p%1YIrJIj&}gjxk>$6d)R(C+#d(NbSSf%nK73+N$VCe0ZPZ+sRc24;hVGuF`=-3m8*pPa^!tJ3\
+20w)oei{aE2Z%2ntmQL_n_D|L84O%bpkhgG>c)CDY<)Zkm1dzO%i*dSCQR%QxR9@5Y>IR?k4Y*Hc\
+zh>uKr3AjbcmUv^GM$T1z|_;#&HpF6<wwa9^wy|6k^_mK2!9mpT?>kg{#fSi#v{~Xc{e=6irk{GF\
+ED3qwJR*lf1R}N3RtX_X(_59VZ>Nx&S5#+aJ+b6%)(#7uB{_K3WW^Fc(-LR#P`rzNPbpH8Ye;w-3\
+qfg1#qtix@nsDLgDP2=quW8!$_j@%nJ09yBA(-o%d4u2hMb_5pk3I@KQz^L4!!|<_!|S|kl)kEJt\
+l!iAI~&Hdi2HHssXs$y3G)vhk|fUVo;B`o*F7@_*PEX@Y0EkHN^34W|83%<gUg;CtrB%>&2#T@w-\
+*OBJULA;{g=LHj<x#h;Ml=0CV#!(>vR2!fBw0%&0*D;n|C(&_0zW3XntHdH??UOo=-ow?`|wT-L%\
+Y)o$e>?7%Um@zT!v=6yP!9<@m`f52nO5$y)x)n4Z!7`cMC>#@Hdxzia$U-2HY_);uY-zR#2u0lqG\
+$eRs?$)u7htCcCOTU+aEVJXkpR#7f_%4-_rOjvSeJL-OGA$Icx+mDQT8>DQo4|1B4neLm#%osAW}\
+rylxhD^KZFWmv?wNj@iDj))z2i_br>?RUq<8zyzjys^3D(I^*Tz;x$pyiZOvs$1d9jOLZ&4wbsHQ\
+R1@5ZDO6Em-4l))9RH>c`~C?Wkn~qM~YMJOAKf_XWZwbJFe?+@4Rlyvc7ZEqW+3s)Nf=N$KLZt^o\
+qJZy5#T2#;YpNesFrz;%aU+ojlIX{dmvzS%028v-Luo*noQ9w7dOjgCOCyz0HqRtg-6ED$%CYTbu\
+5buCH10>yuiq16y46{^QSeDZ3U;99HGm+2iZ<N@!T8k!!V>T4{@VR6aZVyRObV;?7iCx#Z$UP5I3\
+-51)@(;rh{w5f^68`)%8x$>sXg<N1wGa~d~cQkR!ayQQ_P)N|pMdR6z_oA}zdd*AIDDv#LtP7PA`\
+p4;}|`0GpSn^wJ<5qz>qNVMkUziwj|IJym0AGx)z?3bYnoN9L6mle3R*8K&l%zaI@vFGk>I`s8)H\
+~-Vp6D7+XT{tPT<rk5H6}`8H&DdZ5==7c5f(M~L2Q+&=R(k2@fc?UD*M^H5A8^{CaVnGe<@(zXFY\
+Vtk-?ikKyGin}vo!-Qt(wN{t#d1GV9<dE{L`&lcV+5+la=h!aNJbAz;nTXub-}Vn6mcB-XGR~)uZ\
+~z<Y@_Cwg~?rt67kfs2jTQI`K~bNf(}kGn*@g-<E%~w{^YX!E2e_vzGiguKFIY%8g16{q%9$3e_+\
+6`+2lJ{=R5V?9et23%}COU$8b{!kyJEE<RZ+-tj1T>c=NLE-zmx{PzmpgF24e7rkYAN(LhuU;44;\
+lcU~$uKD6(C&9t)E63lK-hbgZO*yG|Mo$O7K5fwtDeVW%K34x?g{mFeq_pkZW0CTLVDocz=)Lrz)\
+3=XFm~i4in<vf>&q@*(M0*e1vhmeQx6jmV!;k-)8NKrcPvJPaQ|WL?rFzqsI=zVgDtz9`&X2-dom\
+;c-?#+r*pFB|ydXe#5{J=%!+}ZQY^@-Q-9C8U!_{p}toO(V+Ut{)me)QgQ+N9;a)0XxROFf&>@2J\
+zIYV&s9?9(P>$h<wJy%I*X95SH7s@c6yt@vl$hSPOCTeYjW^<=v}H5!cy{CMObw^kP)&ANXwrNZm\
+y4Zi%VRQKHn;=b)z(d&F-YJ#Vvb|c4zdwcDgk>T$<wP)|s-=9zL@ktZB-nY0z+1*#XpPasNEaX|a\
+b$j=h30~4IOSP%p(w`<TOm_Lf|L3H=L)(q=c6hRR`s?T!4F`OFIZf#MqGyXO`~6p4Sfbm>{JHG@y\
+@r(r{&nZsw@?4)pS5}61?MI6_x{kUQu9+cHP>C3@J9y@x!+l`r~HlwPE!|8pFL0Y&AC_I_qts?cB\
+}sEu0APc62}ghw(LIId8EUsD&K4=QEKw6eLs!~c&#7HzqmS~_JC$rW+e{!?nYS6u1{*KnhxJ|_t>\
+xg9V(-%mqP#8b}zMo&mWtf_33}{rtdH9+m@M=IB@xd#~!==5562R?&^v;=f6EYa98~0(dCsDTJE|\
+tz4^1cor5m#44&n~+x1o7RlT42tgpZEM&m|36WcmpycGV$`k`_AF7NoLrl94ng<JYIDRb*5MSl9X\
+u;Dch-mTZEevRuPpMC!HaP3OHdF2m}4WC(K<BoL|d(3$8UEMdGzu)d!UX!k6m3`$BT&_`<^cj9mt\
+2=G$aHZpKE?w6Jbq}vJdq>(vrxG>l)@-?av0Dee&(8EQ6+Q|Mo?Bsd)J*q2rCi4Jn7APIQqA4}`j\
+vdWV9ESyqU00tD}4Uk5PkORt3!DQj_e5vtaosDnV-rmeb&@*Q}}Y!IZ5;|`FN%JA02ErjQ6yC<~r\
+V{A%AuBNUtzX*J1V4@W%m{RGU}MUEZwU<BEP;4>a6A`O>|XmDBblISpAlp?>m<RohqYLw}YYu)X&\
+6Zf%wxPpv-k%-%+-^tCO<G+6%kFO{G740!I={@Ne^o>`c1E@5HZgAKjbpGaxzxVz>?MSC~KA!=^_\
+Rx|2W+_I(WGIdPf^K~+XvnQl<nb_w*<|U^tl^hq{uW@<OhDGSsz8b3}Renlq@v404_3r~7{&aap7\
+sX~DPfyRlCdZDv_}FP!s*?G5#?dP!ld||fj!jA&Ck~eFuGm)8tfJ_%4!YU$o8un;`?=$`iwi>^e{\
+pZd9lxMQE&M~Do|i3IxoA|nZ>RL<0}}sExm(Vm?}4kA!|JXawCQyhr{2r{S<~dtkO7Iey_QY!J9&\
+6z)AJQp|90e1*zt0&Mm9O_#Q(NK+>cS!{y0_5YtG?|!`vHH8Cdey{{uT;xET'''
 
     @classmethod
-    def package(cls, *paths):
+    def package(cls, *paths, use_zstd=False):
         """Creates a resource string to be copied into the class."""
-        cls.__generate_data(paths, {})
+        cls.__generate_data(paths, {}, use_zstd)
 
     @classmethod
-    def add(cls, *paths):
+    def add(cls, *paths, use_zstd=False):
         """Include paths in the pre-generated DATA block up above."""
         cls.__preload()
-        cls.__generate_data(paths, cls.__CACHE.copy())
+        cls.__generate_data(paths, cls.__CACHE.copy(), use_zstd)
 
     @classmethod
-    def __generate_data(cls, paths, buffer):
+    def __generate_data(cls, paths, buffer, use_zstd):
         """Load paths into buffer and output DATA code for the class."""
-        for path in map(pathlib.Path, paths):
-            if not path.is_file():
-                raise ValueError('{!r} is not a file'.format(path))
-            key = path.name
+        for path in paths:
+            # One open and fstat both check that path is a file and give the size to read it in one call
+            try:
+                descriptor = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                raise ValueError('{!r} is not a file'.format(path)) from None
+            try:
+                status = os.fstat(descriptor)
+                if not stat.S_ISREG(status.st_mode):
+                    raise ValueError('{!r} is not a file'.format(path))
+                data = os.read(descriptor, status.st_size)
+            finally:
+                os.close(descriptor)
+            key = os.path.basename(path)
             if key in buffer:
                 raise KeyError('{!r} has already been included'.format(key))
-            with path.open('rb') as file:
-                buffer[key] = file.read()
-        pickled = pickle.dumps(buffer, pickle.HIGHEST_PROTOCOL)
-        optimized = pickletools.optimize(pickled)
-        compressed = zlib.compress(optimized, zlib.Z_BEST_COMPRESSION)
+            buffer[key] = data
+        framed = bytearray()
+        for key, value in buffer.items():
+            name = key.encode('utf-8')
+            framed += cls.HEADER.pack(len(name), len(value))
+            framed += name
+            framed += value
+        # zlib is the default since DATA compressed with zstd can only be loaded where zstandard is installed
+        if use_zstd:
+            if zstandard is None:
+                raise ImportError('zstandard is needed to package with use_zstd=True')
+            compressed = zstandard.ZstdCompressor(level=22).compress(framed)
+        else:
+            compressed = zlib.compress(framed, zlib.Z_BEST_COMPRESSION)
         encoded = base64.b85encode(compressed)
-        cls.__print("    DATA = b'''")
-        for offset in range(0, len(encoded), cls.WIDTH):
-            cls.__print("\\\n" + encoded[
-                slice(offset, offset + cls.WIDTH)].decode('ascii'))
-        cls.__print("'''")
+        # The whole block is built first so it is written out in one go rather than opening the file for every line
+        text = encoded.decode('ascii')
+        lines = ("\\\n" + text[offset:offset + cls.WIDTH] for offset in range(0, len(text), cls.WIDTH))
+        # The size and digest of each resource let load check a cached copy without decoding DATA
+        digests = "    DIGESTS = {!r}\n".format({key: cls.__digest(value) for key, value in buffer.items()})
+        requirement = "    # Packaged with use_zstd=True so zstandard has to be installed to load DATA\n" if use_zstd else ""
+        cls.__print(digests + requirement + "    DATA = b'''" + "".join(lines) + "'''")
 
     @staticmethod
     def __print(line):
@@ -1530,23 +1095,150 @@ db&+rYO{jl@O)VmX^6=s}UyrWF1Jx7NY-p)Ax;?s}SYiz4_e*KwFPR)OI4ZnPRZq~WHK(qe`W*=2\
     @contextlib.contextmanager
     def load(cls, name, delete=True):
         """Dynamically loads resources and makes them usable while needed."""
+        cached = cls.__cache_path(name)
+        if cls.__is_intact(cached, name):
+            # An earlier run already extracted this exact DATA so nothing needs decoding
+            yield cached
+            return
         cls.__preload()
         if name not in cls.__CACHE:
             raise KeyError('{!r} cannot be found'.format(name))
-        path = pathlib.Path(name)
-        with path.open('wb') as file:
-            file.write(cls.__CACHE[name])
+        # A missing, truncated or altered copy is replaced atomically so a half written file is never loaded
+        if cls.__save(cached, cls.__CACHE[name]):
+            # The cached copy is kept for later runs so it is never deleted
+            yield cached
+            return
+        descriptor = cls.__memfd(name, cls.__CACHE[name])
+        if descriptor is not None:
+            # Without a cache the resource is held in memory rather than written to the working directory
+            try:
+                yield '/proc/self/fd/{}'.format(descriptor)
+            finally:
+                os.close(descriptor)
+            return
+        path = name
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            cls.__write_all(descriptor, cls.__CACHE[name])
+        finally:
+            os.close(descriptor)
         yield path
         if delete:
-            path.unlink()
+            os.unlink(path)
+
+    @classmethod
+    def __cache_path(cls, name):
+        """Names the copy of a resource kept in the user cache for this DATA."""
+        if cls.__DIGEST is None:
+            # DATA never changes at runtime so it is only hashed once
+            cls.__DIGEST = hashlib.blake2b(cls.DATA, digest_size=16).hexdigest()
+        stem, suffix = os.path.splitext(name)
+        return os.path.join(os.path.expanduser('~'), '.cache', 'checkers', '{}-{}{}'.format(stem, cls.__DIGEST, suffix))
+
+    @classmethod
+    def __is_intact(cls, path, name):
+        """Checks that a cached copy matches the resource it was extracted from."""
+        try:
+            descriptor = os.open(path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            status = os.fstat(descriptor)
+            if not stat.S_ISREG(status.st_mode):
+                return False
+            expected = cls.DIGESTS.get(name)
+            if expected is None:
+                # DATA packaged without digests is checked against the decoded copy instead
+                cls.__preload()
+                if name not in cls.__CACHE:
+                    return False
+                expected = cls.__digest(cls.__CACHE[name])
+            size, digest = expected
+            # Comparing sizes first skips reading a copy that was cut short
+            if status.st_size != size:
+                return False
+            return cls.__digest(os.read(descriptor, size)) == expected
+        finally:
+            os.close(descriptor)
+
+    @staticmethod
+    def __digest(data):
+        """Gives the size and blake2b digest a resource is checked against."""
+        return len(data), hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @classmethod
+    def __save(cls, path, data):
+        """Atomically writes a cached copy, reporting whether it could be written."""
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory)
+            try:
+                try:
+                    cls.__write_all(handle, data)
+                finally:
+                    os.close(handle)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def __write_all(descriptor, data):
+        """Writes all of data to a file descriptor without a Python file object in between."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(descriptor, view):]
+
+    @classmethod
+    def __memfd(cls, name, data):
+        """Copies data into an anonymous in-memory file, returning None where that is not supported."""
+        if not hasattr(os, 'memfd_create'):
+            return None
+        try:
+            descriptor = os.memfd_create(name, os.MFD_CLOEXEC)
+        except OSError:
+            return None
+        try:
+            cls.__write_all(descriptor, data)
+        except BaseException:
+            os.close(descriptor)
+            raise
+        return descriptor
 
     @classmethod
     def __preload(cls):
         """Warm up the cache if it does not exist in a ready state yet."""
         if cls.__CACHE is None:
             decoded = base64.b85decode(cls.DATA)
-            decompressed = zlib.decompress(decoded)
-            cls.__CACHE = pickle.loads(decompressed)
+            decompressed = cls.__decompress(decoded)
+            cls.__CACHE = cls.__unpack(memoryview(decompressed))
+
+    @classmethod
+    def __decompress(cls, data):
+        """Decompresses DATA with the codec it was packaged with."""
+        if data.startswith(cls.ZSTD_MAGIC):
+            if zstandard is None:
+                raise ImportError('this resource was packaged with use_zstd=True so zstandard is needed to load it')
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    @classmethod
+    def __unpack(cls, framed):
+        """Splits the framed resources into views of each one's contents."""
+        resources = {}
+        offset = 0
+        while offset < len(framed):
+            name_size, data_size = cls.HEADER.unpack_from(framed, offset)
+            offset += cls.HEADER.size
+            name = bytes(framed[offset:offset + name_size]).decode('utf-8')
+            offset += name_size
+            resources[name] = framed[offset:offset + data_size]
+            offset += data_size
+        return resources
 
     def __init__(self):
         """Creates an error explaining class was used improperly."""
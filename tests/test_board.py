@@ -0,0 +1,75 @@
+import functools
+import operator
+import os
+import random
+
+import pytest
+
+from board import ZOBRIST, DenseBoard, SparseBoard
+
+TEST_BOARD = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_boards", "d11_normal_1.txt")
+
+
+def random_board(rng, min_pieces=2, max_pieces=14):
+    board = SparseBoard()
+    for _ in range(rng.randint(min_pieces, max_pieces)):
+        board._set_square(rng.randint(0, 7), rng.randint(0, 7), rng.choice([1, 2, -1, -2]))
+    return board
+
+
+def rebuilt_hash(board):
+    # Hashes the pieces from scratch instead of using the incrementally updated zhash
+    if isinstance(board, DenseBoard):
+        board = board.to_sparse_board()
+    return functools.reduce(operator.xor, (ZOBRIST[y * 8 + x][val + 2] for (x, y), val in board.sparse_board.items()), 0)
+
+
+def test_incremental_hash_matches_rebuild():
+    rng = random.Random(5)
+    for _ in range(300):
+        sparse = random_board(rng)
+        dense = DenseBoard.from_sparse_board(sparse)
+        assert sparse.zhash == dense.zhash == rebuilt_hash(sparse)
+        assert sparse.invert().zhash == dense.invert().zhash == rebuilt_hash(sparse.invert())
+        for player in (1, -1):
+            for successor in sparse.get_successors(player) + dense.get_successors(player):
+                assert successor.zhash == rebuilt_hash(successor)
+
+
+def test_hash_follows_a_game():
+    rng = random.Random(6)
+    board = SparseBoard.read_from_file(TEST_BOARD)
+    player = 1
+    for _ in range(40):
+        successors = board.get_successors(player)
+        if not successors:
+            break
+        board = rng.choice(successors)
+        player = -player
+        assert board.zhash == rebuilt_hash(board)
+
+
+def test_dense_board_matches_sparse_board():
+    rng = random.Random(7)
+    for _ in range(200):
+        sparse = random_board(rng)
+        dense = DenseBoard.from_sparse_board(sparse)
+        assert dense == sparse and sparse == dense
+        assert str(dense) == str(sparse)
+        assert dense.is_end() == sparse.is_end()
+        assert dense.evaluate() == pytest.approx(sparse.evaluate())
+        for player in (1, -1):
+            assert sorted(map(str, dense.get_successors(player))) == sorted(map(str, sparse.get_successors(player)))
+
+
+def test_bytes_round_trip():
+    rng = random.Random(8)
+    for _ in range(200):
+        board = random_board(rng, min_pieces=0)
+        assert SparseBoard.read_from_bytes(bytes(board)) == board
+        assert SparseBoard.read_from_string(str(board)) == board
+
+
+def test_only_8x8_boards_are_supported():
+    with pytest.raises(ValueError):
+        SparseBoard(10, 10)
@@ -0,0 +1,163 @@
+import base64
+import importlib.util
+import os
+import re
+
+import pytest
+
+import concat_linux
+import linux_library
+import mac_library
+
+BUILDER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "c_checkers", "library_builder.py")
+# DATA holding a single resource, hello.txt containing b"hello", compressed with zstd so the tests need no zstandard to build it
+ZSTD_DATA = b'D77#BAQYhh00{sE0001JWo&G3E_8TwXk~0{Zv'
+# The same resource in the base64 framing of concat_linux, which also records the framed size and CRC
+CONCAT_ZSTD_DATA = b'KLUv/SAUoQAACQAFAAAAaGVsbG8udHh0aGVsbG8='
+CONCAT_ZSTD_SIZE = 20
+CONCAT_ZSTD_CRC = 0x359ed31c
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    # c_checkers is not a package so the builder is imported from its path
+    spec = importlib.util.spec_from_file_location("library_builder", BUILDER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Keeps the generated DATA and the user cache out of the working tree and the real home directory
+    monkeypatch.setattr(module, "save_file", str(tmp_path / "library.bin"))
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return module
+
+
+def package(builder, tmp_path, contents, use_zstd=False):
+    paths = []
+    for name, data in contents.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(str(path))
+    builder.Resource.package(*paths, use_zstd=use_zstd)
+    namespace = {}
+    # The generated lines are indented for the class body. The DATA lines are never indented since base85 has no spaces
+    exec(re.sub(r"^    ", "", (tmp_path / "library.bin").read_text(), flags=re.M), namespace)
+    return namespace
+
+
+def loader(library, packaged):
+    class Packaged(library.Resource):
+        DATA = packaged["DATA"]
+        DIGESTS = packaged.get("DIGESTS", {})
+        # Each packaged resource starts with its own empty cache instead of the one loaded for the library
+        _Resource__CACHE = None
+        _Resource__DIGEST = None
+
+    return Packaged
+
+
+@pytest.mark.parametrize("library", [linux_library, mac_library])
+def test_package_and_load_round_trip(builder, tmp_path, capsys, library):
+    contents = {"first.so": os.urandom(5000), "second.txt": b"", "third.bin": bytes(range(256)) * 300}
+    resource = loader(library, package(builder, tmp_path, contents))
+    for _ in range(2):
+        # The second pass is served by the copies extracted to the user cache
+        for name, data in contents.items():
+            with resource.load(name) as path:
+                with open(path, "rb") as f:
+                    assert f.read() == data
+
+
+@pytest.mark.parametrize("library", [linux_library, mac_library])
+def test_missing_resources_are_reported(builder, tmp_path, capsys, library):
+    resource = loader(library, package(builder, tmp_path, {"first.so": b"data"}))
+    with pytest.raises(KeyError):
+        with resource.load("second.so"):
+            pass
+    with pytest.raises(ValueError):
+        builder.Resource.package(str(tmp_path))
+
+
+@pytest.mark.parametrize("library", [linux_library, mac_library])
+@pytest.mark.parametrize("with_digests", [True, False])
+def test_damaged_cached_copies_are_replaced(builder, tmp_path, capsys, library, with_digests):
+    contents = {"first.so": os.urandom(5000)}
+    packaged = package(builder, tmp_path, contents)
+    if not with_digests:
+        # DATA packaged before digests were recorded is checked against the decoded copy
+        del packaged["DIGESTS"]
+    with loader(library, packaged).load("first.so") as path:
+        cached = path
+    for damaged in (b"", contents["first.so"][:100], os.urandom(5000)):
+        with open(cached, "wb") as f:
+            f.write(damaged)
+        # A fresh class is used each time so the check cannot rely on anything decoded earlier
+        with loader(library, packaged).load("first.so") as path:
+            assert path == cached
+            with open(path, "rb") as f:
+                assert f.read() == contents["first.so"]
+
+
+def test_zlib_is_used_unless_zstd_is_asked_for(builder, tmp_path, capsys, monkeypatch):
+    class Unusable:
+        def __getattr__(self, name):
+            raise AssertionError("zstandard is only used with use_zstd=True")
+
+    monkeypatch.setattr(builder, "zstandard", Unusable())
+    data = package(builder, tmp_path, {"first.so": b"data"})
+    assert not base64.b85decode(data["DATA"]).startswith(builder.Resource.ZSTD_MAGIC)
+    # So the DATA loads where zstandard is not installed
+    monkeypatch.setattr(linux_library, "zstandard", None)
+    with loader(linux_library, data).load("first.so") as path:
+        with open(path, "rb") as f:
+            assert f.read() == b"data"
+
+
+def test_use_zstd_needs_zstandard_to_package(builder, tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(builder, "zstandard", None)
+    with pytest.raises(ImportError):
+        package(builder, tmp_path, {"first.so": b"data"}, use_zstd=True)
+
+
+@pytest.mark.parametrize("library", [linux_library, mac_library])
+def test_zstd_data_without_zstandard_is_reported(builder, monkeypatch, library):
+    monkeypatch.setattr(library, "zstandard", None)
+    with pytest.raises(ImportError, match="use_zstd=True"):
+        with loader(library, {"DATA": ZSTD_DATA}).load("hello.txt"):
+            pass
+
+
+@pytest.mark.parametrize("library", [linux_library, mac_library])
+def test_zstd_round_trip(builder, tmp_path, capsys, library):
+    pytest.importorskip("zstandard")
+    data = package(builder, tmp_path, {"first.so": b"data"}, use_zstd=True)
+    assert "    # Packaged with use_zstd=True" in (tmp_path / "library.bin").read_text()
+    with loader(library, data).load("first.so") as path:
+        with open(path, "rb") as f:
+            assert f.read() == b"data"
+    with loader(library, {"DATA": ZSTD_DATA}).load("hello.txt") as path:
+        with open(path, "rb") as f:
+            assert f.read() == b"hello"
+
+
+def test_concat_linux_packages_with_zlib_and_reports_zstd_data_without_zstandard(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(concat_linux, "save_file", str(tmp_path / "library.txt"), raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(concat_linux, "zstandard", None)
+    path = tmp_path / "first.so"
+    path.write_bytes(b"data")
+    concat_linux.Resource.package(str(path))
+    namespace = {}
+    exec(re.sub(r"^    ", "", (tmp_path / "library.txt").read_text(), flags=re.M), namespace)
+    assert not base64.b64decode(namespace["DATA"]).startswith(concat_linux.Resource.ZSTD_MAGIC)
+    for not_a_file in (tmp_path, tmp_path / "missing.so"):
+        with pytest.raises(ValueError):
+            concat_linux.Resource.package(str(not_a_file))
+
+    class Packaged(concat_linux.Resource):
+        DATA = CONCAT_ZSTD_DATA
+        SIZE = CONCAT_ZSTD_SIZE
+        CRC = CONCAT_ZSTD_CRC
+        _Resource__CACHE = None
+
+    with pytest.raises(ImportError, match="use_zstd=True"):
+        with Packaged.load("hello.txt"):
+            pass
@@ -0,0 +1,110 @@
+import os
+import random
+
+from board import DenseBoard, ExploreState, SparseBoard
+
+TEST_BOARD = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_boards", "d11_normal_1.txt")
+
+
+def random_board(rng):
+    board = SparseBoard()
+    for _ in range(rng.randint(3, 10)):
+        board._set_square(rng.randint(0, 7), rng.randint(0, 7), rng.choice([1, 2, -1, -2]))
+    return board
+
+
+def plain_minimax(board, depth, player, use_cycle_detection=False):
+    explore_state = ExploreState(use_score_cache=False, use_pruning=False, use_cycle_detection=use_cycle_detection, cache_bits=4)
+    explore_state.push_successor(board, player)
+    return explore_state.minimax(board, depth, player)
+
+
+def test_cached_pruned_minimax_matches_plain_minimax():
+    rng = random.Random(7)
+    checked = 0
+    while checked < 150:
+        board = random_board(rng)
+        if board.is_end() != 0:
+            continue
+        depth = rng.randint(1, 4)
+        player = rng.choice([1, -1])
+        # A small table makes collisions and evictions common
+        explore_state = ExploreState(use_cycle_detection=False, cache_bits=8, min_cache_depth=rng.randint(1, 3))
+        assert explore_state.minimax(board, depth, player) == plain_minimax(board, depth, player)
+        checked += 1
+
+
+def test_iterative_deepening_matches_plain_minimax():
+    rng = random.Random(11)
+    checked = 0
+    while checked < 40:
+        board = random_board(rng)
+        if board.is_end() != 0:
+            continue
+        player = rng.choice([1, -1])
+        explore_state = ExploreState(use_cycle_detection=False, cache_bits=8)
+        for depth in range(1, 5):
+            assert explore_state.search(board, depth, player) == plain_minimax(board, depth, player)
+        checked += 1
+
+
+def test_best_path_reaches_the_search_depth():
+    board = SparseBoard.read_from_file(TEST_BOARD)
+    for depth in (3, 5, 7):
+        explore_state = ExploreState()
+        explore_state.search(board, depth, 1)
+        path = explore_state.recover_best_path(board, 1)
+        assert len(path) == depth + 1
+        player = 1
+        for current, following in zip(path, path[1:]):
+            assert isinstance(following, SparseBoard)
+            assert following in current.get_successors(player)
+            player = -player
+
+
+def test_dense_search_matches_sparse_minimax():
+    board = SparseBoard.read_from_file(TEST_BOARD)
+    explore_state = ExploreState()
+    explore_state.push_successor(board, 1)
+    expected = explore_state.minimax(board, 5, 1)
+    assert ExploreState().search(DenseBoard.from_sparse_board(board), 5, 1) == expected
+    assert ExploreState().search(board, 5, 1) == expected
+
+
+def test_parallel_root_search_matches_search():
+    board = SparseBoard.read_from_file(TEST_BOARD)
+    expected = ExploreState().search(board, 5, 1)
+    explore_state = ExploreState()
+    assert explore_state.parallel_root_search(board, 5, 1, n_workers=2) == expected
+    assert len(explore_state.recover_best_path(board, 1)) == 6
+
+
+def test_cached_pruned_search_with_cycle_detection_matches_plain_minimax():
+    rng = random.Random(13)
+    checked = 0
+    while checked < 150:
+        board = random_board(rng)
+        if board.is_end() != 0:
+            continue
+        depth = rng.randint(1, 4)
+        player = rng.choice([1, -1])
+        explore_state = ExploreState(cache_bits=8)
+        assert explore_state.search(board, depth, player) == plain_minimax(board, depth, player, use_cycle_detection=True)
+        checked += 1
+
+
+def test_repetition_draws_are_not_reused_from_another_path():
+    board = SparseBoard.read_from_file(TEST_BOARD)
+    explore_state = ExploreState()
+    # With every successor of the board in the history, each of its moves repeats a position so the board is scored as a draw
+    successors = board.get_successors(1)
+    for successor in successors:
+        explore_state.push_successor(successor, -1)
+    explore_state.push_successor(board, 1)
+    assert explore_state.minimax(board, 3, 1) == 0
+    for _ in range(len(successors) + 1):
+        explore_state.pop_successor()
+    # Searched again without that history, the draw must not come back from the cache
+    expected = plain_minimax(board, 3, 1, use_cycle_detection=True)
+    assert expected != 0
+    assert explore_state.search(board, 3, 1) == expected
@@ -0,0 +1,104 @@
+import math
+
+from board import EVALUATION_SCALE, EXACT, LOWERBOUND, UPPERBOUND, ZOBRIST_SIDE, TranspositionTable
+
+INF = float("inf")
+
+
+def test_exact_scores_answer_shallower_searches_for_the_same_player():
+    table = TranspositionTable(bits=8)
+    table.store_score(12345, 3, 1, 0.5, EXACT, 678)
+    for depth in (0, 1, 2, 3):
+        assert table.probe_score(12345, depth, 1, -INF, INF) == 0.5
+    assert math.isnan(table.probe_score(12345, 4, 1, -INF, INF))
+    assert math.isnan(table.probe_score(12345, 3, -1, -INF, INF))
+    assert table.get_best(12345, 1) == 678
+    assert table.get_best(12345, -1) is None
+
+
+def test_both_players_scores_are_kept():
+    table = TranspositionTable(bits=16)
+    table.store_score(12345, 2, 1, 0.25, EXACT, 1)
+    table.store_score(12345, 2, -1, -0.75, EXACT, 2)
+    assert table.probe_score(12345, 2, 1, -INF, INF) == 0.25
+    assert table.probe_score(12345, 2, -1, -INF, INF) == -0.75
+    assert table.get_best(12345, 1) == 1
+    assert table.get_best(12345, -1) == 2
+
+
+def test_bounds_are_only_used_when_they_cause_a_cutoff():
+    table = TranspositionTable(bits=8)
+    table.store_score(1, 2, 1, 0.5, LOWERBOUND, 0)
+    assert table.probe_score(1, 2, 1, -INF, 0.5) == 0.5
+    assert math.isnan(table.probe_score(1, 2, 1, -INF, 0.6))
+    table.store_score(2, 2, 1, -0.5, UPPERBOUND, 0)
+    assert table.probe_score(2, 2, 1, -0.5, INF) == -0.5
+    assert math.isnan(table.probe_score(2, 2, 1, -0.6, INF))
+
+
+def test_deeper_scores_of_the_current_generation_are_not_evicted():
+    table = TranspositionTable(bits=4)
+    # Both keys land in slot 1 of the 16 slot table
+    table.store_score(1, 5, 1, 0.5, EXACT, 100)
+    table.store_score(17, 2, 1, 0.25, EXACT, 200)
+    assert table.get_best(1, 1) == 100
+    assert table.get_best(17, 1) is None
+    # Scores from older generations are still found but a shallower score replaces them
+    table.new_generation()
+    assert table.get_best(1, 1) == 100
+    table.store_score(17, 2, 1, 0.25, EXACT, 200)
+    assert table.get_best(17, 1) == 200
+    assert table.get_best(1, 1) is None
+
+
+def test_best_successor_is_stored_without_a_score():
+    table = TranspositionTable(bits=8)
+    table.store_best(3, -1, 300)
+    assert table.get_best(3, -1) == 300
+    assert math.isnan(table.probe_score(3, 0, -1, -INF, INF))
+    # A score from the current generation keeps the best successor that was found with it
+    table.store_score(4, 3, 1, 0.5, EXACT, 400)
+    table.store_best(4, 1, 401)
+    assert table.get_best(4, 1) == 400
+
+
+def test_evaluations_are_stored_as_fixed_point():
+    table = TranspositionTable(bits=8)
+    for board_hash, evaluation in enumerate((0.0, 0.123456, -1.5, 2.0, -0.0001)):
+        stored = table.store_evaluation(board_hash, evaluation)
+        assert abs(stored - evaluation) <= 0.5 / EVALUATION_SCALE
+        assert table.get_evaluation(board_hash) == stored
+    assert table.store_evaluation(10, INF) == INF and table.get_evaluation(10) == INF
+    assert table.store_evaluation(11, -INF) == -INF and table.get_evaluation(11) == -INF
+    assert table.store_evaluation(12, 100.0) == INF
+    assert table.get_evaluation(13) is None
+
+
+def test_utilities_evaluations_and_red_scores_share_a_slot():
+    table = TranspositionTable(bits=8)
+    table.store_utility(5, 0.75)
+    table.store_evaluation(5, 0.5)
+    table.store_score(5, 2, 1, 0.25, EXACT, 6)
+    assert table.get_utility(5) == 0.75
+    assert table.get_evaluation(5) == 0.5
+    assert table.probe_score(5, 2, 1, -INF, INF) == 0.25
+
+
+def test_merge_entries_from_a_smaller_table():
+    small = TranspositionTable(bits=4)
+    # The keys land in different slots of the small table
+    small.store_score(1001, 3, 1, 0.5, EXACT, 7)
+    small.store_score(2002, 2, -1, -0.5, EXACT, 8)
+    small.store_utility(3005, 0.125)
+    small.store_best(4004, 1, 9)
+    large = TranspositionTable(bits=12)
+    large.store_score(1001, 4, 1, 1.0, EXACT, 70)
+    large.merge_entries(small.export_entries())
+    # The deeper score that was already in the large table is kept
+    assert large.probe_score(1001, 4, 1, -INF, INF) == 1.0
+    assert large.probe_score(2002, 2, -1, -INF, INF) == -0.5
+    assert large.get_best(2002, -1) == 8
+    assert large.get_utility(3005) == 0.125
+    assert large.get_best(4004, 1) == 9
+    assert len(small.export_entries()[0]) == 4
+    assert (2002 ^ ZOBRIST_SIDE) in small.export_entries()[0]